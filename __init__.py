@@ -11,8 +11,9 @@ import datetime
 # 리팩토링된 모듈 가져오기
 from app_utils import *
 from postgresql_utils import *
-from minio_utils import MinIOManager
+from minio_utils import MinIOManager, get_minio_manager
 from annotate_utils import detection
+from ocr_utils import get_ocr_metrics
 from render_utils import *
 from style_utils import * 
 
@@ -58,10 +59,15 @@ def initialize_session_state():
         # 레이블링 전용 상태
         "current_mode": "Draw",
         "annotations": {},
+        "annotations_image": None,
+        "annotation_version": 0,
+        "annotation_event": None,
+        "annotation_resync": False,
+        "annotation_resync_nonce": 0,
+        "annotation_save_pending": False,
         "ocr_suggestions": None,
         "pending_ocr_request": False,
         "render_key": int(time.time()),
-        "ocr": None,
 
         # MinIO 및 저장소
         "minio_client": None,
@@ -84,6 +90,18 @@ def render_sidebar():
         st.write("- ESC: 취소") 
         st.write("- Del: 삭제") 
 
+        # OCR 대기열 상태 (OCR을 사용한 뒤에만 표시)
+        ocr_metrics = get_ocr_metrics()
+        if ocr_metrics is not None:
+            with st.expander("OCR 대기열 상태"):
+                st.json(ocr_metrics)
+
+        # MinIO HTTP 커넥션 풀 상태 (로그인 후 클라이언트가 있을 때만 표시)
+        minio_client = st.session_state.get("minio_client")
+        if minio_client is not None:
+            with st.expander("MinIO 커넥션 풀 상태"):
+                st.json(minio_client.get_pool_stats())
+
 
 
 def render_main_content():
@@ -107,8 +125,9 @@ def render_main_content():
             set_current_page(get_current_page()-1)
         st.session_state.current_image = st.session_state.image_list[get_current_page()]
 
-        # 어노테이션 로드
-        load_annotations(st.session_state.current_image)
+        # 어노테이션 로드 (이미지가 바뀐 경우에만 DB에서 읽음)
+        if st.session_state.annotations_image != st.session_state.current_image:
+            load_annotations(st.session_state.current_image)
         
         # 어노테이션 데이터 준비
         bboxes, labels = prepare_annotation_data()
@@ -125,6 +144,7 @@ def render_main_content():
 
             if st.button(label, use_container_width=True):
                 st.session_state.review_mode = not st.session_state.review_mode
+                reset_loaded_annotations()
                 st.rerun()
 
         image_id = get_image_id(st.session_state.current_image)
@@ -172,8 +192,8 @@ def render_main_content():
         print(f"DEBUG: 현재 이미지: {st.session_state.current_page}")
         render_image_controls()
 
-        # 이미지 어노테이션 표시
-        render_image_annotation(st.session_state.current_image, bboxes, labels)
+        # 이미지 어노테이션 표시 (캔버스 상호작용은 fragment만 다시 실행)
+        render_labeling_workspace()
     
     else:
         st.error("표시할 이미지가 없습니다.")
@@ -241,7 +261,8 @@ def main():
         login()
         return
 
-    st.session_state.minio_client = MinIOManager(
+    # 프로세스 전체에서 공유하는 클라이언트 (커넥션 풀 재사용)
+    st.session_state.minio_client = get_minio_manager(
         st.session_state.access_key, st.session_state.secret_key
     )
  
@@ -1,16 +1,30 @@
 import os
+import time
+import datetime
+import threading
+import uuid
+import json
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import streamlit.components.v1 as components
 import numpy as np
 import matplotlib.pyplot as plt
-from PIL import Image
-from hashlib import md5
+from PIL import Image, ImageOps
 import streamlit as st
-try:
-    from streamlit.elements.image import image_to_url
-except:
-    from streamlit.elements.lib.image_utils import image_to_url
+from streamlit import runtime
 import cv2
-from paddleocr import PaddleOCR
+from ocr_utils import (
+    DEFAULT_OCR_CONFIG,
+    OCR_TASK_TIMEOUT,
+    get_model_fingerprint,
+    crop_boxes,
+    recognize_crops,
+    get_ocr_scheduler,
+    get_recognition_batcher,
+    OCROverloadedError,
+    PRIORITY_INTERACTIVE_IMAGE,
+)
 import traceback
 import io
 import zipfile
@@ -22,6 +36,102 @@ absolute_path = os.path.dirname(os.path.abspath(__file__))
 build_path = os.path.join(absolute_path, "frontend/build")
 _component_func = components.declare_component("st-detection", path=build_path)
 
+# 캔버스 편집 상태 동기화
+#   박스 편집/모드 전환은 브라우저에서만 처리하고, 저장/이미지 이동/유휴 시간 경과 시에만 변경분을 Python으로 전송
+#   CANVAS_IDLE_SYNC_MS 동안 추가 편집이 없으면 자동 동기화 (0이면 유휴 동기화 비활성화)
+CANVAS_IDLE_SYNC_MS = 5000
+
+# 캔버스 표시용 이미지 설정
+DISPLAY_IMAGE_WIDTH = 1200
+DISPLAY_IMAGE_FORMAT = "JPEG"   # JPEG, WEBP, PNG
+DISPLAY_IMAGE_QUALITY = 85
+DISPLAY_IMAGE_MIMETYPES = {
+    "JPEG": "image/jpeg",
+    "WEBP": "image/webp",
+    "PNG": "image/png",
+}
+
+# 표시용 이미지 제공 방식
+#   "minio": 표시용 파생 이미지를 MinIO에 저장하고 브라우저가 presigned URL로 직접 받음 (HTTP 캐시 사용)
+#   "media": Streamlit 미디어 파일 매니저를 통해 서버 메모리에서 제공
+DISPLAY_IMAGE_SOURCE = "minio"
+# v2: EXIF 방향을 적용해 만든 파생 이미지 (OCR 검출·메타데이터 크기와 같은 좌표계)
+DERIVATIVE_PREFIX = "_derivatives/v2/display"
+DERIVATIVE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+DISPLAY_URL_EXPIRES = datetime.timedelta(hours=12)
+DISPLAY_URL_REFRESH_MARGIN = 60 * 60  # 만료 1시간 전부터 URL 재발급 (초)
+DISPLAY_IMAGE_EXTENSIONS = {
+    "JPEG": "jpg",
+    "WEBP": "webp",
+    "PNG": "png",
+}
+
+# 대형 스캔용 타일 피라미드 (딥줌)
+#   원본 너비가 TILED_MIN_WIDTH를 넘으면 원본 해상도 타일 피라미드를 MinIO 파생 객체로 한 번 만들어 두고,
+#   캔버스는 현재 배율에서 보이는 타일만 받아 그림 (박스 좌표는 원본 픽셀 기준)
+#   _derivatives/v2/tiles/{etag}/manifest.json, _derivatives/v2/tiles/{etag}/{level}/{col}_{row}.jpg
+#   타일 URL은 모두 같은 서명 시각으로 로컬에서 presign하고, 컴포넌트에는 URL 템플릿과 타일별 서명 값만 보냄
+#   (만료 전까지 같은 서명을 재사용하므로 rerun마다 컴포넌트 인자가 바뀌지 않음)
+TILED_VIEW_ENABLED = True
+TILED_MIN_WIDTH = 4000
+TILE_SIZE = 512
+TILE_FORMAT = "JPEG"
+TILE_QUALITY = 85
+TILE_PREFIX = "_derivatives/v2/tiles"
+TILED_VIEWPORT_HEIGHT = 800  # 타일 모드에서 캔버스 뷰포트 높이 (px)
+TILE_SIGNATURE_PARAM = "&X-Amz-Signature="  # presigned URL의 마지막 쿼리 파라미터
+TILE_BUILD_WORKERS = 1       # 피라미드 생성 전용 스레드 (미리 가져오기/썸네일 생성과 따로 실행)
+
+# (ETag, 너비, 포맷) → 인코딩된 표시용 이미지 캐시 (프로세스 전체 공유)
+DISPLAY_CACHE_MAX_ENTRIES = 128
+_display_image_cache = OrderedDict()
+_display_image_cache_lock = threading.Lock()
+
+# (ETag, 너비, 포맷) → 파생 이미지 presigned URL 캐시
+# 같은 URL을 재사용해야 브라우저 HTTP 캐시가 적중하므로 만료 전까지 URL을 유지합니다.
+_display_url_cache = OrderedDict()
+_display_url_cache_lock = threading.Lock()
+
+# 다음/이전 이미지 미리 가져오기
+#   작업 큐에서 현재 이미지 앞뒤 PREFETCH_NEIGHBORS장의 표시용 URL을 컴포넌트에 넘겨 브라우저가 미리 받게 함
+#   파생 이미지 생성은 백그라운드 스레드에서 수행하고, 준비된 URL만 전달
+PREFETCH_NEIGHBORS = 2
+PREFETCH_WORKERS = 2
+_prefetch_executor = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix="display-prefetch")
+_prefetch_results = OrderedDict()   # (버킷, 객체, 너비, 포맷) → get_display_image_url 결과
+_prefetch_inflight = set()
+_prefetch_lock = threading.Lock()
+
+# 이미지 목록 썸네일
+#   그리드에는 원본 대신 작은 파생 이미지(같은 파생 이미지 경로, 너비만 다름)를 보여줌
+#   생성은 전용 스레드에서 하므로 다음/이전 이미지 미리 가져오기를 막지 않음
+GRID_THUMBNAIL_WIDTH = 320
+GRID_THUMBNAIL_FORMAT = "WEBP"
+THUMBNAIL_WORKERS = 4
+THUMBNAIL_CACHE_MAX_ENTRIES = 4096
+_thumbnail_executor = ThreadPoolExecutor(max_workers=THUMBNAIL_WORKERS, thread_name_prefix="grid-thumbnail")
+_thumbnail_results = OrderedDict()
+_thumbnail_inflight = set()
+_thumbnail_lock = threading.Lock()
+
+# 박스 단위 OCR용 디코딩된 원본 이미지 캐시 (같은 이미지에서 박스를 연달아 인식할 때 재다운로드 방지)
+OCR_IMAGE_CACHE_SIZE = 8
+_ocr_image_cache = OrderedDict()
+_ocr_image_cache_lock = threading.Lock()
+
+# OCR 결과 캐시 (메모리 LRU + Postgres ocr_cache 테이블)
+#   검출: (이미지 sha256, 검출 모델/설정) → 박스 목록
+#   박스 인식: (이미지 sha256, 인식 모델/설정, 반올림한 bbox) → 추천 텍스트 목록
+OCR_CACHE_MAX_ENTRIES = 1024
+_ocr_result_cache = OrderedDict()
+_ocr_result_cache_lock = threading.Lock()
+
+# ETag → 타일 피라미드 manifest + 서명된 타일 URL 템플릿
+_tile_pyramid_cache = OrderedDict()
+_tile_build_inflight = set()
+_tile_pyramid_lock = threading.Lock()   # _tile_pyramid_cache, _tile_build_inflight
+_tile_build_executor = ThreadPoolExecutor(max_workers=TILE_BUILD_WORKERS, thread_name_prefix="tile-pyramid")
+
 def split_first_dir(path):
     """
     폴더 경로를 첫 번째 디렉토리와 나머지 경로로 분할합니다.
@@ -61,6 +171,399 @@ def get_colormap(label_names, colormap_name='gist_rainbow'):
         colormap[l] = ('#%02x%02x%02x' % tuple(rgb))
     return colormap
 
+def render_display_image(image_bytes, width=DISPLAY_IMAGE_WIDTH, image_format=DISPLAY_IMAGE_FORMAT):
+    """
+    원본 이미지 바이트를 캔버스 표시용 크기로 줄여 인코딩합니다.
+    EXIF 방향을 적용하므로 크기와 좌표는 화면에 보이는 방향(OCR 검출과 같은 방향) 기준입니다.
+
+    Returns:
+        dict: {data, mimetype, size, original_size, scale}
+    """
+    image = Image.open(io.BytesIO(image_bytes))
+    transposed = image.getexif().get(EXIF_ORIENTATION_TAG, 1) in EXIF_TRANSPOSED_ORIENTATIONS
+    original_size = image.size[::-1] if transposed else image.size
+    height = int(original_size[1] * (width / original_size[0]))
+
+    # JPEG는 DCT 스케일링으로 목표 크기 이상인 가장 가까운 배율(1/2, 1/4, 1/8)로 바로 디코딩
+    image.draft("RGB", (height, width) if transposed else (width, height))
+    image = ImageOps.exif_transpose(image)
+    image.thumbnail(size=(width, height))
+    if image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+
+    buffer = io.BytesIO()
+    if image_format == "PNG":
+        image.save(buffer, format=image_format)
+    else:
+        image.save(buffer, format=image_format, quality=DISPLAY_IMAGE_QUALITY)
+
+    return {
+        "data": buffer.getvalue(),
+        "mimetype": DISPLAY_IMAGE_MIMETYPES[image_format],
+        "size": image.size,
+        "original_size": original_size,
+        "scale": original_size[0] / image.size[0],
+    }
+
+
+def get_display_image(client, bucket_name, object_name, width=DISPLAY_IMAGE_WIDTH, image_format=DISPLAY_IMAGE_FORMAT):
+    """
+    캔버스 표시용 이미지를 (ETag, 너비, 포맷) 키로 캐시해서 반환합니다.
+    같은 이미지에서 모드 전환이나 버튼 클릭으로 rerun되어도 HEAD 요청 한 번 외에
+    다운로드/디코딩/인코딩을 다시 하지 않습니다.
+
+    Returns:
+        dict: render_display_image 결과 + etag, 실패 시 None
+    """
+    try:
+        etag = client.get_object_etag(bucket_name, object_name)
+    except Exception as e:
+        print(f"DEBUG: ETag 조회 실패: {object_name}, {e}")
+        return None
+
+    cache_key = (etag, width, image_format)
+    with _display_image_cache_lock:
+        entry = _display_image_cache.get(cache_key)
+        if entry is not None:
+            _display_image_cache.move_to_end(cache_key)
+            return entry
+
+    try:
+        image_bytes = client.get_object_bytes(bucket_name, object_name)
+    except Exception as e:
+        print(f"DEBUG: 이미지 다운로드 실패: {object_name}, {e}")
+        return None
+    entry = render_display_image(image_bytes, width, image_format)
+    entry["etag"] = etag
+
+    with _display_image_cache_lock:
+        _display_image_cache[cache_key] = entry
+        while len(_display_image_cache) > DISPLAY_CACHE_MAX_ENTRIES:
+            _display_image_cache.popitem(last=False)
+    return entry
+
+
+def get_display_image_url(client, bucket_name, object_name, width=DISPLAY_IMAGE_WIDTH, image_format=DISPLAY_IMAGE_FORMAT):
+    """
+    표시용 파생 이미지를 MinIO에 한 번만 생성해 두고 presigned GET URL을 반환합니다.
+    파생 이미지 키에 원본 ETag가 들어가므로 내용이 바뀌지 않아 영구 캐시 헤더를 붙입니다.
+    브라우저가 MinIO에서 직접 받으므로 Streamlit 서버 메모리/대역폭을 쓰지 않습니다.
+
+    Returns:
+        dict: {url, size, scale, etag}, 실패 시 None
+    """
+    try:
+        etag = client.get_object_etag(bucket_name, object_name)
+    except Exception as e:
+        print(f"DEBUG: ETag 조회 실패: {object_name}, {e}")
+        return None
+
+    cache_key = (etag, width, image_format)
+    with _display_url_cache_lock:
+        entry = _display_url_cache.get(cache_key)
+        if entry is not None and entry["expires_at"] - time.time() > DISPLAY_URL_REFRESH_MARGIN:
+            _display_url_cache.move_to_end(cache_key)
+            return entry
+
+    derivative_name = f"{DERIVATIVE_PREFIX}/{etag}_{width}.{DISPLAY_IMAGE_EXTENSIONS[image_format]}"
+    try:
+        stat = client.stat_object_or_none(bucket_name, derivative_name)
+        if stat is not None:
+            size = [int(stat.metadata["x-amz-meta-width"]), int(stat.metadata["x-amz-meta-height"])]
+            scale = float(stat.metadata["x-amz-meta-scale"])
+        else:
+            rendered = render_display_image(
+                client.get_object_bytes(bucket_name, object_name), width, image_format
+            )
+            size, scale = list(rendered["size"]), rendered["scale"]
+            client.put_bytes(
+                bucket_name,
+                derivative_name,
+                rendered["data"],
+                rendered["mimetype"],
+                metadata={
+                    "Cache-Control": DERIVATIVE_CACHE_CONTROL,
+                    "width": str(size[0]),
+                    "height": str(size[1]),
+                    "scale": str(scale),
+                }
+            )
+    except Exception as e:
+        print(f"DEBUG: 파생 이미지 준비 실패: {object_name}, {e}")
+        return None
+
+    url = client.get_presigned_url(bucket_name, derivative_name, expires=DISPLAY_URL_EXPIRES)
+    if url is None:
+        return None
+    entry = {
+        "url": url,
+        "size": size,
+        "scale": scale,
+        "etag": etag,
+        "expires_at": time.time() + DISPLAY_URL_EXPIRES.total_seconds(),
+    }
+    with _display_url_cache_lock:
+        _display_url_cache[cache_key] = entry
+        while len(_display_url_cache) > DISPLAY_CACHE_MAX_ENTRIES:
+            _display_url_cache.popitem(last=False)
+    return entry
+
+
+def _prefetch_display_image(client, bucket_name, object_name, width, image_format,
+                            results=_prefetch_results, inflight=_prefetch_inflight,
+                            max_entries=DISPLAY_CACHE_MAX_ENTRIES, lock=_prefetch_lock):
+    """백그라운드에서 표시용 파생 이미지를 준비하고 결과를 기록합니다 (results/inflight는 lock으로 보호)."""
+    key = (bucket_name, object_name, width, image_format)
+    try:
+        entry = get_display_image_url(client, bucket_name, object_name, width=width, image_format=image_format)
+    except Exception as e:
+        print(f"DEBUG: 미리 가져오기 실패: {object_name}, {e}")
+        entry = None
+    with lock:
+        inflight.discard(key)
+        if entry is not None:
+            results[key] = entry
+            results.move_to_end(key)
+            while len(results) > max_entries:
+                results.popitem(last=False)
+
+
+def _get_background_display_urls(client, bucket_name, object_names, width, image_format,
+                                 executor, results, inflight, max_entries, lock):
+    """
+    준비된 파생 이미지 URL은 바로 돌려주고, 없는 것은 executor에서 준비를 시작합니다.
+
+    Returns:
+        dict: 입력 이미지 경로 → URL (아직 준비 중이면 None)
+    """
+    urls = {}
+    for image_path in object_names:
+        object_name = split_first_dir(image_path)[1]
+        key = (bucket_name, object_name, width, image_format)
+        urls[image_path] = None
+        with lock:
+            entry = results.get(key)
+            if entry is not None and entry["expires_at"] - time.time() > DISPLAY_URL_REFRESH_MARGIN:
+                results.move_to_end(key)
+                urls[image_path] = entry["url"]
+                continue
+            if key in inflight:
+                continue
+            inflight.add(key)
+        executor.submit(
+            _prefetch_display_image, client, bucket_name, object_name, width, image_format,
+            results, inflight, max_entries, lock
+        )
+    return urls
+
+
+def get_prefetch_urls(client, bucket_name, object_names, width=DISPLAY_IMAGE_WIDTH, image_format=DISPLAY_IMAGE_FORMAT):
+    """
+    주어진 이미지들의 표시용 URL 중 이미 준비된 것만 반환하고, 나머지는 백그라운드에서 준비를 시작합니다.
+    렌더링을 막지 않으므로 처음 요청한 이미지는 다음 rerun부터 URL이 포함됩니다.
+    """
+    if DISPLAY_IMAGE_SOURCE != "minio":
+        return []
+
+    urls = _get_background_display_urls(
+        client, bucket_name, object_names, width, image_format,
+        _prefetch_executor, _prefetch_results, _prefetch_inflight, DISPLAY_CACHE_MAX_ENTRIES, _prefetch_lock
+    )
+    return [url for url in urls.values() if url]
+
+
+def get_thumbnail_urls(client, bucket_name, image_paths, width=GRID_THUMBNAIL_WIDTH, image_format=GRID_THUMBNAIL_FORMAT):
+    """
+    이미지 목록 그리드용 썸네일 파생 이미지 URL을 반환합니다.
+    준비되지 않은 썸네일은 None이며 전용 스레드에서 생성을 시작합니다 (그리드가 잠시 뒤 다시 요청).
+
+    Returns:
+        dict: 이미지 경로 → 썸네일 URL 또는 None
+    """
+    return _get_background_display_urls(
+        client, bucket_name, image_paths, width, image_format,
+        _thumbnail_executor, _thumbnail_results, _thumbnail_inflight, THUMBNAIL_CACHE_MAX_ENTRIES, _thumbnail_lock
+    )
+
+
+def get_neighbor_images(image_list, current_image, count=PREFETCH_NEIGHBORS):
+    """작업 큐에서 현재 이미지의 다음 count장, 이전 count장을 가까운 순서로 반환합니다."""
+    try:
+        idx = image_list.index(current_image)
+    except ValueError:
+        return []
+    neighbors = []
+    for offset in range(1, count + 1):
+        for i in (idx + offset, idx - offset):
+            if 0 <= i < len(image_list):
+                neighbors.append(image_list[i])
+    return neighbors
+
+
+def build_tile_pyramid(client, bucket_name, object_name, etag):
+    """
+    원본 이미지로 타일 피라미드를 만들어 MinIO에 저장합니다.
+    level 0이 원본 해상도이고 level이 하나 올라갈 때마다 1/2로 줄어들며, 한 타일에 들어갈 때까지 만듭니다.
+    manifest는 모든 타일을 올린 뒤 마지막에 저장하므로, manifest가 있으면 피라미드가 완성된 것입니다.
+    """
+    image = ImageOps.exif_transpose(Image.open(io.BytesIO(client.get_object_bytes(bucket_name, object_name))))
+    if image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    width, height = image.size
+    extension = DISPLAY_IMAGE_EXTENSIONS[TILE_FORMAT]
+    metadata = {"Cache-Control": DERIVATIVE_CACHE_CONTROL}
+
+    levels = []
+    level = 0
+    while True:
+        cols = (image.size[0] + TILE_SIZE - 1) // TILE_SIZE
+        rows = (image.size[1] + TILE_SIZE - 1) // TILE_SIZE
+        for col in range(cols):
+            for row in range(rows):
+                box = (
+                    col * TILE_SIZE,
+                    row * TILE_SIZE,
+                    min((col + 1) * TILE_SIZE, image.size[0]),
+                    min((row + 1) * TILE_SIZE, image.size[1]),
+                )
+                buffer = io.BytesIO()
+                image.crop(box).save(buffer, format=TILE_FORMAT, quality=TILE_QUALITY)
+                client.put_bytes(
+                    bucket_name,
+                    f"{TILE_PREFIX}/{etag}/{level}/{col}_{row}.{extension}",
+                    buffer.getvalue(),
+                    DISPLAY_IMAGE_MIMETYPES[TILE_FORMAT],
+                    metadata=metadata
+                )
+        levels.append({
+            "level": level,
+            "factor": image.size[0] / width,   # 원본 대비 배율
+            "width": image.size[0],
+            "height": image.size[1],
+            "cols": cols,
+            "rows": rows,
+        })
+        if cols == 1 and rows == 1:
+            break
+        image = image.reduce(2)
+        level += 1
+
+    manifest = {
+        "width": width,
+        "height": height,
+        "tile_size": TILE_SIZE,
+        "format": TILE_FORMAT,
+        "levels": levels,
+    }
+    client.put_bytes(
+        bucket_name,
+        f"{TILE_PREFIX}/{etag}/manifest.json",
+        json.dumps(manifest).encode("utf-8"),
+        "application/json"
+    )
+    return manifest
+
+
+def _build_tile_pyramid_background(client, bucket_name, object_name, etag):
+    """백그라운드에서 타일 피라미드를 만들고 진행 중 표시를 해제합니다."""
+    try:
+        build_tile_pyramid(client, bucket_name, object_name, etag)
+        print(f"DEBUG: 타일 피라미드 생성 완료: {object_name}")
+    except Exception as e:
+        print(f"DEBUG: 타일 피라미드 생성 실패: {object_name}, {e}")
+    finally:
+        with _tile_pyramid_lock:
+            _tile_build_inflight.discard(etag)
+
+
+def sign_tile_pyramid(client, bucket_name, etag, manifest):
+    """
+    피라미드의 모든 타일 URL을 같은 서명 시각으로 presign해 URL 템플릿과 타일별 서명 값으로 나눕니다.
+    서명 시각이 같으면 URL은 경로(level, col, row)와 X-Amz-Signature만 다르므로
+    타일마다 전체 URL을 보내는 대신 서명 값만 보내면 됩니다.
+
+    Returns:
+        dict: manifest 항목 + url_template, signatures({"level/col_row": 서명}), expires_at
+            url_template의 {level}, {col}, {row}, {signature}를 채우면 타일 URL
+    """
+    extension = DISPLAY_IMAGE_EXTENSIONS[manifest["format"]]
+    keys = [
+        f"{level['level']}/{col}_{row}"
+        for level in manifest["levels"]
+        for col in range(level["cols"])
+        for row in range(level["rows"])
+    ]
+    urls = client.presign_get_objects(
+        bucket_name,
+        [f"{TILE_PREFIX}/{etag}/{key}.{extension}" for key in keys],
+        expires=DISPLAY_URL_EXPIRES
+    )
+    signatures = {}
+    for key, url in zip(keys, urls):
+        unsigned, signatures[key] = url.rsplit(TILE_SIGNATURE_PARAM, 1)
+    url_template = unsigned.replace(f"/{keys[-1]}.{extension}", f"/{{level}}/{{col}}_{{row}}.{extension}")
+    return {
+        "width": manifest["width"],
+        "height": manifest["height"],
+        "tile_size": manifest["tile_size"],
+        "format": manifest["format"],
+        "levels": manifest["levels"],
+        "url_template": f"{url_template}{TILE_SIGNATURE_PARAM}{{signature}}",
+        "signatures": signatures,
+        "expires_at": time.time() + DISPLAY_URL_EXPIRES.total_seconds(),
+    }
+
+
+def get_tile_pyramid(client, bucket_name, object_name, etag):
+    """
+    이미지의 타일 피라미드 manifest와 서명된 타일 URL 템플릿을 반환합니다.
+    아직 만들어지지 않았으면 전용 스레드에서 생성을 시작하고 None을 반환하며,
+    그동안 캔버스는 기존 표시용 이미지를 사용합니다.
+    서명은 만료 DISPLAY_URL_REFRESH_MARGIN초 전까지 재사용합니다.
+
+    Returns:
+        dict: {width, height, tile_size, url_template, signatures, levels: [{level, factor, width, height, cols, rows}]}, 없으면 None
+    """
+    with _tile_pyramid_lock:
+        pyramid = _tile_pyramid_cache.get(etag)
+        if pyramid is not None:
+            _tile_pyramid_cache.move_to_end(etag)
+            if pyramid["expires_at"] - time.time() > DISPLAY_URL_REFRESH_MARGIN:
+                return pyramid
+
+    try:
+        if pyramid is not None:
+            # manifest는 그대로 두고 서명만 새로 발급
+            manifest = pyramid
+        else:
+            manifest_name = f"{TILE_PREFIX}/{etag}/manifest.json"
+            if client.stat_object_or_none(bucket_name, manifest_name) is None:
+                with _tile_pyramid_lock:
+                    if etag in _tile_build_inflight:
+                        return None
+                    _tile_build_inflight.add(etag)
+                _tile_build_executor.submit(_build_tile_pyramid_background, client, bucket_name, object_name, etag)
+                return None
+            manifest = json.loads(client.get_object_bytes(bucket_name, manifest_name))
+        pyramid = sign_tile_pyramid(client, bucket_name, etag, manifest)
+    except Exception as e:
+        print(f"DEBUG: 타일 피라미드 조회 실패: {object_name}, {e}")
+        return None
+
+    with _tile_pyramid_lock:
+        _tile_pyramid_cache[etag] = pyramid
+        while len(_tile_pyramid_cache) > DISPLAY_CACHE_MAX_ENTRIES:
+            _tile_pyramid_cache.popitem(last=False)
+    return pyramid
+
+
+def display_image_to_url(entry, image_id):
+    """캐시된 표시용 이미지 바이트를 재인코딩 없이 Streamlit 미디어 파일로 등록합니다."""
+    if not runtime.exists():
+        return ""
+    return runtime.get_instance().media_file_mgr.add(entry["data"], entry["mimetype"], image_id)
+
+
 def detection(
         client, 
         bucket_name, 
@@ -72,52 +575,96 @@ def detection(
         line_width=5.0, 
         use_space=False, 
         key=None,
+        image_format=DISPLAY_IMAGE_FORMAT,
+        box_ids=None,
+        version=0,
+        request_full_sync=0,
+        idle_sync_ms=CANVAS_IDLE_SYNC_MS,
+        prefetch_urls=None,
+        ocr_suggestions=None,
     ):
-    """객체 탐지 및 어노테이션 컴포넌트를 표시합니다."""
-    temp_image_path = client.load_image(bucket_name, split_first_dir(object_name)[1])
-    if not temp_image_path:
-        st.error(f"이미지를 로드할 수 없습니다: {object_name}")
-        return None
+    """
+    객체 탐지 및 어노테이션 컴포넌트를 표시합니다.
+    컴포넌트는 전체 박스 목록 대신 base version 기준의 변경 연산(add/move/relabel/delete)만 보내며,
+    반환되는 좌표는 모두 원본 이미지 픽셀 기준으로 되돌려집니다.
+    request_full_sync는 재동기화 요청마다 바뀌는 nonce이며(0이면 요청 없음), 값이 바뀔 때마다 컴포넌트가 전체 목록을 한 번 보냅니다.
+    """
+    display_image = None
+    if DISPLAY_IMAGE_SOURCE == "minio":
+        # 브라우저가 MinIO에서 직접 받는 절대 URL
+        display_image = get_display_image_url(
+            client,
+            bucket_name,
+            split_first_dir(object_name)[1],
+            width=width or DISPLAY_IMAGE_WIDTH,
+            image_format=image_format
+        )
+        if display_image is not None:
+            image_url = display_image["url"]
 
-    image = Image.open(temp_image_path)
-    original_image_size = image.size
-    image_np = np.array(image)
+    if display_image is None:
+        display_image = get_display_image(
+            client,
+            bucket_name,
+            split_first_dir(object_name)[1],
+            width=width or DISPLAY_IMAGE_WIDTH,
+            image_format=image_format
+        )
+        if display_image is None:
+            st.error(f"이미지를 로드할 수 없습니다: {object_name}")
+            return None
 
-    if height is None or width is None:
-        width = 1200
-        height = int(original_image_size[1] * (width / original_image_size[0]))
+        image_url = display_image_to_url(
+            display_image,
+            f"detection-{display_image['etag']}-{display_image['size'][0]}-{key}"
+        )
+        if image_url.startswith('/'):
+            image_url = image_url[1:]
 
-    image.thumbnail(size=(width, height))
-    resized_image_size = image.size
-    scale = original_image_size[0]/resized_image_size[0]
+    image_size = display_image["size"]
+    scale = display_image["scale"]
 
-    image_url = image_to_url(
-        image, image.size[0], True, "RGB", "PNG",
-        f"detection-{md5(image.tobytes()).hexdigest()}-{key}"
-    )
-    if image_url.startswith('/'):
-        image_url = image_url[1:]
+    # 대형 스캔은 타일 피라미드로 표시 (표시용 이미지는 타일 로딩 전 미리보기로 사용)
+    tiles = None
+    original_width = image_size[0] * scale
+    if TILED_VIEW_ENABLED and DISPLAY_IMAGE_SOURCE == "minio" and original_width > TILED_MIN_WIDTH:
+        tiles = get_tile_pyramid(client, bucket_name, split_first_dir(object_name)[1], display_image["etag"])
+        if tiles is not None:
+            image_size = [tiles["width"], tiles["height"]]
+            scale = 1.0
 
     color_map = get_colormap(labels, colormap_name='gist_rainbow')
 
     # bbox_info 생성
+    if box_ids is None:
+        box_ids = [f"bbox-{i}" for i in range(len(bboxes))]
+
     bbox_info = []
-    for i, (bbox, label) in enumerate(zip(bboxes, labels)):
+    for i, (bbox, label, box_id) in enumerate(zip(bboxes, labels, box_ids)):
         scaled_bbox = [b/scale for b in bbox]
         bbox_info.append({
             'bbox': scaled_bbox,
             'label_id': i,
-            'label': label
+            'label': label,
+            'box_id': box_id
         })
     
     # 컴포넌트 호출을 위한 args 구성
     component_args = {
         "image_url": image_url,
-        "image_size": image.size,
+        "image_size": image_size,
         "bbox_info": bbox_info,
         "color_map": color_map,
         "line_width": line_width,
         "use_space": use_space,
+        "version": version,
+        "request_full_sync": request_full_sync,
+        "idle_sync_ms": idle_sync_ms,
+        "prefetch_urls": prefetch_urls or [],
+        "ocr_suggestions": ocr_suggestions or [],
+        "request_ocr": bool(ocr_suggestions),
+        "tiles": tiles,
+        "viewport_height": TILED_VIEWPORT_HEIGHT if tiles is not None else None,
     }
 
     # 컴포넌트 호출
@@ -129,17 +676,379 @@ def detection(
     if component_value is None:
         return None
     
-    return {
+    # 화면 좌표 -> 원본 이미지 좌표
+    def to_original(bbox):
+        return [float(b) * scale for b in bbox]
+
+    # 변경 연산 프로토콜 이전 빌드(또는 브라우저에 캐시된 이전 번들)는 매번 전체 박스 목록만 보냄
+    #   → 전체 동기화로 처리하고, 같은 값이 rerun마다 다시 적용되지 않도록 내용으로 이벤트 ID를 만듦
+    if "ops" not in component_value and "bboxes" in component_value:
+        component_value = {
+            **component_value,
+            "full_sync": True,
+            "event_id": "legacy-" + hashlib.sha1(
+                json.dumps(component_value, sort_keys=True, default=str).encode("utf-8")
+            ).hexdigest(),
+        }
+
+    ops = []
+    for op in component_value.get("ops", []):
+        op = dict(op)
+        if "bbox" in op:
+            op["bbox"] = to_original(op["bbox"])
+        ops.append(op)
+
+    result = {
         "mode": component_value.get("mode", "Draw"),
-        "bboxes": component_value.get("bboxes", []),
+        "event_id": component_value.get("event_id"),
+        "base_version": component_value.get("base_version"),
+        "ops": ops,
         "save_requested": component_value.get("save_requested", False),
+        "request_ocr": component_value.get("request_ocr", False),
     }
 
+    # 재동기화 응답일 때만 전체 목록이 포함됨
+    if component_value.get("full_sync"):
+        result["full_sync"] = True
+        result["bboxes"] = [
+            {**item, "bbox": to_original(item["bbox"])}
+            for item in component_value.get("bboxes", [])
+        ]
+
+    if component_value.get("selected_box_coords"):
+        result["selected_box_id"] = component_value.get("selected_box_id")
+        result["selected_box_coords"] = to_original(component_value["selected_box_coords"])
+
+    return result
+
+
+def image_grid(items, page_offset, page_size, total, selected_count, list_key, data_key, columns=5, height=900, key=None):
+    """
+    가상 스크롤 이미지 그리드 컴포넌트를 표시합니다.
+    page_offset부터 몇 페이지 분량의 메타데이터를 보내고, 브라우저는 받은 페이지를 보관하며 보이는 줄의 카드만 그립니다.
+    보이는 곳이나 그 다음 페이지가 아직 없으면(스크롤이 닿기 전에 미리) 또는 선택이 바뀌면(모아서 전송) 값을 반환합니다.
+
+    Args:
+        items (list): page_offset부터의 {id, url, filename, status, created_by, assigned_by, created_at, prelabel, selected} 목록
+            (page_size의 배수 개, 마지막 페이지는 더 짧을 수 있음)
+        page_offset (int): items의 첫 이미지 위치
+        page_size (int): 페이지 크기
+        total (int): 전체 이미지 수
+        selected_count (int): 현재 선택된 이미지 수
+        list_key (str): 목록 식별자 (바뀌면 브라우저의 페이지와 선택 변경 내역을 버림)
+        data_key (str): 목록 내용 식별자 (바뀌면 보관한 페이지만 버리고 다시 요청, 선택은 Python 상태 기준으로 유지)
+
+    Returns:
+        dict: {list_key, requested_offset, select_all, overrides, version} 또는 None
+            select_all과 overrides는 list_key가 바뀐 뒤(또는 data_key가 바뀌어 Python 선택 상태로 맞춘 뒤)부터 누적된 선택 변경 내역
+    """
+    return _component_func(
+        component="image_grid",
+        items=items,
+        page_offset=page_offset,
+        page_size=page_size,
+        total=total,
+        selected_count=selected_count,
+        list_key=list_key,
+        data_key=data_key,
+        columns=columns,
+        height=height,
+        key=key,
+        default=None,
+    )
+
+
+# OpenCV 축소 디코딩 플래그 (JPEG는 DCT 스케일링으로 디코딩 단계에서 축소)
+REDUCED_DECODE_FLAGS = [
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2),
+]
+
+# 적응형 검출 해상도 / 타일 검출
+#   작은 축소본에서 글자 높이를 추정해 글자가 DET_TARGET_TEXT_HEIGHT px 정도가 되는 작업 해상도를 고릅니다.
+#   작업 해상도가 검출 모델 입력 크기 이하면 한 번에 검출하고(글자가 크면 더 작게 줄여 빨라짐),
+#   그보다 커야 하면 모델 입력 크기의 겹치는 타일로 나눠 한꺼번에 검출한 뒤 원본 좌표로 합칩니다.
+DET_PROBE_SIDE = 1024             # 글자 높이 추정용 축소본 크기
+DET_PROBE_MIN_COMPONENTS = 30     # 이보다 글자 후보가 적으면 추정하지 않고 기본 해상도 사용
+DET_TARGET_TEXT_HEIGHT = 24       # 검출 모델 입력에서 목표로 하는 글자 높이 (px)
+DET_MIN_WORKING_SIDE = 640        # 작업 해상도 긴 변 하한
+DET_TILE_MIN_RATIO = 1.25         # 작업 해상도가 모델 입력 크기의 이 배수를 넘을 때만 타일로 나눔
+DET_TILE_OVERLAP = 0.2            # 타일 겹침 비율 (타일 크기 대비)
+DET_MAX_TILES = 16                # 타일 수 상한 (넘으면 작업 해상도를 낮춤)
+DET_MERGE_OVERLAP = 0.5           # 교집합/작은 박스 면적이 이 이상이면 같은 박스로 합침
+DET_MERGE_LINE_OVERLAP = 0.7      # 세로 겹침/작은 높이가 이 이상이고 가로로 겹치면 잘린 같은 줄로 보고 합침
+DET_CACHE_VARIANT = "adaptive-v1" # 검출 결과 캐시 키에 넣는 전처리 방식 (방식이 바뀌면 이전 결과를 쓰지 않음)
+
+
+def get_det_decode_side(ocr):
+    """
+    검출 모델이 내부적으로 사용하는 최대 변 길이를 반환합니다.
+    det_limit_type이 'max'이면 그보다 큰 해상도는 어차피 축소되므로 그 크기까지만 디코딩하면 됩니다.
+    """
+    if hasattr(ocr, "det_decode_side"):  # OCREngine / OCRWorkerPool
+        return ocr.det_decode_side()
+    det_args = getattr(ocr.text_detector, "args", None)
+    if det_args is None or getattr(det_args, "det_limit_type", "max") != "max":
+        return None
+    return getattr(det_args, "det_limit_side_len", 960)
+
+
+def load_image_reduced(image_path, max_side):
+    """
+    이미지를 max_side 이상인 가장 가까운 1/2, 1/4, 1/8 배율로 디코딩합니다.
+
+    Args:
+        image_path (str): 이미지 파일 경로
+        max_side (int): 디코딩 결과의 긴 변이 최소한 가져야 할 길이
+
+    Returns:
+        tuple: (RGB 이미지 NumPy 배열, 원본 대비 축소 배율)
+    """
+    with Image.open(image_path) as img:
+        original_max_side = max(img.size)
+
+    for factor, flag in REDUCED_DECODE_FLAGS:
+        if original_max_side / factor >= max_side:
+            img_np = cv2.imread(image_path, flag)
+            if img_np is not None:
+                img_np = cv2.cvtColor(img_np, cv2.COLOR_BGR2RGB)
+                return img_np, original_max_side / max(img_np.shape[:2])
+            break
+
+    img_np = cv2.imread(image_path)
+    if img_np is None:
+        # cv2.imread처럼 EXIF 방향을 적용
+        return np.array(ImageOps.exif_transpose(Image.open(image_path)).convert("RGB")), 1.0
+    return cv2.cvtColor(img_np, cv2.COLOR_BGR2RGB), 1.0
+
 
-def detect_text_regions(image_path, ocr):
+def resize_long_side(img_np, long_side):
+    """긴 변이 long_side가 되도록 축소합니다 (이미 작으면 그대로 반환)."""
+    h, w = img_np.shape[:2]
+    if max(h, w) <= long_side:
+        return img_np
+    ratio = long_side / max(h, w)
+    return cv2.resize(img_np, (max(1, round(w * ratio)), max(1, round(h * ratio))), interpolation=cv2.INTER_AREA)
+
+
+def estimate_text_height(probe_np):
+    """
+    축소본에서 글자처럼 보이는 연결 요소의 높이 중앙값을 구합니다 (축소본 픽셀 기준).
+    글자 후보가 너무 적으면(사진 위주 등) None을 반환합니다.
+    """
+    gray = cv2.cvtColor(probe_np, cv2.COLOR_RGB2GRAY)
+    binary = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY_INV, 31, 15)
+    _, _, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+    widths = stats[1:, cv2.CC_STAT_WIDTH]
+    heights = stats[1:, cv2.CC_STAT_HEIGHT]
+    areas = stats[1:, cv2.CC_STAT_AREA]
+
+    # 너무 작거나(잡음) 너무 크거나(선, 그림) 납작한 요소는 제외
+    max_height = probe_np.shape[0] * 0.1
+    text_like = (
+        (heights >= 3) & (heights <= max_height)
+        & (widths <= heights * 3) & (areas >= 0.15 * widths * heights)
+    )
+    if np.count_nonzero(text_like) < DET_PROBE_MIN_COMPONENTS:
+        return None
+    return float(np.median(heights[text_like]))
+
+
+def tile_origins(length, tile_size, overlap):
+    """길이 length를 tile_size 타일로 overlap만큼 겹치게 덮는 시작 위치 목록"""
+    if length <= tile_size:
+        return [0]
+    step = max(1, tile_size - overlap)
+    origins = list(range(0, length - tile_size, step))
+    origins.append(length - tile_size)
+    return origins
+
+
+def plan_detection(width, height, det_side, text_height=None):
+    """
+    원본 크기와 (원본 기준) 글자 높이 추정값으로 검출 작업 해상도와 타일 분할을 정합니다.
+
+    Returns:
+        dict: working_side(작업 해상도 긴 변), tiled(타일 검출 여부)
+    """
+    long_side = max(width, height)
+    if long_side <= det_side:
+        return {"working_side": long_side, "tiled": False}
+
+    if text_height is None:
+        # 글자 크기를 모르면 기존처럼 모델 입력 크기로 한 번에 검출
+        return {"working_side": det_side, "tiled": False}
+
+    working_side = long_side * min(1.0, DET_TARGET_TEXT_HEIGHT / text_height)
+    working_side = int(min(long_side, max(working_side, DET_MIN_WORKING_SIDE)))
+    if working_side <= det_side * DET_TILE_MIN_RATIO:
+        return {"working_side": min(working_side, det_side), "tiled": False}
+
+    # 타일 수가 상한을 넘지 않도록 작업 해상도 조정
+    overlap = int(det_side * DET_TILE_OVERLAP)
+    while True:
+        ratio = working_side / long_side
+        cols = len(tile_origins(round(width * ratio), det_side, overlap))
+        rows = len(tile_origins(round(height * ratio), det_side, overlap))
+        if cols * rows <= DET_MAX_TILES or working_side <= det_side * DET_TILE_MIN_RATIO:
+            break
+        working_side = int(working_side * 0.8)
+    return {"working_side": working_side, "tiled": True}
+
+
+def detect_tiles(ocr, tiles):
+    """
+    타일들을 검출합니다. 스케줄러 백엔드면 타일 전체를 검출 작업 하나로 넣어 빈 워커들이 나눠 처리하게 하고,
+    비동기 제출만 지원하는 백엔드(워커 풀)면 모두 제출한 뒤 기다리며, 아니면 차례로 실행합니다.
+    하나라도 실패하면 아직 시작하지 않은 타일은 취소합니다.
+
+    Returns:
+        list: 타일마다 검출된 박스 목록
+    """
+    if hasattr(ocr, "submit_detect_many"):
+        futures = ocr.submit_detect_many(tiles)
+    elif hasattr(ocr, "submit_detect"):
+        futures = [ocr.submit_detect(tile) for tile in tiles]
+    else:
+        futures = None
+
+    if futures is None:
+        results = [ocr.text_detector(tile) for tile in tiles]
+    else:
+        try:
+            # 스케줄러 클라이언트는 우선순위별 제한 시간을 가짐 (일괄 작업은 None = 제한 없음)
+            timeout = getattr(ocr, "timeout", OCR_TASK_TIMEOUT)
+            results = [future.result(timeout=timeout) for future in futures]
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
+    return [list(result[0]) if result and result[0] is not None else [] for result in results]
+
+
+def merge_tile_boxes(tile_boxes):
+    """
+    타일별 검출 결과(타일 번호, 작업 해상도 좌표 박스)를 합칩니다.
+    겹침 영역에서 두 번 검출된 박스와 타일 경계에서 잘린 같은 줄의 조각은 외접 사각형 하나로 합치고,
+    나머지 박스는 원래 4점 좌표를 그대로 둡니다.
+    """
+    rects = [
+        (points[:, 0].min(), points[:, 1].min(), points[:, 0].max(), points[:, 1].max())
+        for _, points in tile_boxes
+    ]
+    parent = list(range(len(tile_boxes)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    # 서로 다른 타일의 박스끼리만 비교 (같은 타일 안의 박스는 검출기가 이미 분리한 것)
+    order = sorted(range(len(rects)), key=lambda i: rects[i][0])
+    for a_pos, i in enumerate(order):
+        ax0, ay0, ax1, ay1 = rects[i]
+        for j in order[a_pos + 1:]:
+            bx0, by0, bx1, by1 = rects[j]
+            if bx0 > ax1:
+                break
+            if tile_boxes[i][0] == tile_boxes[j][0]:
+                continue
+            inter_w = min(ax1, bx1) - max(ax0, bx0)
+            inter_h = min(ay1, by1) - max(ay0, by0)
+            if inter_w <= 0 or inter_h <= 0:
+                continue
+            min_area = min((ax1 - ax0) * (ay1 - ay0), (bx1 - bx0) * (by1 - by0))
+            min_height = min(ay1 - ay0, by1 - by0)
+            if (min_area > 0 and inter_w * inter_h / min_area >= DET_MERGE_OVERLAP) or \
+                    (min_height > 0 and inter_h / min_height >= DET_MERGE_LINE_OVERLAP):
+                parent[find(j)] = find(i)
+
+    groups = {}
+    for i in range(len(tile_boxes)):
+        groups.setdefault(find(i), []).append(i)
+
+    merged = []
+    for members in groups.values():
+        if len(members) == 1:
+            merged.append(tile_boxes[members[0]][1])
+            continue
+        x0 = min(rects[i][0] for i in members)
+        y0 = min(rects[i][1] for i in members)
+        x1 = max(rects[i][2] for i in members)
+        y1 = max(rects[i][3] for i in members)
+        merged.append(np.array([[x0, y0], [x1, y0], [x1, y1], [x0, y1]], dtype=np.float32))
+    return merged
+
+
+def detect_text_regions_adaptive(image_path, ocr, det_side):
+    """
+    이미지 크기와 글자 크기에 맞춘 해상도로 검출하고 BBox를 원본 좌표로 돌려줍니다.
+    글자가 커서 충분하면 모델 입력보다 작게 줄여 검출하고, 글자가 작은 큰 스캔본은 겹치는 타일로 나눠 검출합니다.
+    """
+    # 긴 변은 EXIF 회전과 무관하므로 헤더로 확인
+    with Image.open(image_path) as img:
+        long_side = max(img.size)
+
+    # 디코딩 결과는 EXIF 방향이 적용되어 헤더와 가로/세로가 바뀔 수 있으므로 디코딩한 배열 크기로 계획
+    probe_np, img_np = None, None
+    text_height = None
+    if long_side > det_side:
+        probe_np, _ = load_image_reduced(image_path, DET_PROBE_SIDE)
+        probe_np = resize_long_side(probe_np, DET_PROBE_SIDE)
+        probe_factor = long_side / max(probe_np.shape[:2])
+        height, width = (round(side * probe_factor) for side in probe_np.shape[:2])
+        probe_height = estimate_text_height(probe_np)
+        if probe_height is not None:
+            text_height = probe_height * probe_factor
+    else:
+        img_np, _ = load_image_reduced(image_path, long_side)
+        height, width = img_np.shape[:2]
+
+    plan = plan_detection(width, height, det_side, text_height)
+    working_side = plan["working_side"]
+
+    # 작업 해상도 이미지 준비 (축소본으로 충분하면 다시 디코딩하지 않음)
+    if img_np is None:
+        if working_side <= max(probe_np.shape[:2]):
+            img_np = resize_long_side(probe_np, working_side)
+        else:
+            img_np, _ = load_image_reduced(image_path, working_side)
+            img_np = resize_long_side(img_np, working_side)
+    factor = long_side / max(img_np.shape[:2])
+
+    if not plan["tiled"]:
+        boxes_result = ocr.text_detector(img_np)
+        boxes = list(boxes_result[0]) if boxes_result and boxes_result[0] is not None else []
+        return [np.array(box) * factor for box in boxes]
+
+    h, w = img_np.shape[:2]
+    overlap = int(det_side * DET_TILE_OVERLAP)
+    origins = [(x, y) for y in tile_origins(h, det_side, overlap) for x in tile_origins(w, det_side, overlap)]
+    tiles = [np.ascontiguousarray(img_np[y:y + det_side, x:x + det_side]) for x, y in origins]
+    print(f"DEBUG: 타일 검출 {len(tiles)}개 (작업 해상도 {w}x{h}, 추정 글자 높이 {text_height:.1f}px)")
+
+    tile_boxes = []
+    for index, ((x, y), boxes) in enumerate(zip(origins, detect_tiles(ocr, tiles))):
+        for box in boxes:
+            tile_boxes.append((index, np.asarray(box, dtype=np.float32) + np.array([x, y], dtype=np.float32)))
+    merged = merge_tile_boxes(tile_boxes)
+    merged.sort(key=lambda points: (points[:, 1].min(), points[:, 0].min()))
+    return [points * factor for points in merged]
+
+
+def detect_text_regions(image_path, ocr, det_max_side=None):
     """
     이미지에서 텍스트 영역(BBox)만 검출하는 함수
+
+    det_max_side(검출 모델 입력 크기)를 지정하면 이미지/글자 크기에 맞춘 작업 해상도로 축소 디코딩하거나
+    큰 이미지를 타일로 나눠 검출하고 BBox를 원본 좌표로 되돌립니다.
+    이 경우 원본 해상도 이미지는 디코딩하지 않으므로 반환 이미지는 None입니다.
     """
+    if det_max_side:
+        return None, detect_text_regions_adaptive(image_path, ocr, det_max_side)
+
     img_np = cv2.imread(image_path)
     if img_np is None:
         img = Image.open(image_path)
@@ -162,23 +1071,32 @@ def auto_detect_text_regions(bucket_name, object_name, bboxes, labels):
     temp_image_path = None
     try:
         # MinIO에서 임시 파일로 이미지 다운로드
-        temp_image_path = st.session_state.st.session_state.minio_client.load_image(
+        temp_image_path = st.session_state.minio_client.load_image(
             bucket_name,
             object_name
         )
         
         if temp_image_path:
-            # 텍스트 영역 감지
-            if st.session_state.ocr is None:
-                st.session_state.ocr = PaddleOCR(
-                    use_angle_cls=True,
-                    show_log=False,
-                    lang='korean',
-                    det_model_dir='/Users/nongshim/Desktop/Python/project/streamlit_image_annotation/Detection/inference/det_v6',
-                    rec_model_dir='/Users/nongshim/Desktop/Python/project/streamlit_image_annotation/Detection/inference/rec_v2_19_best'
-                )
+            # 같은 이미지/모델의 검출 결과가 있으면 재사용
+            content_hash = get_content_hash(st.session_state.current_image)
+            if not content_hash:
+                with open(temp_image_path, "rb") as f:
+                    content_hash = compute_content_hash(f)
+            cache_key = make_ocr_cache_key(
+                "det", content_hash, get_model_fingerprint(DEFAULT_OCR_CONFIG, "det"), DET_CACHE_VARIANT
+            )
+            detected_boxes = ocr_cache_get(cache_key)
 
-            _, detected_boxes = detect_text_regions(temp_image_path, st.session_state.ocr)
+            if detected_boxes is None:
+                # 텍스트 영역 감지 (스케줄러를 거쳐 OCR 워커 프로세스에서 실행, 스크립트 스레드는 결과만 기다림)
+                ocr = get_ocr_scheduler().client(PRIORITY_INTERACTIVE_IMAGE, user=st.session_state.get("userid"))
+                _, detected_boxes = detect_text_regions(
+                    temp_image_path,
+                    ocr,
+                    det_max_side=get_det_decode_side(ocr)
+                )
+                detected_boxes = [np.asarray(box).tolist() for box in detected_boxes]
+                ocr_cache_put(cache_key, "det", detected_boxes)
             # 감지된 바운딩 박스를 기존 어노테이션에 추가
             for box in detected_boxes:
                 # PaddleOCR의 box는 4개의 점(점 4개가 x, y 좌표를 가짐)으로 구성됨
@@ -207,6 +1125,7 @@ def auto_detect_text_regions(bucket_name, object_name, bboxes, labels):
                         # 새 어노테이션 객체 생성
                         new_annotation = {
                             "id": max_id + 1,
+                            "box_id": f"auto-{uuid.uuid4().hex[:12]}",
                             "label": "",
                             "bbox": {
                                 "x": new_bbox[0],
@@ -218,6 +1137,8 @@ def auto_detect_text_regions(bucket_name, object_name, bboxes, labels):
                         # print("DEBUG: new_annotation", new_annotation)
                         st.session_state.annotations.append(new_annotation)
   
+    except OCROverloadedError:
+        st.warning("OCR 서버가 혼잡합니다. 잠시 후 다시 시도해주세요.")
     except Exception as e:
         st.error(f"이미지 로드 또는 텍스트 감지 중 오류 발생: {e}")
     finally:
@@ -249,50 +1170,125 @@ def preprocess_roi(cropped, target_width=320, target_height=48):
     
     return processed
 
-def recognize_text_from_rois(img_np, boxes, ocr, batch_size=32, width=320, height=48):
+def recognize_text_from_rois(img_np, boxes, ocr, batch_size=32):
     """
     검출된 BBox를 기반으로 ROI를 추출한 후, 텍스트를 인식하는 함수
+    결과는 boxes 순서대로 반환합니다.
     """
-    roi_images = []
-    valid_boxes = []
-
-    # ROI 추출 및 전처리
-    for points in boxes:
-        x_min, x_max = int(min(points[:, 0])), int(max(points[:, 0]))
-        y_min, y_max = int(min(points[:, 1])), int(max(points[:, 1]))
-        
-        cropped = img_np[y_min:y_max, x_min:x_max]
-        processed = preprocess_roi(cropped, width, height)  # 전처리 함수 적용
-        
-        roi_images.append(processed)
-        valid_boxes.append(points)
+    results = recognize_crops(crop_boxes(img_np, boxes), ocr, batch_size=batch_size)
 
     paddle_boxes = []
     paddle_txts = []
     paddle_scores = []
-
-    # 배치 단위로 Recognition 수행
-    for i in range(0, len(roi_images), batch_size):
-        batch_images = roi_images[i:i+batch_size]
-        batch_boxes = valid_boxes[i:i+batch_size]
-        
-        rec_results = ocr.text_recognizer(batch_images)
-        
-        if rec_results is None or len(rec_results[0]) == 0:
-            continue
-        
-        texts = rec_results[0]
-        
-        for j, (text_info, box) in enumerate(zip(texts, batch_boxes)):
-            if text_info is not None:
-                text, conf = text_info
-                paddle_boxes.append(box.tolist())
-                paddle_txts.append(text)
-                paddle_scores.append(conf)
+    for points, text_info in zip(boxes, results):
+        if text_info is not None:
+            text, conf = text_info
+            paddle_boxes.append(np.asarray(points).tolist())
+            paddle_txts.append(text)
+            paddle_scores.append(conf)
 
     return paddle_boxes, paddle_txts, paddle_scores
 
 
+def make_ocr_cache_key(kind, content_hash, fingerprint, extra=None):
+    """OCR 결과 캐시 키를 만듭니다. extra에는 bbox 등 입력을 구분하는 값을 넣습니다."""
+    parts = [kind, content_hash, fingerprint]
+    if extra is not None:
+        parts.append(json.dumps(extra, separators=(",", ":")))
+    return ":".join(parts)
+
+
+def ocr_cache_get(cache_key):
+    """메모리 캐시를 먼저 보고, 없으면 Postgres에서 읽어 메모리에 올립니다."""
+    with _ocr_result_cache_lock:
+        if cache_key in _ocr_result_cache:
+            _ocr_result_cache.move_to_end(cache_key)
+            return _ocr_result_cache[cache_key]
+
+    result = get_ocr_cache(cache_key)
+    if result is not None:
+        _ocr_cache_remember(cache_key, result)
+    return result
+
+
+def ocr_cache_put(cache_key, kind, result):
+    """OCR 결과를 메모리와 Postgres에 저장합니다."""
+    _ocr_cache_remember(cache_key, result)
+    put_ocr_cache(cache_key, kind, result)
+
+
+def _ocr_cache_remember(cache_key, result):
+    with _ocr_result_cache_lock:
+        _ocr_result_cache[cache_key] = result
+        _ocr_result_cache.move_to_end(cache_key)
+        while len(_ocr_result_cache) > OCR_CACHE_MAX_ENTRIES:
+            _ocr_result_cache.popitem(last=False)
+
+
+def get_ocr_image(client, bucket_name, object_name):
+    """
+    박스 단위 OCR에 쓸 원본 해상도 RGB 이미지를 (ETag 기준) 캐시해서 반환합니다.
+
+    Returns:
+        tuple: (RGB 이미지 NumPy 배열, 원본 바이트의 sha256)
+    """
+    etag = client.get_object_etag(bucket_name, object_name)
+    key = (bucket_name, object_name, etag)
+    with _ocr_image_cache_lock:
+        entry = _ocr_image_cache.get(key)
+        if entry is not None:
+            _ocr_image_cache.move_to_end(key)
+            return entry
+
+    raw = client.get_object_bytes(bucket_name, object_name)
+    data = np.frombuffer(raw, dtype=np.uint8)
+    image_np = cv2.cvtColor(cv2.imdecode(data, cv2.IMREAD_COLOR), cv2.COLOR_BGR2RGB)
+    entry = (image_np, hashlib.sha256(raw).hexdigest())
+    with _ocr_image_cache_lock:
+        _ocr_image_cache[key] = entry
+        while len(_ocr_image_cache) > OCR_IMAGE_CACHE_SIZE:
+            _ocr_image_cache.popitem(last=False)
+    return entry
+
+
+def suggest_labels_for_box(client, bucket_name, object_name, bbox):
+    """
+    선택한 박스 영역의 텍스트를 인식해 라벨 추천 목록을 반환합니다.
+    인식은 여러 세션의 요청을 모아 한 번에 추론하는 배치 스케줄러를 거칩니다.
+
+    같은 이미지의 같은 박스(정수 픽셀로 반올림)는 캐시된 결과를 바로 돌려줍니다.
+
+    Args:
+        bbox: 원본 이미지 좌표 [x, y, width, height]
+    """
+    fingerprint = get_model_fingerprint(DEFAULT_OCR_CONFIG, "rec")
+    rounded_bbox = [int(round(v)) for v in bbox]
+
+    # 업로드 시 기록된 해시가 있으면 이미지를 받기 전에 캐시 확인
+    content_hash = get_content_hash(object_name)
+    if content_hash:
+        cached = ocr_cache_get(make_ocr_cache_key("rec", content_hash, fingerprint, rounded_bbox))
+        if cached is not None:
+            return cached
+
+    try:
+        image_np, image_hash = get_ocr_image(client, bucket_name, split_first_dir(object_name)[1])
+    except Exception as e:
+        print(f"DEBUG: OCR용 이미지 로드 실패: {object_name}, {e}")
+        return ["추천"]
+
+    cache_key = make_ocr_cache_key("rec", content_hash or image_hash, fingerprint, rounded_bbox)
+    if not content_hash:
+        cached = ocr_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+    suggestions = process_ocr_for_bbox_array(image_np, bbox, get_recognition_batcher())
+    if suggestions and suggestions != ["추천"]:  # 실패 시 기본값은 저장하지 않음
+        ocr_cache_put(cache_key, "rec", suggestions)
+    return suggestions
+
+
 def process_ocr_for_bbox_array(image_np, bbox, ocr):
     """
     NumPy 배열 형태의 이미지에서 선택된 바운딩 박스에 대해 OCR 처리를 수행합니다.
@@ -366,11 +1362,10 @@ def process_ocr_for_bbox_array(image_np, bbox, ocr):
 def convert_annotations(annotations, format_option, image_path):
     if format_option == "YOLO":
         # 예: YOLO 포맷으로 변환 (x_center, y_center, width, height) 정규화 필요
-        # 이미지 크기를 불러오는 부분이 필요함
-        from PIL import Image
-        image_file = st.session_state.minio_client.load_image(st.session_state.selected_bucket, image_path)
-        with Image.open(image_file) as img:
-            img_w, img_h = img.size
+        # 박스는 EXIF 방향을 적용한 좌표이므로 크기도 방향 적용 기준으로 읽음 (헤더만 범위 요청)
+        img_w, img_h = get_image_dimensions(image_path)
+        if img_w is None:
+            return None
 
         yolo_lines = []
         for ann in annotations:
@@ -396,10 +1391,9 @@ def convert_annotations(annotations, format_option, image_path):
         filename.text = os.path.basename(image_path)
 
         size = SubElement(annotation, 'size')
-        image_file = st.session_state.minio_client.load_image(st.session_state.selected_bucket, image_path)
-        from PIL import Image
-        with Image.open(image_file) as img:
-            img_w, img_h = img.size
+        img_w, img_h = get_image_dimensions(image_path)
+        if img_w is None:
+            return None
         SubElement(size, 'width').text = str(img_w)
         SubElement(size, 'height').text = str(img_h)
         SubElement(size, 'depth').text = "3"
@@ -436,6 +1430,8 @@ def create_download_zip(selected_images, format_option, download_option):
                 if success and "annotations" in st.session_state:
                     annotations = st.session_state.annotations
                     label_content = convert_annotations(annotations, format_option, object_name)
+                    if label_content is None:
+                        continue
                     label_filename = os.path.splitext(os.path.basename(object_name))[0] + ".txt"
                     zipf.writestr(f"labels/{label_filename}", label_content)
 
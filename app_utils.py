@@ -1,6 +1,8 @@
 import streamlit as st
+import streamlit.components.v1 as components
 import os
 import json
+import uuid
 from PIL import Image
 import datetime
 from postgresql_utils import *
@@ -44,6 +46,7 @@ def login():
 def set_mode(mode: str):
     """모드 전환: project_list, image_list, labeling"""
     st.session_state.mode = mode
+    reset_loaded_annotations()
     if mode == "project_list":
         st.session_state.project_id = None
         st.session_state.current_image = None
@@ -71,6 +74,7 @@ def select_project(project_id: str):
 def toggle_review_mode():
     """검토/레이블링 전환"""
     st.session_state.review_mode = not st.session_state.review_mode
+    reset_loaded_annotations()
 
 
 def load_user_database():
@@ -89,16 +93,34 @@ def file_uploader(uploaded_files):
     failed_files = []
     duplicate_files = []
 
-    # 1️⃣ 중복 파일 확인
-    all_files_in_bucket = st.session_state.minio_client.list_all_files(st.session_state.selected_bucket)
-    all_filenames = [os.path.basename(file_path) for file_path in all_files_in_bucket]
+    # 1️⃣ 중복 파일 확인 (업로드 대상 전체를 metadata 인덱스로 한 번에 조회)
+    #    같은 이름의 파일이 여러 개 선택될 수 있으므로 해시는 파일 순서(인덱스)로 대응
+    content_hashes = [compute_content_hash(file) for file in uploaded_files]
+    existing = get_existing_uploads(
+        [file.name for file in uploaded_files],
+        content_hashes
+    )
+    if existing is None:
+        st.error("중복 파일 여부를 확인할 수 없어 업로드를 중단합니다.")
+        return False
+    existing_filenames, existing_hashes = existing
     
     for i, file in enumerate(uploaded_files):
         # 상태 메시지 업데이트
         status_text.text(f"업로드 중... ({i+1}/{total_files}): {file.name}")
 
-        if file.name not in all_filenames:
-            # 2️⃣ 이미지 업로드
+        content_hash = content_hashes[i]
+        if file.name not in existing_filenames and content_hash not in existing_hashes:
+            # 2️⃣ 업로드 전 메모리의 파일 헤더에서 이미지 크기 확인
+            try:
+                width, height, orientation = read_image_header(file)
+            except Exception as e:
+                print(f"이미지 헤더 확인 실패: {file.name}, {e}")
+                failed_files.append(file.name)
+                continue
+            print(f"DEBUG: {file.name} width={width}, height={height}, orientation={orientation}")
+
+            # 3️⃣ 이미지 업로드
             success = st.session_state.minio_client.upload_image(
                 bucket_name=st.session_state.selected_bucket,
                 folder_path=project_path,
@@ -109,16 +131,19 @@ def file_uploader(uploaded_files):
                 failed_files.append(file.name)
                 continue
             else:
-                # 3️⃣ 메타데이터 DB에 삽입
+                # 4️⃣ 메타데이터 DB에 삽입
                 image_path = f"{st.session_state.selected_bucket}/{project_path}{file.name}"
-                insert_metadata(st.session_state.project_name, image_path)
+                insert_metadata(st.session_state.project_name, image_path, content_hash, width, height)
+                # 같은 업로드 묶음 안의 중복도 걸러내도록 조회 결과에 추가
+                existing_filenames.add(file.name)
+                existing_hashes.add(content_hash)
         else:
             # 중복된 파일 처리
             duplicate_files.append(file.name)
             continue
         progress_bar.progress((i + 1) / total_files)
     
-    # 4️⃣ 결과 요약
+    # 5️⃣ 결과 요약
     if failed_files:
         st.error("업로드 실패한 파일은 제외합니다:")
         st.warning(', '.join(failed_files))
@@ -132,6 +157,235 @@ def file_uploader(uploaded_files):
         return True
 
 
+# 브라우저 → MinIO 직접 업로드 위젯
+DIRECT_UPLOAD_CONCURRENCY = 4
+# 직접 업로드 임시 저장 위치 (프로젝트 prefix 밖이라 프로젝트 이미지 목록에 섞이지 않음)
+DIRECT_UPLOAD_STAGING_ROOT = "_incoming"
+# 완료 처리되지 않은 임시 객체를 지우는 기간 (일)
+DIRECT_UPLOAD_STAGING_EXPIRE_DAYS = 1
+DIRECT_UPLOAD_LIFECYCLE_RULE_ID = "easylabel-incoming-expire"
+# 브라우저가 계산한 sha256을 담는 객체 메타데이터 이름 (x-amz-meta-content-hash)
+DIRECT_UPLOAD_HASH_METADATA = "content-hash"
+DIRECT_UPLOAD_HTML = """
+<div style="font-family: sans-serif; font-size: 14px;">
+    <input type="file" id="direct-upload-files" multiple accept="image/jpeg,image/png">
+    <button id="direct-upload-start">MinIO로 업로드</button>
+    <div id="direct-upload-status" style="margin-top: 8px;"></div>
+</div>
+<script>
+    const uploadUrl = __UPLOAD_URL__;
+    const formFields = __FORM_FIELDS__;
+    const keyPrefix = __KEY_PREFIX__;
+    const concurrency = __CONCURRENCY__;
+    const hashField = __HASH_FIELD__;
+
+    // 업로드와 함께 보낼 sha256 (일반 업로드의 compute_content_hash와 같은 hex 값)
+    const sha256Hex = async (file) => {
+        const digest = await crypto.subtle.digest("SHA-256", await file.arrayBuffer());
+        return Array.from(new Uint8Array(digest)).map((b) => b.toString(16).padStart(2, "0")).join("");
+    };
+
+    document.getElementById("direct-upload-start").onclick = async () => {
+        const files = Array.from(document.getElementById("direct-upload-files").files)
+            .filter((file) => /\\.(jpe?g|png)$/i.test(file.name));
+        const status = document.getElementById("direct-upload-status");
+        if (!window.crypto || !crypto.subtle) {
+            status.textContent = "이 브라우저 연결에서는 파일 해시를 계산할 수 없습니다 (HTTPS 또는 localhost 필요). 일반 업로드를 사용해주세요.";
+            return;
+        }
+        const queue = files.slice();
+        const failed = [];
+        let done = 0;
+
+        const worker = async () => {
+            while (queue.length > 0) {
+                const file = queue.shift();
+                const form = new FormData();
+                Object.entries(formFields).forEach(([name, value]) => form.append(name, value));
+                form.append("key", keyPrefix + file.name);
+                form.append("Content-Type", file.type || "image/jpeg");
+                try {
+                    form.append(hashField, await sha256Hex(file));
+                    form.append("file", file);
+                    const response = await fetch(uploadUrl, { method: "POST", body: form });
+                    if (!response.ok) failed.push(file.name);
+                } catch (error) {
+                    failed.push(file.name);
+                }
+                done += 1;
+                status.textContent = `업로드 중... (${done}/${files.length})`;
+            }
+        };
+        await Promise.all(Array.from({ length: Math.min(concurrency, files.length) }, worker));
+
+        status.textContent = failed.length > 0
+            ? `업로드 완료: ${files.length - failed.length}개, 실패: ${failed.join(", ")}`
+            : `업로드 완료: ${files.length}개. '업로드 완료 처리' 버튼을 눌러주세요.`;
+    };
+</script>
+"""
+
+
+def get_direct_upload_prefix():
+    """현재 직접 업로드 묶음이 임시로 저장될 MinIO prefix를 반환합니다."""
+    if not st.session_state.get("direct_upload_id"):
+        st.session_state.direct_upload_id = str(uuid.uuid4())[:8]
+    return f"{DIRECT_UPLOAD_STAGING_ROOT}/{st.session_state.project_id}/{st.session_state.direct_upload_id}/"
+
+
+def ensure_direct_upload_expiration(bucket_name):
+    """
+    완료 처리되지 않은 직접 업로드 임시 객체가 남지 않도록 버킷 수명 주기 규칙을 한 번 설정합니다.
+    규칙을 설정할 수 없으면(권한 부족 등) 기간이 지난 임시 객체를 직접 지웁니다.
+    """
+    checked = st.session_state.setdefault("direct_upload_expiration_checked", set())
+    if bucket_name in checked:
+        return
+    minio_client = st.session_state.minio_client
+    staging_root = f"{DIRECT_UPLOAD_STAGING_ROOT}/"
+    if not minio_client.ensure_prefix_expiration(
+        bucket_name, staging_root, DIRECT_UPLOAD_STAGING_EXPIRE_DAYS, DIRECT_UPLOAD_LIFECYCLE_RULE_ID
+    ):
+        try:
+            deleted = minio_client.delete_objects_older_than(
+                bucket_name, staging_root, datetime.timedelta(days=DIRECT_UPLOAD_STAGING_EXPIRE_DAYS)
+            )
+            print(f"DEBUG: 기간이 지난 직접 업로드 임시 객체 {deleted}개 삭제")
+        except Exception as e:
+            print(f"DEBUG: 직접 업로드 임시 객체 정리 실패: {e}")
+    checked.add(bucket_name)
+
+
+def direct_uploader():
+    """
+    브라우저가 presigned POST policy로 MinIO에 직접 업로드하는 위젯을 표시합니다.
+    파일 데이터는 Streamlit 서버를 거치지 않으며, 업로드 후 완료 처리 버튼으로
+    메타데이터를 일괄 등록합니다.
+
+    Returns:
+        bool: 완료 처리에서 한 개 이상 등록되었으면 True
+    """
+    ensure_direct_upload_expiration(st.session_state.selected_bucket)
+    staging_prefix = get_direct_upload_prefix()
+    upload_url, form_fields = st.session_state.minio_client.get_presigned_post_policy(
+        st.session_state.selected_bucket, staging_prefix, metadata_fields=(DIRECT_UPLOAD_HASH_METADATA,)
+    )
+    if upload_url is None:
+        st.error("직접 업로드 URL을 생성할 수 없습니다.")
+        return False
+
+    html = (
+        DIRECT_UPLOAD_HTML
+        .replace("__UPLOAD_URL__", json.dumps(upload_url))
+        .replace("__FORM_FIELDS__", json.dumps(form_fields))
+        .replace("__KEY_PREFIX__", json.dumps(staging_prefix))
+        .replace("__CONCURRENCY__", str(DIRECT_UPLOAD_CONCURRENCY))
+        .replace("__HASH_FIELD__", json.dumps(f"x-amz-meta-{DIRECT_UPLOAD_HASH_METADATA}"))
+    )
+    components.html(html, height=100)
+
+    if st.button("업로드 완료 처리", type="primary", key="finalize_direct_upload", use_container_width=True):
+        return finalize_direct_uploads()
+    return False
+
+
+def finalize_direct_uploads():
+    """
+    직접 업로드된 임시 객체를 확인해 중복(파일 이름, 내용 해시)을 제외하고 프로젝트 경로로 이동한 뒤
+    메타데이터를 한 번에 삽입합니다. 이미지 크기는 객체 헤더만 범위 요청으로 읽고,
+    내용 해시는 브라우저가 업로드 때 넣은 객체 메타데이터에서 읽으므로 본문은 받지 않습니다.
+    메타데이터 삽입에 실패하면 이동한 객체를 지워 DB에 없는 이미지가 남지 않게 합니다.
+    """
+    bucket_name = st.session_state.selected_bucket
+    project_path = f"{st.session_state.project_id}/"
+    staging_prefix = get_direct_upload_prefix()
+    minio_client = st.session_state.minio_client
+
+    staged_objects = minio_client.list_images_in_bucket(bucket_name, prefix=staging_prefix)
+    if not staged_objects:
+        st.warning("업로드된 파일이 없습니다.")
+        return False
+
+    # 1️⃣ 헤더와 내용 해시 확인
+    staged = []
+    failed_files = []
+    discarded_objects = []
+    for object_name in staged_objects:
+        filename = os.path.basename(object_name)
+        try:
+            width, height, _ = minio_client.get_image_header(bucket_name, object_name)
+            content_hash = minio_client.get_object_metadata(bucket_name, object_name, DIRECT_UPLOAD_HASH_METADATA)
+            if not content_hash or len(content_hash) != 64:
+                raise ValueError(f"내용 해시 메타데이터가 올바르지 않습니다: {content_hash}")
+            content_hash = content_hash.lower()
+        except Exception as e:
+            print(f"직접 업로드 완료 처리 실패: {object_name}, {e}")
+            failed_files.append(filename)
+            discarded_objects.append(object_name)
+            continue
+        staged.append((object_name, filename, width, height, content_hash))
+
+    # 2️⃣ 중복 파일 확인 (metadata 인덱스로 한 번에 조회)
+    existing = get_existing_uploads(
+        [filename for _, filename, _, _, _ in staged],
+        [content_hash for _, _, _, _, content_hash in staged]
+    )
+    if existing is None:
+        st.error("중복 파일 여부를 확인할 수 없어 완료 처리를 중단합니다.")
+        return False
+    existing_filenames, existing_hashes = existing
+
+    # 3️⃣ 프로젝트 경로로 이동
+    images = []
+    moved_objects = []
+    duplicate_files = []
+    for object_name, filename, width, height, content_hash in staged:
+        if filename in existing_filenames or content_hash in existing_hashes:
+            duplicate_files.append(filename)
+            discarded_objects.append(object_name)
+            continue
+        target_object = f"{project_path}{filename}"
+        try:
+            minio_client.move_object(bucket_name, object_name, target_object)
+        except Exception as e:
+            print(f"직접 업로드 이동 실패: {object_name}, {e}")
+            failed_files.append(filename)
+            discarded_objects.append(object_name)
+            continue
+        # 같은 업로드 묶음 안의 중복도 걸러내도록 조회 결과에 추가
+        existing_filenames.add(filename)
+        existing_hashes.add(content_hash)
+        moved_objects.append(target_object)
+        images.append({
+            "storage_path": f"{bucket_name}/{target_object}",
+            "width": width,
+            "height": height,
+            "content_hash": content_hash,
+        })
+
+    if discarded_objects:
+        minio_client.delete_objects(bucket_name, discarded_objects)
+
+    # 4️⃣ 메타데이터 일괄 삽입 (실패하면 이동한 객체 삭제)
+    inserted = insert_metadata_bulk(st.session_state.project_name, images)
+    if images and not inserted:
+        minio_client.delete_objects(bucket_name, moved_objects)
+        failed_files.extend(os.path.basename(object_name) for object_name in moved_objects)
+
+    # 다음 업로드 묶음은 새 prefix 사용
+    st.session_state.direct_upload_id = None
+
+    if failed_files:
+        st.error("업로드 실패한 파일은 제외합니다:")
+        st.warning(', '.join(failed_files))
+    if duplicate_files:
+        st.error("중복된 파일은 제외합니다:")
+        st.warning(', '.join(duplicate_files))
+    if inserted:
+        st.success(f"{inserted}개 이미지 등록 완료!")
+    return inserted > 0
+
+
 def update_current_image():
     """현재 페이지에 해당하는 이미지를 업데이트하고 어노테이션 데이터 로드"""
     if not hasattr(st.session_state, 'minio_client') or not st.session_state.selected_bucket:
@@ -244,7 +498,8 @@ def handle_next_image_after_action():
         prefix=st.session_state.project_id
     )
     
-    # 이미지 목록 처리
+    # 이미지 목록 처리 (상태가 바뀐 이미지의 어노테이션은 다시 읽음)
+    reset_loaded_annotations()
     adjust_page_after_action(updated_image_objects)
     
     update_current_image()
@@ -0,0 +1,297 @@
+import os
+import time
+import uuid
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import cv2
+
+from postgresql_utils import (
+    get_content_hash, get_project_image_paths, get_prelabel_status, get_labeled_image_paths,
+    set_prelabel_status, save_pre_annotations
+)
+from minio_utils import MinIOManager, compute_content_hash
+from ocr_utils import (
+    DEFAULT_OCR_CONFIG, OCR_WORKERS, PRIORITY_BATCH,
+    get_model_fingerprint, get_ocr_scheduler, crop_boxes, recognize_crops
+)
+from annotate_utils import (
+    split_first_dir, detect_text_regions, get_det_decode_side,
+    make_ocr_cache_key, ocr_cache_get, ocr_cache_put, DET_CACHE_VARIANT
+)
+
+# 일괄 자동 감지 설정
+BATCH_WRITE_SIZE = 32               # 이 개수만큼 처리할 때마다 DB에 사전 어노테이션을 한 번에 저장
+BATCH_CONCURRENCY = OCR_WORKERS     # 동시에 처리할 이미지 수 (워커 프로세스 수만큼이면 충분)
+BATCH_JOB_HISTORY = 20              # 화면에 남겨둘 완료 작업 수
+
+# 중단 요청 후 처리하지 않고 건너뛴 이미지 표시
+_STOPPED = object()
+
+# 진행 중/완료된 작업 (프로세스 전체 공유)
+_jobs = {}
+_jobs_lock = threading.Lock()
+
+
+class BatchDetectJob:
+    """
+    선택한 이미지들을 백그라운드 스레드에서 자동 감지하고 결과를 사전 어노테이션으로 저장하는 작업
+
+    이미 'done'인 이미지는 건너뛰므로, 중단된 작업은 같은 대상으로 다시 시작하면 남은 이미지만 처리합니다.
+    확정됐거나 이미 어노테이션이 있는 이미지도 사전 어노테이션을 넣지 않으므로 검출하지 않고 건너뜁니다.
+    상태 필드(state, 카운터, 시각, error)는 진행 상황을 읽는 다른 스레드와 겹치지 않도록 _lock을 잡고 바꿉니다.
+    """
+    def __init__(self, minio_client, image_paths, user=None, recognize=False, config_name=DEFAULT_OCR_CONFIG):
+        self.job_id = uuid.uuid4().hex[:8]
+        self.minio_client = minio_client
+        self.image_paths = list(dict.fromkeys(image_paths))
+        self.user = user
+        self.recognize = recognize
+        self.config_name = config_name
+
+        self.total = len(self.image_paths)
+        self.done = 0
+        self.skipped = 0
+        self.failed = 0
+        self.annotations = 0
+        self.state = "pending"  # pending, running, stopped, finished, error
+        self.error = None
+        self.started_at = None
+        self.finished_at = None
+
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, name=f"batch-detect-{self.job_id}", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """현재 처리 중인 이미지까지만 저장하고 멈춥니다 (같은 묶음의 나머지 이미지는 시작하지 않음)."""
+        self._stop.set()
+
+    def join(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def is_active(self):
+        with self._lock:
+            return self.state in ("pending", "running")
+
+    def progress(self):
+        with self._lock:
+            processed = self.done + self.skipped + self.failed
+            return {
+                "job_id": self.job_id,
+                "user": self.user,
+                "state": self.state,
+                "total": self.total,
+                "processed": processed,
+                "done": self.done,
+                "skipped": self.skipped,
+                "failed": self.failed,
+                "annotations": self.annotations,
+                "ratio": processed / self.total if self.total else 1.0,
+                "elapsed": (self.finished_at or time.time()) - self.started_at if self.started_at else 0.0,
+                "error": self.error,
+            }
+
+    def run(self):
+        with self._lock:
+            self.started_at = time.time()
+            self.state = "running"
+        try:
+            status = get_prelabel_status(self.image_paths)
+            labeled = get_labeled_image_paths(self.image_paths)
+            if status is None or labeled is None:
+                raise RuntimeError("자동 감지 상태를 조회하지 못했습니다.")
+            todo = [path for path in self.image_paths if status.get(path) != "done" and path not in labeled]
+            with self._lock:
+                self.skipped = self.total - len(todo)
+            set_prelabel_status(todo, "queued")
+
+            ocr = get_ocr_scheduler(self.config_name).client(PRIORITY_BATCH, user=f"batch:{self.user}")
+            det_max_side = get_det_decode_side(ocr)
+
+            with ThreadPoolExecutor(max_workers=BATCH_CONCURRENCY, thread_name_prefix=f"batch-detect-{self.job_id}") as executor:
+                for start in range(0, len(todo), BATCH_WRITE_SIZE):
+                    if self._stop.is_set():
+                        break
+                    chunk = todo[start:start + BATCH_WRITE_SIZE]
+                    results = []
+                    failed = []
+                    for path, annotations in zip(chunk, executor.map(lambda p: self._process_unless_stopped(p, ocr, det_max_side), chunk)):
+                        if annotations is _STOPPED:
+                            continue
+                        if annotations is None:
+                            failed.append(path)
+                        else:
+                            results.append((path, annotations))
+
+                    saved = save_pre_annotations(results)
+                    if saved is None:
+                        failed.extend(path for path, _ in results)
+                        results = []
+                    set_prelabel_status(failed, "failed")
+                    with self._lock:
+                        self.done += len(results)
+                        self.failed += len(failed)
+                        self.annotations += saved or 0
+
+            # 중단된 경우 아직 처리하지 않은 이미지는 대기 상태를 풀어 다음 실행 때 다시 처리
+            if self._stop.is_set():
+                remaining = get_prelabel_status(todo) or {}
+                set_prelabel_status([path for path in todo if remaining.get(path) == "queued"], None)
+                state = "stopped"
+            else:
+                state = "finished"
+            with self._lock:
+                self.state = state
+        except Exception as e:
+            print(f"DEBUG: 일괄 자동 감지 작업 {self.job_id} 오류 - {e}")
+            with self._lock:
+                self.error = str(e)
+                self.state = "error"
+        finally:
+            with self._lock:
+                self.finished_at = time.time()
+
+    def _process_unless_stopped(self, image_path, ocr, det_max_side):
+        """중단 요청이 있으면 이미지를 처리하지 않고 _STOPPED를 반환합니다 (이미지마다 확인)."""
+        if self._stop.is_set():
+            return _STOPPED
+        return self._process_image(image_path, ocr, det_max_side)
+
+    def _process_image(self, image_path, ocr, det_max_side):
+        """
+        이미지 한 장을 감지(선택적으로 인식)해 [(label, bbox dict), ...]를 반환합니다. 실패하면 None.
+        """
+        bucket_name, object_name = split_first_dir(image_path)
+        temp_image_path = None
+        try:
+            temp_image_path = self.minio_client.load_image(bucket_name, object_name)
+            if not temp_image_path:
+                return None
+
+            # 화면의 자동 감지와 같은 검출 캐시를 공유
+            content_hash = get_content_hash(image_path)
+            if not content_hash:
+                with open(temp_image_path, "rb") as f:
+                    content_hash = compute_content_hash(f)
+            cache_key = make_ocr_cache_key(
+                "det", content_hash, get_model_fingerprint(self.config_name, "det"), DET_CACHE_VARIANT
+            )
+            detected_boxes = ocr_cache_get(cache_key)
+            if detected_boxes is None:
+                _, detected_boxes = detect_text_regions(temp_image_path, ocr, det_max_side=det_max_side)
+                detected_boxes = [np.asarray(box).tolist() for box in detected_boxes]
+                ocr_cache_put(cache_key, "det", detected_boxes)
+
+            labels = [""] * len(detected_boxes)
+            if self.recognize and detected_boxes:
+                img_np = cv2.cvtColor(cv2.imread(temp_image_path), cv2.COLOR_BGR2RGB)
+                rec_results = recognize_crops(crop_boxes(img_np, detected_boxes), ocr)
+                labels = [text_info[0] if text_info else "" for text_info in rec_results]
+
+            annotations = []
+            for box, label in zip(detected_boxes, labels):
+                points = np.array(box)
+                min_x, min_y = np.min(points, axis=0)
+                max_x, max_y = np.max(points, axis=0)
+                annotations.append((label, {
+                    "x": float(min_x),
+                    "y": float(min_y),
+                    "width": float(max_x - min_x),
+                    "height": float(max_y - min_y)
+                }))
+            return annotations
+        except Exception as e:
+            print(f"DEBUG: 자동 감지 실패 ({image_path}) - {e}")
+            return None
+        finally:
+            if temp_image_path and os.path.exists(temp_image_path):
+                os.unlink(temp_image_path)
+
+
+def start_batch_detect(minio_client, image_paths, user=None, recognize=False, config_name=DEFAULT_OCR_CONFIG):
+    """
+    일괄 자동 감지 작업을 백그라운드로 시작하고 작업 객체를 반환합니다.
+    같은 사용자의 작업이 이미 실행 중이면 새 작업을 시작하지 않고 None을 반환합니다
+    (새 선택을 기존 작업에 합치지 않으므로, 기존 작업이 끝나거나 중지한 뒤 다시 시작해야 함).
+    """
+    with _jobs_lock:
+        if any(job.user == user and job.is_active() for job in _jobs.values()):
+            return None
+
+        job = BatchDetectJob(minio_client, image_paths, user=user, recognize=recognize, config_name=config_name)
+        _jobs[job.job_id] = job
+
+        finished = [job_id for job_id, j in _jobs.items() if not j.is_active()]
+        for job_id in finished[:max(len(finished) - BATCH_JOB_HISTORY, 0)]:
+            del _jobs[job_id]
+    return job.start()
+
+
+def get_batch_jobs(user=None, active_only=False):
+    """작업 진행 상황 목록을 반환합니다 (user를 지정하면 해당 사용자의 작업만)."""
+    with _jobs_lock:
+        jobs = list(_jobs.values())
+    return [
+        job.progress() for job in jobs
+        if (user is None or job.user == user)
+        and (not active_only or job.is_active())
+    ]
+
+
+def stop_batch_detect(job_id):
+    with _jobs_lock:
+        job = _jobs.get(job_id)
+    if job is not None:
+        job.stop()
+    return job is not None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="프로젝트 또는 선택한 이미지를 일괄 자동 감지해 사전 어노테이션으로 저장합니다.")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--project", help="처리할 프로젝트 이름 (프로젝트 전체)")
+    target.add_argument("--images", nargs="+", help="처리할 이미지 storage_path 목록 (예: easylabel/project/a.jpg)")
+    parser.add_argument("--recognize", action="store_true", help="감지한 박스의 텍스트를 인식해 라벨로 채웁니다")
+    parser.add_argument("--config", default=DEFAULT_OCR_CONFIG, help="OCR 모델 설정 이름")
+    parser.add_argument("--user", default="cli", help="작업 사용자 이름 (스케줄러 공정성 기준)")
+    parser.add_argument("--endpoint", default=os.environ.get("MINIO_ENDPOINT", "localhost:9000"))
+    parser.add_argument("--access-key", default=os.environ.get("MINIO_ACCESS_KEY"))
+    parser.add_argument("--secret-key", default=os.environ.get("MINIO_SECRET_KEY"))
+    parser.add_argument("--secure", action="store_true")
+    args = parser.parse_args()
+
+    image_paths = get_project_image_paths(args.project) if args.project else args.images
+    if not image_paths:
+        print("처리할 이미지가 없습니다.")
+        return
+
+    minio_client = MinIOManager(args.access_key, args.secret_key, endpoint=args.endpoint, secure=args.secure)
+    job = BatchDetectJob(minio_client, image_paths, user=args.user, recognize=args.recognize, config_name=args.config)
+    job.start()
+    try:
+        while job.is_active():
+            job.join(timeout=2)
+            p = job.progress()
+            print(f"\r{p['processed']}/{p['total']} (완료 {p['done']}, 건너뜀 {p['skipped']}, 실패 {p['failed']})", end="", flush=True)
+    except KeyboardInterrupt:
+        print("\n중단 요청 - 처리 중인 이미지까지만 저장합니다.")
+        job.stop()
+        job.join()
+
+    p = job.progress()
+    print(f"\n{p['state']}: 어노테이션 {p['annotations']}개 저장, {p['elapsed']:.1f}초")
+    if p["error"]:
+        print(f"오류: {p['error']}")
+
+
+if __name__ == "__main__":
+    main()
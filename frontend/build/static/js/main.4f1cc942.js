@@ -1,282 +0,0 @@
-/*! For license information please see main.4f1cc942.js.LICENSE.txt */
-(()=>{var t={143:t=>{var e=/\s/;t.exports=function(t){for(var n=t.length;n--&&e.test(t.charAt(n)););return n}},219:(t,e,n)=>{"use strict";var r=n(2086),i={childContextTypes:!0,contextType:!0,contextTypes:!0,defaultProps:!0,displayName:!0,getDefaultProps:!0,getDerivedStateFromError:!0,getDerivedStateFromProps:!0,mixins:!0,propTypes:!0,type:!0},o={name:!0,length:!0,prototype:!0,caller:!0,callee:!0,arguments:!0,arity:!0},a={$$typeof:!0,compare:!0,defaultProps:!0,displayName:!0,propTypes:!0,type:!0},s={};function l(t){return r.isMemo(t)?a:s[t.$$typeof]||i}s[r.ForwardRef]={$$typeof:!0,render:!0,defaultProps:!0,displayName:!0,propTypes:!0},s[r.Memo]=a;var c=Object.defineProperty,u=Object.getOwnPropertyNames,d=Object.getOwnPropertySymbols,h=Object.getOwnPropertyDescriptor,f=Object.getPrototypeOf,p=Object.prototype;t.exports=function t(e,n,r){if("string"!==typeof n){if(p){var i=f(n);i&&i!==p&&t(e,i,r)}var a=u(n);d&&(a=a.concat(d(n)));for(var s=l(e),g=l(n),m=0;m<a.length;++m){var y=a[m];if(!o[y]&&(!r||!r[y])&&(!g||!g[y])&&(!s||!s[y])){var b=h(n,y);try{c(e,y,b)}catch(v){}}}}return e}},579:(t,e,n)=>{"use strict";t.exports=n(1153)},589:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.HitCanvas=e.SceneCanvas=e.Canvas=void 0;const r=n(7149),i=n(3354),o=n(4602);let a;class s{constructor(t){this.pixelRatio=1,this.width=0,this.height=0,this.isCache=!1;const e=(t||{}).pixelRatio||o.Konva.pixelRatio||function(){if(a)return a;const t=r.Util.createCanvasElement(),e=t.getContext("2d");return a=(o.Konva._global.devicePixelRatio||1)/(e.webkitBackingStorePixelRatio||e.mozBackingStorePixelRatio||e.msBackingStorePixelRatio||e.oBackingStorePixelRatio||e.backingStorePixelRatio||1),r.Util.releaseCanvas(t),a}();this.pixelRatio=e,this._canvas=r.Util.createCanvasElement(),this._canvas.style.padding="0",this._canvas.style.margin="0",this._canvas.style.border="0",this._canvas.style.background="transparent",this._canvas.style.position="absolute",this._canvas.style.top="0",this._canvas.style.left="0"}getContext(){return this.context}getPixelRatio(){return this.pixelRatio}setPixelRatio(t){const e=this.pixelRatio;this.pixelRatio=t,this.setSize(this.getWidth()/e,this.getHeight()/e)}setWidth(t){this.width=this._canvas.width=t*this.pixelRatio,this._canvas.style.width=t+"px";const e=this.pixelRatio;this.getContext()._context.scale(e,e)}setHeight(t){this.height=this._canvas.height=t*this.pixelRatio,this._canvas.style.height=t+"px";const e=this.pixelRatio;this.getContext()._context.scale(e,e)}getWidth(){return this.width}getHeight(){return this.height}setSize(t,e){this.setWidth(t||0),this.setHeight(e||0)}toDataURL(t,e){try{return this._canvas.toDataURL(t,e)}catch(n){try{return this._canvas.toDataURL()}catch(i){return r.Util.error("Unable to get data URL. "+i.message+" For more info read https://konvajs.org/docs/posts/Tainted_Canvas.html."),""}}}}e.Canvas=s;e.SceneCanvas=class extends s{constructor(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{width:0,height:0,willReadFrequently:!1};super(t),this.context=new i.SceneContext(this,{willReadFrequently:t.willReadFrequently}),this.setSize(t.width,t.height)}};e.HitCanvas=class extends s{constructor(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{width:0,height:0};super(t),this.hitCanvas=!0,this.context=new i.HitContext(this),this.setSize(t.width,t.height)}}},801:(t,e,n)=>{var r=n(1141),i=n(6686),o=n(9841),a=/^[-+]0x[0-9a-f]+$/i,s=/^0b[01]+$/i,l=/^0o[0-7]+$/i,c=parseInt;t.exports=function(t){if("number"==typeof t)return t;if(o(t))return NaN;if(i(t)){var e="function"==typeof t.valueOf?t.valueOf():t;t=i(e)?e+"":e}if("string"!=typeof t)return 0===t?t:+t;t=r(t);var n=s.test(t);return n||l.test(t)?c(t.slice(2),n?2:8):a.test(t)?NaN:+t}},1008:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Ring=void 0;const r=n(1751),i=n(3304),o=n(9910),a=n(4602),s=2*Math.PI;class l extends i.Shape{_sceneFunc(t){t.beginPath(),t.arc(0,0,this.innerRadius(),0,s,!1),t.moveTo(this.outerRadius(),0),t.arc(0,0,this.outerRadius(),s,0,!0),t.closePath(),t.fillStrokeShape(this)}getWidth(){return 2*this.outerRadius()}getHeight(){return 2*this.outerRadius()}setWidth(t){this.outerRadius(t/2)}setHeight(t){this.outerRadius(t/2)}}e.Ring=l,l.prototype.className="Ring",l.prototype._centroid=!0,l.prototype._attrsAffectingSize=["innerRadius","outerRadius"],(0,a._registerNode)(l),r.Factory.addGetterSetter(l,"innerRadius",0,(0,o.getNumberValidator)()),r.Factory.addGetterSetter(l,"outerRadius",0,(0,o.getNumberValidator)())},1126:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Threshold=void 0;const r=n(1751),i=n(1189),o=n(9910);e.Threshold=function(t){const e=255*this.threshold(),n=t.data,r=n.length;for(let i=0;i<r;i+=1)n[i]=n[i]<e?0:255},r.Factory.addGetterSetter(i.Node,"threshold",.5,(0,o.getNumberValidator)(),r.Factory.afterSetFilter)},1141:(t,e,n)=>{var r=n(143),i=/^\s+/;t.exports=function(t){return t?t.slice(0,r(t)+1).replace(i,""):t}},1153:(t,e,n)=>{"use strict";var r=n(5043),i=Symbol.for("react.element"),o=Symbol.for("react.fragment"),a=Object.prototype.hasOwnProperty,s=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,l={key:!0,ref:!0,__self:!0,__source:!0};function c(t,e,n){var r,o={},c=null,u=null;for(r in void 0!==n&&(c=""+n),void 0!==e.key&&(c=""+e.key),void 0!==e.ref&&(u=e.ref),e)a.call(e,r)&&!l.hasOwnProperty(r)&&(o[r]=e[r]);if(t&&t.defaultProps)for(r in e=t.defaultProps)void 0===o[r]&&(o[r]=e[r]);return{$$typeof:i,type:t,key:c,ref:u,props:o,_owner:s.current}}e.Fragment=o,e.jsx=c,e.jsxs=c},1189:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Node=void 0;const r=n(7149),i=n(1751),o=n(589),a=n(4602),s=n(8727),l=n(9910),c="absoluteOpacity",u="allEventListeners",d="absoluteTransform",h="absoluteScale",f="canvas",p="listening",g="mouseenter",m="mouseleave",y="Shape",b=" ",v="stage",_="transform",w="visible",x=["xChange.konva","yChange.konva","scaleXChange.konva","scaleYChange.konva","skewXChange.konva","skewYChange.konva","rotationChange.konva","offsetXChange.konva","offsetYChange.konva","transformsEnabledChange.konva"].join(b);let S=1;class k{constructor(t){this._id=S++,this.eventListeners={},this.attrs={},this.index=0,this._allEventListeners=null,this.parent=null,this._cache=new Map,this._attachedDepsListeners=new Map,this._lastPos=null,this._batchingTransformChange=!1,this._needClearTransformCache=!1,this._filterUpToDate=!1,this._isUnderCache=!1,this._dragEventId=null,this._shouldFireChangeEvents=!1,this.setAttrs(t),this._shouldFireChangeEvents=!0}hasChildren(){return!1}_clearCache(t){t!==_&&t!==d||!this._cache.get(t)?t?this._cache.delete(t):this._cache.clear():this._cache.get(t).dirty=!0}_getCache(t,e){let n=this._cache.get(t);return(void 0===n||(t===_||t===d)&&!0===n.dirty)&&(n=e.call(this),this._cache.set(t,n)),n}_calculate(t,e,n){if(!this._attachedDepsListeners.get(t)){const n=e.map((t=>t+"Change.konva")).join(b);this.on(n,(()=>{this._clearCache(t)})),this._attachedDepsListeners.set(t,!0)}return this._getCache(t,n)}_getCanvasCache(){return this._cache.get(f)}_clearSelfAndDescendantCache(t){this._clearCache(t),t===d&&this.fire("absoluteTransformChange")}clearCache(){if(this._cache.has(f)){const{scene:t,filter:e,hit:n}=this._cache.get(f);r.Util.releaseCanvas(t,e,n),this._cache.delete(f)}return this._clearSelfAndDescendantCache(),this._requestDraw(),this}cache(t){const e=t||{};let n={};void 0!==e.x&&void 0!==e.y&&void 0!==e.width&&void 0!==e.height||(n=this.getClientRect({skipTransform:!0,relativeTo:this.getParent()||void 0}));let i=Math.ceil(e.width||n.width),a=Math.ceil(e.height||n.height),s=e.pixelRatio,l=void 0===e.x?Math.floor(n.x):e.x,u=void 0===e.y?Math.floor(n.y):e.y,d=e.offset||0,p=e.drawBorder||!1,g=e.hitCanvasPixelRatio||1;if(!i||!a)return void r.Util.error("Can not cache the node. Width or height of the node equals 0. Caching is skipped.");i+=2*d+(Math.abs(Math.round(n.x)-l)>.5?1:0),a+=2*d+(Math.abs(Math.round(n.y)-u)>.5?1:0),l-=d,u-=d;const m=new o.SceneCanvas({pixelRatio:s,width:i,height:a}),y=new o.SceneCanvas({pixelRatio:s,width:0,height:0,willReadFrequently:!0}),b=new o.HitCanvas({pixelRatio:g,width:i,height:a}),v=m.getContext(),_=b.getContext();return b.isCache=!0,m.isCache=!0,this._cache.delete(f),this._filterUpToDate=!1,!1===e.imageSmoothingEnabled&&(m.getContext()._context.imageSmoothingEnabled=!1,y.getContext()._context.imageSmoothingEnabled=!1),v.save(),_.save(),v.translate(-l,-u),_.translate(-l,-u),this._isUnderCache=!0,this._clearSelfAndDescendantCache(c),this._clearSelfAndDescendantCache(h),this.drawScene(m,this),this.drawHit(b,this),this._isUnderCache=!1,v.restore(),_.restore(),p&&(v.save(),v.beginPath(),v.rect(0,0,i,a),v.closePath(),v.setAttr("strokeStyle","red"),v.setAttr("lineWidth",5),v.stroke(),v.restore()),this._cache.set(f,{scene:m,filter:y,hit:b,x:l,y:u}),this._requestDraw(),this}isCached(){return this._cache.has(f)}getClientRect(t){throw new Error('abstract "getClientRect" method call')}_transformedRect(t,e){const n=[{x:t.x,y:t.y},{x:t.x+t.width,y:t.y},{x:t.x+t.width,y:t.y+t.height},{x:t.x,y:t.y+t.height}];let r=1/0,i=1/0,o=-1/0,a=-1/0;const s=this.getAbsoluteTransform(e);return n.forEach((function(t){const e=s.point(t);void 0===r&&(r=o=e.x,i=a=e.y),r=Math.min(r,e.x),i=Math.min(i,e.y),o=Math.max(o,e.x),a=Math.max(a,e.y)})),{x:r,y:i,width:o-r,height:a-i}}_drawCachedSceneCanvas(t){t.save(),t._applyOpacity(this),t._applyGlobalCompositeOperation(this);const e=this._getCanvasCache();t.translate(e.x,e.y);const n=this._getCachedSceneCanvas(),r=n.pixelRatio;t.drawImage(n._canvas,0,0,n.width/r,n.height/r),t.restore()}_drawCachedHitCanvas(t){const e=this._getCanvasCache(),n=e.hit;t.save(),t.translate(e.x,e.y),t.drawImage(n._canvas,0,0,n.width/n.pixelRatio,n.height/n.pixelRatio),t.restore()}_getCachedSceneCanvas(){let t,e,n,i,o=this.filters(),a=this._getCanvasCache(),s=a.scene,l=a.filter,c=l.getContext();if(o){if(!this._filterUpToDate){const a=s.pixelRatio;l.setSize(s.width/s.pixelRatio,s.height/s.pixelRatio);try{for(t=o.length,c.clear(),c.drawImage(s._canvas,0,0,s.getWidth()/a,s.getHeight()/a),e=c.getImageData(0,0,l.getWidth(),l.getHeight()),n=0;n<t;n++)i=o[n],"function"===typeof i?(i.call(this,e),c.putImageData(e,0,0)):r.Util.error("Filter should be type of function, but got "+typeof i+" instead. Please check correct filters")}catch(u){r.Util.error("Unable to apply filter. "+u.message+" This post my help you https://konvajs.org/docs/posts/Tainted_Canvas.html.")}this._filterUpToDate=!0}return l}return s}on(t,e){if(this._cache&&this._cache.delete(u),3===arguments.length)return this._delegate.apply(this,arguments);let n,r,i,o,a,s=t.split(b),l=s.length;for(n=0;n<l;n++)r=s[n],i=r.split("."),o=i[0],a=i[1]||"",this.eventListeners[o]||(this.eventListeners[o]=[]),this.eventListeners[o].push({name:a,handler:e});return this}off(t,e){let n,r,i,o,a,s,l=(t||"").split(b),c=l.length;if(this._cache&&this._cache.delete(u),!t)for(r in this.eventListeners)this._off(r);for(n=0;n<c;n++)if(i=l[n],o=i.split("."),a=o[0],s=o[1],a)this.eventListeners[a]&&this._off(a,s,e);else for(r in this.eventListeners)this._off(r,s,e);return this}dispatchEvent(t){const e={target:this,type:t.type,evt:t};return this.fire(t.type,e),this}addEventListener(t,e){return this.on(t,(function(t){e.call(this,t.evt)})),this}removeEventListener(t){return this.off(t),this}_delegate(t,e,n){const i=this;this.on(t,(function(t){const o=t.target.findAncestors(e,!0,i);for(let e=0;e<o.length;e++)(t=r.Util.cloneObject(t)).currentTarget=o[e],n.call(o[e],t)}))}remove(){return this.isDragging()&&this.stopDrag(),s.DD._dragElements.delete(this._id),this._remove(),this}_clearCaches(){this._clearSelfAndDescendantCache(d),this._clearSelfAndDescendantCache(c),this._clearSelfAndDescendantCache(h),this._clearSelfAndDescendantCache(v),this._clearSelfAndDescendantCache(w),this._clearSelfAndDescendantCache(p)}_remove(){this._clearCaches();const t=this.getParent();t&&t.children&&(t.children.splice(this.index,1),t._setChildrenIndices(),this.parent=null)}destroy(){return this.remove(),this.clearCache(),this}getAttr(t){const e="get"+r.Util._capitalize(t);return r.Util._isFunction(this[e])?this[e]():this.attrs[t]}getAncestors(){let t=this.getParent(),e=[];for(;t;)e.push(t),t=t.getParent();return e}getAttrs(){return this.attrs||{}}setAttrs(t){return this._batchTransformChanges((()=>{let e,n;if(!t)return this;for(e in t)"children"!==e&&(n="set"+r.Util._capitalize(e),r.Util._isFunction(this[n])?this[n](t[e]):this._setAttr(e,t[e]))})),this}isListening(){return this._getCache(p,this._isListening)}_isListening(t){if(!this.listening())return!1;const e=this.getParent();return!e||e===t||this===t||e._isListening(t)}isVisible(){return this._getCache(w,this._isVisible)}_isVisible(t){if(!this.visible())return!1;const e=this.getParent();return!e||e===t||this===t||e._isVisible(t)}shouldDrawHit(t){let e=arguments.length>1&&void 0!==arguments[1]&&arguments[1];if(t)return this._isVisible(t)&&this._isListening(t);const n=this.getLayer();let r=!1;s.DD._dragElements.forEach((t=>{"dragging"===t.dragStatus&&("Stage"===t.node.nodeType||t.node.getLayer()===n)&&(r=!0)}));const i=!e&&!a.Konva.hitOnDragEnabled&&(r||a.Konva.isTransforming());return this.isListening()&&this.isVisible()&&!i}show(){return this.visible(!0),this}hide(){return this.visible(!1),this}getZIndex(){return this.index||0}getAbsoluteZIndex(){let t,e,n,r,i=this.getDepth(),o=this,a=0;const s=this.getStage();return"Stage"!==o.nodeType&&s&&function s(l){for(t=[],e=l.length,n=0;n<e;n++)r=l[n],a++,r.nodeType!==y&&(t=t.concat(r.getChildren().slice())),r._id===o._id&&(n=e);t.length>0&&t[0].getDepth()<=i&&s(t)}(s.getChildren()),a}getDepth(){let t=0,e=this.parent;for(;e;)t++,e=e.parent;return t}_batchTransformChanges(t){this._batchingTransformChange=!0,t(),this._batchingTransformChange=!1,this._needClearTransformCache&&(this._clearCache(_),this._clearSelfAndDescendantCache(d)),this._needClearTransformCache=!1}setPosition(t){return this._batchTransformChanges((()=>{this.x(t.x),this.y(t.y)})),this}getPosition(){return{x:this.x(),y:this.y()}}getRelativePointerPosition(){const t=this.getStage();if(!t)return null;const e=t.getPointerPosition();if(!e)return null;const n=this.getAbsoluteTransform().copy();return n.invert(),n.point(e)}getAbsolutePosition(t){let e=!1,n=this.parent;for(;n;){if(n.isCached()){e=!0;break}n=n.parent}e&&!t&&(t=!0);const i=this.getAbsoluteTransform(t).getMatrix(),o=new r.Transform,a=this.offset();return o.m=i.slice(),o.translate(a.x,a.y),o.getTranslation()}setAbsolutePosition(t){const{x:e,y:n,...r}=this._clearTransform();this.attrs.x=e,this.attrs.y=n,this._clearCache(_);const i=this._getAbsoluteTransform().copy();return i.invert(),i.translate(t.x,t.y),t={x:this.attrs.x+i.getTranslation().x,y:this.attrs.y+i.getTranslation().y},this._setTransform(r),this.setPosition({x:t.x,y:t.y}),this._clearCache(_),this._clearSelfAndDescendantCache(d),this}_setTransform(t){let e;for(e in t)this.attrs[e]=t[e]}_clearTransform(){const t={x:this.x(),y:this.y(),rotation:this.rotation(),scaleX:this.scaleX(),scaleY:this.scaleY(),offsetX:this.offsetX(),offsetY:this.offsetY(),skewX:this.skewX(),skewY:this.skewY()};return this.attrs.x=0,this.attrs.y=0,this.attrs.rotation=0,this.attrs.scaleX=1,this.attrs.scaleY=1,this.attrs.offsetX=0,this.attrs.offsetY=0,this.attrs.skewX=0,this.attrs.skewY=0,t}move(t){let e=t.x,n=t.y,r=this.x(),i=this.y();return void 0!==e&&(r+=e),void 0!==n&&(i+=n),this.setPosition({x:r,y:i}),this}_eachAncestorReverse(t,e){let n,r,i=[],o=this.getParent();if(!e||e._id!==this._id){for(i.unshift(this);o&&(!e||o._id!==e._id);)i.unshift(o),o=o.parent;for(n=i.length,r=0;r<n;r++)t(i[r])}}rotate(t){return this.rotation(this.rotation()+t),this}moveToTop(){if(!this.parent)return r.Util.warn("Node has no parent. moveToTop function is ignored."),!1;const t=this.index;return t<this.parent.getChildren().length-1&&(this.parent.children.splice(t,1),this.parent.children.push(this),this.parent._setChildrenIndices(),!0)}moveUp(){if(!this.parent)return r.Util.warn("Node has no parent. moveUp function is ignored."),!1;const t=this.index;return t<this.parent.getChildren().length-1&&(this.parent.children.splice(t,1),this.parent.children.splice(t+1,0,this),this.parent._setChildrenIndices(),!0)}moveDown(){if(!this.parent)return r.Util.warn("Node has no parent. moveDown function is ignored."),!1;const t=this.index;return t>0&&(this.parent.children.splice(t,1),this.parent.children.splice(t-1,0,this),this.parent._setChildrenIndices(),!0)}moveToBottom(){if(!this.parent)return r.Util.warn("Node has no parent. moveToBottom function is ignored."),!1;const t=this.index;return t>0&&(this.parent.children.splice(t,1),this.parent.children.unshift(this),this.parent._setChildrenIndices(),!0)}setZIndex(t){if(!this.parent)return r.Util.warn("Node has no parent. zIndex parameter is ignored."),this;(t<0||t>=this.parent.children.length)&&r.Util.warn("Unexpected value "+t+" for zIndex property. zIndex is just index of a node in children of its parent. Expected value is from 0 to "+(this.parent.children.length-1)+".");const e=this.index;return this.parent.children.splice(e,1),this.parent.children.splice(t,0,this),this.parent._setChildrenIndices(),this}getAbsoluteOpacity(){return this._getCache(c,this._getAbsoluteOpacity)}_getAbsoluteOpacity(){let t=this.opacity();const e=this.getParent();return e&&!e._isUnderCache&&(t*=e.getAbsoluteOpacity()),t}moveTo(t){return this.getParent()!==t&&(this._remove(),t.add(this)),this}toObject(){let t,e,n,i,o,a=this.getAttrs();const s={attrs:{},className:this.getClassName()};for(t in a)e=a[t],o=r.Util.isObject(e)&&!r.Util._isPlainObject(e)&&!r.Util._isArray(e),o||(n="function"===typeof this[t]&&this[t],delete a[t],i=n?n.call(this):null,a[t]=e,i!==e&&(s.attrs[t]=e));return r.Util._prepareToStringify(s)}toJSON(){return JSON.stringify(this.toObject())}getParent(){return this.parent}findAncestors(t,e,n){const r=[];e&&this._isMatch(t)&&r.push(this);let i=this.parent;for(;i;){if(i===n)return r;i._isMatch(t)&&r.push(i),i=i.parent}return r}isAncestorOf(t){return!1}findAncestor(t,e,n){return this.findAncestors(t,e,n)[0]}_isMatch(t){if(!t)return!1;if("function"===typeof t)return t(this);let e,n,i=t.replace(/ /g,"").split(","),o=i.length;for(e=0;e<o;e++)if(n=i[e],r.Util.isValidSelector(n)||(r.Util.warn('Selector "'+n+'" is invalid. Allowed selectors examples are "#foo", ".bar" or "Group".'),r.Util.warn('If you have a custom shape with such className, please change it to start with upper letter like "Triangle".'),r.Util.warn("Konva is awesome, right?")),"#"===n.charAt(0)){if(this.id()===n.slice(1))return!0}else if("."===n.charAt(0)){if(this.hasName(n.slice(1)))return!0}else if(this.className===n||this.nodeType===n)return!0;return!1}getLayer(){const t=this.getParent();return t?t.getLayer():null}getStage(){return this._getCache(v,this._getStage)}_getStage(){const t=this.getParent();return t?t.getStage():null}fire(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=arguments.length>2?arguments[2]:void 0;return e.target=e.target||this,n?this._fireAndBubble(t,e):this._fire(t,e),this}getAbsoluteTransform(t){return t?this._getAbsoluteTransform(t):this._getCache(d,this._getAbsoluteTransform)}_getAbsoluteTransform(t){let e;if(t)return e=new r.Transform,this._eachAncestorReverse((function(t){const n=t.transformsEnabled();"all"===n?e.multiply(t.getTransform()):"position"===n&&e.translate(t.x()-t.offsetX(),t.y()-t.offsetY())}),t),e;{e=this._cache.get(d)||new r.Transform,this.parent?this.parent.getAbsoluteTransform().copyInto(e):e.reset();const t=this.transformsEnabled();if("all"===t)e.multiply(this.getTransform());else if("position"===t){const t=this.attrs.x||0,n=this.attrs.y||0,r=this.attrs.offsetX||0,i=this.attrs.offsetY||0;e.translate(t-r,n-i)}return e.dirty=!1,e}}getAbsoluteScale(t){let e=this;for(;e;)e._isUnderCache&&(t=e),e=e.getParent();const n=this.getAbsoluteTransform(t).decompose();return{x:n.scaleX,y:n.scaleY}}getAbsoluteRotation(){return this.getAbsoluteTransform().decompose().rotation}getTransform(){return this._getCache(_,this._getTransform)}_getTransform(){var t,e;const n=this._cache.get(_)||new r.Transform;n.reset();const i=this.x(),o=this.y(),s=a.Konva.getAngle(this.rotation()),l=null!==(t=this.attrs.scaleX)&&void 0!==t?t:1,c=null!==(e=this.attrs.scaleY)&&void 0!==e?e:1,u=this.attrs.skewX||0,d=this.attrs.skewY||0,h=this.attrs.offsetX||0,f=this.attrs.offsetY||0;return 0===i&&0===o||n.translate(i,o),0!==s&&n.rotate(s),0===u&&0===d||n.skew(u,d),1===l&&1===c||n.scale(l,c),0===h&&0===f||n.translate(-1*h,-1*f),n.dirty=!1,n}clone(t){let e,n,i,o,a,s=r.Util.cloneObject(this.attrs);for(e in t)s[e]=t[e];const l=new this.constructor(s);for(e in this.eventListeners)for(n=this.eventListeners[e],i=n.length,o=0;o<i;o++)a=n[o],a.name.indexOf("konva")<0&&(l.eventListeners[e]||(l.eventListeners[e]=[]),l.eventListeners[e].push(a));return l}_toKonvaCanvas(t){t=t||{};const e=this.getClientRect(),n=this.getStage(),r=void 0!==t.x?t.x:Math.floor(e.x),i=void 0!==t.y?t.y:Math.floor(e.y),a=t.pixelRatio||1,s=new o.SceneCanvas({width:t.width||Math.ceil(e.width)||(n?n.width():0),height:t.height||Math.ceil(e.height)||(n?n.height():0),pixelRatio:a}),l=s.getContext(),c=new o.SceneCanvas({width:s.width/s.pixelRatio+Math.abs(r),height:s.height/s.pixelRatio+Math.abs(i),pixelRatio:s.pixelRatio});return!1===t.imageSmoothingEnabled&&(l._context.imageSmoothingEnabled=!1),l.save(),(r||i)&&l.translate(-1*r,-1*i),this.drawScene(s,void 0,c),l.restore(),s}toCanvas(t){return this._toKonvaCanvas(t)._canvas}toDataURL(t){const e=(t=t||{}).mimeType||null,n=t.quality||null,r=this._toKonvaCanvas(t).toDataURL(e,n);return t.callback&&t.callback(r),r}toImage(t){return new Promise(((e,n)=>{try{const n=null===t||void 0===t?void 0:t.callback;n&&delete t.callback,r.Util._urlToImage(this.toDataURL(t),(function(t){e(t),null===n||void 0===n||n(t)}))}catch(i){n(i)}}))}toBlob(t){return new Promise(((e,n)=>{try{const n=null===t||void 0===t?void 0:t.callback;n&&delete t.callback,this.toCanvas(t).toBlob((t=>{e(t),null===n||void 0===n||n(t)}),null===t||void 0===t?void 0:t.mimeType,null===t||void 0===t?void 0:t.quality)}catch(r){n(r)}}))}setSize(t){return this.width(t.width),this.height(t.height),this}getSize(){return{width:this.width(),height:this.height()}}getClassName(){return this.className||this.nodeType}getType(){return this.nodeType}getDragDistance(){return void 0!==this.attrs.dragDistance?this.attrs.dragDistance:this.parent?this.parent.getDragDistance():a.Konva.dragDistance}_off(t,e,n){let r,i,o,a=this.eventListeners[t];for(r=0;r<a.length;r++)if(i=a[r].name,o=a[r].handler,("konva"!==i||"konva"===e)&&(!e||i===e)&&(!n||n===o)){if(a.splice(r,1),0===a.length){delete this.eventListeners[t];break}r--}}_fireChangeEvent(t,e,n){this._fire(t+"Change",{oldVal:e,newVal:n})}addName(t){if(!this.hasName(t)){const e=this.name(),n=e?e+" "+t:t;this.name(n)}return this}hasName(t){if(!t)return!1;const e=this.name();if(!e)return!1;return-1!==(e||"").split(/\s/g).indexOf(t)}removeName(t){const e=(this.name()||"").split(/\s/g),n=e.indexOf(t);return-1!==n&&(e.splice(n,1),this.name(e.join(" "))),this}setAttr(t,e){const n=this["set"+r.Util._capitalize(t)];return r.Util._isFunction(n)?n.call(this,e):this._setAttr(t,e),this}_requestDraw(){if(a.Konva.autoDrawEnabled){const t=this.getLayer()||this.getStage();null===t||void 0===t||t.batchDraw()}}_setAttr(t,e){const n=this.attrs[t];(n!==e||r.Util.isObject(e))&&(void 0===e||null===e?delete this.attrs[t]:this.attrs[t]=e,this._shouldFireChangeEvents&&this._fireChangeEvent(t,n,e),this._requestDraw())}_setComponentAttr(t,e,n){let r;void 0!==n&&(r=this.attrs[t],r||(this.attrs[t]=this.getAttr(t)),this.attrs[t][e]=n,this._fireChangeEvent(t,r,n))}_fireAndBubble(t,e,n){e&&this.nodeType===y&&(e.target=this);if(!((t===g||t===m)&&(n&&(this===n||this.isAncestorOf&&this.isAncestorOf(n))||"Stage"===this.nodeType&&!n))){this._fire(t,e);const r=(t===g||t===m)&&n&&n.isAncestorOf&&n.isAncestorOf(this)&&!n.isAncestorOf(this.parent);(e&&!e.cancelBubble||!e)&&this.parent&&this.parent.isListening()&&!r&&(n&&n.parent?this._fireAndBubble.call(this.parent,t,e,n):this._fireAndBubble.call(this.parent,t,e))}}_getProtoListeners(t){var e,n,r;const i=null!==(e=this._cache.get(u))&&void 0!==e?e:{};let o=null===i||void 0===i?void 0:i[t];if(void 0===o){o=[];let e=Object.getPrototypeOf(this);for(;e;){const i=null!==(r=null===(n=e.eventListeners)||void 0===n?void 0:n[t])&&void 0!==r?r:[];o.push(...i),e=Object.getPrototypeOf(e)}i[t]=o,this._cache.set(u,i)}return o}_fire(t,e){(e=e||{}).currentTarget=this,e.type=t;const n=this._getProtoListeners(t);if(n)for(var r=0;r<n.length;r++)n[r].handler.call(this,e);const i=this.eventListeners[t];if(i)for(r=0;r<i.length;r++)i[r].handler.call(this,e)}draw(){return this.drawScene(),this.drawHit(),this}_createDragElement(t){const e=t?t.pointerId:void 0,n=this.getStage(),r=this.getAbsolutePosition();if(!n)return;const i=n._getPointerById(e)||n._changedPointerPositions[0]||r;s.DD._dragElements.set(this._id,{node:this,startPointerPos:i,offset:{x:i.x-r.x,y:i.y-r.y},dragStatus:"ready",pointerId:e})}startDrag(t){let e=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];s.DD._dragElements.has(this._id)||this._createDragElement(t);s.DD._dragElements.get(this._id).dragStatus="dragging",this.fire("dragstart",{type:"dragstart",target:this,evt:t&&t.evt},e)}_setDragPosition(t,e){const n=this.getStage()._getPointerById(e.pointerId);if(!n)return;let i={x:n.x-e.offset.x,y:n.y-e.offset.y};const o=this.dragBoundFunc();if(void 0!==o){const e=o.call(this,i,t);e?i=e:r.Util.warn("dragBoundFunc did not return any value. That is unexpected behavior. You must return new absolute position from dragBoundFunc.")}this._lastPos&&this._lastPos.x===i.x&&this._lastPos.y===i.y||(this.setAbsolutePosition(i),this._requestDraw()),this._lastPos=i}stopDrag(t){const e=s.DD._dragElements.get(this._id);e&&(e.dragStatus="stopped"),s.DD._endDragBefore(t),s.DD._endDragAfter(t)}setDraggable(t){this._setAttr("draggable",t),this._dragChange()}isDragging(){const t=s.DD._dragElements.get(this._id);return!!t&&"dragging"===t.dragStatus}_listenDrag(){this._dragCleanup(),this.on("mousedown.konva touchstart.konva",(function(t){if(!(!(void 0!==t.evt.button)||a.Konva.dragButtons.indexOf(t.evt.button)>=0))return;if(this.isDragging())return;let e=!1;s.DD._dragElements.forEach((t=>{this.isAncestorOf(t.node)&&(e=!0)})),e||this._createDragElement(t)}))}_dragChange(){if(this.attrs.draggable)this._listenDrag();else{this._dragCleanup();if(!this.getStage())return;const t=s.DD._dragElements.get(this._id),e=t&&"dragging"===t.dragStatus,n=t&&"ready"===t.dragStatus;e?this.stopDrag():n&&s.DD._dragElements.delete(this._id)}}_dragCleanup(){this.off("mousedown.konva"),this.off("touchstart.konva")}isClientRectOnScreen(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{x:0,y:0};const e=this.getStage();if(!e)return!1;const n={x:-t.x,y:-t.y,width:e.width()+2*t.x,height:e.height()+2*t.y};return r.Util.haveIntersection(n,this.getClientRect())}static create(t,e){return r.Util._isString(t)&&(t=JSON.parse(t)),this._createNode(t,e)}static _createNode(t,e){let n,i,o,s=k.prototype.getClassName.call(t),l=t.children;e&&(t.attrs.container=e),a.Konva[s]||(r.Util.warn('Can not find a node with class name "'+s+'". Fallback to "Shape".'),s="Shape");if(n=new(0,a.Konva[s])(t.attrs),l)for(i=l.length,o=0;o<i;o++)n.add(k._createNode(l[o]));return n}}e.Node=k,k.prototype.nodeType="Node",k.prototype._attrsAffectingSize=[],k.prototype.eventListeners={},k.prototype.on.call(k.prototype,x,(function(){this._batchingTransformChange?this._needClearTransformCache=!0:(this._clearCache(_),this._clearSelfAndDescendantCache(d))})),k.prototype.on.call(k.prototype,"visibleChange.konva",(function(){this._clearSelfAndDescendantCache(w)})),k.prototype.on.call(k.prototype,"listeningChange.konva",(function(){this._clearSelfAndDescendantCache(p)})),k.prototype.on.call(k.prototype,"opacityChange.konva",(function(){this._clearSelfAndDescendantCache(c)}));const C=i.Factory.addGetterSetter;C(k,"zIndex"),C(k,"absolutePosition"),C(k,"position"),C(k,"x",0,(0,l.getNumberValidator)()),C(k,"y",0,(0,l.getNumberValidator)()),C(k,"globalCompositeOperation","source-over",(0,l.getStringValidator)()),C(k,"opacity",1,(0,l.getNumberValidator)()),C(k,"name","",(0,l.getStringValidator)()),C(k,"id","",(0,l.getStringValidator)()),C(k,"rotation",0,(0,l.getNumberValidator)()),i.Factory.addComponentsGetterSetter(k,"scale",["x","y"]),C(k,"scaleX",1,(0,l.getNumberValidator)()),C(k,"scaleY",1,(0,l.getNumberValidator)()),i.Factory.addComponentsGetterSetter(k,"skew",["x","y"]),C(k,"skewX",0,(0,l.getNumberValidator)()),C(k,"skewY",0,(0,l.getNumberValidator)()),i.Factory.addComponentsGetterSetter(k,"offset",["x","y"]),C(k,"offsetX",0,(0,l.getNumberValidator)()),C(k,"offsetY",0,(0,l.getNumberValidator)()),C(k,"dragDistance",void 0,(0,l.getNumberValidator)()),C(k,"width",0,(0,l.getNumberValidator)()),C(k,"height",0,(0,l.getNumberValidator)()),C(k,"listening",!0,(0,l.getBooleanValidator)()),C(k,"preventDefault",!0,(0,l.getBooleanValidator)()),C(k,"filters",void 0,(function(t){return this._filterUpToDate=!1,t})),C(k,"visible",!0,(0,l.getBooleanValidator)()),C(k,"transformsEnabled","all",(0,l.getStringValidator)()),C(k,"size"),C(k,"dragBoundFunc"),C(k,"draggable",!1,(0,l.getBooleanValidator)()),i.Factory.backCompat(k,{rotateDeg:"rotate",setRotationDeg:"setRotation",getRotationDeg:"getRotation"})},1222:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.TextPath=void 0;const r=n(7149),i=n(1751),o=n(3304),a=n(7289),s=n(3169),l=n(9910),c=n(4602),u="normal";function d(t){t.fillText(this.partialText,0,0)}function h(t){t.strokeText(this.partialText,0,0)}class f extends o.Shape{constructor(t){super(t),this.dummyCanvas=r.Util.createCanvasElement(),this.dataArray=[],this._readDataAttribute(),this.on("dataChange.konva",(function(){this._readDataAttribute(),this._setTextData()})),this.on("textChange.konva alignChange.konva letterSpacingChange.konva kerningFuncChange.konva fontSizeChange.konva fontFamilyChange.konva",this._setTextData),this._setTextData()}_getTextPathLength(){return a.Path.getPathLength(this.dataArray)}_getPointAtLength(t){if(!this.attrs.data)return null;return t-1>this.pathLength?null:a.Path.getPointAtLengthOfDataArray(t,this.dataArray)}_readDataAttribute(){this.dataArray=a.Path.parsePathData(this.attrs.data),this.pathLength=this._getTextPathLength()}_sceneFunc(t){t.setAttr("font",this._getContextFont()),t.setAttr("textBaseline",this.textBaseline()),t.setAttr("textAlign","left"),t.save();const e=this.textDecoration(),n=this.fill(),r=this.fontSize(),i=this.glyphInfo;"underline"===e&&t.beginPath();for(let o=0;o<i.length;o++){t.save();const n=i[o].p0;t.translate(n.x,n.y),t.rotate(i[o].rotation),this.partialText=i[o].text,t.fillStrokeShape(this),"underline"===e&&(0===o&&t.moveTo(0,r/2+1),t.lineTo(r,r/2+1)),t.restore()}"underline"===e&&(t.strokeStyle=n,t.lineWidth=r/20,t.stroke()),t.restore()}_hitFunc(t){t.beginPath();const e=this.glyphInfo;if(e.length>=1){const n=e[0].p0;t.moveTo(n.x,n.y)}for(let n=0;n<e.length;n++){const r=e[n].p1;t.lineTo(r.x,r.y)}t.setAttr("lineWidth",this.fontSize()),t.setAttr("strokeStyle",this.colorKey),t.stroke()}getTextWidth(){return this.textWidth}getTextHeight(){return r.Util.warn("text.getTextHeight() method is deprecated. Use text.height() - for full height and text.fontSize() - for one line height."),this.textHeight}setText(t){return s.Text.prototype.setText.call(this,t)}_getContextFont(){return s.Text.prototype._getContextFont.call(this)}_getTextSize(t){const e=this.dummyCanvas.getContext("2d");e.save(),e.font=this._getContextFont();const n=e.measureText(t);return e.restore(),{width:n.width,height:parseInt(`${this.fontSize()}`,10)}}_setTextData(){const{width:t,height:e}=this._getTextSize(this.attrs.text);if(this.textWidth=t,this.textHeight=e,this.glyphInfo=[],!this.attrs.data)return null;const n=this.letterSpacing(),r=this.align(),i=this.kerningFunc(),o=Math.max(this.textWidth+((this.attrs.text||"").length-1)*n,0);let l=0;"center"===r&&(l=Math.max(0,this.pathLength/2-o/2)),"right"===r&&(l=Math.max(0,this.pathLength-o));const c=(0,s.stringToArray)(this.text());let u=l;for(let s=0;s<c.length;s++){const t=this._getPointAtLength(u);if(!t)return;let e=this._getTextSize(c[s]).width+n;if(" "===c[s]&&"justify"===r){const t=this.text().split(" ").length-1;e+=(this.pathLength-o)/t}const l=this._getPointAtLength(u+e);if(!l)return;const h=a.Path.getLineLength(t.x,t.y,l.x,l.y);let f=0;if(i)try{f=i(c[s-1],c[s])*this.fontSize()}catch(d){f=0}t.x+=f,l.x+=f,this.textWidth+=f;const p=a.Path.getPointOnLine(f+h/2,t.x,t.y,l.x,l.y),g=Math.atan2(l.y-t.y,l.x-t.x);this.glyphInfo.push({transposeX:p.x,transposeY:p.y,text:c[s],rotation:g,p0:t,p1:l}),u+=e}}getSelfRect(){if(!this.glyphInfo.length)return{x:0,y:0,width:0,height:0};const t=[];this.glyphInfo.forEach((function(e){t.push(e.p0.x),t.push(e.p0.y),t.push(e.p1.x),t.push(e.p1.y)}));let e,n,r=t[0]||0,i=t[0]||0,o=t[1]||0,a=t[1]||0;for(let l=0;l<t.length/2;l++)e=t[2*l],n=t[2*l+1],r=Math.min(r,e),i=Math.max(i,e),o=Math.min(o,n),a=Math.max(a,n);const s=this.fontSize();return{x:r-s/2,y:o-s/2,width:i-r+s,height:a-o+s}}destroy(){return r.Util.releaseCanvas(this.dummyCanvas),super.destroy()}}e.TextPath=f,f.prototype._fillFunc=d,f.prototype._strokeFunc=h,f.prototype._fillFuncHit=d,f.prototype._strokeFuncHit=h,f.prototype.className="TextPath",f.prototype._attrsAffectingSize=["text","fontSize","data"],(0,c._registerNode)(f),i.Factory.addGetterSetter(f,"data"),i.Factory.addGetterSetter(f,"fontFamily","Arial"),i.Factory.addGetterSetter(f,"fontSize",12,(0,l.getNumberValidator)()),i.Factory.addGetterSetter(f,"fontStyle",u),i.Factory.addGetterSetter(f,"align","left"),i.Factory.addGetterSetter(f,"letterSpacing",0,(0,l.getNumberValidator)()),i.Factory.addGetterSetter(f,"textBaseline","middle"),i.Factory.addGetterSetter(f,"fontVariant",u),i.Factory.addGetterSetter(f,"text",""),i.Factory.addGetterSetter(f,"textDecoration",""),i.Factory.addGetterSetter(f,"kerningFunc",void 0)},1300:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Rect=void 0;const r=n(1751),i=n(3304),o=n(4602),a=n(7149),s=n(9910);class l extends i.Shape{_sceneFunc(t){const e=this.cornerRadius(),n=this.width(),r=this.height();t.beginPath(),e?a.Util.drawRoundedRectPath(t,n,r,e):t.rect(0,0,n,r),t.closePath(),t.fillStrokeShape(this)}}e.Rect=l,l.prototype.className="Rect",(0,o._registerNode)(l),r.Factory.addGetterSetter(l,"cornerRadius",0,(0,s.getNumberOrArrayOfNumbersValidator)(4))},1416:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Layer=void 0;const r=n(7149),i=n(4598),o=n(1189),a=n(1751),s=n(589),l=n(9910),c=n(3304),u=n(4602),d=[{x:0,y:0},{x:-1,y:-1},{x:1,y:-1},{x:1,y:1},{x:-1,y:1}],h=d.length;class f extends i.Container{constructor(t){super(t),this.canvas=new s.SceneCanvas,this.hitCanvas=new s.HitCanvas({pixelRatio:1}),this._waitingForDraw=!1,this.on("visibleChange.konva",this._checkVisibility),this._checkVisibility(),this.on("imageSmoothingEnabledChange.konva",this._setSmoothEnabled),this._setSmoothEnabled()}createPNGStream(){return this.canvas._canvas.createPNGStream()}getCanvas(){return this.canvas}getNativeCanvasElement(){return this.canvas._canvas}getHitCanvas(){return this.hitCanvas}getContext(){return this.getCanvas().getContext()}clear(t){return this.getContext().clear(t),this.getHitCanvas().getContext().clear(t),this}setZIndex(t){super.setZIndex(t);const e=this.getStage();return e&&e.content&&(e.content.removeChild(this.getNativeCanvasElement()),t<e.children.length-1?e.content.insertBefore(this.getNativeCanvasElement(),e.children[t+1].getCanvas()._canvas):e.content.appendChild(this.getNativeCanvasElement())),this}moveToTop(){o.Node.prototype.moveToTop.call(this);const t=this.getStage();return t&&t.content&&(t.content.removeChild(this.getNativeCanvasElement()),t.content.appendChild(this.getNativeCanvasElement())),!0}moveUp(){if(!o.Node.prototype.moveUp.call(this))return!1;const t=this.getStage();return!(!t||!t.content)&&(t.content.removeChild(this.getNativeCanvasElement()),this.index<t.children.length-1?t.content.insertBefore(this.getNativeCanvasElement(),t.children[this.index+1].getCanvas()._canvas):t.content.appendChild(this.getNativeCanvasElement()),!0)}moveDown(){if(o.Node.prototype.moveDown.call(this)){const t=this.getStage();if(t){const e=t.children;t.content&&(t.content.removeChild(this.getNativeCanvasElement()),t.content.insertBefore(this.getNativeCanvasElement(),e[this.index+1].getCanvas()._canvas))}return!0}return!1}moveToBottom(){if(o.Node.prototype.moveToBottom.call(this)){const t=this.getStage();if(t){const e=t.children;t.content&&(t.content.removeChild(this.getNativeCanvasElement()),t.content.insertBefore(this.getNativeCanvasElement(),e[1].getCanvas()._canvas))}return!0}return!1}getLayer(){return this}remove(){const t=this.getNativeCanvasElement();return o.Node.prototype.remove.call(this),t&&t.parentNode&&r.Util._isInDocument(t)&&t.parentNode.removeChild(t),this}getStage(){return this.parent}setSize(t){let{width:e,height:n}=t;return this.canvas.setSize(e,n),this.hitCanvas.setSize(e,n),this._setSmoothEnabled(),this}_validateAdd(t){const e=t.getType();"Group"!==e&&"Shape"!==e&&r.Util.throw("You may only add groups and shapes to a layer.")}_toKonvaCanvas(t){return(t=t||{}).width=t.width||this.getWidth(),t.height=t.height||this.getHeight(),t.x=void 0!==t.x?t.x:this.x(),t.y=void 0!==t.y?t.y:this.y(),o.Node.prototype._toKonvaCanvas.call(this,t)}_checkVisibility(){const t=this.visible();this.canvas._canvas.style.display=t?"block":"none"}_setSmoothEnabled(){this.getContext()._context.imageSmoothingEnabled=this.imageSmoothingEnabled()}getWidth(){if(this.parent)return this.parent.width()}setWidth(){r.Util.warn('Can not change width of layer. Use "stage.width(value)" function instead.')}getHeight(){if(this.parent)return this.parent.height()}setHeight(){r.Util.warn('Can not change height of layer. Use "stage.height(value)" function instead.')}batchDraw(){return this._waitingForDraw||(this._waitingForDraw=!0,r.Util.requestAnimFrame((()=>{this.draw(),this._waitingForDraw=!1}))),this}getIntersection(t){if(!this.isListening()||!this.isVisible())return null;let e=1,n=!1;for(;;){for(let r=0;r<h;r++){const i=d[r],o=this._getIntersection({x:t.x+i.x*e,y:t.y+i.y*e}),a=o.shape;if(a)return a;if(n=!!o.antialiased,!o.antialiased)break}if(!n)return null;e+=1}}_getIntersection(t){const e=this.hitCanvas.pixelRatio,n=this.hitCanvas.context.getImageData(Math.round(t.x*e),Math.round(t.y*e),1,1).data,i=n[3];if(255===i){const t=r.Util._rgbToHex(n[0],n[1],n[2]),e=c.shapes["#"+t];return e?{shape:e}:{antialiased:!0}}return i>0?{antialiased:!0}:{}}drawScene(t,e){const n=this.getLayer(),r=t||n&&n.getCanvas();return this._fire("beforeDraw",{node:this}),this.clearBeforeDraw()&&r.getContext().clear(),i.Container.prototype.drawScene.call(this,r,e),this._fire("draw",{node:this}),this}drawHit(t,e){const n=this.getLayer(),r=t||n&&n.hitCanvas;return n&&n.clearBeforeDraw()&&n.getHitCanvas().getContext().clear(),i.Container.prototype.drawHit.call(this,r,e),this}enableHitGraph(){return this.hitGraphEnabled(!0),this}disableHitGraph(){return this.hitGraphEnabled(!1),this}setHitGraphEnabled(t){r.Util.warn("hitGraphEnabled method is deprecated. Please use layer.listening() instead."),this.listening(t)}getHitGraphEnabled(t){return r.Util.warn("hitGraphEnabled method is deprecated. Please use layer.listening() instead."),this.listening()}toggleHitCanvas(){if(!this.parent||!this.parent.content)return;const t=this.parent;!!this.hitCanvas._canvas.parentNode?t.content.removeChild(this.hitCanvas._canvas):t.content.appendChild(this.hitCanvas._canvas)}destroy(){return r.Util.releaseCanvas(this.getNativeCanvasElement(),this.getHitCanvas()._canvas),super.destroy()}}e.Layer=f,f.prototype.nodeType="Layer",(0,u._registerNode)(f),a.Factory.addGetterSetter(f,"imageSmoothingEnabled",!0),a.Factory.addGetterSetter(f,"clearBeforeDraw",!0),a.Factory.addGetterSetter(f,"hitGraphEnabled",!0,(0,l.getBooleanValidator)())},1485:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Pixelate=void 0;const r=n(1751),i=n(7149),o=n(1189),a=n(9910);e.Pixelate=function(t){let e,n,r,o,a,s,l,c,u,d,h,f,p,g,m=Math.ceil(this.pixelSize()),y=t.width,b=t.height,v=Math.ceil(y/m),_=Math.ceil(b/m),w=t.data;if(m<=0)i.Util.error("pixelSize value can not be <= 0");else for(f=0;f<v;f+=1)for(p=0;p<_;p+=1){for(o=0,a=0,s=0,l=0,c=f*m,u=c+m,d=p*m,h=d+m,g=0,e=c;e<u;e+=1)if(!(e>=y))for(n=d;n<h;n+=1)n>=b||(r=4*(y*n+e),o+=w[r+0],a+=w[r+1],s+=w[r+2],l+=w[r+3],g+=1);for(o/=g,a/=g,s/=g,l/=g,e=c;e<u;e+=1)if(!(e>=y))for(n=d;n<h;n+=1)n>=b||(r=4*(y*n+e),w[r+0]=o,w[r+1]=a,w[r+2]=s,w[r+3]=l)}},r.Factory.addGetterSetter(o.Node,"pixelSize",8,(0,a.getNumberValidator)(),r.Factory.afterSetFilter)},1518:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.RGB=void 0;const r=n(1751),i=n(1189),o=n(9910);e.RGB=function(t){const e=t.data,n=e.length,r=this.red(),i=this.green(),o=this.blue();for(let a=0;a<n;a+=4){const t=(.34*e[a]+.5*e[a+1]+.16*e[a+2])/255;e[a]=t*r,e[a+1]=t*i,e[a+2]=t*o,e[a+3]=e[a+3]}},r.Factory.addGetterSetter(i.Node,"red",0,(function(t){return this._filterUpToDate=!1,t>255?255:t<0?0:Math.round(t)})),r.Factory.addGetterSetter(i.Node,"green",0,(function(t){return this._filterUpToDate=!1,t>255?255:t<0?0:Math.round(t)})),r.Factory.addGetterSetter(i.Node,"blue",0,o.RGBComponent,r.Factory.afterSetFilter)},1618:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Circle=void 0;const r=n(1751),i=n(3304),o=n(9910),a=n(4602);class s extends i.Shape{_sceneFunc(t){t.beginPath(),t.arc(0,0,this.attrs.radius||0,0,2*Math.PI,!1),t.closePath(),t.fillStrokeShape(this)}getWidth(){return 2*this.radius()}getHeight(){return 2*this.radius()}setWidth(t){this.radius()!==t/2&&this.radius(t/2)}setHeight(t){this.radius()!==t/2&&this.radius(t/2)}}e.Circle=s,s.prototype._centroid=!0,s.prototype.className="Circle",s.prototype._attrsAffectingSize=["radius"],(0,a._registerNode)(s),r.Factory.addGetterSetter(s,"radius",0,(0,o.getNumberValidator)())},1650:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Konva=void 0;var r=n(8065);Object.defineProperty(e,"Konva",{enumerable:!0,get:function(){return r.Konva}});const i=n(8065);t.exports=i.Konva},1751:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Factory=void 0;const r=n(7149),i=n(9910),o="get",a="set";e.Factory={addGetterSetter(t,n,r,i,o){e.Factory.addGetter(t,n,r),e.Factory.addSetter(t,n,i,o),e.Factory.addOverloadedGetterSetter(t,n)},addGetter(t,e,n){var i=o+r.Util._capitalize(e);t.prototype[i]=t.prototype[i]||function(){const t=this.attrs[e];return void 0===t?n:t}},addSetter(t,n,i,o){var s=a+r.Util._capitalize(n);t.prototype[s]||e.Factory.overWriteSetter(t,n,i,o)},overWriteSetter(t,e,n,i){var o=a+r.Util._capitalize(e);t.prototype[o]=function(t){return n&&void 0!==t&&null!==t&&(t=n.call(this,t,e)),this._setAttr(e,t),i&&i.call(this),this}},addComponentsGetterSetter(t,n,s,l,c){const u=s.length,d=r.Util._capitalize,h=o+d(n),f=a+d(n);t.prototype[h]=function(){const t={};for(let e=0;e<u;e++){const r=s[e];t[r]=this.getAttr(n+d(r))}return t};const p=(0,i.getComponentValidator)(s);t.prototype[f]=function(t){const e=this.attrs[n];l&&(t=l.call(this,t,n)),p&&p.call(this,t,n);for(const r in t)t.hasOwnProperty(r)&&this._setAttr(n+d(r),t[r]);return t||s.forEach((t=>{this._setAttr(n+d(t),void 0)})),this._fireChangeEvent(n,e,t),c&&c.call(this),this},e.Factory.addOverloadedGetterSetter(t,n)},addOverloadedGetterSetter(t,e){var n=r.Util._capitalize(e),i=a+n,s=o+n;t.prototype[e]=function(){return arguments.length?(this[i](arguments[0]),this):this[s]()}},addDeprecatedGetterSetter(t,n,i,a){r.Util.error("Adding deprecated "+n);const s=o+r.Util._capitalize(n),l=n+" property is deprecated and will be removed soon. Look at Konva change log for more information.";t.prototype[s]=function(){r.Util.error(l);const t=this.attrs[n];return void 0===t?i:t},e.Factory.addSetter(t,n,a,(function(){r.Util.error(l)})),e.Factory.addOverloadedGetterSetter(t,n)},backCompat(t,e){r.Util.each(e,(function(e,n){const i=t.prototype[n],s=o+r.Util._capitalize(e),l=a+r.Util._capitalize(e);function c(){i.apply(this,arguments),r.Util.error('"'+e+'" method is deprecated and will be removed soon. Use ""'+n+'" instead.')}t.prototype[e]=c,t.prototype[s]=c,t.prototype[l]=c}))},afterSetFilter(){this._filterUpToDate=!1}}},1801:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Arrow=void 0;const r=n(1751),i=n(5804),o=n(9910),a=n(4602),s=n(7289);class l extends i.Line{_sceneFunc(t){super._sceneFunc(t);const e=2*Math.PI,n=this.points();let r=n;const i=0!==this.tension()&&n.length>4;i&&(r=this.getTensionPoints());const o=this.pointerLength(),a=n.length;let l,c;if(i){const t=[r[r.length-4],r[r.length-3],r[r.length-2],r[r.length-1],n[a-2],n[a-1]],e=s.Path.calcLength(r[r.length-4],r[r.length-3],"C",t),i=s.Path.getPointOnQuadraticBezier(Math.min(1,1-o/e),t[0],t[1],t[2],t[3],t[4],t[5]);l=n[a-2]-i.x,c=n[a-1]-i.y}else l=n[a-2]-n[a-4],c=n[a-1]-n[a-3];const u=(Math.atan2(c,l)+e)%e,d=this.pointerWidth();this.pointerAtEnding()&&(t.save(),t.beginPath(),t.translate(n[a-2],n[a-1]),t.rotate(u),t.moveTo(0,0),t.lineTo(-o,d/2),t.lineTo(-o,-d/2),t.closePath(),t.restore(),this.__fillStroke(t)),this.pointerAtBeginning()&&(t.save(),t.beginPath(),t.translate(n[0],n[1]),i?(l=(r[0]+r[2])/2-n[0],c=(r[1]+r[3])/2-n[1]):(l=n[2]-n[0],c=n[3]-n[1]),t.rotate((Math.atan2(-c,-l)+e)%e),t.moveTo(0,0),t.lineTo(-o,d/2),t.lineTo(-o,-d/2),t.closePath(),t.restore(),this.__fillStroke(t))}__fillStroke(t){const e=this.dashEnabled();e&&(this.attrs.dashEnabled=!1,t.setLineDash([])),t.fillStrokeShape(this),e&&(this.attrs.dashEnabled=!0)}getSelfRect(){const t=super.getSelfRect(),e=this.pointerWidth()/2;return{x:t.x,y:t.y-e,width:t.width,height:t.height+2*e}}}e.Arrow=l,l.prototype.className="Arrow",(0,a._registerNode)(l),r.Factory.addGetterSetter(l,"pointerLength",10,(0,o.getNumberValidator)()),r.Factory.addGetterSetter(l,"pointerWidth",10,(0,o.getNumberValidator)()),r.Factory.addGetterSetter(l,"pointerAtBeginning",!1),r.Factory.addGetterSetter(l,"pointerAtEnding",!0)},2016:(t,e,n)=>{"use strict";t.exports=n(6958)},2078:(t,e)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Grayscale=void 0;e.Grayscale=function(t){const e=t.data,n=e.length;for(let r=0;r<n;r+=4){const t=.34*e[r]+.5*e[r+1]+.16*e[r+2];e[r]=t,e[r+1]=t,e[r+2]=t}}},2086:(t,e,n)=>{"use strict";t.exports=n(5082)},2123:t=>{"use strict";var e=Object.getOwnPropertySymbols,n=Object.prototype.hasOwnProperty,r=Object.prototype.propertyIsEnumerable;t.exports=function(){try{if(!Object.assign)return!1;var t=new String("abc");if(t[5]="de","5"===Object.getOwnPropertyNames(t)[0])return!1;for(var e={},n=0;n<10;n++)e["_"+String.fromCharCode(n)]=n;if("0123456789"!==Object.getOwnPropertyNames(e).map((function(t){return e[t]})).join(""))return!1;var r={};return"abcdefghijklmnopqrst".split("").forEach((function(t){r[t]=t})),"abcdefghijklmnopqrst"===Object.keys(Object.assign({},r)).join("")}catch(i){return!1}}()?Object.assign:function(t,i){for(var o,a,s=function(t){if(null===t||void 0===t)throw new TypeError("Object.assign cannot be called with null or undefined");return Object(t)}(t),l=1;l<arguments.length;l++){for(var c in o=Object(arguments[l]))n.call(o,c)&&(s[c]=o[c]);if(e){a=e(o);for(var u=0;u<a.length;u++)r.call(o,a[u])&&(s[a[u]]=o[a[u]])}}return s}},2157:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0});const r=n(5191);t.exports=r.Konva},2544:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.HSV=void 0;const r=n(1751),i=n(1189),o=n(9910);e.HSV=function(t){const e=t.data,n=e.length,r=Math.pow(2,this.value()),i=Math.pow(2,this.saturation()),o=Math.abs(this.hue()+360)%360,a=r*i*Math.cos(o*Math.PI/180),s=r*i*Math.sin(o*Math.PI/180),l=.299*r+.701*a+.167*s,c=.587*r-.587*a+.33*s,u=.114*r-.114*a-.497*s,d=.299*r-.299*a-.328*s,h=.587*r+.413*a+.035*s,f=.114*r-.114*a+.293*s,p=.299*r-.3*a+1.25*s,g=.587*r-.586*a-1.05*s,m=.114*r+.886*a-.2*s;let y,b,v,_;for(let w=0;w<n;w+=4)y=e[w+0],b=e[w+1],v=e[w+2],_=e[w+3],e[w+0]=l*y+c*b+u*v,e[w+1]=d*y+h*b+f*v,e[w+2]=p*y+g*b+m*v,e[w+3]=_},r.Factory.addGetterSetter(i.Node,"hue",0,(0,o.getNumberValidator)(),r.Factory.afterSetFilter),r.Factory.addGetterSetter(i.Node,"saturation",0,(0,o.getNumberValidator)(),r.Factory.afterSetFilter),r.Factory.addGetterSetter(i.Node,"value",0,(0,o.getNumberValidator)(),r.Factory.afterSetFilter)},2672:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Blur=void 0;const r=n(1751),i=n(1189),o=n(9910);function a(){this.r=0,this.g=0,this.b=0,this.a=0,this.next=null}const s=[512,512,456,512,328,456,335,512,405,328,271,456,388,335,292,512,454,405,364,328,298,271,496,456,420,388,360,335,312,292,273,512,482,454,428,405,383,364,345,328,312,298,284,271,259,496,475,456,437,420,404,388,374,360,347,335,323,312,302,292,282,273,265,512,497,482,468,454,441,428,417,405,394,383,373,364,354,345,337,328,320,312,305,298,291,284,278,271,265,259,507,496,485,475,465,456,446,437,428,420,412,404,396,388,381,374,367,360,354,347,341,335,329,323,318,312,307,302,297,292,287,282,278,273,269,265,261,512,505,497,489,482,475,468,461,454,447,441,435,428,422,417,411,405,399,394,389,383,378,373,368,364,359,354,350,345,341,337,332,328,324,320,316,312,309,305,301,298,294,291,287,284,281,278,274,271,268,265,262,259,257,507,501,496,491,485,480,475,470,465,460,456,451,446,442,437,433,428,424,420,416,412,408,404,400,396,392,388,385,381,377,374,370,367,363,360,357,354,350,347,344,341,338,335,332,329,326,323,320,318,315,312,310,307,304,302,299,297,294,292,289,287,285,282,280,278,275,273,271,269,267,265,263,261,259],l=[9,11,12,13,13,14,14,15,15,15,15,16,16,16,16,17,17,17,17,17,17,17,18,18,18,18,18,18,18,18,18,19,19,19,19,19,19,19,19,19,19,19,19,19,19,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24];e.Blur=function(t){const e=Math.round(this.blurRadius());e>0&&function(t,e){const n=t.data,r=t.width,i=t.height;let o,c,u,d,h,f,p,g,m,y,b,v,_,w,x,S,k,C,T,P,E,A,I,M;const F=e+e+1,D=r-1,R=i-1,O=e+1,N=O*(O+1)/2,L=new a,B=s[e],z=l[e];let j=null,U=L,V=null,$=null;for(u=1;u<F;u++)U=U.next=new a,u===O&&(j=U);for(U.next=L,p=f=0,c=0;c<i;c++){for(S=k=C=T=g=m=y=b=0,v=O*(P=n[f]),_=O*(E=n[f+1]),w=O*(A=n[f+2]),x=O*(I=n[f+3]),g+=N*P,m+=N*E,y+=N*A,b+=N*I,U=L,u=0;u<O;u++)U.r=P,U.g=E,U.b=A,U.a=I,U=U.next;for(u=1;u<O;u++)d=f+((D<u?D:u)<<2),g+=(U.r=P=n[d])*(M=O-u),m+=(U.g=E=n[d+1])*M,y+=(U.b=A=n[d+2])*M,b+=(U.a=I=n[d+3])*M,S+=P,k+=E,C+=A,T+=I,U=U.next;for(V=L,$=j,o=0;o<r;o++)n[f+3]=I=b*B>>z,0!==I?(I=255/I,n[f]=(g*B>>z)*I,n[f+1]=(m*B>>z)*I,n[f+2]=(y*B>>z)*I):n[f]=n[f+1]=n[f+2]=0,g-=v,m-=_,y-=w,b-=x,v-=V.r,_-=V.g,w-=V.b,x-=V.a,d=p+((d=o+e+1)<D?d:D)<<2,S+=V.r=n[d],k+=V.g=n[d+1],C+=V.b=n[d+2],T+=V.a=n[d+3],g+=S,m+=k,y+=C,b+=T,V=V.next,v+=P=$.r,_+=E=$.g,w+=A=$.b,x+=I=$.a,S-=P,k-=E,C-=A,T-=I,$=$.next,f+=4;p+=r}for(o=0;o<r;o++){for(k=C=T=S=m=y=b=g=0,f=o<<2,v=O*(P=n[f]),_=O*(E=n[f+1]),w=O*(A=n[f+2]),x=O*(I=n[f+3]),g+=N*P,m+=N*E,y+=N*A,b+=N*I,U=L,u=0;u<O;u++)U.r=P,U.g=E,U.b=A,U.a=I,U=U.next;for(h=r,u=1;u<=e;u++)f=h+o<<2,g+=(U.r=P=n[f])*(M=O-u),m+=(U.g=E=n[f+1])*M,y+=(U.b=A=n[f+2])*M,b+=(U.a=I=n[f+3])*M,S+=P,k+=E,C+=A,T+=I,U=U.next,u<R&&(h+=r);for(f=o,V=L,$=j,c=0;c<i;c++)d=f<<2,n[d+3]=I=b*B>>z,I>0?(I=255/I,n[d]=(g*B>>z)*I,n[d+1]=(m*B>>z)*I,n[d+2]=(y*B>>z)*I):n[d]=n[d+1]=n[d+2]=0,g-=v,m-=_,y-=w,b-=x,v-=V.r,_-=V.g,w-=V.b,x-=V.a,d=o+((d=c+O)<R?d:R)*r<<2,g+=S+=V.r=n[d],m+=k+=V.g=n[d+1],y+=C+=V.b=n[d+2],b+=T+=V.a=n[d+3],V=V.next,v+=P=$.r,_+=E=$.g,w+=A=$.b,x+=I=$.a,S-=P,k-=E,C-=A,T-=I,$=$.next,f+=r}}(t,e)},r.Factory.addGetterSetter(i.Node,"blurRadius",0,(0,o.getNumberValidator)(),r.Factory.afterSetFilter)},2715:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Enhance=void 0;const r=n(1751),i=n(1189),o=n(9910);function a(t,e,n,r,i){const o=n-e,a=i-r;if(0===o)return r+a/2;if(0===a)return r;let s=(t-e)/o;return s=a*s+r,s}e.Enhance=function(t){const e=t.data,n=e.length;let r,i,o,s=e[0],l=s,c=e[1],u=c,d=e[2],h=d;const f=this.enhance();if(0===f)return;for(let a=0;a<n;a+=4)r=e[a+0],r<s?s=r:r>l&&(l=r),i=e[a+1],i<c?c=i:i>u&&(u=i),o=e[a+2],o<d?d=o:o>h&&(h=o);let p,g,m,y,b,v,_,w,x;l===s&&(l=255,s=0),u===c&&(u=255,c=0),h===d&&(h=255,d=0),f>0?(g=l+f*(255-l),m=s-f*(s-0),b=u+f*(255-u),v=c-f*(c-0),w=h+f*(255-h),x=d-f*(d-0)):(p=.5*(l+s),g=l+f*(l-p),m=s+f*(s-p),y=.5*(u+c),b=u+f*(u-y),v=c+f*(c-y),_=.5*(h+d),w=h+f*(h-_),x=d+f*(d-_));for(let S=0;S<n;S+=4)e[S+0]=a(e[S+0],s,l,m,g),e[S+1]=a(e[S+1],c,u,v,b),e[S+2]=a(e[S+2],d,h,x,w)},r.Factory.addGetterSetter(i.Node,"enhance",0,(0,o.getNumberValidator)(),r.Factory.afterSetFilter)},2730:(t,e,n)=>{"use strict";var r=n(5043),i=n(8853);function o(t){for(var e="https://reactjs.org/docs/error-decoder.html?invariant="+t,n=1;n<arguments.length;n++)e+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+t+"; visit "+e+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var a=new Set,s={};function l(t,e){c(t,e),c(t+"Capture",e)}function c(t,e){for(s[t]=e,t=0;t<e.length;t++)a.add(e[t])}var u=!("undefined"===typeof window||"undefined"===typeof window.document||"undefined"===typeof window.document.createElement),d=Object.prototype.hasOwnProperty,h=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,f={},p={};function g(t,e,n,r,i,o,a){this.acceptsBooleans=2===e||3===e||4===e,this.attributeName=r,this.attributeNamespace=i,this.mustUseProperty=n,this.propertyName=t,this.type=e,this.sanitizeURL=o,this.removeEmptyString=a}var m={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach((function(t){m[t]=new g(t,0,!1,t,null,!1,!1)})),[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach((function(t){var e=t[0];m[e]=new g(e,1,!1,t[1],null,!1,!1)})),["contentEditable","draggable","spellCheck","value"].forEach((function(t){m[t]=new g(t,2,!1,t.toLowerCase(),null,!1,!1)})),["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach((function(t){m[t]=new g(t,2,!1,t,null,!1,!1)})),"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach((function(t){m[t]=new g(t,3,!1,t.toLowerCase(),null,!1,!1)})),["checked","multiple","muted","selected"].forEach((function(t){m[t]=new g(t,3,!0,t,null,!1,!1)})),["capture","download"].forEach((function(t){m[t]=new g(t,4,!1,t,null,!1,!1)})),["cols","rows","size","span"].forEach((function(t){m[t]=new g(t,6,!1,t,null,!1,!1)})),["rowSpan","start"].forEach((function(t){m[t]=new g(t,5,!1,t.toLowerCase(),null,!1,!1)}));var y=/[\-:]([a-z])/g;function b(t){return t[1].toUpperCase()}function v(t,e,n,r){var i=m.hasOwnProperty(e)?m[e]:null;(null!==i?0!==i.type:r||!(2<e.length)||"o"!==e[0]&&"O"!==e[0]||"n"!==e[1]&&"N"!==e[1])&&(function(t,e,n,r){if(null===e||"undefined"===typeof e||function(t,e,n,r){if(null!==n&&0===n.type)return!1;switch(typeof e){case"function":case"symbol":return!0;case"boolean":return!r&&(null!==n?!n.acceptsBooleans:"data-"!==(t=t.toLowerCase().slice(0,5))&&"aria-"!==t);default:return!1}}(t,e,n,r))return!0;if(r)return!1;if(null!==n)switch(n.type){case 3:return!e;case 4:return!1===e;case 5:return isNaN(e);case 6:return isNaN(e)||1>e}return!1}(e,n,i,r)&&(n=null),r||null===i?function(t){return!!d.call(p,t)||!d.call(f,t)&&(h.test(t)?p[t]=!0:(f[t]=!0,!1))}(e)&&(null===n?t.removeAttribute(e):t.setAttribute(e,""+n)):i.mustUseProperty?t[i.propertyName]=null===n?3!==i.type&&"":n:(e=i.attributeName,r=i.attributeNamespace,null===n?t.removeAttribute(e):(n=3===(i=i.type)||4===i&&!0===n?"":""+n,r?t.setAttributeNS(r,e,n):t.setAttribute(e,n))))}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach((function(t){var e=t.replace(y,b);m[e]=new g(e,1,!1,t,null,!1,!1)})),"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach((function(t){var e=t.replace(y,b);m[e]=new g(e,1,!1,t,"http://www.w3.org/1999/xlink",!1,!1)})),["xml:base","xml:lang","xml:space"].forEach((function(t){var e=t.replace(y,b);m[e]=new g(e,1,!1,t,"http://www.w3.org/XML/1998/namespace",!1,!1)})),["tabIndex","crossOrigin"].forEach((function(t){m[t]=new g(t,1,!1,t.toLowerCase(),null,!1,!1)})),m.xlinkHref=new g("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1),["src","href","action","formAction"].forEach((function(t){m[t]=new g(t,1,!1,t.toLowerCase(),null,!0,!0)}));var _=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,w=Symbol.for("react.element"),x=Symbol.for("react.portal"),S=Symbol.for("react.fragment"),k=Symbol.for("react.strict_mode"),C=Symbol.for("react.profiler"),T=Symbol.for("react.provider"),P=Symbol.for("react.context"),E=Symbol.for("react.forward_ref"),A=Symbol.for("react.suspense"),I=Symbol.for("react.suspense_list"),M=Symbol.for("react.memo"),F=Symbol.for("react.lazy");Symbol.for("react.scope"),Symbol.for("react.debug_trace_mode");var D=Symbol.for("react.offscreen");Symbol.for("react.legacy_hidden"),Symbol.for("react.cache"),Symbol.for("react.tracing_marker");var R=Symbol.iterator;function O(t){return null===t||"object"!==typeof t?null:"function"===typeof(t=R&&t[R]||t["@@iterator"])?t:null}var N,L=Object.assign;function B(t){if(void 0===N)try{throw Error()}catch(n){var e=n.stack.trim().match(/\n( *(at )?)/);N=e&&e[1]||""}return"\n"+N+t}var z=!1;function j(t,e){if(!t||z)return"";z=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(e)if(e=function(){throw Error()},Object.defineProperty(e.prototype,"props",{set:function(){throw Error()}}),"object"===typeof Reflect&&Reflect.construct){try{Reflect.construct(e,[])}catch(c){var r=c}Reflect.construct(t,[],e)}else{try{e.call()}catch(c){r=c}t.call(e.prototype)}else{try{throw Error()}catch(c){r=c}t()}}catch(c){if(c&&r&&"string"===typeof c.stack){for(var i=c.stack.split("\n"),o=r.stack.split("\n"),a=i.length-1,s=o.length-1;1<=a&&0<=s&&i[a]!==o[s];)s--;for(;1<=a&&0<=s;a--,s--)if(i[a]!==o[s]){if(1!==a||1!==s)do{if(a--,0>--s||i[a]!==o[s]){var l="\n"+i[a].replace(" at new "," at ");return t.displayName&&l.includes("<anonymous>")&&(l=l.replace("<anonymous>",t.displayName)),l}}while(1<=a&&0<=s);break}}}finally{z=!1,Error.prepareStackTrace=n}return(t=t?t.displayName||t.name:"")?B(t):""}function U(t){switch(t.tag){case 5:return B(t.type);case 16:return B("Lazy");case 13:return B("Suspense");case 19:return B("SuspenseList");case 0:case 2:case 15:return t=j(t.type,!1);case 11:return t=j(t.type.render,!1);case 1:return t=j(t.type,!0);default:return""}}function V(t){if(null==t)return null;if("function"===typeof t)return t.displayName||t.name||null;if("string"===typeof t)return t;switch(t){case S:return"Fragment";case x:return"Portal";case C:return"Profiler";case k:return"StrictMode";case A:return"Suspense";case I:return"SuspenseList"}if("object"===typeof t)switch(t.$$typeof){case P:return(t.displayName||"Context")+".Consumer";case T:return(t._context.displayName||"Context")+".Provider";case E:var e=t.render;return(t=t.displayName)||(t=""!==(t=e.displayName||e.name||"")?"ForwardRef("+t+")":"ForwardRef"),t;case M:return null!==(e=t.displayName||null)?e:V(t.type)||"Memo";case F:e=t._payload,t=t._init;try{return V(t(e))}catch(n){}}return null}function $(t){var e=t.type;switch(t.tag){case 24:return"Cache";case 9:return(e.displayName||"Context")+".Consumer";case 10:return(e._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return t=(t=e.render).displayName||t.name||"",e.displayName||(""!==t?"ForwardRef("+t+")":"ForwardRef");case 7:return"Fragment";case 5:return e;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return V(e);case 8:return e===k?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if("function"===typeof e)return e.displayName||e.name||null;if("string"===typeof e)return e}return null}function W(t){switch(typeof t){case"boolean":case"number":case"string":case"undefined":case"object":return t;default:return""}}function G(t){var e=t.type;return(t=t.nodeName)&&"input"===t.toLowerCase()&&("checkbox"===e||"radio"===e)}function H(t){t._valueTracker||(t._valueTracker=function(t){var e=G(t)?"checked":"value",n=Object.getOwnPropertyDescriptor(t.constructor.prototype,e),r=""+t[e];if(!t.hasOwnProperty(e)&&"undefined"!==typeof n&&"function"===typeof n.get&&"function"===typeof n.set){var i=n.get,o=n.set;return Object.defineProperty(t,e,{configurable:!0,get:function(){return i.call(this)},set:function(t){r=""+t,o.call(this,t)}}),Object.defineProperty(t,e,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(t){r=""+t},stopTracking:function(){t._valueTracker=null,delete t[e]}}}}(t))}function Y(t){if(!t)return!1;var e=t._valueTracker;if(!e)return!0;var n=e.getValue(),r="";return t&&(r=G(t)?t.checked?"true":"false":t.value),(t=r)!==n&&(e.setValue(t),!0)}function q(t){if("undefined"===typeof(t=t||("undefined"!==typeof document?document:void 0)))return null;try{return t.activeElement||t.body}catch(e){return t.body}}function K(t,e){var n=e.checked;return L({},e,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:null!=n?n:t._wrapperState.initialChecked})}function X(t,e){var n=null==e.defaultValue?"":e.defaultValue,r=null!=e.checked?e.checked:e.defaultChecked;n=W(null!=e.value?e.value:n),t._wrapperState={initialChecked:r,initialValue:n,controlled:"checkbox"===e.type||"radio"===e.type?null!=e.checked:null!=e.value}}function Q(t,e){null!=(e=e.checked)&&v(t,"checked",e,!1)}function Z(t,e){Q(t,e);var n=W(e.value),r=e.type;if(null!=n)"number"===r?(0===n&&""===t.value||t.value!=n)&&(t.value=""+n):t.value!==""+n&&(t.value=""+n);else if("submit"===r||"reset"===r)return void t.removeAttribute("value");e.hasOwnProperty("value")?tt(t,e.type,n):e.hasOwnProperty("defaultValue")&&tt(t,e.type,W(e.defaultValue)),null==e.checked&&null!=e.defaultChecked&&(t.defaultChecked=!!e.defaultChecked)}function J(t,e,n){if(e.hasOwnProperty("value")||e.hasOwnProperty("defaultValue")){var r=e.type;if(!("submit"!==r&&"reset"!==r||void 0!==e.value&&null!==e.value))return;e=""+t._wrapperState.initialValue,n||e===t.value||(t.value=e),t.defaultValue=e}""!==(n=t.name)&&(t.name=""),t.defaultChecked=!!t._wrapperState.initialChecked,""!==n&&(t.name=n)}function tt(t,e,n){"number"===e&&q(t.ownerDocument)===t||(null==n?t.defaultValue=""+t._wrapperState.initialValue:t.defaultValue!==""+n&&(t.defaultValue=""+n))}var et=Array.isArray;function nt(t,e,n,r){if(t=t.options,e){e={};for(var i=0;i<n.length;i++)e["$"+n[i]]=!0;for(n=0;n<t.length;n++)i=e.hasOwnProperty("$"+t[n].value),t[n].selected!==i&&(t[n].selected=i),i&&r&&(t[n].defaultSelected=!0)}else{for(n=""+W(n),e=null,i=0;i<t.length;i++){if(t[i].value===n)return t[i].selected=!0,void(r&&(t[i].defaultSelected=!0));null!==e||t[i].disabled||(e=t[i])}null!==e&&(e.selected=!0)}}function rt(t,e){if(null!=e.dangerouslySetInnerHTML)throw Error(o(91));return L({},e,{value:void 0,defaultValue:void 0,children:""+t._wrapperState.initialValue})}function it(t,e){var n=e.value;if(null==n){if(n=e.children,e=e.defaultValue,null!=n){if(null!=e)throw Error(o(92));if(et(n)){if(1<n.length)throw Error(o(93));n=n[0]}e=n}null==e&&(e=""),n=e}t._wrapperState={initialValue:W(n)}}function ot(t,e){var n=W(e.value),r=W(e.defaultValue);null!=n&&((n=""+n)!==t.value&&(t.value=n),null==e.defaultValue&&t.defaultValue!==n&&(t.defaultValue=n)),null!=r&&(t.defaultValue=""+r)}function at(t){var e=t.textContent;e===t._wrapperState.initialValue&&""!==e&&null!==e&&(t.value=e)}function st(t){switch(t){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function lt(t,e){return null==t||"http://www.w3.org/1999/xhtml"===t?st(e):"http://www.w3.org/2000/svg"===t&&"foreignObject"===e?"http://www.w3.org/1999/xhtml":t}var ct,ut,dt=(ut=function(t,e){if("http://www.w3.org/2000/svg"!==t.namespaceURI||"innerHTML"in t)t.innerHTML=e;else{for((ct=ct||document.createElement("div")).innerHTML="<svg>"+e.valueOf().toString()+"</svg>",e=ct.firstChild;t.firstChild;)t.removeChild(t.firstChild);for(;e.firstChild;)t.appendChild(e.firstChild)}},"undefined"!==typeof MSApp&&MSApp.execUnsafeLocalFunction?function(t,e,n,r){MSApp.execUnsafeLocalFunction((function(){return ut(t,e)}))}:ut);function ht(t,e){if(e){var n=t.firstChild;if(n&&n===t.lastChild&&3===n.nodeType)return void(n.nodeValue=e)}t.textContent=e}var ft={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},pt=["Webkit","ms","Moz","O"];function gt(t,e,n){return null==e||"boolean"===typeof e||""===e?"":n||"number"!==typeof e||0===e||ft.hasOwnProperty(t)&&ft[t]?(""+e).trim():e+"px"}function mt(t,e){for(var n in t=t.style,e)if(e.hasOwnProperty(n)){var r=0===n.indexOf("--"),i=gt(n,e[n],r);"float"===n&&(n="cssFloat"),r?t.setProperty(n,i):t[n]=i}}Object.keys(ft).forEach((function(t){pt.forEach((function(e){e=e+t.charAt(0).toUpperCase()+t.substring(1),ft[e]=ft[t]}))}));var yt=L({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function bt(t,e){if(e){if(yt[t]&&(null!=e.children||null!=e.dangerouslySetInnerHTML))throw Error(o(137,t));if(null!=e.dangerouslySetInnerHTML){if(null!=e.children)throw Error(o(60));if("object"!==typeof e.dangerouslySetInnerHTML||!("__html"in e.dangerouslySetInnerHTML))throw Error(o(61))}if(null!=e.style&&"object"!==typeof e.style)throw Error(o(62))}}function vt(t,e){if(-1===t.indexOf("-"))return"string"===typeof e.is;switch(t){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var _t=null;function wt(t){return(t=t.target||t.srcElement||window).correspondingUseElement&&(t=t.correspondingUseElement),3===t.nodeType?t.parentNode:t}var xt=null,St=null,kt=null;function Ct(t){if(t=vi(t)){if("function"!==typeof xt)throw Error(o(280));var e=t.stateNode;e&&(e=wi(e),xt(t.stateNode,t.type,e))}}function Tt(t){St?kt?kt.push(t):kt=[t]:St=t}function Pt(){if(St){var t=St,e=kt;if(kt=St=null,Ct(t),e)for(t=0;t<e.length;t++)Ct(e[t])}}function Et(t,e){return t(e)}function At(){}var It=!1;function Mt(t,e,n){if(It)return t(e,n);It=!0;try{return Et(t,e,n)}finally{It=!1,(null!==St||null!==kt)&&(At(),Pt())}}function Ft(t,e){var n=t.stateNode;if(null===n)return null;var r=wi(n);if(null===r)return null;n=r[e];t:switch(e){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(t=t.type)||"input"===t||"select"===t||"textarea"===t)),t=!r;break t;default:t=!1}if(t)return null;if(n&&"function"!==typeof n)throw Error(o(231,e,typeof n));return n}var Dt=!1;if(u)try{var Rt={};Object.defineProperty(Rt,"passive",{get:function(){Dt=!0}}),window.addEventListener("test",Rt,Rt),window.removeEventListener("test",Rt,Rt)}catch(ut){Dt=!1}function Ot(t,e,n,r,i,o,a,s,l){var c=Array.prototype.slice.call(arguments,3);try{e.apply(n,c)}catch(u){this.onError(u)}}var Nt=!1,Lt=null,Bt=!1,zt=null,jt={onError:function(t){Nt=!0,Lt=t}};function Ut(t,e,n,r,i,o,a,s,l){Nt=!1,Lt=null,Ot.apply(jt,arguments)}function Vt(t){var e=t,n=t;if(t.alternate)for(;e.return;)e=e.return;else{t=e;do{0!==(4098&(e=t).flags)&&(n=e.return),t=e.return}while(t)}return 3===e.tag?n:null}function $t(t){if(13===t.tag){var e=t.memoizedState;if(null===e&&(null!==(t=t.alternate)&&(e=t.memoizedState)),null!==e)return e.dehydrated}return null}function Wt(t){if(Vt(t)!==t)throw Error(o(188))}function Gt(t){return null!==(t=function(t){var e=t.alternate;if(!e){if(null===(e=Vt(t)))throw Error(o(188));return e!==t?null:t}for(var n=t,r=e;;){var i=n.return;if(null===i)break;var a=i.alternate;if(null===a){if(null!==(r=i.return)){n=r;continue}break}if(i.child===a.child){for(a=i.child;a;){if(a===n)return Wt(i),t;if(a===r)return Wt(i),e;a=a.sibling}throw Error(o(188))}if(n.return!==r.return)n=i,r=a;else{for(var s=!1,l=i.child;l;){if(l===n){s=!0,n=i,r=a;break}if(l===r){s=!0,r=i,n=a;break}l=l.sibling}if(!s){for(l=a.child;l;){if(l===n){s=!0,n=a,r=i;break}if(l===r){s=!0,r=a,n=i;break}l=l.sibling}if(!s)throw Error(o(189))}}if(n.alternate!==r)throw Error(o(190))}if(3!==n.tag)throw Error(o(188));return n.stateNode.current===n?t:e}(t))?Ht(t):null}function Ht(t){if(5===t.tag||6===t.tag)return t;for(t=t.child;null!==t;){var e=Ht(t);if(null!==e)return e;t=t.sibling}return null}var Yt=i.unstable_scheduleCallback,qt=i.unstable_cancelCallback,Kt=i.unstable_shouldYield,Xt=i.unstable_requestPaint,Qt=i.unstable_now,Zt=i.unstable_getCurrentPriorityLevel,Jt=i.unstable_ImmediatePriority,te=i.unstable_UserBlockingPriority,ee=i.unstable_NormalPriority,ne=i.unstable_LowPriority,re=i.unstable_IdlePriority,ie=null,oe=null;var ae=Math.clz32?Math.clz32:function(t){return t>>>=0,0===t?32:31-(se(t)/le|0)|0},se=Math.log,le=Math.LN2;var ce=64,ue=4194304;function de(t){switch(t&-t){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return 4194240&t;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return 130023424&t;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return t}}function he(t,e){var n=t.pendingLanes;if(0===n)return 0;var r=0,i=t.suspendedLanes,o=t.pingedLanes,a=268435455&n;if(0!==a){var s=a&~i;0!==s?r=de(s):0!==(o&=a)&&(r=de(o))}else 0!==(a=n&~i)?r=de(a):0!==o&&(r=de(o));if(0===r)return 0;if(0!==e&&e!==r&&0===(e&i)&&((i=r&-r)>=(o=e&-e)||16===i&&0!==(4194240&o)))return e;if(0!==(4&r)&&(r|=16&n),0!==(e=t.entangledLanes))for(t=t.entanglements,e&=r;0<e;)i=1<<(n=31-ae(e)),r|=t[n],e&=~i;return r}function fe(t,e){switch(t){case 1:case 2:case 4:return e+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e+5e3;default:return-1}}function pe(t){return 0!==(t=-1073741825&t.pendingLanes)?t:1073741824&t?1073741824:0}function ge(){var t=ce;return 0===(4194240&(ce<<=1))&&(ce=64),t}function me(t){for(var e=[],n=0;31>n;n++)e.push(t);return e}function ye(t,e,n){t.pendingLanes|=e,536870912!==e&&(t.suspendedLanes=0,t.pingedLanes=0),(t=t.eventTimes)[e=31-ae(e)]=n}function be(t,e){var n=t.entangledLanes|=e;for(t=t.entanglements;n;){var r=31-ae(n),i=1<<r;i&e|t[r]&e&&(t[r]|=e),n&=~i}}var ve=0;function _e(t){return 1<(t&=-t)?4<t?0!==(268435455&t)?16:536870912:4:1}var we,xe,Se,ke,Ce,Te=!1,Pe=[],Ee=null,Ae=null,Ie=null,Me=new Map,Fe=new Map,De=[],Re="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function Oe(t,e){switch(t){case"focusin":case"focusout":Ee=null;break;case"dragenter":case"dragleave":Ae=null;break;case"mouseover":case"mouseout":Ie=null;break;case"pointerover":case"pointerout":Me.delete(e.pointerId);break;case"gotpointercapture":case"lostpointercapture":Fe.delete(e.pointerId)}}function Ne(t,e,n,r,i,o){return null===t||t.nativeEvent!==o?(t={blockedOn:e,domEventName:n,eventSystemFlags:r,nativeEvent:o,targetContainers:[i]},null!==e&&(null!==(e=vi(e))&&xe(e)),t):(t.eventSystemFlags|=r,e=t.targetContainers,null!==i&&-1===e.indexOf(i)&&e.push(i),t)}function Le(t){var e=bi(t.target);if(null!==e){var n=Vt(e);if(null!==n)if(13===(e=n.tag)){if(null!==(e=$t(n)))return t.blockedOn=e,void Ce(t.priority,(function(){Se(n)}))}else if(3===e&&n.stateNode.current.memoizedState.isDehydrated)return void(t.blockedOn=3===n.tag?n.stateNode.containerInfo:null)}t.blockedOn=null}function Be(t){if(null!==t.blockedOn)return!1;for(var e=t.targetContainers;0<e.length;){var n=Ke(t.domEventName,t.eventSystemFlags,e[0],t.nativeEvent);if(null!==n)return null!==(e=vi(n))&&xe(e),t.blockedOn=n,!1;var r=new(n=t.nativeEvent).constructor(n.type,n);_t=r,n.target.dispatchEvent(r),_t=null,e.shift()}return!0}function ze(t,e,n){Be(t)&&n.delete(e)}function je(){Te=!1,null!==Ee&&Be(Ee)&&(Ee=null),null!==Ae&&Be(Ae)&&(Ae=null),null!==Ie&&Be(Ie)&&(Ie=null),Me.forEach(ze),Fe.forEach(ze)}function Ue(t,e){t.blockedOn===e&&(t.blockedOn=null,Te||(Te=!0,i.unstable_scheduleCallback(i.unstable_NormalPriority,je)))}function Ve(t){function e(e){return Ue(e,t)}if(0<Pe.length){Ue(Pe[0],t);for(var n=1;n<Pe.length;n++){var r=Pe[n];r.blockedOn===t&&(r.blockedOn=null)}}for(null!==Ee&&Ue(Ee,t),null!==Ae&&Ue(Ae,t),null!==Ie&&Ue(Ie,t),Me.forEach(e),Fe.forEach(e),n=0;n<De.length;n++)(r=De[n]).blockedOn===t&&(r.blockedOn=null);for(;0<De.length&&null===(n=De[0]).blockedOn;)Le(n),null===n.blockedOn&&De.shift()}var $e=_.ReactCurrentBatchConfig,We=!0;function Ge(t,e,n,r){var i=ve,o=$e.transition;$e.transition=null;try{ve=1,Ye(t,e,n,r)}finally{ve=i,$e.transition=o}}function He(t,e,n,r){var i=ve,o=$e.transition;$e.transition=null;try{ve=4,Ye(t,e,n,r)}finally{ve=i,$e.transition=o}}function Ye(t,e,n,r){if(We){var i=Ke(t,e,n,r);if(null===i)Wr(t,e,r,qe,n),Oe(t,r);else if(function(t,e,n,r,i){switch(e){case"focusin":return Ee=Ne(Ee,t,e,n,r,i),!0;case"dragenter":return Ae=Ne(Ae,t,e,n,r,i),!0;case"mouseover":return Ie=Ne(Ie,t,e,n,r,i),!0;case"pointerover":var o=i.pointerId;return Me.set(o,Ne(Me.get(o)||null,t,e,n,r,i)),!0;case"gotpointercapture":return o=i.pointerId,Fe.set(o,Ne(Fe.get(o)||null,t,e,n,r,i)),!0}return!1}(i,t,e,n,r))r.stopPropagation();else if(Oe(t,r),4&e&&-1<Re.indexOf(t)){for(;null!==i;){var o=vi(i);if(null!==o&&we(o),null===(o=Ke(t,e,n,r))&&Wr(t,e,r,qe,n),o===i)break;i=o}null!==i&&r.stopPropagation()}else Wr(t,e,r,null,n)}}var qe=null;function Ke(t,e,n,r){if(qe=null,null!==(t=bi(t=wt(r))))if(null===(e=Vt(t)))t=null;else if(13===(n=e.tag)){if(null!==(t=$t(e)))return t;t=null}else if(3===n){if(e.stateNode.current.memoizedState.isDehydrated)return 3===e.tag?e.stateNode.containerInfo:null;t=null}else e!==t&&(t=null);return qe=t,null}function Xe(t){switch(t){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(Zt()){case Jt:return 1;case te:return 4;case ee:case ne:return 16;case re:return 536870912;default:return 16}default:return 16}}var Qe=null,Ze=null,Je=null;function tn(){if(Je)return Je;var t,e,n=Ze,r=n.length,i="value"in Qe?Qe.value:Qe.textContent,o=i.length;for(t=0;t<r&&n[t]===i[t];t++);var a=r-t;for(e=1;e<=a&&n[r-e]===i[o-e];e++);return Je=i.slice(t,1<e?1-e:void 0)}function en(t){var e=t.keyCode;return"charCode"in t?0===(t=t.charCode)&&13===e&&(t=13):t=e,10===t&&(t=13),32<=t||13===t?t:0}function nn(){return!0}function rn(){return!1}function on(t){function e(e,n,r,i,o){for(var a in this._reactName=e,this._targetInst=r,this.type=n,this.nativeEvent=i,this.target=o,this.currentTarget=null,t)t.hasOwnProperty(a)&&(e=t[a],this[a]=e?e(i):i[a]);return this.isDefaultPrevented=(null!=i.defaultPrevented?i.defaultPrevented:!1===i.returnValue)?nn:rn,this.isPropagationStopped=rn,this}return L(e.prototype,{preventDefault:function(){this.defaultPrevented=!0;var t=this.nativeEvent;t&&(t.preventDefault?t.preventDefault():"unknown"!==typeof t.returnValue&&(t.returnValue=!1),this.isDefaultPrevented=nn)},stopPropagation:function(){var t=this.nativeEvent;t&&(t.stopPropagation?t.stopPropagation():"unknown"!==typeof t.cancelBubble&&(t.cancelBubble=!0),this.isPropagationStopped=nn)},persist:function(){},isPersistent:nn}),e}var an,sn,ln,cn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(t){return t.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},un=on(cn),dn=L({},cn,{view:0,detail:0}),hn=on(dn),fn=L({},dn,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:Cn,button:0,buttons:0,relatedTarget:function(t){return void 0===t.relatedTarget?t.fromElement===t.srcElement?t.toElement:t.fromElement:t.relatedTarget},movementX:function(t){return"movementX"in t?t.movementX:(t!==ln&&(ln&&"mousemove"===t.type?(an=t.screenX-ln.screenX,sn=t.screenY-ln.screenY):sn=an=0,ln=t),an)},movementY:function(t){return"movementY"in t?t.movementY:sn}}),pn=on(fn),gn=on(L({},fn,{dataTransfer:0})),mn=on(L({},dn,{relatedTarget:0})),yn=on(L({},cn,{animationName:0,elapsedTime:0,pseudoElement:0})),bn=L({},cn,{clipboardData:function(t){return"clipboardData"in t?t.clipboardData:window.clipboardData}}),vn=on(bn),_n=on(L({},cn,{data:0})),wn={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},xn={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},Sn={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function kn(t){var e=this.nativeEvent;return e.getModifierState?e.getModifierState(t):!!(t=Sn[t])&&!!e[t]}function Cn(){return kn}var Tn=L({},dn,{key:function(t){if(t.key){var e=wn[t.key]||t.key;if("Unidentified"!==e)return e}return"keypress"===t.type?13===(t=en(t))?"Enter":String.fromCharCode(t):"keydown"===t.type||"keyup"===t.type?xn[t.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:Cn,charCode:function(t){return"keypress"===t.type?en(t):0},keyCode:function(t){return"keydown"===t.type||"keyup"===t.type?t.keyCode:0},which:function(t){return"keypress"===t.type?en(t):"keydown"===t.type||"keyup"===t.type?t.keyCode:0}}),Pn=on(Tn),En=on(L({},fn,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),An=on(L({},dn,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:Cn})),In=on(L({},cn,{propertyName:0,elapsedTime:0,pseudoElement:0})),Mn=L({},fn,{deltaX:function(t){return"deltaX"in t?t.deltaX:"wheelDeltaX"in t?-t.wheelDeltaX:0},deltaY:function(t){return"deltaY"in t?t.deltaY:"wheelDeltaY"in t?-t.wheelDeltaY:"wheelDelta"in t?-t.wheelDelta:0},deltaZ:0,deltaMode:0}),Fn=on(Mn),Dn=[9,13,27,32],Rn=u&&"CompositionEvent"in window,On=null;u&&"documentMode"in document&&(On=document.documentMode);var Nn=u&&"TextEvent"in window&&!On,Ln=u&&(!Rn||On&&8<On&&11>=On),Bn=String.fromCharCode(32),zn=!1;function jn(t,e){switch(t){case"keyup":return-1!==Dn.indexOf(e.keyCode);case"keydown":return 229!==e.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Un(t){return"object"===typeof(t=t.detail)&&"data"in t?t.data:null}var Vn=!1;var $n={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Wn(t){var e=t&&t.nodeName&&t.nodeName.toLowerCase();return"input"===e?!!$n[t.type]:"textarea"===e}function Gn(t,e,n,r){Tt(r),0<(e=Hr(e,"onChange")).length&&(n=new un("onChange","change",null,n,r),t.push({event:n,listeners:e}))}var Hn=null,Yn=null;function qn(t){Br(t,0)}function Kn(t){if(Y(_i(t)))return t}function Xn(t,e){if("change"===t)return e}var Qn=!1;if(u){var Zn;if(u){var Jn="oninput"in document;if(!Jn){var tr=document.createElement("div");tr.setAttribute("oninput","return;"),Jn="function"===typeof tr.oninput}Zn=Jn}else Zn=!1;Qn=Zn&&(!document.documentMode||9<document.documentMode)}function er(){Hn&&(Hn.detachEvent("onpropertychange",nr),Yn=Hn=null)}function nr(t){if("value"===t.propertyName&&Kn(Yn)){var e=[];Gn(e,Yn,t,wt(t)),Mt(qn,e)}}function rr(t,e,n){"focusin"===t?(er(),Yn=n,(Hn=e).attachEvent("onpropertychange",nr)):"focusout"===t&&er()}function ir(t){if("selectionchange"===t||"keyup"===t||"keydown"===t)return Kn(Yn)}function or(t,e){if("click"===t)return Kn(e)}function ar(t,e){if("input"===t||"change"===t)return Kn(e)}var sr="function"===typeof Object.is?Object.is:function(t,e){return t===e&&(0!==t||1/t===1/e)||t!==t&&e!==e};function lr(t,e){if(sr(t,e))return!0;if("object"!==typeof t||null===t||"object"!==typeof e||null===e)return!1;var n=Object.keys(t),r=Object.keys(e);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var i=n[r];if(!d.call(e,i)||!sr(t[i],e[i]))return!1}return!0}function cr(t){for(;t&&t.firstChild;)t=t.firstChild;return t}function ur(t,e){var n,r=cr(t);for(t=0;r;){if(3===r.nodeType){if(n=t+r.textContent.length,t<=e&&n>=e)return{node:r,offset:e-t};t=n}t:{for(;r;){if(r.nextSibling){r=r.nextSibling;break t}r=r.parentNode}r=void 0}r=cr(r)}}function dr(t,e){return!(!t||!e)&&(t===e||(!t||3!==t.nodeType)&&(e&&3===e.nodeType?dr(t,e.parentNode):"contains"in t?t.contains(e):!!t.compareDocumentPosition&&!!(16&t.compareDocumentPosition(e))))}function hr(){for(var t=window,e=q();e instanceof t.HTMLIFrameElement;){try{var n="string"===typeof e.contentWindow.location.href}catch(r){n=!1}if(!n)break;e=q((t=e.contentWindow).document)}return e}function fr(t){var e=t&&t.nodeName&&t.nodeName.toLowerCase();return e&&("input"===e&&("text"===t.type||"search"===t.type||"tel"===t.type||"url"===t.type||"password"===t.type)||"textarea"===e||"true"===t.contentEditable)}function pr(t){var e=hr(),n=t.focusedElem,r=t.selectionRange;if(e!==n&&n&&n.ownerDocument&&dr(n.ownerDocument.documentElement,n)){if(null!==r&&fr(n))if(e=r.start,void 0===(t=r.end)&&(t=e),"selectionStart"in n)n.selectionStart=e,n.selectionEnd=Math.min(t,n.value.length);else if((t=(e=n.ownerDocument||document)&&e.defaultView||window).getSelection){t=t.getSelection();var i=n.textContent.length,o=Math.min(r.start,i);r=void 0===r.end?o:Math.min(r.end,i),!t.extend&&o>r&&(i=r,r=o,o=i),i=ur(n,o);var a=ur(n,r);i&&a&&(1!==t.rangeCount||t.anchorNode!==i.node||t.anchorOffset!==i.offset||t.focusNode!==a.node||t.focusOffset!==a.offset)&&((e=e.createRange()).setStart(i.node,i.offset),t.removeAllRanges(),o>r?(t.addRange(e),t.extend(a.node,a.offset)):(e.setEnd(a.node,a.offset),t.addRange(e)))}for(e=[],t=n;t=t.parentNode;)1===t.nodeType&&e.push({element:t,left:t.scrollLeft,top:t.scrollTop});for("function"===typeof n.focus&&n.focus(),n=0;n<e.length;n++)(t=e[n]).element.scrollLeft=t.left,t.element.scrollTop=t.top}}var gr=u&&"documentMode"in document&&11>=document.documentMode,mr=null,yr=null,br=null,vr=!1;function _r(t,e,n){var r=n.window===n?n.document:9===n.nodeType?n:n.ownerDocument;vr||null==mr||mr!==q(r)||("selectionStart"in(r=mr)&&fr(r)?r={start:r.selectionStart,end:r.selectionEnd}:r={anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},br&&lr(br,r)||(br=r,0<(r=Hr(yr,"onSelect")).length&&(e=new un("onSelect","select",null,e,n),t.push({event:e,listeners:r}),e.target=mr)))}function wr(t,e){var n={};return n[t.toLowerCase()]=e.toLowerCase(),n["Webkit"+t]="webkit"+e,n["Moz"+t]="moz"+e,n}var xr={animationend:wr("Animation","AnimationEnd"),animationiteration:wr("Animation","AnimationIteration"),animationstart:wr("Animation","AnimationStart"),transitionend:wr("Transition","TransitionEnd")},Sr={},kr={};function Cr(t){if(Sr[t])return Sr[t];if(!xr[t])return t;var e,n=xr[t];for(e in n)if(n.hasOwnProperty(e)&&e in kr)return Sr[t]=n[e];return t}u&&(kr=document.createElement("div").style,"AnimationEvent"in window||(delete xr.animationend.animation,delete xr.animationiteration.animation,delete xr.animationstart.animation),"TransitionEvent"in window||delete xr.transitionend.transition);var Tr=Cr("animationend"),Pr=Cr("animationiteration"),Er=Cr("animationstart"),Ar=Cr("transitionend"),Ir=new Map,Mr="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Fr(t,e){Ir.set(t,e),l(e,[t])}for(var Dr=0;Dr<Mr.length;Dr++){var Rr=Mr[Dr];Fr(Rr.toLowerCase(),"on"+(Rr[0].toUpperCase()+Rr.slice(1)))}Fr(Tr,"onAnimationEnd"),Fr(Pr,"onAnimationIteration"),Fr(Er,"onAnimationStart"),Fr("dblclick","onDoubleClick"),Fr("focusin","onFocus"),Fr("focusout","onBlur"),Fr(Ar,"onTransitionEnd"),c("onMouseEnter",["mouseout","mouseover"]),c("onMouseLeave",["mouseout","mouseover"]),c("onPointerEnter",["pointerout","pointerover"]),c("onPointerLeave",["pointerout","pointerover"]),l("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),l("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),l("onBeforeInput",["compositionend","keypress","textInput","paste"]),l("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),l("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),l("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Or="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Nr=new Set("cancel close invalid load scroll toggle".split(" ").concat(Or));function Lr(t,e,n){var r=t.type||"unknown-event";t.currentTarget=n,function(t,e,n,r,i,a,s,l,c){if(Ut.apply(this,arguments),Nt){if(!Nt)throw Error(o(198));var u=Lt;Nt=!1,Lt=null,Bt||(Bt=!0,zt=u)}}(r,e,void 0,t),t.currentTarget=null}function Br(t,e){e=0!==(4&e);for(var n=0;n<t.length;n++){var r=t[n],i=r.event;r=r.listeners;t:{var o=void 0;if(e)for(var a=r.length-1;0<=a;a--){var s=r[a],l=s.instance,c=s.currentTarget;if(s=s.listener,l!==o&&i.isPropagationStopped())break t;Lr(i,s,c),o=l}else for(a=0;a<r.length;a++){if(l=(s=r[a]).instance,c=s.currentTarget,s=s.listener,l!==o&&i.isPropagationStopped())break t;Lr(i,s,c),o=l}}}if(Bt)throw t=zt,Bt=!1,zt=null,t}function zr(t,e){var n=e[gi];void 0===n&&(n=e[gi]=new Set);var r=t+"__bubble";n.has(r)||($r(e,t,2,!1),n.add(r))}function jr(t,e,n){var r=0;e&&(r|=4),$r(n,t,r,e)}var Ur="_reactListening"+Math.random().toString(36).slice(2);function Vr(t){if(!t[Ur]){t[Ur]=!0,a.forEach((function(e){"selectionchange"!==e&&(Nr.has(e)||jr(e,!1,t),jr(e,!0,t))}));var e=9===t.nodeType?t:t.ownerDocument;null===e||e[Ur]||(e[Ur]=!0,jr("selectionchange",!1,e))}}function $r(t,e,n,r){switch(Xe(e)){case 1:var i=Ge;break;case 4:i=He;break;default:i=Ye}n=i.bind(null,e,n,t),i=void 0,!Dt||"touchstart"!==e&&"touchmove"!==e&&"wheel"!==e||(i=!0),r?void 0!==i?t.addEventListener(e,n,{capture:!0,passive:i}):t.addEventListener(e,n,!0):void 0!==i?t.addEventListener(e,n,{passive:i}):t.addEventListener(e,n,!1)}function Wr(t,e,n,r,i){var o=r;if(0===(1&e)&&0===(2&e)&&null!==r)t:for(;;){if(null===r)return;var a=r.tag;if(3===a||4===a){var s=r.stateNode.containerInfo;if(s===i||8===s.nodeType&&s.parentNode===i)break;if(4===a)for(a=r.return;null!==a;){var l=a.tag;if((3===l||4===l)&&((l=a.stateNode.containerInfo)===i||8===l.nodeType&&l.parentNode===i))return;a=a.return}for(;null!==s;){if(null===(a=bi(s)))return;if(5===(l=a.tag)||6===l){r=o=a;continue t}s=s.parentNode}}r=r.return}Mt((function(){var r=o,i=wt(n),a=[];t:{var s=Ir.get(t);if(void 0!==s){var l=un,c=t;switch(t){case"keypress":if(0===en(n))break t;case"keydown":case"keyup":l=Pn;break;case"focusin":c="focus",l=mn;break;case"focusout":c="blur",l=mn;break;case"beforeblur":case"afterblur":l=mn;break;case"click":if(2===n.button)break t;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":l=pn;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":l=gn;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":l=An;break;case Tr:case Pr:case Er:l=yn;break;case Ar:l=In;break;case"scroll":l=hn;break;case"wheel":l=Fn;break;case"copy":case"cut":case"paste":l=vn;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":l=En}var u=0!==(4&e),d=!u&&"scroll"===t,h=u?null!==s?s+"Capture":null:s;u=[];for(var f,p=r;null!==p;){var g=(f=p).stateNode;if(5===f.tag&&null!==g&&(f=g,null!==h&&(null!=(g=Ft(p,h))&&u.push(Gr(p,g,f)))),d)break;p=p.return}0<u.length&&(s=new l(s,c,null,n,i),a.push({event:s,listeners:u}))}}if(0===(7&e)){if(l="mouseout"===t||"pointerout"===t,(!(s="mouseover"===t||"pointerover"===t)||n===_t||!(c=n.relatedTarget||n.fromElement)||!bi(c)&&!c[pi])&&(l||s)&&(s=i.window===i?i:(s=i.ownerDocument)?s.defaultView||s.parentWindow:window,l?(l=r,null!==(c=(c=n.relatedTarget||n.toElement)?bi(c):null)&&(c!==(d=Vt(c))||5!==c.tag&&6!==c.tag)&&(c=null)):(l=null,c=r),l!==c)){if(u=pn,g="onMouseLeave",h="onMouseEnter",p="mouse","pointerout"!==t&&"pointerover"!==t||(u=En,g="onPointerLeave",h="onPointerEnter",p="pointer"),d=null==l?s:_i(l),f=null==c?s:_i(c),(s=new u(g,p+"leave",l,n,i)).target=d,s.relatedTarget=f,g=null,bi(i)===r&&((u=new u(h,p+"enter",c,n,i)).target=f,u.relatedTarget=d,g=u),d=g,l&&c)t:{for(h=c,p=0,f=u=l;f;f=Yr(f))p++;for(f=0,g=h;g;g=Yr(g))f++;for(;0<p-f;)u=Yr(u),p--;for(;0<f-p;)h=Yr(h),f--;for(;p--;){if(u===h||null!==h&&u===h.alternate)break t;u=Yr(u),h=Yr(h)}u=null}else u=null;null!==l&&qr(a,s,l,u,!1),null!==c&&null!==d&&qr(a,d,c,u,!0)}if("select"===(l=(s=r?_i(r):window).nodeName&&s.nodeName.toLowerCase())||"input"===l&&"file"===s.type)var m=Xn;else if(Wn(s))if(Qn)m=ar;else{m=ir;var y=rr}else(l=s.nodeName)&&"input"===l.toLowerCase()&&("checkbox"===s.type||"radio"===s.type)&&(m=or);switch(m&&(m=m(t,r))?Gn(a,m,n,i):(y&&y(t,s,r),"focusout"===t&&(y=s._wrapperState)&&y.controlled&&"number"===s.type&&tt(s,"number",s.value)),y=r?_i(r):window,t){case"focusin":(Wn(y)||"true"===y.contentEditable)&&(mr=y,yr=r,br=null);break;case"focusout":br=yr=mr=null;break;case"mousedown":vr=!0;break;case"contextmenu":case"mouseup":case"dragend":vr=!1,_r(a,n,i);break;case"selectionchange":if(gr)break;case"keydown":case"keyup":_r(a,n,i)}var b;if(Rn)t:{switch(t){case"compositionstart":var v="onCompositionStart";break t;case"compositionend":v="onCompositionEnd";break t;case"compositionupdate":v="onCompositionUpdate";break t}v=void 0}else Vn?jn(t,n)&&(v="onCompositionEnd"):"keydown"===t&&229===n.keyCode&&(v="onCompositionStart");v&&(Ln&&"ko"!==n.locale&&(Vn||"onCompositionStart"!==v?"onCompositionEnd"===v&&Vn&&(b=tn()):(Ze="value"in(Qe=i)?Qe.value:Qe.textContent,Vn=!0)),0<(y=Hr(r,v)).length&&(v=new _n(v,t,null,n,i),a.push({event:v,listeners:y}),b?v.data=b:null!==(b=Un(n))&&(v.data=b))),(b=Nn?function(t,e){switch(t){case"compositionend":return Un(e);case"keypress":return 32!==e.which?null:(zn=!0,Bn);case"textInput":return(t=e.data)===Bn&&zn?null:t;default:return null}}(t,n):function(t,e){if(Vn)return"compositionend"===t||!Rn&&jn(t,e)?(t=tn(),Je=Ze=Qe=null,Vn=!1,t):null;switch(t){case"paste":default:return null;case"keypress":if(!(e.ctrlKey||e.altKey||e.metaKey)||e.ctrlKey&&e.altKey){if(e.char&&1<e.char.length)return e.char;if(e.which)return String.fromCharCode(e.which)}return null;case"compositionend":return Ln&&"ko"!==e.locale?null:e.data}}(t,n))&&(0<(r=Hr(r,"onBeforeInput")).length&&(i=new _n("onBeforeInput","beforeinput",null,n,i),a.push({event:i,listeners:r}),i.data=b))}Br(a,e)}))}function Gr(t,e,n){return{instance:t,listener:e,currentTarget:n}}function Hr(t,e){for(var n=e+"Capture",r=[];null!==t;){var i=t,o=i.stateNode;5===i.tag&&null!==o&&(i=o,null!=(o=Ft(t,n))&&r.unshift(Gr(t,o,i)),null!=(o=Ft(t,e))&&r.push(Gr(t,o,i))),t=t.return}return r}function Yr(t){if(null===t)return null;do{t=t.return}while(t&&5!==t.tag);return t||null}function qr(t,e,n,r,i){for(var o=e._reactName,a=[];null!==n&&n!==r;){var s=n,l=s.alternate,c=s.stateNode;if(null!==l&&l===r)break;5===s.tag&&null!==c&&(s=c,i?null!=(l=Ft(n,o))&&a.unshift(Gr(n,l,s)):i||null!=(l=Ft(n,o))&&a.push(Gr(n,l,s))),n=n.return}0!==a.length&&t.push({event:e,listeners:a})}var Kr=/\r\n?/g,Xr=/\u0000|\uFFFD/g;function Qr(t){return("string"===typeof t?t:""+t).replace(Kr,"\n").replace(Xr,"")}function Zr(t,e,n){if(e=Qr(e),Qr(t)!==e&&n)throw Error(o(425))}function Jr(){}var ti=null,ei=null;function ni(t,e){return"textarea"===t||"noscript"===t||"string"===typeof e.children||"number"===typeof e.children||"object"===typeof e.dangerouslySetInnerHTML&&null!==e.dangerouslySetInnerHTML&&null!=e.dangerouslySetInnerHTML.__html}var ri="function"===typeof setTimeout?setTimeout:void 0,ii="function"===typeof clearTimeout?clearTimeout:void 0,oi="function"===typeof Promise?Promise:void 0,ai="function"===typeof queueMicrotask?queueMicrotask:"undefined"!==typeof oi?function(t){return oi.resolve(null).then(t).catch(si)}:ri;function si(t){setTimeout((function(){throw t}))}function li(t,e){var n=e,r=0;do{var i=n.nextSibling;if(t.removeChild(n),i&&8===i.nodeType)if("/$"===(n=i.data)){if(0===r)return t.removeChild(i),void Ve(e);r--}else"$"!==n&&"$?"!==n&&"$!"!==n||r++;n=i}while(n);Ve(e)}function ci(t){for(;null!=t;t=t.nextSibling){var e=t.nodeType;if(1===e||3===e)break;if(8===e){if("$"===(e=t.data)||"$!"===e||"$?"===e)break;if("/$"===e)return null}}return t}function ui(t){t=t.previousSibling;for(var e=0;t;){if(8===t.nodeType){var n=t.data;if("$"===n||"$!"===n||"$?"===n){if(0===e)return t;e--}else"/$"===n&&e++}t=t.previousSibling}return null}var di=Math.random().toString(36).slice(2),hi="__reactFiber$"+di,fi="__reactProps$"+di,pi="__reactContainer$"+di,gi="__reactEvents$"+di,mi="__reactListeners$"+di,yi="__reactHandles$"+di;function bi(t){var e=t[hi];if(e)return e;for(var n=t.parentNode;n;){if(e=n[pi]||n[hi]){if(n=e.alternate,null!==e.child||null!==n&&null!==n.child)for(t=ui(t);null!==t;){if(n=t[hi])return n;t=ui(t)}return e}n=(t=n).parentNode}return null}function vi(t){return!(t=t[hi]||t[pi])||5!==t.tag&&6!==t.tag&&13!==t.tag&&3!==t.tag?null:t}function _i(t){if(5===t.tag||6===t.tag)return t.stateNode;throw Error(o(33))}function wi(t){return t[fi]||null}var xi=[],Si=-1;function ki(t){return{current:t}}function Ci(t){0>Si||(t.current=xi[Si],xi[Si]=null,Si--)}function Ti(t,e){Si++,xi[Si]=t.current,t.current=e}var Pi={},Ei=ki(Pi),Ai=ki(!1),Ii=Pi;function Mi(t,e){var n=t.type.contextTypes;if(!n)return Pi;var r=t.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===e)return r.__reactInternalMemoizedMaskedChildContext;var i,o={};for(i in n)o[i]=e[i];return r&&((t=t.stateNode).__reactInternalMemoizedUnmaskedChildContext=e,t.__reactInternalMemoizedMaskedChildContext=o),o}function Fi(t){return null!==(t=t.childContextTypes)&&void 0!==t}function Di(){Ci(Ai),Ci(Ei)}function Ri(t,e,n){if(Ei.current!==Pi)throw Error(o(168));Ti(Ei,e),Ti(Ai,n)}function Oi(t,e,n){var r=t.stateNode;if(e=e.childContextTypes,"function"!==typeof r.getChildContext)return n;for(var i in r=r.getChildContext())if(!(i in e))throw Error(o(108,$(t)||"Unknown",i));return L({},n,r)}function Ni(t){return t=(t=t.stateNode)&&t.__reactInternalMemoizedMergedChildContext||Pi,Ii=Ei.current,Ti(Ei,t),Ti(Ai,Ai.current),!0}function Li(t,e,n){var r=t.stateNode;if(!r)throw Error(o(169));n?(t=Oi(t,e,Ii),r.__reactInternalMemoizedMergedChildContext=t,Ci(Ai),Ci(Ei),Ti(Ei,t)):Ci(Ai),Ti(Ai,n)}var Bi=null,zi=!1,ji=!1;function Ui(t){null===Bi?Bi=[t]:Bi.push(t)}function Vi(){if(!ji&&null!==Bi){ji=!0;var t=0,e=ve;try{var n=Bi;for(ve=1;t<n.length;t++){var r=n[t];do{r=r(!0)}while(null!==r)}Bi=null,zi=!1}catch(i){throw null!==Bi&&(Bi=Bi.slice(t+1)),Yt(Jt,Vi),i}finally{ve=e,ji=!1}}return null}var $i=[],Wi=0,Gi=null,Hi=0,Yi=[],qi=0,Ki=null,Xi=1,Qi="";function Zi(t,e){$i[Wi++]=Hi,$i[Wi++]=Gi,Gi=t,Hi=e}function Ji(t,e,n){Yi[qi++]=Xi,Yi[qi++]=Qi,Yi[qi++]=Ki,Ki=t;var r=Xi;t=Qi;var i=32-ae(r)-1;r&=~(1<<i),n+=1;var o=32-ae(e)+i;if(30<o){var a=i-i%5;o=(r&(1<<a)-1).toString(32),r>>=a,i-=a,Xi=1<<32-ae(e)+i|n<<i|r,Qi=o+t}else Xi=1<<o|n<<i|r,Qi=t}function to(t){null!==t.return&&(Zi(t,1),Ji(t,1,0))}function eo(t){for(;t===Gi;)Gi=$i[--Wi],$i[Wi]=null,Hi=$i[--Wi],$i[Wi]=null;for(;t===Ki;)Ki=Yi[--qi],Yi[qi]=null,Qi=Yi[--qi],Yi[qi]=null,Xi=Yi[--qi],Yi[qi]=null}var no=null,ro=null,io=!1,oo=null;function ao(t,e){var n=Mc(5,null,null,0);n.elementType="DELETED",n.stateNode=e,n.return=t,null===(e=t.deletions)?(t.deletions=[n],t.flags|=16):e.push(n)}function so(t,e){switch(t.tag){case 5:var n=t.type;return null!==(e=1!==e.nodeType||n.toLowerCase()!==e.nodeName.toLowerCase()?null:e)&&(t.stateNode=e,no=t,ro=ci(e.firstChild),!0);case 6:return null!==(e=""===t.pendingProps||3!==e.nodeType?null:e)&&(t.stateNode=e,no=t,ro=null,!0);case 13:return null!==(e=8!==e.nodeType?null:e)&&(n=null!==Ki?{id:Xi,overflow:Qi}:null,t.memoizedState={dehydrated:e,treeContext:n,retryLane:1073741824},(n=Mc(18,null,null,0)).stateNode=e,n.return=t,t.child=n,no=t,ro=null,!0);default:return!1}}function lo(t){return 0!==(1&t.mode)&&0===(128&t.flags)}function co(t){if(io){var e=ro;if(e){var n=e;if(!so(t,e)){if(lo(t))throw Error(o(418));e=ci(n.nextSibling);var r=no;e&&so(t,e)?ao(r,n):(t.flags=-4097&t.flags|2,io=!1,no=t)}}else{if(lo(t))throw Error(o(418));t.flags=-4097&t.flags|2,io=!1,no=t}}}function uo(t){for(t=t.return;null!==t&&5!==t.tag&&3!==t.tag&&13!==t.tag;)t=t.return;no=t}function ho(t){if(t!==no)return!1;if(!io)return uo(t),io=!0,!1;var e;if((e=3!==t.tag)&&!(e=5!==t.tag)&&(e="head"!==(e=t.type)&&"body"!==e&&!ni(t.type,t.memoizedProps)),e&&(e=ro)){if(lo(t))throw fo(),Error(o(418));for(;e;)ao(t,e),e=ci(e.nextSibling)}if(uo(t),13===t.tag){if(!(t=null!==(t=t.memoizedState)?t.dehydrated:null))throw Error(o(317));t:{for(t=t.nextSibling,e=0;t;){if(8===t.nodeType){var n=t.data;if("/$"===n){if(0===e){ro=ci(t.nextSibling);break t}e--}else"$"!==n&&"$!"!==n&&"$?"!==n||e++}t=t.nextSibling}ro=null}}else ro=no?ci(t.stateNode.nextSibling):null;return!0}function fo(){for(var t=ro;t;)t=ci(t.nextSibling)}function po(){ro=no=null,io=!1}function go(t){null===oo?oo=[t]:oo.push(t)}var mo=_.ReactCurrentBatchConfig;function yo(t,e,n){if(null!==(t=n.ref)&&"function"!==typeof t&&"object"!==typeof t){if(n._owner){if(n=n._owner){if(1!==n.tag)throw Error(o(309));var r=n.stateNode}if(!r)throw Error(o(147,t));var i=r,a=""+t;return null!==e&&null!==e.ref&&"function"===typeof e.ref&&e.ref._stringRef===a?e.ref:(e=function(t){var e=i.refs;null===t?delete e[a]:e[a]=t},e._stringRef=a,e)}if("string"!==typeof t)throw Error(o(284));if(!n._owner)throw Error(o(290,t))}return t}function bo(t,e){throw t=Object.prototype.toString.call(e),Error(o(31,"[object Object]"===t?"object with keys {"+Object.keys(e).join(", ")+"}":t))}function vo(t){return(0,t._init)(t._payload)}function _o(t){function e(e,n){if(t){var r=e.deletions;null===r?(e.deletions=[n],e.flags|=16):r.push(n)}}function n(n,r){if(!t)return null;for(;null!==r;)e(n,r),r=r.sibling;return null}function r(t,e){for(t=new Map;null!==e;)null!==e.key?t.set(e.key,e):t.set(e.index,e),e=e.sibling;return t}function i(t,e){return(t=Dc(t,e)).index=0,t.sibling=null,t}function a(e,n,r){return e.index=r,t?null!==(r=e.alternate)?(r=r.index)<n?(e.flags|=2,n):r:(e.flags|=2,n):(e.flags|=1048576,n)}function s(e){return t&&null===e.alternate&&(e.flags|=2),e}function l(t,e,n,r){return null===e||6!==e.tag?((e=Lc(n,t.mode,r)).return=t,e):((e=i(e,n)).return=t,e)}function c(t,e,n,r){var o=n.type;return o===S?d(t,e,n.props.children,r,n.key):null!==e&&(e.elementType===o||"object"===typeof o&&null!==o&&o.$$typeof===F&&vo(o)===e.type)?((r=i(e,n.props)).ref=yo(t,e,n),r.return=t,r):((r=Rc(n.type,n.key,n.props,null,t.mode,r)).ref=yo(t,e,n),r.return=t,r)}function u(t,e,n,r){return null===e||4!==e.tag||e.stateNode.containerInfo!==n.containerInfo||e.stateNode.implementation!==n.implementation?((e=Bc(n,t.mode,r)).return=t,e):((e=i(e,n.children||[])).return=t,e)}function d(t,e,n,r,o){return null===e||7!==e.tag?((e=Oc(n,t.mode,r,o)).return=t,e):((e=i(e,n)).return=t,e)}function h(t,e,n){if("string"===typeof e&&""!==e||"number"===typeof e)return(e=Lc(""+e,t.mode,n)).return=t,e;if("object"===typeof e&&null!==e){switch(e.$$typeof){case w:return(n=Rc(e.type,e.key,e.props,null,t.mode,n)).ref=yo(t,null,e),n.return=t,n;case x:return(e=Bc(e,t.mode,n)).return=t,e;case F:return h(t,(0,e._init)(e._payload),n)}if(et(e)||O(e))return(e=Oc(e,t.mode,n,null)).return=t,e;bo(t,e)}return null}function f(t,e,n,r){var i=null!==e?e.key:null;if("string"===typeof n&&""!==n||"number"===typeof n)return null!==i?null:l(t,e,""+n,r);if("object"===typeof n&&null!==n){switch(n.$$typeof){case w:return n.key===i?c(t,e,n,r):null;case x:return n.key===i?u(t,e,n,r):null;case F:return f(t,e,(i=n._init)(n._payload),r)}if(et(n)||O(n))return null!==i?null:d(t,e,n,r,null);bo(t,n)}return null}function p(t,e,n,r,i){if("string"===typeof r&&""!==r||"number"===typeof r)return l(e,t=t.get(n)||null,""+r,i);if("object"===typeof r&&null!==r){switch(r.$$typeof){case w:return c(e,t=t.get(null===r.key?n:r.key)||null,r,i);case x:return u(e,t=t.get(null===r.key?n:r.key)||null,r,i);case F:return p(t,e,n,(0,r._init)(r._payload),i)}if(et(r)||O(r))return d(e,t=t.get(n)||null,r,i,null);bo(e,r)}return null}function g(i,o,s,l){for(var c=null,u=null,d=o,g=o=0,m=null;null!==d&&g<s.length;g++){d.index>g?(m=d,d=null):m=d.sibling;var y=f(i,d,s[g],l);if(null===y){null===d&&(d=m);break}t&&d&&null===y.alternate&&e(i,d),o=a(y,o,g),null===u?c=y:u.sibling=y,u=y,d=m}if(g===s.length)return n(i,d),io&&Zi(i,g),c;if(null===d){for(;g<s.length;g++)null!==(d=h(i,s[g],l))&&(o=a(d,o,g),null===u?c=d:u.sibling=d,u=d);return io&&Zi(i,g),c}for(d=r(i,d);g<s.length;g++)null!==(m=p(d,i,g,s[g],l))&&(t&&null!==m.alternate&&d.delete(null===m.key?g:m.key),o=a(m,o,g),null===u?c=m:u.sibling=m,u=m);return t&&d.forEach((function(t){return e(i,t)})),io&&Zi(i,g),c}function m(i,s,l,c){var u=O(l);if("function"!==typeof u)throw Error(o(150));if(null==(l=u.call(l)))throw Error(o(151));for(var d=u=null,g=s,m=s=0,y=null,b=l.next();null!==g&&!b.done;m++,b=l.next()){g.index>m?(y=g,g=null):y=g.sibling;var v=f(i,g,b.value,c);if(null===v){null===g&&(g=y);break}t&&g&&null===v.alternate&&e(i,g),s=a(v,s,m),null===d?u=v:d.sibling=v,d=v,g=y}if(b.done)return n(i,g),io&&Zi(i,m),u;if(null===g){for(;!b.done;m++,b=l.next())null!==(b=h(i,b.value,c))&&(s=a(b,s,m),null===d?u=b:d.sibling=b,d=b);return io&&Zi(i,m),u}for(g=r(i,g);!b.done;m++,b=l.next())null!==(b=p(g,i,m,b.value,c))&&(t&&null!==b.alternate&&g.delete(null===b.key?m:b.key),s=a(b,s,m),null===d?u=b:d.sibling=b,d=b);return t&&g.forEach((function(t){return e(i,t)})),io&&Zi(i,m),u}return function t(r,o,a,l){if("object"===typeof a&&null!==a&&a.type===S&&null===a.key&&(a=a.props.children),"object"===typeof a&&null!==a){switch(a.$$typeof){case w:t:{for(var c=a.key,u=o;null!==u;){if(u.key===c){if((c=a.type)===S){if(7===u.tag){n(r,u.sibling),(o=i(u,a.props.children)).return=r,r=o;break t}}else if(u.elementType===c||"object"===typeof c&&null!==c&&c.$$typeof===F&&vo(c)===u.type){n(r,u.sibling),(o=i(u,a.props)).ref=yo(r,u,a),o.return=r,r=o;break t}n(r,u);break}e(r,u),u=u.sibling}a.type===S?((o=Oc(a.props.children,r.mode,l,a.key)).return=r,r=o):((l=Rc(a.type,a.key,a.props,null,r.mode,l)).ref=yo(r,o,a),l.return=r,r=l)}return s(r);case x:t:{for(u=a.key;null!==o;){if(o.key===u){if(4===o.tag&&o.stateNode.containerInfo===a.containerInfo&&o.stateNode.implementation===a.implementation){n(r,o.sibling),(o=i(o,a.children||[])).return=r,r=o;break t}n(r,o);break}e(r,o),o=o.sibling}(o=Bc(a,r.mode,l)).return=r,r=o}return s(r);case F:return t(r,o,(u=a._init)(a._payload),l)}if(et(a))return g(r,o,a,l);if(O(a))return m(r,o,a,l);bo(r,a)}return"string"===typeof a&&""!==a||"number"===typeof a?(a=""+a,null!==o&&6===o.tag?(n(r,o.sibling),(o=i(o,a)).return=r,r=o):(n(r,o),(o=Lc(a,r.mode,l)).return=r,r=o),s(r)):n(r,o)}}var wo=_o(!0),xo=_o(!1),So=ki(null),ko=null,Co=null,To=null;function Po(){To=Co=ko=null}function Eo(t){var e=So.current;Ci(So),t._currentValue=e}function Ao(t,e,n){for(;null!==t;){var r=t.alternate;if((t.childLanes&e)!==e?(t.childLanes|=e,null!==r&&(r.childLanes|=e)):null!==r&&(r.childLanes&e)!==e&&(r.childLanes|=e),t===n)break;t=t.return}}function Io(t,e){ko=t,To=Co=null,null!==(t=t.dependencies)&&null!==t.firstContext&&(0!==(t.lanes&e)&&(vs=!0),t.firstContext=null)}function Mo(t){var e=t._currentValue;if(To!==t)if(t={context:t,memoizedValue:e,next:null},null===Co){if(null===ko)throw Error(o(308));Co=t,ko.dependencies={lanes:0,firstContext:t}}else Co=Co.next=t;return e}var Fo=null;function Do(t){null===Fo?Fo=[t]:Fo.push(t)}function Ro(t,e,n,r){var i=e.interleaved;return null===i?(n.next=n,Do(e)):(n.next=i.next,i.next=n),e.interleaved=n,Oo(t,r)}function Oo(t,e){t.lanes|=e;var n=t.alternate;for(null!==n&&(n.lanes|=e),n=t,t=t.return;null!==t;)t.childLanes|=e,null!==(n=t.alternate)&&(n.childLanes|=e),n=t,t=t.return;return 3===n.tag?n.stateNode:null}var No=!1;function Lo(t){t.updateQueue={baseState:t.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function Bo(t,e){t=t.updateQueue,e.updateQueue===t&&(e.updateQueue={baseState:t.baseState,firstBaseUpdate:t.firstBaseUpdate,lastBaseUpdate:t.lastBaseUpdate,shared:t.shared,effects:t.effects})}function zo(t,e){return{eventTime:t,lane:e,tag:0,payload:null,callback:null,next:null}}function jo(t,e,n){var r=t.updateQueue;if(null===r)return null;if(r=r.shared,0!==(2&El)){var i=r.pending;return null===i?e.next=e:(e.next=i.next,i.next=e),r.pending=e,Oo(t,n)}return null===(i=r.interleaved)?(e.next=e,Do(r)):(e.next=i.next,i.next=e),r.interleaved=e,Oo(t,n)}function Uo(t,e,n){if(null!==(e=e.updateQueue)&&(e=e.shared,0!==(4194240&n))){var r=e.lanes;n|=r&=t.pendingLanes,e.lanes=n,be(t,n)}}function Vo(t,e){var n=t.updateQueue,r=t.alternate;if(null!==r&&n===(r=r.updateQueue)){var i=null,o=null;if(null!==(n=n.firstBaseUpdate)){do{var a={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};null===o?i=o=a:o=o.next=a,n=n.next}while(null!==n);null===o?i=o=e:o=o.next=e}else i=o=e;return n={baseState:r.baseState,firstBaseUpdate:i,lastBaseUpdate:o,shared:r.shared,effects:r.effects},void(t.updateQueue=n)}null===(t=n.lastBaseUpdate)?n.firstBaseUpdate=e:t.next=e,n.lastBaseUpdate=e}function $o(t,e,n,r){var i=t.updateQueue;No=!1;var o=i.firstBaseUpdate,a=i.lastBaseUpdate,s=i.shared.pending;if(null!==s){i.shared.pending=null;var l=s,c=l.next;l.next=null,null===a?o=c:a.next=c,a=l;var u=t.alternate;null!==u&&((s=(u=u.updateQueue).lastBaseUpdate)!==a&&(null===s?u.firstBaseUpdate=c:s.next=c,u.lastBaseUpdate=l))}if(null!==o){var d=i.baseState;for(a=0,u=c=l=null,s=o;;){var h=s.lane,f=s.eventTime;if((r&h)===h){null!==u&&(u=u.next={eventTime:f,lane:0,tag:s.tag,payload:s.payload,callback:s.callback,next:null});t:{var p=t,g=s;switch(h=e,f=n,g.tag){case 1:if("function"===typeof(p=g.payload)){d=p.call(f,d,h);break t}d=p;break t;case 3:p.flags=-65537&p.flags|128;case 0:if(null===(h="function"===typeof(p=g.payload)?p.call(f,d,h):p)||void 0===h)break t;d=L({},d,h);break t;case 2:No=!0}}null!==s.callback&&0!==s.lane&&(t.flags|=64,null===(h=i.effects)?i.effects=[s]:h.push(s))}else f={eventTime:f,lane:h,tag:s.tag,payload:s.payload,callback:s.callback,next:null},null===u?(c=u=f,l=d):u=u.next=f,a|=h;if(null===(s=s.next)){if(null===(s=i.shared.pending))break;s=(h=s).next,h.next=null,i.lastBaseUpdate=h,i.shared.pending=null}}if(null===u&&(l=d),i.baseState=l,i.firstBaseUpdate=c,i.lastBaseUpdate=u,null!==(e=i.shared.interleaved)){i=e;do{a|=i.lane,i=i.next}while(i!==e)}else null===o&&(i.shared.lanes=0);Nl|=a,t.lanes=a,t.memoizedState=d}}function Wo(t,e,n){if(t=e.effects,e.effects=null,null!==t)for(e=0;e<t.length;e++){var r=t[e],i=r.callback;if(null!==i){if(r.callback=null,r=n,"function"!==typeof i)throw Error(o(191,i));i.call(r)}}}var Go={},Ho=ki(Go),Yo=ki(Go),qo=ki(Go);function Ko(t){if(t===Go)throw Error(o(174));return t}function Xo(t,e){switch(Ti(qo,e),Ti(Yo,t),Ti(Ho,Go),t=e.nodeType){case 9:case 11:e=(e=e.documentElement)?e.namespaceURI:lt(null,"");break;default:e=lt(e=(t=8===t?e.parentNode:e).namespaceURI||null,t=t.tagName)}Ci(Ho),Ti(Ho,e)}function Qo(){Ci(Ho),Ci(Yo),Ci(qo)}function Zo(t){Ko(qo.current);var e=Ko(Ho.current),n=lt(e,t.type);e!==n&&(Ti(Yo,t),Ti(Ho,n))}function Jo(t){Yo.current===t&&(Ci(Ho),Ci(Yo))}var ta=ki(0);function ea(t){for(var e=t;null!==e;){if(13===e.tag){var n=e.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||"$?"===n.data||"$!"===n.data))return e}else if(19===e.tag&&void 0!==e.memoizedProps.revealOrder){if(0!==(128&e.flags))return e}else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break;for(;null===e.sibling;){if(null===e.return||e.return===t)return null;e=e.return}e.sibling.return=e.return,e=e.sibling}return null}var na=[];function ra(){for(var t=0;t<na.length;t++)na[t]._workInProgressVersionPrimary=null;na.length=0}var ia=_.ReactCurrentDispatcher,oa=_.ReactCurrentBatchConfig,aa=0,sa=null,la=null,ca=null,ua=!1,da=!1,ha=0,fa=0;function pa(){throw Error(o(321))}function ga(t,e){if(null===e)return!1;for(var n=0;n<e.length&&n<t.length;n++)if(!sr(t[n],e[n]))return!1;return!0}function ma(t,e,n,r,i,a){if(aa=a,sa=e,e.memoizedState=null,e.updateQueue=null,e.lanes=0,ia.current=null===t||null===t.memoizedState?Ja:ts,t=n(r,i),da){a=0;do{if(da=!1,ha=0,25<=a)throw Error(o(301));a+=1,ca=la=null,e.updateQueue=null,ia.current=es,t=n(r,i)}while(da)}if(ia.current=Za,e=null!==la&&null!==la.next,aa=0,ca=la=sa=null,ua=!1,e)throw Error(o(300));return t}function ya(){var t=0!==ha;return ha=0,t}function ba(){var t={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===ca?sa.memoizedState=ca=t:ca=ca.next=t,ca}function va(){if(null===la){var t=sa.alternate;t=null!==t?t.memoizedState:null}else t=la.next;var e=null===ca?sa.memoizedState:ca.next;if(null!==e)ca=e,la=t;else{if(null===t)throw Error(o(310));t={memoizedState:(la=t).memoizedState,baseState:la.baseState,baseQueue:la.baseQueue,queue:la.queue,next:null},null===ca?sa.memoizedState=ca=t:ca=ca.next=t}return ca}function _a(t,e){return"function"===typeof e?e(t):e}function wa(t){var e=va(),n=e.queue;if(null===n)throw Error(o(311));n.lastRenderedReducer=t;var r=la,i=r.baseQueue,a=n.pending;if(null!==a){if(null!==i){var s=i.next;i.next=a.next,a.next=s}r.baseQueue=i=a,n.pending=null}if(null!==i){a=i.next,r=r.baseState;var l=s=null,c=null,u=a;do{var d=u.lane;if((aa&d)===d)null!==c&&(c=c.next={lane:0,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null}),r=u.hasEagerState?u.eagerState:t(r,u.action);else{var h={lane:d,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null};null===c?(l=c=h,s=r):c=c.next=h,sa.lanes|=d,Nl|=d}u=u.next}while(null!==u&&u!==a);null===c?s=r:c.next=l,sr(r,e.memoizedState)||(vs=!0),e.memoizedState=r,e.baseState=s,e.baseQueue=c,n.lastRenderedState=r}if(null!==(t=n.interleaved)){i=t;do{a=i.lane,sa.lanes|=a,Nl|=a,i=i.next}while(i!==t)}else null===i&&(n.lanes=0);return[e.memoizedState,n.dispatch]}function xa(t){var e=va(),n=e.queue;if(null===n)throw Error(o(311));n.lastRenderedReducer=t;var r=n.dispatch,i=n.pending,a=e.memoizedState;if(null!==i){n.pending=null;var s=i=i.next;do{a=t(a,s.action),s=s.next}while(s!==i);sr(a,e.memoizedState)||(vs=!0),e.memoizedState=a,null===e.baseQueue&&(e.baseState=a),n.lastRenderedState=a}return[a,r]}function Sa(){}function ka(t,e){var n=sa,r=va(),i=e(),a=!sr(r.memoizedState,i);if(a&&(r.memoizedState=i,vs=!0),r=r.queue,Na(Pa.bind(null,n,r,t),[t]),r.getSnapshot!==e||a||null!==ca&&1&ca.memoizedState.tag){if(n.flags|=2048,Ma(9,Ta.bind(null,n,r,i,e),void 0,null),null===Al)throw Error(o(349));0!==(30&aa)||Ca(n,e,i)}return i}function Ca(t,e,n){t.flags|=16384,t={getSnapshot:e,value:n},null===(e=sa.updateQueue)?(e={lastEffect:null,stores:null},sa.updateQueue=e,e.stores=[t]):null===(n=e.stores)?e.stores=[t]:n.push(t)}function Ta(t,e,n,r){e.value=n,e.getSnapshot=r,Ea(e)&&Aa(t)}function Pa(t,e,n){return n((function(){Ea(e)&&Aa(t)}))}function Ea(t){var e=t.getSnapshot;t=t.value;try{var n=e();return!sr(t,n)}catch(r){return!0}}function Aa(t){var e=Oo(t,1);null!==e&&nc(e,t,1,-1)}function Ia(t){var e=ba();return"function"===typeof t&&(t=t()),e.memoizedState=e.baseState=t,t={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:_a,lastRenderedState:t},e.queue=t,t=t.dispatch=qa.bind(null,sa,t),[e.memoizedState,t]}function Ma(t,e,n,r){return t={tag:t,create:e,destroy:n,deps:r,next:null},null===(e=sa.updateQueue)?(e={lastEffect:null,stores:null},sa.updateQueue=e,e.lastEffect=t.next=t):null===(n=e.lastEffect)?e.lastEffect=t.next=t:(r=n.next,n.next=t,t.next=r,e.lastEffect=t),t}function Fa(){return va().memoizedState}function Da(t,e,n,r){var i=ba();sa.flags|=t,i.memoizedState=Ma(1|e,n,void 0,void 0===r?null:r)}function Ra(t,e,n,r){var i=va();r=void 0===r?null:r;var o=void 0;if(null!==la){var a=la.memoizedState;if(o=a.destroy,null!==r&&ga(r,a.deps))return void(i.memoizedState=Ma(e,n,o,r))}sa.flags|=t,i.memoizedState=Ma(1|e,n,o,r)}function Oa(t,e){return Da(8390656,8,t,e)}function Na(t,e){return Ra(2048,8,t,e)}function La(t,e){return Ra(4,2,t,e)}function Ba(t,e){return Ra(4,4,t,e)}function za(t,e){return"function"===typeof e?(t=t(),e(t),function(){e(null)}):null!==e&&void 0!==e?(t=t(),e.current=t,function(){e.current=null}):void 0}function ja(t,e,n){return n=null!==n&&void 0!==n?n.concat([t]):null,Ra(4,4,za.bind(null,e,t),n)}function Ua(){}function Va(t,e){var n=va();e=void 0===e?null:e;var r=n.memoizedState;return null!==r&&null!==e&&ga(e,r[1])?r[0]:(n.memoizedState=[t,e],t)}function $a(t,e){var n=va();e=void 0===e?null:e;var r=n.memoizedState;return null!==r&&null!==e&&ga(e,r[1])?r[0]:(t=t(),n.memoizedState=[t,e],t)}function Wa(t,e,n){return 0===(21&aa)?(t.baseState&&(t.baseState=!1,vs=!0),t.memoizedState=n):(sr(n,e)||(n=ge(),sa.lanes|=n,Nl|=n,t.baseState=!0),e)}function Ga(t,e){var n=ve;ve=0!==n&&4>n?n:4,t(!0);var r=oa.transition;oa.transition={};try{t(!1),e()}finally{ve=n,oa.transition=r}}function Ha(){return va().memoizedState}function Ya(t,e,n){var r=ec(t);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},Ka(t))Xa(e,n);else if(null!==(n=Ro(t,e,n,r))){nc(n,t,r,tc()),Qa(n,e,r)}}function qa(t,e,n){var r=ec(t),i={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(Ka(t))Xa(e,i);else{var o=t.alternate;if(0===t.lanes&&(null===o||0===o.lanes)&&null!==(o=e.lastRenderedReducer))try{var a=e.lastRenderedState,s=o(a,n);if(i.hasEagerState=!0,i.eagerState=s,sr(s,a)){var l=e.interleaved;return null===l?(i.next=i,Do(e)):(i.next=l.next,l.next=i),void(e.interleaved=i)}}catch(c){}null!==(n=Ro(t,e,i,r))&&(nc(n,t,r,i=tc()),Qa(n,e,r))}}function Ka(t){var e=t.alternate;return t===sa||null!==e&&e===sa}function Xa(t,e){da=ua=!0;var n=t.pending;null===n?e.next=e:(e.next=n.next,n.next=e),t.pending=e}function Qa(t,e,n){if(0!==(4194240&n)){var r=e.lanes;n|=r&=t.pendingLanes,e.lanes=n,be(t,n)}}var Za={readContext:Mo,useCallback:pa,useContext:pa,useEffect:pa,useImperativeHandle:pa,useInsertionEffect:pa,useLayoutEffect:pa,useMemo:pa,useReducer:pa,useRef:pa,useState:pa,useDebugValue:pa,useDeferredValue:pa,useTransition:pa,useMutableSource:pa,useSyncExternalStore:pa,useId:pa,unstable_isNewReconciler:!1},Ja={readContext:Mo,useCallback:function(t,e){return ba().memoizedState=[t,void 0===e?null:e],t},useContext:Mo,useEffect:Oa,useImperativeHandle:function(t,e,n){return n=null!==n&&void 0!==n?n.concat([t]):null,Da(4194308,4,za.bind(null,e,t),n)},useLayoutEffect:function(t,e){return Da(4194308,4,t,e)},useInsertionEffect:function(t,e){return Da(4,2,t,e)},useMemo:function(t,e){var n=ba();return e=void 0===e?null:e,t=t(),n.memoizedState=[t,e],t},useReducer:function(t,e,n){var r=ba();return e=void 0!==n?n(e):e,r.memoizedState=r.baseState=e,t={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:t,lastRenderedState:e},r.queue=t,t=t.dispatch=Ya.bind(null,sa,t),[r.memoizedState,t]},useRef:function(t){return t={current:t},ba().memoizedState=t},useState:Ia,useDebugValue:Ua,useDeferredValue:function(t){return ba().memoizedState=t},useTransition:function(){var t=Ia(!1),e=t[0];return t=Ga.bind(null,t[1]),ba().memoizedState=t,[e,t]},useMutableSource:function(){},useSyncExternalStore:function(t,e,n){var r=sa,i=ba();if(io){if(void 0===n)throw Error(o(407));n=n()}else{if(n=e(),null===Al)throw Error(o(349));0!==(30&aa)||Ca(r,e,n)}i.memoizedState=n;var a={value:n,getSnapshot:e};return i.queue=a,Oa(Pa.bind(null,r,a,t),[t]),r.flags|=2048,Ma(9,Ta.bind(null,r,a,n,e),void 0,null),n},useId:function(){var t=ba(),e=Al.identifierPrefix;if(io){var n=Qi;e=":"+e+"R"+(n=(Xi&~(1<<32-ae(Xi)-1)).toString(32)+n),0<(n=ha++)&&(e+="H"+n.toString(32)),e+=":"}else e=":"+e+"r"+(n=fa++).toString(32)+":";return t.memoizedState=e},unstable_isNewReconciler:!1},ts={readContext:Mo,useCallback:Va,useContext:Mo,useEffect:Na,useImperativeHandle:ja,useInsertionEffect:La,useLayoutEffect:Ba,useMemo:$a,useReducer:wa,useRef:Fa,useState:function(){return wa(_a)},useDebugValue:Ua,useDeferredValue:function(t){return Wa(va(),la.memoizedState,t)},useTransition:function(){return[wa(_a)[0],va().memoizedState]},useMutableSource:Sa,useSyncExternalStore:ka,useId:Ha,unstable_isNewReconciler:!1},es={readContext:Mo,useCallback:Va,useContext:Mo,useEffect:Na,useImperativeHandle:ja,useInsertionEffect:La,useLayoutEffect:Ba,useMemo:$a,useReducer:xa,useRef:Fa,useState:function(){return xa(_a)},useDebugValue:Ua,useDeferredValue:function(t){var e=va();return null===la?e.memoizedState=t:Wa(e,la.memoizedState,t)},useTransition:function(){return[xa(_a)[0],va().memoizedState]},useMutableSource:Sa,useSyncExternalStore:ka,useId:Ha,unstable_isNewReconciler:!1};function ns(t,e){if(t&&t.defaultProps){for(var n in e=L({},e),t=t.defaultProps)void 0===e[n]&&(e[n]=t[n]);return e}return e}function rs(t,e,n,r){n=null===(n=n(r,e=t.memoizedState))||void 0===n?e:L({},e,n),t.memoizedState=n,0===t.lanes&&(t.updateQueue.baseState=n)}var is={isMounted:function(t){return!!(t=t._reactInternals)&&Vt(t)===t},enqueueSetState:function(t,e,n){t=t._reactInternals;var r=tc(),i=ec(t),o=zo(r,i);o.payload=e,void 0!==n&&null!==n&&(o.callback=n),null!==(e=jo(t,o,i))&&(nc(e,t,i,r),Uo(e,t,i))},enqueueReplaceState:function(t,e,n){t=t._reactInternals;var r=tc(),i=ec(t),o=zo(r,i);o.tag=1,o.payload=e,void 0!==n&&null!==n&&(o.callback=n),null!==(e=jo(t,o,i))&&(nc(e,t,i,r),Uo(e,t,i))},enqueueForceUpdate:function(t,e){t=t._reactInternals;var n=tc(),r=ec(t),i=zo(n,r);i.tag=2,void 0!==e&&null!==e&&(i.callback=e),null!==(e=jo(t,i,r))&&(nc(e,t,r,n),Uo(e,t,r))}};function os(t,e,n,r,i,o,a){return"function"===typeof(t=t.stateNode).shouldComponentUpdate?t.shouldComponentUpdate(r,o,a):!e.prototype||!e.prototype.isPureReactComponent||(!lr(n,r)||!lr(i,o))}function as(t,e,n){var r=!1,i=Pi,o=e.contextType;return"object"===typeof o&&null!==o?o=Mo(o):(i=Fi(e)?Ii:Ei.current,o=(r=null!==(r=e.contextTypes)&&void 0!==r)?Mi(t,i):Pi),e=new e(n,o),t.memoizedState=null!==e.state&&void 0!==e.state?e.state:null,e.updater=is,t.stateNode=e,e._reactInternals=t,r&&((t=t.stateNode).__reactInternalMemoizedUnmaskedChildContext=i,t.__reactInternalMemoizedMaskedChildContext=o),e}function ss(t,e,n,r){t=e.state,"function"===typeof e.componentWillReceiveProps&&e.componentWillReceiveProps(n,r),"function"===typeof e.UNSAFE_componentWillReceiveProps&&e.UNSAFE_componentWillReceiveProps(n,r),e.state!==t&&is.enqueueReplaceState(e,e.state,null)}function ls(t,e,n,r){var i=t.stateNode;i.props=n,i.state=t.memoizedState,i.refs={},Lo(t);var o=e.contextType;"object"===typeof o&&null!==o?i.context=Mo(o):(o=Fi(e)?Ii:Ei.current,i.context=Mi(t,o)),i.state=t.memoizedState,"function"===typeof(o=e.getDerivedStateFromProps)&&(rs(t,e,o,n),i.state=t.memoizedState),"function"===typeof e.getDerivedStateFromProps||"function"===typeof i.getSnapshotBeforeUpdate||"function"!==typeof i.UNSAFE_componentWillMount&&"function"!==typeof i.componentWillMount||(e=i.state,"function"===typeof i.componentWillMount&&i.componentWillMount(),"function"===typeof i.UNSAFE_componentWillMount&&i.UNSAFE_componentWillMount(),e!==i.state&&is.enqueueReplaceState(i,i.state,null),$o(t,n,i,r),i.state=t.memoizedState),"function"===typeof i.componentDidMount&&(t.flags|=4194308)}function cs(t,e){try{var n="",r=e;do{n+=U(r),r=r.return}while(r);var i=n}catch(o){i="\nError generating stack: "+o.message+"\n"+o.stack}return{value:t,source:e,stack:i,digest:null}}function us(t,e,n){return{value:t,source:null,stack:null!=n?n:null,digest:null!=e?e:null}}function ds(t,e){try{console.error(e.value)}catch(n){setTimeout((function(){throw n}))}}var hs="function"===typeof WeakMap?WeakMap:Map;function fs(t,e,n){(n=zo(-1,n)).tag=3,n.payload={element:null};var r=e.value;return n.callback=function(){Wl||(Wl=!0,Gl=r),ds(0,e)},n}function ps(t,e,n){(n=zo(-1,n)).tag=3;var r=t.type.getDerivedStateFromError;if("function"===typeof r){var i=e.value;n.payload=function(){return r(i)},n.callback=function(){ds(0,e)}}var o=t.stateNode;return null!==o&&"function"===typeof o.componentDidCatch&&(n.callback=function(){ds(0,e),"function"!==typeof r&&(null===Hl?Hl=new Set([this]):Hl.add(this));var t=e.stack;this.componentDidCatch(e.value,{componentStack:null!==t?t:""})}),n}function gs(t,e,n){var r=t.pingCache;if(null===r){r=t.pingCache=new hs;var i=new Set;r.set(e,i)}else void 0===(i=r.get(e))&&(i=new Set,r.set(e,i));i.has(n)||(i.add(n),t=Cc.bind(null,t,e,n),e.then(t,t))}function ms(t){do{var e;if((e=13===t.tag)&&(e=null===(e=t.memoizedState)||null!==e.dehydrated),e)return t;t=t.return}while(null!==t);return null}function ys(t,e,n,r,i){return 0===(1&t.mode)?(t===e?t.flags|=65536:(t.flags|=128,n.flags|=131072,n.flags&=-52805,1===n.tag&&(null===n.alternate?n.tag=17:((e=zo(-1,1)).tag=2,jo(n,e,1))),n.lanes|=1),t):(t.flags|=65536,t.lanes=i,t)}var bs=_.ReactCurrentOwner,vs=!1;function _s(t,e,n,r){e.child=null===t?xo(e,null,n,r):wo(e,t.child,n,r)}function ws(t,e,n,r,i){n=n.render;var o=e.ref;return Io(e,i),r=ma(t,e,n,r,o,i),n=ya(),null===t||vs?(io&&n&&to(e),e.flags|=1,_s(t,e,r,i),e.child):(e.updateQueue=t.updateQueue,e.flags&=-2053,t.lanes&=~i,Ws(t,e,i))}function xs(t,e,n,r,i){if(null===t){var o=n.type;return"function"!==typeof o||Fc(o)||void 0!==o.defaultProps||null!==n.compare||void 0!==n.defaultProps?((t=Rc(n.type,null,r,e,e.mode,i)).ref=e.ref,t.return=e,e.child=t):(e.tag=15,e.type=o,Ss(t,e,o,r,i))}if(o=t.child,0===(t.lanes&i)){var a=o.memoizedProps;if((n=null!==(n=n.compare)?n:lr)(a,r)&&t.ref===e.ref)return Ws(t,e,i)}return e.flags|=1,(t=Dc(o,r)).ref=e.ref,t.return=e,e.child=t}function Ss(t,e,n,r,i){if(null!==t){var o=t.memoizedProps;if(lr(o,r)&&t.ref===e.ref){if(vs=!1,e.pendingProps=r=o,0===(t.lanes&i))return e.lanes=t.lanes,Ws(t,e,i);0!==(131072&t.flags)&&(vs=!0)}}return Ts(t,e,n,r,i)}function ks(t,e,n){var r=e.pendingProps,i=r.children,o=null!==t?t.memoizedState:null;if("hidden"===r.mode)if(0===(1&e.mode))e.memoizedState={baseLanes:0,cachePool:null,transitions:null},Ti(Dl,Fl),Fl|=n;else{if(0===(1073741824&n))return t=null!==o?o.baseLanes|n:n,e.lanes=e.childLanes=1073741824,e.memoizedState={baseLanes:t,cachePool:null,transitions:null},e.updateQueue=null,Ti(Dl,Fl),Fl|=t,null;e.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=null!==o?o.baseLanes:n,Ti(Dl,Fl),Fl|=r}else null!==o?(r=o.baseLanes|n,e.memoizedState=null):r=n,Ti(Dl,Fl),Fl|=r;return _s(t,e,i,n),e.child}function Cs(t,e){var n=e.ref;(null===t&&null!==n||null!==t&&t.ref!==n)&&(e.flags|=512,e.flags|=2097152)}function Ts(t,e,n,r,i){var o=Fi(n)?Ii:Ei.current;return o=Mi(e,o),Io(e,i),n=ma(t,e,n,r,o,i),r=ya(),null===t||vs?(io&&r&&to(e),e.flags|=1,_s(t,e,n,i),e.child):(e.updateQueue=t.updateQueue,e.flags&=-2053,t.lanes&=~i,Ws(t,e,i))}function Ps(t,e,n,r,i){if(Fi(n)){var o=!0;Ni(e)}else o=!1;if(Io(e,i),null===e.stateNode)$s(t,e),as(e,n,r),ls(e,n,r,i),r=!0;else if(null===t){var a=e.stateNode,s=e.memoizedProps;a.props=s;var l=a.context,c=n.contextType;"object"===typeof c&&null!==c?c=Mo(c):c=Mi(e,c=Fi(n)?Ii:Ei.current);var u=n.getDerivedStateFromProps,d="function"===typeof u||"function"===typeof a.getSnapshotBeforeUpdate;d||"function"!==typeof a.UNSAFE_componentWillReceiveProps&&"function"!==typeof a.componentWillReceiveProps||(s!==r||l!==c)&&ss(e,a,r,c),No=!1;var h=e.memoizedState;a.state=h,$o(e,r,a,i),l=e.memoizedState,s!==r||h!==l||Ai.current||No?("function"===typeof u&&(rs(e,n,u,r),l=e.memoizedState),(s=No||os(e,n,s,r,h,l,c))?(d||"function"!==typeof a.UNSAFE_componentWillMount&&"function"!==typeof a.componentWillMount||("function"===typeof a.componentWillMount&&a.componentWillMount(),"function"===typeof a.UNSAFE_componentWillMount&&a.UNSAFE_componentWillMount()),"function"===typeof a.componentDidMount&&(e.flags|=4194308)):("function"===typeof a.componentDidMount&&(e.flags|=4194308),e.memoizedProps=r,e.memoizedState=l),a.props=r,a.state=l,a.context=c,r=s):("function"===typeof a.componentDidMount&&(e.flags|=4194308),r=!1)}else{a=e.stateNode,Bo(t,e),s=e.memoizedProps,c=e.type===e.elementType?s:ns(e.type,s),a.props=c,d=e.pendingProps,h=a.context,"object"===typeof(l=n.contextType)&&null!==l?l=Mo(l):l=Mi(e,l=Fi(n)?Ii:Ei.current);var f=n.getDerivedStateFromProps;(u="function"===typeof f||"function"===typeof a.getSnapshotBeforeUpdate)||"function"!==typeof a.UNSAFE_componentWillReceiveProps&&"function"!==typeof a.componentWillReceiveProps||(s!==d||h!==l)&&ss(e,a,r,l),No=!1,h=e.memoizedState,a.state=h,$o(e,r,a,i);var p=e.memoizedState;s!==d||h!==p||Ai.current||No?("function"===typeof f&&(rs(e,n,f,r),p=e.memoizedState),(c=No||os(e,n,c,r,h,p,l)||!1)?(u||"function"!==typeof a.UNSAFE_componentWillUpdate&&"function"!==typeof a.componentWillUpdate||("function"===typeof a.componentWillUpdate&&a.componentWillUpdate(r,p,l),"function"===typeof a.UNSAFE_componentWillUpdate&&a.UNSAFE_componentWillUpdate(r,p,l)),"function"===typeof a.componentDidUpdate&&(e.flags|=4),"function"===typeof a.getSnapshotBeforeUpdate&&(e.flags|=1024)):("function"!==typeof a.componentDidUpdate||s===t.memoizedProps&&h===t.memoizedState||(e.flags|=4),"function"!==typeof a.getSnapshotBeforeUpdate||s===t.memoizedProps&&h===t.memoizedState||(e.flags|=1024),e.memoizedProps=r,e.memoizedState=p),a.props=r,a.state=p,a.context=l,r=c):("function"!==typeof a.componentDidUpdate||s===t.memoizedProps&&h===t.memoizedState||(e.flags|=4),"function"!==typeof a.getSnapshotBeforeUpdate||s===t.memoizedProps&&h===t.memoizedState||(e.flags|=1024),r=!1)}return Es(t,e,n,r,o,i)}function Es(t,e,n,r,i,o){Cs(t,e);var a=0!==(128&e.flags);if(!r&&!a)return i&&Li(e,n,!1),Ws(t,e,o);r=e.stateNode,bs.current=e;var s=a&&"function"!==typeof n.getDerivedStateFromError?null:r.render();return e.flags|=1,null!==t&&a?(e.child=wo(e,t.child,null,o),e.child=wo(e,null,s,o)):_s(t,e,s,o),e.memoizedState=r.state,i&&Li(e,n,!0),e.child}function As(t){var e=t.stateNode;e.pendingContext?Ri(0,e.pendingContext,e.pendingContext!==e.context):e.context&&Ri(0,e.context,!1),Xo(t,e.containerInfo)}function Is(t,e,n,r,i){return po(),go(i),e.flags|=256,_s(t,e,n,r),e.child}var Ms,Fs,Ds,Rs,Os={dehydrated:null,treeContext:null,retryLane:0};function Ns(t){return{baseLanes:t,cachePool:null,transitions:null}}function Ls(t,e,n){var r,i=e.pendingProps,a=ta.current,s=!1,l=0!==(128&e.flags);if((r=l)||(r=(null===t||null!==t.memoizedState)&&0!==(2&a)),r?(s=!0,e.flags&=-129):null!==t&&null===t.memoizedState||(a|=1),Ti(ta,1&a),null===t)return co(e),null!==(t=e.memoizedState)&&null!==(t=t.dehydrated)?(0===(1&e.mode)?e.lanes=1:"$!"===t.data?e.lanes=8:e.lanes=1073741824,null):(l=i.children,t=i.fallback,s?(i=e.mode,s=e.child,l={mode:"hidden",children:l},0===(1&i)&&null!==s?(s.childLanes=0,s.pendingProps=l):s=Nc(l,i,0,null),t=Oc(t,i,n,null),s.return=e,t.return=e,s.sibling=t,e.child=s,e.child.memoizedState=Ns(n),e.memoizedState=Os,t):Bs(e,l));if(null!==(a=t.memoizedState)&&null!==(r=a.dehydrated))return function(t,e,n,r,i,a,s){if(n)return 256&e.flags?(e.flags&=-257,zs(t,e,s,r=us(Error(o(422))))):null!==e.memoizedState?(e.child=t.child,e.flags|=128,null):(a=r.fallback,i=e.mode,r=Nc({mode:"visible",children:r.children},i,0,null),(a=Oc(a,i,s,null)).flags|=2,r.return=e,a.return=e,r.sibling=a,e.child=r,0!==(1&e.mode)&&wo(e,t.child,null,s),e.child.memoizedState=Ns(s),e.memoizedState=Os,a);if(0===(1&e.mode))return zs(t,e,s,null);if("$!"===i.data){if(r=i.nextSibling&&i.nextSibling.dataset)var l=r.dgst;return r=l,zs(t,e,s,r=us(a=Error(o(419)),r,void 0))}if(l=0!==(s&t.childLanes),vs||l){if(null!==(r=Al)){switch(s&-s){case 4:i=2;break;case 16:i=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:i=32;break;case 536870912:i=268435456;break;default:i=0}0!==(i=0!==(i&(r.suspendedLanes|s))?0:i)&&i!==a.retryLane&&(a.retryLane=i,Oo(t,i),nc(r,t,i,-1))}return gc(),zs(t,e,s,r=us(Error(o(421))))}return"$?"===i.data?(e.flags|=128,e.child=t.child,e=Pc.bind(null,t),i._reactRetry=e,null):(t=a.treeContext,ro=ci(i.nextSibling),no=e,io=!0,oo=null,null!==t&&(Yi[qi++]=Xi,Yi[qi++]=Qi,Yi[qi++]=Ki,Xi=t.id,Qi=t.overflow,Ki=e),e=Bs(e,r.children),e.flags|=4096,e)}(t,e,l,i,r,a,n);if(s){s=i.fallback,l=e.mode,r=(a=t.child).sibling;var c={mode:"hidden",children:i.children};return 0===(1&l)&&e.child!==a?((i=e.child).childLanes=0,i.pendingProps=c,e.deletions=null):(i=Dc(a,c)).subtreeFlags=14680064&a.subtreeFlags,null!==r?s=Dc(r,s):(s=Oc(s,l,n,null)).flags|=2,s.return=e,i.return=e,i.sibling=s,e.child=i,i=s,s=e.child,l=null===(l=t.child.memoizedState)?Ns(n):{baseLanes:l.baseLanes|n,cachePool:null,transitions:l.transitions},s.memoizedState=l,s.childLanes=t.childLanes&~n,e.memoizedState=Os,i}return t=(s=t.child).sibling,i=Dc(s,{mode:"visible",children:i.children}),0===(1&e.mode)&&(i.lanes=n),i.return=e,i.sibling=null,null!==t&&(null===(n=e.deletions)?(e.deletions=[t],e.flags|=16):n.push(t)),e.child=i,e.memoizedState=null,i}function Bs(t,e){return(e=Nc({mode:"visible",children:e},t.mode,0,null)).return=t,t.child=e}function zs(t,e,n,r){return null!==r&&go(r),wo(e,t.child,null,n),(t=Bs(e,e.pendingProps.children)).flags|=2,e.memoizedState=null,t}function js(t,e,n){t.lanes|=e;var r=t.alternate;null!==r&&(r.lanes|=e),Ao(t.return,e,n)}function Us(t,e,n,r,i){var o=t.memoizedState;null===o?t.memoizedState={isBackwards:e,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:i}:(o.isBackwards=e,o.rendering=null,o.renderingStartTime=0,o.last=r,o.tail=n,o.tailMode=i)}function Vs(t,e,n){var r=e.pendingProps,i=r.revealOrder,o=r.tail;if(_s(t,e,r.children,n),0!==(2&(r=ta.current)))r=1&r|2,e.flags|=128;else{if(null!==t&&0!==(128&t.flags))t:for(t=e.child;null!==t;){if(13===t.tag)null!==t.memoizedState&&js(t,n,e);else if(19===t.tag)js(t,n,e);else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break t;for(;null===t.sibling;){if(null===t.return||t.return===e)break t;t=t.return}t.sibling.return=t.return,t=t.sibling}r&=1}if(Ti(ta,r),0===(1&e.mode))e.memoizedState=null;else switch(i){case"forwards":for(n=e.child,i=null;null!==n;)null!==(t=n.alternate)&&null===ea(t)&&(i=n),n=n.sibling;null===(n=i)?(i=e.child,e.child=null):(i=n.sibling,n.sibling=null),Us(e,!1,i,n,o);break;case"backwards":for(n=null,i=e.child,e.child=null;null!==i;){if(null!==(t=i.alternate)&&null===ea(t)){e.child=i;break}t=i.sibling,i.sibling=n,n=i,i=t}Us(e,!0,n,null,o);break;case"together":Us(e,!1,null,null,void 0);break;default:e.memoizedState=null}return e.child}function $s(t,e){0===(1&e.mode)&&null!==t&&(t.alternate=null,e.alternate=null,e.flags|=2)}function Ws(t,e,n){if(null!==t&&(e.dependencies=t.dependencies),Nl|=e.lanes,0===(n&e.childLanes))return null;if(null!==t&&e.child!==t.child)throw Error(o(153));if(null!==e.child){for(n=Dc(t=e.child,t.pendingProps),e.child=n,n.return=e;null!==t.sibling;)t=t.sibling,(n=n.sibling=Dc(t,t.pendingProps)).return=e;n.sibling=null}return e.child}function Gs(t,e){if(!io)switch(t.tailMode){case"hidden":e=t.tail;for(var n=null;null!==e;)null!==e.alternate&&(n=e),e=e.sibling;null===n?t.tail=null:n.sibling=null;break;case"collapsed":n=t.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?e||null===t.tail?t.tail=null:t.tail.sibling=null:r.sibling=null}}function Hs(t){var e=null!==t.alternate&&t.alternate.child===t.child,n=0,r=0;if(e)for(var i=t.child;null!==i;)n|=i.lanes|i.childLanes,r|=14680064&i.subtreeFlags,r|=14680064&i.flags,i.return=t,i=i.sibling;else for(i=t.child;null!==i;)n|=i.lanes|i.childLanes,r|=i.subtreeFlags,r|=i.flags,i.return=t,i=i.sibling;return t.subtreeFlags|=r,t.childLanes=n,e}function Ys(t,e,n){var r=e.pendingProps;switch(eo(e),e.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return Hs(e),null;case 1:case 17:return Fi(e.type)&&Di(),Hs(e),null;case 3:return r=e.stateNode,Qo(),Ci(Ai),Ci(Ei),ra(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),null!==t&&null!==t.child||(ho(e)?e.flags|=4:null===t||t.memoizedState.isDehydrated&&0===(256&e.flags)||(e.flags|=1024,null!==oo&&(ac(oo),oo=null))),Fs(t,e),Hs(e),null;case 5:Jo(e);var i=Ko(qo.current);if(n=e.type,null!==t&&null!=e.stateNode)Ds(t,e,n,r,i),t.ref!==e.ref&&(e.flags|=512,e.flags|=2097152);else{if(!r){if(null===e.stateNode)throw Error(o(166));return Hs(e),null}if(t=Ko(Ho.current),ho(e)){r=e.stateNode,n=e.type;var a=e.memoizedProps;switch(r[hi]=e,r[fi]=a,t=0!==(1&e.mode),n){case"dialog":zr("cancel",r),zr("close",r);break;case"iframe":case"object":case"embed":zr("load",r);break;case"video":case"audio":for(i=0;i<Or.length;i++)zr(Or[i],r);break;case"source":zr("error",r);break;case"img":case"image":case"link":zr("error",r),zr("load",r);break;case"details":zr("toggle",r);break;case"input":X(r,a),zr("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!a.multiple},zr("invalid",r);break;case"textarea":it(r,a),zr("invalid",r)}for(var l in bt(n,a),i=null,a)if(a.hasOwnProperty(l)){var c=a[l];"children"===l?"string"===typeof c?r.textContent!==c&&(!0!==a.suppressHydrationWarning&&Zr(r.textContent,c,t),i=["children",c]):"number"===typeof c&&r.textContent!==""+c&&(!0!==a.suppressHydrationWarning&&Zr(r.textContent,c,t),i=["children",""+c]):s.hasOwnProperty(l)&&null!=c&&"onScroll"===l&&zr("scroll",r)}switch(n){case"input":H(r),J(r,a,!0);break;case"textarea":H(r),at(r);break;case"select":case"option":break;default:"function"===typeof a.onClick&&(r.onclick=Jr)}r=i,e.updateQueue=r,null!==r&&(e.flags|=4)}else{l=9===i.nodeType?i:i.ownerDocument,"http://www.w3.org/1999/xhtml"===t&&(t=st(n)),"http://www.w3.org/1999/xhtml"===t?"script"===n?((t=l.createElement("div")).innerHTML="<script><\/script>",t=t.removeChild(t.firstChild)):"string"===typeof r.is?t=l.createElement(n,{is:r.is}):(t=l.createElement(n),"select"===n&&(l=t,r.multiple?l.multiple=!0:r.size&&(l.size=r.size))):t=l.createElementNS(t,n),t[hi]=e,t[fi]=r,Ms(t,e,!1,!1),e.stateNode=t;t:{switch(l=vt(n,r),n){case"dialog":zr("cancel",t),zr("close",t),i=r;break;case"iframe":case"object":case"embed":zr("load",t),i=r;break;case"video":case"audio":for(i=0;i<Or.length;i++)zr(Or[i],t);i=r;break;case"source":zr("error",t),i=r;break;case"img":case"image":case"link":zr("error",t),zr("load",t),i=r;break;case"details":zr("toggle",t),i=r;break;case"input":X(t,r),i=K(t,r),zr("invalid",t);break;case"option":default:i=r;break;case"select":t._wrapperState={wasMultiple:!!r.multiple},i=L({},r,{value:void 0}),zr("invalid",t);break;case"textarea":it(t,r),i=rt(t,r),zr("invalid",t)}for(a in bt(n,i),c=i)if(c.hasOwnProperty(a)){var u=c[a];"style"===a?mt(t,u):"dangerouslySetInnerHTML"===a?null!=(u=u?u.__html:void 0)&&dt(t,u):"children"===a?"string"===typeof u?("textarea"!==n||""!==u)&&ht(t,u):"number"===typeof u&&ht(t,""+u):"suppressContentEditableWarning"!==a&&"suppressHydrationWarning"!==a&&"autoFocus"!==a&&(s.hasOwnProperty(a)?null!=u&&"onScroll"===a&&zr("scroll",t):null!=u&&v(t,a,u,l))}switch(n){case"input":H(t),J(t,r,!1);break;case"textarea":H(t),at(t);break;case"option":null!=r.value&&t.setAttribute("value",""+W(r.value));break;case"select":t.multiple=!!r.multiple,null!=(a=r.value)?nt(t,!!r.multiple,a,!1):null!=r.defaultValue&&nt(t,!!r.multiple,r.defaultValue,!0);break;default:"function"===typeof i.onClick&&(t.onclick=Jr)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break t;case"img":r=!0;break t;default:r=!1}}r&&(e.flags|=4)}null!==e.ref&&(e.flags|=512,e.flags|=2097152)}return Hs(e),null;case 6:if(t&&null!=e.stateNode)Rs(t,e,t.memoizedProps,r);else{if("string"!==typeof r&&null===e.stateNode)throw Error(o(166));if(n=Ko(qo.current),Ko(Ho.current),ho(e)){if(r=e.stateNode,n=e.memoizedProps,r[hi]=e,(a=r.nodeValue!==n)&&null!==(t=no))switch(t.tag){case 3:Zr(r.nodeValue,n,0!==(1&t.mode));break;case 5:!0!==t.memoizedProps.suppressHydrationWarning&&Zr(r.nodeValue,n,0!==(1&t.mode))}a&&(e.flags|=4)}else(r=(9===n.nodeType?n:n.ownerDocument).createTextNode(r))[hi]=e,e.stateNode=r}return Hs(e),null;case 13:if(Ci(ta),r=e.memoizedState,null===t||null!==t.memoizedState&&null!==t.memoizedState.dehydrated){if(io&&null!==ro&&0!==(1&e.mode)&&0===(128&e.flags))fo(),po(),e.flags|=98560,a=!1;else if(a=ho(e),null!==r&&null!==r.dehydrated){if(null===t){if(!a)throw Error(o(318));if(!(a=null!==(a=e.memoizedState)?a.dehydrated:null))throw Error(o(317));a[hi]=e}else po(),0===(128&e.flags)&&(e.memoizedState=null),e.flags|=4;Hs(e),a=!1}else null!==oo&&(ac(oo),oo=null),a=!0;if(!a)return 65536&e.flags?e:null}return 0!==(128&e.flags)?(e.lanes=n,e):((r=null!==r)!==(null!==t&&null!==t.memoizedState)&&r&&(e.child.flags|=8192,0!==(1&e.mode)&&(null===t||0!==(1&ta.current)?0===Rl&&(Rl=3):gc())),null!==e.updateQueue&&(e.flags|=4),Hs(e),null);case 4:return Qo(),Fs(t,e),null===t&&Vr(e.stateNode.containerInfo),Hs(e),null;case 10:return Eo(e.type._context),Hs(e),null;case 19:if(Ci(ta),null===(a=e.memoizedState))return Hs(e),null;if(r=0!==(128&e.flags),null===(l=a.rendering))if(r)Gs(a,!1);else{if(0!==Rl||null!==t&&0!==(128&t.flags))for(t=e.child;null!==t;){if(null!==(l=ea(t))){for(e.flags|=128,Gs(a,!1),null!==(r=l.updateQueue)&&(e.updateQueue=r,e.flags|=4),e.subtreeFlags=0,r=n,n=e.child;null!==n;)t=r,(a=n).flags&=14680066,null===(l=a.alternate)?(a.childLanes=0,a.lanes=t,a.child=null,a.subtreeFlags=0,a.memoizedProps=null,a.memoizedState=null,a.updateQueue=null,a.dependencies=null,a.stateNode=null):(a.childLanes=l.childLanes,a.lanes=l.lanes,a.child=l.child,a.subtreeFlags=0,a.deletions=null,a.memoizedProps=l.memoizedProps,a.memoizedState=l.memoizedState,a.updateQueue=l.updateQueue,a.type=l.type,t=l.dependencies,a.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext}),n=n.sibling;return Ti(ta,1&ta.current|2),e.child}t=t.sibling}null!==a.tail&&Qt()>Vl&&(e.flags|=128,r=!0,Gs(a,!1),e.lanes=4194304)}else{if(!r)if(null!==(t=ea(l))){if(e.flags|=128,r=!0,null!==(n=t.updateQueue)&&(e.updateQueue=n,e.flags|=4),Gs(a,!0),null===a.tail&&"hidden"===a.tailMode&&!l.alternate&&!io)return Hs(e),null}else 2*Qt()-a.renderingStartTime>Vl&&1073741824!==n&&(e.flags|=128,r=!0,Gs(a,!1),e.lanes=4194304);a.isBackwards?(l.sibling=e.child,e.child=l):(null!==(n=a.last)?n.sibling=l:e.child=l,a.last=l)}return null!==a.tail?(e=a.tail,a.rendering=e,a.tail=e.sibling,a.renderingStartTime=Qt(),e.sibling=null,n=ta.current,Ti(ta,r?1&n|2:1&n),e):(Hs(e),null);case 22:case 23:return dc(),r=null!==e.memoizedState,null!==t&&null!==t.memoizedState!==r&&(e.flags|=8192),r&&0!==(1&e.mode)?0!==(1073741824&Fl)&&(Hs(e),6&e.subtreeFlags&&(e.flags|=8192)):Hs(e),null;case 24:case 25:return null}throw Error(o(156,e.tag))}function qs(t,e){switch(eo(e),e.tag){case 1:return Fi(e.type)&&Di(),65536&(t=e.flags)?(e.flags=-65537&t|128,e):null;case 3:return Qo(),Ci(Ai),Ci(Ei),ra(),0!==(65536&(t=e.flags))&&0===(128&t)?(e.flags=-65537&t|128,e):null;case 5:return Jo(e),null;case 13:if(Ci(ta),null!==(t=e.memoizedState)&&null!==t.dehydrated){if(null===e.alternate)throw Error(o(340));po()}return 65536&(t=e.flags)?(e.flags=-65537&t|128,e):null;case 19:return Ci(ta),null;case 4:return Qo(),null;case 10:return Eo(e.type._context),null;case 22:case 23:return dc(),null;default:return null}}Ms=function(t,e){for(var n=e.child;null!==n;){if(5===n.tag||6===n.tag)t.appendChild(n.stateNode);else if(4!==n.tag&&null!==n.child){n.child.return=n,n=n.child;continue}if(n===e)break;for(;null===n.sibling;){if(null===n.return||n.return===e)return;n=n.return}n.sibling.return=n.return,n=n.sibling}},Fs=function(){},Ds=function(t,e,n,r){var i=t.memoizedProps;if(i!==r){t=e.stateNode,Ko(Ho.current);var o,a=null;switch(n){case"input":i=K(t,i),r=K(t,r),a=[];break;case"select":i=L({},i,{value:void 0}),r=L({},r,{value:void 0}),a=[];break;case"textarea":i=rt(t,i),r=rt(t,r),a=[];break;default:"function"!==typeof i.onClick&&"function"===typeof r.onClick&&(t.onclick=Jr)}for(u in bt(n,r),n=null,i)if(!r.hasOwnProperty(u)&&i.hasOwnProperty(u)&&null!=i[u])if("style"===u){var l=i[u];for(o in l)l.hasOwnProperty(o)&&(n||(n={}),n[o]="")}else"dangerouslySetInnerHTML"!==u&&"children"!==u&&"suppressContentEditableWarning"!==u&&"suppressHydrationWarning"!==u&&"autoFocus"!==u&&(s.hasOwnProperty(u)?a||(a=[]):(a=a||[]).push(u,null));for(u in r){var c=r[u];if(l=null!=i?i[u]:void 0,r.hasOwnProperty(u)&&c!==l&&(null!=c||null!=l))if("style"===u)if(l){for(o in l)!l.hasOwnProperty(o)||c&&c.hasOwnProperty(o)||(n||(n={}),n[o]="");for(o in c)c.hasOwnProperty(o)&&l[o]!==c[o]&&(n||(n={}),n[o]=c[o])}else n||(a||(a=[]),a.push(u,n)),n=c;else"dangerouslySetInnerHTML"===u?(c=c?c.__html:void 0,l=l?l.__html:void 0,null!=c&&l!==c&&(a=a||[]).push(u,c)):"children"===u?"string"!==typeof c&&"number"!==typeof c||(a=a||[]).push(u,""+c):"suppressContentEditableWarning"!==u&&"suppressHydrationWarning"!==u&&(s.hasOwnProperty(u)?(null!=c&&"onScroll"===u&&zr("scroll",t),a||l===c||(a=[])):(a=a||[]).push(u,c))}n&&(a=a||[]).push("style",n);var u=a;(e.updateQueue=u)&&(e.flags|=4)}},Rs=function(t,e,n,r){n!==r&&(e.flags|=4)};var Ks=!1,Xs=!1,Qs="function"===typeof WeakSet?WeakSet:Set,Zs=null;function Js(t,e){var n=t.ref;if(null!==n)if("function"===typeof n)try{n(null)}catch(r){kc(t,e,r)}else n.current=null}function tl(t,e,n){try{n()}catch(r){kc(t,e,r)}}var el=!1;function nl(t,e,n){var r=e.updateQueue;if(null!==(r=null!==r?r.lastEffect:null)){var i=r=r.next;do{if((i.tag&t)===t){var o=i.destroy;i.destroy=void 0,void 0!==o&&tl(e,n,o)}i=i.next}while(i!==r)}}function rl(t,e){if(null!==(e=null!==(e=e.updateQueue)?e.lastEffect:null)){var n=e=e.next;do{if((n.tag&t)===t){var r=n.create;n.destroy=r()}n=n.next}while(n!==e)}}function il(t){var e=t.ref;if(null!==e){var n=t.stateNode;t.tag,t=n,"function"===typeof e?e(t):e.current=t}}function ol(t){var e=t.alternate;null!==e&&(t.alternate=null,ol(e)),t.child=null,t.deletions=null,t.sibling=null,5===t.tag&&(null!==(e=t.stateNode)&&(delete e[hi],delete e[fi],delete e[gi],delete e[mi],delete e[yi])),t.stateNode=null,t.return=null,t.dependencies=null,t.memoizedProps=null,t.memoizedState=null,t.pendingProps=null,t.stateNode=null,t.updateQueue=null}function al(t){return 5===t.tag||3===t.tag||4===t.tag}function sl(t){t:for(;;){for(;null===t.sibling;){if(null===t.return||al(t.return))return null;t=t.return}for(t.sibling.return=t.return,t=t.sibling;5!==t.tag&&6!==t.tag&&18!==t.tag;){if(2&t.flags)continue t;if(null===t.child||4===t.tag)continue t;t.child.return=t,t=t.child}if(!(2&t.flags))return t.stateNode}}function ll(t,e,n){var r=t.tag;if(5===r||6===r)t=t.stateNode,e?8===n.nodeType?n.parentNode.insertBefore(t,e):n.insertBefore(t,e):(8===n.nodeType?(e=n.parentNode).insertBefore(t,n):(e=n).appendChild(t),null!==(n=n._reactRootContainer)&&void 0!==n||null!==e.onclick||(e.onclick=Jr));else if(4!==r&&null!==(t=t.child))for(ll(t,e,n),t=t.sibling;null!==t;)ll(t,e,n),t=t.sibling}function cl(t,e,n){var r=t.tag;if(5===r||6===r)t=t.stateNode,e?n.insertBefore(t,e):n.appendChild(t);else if(4!==r&&null!==(t=t.child))for(cl(t,e,n),t=t.sibling;null!==t;)cl(t,e,n),t=t.sibling}var ul=null,dl=!1;function hl(t,e,n){for(n=n.child;null!==n;)fl(t,e,n),n=n.sibling}function fl(t,e,n){if(oe&&"function"===typeof oe.onCommitFiberUnmount)try{oe.onCommitFiberUnmount(ie,n)}catch(s){}switch(n.tag){case 5:Xs||Js(n,e);case 6:var r=ul,i=dl;ul=null,hl(t,e,n),dl=i,null!==(ul=r)&&(dl?(t=ul,n=n.stateNode,8===t.nodeType?t.parentNode.removeChild(n):t.removeChild(n)):ul.removeChild(n.stateNode));break;case 18:null!==ul&&(dl?(t=ul,n=n.stateNode,8===t.nodeType?li(t.parentNode,n):1===t.nodeType&&li(t,n),Ve(t)):li(ul,n.stateNode));break;case 4:r=ul,i=dl,ul=n.stateNode.containerInfo,dl=!0,hl(t,e,n),ul=r,dl=i;break;case 0:case 11:case 14:case 15:if(!Xs&&(null!==(r=n.updateQueue)&&null!==(r=r.lastEffect))){i=r=r.next;do{var o=i,a=o.destroy;o=o.tag,void 0!==a&&(0!==(2&o)||0!==(4&o))&&tl(n,e,a),i=i.next}while(i!==r)}hl(t,e,n);break;case 1:if(!Xs&&(Js(n,e),"function"===typeof(r=n.stateNode).componentWillUnmount))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(s){kc(n,e,s)}hl(t,e,n);break;case 21:hl(t,e,n);break;case 22:1&n.mode?(Xs=(r=Xs)||null!==n.memoizedState,hl(t,e,n),Xs=r):hl(t,e,n);break;default:hl(t,e,n)}}function pl(t){var e=t.updateQueue;if(null!==e){t.updateQueue=null;var n=t.stateNode;null===n&&(n=t.stateNode=new Qs),e.forEach((function(e){var r=Ec.bind(null,t,e);n.has(e)||(n.add(e),e.then(r,r))}))}}function gl(t,e){var n=e.deletions;if(null!==n)for(var r=0;r<n.length;r++){var i=n[r];try{var a=t,s=e,l=s;t:for(;null!==l;){switch(l.tag){case 5:ul=l.stateNode,dl=!1;break t;case 3:case 4:ul=l.stateNode.containerInfo,dl=!0;break t}l=l.return}if(null===ul)throw Error(o(160));fl(a,s,i),ul=null,dl=!1;var c=i.alternate;null!==c&&(c.return=null),i.return=null}catch(u){kc(i,e,u)}}if(12854&e.subtreeFlags)for(e=e.child;null!==e;)ml(e,t),e=e.sibling}function ml(t,e){var n=t.alternate,r=t.flags;switch(t.tag){case 0:case 11:case 14:case 15:if(gl(e,t),yl(t),4&r){try{nl(3,t,t.return),rl(3,t)}catch(m){kc(t,t.return,m)}try{nl(5,t,t.return)}catch(m){kc(t,t.return,m)}}break;case 1:gl(e,t),yl(t),512&r&&null!==n&&Js(n,n.return);break;case 5:if(gl(e,t),yl(t),512&r&&null!==n&&Js(n,n.return),32&t.flags){var i=t.stateNode;try{ht(i,"")}catch(m){kc(t,t.return,m)}}if(4&r&&null!=(i=t.stateNode)){var a=t.memoizedProps,s=null!==n?n.memoizedProps:a,l=t.type,c=t.updateQueue;if(t.updateQueue=null,null!==c)try{"input"===l&&"radio"===a.type&&null!=a.name&&Q(i,a),vt(l,s);var u=vt(l,a);for(s=0;s<c.length;s+=2){var d=c[s],h=c[s+1];"style"===d?mt(i,h):"dangerouslySetInnerHTML"===d?dt(i,h):"children"===d?ht(i,h):v(i,d,h,u)}switch(l){case"input":Z(i,a);break;case"textarea":ot(i,a);break;case"select":var f=i._wrapperState.wasMultiple;i._wrapperState.wasMultiple=!!a.multiple;var p=a.value;null!=p?nt(i,!!a.multiple,p,!1):f!==!!a.multiple&&(null!=a.defaultValue?nt(i,!!a.multiple,a.defaultValue,!0):nt(i,!!a.multiple,a.multiple?[]:"",!1))}i[fi]=a}catch(m){kc(t,t.return,m)}}break;case 6:if(gl(e,t),yl(t),4&r){if(null===t.stateNode)throw Error(o(162));i=t.stateNode,a=t.memoizedProps;try{i.nodeValue=a}catch(m){kc(t,t.return,m)}}break;case 3:if(gl(e,t),yl(t),4&r&&null!==n&&n.memoizedState.isDehydrated)try{Ve(e.containerInfo)}catch(m){kc(t,t.return,m)}break;case 4:default:gl(e,t),yl(t);break;case 13:gl(e,t),yl(t),8192&(i=t.child).flags&&(a=null!==i.memoizedState,i.stateNode.isHidden=a,!a||null!==i.alternate&&null!==i.alternate.memoizedState||(Ul=Qt())),4&r&&pl(t);break;case 22:if(d=null!==n&&null!==n.memoizedState,1&t.mode?(Xs=(u=Xs)||d,gl(e,t),Xs=u):gl(e,t),yl(t),8192&r){if(u=null!==t.memoizedState,(t.stateNode.isHidden=u)&&!d&&0!==(1&t.mode))for(Zs=t,d=t.child;null!==d;){for(h=Zs=d;null!==Zs;){switch(p=(f=Zs).child,f.tag){case 0:case 11:case 14:case 15:nl(4,f,f.return);break;case 1:Js(f,f.return);var g=f.stateNode;if("function"===typeof g.componentWillUnmount){r=f,n=f.return;try{e=r,g.props=e.memoizedProps,g.state=e.memoizedState,g.componentWillUnmount()}catch(m){kc(r,n,m)}}break;case 5:Js(f,f.return);break;case 22:if(null!==f.memoizedState){wl(h);continue}}null!==p?(p.return=f,Zs=p):wl(h)}d=d.sibling}t:for(d=null,h=t;;){if(5===h.tag){if(null===d){d=h;try{i=h.stateNode,u?"function"===typeof(a=i.style).setProperty?a.setProperty("display","none","important"):a.display="none":(l=h.stateNode,s=void 0!==(c=h.memoizedProps.style)&&null!==c&&c.hasOwnProperty("display")?c.display:null,l.style.display=gt("display",s))}catch(m){kc(t,t.return,m)}}}else if(6===h.tag){if(null===d)try{h.stateNode.nodeValue=u?"":h.memoizedProps}catch(m){kc(t,t.return,m)}}else if((22!==h.tag&&23!==h.tag||null===h.memoizedState||h===t)&&null!==h.child){h.child.return=h,h=h.child;continue}if(h===t)break t;for(;null===h.sibling;){if(null===h.return||h.return===t)break t;d===h&&(d=null),h=h.return}d===h&&(d=null),h.sibling.return=h.return,h=h.sibling}}break;case 19:gl(e,t),yl(t),4&r&&pl(t);case 21:}}function yl(t){var e=t.flags;if(2&e){try{t:{for(var n=t.return;null!==n;){if(al(n)){var r=n;break t}n=n.return}throw Error(o(160))}switch(r.tag){case 5:var i=r.stateNode;32&r.flags&&(ht(i,""),r.flags&=-33),cl(t,sl(t),i);break;case 3:case 4:var a=r.stateNode.containerInfo;ll(t,sl(t),a);break;default:throw Error(o(161))}}catch(s){kc(t,t.return,s)}t.flags&=-3}4096&e&&(t.flags&=-4097)}function bl(t,e,n){Zs=t,vl(t,e,n)}function vl(t,e,n){for(var r=0!==(1&t.mode);null!==Zs;){var i=Zs,o=i.child;if(22===i.tag&&r){var a=null!==i.memoizedState||Ks;if(!a){var s=i.alternate,l=null!==s&&null!==s.memoizedState||Xs;s=Ks;var c=Xs;if(Ks=a,(Xs=l)&&!c)for(Zs=i;null!==Zs;)l=(a=Zs).child,22===a.tag&&null!==a.memoizedState?xl(i):null!==l?(l.return=a,Zs=l):xl(i);for(;null!==o;)Zs=o,vl(o,e,n),o=o.sibling;Zs=i,Ks=s,Xs=c}_l(t)}else 0!==(8772&i.subtreeFlags)&&null!==o?(o.return=i,Zs=o):_l(t)}}function _l(t){for(;null!==Zs;){var e=Zs;if(0!==(8772&e.flags)){var n=e.alternate;try{if(0!==(8772&e.flags))switch(e.tag){case 0:case 11:case 15:Xs||rl(5,e);break;case 1:var r=e.stateNode;if(4&e.flags&&!Xs)if(null===n)r.componentDidMount();else{var i=e.elementType===e.type?n.memoizedProps:ns(e.type,n.memoizedProps);r.componentDidUpdate(i,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var a=e.updateQueue;null!==a&&Wo(e,a,r);break;case 3:var s=e.updateQueue;if(null!==s){if(n=null,null!==e.child)switch(e.child.tag){case 5:case 1:n=e.child.stateNode}Wo(e,s,n)}break;case 5:var l=e.stateNode;if(null===n&&4&e.flags){n=l;var c=e.memoizedProps;switch(e.type){case"button":case"input":case"select":case"textarea":c.autoFocus&&n.focus();break;case"img":c.src&&(n.src=c.src)}}break;case 6:case 4:case 12:case 19:case 17:case 21:case 22:case 23:case 25:break;case 13:if(null===e.memoizedState){var u=e.alternate;if(null!==u){var d=u.memoizedState;if(null!==d){var h=d.dehydrated;null!==h&&Ve(h)}}}break;default:throw Error(o(163))}Xs||512&e.flags&&il(e)}catch(f){kc(e,e.return,f)}}if(e===t){Zs=null;break}if(null!==(n=e.sibling)){n.return=e.return,Zs=n;break}Zs=e.return}}function wl(t){for(;null!==Zs;){var e=Zs;if(e===t){Zs=null;break}var n=e.sibling;if(null!==n){n.return=e.return,Zs=n;break}Zs=e.return}}function xl(t){for(;null!==Zs;){var e=Zs;try{switch(e.tag){case 0:case 11:case 15:var n=e.return;try{rl(4,e)}catch(l){kc(e,n,l)}break;case 1:var r=e.stateNode;if("function"===typeof r.componentDidMount){var i=e.return;try{r.componentDidMount()}catch(l){kc(e,i,l)}}var o=e.return;try{il(e)}catch(l){kc(e,o,l)}break;case 5:var a=e.return;try{il(e)}catch(l){kc(e,a,l)}}}catch(l){kc(e,e.return,l)}if(e===t){Zs=null;break}var s=e.sibling;if(null!==s){s.return=e.return,Zs=s;break}Zs=e.return}}var Sl,kl=Math.ceil,Cl=_.ReactCurrentDispatcher,Tl=_.ReactCurrentOwner,Pl=_.ReactCurrentBatchConfig,El=0,Al=null,Il=null,Ml=0,Fl=0,Dl=ki(0),Rl=0,Ol=null,Nl=0,Ll=0,Bl=0,zl=null,jl=null,Ul=0,Vl=1/0,$l=null,Wl=!1,Gl=null,Hl=null,Yl=!1,ql=null,Kl=0,Xl=0,Ql=null,Zl=-1,Jl=0;function tc(){return 0!==(6&El)?Qt():-1!==Zl?Zl:Zl=Qt()}function ec(t){return 0===(1&t.mode)?1:0!==(2&El)&&0!==Ml?Ml&-Ml:null!==mo.transition?(0===Jl&&(Jl=ge()),Jl):0!==(t=ve)?t:t=void 0===(t=window.event)?16:Xe(t.type)}function nc(t,e,n,r){if(50<Xl)throw Xl=0,Ql=null,Error(o(185));ye(t,n,r),0!==(2&El)&&t===Al||(t===Al&&(0===(2&El)&&(Ll|=n),4===Rl&&sc(t,Ml)),rc(t,r),1===n&&0===El&&0===(1&e.mode)&&(Vl=Qt()+500,zi&&Vi()))}function rc(t,e){var n=t.callbackNode;!function(t,e){for(var n=t.suspendedLanes,r=t.pingedLanes,i=t.expirationTimes,o=t.pendingLanes;0<o;){var a=31-ae(o),s=1<<a,l=i[a];-1===l?0!==(s&n)&&0===(s&r)||(i[a]=fe(s,e)):l<=e&&(t.expiredLanes|=s),o&=~s}}(t,e);var r=he(t,t===Al?Ml:0);if(0===r)null!==n&&qt(n),t.callbackNode=null,t.callbackPriority=0;else if(e=r&-r,t.callbackPriority!==e){if(null!=n&&qt(n),1===e)0===t.tag?function(t){zi=!0,Ui(t)}(lc.bind(null,t)):Ui(lc.bind(null,t)),ai((function(){0===(6&El)&&Vi()})),n=null;else{switch(_e(r)){case 1:n=Jt;break;case 4:n=te;break;case 16:default:n=ee;break;case 536870912:n=re}n=Ac(n,ic.bind(null,t))}t.callbackPriority=e,t.callbackNode=n}}function ic(t,e){if(Zl=-1,Jl=0,0!==(6&El))throw Error(o(327));var n=t.callbackNode;if(xc()&&t.callbackNode!==n)return null;var r=he(t,t===Al?Ml:0);if(0===r)return null;if(0!==(30&r)||0!==(r&t.expiredLanes)||e)e=mc(t,r);else{e=r;var i=El;El|=2;var a=pc();for(Al===t&&Ml===e||($l=null,Vl=Qt()+500,hc(t,e));;)try{bc();break}catch(l){fc(t,l)}Po(),Cl.current=a,El=i,null!==Il?e=0:(Al=null,Ml=0,e=Rl)}if(0!==e){if(2===e&&(0!==(i=pe(t))&&(r=i,e=oc(t,i))),1===e)throw n=Ol,hc(t,0),sc(t,r),rc(t,Qt()),n;if(6===e)sc(t,r);else{if(i=t.current.alternate,0===(30&r)&&!function(t){for(var e=t;;){if(16384&e.flags){var n=e.updateQueue;if(null!==n&&null!==(n=n.stores))for(var r=0;r<n.length;r++){var i=n[r],o=i.getSnapshot;i=i.value;try{if(!sr(o(),i))return!1}catch(s){return!1}}}if(n=e.child,16384&e.subtreeFlags&&null!==n)n.return=e,e=n;else{if(e===t)break;for(;null===e.sibling;){if(null===e.return||e.return===t)return!0;e=e.return}e.sibling.return=e.return,e=e.sibling}}return!0}(i)&&(2===(e=mc(t,r))&&(0!==(a=pe(t))&&(r=a,e=oc(t,a))),1===e))throw n=Ol,hc(t,0),sc(t,r),rc(t,Qt()),n;switch(t.finishedWork=i,t.finishedLanes=r,e){case 0:case 1:throw Error(o(345));case 2:case 5:wc(t,jl,$l);break;case 3:if(sc(t,r),(130023424&r)===r&&10<(e=Ul+500-Qt())){if(0!==he(t,0))break;if(((i=t.suspendedLanes)&r)!==r){tc(),t.pingedLanes|=t.suspendedLanes&i;break}t.timeoutHandle=ri(wc.bind(null,t,jl,$l),e);break}wc(t,jl,$l);break;case 4:if(sc(t,r),(4194240&r)===r)break;for(e=t.eventTimes,i=-1;0<r;){var s=31-ae(r);a=1<<s,(s=e[s])>i&&(i=s),r&=~a}if(r=i,10<(r=(120>(r=Qt()-r)?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*kl(r/1960))-r)){t.timeoutHandle=ri(wc.bind(null,t,jl,$l),r);break}wc(t,jl,$l);break;default:throw Error(o(329))}}}return rc(t,Qt()),t.callbackNode===n?ic.bind(null,t):null}function oc(t,e){var n=zl;return t.current.memoizedState.isDehydrated&&(hc(t,e).flags|=256),2!==(t=mc(t,e))&&(e=jl,jl=n,null!==e&&ac(e)),t}function ac(t){null===jl?jl=t:jl.push.apply(jl,t)}function sc(t,e){for(e&=~Bl,e&=~Ll,t.suspendedLanes|=e,t.pingedLanes&=~e,t=t.expirationTimes;0<e;){var n=31-ae(e),r=1<<n;t[n]=-1,e&=~r}}function lc(t){if(0!==(6&El))throw Error(o(327));xc();var e=he(t,0);if(0===(1&e))return rc(t,Qt()),null;var n=mc(t,e);if(0!==t.tag&&2===n){var r=pe(t);0!==r&&(e=r,n=oc(t,r))}if(1===n)throw n=Ol,hc(t,0),sc(t,e),rc(t,Qt()),n;if(6===n)throw Error(o(345));return t.finishedWork=t.current.alternate,t.finishedLanes=e,wc(t,jl,$l),rc(t,Qt()),null}function cc(t,e){var n=El;El|=1;try{return t(e)}finally{0===(El=n)&&(Vl=Qt()+500,zi&&Vi())}}function uc(t){null!==ql&&0===ql.tag&&0===(6&El)&&xc();var e=El;El|=1;var n=Pl.transition,r=ve;try{if(Pl.transition=null,ve=1,t)return t()}finally{ve=r,Pl.transition=n,0===(6&(El=e))&&Vi()}}function dc(){Fl=Dl.current,Ci(Dl)}function hc(t,e){t.finishedWork=null,t.finishedLanes=0;var n=t.timeoutHandle;if(-1!==n&&(t.timeoutHandle=-1,ii(n)),null!==Il)for(n=Il.return;null!==n;){var r=n;switch(eo(r),r.tag){case 1:null!==(r=r.type.childContextTypes)&&void 0!==r&&Di();break;case 3:Qo(),Ci(Ai),Ci(Ei),ra();break;case 5:Jo(r);break;case 4:Qo();break;case 13:case 19:Ci(ta);break;case 10:Eo(r.type._context);break;case 22:case 23:dc()}n=n.return}if(Al=t,Il=t=Dc(t.current,null),Ml=Fl=e,Rl=0,Ol=null,Bl=Ll=Nl=0,jl=zl=null,null!==Fo){for(e=0;e<Fo.length;e++)if(null!==(r=(n=Fo[e]).interleaved)){n.interleaved=null;var i=r.next,o=n.pending;if(null!==o){var a=o.next;o.next=i,r.next=a}n.pending=r}Fo=null}return t}function fc(t,e){for(;;){var n=Il;try{if(Po(),ia.current=Za,ua){for(var r=sa.memoizedState;null!==r;){var i=r.queue;null!==i&&(i.pending=null),r=r.next}ua=!1}if(aa=0,ca=la=sa=null,da=!1,ha=0,Tl.current=null,null===n||null===n.return){Rl=1,Ol=e,Il=null;break}t:{var a=t,s=n.return,l=n,c=e;if(e=Ml,l.flags|=32768,null!==c&&"object"===typeof c&&"function"===typeof c.then){var u=c,d=l,h=d.tag;if(0===(1&d.mode)&&(0===h||11===h||15===h)){var f=d.alternate;f?(d.updateQueue=f.updateQueue,d.memoizedState=f.memoizedState,d.lanes=f.lanes):(d.updateQueue=null,d.memoizedState=null)}var p=ms(s);if(null!==p){p.flags&=-257,ys(p,s,l,0,e),1&p.mode&&gs(a,u,e),c=u;var g=(e=p).updateQueue;if(null===g){var m=new Set;m.add(c),e.updateQueue=m}else g.add(c);break t}if(0===(1&e)){gs(a,u,e),gc();break t}c=Error(o(426))}else if(io&&1&l.mode){var y=ms(s);if(null!==y){0===(65536&y.flags)&&(y.flags|=256),ys(y,s,l,0,e),go(cs(c,l));break t}}a=c=cs(c,l),4!==Rl&&(Rl=2),null===zl?zl=[a]:zl.push(a),a=s;do{switch(a.tag){case 3:a.flags|=65536,e&=-e,a.lanes|=e,Vo(a,fs(0,c,e));break t;case 1:l=c;var b=a.type,v=a.stateNode;if(0===(128&a.flags)&&("function"===typeof b.getDerivedStateFromError||null!==v&&"function"===typeof v.componentDidCatch&&(null===Hl||!Hl.has(v)))){a.flags|=65536,e&=-e,a.lanes|=e,Vo(a,ps(a,l,e));break t}}a=a.return}while(null!==a)}_c(n)}catch(_){e=_,Il===n&&null!==n&&(Il=n=n.return);continue}break}}function pc(){var t=Cl.current;return Cl.current=Za,null===t?Za:t}function gc(){0!==Rl&&3!==Rl&&2!==Rl||(Rl=4),null===Al||0===(268435455&Nl)&&0===(268435455&Ll)||sc(Al,Ml)}function mc(t,e){var n=El;El|=2;var r=pc();for(Al===t&&Ml===e||($l=null,hc(t,e));;)try{yc();break}catch(i){fc(t,i)}if(Po(),El=n,Cl.current=r,null!==Il)throw Error(o(261));return Al=null,Ml=0,Rl}function yc(){for(;null!==Il;)vc(Il)}function bc(){for(;null!==Il&&!Kt();)vc(Il)}function vc(t){var e=Sl(t.alternate,t,Fl);t.memoizedProps=t.pendingProps,null===e?_c(t):Il=e,Tl.current=null}function _c(t){var e=t;do{var n=e.alternate;if(t=e.return,0===(32768&e.flags)){if(null!==(n=Ys(n,e,Fl)))return void(Il=n)}else{if(null!==(n=qs(n,e)))return n.flags&=32767,void(Il=n);if(null===t)return Rl=6,void(Il=null);t.flags|=32768,t.subtreeFlags=0,t.deletions=null}if(null!==(e=e.sibling))return void(Il=e);Il=e=t}while(null!==e);0===Rl&&(Rl=5)}function wc(t,e,n){var r=ve,i=Pl.transition;try{Pl.transition=null,ve=1,function(t,e,n,r){do{xc()}while(null!==ql);if(0!==(6&El))throw Error(o(327));n=t.finishedWork;var i=t.finishedLanes;if(null===n)return null;if(t.finishedWork=null,t.finishedLanes=0,n===t.current)throw Error(o(177));t.callbackNode=null,t.callbackPriority=0;var a=n.lanes|n.childLanes;if(function(t,e){var n=t.pendingLanes&~e;t.pendingLanes=e,t.suspendedLanes=0,t.pingedLanes=0,t.expiredLanes&=e,t.mutableReadLanes&=e,t.entangledLanes&=e,e=t.entanglements;var r=t.eventTimes;for(t=t.expirationTimes;0<n;){var i=31-ae(n),o=1<<i;e[i]=0,r[i]=-1,t[i]=-1,n&=~o}}(t,a),t===Al&&(Il=Al=null,Ml=0),0===(2064&n.subtreeFlags)&&0===(2064&n.flags)||Yl||(Yl=!0,Ac(ee,(function(){return xc(),null}))),a=0!==(15990&n.flags),0!==(15990&n.subtreeFlags)||a){a=Pl.transition,Pl.transition=null;var s=ve;ve=1;var l=El;El|=4,Tl.current=null,function(t,e){if(ti=We,fr(t=hr())){if("selectionStart"in t)var n={start:t.selectionStart,end:t.selectionEnd};else t:{var r=(n=(n=t.ownerDocument)&&n.defaultView||window).getSelection&&n.getSelection();if(r&&0!==r.rangeCount){n=r.anchorNode;var i=r.anchorOffset,a=r.focusNode;r=r.focusOffset;try{n.nodeType,a.nodeType}catch(w){n=null;break t}var s=0,l=-1,c=-1,u=0,d=0,h=t,f=null;e:for(;;){for(var p;h!==n||0!==i&&3!==h.nodeType||(l=s+i),h!==a||0!==r&&3!==h.nodeType||(c=s+r),3===h.nodeType&&(s+=h.nodeValue.length),null!==(p=h.firstChild);)f=h,h=p;for(;;){if(h===t)break e;if(f===n&&++u===i&&(l=s),f===a&&++d===r&&(c=s),null!==(p=h.nextSibling))break;f=(h=f).parentNode}h=p}n=-1===l||-1===c?null:{start:l,end:c}}else n=null}n=n||{start:0,end:0}}else n=null;for(ei={focusedElem:t,selectionRange:n},We=!1,Zs=e;null!==Zs;)if(t=(e=Zs).child,0!==(1028&e.subtreeFlags)&&null!==t)t.return=e,Zs=t;else for(;null!==Zs;){e=Zs;try{var g=e.alternate;if(0!==(1024&e.flags))switch(e.tag){case 0:case 11:case 15:case 5:case 6:case 4:case 17:break;case 1:if(null!==g){var m=g.memoizedProps,y=g.memoizedState,b=e.stateNode,v=b.getSnapshotBeforeUpdate(e.elementType===e.type?m:ns(e.type,m),y);b.__reactInternalSnapshotBeforeUpdate=v}break;case 3:var _=e.stateNode.containerInfo;1===_.nodeType?_.textContent="":9===_.nodeType&&_.documentElement&&_.removeChild(_.documentElement);break;default:throw Error(o(163))}}catch(w){kc(e,e.return,w)}if(null!==(t=e.sibling)){t.return=e.return,Zs=t;break}Zs=e.return}g=el,el=!1}(t,n),ml(n,t),pr(ei),We=!!ti,ei=ti=null,t.current=n,bl(n,t,i),Xt(),El=l,ve=s,Pl.transition=a}else t.current=n;if(Yl&&(Yl=!1,ql=t,Kl=i),a=t.pendingLanes,0===a&&(Hl=null),function(t){if(oe&&"function"===typeof oe.onCommitFiberRoot)try{oe.onCommitFiberRoot(ie,t,void 0,128===(128&t.current.flags))}catch(e){}}(n.stateNode),rc(t,Qt()),null!==e)for(r=t.onRecoverableError,n=0;n<e.length;n++)i=e[n],r(i.value,{componentStack:i.stack,digest:i.digest});if(Wl)throw Wl=!1,t=Gl,Gl=null,t;0!==(1&Kl)&&0!==t.tag&&xc(),a=t.pendingLanes,0!==(1&a)?t===Ql?Xl++:(Xl=0,Ql=t):Xl=0,Vi()}(t,e,n,r)}finally{Pl.transition=i,ve=r}return null}function xc(){if(null!==ql){var t=_e(Kl),e=Pl.transition,n=ve;try{if(Pl.transition=null,ve=16>t?16:t,null===ql)var r=!1;else{if(t=ql,ql=null,Kl=0,0!==(6&El))throw Error(o(331));var i=El;for(El|=4,Zs=t.current;null!==Zs;){var a=Zs,s=a.child;if(0!==(16&Zs.flags)){var l=a.deletions;if(null!==l){for(var c=0;c<l.length;c++){var u=l[c];for(Zs=u;null!==Zs;){var d=Zs;switch(d.tag){case 0:case 11:case 15:nl(8,d,a)}var h=d.child;if(null!==h)h.return=d,Zs=h;else for(;null!==Zs;){var f=(d=Zs).sibling,p=d.return;if(ol(d),d===u){Zs=null;break}if(null!==f){f.return=p,Zs=f;break}Zs=p}}}var g=a.alternate;if(null!==g){var m=g.child;if(null!==m){g.child=null;do{var y=m.sibling;m.sibling=null,m=y}while(null!==m)}}Zs=a}}if(0!==(2064&a.subtreeFlags)&&null!==s)s.return=a,Zs=s;else t:for(;null!==Zs;){if(0!==(2048&(a=Zs).flags))switch(a.tag){case 0:case 11:case 15:nl(9,a,a.return)}var b=a.sibling;if(null!==b){b.return=a.return,Zs=b;break t}Zs=a.return}}var v=t.current;for(Zs=v;null!==Zs;){var _=(s=Zs).child;if(0!==(2064&s.subtreeFlags)&&null!==_)_.return=s,Zs=_;else t:for(s=v;null!==Zs;){if(0!==(2048&(l=Zs).flags))try{switch(l.tag){case 0:case 11:case 15:rl(9,l)}}catch(x){kc(l,l.return,x)}if(l===s){Zs=null;break t}var w=l.sibling;if(null!==w){w.return=l.return,Zs=w;break t}Zs=l.return}}if(El=i,Vi(),oe&&"function"===typeof oe.onPostCommitFiberRoot)try{oe.onPostCommitFiberRoot(ie,t)}catch(x){}r=!0}return r}finally{ve=n,Pl.transition=e}}return!1}function Sc(t,e,n){t=jo(t,e=fs(0,e=cs(n,e),1),1),e=tc(),null!==t&&(ye(t,1,e),rc(t,e))}function kc(t,e,n){if(3===t.tag)Sc(t,t,n);else for(;null!==e;){if(3===e.tag){Sc(e,t,n);break}if(1===e.tag){var r=e.stateNode;if("function"===typeof e.type.getDerivedStateFromError||"function"===typeof r.componentDidCatch&&(null===Hl||!Hl.has(r))){e=jo(e,t=ps(e,t=cs(n,t),1),1),t=tc(),null!==e&&(ye(e,1,t),rc(e,t));break}}e=e.return}}function Cc(t,e,n){var r=t.pingCache;null!==r&&r.delete(e),e=tc(),t.pingedLanes|=t.suspendedLanes&n,Al===t&&(Ml&n)===n&&(4===Rl||3===Rl&&(130023424&Ml)===Ml&&500>Qt()-Ul?hc(t,0):Bl|=n),rc(t,e)}function Tc(t,e){0===e&&(0===(1&t.mode)?e=1:(e=ue,0===(130023424&(ue<<=1))&&(ue=4194304)));var n=tc();null!==(t=Oo(t,e))&&(ye(t,e,n),rc(t,n))}function Pc(t){var e=t.memoizedState,n=0;null!==e&&(n=e.retryLane),Tc(t,n)}function Ec(t,e){var n=0;switch(t.tag){case 13:var r=t.stateNode,i=t.memoizedState;null!==i&&(n=i.retryLane);break;case 19:r=t.stateNode;break;default:throw Error(o(314))}null!==r&&r.delete(e),Tc(t,n)}function Ac(t,e){return Yt(t,e)}function Ic(t,e,n,r){this.tag=t,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=e,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Mc(t,e,n,r){return new Ic(t,e,n,r)}function Fc(t){return!(!(t=t.prototype)||!t.isReactComponent)}function Dc(t,e){var n=t.alternate;return null===n?((n=Mc(t.tag,e,t.key,t.mode)).elementType=t.elementType,n.type=t.type,n.stateNode=t.stateNode,n.alternate=t,t.alternate=n):(n.pendingProps=e,n.type=t.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=14680064&t.flags,n.childLanes=t.childLanes,n.lanes=t.lanes,n.child=t.child,n.memoizedProps=t.memoizedProps,n.memoizedState=t.memoizedState,n.updateQueue=t.updateQueue,e=t.dependencies,n.dependencies=null===e?null:{lanes:e.lanes,firstContext:e.firstContext},n.sibling=t.sibling,n.index=t.index,n.ref=t.ref,n}function Rc(t,e,n,r,i,a){var s=2;if(r=t,"function"===typeof t)Fc(t)&&(s=1);else if("string"===typeof t)s=5;else t:switch(t){case S:return Oc(n.children,i,a,e);case k:s=8,i|=8;break;case C:return(t=Mc(12,n,e,2|i)).elementType=C,t.lanes=a,t;case A:return(t=Mc(13,n,e,i)).elementType=A,t.lanes=a,t;case I:return(t=Mc(19,n,e,i)).elementType=I,t.lanes=a,t;case D:return Nc(n,i,a,e);default:if("object"===typeof t&&null!==t)switch(t.$$typeof){case T:s=10;break t;case P:s=9;break t;case E:s=11;break t;case M:s=14;break t;case F:s=16,r=null;break t}throw Error(o(130,null==t?t:typeof t,""))}return(e=Mc(s,n,e,i)).elementType=t,e.type=r,e.lanes=a,e}function Oc(t,e,n,r){return(t=Mc(7,t,r,e)).lanes=n,t}function Nc(t,e,n,r){return(t=Mc(22,t,r,e)).elementType=D,t.lanes=n,t.stateNode={isHidden:!1},t}function Lc(t,e,n){return(t=Mc(6,t,null,e)).lanes=n,t}function Bc(t,e,n){return(e=Mc(4,null!==t.children?t.children:[],t.key,e)).lanes=n,e.stateNode={containerInfo:t.containerInfo,pendingChildren:null,implementation:t.implementation},e}function zc(t,e,n,r,i){this.tag=e,this.containerInfo=t,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=me(0),this.expirationTimes=me(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=me(0),this.identifierPrefix=r,this.onRecoverableError=i,this.mutableSourceEagerHydrationData=null}function jc(t,e,n,r,i,o,a,s,l){return t=new zc(t,e,n,s,l),1===e?(e=1,!0===o&&(e|=8)):e=0,o=Mc(3,null,null,e),t.current=o,o.stateNode=t,o.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},Lo(o),t}function Uc(t){if(!t)return Pi;t:{if(Vt(t=t._reactInternals)!==t||1!==t.tag)throw Error(o(170));var e=t;do{switch(e.tag){case 3:e=e.stateNode.context;break t;case 1:if(Fi(e.type)){e=e.stateNode.__reactInternalMemoizedMergedChildContext;break t}}e=e.return}while(null!==e);throw Error(o(171))}if(1===t.tag){var n=t.type;if(Fi(n))return Oi(t,n,e)}return e}function Vc(t,e,n,r,i,o,a,s,l){return(t=jc(n,r,!0,t,0,o,0,s,l)).context=Uc(null),n=t.current,(o=zo(r=tc(),i=ec(n))).callback=void 0!==e&&null!==e?e:null,jo(n,o,i),t.current.lanes=i,ye(t,i,r),rc(t,r),t}function $c(t,e,n,r){var i=e.current,o=tc(),a=ec(i);return n=Uc(n),null===e.context?e.context=n:e.pendingContext=n,(e=zo(o,a)).payload={element:t},null!==(r=void 0===r?null:r)&&(e.callback=r),null!==(t=jo(i,e,a))&&(nc(t,i,a,o),Uo(t,i,a)),a}function Wc(t){return(t=t.current).child?(t.child.tag,t.child.stateNode):null}function Gc(t,e){if(null!==(t=t.memoizedState)&&null!==t.dehydrated){var n=t.retryLane;t.retryLane=0!==n&&n<e?n:e}}function Hc(t,e){Gc(t,e),(t=t.alternate)&&Gc(t,e)}Sl=function(t,e,n){if(null!==t)if(t.memoizedProps!==e.pendingProps||Ai.current)vs=!0;else{if(0===(t.lanes&n)&&0===(128&e.flags))return vs=!1,function(t,e,n){switch(e.tag){case 3:As(e),po();break;case 5:Zo(e);break;case 1:Fi(e.type)&&Ni(e);break;case 4:Xo(e,e.stateNode.containerInfo);break;case 10:var r=e.type._context,i=e.memoizedProps.value;Ti(So,r._currentValue),r._currentValue=i;break;case 13:if(null!==(r=e.memoizedState))return null!==r.dehydrated?(Ti(ta,1&ta.current),e.flags|=128,null):0!==(n&e.child.childLanes)?Ls(t,e,n):(Ti(ta,1&ta.current),null!==(t=Ws(t,e,n))?t.sibling:null);Ti(ta,1&ta.current);break;case 19:if(r=0!==(n&e.childLanes),0!==(128&t.flags)){if(r)return Vs(t,e,n);e.flags|=128}if(null!==(i=e.memoizedState)&&(i.rendering=null,i.tail=null,i.lastEffect=null),Ti(ta,ta.current),r)break;return null;case 22:case 23:return e.lanes=0,ks(t,e,n)}return Ws(t,e,n)}(t,e,n);vs=0!==(131072&t.flags)}else vs=!1,io&&0!==(1048576&e.flags)&&Ji(e,Hi,e.index);switch(e.lanes=0,e.tag){case 2:var r=e.type;$s(t,e),t=e.pendingProps;var i=Mi(e,Ei.current);Io(e,n),i=ma(null,e,r,t,i,n);var a=ya();return e.flags|=1,"object"===typeof i&&null!==i&&"function"===typeof i.render&&void 0===i.$$typeof?(e.tag=1,e.memoizedState=null,e.updateQueue=null,Fi(r)?(a=!0,Ni(e)):a=!1,e.memoizedState=null!==i.state&&void 0!==i.state?i.state:null,Lo(e),i.updater=is,e.stateNode=i,i._reactInternals=e,ls(e,r,t,n),e=Es(null,e,r,!0,a,n)):(e.tag=0,io&&a&&to(e),_s(null,e,i,n),e=e.child),e;case 16:r=e.elementType;t:{switch($s(t,e),t=e.pendingProps,r=(i=r._init)(r._payload),e.type=r,i=e.tag=function(t){if("function"===typeof t)return Fc(t)?1:0;if(void 0!==t&&null!==t){if((t=t.$$typeof)===E)return 11;if(t===M)return 14}return 2}(r),t=ns(r,t),i){case 0:e=Ts(null,e,r,t,n);break t;case 1:e=Ps(null,e,r,t,n);break t;case 11:e=ws(null,e,r,t,n);break t;case 14:e=xs(null,e,r,ns(r.type,t),n);break t}throw Error(o(306,r,""))}return e;case 0:return r=e.type,i=e.pendingProps,Ts(t,e,r,i=e.elementType===r?i:ns(r,i),n);case 1:return r=e.type,i=e.pendingProps,Ps(t,e,r,i=e.elementType===r?i:ns(r,i),n);case 3:t:{if(As(e),null===t)throw Error(o(387));r=e.pendingProps,i=(a=e.memoizedState).element,Bo(t,e),$o(e,r,null,n);var s=e.memoizedState;if(r=s.element,a.isDehydrated){if(a={element:r,isDehydrated:!1,cache:s.cache,pendingSuspenseBoundaries:s.pendingSuspenseBoundaries,transitions:s.transitions},e.updateQueue.baseState=a,e.memoizedState=a,256&e.flags){e=Is(t,e,r,n,i=cs(Error(o(423)),e));break t}if(r!==i){e=Is(t,e,r,n,i=cs(Error(o(424)),e));break t}for(ro=ci(e.stateNode.containerInfo.firstChild),no=e,io=!0,oo=null,n=xo(e,null,r,n),e.child=n;n;)n.flags=-3&n.flags|4096,n=n.sibling}else{if(po(),r===i){e=Ws(t,e,n);break t}_s(t,e,r,n)}e=e.child}return e;case 5:return Zo(e),null===t&&co(e),r=e.type,i=e.pendingProps,a=null!==t?t.memoizedProps:null,s=i.children,ni(r,i)?s=null:null!==a&&ni(r,a)&&(e.flags|=32),Cs(t,e),_s(t,e,s,n),e.child;case 6:return null===t&&co(e),null;case 13:return Ls(t,e,n);case 4:return Xo(e,e.stateNode.containerInfo),r=e.pendingProps,null===t?e.child=wo(e,null,r,n):_s(t,e,r,n),e.child;case 11:return r=e.type,i=e.pendingProps,ws(t,e,r,i=e.elementType===r?i:ns(r,i),n);case 7:return _s(t,e,e.pendingProps,n),e.child;case 8:case 12:return _s(t,e,e.pendingProps.children,n),e.child;case 10:t:{if(r=e.type._context,i=e.pendingProps,a=e.memoizedProps,s=i.value,Ti(So,r._currentValue),r._currentValue=s,null!==a)if(sr(a.value,s)){if(a.children===i.children&&!Ai.current){e=Ws(t,e,n);break t}}else for(null!==(a=e.child)&&(a.return=e);null!==a;){var l=a.dependencies;if(null!==l){s=a.child;for(var c=l.firstContext;null!==c;){if(c.context===r){if(1===a.tag){(c=zo(-1,n&-n)).tag=2;var u=a.updateQueue;if(null!==u){var d=(u=u.shared).pending;null===d?c.next=c:(c.next=d.next,d.next=c),u.pending=c}}a.lanes|=n,null!==(c=a.alternate)&&(c.lanes|=n),Ao(a.return,n,e),l.lanes|=n;break}c=c.next}}else if(10===a.tag)s=a.type===e.type?null:a.child;else if(18===a.tag){if(null===(s=a.return))throw Error(o(341));s.lanes|=n,null!==(l=s.alternate)&&(l.lanes|=n),Ao(s,n,e),s=a.sibling}else s=a.child;if(null!==s)s.return=a;else for(s=a;null!==s;){if(s===e){s=null;break}if(null!==(a=s.sibling)){a.return=s.return,s=a;break}s=s.return}a=s}_s(t,e,i.children,n),e=e.child}return e;case 9:return i=e.type,r=e.pendingProps.children,Io(e,n),r=r(i=Mo(i)),e.flags|=1,_s(t,e,r,n),e.child;case 14:return i=ns(r=e.type,e.pendingProps),xs(t,e,r,i=ns(r.type,i),n);case 15:return Ss(t,e,e.type,e.pendingProps,n);case 17:return r=e.type,i=e.pendingProps,i=e.elementType===r?i:ns(r,i),$s(t,e),e.tag=1,Fi(r)?(t=!0,Ni(e)):t=!1,Io(e,n),as(e,r,i),ls(e,r,i,n),Es(null,e,r,!0,t,n);case 19:return Vs(t,e,n);case 22:return ks(t,e,n)}throw Error(o(156,e.tag))};var Yc="function"===typeof reportError?reportError:function(t){console.error(t)};function qc(t){this._internalRoot=t}function Kc(t){this._internalRoot=t}function Xc(t){return!(!t||1!==t.nodeType&&9!==t.nodeType&&11!==t.nodeType)}function Qc(t){return!(!t||1!==t.nodeType&&9!==t.nodeType&&11!==t.nodeType&&(8!==t.nodeType||" react-mount-point-unstable "!==t.nodeValue))}function Zc(){}function Jc(t,e,n,r,i){var o=n._reactRootContainer;if(o){var a=o;if("function"===typeof i){var s=i;i=function(){var t=Wc(a);s.call(t)}}$c(e,a,t,i)}else a=function(t,e,n,r,i){if(i){if("function"===typeof r){var o=r;r=function(){var t=Wc(a);o.call(t)}}var a=Vc(e,r,t,0,null,!1,0,"",Zc);return t._reactRootContainer=a,t[pi]=a.current,Vr(8===t.nodeType?t.parentNode:t),uc(),a}for(;i=t.lastChild;)t.removeChild(i);if("function"===typeof r){var s=r;r=function(){var t=Wc(l);s.call(t)}}var l=jc(t,0,!1,null,0,!1,0,"",Zc);return t._reactRootContainer=l,t[pi]=l.current,Vr(8===t.nodeType?t.parentNode:t),uc((function(){$c(e,l,n,r)})),l}(n,e,t,i,r);return Wc(a)}Kc.prototype.render=qc.prototype.render=function(t){var e=this._internalRoot;if(null===e)throw Error(o(409));$c(t,e,null,null)},Kc.prototype.unmount=qc.prototype.unmount=function(){var t=this._internalRoot;if(null!==t){this._internalRoot=null;var e=t.containerInfo;uc((function(){$c(null,t,null,null)})),e[pi]=null}},Kc.prototype.unstable_scheduleHydration=function(t){if(t){var e=ke();t={blockedOn:null,target:t,priority:e};for(var n=0;n<De.length&&0!==e&&e<De[n].priority;n++);De.splice(n,0,t),0===n&&Le(t)}},we=function(t){switch(t.tag){case 3:var e=t.stateNode;if(e.current.memoizedState.isDehydrated){var n=de(e.pendingLanes);0!==n&&(be(e,1|n),rc(e,Qt()),0===(6&El)&&(Vl=Qt()+500,Vi()))}break;case 13:uc((function(){var e=Oo(t,1);if(null!==e){var n=tc();nc(e,t,1,n)}})),Hc(t,1)}},xe=function(t){if(13===t.tag){var e=Oo(t,134217728);if(null!==e)nc(e,t,134217728,tc());Hc(t,134217728)}},Se=function(t){if(13===t.tag){var e=ec(t),n=Oo(t,e);if(null!==n)nc(n,t,e,tc());Hc(t,e)}},ke=function(){return ve},Ce=function(t,e){var n=ve;try{return ve=t,e()}finally{ve=n}},xt=function(t,e,n){switch(e){case"input":if(Z(t,n),e=n.name,"radio"===n.type&&null!=e){for(n=t;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+e)+'][type="radio"]'),e=0;e<n.length;e++){var r=n[e];if(r!==t&&r.form===t.form){var i=wi(r);if(!i)throw Error(o(90));Y(r),Z(r,i)}}}break;case"textarea":ot(t,n);break;case"select":null!=(e=n.value)&&nt(t,!!n.multiple,e,!1)}},Et=cc,At=uc;var tu={usingClientEntryPoint:!1,Events:[vi,_i,wi,Tt,Pt,cc]},eu={findFiberByHostInstance:bi,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},nu={bundleType:eu.bundleType,version:eu.version,rendererPackageName:eu.rendererPackageName,rendererConfig:eu.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:_.ReactCurrentDispatcher,findHostInstanceByFiber:function(t){return null===(t=Gt(t))?null:t.stateNode},findFiberByHostInstance:eu.findFiberByHostInstance||function(){return null},findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var ru=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!ru.isDisabled&&ru.supportsFiber)try{ie=ru.inject(nu),oe=ru}catch(ut){}}e.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=tu,e.createPortal=function(t,e){var n=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!Xc(e))throw Error(o(200));return function(t,e,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:x,key:null==r?null:""+r,children:t,containerInfo:e,implementation:n}}(t,e,null,n)},e.createRoot=function(t,e){if(!Xc(t))throw Error(o(299));var n=!1,r="",i=Yc;return null!==e&&void 0!==e&&(!0===e.unstable_strictMode&&(n=!0),void 0!==e.identifierPrefix&&(r=e.identifierPrefix),void 0!==e.onRecoverableError&&(i=e.onRecoverableError)),e=jc(t,1,!1,null,0,n,0,r,i),t[pi]=e.current,Vr(8===t.nodeType?t.parentNode:t),new qc(e)},e.findDOMNode=function(t){if(null==t)return null;if(1===t.nodeType)return t;var e=t._reactInternals;if(void 0===e){if("function"===typeof t.render)throw Error(o(188));throw t=Object.keys(t).join(","),Error(o(268,t))}return t=null===(t=Gt(e))?null:t.stateNode},e.flushSync=function(t){return uc(t)},e.hydrate=function(t,e,n){if(!Qc(e))throw Error(o(200));return Jc(null,t,e,!0,n)},e.hydrateRoot=function(t,e,n){if(!Xc(t))throw Error(o(405));var r=null!=n&&n.hydratedSources||null,i=!1,a="",s=Yc;if(null!==n&&void 0!==n&&(!0===n.unstable_strictMode&&(i=!0),void 0!==n.identifierPrefix&&(a=n.identifierPrefix),void 0!==n.onRecoverableError&&(s=n.onRecoverableError)),e=Vc(e,null,t,1,null!=n?n:null,i,0,a,s),t[pi]=e.current,Vr(t),r)for(t=0;t<r.length;t++)i=(i=(n=r[t])._getVersion)(n._source),null==e.mutableSourceEagerHydrationData?e.mutableSourceEagerHydrationData=[n,i]:e.mutableSourceEagerHydrationData.push(n,i);return new Kc(e)},e.render=function(t,e,n){if(!Qc(e))throw Error(o(200));return Jc(null,t,e,!1,n)},e.unmountComponentAtNode=function(t){if(!Qc(t))throw Error(o(40));return!!t._reactRootContainer&&(uc((function(){Jc(null,null,t,!1,(function(){t._reactRootContainer=null,t[pi]=null}))})),!0)},e.unstable_batchedUpdates=cc,e.unstable_renderSubtreeIntoContainer=function(t,e,n,r){if(!Qc(n))throw Error(o(200));if(null==t||void 0===t._reactInternals)throw Error(o(38));return Jc(t,e,n,!1,r)},e.version="18.3.1-next-f1338f8080-20240426"},2761:t=>{t.exports=function(t){return null!=t&&"object"==typeof t}},2941:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Image=void 0;const r=n(7149),i=n(1751),o=n(3304),a=n(4602),s=n(9910);class l extends o.Shape{constructor(t){super(t),this._loadListener=()=>{this._requestDraw()},this.on("imageChange.konva",(t=>{this._removeImageLoad(t.oldVal),this._setImageLoad()})),this._setImageLoad()}_setImageLoad(){const t=this.image();t&&t.complete||t&&4===t.readyState||t&&t.addEventListener&&t.addEventListener("load",this._loadListener)}_removeImageLoad(t){t&&t.removeEventListener&&t.removeEventListener("load",this._loadListener)}destroy(){return this._removeImageLoad(this.image()),super.destroy(),this}_useBufferCanvas(){const t=!!this.cornerRadius(),e=this.hasShadow();return!(!t||!e)||super._useBufferCanvas(!0)}_sceneFunc(t){const e=this.getWidth(),n=this.getHeight(),i=this.cornerRadius(),o=this.attrs.image;let a;if(o){const t=this.attrs.cropWidth,r=this.attrs.cropHeight;a=t&&r?[o,this.cropX(),this.cropY(),t,r,0,0,e,n]:[o,0,0,e,n]}(this.hasFill()||this.hasStroke()||i)&&(t.beginPath(),i?r.Util.drawRoundedRectPath(t,e,n,i):t.rect(0,0,e,n),t.closePath(),t.fillStrokeShape(this)),o&&(i&&t.clip(),t.drawImage.apply(t,a))}_hitFunc(t){const e=this.width(),n=this.height(),i=this.cornerRadius();t.beginPath(),i?r.Util.drawRoundedRectPath(t,e,n,i):t.rect(0,0,e,n),t.closePath(),t.fillStrokeShape(this)}getWidth(){var t,e;return null!==(t=this.attrs.width)&&void 0!==t?t:null===(e=this.image())||void 0===e?void 0:e.width}getHeight(){var t,e;return null!==(t=this.attrs.height)&&void 0!==t?t:null===(e=this.image())||void 0===e?void 0:e.height}static fromURL(t,e){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:null;const i=r.Util.createImageElement();i.onload=function(){const t=new l({image:i});e(t)},i.onerror=n,i.crossOrigin="Anonymous",i.src=t}}e.Image=l,l.prototype.className="Image",(0,a._registerNode)(l),i.Factory.addGetterSetter(l,"cornerRadius",0,(0,s.getNumberOrArrayOfNumbersValidator)(4)),i.Factory.addGetterSetter(l,"image"),i.Factory.addComponentsGetterSetter(l,"crop",["x","y","width","height"]),i.Factory.addGetterSetter(l,"cropX",0,(0,s.getNumberValidator)()),i.Factory.addGetterSetter(l,"cropY",0,(0,s.getNumberValidator)()),i.Factory.addGetterSetter(l,"cropWidth",0,(0,s.getNumberValidator)()),i.Factory.addGetterSetter(l,"cropHeight",0,(0,s.getNumberValidator)())},3169:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Text=void 0,e.stringToArray=c;const r=n(7149),i=n(1751),o=n(3304),a=n(4602),s=n(9910),l=n(4602);function c(t){return[...t].reduce(((t,e,n,r)=>{if(/\p{Emoji}/u.test(e)){const i=r[n+1];i&&/\p{Emoji_Modifier}|\u200D/u.test(i)?(t.push(e+i),r[n+1]=""):t.push(e)}else/\p{Regional_Indicator}{2}/u.test(e+(r[n+1]||""))?t.push(e+r[n+1]):n>0&&/\p{Mn}|\p{Me}|\p{Mc}/u.test(e)?t[t.length-1]+=e:e&&t.push(e);return t}),[])}const u="auto",d="inherit",h="justify",f="left",p="middle",g="normal",m=" ",y="none",b=["direction","fontFamily","fontSize","fontStyle","fontVariant","padding","align","verticalAlign","lineHeight","text","width","height","wrap","ellipsis","letterSpacing"],v=b.length;let _;function w(){return _||(_=r.Util.createCanvasElement().getContext("2d"),_)}class x extends o.Shape{constructor(t){super(function(t){return(t=t||{}).fillLinearGradientColorStops||t.fillRadialGradientColorStops||t.fillPatternImage||(t.fill=t.fill||"black"),t}(t)),this._partialTextX=0,this._partialTextY=0;for(let e=0;e<v;e++)this.on(b[e]+"Change.konva",this._setTextData);this._setTextData()}_sceneFunc(t){const e=this.textArr,n=e.length;if(!this.text())return;let r,i=this.padding(),o=this.fontSize(),s=this.lineHeight()*o,l=this.verticalAlign(),u=this.direction(),g=0,m=this.align(),y=this.getWidth(),b=this.letterSpacing(),v=this.fill(),_=this.textDecoration(),w=-1!==_.indexOf("underline"),x=-1!==_.indexOf("line-through");u=u===d?t.direction:u;let S=s/2,k=p;if(a.Konva._fixTextRendering){const t=this.measureSize("M");k="alphabetic",S=(t.fontBoundingBoxAscent-t.fontBoundingBoxDescent)/2+s/2}var C=0,T=0;for("rtl"===u&&t.setAttr("direction",u),t.setAttr("font",this._getContextFont()),t.setAttr("textBaseline",k),t.setAttr("textAlign",f),l===p?g=(this.getHeight()-n*s-2*i)/2:"bottom"===l&&(g=this.getHeight()-n*s-2*i),t.translate(i,g+i),r=0;r<n;r++){C=0,T=0;var P,E,A=e[r],I=A.text,M=A.width,F=A.lastInParagraph;if(t.save(),"right"===m?C+=y-M-2*i:"center"===m&&(C+=(y-M-2*i)/2),w){t.save(),t.beginPath();const e=C,n=S+T+(a.Konva._fixTextRendering?Math.round(o/4):Math.round(o/2));t.moveTo(e,n),0===(P=I.split(" ").length-1),E=m!==h||F?M:y-2*i,t.lineTo(e+Math.round(E),n),t.lineWidth=o/15;const r=this._getLinearGradient();t.strokeStyle=r||v,t.stroke(),t.restore()}if(x){t.save(),t.beginPath();const e=a.Konva._fixTextRendering?-Math.round(o/4):0;t.moveTo(C,S+T+e),0===(P=I.split(" ").length-1),E=m!==h||F?M:y-2*i,t.lineTo(C+Math.round(E),S+T+e),t.lineWidth=o/15;const n=this._getLinearGradient();t.strokeStyle=n||v,t.stroke(),t.restore()}if("rtl"===u||0===b&&m!==h)0!==b&&t.setAttr("letterSpacing",`${b}px`),this._partialTextX=C,this._partialTextY=S+T,this._partialText=I,t.fillStrokeShape(this);else{P=I.split(" ").length-1;const e=c(I);for(let n=0;n<e.length;n++){const r=e[n];" "!==r||F||m!==h||(C+=(y-2*i-M)/P),this._partialTextX=C,this._partialTextY=S+T,this._partialText=r,t.fillStrokeShape(this),C+=this.measureSize(r).width+b}}t.restore(),n>1&&(S+=s)}}_hitFunc(t){const e=this.getWidth(),n=this.getHeight();t.beginPath(),t.rect(0,0,e,n),t.closePath(),t.fillStrokeShape(this)}setText(t){const e=r.Util._isString(t)?t:null===t||void 0===t?"":t+"";return this._setAttr("text",e),this}getWidth(){return this.attrs.width===u||void 0===this.attrs.width?this.getTextWidth()+2*this.padding():this.attrs.width}getHeight(){return this.attrs.height===u||void 0===this.attrs.height?this.fontSize()*this.textArr.length*this.lineHeight()+2*this.padding():this.attrs.height}getTextWidth(){return this.textWidth}getTextHeight(){return r.Util.warn("text.getTextHeight() method is deprecated. Use text.height() - for full height and text.fontSize() - for one line height."),this.textHeight}measureSize(t){var e,n,r,i,o,a,s,l,c,u,d;let h,f=w(),p=this.fontSize();f.save(),f.font=this._getContextFont(),h=f.measureText(t),f.restore();const g=p/100;return{actualBoundingBoxAscent:null!==(e=h.actualBoundingBoxAscent)&&void 0!==e?e:71.58203125*g,actualBoundingBoxDescent:null!==(n=h.actualBoundingBoxDescent)&&void 0!==n?n:0,actualBoundingBoxLeft:null!==(r=h.actualBoundingBoxLeft)&&void 0!==r?r:-7.421875*g,actualBoundingBoxRight:null!==(i=h.actualBoundingBoxRight)&&void 0!==i?i:75.732421875*g,alphabeticBaseline:null!==(o=h.alphabeticBaseline)&&void 0!==o?o:0,emHeightAscent:null!==(a=h.emHeightAscent)&&void 0!==a?a:100*g,emHeightDescent:null!==(s=h.emHeightDescent)&&void 0!==s?s:-20*g,fontBoundingBoxAscent:null!==(l=h.fontBoundingBoxAscent)&&void 0!==l?l:91*g,fontBoundingBoxDescent:null!==(c=h.fontBoundingBoxDescent)&&void 0!==c?c:21*g,hangingBaseline:null!==(u=h.hangingBaseline)&&void 0!==u?u:72.80000305175781*g,ideographicBaseline:null!==(d=h.ideographicBaseline)&&void 0!==d?d:-21*g,width:h.width,height:p}}_getContextFont(){return this.fontStyle()+m+this.fontVariant()+m+(this.fontSize()+"px ")+this.fontFamily().split(",").map((t=>{const e=(t=t.trim()).indexOf(" ")>=0,n=t.indexOf('"')>=0||t.indexOf("'")>=0;return e&&!n&&(t=`"${t}"`),t})).join(", ")}_addTextLine(t){this.align()===h&&(t=t.trim());const e=this._getTextWidth(t);return this.textArr.push({text:t,width:e,lastInParagraph:!1})}_getTextWidth(t){const e=this.letterSpacing(),n=t.length;return w().measureText(t).width+e*n}_setTextData(){let t=this.text().split("\n"),e=+this.fontSize(),n=0,r=this.lineHeight()*e,i=this.attrs.width,o=this.attrs.height,a=i!==u&&void 0!==i,s=o!==u&&void 0!==o,l=this.padding(),d=i-2*l,h=o-2*l,f=0,p=this.wrap(),g="char"!==p&&p!==y,b=this.ellipsis();this.textArr=[],w().font=this._getContextFont();const v=b?this._getTextWidth("\u2026"):0;for(let u=0,y=t.length;u<y;++u){let e=t[u],i=this._getTextWidth(e);if(a&&i>d)for(;e.length>0;){let t=0,o=c(e).length,a="",l=0;for(;t<o;){const n=t+o>>>1,i=c(e).slice(0,n+1).join(""),u=this._getTextWidth(i);(b&&s&&f+r>h?u+v:u)<=d?(t=n+1,a=i,l=u):o=n}if(!a)break;if(g){const n=c(e),r=c(a),i=n[r.length];let o;if((i===m||"-"===i)&&l<=d)o=r.length;else{const t=r.lastIndexOf(m),e=r.lastIndexOf("-");o=Math.max(t,e)+1}o>0&&(t=o,a=n.slice(0,t).join(""),l=this._getTextWidth(a))}a=a.trimRight(),this._addTextLine(a),n=Math.max(n,l),f+=r;if(this._shouldHandleEllipsis(f)){this._tryToAddEllipsisToLastLine();break}if(e=c(e).slice(t).join("").trimLeft(),e.length>0&&(i=this._getTextWidth(e),i<=d)){this._addTextLine(e),f+=r,n=Math.max(n,i);break}}else this._addTextLine(e),f+=r,n=Math.max(n,i),this._shouldHandleEllipsis(f)&&u<y-1&&this._tryToAddEllipsisToLastLine();if(this.textArr[this.textArr.length-1]&&(this.textArr[this.textArr.length-1].lastInParagraph=!0),s&&f+r>h)break}this.textHeight=e,this.textWidth=n}_shouldHandleEllipsis(t){const e=+this.fontSize(),n=this.lineHeight()*e,r=this.attrs.height,i=r!==u&&void 0!==r,o=r-2*this.padding();return!(this.wrap()!==y)||i&&t+n>o}_tryToAddEllipsisToLastLine(){const t=this.attrs.width,e=t!==u&&void 0!==t,n=t-2*this.padding(),r=this.ellipsis(),i=this.textArr[this.textArr.length-1];if(i&&r){if(e){this._getTextWidth(i.text+"\u2026")<n||(i.text=i.text.slice(0,i.text.length-3))}this.textArr.splice(this.textArr.length-1,1),this._addTextLine(i.text+"\u2026")}}getStrokeScaleEnabled(){return!0}_useBufferCanvas(){const t=-1!==this.textDecoration().indexOf("underline")||-1!==this.textDecoration().indexOf("line-through"),e=this.hasShadow();return!(!t||!e)||super._useBufferCanvas()}}e.Text=x,x.prototype._fillFunc=function(t){t.fillText(this._partialText,this._partialTextX,this._partialTextY)},x.prototype._strokeFunc=function(t){t.setAttr("miterLimit",2),t.strokeText(this._partialText,this._partialTextX,this._partialTextY)},x.prototype.className="Text",x.prototype._attrsAffectingSize=["text","fontSize","padding","wrap","lineHeight","letterSpacing"],(0,l._registerNode)(x),i.Factory.overWriteSetter(x,"width",(0,s.getNumberOrAutoValidator)()),i.Factory.overWriteSetter(x,"height",(0,s.getNumberOrAutoValidator)()),i.Factory.addGetterSetter(x,"direction",d),i.Factory.addGetterSetter(x,"fontFamily","Arial"),i.Factory.addGetterSetter(x,"fontSize",12,(0,s.getNumberValidator)()),i.Factory.addGetterSetter(x,"fontStyle",g),i.Factory.addGetterSetter(x,"fontVariant",g),i.Factory.addGetterSetter(x,"padding",0,(0,s.getNumberValidator)()),i.Factory.addGetterSetter(x,"align",f),i.Factory.addGetterSetter(x,"verticalAlign","top"),i.Factory.addGetterSetter(x,"lineHeight",1,(0,s.getNumberValidator)()),i.Factory.addGetterSetter(x,"wrap","word"),i.Factory.addGetterSetter(x,"ellipsis",!1,(0,s.getBooleanValidator)()),i.Factory.addGetterSetter(x,"letterSpacing",0,(0,s.getNumberValidator)()),i.Factory.addGetterSetter(x,"text","",(0,s.getStringValidator)()),i.Factory.addGetterSetter(x,"textDecoration","")},3243:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Animation=void 0;const r=n(4602),i=n(7149),o=r.glob.performance&&r.glob.performance.now?function(){return r.glob.performance.now()}:function(){return(new Date).getTime()};class a{constructor(t,e){this.id=a.animIdCounter++,this.frame={time:0,timeDiff:0,lastTime:o(),frameRate:0},this.func=t,this.setLayers(e)}setLayers(t){let e=[];return t&&(e=Array.isArray(t)?t:[t]),this.layers=e,this}getLayers(){return this.layers}addLayer(t){const e=this.layers,n=e.length;for(let r=0;r<n;r++)if(e[r]._id===t._id)return!1;return this.layers.push(t),!0}isRunning(){const t=a.animations,e=t.length;for(let n=0;n<e;n++)if(t[n].id===this.id)return!0;return!1}start(){return this.stop(),this.frame.timeDiff=0,this.frame.lastTime=o(),a._addAnimation(this),this}stop(){return a._removeAnimation(this),this}_updateFrameObject(t){this.frame.timeDiff=t-this.frame.lastTime,this.frame.lastTime=t,this.frame.time+=this.frame.timeDiff,this.frame.frameRate=1e3/this.frame.timeDiff}static _addAnimation(t){this.animations.push(t),this._handleAnimation()}static _removeAnimation(t){const e=t.id,n=this.animations,r=n.length;for(let i=0;i<r;i++)if(n[i].id===e){this.animations.splice(i,1);break}}static _runFrames(){const t={},e=this.animations;for(let n=0;n<e.length;n++){const r=e[n],i=r.layers,a=r.func;r._updateFrameObject(o());const s=i.length;let l;if(l=!a||!1!==a.call(r,r.frame),l)for(let e=0;e<s;e++){const n=i[e];void 0!==n._id&&(t[n._id]=n)}}for(const n in t)t.hasOwnProperty(n)&&t[n].batchDraw()}static _animationLoop(){const t=a;t.animations.length?(t._runFrames(),i.Util.requestAnimFrame(t._animationLoop)):t.animRunning=!1}static _handleAnimation(){this.animRunning||(this.animRunning=!0,i.Util.requestAnimFrame(this._animationLoop))}}e.Animation=a,a.animations=[],a.animIdCounter=0,a.animRunning=!1},3304:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Shape=e.shapes=void 0;const r=n(4602),i=n(7149),o=n(1751),a=n(1189),s=n(9910),l=n(4602),c=n(9485),u="hasShadow",d="shadowRGBA",h="patternImage",f="linearGradient",p="radialGradient";let g;function m(){return g||(g=i.Util.createCanvasElement().getContext("2d"),g)}e.shapes={};class y extends a.Node{constructor(t){let n;for(super(t);n=i.Util.getRandomColor(),!n||n in e.shapes;);this.colorKey=n,e.shapes[n]=this}getContext(){return i.Util.warn("shape.getContext() method is deprecated. Please do not use it."),this.getLayer().getContext()}getCanvas(){return i.Util.warn("shape.getCanvas() method is deprecated. Please do not use it."),this.getLayer().getCanvas()}getSceneFunc(){return this.attrs.sceneFunc||this._sceneFunc}getHitFunc(){return this.attrs.hitFunc||this._hitFunc}hasShadow(){return this._getCache(u,this._hasShadow)}_hasShadow(){return this.shadowEnabled()&&0!==this.shadowOpacity()&&!!(this.shadowColor()||this.shadowBlur()||this.shadowOffsetX()||this.shadowOffsetY())}_getFillPattern(){return this._getCache(h,this.__getFillPattern)}__getFillPattern(){if(this.fillPatternImage()){const t=m().createPattern(this.fillPatternImage(),this.fillPatternRepeat()||"repeat");if(t&&t.setTransform){const e=new i.Transform;e.translate(this.fillPatternX(),this.fillPatternY()),e.rotate(r.Konva.getAngle(this.fillPatternRotation())),e.scale(this.fillPatternScaleX(),this.fillPatternScaleY()),e.translate(-1*this.fillPatternOffsetX(),-1*this.fillPatternOffsetY());const n=e.getMatrix(),o="undefined"===typeof DOMMatrix?{a:n[0],b:n[1],c:n[2],d:n[3],e:n[4],f:n[5]}:new DOMMatrix(n);t.setTransform(o)}return t}}_getLinearGradient(){return this._getCache(f,this.__getLinearGradient)}__getLinearGradient(){const t=this.fillLinearGradientColorStops();if(t){const e=m(),n=this.fillLinearGradientStartPoint(),r=this.fillLinearGradientEndPoint(),i=e.createLinearGradient(n.x,n.y,r.x,r.y);for(let o=0;o<t.length;o+=2)i.addColorStop(t[o],t[o+1]);return i}}_getRadialGradient(){return this._getCache(p,this.__getRadialGradient)}__getRadialGradient(){const t=this.fillRadialGradientColorStops();if(t){const e=m(),n=this.fillRadialGradientStartPoint(),r=this.fillRadialGradientEndPoint(),i=e.createRadialGradient(n.x,n.y,this.fillRadialGradientStartRadius(),r.x,r.y,this.fillRadialGradientEndRadius());for(let o=0;o<t.length;o+=2)i.addColorStop(t[o],t[o+1]);return i}}getShadowRGBA(){return this._getCache(d,this._getShadowRGBA)}_getShadowRGBA(){if(!this.hasShadow())return;const t=i.Util.colorToRGBA(this.shadowColor());return t?"rgba("+t.r+","+t.g+","+t.b+","+t.a*(this.shadowOpacity()||1)+")":void 0}hasFill(){return this._calculate("hasFill",["fillEnabled","fill","fillPatternImage","fillLinearGradientColorStops","fillRadialGradientColorStops"],(()=>this.fillEnabled()&&!!(this.fill()||this.fillPatternImage()||this.fillLinearGradientColorStops()||this.fillRadialGradientColorStops())))}hasStroke(){return this._calculate("hasStroke",["strokeEnabled","strokeWidth","stroke","strokeLinearGradientColorStops"],(()=>this.strokeEnabled()&&this.strokeWidth()&&!(!this.stroke()&&!this.strokeLinearGradientColorStops())))}hasHitStroke(){const t=this.hitStrokeWidth();return"auto"===t?this.hasStroke():this.strokeEnabled()&&!!t}intersects(t){const e=this.getStage();if(!e)return!1;const n=e.bufferHitCanvas;n.getContext().clear(),this.drawHit(n,void 0,!0);return n.context.getImageData(Math.round(t.x),Math.round(t.y),1,1).data[3]>0}destroy(){return a.Node.prototype.destroy.call(this),delete e.shapes[this.colorKey],delete this.colorKey,this}_useBufferCanvas(t){var e;if(!(null===(e=this.attrs.perfectDrawEnabled)||void 0===e||e))return!1;const n=t||this.hasFill(),r=this.hasStroke(),i=1!==this.getAbsoluteOpacity();if(n&&r&&i)return!0;const o=this.hasShadow(),a=this.shadowForStrokeEnabled();return!!(n&&r&&o&&a)}setStrokeHitEnabled(t){i.Util.warn("strokeHitEnabled property is deprecated. Please use hitStrokeWidth instead."),t?this.hitStrokeWidth("auto"):this.hitStrokeWidth(0)}getStrokeHitEnabled(){return 0!==this.hitStrokeWidth()}getSelfRect(){const t=this.size();return{x:this._centroid?-t.width/2:0,y:this._centroid?-t.height/2:0,width:t.width,height:t.height}}getClientRect(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},e=!1,n=this.getParent();for(;n;){if(n.isCached()){e=!0;break}n=n.getParent()}const r=t.skipTransform,i=t.relativeTo||e&&this.getStage()||void 0,o=this.getSelfRect(),a=!t.skipStroke&&this.hasStroke()&&this.strokeWidth()||0,s=o.width+a,l=o.height+a,c=!t.skipShadow&&this.hasShadow(),u=c?this.shadowOffsetX():0,d=c?this.shadowOffsetY():0,h=s+Math.abs(u),f=l+Math.abs(d),p=c&&this.shadowBlur()||0,g={width:h+2*p,height:f+2*p,x:-(a/2+p)+Math.min(u,0)+o.x,y:-(a/2+p)+Math.min(d,0)+o.y};return r?g:this._transformedRect(g,i)}drawScene(t,e,n){const r=this.getLayer();let i,o,a=t||r.getCanvas(),s=a.getContext(),l=this._getCanvasCache(),c=this.getSceneFunc(),u=this.hasShadow();const d=a.isCache,h=e===this;if(!this.isVisible()&&!h)return this;if(l){s.save();const t=this.getAbsoluteTransform(e).getMatrix();return s.transform(t[0],t[1],t[2],t[3],t[4],t[5]),this._drawCachedSceneCanvas(s),s.restore(),this}if(!c)return this;if(s.save(),this._useBufferCanvas()&&!d){i=this.getStage();const t=n||i.bufferCanvas;o=t.getContext(),o.clear(),o.save(),o._applyLineJoin(this);var f=this.getAbsoluteTransform(e).getMatrix();o.transform(f[0],f[1],f[2],f[3],f[4],f[5]),c.call(this,o,this),o.restore();const r=t.pixelRatio;u&&s._applyShadow(this),s._applyOpacity(this),s._applyGlobalCompositeOperation(this),s.drawImage(t._canvas,0,0,t.width/r,t.height/r)}else{if(s._applyLineJoin(this),!h){f=this.getAbsoluteTransform(e).getMatrix();s.transform(f[0],f[1],f[2],f[3],f[4],f[5]),s._applyOpacity(this),s._applyGlobalCompositeOperation(this)}u&&s._applyShadow(this),c.call(this,s,this)}return s.restore(),this}drawHit(t,e){let n=arguments.length>2&&void 0!==arguments[2]&&arguments[2];if(!this.shouldDrawHit(e,n))return this;const r=this.getLayer(),o=t||r.hitCanvas,a=o&&o.getContext(),s=this.hitFunc()||this.sceneFunc(),l=this._getCanvasCache(),c=l&&l.hit;if(this.colorKey||i.Util.warn("Looks like your canvas has a destroyed shape in it. Do not reuse shape after you destroyed it. If you want to reuse shape you should call remove() instead of destroy()"),c){a.save();const t=this.getAbsoluteTransform(e).getMatrix();return a.transform(t[0],t[1],t[2],t[3],t[4],t[5]),this._drawCachedHitCanvas(a),a.restore(),this}if(!s)return this;a.save(),a._applyLineJoin(this);if(!(this===e)){const t=this.getAbsoluteTransform(e).getMatrix();a.transform(t[0],t[1],t[2],t[3],t[4],t[5])}return s.call(this,a,this),a.restore(),this}drawHitFromCache(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:0;const e=this._getCanvasCache(),n=this._getCachedSceneCanvas(),r=e.hit,o=r.getContext(),a=r.getWidth(),s=r.getHeight();o.clear(),o.drawImage(n._canvas,0,0,a,s);try{const e=o.getImageData(0,0,a,s),n=e.data,r=n.length,l=i.Util._hexToRgb(this.colorKey);for(let i=0;i<r;i+=4){n[i+3]>t?(n[i]=l.r,n[i+1]=l.g,n[i+2]=l.b,n[i+3]=255):n[i+3]=0}o.putImageData(e,0,0)}catch(l){i.Util.error("Unable to draw hit graph from cached scene canvas. "+l.message)}return this}hasPointerCapture(t){return c.hasPointerCapture(t,this)}setPointerCapture(t){c.setPointerCapture(t,this)}releaseCapture(t){c.releaseCapture(t,this)}}e.Shape=y,y.prototype._fillFunc=function(t){const e=this.attrs.fillRule;e?t.fill(e):t.fill()},y.prototype._strokeFunc=function(t){t.stroke()},y.prototype._fillFuncHit=function(t){const e=this.attrs.fillRule;e?t.fill(e):t.fill()},y.prototype._strokeFuncHit=function(t){t.stroke()},y.prototype._centroid=!1,y.prototype.nodeType="Shape",(0,l._registerNode)(y),y.prototype.eventListeners={},y.prototype.on.call(y.prototype,"shadowColorChange.konva shadowBlurChange.konva shadowOffsetChange.konva shadowOpacityChange.konva shadowEnabledChange.konva",(function(){this._clearCache(u)})),y.prototype.on.call(y.prototype,"shadowColorChange.konva shadowOpacityChange.konva shadowEnabledChange.konva",(function(){this._clearCache(d)})),y.prototype.on.call(y.prototype,"fillPriorityChange.konva fillPatternImageChange.konva fillPatternRepeatChange.konva fillPatternScaleXChange.konva fillPatternScaleYChange.konva fillPatternOffsetXChange.konva fillPatternOffsetYChange.konva fillPatternXChange.konva fillPatternYChange.konva fillPatternRotationChange.konva",(function(){this._clearCache(h)})),y.prototype.on.call(y.prototype,"fillPriorityChange.konva fillLinearGradientColorStopsChange.konva fillLinearGradientStartPointXChange.konva fillLinearGradientStartPointYChange.konva fillLinearGradientEndPointXChange.konva fillLinearGradientEndPointYChange.konva",(function(){this._clearCache(f)})),y.prototype.on.call(y.prototype,"fillPriorityChange.konva fillRadialGradientColorStopsChange.konva fillRadialGradientStartPointXChange.konva fillRadialGradientStartPointYChange.konva fillRadialGradientEndPointXChange.konva fillRadialGradientEndPointYChange.konva fillRadialGradientStartRadiusChange.konva fillRadialGradientEndRadiusChange.konva",(function(){this._clearCache(p)})),o.Factory.addGetterSetter(y,"stroke",void 0,(0,s.getStringOrGradientValidator)()),o.Factory.addGetterSetter(y,"strokeWidth",2,(0,s.getNumberValidator)()),o.Factory.addGetterSetter(y,"fillAfterStrokeEnabled",!1),o.Factory.addGetterSetter(y,"hitStrokeWidth","auto",(0,s.getNumberOrAutoValidator)()),o.Factory.addGetterSetter(y,"strokeHitEnabled",!0,(0,s.getBooleanValidator)()),o.Factory.addGetterSetter(y,"perfectDrawEnabled",!0,(0,s.getBooleanValidator)()),o.Factory.addGetterSetter(y,"shadowForStrokeEnabled",!0,(0,s.getBooleanValidator)()),o.Factory.addGetterSetter(y,"lineJoin"),o.Factory.addGetterSetter(y,"lineCap"),o.Factory.addGetterSetter(y,"sceneFunc"),o.Factory.addGetterSetter(y,"hitFunc"),o.Factory.addGetterSetter(y,"dash"),o.Factory.addGetterSetter(y,"dashOffset",0,(0,s.getNumberValidator)()),o.Factory.addGetterSetter(y,"shadowColor",void 0,(0,s.getStringValidator)()),o.Factory.addGetterSetter(y,"shadowBlur",0,(0,s.getNumberValidator)()),o.Factory.addGetterSetter(y,"shadowOpacity",1,(0,s.getNumberValidator)()),o.Factory.addComponentsGetterSetter(y,"shadowOffset",["x","y"]),o.Factory.addGetterSetter(y,"shadowOffsetX",0,(0,s.getNumberValidator)()),o.Factory.addGetterSetter(y,"shadowOffsetY",0,(0,s.getNumberValidator)()),o.Factory.addGetterSetter(y,"fillPatternImage"),o.Factory.addGetterSetter(y,"fill",void 0,(0,s.getStringOrGradientValidator)()),o.Factory.addGetterSetter(y,"fillPatternX",0,(0,s.getNumberValidator)()),o.Factory.addGetterSetter(y,"fillPatternY",0,(0,s.getNumberValidator)()),o.Factory.addGetterSetter(y,"fillLinearGradientColorStops"),o.Factory.addGetterSetter(y,"strokeLinearGradientColorStops"),o.Factory.addGetterSetter(y,"fillRadialGradientStartRadius",0),o.Factory.addGetterSetter(y,"fillRadialGradientEndRadius",0),o.Factory.addGetterSetter(y,"fillRadialGradientColorStops"),o.Factory.addGetterSetter(y,"fillPatternRepeat","repeat"),o.Factory.addGetterSetter(y,"fillEnabled",!0),o.Factory.addGetterSetter(y,"strokeEnabled",!0),o.Factory.addGetterSetter(y,"shadowEnabled",!0),o.Factory.addGetterSetter(y,"dashEnabled",!0),o.Factory.addGetterSetter(y,"strokeScaleEnabled",!0),o.Factory.addGetterSetter(y,"fillPriority","color"),o.Factory.addComponentsGetterSetter(y,"fillPatternOffset",["x","y"]),o.Factory.addGetterSetter(y,"fillPatternOffsetX",0,(0,s.getNumberValidator)()),o.Factory.addGetterSetter(y,"fillPatternOffsetY",0,(0,s.getNumberValidator)()),o.Factory.addComponentsGetterSetter(y,"fillPatternScale",["x","y"]),o.Factory.addGetterSetter(y,"fillPatternScaleX",1,(0,s.getNumberValidator)()),o.Factory.addGetterSetter(y,"fillPatternScaleY",1,(0,s.getNumberValidator)()),o.Factory.addComponentsGetterSetter(y,"fillLinearGradientStartPoint",["x","y"]),o.Factory.addComponentsGetterSetter(y,"strokeLinearGradientStartPoint",["x","y"]),o.Factory.addGetterSetter(y,"fillLinearGradientStartPointX",0),o.Factory.addGetterSetter(y,"strokeLinearGradientStartPointX",0),o.Factory.addGetterSetter(y,"fillLinearGradientStartPointY",0),o.Factory.addGetterSetter(y,"strokeLinearGradientStartPointY",0),o.Factory.addComponentsGetterSetter(y,"fillLinearGradientEndPoint",["x","y"]),o.Factory.addComponentsGetterSetter(y,"strokeLinearGradientEndPoint",["x","y"]),o.Factory.addGetterSetter(y,"fillLinearGradientEndPointX",0),o.Factory.addGetterSetter(y,"strokeLinearGradientEndPointX",0),o.Factory.addGetterSetter(y,"fillLinearGradientEndPointY",0),o.Factory.addGetterSetter(y,"strokeLinearGradientEndPointY",0),o.Factory.addComponentsGetterSetter(y,"fillRadialGradientStartPoint",["x","y"]),o.Factory.addGetterSetter(y,"fillRadialGradientStartPointX",0),o.Factory.addGetterSetter(y,"fillRadialGradientStartPointY",0),o.Factory.addComponentsGetterSetter(y,"fillRadialGradientEndPoint",["x","y"]),o.Factory.addGetterSetter(y,"fillRadialGradientEndPointX",0),o.Factory.addGetterSetter(y,"fillRadialGradientEndPointY",0),o.Factory.addGetterSetter(y,"fillPatternRotation",0),o.Factory.addGetterSetter(y,"fillRule",void 0,(0,s.getStringValidator)()),o.Factory.backCompat(y,{dashArray:"dash",getDashArray:"getDash",setDashArray:"getDash",drawFunc:"sceneFunc",getDrawFunc:"getSceneFunc",setDrawFunc:"setSceneFunc",drawHitFunc:"hitFunc",getDrawHitFunc:"getHitFunc",setDrawHitFunc:"setHitFunc"})},3354:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.HitContext=e.SceneContext=e.Context=void 0;const r=n(7149),i=n(4602);const o=["arc","arcTo","beginPath","bezierCurveTo","clearRect","clip","closePath","createLinearGradient","createPattern","createRadialGradient","drawImage","ellipse","fill","fillText","getImageData","createImageData","lineTo","moveTo","putImageData","quadraticCurveTo","rect","roundRect","restore","rotate","save","scale","setLineDash","setTransform","stroke","strokeText","transform","translate"];class a{constructor(t){this.canvas=t,i.Konva.enableTrace&&(this.traceArr=[],this._enableTrace())}fillShape(t){t.fillEnabled()&&this._fill(t)}_fill(t){}strokeShape(t){t.hasStroke()&&this._stroke(t)}_stroke(t){}fillStrokeShape(t){t.attrs.fillAfterStrokeEnabled?(this.strokeShape(t),this.fillShape(t)):(this.fillShape(t),this.strokeShape(t))}getTrace(t,e){let n,i,o,a,s=this.traceArr,l=s.length,c="";for(n=0;n<l;n++)i=s[n],o=i.method,o?(a=i.args,c+=o,t?c+="()":r.Util._isArray(a[0])?c+="(["+a.join(",")+"])":(e&&(a=a.map((t=>"number"===typeof t?Math.floor(t):t))),c+="("+a.join(",")+")")):(c+=i.property,t||(c+="="+i.val)),c+=";";return c}clearTrace(){this.traceArr=[]}_trace(t){let e,n=this.traceArr;n.push(t),e=n.length,e>=100&&n.shift()}reset(){const t=this.getCanvas().getPixelRatio();this.setTransform(1*t,0,0,1*t,0,0)}getCanvas(){return this.canvas}clear(t){const e=this.getCanvas();t?this.clearRect(t.x||0,t.y||0,t.width||0,t.height||0):this.clearRect(0,0,e.getWidth()/e.pixelRatio,e.getHeight()/e.pixelRatio)}_applyLineCap(t){const e=t.attrs.lineCap;e&&this.setAttr("lineCap",e)}_applyOpacity(t){const e=t.getAbsoluteOpacity();1!==e&&this.setAttr("globalAlpha",e)}_applyLineJoin(t){const e=t.attrs.lineJoin;e&&this.setAttr("lineJoin",e)}setAttr(t,e){this._context[t]=e}arc(t,e,n,r,i,o){this._context.arc(t,e,n,r,i,o)}arcTo(t,e,n,r,i){this._context.arcTo(t,e,n,r,i)}beginPath(){this._context.beginPath()}bezierCurveTo(t,e,n,r,i,o){this._context.bezierCurveTo(t,e,n,r,i,o)}clearRect(t,e,n,r){this._context.clearRect(t,e,n,r)}clip(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];this._context.clip.apply(this._context,e)}closePath(){this._context.closePath()}createImageData(t,e){const n=arguments;return 2===n.length?this._context.createImageData(t,e):1===n.length?this._context.createImageData(t):void 0}createLinearGradient(t,e,n,r){return this._context.createLinearGradient(t,e,n,r)}createPattern(t,e){return this._context.createPattern(t,e)}createRadialGradient(t,e,n,r,i,o){return this._context.createRadialGradient(t,e,n,r,i,o)}drawImage(t,e,n,r,i,o,a,s,l){const c=arguments,u=this._context;3===c.length?u.drawImage(t,e,n):5===c.length?u.drawImage(t,e,n,r,i):9===c.length&&u.drawImage(t,e,n,r,i,o,a,s,l)}ellipse(t,e,n,r,i,o,a,s){this._context.ellipse(t,e,n,r,i,o,a,s)}isPointInPath(t,e,n,r){return n?this._context.isPointInPath(n,t,e,r):this._context.isPointInPath(t,e,r)}fill(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];this._context.fill.apply(this._context,e)}fillRect(t,e,n,r){this._context.fillRect(t,e,n,r)}strokeRect(t,e,n,r){this._context.strokeRect(t,e,n,r)}fillText(t,e,n,r){r?this._context.fillText(t,e,n,r):this._context.fillText(t,e,n)}measureText(t){return this._context.measureText(t)}getImageData(t,e,n,r){return this._context.getImageData(t,e,n,r)}lineTo(t,e){this._context.lineTo(t,e)}moveTo(t,e){this._context.moveTo(t,e)}rect(t,e,n,r){this._context.rect(t,e,n,r)}roundRect(t,e,n,r,i){this._context.roundRect(t,e,n,r,i)}putImageData(t,e,n){this._context.putImageData(t,e,n)}quadraticCurveTo(t,e,n,r){this._context.quadraticCurveTo(t,e,n,r)}restore(){this._context.restore()}rotate(t){this._context.rotate(t)}save(){this._context.save()}scale(t,e){this._context.scale(t,e)}setLineDash(t){this._context.setLineDash?this._context.setLineDash(t):"mozDash"in this._context?this._context.mozDash=t:"webkitLineDash"in this._context&&(this._context.webkitLineDash=t)}getLineDash(){return this._context.getLineDash()}setTransform(t,e,n,r,i,o){this._context.setTransform(t,e,n,r,i,o)}stroke(t){t?this._context.stroke(t):this._context.stroke()}strokeText(t,e,n,r){this._context.strokeText(t,e,n,r)}transform(t,e,n,r,i,o){this._context.transform(t,e,n,r,i,o)}translate(t,e){this._context.translate(t,e)}_enableTrace(){let t,e,n=this,i=o.length,a=this.setAttr;const s=function(t){let i,o=n[t];n[t]=function(){return e=function(t){const e=[],n=t.length,i=r.Util;for(let r=0;r<n;r++){let n=t[r];i._isNumber(n)?n=Math.round(1e3*n)/1e3:i._isString(n)||(n+=""),e.push(n)}return e}(Array.prototype.slice.call(arguments,0)),i=o.apply(n,arguments),n._trace({method:t,args:e}),i}};for(t=0;t<i;t++)s(o[t]);n.setAttr=function(){a.apply(n,arguments);const t=arguments[0];let e=arguments[1];"shadowOffsetX"!==t&&"shadowOffsetY"!==t&&"shadowBlur"!==t||(e/=this.canvas.getPixelRatio()),n._trace({property:t,val:e})}}_applyGlobalCompositeOperation(t){const e=t.attrs.globalCompositeOperation;!e||"source-over"===e||this.setAttr("globalCompositeOperation",e)}}e.Context=a,["fillStyle","strokeStyle","shadowColor","shadowBlur","shadowOffsetX","shadowOffsetY","letterSpacing","lineCap","lineDashOffset","lineJoin","lineWidth","miterLimit","direction","font","textAlign","textBaseline","globalAlpha","globalCompositeOperation","imageSmoothingEnabled"].forEach((function(t){Object.defineProperty(a.prototype,t,{get(){return this._context[t]},set(e){this._context[t]=e}})}));e.SceneContext=class extends a{constructor(t){let{willReadFrequently:e=!1}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};super(t),this._context=t._canvas.getContext("2d",{willReadFrequently:e})}_fillColor(t){const e=t.fill();this.setAttr("fillStyle",e),t._fillFunc(this)}_fillPattern(t){this.setAttr("fillStyle",t._getFillPattern()),t._fillFunc(this)}_fillLinearGradient(t){const e=t._getLinearGradient();e&&(this.setAttr("fillStyle",e),t._fillFunc(this))}_fillRadialGradient(t){const e=t._getRadialGradient();e&&(this.setAttr("fillStyle",e),t._fillFunc(this))}_fill(t){const e=t.fill(),n=t.getFillPriority();if(e&&"color"===n)return void this._fillColor(t);const r=t.getFillPatternImage();if(r&&"pattern"===n)return void this._fillPattern(t);const i=t.getFillLinearGradientColorStops();if(i&&"linear-gradient"===n)return void this._fillLinearGradient(t);const o=t.getFillRadialGradientColorStops();o&&"radial-gradient"===n?this._fillRadialGradient(t):e?this._fillColor(t):r?this._fillPattern(t):i?this._fillLinearGradient(t):o&&this._fillRadialGradient(t)}_strokeLinearGradient(t){const e=t.getStrokeLinearGradientStartPoint(),n=t.getStrokeLinearGradientEndPoint(),r=t.getStrokeLinearGradientColorStops(),i=this.createLinearGradient(e.x,e.y,n.x,n.y);if(r){for(let t=0;t<r.length;t+=2)i.addColorStop(r[t],r[t+1]);this.setAttr("strokeStyle",i)}}_stroke(t){const e=t.dash(),n=t.getStrokeScaleEnabled();if(t.hasStroke()){if(!n){this.save();const t=this.getCanvas().getPixelRatio();this.setTransform(t,0,0,t,0,0)}this._applyLineCap(t),e&&t.dashEnabled()&&(this.setLineDash(e),this.setAttr("lineDashOffset",t.dashOffset())),this.setAttr("lineWidth",t.strokeWidth()),t.getShadowForStrokeEnabled()||this.setAttr("shadowColor","rgba(0,0,0,0)");t.getStrokeLinearGradientColorStops()?this._strokeLinearGradient(t):this.setAttr("strokeStyle",t.stroke()),t._strokeFunc(this),n||this.restore()}}_applyShadow(t){var e,n,r;const i=null!==(e=t.getShadowRGBA())&&void 0!==e?e:"black",o=null!==(n=t.getShadowBlur())&&void 0!==n?n:5,a=null!==(r=t.getShadowOffset())&&void 0!==r?r:{x:0,y:0},s=t.getAbsoluteScale(),l=this.canvas.getPixelRatio(),c=s.x*l,u=s.y*l;this.setAttr("shadowColor",i),this.setAttr("shadowBlur",o*Math.min(Math.abs(c),Math.abs(u))),this.setAttr("shadowOffsetX",a.x*c),this.setAttr("shadowOffsetY",a.y*u)}};e.HitContext=class extends a{constructor(t){super(t),this._context=t._canvas.getContext("2d",{willReadFrequently:!0})}_fill(t){this.save(),this.setAttr("fillStyle",t.colorKey),t._fillFuncHit(this),this.restore()}strokeShape(t){t.hasHitStroke()&&this._stroke(t)}_stroke(t){if(t.hasHitStroke()){const e=t.getStrokeScaleEnabled();if(!e){this.save();const t=this.getCanvas().getPixelRatio();this.setTransform(t,0,0,t,0,0)}this._applyLineCap(t);const n=t.hitStrokeWidth(),r="auto"===n?t.strokeWidth():n;this.setAttr("lineWidth",r),this.setAttr("strokeStyle",t.colorKey),t._strokeFuncHit(this),e||this.restore()}}}},3535:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Transformer=void 0;const r=n(7149),i=n(1751),o=n(1189),a=n(3304),s=n(1300),l=n(6338),c=n(4602),u=n(9910),d=n(4602),h="tr-konva",f=["resizeEnabledChange","rotateAnchorOffsetChange","rotateEnabledChange","enabledAnchorsChange","anchorSizeChange","borderEnabledChange","borderStrokeChange","borderStrokeWidthChange","borderDashChange","anchorStrokeChange","anchorStrokeWidthChange","anchorFillChange","anchorCornerRadiusChange","ignoreStrokeChange","anchorStyleFuncChange"].map((t=>t+`.${h}`)).join(" "),p="nodesRect",g=["widthChange","heightChange","scaleXChange","scaleYChange","skewXChange","skewYChange","rotationChange","offsetXChange","offsetYChange","transformsEnabledChange","strokeWidthChange"],m={"top-left":-45,"top-center":0,"top-right":45,"middle-right":-90,"middle-left":90,"bottom-left":-135,"bottom-center":180,"bottom-right":135},y="ontouchstart"in c.Konva._global;const b=["top-left","top-center","top-right","middle-right","middle-left","bottom-left","bottom-center","bottom-right"];function v(t,e,n){const r=n.x+(t.x-n.x)*Math.cos(e)-(t.y-n.y)*Math.sin(e),i=n.y+(t.x-n.x)*Math.sin(e)+(t.y-n.y)*Math.cos(e);return{...t,rotation:t.rotation+e,x:r,y:i}}function _(t,e){const n=function(t){return{x:t.x+t.width/2*Math.cos(t.rotation)+t.height/2*Math.sin(-t.rotation),y:t.y+t.height/2*Math.cos(t.rotation)+t.width/2*Math.sin(t.rotation)}}(t);return v(t,e,n)}let w=0;class x extends l.Group{constructor(t){super(t),this._movingAnchorName=null,this._transforming=!1,this._createElements(),this._handleMouseMove=this._handleMouseMove.bind(this),this._handleMouseUp=this._handleMouseUp.bind(this),this.update=this.update.bind(this),this.on(f,this.update),this.getNode()&&this.update()}attachTo(t){return this.setNode(t),this}setNode(t){return r.Util.warn("tr.setNode(shape), tr.node(shape) and tr.attachTo(shape) methods are deprecated. Please use tr.nodes(nodesArray) instead."),this.setNodes([t])}getNode(){return this._nodes&&this._nodes[0]}_getEventNamespace(){return h+this._id}setNodes(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:[];this._nodes&&this._nodes.length&&this.detach();const e=t.filter((t=>!t.isAncestorOf(this)||(r.Util.error("Konva.Transformer cannot be an a child of the node you are trying to attach"),!1)));this._nodes=t=e,1===t.length&&this.useSingleNodeRotation()?this.rotation(t[0].getAbsoluteRotation()):this.rotation(0),this._nodes.forEach((t=>{const e=()=>{1===this.nodes().length&&this.useSingleNodeRotation()&&this.rotation(this.nodes()[0].getAbsoluteRotation()),this._resetTransformCache(),this._transforming||this.isDragging()||this.update()};if(t._attrsAffectingSize.length){const n=t._attrsAffectingSize.map((t=>t+"Change."+this._getEventNamespace())).join(" ");t.on(n,e)}t.on(g.map((t=>t+`.${this._getEventNamespace()}`)).join(" "),e),t.on(`absoluteTransformChange.${this._getEventNamespace()}`,e),this._proxyDrag(t)})),this._resetTransformCache();return!!this.findOne(".top-left")&&this.update(),this}_proxyDrag(t){let e;t.on(`dragstart.${this._getEventNamespace()}`,(n=>{e=t.getAbsolutePosition(),this.isDragging()||t===this.findOne(".back")||this.startDrag(n,!1)})),t.on(`dragmove.${this._getEventNamespace()}`,(n=>{if(!e)return;const r=t.getAbsolutePosition(),i=r.x-e.x,o=r.y-e.y;this.nodes().forEach((e=>{if(e===t)return;if(e.isDragging())return;const r=e.getAbsolutePosition();e.setAbsolutePosition({x:r.x+i,y:r.y+o}),e.startDrag(n)})),e=null}))}getNodes(){return this._nodes||[]}getActiveAnchor(){return this._movingAnchorName}detach(){this._nodes&&this._nodes.forEach((t=>{t.off("."+this._getEventNamespace())})),this._nodes=[],this._resetTransformCache()}_resetTransformCache(){this._clearCache(p),this._clearCache("transform"),this._clearSelfAndDescendantCache("absoluteTransform")}_getNodeRect(){return this._getCache(p,this.__getNodeRect)}__getNodeShape(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.rotation(),n=arguments.length>2?arguments[2]:void 0;const r=t.getClientRect({skipTransform:!0,skipShadow:!0,skipStroke:this.ignoreStroke()}),i=t.getAbsoluteScale(n),o=t.getAbsolutePosition(n),a=r.x*i.x-t.offsetX()*i.x,s=r.y*i.y-t.offsetY()*i.y,l=(c.Konva.getAngle(t.getAbsoluteRotation())+2*Math.PI)%(2*Math.PI);return v({x:o.x+a*Math.cos(l)+s*Math.sin(-l),y:o.y+s*Math.cos(l)+a*Math.sin(l),width:r.width*i.x,height:r.height*i.y,rotation:l},-c.Konva.getAngle(e),{x:0,y:0})}__getNodeRect(){if(!this.getNode())return{x:-1e8,y:-1e8,width:0,height:0,rotation:0};const t=[];this.nodes().map((e=>{const n=e.getClientRect({skipTransform:!0,skipShadow:!0,skipStroke:this.ignoreStroke()}),r=[{x:n.x,y:n.y},{x:n.x+n.width,y:n.y},{x:n.x+n.width,y:n.y+n.height},{x:n.x,y:n.y+n.height}],i=e.getAbsoluteTransform();r.forEach((function(e){const n=i.point(e);t.push(n)}))}));const e=new r.Transform;e.rotate(-c.Konva.getAngle(this.rotation()));let n=1/0,i=1/0,o=-1/0,a=-1/0;t.forEach((function(t){const r=e.point(t);void 0===n&&(n=o=r.x,i=a=r.y),n=Math.min(n,r.x),i=Math.min(i,r.y),o=Math.max(o,r.x),a=Math.max(a,r.y)})),e.invert();const s=e.point({x:n,y:i});return{x:s.x,y:s.y,width:o-n,height:a-i,rotation:c.Konva.getAngle(this.rotation())}}getX(){return this._getNodeRect().x}getY(){return this._getNodeRect().y}getWidth(){return this._getNodeRect().width}getHeight(){return this._getNodeRect().height}_createElements(){this._createBack(),b.forEach((t=>{this._createAnchor(t)})),this._createAnchor("rotater")}_createAnchor(t){const e=new s.Rect({stroke:"rgb(0, 161, 255)",fill:"white",strokeWidth:1,name:t+" _anchor",dragDistance:0,draggable:!0,hitStrokeWidth:y?10:"auto"}),n=this;e.on("mousedown touchstart",(function(t){n._handleMouseDown(t)})),e.on("dragstart",(t=>{e.stopDrag(),t.cancelBubble=!0})),e.on("dragend",(t=>{t.cancelBubble=!0})),e.on("mouseenter",(()=>{const n=c.Konva.getAngle(this.rotation()),i=this.rotateAnchorCursor(),o=function(t,e,n){if("rotater"===t)return n;e+=r.Util.degToRad(m[t]||0);const i=(r.Util.radToDeg(e)%360+360)%360;return r.Util._inRange(i,337.5,360)||r.Util._inRange(i,0,22.5)?"ns-resize":r.Util._inRange(i,22.5,67.5)?"nesw-resize":r.Util._inRange(i,67.5,112.5)?"ew-resize":r.Util._inRange(i,112.5,157.5)?"nwse-resize":r.Util._inRange(i,157.5,202.5)?"ns-resize":r.Util._inRange(i,202.5,247.5)?"nesw-resize":r.Util._inRange(i,247.5,292.5)?"ew-resize":r.Util._inRange(i,292.5,337.5)?"nwse-resize":(r.Util.error("Transformer has unknown angle for cursor detection: "+i),"pointer")}(t,n,i);e.getStage().content&&(e.getStage().content.style.cursor=o),this._cursorChange=!0})),e.on("mouseout",(()=>{e.getStage().content&&(e.getStage().content.style.cursor=""),this._cursorChange=!1})),this.add(e)}_createBack(){const t=new a.Shape({name:"back",width:0,height:0,draggable:!0,sceneFunc(t,e){const n=e.getParent(),i=n.padding();t.beginPath(),t.rect(-i,-i,e.width()+2*i,e.height()+2*i),t.moveTo(e.width()/2,-i),n.rotateEnabled()&&n.rotateLineVisible()&&t.lineTo(e.width()/2,-n.rotateAnchorOffset()*r.Util._sign(e.height())-i),t.fillStrokeShape(e)},hitFunc:(t,e)=>{if(!this.shouldOverdrawWholeArea())return;const n=this.padding();t.beginPath(),t.rect(-n,-n,e.width()+2*n,e.height()+2*n),t.fillStrokeShape(e)}});this.add(t),this._proxyDrag(t),t.on("dragstart",(t=>{t.cancelBubble=!0})),t.on("dragmove",(t=>{t.cancelBubble=!0})),t.on("dragend",(t=>{t.cancelBubble=!0})),this.on("dragmove",(t=>{this.update()}))}_handleMouseDown(t){if(this._transforming)return;this._movingAnchorName=t.target.name().split(" ")[0];const e=this._getNodeRect(),n=e.width,r=e.height,i=Math.sqrt(Math.pow(n,2)+Math.pow(r,2));this.sin=Math.abs(r/i),this.cos=Math.abs(n/i),"undefined"!==typeof window&&(window.addEventListener("mousemove",this._handleMouseMove),window.addEventListener("touchmove",this._handleMouseMove),window.addEventListener("mouseup",this._handleMouseUp,!0),window.addEventListener("touchend",this._handleMouseUp,!0)),this._transforming=!0;const o=t.target.getAbsolutePosition(),a=t.target.getStage().getPointerPosition();this._anchorDragOffset={x:a.x-o.x,y:a.y-o.y},w++,this._fire("transformstart",{evt:t.evt,target:this.getNode()}),this._nodes.forEach((e=>{e._fire("transformstart",{evt:t.evt,target:e})}))}_handleMouseMove(t){let e,n,r;const i=this.findOne("."+this._movingAnchorName),o=i.getStage();o.setPointersPositions(t);const a=o.getPointerPosition();let s={x:a.x-this._anchorDragOffset.x,y:a.y-this._anchorDragOffset.y};const l=i.getAbsolutePosition();this.anchorDragBoundFunc()&&(s=this.anchorDragBoundFunc()(l,s,t)),i.setAbsolutePosition(s);const u=i.getAbsolutePosition();if(l.x===u.x&&l.y===u.y)return;if("rotater"===this._movingAnchorName){const r=this._getNodeRect();e=i.x()-r.width/2,n=-i.y()+r.height/2;let o=Math.atan2(-n,e)+Math.PI/2;r.height<0&&(o-=Math.PI);const a=c.Konva.getAngle(this.rotation())+o,s=c.Konva.getAngle(this.rotationSnapTolerance()),l=function(t,e,n){let r=e;for(let i=0;i<t.length;i++){const o=c.Konva.getAngle(t[i]),a=Math.abs(o-e)%(2*Math.PI);Math.min(a,2*Math.PI-a)<n&&(r=o)}return r}(this.rotationSnaps(),a,s),u=_(r,l-r.rotation);return void this._fitNodesInto(u,t)}const d=this.shiftBehavior();let h;h="inverted"===d?this.keepRatio()&&!t.shiftKey:"none"===d?this.keepRatio():this.keepRatio()||t.shiftKey;var f=this.centeredScaling()||t.altKey;if("top-left"===this._movingAnchorName){if(h){var p=f?{x:this.width()/2,y:this.height()/2}:{x:this.findOne(".bottom-right").x(),y:this.findOne(".bottom-right").y()};r=Math.sqrt(Math.pow(p.x-i.x(),2)+Math.pow(p.y-i.y(),2));var g=this.findOne(".top-left").x()>p.x?-1:1,m=this.findOne(".top-left").y()>p.y?-1:1;e=r*this.cos*g,n=r*this.sin*m,this.findOne(".top-left").x(p.x-e),this.findOne(".top-left").y(p.y-n)}}else if("top-center"===this._movingAnchorName)this.findOne(".top-left").y(i.y());else if("top-right"===this._movingAnchorName){if(h){p=f?{x:this.width()/2,y:this.height()/2}:{x:this.findOne(".bottom-left").x(),y:this.findOne(".bottom-left").y()};r=Math.sqrt(Math.pow(i.x()-p.x,2)+Math.pow(p.y-i.y(),2));g=this.findOne(".top-right").x()<p.x?-1:1,m=this.findOne(".top-right").y()>p.y?-1:1;e=r*this.cos*g,n=r*this.sin*m,this.findOne(".top-right").x(p.x+e),this.findOne(".top-right").y(p.y-n)}var y=i.position();this.findOne(".top-left").y(y.y),this.findOne(".bottom-right").x(y.x)}else if("middle-left"===this._movingAnchorName)this.findOne(".top-left").x(i.x());else if("middle-right"===this._movingAnchorName)this.findOne(".bottom-right").x(i.x());else if("bottom-left"===this._movingAnchorName){if(h){p=f?{x:this.width()/2,y:this.height()/2}:{x:this.findOne(".top-right").x(),y:this.findOne(".top-right").y()};r=Math.sqrt(Math.pow(p.x-i.x(),2)+Math.pow(i.y()-p.y,2));g=p.x<i.x()?-1:1,m=i.y()<p.y?-1:1;e=r*this.cos*g,n=r*this.sin*m,i.x(p.x-e),i.y(p.y+n)}y=i.position(),this.findOne(".top-left").x(y.x),this.findOne(".bottom-right").y(y.y)}else if("bottom-center"===this._movingAnchorName)this.findOne(".bottom-right").y(i.y());else if("bottom-right"===this._movingAnchorName){if(h){p=f?{x:this.width()/2,y:this.height()/2}:{x:this.findOne(".top-left").x(),y:this.findOne(".top-left").y()};r=Math.sqrt(Math.pow(i.x()-p.x,2)+Math.pow(i.y()-p.y,2));g=this.findOne(".bottom-right").x()<p.x?-1:1,m=this.findOne(".bottom-right").y()<p.y?-1:1;e=r*this.cos*g,n=r*this.sin*m,this.findOne(".bottom-right").x(p.x+e),this.findOne(".bottom-right").y(p.y+n)}}else console.error(new Error("Wrong position argument of selection resizer: "+this._movingAnchorName));if(f=this.centeredScaling()||t.altKey){const t=this.findOne(".top-left"),e=this.findOne(".bottom-right"),n=t.x(),r=t.y(),i=this.getWidth()-e.x(),o=this.getHeight()-e.y();e.move({x:-n,y:-r}),t.move({x:i,y:o})}const b=this.findOne(".top-left").getAbsolutePosition();e=b.x,n=b.y;const v=this.findOne(".bottom-right").x()-this.findOne(".top-left").x(),w=this.findOne(".bottom-right").y()-this.findOne(".top-left").y();this._fitNodesInto({x:e,y:n,width:v,height:w,rotation:c.Konva.getAngle(this.rotation())},t)}_handleMouseUp(t){this._removeEvents(t)}getAbsoluteTransform(){return this.getTransform()}_removeEvents(t){var e;if(this._transforming){this._transforming=!1,"undefined"!==typeof window&&(window.removeEventListener("mousemove",this._handleMouseMove),window.removeEventListener("touchmove",this._handleMouseMove),window.removeEventListener("mouseup",this._handleMouseUp,!0),window.removeEventListener("touchend",this._handleMouseUp,!0));const n=this.getNode();w--,this._fire("transformend",{evt:t,target:n}),null===(e=this.getLayer())||void 0===e||e.batchDraw(),n&&this._nodes.forEach((e=>{var n;e._fire("transformend",{evt:t,target:e}),null===(n=e.getLayer())||void 0===n||n.batchDraw()})),this._movingAnchorName=null}}_fitNodesInto(t,e){const n=this._getNodeRect();if(r.Util._inRange(t.width,2*-this.padding()-1,1))return void this.update();if(r.Util._inRange(t.height,2*-this.padding()-1,1))return void this.update();const i=new r.Transform;if(i.rotate(c.Konva.getAngle(this.rotation())),this._movingAnchorName&&t.width<0&&this._movingAnchorName.indexOf("left")>=0){const e=i.point({x:2*-this.padding(),y:0});t.x+=e.x,t.y+=e.y,t.width+=2*this.padding(),this._movingAnchorName=this._movingAnchorName.replace("left","right"),this._anchorDragOffset.x-=e.x,this._anchorDragOffset.y-=e.y}else if(this._movingAnchorName&&t.width<0&&this._movingAnchorName.indexOf("right")>=0){const e=i.point({x:2*this.padding(),y:0});this._movingAnchorName=this._movingAnchorName.replace("right","left"),this._anchorDragOffset.x-=e.x,this._anchorDragOffset.y-=e.y,t.width+=2*this.padding()}if(this._movingAnchorName&&t.height<0&&this._movingAnchorName.indexOf("top")>=0){const e=i.point({x:0,y:2*-this.padding()});t.x+=e.x,t.y+=e.y,this._movingAnchorName=this._movingAnchorName.replace("top","bottom"),this._anchorDragOffset.x-=e.x,this._anchorDragOffset.y-=e.y,t.height+=2*this.padding()}else if(this._movingAnchorName&&t.height<0&&this._movingAnchorName.indexOf("bottom")>=0){const e=i.point({x:0,y:2*this.padding()});this._movingAnchorName=this._movingAnchorName.replace("bottom","top"),this._anchorDragOffset.x-=e.x,this._anchorDragOffset.y-=e.y,t.height+=2*this.padding()}if(this.boundBoxFunc()){const e=this.boundBoxFunc()(n,t);e?t=e:r.Util.warn("boundBoxFunc returned falsy. You should return new bound rect from it!")}const o=1e7,a=new r.Transform;a.translate(n.x,n.y),a.rotate(n.rotation),a.scale(n.width/o,n.height/o);const s=new r.Transform,l=t.width/o,u=t.height/o;!1===this.flipEnabled()?(s.translate(t.x,t.y),s.rotate(t.rotation),s.translate(t.width<0?t.width:0,t.height<0?t.height:0),s.scale(Math.abs(l),Math.abs(u))):(s.translate(t.x,t.y),s.rotate(t.rotation),s.scale(l,u));const d=s.multiply(a.invert());this._nodes.forEach((t=>{var e;const n=t.getParent().getAbsoluteTransform(),i=t.getTransform().copy();i.translate(t.offsetX(),t.offsetY());const o=new r.Transform;o.multiply(n.copy().invert()).multiply(d).multiply(n).multiply(i);const a=o.decompose();t.setAttrs(a),null===(e=t.getLayer())||void 0===e||e.batchDraw()})),this.rotation(r.Util._getRotation(t.rotation)),this._nodes.forEach((t=>{this._fire("transform",{evt:e,target:t}),t._fire("transform",{evt:e,target:t})})),this._resetTransformCache(),this.update(),this.getLayer().batchDraw()}forceUpdate(){this._resetTransformCache(),this.update()}_batchChangeChild(t,e){this.findOne(t).setAttrs(e)}update(){var t;const e=this._getNodeRect();this.rotation(r.Util._getRotation(e.rotation));const n=e.width,i=e.height,o=this.enabledAnchors(),a=this.resizeEnabled(),s=this.padding(),l=this.anchorSize(),c=this.find("._anchor");c.forEach((t=>{t.setAttrs({width:l,height:l,offsetX:l/2,offsetY:l/2,stroke:this.anchorStroke(),strokeWidth:this.anchorStrokeWidth(),fill:this.anchorFill(),cornerRadius:this.anchorCornerRadius()})})),this._batchChangeChild(".top-left",{x:0,y:0,offsetX:l/2+s,offsetY:l/2+s,visible:a&&o.indexOf("top-left")>=0}),this._batchChangeChild(".top-center",{x:n/2,y:0,offsetY:l/2+s,visible:a&&o.indexOf("top-center")>=0}),this._batchChangeChild(".top-right",{x:n,y:0,offsetX:l/2-s,offsetY:l/2+s,visible:a&&o.indexOf("top-right")>=0}),this._batchChangeChild(".middle-left",{x:0,y:i/2,offsetX:l/2+s,visible:a&&o.indexOf("middle-left")>=0}),this._batchChangeChild(".middle-right",{x:n,y:i/2,offsetX:l/2-s,visible:a&&o.indexOf("middle-right")>=0}),this._batchChangeChild(".bottom-left",{x:0,y:i,offsetX:l/2+s,offsetY:l/2-s,visible:a&&o.indexOf("bottom-left")>=0}),this._batchChangeChild(".bottom-center",{x:n/2,y:i,offsetY:l/2-s,visible:a&&o.indexOf("bottom-center")>=0}),this._batchChangeChild(".bottom-right",{x:n,y:i,offsetX:l/2-s,offsetY:l/2-s,visible:a&&o.indexOf("bottom-right")>=0}),this._batchChangeChild(".rotater",{x:n/2,y:-this.rotateAnchorOffset()*r.Util._sign(i)-s,visible:this.rotateEnabled()}),this._batchChangeChild(".back",{width:n,height:i,visible:this.borderEnabled(),stroke:this.borderStroke(),strokeWidth:this.borderStrokeWidth(),dash:this.borderDash(),x:0,y:0});const u=this.anchorStyleFunc();u&&c.forEach((t=>{u(t)})),null===(t=this.getLayer())||void 0===t||t.batchDraw()}isTransforming(){return this._transforming}stopTransform(){if(this._transforming){this._removeEvents();const t=this.findOne("."+this._movingAnchorName);t&&t.stopDrag()}}destroy(){return this.getStage()&&this._cursorChange&&this.getStage().content&&(this.getStage().content.style.cursor=""),l.Group.prototype.destroy.call(this),this.detach(),this._removeEvents(),this}toObject(){return o.Node.prototype.toObject.call(this)}clone(t){return o.Node.prototype.clone.call(this,t)}getClientRect(){return this.nodes().length>0?super.getClientRect():{x:0,y:0,width:0,height:0}}}e.Transformer=x,x.isTransforming=()=>w>0,x.prototype.className="Transformer",(0,d._registerNode)(x),i.Factory.addGetterSetter(x,"enabledAnchors",b,(function(t){return t instanceof Array||r.Util.warn("enabledAnchors value should be an array"),t instanceof Array&&t.forEach((function(t){-1===b.indexOf(t)&&r.Util.warn("Unknown anchor name: "+t+". Available names are: "+b.join(", "))})),t||[]})),i.Factory.addGetterSetter(x,"flipEnabled",!0,(0,u.getBooleanValidator)()),i.Factory.addGetterSetter(x,"resizeEnabled",!0),i.Factory.addGetterSetter(x,"anchorSize",10,(0,u.getNumberValidator)()),i.Factory.addGetterSetter(x,"rotateEnabled",!0),i.Factory.addGetterSetter(x,"rotateLineVisible",!0),i.Factory.addGetterSetter(x,"rotationSnaps",[]),i.Factory.addGetterSetter(x,"rotateAnchorOffset",50,(0,u.getNumberValidator)()),i.Factory.addGetterSetter(x,"rotateAnchorCursor","crosshair"),i.Factory.addGetterSetter(x,"rotationSnapTolerance",5,(0,u.getNumberValidator)()),i.Factory.addGetterSetter(x,"borderEnabled",!0),i.Factory.addGetterSetter(x,"anchorStroke","rgb(0, 161, 255)"),i.Factory.addGetterSetter(x,"anchorStrokeWidth",1,(0,u.getNumberValidator)()),i.Factory.addGetterSetter(x,"anchorFill","white"),i.Factory.addGetterSetter(x,"anchorCornerRadius",0,(0,u.getNumberValidator)()),i.Factory.addGetterSetter(x,"borderStroke","rgb(0, 161, 255)"),i.Factory.addGetterSetter(x,"borderStrokeWidth",1,(0,u.getNumberValidator)()),i.Factory.addGetterSetter(x,"borderDash"),i.Factory.addGetterSetter(x,"keepRatio",!0),i.Factory.addGetterSetter(x,"shiftBehavior","default"),i.Factory.addGetterSetter(x,"centeredScaling",!1),i.Factory.addGetterSetter(x,"ignoreStroke",!1),i.Factory.addGetterSetter(x,"padding",0,(0,u.getNumberValidator)()),i.Factory.addGetterSetter(x,"nodes"),i.Factory.addGetterSetter(x,"node"),i.Factory.addGetterSetter(x,"boundBoxFunc"),i.Factory.addGetterSetter(x,"anchorDragBoundFunc"),i.Factory.addGetterSetter(x,"anchorStyleFunc"),i.Factory.addGetterSetter(x,"shouldOverdrawWholeArea",!1),i.Factory.addGetterSetter(x,"useSingleNodeRotation",!0),i.Factory.backCompat(x,{lineEnabled:"borderEnabled",rotateHandlerOffset:"rotateAnchorOffset",enabledHandlers:"enabledAnchors"})},3602:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Emboss=void 0;const r=n(1751),i=n(1189),o=n(7149),a=n(9910);e.Emboss=function(t){const e=10*this.embossStrength(),n=255*this.embossWhiteLevel(),r=this.embossDirection(),i=this.embossBlend(),a=t.data,s=t.width,l=t.height,c=4*s;let u=0,d=0,h=l;switch(r){case"top-left":u=-1,d=-1;break;case"top":u=-1,d=0;break;case"top-right":u=-1,d=1;break;case"right":u=0,d=1;break;case"bottom-right":u=1,d=1;break;case"bottom":u=1,d=0;break;case"bottom-left":u=1,d=-1;break;case"left":u=0,d=-1;break;default:o.Util.error("Unknown emboss direction: "+r)}do{const t=(h-1)*c;let r=u;h+r<1&&(r=0),h+r>l&&(r=0);const o=(h-1+r)*s*4;let f=s;do{const r=t+4*(f-1);let l=d;f+l<1&&(l=0),f+l>s&&(l=0);const c=o+4*(f-1+l),u=a[r]-a[c],h=a[r+1]-a[c+1],p=a[r+2]-a[c+2];let g=u;const m=g>0?g:-g;if((h>0?h:-h)>m&&(g=h),(p>0?p:-p)>m&&(g=p),g*=e,i){const t=a[r]+g,e=a[r+1]+g,n=a[r+2]+g;a[r]=t>255?255:t<0?0:t,a[r+1]=e>255?255:e<0?0:e,a[r+2]=n>255?255:n<0?0:n}else{let t=n-g;t<0?t=0:t>255&&(t=255),a[r]=a[r+1]=a[r+2]=t}}while(--f)}while(--h)},r.Factory.addGetterSetter(i.Node,"embossStrength",.5,(0,a.getNumberValidator)(),r.Factory.afterSetFilter),r.Factory.addGetterSetter(i.Node,"embossWhiteLevel",.5,(0,a.getNumberValidator)(),r.Factory.afterSetFilter),r.Factory.addGetterSetter(i.Node,"embossDirection","top-left",void 0,r.Factory.afterSetFilter),r.Factory.addGetterSetter(i.Node,"embossBlend",!1,void 0,r.Factory.afterSetFilter)},3672:(t,e)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Solarize=void 0;e.Solarize=function(t){const e=t.data,n=t.width,r=4*n;let i=t.height;do{const t=(i-1)*r;let o=n;do{const n=t+4*(o-1);let r=e[n],i=e[n+1],a=e[n+2];r>127&&(r=255-r),i>127&&(i=255-i),a>127&&(a=255-a),e[n]=r,e[n+1]=i,e[n+2]=a}while(--o)}while(--i)}},3699:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.RGBA=void 0;const r=n(1751),i=n(1189),o=n(9910);e.RGBA=function(t){const e=t.data,n=e.length,r=this.red(),i=this.green(),o=this.blue(),a=this.alpha();for(let s=0;s<n;s+=4){const t=1-a;e[s]=r*a+e[s]*t,e[s+1]=i*a+e[s+1]*t,e[s+2]=o*a+e[s+2]*t}},r.Factory.addGetterSetter(i.Node,"red",0,(function(t){return this._filterUpToDate=!1,t>255?255:t<0?0:Math.round(t)})),r.Factory.addGetterSetter(i.Node,"green",0,(function(t){return this._filterUpToDate=!1,t>255?255:t<0?0:Math.round(t)})),r.Factory.addGetterSetter(i.Node,"blue",0,o.RGBComponent,r.Factory.afterSetFilter),r.Factory.addGetterSetter(i.Node,"alpha",1,(function(t){return this._filterUpToDate=!1,t>1?1:t<0?0:t}))},3810:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Star=void 0;const r=n(1751),i=n(3304),o=n(9910),a=n(4602);class s extends i.Shape{_sceneFunc(t){const e=this.innerRadius(),n=this.outerRadius(),r=this.numPoints();t.beginPath(),t.moveTo(0,0-n);for(let i=1;i<2*r;i++){const o=i%2===0?n:e,a=o*Math.sin(i*Math.PI/r),s=-1*o*Math.cos(i*Math.PI/r);t.lineTo(a,s)}t.closePath(),t.fillStrokeShape(this)}getWidth(){return 2*this.outerRadius()}getHeight(){return 2*this.outerRadius()}setWidth(t){this.outerRadius(t/2)}setHeight(t){this.outerRadius(t/2)}}e.Star=s,s.prototype.className="Star",s.prototype._centroid=!0,s.prototype._attrsAffectingSize=["innerRadius","outerRadius"],(0,a._registerNode)(s),r.Factory.addGetterSetter(s,"numPoints",5,(0,o.getNumberValidator)()),r.Factory.addGetterSetter(s,"innerRadius",0,(0,o.getNumberValidator)()),r.Factory.addGetterSetter(s,"outerRadius",0,(0,o.getNumberValidator)())},3950:(t,e,n)=>{var r=n(6686),i=n(4757),o=n(801),a=Math.max,s=Math.min;t.exports=function(t,e,n){var l,c,u,d,h,f,p=0,g=!1,m=!1,y=!0;if("function"!=typeof t)throw new TypeError("Expected a function");function b(e){var n=l,r=c;return l=c=void 0,p=e,d=t.apply(r,n)}function v(t){var n=t-f;return void 0===f||n>=e||n<0||m&&t-p>=u}function _(){var t=i();if(v(t))return w(t);h=setTimeout(_,function(t){var n=e-(t-f);return m?s(n,u-(t-p)):n}(t))}function w(t){return h=void 0,y&&l?b(t):(l=c=void 0,d)}function x(){var t=i(),n=v(t);if(l=arguments,c=this,f=t,n){if(void 0===h)return function(t){return p=t,h=setTimeout(_,e),g?b(t):d}(f);if(m)return clearTimeout(h),h=setTimeout(_,e),b(f)}return void 0===h&&(h=setTimeout(_,e)),d}return e=o(e)||0,r(n)&&(g=!!n.leading,u=(m="maxWait"in n)?a(o(n.maxWait)||0,e):u,y="trailing"in n?!!n.trailing:y),x.cancel=function(){void 0!==h&&clearTimeout(h),p=0,l=f=c=h=void 0},x.flush=function(){return void 0===h?d:w(i())},x}},3971:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Sprite=void 0;const r=n(1751),i=n(3304),o=n(3243),a=n(9910),s=n(4602);class l extends i.Shape{constructor(t){super(t),this._updated=!0,this.anim=new o.Animation((()=>{const t=this._updated;return this._updated=!1,t})),this.on("animationChange.konva",(function(){this.frameIndex(0)})),this.on("frameIndexChange.konva",(function(){this._updated=!0})),this.on("frameRateChange.konva",(function(){this.anim.isRunning()&&(clearInterval(this.interval),this._setInterval())}))}_sceneFunc(t){const e=this.animation(),n=this.frameIndex(),r=4*n,i=this.animations()[e],o=this.frameOffsets(),a=i[r+0],s=i[r+1],l=i[r+2],c=i[r+3],u=this.image();if((this.hasFill()||this.hasStroke())&&(t.beginPath(),t.rect(0,0,l,c),t.closePath(),t.fillStrokeShape(this)),u)if(o){const r=o[e],i=2*n;t.drawImage(u,a,s,l,c,r[i+0],r[i+1],l,c)}else t.drawImage(u,a,s,l,c,0,0,l,c)}_hitFunc(t){const e=this.animation(),n=this.frameIndex(),r=4*n,i=this.animations()[e],o=this.frameOffsets(),a=i[r+2],s=i[r+3];if(t.beginPath(),o){const r=o[e],i=2*n;t.rect(r[i+0],r[i+1],a,s)}else t.rect(0,0,a,s);t.closePath(),t.fillShape(this)}_useBufferCanvas(){return super._useBufferCanvas(!0)}_setInterval(){const t=this;this.interval=setInterval((function(){t._updateIndex()}),1e3/this.frameRate())}start(){if(this.isRunning())return;const t=this.getLayer();this.anim.setLayers(t),this._setInterval(),this.anim.start()}stop(){this.anim.stop(),clearInterval(this.interval)}isRunning(){return this.anim.isRunning()}_updateIndex(){const t=this.frameIndex(),e=this.animation();t<this.animations()[e].length/4-1?this.frameIndex(t+1):this.frameIndex(0)}}e.Sprite=l,l.prototype.className="Sprite",(0,s._registerNode)(l),r.Factory.addGetterSetter(l,"animation"),r.Factory.addGetterSetter(l,"animations"),r.Factory.addGetterSetter(l,"frameOffsets"),r.Factory.addGetterSetter(l,"image"),r.Factory.addGetterSetter(l,"frameIndex",0,(0,a.getNumberValidator)()),r.Factory.addGetterSetter(l,"frameRate",17,(0,a.getNumberValidator)()),r.Factory.backCompat(l,{index:"frameIndex",getIndex:"getFrameIndex",setIndex:"setFrameIndex"})},3994:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.FastLayer=void 0;const r=n(7149),i=n(1416),o=n(4602);class a extends i.Layer{constructor(t){super(t),this.listening(!1),r.Util.warn('Konva.Fast layer is deprecated. Please use "new Konva.Layer({ listening: false })" instead.')}}e.FastLayer=a,a.prototype.nodeType="FastLayer",(0,o._registerNode)(a)},4082:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.HSL=void 0;const r=n(1751),i=n(1189),o=n(9910);r.Factory.addGetterSetter(i.Node,"hue",0,(0,o.getNumberValidator)(),r.Factory.afterSetFilter),r.Factory.addGetterSetter(i.Node,"saturation",0,(0,o.getNumberValidator)(),r.Factory.afterSetFilter),r.Factory.addGetterSetter(i.Node,"luminance",0,(0,o.getNumberValidator)(),r.Factory.afterSetFilter);e.HSL=function(t){const e=t.data,n=e.length,r=Math.pow(2,this.saturation()),i=Math.abs(this.hue()+360)%360,o=127*this.luminance(),a=1*r*Math.cos(i*Math.PI/180),s=1*r*Math.sin(i*Math.PI/180),l=.299+.701*a+.167*s,c=.587-.587*a+.33*s,u=.114-.114*a-.497*s,d=.299-.299*a-.328*s,h=.587+.413*a+.035*s,f=.114-.114*a+.293*s,p=.299-.3*a+1.25*s,g=.587-.586*a-1.05*s,m=.114+.886*a-.2*s;let y,b,v,_;for(let w=0;w<n;w+=4)y=e[w+0],b=e[w+1],v=e[w+2],_=e[w+3],e[w+0]=l*y+c*b+u*v+o,e[w+1]=d*y+h*b+f*v+o,e[w+2]=p*y+g*b+m*v+o,e[w+3]=_}},4202:(t,e)=>{"use strict";var n=Symbol.for("react.element"),r=Symbol.for("react.portal"),i=Symbol.for("react.fragment"),o=Symbol.for("react.strict_mode"),a=Symbol.for("react.profiler"),s=Symbol.for("react.provider"),l=Symbol.for("react.context"),c=Symbol.for("react.forward_ref"),u=Symbol.for("react.suspense"),d=Symbol.for("react.memo"),h=Symbol.for("react.lazy"),f=Symbol.iterator;var p={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},g=Object.assign,m={};function y(t,e,n){this.props=t,this.context=e,this.refs=m,this.updater=n||p}function b(){}function v(t,e,n){this.props=t,this.context=e,this.refs=m,this.updater=n||p}y.prototype.isReactComponent={},y.prototype.setState=function(t,e){if("object"!==typeof t&&"function"!==typeof t&&null!=t)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,t,e,"setState")},y.prototype.forceUpdate=function(t){this.updater.enqueueForceUpdate(this,t,"forceUpdate")},b.prototype=y.prototype;var _=v.prototype=new b;_.constructor=v,g(_,y.prototype),_.isPureReactComponent=!0;var w=Array.isArray,x=Object.prototype.hasOwnProperty,S={current:null},k={key:!0,ref:!0,__self:!0,__source:!0};function C(t,e,r){var i,o={},a=null,s=null;if(null!=e)for(i in void 0!==e.ref&&(s=e.ref),void 0!==e.key&&(a=""+e.key),e)x.call(e,i)&&!k.hasOwnProperty(i)&&(o[i]=e[i]);var l=arguments.length-2;if(1===l)o.children=r;else if(1<l){for(var c=Array(l),u=0;u<l;u++)c[u]=arguments[u+2];o.children=c}if(t&&t.defaultProps)for(i in l=t.defaultProps)void 0===o[i]&&(o[i]=l[i]);return{$$typeof:n,type:t,key:a,ref:s,props:o,_owner:S.current}}function T(t){return"object"===typeof t&&null!==t&&t.$$typeof===n}var P=/\/+/g;function E(t,e){return"object"===typeof t&&null!==t&&null!=t.key?function(t){var e={"=":"=0",":":"=2"};return"$"+t.replace(/[=:]/g,(function(t){return e[t]}))}(""+t.key):e.toString(36)}function A(t,e,i,o,a){var s=typeof t;"undefined"!==s&&"boolean"!==s||(t=null);var l=!1;if(null===t)l=!0;else switch(s){case"string":case"number":l=!0;break;case"object":switch(t.$$typeof){case n:case r:l=!0}}if(l)return a=a(l=t),t=""===o?"."+E(l,0):o,w(a)?(i="",null!=t&&(i=t.replace(P,"$&/")+"/"),A(a,e,i,"",(function(t){return t}))):null!=a&&(T(a)&&(a=function(t,e){return{$$typeof:n,type:t.type,key:e,ref:t.ref,props:t.props,_owner:t._owner}}(a,i+(!a.key||l&&l.key===a.key?"":(""+a.key).replace(P,"$&/")+"/")+t)),e.push(a)),1;if(l=0,o=""===o?".":o+":",w(t))for(var c=0;c<t.length;c++){var u=o+E(s=t[c],c);l+=A(s,e,i,u,a)}else if(u=function(t){return null===t||"object"!==typeof t?null:"function"===typeof(t=f&&t[f]||t["@@iterator"])?t:null}(t),"function"===typeof u)for(t=u.call(t),c=0;!(s=t.next()).done;)l+=A(s=s.value,e,i,u=o+E(s,c++),a);else if("object"===s)throw e=String(t),Error("Objects are not valid as a React child (found: "+("[object Object]"===e?"object with keys {"+Object.keys(t).join(", ")+"}":e)+"). If you meant to render a collection of children, use an array instead.");return l}function I(t,e,n){if(null==t)return t;var r=[],i=0;return A(t,r,"","",(function(t){return e.call(n,t,i++)})),r}function M(t){if(-1===t._status){var e=t._result;(e=e()).then((function(e){0!==t._status&&-1!==t._status||(t._status=1,t._result=e)}),(function(e){0!==t._status&&-1!==t._status||(t._status=2,t._result=e)})),-1===t._status&&(t._status=0,t._result=e)}if(1===t._status)return t._result.default;throw t._result}var F={current:null},D={transition:null},R={ReactCurrentDispatcher:F,ReactCurrentBatchConfig:D,ReactCurrentOwner:S};function O(){throw Error("act(...) is not supported in production builds of React.")}e.Children={map:I,forEach:function(t,e,n){I(t,(function(){e.apply(this,arguments)}),n)},count:function(t){var e=0;return I(t,(function(){e++})),e},toArray:function(t){return I(t,(function(t){return t}))||[]},only:function(t){if(!T(t))throw Error("React.Children.only expected to receive a single React element child.");return t}},e.Component=y,e.Fragment=i,e.Profiler=a,e.PureComponent=v,e.StrictMode=o,e.Suspense=u,e.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=R,e.act=O,e.cloneElement=function(t,e,r){if(null===t||void 0===t)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+t+".");var i=g({},t.props),o=t.key,a=t.ref,s=t._owner;if(null!=e){if(void 0!==e.ref&&(a=e.ref,s=S.current),void 0!==e.key&&(o=""+e.key),t.type&&t.type.defaultProps)var l=t.type.defaultProps;for(c in e)x.call(e,c)&&!k.hasOwnProperty(c)&&(i[c]=void 0===e[c]&&void 0!==l?l[c]:e[c])}var c=arguments.length-2;if(1===c)i.children=r;else if(1<c){l=Array(c);for(var u=0;u<c;u++)l[u]=arguments[u+2];i.children=l}return{$$typeof:n,type:t.type,key:o,ref:a,props:i,_owner:s}},e.createContext=function(t){return(t={$$typeof:l,_currentValue:t,_currentValue2:t,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null}).Provider={$$typeof:s,_context:t},t.Consumer=t},e.createElement=C,e.createFactory=function(t){var e=C.bind(null,t);return e.type=t,e},e.createRef=function(){return{current:null}},e.forwardRef=function(t){return{$$typeof:c,render:t}},e.isValidElement=T,e.lazy=function(t){return{$$typeof:h,_payload:{_status:-1,_result:t},_init:M}},e.memo=function(t,e){return{$$typeof:d,type:t,compare:void 0===e?null:e}},e.startTransition=function(t){var e=D.transition;D.transition={};try{t()}finally{D.transition=e}},e.unstable_act=O,e.useCallback=function(t,e){return F.current.useCallback(t,e)},e.useContext=function(t){return F.current.useContext(t)},e.useDebugValue=function(){},e.useDeferredValue=function(t){return F.current.useDeferredValue(t)},e.useEffect=function(t,e){return F.current.useEffect(t,e)},e.useId=function(){return F.current.useId()},e.useImperativeHandle=function(t,e,n){return F.current.useImperativeHandle(t,e,n)},e.useInsertionEffect=function(t,e){return F.current.useInsertionEffect(t,e)},e.useLayoutEffect=function(t,e){return F.current.useLayoutEffect(t,e)},e.useMemo=function(t,e){return F.current.useMemo(t,e)},e.useReducer=function(t,e,n){return F.current.useReducer(t,e,n)},e.useRef=function(t){return F.current.useRef(t)},e.useState=function(t){return F.current.useState(t)},e.useSyncExternalStore=function(t,e,n){return F.current.useSyncExternalStore(t,e,n)},e.useTransition=function(){return F.current.useTransition()},e.version="18.3.1"},4367:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Stage=e.stages=void 0;const r=n(7149),i=n(1751),o=n(4598),a=n(4602),s=n(589),l=n(8727),c=n(4602),u=n(9485),d="mouseleave",h="mouseover",f="mouseenter",p="mousemove",g="mousedown",m="mouseup",y="pointermove",b="pointerdown",v="pointerup",_="pointercancel",w="pointerout",x="pointerleave",S="pointerover",k="pointerenter",C="contextmenu",T="touchstart",P="touchend",E="touchmove",A="touchcancel",I="wheel",M=[[f,"_pointerenter"],[g,"_pointerdown"],[p,"_pointermove"],[m,"_pointerup"],[d,"_pointerleave"],[T,"_pointerdown"],[E,"_pointermove"],[P,"_pointerup"],[A,"_pointercancel"],[h,"_pointerover"],[I,"_wheel"],[C,"_contextmenu"],[b,"_pointerdown"],[y,"_pointermove"],[v,"_pointerup"],[_,"_pointercancel"],["lostpointercapture","_lostpointercapture"]],F={mouse:{[w]:"mouseout",[x]:d,[S]:h,[k]:f,[y]:p,[b]:g,[v]:m,[_]:"mousecancel",pointerclick:"click",pointerdblclick:"dblclick"},touch:{[w]:"touchout",[x]:"touchleave",[S]:"touchover",[k]:"touchenter",[y]:E,[b]:T,[v]:P,[_]:A,pointerclick:"tap",pointerdblclick:"dbltap"},pointer:{[w]:w,[x]:x,[S]:S,[k]:k,[y]:y,[b]:b,[v]:v,[_]:_,pointerclick:"pointerclick",pointerdblclick:"pointerdblclick"}},D=t=>t.indexOf("pointer")>=0?"pointer":t.indexOf("touch")>=0?"touch":"mouse",R=t=>{const e=D(t);return"pointer"===e?a.Konva.pointerEventsEnabled&&F.pointer:"touch"===e?F.touch:"mouse"===e?F.mouse:void 0};function O(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};return(t.clipFunc||t.clipWidth||t.clipHeight)&&r.Util.warn("Stage does not support clipping. Please use clip for Layers or Groups."),t}e.stages=[];class N extends o.Container{constructor(t){super(O(t)),this._pointerPositions=[],this._changedPointerPositions=[],this._buildDOM(),this._bindContentEvents(),e.stages.push(this),this.on("widthChange.konva heightChange.konva",this._resizeDOM),this.on("visibleChange.konva",this._checkVisibility),this.on("clipWidthChange.konva clipHeightChange.konva clipFuncChange.konva",(()=>{O(this.attrs)})),this._checkVisibility()}_validateAdd(t){const e="Layer"===t.getType(),n="FastLayer"===t.getType();e||n||r.Util.throw("You may only add layers to the stage.")}_checkVisibility(){if(!this.content)return;const t=this.visible()?"":"none";this.content.style.display=t}setContainer(t){if("string"===typeof t){if("."===t.charAt(0)){const e=t.slice(1);t=document.getElementsByClassName(e)[0]}else{var e;e="#"!==t.charAt(0)?t:t.slice(1),t=document.getElementById(e)}if(!t)throw"Can not find container in document with id "+e}return this._setAttr("container",t),this.content&&(this.content.parentElement&&this.content.parentElement.removeChild(this.content),t.appendChild(this.content)),this}shouldDrawHit(){return!0}clear(){const t=this.children,e=t.length;for(let n=0;n<e;n++)t[n].clear();return this}clone(t){return t||(t={}),t.container="undefined"!==typeof document&&document.createElement("div"),o.Container.prototype.clone.call(this,t)}destroy(){super.destroy();const t=this.content;t&&r.Util._isInDocument(t)&&this.container().removeChild(t);const n=e.stages.indexOf(this);return n>-1&&e.stages.splice(n,1),r.Util.releaseCanvas(this.bufferCanvas._canvas,this.bufferHitCanvas._canvas),this}getPointerPosition(){const t=this._pointerPositions[0]||this._changedPointerPositions[0];return t?{x:t.x,y:t.y}:(r.Util.warn("Pointer position is missing and not registered by the stage. Looks like it is outside of the stage container. You can set it manually from event: stage.setPointersPositions(event);"),null)}_getPointerById(t){return this._pointerPositions.find((e=>e.id===t))}getPointersPositions(){return this._pointerPositions}getStage(){return this}getContent(){return this.content}_toKonvaCanvas(t){(t=t||{}).x=t.x||0,t.y=t.y||0,t.width=t.width||this.width(),t.height=t.height||this.height();const e=new s.SceneCanvas({width:t.width,height:t.height,pixelRatio:t.pixelRatio||1}),n=e.getContext()._context,r=this.children;return(t.x||t.y)&&n.translate(-1*t.x,-1*t.y),r.forEach((function(e){if(!e.isVisible())return;const r=e._toKonvaCanvas(t);n.drawImage(r._canvas,t.x,t.y,r.getWidth()/r.getPixelRatio(),r.getHeight()/r.getPixelRatio())})),e}getIntersection(t){if(!t)return null;const e=this.children;for(let n=e.length-1;n>=0;n--){const r=e[n].getIntersection(t);if(r)return r}return null}_resizeDOM(){const t=this.width(),e=this.height();this.content&&(this.content.style.width=t+"px",this.content.style.height=e+"px"),this.bufferCanvas.setSize(t,e),this.bufferHitCanvas.setSize(t,e),this.children.forEach((n=>{n.setSize({width:t,height:e}),n.draw()}))}add(t){for(var e=arguments.length,n=new Array(e>1?e-1:0),i=1;i<e;i++)n[i-1]=arguments[i];if(arguments.length>1){for(let t=0;t<arguments.length;t++)this.add(arguments[t]);return this}super.add(t);const o=this.children.length;return o>5&&r.Util.warn("The stage has "+o+" layers. Recommended maximum number of layers is 3-5. Adding more layers into the stage may drop the performance. Rethink your tree structure, you can use Konva.Group."),t.setSize({width:this.width(),height:this.height()}),t.draw(),a.Konva.isBrowser&&this.content.appendChild(t.canvas._canvas),this}getParent(){return null}getLayer(){return null}hasPointerCapture(t){return u.hasPointerCapture(t,this)}setPointerCapture(t){u.setPointerCapture(t,this)}releaseCapture(t){u.releaseCapture(t,this)}getLayers(){return this.children}_bindContentEvents(){a.Konva.isBrowser&&M.forEach((t=>{let[e,n]=t;this.content.addEventListener(e,(t=>{this[n](t)}),{passive:!1})}))}_pointerenter(t){this.setPointersPositions(t);const e=R(t.type);e&&this._fire(e.pointerenter,{evt:t,target:this,currentTarget:this})}_pointerover(t){this.setPointersPositions(t);const e=R(t.type);e&&this._fire(e.pointerover,{evt:t,target:this,currentTarget:this})}_getTargetShape(t){let e=this[t+"targetShape"];return e&&!e.getStage()&&(e=null),e}_pointerleave(t){const e=R(t.type),n=D(t.type);if(!e)return;this.setPointersPositions(t);const r=this._getTargetShape(n),i=!(a.Konva.isDragging()||a.Konva.isTransforming())||a.Konva.hitOnDragEnabled;r&&i?(r._fireAndBubble(e.pointerout,{evt:t}),r._fireAndBubble(e.pointerleave,{evt:t}),this._fire(e.pointerleave,{evt:t,target:this,currentTarget:this}),this[n+"targetShape"]=null):i&&(this._fire(e.pointerleave,{evt:t,target:this,currentTarget:this}),this._fire(e.pointerout,{evt:t,target:this,currentTarget:this})),this.pointerPos=null,this._pointerPositions=[]}_pointerdown(t){const e=R(t.type),n=D(t.type);if(!e)return;this.setPointersPositions(t);let r=!1;this._changedPointerPositions.forEach((i=>{const o=this.getIntersection(i);if(l.DD.justDragged=!1,a.Konva["_"+n+"ListenClick"]=!0,!o||!o.isListening())return void(this[n+"ClickStartShape"]=void 0);a.Konva.capturePointerEventsEnabled&&o.setPointerCapture(i.id),this[n+"ClickStartShape"]=o,o._fireAndBubble(e.pointerdown,{evt:t,pointerId:i.id}),r=!0;const s=t.type.indexOf("touch")>=0;o.preventDefault()&&t.cancelable&&s&&t.preventDefault()})),r||this._fire(e.pointerdown,{evt:t,target:this,currentTarget:this,pointerId:this._pointerPositions[0].id})}_pointermove(t){const e=R(t.type),n=D(t.type);if(!e)return;a.Konva.isDragging()&&l.DD.node.preventDefault()&&t.cancelable&&t.preventDefault(),this.setPointersPositions(t);if(!(!(a.Konva.isDragging()||a.Konva.isTransforming())||a.Konva.hitOnDragEnabled))return;const r={};let i=!1;const o=this._getTargetShape(n);this._changedPointerPositions.forEach((a=>{const s=u.getCapturedShape(a.id)||this.getIntersection(a),l=a.id,c={evt:t,pointerId:l},d=o!==s;if(d&&o&&(o._fireAndBubble(e.pointerout,{...c},s),o._fireAndBubble(e.pointerleave,{...c},s)),s){if(r[s._id])return;r[s._id]=!0}s&&s.isListening()?(i=!0,d&&(s._fireAndBubble(e.pointerover,{...c},o),s._fireAndBubble(e.pointerenter,{...c},o),this[n+"targetShape"]=s),s._fireAndBubble(e.pointermove,{...c})):o&&(this._fire(e.pointerover,{evt:t,target:this,currentTarget:this,pointerId:l}),this[n+"targetShape"]=null)})),i||this._fire(e.pointermove,{evt:t,target:this,currentTarget:this,pointerId:this._changedPointerPositions[0].id})}_pointerup(t){const e=R(t.type),n=D(t.type);if(!e)return;this.setPointersPositions(t);const r=this[n+"ClickStartShape"],i=this[n+"ClickEndShape"],o={};let s=!1;this._changedPointerPositions.forEach((c=>{const d=u.getCapturedShape(c.id)||this.getIntersection(c);if(d){if(d.releaseCapture(c.id),o[d._id])return;o[d._id]=!0}const h=c.id,f={evt:t,pointerId:h};let p=!1;a.Konva["_"+n+"InDblClickWindow"]?(p=!0,clearTimeout(this[n+"DblTimeout"])):l.DD.justDragged||(a.Konva["_"+n+"InDblClickWindow"]=!0,clearTimeout(this[n+"DblTimeout"])),this[n+"DblTimeout"]=setTimeout((function(){a.Konva["_"+n+"InDblClickWindow"]=!1}),a.Konva.dblClickWindow),d&&d.isListening()?(s=!0,this[n+"ClickEndShape"]=d,d._fireAndBubble(e.pointerup,{...f}),a.Konva["_"+n+"ListenClick"]&&r&&r===d&&(d._fireAndBubble(e.pointerclick,{...f}),p&&i&&i===d&&d._fireAndBubble(e.pointerdblclick,{...f}))):(this[n+"ClickEndShape"]=null,a.Konva["_"+n+"ListenClick"]&&this._fire(e.pointerclick,{evt:t,target:this,currentTarget:this,pointerId:h}),p&&this._fire(e.pointerdblclick,{evt:t,target:this,currentTarget:this,pointerId:h}))})),s||this._fire(e.pointerup,{evt:t,target:this,currentTarget:this,pointerId:this._changedPointerPositions[0].id}),a.Konva["_"+n+"ListenClick"]=!1,t.cancelable&&"touch"!==n&&"pointer"!==n&&t.preventDefault()}_contextmenu(t){this.setPointersPositions(t);const e=this.getIntersection(this.getPointerPosition());e&&e.isListening()?e._fireAndBubble(C,{evt:t}):this._fire(C,{evt:t,target:this,currentTarget:this})}_wheel(t){this.setPointersPositions(t);const e=this.getIntersection(this.getPointerPosition());e&&e.isListening()?e._fireAndBubble(I,{evt:t}):this._fire(I,{evt:t,target:this,currentTarget:this})}_pointercancel(t){this.setPointersPositions(t);const e=u.getCapturedShape(t.pointerId)||this.getIntersection(this.getPointerPosition());e&&e._fireAndBubble(v,u.createEvent(t)),u.releaseCapture(t.pointerId)}_lostpointercapture(t){u.releaseCapture(t.pointerId)}setPointersPositions(t){const e=this._getContentPosition();let n=null,i=null;void 0!==(t=t||window.event).touches?(this._pointerPositions=[],this._changedPointerPositions=[],Array.prototype.forEach.call(t.touches,(t=>{this._pointerPositions.push({id:t.identifier,x:(t.clientX-e.left)/e.scaleX,y:(t.clientY-e.top)/e.scaleY})})),Array.prototype.forEach.call(t.changedTouches||t.touches,(t=>{this._changedPointerPositions.push({id:t.identifier,x:(t.clientX-e.left)/e.scaleX,y:(t.clientY-e.top)/e.scaleY})}))):(n=(t.clientX-e.left)/e.scaleX,i=(t.clientY-e.top)/e.scaleY,this.pointerPos={x:n,y:i},this._pointerPositions=[{x:n,y:i,id:r.Util._getFirstPointerId(t)}],this._changedPointerPositions=[{x:n,y:i,id:r.Util._getFirstPointerId(t)}])}_setPointerPosition(t){r.Util.warn('Method _setPointerPosition is deprecated. Use "stage.setPointersPositions(event)" instead.'),this.setPointersPositions(t)}_getContentPosition(){if(!this.content||!this.content.getBoundingClientRect)return{top:0,left:0,scaleX:1,scaleY:1};const t=this.content.getBoundingClientRect();return{top:t.top,left:t.left,scaleX:t.width/this.content.clientWidth||1,scaleY:t.height/this.content.clientHeight||1}}_buildDOM(){if(this.bufferCanvas=new s.SceneCanvas({width:this.width(),height:this.height()}),this.bufferHitCanvas=new s.HitCanvas({pixelRatio:1,width:this.width(),height:this.height()}),!a.Konva.isBrowser)return;const t=this.container();if(!t)throw"Stage has no container. A container is required.";t.innerHTML="",this.content=document.createElement("div"),this.content.style.position="relative",this.content.style.userSelect="none",this.content.className="konvajs-content",this.content.setAttribute("role","presentation"),t.appendChild(this.content),this._resizeDOM()}cache(){return r.Util.warn("Cache function is not allowed for stage. You may use cache only for layers, groups and shapes."),this}clearCache(){return this}batchDraw(){return this.getChildren().forEach((function(t){t.batchDraw()})),this}}e.Stage=N,N.prototype.nodeType="Stage",(0,c._registerNode)(N),i.Factory.addGetterSetter(N,"container"),a.Konva.isBrowser&&document.addEventListener("visibilitychange",(()=>{e.stages.forEach((t=>{t.batchDraw()}))}))},4391:(t,e,n)=>{"use strict";var r=n(7950);e.H=r.createRoot,r.hydrateRoot},4552:(t,e,n)=>{var r=n(9812),i=Object.prototype,o=i.hasOwnProperty,a=i.toString,s=r?r.toStringTag:void 0;t.exports=function(t){var e=o.call(t,s),n=t[s];try{t[s]=void 0;var r=!0}catch(l){}var i=a.call(t);return r&&(e?t[s]=n:delete t[s]),i}},4598:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Container=void 0;const r=n(1751),i=n(1189),o=n(9910);class a extends i.Node{constructor(){super(...arguments),this.children=[]}getChildren(t){if(!t)return this.children||[];const e=this.children||[],n=[];return e.forEach((function(e){t(e)&&n.push(e)})),n}hasChildren(){return this.getChildren().length>0}removeChildren(){return this.getChildren().forEach((t=>{t.parent=null,t.index=0,t.remove()})),this.children=[],this._requestDraw(),this}destroyChildren(){return this.getChildren().forEach((t=>{t.parent=null,t.index=0,t.destroy()})),this.children=[],this._requestDraw(),this}add(){if(0===arguments.length)return this;if(arguments.length>1){for(let t=0;t<arguments.length;t++)this.add(t<0||arguments.length<=t?void 0:arguments[t]);return this}const t=arguments.length<=0?void 0:arguments[0];return t.getParent()?(t.moveTo(this),this):(this._validateAdd(t),t.index=this.getChildren().length,t.parent=this,t._clearCaches(),this.getChildren().push(t),this._fire("add",{child:t}),this._requestDraw(),this)}destroy(){return this.hasChildren()&&this.destroyChildren(),super.destroy(),this}find(t){return this._generalFind(t,!1)}findOne(t){const e=this._generalFind(t,!0);return e.length>0?e[0]:void 0}_generalFind(t,e){const n=[];return this._descendants((r=>{const i=r._isMatch(t);return i&&n.push(r),!(!i||!e)})),n}_descendants(t){let e=!1;const n=this.getChildren();for(const r of n){if(e=t(r),e)return!0;if(r.hasChildren()&&(e=r._descendants(t),e))return!0}return!1}toObject(){const t=i.Node.prototype.toObject.call(this);return t.children=[],this.getChildren().forEach((e=>{t.children.push(e.toObject())})),t}isAncestorOf(t){let e=t.getParent();for(;e;){if(e._id===this._id)return!0;e=e.getParent()}return!1}clone(t){const e=i.Node.prototype.clone.call(this,t);return this.getChildren().forEach((function(t){e.add(t.clone())})),e}getAllIntersections(t){const e=[];return this.find("Shape").forEach((n=>{n.isVisible()&&n.intersects(t)&&e.push(n)})),e}_clearSelfAndDescendantCache(t){var e;super._clearSelfAndDescendantCache(t),this.isCached()||null===(e=this.children)||void 0===e||e.forEach((function(e){e._clearSelfAndDescendantCache(t)}))}_setChildrenIndices(){var t;null===(t=this.children)||void 0===t||t.forEach((function(t,e){t.index=e})),this._requestDraw()}drawScene(t,e,n){const r=this.getLayer(),i=t||r&&r.getCanvas(),o=i&&i.getContext(),a=this._getCanvasCache(),s=a&&a.scene,l=i&&i.isCache;if(!this.isVisible()&&!l)return this;if(s){o.save();const t=this.getAbsoluteTransform(e).getMatrix();o.transform(t[0],t[1],t[2],t[3],t[4],t[5]),this._drawCachedSceneCanvas(o),o.restore()}else this._drawChildren("drawScene",i,e,n);return this}drawHit(t,e){if(!this.shouldDrawHit(e))return this;const n=this.getLayer(),r=t||n&&n.hitCanvas,i=r&&r.getContext(),o=this._getCanvasCache();if(o&&o.hit){i.save();const t=this.getAbsoluteTransform(e).getMatrix();i.transform(t[0],t[1],t[2],t[3],t[4],t[5]),this._drawCachedHitCanvas(i),i.restore()}else this._drawChildren("drawHit",r,e);return this}_drawChildren(t,e,n,r){var i;const o=e&&e.getContext(),a=this.clipWidth(),s=this.clipHeight(),l=this.clipFunc(),c="number"===typeof a&&"number"===typeof s||l,u=n===this;if(c){o.save();const t=this.getAbsoluteTransform(n);let e,r=t.getMatrix();if(o.transform(r[0],r[1],r[2],r[3],r[4],r[5]),o.beginPath(),l)e=l.call(this,o,this);else{const t=this.clipX(),e=this.clipY();o.rect(t||0,e||0,a,s)}o.clip.apply(o,e),r=t.copy().invert().getMatrix(),o.transform(r[0],r[1],r[2],r[3],r[4],r[5])}const d=!u&&"source-over"!==this.globalCompositeOperation()&&"drawScene"===t;d&&(o.save(),o._applyGlobalCompositeOperation(this)),null===(i=this.children)||void 0===i||i.forEach((function(i){i[t](e,n,r)})),d&&o.restore(),c&&o.restore()}getClientRect(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};var e;const n=t.skipTransform,r=t.relativeTo;let i,o,a,s,l={x:1/0,y:1/0,width:0,height:0};const c=this;null===(e=this.children)||void 0===e||e.forEach((function(e){if(!e.visible())return;const n=e.getClientRect({relativeTo:c,skipShadow:t.skipShadow,skipStroke:t.skipStroke});0===n.width&&0===n.height||(void 0===i?(i=n.x,o=n.y,a=n.x+n.width,s=n.y+n.height):(i=Math.min(i,n.x),o=Math.min(o,n.y),a=Math.max(a,n.x+n.width),s=Math.max(s,n.y+n.height)))}));const u=this.find("Shape");let d=!1;for(let h=0;h<u.length;h++){if(u[h]._isVisible(this)){d=!0;break}}return l=d&&void 0!==i?{x:i,y:o,width:a-i,height:s-o}:{x:0,y:0,width:0,height:0},n?l:this._transformedRect(l,r)}}e.Container=a,r.Factory.addComponentsGetterSetter(a,"clip",["x","y","width","height"]),r.Factory.addGetterSetter(a,"clipX",void 0,(0,o.getNumberValidator)()),r.Factory.addGetterSetter(a,"clipY",void 0,(0,o.getNumberValidator)()),r.Factory.addGetterSetter(a,"clipWidth",void 0,(0,o.getNumberValidator)()),r.Factory.addGetterSetter(a,"clipHeight",void 0,(0,o.getNumberValidator)()),r.Factory.addGetterSetter(a,"clipFunc")},4602:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e._registerNode=e.Konva=e.glob=void 0;const r=Math.PI/180;e.glob="undefined"!==typeof n.g?n.g:"undefined"!==typeof window?window:"undefined"!==typeof WorkerGlobalScope?self:{},e.Konva={_global:e.glob,version:"9.3.20",isBrowser:"undefined"!==typeof window&&("[object Window]"==={}.toString.call(window)||"[object global]"==={}.toString.call(window)),isUnminified:/param/.test(function(t){}.toString()),dblClickWindow:400,getAngle:t=>e.Konva.angleDeg?t*r:t,enableTrace:!1,pointerEventsEnabled:!0,autoDrawEnabled:!0,hitOnDragEnabled:!1,capturePointerEventsEnabled:!1,_mouseListenClick:!1,_touchListenClick:!1,_pointerListenClick:!1,_mouseInDblClickWindow:!1,_touchInDblClickWindow:!1,_pointerInDblClickWindow:!1,_mouseDblClickPointerId:null,_touchDblClickPointerId:null,_pointerDblClickPointerId:null,_fixTextRendering:!1,pixelRatio:"undefined"!==typeof window&&window.devicePixelRatio||1,dragDistance:3,angleDeg:!0,showWarnings:!0,dragButtons:[0,1],isDragging:()=>e.Konva.DD.isDragging,isTransforming(){var t;return null===(t=e.Konva.Transformer)||void 0===t?void 0:t.isTransforming()},isDragReady:()=>!!e.Konva.DD.node,releaseCanvasOnDestroy:!0,document:e.glob.document,_injectGlobal(t){e.glob.Konva=t}};e._registerNode=t=>{e.Konva[t.prototype.getClassName()]=t},e.Konva._injectGlobal(e.Konva)},4757:(t,e,n)=>{var r=n(6552);t.exports=function(){return r.Date.now()}},4940:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Wedge=void 0;const r=n(1751),i=n(3304),o=n(4602),a=n(9910),s=n(4602);class l extends i.Shape{_sceneFunc(t){t.beginPath(),t.arc(0,0,this.radius(),0,o.Konva.getAngle(this.angle()),this.clockwise()),t.lineTo(0,0),t.closePath(),t.fillStrokeShape(this)}getWidth(){return 2*this.radius()}getHeight(){return 2*this.radius()}setWidth(t){this.radius(t/2)}setHeight(t){this.radius(t/2)}}e.Wedge=l,l.prototype.className="Wedge",l.prototype._centroid=!0,l.prototype._attrsAffectingSize=["radius"],(0,s._registerNode)(l),r.Factory.addGetterSetter(l,"radius",0,(0,a.getNumberValidator)()),r.Factory.addGetterSetter(l,"angle",0,(0,a.getNumberValidator)()),r.Factory.addGetterSetter(l,"clockwise",!1),r.Factory.backCompat(l,{angleDeg:"angle",getAngleDeg:"getAngle",setAngleDeg:"setAngle"})},5043:(t,e,n)=>{"use strict";t.exports=n(4202)},5053:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Mask=void 0;const r=n(1751),i=n(1189),o=n(9910);function a(t,e,n){let r=4*(n*t.width+e);const i=[];return i.push(t.data[r++],t.data[r++],t.data[r++],t.data[r++]),i}function s(t,e){return Math.sqrt(Math.pow(t[0]-e[0],2)+Math.pow(t[1]-e[1],2)+Math.pow(t[2]-e[2],2))}e.Mask=function(t){let e=function(t,e){const n=a(t,0,0),r=a(t,t.width-1,0),i=a(t,0,t.height-1),o=a(t,t.width-1,t.height-1),l=e||10;if(s(n,r)<l&&s(r,o)<l&&s(o,i)<l&&s(i,n)<l){const e=function(t){const e=[0,0,0];for(let n=0;n<t.length;n++)e[0]+=t[n][0],e[1]+=t[n][1],e[2]+=t[n][2];return e[0]/=t.length,e[1]/=t.length,e[2]/=t.length,e}([r,n,o,i]),a=[];for(let n=0;n<t.width*t.height;n++){const r=s(e,[t.data[4*n],t.data[4*n+1],t.data[4*n+2]]);a[n]=r<l?0:255}return a}}(t,this.threshold());return e&&(e=function(t,e,n){const r=[1,1,1,1,0,1,1,1,1],i=Math.round(Math.sqrt(r.length)),o=Math.floor(i/2),a=[];for(let s=0;s<n;s++)for(let l=0;l<e;l++){const c=s*e+l;let u=0;for(let a=0;a<i;a++)for(let c=0;c<i;c++){const d=s+a-o,h=l+c-o;if(d>=0&&d<n&&h>=0&&h<e){const n=r[a*i+c];u+=t[d*e+h]*n}}a[c]=2040===u?255:0}return a}(e,t.width,t.height),e=function(t,e,n){const r=[1,1,1,1,1,1,1,1,1],i=Math.round(Math.sqrt(r.length)),o=Math.floor(i/2),a=[];for(let s=0;s<n;s++)for(let l=0;l<e;l++){const c=s*e+l;let u=0;for(let a=0;a<i;a++)for(let c=0;c<i;c++){const d=s+a-o,h=l+c-o;if(d>=0&&d<n&&h>=0&&h<e){const n=r[a*i+c];u+=t[d*e+h]*n}}a[c]=u>=1020?255:0}return a}(e,t.width,t.height),e=function(t,e,n){const r=[1/9,1/9,1/9,1/9,1/9,1/9,1/9,1/9,1/9],i=Math.round(Math.sqrt(r.length)),o=Math.floor(i/2),a=[];for(let s=0;s<n;s++)for(let l=0;l<e;l++){const c=s*e+l;let u=0;for(let a=0;a<i;a++)for(let c=0;c<i;c++){const d=s+a-o,h=l+c-o;if(d>=0&&d<n&&h>=0&&h<e){const n=r[a*i+c];u+=t[d*e+h]*n}}a[c]=u}return a}(e,t.width,t.height),function(t,e){for(let n=0;n<t.width*t.height;n++)t.data[4*n+3]=e[n]}(t,e)),t},r.Factory.addGetterSetter(i.Node,"threshold",0,(0,o.getNumberValidator)(),r.Factory.afterSetFilter)},5082:(t,e)=>{"use strict";var n="function"===typeof Symbol&&Symbol.for,r=n?Symbol.for("react.element"):60103,i=n?Symbol.for("react.portal"):60106,o=n?Symbol.for("react.fragment"):60107,a=n?Symbol.for("react.strict_mode"):60108,s=n?Symbol.for("react.profiler"):60114,l=n?Symbol.for("react.provider"):60109,c=n?Symbol.for("react.context"):60110,u=n?Symbol.for("react.async_mode"):60111,d=n?Symbol.for("react.concurrent_mode"):60111,h=n?Symbol.for("react.forward_ref"):60112,f=n?Symbol.for("react.suspense"):60113,p=n?Symbol.for("react.suspense_list"):60120,g=n?Symbol.for("react.memo"):60115,m=n?Symbol.for("react.lazy"):60116,y=n?Symbol.for("react.block"):60121,b=n?Symbol.for("react.fundamental"):60117,v=n?Symbol.for("react.responder"):60118,_=n?Symbol.for("react.scope"):60119;function w(t){if("object"===typeof t&&null!==t){var e=t.$$typeof;switch(e){case r:switch(t=t.type){case u:case d:case o:case s:case a:case f:return t;default:switch(t=t&&t.$$typeof){case c:case h:case m:case g:case l:return t;default:return e}}case i:return e}}}function x(t){return w(t)===d}e.AsyncMode=u,e.ConcurrentMode=d,e.ContextConsumer=c,e.ContextProvider=l,e.Element=r,e.ForwardRef=h,e.Fragment=o,e.Lazy=m,e.Memo=g,e.Portal=i,e.Profiler=s,e.StrictMode=a,e.Suspense=f,e.isAsyncMode=function(t){return x(t)||w(t)===u},e.isConcurrentMode=x,e.isContextConsumer=function(t){return w(t)===c},e.isContextProvider=function(t){return w(t)===l},e.isElement=function(t){return"object"===typeof t&&null!==t&&t.$$typeof===r},e.isForwardRef=function(t){return w(t)===h},e.isFragment=function(t){return w(t)===o},e.isLazy=function(t){return w(t)===m},e.isMemo=function(t){return w(t)===g},e.isPortal=function(t){return w(t)===i},e.isProfiler=function(t){return w(t)===s},e.isStrictMode=function(t){return w(t)===a},e.isSuspense=function(t){return w(t)===f},e.isValidElementType=function(t){return"string"===typeof t||"function"===typeof t||t===o||t===d||t===s||t===a||t===f||t===p||"object"===typeof t&&null!==t&&(t.$$typeof===m||t.$$typeof===g||t.$$typeof===l||t.$$typeof===c||t.$$typeof===h||t.$$typeof===b||t.$$typeof===v||t.$$typeof===_||t.$$typeof===y)},e.typeOf=w},5191:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Konva=void 0;const r=n(8065),i=n(9144),o=n(1801),a=n(1618),s=n(9554),l=n(2941),c=n(6494),u=n(5804),d=n(7289),h=n(1300),f=n(7980),p=n(1008),g=n(3971),m=n(3810),y=n(3169),b=n(1222),v=n(3535),_=n(4940),w=n(2672),x=n(8098),S=n(5783),k=n(3602),C=n(2715),T=n(2078),P=n(4082),E=n(2544),A=n(7205),I=n(8332),M=n(5053),F=n(9195),D=n(1485),R=n(7264),O=n(1518),N=n(3699),L=n(8019),B=n(3672),z=n(1126);e.Konva=r.Konva.Util._assign(r.Konva,{Arc:i.Arc,Arrow:o.Arrow,Circle:a.Circle,Ellipse:s.Ellipse,Image:l.Image,Label:c.Label,Tag:c.Tag,Line:u.Line,Path:d.Path,Rect:h.Rect,RegularPolygon:f.RegularPolygon,Ring:p.Ring,Sprite:g.Sprite,Star:m.Star,Text:y.Text,TextPath:b.TextPath,Transformer:v.Transformer,Wedge:_.Wedge,Filters:{Blur:w.Blur,Brighten:x.Brighten,Contrast:S.Contrast,Emboss:k.Emboss,Enhance:C.Enhance,Grayscale:T.Grayscale,HSL:P.HSL,HSV:E.HSV,Invert:A.Invert,Kaleidoscope:I.Kaleidoscope,Mask:M.Mask,Noise:F.Noise,Pixelate:D.Pixelate,Posterize:R.Posterize,RGB:O.RGB,RGBA:N.RGBA,Sepia:L.Sepia,Solarize:B.Solarize,Threshold:z.Threshold}})},5242:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Easings=e.Tween=void 0;const r=n(7149),i=n(3243),o=n(1189),a=n(4602),s={node:1,duration:1,easing:1,onFinish:1,yoyo:1},l=["fill","stroke","shadowColor"];let c=0;class u{constructor(t,e,n,r,i,o,a){this.prop=t,this.propFunc=e,this.begin=r,this._pos=r,this.duration=o,this._change=0,this.prevPos=0,this.yoyo=a,this._time=0,this._position=0,this._startTime=0,this._finish=0,this.func=n,this._change=i-this.begin,this.pause()}fire(t){const e=this[t];e&&e()}setTime(t){t>this.duration?this.yoyo?(this._time=this.duration,this.reverse()):this.finish():t<0?this.yoyo?(this._time=0,this.play()):this.reset():(this._time=t,this.update())}getTime(){return this._time}setPosition(t){this.prevPos=this._pos,this.propFunc(t),this._pos=t}getPosition(t){return void 0===t&&(t=this._time),this.func(t,this.begin,this._change,this.duration)}play(){this.state=2,this._startTime=this.getTimer()-this._time,this.onEnterFrame(),this.fire("onPlay")}reverse(){this.state=3,this._time=this.duration-this._time,this._startTime=this.getTimer()-this._time,this.onEnterFrame(),this.fire("onReverse")}seek(t){this.pause(),this._time=t,this.update(),this.fire("onSeek")}reset(){this.pause(),this._time=0,this.update(),this.fire("onReset")}finish(){this.pause(),this._time=this.duration,this.update(),this.fire("onFinish")}update(){this.setPosition(this.getPosition(this._time)),this.fire("onUpdate")}onEnterFrame(){const t=this.getTimer()-this._startTime;2===this.state?this.setTime(t):3===this.state&&this.setTime(this.duration-t)}pause(){this.state=1,this.fire("onPause")}getTimer(){return(new Date).getTime()}}class d{constructor(t){const n=this,o=t.node,l=o._id,h=t.easing||e.Easings.Linear,f=!!t.yoyo;let p,g;p="undefined"===typeof t.duration?.3:0===t.duration?.001:t.duration,this.node=o,this._id=c++;const m=o.getLayer()||(o instanceof a.Konva.Stage?o.getLayers():null);for(g in m||r.Util.error("Tween constructor have `node` that is not in a layer. Please add node into layer first."),this.anim=new i.Animation((function(){n.tween.onEnterFrame()}),m),this.tween=new u(g,(function(t){n._tweenFunc(t)}),h,0,1,1e3*p,f),this._addListeners(),d.attrs[l]||(d.attrs[l]={}),d.attrs[l][this._id]||(d.attrs[l][this._id]={}),d.tweens[l]||(d.tweens[l]={}),t)void 0===s[g]&&this._addAttr(g,t[g]);this.reset(),this.onFinish=t.onFinish,this.onReset=t.onReset,this.onUpdate=t.onUpdate}_addAttr(t,e){const n=this.node,i=n._id;let o,a,s,c,u;const h=d.tweens[i][t];h&&delete d.attrs[i][h][t];let f=n.getAttr(t);if(r.Util._isArray(e))if(o=[],a=Math.max(e.length,f.length),"points"===t&&e.length!==f.length&&(e.length>f.length?(c=f,f=r.Util._prepareArrayForTween(f,e,n.closed())):(s=e,e=r.Util._prepareArrayForTween(e,f,n.closed()))),0===t.indexOf("fill"))for(let l=0;l<a;l++)if(l%2===0)o.push(e[l]-f[l]);else{const t=r.Util.colorToRGBA(f[l]);u=r.Util.colorToRGBA(e[l]),f[l]=t,o.push({r:u.r-t.r,g:u.g-t.g,b:u.b-t.b,a:u.a-t.a})}else for(let r=0;r<a;r++)o.push(e[r]-f[r]);else-1!==l.indexOf(t)?(f=r.Util.colorToRGBA(f),u=r.Util.colorToRGBA(e),o={r:u.r-f.r,g:u.g-f.g,b:u.b-f.b,a:u.a-f.a}):o=e-f;d.attrs[i][this._id][t]={start:f,diff:o,end:e,trueEnd:s,trueStart:c},d.tweens[i][t]=this._id}_tweenFunc(t){const e=this.node,n=d.attrs[e._id][this._id];let i,o,a,s,c,u,h,f;for(i in n){if(o=n[i],a=o.start,s=o.diff,f=o.end,r.Util._isArray(a))if(c=[],h=Math.max(a.length,f.length),0===i.indexOf("fill"))for(u=0;u<h;u++)u%2===0?c.push((a[u]||0)+s[u]*t):c.push("rgba("+Math.round(a[u].r+s[u].r*t)+","+Math.round(a[u].g+s[u].g*t)+","+Math.round(a[u].b+s[u].b*t)+","+(a[u].a+s[u].a*t)+")");else for(u=0;u<h;u++)c.push((a[u]||0)+s[u]*t);else c=-1!==l.indexOf(i)?"rgba("+Math.round(a.r+s.r*t)+","+Math.round(a.g+s.g*t)+","+Math.round(a.b+s.b*t)+","+(a.a+s.a*t)+")":a+s*t;e.setAttr(i,c)}}_addListeners(){this.tween.onPlay=()=>{this.anim.start()},this.tween.onReverse=()=>{this.anim.start()},this.tween.onPause=()=>{this.anim.stop()},this.tween.onFinish=()=>{const t=this.node,e=d.attrs[t._id][this._id];e.points&&e.points.trueEnd&&t.setAttr("points",e.points.trueEnd),this.onFinish&&this.onFinish.call(this)},this.tween.onReset=()=>{const t=this.node,e=d.attrs[t._id][this._id];e.points&&e.points.trueStart&&t.points(e.points.trueStart),this.onReset&&this.onReset()},this.tween.onUpdate=()=>{this.onUpdate&&this.onUpdate.call(this)}}play(){return this.tween.play(),this}reverse(){return this.tween.reverse(),this}reset(){return this.tween.reset(),this}seek(t){return this.tween.seek(1e3*t),this}pause(){return this.tween.pause(),this}finish(){return this.tween.finish(),this}destroy(){const t=this.node._id,e=this._id,n=d.tweens[t];this.pause();for(const r in n)delete d.tweens[t][r];delete d.attrs[t][e]}}e.Tween=d,d.attrs={},d.tweens={},o.Node.prototype.to=function(t){const e=t.onFinish;t.node=this,t.onFinish=function(){this.destroy(),e&&e()};new d(t).play()},e.Easings={BackEaseIn(t,e,n,r){const i=1.70158;return n*(t/=r)*t*((i+1)*t-i)+e},BackEaseOut(t,e,n,r){const i=1.70158;return n*((t=t/r-1)*t*((i+1)*t+i)+1)+e},BackEaseInOut(t,e,n,r){let i=1.70158;return(t/=r/2)<1?n/2*(t*t*((1+(i*=1.525))*t-i))+e:n/2*((t-=2)*t*((1+(i*=1.525))*t+i)+2)+e},ElasticEaseIn(t,e,n,r,i,o){let a=0;return 0===t?e:1===(t/=r)?e+n:(o||(o=.3*r),!i||i<Math.abs(n)?(i=n,a=o/4):a=o/(2*Math.PI)*Math.asin(n/i),-i*Math.pow(2,10*(t-=1))*Math.sin((t*r-a)*(2*Math.PI)/o)+e)},ElasticEaseOut(t,e,n,r,i,o){let a=0;return 0===t?e:1===(t/=r)?e+n:(o||(o=.3*r),!i||i<Math.abs(n)?(i=n,a=o/4):a=o/(2*Math.PI)*Math.asin(n/i),i*Math.pow(2,-10*t)*Math.sin((t*r-a)*(2*Math.PI)/o)+n+e)},ElasticEaseInOut(t,e,n,r,i,o){let a=0;return 0===t?e:2===(t/=r/2)?e+n:(o||(o=r*(.3*1.5)),!i||i<Math.abs(n)?(i=n,a=o/4):a=o/(2*Math.PI)*Math.asin(n/i),t<1?i*Math.pow(2,10*(t-=1))*Math.sin((t*r-a)*(2*Math.PI)/o)*-.5+e:i*Math.pow(2,-10*(t-=1))*Math.sin((t*r-a)*(2*Math.PI)/o)*.5+n+e)},BounceEaseOut:(t,e,n,r)=>(t/=r)<1/2.75?n*(7.5625*t*t)+e:t<2/2.75?n*(7.5625*(t-=1.5/2.75)*t+.75)+e:t<2.5/2.75?n*(7.5625*(t-=2.25/2.75)*t+.9375)+e:n*(7.5625*(t-=2.625/2.75)*t+.984375)+e,BounceEaseIn:(t,n,r,i)=>r-e.Easings.BounceEaseOut(i-t,0,r,i)+n,BounceEaseInOut:(t,n,r,i)=>t<i/2?.5*e.Easings.BounceEaseIn(2*t,0,r,i)+n:.5*e.Easings.BounceEaseOut(2*t-i,0,r,i)+.5*r+n,EaseIn:(t,e,n,r)=>n*(t/=r)*t+e,EaseOut:(t,e,n,r)=>-n*(t/=r)*(t-2)+e,EaseInOut:(t,e,n,r)=>(t/=r/2)<1?n/2*t*t+e:-n/2*(--t*(t-2)-1)+e,StrongEaseIn:(t,e,n,r)=>n*(t/=r)*t*t*t*t+e,StrongEaseOut:(t,e,n,r)=>n*((t=t/r-1)*t*t*t*t+1)+e,StrongEaseInOut:(t,e,n,r)=>(t/=r/2)<1?n/2*t*t*t*t*t+e:n/2*((t-=2)*t*t*t*t+2)+e,Linear:(t,e,n,r)=>n*t/r+e}},5783:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Contrast=void 0;const r=n(1751),i=n(1189),o=n(9910);e.Contrast=function(t){const e=Math.pow((this.contrast()+100)/100,2),n=t.data,r=n.length;let i=150,o=150,a=150;for(let s=0;s<r;s+=4)i=n[s],o=n[s+1],a=n[s+2],i/=255,i-=.5,i*=e,i+=.5,i*=255,o/=255,o-=.5,o*=e,o+=.5,o*=255,a/=255,a-=.5,a*=e,a+=.5,a*=255,i=i<0?0:i>255?255:i,o=o<0?0:o>255?255:o,a=a<0?0:a>255?255:a,n[s]=i,n[s+1]=o,n[s+2]=a},r.Factory.addGetterSetter(i.Node,"contrast",0,(0,o.getNumberValidator)(),r.Factory.afterSetFilter)},5804:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Line=void 0;const r=n(1751),i=n(4602),o=n(3304),a=n(9910);function s(t,e,n,r,i,o,a){const s=Math.sqrt(Math.pow(n-t,2)+Math.pow(r-e,2)),l=Math.sqrt(Math.pow(i-n,2)+Math.pow(o-r,2)),c=a*s/(s+l),u=a*l/(s+l);return[n-c*(i-t),r-c*(o-e),n+u*(i-t),r+u*(o-e)]}function l(t,e){const n=t.length,r=[];for(let i=2;i<n-2;i+=2){const n=s(t[i-2],t[i-1],t[i],t[i+1],t[i+2],t[i+3],e);isNaN(n[0])||(r.push(n[0]),r.push(n[1]),r.push(t[i]),r.push(t[i+1]),r.push(n[2]),r.push(n[3]))}return r}class c extends o.Shape{constructor(t){super(t),this.on("pointsChange.konva tensionChange.konva closedChange.konva bezierChange.konva",(function(){this._clearCache("tensionPoints")}))}_sceneFunc(t){let e,n,r,i=this.points(),o=i.length,a=this.tension(),s=this.closed(),l=this.bezier();if(o){if(t.beginPath(),t.moveTo(i[0],i[1]),0!==a&&o>4){for(e=this.getTensionPoints(),n=e.length,r=s?0:4,s||t.quadraticCurveTo(e[0],e[1],e[2],e[3]);r<n-2;)t.bezierCurveTo(e[r++],e[r++],e[r++],e[r++],e[r++],e[r++]);s||t.quadraticCurveTo(e[n-2],e[n-1],i[o-2],i[o-1])}else if(l)for(r=2;r<o;)t.bezierCurveTo(i[r++],i[r++],i[r++],i[r++],i[r++],i[r++]);else for(r=2;r<o;r+=2)t.lineTo(i[r],i[r+1]);s?(t.closePath(),t.fillStrokeShape(this)):t.strokeShape(this)}}getTensionPoints(){return this._getCache("tensionPoints",this._getTensionPoints)}_getTensionPoints(){return this.closed()?this._getTensionPointsClosed():l(this.points(),this.tension())}_getTensionPointsClosed(){const t=this.points(),e=t.length,n=this.tension(),r=s(t[e-2],t[e-1],t[0],t[1],t[2],t[3],n),i=s(t[e-4],t[e-3],t[e-2],t[e-1],t[0],t[1],n),o=l(t,n);return[r[2],r[3]].concat(o).concat([i[0],i[1],t[e-2],t[e-1],i[2],i[3],r[0],r[1],t[0],t[1]])}getWidth(){return this.getSelfRect().width}getHeight(){return this.getSelfRect().height}getSelfRect(){let t=this.points();if(t.length<4)return{x:t[0]||0,y:t[1]||0,width:0,height:0};t=0!==this.tension()?[t[0],t[1],...this._getTensionPoints(),t[t.length-2],t[t.length-1]]:this.points();let e,n,r=t[0],i=t[0],o=t[1],a=t[1];for(let s=0;s<t.length/2;s++)e=t[2*s],n=t[2*s+1],r=Math.min(r,e),i=Math.max(i,e),o=Math.min(o,n),a=Math.max(a,n);return{x:r,y:o,width:i-r,height:a-o}}}e.Line=c,c.prototype.className="Line",c.prototype._attrsAffectingSize=["points","bezier","tension"],(0,i._registerNode)(c),r.Factory.addGetterSetter(c,"closed",!1),r.Factory.addGetterSetter(c,"bezier",!1),r.Factory.addGetterSetter(c,"tension",0,(0,a.getNumberValidator)()),r.Factory.addGetterSetter(c,"points",[],(0,a.getNumberArrayValidator)())},5941:(t,e)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.t2length=e.getQuadraticArcLength=e.getCubicArcLength=e.binomialCoefficients=e.cValues=e.tValues=void 0,e.tValues=[[],[],[-.5773502691896257,.5773502691896257],[0,-.7745966692414834,.7745966692414834],[-.33998104358485626,.33998104358485626,-.8611363115940526,.8611363115940526],[0,-.5384693101056831,.5384693101056831,-.906179845938664,.906179845938664],[.6612093864662645,-.6612093864662645,-.2386191860831969,.2386191860831969,-.932469514203152,.932469514203152],[0,.4058451513773972,-.4058451513773972,-.7415311855993945,.7415311855993945,-.9491079123427585,.9491079123427585],[-.1834346424956498,.1834346424956498,-.525532409916329,.525532409916329,-.7966664774136267,.7966664774136267,-.9602898564975363,.9602898564975363],[0,-.8360311073266358,.8360311073266358,-.9681602395076261,.9681602395076261,-.3242534234038089,.3242534234038089,-.6133714327005904,.6133714327005904],[-.14887433898163122,.14887433898163122,-.4333953941292472,.4333953941292472,-.6794095682990244,.6794095682990244,-.8650633666889845,.8650633666889845,-.9739065285171717,.9739065285171717],[0,-.26954315595234496,.26954315595234496,-.5190961292068118,.5190961292068118,-.7301520055740494,.7301520055740494,-.8870625997680953,.8870625997680953,-.978228658146057,.978228658146057],[-.1252334085114689,.1252334085114689,-.3678314989981802,.3678314989981802,-.5873179542866175,.5873179542866175,-.7699026741943047,.7699026741943047,-.9041172563704749,.9041172563704749,-.9815606342467192,.9815606342467192],[0,-.2304583159551348,.2304583159551348,-.44849275103644687,.44849275103644687,-.6423493394403402,.6423493394403402,-.8015780907333099,.8015780907333099,-.9175983992229779,.9175983992229779,-.9841830547185881,.9841830547185881],[-.10805494870734367,.10805494870734367,-.31911236892788974,.31911236892788974,-.5152486363581541,.5152486363581541,-.6872929048116855,.6872929048116855,-.827201315069765,.827201315069765,-.9284348836635735,.9284348836635735,-.9862838086968123,.9862838086968123],[0,-.20119409399743451,.20119409399743451,-.3941513470775634,.3941513470775634,-.5709721726085388,.5709721726085388,-.7244177313601701,.7244177313601701,-.8482065834104272,.8482065834104272,-.937273392400706,.937273392400706,-.9879925180204854,.9879925180204854],[-.09501250983763744,.09501250983763744,-.2816035507792589,.2816035507792589,-.45801677765722737,.45801677765722737,-.6178762444026438,.6178762444026438,-.755404408355003,.755404408355003,-.8656312023878318,.8656312023878318,-.9445750230732326,.9445750230732326,-.9894009349916499,.9894009349916499],[0,-.17848418149584785,.17848418149584785,-.3512317634538763,.3512317634538763,-.5126905370864769,.5126905370864769,-.6576711592166907,.6576711592166907,-.7815140038968014,.7815140038968014,-.8802391537269859,.8802391537269859,-.9506755217687678,.9506755217687678,-.9905754753144174,.9905754753144174],[-.0847750130417353,.0847750130417353,-.2518862256915055,.2518862256915055,-.41175116146284263,.41175116146284263,-.5597708310739475,.5597708310739475,-.6916870430603532,.6916870430603532,-.8037049589725231,.8037049589725231,-.8926024664975557,.8926024664975557,-.9558239495713977,.9558239495713977,-.9915651684209309,.9915651684209309],[0,-.16035864564022537,.16035864564022537,-.31656409996362983,.31656409996362983,-.46457074137596094,.46457074137596094,-.600545304661681,.600545304661681,-.7209661773352294,.7209661773352294,-.8227146565371428,.8227146565371428,-.9031559036148179,.9031559036148179,-.96020815213483,.96020815213483,-.9924068438435844,.9924068438435844],[-.07652652113349734,.07652652113349734,-.22778585114164507,.22778585114164507,-.37370608871541955,.37370608871541955,-.5108670019508271,.5108670019508271,-.636053680726515,.636053680726515,-.7463319064601508,.7463319064601508,-.8391169718222188,.8391169718222188,-.912234428251326,.912234428251326,-.9639719272779138,.9639719272779138,-.9931285991850949,.9931285991850949],[0,-.1455618541608951,.1455618541608951,-.2880213168024011,.2880213168024011,-.4243421202074388,.4243421202074388,-.5516188358872198,.5516188358872198,-.6671388041974123,.6671388041974123,-.7684399634756779,.7684399634756779,-.8533633645833173,.8533633645833173,-.9200993341504008,.9200993341504008,-.9672268385663063,.9672268385663063,-.9937521706203895,.9937521706203895],[-.06973927331972223,.06973927331972223,-.20786042668822127,.20786042668822127,-.34193582089208424,.34193582089208424,-.469355837986757,.469355837986757,-.5876404035069116,.5876404035069116,-.6944872631866827,.6944872631866827,-.7878168059792081,.7878168059792081,-.8658125777203002,.8658125777203002,-.926956772187174,.926956772187174,-.9700604978354287,.9700604978354287,-.9942945854823992,.9942945854823992],[0,-.1332568242984661,.1332568242984661,-.26413568097034495,.26413568097034495,-.3903010380302908,.3903010380302908,-.5095014778460075,.5095014778460075,-.6196098757636461,.6196098757636461,-.7186613631319502,.7186613631319502,-.8048884016188399,.8048884016188399,-.8767523582704416,.8767523582704416,-.9329710868260161,.9329710868260161,-.9725424712181152,.9725424712181152,-.9947693349975522,.9947693349975522],[-.06405689286260563,.06405689286260563,-.1911188674736163,.1911188674736163,-.3150426796961634,.3150426796961634,-.4337935076260451,.4337935076260451,-.5454214713888396,.5454214713888396,-.6480936519369755,.6480936519369755,-.7401241915785544,.7401241915785544,-.820001985973903,.820001985973903,-.8864155270044011,.8864155270044011,-.9382745520027328,.9382745520027328,-.9747285559713095,.9747285559713095,-.9951872199970213,.9951872199970213]],e.cValues=[[],[],[1,1],[.8888888888888888,.5555555555555556,.5555555555555556],[.6521451548625461,.6521451548625461,.34785484513745385,.34785484513745385],[.5688888888888889,.47862867049936647,.47862867049936647,.23692688505618908,.23692688505618908],[.3607615730481386,.3607615730481386,.46791393457269104,.46791393457269104,.17132449237917036,.17132449237917036],[.4179591836734694,.3818300505051189,.3818300505051189,.27970539148927664,.27970539148927664,.1294849661688697,.1294849661688697],[.362683783378362,.362683783378362,.31370664587788727,.31370664587788727,.22238103445337448,.22238103445337448,.10122853629037626,.10122853629037626],[.3302393550012598,.1806481606948574,.1806481606948574,.08127438836157441,.08127438836157441,.31234707704000286,.31234707704000286,.26061069640293544,.26061069640293544],[.29552422471475287,.29552422471475287,.26926671930999635,.26926671930999635,.21908636251598204,.21908636251598204,.1494513491505806,.1494513491505806,.06667134430868814,.06667134430868814],[.2729250867779006,.26280454451024665,.26280454451024665,.23319376459199048,.23319376459199048,.18629021092773426,.18629021092773426,.1255803694649046,.1255803694649046,.05566856711617366,.05566856711617366],[.24914704581340277,.24914704581340277,.2334925365383548,.2334925365383548,.20316742672306592,.20316742672306592,.16007832854334622,.16007832854334622,.10693932599531843,.10693932599531843,.04717533638651183,.04717533638651183],[.2325515532308739,.22628318026289723,.22628318026289723,.2078160475368885,.2078160475368885,.17814598076194574,.17814598076194574,.13887351021978725,.13887351021978725,.09212149983772845,.09212149983772845,.04048400476531588,.04048400476531588],[.2152638534631578,.2152638534631578,.2051984637212956,.2051984637212956,.18553839747793782,.18553839747793782,.15720316715819355,.15720316715819355,.12151857068790319,.12151857068790319,.08015808715976021,.08015808715976021,.03511946033175186,.03511946033175186],[.2025782419255613,.19843148532711158,.19843148532711158,.1861610000155622,.1861610000155622,.16626920581699392,.16626920581699392,.13957067792615432,.13957067792615432,.10715922046717194,.10715922046717194,.07036604748810812,.07036604748810812,.03075324199611727,.03075324199611727],[.1894506104550685,.1894506104550685,.18260341504492358,.18260341504492358,.16915651939500254,.16915651939500254,.14959598881657674,.14959598881657674,.12462897125553388,.12462897125553388,.09515851168249279,.09515851168249279,.062253523938647894,.062253523938647894,.027152459411754096,.027152459411754096],[.17944647035620653,.17656270536699264,.17656270536699264,.16800410215645004,.16800410215645004,.15404576107681028,.15404576107681028,.13513636846852548,.13513636846852548,.11188384719340397,.11188384719340397,.08503614831717918,.08503614831717918,.0554595293739872,.0554595293739872,.02414830286854793,.02414830286854793],[.1691423829631436,.1691423829631436,.16427648374583273,.16427648374583273,.15468467512626524,.15468467512626524,.14064291467065065,.14064291467065065,.12255520671147846,.12255520671147846,.10094204410628717,.10094204410628717,.07642573025488905,.07642573025488905,.0497145488949698,.0497145488949698,.02161601352648331,.02161601352648331],[.1610544498487837,.15896884339395434,.15896884339395434,.15276604206585967,.15276604206585967,.1426067021736066,.1426067021736066,.12875396253933621,.12875396253933621,.11156664554733399,.11156664554733399,.09149002162245,.09149002162245,.06904454273764123,.06904454273764123,.0448142267656996,.0448142267656996,.019461788229726478,.019461788229726478],[.15275338713072584,.15275338713072584,.14917298647260374,.14917298647260374,.14209610931838204,.14209610931838204,.13168863844917664,.13168863844917664,.11819453196151841,.11819453196151841,.10193011981724044,.10193011981724044,.08327674157670475,.08327674157670475,.06267204833410907,.06267204833410907,.04060142980038694,.04060142980038694,.017614007139152118,.017614007139152118],[.14608113364969041,.14452440398997005,.14452440398997005,.13988739479107315,.13988739479107315,.13226893863333747,.13226893863333747,.12183141605372853,.12183141605372853,.10879729916714838,.10879729916714838,.09344442345603386,.09344442345603386,.0761001136283793,.0761001136283793,.057134425426857205,.057134425426857205,.036953789770852494,.036953789770852494,.016017228257774335,.016017228257774335],[.13925187285563198,.13925187285563198,.13654149834601517,.13654149834601517,.13117350478706238,.13117350478706238,.12325237681051242,.12325237681051242,.11293229608053922,.11293229608053922,.10041414444288096,.10041414444288096,.08594160621706773,.08594160621706773,.06979646842452049,.06979646842452049,.052293335152683286,.052293335152683286,.03377490158481415,.03377490158481415,.0146279952982722,.0146279952982722],[.13365457218610619,.1324620394046966,.1324620394046966,.12890572218808216,.12890572218808216,.12304908430672953,.12304908430672953,.11499664022241136,.11499664022241136,.10489209146454141,.10489209146454141,.09291576606003515,.09291576606003515,.07928141177671895,.07928141177671895,.06423242140852585,.06423242140852585,.04803767173108467,.04803767173108467,.030988005856979445,.030988005856979445,.013411859487141771,.013411859487141771],[.12793819534675216,.12793819534675216,.1258374563468283,.1258374563468283,.12167047292780339,.12167047292780339,.1155056680537256,.1155056680537256,.10744427011596563,.10744427011596563,.09761865210411388,.09761865210411388,.08619016153195327,.08619016153195327,.0733464814110803,.0733464814110803,.05929858491543678,.05929858491543678,.04427743881741981,.04427743881741981,.028531388628933663,.028531388628933663,.0123412297999872,.0123412297999872]],e.binomialCoefficients=[[1],[1,1],[1,2,1],[1,3,3,1]];e.getCubicArcLength=(t,r,i)=>{let o,a;const s=i/2;o=0;for(let l=0;l<20;l++)a=s*e.tValues[20][l]+s,o+=e.cValues[20][l]*n(t,r,a);return s*o};function n(t,e,n){const i=r(1,n,t),o=r(1,n,e),a=i*i+o*o;return Math.sqrt(a)}e.getQuadraticArcLength=(t,e,n)=>{void 0===n&&(n=1);const r=t[0]-2*t[1]+t[2],i=e[0]-2*e[1]+e[2],o=2*t[1]-2*t[0],a=2*e[1]-2*e[0],s=4*(r*r+i*i),l=4*(r*o+i*a),c=o*o+a*a;if(0===s)return n*Math.sqrt(Math.pow(t[2]-t[0],2)+Math.pow(e[2]-e[0],2));const u=l/(2*s),d=n+u,h=c/s-u*u,f=d*d+h>0?Math.sqrt(d*d+h):0,p=u*u+h>0?Math.sqrt(u*u+h):0,g=u+Math.sqrt(u*u+h)!==0?h*Math.log(Math.abs((d+f)/(u+p))):0;return Math.sqrt(s)/2*(d*f-u*p+g)};const r=(t,n,i)=>{const o=i.length-1;let a,s;if(0===o)return 0;if(0===t){s=0;for(let t=0;t<=o;t++)s+=e.binomialCoefficients[o][t]*Math.pow(1-n,o-t)*Math.pow(n,t)*i[t];return s}a=new Array(o);for(let e=0;e<o;e++)a[e]=o*(i[e+1]-i[e]);return r(t-1,n,a)};e.t2length=(t,e,n)=>{let r=1,i=t/e,o=(t-n(i))/e,a=0;for(;r>.001;){const s=n(i+o),l=Math.abs(t-s)/e;if(l<r)r=l,i+=o;else{const a=n(i-o),s=Math.abs(t-a)/e;s<r?(r=s,i-=o):o/=2}if(a++,a>500)break}return i}},6095:t=>{var e=Object.prototype.toString;t.exports=function(t){return e.call(t)}},6338:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Group=void 0;const r=n(7149),i=n(4598),o=n(4602);class a extends i.Container{_validateAdd(t){const e=t.getType();"Group"!==e&&"Shape"!==e&&r.Util.throw("You may only add groups and shapes to groups.")}}e.Group=a,a.prototype.nodeType="Group",(0,o._registerNode)(a)},6366:t=>{var e="undefined"!==typeof Element,n="function"===typeof Map,r="function"===typeof Set,i="function"===typeof ArrayBuffer&&!!ArrayBuffer.isView;function o(t,a){if(t===a)return!0;if(t&&a&&"object"==typeof t&&"object"==typeof a){if(t.constructor!==a.constructor)return!1;var s,l,c,u;if(Array.isArray(t)){if((s=t.length)!=a.length)return!1;for(l=s;0!==l--;)if(!o(t[l],a[l]))return!1;return!0}if(n&&t instanceof Map&&a instanceof Map){if(t.size!==a.size)return!1;for(u=t.entries();!(l=u.next()).done;)if(!a.has(l.value[0]))return!1;for(u=t.entries();!(l=u.next()).done;)if(!o(l.value[1],a.get(l.value[0])))return!1;return!0}if(r&&t instanceof Set&&a instanceof Set){if(t.size!==a.size)return!1;for(u=t.entries();!(l=u.next()).done;)if(!a.has(l.value[0]))return!1;return!0}if(i&&ArrayBuffer.isView(t)&&ArrayBuffer.isView(a)){if((s=t.length)!=a.length)return!1;for(l=s;0!==l--;)if(t[l]!==a[l])return!1;return!0}if(t.constructor===RegExp)return t.source===a.source&&t.flags===a.flags;if(t.valueOf!==Object.prototype.valueOf&&"function"===typeof t.valueOf&&"function"===typeof a.valueOf)return t.valueOf()===a.valueOf();if(t.toString!==Object.prototype.toString&&"function"===typeof t.toString&&"function"===typeof a.toString)return t.toString()===a.toString();if((s=(c=Object.keys(t)).length)!==Object.keys(a).length)return!1;for(l=s;0!==l--;)if(!Object.prototype.hasOwnProperty.call(a,c[l]))return!1;if(e&&t instanceof Element)return!1;for(l=s;0!==l--;)if(("_owner"!==c[l]&&"__v"!==c[l]&&"__o"!==c[l]||!t.$$typeof)&&!o(t[c[l]],a[c[l]]))return!1;return!0}return t!==t&&a!==a}t.exports=function(t,e){try{return o(t,e)}catch(n){if((n.message||"").match(/stack|recursion/i))return console.warn("react-fast-compare cannot handle circular refs"),!1;throw n}}},6494:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Tag=e.Label=void 0;const r=n(1751),i=n(3304),o=n(6338),a=n(9910),s=n(4602),l=["fontFamily","fontSize","fontStyle","padding","lineHeight","text","width","height","pointerDirection","pointerWidth","pointerHeight"],c="up",u="right",d="down",h="left",f=l.length;class p extends o.Group{constructor(t){super(t),this.on("add.konva",(function(t){this._addListeners(t.child),this._sync()}))}getText(){return this.find("Text")[0]}getTag(){return this.find("Tag")[0]}_addListeners(t){let e,n=this;const r=function(){n._sync()};for(e=0;e<f;e++)t.on(l[e]+"Change.konva",r)}getWidth(){return this.getText().width()}getHeight(){return this.getText().height()}_sync(){let t,e,n,r,i,o,a,s=this.getText(),l=this.getTag();if(s&&l){switch(t=s.width(),e=s.height(),n=l.pointerDirection(),r=l.pointerWidth(),a=l.pointerHeight(),i=0,o=0,n){case c:i=t/2,o=-1*a;break;case u:i=t+r,o=e/2;break;case d:i=t/2,o=e+a;break;case h:i=-1*r,o=e/2}l.setAttrs({x:-1*i,y:-1*o,width:t,height:e}),s.setAttrs({x:-1*i,y:-1*o})}}}e.Label=p,p.prototype.className="Label",(0,s._registerNode)(p);class g extends i.Shape{_sceneFunc(t){const e=this.width(),n=this.height(),r=this.pointerDirection(),i=this.pointerWidth(),o=this.pointerHeight(),a=this.cornerRadius();let s=0,l=0,f=0,p=0;"number"===typeof a?s=l=f=p=Math.min(a,e/2,n/2):(s=Math.min(a[0]||0,e/2,n/2),l=Math.min(a[1]||0,e/2,n/2),p=Math.min(a[2]||0,e/2,n/2),f=Math.min(a[3]||0,e/2,n/2)),t.beginPath(),t.moveTo(s,0),r===c&&(t.lineTo((e-i)/2,0),t.lineTo(e/2,-1*o),t.lineTo((e+i)/2,0)),t.lineTo(e-l,0),t.arc(e-l,l,l,3*Math.PI/2,0,!1),r===u&&(t.lineTo(e,(n-o)/2),t.lineTo(e+i,n/2),t.lineTo(e,(n+o)/2)),t.lineTo(e,n-p),t.arc(e-p,n-p,p,0,Math.PI/2,!1),r===d&&(t.lineTo((e+i)/2,n),t.lineTo(e/2,n+o),t.lineTo((e-i)/2,n)),t.lineTo(f,n),t.arc(f,n-f,f,Math.PI/2,Math.PI,!1),r===h&&(t.lineTo(0,(n+o)/2),t.lineTo(-1*i,n/2),t.lineTo(0,(n-o)/2)),t.lineTo(0,s),t.arc(s,s,s,Math.PI,3*Math.PI/2,!1),t.closePath(),t.fillStrokeShape(this)}getSelfRect(){let t=0,e=0,n=this.pointerWidth(),r=this.pointerHeight(),i=this.pointerDirection(),o=this.width(),a=this.height();return i===c?(e-=r,a+=r):i===d?a+=r:i===h?(t-=1.5*n,o+=n):i===u&&(o+=1.5*n),{x:t,y:e,width:o,height:a}}}e.Tag=g,g.prototype.className="Tag",(0,s._registerNode)(g),r.Factory.addGetterSetter(g,"pointerDirection","none"),r.Factory.addGetterSetter(g,"pointerWidth",0,(0,a.getNumberValidator)()),r.Factory.addGetterSetter(g,"pointerHeight",0,(0,a.getNumberValidator)()),r.Factory.addGetterSetter(g,"cornerRadius",0,(0,a.getNumberOrArrayOfNumbersValidator)(4))},6552:(t,e,n)=>{var r=n(7105),i="object"==typeof self&&self&&self.Object===Object&&self,o=r||i||Function("return this")();t.exports=o},6686:t=>{t.exports=function(t){var e=typeof t;return null!=t&&("object"==e||"function"==e)}},6904:(t,e,n)=>{"use strict";t.exports=n(7739)},6913:(t,e,n)=>{var r=n(9812),i=n(4552),o=n(6095),a=r?r.toStringTag:void 0;t.exports=function(t){return null==t?void 0===t?"[object Undefined]":"[object Null]":a&&a in Object(t)?i(t):o(t)}},6958:(t,e,n)=>{t.exports=function(t){var e={},r=n(5043),i=n(8853),o=Object.assign;function a(t){for(var e="https://reactjs.org/docs/error-decoder.html?invariant="+t,n=1;n<arguments.length;n++)e+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+t+"; visit "+e+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var s=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,l=Symbol.for("react.element"),c=Symbol.for("react.portal"),u=Symbol.for("react.fragment"),d=Symbol.for("react.strict_mode"),h=Symbol.for("react.profiler"),f=Symbol.for("react.provider"),p=Symbol.for("react.context"),g=Symbol.for("react.forward_ref"),m=Symbol.for("react.suspense"),y=Symbol.for("react.suspense_list"),b=Symbol.for("react.memo"),v=Symbol.for("react.lazy");Symbol.for("react.scope"),Symbol.for("react.debug_trace_mode");var _=Symbol.for("react.offscreen");Symbol.for("react.legacy_hidden"),Symbol.for("react.cache"),Symbol.for("react.tracing_marker");var w=Symbol.iterator;function x(t){return null===t||"object"!==typeof t?null:"function"===typeof(t=w&&t[w]||t["@@iterator"])?t:null}function S(t){if(null==t)return null;if("function"===typeof t)return t.displayName||t.name||null;if("string"===typeof t)return t;switch(t){case u:return"Fragment";case c:return"Portal";case h:return"Profiler";case d:return"StrictMode";case m:return"Suspense";case y:return"SuspenseList"}if("object"===typeof t)switch(t.$$typeof){case p:return(t.displayName||"Context")+".Consumer";case f:return(t._context.displayName||"Context")+".Provider";case g:var e=t.render;return(t=t.displayName)||(t=""!==(t=e.displayName||e.name||"")?"ForwardRef("+t+")":"ForwardRef"),t;case b:return null!==(e=t.displayName||null)?e:S(t.type)||"Memo";case v:e=t._payload,t=t._init;try{return S(t(e))}catch(n){}}return null}function k(t){var e=t.type;switch(t.tag){case 24:return"Cache";case 9:return(e.displayName||"Context")+".Consumer";case 10:return(e._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return t=(t=e.render).displayName||t.name||"",e.displayName||(""!==t?"ForwardRef("+t+")":"ForwardRef");case 7:return"Fragment";case 5:return e;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return S(e);case 8:return e===d?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if("function"===typeof e)return e.displayName||e.name||null;if("string"===typeof e)return e}return null}function C(t){var e=t,n=t;if(t.alternate)for(;e.return;)e=e.return;else{t=e;do{0!==(4098&(e=t).flags)&&(n=e.return),t=e.return}while(t)}return 3===e.tag?n:null}function T(t){if(C(t)!==t)throw Error(a(188))}function P(t){var e=t.alternate;if(!e){if(null===(e=C(t)))throw Error(a(188));return e!==t?null:t}for(var n=t,r=e;;){var i=n.return;if(null===i)break;var o=i.alternate;if(null===o){if(null!==(r=i.return)){n=r;continue}break}if(i.child===o.child){for(o=i.child;o;){if(o===n)return T(i),t;if(o===r)return T(i),e;o=o.sibling}throw Error(a(188))}if(n.return!==r.return)n=i,r=o;else{for(var s=!1,l=i.child;l;){if(l===n){s=!0,n=i,r=o;break}if(l===r){s=!0,r=i,n=o;break}l=l.sibling}if(!s){for(l=o.child;l;){if(l===n){s=!0,n=o,r=i;break}if(l===r){s=!0,r=o,n=i;break}l=l.sibling}if(!s)throw Error(a(189))}}if(n.alternate!==r)throw Error(a(190))}if(3!==n.tag)throw Error(a(188));return n.stateNode.current===n?t:e}function E(t){return null!==(t=P(t))?A(t):null}function A(t){if(5===t.tag||6===t.tag)return t;for(t=t.child;null!==t;){var e=A(t);if(null!==e)return e;t=t.sibling}return null}function I(t){if(5===t.tag||6===t.tag)return t;for(t=t.child;null!==t;){if(4!==t.tag){var e=I(t);if(null!==e)return e}t=t.sibling}return null}var M,F=Array.isArray,D=t.getPublicInstance,R=t.getRootHostContext,O=t.getChildHostContext,N=t.prepareForCommit,L=t.resetAfterCommit,B=t.createInstance,z=t.appendInitialChild,j=t.finalizeInitialChildren,U=t.prepareUpdate,V=t.shouldSetTextContent,$=t.createTextInstance,W=t.scheduleTimeout,G=t.cancelTimeout,H=t.noTimeout,Y=t.isPrimaryRenderer,q=t.supportsMutation,K=t.supportsPersistence,X=t.supportsHydration,Q=t.getInstanceFromNode,Z=t.preparePortalMount,J=t.getCurrentEventPriority,tt=t.detachDeletedInstance,et=t.supportsMicrotasks,nt=t.scheduleMicrotask,rt=t.supportsTestSelectors,it=t.findFiberRoot,ot=t.getBoundingRect,at=t.getTextContent,st=t.isHiddenSubtree,lt=t.matchAccessibilityRole,ct=t.setFocusIfFocusable,ut=t.setupIntersectionObserver,dt=t.appendChild,ht=t.appendChildToContainer,ft=t.commitTextUpdate,pt=t.commitMount,gt=t.commitUpdate,mt=t.insertBefore,yt=t.insertInContainerBefore,bt=t.removeChild,vt=t.removeChildFromContainer,_t=t.resetTextContent,wt=t.hideInstance,xt=t.hideTextInstance,St=t.unhideInstance,kt=t.unhideTextInstance,Ct=t.clearContainer,Tt=t.cloneInstance,Pt=t.createContainerChildSet,Et=t.appendChildToContainerChildSet,At=t.finalizeContainerChildren,It=t.replaceContainerChildren,Mt=t.cloneHiddenInstance,Ft=t.cloneHiddenTextInstance,Dt=t.canHydrateInstance,Rt=t.canHydrateTextInstance,Ot=t.canHydrateSuspenseInstance,Nt=t.isSuspenseInstancePending,Lt=t.isSuspenseInstanceFallback,Bt=t.getSuspenseInstanceFallbackErrorDetails,zt=t.registerSuspenseInstanceRetry,jt=t.getNextHydratableSibling,Ut=t.getFirstHydratableChild,Vt=t.getFirstHydratableChildWithinContainer,$t=t.getFirstHydratableChildWithinSuspenseInstance,Wt=t.hydrateInstance,Gt=t.hydrateTextInstance,Ht=t.hydrateSuspenseInstance,Yt=t.getNextHydratableInstanceAfterSuspenseInstance,qt=t.commitHydratedContainer,Kt=t.commitHydratedSuspenseInstance,Xt=t.clearSuspenseBoundary,Qt=t.clearSuspenseBoundaryFromContainer,Zt=t.shouldDeleteUnhydratedTailInstances,Jt=t.didNotMatchHydratedContainerTextInstance,te=t.didNotMatchHydratedTextInstance;function ee(t){if(void 0===M)try{throw Error()}catch(n){var e=n.stack.trim().match(/\n( *(at )?)/);M=e&&e[1]||""}return"\n"+M+t}var ne=!1;function re(t,e){if(!t||ne)return"";ne=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(e)if(e=function(){throw Error()},Object.defineProperty(e.prototype,"props",{set:function(){throw Error()}}),"object"===typeof Reflect&&Reflect.construct){try{Reflect.construct(e,[])}catch(c){var r=c}Reflect.construct(t,[],e)}else{try{e.call()}catch(c){r=c}t.call(e.prototype)}else{try{throw Error()}catch(c){r=c}t()}}catch(c){if(c&&r&&"string"===typeof c.stack){for(var i=c.stack.split("\n"),o=r.stack.split("\n"),a=i.length-1,s=o.length-1;1<=a&&0<=s&&i[a]!==o[s];)s--;for(;1<=a&&0<=s;a--,s--)if(i[a]!==o[s]){if(1!==a||1!==s)do{if(a--,0>--s||i[a]!==o[s]){var l="\n"+i[a].replace(" at new "," at ");return t.displayName&&l.includes("<anonymous>")&&(l=l.replace("<anonymous>",t.displayName)),l}}while(1<=a&&0<=s);break}}}finally{ne=!1,Error.prepareStackTrace=n}return(t=t?t.displayName||t.name:"")?ee(t):""}var ie=Object.prototype.hasOwnProperty,oe=[],ae=-1;function se(t){return{current:t}}function le(t){0>ae||(t.current=oe[ae],oe[ae]=null,ae--)}function ce(t,e){ae++,oe[ae]=t.current,t.current=e}var ue={},de=se(ue),he=se(!1),fe=ue;function pe(t,e){var n=t.type.contextTypes;if(!n)return ue;var r=t.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===e)return r.__reactInternalMemoizedMaskedChildContext;var i,o={};for(i in n)o[i]=e[i];return r&&((t=t.stateNode).__reactInternalMemoizedUnmaskedChildContext=e,t.__reactInternalMemoizedMaskedChildContext=o),o}function ge(t){return null!==(t=t.childContextTypes)&&void 0!==t}function me(){le(he),le(de)}function ye(t,e,n){if(de.current!==ue)throw Error(a(168));ce(de,e),ce(he,n)}function be(t,e,n){var r=t.stateNode;if(e=e.childContextTypes,"function"!==typeof r.getChildContext)return n;for(var i in r=r.getChildContext())if(!(i in e))throw Error(a(108,k(t)||"Unknown",i));return o({},n,r)}function ve(t){return t=(t=t.stateNode)&&t.__reactInternalMemoizedMergedChildContext||ue,fe=de.current,ce(de,t),ce(he,he.current),!0}function _e(t,e,n){var r=t.stateNode;if(!r)throw Error(a(169));n?(t=be(t,e,fe),r.__reactInternalMemoizedMergedChildContext=t,le(he),le(de),ce(de,t)):le(he),ce(he,n)}var we=Math.clz32?Math.clz32:function(t){return 0===(t>>>=0)?32:31-(xe(t)/Se|0)|0},xe=Math.log,Se=Math.LN2;var ke=64,Ce=4194304;function Te(t){switch(t&-t){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return 4194240&t;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return 130023424&t;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return t}}function Pe(t,e){var n=t.pendingLanes;if(0===n)return 0;var r=0,i=t.suspendedLanes,o=t.pingedLanes,a=268435455&n;if(0!==a){var s=a&~i;0!==s?r=Te(s):0!==(o&=a)&&(r=Te(o))}else 0!==(a=n&~i)?r=Te(a):0!==o&&(r=Te(o));if(0===r)return 0;if(0!==e&&e!==r&&0===(e&i)&&((i=r&-r)>=(o=e&-e)||16===i&&0!==(4194240&o)))return e;if(0!==(4&r)&&(r|=16&n),0!==(e=t.entangledLanes))for(t=t.entanglements,e&=r;0<e;)i=1<<(n=31-we(e)),r|=t[n],e&=~i;return r}function Ee(t,e){switch(t){case 1:case 2:case 4:return e+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e+5e3;default:return-1}}function Ae(t){return 0!==(t=-1073741825&t.pendingLanes)?t:1073741824&t?1073741824:0}function Ie(){var t=ke;return 0===(4194240&(ke<<=1))&&(ke=64),t}function Me(t){for(var e=[],n=0;31>n;n++)e.push(t);return e}function Fe(t,e,n){t.pendingLanes|=e,536870912!==e&&(t.suspendedLanes=0,t.pingedLanes=0),(t=t.eventTimes)[e=31-we(e)]=n}function De(t,e){var n=t.entangledLanes|=e;for(t=t.entanglements;n;){var r=31-we(n),i=1<<r;i&e|t[r]&e&&(t[r]|=e),n&=~i}}var Re=0;function Oe(t){return 1<(t&=-t)?4<t?0!==(268435455&t)?16:536870912:4:1}var Ne=i.unstable_scheduleCallback,Le=i.unstable_cancelCallback,Be=i.unstable_shouldYield,ze=i.unstable_requestPaint,je=i.unstable_now,Ue=i.unstable_ImmediatePriority,Ve=i.unstable_UserBlockingPriority,$e=i.unstable_NormalPriority,We=i.unstable_IdlePriority,Ge=null,He=null;var Ye="function"===typeof Object.is?Object.is:function(t,e){return t===e&&(0!==t||1/t===1/e)||t!==t&&e!==e},qe=null,Ke=!1,Xe=!1;function Qe(t){null===qe?qe=[t]:qe.push(t)}function Ze(){if(!Xe&&null!==qe){Xe=!0;var t=0,e=Re;try{var n=qe;for(Re=1;t<n.length;t++){var r=n[t];do{r=r(!0)}while(null!==r)}qe=null,Ke=!1}catch(i){throw null!==qe&&(qe=qe.slice(t+1)),Ne(Ue,Ze),i}finally{Re=e,Xe=!1}}return null}var Je=[],tn=0,en=null,nn=0,rn=[],on=0,an=null,sn=1,ln="";function cn(t,e){Je[tn++]=nn,Je[tn++]=en,en=t,nn=e}function un(t,e,n){rn[on++]=sn,rn[on++]=ln,rn[on++]=an,an=t;var r=sn;t=ln;var i=32-we(r)-1;r&=~(1<<i),n+=1;var o=32-we(e)+i;if(30<o){var a=i-i%5;o=(r&(1<<a)-1).toString(32),r>>=a,i-=a,sn=1<<32-we(e)+i|n<<i|r,ln=o+t}else sn=1<<o|n<<i|r,ln=t}function dn(t){null!==t.return&&(cn(t,1),un(t,1,0))}function hn(t){for(;t===en;)en=Je[--tn],Je[tn]=null,nn=Je[--tn],Je[tn]=null;for(;t===an;)an=rn[--on],rn[on]=null,ln=rn[--on],rn[on]=null,sn=rn[--on],rn[on]=null}var fn=null,pn=null,gn=!1,mn=!1,yn=null;function bn(t,e){var n=as(5,null,null,0);n.elementType="DELETED",n.stateNode=e,n.return=t,null===(e=t.deletions)?(t.deletions=[n],t.flags|=16):e.push(n)}function vn(t,e){switch(t.tag){case 5:return null!==(e=Dt(e,t.type,t.pendingProps))&&(t.stateNode=e,fn=t,pn=Ut(e),!0);case 6:return null!==(e=Rt(e,t.pendingProps))&&(t.stateNode=e,fn=t,pn=null,!0);case 13:if(null!==(e=Ot(e))){var n=null!==an?{id:sn,overflow:ln}:null;return t.memoizedState={dehydrated:e,treeContext:n,retryLane:1073741824},(n=as(18,null,null,0)).stateNode=e,n.return=t,t.child=n,fn=t,pn=null,!0}return!1;default:return!1}}function _n(t){return 0!==(1&t.mode)&&0===(128&t.flags)}function wn(t){if(gn){var e=pn;if(e){var n=e;if(!vn(t,e)){if(_n(t))throw Error(a(418));e=jt(n);var r=fn;e&&vn(t,e)?bn(r,n):(t.flags=-4097&t.flags|2,gn=!1,fn=t)}}else{if(_n(t))throw Error(a(418));t.flags=-4097&t.flags|2,gn=!1,fn=t}}}function xn(t){for(t=t.return;null!==t&&5!==t.tag&&3!==t.tag&&13!==t.tag;)t=t.return;fn=t}function Sn(t){if(!X||t!==fn)return!1;if(!gn)return xn(t),gn=!0,!1;if(3!==t.tag&&(5!==t.tag||Zt(t.type)&&!V(t.type,t.memoizedProps))){var e=pn;if(e){if(_n(t))throw kn(),Error(a(418));for(;e;)bn(t,e),e=jt(e)}}if(xn(t),13===t.tag){if(!X)throw Error(a(316));if(!(t=null!==(t=t.memoizedState)?t.dehydrated:null))throw Error(a(317));pn=Yt(t)}else pn=fn?jt(t.stateNode):null;return!0}function kn(){for(var t=pn;t;)t=jt(t)}function Cn(){X&&(pn=fn=null,mn=gn=!1)}function Tn(t){null===yn?yn=[t]:yn.push(t)}var Pn=s.ReactCurrentBatchConfig;function En(t,e){if(Ye(t,e))return!0;if("object"!==typeof t||null===t||"object"!==typeof e||null===e)return!1;var n=Object.keys(t),r=Object.keys(e);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var i=n[r];if(!ie.call(e,i)||!Ye(t[i],e[i]))return!1}return!0}function An(t){switch(t.tag){case 5:return ee(t.type);case 16:return ee("Lazy");case 13:return ee("Suspense");case 19:return ee("SuspenseList");case 0:case 2:case 15:return t=re(t.type,!1);case 11:return t=re(t.type.render,!1);case 1:return t=re(t.type,!0);default:return""}}function In(t,e,n){if(null!==(t=n.ref)&&"function"!==typeof t&&"object"!==typeof t){if(n._owner){if(n=n._owner){if(1!==n.tag)throw Error(a(309));var r=n.stateNode}if(!r)throw Error(a(147,t));var i=r,o=""+t;return null!==e&&null!==e.ref&&"function"===typeof e.ref&&e.ref._stringRef===o?e.ref:(e=function(t){var e=i.refs;null===t?delete e[o]:e[o]=t},e._stringRef=o,e)}if("string"!==typeof t)throw Error(a(284));if(!n._owner)throw Error(a(290,t))}return t}function Mn(t,e){throw t=Object.prototype.toString.call(e),Error(a(31,"[object Object]"===t?"object with keys {"+Object.keys(e).join(", ")+"}":t))}function Fn(t){return(0,t._init)(t._payload)}function Dn(t){function e(e,n){if(t){var r=e.deletions;null===r?(e.deletions=[n],e.flags|=16):r.push(n)}}function n(n,r){if(!t)return null;for(;null!==r;)e(n,r),r=r.sibling;return null}function r(t,e){for(t=new Map;null!==e;)null!==e.key?t.set(e.key,e):t.set(e.index,e),e=e.sibling;return t}function i(t,e){return(t=ls(t,e)).index=0,t.sibling=null,t}function o(e,n,r){return e.index=r,t?null!==(r=e.alternate)?(r=r.index)<n?(e.flags|=2,n):r:(e.flags|=2,n):(e.flags|=1048576,n)}function s(e){return t&&null===e.alternate&&(e.flags|=2),e}function d(t,e,n,r){return null===e||6!==e.tag?((e=hs(n,t.mode,r)).return=t,e):((e=i(e,n)).return=t,e)}function h(t,e,n,r){var o=n.type;return o===u?p(t,e,n.props.children,r,n.key):null!==e&&(e.elementType===o||"object"===typeof o&&null!==o&&o.$$typeof===v&&Fn(o)===e.type)?((r=i(e,n.props)).ref=In(t,e,n),r.return=t,r):((r=cs(n.type,n.key,n.props,null,t.mode,r)).ref=In(t,e,n),r.return=t,r)}function f(t,e,n,r){return null===e||4!==e.tag||e.stateNode.containerInfo!==n.containerInfo||e.stateNode.implementation!==n.implementation?((e=fs(n,t.mode,r)).return=t,e):((e=i(e,n.children||[])).return=t,e)}function p(t,e,n,r,o){return null===e||7!==e.tag?((e=us(n,t.mode,r,o)).return=t,e):((e=i(e,n)).return=t,e)}function g(t,e,n){if("string"===typeof e&&""!==e||"number"===typeof e)return(e=hs(""+e,t.mode,n)).return=t,e;if("object"===typeof e&&null!==e){switch(e.$$typeof){case l:return(n=cs(e.type,e.key,e.props,null,t.mode,n)).ref=In(t,null,e),n.return=t,n;case c:return(e=fs(e,t.mode,n)).return=t,e;case v:return g(t,(0,e._init)(e._payload),n)}if(F(e)||x(e))return(e=us(e,t.mode,n,null)).return=t,e;Mn(t,e)}return null}function m(t,e,n,r){var i=null!==e?e.key:null;if("string"===typeof n&&""!==n||"number"===typeof n)return null!==i?null:d(t,e,""+n,r);if("object"===typeof n&&null!==n){switch(n.$$typeof){case l:return n.key===i?h(t,e,n,r):null;case c:return n.key===i?f(t,e,n,r):null;case v:return m(t,e,(i=n._init)(n._payload),r)}if(F(n)||x(n))return null!==i?null:p(t,e,n,r,null);Mn(t,n)}return null}function y(t,e,n,r,i){if("string"===typeof r&&""!==r||"number"===typeof r)return d(e,t=t.get(n)||null,""+r,i);if("object"===typeof r&&null!==r){switch(r.$$typeof){case l:return h(e,t=t.get(null===r.key?n:r.key)||null,r,i);case c:return f(e,t=t.get(null===r.key?n:r.key)||null,r,i);case v:return y(t,e,n,(0,r._init)(r._payload),i)}if(F(r)||x(r))return p(e,t=t.get(n)||null,r,i,null);Mn(e,r)}return null}function b(i,a,s,l){for(var c=null,u=null,d=a,h=a=0,f=null;null!==d&&h<s.length;h++){d.index>h?(f=d,d=null):f=d.sibling;var p=m(i,d,s[h],l);if(null===p){null===d&&(d=f);break}t&&d&&null===p.alternate&&e(i,d),a=o(p,a,h),null===u?c=p:u.sibling=p,u=p,d=f}if(h===s.length)return n(i,d),gn&&cn(i,h),c;if(null===d){for(;h<s.length;h++)null!==(d=g(i,s[h],l))&&(a=o(d,a,h),null===u?c=d:u.sibling=d,u=d);return gn&&cn(i,h),c}for(d=r(i,d);h<s.length;h++)null!==(f=y(d,i,h,s[h],l))&&(t&&null!==f.alternate&&d.delete(null===f.key?h:f.key),a=o(f,a,h),null===u?c=f:u.sibling=f,u=f);return t&&d.forEach((function(t){return e(i,t)})),gn&&cn(i,h),c}function _(i,s,l,c){var u=x(l);if("function"!==typeof u)throw Error(a(150));if(null==(l=u.call(l)))throw Error(a(151));for(var d=u=null,h=s,f=s=0,p=null,b=l.next();null!==h&&!b.done;f++,b=l.next()){h.index>f?(p=h,h=null):p=h.sibling;var v=m(i,h,b.value,c);if(null===v){null===h&&(h=p);break}t&&h&&null===v.alternate&&e(i,h),s=o(v,s,f),null===d?u=v:d.sibling=v,d=v,h=p}if(b.done)return n(i,h),gn&&cn(i,f),u;if(null===h){for(;!b.done;f++,b=l.next())null!==(b=g(i,b.value,c))&&(s=o(b,s,f),null===d?u=b:d.sibling=b,d=b);return gn&&cn(i,f),u}for(h=r(i,h);!b.done;f++,b=l.next())null!==(b=y(h,i,f,b.value,c))&&(t&&null!==b.alternate&&h.delete(null===b.key?f:b.key),s=o(b,s,f),null===d?u=b:d.sibling=b,d=b);return t&&h.forEach((function(t){return e(i,t)})),gn&&cn(i,f),u}return function t(r,o,a,d){if("object"===typeof a&&null!==a&&a.type===u&&null===a.key&&(a=a.props.children),"object"===typeof a&&null!==a){switch(a.$$typeof){case l:t:{for(var h=a.key,f=o;null!==f;){if(f.key===h){if((h=a.type)===u){if(7===f.tag){n(r,f.sibling),(o=i(f,a.props.children)).return=r,r=o;break t}}else if(f.elementType===h||"object"===typeof h&&null!==h&&h.$$typeof===v&&Fn(h)===f.type){n(r,f.sibling),(o=i(f,a.props)).ref=In(r,f,a),o.return=r,r=o;break t}n(r,f);break}e(r,f),f=f.sibling}a.type===u?((o=us(a.props.children,r.mode,d,a.key)).return=r,r=o):((d=cs(a.type,a.key,a.props,null,r.mode,d)).ref=In(r,o,a),d.return=r,r=d)}return s(r);case c:t:{for(f=a.key;null!==o;){if(o.key===f){if(4===o.tag&&o.stateNode.containerInfo===a.containerInfo&&o.stateNode.implementation===a.implementation){n(r,o.sibling),(o=i(o,a.children||[])).return=r,r=o;break t}n(r,o);break}e(r,o),o=o.sibling}(o=fs(a,r.mode,d)).return=r,r=o}return s(r);case v:return t(r,o,(f=a._init)(a._payload),d)}if(F(a))return b(r,o,a,d);if(x(a))return _(r,o,a,d);Mn(r,a)}return"string"===typeof a&&""!==a||"number"===typeof a?(a=""+a,null!==o&&6===o.tag?(n(r,o.sibling),(o=i(o,a)).return=r,r=o):(n(r,o),(o=hs(a,r.mode,d)).return=r,r=o),s(r)):n(r,o)}}var Rn=Dn(!0),On=Dn(!1),Nn=se(null),Ln=null,Bn=null,zn=null;function jn(){zn=Bn=Ln=null}function Un(t,e,n){Y?(ce(Nn,e._currentValue),e._currentValue=n):(ce(Nn,e._currentValue2),e._currentValue2=n)}function Vn(t){var e=Nn.current;le(Nn),Y?t._currentValue=e:t._currentValue2=e}function $n(t,e,n){for(;null!==t;){var r=t.alternate;if((t.childLanes&e)!==e?(t.childLanes|=e,null!==r&&(r.childLanes|=e)):null!==r&&(r.childLanes&e)!==e&&(r.childLanes|=e),t===n)break;t=t.return}}function Wn(t,e){Ln=t,zn=Bn=null,null!==(t=t.dependencies)&&null!==t.firstContext&&(0!==(t.lanes&e)&&(Di=!0),t.firstContext=null)}function Gn(t){var e=Y?t._currentValue:t._currentValue2;if(zn!==t)if(t={context:t,memoizedValue:e,next:null},null===Bn){if(null===Ln)throw Error(a(308));Bn=t,Ln.dependencies={lanes:0,firstContext:t}}else Bn=Bn.next=t;return e}var Hn=null;function Yn(t){null===Hn?Hn=[t]:Hn.push(t)}function qn(t,e,n,r){var i=e.interleaved;return null===i?(n.next=n,Yn(e)):(n.next=i.next,i.next=n),e.interleaved=n,Kn(t,r)}function Kn(t,e){t.lanes|=e;var n=t.alternate;for(null!==n&&(n.lanes|=e),n=t,t=t.return;null!==t;)t.childLanes|=e,null!==(n=t.alternate)&&(n.childLanes|=e),n=t,t=t.return;return 3===n.tag?n.stateNode:null}var Xn=!1;function Qn(t){t.updateQueue={baseState:t.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function Zn(t,e){t=t.updateQueue,e.updateQueue===t&&(e.updateQueue={baseState:t.baseState,firstBaseUpdate:t.firstBaseUpdate,lastBaseUpdate:t.lastBaseUpdate,shared:t.shared,effects:t.effects})}function Jn(t,e){return{eventTime:t,lane:e,tag:0,payload:null,callback:null,next:null}}function tr(t,e,n){var r=t.updateQueue;if(null===r)return null;if(r=r.shared,0!==(2&na)){var i=r.pending;return null===i?e.next=e:(e.next=i.next,i.next=e),r.pending=e,Kn(t,n)}return null===(i=r.interleaved)?(e.next=e,Yn(r)):(e.next=i.next,i.next=e),r.interleaved=e,Kn(t,n)}function er(t,e,n){if(null!==(e=e.updateQueue)&&(e=e.shared,0!==(4194240&n))){var r=e.lanes;n|=r&=t.pendingLanes,e.lanes=n,De(t,n)}}function nr(t,e){var n=t.updateQueue,r=t.alternate;if(null!==r&&n===(r=r.updateQueue)){var i=null,o=null;if(null!==(n=n.firstBaseUpdate)){do{var a={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};null===o?i=o=a:o=o.next=a,n=n.next}while(null!==n);null===o?i=o=e:o=o.next=e}else i=o=e;return n={baseState:r.baseState,firstBaseUpdate:i,lastBaseUpdate:o,shared:r.shared,effects:r.effects},void(t.updateQueue=n)}null===(t=n.lastBaseUpdate)?n.firstBaseUpdate=e:t.next=e,n.lastBaseUpdate=e}function rr(t,e,n,r){var i=t.updateQueue;Xn=!1;var a=i.firstBaseUpdate,s=i.lastBaseUpdate,l=i.shared.pending;if(null!==l){i.shared.pending=null;var c=l,u=c.next;c.next=null,null===s?a=u:s.next=u,s=c;var d=t.alternate;null!==d&&((l=(d=d.updateQueue).lastBaseUpdate)!==s&&(null===l?d.firstBaseUpdate=u:l.next=u,d.lastBaseUpdate=c))}if(null!==a){var h=i.baseState;for(s=0,d=u=c=null,l=a;;){var f=l.lane,p=l.eventTime;if((r&f)===f){null!==d&&(d=d.next={eventTime:p,lane:0,tag:l.tag,payload:l.payload,callback:l.callback,next:null});t:{var g=t,m=l;switch(f=e,p=n,m.tag){case 1:if("function"===typeof(g=m.payload)){h=g.call(p,h,f);break t}h=g;break t;case 3:g.flags=-65537&g.flags|128;case 0:if(null===(f="function"===typeof(g=m.payload)?g.call(p,h,f):g)||void 0===f)break t;h=o({},h,f);break t;case 2:Xn=!0}}null!==l.callback&&0!==l.lane&&(t.flags|=64,null===(f=i.effects)?i.effects=[l]:f.push(l))}else p={eventTime:p,lane:f,tag:l.tag,payload:l.payload,callback:l.callback,next:null},null===d?(u=d=p,c=h):d=d.next=p,s|=f;if(null===(l=l.next)){if(null===(l=i.shared.pending))break;l=(f=l).next,f.next=null,i.lastBaseUpdate=f,i.shared.pending=null}}if(null===d&&(c=h),i.baseState=c,i.firstBaseUpdate=u,i.lastBaseUpdate=d,null!==(e=i.shared.interleaved)){i=e;do{s|=i.lane,i=i.next}while(i!==e)}else null===a&&(i.shared.lanes=0);ua|=s,t.lanes=s,t.memoizedState=h}}function ir(t,e,n){if(t=e.effects,e.effects=null,null!==t)for(e=0;e<t.length;e++){var r=t[e],i=r.callback;if(null!==i){if(r.callback=null,r=n,"function"!==typeof i)throw Error(a(191,i));i.call(r)}}}var or={},ar=se(or),sr=se(or),lr=se(or);function cr(t){if(t===or)throw Error(a(174));return t}function ur(t,e){ce(lr,e),ce(sr,t),ce(ar,or),t=R(e),le(ar),ce(ar,t)}function dr(){le(ar),le(sr),le(lr)}function hr(t){var e=cr(lr.current),n=cr(ar.current);n!==(e=O(n,t.type,e))&&(ce(sr,t),ce(ar,e))}function fr(t){sr.current===t&&(le(ar),le(sr))}var pr=se(0);function gr(t){for(var e=t;null!==e;){if(13===e.tag){var n=e.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||Nt(n)||Lt(n)))return e}else if(19===e.tag&&void 0!==e.memoizedProps.revealOrder){if(0!==(128&e.flags))return e}else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break;for(;null===e.sibling;){if(null===e.return||e.return===t)return null;e=e.return}e.sibling.return=e.return,e=e.sibling}return null}var mr=[];function yr(){for(var t=0;t<mr.length;t++){var e=mr[t];Y?e._workInProgressVersionPrimary=null:e._workInProgressVersionSecondary=null}mr.length=0}var br=s.ReactCurrentDispatcher,vr=s.ReactCurrentBatchConfig,_r=0,wr=null,xr=null,Sr=null,kr=!1,Cr=!1,Tr=0,Pr=0;function Er(){throw Error(a(321))}function Ar(t,e){if(null===e)return!1;for(var n=0;n<e.length&&n<t.length;n++)if(!Ye(t[n],e[n]))return!1;return!0}function Ir(t,e,n,r,i,o){if(_r=o,wr=e,e.memoizedState=null,e.updateQueue=null,e.lanes=0,br.current=null===t||null===t.memoizedState?fi:pi,t=n(r,i),Cr){o=0;do{if(Cr=!1,Tr=0,25<=o)throw Error(a(301));o+=1,Sr=xr=null,e.updateQueue=null,br.current=gi,t=n(r,i)}while(Cr)}if(br.current=hi,e=null!==xr&&null!==xr.next,_r=0,Sr=xr=wr=null,kr=!1,e)throw Error(a(300));return t}function Mr(){var t=0!==Tr;return Tr=0,t}function Fr(){var t={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===Sr?wr.memoizedState=Sr=t:Sr=Sr.next=t,Sr}function Dr(){if(null===xr){var t=wr.alternate;t=null!==t?t.memoizedState:null}else t=xr.next;var e=null===Sr?wr.memoizedState:Sr.next;if(null!==e)Sr=e,xr=t;else{if(null===t)throw Error(a(310));t={memoizedState:(xr=t).memoizedState,baseState:xr.baseState,baseQueue:xr.baseQueue,queue:xr.queue,next:null},null===Sr?wr.memoizedState=Sr=t:Sr=Sr.next=t}return Sr}function Rr(t,e){return"function"===typeof e?e(t):e}function Or(t){var e=Dr(),n=e.queue;if(null===n)throw Error(a(311));n.lastRenderedReducer=t;var r=xr,i=r.baseQueue,o=n.pending;if(null!==o){if(null!==i){var s=i.next;i.next=o.next,o.next=s}r.baseQueue=i=o,n.pending=null}if(null!==i){o=i.next,r=r.baseState;var l=s=null,c=null,u=o;do{var d=u.lane;if((_r&d)===d)null!==c&&(c=c.next={lane:0,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null}),r=u.hasEagerState?u.eagerState:t(r,u.action);else{var h={lane:d,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null};null===c?(l=c=h,s=r):c=c.next=h,wr.lanes|=d,ua|=d}u=u.next}while(null!==u&&u!==o);null===c?s=r:c.next=l,Ye(r,e.memoizedState)||(Di=!0),e.memoizedState=r,e.baseState=s,e.baseQueue=c,n.lastRenderedState=r}if(null!==(t=n.interleaved)){i=t;do{o=i.lane,wr.lanes|=o,ua|=o,i=i.next}while(i!==t)}else null===i&&(n.lanes=0);return[e.memoizedState,n.dispatch]}function Nr(t){var e=Dr(),n=e.queue;if(null===n)throw Error(a(311));n.lastRenderedReducer=t;var r=n.dispatch,i=n.pending,o=e.memoizedState;if(null!==i){n.pending=null;var s=i=i.next;do{o=t(o,s.action),s=s.next}while(s!==i);Ye(o,e.memoizedState)||(Di=!0),e.memoizedState=o,null===e.baseQueue&&(e.baseState=o),n.lastRenderedState=o}return[o,r]}function Lr(){}function Br(t,e){var n=wr,r=Dr(),i=e(),o=!Ye(r.memoizedState,i);if(o&&(r.memoizedState=i,Di=!0),r=r.queue,Xr(Ur.bind(null,n,r,t),[t]),r.getSnapshot!==e||o||null!==Sr&&1&Sr.memoizedState.tag){if(n.flags|=2048,Gr(9,jr.bind(null,n,r,i,e),void 0,null),null===ra)throw Error(a(349));0!==(30&_r)||zr(n,e,i)}return i}function zr(t,e,n){t.flags|=16384,t={getSnapshot:e,value:n},null===(e=wr.updateQueue)?(e={lastEffect:null,stores:null},wr.updateQueue=e,e.stores=[t]):null===(n=e.stores)?e.stores=[t]:n.push(t)}function jr(t,e,n,r){e.value=n,e.getSnapshot=r,Vr(e)&&$r(t)}function Ur(t,e,n){return n((function(){Vr(e)&&$r(t)}))}function Vr(t){var e=t.getSnapshot;t=t.value;try{var n=e();return!Ye(t,n)}catch(r){return!0}}function $r(t){var e=Kn(t,1);null!==e&&Fa(e,t,1,-1)}function Wr(t){var e=Fr();return"function"===typeof t&&(t=t()),e.memoizedState=e.baseState=t,t={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:Rr,lastRenderedState:t},e.queue=t,t=t.dispatch=li.bind(null,wr,t),[e.memoizedState,t]}function Gr(t,e,n,r){return t={tag:t,create:e,destroy:n,deps:r,next:null},null===(e=wr.updateQueue)?(e={lastEffect:null,stores:null},wr.updateQueue=e,e.lastEffect=t.next=t):null===(n=e.lastEffect)?e.lastEffect=t.next=t:(r=n.next,n.next=t,t.next=r,e.lastEffect=t),t}function Hr(){return Dr().memoizedState}function Yr(t,e,n,r){var i=Fr();wr.flags|=t,i.memoizedState=Gr(1|e,n,void 0,void 0===r?null:r)}function qr(t,e,n,r){var i=Dr();r=void 0===r?null:r;var o=void 0;if(null!==xr){var a=xr.memoizedState;if(o=a.destroy,null!==r&&Ar(r,a.deps))return void(i.memoizedState=Gr(e,n,o,r))}wr.flags|=t,i.memoizedState=Gr(1|e,n,o,r)}function Kr(t,e){return Yr(8390656,8,t,e)}function Xr(t,e){return qr(2048,8,t,e)}function Qr(t,e){return qr(4,2,t,e)}function Zr(t,e){return qr(4,4,t,e)}function Jr(t,e){return"function"===typeof e?(t=t(),e(t),function(){e(null)}):null!==e&&void 0!==e?(t=t(),e.current=t,function(){e.current=null}):void 0}function ti(t,e,n){return n=null!==n&&void 0!==n?n.concat([t]):null,qr(4,4,Jr.bind(null,e,t),n)}function ei(){}function ni(t,e){var n=Dr();e=void 0===e?null:e;var r=n.memoizedState;return null!==r&&null!==e&&Ar(e,r[1])?r[0]:(n.memoizedState=[t,e],t)}function ri(t,e){var n=Dr();e=void 0===e?null:e;var r=n.memoizedState;return null!==r&&null!==e&&Ar(e,r[1])?r[0]:(t=t(),n.memoizedState=[t,e],t)}function ii(t,e,n){return 0===(21&_r)?(t.baseState&&(t.baseState=!1,Di=!0),t.memoizedState=n):(Ye(n,e)||(n=Ie(),wr.lanes|=n,ua|=n,t.baseState=!0),e)}function oi(t,e){var n=Re;Re=0!==n&&4>n?n:4,t(!0);var r=vr.transition;vr.transition={};try{t(!1),e()}finally{Re=n,vr.transition=r}}function ai(){return Dr().memoizedState}function si(t,e,n){var r=Ma(t);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},ci(t))ui(e,n);else if(null!==(n=qn(t,e,n,r))){Fa(n,t,r,Ia()),di(n,e,r)}}function li(t,e,n){var r=Ma(t),i={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(ci(t))ui(e,i);else{var o=t.alternate;if(0===t.lanes&&(null===o||0===o.lanes)&&null!==(o=e.lastRenderedReducer))try{var a=e.lastRenderedState,s=o(a,n);if(i.hasEagerState=!0,i.eagerState=s,Ye(s,a)){var l=e.interleaved;return null===l?(i.next=i,Yn(e)):(i.next=l.next,l.next=i),void(e.interleaved=i)}}catch(c){}null!==(n=qn(t,e,i,r))&&(Fa(n,t,r,i=Ia()),di(n,e,r))}}function ci(t){var e=t.alternate;return t===wr||null!==e&&e===wr}function ui(t,e){Cr=kr=!0;var n=t.pending;null===n?e.next=e:(e.next=n.next,n.next=e),t.pending=e}function di(t,e,n){if(0!==(4194240&n)){var r=e.lanes;n|=r&=t.pendingLanes,e.lanes=n,De(t,n)}}var hi={readContext:Gn,useCallback:Er,useContext:Er,useEffect:Er,useImperativeHandle:Er,useInsertionEffect:Er,useLayoutEffect:Er,useMemo:Er,useReducer:Er,useRef:Er,useState:Er,useDebugValue:Er,useDeferredValue:Er,useTransition:Er,useMutableSource:Er,useSyncExternalStore:Er,useId:Er,unstable_isNewReconciler:!1},fi={readContext:Gn,useCallback:function(t,e){return Fr().memoizedState=[t,void 0===e?null:e],t},useContext:Gn,useEffect:Kr,useImperativeHandle:function(t,e,n){return n=null!==n&&void 0!==n?n.concat([t]):null,Yr(4194308,4,Jr.bind(null,e,t),n)},useLayoutEffect:function(t,e){return Yr(4194308,4,t,e)},useInsertionEffect:function(t,e){return Yr(4,2,t,e)},useMemo:function(t,e){var n=Fr();return e=void 0===e?null:e,t=t(),n.memoizedState=[t,e],t},useReducer:function(t,e,n){var r=Fr();return e=void 0!==n?n(e):e,r.memoizedState=r.baseState=e,t={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:t,lastRenderedState:e},r.queue=t,t=t.dispatch=si.bind(null,wr,t),[r.memoizedState,t]},useRef:function(t){return t={current:t},Fr().memoizedState=t},useState:Wr,useDebugValue:ei,useDeferredValue:function(t){return Fr().memoizedState=t},useTransition:function(){var t=Wr(!1),e=t[0];return t=oi.bind(null,t[1]),Fr().memoizedState=t,[e,t]},useMutableSource:function(){},useSyncExternalStore:function(t,e,n){var r=wr,i=Fr();if(gn){if(void 0===n)throw Error(a(407));n=n()}else{if(n=e(),null===ra)throw Error(a(349));0!==(30&_r)||zr(r,e,n)}i.memoizedState=n;var o={value:n,getSnapshot:e};return i.queue=o,Kr(Ur.bind(null,r,o,t),[t]),r.flags|=2048,Gr(9,jr.bind(null,r,o,n,e),void 0,null),n},useId:function(){var t=Fr(),e=ra.identifierPrefix;if(gn){var n=ln;e=":"+e+"R"+(n=(sn&~(1<<32-we(sn)-1)).toString(32)+n),0<(n=Tr++)&&(e+="H"+n.toString(32)),e+=":"}else e=":"+e+"r"+(n=Pr++).toString(32)+":";return t.memoizedState=e},unstable_isNewReconciler:!1},pi={readContext:Gn,useCallback:ni,useContext:Gn,useEffect:Xr,useImperativeHandle:ti,useInsertionEffect:Qr,useLayoutEffect:Zr,useMemo:ri,useReducer:Or,useRef:Hr,useState:function(){return Or(Rr)},useDebugValue:ei,useDeferredValue:function(t){return ii(Dr(),xr.memoizedState,t)},useTransition:function(){return[Or(Rr)[0],Dr().memoizedState]},useMutableSource:Lr,useSyncExternalStore:Br,useId:ai,unstable_isNewReconciler:!1},gi={readContext:Gn,useCallback:ni,useContext:Gn,useEffect:Xr,useImperativeHandle:ti,useInsertionEffect:Qr,useLayoutEffect:Zr,useMemo:ri,useReducer:Nr,useRef:Hr,useState:function(){return Nr(Rr)},useDebugValue:ei,useDeferredValue:function(t){var e=Dr();return null===xr?e.memoizedState=t:ii(e,xr.memoizedState,t)},useTransition:function(){return[Nr(Rr)[0],Dr().memoizedState]},useMutableSource:Lr,useSyncExternalStore:Br,useId:ai,unstable_isNewReconciler:!1};function mi(t,e){if(t&&t.defaultProps){for(var n in e=o({},e),t=t.defaultProps)void 0===e[n]&&(e[n]=t[n]);return e}return e}function yi(t,e,n,r){n=null===(n=n(r,e=t.memoizedState))||void 0===n?e:o({},e,n),t.memoizedState=n,0===t.lanes&&(t.updateQueue.baseState=n)}var bi={isMounted:function(t){return!!(t=t._reactInternals)&&C(t)===t},enqueueSetState:function(t,e,n){t=t._reactInternals;var r=Ia(),i=Ma(t),o=Jn(r,i);o.payload=e,void 0!==n&&null!==n&&(o.callback=n),null!==(e=tr(t,o,i))&&(Fa(e,t,i,r),er(e,t,i))},enqueueReplaceState:function(t,e,n){t=t._reactInternals;var r=Ia(),i=Ma(t),o=Jn(r,i);o.tag=1,o.payload=e,void 0!==n&&null!==n&&(o.callback=n),null!==(e=tr(t,o,i))&&(Fa(e,t,i,r),er(e,t,i))},enqueueForceUpdate:function(t,e){t=t._reactInternals;var n=Ia(),r=Ma(t),i=Jn(n,r);i.tag=2,void 0!==e&&null!==e&&(i.callback=e),null!==(e=tr(t,i,r))&&(Fa(e,t,r,n),er(e,t,r))}};function vi(t,e,n,r,i,o,a){return"function"===typeof(t=t.stateNode).shouldComponentUpdate?t.shouldComponentUpdate(r,o,a):!e.prototype||!e.prototype.isPureReactComponent||(!En(n,r)||!En(i,o))}function _i(t,e,n){var r=!1,i=ue,o=e.contextType;return"object"===typeof o&&null!==o?o=Gn(o):(i=ge(e)?fe:de.current,o=(r=null!==(r=e.contextTypes)&&void 0!==r)?pe(t,i):ue),e=new e(n,o),t.memoizedState=null!==e.state&&void 0!==e.state?e.state:null,e.updater=bi,t.stateNode=e,e._reactInternals=t,r&&((t=t.stateNode).__reactInternalMemoizedUnmaskedChildContext=i,t.__reactInternalMemoizedMaskedChildContext=o),e}function wi(t,e,n,r){t=e.state,"function"===typeof e.componentWillReceiveProps&&e.componentWillReceiveProps(n,r),"function"===typeof e.UNSAFE_componentWillReceiveProps&&e.UNSAFE_componentWillReceiveProps(n,r),e.state!==t&&bi.enqueueReplaceState(e,e.state,null)}function xi(t,e,n,r){var i=t.stateNode;i.props=n,i.state=t.memoizedState,i.refs={},Qn(t);var o=e.contextType;"object"===typeof o&&null!==o?i.context=Gn(o):(o=ge(e)?fe:de.current,i.context=pe(t,o)),i.state=t.memoizedState,"function"===typeof(o=e.getDerivedStateFromProps)&&(yi(t,e,o,n),i.state=t.memoizedState),"function"===typeof e.getDerivedStateFromProps||"function"===typeof i.getSnapshotBeforeUpdate||"function"!==typeof i.UNSAFE_componentWillMount&&"function"!==typeof i.componentWillMount||(e=i.state,"function"===typeof i.componentWillMount&&i.componentWillMount(),"function"===typeof i.UNSAFE_componentWillMount&&i.UNSAFE_componentWillMount(),e!==i.state&&bi.enqueueReplaceState(i,i.state,null),rr(t,n,i,r),i.state=t.memoizedState),"function"===typeof i.componentDidMount&&(t.flags|=4194308)}function Si(t,e){try{var n="",r=e;do{n+=An(r),r=r.return}while(r);var i=n}catch(o){i="\nError generating stack: "+o.message+"\n"+o.stack}return{value:t,source:e,stack:i,digest:null}}function ki(t,e,n){return{value:t,source:null,stack:null!=n?n:null,digest:null!=e?e:null}}function Ci(t,e){try{console.error(e.value)}catch(n){setTimeout((function(){throw n}))}}var Ti="function"===typeof WeakMap?WeakMap:Map;function Pi(t,e,n){(n=Jn(-1,n)).tag=3,n.payload={element:null};var r=e.value;return n.callback=function(){_a||(_a=!0,wa=r),Ci(0,e)},n}function Ei(t,e,n){(n=Jn(-1,n)).tag=3;var r=t.type.getDerivedStateFromError;if("function"===typeof r){var i=e.value;n.payload=function(){return r(i)},n.callback=function(){Ci(0,e)}}var o=t.stateNode;return null!==o&&"function"===typeof o.componentDidCatch&&(n.callback=function(){Ci(0,e),"function"!==typeof r&&(null===xa?xa=new Set([this]):xa.add(this));var t=e.stack;this.componentDidCatch(e.value,{componentStack:null!==t?t:""})}),n}function Ai(t,e,n){var r=t.pingCache;if(null===r){r=t.pingCache=new Ti;var i=new Set;r.set(e,i)}else void 0===(i=r.get(e))&&(i=new Set,r.set(e,i));i.has(n)||(i.add(n),t=ts.bind(null,t,e,n),e.then(t,t))}function Ii(t){do{var e;if((e=13===t.tag)&&(e=null===(e=t.memoizedState)||null!==e.dehydrated),e)return t;t=t.return}while(null!==t);return null}function Mi(t,e,n,r,i){return 0===(1&t.mode)?(t===e?t.flags|=65536:(t.flags|=128,n.flags|=131072,n.flags&=-52805,1===n.tag&&(null===n.alternate?n.tag=17:((e=Jn(-1,1)).tag=2,tr(n,e,1))),n.lanes|=1),t):(t.flags|=65536,t.lanes=i,t)}var Fi=s.ReactCurrentOwner,Di=!1;function Ri(t,e,n,r){e.child=null===t?On(e,null,n,r):Rn(e,t.child,n,r)}function Oi(t,e,n,r,i){n=n.render;var o=e.ref;return Wn(e,i),r=Ir(t,e,n,r,o,i),n=Mr(),null===t||Di?(gn&&n&&dn(e),e.flags|=1,Ri(t,e,r,i),e.child):(e.updateQueue=t.updateQueue,e.flags&=-2053,t.lanes&=~i,io(t,e,i))}function Ni(t,e,n,r,i){if(null===t){var o=n.type;return"function"!==typeof o||ss(o)||void 0!==o.defaultProps||null!==n.compare||void 0!==n.defaultProps?((t=cs(n.type,null,r,e,e.mode,i)).ref=e.ref,t.return=e,e.child=t):(e.tag=15,e.type=o,Li(t,e,o,r,i))}if(o=t.child,0===(t.lanes&i)){var a=o.memoizedProps;if((n=null!==(n=n.compare)?n:En)(a,r)&&t.ref===e.ref)return io(t,e,i)}return e.flags|=1,(t=ls(o,r)).ref=e.ref,t.return=e,e.child=t}function Li(t,e,n,r,i){if(null!==t){var o=t.memoizedProps;if(En(o,r)&&t.ref===e.ref){if(Di=!1,e.pendingProps=r=o,0===(t.lanes&i))return e.lanes=t.lanes,io(t,e,i);0!==(131072&t.flags)&&(Di=!0)}}return ji(t,e,n,r,i)}function Bi(t,e,n){var r=e.pendingProps,i=r.children,o=null!==t?t.memoizedState:null;if("hidden"===r.mode)if(0===(1&e.mode))e.memoizedState={baseLanes:0,cachePool:null,transitions:null},ce(sa,aa),aa|=n;else{if(0===(1073741824&n))return t=null!==o?o.baseLanes|n:n,e.lanes=e.childLanes=1073741824,e.memoizedState={baseLanes:t,cachePool:null,transitions:null},e.updateQueue=null,ce(sa,aa),aa|=t,null;e.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=null!==o?o.baseLanes:n,ce(sa,aa),aa|=r}else null!==o?(r=o.baseLanes|n,e.memoizedState=null):r=n,ce(sa,aa),aa|=r;return Ri(t,e,i,n),e.child}function zi(t,e){var n=e.ref;(null===t&&null!==n||null!==t&&t.ref!==n)&&(e.flags|=512,e.flags|=2097152)}function ji(t,e,n,r,i){var o=ge(n)?fe:de.current;return o=pe(e,o),Wn(e,i),n=Ir(t,e,n,r,o,i),r=Mr(),null===t||Di?(gn&&r&&dn(e),e.flags|=1,Ri(t,e,n,i),e.child):(e.updateQueue=t.updateQueue,e.flags&=-2053,t.lanes&=~i,io(t,e,i))}function Ui(t,e,n,r,i){if(ge(n)){var o=!0;ve(e)}else o=!1;if(Wn(e,i),null===e.stateNode)ro(t,e),_i(e,n,r),xi(e,n,r,i),r=!0;else if(null===t){var a=e.stateNode,s=e.memoizedProps;a.props=s;var l=a.context,c=n.contextType;"object"===typeof c&&null!==c?c=Gn(c):c=pe(e,c=ge(n)?fe:de.current);var u=n.getDerivedStateFromProps,d="function"===typeof u||"function"===typeof a.getSnapshotBeforeUpdate;d||"function"!==typeof a.UNSAFE_componentWillReceiveProps&&"function"!==typeof a.componentWillReceiveProps||(s!==r||l!==c)&&wi(e,a,r,c),Xn=!1;var h=e.memoizedState;a.state=h,rr(e,r,a,i),l=e.memoizedState,s!==r||h!==l||he.current||Xn?("function"===typeof u&&(yi(e,n,u,r),l=e.memoizedState),(s=Xn||vi(e,n,s,r,h,l,c))?(d||"function"!==typeof a.UNSAFE_componentWillMount&&"function"!==typeof a.componentWillMount||("function"===typeof a.componentWillMount&&a.componentWillMount(),"function"===typeof a.UNSAFE_componentWillMount&&a.UNSAFE_componentWillMount()),"function"===typeof a.componentDidMount&&(e.flags|=4194308)):("function"===typeof a.componentDidMount&&(e.flags|=4194308),e.memoizedProps=r,e.memoizedState=l),a.props=r,a.state=l,a.context=c,r=s):("function"===typeof a.componentDidMount&&(e.flags|=4194308),r=!1)}else{a=e.stateNode,Zn(t,e),s=e.memoizedProps,c=e.type===e.elementType?s:mi(e.type,s),a.props=c,d=e.pendingProps,h=a.context,"object"===typeof(l=n.contextType)&&null!==l?l=Gn(l):l=pe(e,l=ge(n)?fe:de.current);var f=n.getDerivedStateFromProps;(u="function"===typeof f||"function"===typeof a.getSnapshotBeforeUpdate)||"function"!==typeof a.UNSAFE_componentWillReceiveProps&&"function"!==typeof a.componentWillReceiveProps||(s!==d||h!==l)&&wi(e,a,r,l),Xn=!1,h=e.memoizedState,a.state=h,rr(e,r,a,i);var p=e.memoizedState;s!==d||h!==p||he.current||Xn?("function"===typeof f&&(yi(e,n,f,r),p=e.memoizedState),(c=Xn||vi(e,n,c,r,h,p,l)||!1)?(u||"function"!==typeof a.UNSAFE_componentWillUpdate&&"function"!==typeof a.componentWillUpdate||("function"===typeof a.componentWillUpdate&&a.componentWillUpdate(r,p,l),"function"===typeof a.UNSAFE_componentWillUpdate&&a.UNSAFE_componentWillUpdate(r,p,l)),"function"===typeof a.componentDidUpdate&&(e.flags|=4),"function"===typeof a.getSnapshotBeforeUpdate&&(e.flags|=1024)):("function"!==typeof a.componentDidUpdate||s===t.memoizedProps&&h===t.memoizedState||(e.flags|=4),"function"!==typeof a.getSnapshotBeforeUpdate||s===t.memoizedProps&&h===t.memoizedState||(e.flags|=1024),e.memoizedProps=r,e.memoizedState=p),a.props=r,a.state=p,a.context=l,r=c):("function"!==typeof a.componentDidUpdate||s===t.memoizedProps&&h===t.memoizedState||(e.flags|=4),"function"!==typeof a.getSnapshotBeforeUpdate||s===t.memoizedProps&&h===t.memoizedState||(e.flags|=1024),r=!1)}return Vi(t,e,n,r,o,i)}function Vi(t,e,n,r,i,o){zi(t,e);var a=0!==(128&e.flags);if(!r&&!a)return i&&_e(e,n,!1),io(t,e,o);r=e.stateNode,Fi.current=e;var s=a&&"function"!==typeof n.getDerivedStateFromError?null:r.render();return e.flags|=1,null!==t&&a?(e.child=Rn(e,t.child,null,o),e.child=Rn(e,null,s,o)):Ri(t,e,s,o),e.memoizedState=r.state,i&&_e(e,n,!0),e.child}function $i(t){var e=t.stateNode;e.pendingContext?ye(0,e.pendingContext,e.pendingContext!==e.context):e.context&&ye(0,e.context,!1),ur(t,e.containerInfo)}function Wi(t,e,n,r,i){return Cn(),Tn(i),e.flags|=256,Ri(t,e,n,r),e.child}var Gi,Hi,Yi,qi,Ki={dehydrated:null,treeContext:null,retryLane:0};function Xi(t){return{baseLanes:t,cachePool:null,transitions:null}}function Qi(t,e,n){var r,i=e.pendingProps,o=pr.current,s=!1,l=0!==(128&e.flags);if((r=l)||(r=(null===t||null!==t.memoizedState)&&0!==(2&o)),r?(s=!0,e.flags&=-129):null!==t&&null===t.memoizedState||(o|=1),ce(pr,1&o),null===t)return wn(e),null!==(t=e.memoizedState)&&null!==(t=t.dehydrated)?(0===(1&e.mode)?e.lanes=1:Lt(t)?e.lanes=8:e.lanes=1073741824,null):(l=i.children,t=i.fallback,s?(i=e.mode,s=e.child,l={mode:"hidden",children:l},0===(1&i)&&null!==s?(s.childLanes=0,s.pendingProps=l):s=ds(l,i,0,null),t=us(t,i,n,null),s.return=e,t.return=e,s.sibling=t,e.child=s,e.child.memoizedState=Xi(n),e.memoizedState=Ki,t):Zi(e,l));if(null!==(o=t.memoizedState)&&null!==(r=o.dehydrated))return function(t,e,n,r,i,o,s){if(n)return 256&e.flags?(e.flags&=-257,Ji(t,e,s,r=ki(Error(a(422))))):null!==e.memoizedState?(e.child=t.child,e.flags|=128,null):(o=r.fallback,i=e.mode,r=ds({mode:"visible",children:r.children},i,0,null),(o=us(o,i,s,null)).flags|=2,r.return=e,o.return=e,r.sibling=o,e.child=r,0!==(1&e.mode)&&Rn(e,t.child,null,s),e.child.memoizedState=Xi(s),e.memoizedState=Ki,o);if(0===(1&e.mode))return Ji(t,e,s,null);if(Lt(i))return r=Bt(i).digest,o=Error(a(419)),r=ki(o,r,void 0),Ji(t,e,s,r);if(n=0!==(s&t.childLanes),Di||n){if(null!==(r=ra)){switch(s&-s){case 4:i=2;break;case 16:i=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:i=32;break;case 536870912:i=268435456;break;default:i=0}0!==(i=0!==(i&(r.suspendedLanes|s))?0:i)&&i!==o.retryLane&&(o.retryLane=i,Kn(t,i),Fa(r,t,i,-1))}return Wa(),Ji(t,e,s,r=ki(Error(a(421))))}return Nt(i)?(e.flags|=128,e.child=t.child,e=ns.bind(null,t),zt(i,e),null):(t=o.treeContext,X&&(pn=$t(i),fn=e,gn=!0,yn=null,mn=!1,null!==t&&(rn[on++]=sn,rn[on++]=ln,rn[on++]=an,sn=t.id,ln=t.overflow,an=e)),e=Zi(e,r.children),e.flags|=4096,e)}(t,e,l,i,r,o,n);if(s){s=i.fallback,l=e.mode,r=(o=t.child).sibling;var c={mode:"hidden",children:i.children};return 0===(1&l)&&e.child!==o?((i=e.child).childLanes=0,i.pendingProps=c,e.deletions=null):(i=ls(o,c)).subtreeFlags=14680064&o.subtreeFlags,null!==r?s=ls(r,s):(s=us(s,l,n,null)).flags|=2,s.return=e,i.return=e,i.sibling=s,e.child=i,i=s,s=e.child,l=null===(l=t.child.memoizedState)?Xi(n):{baseLanes:l.baseLanes|n,cachePool:null,transitions:l.transitions},s.memoizedState=l,s.childLanes=t.childLanes&~n,e.memoizedState=Ki,i}return t=(s=t.child).sibling,i=ls(s,{mode:"visible",children:i.children}),0===(1&e.mode)&&(i.lanes=n),i.return=e,i.sibling=null,null!==t&&(null===(n=e.deletions)?(e.deletions=[t],e.flags|=16):n.push(t)),e.child=i,e.memoizedState=null,i}function Zi(t,e){return(e=ds({mode:"visible",children:e},t.mode,0,null)).return=t,t.child=e}function Ji(t,e,n,r){return null!==r&&Tn(r),Rn(e,t.child,null,n),(t=Zi(e,e.pendingProps.children)).flags|=2,e.memoizedState=null,t}function to(t,e,n){t.lanes|=e;var r=t.alternate;null!==r&&(r.lanes|=e),$n(t.return,e,n)}function eo(t,e,n,r,i){var o=t.memoizedState;null===o?t.memoizedState={isBackwards:e,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:i}:(o.isBackwards=e,o.rendering=null,o.renderingStartTime=0,o.last=r,o.tail=n,o.tailMode=i)}function no(t,e,n){var r=e.pendingProps,i=r.revealOrder,o=r.tail;if(Ri(t,e,r.children,n),0!==(2&(r=pr.current)))r=1&r|2,e.flags|=128;else{if(null!==t&&0!==(128&t.flags))t:for(t=e.child;null!==t;){if(13===t.tag)null!==t.memoizedState&&to(t,n,e);else if(19===t.tag)to(t,n,e);else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break t;for(;null===t.sibling;){if(null===t.return||t.return===e)break t;t=t.return}t.sibling.return=t.return,t=t.sibling}r&=1}if(ce(pr,r),0===(1&e.mode))e.memoizedState=null;else switch(i){case"forwards":for(n=e.child,i=null;null!==n;)null!==(t=n.alternate)&&null===gr(t)&&(i=n),n=n.sibling;null===(n=i)?(i=e.child,e.child=null):(i=n.sibling,n.sibling=null),eo(e,!1,i,n,o);break;case"backwards":for(n=null,i=e.child,e.child=null;null!==i;){if(null!==(t=i.alternate)&&null===gr(t)){e.child=i;break}t=i.sibling,i.sibling=n,n=i,i=t}eo(e,!0,n,null,o);break;case"together":eo(e,!1,null,null,void 0);break;default:e.memoizedState=null}return e.child}function ro(t,e){0===(1&e.mode)&&null!==t&&(t.alternate=null,e.alternate=null,e.flags|=2)}function io(t,e,n){if(null!==t&&(e.dependencies=t.dependencies),ua|=e.lanes,0===(n&e.childLanes))return null;if(null!==t&&e.child!==t.child)throw Error(a(153));if(null!==e.child){for(n=ls(t=e.child,t.pendingProps),e.child=n,n.return=e;null!==t.sibling;)t=t.sibling,(n=n.sibling=ls(t,t.pendingProps)).return=e;n.sibling=null}return e.child}function oo(t){t.flags|=4}function ao(t,e){if(null!==t&&t.child===e.child)return!0;if(0!==(16&e.flags))return!1;for(t=e.child;null!==t;){if(0!==(12854&t.flags)||0!==(12854&t.subtreeFlags))return!1;t=t.sibling}return!0}if(q)Gi=function(t,e){for(var n=e.child;null!==n;){if(5===n.tag||6===n.tag)z(t,n.stateNode);else if(4!==n.tag&&null!==n.child){n.child.return=n,n=n.child;continue}if(n===e)break;for(;null===n.sibling;){if(null===n.return||n.return===e)return;n=n.return}n.sibling.return=n.return,n=n.sibling}},Hi=function(){},Yi=function(t,e,n,r,i){if((t=t.memoizedProps)!==r){var o=e.stateNode,a=cr(ar.current);n=U(o,n,t,r,i,a),(e.updateQueue=n)&&oo(e)}},qi=function(t,e,n,r){n!==r&&oo(e)};else if(K){Gi=function(t,e,n,r){for(var i=e.child;null!==i;){if(5===i.tag){var o=i.stateNode;n&&r&&(o=Mt(o,i.type,i.memoizedProps,i)),z(t,o)}else if(6===i.tag)o=i.stateNode,n&&r&&(o=Ft(o,i.memoizedProps,i)),z(t,o);else if(4!==i.tag)if(22===i.tag&&null!==i.memoizedState)null!==(o=i.child)&&(o.return=i),Gi(t,i,!0,!0);else if(null!==i.child){i.child.return=i,i=i.child;continue}if(i===e)break;for(;null===i.sibling;){if(null===i.return||i.return===e)return;i=i.return}i.sibling.return=i.return,i=i.sibling}};var so=function(t,e,n,r){for(var i=e.child;null!==i;){if(5===i.tag){var o=i.stateNode;n&&r&&(o=Mt(o,i.type,i.memoizedProps,i)),Et(t,o)}else if(6===i.tag)o=i.stateNode,n&&r&&(o=Ft(o,i.memoizedProps,i)),Et(t,o);else if(4!==i.tag)if(22===i.tag&&null!==i.memoizedState)null!==(o=i.child)&&(o.return=i),so(t,i,!0,!0);else if(null!==i.child){i.child.return=i,i=i.child;continue}if(i===e)break;for(;null===i.sibling;){if(null===i.return||i.return===e)return;i=i.return}i.sibling.return=i.return,i=i.sibling}};Hi=function(t,e){var n=e.stateNode;if(!ao(t,e)){t=n.containerInfo;var r=Pt(t);so(r,e,!1,!1),n.pendingChildren=r,oo(e),At(t,r)}},Yi=function(t,e,n,r,i){var o=t.stateNode,a=t.memoizedProps;if((t=ao(t,e))&&a===r)e.stateNode=o;else{var s=e.stateNode,l=cr(ar.current),c=null;a!==r&&(c=U(s,n,a,r,i,l)),t&&null===c?e.stateNode=o:(o=Tt(o,c,n,a,r,e,t,s),j(o,n,r,i,l)&&oo(e),e.stateNode=o,t?oo(e):Gi(o,e,!1,!1))}},qi=function(t,e,n,r){n!==r?(t=cr(lr.current),n=cr(ar.current),e.stateNode=$(r,t,n,e),oo(e)):e.stateNode=t.stateNode}}else Hi=function(){},Yi=function(){},qi=function(){};function lo(t,e){if(!gn)switch(t.tailMode){case"hidden":e=t.tail;for(var n=null;null!==e;)null!==e.alternate&&(n=e),e=e.sibling;null===n?t.tail=null:n.sibling=null;break;case"collapsed":n=t.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?e||null===t.tail?t.tail=null:t.tail.sibling=null:r.sibling=null}}function co(t){var e=null!==t.alternate&&t.alternate.child===t.child,n=0,r=0;if(e)for(var i=t.child;null!==i;)n|=i.lanes|i.childLanes,r|=14680064&i.subtreeFlags,r|=14680064&i.flags,i.return=t,i=i.sibling;else for(i=t.child;null!==i;)n|=i.lanes|i.childLanes,r|=i.subtreeFlags,r|=i.flags,i.return=t,i=i.sibling;return t.subtreeFlags|=r,t.childLanes=n,e}function uo(t,e,n){var r=e.pendingProps;switch(hn(e),e.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return co(e),null;case 1:case 17:return ge(e.type)&&me(),co(e),null;case 3:return n=e.stateNode,dr(),le(he),le(de),yr(),n.pendingContext&&(n.context=n.pendingContext,n.pendingContext=null),null!==t&&null!==t.child||(Sn(e)?oo(e):null===t||t.memoizedState.isDehydrated&&0===(256&e.flags)||(e.flags|=1024,null!==yn&&(Na(yn),yn=null))),Hi(t,e),co(e),null;case 5:fr(e),n=cr(lr.current);var i=e.type;if(null!==t&&null!=e.stateNode)Yi(t,e,i,r,n),t.ref!==e.ref&&(e.flags|=512,e.flags|=2097152);else{if(!r){if(null===e.stateNode)throw Error(a(166));return co(e),null}if(t=cr(ar.current),Sn(e)){if(!X)throw Error(a(175));t=Wt(e.stateNode,e.type,e.memoizedProps,n,t,e,!mn),e.updateQueue=t,null!==t&&oo(e)}else{var o=B(i,r,n,t,e);Gi(o,e,!1,!1),e.stateNode=o,j(o,i,r,n,t)&&oo(e)}null!==e.ref&&(e.flags|=512,e.flags|=2097152)}return co(e),null;case 6:if(t&&null!=e.stateNode)qi(t,e,t.memoizedProps,r);else{if("string"!==typeof r&&null===e.stateNode)throw Error(a(166));if(t=cr(lr.current),n=cr(ar.current),Sn(e)){if(!X)throw Error(a(176));if(t=e.stateNode,n=e.memoizedProps,(r=Gt(t,n,e,!mn))&&null!==(i=fn))switch(i.tag){case 3:Jt(i.stateNode.containerInfo,t,n,0!==(1&i.mode));break;case 5:te(i.type,i.memoizedProps,i.stateNode,t,n,0!==(1&i.mode))}r&&oo(e)}else e.stateNode=$(r,t,n,e)}return co(e),null;case 13:if(le(pr),r=e.memoizedState,null===t||null!==t.memoizedState&&null!==t.memoizedState.dehydrated){if(gn&&null!==pn&&0!==(1&e.mode)&&0===(128&e.flags))kn(),Cn(),e.flags|=98560,i=!1;else if(i=Sn(e),null!==r&&null!==r.dehydrated){if(null===t){if(!i)throw Error(a(318));if(!X)throw Error(a(344));if(!(i=null!==(i=e.memoizedState)?i.dehydrated:null))throw Error(a(317));Ht(i,e)}else Cn(),0===(128&e.flags)&&(e.memoizedState=null),e.flags|=4;co(e),i=!1}else null!==yn&&(Na(yn),yn=null),i=!0;if(!i)return 65536&e.flags?e:null}return 0!==(128&e.flags)?(e.lanes=n,e):((n=null!==r)!==(null!==t&&null!==t.memoizedState)&&n&&(e.child.flags|=8192,0!==(1&e.mode)&&(null===t||0!==(1&pr.current)?0===la&&(la=3):Wa())),null!==e.updateQueue&&(e.flags|=4),co(e),null);case 4:return dr(),Hi(t,e),null===t&&Z(e.stateNode.containerInfo),co(e),null;case 10:return Vn(e.type._context),co(e),null;case 19:if(le(pr),null===(i=e.memoizedState))return co(e),null;if(r=0!==(128&e.flags),null===(o=i.rendering))if(r)lo(i,!1);else{if(0!==la||null!==t&&0!==(128&t.flags))for(t=e.child;null!==t;){if(null!==(o=gr(t))){for(e.flags|=128,lo(i,!1),null!==(t=o.updateQueue)&&(e.updateQueue=t,e.flags|=4),e.subtreeFlags=0,t=n,n=e.child;null!==n;)i=t,(r=n).flags&=14680066,null===(o=r.alternate)?(r.childLanes=0,r.lanes=i,r.child=null,r.subtreeFlags=0,r.memoizedProps=null,r.memoizedState=null,r.updateQueue=null,r.dependencies=null,r.stateNode=null):(r.childLanes=o.childLanes,r.lanes=o.lanes,r.child=o.child,r.subtreeFlags=0,r.deletions=null,r.memoizedProps=o.memoizedProps,r.memoizedState=o.memoizedState,r.updateQueue=o.updateQueue,r.type=o.type,i=o.dependencies,r.dependencies=null===i?null:{lanes:i.lanes,firstContext:i.firstContext}),n=n.sibling;return ce(pr,1&pr.current|2),e.child}t=t.sibling}null!==i.tail&&je()>ma&&(e.flags|=128,r=!0,lo(i,!1),e.lanes=4194304)}else{if(!r)if(null!==(t=gr(o))){if(e.flags|=128,r=!0,null!==(t=t.updateQueue)&&(e.updateQueue=t,e.flags|=4),lo(i,!0),null===i.tail&&"hidden"===i.tailMode&&!o.alternate&&!gn)return co(e),null}else 2*je()-i.renderingStartTime>ma&&1073741824!==n&&(e.flags|=128,r=!0,lo(i,!1),e.lanes=4194304);i.isBackwards?(o.sibling=e.child,e.child=o):(null!==(t=i.last)?t.sibling=o:e.child=o,i.last=o)}return null!==i.tail?(e=i.tail,i.rendering=e,i.tail=e.sibling,i.renderingStartTime=je(),e.sibling=null,t=pr.current,ce(pr,r?1&t|2:1&t),e):(co(e),null);case 22:case 23:return ja(),n=null!==e.memoizedState,null!==t&&null!==t.memoizedState!==n&&(e.flags|=8192),n&&0!==(1&e.mode)?0!==(1073741824&aa)&&(co(e),q&&6&e.subtreeFlags&&(e.flags|=8192)):co(e),null;case 24:case 25:return null}throw Error(a(156,e.tag))}function ho(t,e){switch(hn(e),e.tag){case 1:return ge(e.type)&&me(),65536&(t=e.flags)?(e.flags=-65537&t|128,e):null;case 3:return dr(),le(he),le(de),yr(),0!==(65536&(t=e.flags))&&0===(128&t)?(e.flags=-65537&t|128,e):null;case 5:return fr(e),null;case 13:if(le(pr),null!==(t=e.memoizedState)&&null!==t.dehydrated){if(null===e.alternate)throw Error(a(340));Cn()}return 65536&(t=e.flags)?(e.flags=-65537&t|128,e):null;case 19:return le(pr),null;case 4:return dr(),null;case 10:return Vn(e.type._context),null;case 22:case 23:return ja(),null;default:return null}}var fo=!1,po=!1,go="function"===typeof WeakSet?WeakSet:Set,mo=null;function yo(t,e){var n=t.ref;if(null!==n)if("function"===typeof n)try{n(null)}catch(r){Ja(t,e,r)}else n.current=null}function bo(t,e,n){try{n()}catch(r){Ja(t,e,r)}}var vo=!1;function _o(t,e,n){var r=e.updateQueue;if(null!==(r=null!==r?r.lastEffect:null)){var i=r=r.next;do{if((i.tag&t)===t){var o=i.destroy;i.destroy=void 0,void 0!==o&&bo(e,n,o)}i=i.next}while(i!==r)}}function wo(t,e){if(null!==(e=null!==(e=e.updateQueue)?e.lastEffect:null)){var n=e=e.next;do{if((n.tag&t)===t){var r=n.create;n.destroy=r()}n=n.next}while(n!==e)}}function xo(t){var e=t.ref;if(null!==e){var n=t.stateNode;if(5===t.tag)t=D(n);else t=n;"function"===typeof e?e(t):e.current=t}}function So(t){var e=t.alternate;null!==e&&(t.alternate=null,So(e)),t.child=null,t.deletions=null,t.sibling=null,5===t.tag&&(null!==(e=t.stateNode)&&tt(e)),t.stateNode=null,t.return=null,t.dependencies=null,t.memoizedProps=null,t.memoizedState=null,t.pendingProps=null,t.stateNode=null,t.updateQueue=null}function ko(t){return 5===t.tag||3===t.tag||4===t.tag}function Co(t){t:for(;;){for(;null===t.sibling;){if(null===t.return||ko(t.return))return null;t=t.return}for(t.sibling.return=t.return,t=t.sibling;5!==t.tag&&6!==t.tag&&18!==t.tag;){if(2&t.flags)continue t;if(null===t.child||4===t.tag)continue t;t.child.return=t,t=t.child}if(!(2&t.flags))return t.stateNode}}function To(t,e,n){var r=t.tag;if(5===r||6===r)t=t.stateNode,e?yt(n,t,e):ht(n,t);else if(4!==r&&null!==(t=t.child))for(To(t,e,n),t=t.sibling;null!==t;)To(t,e,n),t=t.sibling}function Po(t,e,n){var r=t.tag;if(5===r||6===r)t=t.stateNode,e?mt(n,t,e):dt(n,t);else if(4!==r&&null!==(t=t.child))for(Po(t,e,n),t=t.sibling;null!==t;)Po(t,e,n),t=t.sibling}var Eo=null,Ao=!1;function Io(t,e,n){for(n=n.child;null!==n;)Mo(t,e,n),n=n.sibling}function Mo(t,e,n){if(He&&"function"===typeof He.onCommitFiberUnmount)try{He.onCommitFiberUnmount(Ge,n)}catch(s){}switch(n.tag){case 5:po||yo(n,e);case 6:if(q){var r=Eo,i=Ao;Eo=null,Io(t,e,n),Ao=i,null!==(Eo=r)&&(Ao?vt(Eo,n.stateNode):bt(Eo,n.stateNode))}else Io(t,e,n);break;case 18:q&&null!==Eo&&(Ao?Qt(Eo,n.stateNode):Xt(Eo,n.stateNode));break;case 4:q?(r=Eo,i=Ao,Eo=n.stateNode.containerInfo,Ao=!0,Io(t,e,n),Eo=r,Ao=i):(K&&(r=n.stateNode.containerInfo,i=Pt(r),It(r,i)),Io(t,e,n));break;case 0:case 11:case 14:case 15:if(!po&&(null!==(r=n.updateQueue)&&null!==(r=r.lastEffect))){i=r=r.next;do{var o=i,a=o.destroy;o=o.tag,void 0!==a&&(0!==(2&o)||0!==(4&o))&&bo(n,e,a),i=i.next}while(i!==r)}Io(t,e,n);break;case 1:if(!po&&(yo(n,e),"function"===typeof(r=n.stateNode).componentWillUnmount))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(s){Ja(n,e,s)}Io(t,e,n);break;case 21:Io(t,e,n);break;case 22:1&n.mode?(po=(r=po)||null!==n.memoizedState,Io(t,e,n),po=r):Io(t,e,n);break;default:Io(t,e,n)}}function Fo(t){var e=t.updateQueue;if(null!==e){t.updateQueue=null;var n=t.stateNode;null===n&&(n=t.stateNode=new go),e.forEach((function(e){var r=rs.bind(null,t,e);n.has(e)||(n.add(e),e.then(r,r))}))}}function Do(t,e){var n=e.deletions;if(null!==n)for(var r=0;r<n.length;r++){var i=n[r];try{var o=t,s=e;if(q){var l=s;t:for(;null!==l;){switch(l.tag){case 5:Eo=l.stateNode,Ao=!1;break t;case 3:case 4:Eo=l.stateNode.containerInfo,Ao=!0;break t}l=l.return}if(null===Eo)throw Error(a(160));Mo(o,s,i),Eo=null,Ao=!1}else Mo(o,s,i);var c=i.alternate;null!==c&&(c.return=null),i.return=null}catch(u){Ja(i,e,u)}}if(12854&e.subtreeFlags)for(e=e.child;null!==e;)Ro(e,t),e=e.sibling}function Ro(t,e){var n=t.alternate,r=t.flags;switch(t.tag){case 0:case 11:case 14:case 15:if(Do(e,t),Oo(t),4&r){try{_o(3,t,t.return),wo(3,t)}catch(f){Ja(t,t.return,f)}try{_o(5,t,t.return)}catch(f){Ja(t,t.return,f)}}break;case 1:Do(e,t),Oo(t),512&r&&null!==n&&yo(n,n.return);break;case 5:if(Do(e,t),Oo(t),512&r&&null!==n&&yo(n,n.return),q){if(32&t.flags){var i=t.stateNode;try{_t(i)}catch(f){Ja(t,t.return,f)}}if(4&r&&null!=(i=t.stateNode)){var o=t.memoizedProps;if(n=null!==n?n.memoizedProps:o,r=t.type,e=t.updateQueue,t.updateQueue=null,null!==e)try{gt(i,e,r,n,o,t)}catch(f){Ja(t,t.return,f)}}}break;case 6:if(Do(e,t),Oo(t),4&r&&q){if(null===t.stateNode)throw Error(a(162));i=t.stateNode,o=t.memoizedProps,n=null!==n?n.memoizedProps:o;try{ft(i,n,o)}catch(f){Ja(t,t.return,f)}}break;case 3:if(Do(e,t),Oo(t),4&r){if(q&&X&&null!==n&&n.memoizedState.isDehydrated)try{qt(e.containerInfo)}catch(f){Ja(t,t.return,f)}if(K){i=e.containerInfo,o=e.pendingChildren;try{It(i,o)}catch(f){Ja(t,t.return,f)}}}break;case 4:if(Do(e,t),Oo(t),4&r&&K){i=(o=t.stateNode).containerInfo,o=o.pendingChildren;try{It(i,o)}catch(f){Ja(t,t.return,f)}}break;case 13:Do(e,t),Oo(t),8192&(i=t.child).flags&&(o=null!==i.memoizedState,i.stateNode.isHidden=o,!o||null!==i.alternate&&null!==i.alternate.memoizedState||(ga=je())),4&r&&Fo(t);break;case 22:var s=null!==n&&null!==n.memoizedState;if(1&t.mode?(po=(n=po)||s,Do(e,t),po=n):Do(e,t),Oo(t),8192&r){if(n=null!==t.memoizedState,(t.stateNode.isHidden=n)&&!s&&0!==(1&t.mode))for(mo=t,r=t.child;null!==r;){for(e=mo=r;null!==mo;){var l=(s=mo).child;switch(s.tag){case 0:case 11:case 14:case 15:_o(4,s,s.return);break;case 1:yo(s,s.return);var c=s.stateNode;if("function"===typeof c.componentWillUnmount){var u=s,d=s.return;try{var h=u;c.props=h.memoizedProps,c.state=h.memoizedState,c.componentWillUnmount()}catch(f){Ja(u,d,f)}}break;case 5:yo(s,s.return);break;case 22:if(null!==s.memoizedState){zo(e);continue}}null!==l?(l.return=s,mo=l):zo(e)}r=r.sibling}if(q)t:if(r=null,q)for(e=t;;){if(5===e.tag){if(null===r){r=e;try{i=e.stateNode,n?wt(i):St(e.stateNode,e.memoizedProps)}catch(f){Ja(t,t.return,f)}}}else if(6===e.tag){if(null===r)try{o=e.stateNode,n?xt(o):kt(o,e.memoizedProps)}catch(f){Ja(t,t.return,f)}}else if((22!==e.tag&&23!==e.tag||null===e.memoizedState||e===t)&&null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break t;for(;null===e.sibling;){if(null===e.return||e.return===t)break t;r===e&&(r=null),e=e.return}r===e&&(r=null),e.sibling.return=e.return,e=e.sibling}}break;case 19:Do(e,t),Oo(t),4&r&&Fo(t);break;case 21:break;default:Do(e,t),Oo(t)}}function Oo(t){var e=t.flags;if(2&e){try{if(q){t:{for(var n=t.return;null!==n;){if(ko(n)){var r=n;break t}n=n.return}throw Error(a(160))}switch(r.tag){case 5:var i=r.stateNode;32&r.flags&&(_t(i),r.flags&=-33),Po(t,Co(t),i);break;case 3:case 4:var o=r.stateNode.containerInfo;To(t,Co(t),o);break;default:throw Error(a(161))}}}catch(s){Ja(t,t.return,s)}t.flags&=-3}4096&e&&(t.flags&=-4097)}function No(t,e,n){mo=t,Lo(t,e,n)}function Lo(t,e,n){for(var r=0!==(1&t.mode);null!==mo;){var i=mo,o=i.child;if(22===i.tag&&r){var a=null!==i.memoizedState||fo;if(!a){var s=i.alternate,l=null!==s&&null!==s.memoizedState||po;s=fo;var c=po;if(fo=a,(po=l)&&!c)for(mo=i;null!==mo;)l=(a=mo).child,22===a.tag&&null!==a.memoizedState?jo(i):null!==l?(l.return=a,mo=l):jo(i);for(;null!==o;)mo=o,Lo(o,e,n),o=o.sibling;mo=i,fo=s,po=c}Bo(t)}else 0!==(8772&i.subtreeFlags)&&null!==o?(o.return=i,mo=o):Bo(t)}}function Bo(t){for(;null!==mo;){var e=mo;if(0!==(8772&e.flags)){var n=e.alternate;try{if(0!==(8772&e.flags))switch(e.tag){case 0:case 11:case 15:po||wo(5,e);break;case 1:var r=e.stateNode;if(4&e.flags&&!po)if(null===n)r.componentDidMount();else{var i=e.elementType===e.type?n.memoizedProps:mi(e.type,n.memoizedProps);r.componentDidUpdate(i,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var o=e.updateQueue;null!==o&&ir(e,o,r);break;case 3:var s=e.updateQueue;if(null!==s){if(n=null,null!==e.child)switch(e.child.tag){case 5:n=D(e.child.stateNode);break;case 1:n=e.child.stateNode}ir(e,s,n)}break;case 5:var l=e.stateNode;null===n&&4&e.flags&&pt(l,e.type,e.memoizedProps,e);break;case 6:case 4:case 12:case 19:case 17:case 21:case 22:case 23:case 25:break;case 13:if(X&&null===e.memoizedState){var c=e.alternate;if(null!==c){var u=c.memoizedState;if(null!==u){var d=u.dehydrated;null!==d&&Kt(d)}}}break;default:throw Error(a(163))}po||512&e.flags&&xo(e)}catch(h){Ja(e,e.return,h)}}if(e===t){mo=null;break}if(null!==(n=e.sibling)){n.return=e.return,mo=n;break}mo=e.return}}function zo(t){for(;null!==mo;){var e=mo;if(e===t){mo=null;break}var n=e.sibling;if(null!==n){n.return=e.return,mo=n;break}mo=e.return}}function jo(t){for(;null!==mo;){var e=mo;try{switch(e.tag){case 0:case 11:case 15:var n=e.return;try{wo(4,e)}catch(l){Ja(e,n,l)}break;case 1:var r=e.stateNode;if("function"===typeof r.componentDidMount){var i=e.return;try{r.componentDidMount()}catch(l){Ja(e,i,l)}}var o=e.return;try{xo(e)}catch(l){Ja(e,o,l)}break;case 5:var a=e.return;try{xo(e)}catch(l){Ja(e,a,l)}}}catch(l){Ja(e,e.return,l)}if(e===t){mo=null;break}var s=e.sibling;if(null!==s){s.return=e.return,mo=s;break}mo=e.return}}var Uo=0,Vo=1,$o=2,Wo=3,Go=4;if("function"===typeof Symbol&&Symbol.for){var Ho=Symbol.for;Uo=Ho("selector.component"),Vo=Ho("selector.has_pseudo_class"),$o=Ho("selector.role"),Wo=Ho("selector.test_id"),Go=Ho("selector.text")}function Yo(t){var e=Q(t);if(null!=e){if("string"!==typeof e.memoizedProps["data-testname"])throw Error(a(364));return e}if(null===(t=it(t)))throw Error(a(362));return t.stateNode.current}function qo(t,e){switch(e.$$typeof){case Uo:if(t.type===e.value)return!0;break;case Vo:t:{e=e.value,t=[t,0];for(var n=0;n<t.length;){var r=t[n++],i=t[n++],o=e[i];if(5!==r.tag||!st(r)){for(;null!=o&&qo(r,o);)o=e[++i];if(i===e.length){e=!0;break t}for(r=r.child;null!==r;)t.push(r,i),r=r.sibling}}e=!1}return e;case $o:if(5===t.tag&&lt(t.stateNode,e.value))return!0;break;case Go:if((5===t.tag||6===t.tag)&&(null!==(t=at(t))&&0<=t.indexOf(e.value)))return!0;break;case Wo:if(5===t.tag&&("string"===typeof(t=t.memoizedProps["data-testname"])&&t.toLowerCase()===e.value.toLowerCase()))return!0;break;default:throw Error(a(365))}return!1}function Ko(t){switch(t.$$typeof){case Uo:return"<"+(S(t.value)||"Unknown")+">";case Vo:return":has("+(Ko(t)||"")+")";case $o:return'[role="'+t.value+'"]';case Go:return'"'+t.value+'"';case Wo:return'[data-testname="'+t.value+'"]';default:throw Error(a(365))}}function Xo(t,e){var n=[];t=[t,0];for(var r=0;r<t.length;){var i=t[r++],o=t[r++],a=e[o];if(5!==i.tag||!st(i)){for(;null!=a&&qo(i,a);)a=e[++o];if(o===e.length)n.push(i);else for(i=i.child;null!==i;)t.push(i,o),i=i.sibling}}return n}function Qo(t,e){if(!rt)throw Error(a(363));t=Xo(t=Yo(t),e),e=[],t=Array.from(t);for(var n=0;n<t.length;){var r=t[n++];if(5===r.tag)st(r)||e.push(r.stateNode);else for(r=r.child;null!==r;)t.push(r),r=r.sibling}return e}var Zo=Math.ceil,Jo=s.ReactCurrentDispatcher,ta=s.ReactCurrentOwner,ea=s.ReactCurrentBatchConfig,na=0,ra=null,ia=null,oa=0,aa=0,sa=se(0),la=0,ca=null,ua=0,da=0,ha=0,fa=null,pa=null,ga=0,ma=1/0,ya=null;function ba(){ma=je()+500}var va,_a=!1,wa=null,xa=null,Sa=!1,ka=null,Ca=0,Ta=0,Pa=null,Ea=-1,Aa=0;function Ia(){return 0!==(6&na)?je():-1!==Ea?Ea:Ea=je()}function Ma(t){return 0===(1&t.mode)?1:0!==(2&na)&&0!==oa?oa&-oa:null!==Pn.transition?(0===Aa&&(Aa=Ie()),Aa):0!==(t=Re)?t:J()}function Fa(t,e,n,r){if(50<Ta)throw Ta=0,Pa=null,Error(a(185));Fe(t,n,r),0!==(2&na)&&t===ra||(t===ra&&(0===(2&na)&&(da|=n),4===la&&La(t,oa)),Da(t,r),1===n&&0===na&&0===(1&e.mode)&&(ba(),Ke&&Ze()))}function Da(t,e){var n=t.callbackNode;!function(t,e){for(var n=t.suspendedLanes,r=t.pingedLanes,i=t.expirationTimes,o=t.pendingLanes;0<o;){var a=31-we(o),s=1<<a,l=i[a];-1===l?0!==(s&n)&&0===(s&r)||(i[a]=Ee(s,e)):l<=e&&(t.expiredLanes|=s),o&=~s}}(t,e);var r=Pe(t,t===ra?oa:0);if(0===r)null!==n&&Le(n),t.callbackNode=null,t.callbackPriority=0;else if(e=r&-r,t.callbackPriority!==e){if(null!=n&&Le(n),1===e)0===t.tag?function(t){Ke=!0,Qe(t)}(Ba.bind(null,t)):Qe(Ba.bind(null,t)),et?nt((function(){0===(6&na)&&Ze()})):Ne(Ue,Ze),n=null;else{switch(Oe(r)){case 1:n=Ue;break;case 4:n=Ve;break;case 16:default:n=$e;break;case 536870912:n=We}n=is(n,Ra.bind(null,t))}t.callbackPriority=e,t.callbackNode=n}}function Ra(t,e){if(Ea=-1,Aa=0,0!==(6&na))throw Error(a(327));var n=t.callbackNode;if(Qa()&&t.callbackNode!==n)return null;var r=Pe(t,t===ra?oa:0);if(0===r)return null;if(0!==(30&r)||0!==(r&t.expiredLanes)||e)e=Ga(t,r);else{e=r;var i=na;na|=2;var o=$a();for(ra===t&&oa===e||(ya=null,ba(),Ua(t,e));;)try{Ya();break}catch(l){Va(t,l)}jn(),Jo.current=o,na=i,null!==ia?e=0:(ra=null,oa=0,e=la)}if(0!==e){if(2===e&&(0!==(i=Ae(t))&&(r=i,e=Oa(t,i))),1===e)throw n=ca,Ua(t,0),La(t,r),Da(t,je()),n;if(6===e)La(t,r);else{if(i=t.current.alternate,0===(30&r)&&!function(t){for(var e=t;;){if(16384&e.flags){var n=e.updateQueue;if(null!==n&&null!==(n=n.stores))for(var r=0;r<n.length;r++){var i=n[r],o=i.getSnapshot;i=i.value;try{if(!Ye(o(),i))return!1}catch(s){return!1}}}if(n=e.child,16384&e.subtreeFlags&&null!==n)n.return=e,e=n;else{if(e===t)break;for(;null===e.sibling;){if(null===e.return||e.return===t)return!0;e=e.return}e.sibling.return=e.return,e=e.sibling}}return!0}(i)&&(2===(e=Ga(t,r))&&(0!==(o=Ae(t))&&(r=o,e=Oa(t,o))),1===e))throw n=ca,Ua(t,0),La(t,r),Da(t,je()),n;switch(t.finishedWork=i,t.finishedLanes=r,e){case 0:case 1:throw Error(a(345));case 2:case 5:Xa(t,pa,ya);break;case 3:if(La(t,r),(130023424&r)===r&&10<(e=ga+500-je())){if(0!==Pe(t,0))break;if(((i=t.suspendedLanes)&r)!==r){Ia(),t.pingedLanes|=t.suspendedLanes&i;break}t.timeoutHandle=W(Xa.bind(null,t,pa,ya),e);break}Xa(t,pa,ya);break;case 4:if(La(t,r),(4194240&r)===r)break;for(e=t.eventTimes,i=-1;0<r;){var s=31-we(r);o=1<<s,(s=e[s])>i&&(i=s),r&=~o}if(r=i,10<(r=(120>(r=je()-r)?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*Zo(r/1960))-r)){t.timeoutHandle=W(Xa.bind(null,t,pa,ya),r);break}Xa(t,pa,ya);break;default:throw Error(a(329))}}}return Da(t,je()),t.callbackNode===n?Ra.bind(null,t):null}function Oa(t,e){var n=fa;return t.current.memoizedState.isDehydrated&&(Ua(t,e).flags|=256),2!==(t=Ga(t,e))&&(e=pa,pa=n,null!==e&&Na(e)),t}function Na(t){null===pa?pa=t:pa.push.apply(pa,t)}function La(t,e){for(e&=~ha,e&=~da,t.suspendedLanes|=e,t.pingedLanes&=~e,t=t.expirationTimes;0<e;){var n=31-we(e),r=1<<n;t[n]=-1,e&=~r}}function Ba(t){if(0!==(6&na))throw Error(a(327));Qa();var e=Pe(t,0);if(0===(1&e))return Da(t,je()),null;var n=Ga(t,e);if(0!==t.tag&&2===n){var r=Ae(t);0!==r&&(e=r,n=Oa(t,r))}if(1===n)throw n=ca,Ua(t,0),La(t,e),Da(t,je()),n;if(6===n)throw Error(a(345));return t.finishedWork=t.current.alternate,t.finishedLanes=e,Xa(t,pa,ya),Da(t,je()),null}function za(t){null!==ka&&0===ka.tag&&0===(6&na)&&Qa();var e=na;na|=1;var n=ea.transition,r=Re;try{if(ea.transition=null,Re=1,t)return t()}finally{Re=r,ea.transition=n,0===(6&(na=e))&&Ze()}}function ja(){aa=sa.current,le(sa)}function Ua(t,e){t.finishedWork=null,t.finishedLanes=0;var n=t.timeoutHandle;if(n!==H&&(t.timeoutHandle=H,G(n)),null!==ia)for(n=ia.return;null!==n;){var r=n;switch(hn(r),r.tag){case 1:null!==(r=r.type.childContextTypes)&&void 0!==r&&me();break;case 3:dr(),le(he),le(de),yr();break;case 5:fr(r);break;case 4:dr();break;case 13:case 19:le(pr);break;case 10:Vn(r.type._context);break;case 22:case 23:ja()}n=n.return}if(ra=t,ia=t=ls(t.current,null),oa=aa=e,la=0,ca=null,ha=da=ua=0,pa=fa=null,null!==Hn){for(e=0;e<Hn.length;e++)if(null!==(r=(n=Hn[e]).interleaved)){n.interleaved=null;var i=r.next,o=n.pending;if(null!==o){var a=o.next;o.next=i,r.next=a}n.pending=r}Hn=null}return t}function Va(t,e){for(;;){var n=ia;try{if(jn(),br.current=hi,kr){for(var r=wr.memoizedState;null!==r;){var i=r.queue;null!==i&&(i.pending=null),r=r.next}kr=!1}if(_r=0,Sr=xr=wr=null,Cr=!1,Tr=0,ta.current=null,null===n||null===n.return){la=1,ca=e,ia=null;break}t:{var o=t,s=n.return,l=n,c=e;if(e=oa,l.flags|=32768,null!==c&&"object"===typeof c&&"function"===typeof c.then){var u=c,d=l,h=d.tag;if(0===(1&d.mode)&&(0===h||11===h||15===h)){var f=d.alternate;f?(d.updateQueue=f.updateQueue,d.memoizedState=f.memoizedState,d.lanes=f.lanes):(d.updateQueue=null,d.memoizedState=null)}var p=Ii(s);if(null!==p){p.flags&=-257,Mi(p,s,l,0,e),1&p.mode&&Ai(o,u,e),c=u;var g=(e=p).updateQueue;if(null===g){var m=new Set;m.add(c),e.updateQueue=m}else g.add(c);break t}if(0===(1&e)){Ai(o,u,e),Wa();break t}c=Error(a(426))}else if(gn&&1&l.mode){var y=Ii(s);if(null!==y){0===(65536&y.flags)&&(y.flags|=256),Mi(y,s,l,0,e),Tn(Si(c,l));break t}}o=c=Si(c,l),4!==la&&(la=2),null===fa?fa=[o]:fa.push(o),o=s;do{switch(o.tag){case 3:o.flags|=65536,e&=-e,o.lanes|=e,nr(o,Pi(0,c,e));break t;case 1:l=c;var b=o.type,v=o.stateNode;if(0===(128&o.flags)&&("function"===typeof b.getDerivedStateFromError||null!==v&&"function"===typeof v.componentDidCatch&&(null===xa||!xa.has(v)))){o.flags|=65536,e&=-e,o.lanes|=e,nr(o,Ei(o,l,e));break t}}o=o.return}while(null!==o)}Ka(n)}catch(_){e=_,ia===n&&null!==n&&(ia=n=n.return);continue}break}}function $a(){var t=Jo.current;return Jo.current=hi,null===t?hi:t}function Wa(){0!==la&&3!==la&&2!==la||(la=4),null===ra||0===(268435455&ua)&&0===(268435455&da)||La(ra,oa)}function Ga(t,e){var n=na;na|=2;var r=$a();for(ra===t&&oa===e||(ya=null,Ua(t,e));;)try{Ha();break}catch(i){Va(t,i)}if(jn(),na=n,Jo.current=r,null!==ia)throw Error(a(261));return ra=null,oa=0,la}function Ha(){for(;null!==ia;)qa(ia)}function Ya(){for(;null!==ia&&!Be();)qa(ia)}function qa(t){var e=va(t.alternate,t,aa);t.memoizedProps=t.pendingProps,null===e?Ka(t):ia=e,ta.current=null}function Ka(t){var e=t;do{var n=e.alternate;if(t=e.return,0===(32768&e.flags)){if(null!==(n=uo(n,e,aa)))return void(ia=n)}else{if(null!==(n=ho(n,e)))return n.flags&=32767,void(ia=n);if(null===t)return la=6,void(ia=null);t.flags|=32768,t.subtreeFlags=0,t.deletions=null}if(null!==(e=e.sibling))return void(ia=e);ia=e=t}while(null!==e);0===la&&(la=5)}function Xa(t,e,n){var r=Re,i=ea.transition;try{ea.transition=null,Re=1,function(t,e,n,r){do{Qa()}while(null!==ka);if(0!==(6&na))throw Error(a(327));n=t.finishedWork;var i=t.finishedLanes;if(null===n)return null;if(t.finishedWork=null,t.finishedLanes=0,n===t.current)throw Error(a(177));t.callbackNode=null,t.callbackPriority=0;var o=n.lanes|n.childLanes;if(function(t,e){var n=t.pendingLanes&~e;t.pendingLanes=e,t.suspendedLanes=0,t.pingedLanes=0,t.expiredLanes&=e,t.mutableReadLanes&=e,t.entangledLanes&=e,e=t.entanglements;var r=t.eventTimes;for(t=t.expirationTimes;0<n;){var i=31-we(n),o=1<<i;e[i]=0,r[i]=-1,t[i]=-1,n&=~o}}(t,o),t===ra&&(ia=ra=null,oa=0),0===(2064&n.subtreeFlags)&&0===(2064&n.flags)||Sa||(Sa=!0,is($e,(function(){return Qa(),null}))),o=0!==(15990&n.flags),0!==(15990&n.subtreeFlags)||o){o=ea.transition,ea.transition=null;var s=Re;Re=1;var l=na;na|=4,ta.current=null,function(t,e){for(N(t.containerInfo),mo=e;null!==mo;)if(e=(t=mo).child,0!==(1028&t.subtreeFlags)&&null!==e)e.return=t,mo=e;else for(;null!==mo;){t=mo;try{var n=t.alternate;if(0!==(1024&t.flags))switch(t.tag){case 0:case 11:case 15:case 5:case 6:case 4:case 17:break;case 1:if(null!==n){var r=n.memoizedProps,i=n.memoizedState,o=t.stateNode,s=o.getSnapshotBeforeUpdate(t.elementType===t.type?r:mi(t.type,r),i);o.__reactInternalSnapshotBeforeUpdate=s}break;case 3:q&&Ct(t.stateNode.containerInfo);break;default:throw Error(a(163))}}catch(l){Ja(t,t.return,l)}if(null!==(e=t.sibling)){e.return=t.return,mo=e;break}mo=t.return}n=vo,vo=!1}(t,n),Ro(n,t),L(t.containerInfo),t.current=n,No(n,t,i),ze(),na=l,Re=s,ea.transition=o}else t.current=n;if(Sa&&(Sa=!1,ka=t,Ca=i),o=t.pendingLanes,0===o&&(xa=null),function(t){if(He&&"function"===typeof He.onCommitFiberRoot)try{He.onCommitFiberRoot(Ge,t,void 0,128===(128&t.current.flags))}catch(e){}}(n.stateNode),Da(t,je()),null!==e)for(r=t.onRecoverableError,n=0;n<e.length;n++)i=e[n],r(i.value,{componentStack:i.stack,digest:i.digest});if(_a)throw _a=!1,t=wa,wa=null,t;0!==(1&Ca)&&0!==t.tag&&Qa(),o=t.pendingLanes,0!==(1&o)?t===Pa?Ta++:(Ta=0,Pa=t):Ta=0,Ze()}(t,e,n,r)}finally{ea.transition=i,Re=r}return null}function Qa(){if(null!==ka){var t=Oe(Ca),e=ea.transition,n=Re;try{if(ea.transition=null,Re=16>t?16:t,null===ka)var r=!1;else{if(t=ka,ka=null,Ca=0,0!==(6&na))throw Error(a(331));var i=na;for(na|=4,mo=t.current;null!==mo;){var o=mo,s=o.child;if(0!==(16&mo.flags)){var l=o.deletions;if(null!==l){for(var c=0;c<l.length;c++){var u=l[c];for(mo=u;null!==mo;){var d=mo;switch(d.tag){case 0:case 11:case 15:_o(8,d,o)}var h=d.child;if(null!==h)h.return=d,mo=h;else for(;null!==mo;){var f=(d=mo).sibling,p=d.return;if(So(d),d===u){mo=null;break}if(null!==f){f.return=p,mo=f;break}mo=p}}}var g=o.alternate;if(null!==g){var m=g.child;if(null!==m){g.child=null;do{var y=m.sibling;m.sibling=null,m=y}while(null!==m)}}mo=o}}if(0!==(2064&o.subtreeFlags)&&null!==s)s.return=o,mo=s;else t:for(;null!==mo;){if(0!==(2048&(o=mo).flags))switch(o.tag){case 0:case 11:case 15:_o(9,o,o.return)}var b=o.sibling;if(null!==b){b.return=o.return,mo=b;break t}mo=o.return}}var v=t.current;for(mo=v;null!==mo;){var _=(s=mo).child;if(0!==(2064&s.subtreeFlags)&&null!==_)_.return=s,mo=_;else t:for(s=v;null!==mo;){if(0!==(2048&(l=mo).flags))try{switch(l.tag){case 0:case 11:case 15:wo(9,l)}}catch(x){Ja(l,l.return,x)}if(l===s){mo=null;break t}var w=l.sibling;if(null!==w){w.return=l.return,mo=w;break t}mo=l.return}}if(na=i,Ze(),He&&"function"===typeof He.onPostCommitFiberRoot)try{He.onPostCommitFiberRoot(Ge,t)}catch(x){}r=!0}return r}finally{Re=n,ea.transition=e}}return!1}function Za(t,e,n){t=tr(t,e=Pi(0,e=Si(n,e),1),1),e=Ia(),null!==t&&(Fe(t,1,e),Da(t,e))}function Ja(t,e,n){if(3===t.tag)Za(t,t,n);else for(;null!==e;){if(3===e.tag){Za(e,t,n);break}if(1===e.tag){var r=e.stateNode;if("function"===typeof e.type.getDerivedStateFromError||"function"===typeof r.componentDidCatch&&(null===xa||!xa.has(r))){e=tr(e,t=Ei(e,t=Si(n,t),1),1),t=Ia(),null!==e&&(Fe(e,1,t),Da(e,t));break}}e=e.return}}function ts(t,e,n){var r=t.pingCache;null!==r&&r.delete(e),e=Ia(),t.pingedLanes|=t.suspendedLanes&n,ra===t&&(oa&n)===n&&(4===la||3===la&&(130023424&oa)===oa&&500>je()-ga?Ua(t,0):ha|=n),Da(t,e)}function es(t,e){0===e&&(0===(1&t.mode)?e=1:(e=Ce,0===(130023424&(Ce<<=1))&&(Ce=4194304)));var n=Ia();null!==(t=Kn(t,e))&&(Fe(t,e,n),Da(t,n))}function ns(t){var e=t.memoizedState,n=0;null!==e&&(n=e.retryLane),es(t,n)}function rs(t,e){var n=0;switch(t.tag){case 13:var r=t.stateNode,i=t.memoizedState;null!==i&&(n=i.retryLane);break;case 19:r=t.stateNode;break;default:throw Error(a(314))}null!==r&&r.delete(e),es(t,n)}function is(t,e){return Ne(t,e)}function os(t,e,n,r){this.tag=t,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=e,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function as(t,e,n,r){return new os(t,e,n,r)}function ss(t){return!(!(t=t.prototype)||!t.isReactComponent)}function ls(t,e){var n=t.alternate;return null===n?((n=as(t.tag,e,t.key,t.mode)).elementType=t.elementType,n.type=t.type,n.stateNode=t.stateNode,n.alternate=t,t.alternate=n):(n.pendingProps=e,n.type=t.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=14680064&t.flags,n.childLanes=t.childLanes,n.lanes=t.lanes,n.child=t.child,n.memoizedProps=t.memoizedProps,n.memoizedState=t.memoizedState,n.updateQueue=t.updateQueue,e=t.dependencies,n.dependencies=null===e?null:{lanes:e.lanes,firstContext:e.firstContext},n.sibling=t.sibling,n.index=t.index,n.ref=t.ref,n}function cs(t,e,n,r,i,o){var s=2;if(r=t,"function"===typeof t)ss(t)&&(s=1);else if("string"===typeof t)s=5;else t:switch(t){case u:return us(n.children,i,o,e);case d:s=8,i|=8;break;case h:return(t=as(12,n,e,2|i)).elementType=h,t.lanes=o,t;case m:return(t=as(13,n,e,i)).elementType=m,t.lanes=o,t;case y:return(t=as(19,n,e,i)).elementType=y,t.lanes=o,t;case _:return ds(n,i,o,e);default:if("object"===typeof t&&null!==t)switch(t.$$typeof){case f:s=10;break t;case p:s=9;break t;case g:s=11;break t;case b:s=14;break t;case v:s=16,r=null;break t}throw Error(a(130,null==t?t:typeof t,""))}return(e=as(s,n,e,i)).elementType=t,e.type=r,e.lanes=o,e}function us(t,e,n,r){return(t=as(7,t,r,e)).lanes=n,t}function ds(t,e,n,r){return(t=as(22,t,r,e)).elementType=_,t.lanes=n,t.stateNode={isHidden:!1},t}function hs(t,e,n){return(t=as(6,t,null,e)).lanes=n,t}function fs(t,e,n){return(e=as(4,null!==t.children?t.children:[],t.key,e)).lanes=n,e.stateNode={containerInfo:t.containerInfo,pendingChildren:null,implementation:t.implementation},e}function ps(t,e,n,r,i){this.tag=e,this.containerInfo=t,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=H,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=Me(0),this.expirationTimes=Me(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Me(0),this.identifierPrefix=r,this.onRecoverableError=i,X&&(this.mutableSourceEagerHydrationData=null)}function gs(t,e,n,r,i,o,a,s,l){return t=new ps(t,e,n,s,l),1===e?(e=1,!0===o&&(e|=8)):e=0,o=as(3,null,null,e),t.current=o,o.stateNode=t,o.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},Qn(o),t}function ms(t){if(!t)return ue;t:{if(C(t=t._reactInternals)!==t||1!==t.tag)throw Error(a(170));var e=t;do{switch(e.tag){case 3:e=e.stateNode.context;break t;case 1:if(ge(e.type)){e=e.stateNode.__reactInternalMemoizedMergedChildContext;break t}}e=e.return}while(null!==e);throw Error(a(171))}if(1===t.tag){var n=t.type;if(ge(n))return be(t,n,e)}return e}function ys(t){var e=t._reactInternals;if(void 0===e){if("function"===typeof t.render)throw Error(a(188));throw t=Object.keys(t).join(","),Error(a(268,t))}return null===(t=E(e))?null:t.stateNode}function bs(t,e){if(null!==(t=t.memoizedState)&&null!==t.dehydrated){var n=t.retryLane;t.retryLane=0!==n&&n<e?n:e}}function vs(t,e){bs(t,e),(t=t.alternate)&&bs(t,e)}function _s(t){return null===(t=E(t))?null:t.stateNode}function ws(){return null}return va=function(t,e,n){if(null!==t)if(t.memoizedProps!==e.pendingProps||he.current)Di=!0;else{if(0===(t.lanes&n)&&0===(128&e.flags))return Di=!1,function(t,e,n){switch(e.tag){case 3:$i(e),Cn();break;case 5:hr(e);break;case 1:ge(e.type)&&ve(e);break;case 4:ur(e,e.stateNode.containerInfo);break;case 10:Un(0,e.type._context,e.memoizedProps.value);break;case 13:var r=e.memoizedState;if(null!==r)return null!==r.dehydrated?(ce(pr,1&pr.current),e.flags|=128,null):0!==(n&e.child.childLanes)?Qi(t,e,n):(ce(pr,1&pr.current),null!==(t=io(t,e,n))?t.sibling:null);ce(pr,1&pr.current);break;case 19:if(r=0!==(n&e.childLanes),0!==(128&t.flags)){if(r)return no(t,e,n);e.flags|=128}var i=e.memoizedState;if(null!==i&&(i.rendering=null,i.tail=null,i.lastEffect=null),ce(pr,pr.current),r)break;return null;case 22:case 23:return e.lanes=0,Bi(t,e,n)}return io(t,e,n)}(t,e,n);Di=0!==(131072&t.flags)}else Di=!1,gn&&0!==(1048576&e.flags)&&un(e,nn,e.index);switch(e.lanes=0,e.tag){case 2:var r=e.type;ro(t,e),t=e.pendingProps;var i=pe(e,de.current);Wn(e,n),i=Ir(null,e,r,t,i,n);var o=Mr();return e.flags|=1,"object"===typeof i&&null!==i&&"function"===typeof i.render&&void 0===i.$$typeof?(e.tag=1,e.memoizedState=null,e.updateQueue=null,ge(r)?(o=!0,ve(e)):o=!1,e.memoizedState=null!==i.state&&void 0!==i.state?i.state:null,Qn(e),i.updater=bi,e.stateNode=i,i._reactInternals=e,xi(e,r,t,n),e=Vi(null,e,r,!0,o,n)):(e.tag=0,gn&&o&&dn(e),Ri(null,e,i,n),e=e.child),e;case 16:r=e.elementType;t:{switch(ro(t,e),t=e.pendingProps,r=(i=r._init)(r._payload),e.type=r,i=e.tag=function(t){if("function"===typeof t)return ss(t)?1:0;if(void 0!==t&&null!==t){if((t=t.$$typeof)===g)return 11;if(t===b)return 14}return 2}(r),t=mi(r,t),i){case 0:e=ji(null,e,r,t,n);break t;case 1:e=Ui(null,e,r,t,n);break t;case 11:e=Oi(null,e,r,t,n);break t;case 14:e=Ni(null,e,r,mi(r.type,t),n);break t}throw Error(a(306,r,""))}return e;case 0:return r=e.type,i=e.pendingProps,ji(t,e,r,i=e.elementType===r?i:mi(r,i),n);case 1:return r=e.type,i=e.pendingProps,Ui(t,e,r,i=e.elementType===r?i:mi(r,i),n);case 3:t:{if($i(e),null===t)throw Error(a(387));r=e.pendingProps,i=(o=e.memoizedState).element,Zn(t,e),rr(e,r,null,n);var s=e.memoizedState;if(r=s.element,X&&o.isDehydrated){if(o={element:r,isDehydrated:!1,cache:s.cache,pendingSuspenseBoundaries:s.pendingSuspenseBoundaries,transitions:s.transitions},e.updateQueue.baseState=o,e.memoizedState=o,256&e.flags){e=Wi(t,e,r,n,i=Si(Error(a(423)),e));break t}if(r!==i){e=Wi(t,e,r,n,i=Si(Error(a(424)),e));break t}for(X&&(pn=Vt(e.stateNode.containerInfo),fn=e,gn=!0,yn=null,mn=!1),n=On(e,null,r,n),e.child=n;n;)n.flags=-3&n.flags|4096,n=n.sibling}else{if(Cn(),r===i){e=io(t,e,n);break t}Ri(t,e,r,n)}e=e.child}return e;case 5:return hr(e),null===t&&wn(e),r=e.type,i=e.pendingProps,o=null!==t?t.memoizedProps:null,s=i.children,V(r,i)?s=null:null!==o&&V(r,o)&&(e.flags|=32),zi(t,e),Ri(t,e,s,n),e.child;case 6:return null===t&&wn(e),null;case 13:return Qi(t,e,n);case 4:return ur(e,e.stateNode.containerInfo),r=e.pendingProps,null===t?e.child=Rn(e,null,r,n):Ri(t,e,r,n),e.child;case 11:return r=e.type,i=e.pendingProps,Oi(t,e,r,i=e.elementType===r?i:mi(r,i),n);case 7:return Ri(t,e,e.pendingProps,n),e.child;case 8:case 12:return Ri(t,e,e.pendingProps.children,n),e.child;case 10:t:{if(r=e.type._context,i=e.pendingProps,o=e.memoizedProps,Un(0,r,s=i.value),null!==o)if(Ye(o.value,s)){if(o.children===i.children&&!he.current){e=io(t,e,n);break t}}else for(null!==(o=e.child)&&(o.return=e);null!==o;){var l=o.dependencies;if(null!==l){s=o.child;for(var c=l.firstContext;null!==c;){if(c.context===r){if(1===o.tag){(c=Jn(-1,n&-n)).tag=2;var u=o.updateQueue;if(null!==u){var d=(u=u.shared).pending;null===d?c.next=c:(c.next=d.next,d.next=c),u.pending=c}}o.lanes|=n,null!==(c=o.alternate)&&(c.lanes|=n),$n(o.return,n,e),l.lanes|=n;break}c=c.next}}else if(10===o.tag)s=o.type===e.type?null:o.child;else if(18===o.tag){if(null===(s=o.return))throw Error(a(341));s.lanes|=n,null!==(l=s.alternate)&&(l.lanes|=n),$n(s,n,e),s=o.sibling}else s=o.child;if(null!==s)s.return=o;else for(s=o;null!==s;){if(s===e){s=null;break}if(null!==(o=s.sibling)){o.return=s.return,s=o;break}s=s.return}o=s}Ri(t,e,i.children,n),e=e.child}return e;case 9:return i=e.type,r=e.pendingProps.children,Wn(e,n),r=r(i=Gn(i)),e.flags|=1,Ri(t,e,r,n),e.child;case 14:return i=mi(r=e.type,e.pendingProps),Ni(t,e,r,i=mi(r.type,i),n);case 15:return Li(t,e,e.type,e.pendingProps,n);case 17:return r=e.type,i=e.pendingProps,i=e.elementType===r?i:mi(r,i),ro(t,e),e.tag=1,ge(r)?(t=!0,ve(e)):t=!1,Wn(e,n),_i(e,r,i),xi(e,r,i,n),Vi(null,e,r,!0,t,n);case 19:return no(t,e,n);case 22:return Bi(t,e,n)}throw Error(a(156,e.tag))},e.attemptContinuousHydration=function(t){if(13===t.tag){var e=Kn(t,134217728);if(null!==e)Fa(e,t,134217728,Ia());vs(t,134217728)}},e.attemptDiscreteHydration=function(t){if(13===t.tag){var e=Kn(t,1);if(null!==e)Fa(e,t,1,Ia());vs(t,1)}},e.attemptHydrationAtCurrentPriority=function(t){if(13===t.tag){var e=Ma(t),n=Kn(t,e);if(null!==n)Fa(n,t,e,Ia());vs(t,e)}},e.attemptSynchronousHydration=function(t){switch(t.tag){case 3:var e=t.stateNode;if(e.current.memoizedState.isDehydrated){var n=Te(e.pendingLanes);0!==n&&(De(e,1|n),Da(e,je()),0===(6&na)&&(ba(),Ze()))}break;case 13:za((function(){var e=Kn(t,1);if(null!==e){var n=Ia();Fa(e,t,1,n)}})),vs(t,1)}},e.batchedUpdates=function(t,e){var n=na;na|=1;try{return t(e)}finally{0===(na=n)&&(ba(),Ke&&Ze())}},e.createComponentSelector=function(t){return{$$typeof:Uo,value:t}},e.createContainer=function(t,e,n,r,i,o,a){return gs(t,e,!1,null,0,r,0,o,a)},e.createHasPseudoClassSelector=function(t){return{$$typeof:Vo,value:t}},e.createHydrationContainer=function(t,e,n,r,i,o,a,s,l){return(t=gs(n,r,!0,t,0,o,0,s,l)).context=ms(null),n=t.current,(o=Jn(r=Ia(),i=Ma(n))).callback=void 0!==e&&null!==e?e:null,tr(n,o,i),t.current.lanes=i,Fe(t,i,r),Da(t,r),t},e.createPortal=function(t,e,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:c,key:null==r?null:""+r,children:t,containerInfo:e,implementation:n}},e.createRoleSelector=function(t){return{$$typeof:$o,value:t}},e.createTestNameSelector=function(t){return{$$typeof:Wo,value:t}},e.createTextSelector=function(t){return{$$typeof:Go,value:t}},e.deferredUpdates=function(t){var e=Re,n=ea.transition;try{return ea.transition=null,Re=16,t()}finally{Re=e,ea.transition=n}},e.discreteUpdates=function(t,e,n,r,i){var o=Re,a=ea.transition;try{return ea.transition=null,Re=1,t(e,n,r,i)}finally{Re=o,ea.transition=a,0===na&&ba()}},e.findAllNodes=Qo,e.findBoundingRects=function(t,e){if(!rt)throw Error(a(363));e=Qo(t,e),t=[];for(var n=0;n<e.length;n++)t.push(ot(e[n]));for(e=t.length-1;0<e;e--)for(var r=(n=t[e]).x,i=r+n.width,o=n.y,s=o+n.height,l=e-1;0<=l;l--)if(e!==l){var c=t[l],u=c.x,d=u+c.width,h=c.y,f=h+c.height;if(r>=u&&o>=h&&i<=d&&s<=f){t.splice(e,1);break}if(!(r!==u||n.width!==c.width||f<o||h>s)){h>o&&(c.height+=h-o,c.y=o),f<s&&(c.height=s-h),t.splice(e,1);break}if(!(o!==h||n.height!==c.height||d<r||u>i)){u>r&&(c.width+=u-r,c.x=r),d<i&&(c.width=i-u),t.splice(e,1);break}}return t},e.findHostInstance=ys,e.findHostInstanceWithNoPortals=function(t){return null===(t=null!==(t=P(t))?I(t):null)?null:t.stateNode},e.findHostInstanceWithWarning=function(t){return ys(t)},e.flushControlled=function(t){var e=na;na|=1;var n=ea.transition,r=Re;try{ea.transition=null,Re=1,t()}finally{Re=r,ea.transition=n,0===(na=e)&&(ba(),Ze())}},e.flushPassiveEffects=Qa,e.flushSync=za,e.focusWithin=function(t,e){if(!rt)throw Error(a(363));for(e=Xo(t=Yo(t),e),e=Array.from(e),t=0;t<e.length;){var n=e[t++];if(!st(n)){if(5===n.tag&&ct(n.stateNode))return!0;for(n=n.child;null!==n;)e.push(n),n=n.sibling}}return!1},e.getCurrentUpdatePriority=function(){return Re},e.getFindAllNodesFailureDescription=function(t,e){if(!rt)throw Error(a(363));var n=0,r=[];t=[Yo(t),0];for(var i=0;i<t.length;){var o=t[i++],s=t[i++],l=e[s];if((5!==o.tag||!st(o))&&(qo(o,l)&&(r.push(Ko(l)),++s>n&&(n=s)),s<e.length))for(o=o.child;null!==o;)t.push(o,s),o=o.sibling}if(n<e.length){for(t=[];n<e.length;n++)t.push(Ko(e[n]));return"findAllNodes was able to match part of the selector:\n  "+r.join(" > ")+"\n\nNo matching component was found for:\n  "+t.join(" > ")}return null},e.getPublicRootInstance=function(t){return(t=t.current).child?5===t.child.tag?D(t.child.stateNode):t.child.stateNode:null},e.injectIntoDevTools=function(t){if(t={bundleType:t.bundleType,version:t.version,rendererPackageName:t.rendererPackageName,rendererConfig:t.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:s.ReactCurrentDispatcher,findHostInstanceByFiber:_s,findFiberByHostInstance:t.findFiberByHostInstance||ws,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1"},"undefined"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__)t=!1;else{var e=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(e.isDisabled||!e.supportsFiber)t=!0;else{try{Ge=e.inject(t),He=e}catch(n){}t=!!e.checkDCE}}return t},e.isAlreadyRendering=function(){return!1},e.observeVisibleRects=function(t,e,n,r){if(!rt)throw Error(a(363));t=Qo(t,e);var i=ut(t,n,r).disconnect;return{disconnect:function(){i()}}},e.registerMutableSourceForHydration=function(t,e){var n=e._getVersion;n=n(e._source),null==t.mutableSourceEagerHydrationData?t.mutableSourceEagerHydrationData=[e,n]:t.mutableSourceEagerHydrationData.push(e,n)},e.runWithPriority=function(t,e){var n=Re;try{return Re=t,e()}finally{Re=n}},e.shouldError=function(){return null},e.shouldSuspend=function(){return!1},e.updateContainer=function(t,e,n,r){var i=e.current,o=Ia(),a=Ma(i);return n=ms(n),null===e.context?e.context=n:e.pendingContext=n,(e=Jn(o,a)).payload={element:t},null!==(r=void 0===r?null:r)&&(e.callback=r),null!==(t=tr(i,e,a))&&(Fa(t,i,a,o),er(t,i,a)),a},e}},7105:(t,e,n)=>{var r="object"==typeof n.g&&n.g&&n.g.Object===Object&&n.g;t.exports=r},7149:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Util=e.Transform=void 0;const r=n(4602);class i{constructor(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:[1,0,0,1,0,0];this.dirty=!1,this.m=t&&t.slice()||[1,0,0,1,0,0]}reset(){this.m[0]=1,this.m[1]=0,this.m[2]=0,this.m[3]=1,this.m[4]=0,this.m[5]=0}copy(){return new i(this.m)}copyInto(t){t.m[0]=this.m[0],t.m[1]=this.m[1],t.m[2]=this.m[2],t.m[3]=this.m[3],t.m[4]=this.m[4],t.m[5]=this.m[5]}point(t){const e=this.m;return{x:e[0]*t.x+e[2]*t.y+e[4],y:e[1]*t.x+e[3]*t.y+e[5]}}translate(t,e){return this.m[4]+=this.m[0]*t+this.m[2]*e,this.m[5]+=this.m[1]*t+this.m[3]*e,this}scale(t,e){return this.m[0]*=t,this.m[1]*=t,this.m[2]*=e,this.m[3]*=e,this}rotate(t){const e=Math.cos(t),n=Math.sin(t),r=this.m[0]*e+this.m[2]*n,i=this.m[1]*e+this.m[3]*n,o=this.m[0]*-n+this.m[2]*e,a=this.m[1]*-n+this.m[3]*e;return this.m[0]=r,this.m[1]=i,this.m[2]=o,this.m[3]=a,this}getTranslation(){return{x:this.m[4],y:this.m[5]}}skew(t,e){const n=this.m[0]+this.m[2]*e,r=this.m[1]+this.m[3]*e,i=this.m[2]+this.m[0]*t,o=this.m[3]+this.m[1]*t;return this.m[0]=n,this.m[1]=r,this.m[2]=i,this.m[3]=o,this}multiply(t){const e=this.m[0]*t.m[0]+this.m[2]*t.m[1],n=this.m[1]*t.m[0]+this.m[3]*t.m[1],r=this.m[0]*t.m[2]+this.m[2]*t.m[3],i=this.m[1]*t.m[2]+this.m[3]*t.m[3],o=this.m[0]*t.m[4]+this.m[2]*t.m[5]+this.m[4],a=this.m[1]*t.m[4]+this.m[3]*t.m[5]+this.m[5];return this.m[0]=e,this.m[1]=n,this.m[2]=r,this.m[3]=i,this.m[4]=o,this.m[5]=a,this}invert(){const t=1/(this.m[0]*this.m[3]-this.m[1]*this.m[2]),e=this.m[3]*t,n=-this.m[1]*t,r=-this.m[2]*t,i=this.m[0]*t,o=t*(this.m[2]*this.m[5]-this.m[3]*this.m[4]),a=t*(this.m[1]*this.m[4]-this.m[0]*this.m[5]);return this.m[0]=e,this.m[1]=n,this.m[2]=r,this.m[3]=i,this.m[4]=o,this.m[5]=a,this}getMatrix(){return this.m}decompose(){const t=this.m[0],n=this.m[1],r=this.m[2],i=this.m[3],o=t*i-n*r,a={x:this.m[4],y:this.m[5],rotation:0,scaleX:0,scaleY:0,skewX:0,skewY:0};if(0!=t||0!=n){const e=Math.sqrt(t*t+n*n);a.rotation=n>0?Math.acos(t/e):-Math.acos(t/e),a.scaleX=e,a.scaleY=o/e,a.skewX=(t*r+n*i)/o,a.skewY=0}else if(0!=r||0!=i){const e=Math.sqrt(r*r+i*i);a.rotation=Math.PI/2-(i>0?Math.acos(-r/e):-Math.acos(r/e)),a.scaleX=o/e,a.scaleY=e,a.skewX=0,a.skewY=(t*r+n*i)/o}return a.rotation=e.Util._getRotation(a.rotation),a}}e.Transform=i;const o=Math.PI/180,a=180/Math.PI,s="Konva error: ",l={aliceblue:[240,248,255],antiquewhite:[250,235,215],aqua:[0,255,255],aquamarine:[127,255,212],azure:[240,255,255],beige:[245,245,220],bisque:[255,228,196],black:[0,0,0],blanchedalmond:[255,235,205],blue:[0,0,255],blueviolet:[138,43,226],brown:[165,42,42],burlywood:[222,184,135],cadetblue:[95,158,160],chartreuse:[127,255,0],chocolate:[210,105,30],coral:[255,127,80],cornflowerblue:[100,149,237],cornsilk:[255,248,220],crimson:[220,20,60],cyan:[0,255,255],darkblue:[0,0,139],darkcyan:[0,139,139],darkgoldenrod:[184,132,11],darkgray:[169,169,169],darkgreen:[0,100,0],darkgrey:[169,169,169],darkkhaki:[189,183,107],darkmagenta:[139,0,139],darkolivegreen:[85,107,47],darkorange:[255,140,0],darkorchid:[153,50,204],darkred:[139,0,0],darksalmon:[233,150,122],darkseagreen:[143,188,143],darkslateblue:[72,61,139],darkslategray:[47,79,79],darkslategrey:[47,79,79],darkturquoise:[0,206,209],darkviolet:[148,0,211],deeppink:[255,20,147],deepskyblue:[0,191,255],dimgray:[105,105,105],dimgrey:[105,105,105],dodgerblue:[30,144,255],firebrick:[178,34,34],floralwhite:[255,255,240],forestgreen:[34,139,34],fuchsia:[255,0,255],gainsboro:[220,220,220],ghostwhite:[248,248,255],gold:[255,215,0],goldenrod:[218,165,32],gray:[128,128,128],green:[0,128,0],greenyellow:[173,255,47],grey:[128,128,128],honeydew:[240,255,240],hotpink:[255,105,180],indianred:[205,92,92],indigo:[75,0,130],ivory:[255,255,240],khaki:[240,230,140],lavender:[230,230,250],lavenderblush:[255,240,245],lawngreen:[124,252,0],lemonchiffon:[255,250,205],lightblue:[173,216,230],lightcoral:[240,128,128],lightcyan:[224,255,255],lightgoldenrodyellow:[250,250,210],lightgray:[211,211,211],lightgreen:[144,238,144],lightgrey:[211,211,211],lightpink:[255,182,193],lightsalmon:[255,160,122],lightseagreen:[32,178,170],lightskyblue:[135,206,250],lightslategray:[119,136,153],lightslategrey:[119,136,153],lightsteelblue:[176,196,222],lightyellow:[255,255,224],lime:[0,255,0],limegreen:[50,205,50],linen:[250,240,230],magenta:[255,0,255],maroon:[128,0,0],mediumaquamarine:[102,205,170],mediumblue:[0,0,205],mediumorchid:[186,85,211],mediumpurple:[147,112,219],mediumseagreen:[60,179,113],mediumslateblue:[123,104,238],mediumspringgreen:[0,250,154],mediumturquoise:[72,209,204],mediumvioletred:[199,21,133],midnightblue:[25,25,112],mintcream:[245,255,250],mistyrose:[255,228,225],moccasin:[255,228,181],navajowhite:[255,222,173],navy:[0,0,128],oldlace:[253,245,230],olive:[128,128,0],olivedrab:[107,142,35],orange:[255,165,0],orangered:[255,69,0],orchid:[218,112,214],palegoldenrod:[238,232,170],palegreen:[152,251,152],paleturquoise:[175,238,238],palevioletred:[219,112,147],papayawhip:[255,239,213],peachpuff:[255,218,185],peru:[205,133,63],pink:[255,192,203],plum:[221,160,203],powderblue:[176,224,230],purple:[128,0,128],rebeccapurple:[102,51,153],red:[255,0,0],rosybrown:[188,143,143],royalblue:[65,105,225],saddlebrown:[139,69,19],salmon:[250,128,114],sandybrown:[244,164,96],seagreen:[46,139,87],seashell:[255,245,238],sienna:[160,82,45],silver:[192,192,192],skyblue:[135,206,235],slateblue:[106,90,205],slategray:[119,128,144],slategrey:[119,128,144],snow:[255,255,250],springgreen:[0,255,127],steelblue:[70,130,180],tan:[210,180,140],teal:[0,128,128],thistle:[216,191,216],transparent:[255,255,255,0],tomato:[255,99,71],turquoise:[64,224,208],violet:[238,130,238],wheat:[245,222,179],white:[255,255,255],whitesmoke:[245,245,245],yellow:[255,255,0],yellowgreen:[154,205,5]},c=/rgb\((\d{1,3}),(\d{1,3}),(\d{1,3})\)/;let u=[];const d="undefined"!==typeof requestAnimationFrame&&requestAnimationFrame||function(t){setTimeout(t,60)};e.Util={_isElement:t=>!(!t||1!=t.nodeType),_isFunction:t=>!!(t&&t.constructor&&t.call&&t.apply),_isPlainObject:t=>!!t&&t.constructor===Object,_isArray:t=>"[object Array]"===Object.prototype.toString.call(t),_isNumber:t=>"[object Number]"===Object.prototype.toString.call(t)&&!isNaN(t)&&isFinite(t),_isString:t=>"[object String]"===Object.prototype.toString.call(t),_isBoolean:t=>"[object Boolean]"===Object.prototype.toString.call(t),isObject:t=>t instanceof Object,isValidSelector(t){if("string"!==typeof t)return!1;const e=t[0];return"#"===e||"."===e||e===e.toUpperCase()},_sign:t=>0===t||t>0?1:-1,requestAnimFrame(t){u.push(t),1===u.length&&d((function(){const t=u;u=[],t.forEach((function(t){t()}))}))},createCanvasElement(){const t=document.createElement("canvas");try{t.style=t.style||{}}catch(e){}return t},createImageElement:()=>document.createElement("img"),_isInDocument(t){for(;t=t.parentNode;)if(t==document)return!0;return!1},_urlToImage(t,n){const r=e.Util.createImageElement();r.onload=function(){n(r)},r.src=t},_rgbToHex:(t,e,n)=>((1<<24)+(t<<16)+(e<<8)+n).toString(16).slice(1),_hexToRgb(t){t=t.replace("#","");const e=parseInt(t,16);return{r:e>>16&255,g:e>>8&255,b:255&e}},getRandomColor(){let t=(16777215*Math.random()|0).toString(16);for(;t.length<6;)t="0"+t;return"#"+t},getRGB(t){let e;return t in l?(e=l[t],{r:e[0],g:e[1],b:e[2]}):"#"===t[0]?this._hexToRgb(t.substring(1)):"rgb("===t.substr(0,4)?(e=c.exec(t.replace(/ /g,"")),{r:parseInt(e[1],10),g:parseInt(e[2],10),b:parseInt(e[3],10)}):{r:0,g:0,b:0}},colorToRGBA:t=>(t=t||"black",e.Util._namedColorToRBA(t)||e.Util._hex3ColorToRGBA(t)||e.Util._hex4ColorToRGBA(t)||e.Util._hex6ColorToRGBA(t)||e.Util._hex8ColorToRGBA(t)||e.Util._rgbColorToRGBA(t)||e.Util._rgbaColorToRGBA(t)||e.Util._hslColorToRGBA(t)),_namedColorToRBA(t){const e=l[t.toLowerCase()];return e?{r:e[0],g:e[1],b:e[2],a:1}:null},_rgbColorToRGBA(t){if(0===t.indexOf("rgb(")){const e=(t=t.match(/rgb\(([^)]+)\)/)[1]).split(/ *, */).map(Number);return{r:e[0],g:e[1],b:e[2],a:1}}},_rgbaColorToRGBA(t){if(0===t.indexOf("rgba(")){const e=(t=t.match(/rgba\(([^)]+)\)/)[1]).split(/ *, */).map(((t,e)=>"%"===t.slice(-1)?3===e?parseInt(t)/100:parseInt(t)/100*255:Number(t)));return{r:e[0],g:e[1],b:e[2],a:e[3]}}},_hex8ColorToRGBA(t){if("#"===t[0]&&9===t.length)return{r:parseInt(t.slice(1,3),16),g:parseInt(t.slice(3,5),16),b:parseInt(t.slice(5,7),16),a:parseInt(t.slice(7,9),16)/255}},_hex6ColorToRGBA(t){if("#"===t[0]&&7===t.length)return{r:parseInt(t.slice(1,3),16),g:parseInt(t.slice(3,5),16),b:parseInt(t.slice(5,7),16),a:1}},_hex4ColorToRGBA(t){if("#"===t[0]&&5===t.length)return{r:parseInt(t[1]+t[1],16),g:parseInt(t[2]+t[2],16),b:parseInt(t[3]+t[3],16),a:parseInt(t[4]+t[4],16)/255}},_hex3ColorToRGBA(t){if("#"===t[0]&&4===t.length)return{r:parseInt(t[1]+t[1],16),g:parseInt(t[2]+t[2],16),b:parseInt(t[3]+t[3],16),a:1}},_hslColorToRGBA(t){if(/hsl\((\d+),\s*([\d.]+)%,\s*([\d.]+)%\)/g.test(t)){const[e,...n]=/hsl\((\d+),\s*([\d.]+)%,\s*([\d.]+)%\)/g.exec(t),r=Number(n[0])/360,i=Number(n[1])/100,o=Number(n[2])/100;let a,s,l;if(0===i)return l=255*o,{r:Math.round(l),g:Math.round(l),b:Math.round(l),a:1};a=o<.5?o*(1+i):o+i-o*i;const c=2*o-a,u=[0,0,0];for(let t=0;t<3;t++)s=r+1/3*-(t-1),s<0&&s++,s>1&&s--,l=6*s<1?c+6*(a-c)*s:2*s<1?a:3*s<2?c+(a-c)*(2/3-s)*6:c,u[t]=255*l;return{r:Math.round(u[0]),g:Math.round(u[1]),b:Math.round(u[2]),a:1}}},haveIntersection:(t,e)=>!(e.x>t.x+t.width||e.x+e.width<t.x||e.y>t.y+t.height||e.y+e.height<t.y),cloneObject(t){const e={};for(const n in t)this._isPlainObject(t[n])?e[n]=this.cloneObject(t[n]):this._isArray(t[n])?e[n]=this.cloneArray(t[n]):e[n]=t[n];return e},cloneArray:t=>t.slice(0),degToRad:t=>t*o,radToDeg:t=>t*a,_degToRad:t=>(e.Util.warn("Util._degToRad is removed. Please use public Util.degToRad instead."),e.Util.degToRad(t)),_radToDeg:t=>(e.Util.warn("Util._radToDeg is removed. Please use public Util.radToDeg instead."),e.Util.radToDeg(t)),_getRotation:t=>r.Konva.angleDeg?e.Util.radToDeg(t):t,_capitalize:t=>t.charAt(0).toUpperCase()+t.slice(1),throw(t){throw new Error(s+t)},error(t){console.error(s+t)},warn(t){r.Konva.showWarnings&&console.warn("Konva warning: "+t)},each(t,e){for(const n in t)e(n,t[n])},_inRange:(t,e,n)=>e<=t&&t<n,_getProjectionToSegment(t,e,n,r,i,o){let a,s,l;const c=(t-n)*(t-n)+(e-r)*(e-r);if(0==c)a=t,s=e,l=(i-n)*(i-n)+(o-r)*(o-r);else{const u=((i-t)*(n-t)+(o-e)*(r-e))/c;u<0?(a=t,s=e,l=(t-i)*(t-i)+(e-o)*(e-o)):u>1?(a=n,s=r,l=(n-i)*(n-i)+(r-o)*(r-o)):(a=t+u*(n-t),s=e+u*(r-e),l=(a-i)*(a-i)+(s-o)*(s-o))}return[a,s,l]},_getProjectionToLine(t,n,r){const i=e.Util.cloneObject(t);let o=Number.MAX_VALUE;return n.forEach((function(a,s){if(!r&&s===n.length-1)return;const l=n[(s+1)%n.length],c=e.Util._getProjectionToSegment(a.x,a.y,l.x,l.y,t.x,t.y),u=c[0],d=c[1],h=c[2];h<o&&(i.x=u,i.y=d,o=h)})),i},_prepareArrayForTween(t,n,r){const i=[],o=[];if(t.length>n.length){const e=n;n=t,t=e}for(let e=0;e<t.length;e+=2)i.push({x:t[e],y:t[e+1]});for(let e=0;e<n.length;e+=2)o.push({x:n[e],y:n[e+1]});const a=[];return o.forEach((function(t){const n=e.Util._getProjectionToLine(t,i,r);a.push(n.x),a.push(n.y)})),a},_prepareToStringify(t){let n;t.visitedByCircularReferenceRemoval=!0;for(const r in t)if(t.hasOwnProperty(r)&&t[r]&&"object"==typeof t[r])if(n=Object.getOwnPropertyDescriptor(t,r),t[r].visitedByCircularReferenceRemoval||e.Util._isElement(t[r])){if(!n.configurable)return null;delete t[r]}else if(null===e.Util._prepareToStringify(t[r])){if(!n.configurable)return null;delete t[r]}return delete t.visitedByCircularReferenceRemoval,t},_assign(t,e){for(const n in e)t[n]=e[n];return t},_getFirstPointerId:t=>t.touches?t.changedTouches[0].identifier:t.pointerId||999,releaseCanvas(){if(r.Konva.releaseCanvasOnDestroy){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];e.forEach((t=>{t.width=0,t.height=0}))}},drawRoundedRectPath(t,e,n,r){let i=0,o=0,a=0,s=0;"number"===typeof r?i=o=a=s=Math.min(r,e/2,n/2):(i=Math.min(r[0]||0,e/2,n/2),o=Math.min(r[1]||0,e/2,n/2),s=Math.min(r[2]||0,e/2,n/2),a=Math.min(r[3]||0,e/2,n/2)),t.moveTo(i,0),t.lineTo(e-o,0),t.arc(e-o,o,o,3*Math.PI/2,0,!1),t.lineTo(e,n-s),t.arc(e-s,n-s,s,0,Math.PI/2,!1),t.lineTo(a,n),t.arc(a,n-a,a,Math.PI/2,Math.PI,!1),t.lineTo(0,i),t.arc(i,i,i,Math.PI,3*Math.PI/2,!1)}}},7205:(t,e)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Invert=void 0;e.Invert=function(t){const e=t.data,n=e.length;for(let r=0;r<n;r+=4)e[r]=255-e[r],e[r+1]=255-e[r+1],e[r+2]=255-e[r+2]}},7234:(t,e)=>{"use strict";function n(t,e){var n=t.length;t.push(e);t:for(;0<n;){var r=n-1>>>1,i=t[r];if(!(0<o(i,e)))break t;t[r]=e,t[n]=i,n=r}}function r(t){return 0===t.length?null:t[0]}function i(t){if(0===t.length)return null;var e=t[0],n=t.pop();if(n!==e){t[0]=n;t:for(var r=0,i=t.length,a=i>>>1;r<a;){var s=2*(r+1)-1,l=t[s],c=s+1,u=t[c];if(0>o(l,n))c<i&&0>o(u,l)?(t[r]=u,t[c]=n,r=c):(t[r]=l,t[s]=n,r=s);else{if(!(c<i&&0>o(u,n)))break t;t[r]=u,t[c]=n,r=c}}}return e}function o(t,e){var n=t.sortIndex-e.sortIndex;return 0!==n?n:t.id-e.id}if("object"===typeof performance&&"function"===typeof performance.now){var a=performance;e.unstable_now=function(){return a.now()}}else{var s=Date,l=s.now();e.unstable_now=function(){return s.now()-l}}var c=[],u=[],d=1,h=null,f=3,p=!1,g=!1,m=!1,y="function"===typeof setTimeout?setTimeout:null,b="function"===typeof clearTimeout?clearTimeout:null,v="undefined"!==typeof setImmediate?setImmediate:null;function _(t){for(var e=r(u);null!==e;){if(null===e.callback)i(u);else{if(!(e.startTime<=t))break;i(u),e.sortIndex=e.expirationTime,n(c,e)}e=r(u)}}function w(t){if(m=!1,_(t),!g)if(null!==r(c))g=!0,D(x);else{var e=r(u);null!==e&&R(w,e.startTime-t)}}function x(t,n){g=!1,m&&(m=!1,b(T),T=-1),p=!0;var o=f;try{for(_(n),h=r(c);null!==h&&(!(h.expirationTime>n)||t&&!A());){var a=h.callback;if("function"===typeof a){h.callback=null,f=h.priorityLevel;var s=a(h.expirationTime<=n);n=e.unstable_now(),"function"===typeof s?h.callback=s:h===r(c)&&i(c),_(n)}else i(c);h=r(c)}if(null!==h)var l=!0;else{var d=r(u);null!==d&&R(w,d.startTime-n),l=!1}return l}finally{h=null,f=o,p=!1}}"undefined"!==typeof navigator&&void 0!==navigator.scheduling&&void 0!==navigator.scheduling.isInputPending&&navigator.scheduling.isInputPending.bind(navigator.scheduling);var S,k=!1,C=null,T=-1,P=5,E=-1;function A(){return!(e.unstable_now()-E<P)}function I(){if(null!==C){var t=e.unstable_now();E=t;var n=!0;try{n=C(!0,t)}finally{n?S():(k=!1,C=null)}}else k=!1}if("function"===typeof v)S=function(){v(I)};else if("undefined"!==typeof MessageChannel){var M=new MessageChannel,F=M.port2;M.port1.onmessage=I,S=function(){F.postMessage(null)}}else S=function(){y(I,0)};function D(t){C=t,k||(k=!0,S())}function R(t,n){T=y((function(){t(e.unstable_now())}),n)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(t){t.callback=null},e.unstable_continueExecution=function(){g||p||(g=!0,D(x))},e.unstable_forceFrameRate=function(t){0>t||125<t?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):P=0<t?Math.floor(1e3/t):5},e.unstable_getCurrentPriorityLevel=function(){return f},e.unstable_getFirstCallbackNode=function(){return r(c)},e.unstable_next=function(t){switch(f){case 1:case 2:case 3:var e=3;break;default:e=f}var n=f;f=e;try{return t()}finally{f=n}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(t,e){switch(t){case 1:case 2:case 3:case 4:case 5:break;default:t=3}var n=f;f=t;try{return e()}finally{f=n}},e.unstable_scheduleCallback=function(t,i,o){var a=e.unstable_now();switch("object"===typeof o&&null!==o?o="number"===typeof(o=o.delay)&&0<o?a+o:a:o=a,t){case 1:var s=-1;break;case 2:s=250;break;case 5:s=1073741823;break;case 4:s=1e4;break;default:s=5e3}return t={id:d++,callback:i,priorityLevel:t,startTime:o,expirationTime:s=o+s,sortIndex:-1},o>a?(t.sortIndex=o,n(u,t),null===r(c)&&t===r(u)&&(m?(b(T),T=-1):m=!0,R(w,o-a))):(t.sortIndex=s,n(c,t),g||p||(g=!0,D(x))),t},e.unstable_shouldYield=A,e.unstable_wrapCallback=function(t){var e=f;return function(){var n=f;f=e;try{return t.apply(this,arguments)}finally{f=n}}}},7264:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Posterize=void 0;const r=n(1751),i=n(1189),o=n(9910);e.Posterize=function(t){const e=Math.round(254*this.levels())+1,n=t.data,r=n.length,i=255/e;for(let o=0;o<r;o+=1)n[o]=Math.floor(n[o]/i)*i},r.Factory.addGetterSetter(i.Node,"levels",.5,(0,o.getNumberValidator)(),r.Factory.afterSetFilter)},7289:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Path=void 0;const r=n(1751),i=n(3304),o=n(4602),a=n(5941);class s extends i.Shape{constructor(t){super(t),this.dataArray=[],this.pathLength=0,this._readDataAttribute(),this.on("dataChange.konva",(function(){this._readDataAttribute()}))}_readDataAttribute(){this.dataArray=s.parsePathData(this.data()),this.pathLength=s.getPathLength(this.dataArray)}_sceneFunc(t){const e=this.dataArray;t.beginPath();let n=!1;for(let p=0;p<e.length;p++){const g=e[p].command,m=e[p].points;switch(g){case"L":t.lineTo(m[0],m[1]);break;case"M":t.moveTo(m[0],m[1]);break;case"C":t.bezierCurveTo(m[0],m[1],m[2],m[3],m[4],m[5]);break;case"Q":t.quadraticCurveTo(m[0],m[1],m[2],m[3]);break;case"A":var r=m[0],i=m[1],o=m[2],a=m[3],s=m[4],l=m[5],c=m[6],u=m[7],d=o>a?o:a,h=o>a?1:o/a,f=o>a?a/o:1;t.translate(r,i),t.rotate(c),t.scale(h,f),t.arc(0,0,d,s,s+l,1-u),t.scale(1/h,1/f),t.rotate(-c),t.translate(-r,-i);break;case"z":n=!0,t.closePath()}}n||this.hasFill()?t.fillStrokeShape(this):t.strokeShape(this)}getSelfRect(){let t=[];this.dataArray.forEach((function(e){if("A"===e.command){const n=e.points[4],r=e.points[5],i=e.points[4]+r;let o=Math.PI/180;if(Math.abs(n-i)<o&&(o=Math.abs(n-i)),r<0)for(let a=n-o;a>i;a-=o){const n=s.getPointOnEllipticalArc(e.points[0],e.points[1],e.points[2],e.points[3],a,0);t.push(n.x,n.y)}else for(let a=n+o;a<i;a+=o){const n=s.getPointOnEllipticalArc(e.points[0],e.points[1],e.points[2],e.points[3],a,0);t.push(n.x,n.y)}}else if("C"===e.command)for(let n=0;n<=1;n+=.01){const r=s.getPointOnCubicBezier(n,e.start.x,e.start.y,e.points[0],e.points[1],e.points[2],e.points[3],e.points[4],e.points[5]);t.push(r.x,r.y)}else t=t.concat(e.points)}));let e,n,r=t[0],i=t[0],o=t[1],a=t[1];for(let s=0;s<t.length/2;s++)e=t[2*s],n=t[2*s+1],isNaN(e)||(r=Math.min(r,e),i=Math.max(i,e)),isNaN(n)||(o=Math.min(o,n),a=Math.max(a,n));return{x:r,y:o,width:i-r,height:a-o}}getLength(){return this.pathLength}getPointAtLength(t){return s.getPointAtLengthOfDataArray(t,this.dataArray)}static getLineLength(t,e,n,r){return Math.sqrt((n-t)*(n-t)+(r-e)*(r-e))}static getPathLength(t){let e=0;for(let n=0;n<t.length;++n)e+=t[n].pathLength;return e}static getPointAtLengthOfDataArray(t,e){let n,r=0,i=e.length;if(!i)return null;for(;r<i&&t>e[r].pathLength;)t-=e[r].pathLength,++r;if(r===i)return n=e[r-1].points.slice(-2),{x:n[0],y:n[1]};if(t<.01)return n=e[r].points.slice(0,2),{x:n[0],y:n[1]};const o=e[r],l=o.points;switch(o.command){case"L":return s.getPointOnLine(t,o.start.x,o.start.y,l[0],l[1]);case"C":return s.getPointOnCubicBezier((0,a.t2length)(t,s.getPathLength(e),(t=>(0,a.getCubicArcLength)([o.start.x,l[0],l[2],l[4]],[o.start.y,l[1],l[3],l[5]],t))),o.start.x,o.start.y,l[0],l[1],l[2],l[3],l[4],l[5]);case"Q":return s.getPointOnQuadraticBezier((0,a.t2length)(t,s.getPathLength(e),(t=>(0,a.getQuadraticArcLength)([o.start.x,l[0],l[2]],[o.start.y,l[1],l[3]],t))),o.start.x,o.start.y,l[0],l[1],l[2],l[3]);case"A":var c=l[0],u=l[1],d=l[2],h=l[3],f=l[4],p=l[5],g=l[6];return f+=p*t/o.pathLength,s.getPointOnEllipticalArc(c,u,d,h,f,g)}return null}static getPointOnLine(t,e,n,r,i,o,a){o=null!==o&&void 0!==o?o:e,a=null!==a&&void 0!==a?a:n;const s=this.getLineLength(e,n,r,i);if(s<1e-10)return{x:e,y:n};if(r===e)return{x:o,y:a+(i>n?t:-t)};const l=(i-n)/(r-e),c=Math.sqrt(t*t/(1+l*l))*(r<e?-1:1),u=l*c;if(Math.abs(a-n-l*(o-e))<1e-10)return{x:o+c,y:a+u};const d=((o-e)*(r-e)+(a-n)*(i-n))/(s*s),h=e+d*(r-e),f=n+d*(i-n),p=this.getLineLength(o,a,h,f),g=Math.sqrt(t*t-p*p),m=Math.sqrt(g*g/(1+l*l))*(r<e?-1:1);return{x:h+m,y:f+l*m}}static getPointOnCubicBezier(t,e,n,r,i,o,a,s,l){function c(t){return t*t*t}function u(t){return 3*t*t*(1-t)}function d(t){return 3*t*(1-t)*(1-t)}function h(t){return(1-t)*(1-t)*(1-t)}return{x:s*c(t)+o*u(t)+r*d(t)+e*h(t),y:l*c(t)+a*u(t)+i*d(t)+n*h(t)}}static getPointOnQuadraticBezier(t,e,n,r,i,o,a){function s(t){return t*t}function l(t){return 2*t*(1-t)}function c(t){return(1-t)*(1-t)}return{x:o*s(t)+r*l(t)+e*c(t),y:a*s(t)+i*l(t)+n*c(t)}}static getPointOnEllipticalArc(t,e,n,r,i,o){const a=Math.cos(o),s=Math.sin(o),l=n*Math.cos(i),c=r*Math.sin(i);return{x:t+(l*a-c*s),y:e+(l*s+c*a)}}static parsePathData(t){if(!t)return[];let e=t;const n=["m","M","l","L","v","V","h","H","z","Z","c","C","q","Q","t","T","s","S","a","A"];e=e.replace(new RegExp(" ","g"),",");for(var r=0;r<n.length;r++)e=e.replace(new RegExp(n[r],"g"),"|"+n[r]);const i=e.split("|"),o=[],a=[];let s=0,l=0;const c=/([-+]?((\d+\.\d+)|((\d+)|(\.\d+)))(?:e[-+]?\d+)?)/gi;let u;for(r=1;r<i.length;r++){let t=i[r],e=t.charAt(0);for(t=t.slice(1),a.length=0;u=c.exec(t);)a.push(u[0]);const n=[];for(let r=0,i=a.length;r<i;r++){if("00"===a[r]){n.push(0,0);continue}const t=parseFloat(a[r]);isNaN(t)?n.push(0):n.push(t)}for(;n.length>0&&!isNaN(n[0]);){let t="",r=[];const i=s,a=l;var d,h,f,p,g,m,y,b,v,_;switch(e){case"l":s+=n.shift(),l+=n.shift(),t="L",r.push(s,l);break;case"L":s=n.shift(),l=n.shift(),r.push(s,l);break;case"m":var w=n.shift(),x=n.shift();if(s+=w,l+=x,t="M",o.length>2&&"z"===o[o.length-1].command)for(let t=o.length-2;t>=0;t--)if("M"===o[t].command){s=o[t].points[0]+w,l=o[t].points[1]+x;break}r.push(s,l),e="l";break;case"M":s=n.shift(),l=n.shift(),t="M",r.push(s,l),e="L";break;case"h":s+=n.shift(),t="L",r.push(s,l);break;case"H":s=n.shift(),t="L",r.push(s,l);break;case"v":l+=n.shift(),t="L",r.push(s,l);break;case"V":l=n.shift(),t="L",r.push(s,l);break;case"C":r.push(n.shift(),n.shift(),n.shift(),n.shift()),s=n.shift(),l=n.shift(),r.push(s,l);break;case"c":r.push(s+n.shift(),l+n.shift(),s+n.shift(),l+n.shift()),s+=n.shift(),l+=n.shift(),t="C",r.push(s,l);break;case"S":h=s,f=l,"C"===(d=o[o.length-1]).command&&(h=s+(s-d.points[2]),f=l+(l-d.points[3])),r.push(h,f,n.shift(),n.shift()),s=n.shift(),l=n.shift(),t="C",r.push(s,l);break;case"s":h=s,f=l,"C"===(d=o[o.length-1]).command&&(h=s+(s-d.points[2]),f=l+(l-d.points[3])),r.push(h,f,s+n.shift(),l+n.shift()),s+=n.shift(),l+=n.shift(),t="C",r.push(s,l);break;case"Q":r.push(n.shift(),n.shift()),s=n.shift(),l=n.shift(),r.push(s,l);break;case"q":r.push(s+n.shift(),l+n.shift()),s+=n.shift(),l+=n.shift(),t="Q",r.push(s,l);break;case"T":h=s,f=l,"Q"===(d=o[o.length-1]).command&&(h=s+(s-d.points[0]),f=l+(l-d.points[1])),s=n.shift(),l=n.shift(),t="Q",r.push(h,f,s,l);break;case"t":h=s,f=l,"Q"===(d=o[o.length-1]).command&&(h=s+(s-d.points[0]),f=l+(l-d.points[1])),s+=n.shift(),l+=n.shift(),t="Q",r.push(h,f,s,l);break;case"A":p=n.shift(),g=n.shift(),m=n.shift(),y=n.shift(),b=n.shift(),v=s,_=l,s=n.shift(),l=n.shift(),t="A",r=this.convertEndpointToCenterParameterization(v,_,s,l,y,b,p,g,m);break;case"a":p=n.shift(),g=n.shift(),m=n.shift(),y=n.shift(),b=n.shift(),v=s,_=l,s+=n.shift(),l+=n.shift(),t="A",r=this.convertEndpointToCenterParameterization(v,_,s,l,y,b,p,g,m)}o.push({command:t||e,points:r,start:{x:i,y:a},pathLength:this.calcLength(i,a,t||e,r)})}"z"!==e&&"Z"!==e||o.push({command:"z",points:[],start:void 0,pathLength:0})}return o}static calcLength(t,e,n,r){let i,o,l,c;const u=s;switch(n){case"L":return u.getLineLength(t,e,r[0],r[1]);case"C":return(0,a.getCubicArcLength)([t,r[0],r[2],r[4]],[e,r[1],r[3],r[5]],1);case"Q":return(0,a.getQuadraticArcLength)([t,r[0],r[2]],[e,r[1],r[3]],1);case"A":i=0;var d=r[4],h=r[5],f=r[4]+h,p=Math.PI/180;if(Math.abs(d-f)<p&&(p=Math.abs(d-f)),o=u.getPointOnEllipticalArc(r[0],r[1],r[2],r[3],d,0),h<0)for(c=d-p;c>f;c-=p)l=u.getPointOnEllipticalArc(r[0],r[1],r[2],r[3],c,0),i+=u.getLineLength(o.x,o.y,l.x,l.y),o=l;else for(c=d+p;c<f;c+=p)l=u.getPointOnEllipticalArc(r[0],r[1],r[2],r[3],c,0),i+=u.getLineLength(o.x,o.y,l.x,l.y),o=l;return l=u.getPointOnEllipticalArc(r[0],r[1],r[2],r[3],f,0),i+=u.getLineLength(o.x,o.y,l.x,l.y),i}return 0}static convertEndpointToCenterParameterization(t,e,n,r,i,o,a,s,l){const c=l*(Math.PI/180),u=Math.cos(c)*(t-n)/2+Math.sin(c)*(e-r)/2,d=-1*Math.sin(c)*(t-n)/2+Math.cos(c)*(e-r)/2,h=u*u/(a*a)+d*d/(s*s);h>1&&(a*=Math.sqrt(h),s*=Math.sqrt(h));let f=Math.sqrt((a*a*(s*s)-a*a*(d*d)-s*s*(u*u))/(a*a*(d*d)+s*s*(u*u)));i===o&&(f*=-1),isNaN(f)&&(f=0);const p=f*a*d/s,g=f*-s*u/a,m=(t+n)/2+Math.cos(c)*p-Math.sin(c)*g,y=(e+r)/2+Math.sin(c)*p+Math.cos(c)*g,b=function(t){return Math.sqrt(t[0]*t[0]+t[1]*t[1])},v=function(t,e){return(t[0]*e[0]+t[1]*e[1])/(b(t)*b(e))},_=function(t,e){return(t[0]*e[1]<t[1]*e[0]?-1:1)*Math.acos(v(t,e))},w=_([1,0],[(u-p)/a,(d-g)/s]),x=[(u-p)/a,(d-g)/s],S=[(-1*u-p)/a,(-1*d-g)/s];let k=_(x,S);return v(x,S)<=-1&&(k=Math.PI),v(x,S)>=1&&(k=0),0===o&&k>0&&(k-=2*Math.PI),1===o&&k<0&&(k+=2*Math.PI),[m,y,a,s,w,k,c,o]}}e.Path=s,s.prototype.className="Path",s.prototype._attrsAffectingSize=["data"],(0,o._registerNode)(s),r.Factory.addGetterSetter(s,"data")},7302:(t,e)=>{"use strict";e.DefaultEventPriority=16,e.LegacyRoot=0},7739:(t,e,n)=>{"use strict";var r=n(2123),i="function"===typeof Symbol&&Symbol.for,o=i?Symbol.for("react.element"):60103,a=i?Symbol.for("react.portal"):60106,s=i?Symbol.for("react.fragment"):60107,l=i?Symbol.for("react.strict_mode"):60108,c=i?Symbol.for("react.profiler"):60114,u=i?Symbol.for("react.provider"):60109,d=i?Symbol.for("react.context"):60110,h=i?Symbol.for("react.forward_ref"):60112,f=i?Symbol.for("react.suspense"):60113,p=i?Symbol.for("react.memo"):60115,g=i?Symbol.for("react.lazy"):60116,m="function"===typeof Symbol&&Symbol.iterator;function y(t){for(var e="https://reactjs.org/docs/error-decoder.html?invariant="+t,n=1;n<arguments.length;n++)e+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+t+"; visit "+e+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var b={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},v={};function _(t,e,n){this.props=t,this.context=e,this.refs=v,this.updater=n||b}function w(){}function x(t,e,n){this.props=t,this.context=e,this.refs=v,this.updater=n||b}_.prototype.isReactComponent={},_.prototype.setState=function(t,e){if("object"!==typeof t&&"function"!==typeof t&&null!=t)throw Error(y(85));this.updater.enqueueSetState(this,t,e,"setState")},_.prototype.forceUpdate=function(t){this.updater.enqueueForceUpdate(this,t,"forceUpdate")},w.prototype=_.prototype;var S=x.prototype=new w;S.constructor=x,r(S,_.prototype),S.isPureReactComponent=!0;var k={current:null},C=Object.prototype.hasOwnProperty,T={key:!0,ref:!0,__self:!0,__source:!0};function P(t,e,n){var r,i={},a=null,s=null;if(null!=e)for(r in void 0!==e.ref&&(s=e.ref),void 0!==e.key&&(a=""+e.key),e)C.call(e,r)&&!T.hasOwnProperty(r)&&(i[r]=e[r]);var l=arguments.length-2;if(1===l)i.children=n;else if(1<l){for(var c=Array(l),u=0;u<l;u++)c[u]=arguments[u+2];i.children=c}if(t&&t.defaultProps)for(r in l=t.defaultProps)void 0===i[r]&&(i[r]=l[r]);return{$$typeof:o,type:t,key:a,ref:s,props:i,_owner:k.current}}function E(t){return"object"===typeof t&&null!==t&&t.$$typeof===o}var A=/\/+/g,I=[];function M(t,e,n,r){if(I.length){var i=I.pop();return i.result=t,i.keyPrefix=e,i.func=n,i.context=r,i.count=0,i}return{result:t,keyPrefix:e,func:n,context:r,count:0}}function F(t){t.result=null,t.keyPrefix=null,t.func=null,t.context=null,t.count=0,10>I.length&&I.push(t)}function D(t,e,n,r){var i=typeof t;"undefined"!==i&&"boolean"!==i||(t=null);var s=!1;if(null===t)s=!0;else switch(i){case"string":case"number":s=!0;break;case"object":switch(t.$$typeof){case o:case a:s=!0}}if(s)return n(r,t,""===e?"."+O(t,0):e),1;if(s=0,e=""===e?".":e+":",Array.isArray(t))for(var l=0;l<t.length;l++){var c=e+O(i=t[l],l);s+=D(i,c,n,r)}else if(null===t||"object"!==typeof t?c=null:c="function"===typeof(c=m&&t[m]||t["@@iterator"])?c:null,"function"===typeof c)for(t=c.call(t),l=0;!(i=t.next()).done;)s+=D(i=i.value,c=e+O(i,l++),n,r);else if("object"===i)throw n=""+t,Error(y(31,"[object Object]"===n?"object with keys {"+Object.keys(t).join(", ")+"}":n,""));return s}function R(t,e,n){return null==t?0:D(t,"",e,n)}function O(t,e){return"object"===typeof t&&null!==t&&null!=t.key?function(t){var e={"=":"=0",":":"=2"};return"$"+(""+t).replace(/[=:]/g,(function(t){return e[t]}))}(t.key):e.toString(36)}function N(t,e){t.func.call(t.context,e,t.count++)}function L(t,e,n){var r=t.result,i=t.keyPrefix;t=t.func.call(t.context,e,t.count++),Array.isArray(t)?B(t,r,n,(function(t){return t})):null!=t&&(E(t)&&(t=function(t,e){return{$$typeof:o,type:t.type,key:e,ref:t.ref,props:t.props,_owner:t._owner}}(t,i+(!t.key||e&&e.key===t.key?"":(""+t.key).replace(A,"$&/")+"/")+n)),r.push(t))}function B(t,e,n,r,i){var o="";null!=n&&(o=(""+n).replace(A,"$&/")+"/"),R(t,L,e=M(e,o,r,i)),F(e)}var z={current:null};function j(){var t=z.current;if(null===t)throw Error(y(321));return t}var U={ReactCurrentDispatcher:z,ReactCurrentBatchConfig:{suspense:null},ReactCurrentOwner:k,IsSomeRendererActing:{current:!1},assign:r};e.Children={map:function(t,e,n){if(null==t)return t;var r=[];return B(t,r,null,e,n),r},forEach:function(t,e,n){if(null==t)return t;R(t,N,e=M(null,null,e,n)),F(e)},count:function(t){return R(t,(function(){return null}),null)},toArray:function(t){var e=[];return B(t,e,null,(function(t){return t})),e},only:function(t){if(!E(t))throw Error(y(143));return t}},e.Component=_,e.Fragment=s,e.Profiler=c,e.PureComponent=x,e.StrictMode=l,e.Suspense=f,e.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=U,e.cloneElement=function(t,e,n){if(null===t||void 0===t)throw Error(y(267,t));var i=r({},t.props),a=t.key,s=t.ref,l=t._owner;if(null!=e){if(void 0!==e.ref&&(s=e.ref,l=k.current),void 0!==e.key&&(a=""+e.key),t.type&&t.type.defaultProps)var c=t.type.defaultProps;for(u in e)C.call(e,u)&&!T.hasOwnProperty(u)&&(i[u]=void 0===e[u]&&void 0!==c?c[u]:e[u])}var u=arguments.length-2;if(1===u)i.children=n;else if(1<u){c=Array(u);for(var d=0;d<u;d++)c[d]=arguments[d+2];i.children=c}return{$$typeof:o,type:t.type,key:a,ref:s,props:i,_owner:l}},e.createContext=function(t,e){return void 0===e&&(e=null),(t={$$typeof:d,_calculateChangedBits:e,_currentValue:t,_currentValue2:t,_threadCount:0,Provider:null,Consumer:null}).Provider={$$typeof:u,_context:t},t.Consumer=t},e.createElement=P,e.createFactory=function(t){var e=P.bind(null,t);return e.type=t,e},e.createRef=function(){return{current:null}},e.forwardRef=function(t){return{$$typeof:h,render:t}},e.isValidElement=E,e.lazy=function(t){return{$$typeof:g,_ctor:t,_status:-1,_result:null}},e.memo=function(t,e){return{$$typeof:p,type:t,compare:void 0===e?null:e}},e.useCallback=function(t,e){return j().useCallback(t,e)},e.useContext=function(t,e){return j().useContext(t,e)},e.useDebugValue=function(){},e.useEffect=function(t,e){return j().useEffect(t,e)},e.useImperativeHandle=function(t,e,n){return j().useImperativeHandle(t,e,n)},e.useLayoutEffect=function(t,e){return j().useLayoutEffect(t,e)},e.useMemo=function(t,e){return j().useMemo(t,e)},e.useReducer=function(t,e,n){return j().useReducer(t,e,n)},e.useRef=function(t){return j().useRef(t)},e.useState=function(t){return j().useState(t)},e.version="16.14.0"},7950:(t,e,n)=>{"use strict";!function t(){if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(t)}catch(e){console.error(e)}}(),t.exports=n(2730)},7980:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.RegularPolygon=void 0;const r=n(1751),i=n(3304),o=n(9910),a=n(4602);class s extends i.Shape{_sceneFunc(t){const e=this._getPoints();t.beginPath(),t.moveTo(e[0].x,e[0].y);for(let n=1;n<e.length;n++)t.lineTo(e[n].x,e[n].y);t.closePath(),t.fillStrokeShape(this)}_getPoints(){const t=this.attrs.sides,e=this.attrs.radius||0,n=[];for(let r=0;r<t;r++)n.push({x:e*Math.sin(2*r*Math.PI/t),y:-1*e*Math.cos(2*r*Math.PI/t)});return n}getSelfRect(){const t=this._getPoints();let e=t[0].x,n=t[0].y,r=t[0].x,i=t[0].y;return t.forEach((t=>{e=Math.min(e,t.x),n=Math.max(n,t.x),r=Math.min(r,t.y),i=Math.max(i,t.y)})),{x:e,y:r,width:n-e,height:i-r}}getWidth(){return 2*this.radius()}getHeight(){return 2*this.radius()}setWidth(t){this.radius(t/2)}setHeight(t){this.radius(t/2)}}e.RegularPolygon=s,s.prototype.className="RegularPolygon",s.prototype._centroid=!0,s.prototype._attrsAffectingSize=["radius"],(0,a._registerNode)(s),r.Factory.addGetterSetter(s,"radius",0,(0,o.getNumberValidator)()),r.Factory.addGetterSetter(s,"sides",0,(0,o.getNumberValidator)())},8019:(t,e)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Sepia=void 0;e.Sepia=function(t){const e=t.data,n=e.length;for(let r=0;r<n;r+=4){const t=e[r+0],n=e[r+1],i=e[r+2];e[r+0]=Math.min(255,.393*t+.769*n+.189*i),e[r+1]=Math.min(255,.349*t+.686*n+.168*i),e[r+2]=Math.min(255,.272*t+.534*n+.131*i)}}},8065:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Konva=void 0;const r=n(4602),i=n(7149),o=n(1189),a=n(4598),s=n(4367),l=n(1416),c=n(3994),u=n(6338),d=n(8727),h=n(3304),f=n(3243),p=n(5242),g=n(3354),m=n(589);e.Konva=i.Util._assign(r.Konva,{Util:i.Util,Transform:i.Transform,Node:o.Node,Container:a.Container,Stage:s.Stage,stages:s.stages,Layer:l.Layer,FastLayer:c.FastLayer,Group:u.Group,DD:d.DD,Shape:h.Shape,shapes:h.shapes,Animation:f.Animation,Tween:p.Tween,Easings:p.Easings,Context:g.Context,Canvas:m.Canvas}),e.default=e.Konva},8098:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Brighten=void 0;const r=n(1751),i=n(1189),o=n(9910);e.Brighten=function(t){const e=255*this.brightness(),n=t.data,r=n.length;for(let i=0;i<r;i+=4)n[i]+=e,n[i+1]+=e,n[i+2]+=e},r.Factory.addGetterSetter(i.Node,"brightness",0,(0,o.getNumberValidator)(),r.Factory.afterSetFilter)},8332:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Kaleidoscope=void 0;const r=n(1751),i=n(1189),o=n(7149),a=n(9910);e.Kaleidoscope=function(t){const e=t.width,n=t.height;let r,i,a,s,l,c,u,d,h,f,p=Math.round(this.kaleidoscopePower());const g=Math.round(this.kaleidoscopeAngle()),m=Math.floor(e*(g%360)/360);if(p<1)return;const y=o.Util.createCanvasElement();y.width=e,y.height=n;const b=y.getContext("2d").getImageData(0,0,e,n);o.Util.releaseCanvas(y),function(t,e,n){const r=t.data,i=e.data,o=t.width,a=t.height,s=n.polarCenterX||o/2,l=n.polarCenterY||a/2;let c=Math.sqrt(s*s+l*l),u=o-s,d=a-l;const h=Math.sqrt(u*u+d*d);c=h>c?h:c;const f=a,p=o,g=360/p*Math.PI/180;for(let m=0;m<p;m+=1){const t=Math.sin(m*g),e=Math.cos(m*g);for(let n=0;n<f;n+=1){u=Math.floor(s+c*n/f*e),d=Math.floor(l+c*n/f*t);let a=4*(d*o+u);const h=r[a+0],p=r[a+1],g=r[a+2],y=r[a+3];a=4*(m+n*o),i[a+0]=h,i[a+1]=p,i[a+2]=g,i[a+3]=y}}}(t,b,{polarCenterX:e/2,polarCenterY:n/2});let v=e/Math.pow(2,p);for(;v<=8;)v*=2,p-=1;v=Math.ceil(v);let _=v,w=0,x=_,S=1;for(m+v>e&&(w=_,x=0,S=-1),i=0;i<n;i+=1)for(r=w;r!==x;r+=S)a=Math.round(r+m)%e,h=4*(e*i+a),l=b.data[h+0],c=b.data[h+1],u=b.data[h+2],d=b.data[h+3],f=4*(e*i+r),b.data[f+0]=l,b.data[f+1]=c,b.data[f+2]=u,b.data[f+3]=d;for(i=0;i<n;i+=1)for(_=Math.floor(v),s=0;s<p;s+=1){for(r=0;r<_+1;r+=1)h=4*(e*i+r),l=b.data[h+0],c=b.data[h+1],u=b.data[h+2],d=b.data[h+3],f=4*(e*i+2*_-r-1),b.data[f+0]=l,b.data[f+1]=c,b.data[f+2]=u,b.data[f+3]=d;_*=2}!function(t,e,n){const r=t.data,i=e.data,o=t.width,a=t.height,s=n.polarCenterX||o/2,l=n.polarCenterY||a/2;let c=Math.sqrt(s*s+l*l),u=o-s,d=a-l;const h=Math.sqrt(u*u+d*d);c=h>c?h:c;const f=a,p=o,g=n.polarRotation||0;let m,y;for(u=0;u<o;u+=1)for(d=0;d<a;d+=1){const t=u-s,e=d-l,n=Math.sqrt(t*t+e*e)*f/c;let a=(180*Math.atan2(e,t)/Math.PI+360+g)%360;a=a*p/360,m=Math.floor(a),y=Math.floor(n);let h=4*(y*o+m);const b=r[h+0],v=r[h+1],_=r[h+2],w=r[h+3];h=4*(d*o+u),i[h+0]=b,i[h+1]=v,i[h+2]=_,i[h+3]=w}}(b,t,{polarRotation:0})},r.Factory.addGetterSetter(i.Node,"kaleidoscopePower",2,(0,a.getNumberValidator)(),r.Factory.afterSetFilter),r.Factory.addGetterSetter(i.Node,"kaleidoscopeAngle",0,(0,a.getNumberValidator)(),r.Factory.afterSetFilter)},8627:(t,e,n)=>{var r=n(5043);t.exports=function(t,e,n){const i=r.useRef("loading"),o=r.useRef(),[a,s]=r.useState(0),l=r.useRef(),c=r.useRef(),u=r.useRef();return l.current===t&&c.current===e&&u.current===n||(i.current="loading",o.current=void 0,l.current=t,c.current=e,u.current=n),r.useLayoutEffect((function(){if(t){var r=document.createElement("img");return r.addEventListener("load",a),r.addEventListener("error",l),e&&(r.crossOrigin=e),n&&(r.referrerPolicy=n),r.src=t,function(){r.removeEventListener("load",a),r.removeEventListener("error",l)}}function a(){i.current="loaded",o.current=r,s(Math.random())}function l(){i.current="failed",o.current=void 0,s(Math.random())}}),[t,e,n]),[o.current,i.current]}},8727:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.DD=void 0;const r=n(4602),i=n(7149);e.DD={get isDragging(){let t=!1;return e.DD._dragElements.forEach((e=>{"dragging"===e.dragStatus&&(t=!0)})),t},justDragged:!1,get node(){let t;return e.DD._dragElements.forEach((e=>{t=e.node})),t},_dragElements:new Map,_drag(t){const n=[];e.DD._dragElements.forEach(((e,r)=>{const{node:o}=e,a=o.getStage();a.setPointersPositions(t),void 0===e.pointerId&&(e.pointerId=i.Util._getFirstPointerId(t));const s=a._changedPointerPositions.find((t=>t.id===e.pointerId));if(s){if("dragging"!==e.dragStatus){const n=o.dragDistance();if(Math.max(Math.abs(s.x-e.startPointerPos.x),Math.abs(s.y-e.startPointerPos.y))<n)return;if(o.startDrag({evt:t}),!o.isDragging())return}o._setDragPosition(t,e),n.push(o)}})),n.forEach((e=>{e.fire("dragmove",{type:"dragmove",target:e,evt:t},!0)}))},_endDragBefore(t){const n=[];e.DD._dragElements.forEach((i=>{const{node:o}=i,a=o.getStage();t&&a.setPointersPositions(t);if(!a._changedPointerPositions.find((t=>t.id===i.pointerId)))return;"dragging"!==i.dragStatus&&"stopped"!==i.dragStatus||(e.DD.justDragged=!0,r.Konva._mouseListenClick=!1,r.Konva._touchListenClick=!1,r.Konva._pointerListenClick=!1,i.dragStatus="stopped");const s=i.node.getLayer()||i.node instanceof r.Konva.Stage&&i.node;s&&-1===n.indexOf(s)&&n.push(s)})),n.forEach((t=>{t.draw()}))},_endDragAfter(t){e.DD._dragElements.forEach(((n,r)=>{"stopped"===n.dragStatus&&n.node.fire("dragend",{type:"dragend",target:n.node,evt:t},!0),"dragging"!==n.dragStatus&&e.DD._dragElements.delete(r)}))}},r.Konva.isBrowser&&(window.addEventListener("mouseup",e.DD._endDragBefore,!0),window.addEventListener("touchend",e.DD._endDragBefore,!0),window.addEventListener("touchcancel",e.DD._endDragBefore,!0),window.addEventListener("mousemove",e.DD._drag),window.addEventListener("touchmove",e.DD._drag),window.addEventListener("mouseup",e.DD._endDragAfter,!1),window.addEventListener("touchend",e.DD._endDragAfter,!1),window.addEventListener("touchcancel",e.DD._endDragAfter,!1))},8853:(t,e,n)=>{"use strict";t.exports=n(7234)},9144:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Arc=void 0;const r=n(1751),i=n(3304),o=n(4602),a=n(9910),s=n(4602);class l extends i.Shape{_sceneFunc(t){const e=o.Konva.getAngle(this.angle()),n=this.clockwise();t.beginPath(),t.arc(0,0,this.outerRadius(),0,e,n),t.arc(0,0,this.innerRadius(),e,0,!n),t.closePath(),t.fillStrokeShape(this)}getWidth(){return 2*this.outerRadius()}getHeight(){return 2*this.outerRadius()}setWidth(t){this.outerRadius(t/2)}setHeight(t){this.outerRadius(t/2)}getSelfRect(){const t=this.innerRadius(),e=this.outerRadius(),n=this.clockwise(),r=o.Konva.getAngle(n?360-this.angle():this.angle()),i=Math.cos(Math.min(r,Math.PI)),a=Math.sin(Math.min(Math.max(Math.PI,r),3*Math.PI/2)),s=Math.sin(Math.min(r,Math.PI/2)),l=i*(i>0?t:e),c=a*(a>0?t:e),u=s*(s>0?e:t);return{x:l,y:n?-1*u:c,width:1*e-l,height:u-c}}}e.Arc=l,l.prototype._centroid=!0,l.prototype.className="Arc",l.prototype._attrsAffectingSize=["innerRadius","outerRadius","angle","clockwise"],(0,s._registerNode)(l),r.Factory.addGetterSetter(l,"innerRadius",0,(0,a.getNumberValidator)()),r.Factory.addGetterSetter(l,"outerRadius",0,(0,a.getNumberValidator)()),r.Factory.addGetterSetter(l,"angle",0,(0,a.getNumberValidator)()),r.Factory.addGetterSetter(l,"clockwise",!1,(0,a.getBooleanValidator)())},9195:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Noise=void 0;const r=n(1751),i=n(1189),o=n(9910);e.Noise=function(t){const e=255*this.noise(),n=t.data,r=n.length,i=e/2;for(let o=0;o<r;o+=4)n[o+0]+=i-2*i*Math.random(),n[o+1]+=i-2*i*Math.random(),n[o+2]+=i-2*i*Math.random()},r.Factory.addGetterSetter(i.Node,"noise",.2,(0,o.getNumberValidator)(),r.Factory.afterSetFilter)},9485:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.getCapturedShape=function(t){return i.get(t)},e.createEvent=a,e.hasPointerCapture=function(t,e){return i.get(t)===e},e.setPointerCapture=function(t,e){s(t);if(!e.getStage())return;i.set(t,e),o&&e._fire("gotpointercapture",a(new PointerEvent("gotpointercapture")))},e.releaseCapture=s;const r=n(4602),i=new Map,o=void 0!==r.Konva._global.PointerEvent;function a(t){return{evt:t,pointerId:t.pointerId}}function s(t,e){const n=i.get(t);if(!n)return;const r=n.getStage();r&&r.content,i.delete(t),o&&n._fire("lostpointercapture",a(new PointerEvent("lostpointercapture")))}},9554:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Ellipse=void 0;const r=n(1751),i=n(3304),o=n(9910),a=n(4602);class s extends i.Shape{_sceneFunc(t){const e=this.radiusX(),n=this.radiusY();t.beginPath(),t.save(),e!==n&&t.scale(1,n/e),t.arc(0,0,e,0,2*Math.PI,!1),t.restore(),t.closePath(),t.fillStrokeShape(this)}getWidth(){return 2*this.radiusX()}getHeight(){return 2*this.radiusY()}setWidth(t){this.radiusX(t/2)}setHeight(t){this.radiusY(t/2)}}e.Ellipse=s,s.prototype.className="Ellipse",s.prototype._centroid=!0,s.prototype._attrsAffectingSize=["radiusX","radiusY"],(0,a._registerNode)(s),r.Factory.addComponentsGetterSetter(s,"radius",["x","y"]),r.Factory.addGetterSetter(s,"radiusX",0,(0,o.getNumberValidator)()),r.Factory.addGetterSetter(s,"radiusY",0,(0,o.getNumberValidator)())},9586:(t,e,n)=>{"use strict";t.exports=n(7302)},9611:(t,e,n)=>{t=n.nmd(t);var r="__lodash_hash_undefined__",i=9007199254740991,o="[object Arguments]",a="[object Function]",s="[object Object]",l=/^\[object .+?Constructor\]$/,c=/^(?:0|[1-9]\d*)$/,u={};u["[object Float32Array]"]=u["[object Float64Array]"]=u["[object Int8Array]"]=u["[object Int16Array]"]=u["[object Int32Array]"]=u["[object Uint8Array]"]=u["[object Uint8ClampedArray]"]=u["[object Uint16Array]"]=u["[object Uint32Array]"]=!0,u[o]=u["[object Array]"]=u["[object ArrayBuffer]"]=u["[object Boolean]"]=u["[object DataView]"]=u["[object Date]"]=u["[object Error]"]=u[a]=u["[object Map]"]=u["[object Number]"]=u[s]=u["[object RegExp]"]=u["[object Set]"]=u["[object String]"]=u["[object WeakMap]"]=!1;var d="object"==typeof n.g&&n.g&&n.g.Object===Object&&n.g,h="object"==typeof self&&self&&self.Object===Object&&self,f=d||h||Function("return this")(),p=e&&!e.nodeType&&e,g=p&&t&&!t.nodeType&&t,m=g&&g.exports===p,y=m&&d.process,b=function(){try{var t=g&&g.require&&g.require("util").types;return t||y&&y.binding&&y.binding("util")}catch(e){}}(),v=b&&b.isTypedArray;var _,w,x=Array.prototype,S=Function.prototype,k=Object.prototype,C=f["__core-js_shared__"],T=S.toString,P=k.hasOwnProperty,E=function(){var t=/[^.]+$/.exec(C&&C.keys&&C.keys.IE_PROTO||"");return t?"Symbol(src)_1."+t:""}(),A=k.toString,I=T.call(Object),M=RegExp("^"+T.call(P).replace(/[\\^$.*+?()[\]{}|]/g,"\\$&").replace(/hasOwnProperty|(function).*?(?=\\\()| for .+?(?=\\\])/g,"$1.*?")+"$"),F=m?f.Buffer:void 0,D=f.Symbol,R=f.Uint8Array,O=F?F.allocUnsafe:void 0,N=(_=Object.getPrototypeOf,w=Object,function(t){return _(w(t))}),L=Object.create,B=k.propertyIsEnumerable,z=x.splice,j=D?D.toStringTag:void 0,U=function(){try{var t=ft(Object,"defineProperty");return t({},"",{}),t}catch(e){}}(),V=F?F.isBuffer:void 0,$=Math.max,W=Date.now,G=ft(f,"Map"),H=ft(Object,"create"),Y=function(){function t(){}return function(e){if(!Ct(e))return{};if(L)return L(e);t.prototype=e;var n=new t;return t.prototype=void 0,n}}();function q(t){var e=-1,n=null==t?0:t.length;for(this.clear();++e<n;){var r=t[e];this.set(r[0],r[1])}}function K(t){var e=-1,n=null==t?0:t.length;for(this.clear();++e<n;){var r=t[e];this.set(r[0],r[1])}}function X(t){var e=-1,n=null==t?0:t.length;for(this.clear();++e<n;){var r=t[e];this.set(r[0],r[1])}}function Q(t){var e=this.__data__=new K(t);this.size=e.size}function Z(t,e){var n=_t(t),r=!n&&vt(t),i=!n&&!r&&xt(t),o=!n&&!r&&!i&&Pt(t),a=n||r||i||o,s=a?function(t,e){for(var n=-1,r=Array(t);++n<t;)r[n]=e(n);return r}(t.length,String):[],l=s.length;for(var c in t)!e&&!P.call(t,c)||a&&("length"==c||i&&("offset"==c||"parent"==c)||o&&("buffer"==c||"byteLength"==c||"byteOffset"==c)||pt(c,l))||s.push(c);return s}function J(t,e,n){(void 0!==n&&!bt(t[e],n)||void 0===n&&!(e in t))&&nt(t,e,n)}function tt(t,e,n){var r=t[e];P.call(t,e)&&bt(r,n)&&(void 0!==n||e in t)||nt(t,e,n)}function et(t,e){for(var n=t.length;n--;)if(bt(t[n][0],e))return n;return-1}function nt(t,e,n){"__proto__"==e&&U?U(t,e,{configurable:!0,enumerable:!0,value:n,writable:!0}):t[e]=n}q.prototype.clear=function(){this.__data__=H?H(null):{},this.size=0},q.prototype.delete=function(t){var e=this.has(t)&&delete this.__data__[t];return this.size-=e?1:0,e},q.prototype.get=function(t){var e=this.__data__;if(H){var n=e[t];return n===r?void 0:n}return P.call(e,t)?e[t]:void 0},q.prototype.has=function(t){var e=this.__data__;return H?void 0!==e[t]:P.call(e,t)},q.prototype.set=function(t,e){var n=this.__data__;return this.size+=this.has(t)?0:1,n[t]=H&&void 0===e?r:e,this},K.prototype.clear=function(){this.__data__=[],this.size=0},K.prototype.delete=function(t){var e=this.__data__,n=et(e,t);return!(n<0)&&(n==e.length-1?e.pop():z.call(e,n,1),--this.size,!0)},K.prototype.get=function(t){var e=this.__data__,n=et(e,t);return n<0?void 0:e[n][1]},K.prototype.has=function(t){return et(this.__data__,t)>-1},K.prototype.set=function(t,e){var n=this.__data__,r=et(n,t);return r<0?(++this.size,n.push([t,e])):n[r][1]=e,this},X.prototype.clear=function(){this.size=0,this.__data__={hash:new q,map:new(G||K),string:new q}},X.prototype.delete=function(t){var e=ht(this,t).delete(t);return this.size-=e?1:0,e},X.prototype.get=function(t){return ht(this,t).get(t)},X.prototype.has=function(t){return ht(this,t).has(t)},X.prototype.set=function(t,e){var n=ht(this,t),r=n.size;return n.set(t,e),this.size+=n.size==r?0:1,this},Q.prototype.clear=function(){this.__data__=new K,this.size=0},Q.prototype.delete=function(t){var e=this.__data__,n=e.delete(t);return this.size=e.size,n},Q.prototype.get=function(t){return this.__data__.get(t)},Q.prototype.has=function(t){return this.__data__.has(t)},Q.prototype.set=function(t,e){var n=this.__data__;if(n instanceof K){var r=n.__data__;if(!G||r.length<199)return r.push([t,e]),this.size=++n.size,this;n=this.__data__=new X(r)}return n.set(t,e),this.size=n.size,this};var rt,it=function(t,e,n){for(var r=-1,i=Object(t),o=n(t),a=o.length;a--;){var s=o[rt?a:++r];if(!1===e(i[s],s,i))break}return t};function ot(t){return null==t?void 0===t?"[object Undefined]":"[object Null]":j&&j in Object(t)?function(t){var e=P.call(t,j),n=t[j];try{t[j]=void 0;var r=!0}catch(o){}var i=A.call(t);r&&(e?t[j]=n:delete t[j]);return i}(t):function(t){return A.call(t)}(t)}function at(t){return Tt(t)&&ot(t)==o}function st(t){return!(!Ct(t)||function(t){return!!E&&E in t}(t))&&(St(t)?M:l).test(function(t){if(null!=t){try{return T.call(t)}catch(e){}try{return t+""}catch(e){}}return""}(t))}function lt(t){if(!Ct(t))return function(t){var e=[];if(null!=t)for(var n in Object(t))e.push(n);return e}(t);var e=gt(t),n=[];for(var r in t)("constructor"!=r||!e&&P.call(t,r))&&n.push(r);return n}function ct(t,e,n,r,i){t!==e&&it(e,(function(o,a){if(i||(i=new Q),Ct(o))!function(t,e,n,r,i,o,a){var l=mt(t,n),c=mt(e,n),u=a.get(c);if(u)return void J(t,n,u);var d=o?o(l,c,n+"",t,e,a):void 0,h=void 0===d;if(h){var f=_t(c),p=!f&&xt(c),g=!f&&!p&&Pt(c);d=c,f||p||g?_t(l)?d=l:Tt(m=l)&&wt(m)?d=function(t,e){var n=-1,r=t.length;e||(e=Array(r));for(;++n<r;)e[n]=t[n];return e}(l):p?(h=!1,d=function(t,e){if(e)return t.slice();var n=t.length,r=O?O(n):new t.constructor(n);return t.copy(r),r}(c,!0)):g?(h=!1,d=function(t,e){var n=e?function(t){var e=new t.constructor(t.byteLength);return new R(e).set(new R(t)),e}(t.buffer):t.buffer;return new t.constructor(n,t.byteOffset,t.length)}(c,!0)):d=[]:function(t){if(!Tt(t)||ot(t)!=s)return!1;var e=N(t);if(null===e)return!0;var n=P.call(e,"constructor")&&e.constructor;return"function"==typeof n&&n instanceof n&&T.call(n)==I}(c)||vt(c)?(d=l,vt(l)?d=function(t){return function(t,e,n,r){var i=!n;n||(n={});var o=-1,a=e.length;for(;++o<a;){var s=e[o],l=r?r(n[s],t[s],s,n,t):void 0;void 0===l&&(l=t[s]),i?nt(n,s,l):tt(n,s,l)}return n}(t,Et(t))}(l):Ct(l)&&!St(l)||(d=function(t){return"function"!=typeof t.constructor||gt(t)?{}:Y(N(t))}(c))):h=!1}var m;h&&(a.set(c,d),i(d,c,r,o,a),a.delete(c));J(t,n,d)}(t,e,a,n,ct,r,i);else{var l=r?r(mt(t,a),o,a+"",t,e,i):void 0;void 0===l&&(l=o),J(t,a,l)}}),Et)}function ut(t,e){return yt(function(t,e,n){return e=$(void 0===e?t.length-1:e,0),function(){for(var r=arguments,i=-1,o=$(r.length-e,0),a=Array(o);++i<o;)a[i]=r[e+i];i=-1;for(var s=Array(e+1);++i<e;)s[i]=r[i];return s[e]=n(a),function(t,e,n){switch(n.length){case 0:return t.call(e);case 1:return t.call(e,n[0]);case 2:return t.call(e,n[0],n[1]);case 3:return t.call(e,n[0],n[1],n[2])}return t.apply(e,n)}(t,this,s)}}(t,e,Mt),t+"")}var dt=U?function(t,e){return U(t,"toString",{configurable:!0,enumerable:!1,value:(n=e,function(){return n}),writable:!0});var n}:Mt;function ht(t,e){var n=t.__data__;return function(t){var e=typeof t;return"string"==e||"number"==e||"symbol"==e||"boolean"==e?"__proto__"!==t:null===t}(e)?n["string"==typeof e?"string":"hash"]:n.map}function ft(t,e){var n=function(t,e){return null==t?void 0:t[e]}(t,e);return st(n)?n:void 0}function pt(t,e){var n=typeof t;return!!(e=null==e?i:e)&&("number"==n||"symbol"!=n&&c.test(t))&&t>-1&&t%1==0&&t<e}function gt(t){var e=t&&t.constructor;return t===("function"==typeof e&&e.prototype||k)}function mt(t,e){if(("constructor"!==e||"function"!==typeof t[e])&&"__proto__"!=e)return t[e]}var yt=function(t){var e=0,n=0;return function(){var r=W(),i=16-(r-n);if(n=r,i>0){if(++e>=800)return arguments[0]}else e=0;return t.apply(void 0,arguments)}}(dt);function bt(t,e){return t===e||t!==t&&e!==e}var vt=at(function(){return arguments}())?at:function(t){return Tt(t)&&P.call(t,"callee")&&!B.call(t,"callee")},_t=Array.isArray;function wt(t){return null!=t&&kt(t.length)&&!St(t)}var xt=V||function(){return!1};function St(t){if(!Ct(t))return!1;var e=ot(t);return e==a||"[object GeneratorFunction]"==e||"[object AsyncFunction]"==e||"[object Proxy]"==e}function kt(t){return"number"==typeof t&&t>-1&&t%1==0&&t<=i}function Ct(t){var e=typeof t;return null!=t&&("object"==e||"function"==e)}function Tt(t){return null!=t&&"object"==typeof t}var Pt=v?function(t){return function(e){return t(e)}}(v):function(t){return Tt(t)&&kt(t.length)&&!!u[ot(t)]};function Et(t){return wt(t)?Z(t,!0):lt(t)}var At,It=(At=function(t,e,n,r){ct(t,e,n,r)},ut((function(t,e){var n=-1,r=e.length,i=r>1?e[r-1]:void 0,o=r>2?e[2]:void 0;for(i=At.length>3&&"function"==typeof i?(r--,i):void 0,o&&function(t,e,n){if(!Ct(n))return!1;var r=typeof e;return!!("number"==r?wt(n)&&pt(e,n.length):"string"==r&&e in n)&&bt(n[e],t)}(e[0],e[1],o)&&(i=r<3?void 0:i,r=1),t=Object(t);++n<r;){var a=e[n];a&&At(t,a,n,i)}return t})));function Mt(t){return t}t.exports=It},9812:(t,e,n)=>{var r=n(6552).Symbol;t.exports=r},9841:(t,e,n)=>{var r=n(6913),i=n(2761);t.exports=function(t){return"symbol"==typeof t||i(t)&&"[object Symbol]"==r(t)}},9910:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.RGBComponent=function(t){if(t>255)return 255;if(t<0)return 0;return Math.round(t)},e.alphaComponent=function(t){if(t>1)return 1;if(t<1e-4)return 1e-4;return t},e.getNumberValidator=function(){if(r.Konva.isUnminified)return function(t,e){return i.Util._isNumber(t)||i.Util.warn(o(t)+' is a not valid value for "'+e+'" attribute. The value should be a number.'),t}},e.getNumberOrArrayOfNumbersValidator=function(t){if(r.Konva.isUnminified)return function(e,n){let r=i.Util._isNumber(e),a=i.Util._isArray(e)&&e.length==t;return r||a||i.Util.warn(o(e)+' is a not valid value for "'+n+'" attribute. The value should be a number or Array<number>('+t+")"),e}},e.getNumberOrAutoValidator=function(){if(r.Konva.isUnminified)return function(t,e){return i.Util._isNumber(t)||"auto"===t||i.Util.warn(o(t)+' is a not valid value for "'+e+'" attribute. The value should be a number or "auto".'),t}},e.getStringValidator=function(){if(r.Konva.isUnminified)return function(t,e){return i.Util._isString(t)||i.Util.warn(o(t)+' is a not valid value for "'+e+'" attribute. The value should be a string.'),t}},e.getStringOrGradientValidator=function(){if(r.Konva.isUnminified)return function(t,e){const n=i.Util._isString(t),r="[object CanvasGradient]"===Object.prototype.toString.call(t)||t&&t.addColorStop;return n||r||i.Util.warn(o(t)+' is a not valid value for "'+e+'" attribute. The value should be a string or a native gradient.'),t}},e.getFunctionValidator=function(){if(r.Konva.isUnminified)return function(t,e){return i.Util._isFunction(t)||i.Util.warn(o(t)+' is a not valid value for "'+e+'" attribute. The value should be a function.'),t}},e.getNumberArrayValidator=function(){if(r.Konva.isUnminified)return function(t,e){const n=Int8Array?Object.getPrototypeOf(Int8Array):null;return n&&t instanceof n||(i.Util._isArray(t)?t.forEach((function(t){i.Util._isNumber(t)||i.Util.warn('"'+e+'" attribute has non numeric element '+t+". Make sure that all elements are numbers.")})):i.Util.warn(o(t)+' is a not valid value for "'+e+'" attribute. The value should be a array of numbers.')),t}},e.getBooleanValidator=function(){if(r.Konva.isUnminified)return function(t,e){return!0===t||!1===t||i.Util.warn(o(t)+' is a not valid value for "'+e+'" attribute. The value should be a boolean.'),t}},e.getComponentValidator=function(t){if(r.Konva.isUnminified)return function(e,n){return void 0===e||null===e||i.Util.isObject(e)||i.Util.warn(o(e)+' is a not valid value for "'+n+'" attribute. The value should be an object with properties '+t),e}};const r=n(4602),i=n(7149);function o(t){return i.Util._isString(t)?'"'+t+'"':"[object Number]"===Object.prototype.toString.call(t)||i.Util._isBoolean(t)?t:Object.prototype.toString.call(t)}}},e={};function n(r){var i=e[r];if(void 0!==i)return i.exports;var o=e[r]={id:r,loaded:!1,exports:{}};return t[r](o,o.exports,n),o.loaded=!0,o.exports}n.n=t=>{var e=t&&t.__esModule?()=>t.default:()=>t;return n.d(e,{a:e}),e},(()=>{var t,e=Object.getPrototypeOf?t=>Object.getPrototypeOf(t):t=>t.__proto__;n.t=function(r,i){if(1&i&&(r=this(r)),8&i)return r;if("object"===typeof r&&r){if(4&i&&r.__esModule)return r;if(16&i&&"function"===typeof r.then)return r}var o=Object.create(null);n.r(o);var a={};t=t||[null,e({}),e([]),e(e)];for(var s=2&i&&r;"object"==typeof s&&!~t.indexOf(s);s=e(s))Object.getOwnPropertyNames(s).forEach((t=>a[t]=()=>r[t]));return a.default=()=>r,n.d(o,a),o}})(),n.d=(t,e)=>{for(var r in e)n.o(e,r)&&!n.o(t,r)&&Object.defineProperty(t,r,{enumerable:!0,get:e[r]})},n.g=function(){if("object"===typeof globalThis)return globalThis;try{return this||new Function("return this")()}catch(t){if("object"===typeof window)return window}}(),n.o=(t,e)=>Object.prototype.hasOwnProperty.call(t,e),n.r=t=>{"undefined"!==typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(t,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(t,"__esModule",{value:!0})},n.nmd=t=>(t.paths=[],t.children||(t.children=[]),t),(()=>{"use strict";var t={};n.r(t),n.d(t,{appendChild:()=>OC,appendChildToContainer:()=>NC,appendInitialChild:()=>gC,cancelTimeout:()=>AC,clearContainer:()=>qC,commitMount:()=>VC,commitTextUpdate:()=>UC,commitUpdate:()=>$C,createInstance:()=>mC,createTextInstance:()=>yC,detachDeletedInstance:()=>KC,finalizeInitialChildren:()=>bC,getChildHostContext:()=>PC,getCurrentEventPriority:()=>XC,getPublicInstance:()=>vC,getRootHostContext:()=>TC,hideInstance:()=>WC,hideTextInstance:()=>GC,idlePriority:()=>hC.unstable_IdlePriority,insertBefore:()=>LC,insertInContainerBefore:()=>BC,isPrimaryRenderer:()=>FC,noTimeout:()=>IC,now:()=>hC.unstable_now,prepareForCommit:()=>_C,preparePortalMount:()=>wC,prepareUpdate:()=>xC,removeChild:()=>zC,removeChildFromContainer:()=>jC,resetAfterCommit:()=>SC,resetTextContent:()=>kC,run:()=>hC.unstable_runWithPriority,scheduleTimeout:()=>EC,shouldDeprioritizeSubtree:()=>CC,shouldSetTextContent:()=>MC,supportsMutation:()=>RC,unhideInstance:()=>HC,unhideTextInstance:()=>YC,warnsIfNotActing:()=>DC});var e,r,i,o,a,s,l,c,u,d=n(5043),h=n.t(d,2),f=n(4391),p=n(219),g=n.n(p),m=n(6904);!function(t){t[t.V1=0]="V1",t[t.V2=1]="V2",t[t.V3=2]="V3",t[t.V4=3]="V4",t[t.V5=4]="V5"}(e||(e={})),function(t){t[t.Sparse=0]="Sparse",t[t.Dense=1]="Dense"}(r||(r={})),function(t){t[t.HALF=0]="HALF",t[t.SINGLE=1]="SINGLE",t[t.DOUBLE=2]="DOUBLE"}(i||(i={})),function(t){t[t.DAY=0]="DAY",t[t.MILLISECOND=1]="MILLISECOND"}(o||(o={})),function(t){t[t.SECOND=0]="SECOND",t[t.MILLISECOND=1]="MILLISECOND",t[t.MICROSECOND=2]="MICROSECOND",t[t.NANOSECOND=3]="NANOSECOND"}(a||(a={})),function(t){t[t.YEAR_MONTH=0]="YEAR_MONTH",t[t.DAY_TIME=1]="DAY_TIME",t[t.MONTH_DAY_NANO=2]="MONTH_DAY_NANO"}(s||(s={})),function(t){t[t.NONE=0]="NONE",t[t.Schema=1]="Schema",t[t.DictionaryBatch=2]="DictionaryBatch",t[t.RecordBatch=3]="RecordBatch",t[t.Tensor=4]="Tensor",t[t.SparseTensor=5]="SparseTensor"}(l||(l={})),function(t){t[t.NONE=0]="NONE",t[t.Null=1]="Null",t[t.Int=2]="Int",t[t.Float=3]="Float",t[t.Binary=4]="Binary",t[t.Utf8=5]="Utf8",t[t.Bool=6]="Bool",t[t.Decimal=7]="Decimal",t[t.Date=8]="Date",t[t.Time=9]="Time",t[t.Timestamp=10]="Timestamp",t[t.Interval=11]="Interval",t[t.List=12]="List",t[t.Struct=13]="Struct",t[t.Union=14]="Union",t[t.FixedSizeBinary=15]="FixedSizeBinary",t[t.FixedSizeList=16]="FixedSizeList",t[t.Map=17]="Map",t[t.Dictionary=-1]="Dictionary",t[t.Int8=-2]="Int8",t[t.Int16=-3]="Int16",t[t.Int32=-4]="Int32",t[t.Int64=-5]="Int64",t[t.Uint8=-6]="Uint8",t[t.Uint16=-7]="Uint16",t[t.Uint32=-8]="Uint32",t[t.Uint64=-9]="Uint64",t[t.Float16=-10]="Float16",t[t.Float32=-11]="Float32",t[t.Float64=-12]="Float64",t[t.DateDay=-13]="DateDay",t[t.DateMillisecond=-14]="DateMillisecond",t[t.TimestampSecond=-15]="TimestampSecond",t[t.TimestampMillisecond=-16]="TimestampMillisecond",t[t.TimestampMicrosecond=-17]="TimestampMicrosecond",t[t.TimestampNanosecond=-18]="TimestampNanosecond",t[t.TimeSecond=-19]="TimeSecond",t[t.TimeMillisecond=-20]="TimeMillisecond",t[t.TimeMicrosecond=-21]="TimeMicrosecond",t[t.TimeNanosecond=-22]="TimeNanosecond",t[t.DenseUnion=-23]="DenseUnion",t[t.SparseUnion=-24]="SparseUnion",t[t.IntervalDayTime=-25]="IntervalDayTime",t[t.IntervalYearMonth=-26]="IntervalYearMonth"}(c||(c={})),function(t){t[t.OFFSET=0]="OFFSET",t[t.DATA=1]="DATA",t[t.VALIDITY=2]="VALIDITY",t[t.TYPE=3]="TYPE"}(u||(u={}));const[y,b]=(()=>{const t=()=>{throw new Error("BigInt is not available in this environment")};function e(){throw t()}return e.asIntN=()=>{throw t()},e.asUintN=()=>{throw t()},"undefined"!==typeof BigInt?[BigInt,!0]:[e,!1]})(),[v,_]=(()=>{const t=()=>{throw new Error("BigInt64Array is not available in this environment")};return"undefined"!==typeof BigInt64Array?[BigInt64Array,!0]:[class{static get BYTES_PER_ELEMENT(){return 8}static of(){throw t()}static from(){throw t()}constructor(){throw t()}},!1]})(),[w,x]=(()=>{const t=()=>{throw new Error("BigUint64Array is not available in this environment")};return"undefined"!==typeof BigUint64Array?[BigUint64Array,!0]:[class{static get BYTES_PER_ELEMENT(){return 8}static of(){throw t()}static from(){throw t()}constructor(){throw t()}},!1]})(),S=t=>"number"===typeof t,k=t=>"boolean"===typeof t,C=t=>"function"===typeof t,T=t=>null!=t&&Object(t)===t,P=t=>T(t)&&C(t.then),E=t=>T(t)&&C(t[Symbol.iterator]),A=t=>T(t)&&C(t[Symbol.asyncIterator]),I=t=>T(t)&&T(t.schema),M=t=>T(t)&&"done"in t&&"value"in t,F=t=>T(t)&&C(t.stat)&&S(t.fd),D=t=>T(t)&&O(t.body),R=t=>"_getDOMStream"in t&&"_getNodeStream"in t,O=t=>T(t)&&C(t.cancel)&&C(t.getReader)&&!R(t),N=t=>T(t)&&C(t.read)&&C(t.pipe)&&k(t.readable)&&!R(t);function L(t){if(null===t)return"null";if(undefined===t)return"undefined";switch(typeof t){case"number":case"bigint":return`${t}`;case"string":return`"${t}"`}return"function"===typeof t[Symbol.toPrimitive]?t[Symbol.toPrimitive]("string"):ArrayBuffer.isView(t)?t instanceof v||t instanceof w?`[${[...t].map((t=>L(t)))}]`:`[${t}]`:ArrayBuffer.isView(t)?`[${t}]`:JSON.stringify(t,((t,e)=>"bigint"===typeof e?`${e}`:e))}function B(t,e,n,r){return new(n||(n=Promise))((function(i,o){function a(t){try{l(r.next(t))}catch(e){o(e)}}function s(t){try{l(r.throw(t))}catch(e){o(e)}}function l(t){var e;t.done?i(t.value):(e=t.value,e instanceof n?e:new n((function(t){t(e)}))).then(a,s)}l((r=r.apply(t,e||[])).next())}))}Object.create;function z(t){var e="function"===typeof Symbol&&Symbol.iterator,n=e&&t[e],r=0;if(n)return n.call(t);if(t&&"number"===typeof t.length)return{next:function(){return t&&r>=t.length&&(t=void 0),{value:t&&t[r++],done:!t}}};throw new TypeError(e?"Object is not iterable.":"Symbol.iterator is not defined.")}function j(t){return this instanceof j?(this.v=t,this):new j(t)}function U(t,e,n){if(!Symbol.asyncIterator)throw new TypeError("Symbol.asyncIterator is not defined.");var r,i=n.apply(t,e||[]),o=[];return r=Object.create(("function"===typeof AsyncIterator?AsyncIterator:Object).prototype),a("next"),a("throw"),a("return",(function(t){return function(e){return Promise.resolve(e).then(t,c)}})),r[Symbol.asyncIterator]=function(){return this},r;function a(t,e){i[t]&&(r[t]=function(e){return new Promise((function(n,r){o.push([t,e,n,r])>1||s(t,e)}))},e&&(r[t]=e(r[t])))}function s(t,e){try{!function(t){t.value instanceof j?Promise.resolve(t.value.v).then(l,c):u(o[0][2],t)}(i[t](e))}catch(n){u(o[0][3],n)}}function l(t){s("next",t)}function c(t){s("throw",t)}function u(t,e){t(e),o.shift(),o.length&&s(o[0][0],o[0][1])}}function V(t){var e,n;return e={},r("next"),r("throw",(function(t){throw t})),r("return"),e[Symbol.iterator]=function(){return this},e;function r(r,i){e[r]=t[r]?function(e){return(n=!n)?{value:j(t[r](e)),done:!1}:i?i(e):e}:i}}function $(t){if(!Symbol.asyncIterator)throw new TypeError("Symbol.asyncIterator is not defined.");var e,n=t[Symbol.asyncIterator];return n?n.call(t):(t=z(t),e={},r("next"),r("throw"),r("return"),e[Symbol.asyncIterator]=function(){return this},e);function r(n){e[n]=t[n]&&function(e){return new Promise((function(r,i){(function(t,e,n,r){Promise.resolve(r).then((function(e){t({value:e,done:n})}),e)})(r,i,(e=t[n](e)).done,e.value)}))}}}Object.create;"function"===typeof SuppressedError&&SuppressedError;const W=new TextDecoder("utf-8"),G=t=>W.decode(t),H=new TextEncoder,Y=t=>H.encode(t),q="undefined"!==typeof SharedArrayBuffer?SharedArrayBuffer:ArrayBuffer;function K(t,e){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0,r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:e.byteLength;const i=t.byteLength,o=new Uint8Array(t.buffer,t.byteOffset,i),a=new Uint8Array(e.buffer,e.byteOffset,Math.min(r,i));return o.set(a,n),t}function X(t,e){const n=function(t){const e=t[0]?[t[0]]:[];let n,r,i,o;for(let a,s,l=0,c=0,u=t.length;++l<u;)a=e[c],s=t[l],!a||!s||a.buffer!==s.buffer||s.byteOffset<a.byteOffset?s&&(e[++c]=s):(({byteOffset:n,byteLength:i}=a),({byteOffset:r,byteLength:o}=s),n+i<r||r+o<n?s&&(e[++c]=s):e[c]=new Uint8Array(a.buffer,n,r-n+o));return e}(t),r=n.reduce(((t,e)=>t+e.byteLength),0);let i,o,a,s=0,l=-1;const c=Math.min(e||Number.POSITIVE_INFINITY,r);for(const u=n.length;++l<u;){if(i=n[l],o=i.subarray(0,Math.min(i.length,c-s)),c<=s+o.length){o.length<i.length?n[l]=i.subarray(o.length):o.length===i.length&&l++,a?K(a,o,s):a=o;break}K(a||(a=new Uint8Array(c)),o,s),s+=o.length}return[a||new Uint8Array(0),n.slice(l),r-(a?a.byteLength:0)]}function Q(t,e){let n=M(e)?e.value:e;return n instanceof t?t===Uint8Array?new t(n.buffer,n.byteOffset,n.byteLength):n:n?("string"===typeof n&&(n=Y(n)),n instanceof ArrayBuffer||n instanceof q?new t(n):T(r=n)&&C(r.clear)&&C(r.bytes)&&C(r.position)&&C(r.setPosition)&&C(r.capacity)&&C(r.getBufferIdentifier)&&C(r.createLong)?Q(t,n.bytes()):ArrayBuffer.isView(n)?n.byteLength<=0?new t(0):new t(n.buffer,n.byteOffset,n.byteLength/t.BYTES_PER_ELEMENT):t.from(n)):new t(0);var r}const Z=t=>Q(Int32Array,t),J=t=>Q(Uint8Array,t),tt=t=>(t.next(),t);function*et(t,e){const n=function*(t){yield t},r="string"===typeof e||ArrayBuffer.isView(e)||e instanceof ArrayBuffer||e instanceof q?n(e):E(e)?e:n(e);return yield*tt(function*(e){let n=null;do{n=e.next(yield Q(t,n))}while(!n.done)}(r[Symbol.iterator]())),new t}function nt(t,e){return U(this,arguments,(function*(){if(P(e))return yield j(yield j(yield*V($(nt(t,yield j(e))))));const n=function(t){return U(this,arguments,(function*(){yield yield j(yield j(t))}))},r="string"===typeof e||ArrayBuffer.isView(e)||e instanceof ArrayBuffer||e instanceof q?n(e):E(e)?function(t){return U(this,arguments,(function*(){yield j(yield*V($(tt(function*(t){let e=null;do{e=t.next(yield null===e||void 0===e?void 0:e.value)}while(!e.done)}(t[Symbol.iterator]())))))}))}(e):A(e)?e:n(e);return yield j(yield*V($(tt(function(e){return U(this,arguments,(function*(){let n=null;do{n=yield j(e.next(yield yield j(Q(t,n))))}while(!n.done)}))}(r[Symbol.asyncIterator]()))))),yield j(new t)}))}function rt(t,e,n){if(0!==t){n=n.slice(0,e+1);for(let r=-1;++r<=e;)n[r]+=t}return n}const it=Symbol.for("isArrowBigNum");function ot(t){for(var e=arguments.length,n=new Array(e>1?e-1:0),r=1;r<e;r++)n[r-1]=arguments[r];return 0===n.length?Object.setPrototypeOf(Q(this.TypedArray,t),this.constructor.prototype):Object.setPrototypeOf(new this.TypedArray(t,...n),this.constructor.prototype)}function at(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return ot.apply(this,e)}function st(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return ot.apply(this,e)}function lt(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return ot.apply(this,e)}function ct(t){const{buffer:e,byteOffset:n,length:r,signed:i}=t,o=new w(e,n,r),a=i&&o[o.length-1]&BigInt(1)<<BigInt(63);let s=a?BigInt(1):BigInt(0),l=BigInt(0);if(a){for(const t of o)s+=~t*(BigInt(1)<<BigInt(32)*l++);s*=BigInt(-1)}else for(const c of o)s+=c*(BigInt(1)<<BigInt(32)*l++);return s}let ut,dt;function ht(t){let e="";const n=new Uint32Array(2);let r=new Uint16Array(t.buffer,t.byteOffset,t.byteLength/2);const i=new Uint32Array((r=new Uint16Array(r).reverse()).buffer);let o=-1;const a=r.length-1;do{for(n[0]=r[o=0];o<a;)r[o++]=n[1]=n[0]/10,n[0]=(n[0]-10*n[1]<<16)+r[o];r[o]=n[1]=n[0]/10,n[0]=n[0]-10*n[1],e=`${n[0]}${e}`}while(i[0]||i[1]||i[2]||i[3]);return null!==e&&void 0!==e?e:"0"}ot.prototype[it]=!0,ot.prototype.toJSON=function(){return`"${ut(this)}"`},ot.prototype.valueOf=function(){return ct(this)},ot.prototype.toString=function(){return ut(this)},ot.prototype[Symbol.toPrimitive]=function(){switch(arguments.length>0&&void 0!==arguments[0]?arguments[0]:"default"){case"number":return ct(this);case"string":return ut(this);case"default":return dt(this)}return ut(this)},Object.setPrototypeOf(at.prototype,Object.create(Int32Array.prototype)),Object.setPrototypeOf(st.prototype,Object.create(Uint32Array.prototype)),Object.setPrototypeOf(lt.prototype,Object.create(Uint32Array.prototype)),Object.assign(at.prototype,ot.prototype,{constructor:at,signed:!0,TypedArray:Int32Array,BigIntArray:v}),Object.assign(st.prototype,ot.prototype,{constructor:st,signed:!1,TypedArray:Uint32Array,BigIntArray:w}),Object.assign(lt.prototype,ot.prototype,{constructor:lt,signed:!0,TypedArray:Uint32Array,BigIntArray:w}),b?(dt=t=>8===t.byteLength?new t.BigIntArray(t.buffer,t.byteOffset,1)[0]:ht(t),ut=t=>8===t.byteLength?`${new t.BigIntArray(t.buffer,t.byteOffset,1)[0]}`:ht(t)):(ut=ht,dt=ut);class ft{static new(t,e){switch(e){case!0:return new at(t);case!1:return new st(t)}switch(t.constructor){case Int8Array:case Int16Array:case Int32Array:case v:return new at(t)}return 16===t.byteLength?new lt(t):new st(t)}static signed(t){return new at(t)}static unsigned(t){return new st(t)}static decimal(t){return new lt(t)}constructor(t,e){return ft.new(t,e)}}var pt,gt,mt,yt,bt,vt,_t,wt,xt,St,kt,Ct,Tt,Pt,Et,At,It,Mt,Ft,Dt;class Rt{static isNull(t){return(null===t||void 0===t?void 0:t.typeId)===c.Null}static isInt(t){return(null===t||void 0===t?void 0:t.typeId)===c.Int}static isFloat(t){return(null===t||void 0===t?void 0:t.typeId)===c.Float}static isBinary(t){return(null===t||void 0===t?void 0:t.typeId)===c.Binary}static isUtf8(t){return(null===t||void 0===t?void 0:t.typeId)===c.Utf8}static isBool(t){return(null===t||void 0===t?void 0:t.typeId)===c.Bool}static isDecimal(t){return(null===t||void 0===t?void 0:t.typeId)===c.Decimal}static isDate(t){return(null===t||void 0===t?void 0:t.typeId)===c.Date}static isTime(t){return(null===t||void 0===t?void 0:t.typeId)===c.Time}static isTimestamp(t){return(null===t||void 0===t?void 0:t.typeId)===c.Timestamp}static isInterval(t){return(null===t||void 0===t?void 0:t.typeId)===c.Interval}static isList(t){return(null===t||void 0===t?void 0:t.typeId)===c.List}static isStruct(t){return(null===t||void 0===t?void 0:t.typeId)===c.Struct}static isUnion(t){return(null===t||void 0===t?void 0:t.typeId)===c.Union}static isFixedSizeBinary(t){return(null===t||void 0===t?void 0:t.typeId)===c.FixedSizeBinary}static isFixedSizeList(t){return(null===t||void 0===t?void 0:t.typeId)===c.FixedSizeList}static isMap(t){return(null===t||void 0===t?void 0:t.typeId)===c.Map}static isDictionary(t){return(null===t||void 0===t?void 0:t.typeId)===c.Dictionary}static isDenseUnion(t){return Rt.isUnion(t)&&t.mode===r.Dense}static isSparseUnion(t){return Rt.isUnion(t)&&t.mode===r.Sparse}get typeId(){return c.NONE}}pt=Symbol.toStringTag,Rt[pt]=((Dt=Rt.prototype).children=null,Dt.ArrayType=Array,Dt[Symbol.toStringTag]="DataType");class Ot extends Rt{toString(){return"Null"}get typeId(){return c.Null}}gt=Symbol.toStringTag,Ot[gt]=(t=>t[Symbol.toStringTag]="Null")(Ot.prototype);class Nt extends Rt{constructor(t,e){super(),this.isSigned=t,this.bitWidth=e}get typeId(){return c.Int}get ArrayType(){switch(this.bitWidth){case 8:return this.isSigned?Int8Array:Uint8Array;case 16:return this.isSigned?Int16Array:Uint16Array;case 32:return this.isSigned?Int32Array:Uint32Array;case 64:return this.isSigned?v:w}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}toString(){return`${this.isSigned?"I":"Ui"}nt${this.bitWidth}`}}mt=Symbol.toStringTag,Nt[mt]=(t=>(t.isSigned=null,t.bitWidth=null,t[Symbol.toStringTag]="Int"))(Nt.prototype);class Lt extends Nt{constructor(){super(!0,32)}get ArrayType(){return Int32Array}}Object.defineProperty(class extends Nt{constructor(){super(!0,8)}get ArrayType(){return Int8Array}}.prototype,"ArrayType",{value:Int8Array}),Object.defineProperty(class extends Nt{constructor(){super(!0,16)}get ArrayType(){return Int16Array}}.prototype,"ArrayType",{value:Int16Array}),Object.defineProperty(Lt.prototype,"ArrayType",{value:Int32Array}),Object.defineProperty(class extends Nt{constructor(){super(!0,64)}get ArrayType(){return v}}.prototype,"ArrayType",{value:v}),Object.defineProperty(class extends Nt{constructor(){super(!1,8)}get ArrayType(){return Uint8Array}}.prototype,"ArrayType",{value:Uint8Array}),Object.defineProperty(class extends Nt{constructor(){super(!1,16)}get ArrayType(){return Uint16Array}}.prototype,"ArrayType",{value:Uint16Array}),Object.defineProperty(class extends Nt{constructor(){super(!1,32)}get ArrayType(){return Uint32Array}}.prototype,"ArrayType",{value:Uint32Array}),Object.defineProperty(class extends Nt{constructor(){super(!1,64)}get ArrayType(){return w}}.prototype,"ArrayType",{value:w});class Bt extends Rt{constructor(t){super(),this.precision=t}get typeId(){return c.Float}get ArrayType(){switch(this.precision){case i.HALF:return Uint16Array;case i.SINGLE:return Float32Array;case i.DOUBLE:return Float64Array}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}toString(){return`Float${this.precision<<5||16}`}}yt=Symbol.toStringTag,Bt[yt]=(t=>(t.precision=null,t[Symbol.toStringTag]="Float"))(Bt.prototype);Object.defineProperty(class extends Bt{constructor(){super(i.HALF)}}.prototype,"ArrayType",{value:Uint16Array}),Object.defineProperty(class extends Bt{constructor(){super(i.SINGLE)}}.prototype,"ArrayType",{value:Float32Array}),Object.defineProperty(class extends Bt{constructor(){super(i.DOUBLE)}}.prototype,"ArrayType",{value:Float64Array});class zt extends Rt{constructor(){super()}get typeId(){return c.Binary}toString(){return"Binary"}}bt=Symbol.toStringTag,zt[bt]=(t=>(t.ArrayType=Uint8Array,t[Symbol.toStringTag]="Binary"))(zt.prototype);class jt extends Rt{constructor(){super()}get typeId(){return c.Utf8}toString(){return"Utf8"}}vt=Symbol.toStringTag,jt[vt]=(t=>(t.ArrayType=Uint8Array,t[Symbol.toStringTag]="Utf8"))(jt.prototype);class Ut extends Rt{constructor(){super()}get typeId(){return c.Bool}toString(){return"Bool"}}_t=Symbol.toStringTag,Ut[_t]=(t=>(t.ArrayType=Uint8Array,t[Symbol.toStringTag]="Bool"))(Ut.prototype);class Vt extends Rt{constructor(t,e){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:128;super(),this.scale=t,this.precision=e,this.bitWidth=n}get typeId(){return c.Decimal}toString(){return`Decimal[${this.precision}e${this.scale>0?"+":""}${this.scale}]`}}wt=Symbol.toStringTag,Vt[wt]=(t=>(t.scale=null,t.precision=null,t.ArrayType=Uint32Array,t[Symbol.toStringTag]="Decimal"))(Vt.prototype);class $t extends Rt{constructor(t){super(),this.unit=t}get typeId(){return c.Date}toString(){return`Date${32*(this.unit+1)}<${o[this.unit]}>`}}xt=Symbol.toStringTag,$t[xt]=(t=>(t.unit=null,t.ArrayType=Int32Array,t[Symbol.toStringTag]="Date"))($t.prototype);class Wt extends Rt{constructor(t,e){super(),this.unit=t,this.bitWidth=e}get typeId(){return c.Time}toString(){return`Time${this.bitWidth}<${a[this.unit]}>`}get ArrayType(){switch(this.bitWidth){case 32:return Int32Array;case 64:return v}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}}St=Symbol.toStringTag,Wt[St]=(t=>(t.unit=null,t.bitWidth=null,t[Symbol.toStringTag]="Time"))(Wt.prototype);class Gt extends Rt{constructor(t,e){super(),this.unit=t,this.timezone=e}get typeId(){return c.Timestamp}toString(){return`Timestamp<${a[this.unit]}${this.timezone?`, ${this.timezone}`:""}>`}}kt=Symbol.toStringTag,Gt[kt]=(t=>(t.unit=null,t.timezone=null,t.ArrayType=Int32Array,t[Symbol.toStringTag]="Timestamp"))(Gt.prototype);class Ht extends Rt{constructor(t){super(),this.unit=t}get typeId(){return c.Interval}toString(){return`Interval<${s[this.unit]}>`}}Ct=Symbol.toStringTag,Ht[Ct]=(t=>(t.unit=null,t.ArrayType=Int32Array,t[Symbol.toStringTag]="Interval"))(Ht.prototype);class Yt extends Rt{constructor(t){super(),this.children=[t]}get typeId(){return c.List}toString(){return`List<${this.valueType}>`}get valueType(){return this.children[0].type}get valueField(){return this.children[0]}get ArrayType(){return this.valueType.ArrayType}}Tt=Symbol.toStringTag,Yt[Tt]=(t=>(t.children=null,t[Symbol.toStringTag]="List"))(Yt.prototype);class qt extends Rt{constructor(t){super(),this.children=t}get typeId(){return c.Struct}toString(){return`Struct<{${this.children.map((t=>`${t.name}:${t.type}`)).join(", ")}}>`}}Pt=Symbol.toStringTag,qt[Pt]=(t=>(t.children=null,t[Symbol.toStringTag]="Struct"))(qt.prototype);class Kt extends Rt{constructor(t,e,n){super(),this.mode=t,this.children=n,this.typeIds=e=Int32Array.from(e),this.typeIdToChildIndex=e.reduce(((t,e,n)=>(t[e]=n)&&t||t),Object.create(null))}get typeId(){return c.Union}toString(){return`${this[Symbol.toStringTag]}<${this.children.map((t=>`${t.type}`)).join(" | ")}>`}}Et=Symbol.toStringTag,Kt[Et]=(t=>(t.mode=null,t.typeIds=null,t.children=null,t.typeIdToChildIndex=null,t.ArrayType=Int8Array,t[Symbol.toStringTag]="Union"))(Kt.prototype);class Xt extends Rt{constructor(t){super(),this.byteWidth=t}get typeId(){return c.FixedSizeBinary}toString(){return`FixedSizeBinary[${this.byteWidth}]`}}At=Symbol.toStringTag,Xt[At]=(t=>(t.byteWidth=null,t.ArrayType=Uint8Array,t[Symbol.toStringTag]="FixedSizeBinary"))(Xt.prototype);class Qt extends Rt{constructor(t,e){super(),this.listSize=t,this.children=[e]}get typeId(){return c.FixedSizeList}get valueType(){return this.children[0].type}get valueField(){return this.children[0]}get ArrayType(){return this.valueType.ArrayType}toString(){return`FixedSizeList[${this.listSize}]<${this.valueType}>`}}It=Symbol.toStringTag,Qt[It]=(t=>(t.children=null,t.listSize=null,t[Symbol.toStringTag]="FixedSizeList"))(Qt.prototype);class Zt extends Rt{constructor(t){let e=arguments.length>1&&void 0!==arguments[1]&&arguments[1];super(),this.children=[t],this.keysSorted=e}get typeId(){return c.Map}get keyType(){return this.children[0].type.children[0].type}get valueType(){return this.children[0].type.children[1].type}get childType(){return this.children[0].type}toString(){return`Map<{${this.children[0].type.children.map((t=>`${t.name}:${t.type}`)).join(", ")}}>`}}Mt=Symbol.toStringTag,Zt[Mt]=(t=>(t.children=null,t.keysSorted=null,t[Symbol.toStringTag]="Map_"))(Zt.prototype);const Jt=(te=-1,()=>++te);var te;class ee extends Rt{constructor(t,e,n,r){super(),this.indices=e,this.dictionary=t,this.isOrdered=r||!1,this.id=null==n?Jt():"number"===typeof n?n:n.low}get typeId(){return c.Dictionary}get children(){return this.dictionary.children}get valueType(){return this.dictionary}get ArrayType(){return this.dictionary.ArrayType}toString(){return`Dictionary<${this.indices}, ${this.dictionary}>`}}function ne(t){const e=t;switch(t.typeId){case c.Decimal:return t.bitWidth/32;case c.Timestamp:return 2;case c.Date:case c.Interval:return 1+e.unit;case c.FixedSizeList:return e.listSize;case c.FixedSizeBinary:return e.byteWidth;default:return 1}}Ft=Symbol.toStringTag,ee[Ft]=(t=>(t.id=null,t.indices=null,t.isOrdered=null,t.dictionary=null,t[Symbol.toStringTag]="Dictionary"))(ee.prototype);class re{visitMany(t){for(var e=arguments.length,n=new Array(e>1?e-1:0),r=1;r<e;r++)n[r-1]=arguments[r];return t.map(((t,e)=>this.visit(t,...n.map((t=>t[e])))))}visit(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return this.getVisitFn(e[0],!1).apply(this,e)}getVisitFn(t){return function(t,e){let n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];if("number"===typeof e)return ie(t,e,n);if("string"===typeof e&&e in c)return ie(t,c[e],n);if(e&&e instanceof Rt)return ie(t,oe(e),n);if((null===e||void 0===e?void 0:e.type)&&e.type instanceof Rt)return ie(t,oe(e.type),n);return ie(t,c.NONE,n)}(this,t,!(arguments.length>1&&void 0!==arguments[1])||arguments[1])}getVisitFnByTypeId(t){return ie(this,t,!(arguments.length>1&&void 0!==arguments[1])||arguments[1])}visitNull(t){return null}visitBool(t){return null}visitInt(t){return null}visitFloat(t){return null}visitUtf8(t){return null}visitBinary(t){return null}visitFixedSizeBinary(t){return null}visitDate(t){return null}visitTimestamp(t){return null}visitTime(t){return null}visitDecimal(t){return null}visitList(t){return null}visitStruct(t){return null}visitUnion(t){return null}visitDictionary(t){return null}visitInterval(t){return null}visitFixedSizeList(t){return null}visitMap(t){return null}}function ie(t,e){let n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],r=null;switch(e){case c.Null:r=t.visitNull;break;case c.Bool:r=t.visitBool;break;case c.Int:r=t.visitInt;break;case c.Int8:r=t.visitInt8||t.visitInt;break;case c.Int16:r=t.visitInt16||t.visitInt;break;case c.Int32:r=t.visitInt32||t.visitInt;break;case c.Int64:r=t.visitInt64||t.visitInt;break;case c.Uint8:r=t.visitUint8||t.visitInt;break;case c.Uint16:r=t.visitUint16||t.visitInt;break;case c.Uint32:r=t.visitUint32||t.visitInt;break;case c.Uint64:r=t.visitUint64||t.visitInt;break;case c.Float:r=t.visitFloat;break;case c.Float16:r=t.visitFloat16||t.visitFloat;break;case c.Float32:r=t.visitFloat32||t.visitFloat;break;case c.Float64:r=t.visitFloat64||t.visitFloat;break;case c.Utf8:r=t.visitUtf8;break;case c.Binary:r=t.visitBinary;break;case c.FixedSizeBinary:r=t.visitFixedSizeBinary;break;case c.Date:r=t.visitDate;break;case c.DateDay:r=t.visitDateDay||t.visitDate;break;case c.DateMillisecond:r=t.visitDateMillisecond||t.visitDate;break;case c.Timestamp:r=t.visitTimestamp;break;case c.TimestampSecond:r=t.visitTimestampSecond||t.visitTimestamp;break;case c.TimestampMillisecond:r=t.visitTimestampMillisecond||t.visitTimestamp;break;case c.TimestampMicrosecond:r=t.visitTimestampMicrosecond||t.visitTimestamp;break;case c.TimestampNanosecond:r=t.visitTimestampNanosecond||t.visitTimestamp;break;case c.Time:r=t.visitTime;break;case c.TimeSecond:r=t.visitTimeSecond||t.visitTime;break;case c.TimeMillisecond:r=t.visitTimeMillisecond||t.visitTime;break;case c.TimeMicrosecond:r=t.visitTimeMicrosecond||t.visitTime;break;case c.TimeNanosecond:r=t.visitTimeNanosecond||t.visitTime;break;case c.Decimal:r=t.visitDecimal;break;case c.List:r=t.visitList;break;case c.Struct:r=t.visitStruct;break;case c.Union:r=t.visitUnion;break;case c.DenseUnion:r=t.visitDenseUnion||t.visitUnion;break;case c.SparseUnion:r=t.visitSparseUnion||t.visitUnion;break;case c.Dictionary:r=t.visitDictionary;break;case c.Interval:r=t.visitInterval;break;case c.IntervalDayTime:r=t.visitIntervalDayTime||t.visitInterval;break;case c.IntervalYearMonth:r=t.visitIntervalYearMonth||t.visitInterval;break;case c.FixedSizeList:r=t.visitFixedSizeList;break;case c.Map:r=t.visitMap}if("function"===typeof r)return r;if(!n)return()=>null;throw new Error(`Unrecognized type '${c[e]}'`)}function oe(t){switch(t.typeId){case c.Null:return c.Null;case c.Int:{const{bitWidth:e,isSigned:n}=t;switch(e){case 8:return n?c.Int8:c.Uint8;case 16:return n?c.Int16:c.Uint16;case 32:return n?c.Int32:c.Uint32;case 64:return n?c.Int64:c.Uint64}return c.Int}case c.Float:switch(t.precision){case i.HALF:return c.Float16;case i.SINGLE:return c.Float32;case i.DOUBLE:return c.Float64}return c.Float;case c.Binary:return c.Binary;case c.Utf8:return c.Utf8;case c.Bool:return c.Bool;case c.Decimal:return c.Decimal;case c.Time:switch(t.unit){case a.SECOND:return c.TimeSecond;case a.MILLISECOND:return c.TimeMillisecond;case a.MICROSECOND:return c.TimeMicrosecond;case a.NANOSECOND:return c.TimeNanosecond}return c.Time;case c.Timestamp:switch(t.unit){case a.SECOND:return c.TimestampSecond;case a.MILLISECOND:return c.TimestampMillisecond;case a.MICROSECOND:return c.TimestampMicrosecond;case a.NANOSECOND:return c.TimestampNanosecond}return c.Timestamp;case c.Date:switch(t.unit){case o.DAY:return c.DateDay;case o.MILLISECOND:return c.DateMillisecond}return c.Date;case c.Interval:switch(t.unit){case s.DAY_TIME:return c.IntervalDayTime;case s.YEAR_MONTH:return c.IntervalYearMonth}return c.Interval;case c.Map:return c.Map;case c.List:return c.List;case c.Struct:return c.Struct;case c.Union:switch(t.mode){case r.Dense:return c.DenseUnion;case r.Sparse:return c.SparseUnion}return c.Union;case c.FixedSizeBinary:return c.FixedSizeBinary;case c.FixedSizeList:return c.FixedSizeList;case c.Dictionary:return c.Dictionary}throw new Error(`Unrecognized type '${c[t.typeId]}'`)}re.prototype.visitInt8=null,re.prototype.visitInt16=null,re.prototype.visitInt32=null,re.prototype.visitInt64=null,re.prototype.visitUint8=null,re.prototype.visitUint16=null,re.prototype.visitUint32=null,re.prototype.visitUint64=null,re.prototype.visitFloat16=null,re.prototype.visitFloat32=null,re.prototype.visitFloat64=null,re.prototype.visitDateDay=null,re.prototype.visitDateMillisecond=null,re.prototype.visitTimestampSecond=null,re.prototype.visitTimestampMillisecond=null,re.prototype.visitTimestampMicrosecond=null,re.prototype.visitTimestampNanosecond=null,re.prototype.visitTimeSecond=null,re.prototype.visitTimeMillisecond=null,re.prototype.visitTimeMicrosecond=null,re.prototype.visitTimeNanosecond=null,re.prototype.visitDenseUnion=null,re.prototype.visitSparseUnion=null,re.prototype.visitIntervalDayTime=null,re.prototype.visitIntervalYearMonth=null;const ae=new Float64Array(1),se=new Uint32Array(ae.buffer);function le(t){const e=(31744&t)>>10,n=(1023&t)/1024,r=Math.pow(-1,(32768&t)>>15);switch(e){case 31:return r*(n?Number.NaN:1/0);case 0:return r*(n?6103515625e-14*n:0)}return r*Math.pow(2,e-15)*(1+n)}class ce extends re{}function ue(t){return(e,n,r)=>{if(e.setValid(n,null!=r))return t(e,n,r)}}const de=(t,e,n)=>{t[e]=Math.trunc(n%4294967296),t[e+1]=Math.trunc(n/4294967296)},he=(t,e,n,r)=>{if(n+1<e.length){const{[n]:i,[n+1]:o}=e;t.set(r.subarray(0,o-i),i)}},fe=(t,e,n)=>{let{values:r}=t;r[e]=n},pe=(t,e,n)=>{let{values:r}=t;r[e]=n},ge=(t,e,n)=>{let{values:r}=t;r[e]=function(t){if(t!==t)return 32256;ae[0]=t;const e=(2147483648&se[1])>>16&65535;let n=2146435072&se[1],r=0;return n>=1089470464?se[0]>0?n=31744:(n=(2080374784&n)>>16,r=(1048575&se[1])>>10):n<=1056964608?(r=1048576+(1048575&se[1]),r=1048576+(r<<(n>>20)-998)>>21,n=0):(n=n-1056964608>>10,r=512+(1048575&se[1])>>10),e|n|65535&r}(n)},me=(t,e,n)=>{let{values:r}=t;((t,e,n)=>{t[e]=Math.trunc(n/864e5)})(r,e,n.valueOf())},ye=(t,e,n)=>{let{values:r}=t;de(r,2*e,n.valueOf())},be=(t,e,n)=>{let{values:r}=t;return de(r,2*e,n/1e3)},ve=(t,e,n)=>{let{values:r}=t;return de(r,2*e,n)},_e=(t,e,n)=>{let{values:r}=t;return((t,e,n)=>{t[e]=Math.trunc(1e3*n%4294967296),t[e+1]=Math.trunc(1e3*n/4294967296)})(r,2*e,n)},we=(t,e,n)=>{let{values:r}=t;return((t,e,n)=>{t[e]=Math.trunc(1e6*n%4294967296),t[e+1]=Math.trunc(1e6*n/4294967296)})(r,2*e,n)},xe=(t,e,n)=>{let{values:r}=t;r[e]=n},Se=(t,e,n)=>{let{values:r}=t;r[e]=n},ke=(t,e,n)=>{let{values:r}=t;r[e]=n},Ce=(t,e,n)=>{let{values:r}=t;r[e]=n},Te=(t,e,n)=>{const r=t.type.typeIdToChildIndex[t.typeIds[e]],i=t.children[r];Ie.visit(i,t.valueOffsets[e],n)},Pe=(t,e,n)=>{const r=t.type.typeIdToChildIndex[t.typeIds[e]],i=t.children[r];Ie.visit(i,e,n)},Ee=(t,e,n)=>{let{values:r}=t;r.set(n.subarray(0,2),2*e)},Ae=(t,e,n)=>{let{values:r}=t;r[e]=12*n[0]+n[1]%12};ce.prototype.visitBool=ue(((t,e,n)=>{let{offset:r,values:i}=t;const o=r+e;n?i[o>>3]|=1<<o%8:i[o>>3]&=~(1<<o%8)})),ce.prototype.visitInt=ue(fe),ce.prototype.visitInt8=ue(fe),ce.prototype.visitInt16=ue(fe),ce.prototype.visitInt32=ue(fe),ce.prototype.visitInt64=ue(fe),ce.prototype.visitUint8=ue(fe),ce.prototype.visitUint16=ue(fe),ce.prototype.visitUint32=ue(fe),ce.prototype.visitUint64=ue(fe),ce.prototype.visitFloat=ue(((t,e,n)=>{switch(t.type.precision){case i.HALF:return ge(t,e,n);case i.SINGLE:case i.DOUBLE:return pe(t,e,n)}})),ce.prototype.visitFloat16=ue(ge),ce.prototype.visitFloat32=ue(pe),ce.prototype.visitFloat64=ue(pe),ce.prototype.visitUtf8=ue(((t,e,n)=>{let{values:r,valueOffsets:i}=t;he(r,i,e,Y(n))})),ce.prototype.visitBinary=ue(((t,e,n)=>{let{values:r,valueOffsets:i}=t;return he(r,i,e,n)})),ce.prototype.visitFixedSizeBinary=ue(((t,e,n)=>{let{stride:r,values:i}=t;i.set(n.subarray(0,r),r*e)})),ce.prototype.visitDate=ue(((t,e,n)=>{t.type.unit===o.DAY?me(t,e,n):ye(t,e,n)})),ce.prototype.visitDateDay=ue(me),ce.prototype.visitDateMillisecond=ue(ye),ce.prototype.visitTimestamp=ue(((t,e,n)=>{switch(t.type.unit){case a.SECOND:return be(t,e,n);case a.MILLISECOND:return ve(t,e,n);case a.MICROSECOND:return _e(t,e,n);case a.NANOSECOND:return we(t,e,n)}})),ce.prototype.visitTimestampSecond=ue(be),ce.prototype.visitTimestampMillisecond=ue(ve),ce.prototype.visitTimestampMicrosecond=ue(_e),ce.prototype.visitTimestampNanosecond=ue(we),ce.prototype.visitTime=ue(((t,e,n)=>{switch(t.type.unit){case a.SECOND:return xe(t,e,n);case a.MILLISECOND:return Se(t,e,n);case a.MICROSECOND:return ke(t,e,n);case a.NANOSECOND:return Ce(t,e,n)}})),ce.prototype.visitTimeSecond=ue(xe),ce.prototype.visitTimeMillisecond=ue(Se),ce.prototype.visitTimeMicrosecond=ue(ke),ce.prototype.visitTimeNanosecond=ue(Ce),ce.prototype.visitDecimal=ue(((t,e,n)=>{let{values:r,stride:i}=t;r.set(n.subarray(0,i),i*e)})),ce.prototype.visitList=ue(((t,e,n)=>{const r=t.children[0],i=t.valueOffsets,o=Ie.getVisitFn(r);if(Array.isArray(n))for(let a=-1,s=i[e],l=i[e+1];s<l;)o(r,s++,n[++a]);else for(let a=-1,s=i[e],l=i[e+1];s<l;)o(r,s++,n.get(++a))})),ce.prototype.visitStruct=ue(((t,e,n)=>{const r=t.type.children.map((t=>Ie.getVisitFn(t.type))),i=n instanceof Map?(o=e,a=n,(t,e,n,r)=>e&&t(e,o,a.get(n.name))):n instanceof qn?((t,e)=>(n,r,i,o)=>r&&n(r,t,e.get(o)))(e,n):Array.isArray(n)?((t,e)=>(n,r,i,o)=>r&&n(r,t,e[o]))(e,n):((t,e)=>(n,r,i,o)=>r&&n(r,t,e[i.name]))(e,n);var o,a;t.type.children.forEach(((e,n)=>i(r[n],t.children[n],e,n)))})),ce.prototype.visitUnion=ue(((t,e,n)=>{t.type.mode===r.Dense?Te(t,e,n):Pe(t,e,n)})),ce.prototype.visitDenseUnion=ue(Te),ce.prototype.visitSparseUnion=ue(Pe),ce.prototype.visitDictionary=ue(((t,e,n)=>{var r;null===(r=t.dictionary)||void 0===r||r.set(t.values[e],n)})),ce.prototype.visitInterval=ue(((t,e,n)=>{t.type.unit===s.DAY_TIME?Ee(t,e,n):Ae(t,e,n)})),ce.prototype.visitIntervalDayTime=ue(Ee),ce.prototype.visitIntervalYearMonth=ue(Ae),ce.prototype.visitFixedSizeList=ue(((t,e,n)=>{const{stride:r}=t,i=t.children[0],o=Ie.getVisitFn(i);if(Array.isArray(n))for(let a=-1,s=e*r;++a<r;)o(i,s+a,n[a]);else for(let a=-1,s=e*r;++a<r;)o(i,s+a,n.get(a))})),ce.prototype.visitMap=ue(((t,e,n)=>{const r=t.children[0],{valueOffsets:i}=t,o=Ie.getVisitFn(r);let{[e]:a,[e+1]:s}=i;const l=n instanceof Map?n.entries():Object.entries(n);for(const c of l)if(o(r,a,c),++a>=s)break}));const Ie=new ce,Me=Symbol.for("parent"),Fe=Symbol.for("rowIndex");class De{constructor(t,e){return this[Me]=t,this[Fe]=e,new Proxy(this,new Oe)}toArray(){return Object.values(this.toJSON())}toJSON(){const t=this[Fe],e=this[Me],n=e.type.children,r={};for(let i=-1,o=n.length;++i<o;)r[n[i].name]=rn.visit(e.children[i],t);return r}toString(){return`{${[...this].map((t=>{let[e,n]=t;return`${L(e)}: ${L(n)}`})).join(", ")}}`}[Symbol.for("nodejs.util.inspect.custom")](){return this.toString()}[Symbol.iterator](){return new Re(this[Me],this[Fe])}}class Re{constructor(t,e){this.childIndex=0,this.children=t.children,this.rowIndex=e,this.childFields=t.type.children,this.numChildren=this.childFields.length}[Symbol.iterator](){return this}next(){const t=this.childIndex;return t<this.numChildren?(this.childIndex=t+1,{done:!1,value:[this.childFields[t].name,rn.visit(this.children[t],this.rowIndex)]}):{done:!0,value:null}}}Object.defineProperties(De.prototype,{[Symbol.toStringTag]:{enumerable:!1,configurable:!1,value:"Row"},[Me]:{writable:!0,enumerable:!1,configurable:!1,value:null},[Fe]:{writable:!0,enumerable:!1,configurable:!1,value:-1}});class Oe{isExtensible(){return!1}deleteProperty(){return!1}preventExtensions(){return!0}ownKeys(t){return t[Me].type.children.map((t=>t.name))}has(t,e){return-1!==t[Me].type.children.findIndex((t=>t.name===e))}getOwnPropertyDescriptor(t,e){if(-1!==t[Me].type.children.findIndex((t=>t.name===e)))return{writable:!0,enumerable:!0,configurable:!0}}get(t,e){if(Reflect.has(t,e))return t[e];const n=t[Me].type.children.findIndex((t=>t.name===e));if(-1!==n){const r=rn.visit(t[Me].children[n],t[Fe]);return Reflect.set(t,e,r),r}}set(t,e,n){const r=t[Me].type.children.findIndex((t=>t.name===e));return-1!==r?(Ie.visit(t[Me].children[r],t[Fe],n),Reflect.set(t,e,n)):!(!Reflect.has(t,e)&&"symbol"!==typeof e)&&Reflect.set(t,e,n)}}class Ne extends re{}function Le(t){return(e,n)=>e.getValid(n)?t(e,n):null}const Be=(t,e)=>4294967296*t[e+1]+(t[e]>>>0),ze=t=>new Date(t),je=(t,e,n)=>{if(n+1>=e.length)return null;const r=e[n],i=e[n+1];return t.subarray(r,i)},Ue=(t,e)=>{let{values:n}=t;return((t,e)=>ze(((t,e)=>864e5*t[e])(t,e)))(n,e)},Ve=(t,e)=>{let{values:n}=t;return((t,e)=>ze(Be(t,e)))(n,2*e)},$e=(t,e)=>{let{stride:n,values:r}=t;return r[n*e]},We=(t,e)=>{let{values:n}=t;return n[e]},Ge=(t,e)=>{let{values:n}=t;return 1e3*Be(n,2*e)},He=(t,e)=>{let{values:n}=t;return Be(n,2*e)},Ye=(t,e)=>{let{values:n}=t;return((t,e)=>t[e+1]/1e3*4294967296+(t[e]>>>0)/1e3)(n,2*e)},qe=(t,e)=>{let{values:n}=t;return((t,e)=>t[e+1]/1e6*4294967296+(t[e]>>>0)/1e6)(n,2*e)},Ke=(t,e)=>{let{values:n}=t;return n[e]},Xe=(t,e)=>{let{values:n}=t;return n[e]},Qe=(t,e)=>{let{values:n}=t;return n[e]},Ze=(t,e)=>{let{values:n}=t;return n[e]},Je=(t,e)=>{const n=t.type.typeIdToChildIndex[t.typeIds[e]],r=t.children[n];return rn.visit(r,t.valueOffsets[e])},tn=(t,e)=>{const n=t.type.typeIdToChildIndex[t.typeIds[e]],r=t.children[n];return rn.visit(r,e)},en=(t,e)=>{let{values:n}=t;return n.subarray(2*e,2*(e+1))},nn=(t,e)=>{let{values:n}=t;const r=n[e],i=new Int32Array(2);return i[0]=Math.trunc(r/12),i[1]=Math.trunc(r%12),i};Ne.prototype.visitNull=Le(((t,e)=>null)),Ne.prototype.visitBool=Le(((t,e)=>{let{offset:n,values:r}=t;const i=n+e;return 0!==(r[i>>3]&1<<i%8)})),Ne.prototype.visitInt=Le(((t,e)=>{let{values:n}=t;return n[e]})),Ne.prototype.visitInt8=Le($e),Ne.prototype.visitInt16=Le($e),Ne.prototype.visitInt32=Le($e),Ne.prototype.visitInt64=Le(We),Ne.prototype.visitUint8=Le($e),Ne.prototype.visitUint16=Le($e),Ne.prototype.visitUint32=Le($e),Ne.prototype.visitUint64=Le(We),Ne.prototype.visitFloat=Le(((t,e)=>{let{type:n,values:r}=t;return n.precision!==i.HALF?r[e]:le(r[e])})),Ne.prototype.visitFloat16=Le(((t,e)=>{let{stride:n,values:r}=t;return le(r[n*e])})),Ne.prototype.visitFloat32=Le($e),Ne.prototype.visitFloat64=Le($e),Ne.prototype.visitUtf8=Le(((t,e)=>{let{values:n,valueOffsets:r}=t;const i=je(n,r,e);return null!==i?G(i):null})),Ne.prototype.visitBinary=Le(((t,e)=>{let{values:n,valueOffsets:r}=t;return je(n,r,e)})),Ne.prototype.visitFixedSizeBinary=Le(((t,e)=>{let{stride:n,values:r}=t;return r.subarray(n*e,n*(e+1))})),Ne.prototype.visitDate=Le(((t,e)=>t.type.unit===o.DAY?Ue(t,e):Ve(t,e))),Ne.prototype.visitDateDay=Le(Ue),Ne.prototype.visitDateMillisecond=Le(Ve),Ne.prototype.visitTimestamp=Le(((t,e)=>{switch(t.type.unit){case a.SECOND:return Ge(t,e);case a.MILLISECOND:return He(t,e);case a.MICROSECOND:return Ye(t,e);case a.NANOSECOND:return qe(t,e)}})),Ne.prototype.visitTimestampSecond=Le(Ge),Ne.prototype.visitTimestampMillisecond=Le(He),Ne.prototype.visitTimestampMicrosecond=Le(Ye),Ne.prototype.visitTimestampNanosecond=Le(qe),Ne.prototype.visitTime=Le(((t,e)=>{switch(t.type.unit){case a.SECOND:return Ke(t,e);case a.MILLISECOND:return Xe(t,e);case a.MICROSECOND:return Qe(t,e);case a.NANOSECOND:return Ze(t,e)}})),Ne.prototype.visitTimeSecond=Le(Ke),Ne.prototype.visitTimeMillisecond=Le(Xe),Ne.prototype.visitTimeMicrosecond=Le(Qe),Ne.prototype.visitTimeNanosecond=Le(Ze),Ne.prototype.visitDecimal=Le(((t,e)=>{let{values:n,stride:r}=t;return ft.decimal(n.subarray(r*e,r*(e+1)))})),Ne.prototype.visitList=Le(((t,e)=>{const{valueOffsets:n,stride:r,children:i}=t,{[e*r]:o,[e*r+1]:a}=n,s=i[0].slice(o,a-o);return new qn([s])})),Ne.prototype.visitStruct=Le(((t,e)=>new De(t,e))),Ne.prototype.visitUnion=Le(((t,e)=>t.type.mode===r.Dense?Je(t,e):tn(t,e))),Ne.prototype.visitDenseUnion=Le(Je),Ne.prototype.visitSparseUnion=Le(tn),Ne.prototype.visitDictionary=Le(((t,e)=>{var n;return null===(n=t.dictionary)||void 0===n?void 0:n.get(t.values[e])})),Ne.prototype.visitInterval=Le(((t,e)=>t.type.unit===s.DAY_TIME?en(t,e):nn(t,e))),Ne.prototype.visitIntervalDayTime=Le(en),Ne.prototype.visitIntervalYearMonth=Le(nn),Ne.prototype.visitFixedSizeList=Le(((t,e)=>{const{stride:n,children:r}=t,i=r[0].slice(e*n,n);return new qn([i])})),Ne.prototype.visitMap=Le(((t,e)=>{const{valueOffsets:n,children:r}=t,{[e]:i,[e+1]:o}=n,a=r[0];return new sn(a.slice(i,o-i))}));const rn=new Ne,on=Symbol.for("keys"),an=Symbol.for("vals");class sn{constructor(t){return this[on]=new qn([t.children[0]]).memoize(),this[an]=t.children[1],new Proxy(this,new cn)}[Symbol.iterator](){return new ln(this[on],this[an])}get size(){return this[on].length}toArray(){return Object.values(this.toJSON())}toJSON(){const t=this[on],e=this[an],n={};for(let r=-1,i=t.length;++r<i;)n[t.get(r)]=rn.visit(e,r);return n}toString(){return`{${[...this].map((t=>{let[e,n]=t;return`${L(e)}: ${L(n)}`})).join(", ")}}`}[Symbol.for("nodejs.util.inspect.custom")](){return this.toString()}}class ln{constructor(t,e){this.keys=t,this.vals=e,this.keyIndex=0,this.numKeys=t.length}[Symbol.iterator](){return this}next(){const t=this.keyIndex;return t===this.numKeys?{done:!0,value:null}:(this.keyIndex++,{done:!1,value:[this.keys.get(t),rn.visit(this.vals,t)]})}}class cn{isExtensible(){return!1}deleteProperty(){return!1}preventExtensions(){return!0}ownKeys(t){return t[on].toArray().map(String)}has(t,e){return t[on].includes(e)}getOwnPropertyDescriptor(t,e){if(-1!==t[on].indexOf(e))return{writable:!0,enumerable:!0,configurable:!0}}get(t,e){if(Reflect.has(t,e))return t[e];const n=t[on].indexOf(e);if(-1!==n){const r=rn.visit(Reflect.get(t,an),n);return Reflect.set(t,e,r),r}}set(t,e,n){const r=t[on].indexOf(e);return-1!==r?(Ie.visit(Reflect.get(t,an),r,n),Reflect.set(t,e,n)):!!Reflect.has(t,e)&&Reflect.set(t,e,n)}}let un;function dn(t,e,n,r){const{length:i=0}=t;let o="number"!==typeof e?0:e,a="number"!==typeof n?i:n;return o<0&&(o=(o%i+i)%i),a<0&&(a=(a%i+i)%i),a<o&&(un=o,o=a,a=un),a>i&&(a=i),r?r(t,o,a):[o,a]}Object.defineProperties(sn.prototype,{[Symbol.toStringTag]:{enumerable:!1,configurable:!1,value:"Row"},[on]:{writable:!0,enumerable:!1,configurable:!1,value:null},[an]:{writable:!0,enumerable:!1,configurable:!1,value:null}});const hn=t=>t!==t;function fn(t){if("object"!==typeof t||null===t)return hn(t)?hn:e=>e===t;if(t instanceof Date){const e=t.valueOf();return t=>t instanceof Date&&t.valueOf()===e}return ArrayBuffer.isView(t)?e=>!!e&&function(t,e){let n=0;const r=t.length;if(r!==e.length)return!1;if(r>0)do{if(t[n]!==e[n])return!1}while(++n<r);return!0}(t,e):t instanceof Map?function(t){let e=-1;const n=[];for(const r of t.values())n[++e]=fn(r);return pn(n)}(t):Array.isArray(t)?function(t){const e=[];for(let n=-1,r=t.length;++n<r;)e[n]=fn(t[n]);return pn(e)}(t):t instanceof qn?function(t){const e=[];for(let n=-1,r=t.length;++n<r;)e[n]=fn(t.get(n));return pn(e)}(t):function(t){let e=arguments.length>1&&void 0!==arguments[1]&&arguments[1];const n=Object.keys(t);if(!e&&0===n.length)return()=>!1;const r=[];for(let i=-1,o=n.length;++i<o;)r[i]=fn(t[n[i]]);return pn(r,n)}(t,!0)}function pn(t,e){return n=>{if(!n||"object"!==typeof n)return!1;switch(n.constructor){case Array:return function(t,e){const n=t.length;if(e.length!==n)return!1;for(let r=-1;++r<n;)if(!t[r](e[r]))return!1;return!0}(t,n);case Map:return gn(t,n,n.keys());case sn:case De:case Object:case void 0:return gn(t,n,e||Object.keys(n))}return n instanceof qn&&function(t,e){const n=t.length;if(e.length!==n)return!1;for(let r=-1;++r<n;)if(!t[r](e.get(r)))return!1;return!0}(t,n)}}function gn(t,e,n){const r=n[Symbol.iterator](),i=e instanceof Map?e.keys():Object.keys(e)[Symbol.iterator](),o=e instanceof Map?e.values():Object.values(e)[Symbol.iterator]();let a=0;const s=t.length;let l=o.next(),c=r.next(),u=i.next();for(;a<s&&!c.done&&!u.done&&!l.done&&(c.value===u.value&&t[a](l.value));++a,c=r.next(),u=i.next(),l=o.next());return!!(a===s&&c.done&&u.done&&l.done)||(r.return&&r.return(),i.return&&i.return(),o.return&&o.return(),!1)}class mn{constructor(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:0,e=arguments.length>1?arguments[1]:void 0;this.numChunks=t,this.getChunkIterator=e,this.chunkIndex=0,this.chunkIterator=this.getChunkIterator(0)}next(){for(;this.chunkIndex<this.numChunks;){const t=this.chunkIterator.next();if(!t.done)return t;++this.chunkIndex<this.numChunks&&(this.chunkIterator=this.getChunkIterator(this.chunkIndex))}return{done:!0,value:null}}[Symbol.iterator](){return this}}function yn(t){return t.reduce(((t,e)=>t+e.nullCount),0)}function bn(t){return t.reduce(((t,e,n)=>(t[n+1]=t[n]+e.length,t)),new Uint32Array(t.length+1))}function vn(t,e,n,r){const i=[];for(let o=-1,a=t.length;++o<a;){const a=t[o],s=e[o],{length:l}=a;if(s>=r)break;if(n>=s+l)continue;if(s>=n&&s+l<=r){i.push(a);continue}const c=Math.max(0,n-s),u=Math.min(r-s,l);i.push(a.slice(c,u-c))}return 0===i.length&&i.push(t[0].slice(0,0)),i}function _n(t,e,n,r){let i=0,o=0,a=e.length-1;do{if(i>=a-1)return n<e[a]?r(t,i,n-e[i]):null;o=i+Math.trunc(.5*(a-i)),n<e[o]?a=o:i=o}while(i<a)}function wn(t,e){return t.getValid(e)}function xn(t){function e(e,n,r){return t(e[n],r)}return function(t){return _n(this.data,this._offsets,t,e)}}function Sn(t){let e;function n(n,r,i){return t(n[r],i,e)}return function(t,r){const i=this.data;e=r;const o=_n(i,this._offsets,t,n);return e=void 0,o}}function kn(t){let e;function n(n,r,i){let o=i,a=0,s=0;for(let l=r-1,c=n.length;++l<c;){const r=n[l];if(~(a=t(r,e,o)))return s+a;o=0,s+=r.length}return-1}return function(t,r){e=t;const i=this.data,o="number"!==typeof r?n(i,0,0):_n(i,this._offsets,r,n);return e=void 0,o}}function Cn(t,e,n,r){return 0!==(n&1<<r)}function Tn(t,e,n,r){return(n&1<<r)>>r}function Pn(t,e,n){const r=n.byteLength+7&-8;if(t>0||n.byteLength<r){const i=new Uint8Array(r);return i.set(t%8===0?n.subarray(t>>3):En(new An(n,t,e,null,Cn)).subarray(0,r)),i}return n}function En(t){const e=[];let n=0,r=0,i=0;for(const a of t)a&&(i|=1<<r),8===++r&&(e[n++]=i,i=r=0);(0===n||r>0)&&(e[n++]=i);const o=new Uint8Array(e.length+7&-8);return o.set(e),o}class An{constructor(t,e,n,r,i){this.bytes=t,this.length=n,this.context=r,this.get=i,this.bit=e%8,this.byteIndex=e>>3,this.byte=t[this.byteIndex++],this.index=0}next(){return this.index<this.length?(8===this.bit&&(this.bit=0,this.byte=this.bytes[this.byteIndex++]),{value:this.get(this.context,this.index++,this.byte,this.bit++)}):{done:!0,value:null}}[Symbol.iterator](){return this}}function In(t,e,n){if(n-e<=0)return 0;if(n-e<8){let r=0;for(const i of new An(t,e,n-e,t,Tn))r+=i;return r}const r=n>>3<<3,i=e+(e%8===0?0:8-e%8);return In(t,e,i)+In(t,r,n)+function(t,e,n){let r=0,i=Math.trunc(e);const o=new DataView(t.buffer,t.byteOffset,t.byteLength),a=void 0===n?t.byteLength:i+n;for(;a-i>=4;)r+=Mn(o.getUint32(i)),i+=4;for(;a-i>=2;)r+=Mn(o.getUint16(i)),i+=2;for(;a-i>=1;)r+=Mn(o.getUint8(i)),i+=1;return r}(t,i>>3,r-i>>3)}function Mn(t){let e=Math.trunc(t);return e-=e>>>1&1431655765,e=(858993459&e)+(e>>>2&858993459),16843009*(e+(e>>>4)&252645135)>>>24}class Fn extends re{}function Dn(t,e,n){if(void 0===e)return-1;if(null===e)return function(t,e){const{nullBitmap:n}=t;if(!n||t.nullCount<=0)return-1;let r=0;for(const i of new An(n,t.offset+(e||0),t.length,n,Cn)){if(!i)return r;++r}return-1}(t,n);const r=rn.getVisitFn(t),i=fn(e);for(let o=(n||0)-1,a=t.length;++o<a;)if(i(r(t,o)))return o;return-1}function Rn(t,e,n){const r=rn.getVisitFn(t),i=fn(e);for(let o=(n||0)-1,a=t.length;++o<a;)if(i(r(t,o)))return o;return-1}Fn.prototype.visitNull=function(t,e){return null===e&&t.length>0?0:-1},Fn.prototype.visitBool=Dn,Fn.prototype.visitInt=Dn,Fn.prototype.visitInt8=Dn,Fn.prototype.visitInt16=Dn,Fn.prototype.visitInt32=Dn,Fn.prototype.visitInt64=Dn,Fn.prototype.visitUint8=Dn,Fn.prototype.visitUint16=Dn,Fn.prototype.visitUint32=Dn,Fn.prototype.visitUint64=Dn,Fn.prototype.visitFloat=Dn,Fn.prototype.visitFloat16=Dn,Fn.prototype.visitFloat32=Dn,Fn.prototype.visitFloat64=Dn,Fn.prototype.visitUtf8=Dn,Fn.prototype.visitBinary=Dn,Fn.prototype.visitFixedSizeBinary=Dn,Fn.prototype.visitDate=Dn,Fn.prototype.visitDateDay=Dn,Fn.prototype.visitDateMillisecond=Dn,Fn.prototype.visitTimestamp=Dn,Fn.prototype.visitTimestampSecond=Dn,Fn.prototype.visitTimestampMillisecond=Dn,Fn.prototype.visitTimestampMicrosecond=Dn,Fn.prototype.visitTimestampNanosecond=Dn,Fn.prototype.visitTime=Dn,Fn.prototype.visitTimeSecond=Dn,Fn.prototype.visitTimeMillisecond=Dn,Fn.prototype.visitTimeMicrosecond=Dn,Fn.prototype.visitTimeNanosecond=Dn,Fn.prototype.visitDecimal=Dn,Fn.prototype.visitList=Dn,Fn.prototype.visitStruct=Dn,Fn.prototype.visitUnion=Dn,Fn.prototype.visitDenseUnion=Rn,Fn.prototype.visitSparseUnion=Rn,Fn.prototype.visitDictionary=Dn,Fn.prototype.visitInterval=Dn,Fn.prototype.visitIntervalDayTime=Dn,Fn.prototype.visitIntervalYearMonth=Dn,Fn.prototype.visitFixedSizeList=Dn,Fn.prototype.visitMap=Dn;const On=new Fn;class Nn extends re{}function Ln(t){const{type:e}=t;if(0===t.nullCount&&1===t.stride&&(e.typeId===c.Timestamp||e instanceof Nt&&64!==e.bitWidth||e instanceof Wt&&64!==e.bitWidth||e instanceof Bt&&e.precision!==i.HALF))return new mn(t.data.length,(e=>{const n=t.data[e];return n.values.subarray(0,n.length)[Symbol.iterator]()}));let n=0;return new mn(t.data.length,(e=>{const r=t.data[e].length,i=t.slice(n,n+r);return n+=r,new Bn(i)}))}class Bn{constructor(t){this.vector=t,this.index=0}next(){return this.index<this.vector.length?{value:this.vector.get(this.index++)}:{done:!0,value:null}}[Symbol.iterator](){return this}}Nn.prototype.visitNull=Ln,Nn.prototype.visitBool=Ln,Nn.prototype.visitInt=Ln,Nn.prototype.visitInt8=Ln,Nn.prototype.visitInt16=Ln,Nn.prototype.visitInt32=Ln,Nn.prototype.visitInt64=Ln,Nn.prototype.visitUint8=Ln,Nn.prototype.visitUint16=Ln,Nn.prototype.visitUint32=Ln,Nn.prototype.visitUint64=Ln,Nn.prototype.visitFloat=Ln,Nn.prototype.visitFloat16=Ln,Nn.prototype.visitFloat32=Ln,Nn.prototype.visitFloat64=Ln,Nn.prototype.visitUtf8=Ln,Nn.prototype.visitBinary=Ln,Nn.prototype.visitFixedSizeBinary=Ln,Nn.prototype.visitDate=Ln,Nn.prototype.visitDateDay=Ln,Nn.prototype.visitDateMillisecond=Ln,Nn.prototype.visitTimestamp=Ln,Nn.prototype.visitTimestampSecond=Ln,Nn.prototype.visitTimestampMillisecond=Ln,Nn.prototype.visitTimestampMicrosecond=Ln,Nn.prototype.visitTimestampNanosecond=Ln,Nn.prototype.visitTime=Ln,Nn.prototype.visitTimeSecond=Ln,Nn.prototype.visitTimeMillisecond=Ln,Nn.prototype.visitTimeMicrosecond=Ln,Nn.prototype.visitTimeNanosecond=Ln,Nn.prototype.visitDecimal=Ln,Nn.prototype.visitList=Ln,Nn.prototype.visitStruct=Ln,Nn.prototype.visitUnion=Ln,Nn.prototype.visitDenseUnion=Ln,Nn.prototype.visitSparseUnion=Ln,Nn.prototype.visitDictionary=Ln,Nn.prototype.visitInterval=Ln,Nn.prototype.visitIntervalDayTime=Ln,Nn.prototype.visitIntervalYearMonth=Ln,Nn.prototype.visitFixedSizeList=Ln,Nn.prototype.visitMap=Ln;const zn=new Nn,jn=(t,e)=>t+e;class Un extends re{visitNull(t,e){return 0}visitInt(t,e){return t.type.bitWidth/8}visitFloat(t,e){return t.type.ArrayType.BYTES_PER_ELEMENT}visitBool(t,e){return 1/8}visitDecimal(t,e){return t.type.bitWidth/8}visitDate(t,e){return 4*(t.type.unit+1)}visitTime(t,e){return t.type.bitWidth/8}visitTimestamp(t,e){return t.type.unit===a.SECOND?4:8}visitInterval(t,e){return 4*(t.type.unit+1)}visitStruct(t,e){return t.children.reduce(((t,n)=>t+Wn.visit(n,e)),0)}visitFixedSizeBinary(t,e){return t.type.byteWidth}visitMap(t,e){return 8+t.children.reduce(((t,n)=>t+Wn.visit(n,e)),0)}visitDictionary(t,e){var n;return t.type.indices.bitWidth/8+((null===(n=t.dictionary)||void 0===n?void 0:n.getByteLength(t.values[e]))||0)}}const Vn=(t,e)=>{let{type:n,children:r,typeIds:i,valueOffsets:o}=t;const a=n.typeIdToChildIndex[i[e]];return 8+Wn.visit(r[a],o[e])},$n=(t,e)=>{let{children:n}=t;return 4+Wn.visitMany(n,n.map((()=>e))).reduce(jn,0)};Un.prototype.visitUtf8=(t,e)=>{let{valueOffsets:n}=t;return n[e+1]-n[e]+8},Un.prototype.visitBinary=(t,e)=>{let{valueOffsets:n}=t;return n[e+1]-n[e]+8},Un.prototype.visitList=(t,e)=>{let{valueOffsets:n,stride:r,children:i}=t;const o=i[0],{[e*r]:a}=n,{[e*r+1]:s}=n,l=Wn.getVisitFn(o.type),c=o.slice(a,s-a);let u=8;for(let d=-1,h=s-a;++d<h;)u+=l(c,d);return u},Un.prototype.visitFixedSizeList=(t,e)=>{let{stride:n,children:r}=t;const i=r[0],o=i.slice(e*n,n),a=Wn.getVisitFn(i.type);let s=0;for(let l=-1,c=o.length;++l<c;)s+=a(o,l);return s},Un.prototype.visitUnion=(t,e)=>t.type.mode===r.Dense?Vn(t,e):$n(t,e),Un.prototype.visitDenseUnion=Vn,Un.prototype.visitSparseUnion=$n;const Wn=new Un;var Gn;const Hn={},Yn={};class qn{constructor(t){var e,n,r;const i=t[0]instanceof qn?t.flatMap((t=>t.data)):t;if(0===i.length||i.some((t=>!(t instanceof Xn))))throw new TypeError("Vector constructor expects an Array of Data instances.");const o=null===(e=i[0])||void 0===e?void 0:e.type;switch(i.length){case 0:this._offsets=[0];break;case 1:{const{get:t,set:e,indexOf:n,byteLength:r}=Hn[o.typeId],a=i[0];this.isValid=t=>wn(a,t),this.get=e=>t(a,e),this.set=(t,n)=>e(a,t,n),this.indexOf=t=>n(a,t),this.getByteLength=t=>r(a,t),this._offsets=[0,a.length];break}default:Object.setPrototypeOf(this,Yn[o.typeId]),this._offsets=bn(i)}this.data=i,this.type=o,this.stride=ne(o),this.numChildren=null!==(r=null===(n=o.children)||void 0===n?void 0:n.length)&&void 0!==r?r:0,this.length=this._offsets[this._offsets.length-1]}get byteLength(){return-1===this._byteLength&&(this._byteLength=this.data.reduce(((t,e)=>t+e.byteLength),0)),this._byteLength}get nullCount(){return-1===this._nullCount&&(this._nullCount=yn(this.data)),this._nullCount}get ArrayType(){return this.type.ArrayType}get[Symbol.toStringTag](){return`${this.VectorName}<${this.type[Symbol.toStringTag]}>`}get VectorName(){return`${c[this.type.typeId]}Vector`}isValid(t){return!1}get(t){return null}set(t,e){}indexOf(t,e){return-1}includes(t,e){return this.indexOf(t,e)>0}getByteLength(t){return 0}[Symbol.iterator](){return zn.visit(this)}concat(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return new qn(this.data.concat(e.flatMap((t=>t.data)).flat(Number.POSITIVE_INFINITY)))}slice(t,e){return new qn(dn(this,t,e,((t,e,n)=>{let{data:r,_offsets:i}=t;return vn(r,i,e,n)})))}toJSON(){return[...this]}toArray(){const{type:t,data:e,length:n,stride:r,ArrayType:i}=this;switch(t.typeId){case c.Int:case c.Float:case c.Decimal:case c.Time:case c.Timestamp:switch(e.length){case 0:return new i;case 1:return e[0].values.subarray(0,n*r);default:return e.reduce(((t,e)=>{let{values:n,length:i}=e;return t.array.set(n.subarray(0,i*r),t.offset),t.offset+=i*r,t}),{array:new i(n*r),offset:0}).array}}return[...this]}toString(){return`[${[...this].join(",")}]`}getChild(t){var e;return this.getChildAt(null===(e=this.type.children)||void 0===e?void 0:e.findIndex((e=>e.name===t)))}getChildAt(t){return t>-1&&t<this.numChildren?new qn(this.data.map((e=>{let{children:n}=e;return n[t]}))):null}get isMemoized(){return!!Rt.isDictionary(this.type)&&this.data[0].dictionary.isMemoized}memoize(){if(Rt.isDictionary(this.type)){const t=new Kn(this.data[0].dictionary),e=this.data.map((e=>{const n=e.clone();return n.dictionary=t,n}));return new qn(e)}return new Kn(this)}unmemoize(){if(Rt.isDictionary(this.type)&&this.isMemoized){const t=this.data[0].dictionary.unmemoize(),e=this.data.map((e=>{const n=e.clone();return n.dictionary=t,n}));return new qn(e)}return this}}Gn=Symbol.toStringTag,qn[Gn]=(t=>{t.type=Rt.prototype,t.data=[],t.length=0,t.stride=1,t.numChildren=0,t._nullCount=-1,t._byteLength=-1,t._offsets=new Uint32Array([0]),t[Symbol.isConcatSpreadable]=!0;const e=Object.keys(c).map((t=>c[t])).filter((t=>"number"===typeof t&&t!==c.NONE));for(const n of e){const e=rn.getVisitFnByTypeId(n),r=Ie.getVisitFnByTypeId(n),i=On.getVisitFnByTypeId(n),o=Wn.getVisitFnByTypeId(n);Hn[n]={get:e,set:r,indexOf:i,byteLength:o},Yn[n]=Object.create(t,{isValid:{value:xn(wn)},get:{value:xn(rn.getVisitFnByTypeId(n))},set:{value:Sn(Ie.getVisitFnByTypeId(n))},indexOf:{value:kn(On.getVisitFnByTypeId(n))},getByteLength:{value:xn(Wn.getVisitFnByTypeId(n))}})}return"Vector"})(qn.prototype);class Kn extends qn{constructor(t){super(t.data);const e=this.get,n=this.set,r=this.slice,i=new Array(this.length);Object.defineProperty(this,"get",{value(t){const n=i[t];if(void 0!==n)return n;const r=e.call(this,t);return i[t]=r,r}}),Object.defineProperty(this,"set",{value(t,e){n.call(this,t,e),i[t]=e}}),Object.defineProperty(this,"slice",{value:(t,e)=>new Kn(r.call(this,t,e))}),Object.defineProperty(this,"isMemoized",{value:!0}),Object.defineProperty(this,"unmemoize",{value:()=>new qn(this.data)}),Object.defineProperty(this,"memoize",{value:()=>this})}}class Xn{constructor(t,e,n,r,i){let o,a=arguments.length>5&&void 0!==arguments[5]?arguments[5]:[],s=arguments.length>6?arguments[6]:void 0;this.type=t,this.children=a,this.dictionary=s,this.offset=Math.floor(Math.max(e||0,0)),this.length=Math.floor(Math.max(n||0,0)),this._nullCount=Math.floor(Math.max(r||0,-1)),i instanceof Xn?(this.stride=i.stride,this.values=i.values,this.typeIds=i.typeIds,this.nullBitmap=i.nullBitmap,this.valueOffsets=i.valueOffsets):(this.stride=ne(t),i&&((o=i[0])&&(this.valueOffsets=o),(o=i[1])&&(this.values=o),(o=i[2])&&(this.nullBitmap=o),(o=i[3])&&(this.typeIds=o))),this.nullable=0!==this._nullCount&&this.nullBitmap&&this.nullBitmap.byteLength>0}get typeId(){return this.type.typeId}get ArrayType(){return this.type.ArrayType}get buffers(){return[this.valueOffsets,this.values,this.nullBitmap,this.typeIds]}get byteLength(){let t=0;const{valueOffsets:e,values:n,nullBitmap:r,typeIds:i}=this;return e&&(t+=e.byteLength),n&&(t+=n.byteLength),r&&(t+=r.byteLength),i&&(t+=i.byteLength),this.children.reduce(((t,e)=>t+e.byteLength),t)}get nullCount(){let t,e=this._nullCount;return e<=-1&&(t=this.nullBitmap)&&(this._nullCount=e=this.length-In(t,this.offset,this.offset+this.length)),e}getValid(t){if(this.nullable&&this.nullCount>0){const e=this.offset+t;return 0!==(this.nullBitmap[e>>3]&1<<e%8)}return!0}setValid(t,e){if(!this.nullable)return e;if(!this.nullBitmap||this.nullBitmap.byteLength<=t>>3){const{nullBitmap:t}=this._changeLengthAndBackfillNullBitmap(this.length);Object.assign(this,{nullBitmap:t,_nullCount:0})}const{nullBitmap:n,offset:r}=this,i=r+t>>3,o=(r+t)%8,a=n[i]>>o&1;return e?0===a&&(n[i]|=1<<o,this._nullCount=this.nullCount+1):1===a&&(n[i]&=~(1<<o),this._nullCount=this.nullCount-1),e}clone(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this.type,e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.offset,n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:this.length,r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:this._nullCount,i=arguments.length>4&&void 0!==arguments[4]?arguments[4]:this,o=arguments.length>5&&void 0!==arguments[5]?arguments[5]:this.children;return new Xn(t,e,n,r,i,o,this.dictionary)}slice(t,e){const{stride:n,typeId:r,children:i}=this,o=+(0===this._nullCount)-1,a=16===r?n:1,s=this._sliceBuffers(t,e,n,r);return this.clone(this.type,this.offset+t,e,o,s,0===i.length||this.valueOffsets?i:this._sliceChildren(i,a*t,a*e))}_changeLengthAndBackfillNullBitmap(t){if(this.typeId===c.Null)return this.clone(this.type,0,t,0);const{length:e,nullCount:n}=this,r=new Uint8Array((t+63&-64)>>3).fill(255,0,e>>3);r[e>>3]=(1<<e-(-8&e))-1,n>0&&r.set(Pn(this.offset,e,this.nullBitmap),0);const i=this.buffers;return i[u.VALIDITY]=r,this.clone(this.type,0,t,n+(t-e),i)}_sliceBuffers(t,e,n,r){let i;const{buffers:o}=this;return(i=o[u.TYPE])&&(o[u.TYPE]=i.subarray(t,t+e)),(i=o[u.OFFSET])&&(o[u.OFFSET]=i.subarray(t,t+e+1))||(i=o[u.DATA])&&(o[u.DATA]=6===r?i:i.subarray(n*t,n*(t+e))),o}_sliceChildren(t,e,n){return t.map((t=>t.slice(e,n)))}}Xn.prototype.children=Object.freeze([]);class Qn extends re{visit(t){return this.getVisitFn(t.type).call(this,t)}visitNull(t){const{type:e,offset:n=0,length:r=0}=t;return new Xn(e,n,r,0)}visitBool(t){const{type:e,offset:n=0}=t,r=J(t.nullBitmap),i=Q(e.ArrayType,t.data),{length:o=i.length>>3,nullCount:a=(t.nullBitmap?-1:0)}=t;return new Xn(e,n,o,a,[void 0,i,r])}visitInt(t){const{type:e,offset:n=0}=t,r=J(t.nullBitmap),i=Q(e.ArrayType,t.data),{length:o=i.length,nullCount:a=(t.nullBitmap?-1:0)}=t;return new Xn(e,n,o,a,[void 0,i,r])}visitFloat(t){const{type:e,offset:n=0}=t,r=J(t.nullBitmap),i=Q(e.ArrayType,t.data),{length:o=i.length,nullCount:a=(t.nullBitmap?-1:0)}=t;return new Xn(e,n,o,a,[void 0,i,r])}visitUtf8(t){const{type:e,offset:n=0}=t,r=J(t.data),i=J(t.nullBitmap),o=Z(t.valueOffsets),{length:a=o.length-1,nullCount:s=(t.nullBitmap?-1:0)}=t;return new Xn(e,n,a,s,[o,r,i])}visitBinary(t){const{type:e,offset:n=0}=t,r=J(t.data),i=J(t.nullBitmap),o=Z(t.valueOffsets),{length:a=o.length-1,nullCount:s=(t.nullBitmap?-1:0)}=t;return new Xn(e,n,a,s,[o,r,i])}visitFixedSizeBinary(t){const{type:e,offset:n=0}=t,r=J(t.nullBitmap),i=Q(e.ArrayType,t.data),{length:o=i.length/ne(e),nullCount:a=(t.nullBitmap?-1:0)}=t;return new Xn(e,n,o,a,[void 0,i,r])}visitDate(t){const{type:e,offset:n=0}=t,r=J(t.nullBitmap),i=Q(e.ArrayType,t.data),{length:o=i.length/ne(e),nullCount:a=(t.nullBitmap?-1:0)}=t;return new Xn(e,n,o,a,[void 0,i,r])}visitTimestamp(t){const{type:e,offset:n=0}=t,r=J(t.nullBitmap),i=Q(e.ArrayType,t.data),{length:o=i.length/ne(e),nullCount:a=(t.nullBitmap?-1:0)}=t;return new Xn(e,n,o,a,[void 0,i,r])}visitTime(t){const{type:e,offset:n=0}=t,r=J(t.nullBitmap),i=Q(e.ArrayType,t.data),{length:o=i.length/ne(e),nullCount:a=(t.nullBitmap?-1:0)}=t;return new Xn(e,n,o,a,[void 0,i,r])}visitDecimal(t){const{type:e,offset:n=0}=t,r=J(t.nullBitmap),i=Q(e.ArrayType,t.data),{length:o=i.length/ne(e),nullCount:a=(t.nullBitmap?-1:0)}=t;return new Xn(e,n,o,a,[void 0,i,r])}visitList(t){const{type:e,offset:n=0,child:r}=t,i=J(t.nullBitmap),o=Z(t.valueOffsets),{length:a=o.length-1,nullCount:s=(t.nullBitmap?-1:0)}=t;return new Xn(e,n,a,s,[o,void 0,i],[r])}visitStruct(t){const{type:e,offset:n=0,children:r=[]}=t,i=J(t.nullBitmap),{length:o=r.reduce(((t,e)=>{let{length:n}=e;return Math.max(t,n)}),0),nullCount:a=(t.nullBitmap?-1:0)}=t;return new Xn(e,n,o,a,[void 0,void 0,i],r)}visitUnion(t){const{type:e,offset:n=0,children:r=[]}=t,i=J(t.nullBitmap),o=Q(e.ArrayType,t.typeIds),{length:a=o.length,nullCount:s=(t.nullBitmap?-1:0)}=t;if(Rt.isSparseUnion(e))return new Xn(e,n,a,s,[void 0,void 0,i,o],r);const l=Z(t.valueOffsets);return new Xn(e,n,a,s,[l,void 0,i,o],r)}visitDictionary(t){const{type:e,offset:n=0}=t,r=J(t.nullBitmap),i=Q(e.indices.ArrayType,t.data),{dictionary:o=new qn([(new Qn).visit({type:e.dictionary})])}=t,{length:a=i.length,nullCount:s=(t.nullBitmap?-1:0)}=t;return new Xn(e,n,a,s,[void 0,i,r],[],o)}visitInterval(t){const{type:e,offset:n=0}=t,r=J(t.nullBitmap),i=Q(e.ArrayType,t.data),{length:o=i.length/ne(e),nullCount:a=(t.nullBitmap?-1:0)}=t;return new Xn(e,n,o,a,[void 0,i,r])}visitFixedSizeList(t){const{type:e,offset:n=0,child:r=(new Qn).visit({type:e.valueType})}=t,i=J(t.nullBitmap),{length:o=r.length/ne(e),nullCount:a=(t.nullBitmap?-1:0)}=t;return new Xn(e,n,o,a,[void 0,void 0,i],[r])}visitMap(t){const{type:e,offset:n=0,child:r=(new Qn).visit({type:e.childType})}=t,i=J(t.nullBitmap),o=Z(t.valueOffsets),{length:a=o.length-1,nullCount:s=(t.nullBitmap?-1:0)}=t;return new Xn(e,n,a,s,[o,void 0,i],[r])}}function Zn(t){return(new Qn).visit(t)}class Jn{constructor(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:[],e=arguments.length>1?arguments[1]:void 0,n=arguments.length>2?arguments[2]:void 0;this.fields=t||[],this.metadata=e||new Map,n||(n=nr(t)),this.dictionaries=n}get[Symbol.toStringTag](){return"Schema"}get names(){return this.fields.map((t=>t.name))}toString(){return`Schema<{ ${this.fields.map(((t,e)=>`${e}: ${t}`)).join(", ")} }>`}select(t){const e=new Set(t),n=this.fields.filter((t=>e.has(t.name)));return new Jn(n,this.metadata)}selectAt(t){const e=t.map((t=>this.fields[t])).filter(Boolean);return new Jn(e,this.metadata)}assign(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];const r=e[0]instanceof Jn?e[0]:Array.isArray(e[0])?new Jn(e[0]):new Jn(e),i=[...this.fields],o=er(er(new Map,this.metadata),r.metadata),a=r.fields.filter((t=>{const e=i.findIndex((e=>e.name===t.name));return!~e||(i[e]=t.clone({metadata:er(er(new Map,i[e].metadata),t.metadata)}))&&!1})),s=nr(a,new Map);return new Jn([...i,...a],o,new Map([...this.dictionaries,...s]))}}Jn.prototype.fields=null,Jn.prototype.metadata=null,Jn.prototype.dictionaries=null;class tr{constructor(t,e){let n=arguments.length>2&&void 0!==arguments[2]&&arguments[2],r=arguments.length>3?arguments[3]:void 0;this.name=t,this.type=e,this.nullable=n,this.metadata=r||new Map}static new(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];let[r,i,o,a]=e;return e[0]&&"object"===typeof e[0]&&(({name:r}=e[0]),void 0===i&&(i=e[0].type),void 0===o&&(o=e[0].nullable),void 0===a&&(a=e[0].metadata)),new tr(`${r}`,i,o,a)}get typeId(){return this.type.typeId}get[Symbol.toStringTag](){return"Field"}toString(){return`${this.name}: ${this.type}`}clone(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];let[r,i,o,a]=e;return e[0]&&"object"===typeof e[0]?({name:r=this.name,type:i=this.type,nullable:o=this.nullable,metadata:a=this.metadata}=e[0]):[r=this.name,i=this.type,o=this.nullable,a=this.metadata]=e,tr.new(r,i,o,a)}}function er(t,e){return new Map([...t||new Map,...e||new Map])}function nr(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Map;for(let n=-1,r=t.length;++n<r;){const r=t[n].type;if(Rt.isDictionary(r))if(e.has(r.id)){if(e.get(r.id)!==r.dictionary)throw new Error("Cannot create Schema containing two different dictionaries with the same Id")}else e.set(r.id,r.dictionary);r.children&&r.children.length>0&&nr(r.children,e)}return e}tr.prototype.type=null,tr.prototype.name=null,tr.prototype.nullable=null,tr.prototype.metadata=null;class rr extends re{compareSchemas(t,e){return t===e||e instanceof t.constructor&&this.compareManyFields(t.fields,e.fields)}compareManyFields(t,e){return t===e||Array.isArray(t)&&Array.isArray(e)&&t.length===e.length&&t.every(((t,n)=>this.compareFields(t,e[n])))}compareFields(t,e){return t===e||e instanceof t.constructor&&t.name===e.name&&t.nullable===e.nullable&&this.visit(t.type,e.type)}}function ir(t,e){return e instanceof t.constructor}function or(t,e){return t===e||ir(t,e)}function ar(t,e){return t===e||ir(t,e)&&t.bitWidth===e.bitWidth&&t.isSigned===e.isSigned}function sr(t,e){return t===e||ir(t,e)&&t.precision===e.precision}function lr(t,e){return t===e||ir(t,e)&&t.unit===e.unit}function cr(t,e){return t===e||ir(t,e)&&t.unit===e.unit&&t.timezone===e.timezone}function ur(t,e){return t===e||ir(t,e)&&t.unit===e.unit&&t.bitWidth===e.bitWidth}function dr(t,e){return t===e||ir(t,e)&&t.mode===e.mode&&t.typeIds.every(((t,n)=>t===e.typeIds[n]))&&fr.compareManyFields(t.children,e.children)}function hr(t,e){return t===e||ir(t,e)&&t.unit===e.unit}rr.prototype.visitNull=or,rr.prototype.visitBool=or,rr.prototype.visitInt=ar,rr.prototype.visitInt8=ar,rr.prototype.visitInt16=ar,rr.prototype.visitInt32=ar,rr.prototype.visitInt64=ar,rr.prototype.visitUint8=ar,rr.prototype.visitUint16=ar,rr.prototype.visitUint32=ar,rr.prototype.visitUint64=ar,rr.prototype.visitFloat=sr,rr.prototype.visitFloat16=sr,rr.prototype.visitFloat32=sr,rr.prototype.visitFloat64=sr,rr.prototype.visitUtf8=or,rr.prototype.visitBinary=or,rr.prototype.visitFixedSizeBinary=function(t,e){return t===e||ir(t,e)&&t.byteWidth===e.byteWidth},rr.prototype.visitDate=lr,rr.prototype.visitDateDay=lr,rr.prototype.visitDateMillisecond=lr,rr.prototype.visitTimestamp=cr,rr.prototype.visitTimestampSecond=cr,rr.prototype.visitTimestampMillisecond=cr,rr.prototype.visitTimestampMicrosecond=cr,rr.prototype.visitTimestampNanosecond=cr,rr.prototype.visitTime=ur,rr.prototype.visitTimeSecond=ur,rr.prototype.visitTimeMillisecond=ur,rr.prototype.visitTimeMicrosecond=ur,rr.prototype.visitTimeNanosecond=ur,rr.prototype.visitDecimal=or,rr.prototype.visitList=function(t,e){return t===e||ir(t,e)&&t.children.length===e.children.length&&fr.compareManyFields(t.children,e.children)},rr.prototype.visitStruct=function(t,e){return t===e||ir(t,e)&&t.children.length===e.children.length&&fr.compareManyFields(t.children,e.children)},rr.prototype.visitUnion=dr,rr.prototype.visitDenseUnion=dr,rr.prototype.visitSparseUnion=dr,rr.prototype.visitDictionary=function(t,e){return t===e||ir(t,e)&&t.id===e.id&&t.isOrdered===e.isOrdered&&fr.visit(t.indices,e.indices)&&fr.visit(t.dictionary,e.dictionary)},rr.prototype.visitInterval=hr,rr.prototype.visitIntervalDayTime=hr,rr.prototype.visitIntervalYearMonth=hr,rr.prototype.visitFixedSizeList=function(t,e){return t===e||ir(t,e)&&t.listSize===e.listSize&&t.children.length===e.children.length&&fr.compareManyFields(t.children,e.children)},rr.prototype.visitMap=function(t,e){return t===e||ir(t,e)&&t.keysSorted===e.keysSorted&&t.children.length===e.children.length&&fr.compareManyFields(t.children,e.children)};const fr=new rr;function pr(t,e){return fr.compareSchemas(t,e)}var gr,mr;class yr{constructor(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];switch(e.length){case 2:if([this.schema]=e,!(this.schema instanceof Jn))throw new TypeError("RecordBatch constructor expects a [Schema, Data] pair.");if([,this.data=Zn({nullCount:0,type:new qt(this.schema.fields),children:this.schema.fields.map((t=>Zn({type:t.type,nullCount:0})))})]=e,!(this.data instanceof Xn))throw new TypeError("RecordBatch constructor expects a [Schema, Data] pair.");[this.schema,this.data]=br(this.schema,this.data.children);break;case 1:{const[t]=e,{fields:n,children:r,length:i}=Object.keys(t).reduce(((e,n,r)=>(e.children[r]=t[n],e.length=Math.max(e.length,t[n].length),e.fields[r]=tr.new({name:n,type:t[n].type,nullable:!0}),e)),{length:0,fields:new Array,children:new Array}),o=new Jn(n),a=Zn({type:new qt(n),length:i,children:r,nullCount:0});[this.schema,this.data]=br(o,a.children,i);break}default:throw new TypeError("RecordBatch constructor expects an Object mapping names to child Data, or a [Schema, Data] pair.")}}get dictionaries(){return this._dictionaries||(this._dictionaries=vr(this.schema.fields,this.data.children))}get numCols(){return this.schema.fields.length}get numRows(){return this.data.length}get nullCount(){return this.data.nullCount}isValid(t){return this.data.getValid(t)}get(t){return rn.visit(this.data,t)}set(t,e){return Ie.visit(this.data,t,e)}indexOf(t,e){return On.visit(this.data,t,e)}getByteLength(t){return Wn.visit(this.data,t)}[Symbol.iterator](){return zn.visit(new qn([this.data]))}toArray(){return[...this]}concat(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return new Sr(this.schema,[this,...e])}slice(t,e){const[n]=new qn([this.data]).slice(t,e).data;return new yr(this.schema,n)}getChild(t){var e;return this.getChildAt(null===(e=this.schema.fields)||void 0===e?void 0:e.findIndex((e=>e.name===t)))}getChildAt(t){return t>-1&&t<this.schema.fields.length?new qn([this.data.children[t]]):null}setChild(t,e){var n;return this.setChildAt(null===(n=this.schema.fields)||void 0===n?void 0:n.findIndex((e=>e.name===t)),e)}setChildAt(t,e){let n=this.schema,r=this.data;if(t>-1&&t<this.numCols){e||(e=new qn([Zn({type:new Ot,length:this.numRows})]));const i=n.fields.slice(),o=r.children.slice(),a=i[t].clone({type:e.type});[i[t],o[t]]=[a,e.data[0]],n=new Jn(i,new Map(this.schema.metadata)),r=Zn({type:new qt(i),children:o})}return new yr(n,r)}select(t){const e=this.schema.select(t),n=new qt(e.fields),r=[];for(const i of t){const t=this.schema.fields.findIndex((t=>t.name===i));~t&&(r[t]=this.data.children[t])}return new yr(e,Zn({type:n,length:this.numRows,children:r}))}selectAt(t){const e=this.schema.selectAt(t),n=t.map((t=>this.data.children[t])).filter(Boolean),r=Zn({type:new qt(e.fields),length:this.numRows,children:n});return new yr(e,r)}}function br(t,e){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:e.reduce(((t,e)=>Math.max(t,e.length)),0);var r;const i=[...t.fields],o=[...e],a=(n+63&-64)>>3;for(const[s,l]of t.fields.entries()){const t=e[s];t&&t.length===n||(i[s]=l.clone({nullable:!0}),o[s]=null!==(r=null===t||void 0===t?void 0:t._changeLengthAndBackfillNullBitmap(n))&&void 0!==r?r:Zn({type:l.type,length:n,nullCount:n,nullBitmap:new Uint8Array(a)}))}return[t.assign(i),Zn({type:new qt(i),length:n,children:o})]}function vr(t,e){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:new Map;for(let r=-1,i=t.length;++r<i;){const i=t[r].type,o=e[r];if(Rt.isDictionary(i))if(n.has(i.id)){if(n.get(i.id)!==o.dictionary)throw new Error("Cannot create Schema containing two different dictionaries with the same Id")}else o.dictionary&&n.set(i.id,o.dictionary);i.children&&i.children.length>0&&vr(i.children,o.children,n)}return n}gr=Symbol.toStringTag,yr[gr]=(t=>(t._nullCount=-1,t[Symbol.isConcatSpreadable]=!0,"RecordBatch"))(yr.prototype);class _r extends yr{constructor(t){const e=t.fields.map((t=>Zn({type:t.type})));super(t,Zn({type:new qt(t.fields),nullCount:0,children:e}))}}function wr(t,e){return function(t,e){const n=[...t.fields],r=[],i={numBatches:e.reduce(((t,e)=>Math.max(t,e.length)),0)};let o=0,a=0,s=-1;const l=e.length;let c,u=[];for(;i.numBatches-- >0;){for(a=Number.POSITIVE_INFINITY,s=-1;++s<l;)u[s]=c=e[s].shift(),a=Math.min(a,c?c.length:a);Number.isFinite(a)&&(u=xr(n,a,u,e,i),a>0&&(r[o++]=Zn({type:new qt(n),length:a,nullCount:0,children:u.slice()})))}return[t=t.assign(n),r.map((e=>new yr(t,e)))]}(t,e.map((t=>t.data.concat())))}function xr(t,e,n,r,i){var o;const a=(e+63&-64)>>3;for(let s=-1,l=r.length;++s<l;){const l=n[s],c=null===l||void 0===l?void 0:l.length;if(c>=e)c===e?n[s]=l:(n[s]=l.slice(0,e),i.numBatches=Math.max(i.numBatches,r[s].unshift(l.slice(e,c-e))));else{const r=t[s];t[s]=r.clone({nullable:!0}),n[s]=null!==(o=null===l||void 0===l?void 0:l._changeLengthAndBackfillNullBitmap(e))&&void 0!==o?o:Zn({type:r.type,length:e,nullCount:e,nullBitmap:new Uint8Array(a)})}}return n}class Sr{constructor(){for(var t,e,n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];if(0===r.length)return this.batches=[],this.schema=new Jn([]),this._offsets=[0],this;let o,a;r[0]instanceof Jn&&(o=r.shift()),r[r.length-1]instanceof Uint32Array&&(a=r.pop());const s=t=>{if(t){if(t instanceof yr)return[t];if(t instanceof Sr)return t.batches;if(t instanceof Xn){if(t.type instanceof qt)return[new yr(new Jn(t.type.children),t)]}else{if(Array.isArray(t))return t.flatMap((t=>s(t)));if("function"===typeof t[Symbol.iterator])return[...t].flatMap((t=>s(t)));if("object"===typeof t){const e=Object.keys(t),n=e.map((e=>new qn([t[e]]))),r=new Jn(e.map(((t,e)=>new tr(String(t),n[e].type)))),[,i]=wr(r,n);return 0===i.length?[new yr(t)]:i}}}return[]},l=r.flatMap((t=>s(t)));if(o=null!==(e=null!==o&&void 0!==o?o:null===(t=l[0])||void 0===t?void 0:t.schema)&&void 0!==e?e:new Jn([]),!(o instanceof Jn))throw new TypeError("Table constructor expects a [Schema, RecordBatch[]] pair.");for(const c of l){if(!(c instanceof yr))throw new TypeError("Table constructor expects a [Schema, RecordBatch[]] pair.");if(!pr(o,c.schema))throw new TypeError("Table and inner RecordBatch schemas must be equivalent.")}this.schema=o,this.batches=l,this._offsets=null!==a&&void 0!==a?a:bn(this.data)}get data(){return this.batches.map((t=>{let{data:e}=t;return e}))}get numCols(){return this.schema.fields.length}get numRows(){return this.data.reduce(((t,e)=>t+e.length),0)}get nullCount(){return-1===this._nullCount&&(this._nullCount=yn(this.data)),this._nullCount}isValid(t){return!1}get(t){return null}set(t,e){}indexOf(t,e){return-1}getByteLength(t){return 0}[Symbol.iterator](){return this.batches.length>0?zn.visit(new qn(this.data)):new Array(0)[Symbol.iterator]()}toArray(){return[...this]}toString(){return`[\n  ${this.toArray().join(",\n  ")}\n]`}concat(){const t=this.schema;for(var e=arguments.length,n=new Array(e),r=0;r<e;r++)n[r]=arguments[r];const i=this.data.concat(n.flatMap((t=>{let{data:e}=t;return e})));return new Sr(t,i.map((e=>new yr(t,e))))}slice(t,e){const n=this.schema;[t,e]=dn({length:this.numRows},t,e);const r=vn(this.data,this._offsets,t,e);return new Sr(n,r.map((t=>new yr(n,t))))}getChild(t){return this.getChildAt(this.schema.fields.findIndex((e=>e.name===t)))}getChildAt(t){if(t>-1&&t<this.schema.fields.length){const e=this.data.map((e=>e.children[t]));if(0===e.length){const{type:n}=this.schema.fields[t],r=Zn({type:n,length:0,nullCount:0});e.push(r._changeLengthAndBackfillNullBitmap(this.numRows))}return new qn(e)}return null}setChild(t,e){var n;return this.setChildAt(null===(n=this.schema.fields)||void 0===n?void 0:n.findIndex((e=>e.name===t)),e)}setChildAt(t,e){let n=this.schema,r=[...this.batches];if(t>-1&&t<this.numCols){e||(e=new qn([Zn({type:new Ot,length:this.numRows})]));const i=n.fields.slice(),o=i[t].clone({type:e.type}),a=this.schema.fields.map(((t,e)=>this.getChildAt(e)));[i[t],a[t]]=[o,e],[n,r]=wr(n,a)}return new Sr(n,r)}select(t){const e=this.schema.fields.reduce(((t,e,n)=>t.set(e.name,n)),new Map);return this.selectAt(t.map((t=>e.get(t))).filter((t=>t>-1)))}selectAt(t){const e=this.schema.selectAt(t),n=this.batches.map((e=>e.selectAt(t)));return new Sr(e,n)}assign(t){const e=this.schema.fields,[n,r]=t.schema.fields.reduce(((t,n,r)=>{const[i,o]=t,a=e.findIndex((t=>t.name===n.name));return~a?o[a]=r:i.push(r),t}),[[],[]]),i=this.schema.assign(t.schema),o=[...e.map(((t,e)=>[e,r[e]])).map((e=>{let[n,r]=e;return void 0===r?this.getChildAt(n):t.getChildAt(r)})),...n.map((e=>t.getChildAt(e)))].filter(Boolean);return new Sr(...wr(i,o))}}mr=Symbol.toStringTag,Sr[mr]=(t=>(t.schema=null,t.batches=[],t._offsets=new Uint32Array([0]),t._nullCount=-1,t[Symbol.isConcatSpreadable]=!0,t.isValid=xn(wn),t.get=xn(rn.getVisitFn(c.Struct)),t.set=Sn(Ie.getVisitFn(c.Struct)),t.indexOf=kn(On.getVisitFn(c.Struct)),t.getByteLength=xn(Wn.getVisitFn(c.Struct)),"Table"))(Sr.prototype);class kr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}offset(){return this.bb.readInt64(this.bb_pos)}metaDataLength(){return this.bb.readInt32(this.bb_pos+8)}bodyLength(){return this.bb.readInt64(this.bb_pos+16)}static sizeOf(){return 24}static createBlock(t,e,n,r){return t.prep(8,24),t.writeInt64(r),t.pad(4),t.writeInt32(n),t.writeInt64(e),t.offset()}}const Cr=new Int32Array(2),Tr=new Float32Array(Cr.buffer),Pr=new Float64Array(Cr.buffer),Er=1===new Uint16Array(new Uint8Array([1,0]).buffer)[0];class Ar{constructor(t,e){this.low=0|t,this.high=0|e}static create(t,e){return 0==t&&0==e?Ar.ZERO:new Ar(t,e)}toFloat64(){return(this.low>>>0)+4294967296*this.high}equals(t){return this.low==t.low&&this.high==t.high}}var Ir,Mr,Fr,Dr,Rr;Ar.ZERO=new Ar(0,0),function(t){t[t.UTF8_BYTES=1]="UTF8_BYTES",t[t.UTF16_STRING=2]="UTF16_STRING"}(Ir||(Ir={}));class Or{constructor(t){this.bytes_=t,this.position_=0}static allocate(t){return new Or(new Uint8Array(t))}clear(){this.position_=0}bytes(){return this.bytes_}position(){return this.position_}setPosition(t){this.position_=t}capacity(){return this.bytes_.length}readInt8(t){return this.readUint8(t)<<24>>24}readUint8(t){return this.bytes_[t]}readInt16(t){return this.readUint16(t)<<16>>16}readUint16(t){return this.bytes_[t]|this.bytes_[t+1]<<8}readInt32(t){return this.bytes_[t]|this.bytes_[t+1]<<8|this.bytes_[t+2]<<16|this.bytes_[t+3]<<24}readUint32(t){return this.readInt32(t)>>>0}readInt64(t){return new Ar(this.readInt32(t),this.readInt32(t+4))}readUint64(t){return new Ar(this.readUint32(t),this.readUint32(t+4))}readFloat32(t){return Cr[0]=this.readInt32(t),Tr[0]}readFloat64(t){return Cr[Er?0:1]=this.readInt32(t),Cr[Er?1:0]=this.readInt32(t+4),Pr[0]}writeInt8(t,e){this.bytes_[t]=e}writeUint8(t,e){this.bytes_[t]=e}writeInt16(t,e){this.bytes_[t]=e,this.bytes_[t+1]=e>>8}writeUint16(t,e){this.bytes_[t]=e,this.bytes_[t+1]=e>>8}writeInt32(t,e){this.bytes_[t]=e,this.bytes_[t+1]=e>>8,this.bytes_[t+2]=e>>16,this.bytes_[t+3]=e>>24}writeUint32(t,e){this.bytes_[t]=e,this.bytes_[t+1]=e>>8,this.bytes_[t+2]=e>>16,this.bytes_[t+3]=e>>24}writeInt64(t,e){this.writeInt32(t,e.low),this.writeInt32(t+4,e.high)}writeUint64(t,e){this.writeUint32(t,e.low),this.writeUint32(t+4,e.high)}writeFloat32(t,e){Tr[0]=e,this.writeInt32(t,Cr[0])}writeFloat64(t,e){Pr[0]=e,this.writeInt32(t,Cr[Er?0:1]),this.writeInt32(t+4,Cr[Er?1:0])}getBufferIdentifier(){if(this.bytes_.length<this.position_+4+4)throw new Error("FlatBuffers: ByteBuffer is too short to contain an identifier.");let t="";for(let e=0;e<4;e++)t+=String.fromCharCode(this.readInt8(this.position_+4+e));return t}__offset(t,e){const n=t-this.readInt32(t);return e<this.readInt16(n)?this.readInt16(n+e):0}__union(t,e){return t.bb_pos=e+this.readInt32(e),t.bb=this,t}__string(t,e){t+=this.readInt32(t);const n=this.readInt32(t);let r="",i=0;if(t+=4,e===Ir.UTF8_BYTES)return this.bytes_.subarray(t,t+n);for(;i<n;){let e;const n=this.readUint8(t+i++);if(n<192)e=n;else{const r=this.readUint8(t+i++);if(n<224)e=(31&n)<<6|63&r;else{const o=this.readUint8(t+i++);if(n<240)e=(15&n)<<12|(63&r)<<6|63&o;else{e=(7&n)<<18|(63&r)<<12|(63&o)<<6|63&this.readUint8(t+i++)}}}e<65536?r+=String.fromCharCode(e):(e-=65536,r+=String.fromCharCode(55296+(e>>10),56320+(1023&e)))}return r}__union_with_string(t,e){return"string"===typeof t?this.__string(e):this.__union(t,e)}__indirect(t){return t+this.readInt32(t)}__vector(t){return t+this.readInt32(t)+4}__vector_len(t){return this.readInt32(t+this.readInt32(t))}__has_identifier(t){if(4!=t.length)throw new Error("FlatBuffers: file identifier must be length 4");for(let e=0;e<4;e++)if(t.charCodeAt(e)!=this.readInt8(this.position()+4+e))return!1;return!0}createLong(t,e){return Ar.create(t,e)}createScalarList(t,e){const n=[];for(let r=0;r<e;++r)null!==t(r)&&n.push(t(r));return n}createObjList(t,e){const n=[];for(let r=0;r<e;++r){const e=t(r);null!==e&&n.push(e.unpack())}return n}}class Nr{constructor(t){let e;this.minalign=1,this.vtable=null,this.vtable_in_use=0,this.isNested=!1,this.object_start=0,this.vtables=[],this.vector_num_elems=0,this.force_defaults=!1,this.string_maps=null,e=t||1024,this.bb=Or.allocate(e),this.space=e}clear(){this.bb.clear(),this.space=this.bb.capacity(),this.minalign=1,this.vtable=null,this.vtable_in_use=0,this.isNested=!1,this.object_start=0,this.vtables=[],this.vector_num_elems=0,this.force_defaults=!1,this.string_maps=null}forceDefaults(t){this.force_defaults=t}dataBuffer(){return this.bb}asUint8Array(){return this.bb.bytes().subarray(this.bb.position(),this.bb.position()+this.offset())}prep(t,e){t>this.minalign&&(this.minalign=t);const n=1+~(this.bb.capacity()-this.space+e)&t-1;for(;this.space<n+t+e;){const t=this.bb.capacity();this.bb=Nr.growByteBuffer(this.bb),this.space+=this.bb.capacity()-t}this.pad(n)}pad(t){for(let e=0;e<t;e++)this.bb.writeInt8(--this.space,0)}writeInt8(t){this.bb.writeInt8(this.space-=1,t)}writeInt16(t){this.bb.writeInt16(this.space-=2,t)}writeInt32(t){this.bb.writeInt32(this.space-=4,t)}writeInt64(t){this.bb.writeInt64(this.space-=8,t)}writeFloat32(t){this.bb.writeFloat32(this.space-=4,t)}writeFloat64(t){this.bb.writeFloat64(this.space-=8,t)}addInt8(t){this.prep(1,0),this.writeInt8(t)}addInt16(t){this.prep(2,0),this.writeInt16(t)}addInt32(t){this.prep(4,0),this.writeInt32(t)}addInt64(t){this.prep(8,0),this.writeInt64(t)}addFloat32(t){this.prep(4,0),this.writeFloat32(t)}addFloat64(t){this.prep(8,0),this.writeFloat64(t)}addFieldInt8(t,e,n){(this.force_defaults||e!=n)&&(this.addInt8(e),this.slot(t))}addFieldInt16(t,e,n){(this.force_defaults||e!=n)&&(this.addInt16(e),this.slot(t))}addFieldInt32(t,e,n){(this.force_defaults||e!=n)&&(this.addInt32(e),this.slot(t))}addFieldInt64(t,e,n){!this.force_defaults&&e.equals(n)||(this.addInt64(e),this.slot(t))}addFieldFloat32(t,e,n){(this.force_defaults||e!=n)&&(this.addFloat32(e),this.slot(t))}addFieldFloat64(t,e,n){(this.force_defaults||e!=n)&&(this.addFloat64(e),this.slot(t))}addFieldOffset(t,e,n){(this.force_defaults||e!=n)&&(this.addOffset(e),this.slot(t))}addFieldStruct(t,e,n){e!=n&&(this.nested(e),this.slot(t))}nested(t){if(t!=this.offset())throw new Error("FlatBuffers: struct must be serialized inline.")}notNested(){if(this.isNested)throw new Error("FlatBuffers: object serialization must not be nested.")}slot(t){null!==this.vtable&&(this.vtable[t]=this.offset())}offset(){return this.bb.capacity()-this.space}static growByteBuffer(t){const e=t.capacity();if(3221225472&e)throw new Error("FlatBuffers: cannot grow buffer beyond 2 gigabytes.");const n=e<<1,r=Or.allocate(n);return r.setPosition(n-e),r.bytes().set(t.bytes(),n-e),r}addOffset(t){this.prep(4,0),this.writeInt32(this.offset()-t+4)}startObject(t){this.notNested(),null==this.vtable&&(this.vtable=[]),this.vtable_in_use=t;for(let e=0;e<t;e++)this.vtable[e]=0;this.isNested=!0,this.object_start=this.offset()}endObject(){if(null==this.vtable||!this.isNested)throw new Error("FlatBuffers: endObject called without startObject");this.addInt32(0);const t=this.offset();let e=this.vtable_in_use-1;for(;e>=0&&0==this.vtable[e];e--);const n=e+1;for(;e>=0;e--)this.addInt16(0!=this.vtable[e]?t-this.vtable[e]:0);this.addInt16(t-this.object_start);const r=2*(n+2);this.addInt16(r);let i=0;const o=this.space;t:for(e=0;e<this.vtables.length;e++){const t=this.bb.capacity()-this.vtables[e];if(r==this.bb.readInt16(t)){for(let e=2;e<r;e+=2)if(this.bb.readInt16(o+e)!=this.bb.readInt16(t+e))continue t;i=this.vtables[e];break}}return i?(this.space=this.bb.capacity()-t,this.bb.writeInt32(this.space,i-t)):(this.vtables.push(this.offset()),this.bb.writeInt32(this.bb.capacity()-t,this.offset()-t)),this.isNested=!1,t}finish(t,e,n){const r=n?4:0;if(e){const t=e;if(this.prep(this.minalign,8+r),4!=t.length)throw new Error("FlatBuffers: file identifier must be length 4");for(let e=3;e>=0;e--)this.writeInt8(t.charCodeAt(e))}this.prep(this.minalign,4+r),this.addOffset(t),r&&this.addInt32(this.bb.capacity()-this.space),this.bb.setPosition(this.space)}finishSizePrefixed(t,e){this.finish(t,e,!0)}requiredField(t,e){const n=this.bb.capacity()-t,r=n-this.bb.readInt32(n);if(!(0!=this.bb.readInt16(r+e)))throw new Error("FlatBuffers: field "+e+" must be set")}startVector(t,e,n){this.notNested(),this.vector_num_elems=e,this.prep(4,t*e),this.prep(n,t*e)}endVector(){return this.writeInt32(this.vector_num_elems),this.offset()}createSharedString(t){if(!t)return 0;if(this.string_maps||(this.string_maps=new Map),this.string_maps.has(t))return this.string_maps.get(t);const e=this.createString(t);return this.string_maps.set(t,e),e}createString(t){if(!t)return 0;let e;if(t instanceof Uint8Array)e=t;else{e=[];let n=0;for(;n<t.length;){let r;const i=t.charCodeAt(n++);if(i<55296||i>=56320)r=i;else{r=(i<<10)+t.charCodeAt(n++)+-56613888}r<128?e.push(r):(r<2048?e.push(r>>6&31|192):(r<65536?e.push(r>>12&15|224):e.push(r>>18&7|240,r>>12&63|128),e.push(r>>6&63|128)),e.push(63&r|128))}}this.addInt8(0),this.startVector(1,e.length,1),this.bb.setPosition(this.space-=e.length);for(let n=0,r=this.space,i=this.bb.bytes();n<e.length;n++)i[r++]=e[n];return this.endVector()}createLong(t,e){return Ar.create(t,e)}createObjectOffset(t){return null===t?0:"string"===typeof t?this.createString(t):t.pack(this)}createObjectOffsetList(t){const e=[];for(let n=0;n<t.length;++n){const r=t[n];if(null===r)throw new Error("FlatBuffers: Argument for createObjectOffsetList cannot contain null.");e.push(this.createObjectOffset(r))}return e}createStructOffsetList(t,e){return e(this,t.length),this.createObjectOffsetList(t),this.endVector()}}class Lr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsKeyValue(t,e){return(e||new Lr).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsKeyValue(t,e){return t.setPosition(t.position()+4),(e||new Lr).__init(t.readInt32(t.position())+t.position(),t)}key(t){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.__string(this.bb_pos+e,t):null}value(t){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.__string(this.bb_pos+e,t):null}static startKeyValue(t){t.startObject(2)}static addKey(t,e){t.addFieldOffset(0,e,0)}static addValue(t,e){t.addFieldOffset(1,e,0)}static endKeyValue(t){return t.endObject()}static createKeyValue(t,e,n){return Lr.startKeyValue(t),Lr.addKey(t,e),Lr.addValue(t,n),Lr.endKeyValue(t)}}!function(t){t[t.V1=0]="V1",t[t.V2=1]="V2",t[t.V3=2]="V3",t[t.V4=3]="V4",t[t.V5=4]="V5"}(Mr||(Mr={})),function(t){t[t.Little=0]="Little",t[t.Big=1]="Big"}(Fr||(Fr={})),function(t){t[t.DenseArray=0]="DenseArray"}(Dr||(Dr={}));class Br{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsInt(t,e){return(e||new Br).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsInt(t,e){return t.setPosition(t.position()+4),(e||new Br).__init(t.readInt32(t.position())+t.position(),t)}bitWidth(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt32(this.bb_pos+t):0}isSigned(){const t=this.bb.__offset(this.bb_pos,6);return!!t&&!!this.bb.readInt8(this.bb_pos+t)}static startInt(t){t.startObject(2)}static addBitWidth(t,e){t.addFieldInt32(0,e,0)}static addIsSigned(t,e){t.addFieldInt8(1,+e,0)}static endInt(t){return t.endObject()}static createInt(t,e,n){return Br.startInt(t),Br.addBitWidth(t,e),Br.addIsSigned(t,n),Br.endInt(t)}}class zr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsDictionaryEncoding(t,e){return(e||new zr).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsDictionaryEncoding(t,e){return t.setPosition(t.position()+4),(e||new zr).__init(t.readInt32(t.position())+t.position(),t)}id(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt64(this.bb_pos+t):this.bb.createLong(0,0)}indexType(t){const e=this.bb.__offset(this.bb_pos,6);return e?(t||new Br).__init(this.bb.__indirect(this.bb_pos+e),this.bb):null}isOrdered(){const t=this.bb.__offset(this.bb_pos,8);return!!t&&!!this.bb.readInt8(this.bb_pos+t)}dictionaryKind(){const t=this.bb.__offset(this.bb_pos,10);return t?this.bb.readInt16(this.bb_pos+t):Dr.DenseArray}static startDictionaryEncoding(t){t.startObject(4)}static addId(t,e){t.addFieldInt64(0,e,t.createLong(0,0))}static addIndexType(t,e){t.addFieldOffset(1,e,0)}static addIsOrdered(t,e){t.addFieldInt8(2,+e,0)}static addDictionaryKind(t,e){t.addFieldInt16(3,e,Dr.DenseArray)}static endDictionaryEncoding(t){return t.endObject()}}!function(t){t[t.NONE=0]="NONE",t[t.Null=1]="Null",t[t.Int=2]="Int",t[t.FloatingPoint=3]="FloatingPoint",t[t.Binary=4]="Binary",t[t.Utf8=5]="Utf8",t[t.Bool=6]="Bool",t[t.Decimal=7]="Decimal",t[t.Date=8]="Date",t[t.Time=9]="Time",t[t.Timestamp=10]="Timestamp",t[t.Interval=11]="Interval",t[t.List=12]="List",t[t.Struct_=13]="Struct_",t[t.Union=14]="Union",t[t.FixedSizeBinary=15]="FixedSizeBinary",t[t.FixedSizeList=16]="FixedSizeList",t[t.Map=17]="Map",t[t.Duration=18]="Duration",t[t.LargeBinary=19]="LargeBinary",t[t.LargeUtf8=20]="LargeUtf8",t[t.LargeList=21]="LargeList"}(Rr||(Rr={}));class jr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsField(t,e){return(e||new jr).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsField(t,e){return t.setPosition(t.position()+4),(e||new jr).__init(t.readInt32(t.position())+t.position(),t)}name(t){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.__string(this.bb_pos+e,t):null}nullable(){const t=this.bb.__offset(this.bb_pos,6);return!!t&&!!this.bb.readInt8(this.bb_pos+t)}typeType(){const t=this.bb.__offset(this.bb_pos,8);return t?this.bb.readUint8(this.bb_pos+t):Rr.NONE}type(t){const e=this.bb.__offset(this.bb_pos,10);return e?this.bb.__union(t,this.bb_pos+e):null}dictionary(t){const e=this.bb.__offset(this.bb_pos,12);return e?(t||new zr).__init(this.bb.__indirect(this.bb_pos+e),this.bb):null}children(t,e){const n=this.bb.__offset(this.bb_pos,14);return n?(e||new jr).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*t),this.bb):null}childrenLength(){const t=this.bb.__offset(this.bb_pos,14);return t?this.bb.__vector_len(this.bb_pos+t):0}customMetadata(t,e){const n=this.bb.__offset(this.bb_pos,16);return n?(e||new Lr).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*t),this.bb):null}customMetadataLength(){const t=this.bb.__offset(this.bb_pos,16);return t?this.bb.__vector_len(this.bb_pos+t):0}static startField(t){t.startObject(7)}static addName(t,e){t.addFieldOffset(0,e,0)}static addNullable(t,e){t.addFieldInt8(1,+e,0)}static addTypeType(t,e){t.addFieldInt8(2,e,Rr.NONE)}static addType(t,e){t.addFieldOffset(3,e,0)}static addDictionary(t,e){t.addFieldOffset(4,e,0)}static addChildren(t,e){t.addFieldOffset(5,e,0)}static createChildrenVector(t,e){t.startVector(4,e.length,4);for(let n=e.length-1;n>=0;n--)t.addOffset(e[n]);return t.endVector()}static startChildrenVector(t,e){t.startVector(4,e,4)}static addCustomMetadata(t,e){t.addFieldOffset(6,e,0)}static createCustomMetadataVector(t,e){t.startVector(4,e.length,4);for(let n=e.length-1;n>=0;n--)t.addOffset(e[n]);return t.endVector()}static startCustomMetadataVector(t,e){t.startVector(4,e,4)}static endField(t){return t.endObject()}}class Ur{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsSchema(t,e){return(e||new Ur).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsSchema(t,e){return t.setPosition(t.position()+4),(e||new Ur).__init(t.readInt32(t.position())+t.position(),t)}endianness(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):Fr.Little}fields(t,e){const n=this.bb.__offset(this.bb_pos,6);return n?(e||new jr).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*t),this.bb):null}fieldsLength(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.__vector_len(this.bb_pos+t):0}customMetadata(t,e){const n=this.bb.__offset(this.bb_pos,8);return n?(e||new Lr).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*t),this.bb):null}customMetadataLength(){const t=this.bb.__offset(this.bb_pos,8);return t?this.bb.__vector_len(this.bb_pos+t):0}features(t){const e=this.bb.__offset(this.bb_pos,10);return e?this.bb.readInt64(this.bb.__vector(this.bb_pos+e)+8*t):this.bb.createLong(0,0)}featuresLength(){const t=this.bb.__offset(this.bb_pos,10);return t?this.bb.__vector_len(this.bb_pos+t):0}static startSchema(t){t.startObject(4)}static addEndianness(t,e){t.addFieldInt16(0,e,Fr.Little)}static addFields(t,e){t.addFieldOffset(1,e,0)}static createFieldsVector(t,e){t.startVector(4,e.length,4);for(let n=e.length-1;n>=0;n--)t.addOffset(e[n]);return t.endVector()}static startFieldsVector(t,e){t.startVector(4,e,4)}static addCustomMetadata(t,e){t.addFieldOffset(2,e,0)}static createCustomMetadataVector(t,e){t.startVector(4,e.length,4);for(let n=e.length-1;n>=0;n--)t.addOffset(e[n]);return t.endVector()}static startCustomMetadataVector(t,e){t.startVector(4,e,4)}static addFeatures(t,e){t.addFieldOffset(3,e,0)}static createFeaturesVector(t,e){t.startVector(8,e.length,8);for(let n=e.length-1;n>=0;n--)t.addInt64(e[n]);return t.endVector()}static startFeaturesVector(t,e){t.startVector(8,e,8)}static endSchema(t){return t.endObject()}static finishSchemaBuffer(t,e){t.finish(e)}static finishSizePrefixedSchemaBuffer(t,e){t.finish(e,void 0,!0)}static createSchema(t,e,n,r,i){return Ur.startSchema(t),Ur.addEndianness(t,e),Ur.addFields(t,n),Ur.addCustomMetadata(t,r),Ur.addFeatures(t,i),Ur.endSchema(t)}}class Vr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsFooter(t,e){return(e||new Vr).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsFooter(t,e){return t.setPosition(t.position()+4),(e||new Vr).__init(t.readInt32(t.position())+t.position(),t)}version(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):Mr.V1}schema(t){const e=this.bb.__offset(this.bb_pos,6);return e?(t||new Ur).__init(this.bb.__indirect(this.bb_pos+e),this.bb):null}dictionaries(t,e){const n=this.bb.__offset(this.bb_pos,8);return n?(e||new kr).__init(this.bb.__vector(this.bb_pos+n)+24*t,this.bb):null}dictionariesLength(){const t=this.bb.__offset(this.bb_pos,8);return t?this.bb.__vector_len(this.bb_pos+t):0}recordBatches(t,e){const n=this.bb.__offset(this.bb_pos,10);return n?(e||new kr).__init(this.bb.__vector(this.bb_pos+n)+24*t,this.bb):null}recordBatchesLength(){const t=this.bb.__offset(this.bb_pos,10);return t?this.bb.__vector_len(this.bb_pos+t):0}customMetadata(t,e){const n=this.bb.__offset(this.bb_pos,12);return n?(e||new Lr).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*t),this.bb):null}customMetadataLength(){const t=this.bb.__offset(this.bb_pos,12);return t?this.bb.__vector_len(this.bb_pos+t):0}static startFooter(t){t.startObject(5)}static addVersion(t,e){t.addFieldInt16(0,e,Mr.V1)}static addSchema(t,e){t.addFieldOffset(1,e,0)}static addDictionaries(t,e){t.addFieldOffset(2,e,0)}static startDictionariesVector(t,e){t.startVector(24,e,8)}static addRecordBatches(t,e){t.addFieldOffset(3,e,0)}static startRecordBatchesVector(t,e){t.startVector(24,e,8)}static addCustomMetadata(t,e){t.addFieldOffset(4,e,0)}static createCustomMetadataVector(t,e){t.startVector(4,e.length,4);for(let n=e.length-1;n>=0;n--)t.addOffset(e[n]);return t.endVector()}static startCustomMetadataVector(t,e){t.startVector(4,e,4)}static endFooter(t){return t.endObject()}static finishFooterBuffer(t,e){t.finish(e)}static finishSizePrefixedFooterBuffer(t,e){t.finish(e,void 0,!0)}}var $r=Ar,Wr=Nr,Gr=Or;class Hr{constructor(t){let n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:e.V4,r=arguments.length>2?arguments[2]:void 0,i=arguments.length>3?arguments[3]:void 0;this.schema=t,this.version=n,r&&(this._recordBatches=r),i&&(this._dictionaryBatches=i)}static decode(t){t=new Gr(J(t));const e=Vr.getRootAsFooter(t),n=Jn.decode(e.schema());return new Yr(n,e)}static encode(t){const n=new Wr,r=Jn.encode(n,t.schema);Vr.startRecordBatchesVector(n,t.numRecordBatches);for(const e of[...t.recordBatches()].slice().reverse())qr.encode(n,e);const i=n.endVector();Vr.startDictionariesVector(n,t.numDictionaries);for(const e of[...t.dictionaryBatches()].slice().reverse())qr.encode(n,e);const o=n.endVector();return Vr.startFooter(n),Vr.addSchema(n,r),Vr.addVersion(n,e.V4),Vr.addRecordBatches(n,i),Vr.addDictionaries(n,o),Vr.finishFooterBuffer(n,Vr.endFooter(n)),n.asUint8Array()}get numRecordBatches(){return this._recordBatches.length}get numDictionaries(){return this._dictionaryBatches.length}*recordBatches(){for(let t,e=-1,n=this.numRecordBatches;++e<n;)(t=this.getRecordBatch(e))&&(yield t)}*dictionaryBatches(){for(let t,e=-1,n=this.numDictionaries;++e<n;)(t=this.getDictionaryBatch(e))&&(yield t)}getRecordBatch(t){return t>=0&&t<this.numRecordBatches&&this._recordBatches[t]||null}getDictionaryBatch(t){return t>=0&&t<this.numDictionaries&&this._dictionaryBatches[t]||null}}class Yr extends Hr{constructor(t,e){super(t,e.version()),this._footer=e}get numRecordBatches(){return this._footer.recordBatchesLength()}get numDictionaries(){return this._footer.dictionariesLength()}getRecordBatch(t){if(t>=0&&t<this.numRecordBatches){const e=this._footer.recordBatches(t);if(e)return qr.decode(e)}return null}getDictionaryBatch(t){if(t>=0&&t<this.numDictionaries){const e=this._footer.dictionaries(t);if(e)return qr.decode(e)}return null}}class qr{constructor(t,e,n){this.metaDataLength=t,this.offset="number"===typeof n?n:n.low,this.bodyLength="number"===typeof e?e:e.low}static decode(t){return new qr(t.metaDataLength(),t.bodyLength(),t.offset())}static encode(t,e){const{metaDataLength:n}=e,r=new $r(e.offset,0),i=new $r(e.bodyLength,0);return kr.createBlock(t,r,n,i)}}const Kr={fromIterable:t=>Xr(function*(t){let e,n,r,i,o=!1,a=[],s=0;function l(){return"peek"===r?X(a,i)[0]:([n,a,s]=X(a,i),n)}({cmd:r,size:i}=yield null);const c=(u=t,et(Uint8Array,u))[Symbol.iterator]();var u;try{do{if(({done:e,value:n}=Number.isNaN(i-s)?c.next():c.next(i-s)),!e&&n.byteLength>0&&(a.push(n),s+=n.byteLength),e||i<=s)do{({cmd:r,size:i}=yield l())}while(i<s)}while(!e)}catch(d){(o=!0)&&"function"===typeof c.throw&&c.throw(d)}finally{!1===o&&"function"===typeof c.return&&c.return(null)}return null}(t)),fromAsyncIterable:t=>Xr(function(t){return U(this,arguments,(function*(){let e,n,r,i,o=!1,a=[],s=0;function l(){return"peek"===r?X(a,i)[0]:([n,a,s]=X(a,i),n)}({cmd:r,size:i}=yield yield j(null));const c=(u=t,nt(Uint8Array,u))[Symbol.asyncIterator]();var u;try{do{if(({done:e,value:n}=Number.isNaN(i-s)?yield j(c.next()):yield j(c.next(i-s))),!e&&n.byteLength>0&&(a.push(n),s+=n.byteLength),e||i<=s)do{({cmd:r,size:i}=yield yield j(l()))}while(i<s)}while(!e)}catch(d){(o=!0)&&"function"===typeof c.throw&&(yield j(c.throw(d)))}finally{!1===o&&"function"===typeof c.return&&(yield j(c.return(new Uint8Array(0))))}return yield j(null)}))}(t)),fromDOMStream:t=>Xr(function(t){return U(this,arguments,(function*(){let e,n,r,i=!1,o=!1,a=[],s=0;function l(){return"peek"===n?X(a,r)[0]:([e,a,s]=X(a,r),e)}({cmd:n,size:r}=yield yield j(null));const c=new Qr(t);try{do{if(({done:i,value:e}=Number.isNaN(r-s)?yield j(c.read()):yield j(c.read(r-s))),!i&&e.byteLength>0&&(a.push(J(e)),s+=e.byteLength),i||r<=s)do{({cmd:n,size:r}=yield yield j(l()))}while(r<s)}while(!i)}catch(u){(o=!0)&&(yield j(c.cancel(u)))}finally{!1===o?yield j(c.cancel()):t.locked&&c.releaseLock()}return yield j(null)}))}(t)),fromNodeStream:t=>Xr(function(t){return U(this,arguments,(function*(){const e=[];let n,r,i,o="error",a=!1,s=null,l=0,c=[];function u(){return"peek"===n?X(c,r)[0]:([i,c,l]=X(c,r),i)}if(({cmd:n,size:r}=yield yield j(null)),t.isTTY)return yield yield j(new Uint8Array(0)),yield j(null);try{e[0]=Zr(t,"end"),e[1]=Zr(t,"error");do{if(e[2]=Zr(t,"readable"),[o,s]=yield j(Promise.race(e.map((t=>t[2])))),"error"===o)break;if((a="end"===o)||(Number.isFinite(r-l)?(i=J(t.read(r-l)),i.byteLength<r-l&&(i=J(t.read()))):i=J(t.read()),i.byteLength>0&&(c.push(i),l+=i.byteLength)),a||r<=l)do{({cmd:n,size:r}=yield yield j(u()))}while(r<l)}while(!a)}finally{yield j(d(e,"error"===o?s:null))}return yield j(null);function d(e,n){return i=c=null,new Promise(((r,i)=>{for(const[n,a]of e)t.off(n,a);try{const e=t.destroy;e&&e.call(t,n),n=void 0}catch(o){n=o||n}finally{null!=n?i(n):r()}}))}}))}(t)),toDOMStream(t,e){throw new Error('"toDOMStream" not available in this environment')},toNodeStream(t,e){throw new Error('"toNodeStream" not available in this environment')}},Xr=t=>(t.next(),t);class Qr{constructor(t){this.source=t,this.reader=null,this.reader=this.source.getReader(),this.reader.closed.catch((()=>{}))}get closed(){return this.reader?this.reader.closed.catch((()=>{})):Promise.resolve()}releaseLock(){this.reader&&this.reader.releaseLock(),this.reader=null}cancel(t){return B(this,void 0,void 0,(function*(){const{reader:e,source:n}=this;e&&(yield e.cancel(t).catch((()=>{}))),n&&n.locked&&this.releaseLock()}))}read(t){return B(this,void 0,void 0,(function*(){if(0===t)return{done:null==this.reader,value:new Uint8Array(0)};const e=yield this.reader.read();return!e.done&&(e.value=J(e)),e}))}}const Zr=(t,e)=>{const n=t=>r([e,t]);let r;return[e,n,new Promise((i=>(r=i)&&t.once(e,n)))]};const Jr=Object.freeze({done:!0,value:void 0});class ti{constructor(t){this._json=t}get schema(){return this._json.schema}get batches(){return this._json.batches||[]}get dictionaries(){return this._json.dictionaries||[]}}class ei{tee(){return this._getDOMStream().tee()}pipe(t,e){return this._getNodeStream().pipe(t,e)}pipeTo(t,e){return this._getDOMStream().pipeTo(t,e)}pipeThrough(t,e){return this._getDOMStream().pipeThrough(t,e)}_getDOMStream(){return this._DOMStream||(this._DOMStream=this.toDOMStream())}_getNodeStream(){return this._nodeStream||(this._nodeStream=this.toNodeStream())}}class ni extends ei{constructor(){super(),this._values=[],this.resolvers=[],this._closedPromise=new Promise((t=>this._closedPromiseResolve=t))}get closed(){return this._closedPromise}cancel(t){return B(this,void 0,void 0,(function*(){yield this.return(t)}))}write(t){this._ensureOpen()&&(this.resolvers.length<=0?this._values.push(t):this.resolvers.shift().resolve({done:!1,value:t}))}abort(t){this._closedPromiseResolve&&(this.resolvers.length<=0?this._error={error:t}:this.resolvers.shift().reject({done:!0,value:t}))}close(){if(this._closedPromiseResolve){const{resolvers:t}=this;for(;t.length>0;)t.shift().resolve(Jr);this._closedPromiseResolve(),this._closedPromiseResolve=void 0}}[Symbol.asyncIterator](){return this}toDOMStream(t){return Kr.toDOMStream(this._closedPromiseResolve||this._error?this:this._values,t)}toNodeStream(t){return Kr.toNodeStream(this._closedPromiseResolve||this._error?this:this._values,t)}throw(t){return B(this,void 0,void 0,(function*(){return yield this.abort(t),Jr}))}return(t){return B(this,void 0,void 0,(function*(){return yield this.close(),Jr}))}read(t){return B(this,void 0,void 0,(function*(){return(yield this.next(t,"read")).value}))}peek(t){return B(this,void 0,void 0,(function*(){return(yield this.next(t,"peek")).value}))}next(){return this._values.length>0?Promise.resolve({done:!1,value:this._values.shift()}):this._error?Promise.reject({done:!0,value:this._error.error}):this._closedPromiseResolve?new Promise(((t,e)=>{this.resolvers.push({resolve:t,reject:e})})):Promise.resolve(Jr)}_ensureOpen(){if(this._closedPromiseResolve)return!0;throw new Error("AsyncQueue is closed")}}class ri extends ni{write(t){if((t=J(t)).byteLength>0)return super.write(t)}toString(){return arguments.length>0&&void 0!==arguments[0]&&arguments[0]?G(this.toUint8Array(!0)):this.toUint8Array(!1).then(G)}toUint8Array(){return arguments.length>0&&void 0!==arguments[0]&&arguments[0]?X(this._values)[0]:(()=>B(this,void 0,void 0,(function*(){var t,e;const n=[];let r=0;try{for(var i,o=$(this);!(i=yield o.next()).done;){const t=i.value;n.push(t),r+=t.byteLength}}catch(a){t={error:a}}finally{try{i&&!i.done&&(e=o.return)&&(yield e.call(o))}finally{if(t)throw t.error}}return X(n,r)[0]})))()}}class ii{constructor(t){t&&(this.source=new ai(Kr.fromIterable(t)))}[Symbol.iterator](){return this}next(t){return this.source.next(t)}throw(t){return this.source.throw(t)}return(t){return this.source.return(t)}peek(t){return this.source.peek(t)}read(t){return this.source.read(t)}}class oi{constructor(t){t instanceof oi?this.source=t.source:t instanceof ri?this.source=new si(Kr.fromAsyncIterable(t)):N(t)?this.source=new si(Kr.fromNodeStream(t)):O(t)?this.source=new si(Kr.fromDOMStream(t)):D(t)?this.source=new si(Kr.fromDOMStream(t.body)):E(t)?this.source=new si(Kr.fromIterable(t)):(P(t)||A(t))&&(this.source=new si(Kr.fromAsyncIterable(t)))}[Symbol.asyncIterator](){return this}next(t){return this.source.next(t)}throw(t){return this.source.throw(t)}return(t){return this.source.return(t)}get closed(){return this.source.closed}cancel(t){return this.source.cancel(t)}peek(t){return this.source.peek(t)}read(t){return this.source.read(t)}}class ai{constructor(t){this.source=t}cancel(t){this.return(t)}peek(t){return this.next(t,"peek").value}read(t){return this.next(t,"read").value}next(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"read";return this.source.next({cmd:e,size:t})}throw(t){return Object.create(this.source.throw&&this.source.throw(t)||Jr)}return(t){return Object.create(this.source.return&&this.source.return(t)||Jr)}}class si{constructor(t){this.source=t,this._closedPromise=new Promise((t=>this._closedPromiseResolve=t))}cancel(t){return B(this,void 0,void 0,(function*(){yield this.return(t)}))}get closed(){return this._closedPromise}read(t){return B(this,void 0,void 0,(function*(){return(yield this.next(t,"read")).value}))}peek(t){return B(this,void 0,void 0,(function*(){return(yield this.next(t,"peek")).value}))}next(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"read";return B(this,void 0,void 0,(function*(){return yield this.source.next({cmd:e,size:t})}))}throw(t){return B(this,void 0,void 0,(function*(){const e=this.source.throw&&(yield this.source.throw(t))||Jr;return this._closedPromiseResolve&&this._closedPromiseResolve(),this._closedPromiseResolve=void 0,Object.create(e)}))}return(t){return B(this,void 0,void 0,(function*(){const e=this.source.return&&(yield this.source.return(t))||Jr;return this._closedPromiseResolve&&this._closedPromiseResolve(),this._closedPromiseResolve=void 0,Object.create(e)}))}}class li extends ii{constructor(t,e){super(),this.position=0,this.buffer=J(t),this.size="undefined"===typeof e?this.buffer.byteLength:e}readInt32(t){const{buffer:e,byteOffset:n}=this.readAt(t,4);return new DataView(e,n).getInt32(0,!0)}seek(t){return this.position=Math.min(t,this.size),t<this.size}read(t){const{buffer:e,size:n,position:r}=this;return e&&r<n?("number"!==typeof t&&(t=Number.POSITIVE_INFINITY),this.position=Math.min(n,r+Math.min(n-r,t)),e.subarray(r,this.position)):null}readAt(t,e){const n=this.buffer,r=Math.min(this.size,t+e);return n?n.subarray(t,r):new Uint8Array(e)}close(){this.buffer&&(this.buffer=null)}throw(t){return this.close(),{done:!0,value:t}}return(t){return this.close(),{done:!0,value:t}}}class ci extends oi{constructor(t,e){super(),this.position=0,this._handle=t,"number"===typeof e?this.size=e:this._pending=(()=>B(this,void 0,void 0,(function*(){this.size=(yield t.stat()).size,delete this._pending})))()}readInt32(t){return B(this,void 0,void 0,(function*(){const{buffer:e,byteOffset:n}=yield this.readAt(t,4);return new DataView(e,n).getInt32(0,!0)}))}seek(t){return B(this,void 0,void 0,(function*(){return this._pending&&(yield this._pending),this.position=Math.min(t,this.size),t<this.size}))}read(t){return B(this,void 0,void 0,(function*(){this._pending&&(yield this._pending);const{_handle:e,size:n,position:r}=this;if(e&&r<n){"number"!==typeof t&&(t=Number.POSITIVE_INFINITY);let i=r,o=0,a=0;const s=Math.min(n,i+Math.min(n-i,t)),l=new Uint8Array(Math.max(0,(this.position=s)-i));for(;(i+=a)<s&&(o+=a)<l.byteLength;)({bytesRead:a}=yield e.read(l,o,l.byteLength-o,i));return l}return null}))}readAt(t,e){return B(this,void 0,void 0,(function*(){this._pending&&(yield this._pending);const{_handle:n,size:r}=this;if(n&&t+e<r){const i=Math.min(r,t+e),o=new Uint8Array(i-t);return(yield n.read(o,0,e,t)).buffer}return new Uint8Array(e)}))}close(){return B(this,void 0,void 0,(function*(){const t=this._handle;this._handle=null,t&&(yield t.close())}))}throw(t){return B(this,void 0,void 0,(function*(){return yield this.close(),{done:!0,value:t}}))}return(t){return B(this,void 0,void 0,(function*(){return yield this.close(),{done:!0,value:t}}))}}function ui(t){return t<0&&(t=4294967295+t+1),`0x${t.toString(16)}`}const di=[1,10,100,1e3,1e4,1e5,1e6,1e7,1e8];class hi{constructor(t){this.buffer=t}high(){return this.buffer[1]}low(){return this.buffer[0]}_times(t){const e=new Uint32Array([this.buffer[1]>>>16,65535&this.buffer[1],this.buffer[0]>>>16,65535&this.buffer[0]]),n=new Uint32Array([t.buffer[1]>>>16,65535&t.buffer[1],t.buffer[0]>>>16,65535&t.buffer[0]]);let r=e[3]*n[3];this.buffer[0]=65535&r;let i=r>>>16;return r=e[2]*n[3],i+=r,r=e[3]*n[2]>>>0,i+=r,this.buffer[0]+=i<<16,this.buffer[1]=i>>>0<r?65536:0,this.buffer[1]+=i>>>16,this.buffer[1]+=e[1]*n[3]+e[2]*n[2]+e[3]*n[1],this.buffer[1]+=e[0]*n[3]+e[1]*n[2]+e[2]*n[1]+e[3]*n[0]<<16,this}_plus(t){const e=this.buffer[0]+t.buffer[0]>>>0;this.buffer[1]+=t.buffer[1],e<this.buffer[0]>>>0&&++this.buffer[1],this.buffer[0]=e}lessThan(t){return this.buffer[1]<t.buffer[1]||this.buffer[1]===t.buffer[1]&&this.buffer[0]<t.buffer[0]}equals(t){return this.buffer[1]===t.buffer[1]&&this.buffer[0]==t.buffer[0]}greaterThan(t){return t.lessThan(this)}hex(){return`${ui(this.buffer[1])} ${ui(this.buffer[0])}`}}class fi extends hi{times(t){return this._times(t),this}plus(t){return this._plus(t),this}static from(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(2);return fi.fromString("string"===typeof t?t:t.toString(),e)}static fromNumber(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(2);return fi.fromString(t.toString(),e)}static fromString(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(2);const n=t.length,r=new fi(e);for(let i=0;i<n;){const e=8<n-i?8:n-i,o=new fi(new Uint32Array([Number.parseInt(t.slice(i,i+e),10),0])),a=new fi(new Uint32Array([di[e],0]));r.times(a),r.plus(o),i+=e}return r}static convertArray(t){const e=new Uint32Array(2*t.length);for(let n=-1,r=t.length;++n<r;)fi.from(t[n],new Uint32Array(e.buffer,e.byteOffset+2*n*4,2));return e}static multiply(t,e){return new fi(new Uint32Array(t.buffer)).times(e)}static add(t,e){return new fi(new Uint32Array(t.buffer)).plus(e)}}class pi extends hi{negate(){return this.buffer[0]=1+~this.buffer[0],this.buffer[1]=~this.buffer[1],0==this.buffer[0]&&++this.buffer[1],this}times(t){return this._times(t),this}plus(t){return this._plus(t),this}lessThan(t){const e=this.buffer[1]|0,n=t.buffer[1]|0;return e<n||e===n&&this.buffer[0]<t.buffer[0]}static from(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(2);return pi.fromString("string"===typeof t?t:t.toString(),e)}static fromNumber(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(2);return pi.fromString(t.toString(),e)}static fromString(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(2);const n=t.startsWith("-"),r=t.length,i=new pi(e);for(let o=n?1:0;o<r;){const e=8<r-o?8:r-o,n=new pi(new Uint32Array([Number.parseInt(t.slice(o,o+e),10),0])),a=new pi(new Uint32Array([di[e],0]));i.times(a),i.plus(n),o+=e}return n?i.negate():i}static convertArray(t){const e=new Uint32Array(2*t.length);for(let n=-1,r=t.length;++n<r;)pi.from(t[n],new Uint32Array(e.buffer,e.byteOffset+2*n*4,2));return e}static multiply(t,e){return new pi(new Uint32Array(t.buffer)).times(e)}static add(t,e){return new pi(new Uint32Array(t.buffer)).plus(e)}}class gi{constructor(t){this.buffer=t}high(){return new pi(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset+8,2))}low(){return new pi(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset,2))}negate(){return this.buffer[0]=1+~this.buffer[0],this.buffer[1]=~this.buffer[1],this.buffer[2]=~this.buffer[2],this.buffer[3]=~this.buffer[3],0==this.buffer[0]&&++this.buffer[1],0==this.buffer[1]&&++this.buffer[2],0==this.buffer[2]&&++this.buffer[3],this}times(t){const e=new fi(new Uint32Array([this.buffer[3],0])),n=new fi(new Uint32Array([this.buffer[2],0])),r=new fi(new Uint32Array([this.buffer[1],0])),i=new fi(new Uint32Array([this.buffer[0],0])),o=new fi(new Uint32Array([t.buffer[3],0])),a=new fi(new Uint32Array([t.buffer[2],0])),s=new fi(new Uint32Array([t.buffer[1],0])),l=new fi(new Uint32Array([t.buffer[0],0]));let c=fi.multiply(i,l);this.buffer[0]=c.low();const u=new fi(new Uint32Array([c.high(),0]));c=fi.multiply(r,l),u.plus(c),c=fi.multiply(i,s),u.plus(c),this.buffer[1]=u.low(),this.buffer[3]=u.lessThan(c)?1:0,this.buffer[2]=u.high();return new fi(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset+8,2)).plus(fi.multiply(n,l)).plus(fi.multiply(r,s)).plus(fi.multiply(i,a)),this.buffer[3]+=fi.multiply(e,l).plus(fi.multiply(n,s)).plus(fi.multiply(r,a)).plus(fi.multiply(i,o)).low(),this}plus(t){const e=new Uint32Array(4);return e[3]=this.buffer[3]+t.buffer[3]>>>0,e[2]=this.buffer[2]+t.buffer[2]>>>0,e[1]=this.buffer[1]+t.buffer[1]>>>0,e[0]=this.buffer[0]+t.buffer[0]>>>0,e[0]<this.buffer[0]>>>0&&++e[1],e[1]<this.buffer[1]>>>0&&++e[2],e[2]<this.buffer[2]>>>0&&++e[3],this.buffer[3]=e[3],this.buffer[2]=e[2],this.buffer[1]=e[1],this.buffer[0]=e[0],this}hex(){return`${ui(this.buffer[3])} ${ui(this.buffer[2])} ${ui(this.buffer[1])} ${ui(this.buffer[0])}`}static multiply(t,e){return new gi(new Uint32Array(t.buffer)).times(e)}static add(t,e){return new gi(new Uint32Array(t.buffer)).plus(e)}static from(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(4);return gi.fromString("string"===typeof t?t:t.toString(),e)}static fromNumber(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(4);return gi.fromString(t.toString(),e)}static fromString(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(4);const n=t.startsWith("-"),r=t.length,i=new gi(e);for(let o=n?1:0;o<r;){const e=8<r-o?8:r-o,n=new gi(new Uint32Array([Number.parseInt(t.slice(o,o+e),10),0,0,0])),a=new gi(new Uint32Array([di[e],0,0,0]));i.times(a),i.plus(n),o+=e}return n?i.negate():i}static convertArray(t){const e=new Uint32Array(4*t.length);for(let n=-1,r=t.length;++n<r;)gi.from(t[n],new Uint32Array(e.buffer,e.byteOffset+16*n,4));return e}}class mi extends re{constructor(t,e,n,r){super(),this.nodesIndex=-1,this.buffersIndex=-1,this.bytes=t,this.nodes=e,this.buffers=n,this.dictionaries=r}visit(t){return super.visit(t instanceof tr?t.type:t)}visitNull(t){let{length:e}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Zn({type:t,length:e})}visitBool(t){let{length:e,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Zn({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),data:this.readData(t)})}visitInt(t){let{length:e,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Zn({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),data:this.readData(t)})}visitFloat(t){let{length:e,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Zn({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),data:this.readData(t)})}visitUtf8(t){let{length:e,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Zn({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),valueOffsets:this.readOffsets(t),data:this.readData(t)})}visitBinary(t){let{length:e,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Zn({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),valueOffsets:this.readOffsets(t),data:this.readData(t)})}visitFixedSizeBinary(t){let{length:e,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Zn({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),data:this.readData(t)})}visitDate(t){let{length:e,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Zn({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),data:this.readData(t)})}visitTimestamp(t){let{length:e,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Zn({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),data:this.readData(t)})}visitTime(t){let{length:e,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Zn({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),data:this.readData(t)})}visitDecimal(t){let{length:e,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Zn({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),data:this.readData(t)})}visitList(t){let{length:e,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Zn({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),valueOffsets:this.readOffsets(t),child:this.visit(t.children[0])})}visitStruct(t){let{length:e,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Zn({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),children:this.visitMany(t.children)})}visitUnion(t){return t.mode===r.Sparse?this.visitSparseUnion(t):this.visitDenseUnion(t)}visitDenseUnion(t){let{length:e,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Zn({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),typeIds:this.readTypeIds(t),valueOffsets:this.readOffsets(t),children:this.visitMany(t.children)})}visitSparseUnion(t){let{length:e,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Zn({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),typeIds:this.readTypeIds(t),children:this.visitMany(t.children)})}visitDictionary(t){let{length:e,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Zn({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),data:this.readData(t.indices),dictionary:this.readDictionary(t)})}visitInterval(t){let{length:e,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Zn({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),data:this.readData(t)})}visitFixedSizeList(t){let{length:e,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Zn({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),child:this.visit(t.children[0])})}visitMap(t){let{length:e,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Zn({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),valueOffsets:this.readOffsets(t),child:this.visit(t.children[0])})}nextFieldNode(){return this.nodes[++this.nodesIndex]}nextBufferRange(){return this.buffers[++this.buffersIndex]}readNullBitmap(t,e){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:this.nextBufferRange();return e>0&&this.readData(t,n)||new Uint8Array(0)}readOffsets(t,e){return this.readData(t,e)}readTypeIds(t,e){return this.readData(t,e)}readData(t){let{length:e,offset:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextBufferRange();return this.bytes.subarray(n,n+e)}readDictionary(t){return this.dictionaries.get(t.id)}}class yi extends mi{constructor(t,e,n,r){super(new Uint8Array(0),e,n,r),this.sources=t}readNullBitmap(t,e){let{offset:n}=arguments.length>2&&void 0!==arguments[2]?arguments[2]:this.nextBufferRange();return e<=0?new Uint8Array(0):En(this.sources[n])}readOffsets(t){let{offset:e}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextBufferRange();return Q(Uint8Array,Q(Int32Array,this.sources[e]))}readTypeIds(t){let{offset:e}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextBufferRange();return Q(Uint8Array,Q(t.ArrayType,this.sources[e]))}readData(t){let{offset:e}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextBufferRange();const{sources:n}=this;return Rt.isTimestamp(t)||(Rt.isInt(t)||Rt.isTime(t))&&64===t.bitWidth||Rt.isDate(t)&&t.unit===o.MILLISECOND?Q(Uint8Array,pi.convertArray(n[e])):Rt.isDecimal(t)?Q(Uint8Array,gi.convertArray(n[e])):Rt.isBinary(t)||Rt.isFixedSizeBinary(t)?function(t){const e=t.join(""),n=new Uint8Array(e.length/2);for(let r=0;r<e.length;r+=2)n[r>>1]=Number.parseInt(e.slice(r,r+2),16);return n}(n[e]):Rt.isBool(t)?En(n[e]):Rt.isUtf8(t)?Y(n[e].join("")):Q(Uint8Array,Q(t.ArrayType,n[e].map((t=>+t))))}}var bi,vi,_i,wi,xi,Si,ki,Ci;!function(t){t[t.BUFFER=0]="BUFFER"}(bi||(bi={})),function(t){t[t.LZ4_FRAME=0]="LZ4_FRAME",t[t.ZSTD=1]="ZSTD"}(vi||(vi={}));class Ti{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsBodyCompression(t,e){return(e||new Ti).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsBodyCompression(t,e){return t.setPosition(t.position()+4),(e||new Ti).__init(t.readInt32(t.position())+t.position(),t)}codec(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt8(this.bb_pos+t):vi.LZ4_FRAME}method(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.readInt8(this.bb_pos+t):bi.BUFFER}static startBodyCompression(t){t.startObject(2)}static addCodec(t,e){t.addFieldInt8(0,e,vi.LZ4_FRAME)}static addMethod(t,e){t.addFieldInt8(1,e,bi.BUFFER)}static endBodyCompression(t){return t.endObject()}static createBodyCompression(t,e,n){return Ti.startBodyCompression(t),Ti.addCodec(t,e),Ti.addMethod(t,n),Ti.endBodyCompression(t)}}class Pi{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}offset(){return this.bb.readInt64(this.bb_pos)}length(){return this.bb.readInt64(this.bb_pos+8)}static sizeOf(){return 16}static createBuffer(t,e,n){return t.prep(8,16),t.writeInt64(n),t.writeInt64(e),t.offset()}}class Ei{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}length(){return this.bb.readInt64(this.bb_pos)}nullCount(){return this.bb.readInt64(this.bb_pos+8)}static sizeOf(){return 16}static createFieldNode(t,e,n){return t.prep(8,16),t.writeInt64(n),t.writeInt64(e),t.offset()}}class Ai{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsRecordBatch(t,e){return(e||new Ai).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsRecordBatch(t,e){return t.setPosition(t.position()+4),(e||new Ai).__init(t.readInt32(t.position())+t.position(),t)}length(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt64(this.bb_pos+t):this.bb.createLong(0,0)}nodes(t,e){const n=this.bb.__offset(this.bb_pos,6);return n?(e||new Ei).__init(this.bb.__vector(this.bb_pos+n)+16*t,this.bb):null}nodesLength(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.__vector_len(this.bb_pos+t):0}buffers(t,e){const n=this.bb.__offset(this.bb_pos,8);return n?(e||new Pi).__init(this.bb.__vector(this.bb_pos+n)+16*t,this.bb):null}buffersLength(){const t=this.bb.__offset(this.bb_pos,8);return t?this.bb.__vector_len(this.bb_pos+t):0}compression(t){const e=this.bb.__offset(this.bb_pos,10);return e?(t||new Ti).__init(this.bb.__indirect(this.bb_pos+e),this.bb):null}static startRecordBatch(t){t.startObject(4)}static addLength(t,e){t.addFieldInt64(0,e,t.createLong(0,0))}static addNodes(t,e){t.addFieldOffset(1,e,0)}static startNodesVector(t,e){t.startVector(16,e,8)}static addBuffers(t,e){t.addFieldOffset(2,e,0)}static startBuffersVector(t,e){t.startVector(16,e,8)}static addCompression(t,e){t.addFieldOffset(3,e,0)}static endRecordBatch(t){return t.endObject()}}class Ii{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsDictionaryBatch(t,e){return(e||new Ii).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsDictionaryBatch(t,e){return t.setPosition(t.position()+4),(e||new Ii).__init(t.readInt32(t.position())+t.position(),t)}id(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt64(this.bb_pos+t):this.bb.createLong(0,0)}data(t){const e=this.bb.__offset(this.bb_pos,6);return e?(t||new Ai).__init(this.bb.__indirect(this.bb_pos+e),this.bb):null}isDelta(){const t=this.bb.__offset(this.bb_pos,8);return!!t&&!!this.bb.readInt8(this.bb_pos+t)}static startDictionaryBatch(t){t.startObject(3)}static addId(t,e){t.addFieldInt64(0,e,t.createLong(0,0))}static addData(t,e){t.addFieldOffset(1,e,0)}static addIsDelta(t,e){t.addFieldInt8(2,+e,0)}static endDictionaryBatch(t){return t.endObject()}}!function(t){t[t.HALF=0]="HALF",t[t.SINGLE=1]="SINGLE",t[t.DOUBLE=2]="DOUBLE"}(_i||(_i={}));class Mi{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsFloatingPoint(t,e){return(e||new Mi).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsFloatingPoint(t,e){return t.setPosition(t.position()+4),(e||new Mi).__init(t.readInt32(t.position())+t.position(),t)}precision(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):_i.HALF}static startFloatingPoint(t){t.startObject(1)}static addPrecision(t,e){t.addFieldInt16(0,e,_i.HALF)}static endFloatingPoint(t){return t.endObject()}static createFloatingPoint(t,e){return Mi.startFloatingPoint(t),Mi.addPrecision(t,e),Mi.endFloatingPoint(t)}}class Fi{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsDecimal(t,e){return(e||new Fi).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsDecimal(t,e){return t.setPosition(t.position()+4),(e||new Fi).__init(t.readInt32(t.position())+t.position(),t)}precision(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt32(this.bb_pos+t):0}scale(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.readInt32(this.bb_pos+t):0}bitWidth(){const t=this.bb.__offset(this.bb_pos,8);return t?this.bb.readInt32(this.bb_pos+t):128}static startDecimal(t){t.startObject(3)}static addPrecision(t,e){t.addFieldInt32(0,e,0)}static addScale(t,e){t.addFieldInt32(1,e,0)}static addBitWidth(t,e){t.addFieldInt32(2,e,128)}static endDecimal(t){return t.endObject()}static createDecimal(t,e,n,r){return Fi.startDecimal(t),Fi.addPrecision(t,e),Fi.addScale(t,n),Fi.addBitWidth(t,r),Fi.endDecimal(t)}}!function(t){t[t.DAY=0]="DAY",t[t.MILLISECOND=1]="MILLISECOND"}(wi||(wi={}));class Di{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsDate(t,e){return(e||new Di).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsDate(t,e){return t.setPosition(t.position()+4),(e||new Di).__init(t.readInt32(t.position())+t.position(),t)}unit(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):wi.MILLISECOND}static startDate(t){t.startObject(1)}static addUnit(t,e){t.addFieldInt16(0,e,wi.MILLISECOND)}static endDate(t){return t.endObject()}static createDate(t,e){return Di.startDate(t),Di.addUnit(t,e),Di.endDate(t)}}!function(t){t[t.SECOND=0]="SECOND",t[t.MILLISECOND=1]="MILLISECOND",t[t.MICROSECOND=2]="MICROSECOND",t[t.NANOSECOND=3]="NANOSECOND"}(xi||(xi={}));class Ri{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsTime(t,e){return(e||new Ri).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsTime(t,e){return t.setPosition(t.position()+4),(e||new Ri).__init(t.readInt32(t.position())+t.position(),t)}unit(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):xi.MILLISECOND}bitWidth(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.readInt32(this.bb_pos+t):32}static startTime(t){t.startObject(2)}static addUnit(t,e){t.addFieldInt16(0,e,xi.MILLISECOND)}static addBitWidth(t,e){t.addFieldInt32(1,e,32)}static endTime(t){return t.endObject()}static createTime(t,e,n){return Ri.startTime(t),Ri.addUnit(t,e),Ri.addBitWidth(t,n),Ri.endTime(t)}}class Oi{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsTimestamp(t,e){return(e||new Oi).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsTimestamp(t,e){return t.setPosition(t.position()+4),(e||new Oi).__init(t.readInt32(t.position())+t.position(),t)}unit(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):xi.SECOND}timezone(t){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.__string(this.bb_pos+e,t):null}static startTimestamp(t){t.startObject(2)}static addUnit(t,e){t.addFieldInt16(0,e,xi.SECOND)}static addTimezone(t,e){t.addFieldOffset(1,e,0)}static endTimestamp(t){return t.endObject()}static createTimestamp(t,e,n){return Oi.startTimestamp(t),Oi.addUnit(t,e),Oi.addTimezone(t,n),Oi.endTimestamp(t)}}!function(t){t[t.YEAR_MONTH=0]="YEAR_MONTH",t[t.DAY_TIME=1]="DAY_TIME",t[t.MONTH_DAY_NANO=2]="MONTH_DAY_NANO"}(Si||(Si={}));class Ni{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsInterval(t,e){return(e||new Ni).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsInterval(t,e){return t.setPosition(t.position()+4),(e||new Ni).__init(t.readInt32(t.position())+t.position(),t)}unit(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):Si.YEAR_MONTH}static startInterval(t){t.startObject(1)}static addUnit(t,e){t.addFieldInt16(0,e,Si.YEAR_MONTH)}static endInterval(t){return t.endObject()}static createInterval(t,e){return Ni.startInterval(t),Ni.addUnit(t,e),Ni.endInterval(t)}}!function(t){t[t.Sparse=0]="Sparse",t[t.Dense=1]="Dense"}(ki||(ki={}));class Li{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsUnion(t,e){return(e||new Li).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsUnion(t,e){return t.setPosition(t.position()+4),(e||new Li).__init(t.readInt32(t.position())+t.position(),t)}mode(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):ki.Sparse}typeIds(t){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.readInt32(this.bb.__vector(this.bb_pos+e)+4*t):0}typeIdsLength(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.__vector_len(this.bb_pos+t):0}typeIdsArray(){const t=this.bb.__offset(this.bb_pos,6);return t?new Int32Array(this.bb.bytes().buffer,this.bb.bytes().byteOffset+this.bb.__vector(this.bb_pos+t),this.bb.__vector_len(this.bb_pos+t)):null}static startUnion(t){t.startObject(2)}static addMode(t,e){t.addFieldInt16(0,e,ki.Sparse)}static addTypeIds(t,e){t.addFieldOffset(1,e,0)}static createTypeIdsVector(t,e){t.startVector(4,e.length,4);for(let n=e.length-1;n>=0;n--)t.addInt32(e[n]);return t.endVector()}static startTypeIdsVector(t,e){t.startVector(4,e,4)}static endUnion(t){return t.endObject()}static createUnion(t,e,n){return Li.startUnion(t),Li.addMode(t,e),Li.addTypeIds(t,n),Li.endUnion(t)}}class Bi{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsFixedSizeBinary(t,e){return(e||new Bi).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsFixedSizeBinary(t,e){return t.setPosition(t.position()+4),(e||new Bi).__init(t.readInt32(t.position())+t.position(),t)}byteWidth(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt32(this.bb_pos+t):0}static startFixedSizeBinary(t){t.startObject(1)}static addByteWidth(t,e){t.addFieldInt32(0,e,0)}static endFixedSizeBinary(t){return t.endObject()}static createFixedSizeBinary(t,e){return Bi.startFixedSizeBinary(t),Bi.addByteWidth(t,e),Bi.endFixedSizeBinary(t)}}class zi{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsFixedSizeList(t,e){return(e||new zi).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsFixedSizeList(t,e){return t.setPosition(t.position()+4),(e||new zi).__init(t.readInt32(t.position())+t.position(),t)}listSize(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt32(this.bb_pos+t):0}static startFixedSizeList(t){t.startObject(1)}static addListSize(t,e){t.addFieldInt32(0,e,0)}static endFixedSizeList(t){return t.endObject()}static createFixedSizeList(t,e){return zi.startFixedSizeList(t),zi.addListSize(t,e),zi.endFixedSizeList(t)}}class ji{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsMap(t,e){return(e||new ji).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsMap(t,e){return t.setPosition(t.position()+4),(e||new ji).__init(t.readInt32(t.position())+t.position(),t)}keysSorted(){const t=this.bb.__offset(this.bb_pos,4);return!!t&&!!this.bb.readInt8(this.bb_pos+t)}static startMap(t){t.startObject(1)}static addKeysSorted(t,e){t.addFieldInt8(0,+e,0)}static endMap(t){return t.endObject()}static createMap(t,e){return ji.startMap(t),ji.addKeysSorted(t,e),ji.endMap(t)}}!function(t){t[t.NONE=0]="NONE",t[t.Schema=1]="Schema",t[t.DictionaryBatch=2]="DictionaryBatch",t[t.RecordBatch=3]="RecordBatch",t[t.Tensor=4]="Tensor",t[t.SparseTensor=5]="SparseTensor"}(Ci||(Ci={}));class Ui{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsMessage(t,e){return(e||new Ui).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsMessage(t,e){return t.setPosition(t.position()+4),(e||new Ui).__init(t.readInt32(t.position())+t.position(),t)}version(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):Mr.V1}headerType(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.readUint8(this.bb_pos+t):Ci.NONE}header(t){const e=this.bb.__offset(this.bb_pos,8);return e?this.bb.__union(t,this.bb_pos+e):null}bodyLength(){const t=this.bb.__offset(this.bb_pos,10);return t?this.bb.readInt64(this.bb_pos+t):this.bb.createLong(0,0)}customMetadata(t,e){const n=this.bb.__offset(this.bb_pos,12);return n?(e||new Lr).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*t),this.bb):null}customMetadataLength(){const t=this.bb.__offset(this.bb_pos,12);return t?this.bb.__vector_len(this.bb_pos+t):0}static startMessage(t){t.startObject(5)}static addVersion(t,e){t.addFieldInt16(0,e,Mr.V1)}static addHeaderType(t,e){t.addFieldInt8(1,e,Ci.NONE)}static addHeader(t,e){t.addFieldOffset(2,e,0)}static addBodyLength(t,e){t.addFieldInt64(3,e,t.createLong(0,0))}static addCustomMetadata(t,e){t.addFieldOffset(4,e,0)}static createCustomMetadataVector(t,e){t.startVector(4,e.length,4);for(let n=e.length-1;n>=0;n--)t.addOffset(e[n]);return t.endVector()}static startCustomMetadataVector(t,e){t.startVector(4,e,4)}static endMessage(t){return t.endObject()}static finishMessageBuffer(t,e){t.finish(e)}static finishSizePrefixedMessageBuffer(t,e){t.finish(e,void 0,!0)}static createMessage(t,e,n,r,i,o){return Ui.startMessage(t),Ui.addVersion(t,e),Ui.addHeaderType(t,n),Ui.addHeader(t,r),Ui.addBodyLength(t,i),Ui.addCustomMetadata(t,o),Ui.endMessage(t)}}class Vi{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsNull(t,e){return(e||new Vi).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsNull(t,e){return t.setPosition(t.position()+4),(e||new Vi).__init(t.readInt32(t.position())+t.position(),t)}static startNull(t){t.startObject(0)}static endNull(t){return t.endObject()}static createNull(t){return Vi.startNull(t),Vi.endNull(t)}}class $i{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsBinary(t,e){return(e||new $i).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsBinary(t,e){return t.setPosition(t.position()+4),(e||new $i).__init(t.readInt32(t.position())+t.position(),t)}static startBinary(t){t.startObject(0)}static endBinary(t){return t.endObject()}static createBinary(t){return $i.startBinary(t),$i.endBinary(t)}}class Wi{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsBool(t,e){return(e||new Wi).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsBool(t,e){return t.setPosition(t.position()+4),(e||new Wi).__init(t.readInt32(t.position())+t.position(),t)}static startBool(t){t.startObject(0)}static endBool(t){return t.endObject()}static createBool(t){return Wi.startBool(t),Wi.endBool(t)}}class Gi{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsUtf8(t,e){return(e||new Gi).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsUtf8(t,e){return t.setPosition(t.position()+4),(e||new Gi).__init(t.readInt32(t.position())+t.position(),t)}static startUtf8(t){t.startObject(0)}static endUtf8(t){return t.endObject()}static createUtf8(t){return Gi.startUtf8(t),Gi.endUtf8(t)}}class Hi{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsList(t,e){return(e||new Hi).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsList(t,e){return t.setPosition(t.position()+4),(e||new Hi).__init(t.readInt32(t.position())+t.position(),t)}static startList(t){t.startObject(0)}static endList(t){return t.endObject()}static createList(t){return Hi.startList(t),Hi.endList(t)}}class Yi{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsStruct_(t,e){return(e||new Yi).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsStruct_(t,e){return t.setPosition(t.position()+4),(e||new Yi).__init(t.readInt32(t.position())+t.position(),t)}static startStruct_(t){t.startObject(0)}static endStruct_(t){return t.endObject()}static createStruct_(t){return Yi.startStruct_(t),Yi.endStruct_(t)}}var qi=Ar;const Ki=new class extends re{visit(t,e){return null==t||null==e?void 0:super.visit(t,e)}visitNull(t,e){return Vi.startNull(e),Vi.endNull(e)}visitInt(t,e){return Br.startInt(e),Br.addBitWidth(e,t.bitWidth),Br.addIsSigned(e,t.isSigned),Br.endInt(e)}visitFloat(t,e){return Mi.startFloatingPoint(e),Mi.addPrecision(e,t.precision),Mi.endFloatingPoint(e)}visitBinary(t,e){return $i.startBinary(e),$i.endBinary(e)}visitBool(t,e){return Wi.startBool(e),Wi.endBool(e)}visitUtf8(t,e){return Gi.startUtf8(e),Gi.endUtf8(e)}visitDecimal(t,e){return Fi.startDecimal(e),Fi.addScale(e,t.scale),Fi.addPrecision(e,t.precision),Fi.addBitWidth(e,t.bitWidth),Fi.endDecimal(e)}visitDate(t,e){return Di.startDate(e),Di.addUnit(e,t.unit),Di.endDate(e)}visitTime(t,e){return Ri.startTime(e),Ri.addUnit(e,t.unit),Ri.addBitWidth(e,t.bitWidth),Ri.endTime(e)}visitTimestamp(t,e){const n=t.timezone&&e.createString(t.timezone)||void 0;return Oi.startTimestamp(e),Oi.addUnit(e,t.unit),void 0!==n&&Oi.addTimezone(e,n),Oi.endTimestamp(e)}visitInterval(t,e){return Ni.startInterval(e),Ni.addUnit(e,t.unit),Ni.endInterval(e)}visitList(t,e){return Hi.startList(e),Hi.endList(e)}visitStruct(t,e){return Yi.startStruct_(e),Yi.endStruct_(e)}visitUnion(t,e){Li.startTypeIdsVector(e,t.typeIds.length);const n=Li.createTypeIdsVector(e,t.typeIds);return Li.startUnion(e),Li.addMode(e,t.mode),Li.addTypeIds(e,n),Li.endUnion(e)}visitDictionary(t,e){const n=this.visit(t.indices,e);return zr.startDictionaryEncoding(e),zr.addId(e,new qi(t.id,0)),zr.addIsOrdered(e,t.isOrdered),void 0!==n&&zr.addIndexType(e,n),zr.endDictionaryEncoding(e)}visitFixedSizeBinary(t,e){return Bi.startFixedSizeBinary(e),Bi.addByteWidth(e,t.byteWidth),Bi.endFixedSizeBinary(e)}visitFixedSizeList(t,e){return zi.startFixedSizeList(e),zi.addListSize(e,t.listSize),zi.endFixedSizeList(e)}visitMap(t,e){return ji.startMap(e),ji.addKeysSorted(e,t.keysSorted),ji.endMap(e)}};function Xi(t){return new so(t.count,Zi(t.columns),Ji(t.columns))}function Qi(t,e){return(t.children||[]).filter(Boolean).map((t=>tr.fromJSON(t,e)))}function Zi(t){return(t||[]).reduce(((t,e)=>{return[...t,new uo(e.count,(n=e.VALIDITY,(n||[]).reduce(((t,e)=>t+ +(0===e)),0))),...Zi(e.children)];var n}),[])}function Ji(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[];for(let n=-1,r=(t||[]).length;++n<r;){const r=t[n];r.VALIDITY&&e.push(new co(e.length,r.VALIDITY.length)),r.TYPE&&e.push(new co(e.length,r.TYPE.length)),r.OFFSET&&e.push(new co(e.length,r.OFFSET.length)),r.DATA&&e.push(new co(e.length,r.DATA.length)),e=Ji(r.children,e)}return e}function to(t){return new Map(Object.entries(t||{}))}function eo(t){return new Nt(t.isSigned,t.bitWidth)}function no(t,e){const n=t.type.name;switch(n){case"NONE":case"null":return new Ot;case"binary":return new zt;case"utf8":return new jt;case"bool":return new Ut;case"list":return new Yt((e||[])[0]);case"struct":case"struct_":return new qt(e||[])}switch(n){case"int":{const e=t.type;return new Nt(e.isSigned,e.bitWidth)}case"floatingpoint":{const e=t.type;return new Bt(i[e.precision])}case"decimal":{const e=t.type;return new Vt(e.scale,e.precision,e.bitWidth)}case"date":{const e=t.type;return new $t(o[e.unit])}case"time":{const e=t.type;return new Wt(a[e.unit],e.bitWidth)}case"timestamp":{const e=t.type;return new Gt(a[e.unit],e.timezone)}case"interval":{const e=t.type;return new Ht(s[e.unit])}case"union":{const n=t.type;return new Kt(r[n.mode],n.typeIds||[],e||[])}case"fixedsizebinary":{const e=t.type;return new Xt(e.byteWidth)}case"fixedsizelist":{const n=t.type;return new Qt(n.listSize,(e||[])[0])}case"map":{const n=t.type;return new Zt((e||[])[0],n.keysSorted)}}throw new Error(`Unrecognized type: "${n}"`)}var ro=Ar,io=Nr,oo=Or;class ao{constructor(t,e,n,r){this._version=e,this._headerType=n,this.body=new Uint8Array(0),r&&(this._createHeader=()=>r),this._bodyLength="number"===typeof t?t:t.low}static fromJSON(t,n){const r=new ao(0,e.V4,n);return r._createHeader=function(t,e){return()=>{switch(e){case l.Schema:return Jn.fromJSON(t);case l.RecordBatch:return so.fromJSON(t);case l.DictionaryBatch:return lo.fromJSON(t)}throw new Error(`Unrecognized Message type: { name: ${l[e]}, type: ${e} }`)}}(t,n),r}static decode(t){t=new oo(J(t));const e=Ui.getRootAsMessage(t),n=e.bodyLength(),r=e.version(),i=e.headerType(),o=new ao(n,r,i);return o._createHeader=function(t,e){return()=>{switch(e){case l.Schema:return Jn.decode(t.header(new Ur));case l.RecordBatch:return so.decode(t.header(new Ai),t.version());case l.DictionaryBatch:return lo.decode(t.header(new Ii),t.version())}throw new Error(`Unrecognized Message type: { name: ${l[e]}, type: ${e} }`)}}(e,i),o}static encode(t){const n=new io;let r=-1;return t.isSchema()?r=Jn.encode(n,t.header()):t.isRecordBatch()?r=so.encode(n,t.header()):t.isDictionaryBatch()&&(r=lo.encode(n,t.header())),Ui.startMessage(n),Ui.addVersion(n,e.V4),Ui.addHeader(n,r),Ui.addHeaderType(n,t.headerType),Ui.addBodyLength(n,new ro(t.bodyLength,0)),Ui.finishMessageBuffer(n,Ui.endMessage(n)),n.asUint8Array()}static from(t){let n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0;if(t instanceof Jn)return new ao(0,e.V4,l.Schema,t);if(t instanceof so)return new ao(n,e.V4,l.RecordBatch,t);if(t instanceof lo)return new ao(n,e.V4,l.DictionaryBatch,t);throw new Error(`Unrecognized Message header: ${t}`)}get type(){return this.headerType}get version(){return this._version}get headerType(){return this._headerType}get bodyLength(){return this._bodyLength}header(){return this._createHeader()}isSchema(){return this.headerType===l.Schema}isRecordBatch(){return this.headerType===l.RecordBatch}isDictionaryBatch(){return this.headerType===l.DictionaryBatch}}class so{constructor(t,e,n){this._nodes=e,this._buffers=n,this._length="number"===typeof t?t:t.low}get nodes(){return this._nodes}get length(){return this._length}get buffers(){return this._buffers}}class lo{constructor(t,e){let n=arguments.length>2&&void 0!==arguments[2]&&arguments[2];this._data=t,this._isDelta=n,this._id="number"===typeof e?e:e.low}get id(){return this._id}get data(){return this._data}get isDelta(){return this._isDelta}get length(){return this.data.length}get nodes(){return this.data.nodes}get buffers(){return this.data.buffers}}class co{constructor(t,e){this.offset="number"===typeof t?t:t.low,this.length="number"===typeof e?e:e.low}}class uo{constructor(t,e){this.length="number"===typeof t?t:t.low,this.nullCount="number"===typeof e?e:e.low}}function ho(t,e){const n=[];for(let r,i=-1,o=-1,a=t.childrenLength();++i<a;)(r=t.children(i))&&(n[++o]=tr.decode(r,e));return n}function fo(t){const e=new Map;if(t)for(let n,r,i=-1,o=Math.trunc(t.customMetadataLength());++i<o;)(n=t.customMetadata(i))&&null!=(r=n.key())&&e.set(r,n.value());return e}function po(t){return new Nt(t.isSigned(),t.bitWidth())}function go(t,e){const n=t.typeType();switch(n){case Rr.NONE:case Rr.Null:return new Ot;case Rr.Binary:return new zt;case Rr.Utf8:return new jt;case Rr.Bool:return new Ut;case Rr.List:return new Yt((e||[])[0]);case Rr.Struct_:return new qt(e||[])}switch(n){case Rr.Int:{const e=t.type(new Br);return new Nt(e.isSigned(),e.bitWidth())}case Rr.FloatingPoint:{const e=t.type(new Mi);return new Bt(e.precision())}case Rr.Decimal:{const e=t.type(new Fi);return new Vt(e.scale(),e.precision(),e.bitWidth())}case Rr.Date:{const e=t.type(new Di);return new $t(e.unit())}case Rr.Time:{const e=t.type(new Ri);return new Wt(e.unit(),e.bitWidth())}case Rr.Timestamp:{const e=t.type(new Oi);return new Gt(e.unit(),e.timezone())}case Rr.Interval:{const e=t.type(new Ni);return new Ht(e.unit())}case Rr.Union:{const n=t.type(new Li);return new Kt(n.mode(),n.typeIdsArray()||[],e||[])}case Rr.FixedSizeBinary:{const e=t.type(new Bi);return new Xt(e.byteWidth())}case Rr.FixedSizeList:{const n=t.type(new zi);return new Qt(n.listSize(),(e||[])[0])}case Rr.Map:{const n=t.type(new ji);return new Zt((e||[])[0],n.keysSorted())}}throw new Error(`Unrecognized type: "${Rr[n]}" (${n})`)}tr.encode=function(t,e){let n=-1,r=-1,i=-1;const o=e.type;let a=e.typeId;Rt.isDictionary(o)?(a=o.dictionary.typeId,i=Ki.visit(o,t),r=Ki.visit(o.dictionary,t)):r=Ki.visit(o,t);const s=(o.children||[]).map((e=>tr.encode(t,e))),l=jr.createChildrenVector(t,s),c=e.metadata&&e.metadata.size>0?jr.createCustomMetadataVector(t,[...e.metadata].map((e=>{let[n,r]=e;const i=t.createString(`${n}`),o=t.createString(`${r}`);return Lr.startKeyValue(t),Lr.addKey(t,i),Lr.addValue(t,o),Lr.endKeyValue(t)}))):-1;e.name&&(n=t.createString(e.name));jr.startField(t),jr.addType(t,r),jr.addTypeType(t,a),jr.addChildren(t,l),jr.addNullable(t,!!e.nullable),-1!==n&&jr.addName(t,n);-1!==i&&jr.addDictionary(t,i);-1!==c&&jr.addCustomMetadata(t,c);return jr.endField(t)},tr.decode=function(t,e){let n,r,i,o,a,s;e&&(s=t.dictionary())?e.has(n=s.id().low)?(o=(o=s.indexType())?po(o):new Lt,a=new ee(e.get(n),o,n,s.isOrdered()),r=new tr(t.name(),a,t.nullable(),fo(t))):(o=(o=s.indexType())?po(o):new Lt,e.set(n,i=go(t,ho(t,e))),a=new ee(i,o,n,s.isOrdered()),r=new tr(t.name(),a,t.nullable(),fo(t))):(i=go(t,ho(t,e)),r=new tr(t.name(),i,t.nullable(),fo(t)));return r||null},tr.fromJSON=function(t,e){let n,r,i,o,a,s;return e&&(o=t.dictionary)?e.has(n=o.id)?(r=(r=o.indexType)?eo(r):new Lt,s=new ee(e.get(n),r,n,o.isOrdered),i=new tr(t.name,s,t.nullable,to(t.customMetadata))):(r=(r=o.indexType)?eo(r):new Lt,e.set(n,a=no(t,Qi(t,e))),s=new ee(a,r,n,o.isOrdered),i=new tr(t.name,s,t.nullable,to(t.customMetadata))):(a=no(t,Qi(t,e)),i=new tr(t.name,a,t.nullable,to(t.customMetadata))),i||null},Jn.encode=function(t,e){const n=e.fields.map((e=>tr.encode(t,e)));Ur.startFieldsVector(t,n.length);const r=Ur.createFieldsVector(t,n),i=e.metadata&&e.metadata.size>0?Ur.createCustomMetadataVector(t,[...e.metadata].map((e=>{let[n,r]=e;const i=t.createString(`${n}`),o=t.createString(`${r}`);return Lr.startKeyValue(t),Lr.addKey(t,i),Lr.addValue(t,o),Lr.endKeyValue(t)}))):-1;Ur.startSchema(t),Ur.addFields(t,r),Ur.addEndianness(t,mo?Fr.Little:Fr.Big),-1!==i&&Ur.addCustomMetadata(t,i);return Ur.endSchema(t)},Jn.decode=function(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Map;const n=function(t,e){const n=[];for(let r,i=-1,o=-1,a=t.fieldsLength();++i<a;)(r=t.fields(i))&&(n[++o]=tr.decode(r,e));return n}(t,e);return new Jn(n,fo(t),e)},Jn.fromJSON=function(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Map;return new Jn(function(t,e){return(t.fields||[]).filter(Boolean).map((t=>tr.fromJSON(t,e)))}(t,e),to(t.customMetadata),e)},so.encode=function(t,e){const n=e.nodes||[],r=e.buffers||[];Ai.startNodesVector(t,n.length);for(const a of n.slice().reverse())uo.encode(t,a);const i=t.endVector();Ai.startBuffersVector(t,r.length);for(const a of r.slice().reverse())co.encode(t,a);const o=t.endVector();return Ai.startRecordBatch(t),Ai.addLength(t,new ro(e.length,0)),Ai.addNodes(t,i),Ai.addBuffers(t,o),Ai.endRecordBatch(t)},so.decode=function(t){let n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:e.V4;if(null!==t.compression())throw new Error("Record batch compression not implemented");return new so(t.length(),function(t){const e=[];for(let n,r=-1,i=-1,o=t.nodesLength();++r<o;)(n=t.nodes(r))&&(e[++i]=uo.decode(n));return e}(t),function(t,n){const r=[];for(let i,o=-1,a=-1,s=t.buffersLength();++o<s;)(i=t.buffers(o))&&(n<e.V4&&(i.bb_pos+=8*(o+1)),r[++a]=co.decode(i));return r}(t,n))},so.fromJSON=Xi,lo.encode=function(t,e){const n=so.encode(t,e.data);return Ii.startDictionaryBatch(t),Ii.addId(t,new ro(e.id,0)),Ii.addIsDelta(t,e.isDelta),Ii.addData(t,n),Ii.endDictionaryBatch(t)},lo.decode=function(t){let n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:e.V4;return new lo(so.decode(t.data(),n),t.id(),t.isDelta())},lo.fromJSON=function(t){return new lo(Xi(t.data),t.id,t.isDelta)},uo.encode=function(t,e){return Ei.createFieldNode(t,new ro(e.length,0),new ro(e.nullCount,0))},uo.decode=function(t){return new uo(t.length(),t.nullCount())},co.encode=function(t,e){return Pi.createBuffer(t,new ro(e.offset,0),new ro(e.length,0))},co.decode=function(t){return new co(t.offset(),t.length())};const mo=(()=>{const t=new ArrayBuffer(2);return new DataView(t).setInt16(0,256,!0),256===new Int16Array(t)[0]})(),yo=t=>`Expected ${l[t]} Message in stream, but was null or length 0.`,bo=t=>`Header pointer of flatbuffer-encoded ${l[t]} Message is null or length 0.`,vo=(t,e)=>`Expected to read ${t} metadata bytes, but only read ${e}.`,_o=(t,e)=>`Expected to read ${t} bytes for message body, but only read ${e}.`;class wo{constructor(t){this.source=t instanceof ii?t:new ii(t)}[Symbol.iterator](){return this}next(){let t;return(t=this.readMetadataLength()).done||-1===t.value&&(t=this.readMetadataLength()).done||(t=this.readMetadata(t.value)).done?Jr:t}throw(t){return this.source.throw(t)}return(t){return this.source.return(t)}readMessage(t){let e;if((e=this.next()).done)return null;if(null!=t&&e.value.headerType!==t)throw new Error(yo(t));return e.value}readMessageBody(t){if(t<=0)return new Uint8Array(0);const e=J(this.source.read(t));if(e.byteLength<t)throw new Error(_o(t,e.byteLength));return e.byteOffset%8===0&&e.byteOffset+e.byteLength<=e.buffer.byteLength?e:e.slice()}readSchema(){let t=arguments.length>0&&void 0!==arguments[0]&&arguments[0];const e=l.Schema,n=this.readMessage(e),r=null===n||void 0===n?void 0:n.header();if(t&&!r)throw new Error(bo(e));return r}readMetadataLength(){const t=this.source.read(ko),e=t&&new Or(t),n=(null===e||void 0===e?void 0:e.readInt32(0))||0;return{done:0===n,value:n}}readMetadata(t){const e=this.source.read(t);if(!e)return Jr;if(e.byteLength<t)throw new Error(vo(t,e.byteLength));return{done:!1,value:ao.decode(e)}}}class xo{constructor(t,e){this.source=t instanceof oi?t:F(t)?new ci(t,e):new oi(t)}[Symbol.asyncIterator](){return this}next(){return B(this,void 0,void 0,(function*(){let t;return(t=yield this.readMetadataLength()).done||-1===t.value&&(t=yield this.readMetadataLength()).done||(t=yield this.readMetadata(t.value)).done?Jr:t}))}throw(t){return B(this,void 0,void 0,(function*(){return yield this.source.throw(t)}))}return(t){return B(this,void 0,void 0,(function*(){return yield this.source.return(t)}))}readMessage(t){return B(this,void 0,void 0,(function*(){let e;if((e=yield this.next()).done)return null;if(null!=t&&e.value.headerType!==t)throw new Error(yo(t));return e.value}))}readMessageBody(t){return B(this,void 0,void 0,(function*(){if(t<=0)return new Uint8Array(0);const e=J(yield this.source.read(t));if(e.byteLength<t)throw new Error(_o(t,e.byteLength));return e.byteOffset%8===0&&e.byteOffset+e.byteLength<=e.buffer.byteLength?e:e.slice()}))}readSchema(){let t=arguments.length>0&&void 0!==arguments[0]&&arguments[0];return B(this,void 0,void 0,(function*(){const e=l.Schema,n=yield this.readMessage(e),r=null===n||void 0===n?void 0:n.header();if(t&&!r)throw new Error(bo(e));return r}))}readMetadataLength(){return B(this,void 0,void 0,(function*(){const t=yield this.source.read(ko),e=t&&new Or(t),n=(null===e||void 0===e?void 0:e.readInt32(0))||0;return{done:0===n,value:n}}))}readMetadata(t){return B(this,void 0,void 0,(function*(){const e=yield this.source.read(t);if(!e)return Jr;if(e.byteLength<t)throw new Error(vo(t,e.byteLength));return{done:!1,value:ao.decode(e)}}))}}class So extends wo{constructor(t){super(new Uint8Array(0)),this._schema=!1,this._body=[],this._batchIndex=0,this._dictionaryIndex=0,this._json=t instanceof ti?t:new ti(t)}next(){const{_json:t}=this;if(!this._schema){this._schema=!0;return{done:!1,value:ao.fromJSON(t.schema,l.Schema)}}if(this._dictionaryIndex<t.dictionaries.length){const e=t.dictionaries[this._dictionaryIndex++];this._body=e.data.columns;return{done:!1,value:ao.fromJSON(e,l.DictionaryBatch)}}if(this._batchIndex<t.batches.length){const e=t.batches[this._batchIndex++];this._body=e.columns;return{done:!1,value:ao.fromJSON(e,l.RecordBatch)}}return this._body=[],Jr}readMessageBody(t){return function t(e){return(e||[]).reduce(((e,n)=>[...e,...n.VALIDITY&&[n.VALIDITY]||[],...n.TYPE&&[n.TYPE]||[],...n.OFFSET&&[n.OFFSET]||[],...n.DATA&&[n.DATA]||[],...t(n.children)]),[])}(this._body)}readMessage(t){let e;if((e=this.next()).done)return null;if(null!=t&&e.value.headerType!==t)throw new Error(yo(t));return e.value}readSchema(){const t=l.Schema,e=this.readMessage(t),n=null===e||void 0===e?void 0:e.header();if(!e||!n)throw new Error(bo(t));return n}}const ko=4,Co="ARROW1",To=new Uint8Array(6);for(let n=0;n<6;n+=1)To[n]=Co.codePointAt(n);function Po(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0;for(let n=-1,r=To.length;++n<r;)if(To[n]!==t[e+n])return!1;return!0}const Eo=To.length,Ao=Eo+ko,Io=2*Eo+ko;class Mo extends ei{constructor(t){super(),this._impl=t}get closed(){return this._impl.closed}get schema(){return this._impl.schema}get autoDestroy(){return this._impl.autoDestroy}get dictionaries(){return this._impl.dictionaries}get numDictionaries(){return this._impl.numDictionaries}get numRecordBatches(){return this._impl.numRecordBatches}get footer(){return this._impl.isFile()?this._impl.footer:null}isSync(){return this._impl.isSync()}isAsync(){return this._impl.isAsync()}isFile(){return this._impl.isFile()}isStream(){return this._impl.isStream()}next(){return this._impl.next()}throw(t){return this._impl.throw(t)}return(t){return this._impl.return(t)}cancel(){return this._impl.cancel()}reset(t){return this._impl.reset(t),this._DOMStream=void 0,this._nodeStream=void 0,this}open(t){const e=this._impl.open(t);return P(e)?e.then((()=>this)):this}readRecordBatch(t){return this._impl.isFile()?this._impl.readRecordBatch(t):null}[Symbol.iterator](){return this._impl[Symbol.iterator]()}[Symbol.asyncIterator](){return this._impl[Symbol.asyncIterator]()}toDOMStream(){return Kr.toDOMStream(this.isSync()?{[Symbol.iterator]:()=>this}:{[Symbol.asyncIterator]:()=>this})}toNodeStream(){return Kr.toNodeStream(this.isSync()?{[Symbol.iterator]:()=>this}:{[Symbol.asyncIterator]:()=>this},{objectMode:!0})}static throughNode(t){throw new Error('"throughNode" not available in this environment')}static throughDOM(t,e){throw new Error('"throughDOM" not available in this environment')}static from(t){return t instanceof Mo?t:I(t)?function(t){return new Fo(new Uo(t))}(t):F(t)?function(t){return B(this,void 0,void 0,(function*(){const{size:e}=yield t.stat(),n=new ci(t,e);return e>=Io&&Po(yield n.readAt(0,Eo+7&-8))?new Oo(new jo(n)):new Do(new Bo(n))}))}(t):P(t)?(()=>B(this,void 0,void 0,(function*(){return yield Mo.from(yield t)})))():D(t)||O(t)||N(t)||A(t)?function(t){return B(this,void 0,void 0,(function*(){const e=yield t.peek(Eo+7&-8);return e&&e.byteLength>=4?Po(e)?new Ro(new zo(yield t.read())):new Do(new Bo(t)):new Do(new Bo(function(){return U(this,arguments,(function*(){}))}()))}))}(new oi(t)):function(t){const e=t.peek(Eo+7&-8);return e&&e.byteLength>=4?Po(e)?new Ro(new zo(t.read())):new Fo(new Lo(t)):new Fo(new Lo(function*(){}()))}(new ii(t))}static readAll(t){return t instanceof Mo?t.isSync()?$o(t):Wo(t):I(t)||ArrayBuffer.isView(t)||E(t)||M(t)?$o(t):Wo(t)}}class Fo extends Mo{constructor(t){super(t),this._impl=t}readAll(){return[...this]}[Symbol.iterator](){return this._impl[Symbol.iterator]()}[Symbol.asyncIterator](){return U(this,arguments,(function*(){yield j(yield*V($(this[Symbol.iterator]())))}))}}class Do extends Mo{constructor(t){super(t),this._impl=t}readAll(){var t,e;return B(this,void 0,void 0,(function*(){const n=new Array;try{for(var r,i=$(this);!(r=yield i.next()).done;){const t=r.value;n.push(t)}}catch(o){t={error:o}}finally{try{r&&!r.done&&(e=i.return)&&(yield e.call(i))}finally{if(t)throw t.error}}return n}))}[Symbol.iterator](){throw new Error("AsyncRecordBatchStreamReader is not Iterable")}[Symbol.asyncIterator](){return this._impl[Symbol.asyncIterator]()}}class Ro extends Fo{constructor(t){super(t),this._impl=t}}class Oo extends Do{constructor(t){super(t),this._impl=t}}class No{constructor(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:new Map;this.closed=!1,this.autoDestroy=!0,this._dictionaryIndex=0,this._recordBatchIndex=0,this.dictionaries=t}get numDictionaries(){return this._dictionaryIndex}get numRecordBatches(){return this._recordBatchIndex}isSync(){return!1}isAsync(){return!1}isFile(){return!1}isStream(){return!1}reset(t){return this._dictionaryIndex=0,this._recordBatchIndex=0,this.schema=t,this.dictionaries=new Map,this}_loadRecordBatch(t,e){const n=this._loadVectors(t,e,this.schema.fields),r=Zn({type:new qt(this.schema.fields),length:t.length,children:n});return new yr(this.schema,r)}_loadDictionaryBatch(t,e){const{id:n,isDelta:r}=t,{dictionaries:i,schema:o}=this,a=i.get(n);if(r||!a){const i=o.dictionaries.get(n),s=this._loadVectors(t.data,e,[i]);return(a&&r?a.concat(new qn(s)):new qn(s)).memoize()}return a.memoize()}_loadVectors(t,e,n){return new mi(e,t.nodes,t.buffers,this.dictionaries).visitMany(n)}}class Lo extends No{constructor(t,e){super(e),this._reader=I(t)?new So(this._handle=t):new wo(this._handle=t)}isSync(){return!0}isStream(){return!0}[Symbol.iterator](){return this}cancel(){!this.closed&&(this.closed=!0)&&(this.reset()._reader.return(),this._reader=null,this.dictionaries=null)}open(t){return this.closed||(this.autoDestroy=Vo(this,t),this.schema||(this.schema=this._reader.readSchema())||this.cancel()),this}throw(t){return!this.closed&&this.autoDestroy&&(this.closed=!0)?this.reset()._reader.throw(t):Jr}return(t){return!this.closed&&this.autoDestroy&&(this.closed=!0)?this.reset()._reader.return(t):Jr}next(){if(this.closed)return Jr;let t;const{_reader:e}=this;for(;t=this._readNextMessageAndValidate();)if(t.isSchema())this.reset(t.header());else{if(t.isRecordBatch()){this._recordBatchIndex++;const n=t.header(),r=e.readMessageBody(t.bodyLength);return{done:!1,value:this._loadRecordBatch(n,r)}}if(t.isDictionaryBatch()){this._dictionaryIndex++;const n=t.header(),r=e.readMessageBody(t.bodyLength),i=this._loadDictionaryBatch(n,r);this.dictionaries.set(n.id,i)}}return this.schema&&0===this._recordBatchIndex?(this._recordBatchIndex++,{done:!1,value:new _r(this.schema)}):this.return()}_readNextMessageAndValidate(t){return this._reader.readMessage(t)}}class Bo extends No{constructor(t,e){super(e),this._reader=new xo(this._handle=t)}isAsync(){return!0}isStream(){return!0}[Symbol.asyncIterator](){return this}cancel(){return B(this,void 0,void 0,(function*(){!this.closed&&(this.closed=!0)&&(yield this.reset()._reader.return(),this._reader=null,this.dictionaries=null)}))}open(t){return B(this,void 0,void 0,(function*(){return this.closed||(this.autoDestroy=Vo(this,t),this.schema||(this.schema=yield this._reader.readSchema())||(yield this.cancel())),this}))}throw(t){return B(this,void 0,void 0,(function*(){return!this.closed&&this.autoDestroy&&(this.closed=!0)?yield this.reset()._reader.throw(t):Jr}))}return(t){return B(this,void 0,void 0,(function*(){return!this.closed&&this.autoDestroy&&(this.closed=!0)?yield this.reset()._reader.return(t):Jr}))}next(){return B(this,void 0,void 0,(function*(){if(this.closed)return Jr;let t;const{_reader:e}=this;for(;t=yield this._readNextMessageAndValidate();)if(t.isSchema())yield this.reset(t.header());else{if(t.isRecordBatch()){this._recordBatchIndex++;const n=t.header(),r=yield e.readMessageBody(t.bodyLength);return{done:!1,value:this._loadRecordBatch(n,r)}}if(t.isDictionaryBatch()){this._dictionaryIndex++;const n=t.header(),r=yield e.readMessageBody(t.bodyLength),i=this._loadDictionaryBatch(n,r);this.dictionaries.set(n.id,i)}}return this.schema&&0===this._recordBatchIndex?(this._recordBatchIndex++,{done:!1,value:new _r(this.schema)}):yield this.return()}))}_readNextMessageAndValidate(t){return B(this,void 0,void 0,(function*(){return yield this._reader.readMessage(t)}))}}class zo extends Lo{constructor(t,e){super(t instanceof li?t:new li(t),e)}get footer(){return this._footer}get numDictionaries(){return this._footer?this._footer.numDictionaries:0}get numRecordBatches(){return this._footer?this._footer.numRecordBatches:0}isSync(){return!0}isFile(){return!0}open(t){if(!this.closed&&!this._footer){this.schema=(this._footer=this._readFooter()).schema;for(const t of this._footer.dictionaryBatches())t&&this._readDictionaryBatch(this._dictionaryIndex++)}return super.open(t)}readRecordBatch(t){var e;if(this.closed)return null;this._footer||this.open();const n=null===(e=this._footer)||void 0===e?void 0:e.getRecordBatch(t);if(n&&this._handle.seek(n.offset)){const t=this._reader.readMessage(l.RecordBatch);if(null===t||void 0===t?void 0:t.isRecordBatch()){const e=t.header(),n=this._reader.readMessageBody(t.bodyLength);return this._loadRecordBatch(e,n)}}return null}_readDictionaryBatch(t){var e;const n=null===(e=this._footer)||void 0===e?void 0:e.getDictionaryBatch(t);if(n&&this._handle.seek(n.offset)){const t=this._reader.readMessage(l.DictionaryBatch);if(null===t||void 0===t?void 0:t.isDictionaryBatch()){const e=t.header(),n=this._reader.readMessageBody(t.bodyLength),r=this._loadDictionaryBatch(e,n);this.dictionaries.set(e.id,r)}}}_readFooter(){const{_handle:t}=this,e=t.size-Ao,n=t.readInt32(e),r=t.readAt(e-n,n);return Hr.decode(r)}_readNextMessageAndValidate(t){var e;if(this._footer||this.open(),this._footer&&this._recordBatchIndex<this.numRecordBatches){const n=null===(e=this._footer)||void 0===e?void 0:e.getRecordBatch(this._recordBatchIndex);if(n&&this._handle.seek(n.offset))return this._reader.readMessage(t)}return null}}class jo extends Bo{constructor(t){for(var e=arguments.length,n=new Array(e>1?e-1:0),r=1;r<e;r++)n[r-1]=arguments[r];const i="number"!==typeof n[0]?n.shift():void 0,o=n[0]instanceof Map?n.shift():void 0;super(t instanceof ci?t:new ci(t,i),o)}get footer(){return this._footer}get numDictionaries(){return this._footer?this._footer.numDictionaries:0}get numRecordBatches(){return this._footer?this._footer.numRecordBatches:0}isFile(){return!0}isAsync(){return!0}open(t){const e=Object.create(null,{open:{get:()=>super.open}});return B(this,void 0,void 0,(function*(){if(!this.closed&&!this._footer){this.schema=(this._footer=yield this._readFooter()).schema;for(const t of this._footer.dictionaryBatches())t&&(yield this._readDictionaryBatch(this._dictionaryIndex++))}return yield e.open.call(this,t)}))}readRecordBatch(t){var e;return B(this,void 0,void 0,(function*(){if(this.closed)return null;this._footer||(yield this.open());const n=null===(e=this._footer)||void 0===e?void 0:e.getRecordBatch(t);if(n&&(yield this._handle.seek(n.offset))){const t=yield this._reader.readMessage(l.RecordBatch);if(null===t||void 0===t?void 0:t.isRecordBatch()){const e=t.header(),n=yield this._reader.readMessageBody(t.bodyLength);return this._loadRecordBatch(e,n)}}return null}))}_readDictionaryBatch(t){var e;return B(this,void 0,void 0,(function*(){const n=null===(e=this._footer)||void 0===e?void 0:e.getDictionaryBatch(t);if(n&&(yield this._handle.seek(n.offset))){const t=yield this._reader.readMessage(l.DictionaryBatch);if(null===t||void 0===t?void 0:t.isDictionaryBatch()){const e=t.header(),n=yield this._reader.readMessageBody(t.bodyLength),r=this._loadDictionaryBatch(e,n);this.dictionaries.set(e.id,r)}}}))}_readFooter(){return B(this,void 0,void 0,(function*(){const{_handle:t}=this;t._pending&&(yield t._pending);const e=t.size-Ao,n=yield t.readInt32(e),r=yield t.readAt(e-n,n);return Hr.decode(r)}))}_readNextMessageAndValidate(t){return B(this,void 0,void 0,(function*(){if(this._footer||(yield this.open()),this._footer&&this._recordBatchIndex<this.numRecordBatches){const e=this._footer.getRecordBatch(this._recordBatchIndex);if(e&&(yield this._handle.seek(e.offset)))return yield this._reader.readMessage(t)}return null}))}}class Uo extends Lo{constructor(t,e){super(t,e)}_loadVectors(t,e,n){return new yi(e,t.nodes,t.buffers,this.dictionaries).visitMany(n)}}function Vo(t,e){return e&&"boolean"===typeof e.autoDestroy?e.autoDestroy:t.autoDestroy}function*$o(t){const e=Mo.from(t);try{if(!e.open({autoDestroy:!1}).closed)do{yield e}while(!e.reset().open().closed)}finally{e.cancel()}}function Wo(t){return U(this,arguments,(function*(){const e=yield j(Mo.from(t));try{if(!(yield j(e.open({autoDestroy:!1}))).closed)do{yield yield j(e)}while(!(yield j(e.reset().open())).closed)}finally{yield j(e.cancel())}}))}class Go extends re{constructor(){super(),this._byteLength=0,this._nodes=[],this._buffers=[],this._bufferRegions=[]}static assemble(){const t=e=>e.flatMap((e=>Array.isArray(e)?t(e):e instanceof yr?e.data.children:e.data)),e=new Go;for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return e.visitMany(t(r)),e}visit(t){if(t instanceof qn)return this.visitMany(t.data),this;const{type:e}=t;if(!Rt.isDictionary(e)){const{length:n,nullCount:r}=t;if(n>2147483647)throw new RangeError("Cannot write arrays larger than 2^31 - 1 in length");Rt.isNull(e)||Ho.call(this,r<=0?new Uint8Array(0):Pn(t.offset,n,t.nullBitmap)),this.nodes.push(new uo(n,r))}return super.visit(t)}visitNull(t){return this}visitDictionary(t){return this.visit(t.clone(t.type.indices))}get nodes(){return this._nodes}get buffers(){return this._buffers}get byteLength(){return this._byteLength}get bufferRegions(){return this._bufferRegions}}function Ho(t){const e=t.byteLength+7&-8;return this.buffers.push(t),this.bufferRegions.push(new co(this._byteLength,e)),this._byteLength+=e,this}function Yo(t){return Ho.call(this,t.values.subarray(0,t.length*t.stride))}function qo(t){const{length:e,values:n,valueOffsets:r}=t,i=r[0],o=r[e],a=Math.min(o-i,n.byteLength-i);return Ho.call(this,rt(-r[0],e,r)),Ho.call(this,n.subarray(i,i+a)),this}function Ko(t){const{length:e,valueOffsets:n}=t;return n&&Ho.call(this,rt(n[0],e,n)),this.visit(t.children[0])}function Xo(t){return this.visitMany(t.type.children.map(((e,n)=>t.children[n])).filter(Boolean))[0]}Go.prototype.visitBool=function(t){let e;return t.nullCount>=t.length?Ho.call(this,new Uint8Array(0)):(e=t.values)instanceof Uint8Array?Ho.call(this,Pn(t.offset,t.length,e)):Ho.call(this,En(t.values))},Go.prototype.visitInt=Yo,Go.prototype.visitFloat=Yo,Go.prototype.visitUtf8=qo,Go.prototype.visitBinary=qo,Go.prototype.visitFixedSizeBinary=Yo,Go.prototype.visitDate=Yo,Go.prototype.visitTimestamp=Yo,Go.prototype.visitTime=Yo,Go.prototype.visitDecimal=Yo,Go.prototype.visitList=Ko,Go.prototype.visitStruct=Xo,Go.prototype.visitUnion=function(t){const{type:e,length:n,typeIds:i,valueOffsets:o}=t;if(Ho.call(this,i),e.mode===r.Sparse)return Xo.call(this,t);if(e.mode===r.Dense){if(t.offset<=0)return Ho.call(this,o),Xo.call(this,t);{const r=i.reduce(((t,e)=>Math.max(t,e)),i[0]),a=new Int32Array(r+1),s=new Int32Array(r+1).fill(-1),l=new Int32Array(n),c=rt(-o[0],n,o);for(let t,e,o=-1;++o<n;)-1===(e=s[t=i[o]])&&(e=s[t]=c[t]),l[o]=c[o]-e,++a[t];Ho.call(this,l);for(let i,o=-1,u=e.children.length;++o<u;)if(i=t.children[o]){const t=e.typeIds[o],r=Math.min(n,a[t]);this.visit(i.slice(s[t],r))}}}return this},Go.prototype.visitInterval=Yo,Go.prototype.visitFixedSizeList=Ko,Go.prototype.visitMap=Ko;class Qo extends ei{constructor(t){super(),this._position=0,this._started=!1,this._sink=new ri,this._schema=null,this._dictionaryBlocks=[],this._recordBatchBlocks=[],this._dictionaryDeltaOffsets=new Map,T(t)||(t={autoDestroy:!0,writeLegacyIpcFormat:!1}),this._autoDestroy="boolean"!==typeof t.autoDestroy||t.autoDestroy,this._writeLegacyIpcFormat="boolean"===typeof t.writeLegacyIpcFormat&&t.writeLegacyIpcFormat}static throughNode(t){throw new Error('"throughNode" not available in this environment')}static throughDOM(t,e){throw new Error('"throughDOM" not available in this environment')}toString(){let t=arguments.length>0&&void 0!==arguments[0]&&arguments[0];return this._sink.toString(t)}toUint8Array(){let t=arguments.length>0&&void 0!==arguments[0]&&arguments[0];return this._sink.toUint8Array(t)}writeAll(t){return P(t)?t.then((t=>this.writeAll(t))):A(t)?ea(this,t):ta(this,t)}get closed(){return this._sink.closed}[Symbol.asyncIterator](){return this._sink[Symbol.asyncIterator]()}toDOMStream(t){return this._sink.toDOMStream(t)}toNodeStream(t){return this._sink.toNodeStream(t)}close(){return this.reset()._sink.close()}abort(t){return this.reset()._sink.abort(t)}finish(){return this._autoDestroy?this.close():this.reset(this._sink,this._schema),this}reset(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this._sink,e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:null;var n;return t===this._sink||t instanceof ri?this._sink=t:(this._sink=new ri,t&&(T(n=t)&&C(n.abort)&&C(n.getWriter)&&!R(n))?this.toDOMStream({type:"bytes"}).pipeTo(t):t&&(t=>T(t)&&C(t.end)&&C(t.write)&&k(t.writable)&&!R(t))(t)&&this.toNodeStream({objectMode:!1}).pipe(t)),this._started&&this._schema&&this._writeFooter(this._schema),this._started=!1,this._dictionaryBlocks=[],this._recordBatchBlocks=[],this._dictionaryDeltaOffsets=new Map,e&&pr(e,this._schema)||(null==e?(this._position=0,this._schema=null):(this._started=!0,this._schema=e,this._writeSchema(e))),this}write(t){let e=null;if(!this._sink)throw new Error("RecordBatchWriter is closed");if(null==t)return this.finish()&&void 0;if(t instanceof Sr&&!(e=t.schema))return this.finish()&&void 0;if(t instanceof yr&&!(e=t.schema))return this.finish()&&void 0;if(e&&!pr(e,this._schema)){if(this._started&&this._autoDestroy)return this.close();this.reset(this._sink,e)}t instanceof yr?t instanceof _r||this._writeRecordBatch(t):t instanceof Sr?this.writeAll(t.batches):E(t)&&this.writeAll(t)}_writeMessage(t){const e=(arguments.length>1&&void 0!==arguments[1]?arguments[1]:8)-1,n=ao.encode(t),r=n.byteLength,i=this._writeLegacyIpcFormat?4:8,o=r+i+e&~e,a=o-r-i;return t.headerType===l.RecordBatch?this._recordBatchBlocks.push(new qr(o,t.bodyLength,this._position)):t.headerType===l.DictionaryBatch&&this._dictionaryBlocks.push(new qr(o,t.bodyLength,this._position)),this._writeLegacyIpcFormat||this._write(Int32Array.of(-1)),this._write(Int32Array.of(o-i)),r>0&&this._write(n),this._writePadding(a)}_write(t){if(this._started){const e=J(t);e&&e.byteLength>0&&(this._sink.write(e),this._position+=e.byteLength)}return this}_writeSchema(t){return this._writeMessage(ao.from(t))}_writeFooter(t){return this._writeLegacyIpcFormat?this._write(Int32Array.of(0)):this._write(Int32Array.of(-1,0))}_writeMagic(){return this._write(To)}_writePadding(t){return t>0?this._write(new Uint8Array(t)):this}_writeRecordBatch(t){const{byteLength:e,nodes:n,bufferRegions:r,buffers:i}=Go.assemble(t),o=new so(t.numRows,n,r),a=ao.from(o,e);return this._writeDictionaries(t)._writeMessage(a)._writeBodyBuffers(i)}_writeDictionaryBatch(t,e){let n=arguments.length>2&&void 0!==arguments[2]&&arguments[2];this._dictionaryDeltaOffsets.set(e,t.length+(this._dictionaryDeltaOffsets.get(e)||0));const{byteLength:r,nodes:i,bufferRegions:o,buffers:a}=Go.assemble(new qn([t])),s=new so(t.length,i,o),l=new lo(s,e,n),c=ao.from(l,r);return this._writeMessage(c)._writeBodyBuffers(a)}_writeBodyBuffers(t){let e,n,r;for(let i=-1,o=t.length;++i<o;)(e=t[i])&&(n=e.byteLength)>0&&(this._write(e),(r=(n+7&-8)-n)>0&&this._writePadding(r));return this}_writeDictionaries(t){for(let[e,n]of t.dictionaries){let t=this._dictionaryDeltaOffsets.get(e)||0;if(0===t||(n=null===n||void 0===n?void 0:n.slice(t)).length>0)for(const r of n.data)this._writeDictionaryBatch(r,e,t>0),t+=r.length}return this}}class Zo extends Qo{static writeAll(t,e){const n=new Zo(e);return P(t)?t.then((t=>n.writeAll(t))):A(t)?ea(n,t):ta(n,t)}}class Jo extends Qo{static writeAll(t){const e=new Jo;return P(t)?t.then((t=>e.writeAll(t))):A(t)?ea(e,t):ta(e,t)}constructor(){super(),this._autoDestroy=!0}_writeSchema(t){return this._writeMagic()._writePadding(2)}_writeFooter(t){const n=Hr.encode(new Hr(t,e.V4,this._recordBatchBlocks,this._dictionaryBlocks));return super._writeFooter(t)._write(n)._write(Int32Array.of(n.byteLength))._writeMagic()}}function ta(t,e){let n=e;e instanceof Sr&&(n=e.batches,t.reset(void 0,e.schema));for(const r of n)t.write(r);return t.finish()}function ea(t,e){var n,r,i,o;return B(this,void 0,void 0,(function*(){try{for(n=$(e);!(r=yield n.next()).done;){const e=r.value;t.write(e)}}catch(a){i={error:a}}finally{try{r&&!r.done&&(o=n.return)&&(yield o.call(n))}finally{if(i)throw i.error}}return t.finish()}))}function na(t){const e=Mo.from(t);return P(e)?e.then((t=>na(t))):e.isAsync()?e.readAll().then((t=>new Sr(t))):new Sr(e.readAll())}function ra(t){return("stream"===(arguments.length>1&&void 0!==arguments[1]?arguments[1]:"stream")?Zo:Jo).writeAll(t).toUint8Array(!0)}var ia,oa=function(){function t(t,e,n,r){var i=this;this.getCell=function(t,e){var n=t<i.headerRows&&e<i.headerColumns,r=t>=i.headerRows&&e<i.headerColumns,o=t<i.headerRows&&e>=i.headerColumns;if(n){var a=["blank"];return e>0&&a.push("level"+t),{type:"blank",classNames:a.join(" "),content:""}}if(o)return{type:"columns",classNames:(a=["col_heading","level"+t,"col"+(l=e-i.headerColumns)]).join(" "),content:i.getContent(i.columnsTable,l,t)};if(r){a=["row_heading","level"+e,"row"+(s=t-i.headerRows)];return{type:"index",id:"T_".concat(i.uuid,"level").concat(e,"_row").concat(s),classNames:a.join(" "),content:i.getContent(i.indexTable,s,e)}}a=["data","row"+(s=t-i.headerRows),"col"+(l=e-i.headerColumns)];var s,l,c=i.styler?i.getContent(i.styler.displayValuesTable,s,l):i.getContent(i.dataTable,s,l);return{type:"data",id:"T_".concat(i.uuid,"row").concat(s,"_col").concat(l),classNames:a.join(" "),content:c}},this.getContent=function(t,e,n){var r=t.getChildAt(n);return null===r?"":i.getColumnTypeId(t,n)===c.Timestamp?i.nanosToDate(r.get(e)):r.get(e)},this.dataTable=na(t),this.indexTable=na(e),this.columnsTable=na(n),this.styler=r?{caption:r.caption,displayValuesTable:na(r.displayValues),styles:r.styles,uuid:r.uuid}:void 0}return Object.defineProperty(t.prototype,"rows",{get:function(){return this.indexTable.numRows+this.columnsTable.numCols},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"columns",{get:function(){return this.indexTable.numCols+this.columnsTable.numRows},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"headerRows",{get:function(){return this.rows-this.dataRows},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"headerColumns",{get:function(){return this.columns-this.dataColumns},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"dataRows",{get:function(){return this.dataTable.numRows},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"dataColumns",{get:function(){return this.dataTable.numCols},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"uuid",{get:function(){return this.styler&&this.styler.uuid},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"caption",{get:function(){return this.styler&&this.styler.caption},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"styles",{get:function(){return this.styler&&this.styler.styles},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"table",{get:function(){return this.dataTable},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"index",{get:function(){return this.indexTable},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"columnTable",{get:function(){return this.columnsTable},enumerable:!1,configurable:!0}),t.prototype.serialize=function(){return{data:ra(this.dataTable),index:ra(this.indexTable),columns:ra(this.columnsTable)}},t.prototype.getColumnTypeId=function(t,e){return t.schema.fields[e].type.typeId},t.prototype.nanosToDate=function(t){return new Date(t/1e6)},t}(),aa=function(){return aa=Object.assign||function(t){for(var e,n=1,r=arguments.length;n<r;n++)for(var i in e=arguments[n])Object.prototype.hasOwnProperty.call(e,i)&&(t[i]=e[i]);return t},aa.apply(this,arguments)};!function(t){t.COMPONENT_READY="streamlit:componentReady",t.SET_COMPONENT_VALUE="streamlit:setComponentValue",t.SET_FRAME_HEIGHT="streamlit:setFrameHeight"}(ia||(ia={}));var sa=function(){function t(){}return t.API_VERSION=1,t.RENDER_EVENT="streamlit:render",t.events=new EventTarget,t.registeredMessageListener=!1,t.setComponentReady=function(){t.registeredMessageListener||(window.addEventListener("message",t.onMessageEvent),t.registeredMessageListener=!0),t.sendBackMsg(ia.COMPONENT_READY,{apiVersion:t.API_VERSION})},t.setFrameHeight=function(e){void 0===e&&(e=document.body.scrollHeight),e!==t.lastFrameHeight&&(t.lastFrameHeight=e,t.sendBackMsg(ia.SET_FRAME_HEIGHT,{height:e}))},t.setComponentValue=function(e){var n;e instanceof oa?(n="dataframe",e=e.serialize()):!function(t){var e=!1;try{e=t instanceof BigInt64Array||t instanceof BigUint64Array}catch(n){}return t instanceof Int8Array||t instanceof Uint8Array||t instanceof Uint8ClampedArray||t instanceof Int16Array||t instanceof Uint16Array||t instanceof Int32Array||t instanceof Uint32Array||t instanceof Float32Array||t instanceof Float64Array||e}(e)?e instanceof ArrayBuffer?(n="bytes",e=new Uint8Array(e)):n="json":(n="bytes",e=new Uint8Array(e.buffer)),t.sendBackMsg(ia.SET_COMPONENT_VALUE,{value:e,dataType:n})},t.onMessageEvent=function(e){if(e.data.type===t.RENDER_EVENT)t.onRenderMessage(e.data)},t.onRenderMessage=function(e){var n=e.args;null==n&&(console.error("Got null args in onRenderMessage. This should never happen"),n={});var r=e.dfs&&e.dfs.length>0?t.argsDataframeToObject(e.dfs):{};n=aa(aa({},n),r);var i=Boolean(e.disabled),o=e.theme;o&&la(o);var a={disabled:i,args:n,theme:o},s=new CustomEvent(t.RENDER_EVENT,{detail:a});t.events.dispatchEvent(s)},t.argsDataframeToObject=function(e){var n=e.map((function(e){var n=e.key,r=e.value;return[n,t.toArrowTable(r)]}));return Object.fromEntries(n)},t.toArrowTable=function(t){var e,n=(e=t.data).data,r=e.index,i=e.columns,o=e.styler;return new oa(n,r,i,o)},t.sendBackMsg=function(t,e){window.parent.postMessage(aa({isStreamlitMessage:!0,type:t},e),"*")},t}(),la=function(t){var e=document.createElement("style");document.head.appendChild(e),e.innerHTML="\n    :root {\n      --primary-color: ".concat(t.primaryColor,";\n      --background-color: ").concat(t.backgroundColor,";\n      --secondary-background-color: ").concat(t.secondaryBackgroundColor,";\n      --text-color: ").concat(t.textColor,";\n      --font: ").concat(t.font,";\n    }\n\n    body {\n      background-color: var(--background-color);\n      color: var(--text-color);\n    }\n  ")};var ca=function(){var t=function(e,n){return t=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(t,e){t.__proto__=e}||function(t,e){for(var n in e)Object.prototype.hasOwnProperty.call(e,n)&&(t[n]=e[n])},t(e,n)};return function(e,n){if("function"!==typeof n&&null!==n)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");function r(){this.constructor=e}t(e,n),e.prototype=null===n?Object.create(n):(r.prototype=n.prototype,new r)}}();!function(t){function e(){return null!==t&&t.apply(this,arguments)||this}ca(e,t),e.prototype.componentDidMount=function(){sa.setFrameHeight()},e.prototype.componentDidUpdate=function(){sa.setFrameHeight()}}(m.PureComponent);function ua(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=!1;function r(e){const n=`chakra-${(["container","root"].includes(e??"")?[t]:[t,e]).filter(Boolean).join("__")}`;return{className:n,selector:`.${n}`,toString:()=>e}}return{parts:function(){!function(){if(n)throw new Error("[anatomy] .part(...) should only be called once. Did you mean to use .extend(...) ?");n=!0}();for(var i=arguments.length,o=new Array(i),a=0;a<i;a++)o[a]=arguments[a];for(const t of o)e[t]=r(t);return ua(t,e)},toPart:r,extend:function(){for(var n=arguments.length,i=new Array(n),o=0;o<n;o++)i[o]=arguments[o];for(const t of i)t in e||(e[t]=r(t));return ua(t,e)},selectors:function(){return Object.fromEntries(Object.entries(e).map((t=>{let[e,n]=t;return[e,n.selector]})))},classnames:function(){return Object.fromEntries(Object.entries(e).map((t=>{let[e,n]=t;return[e,n.className]})))},get keys(){return Object.keys(e)},__type:{}}}const da=ua("accordion").parts("root","container","button","panel","icon"),ha=ua("alert").parts("title","description","container","icon","spinner"),fa=ua("avatar").parts("label","badge","container","excessLabel","group"),pa=ua("breadcrumb").parts("link","item","container","separator"),ga=(ua("button").parts(),ua("checkbox").parts("control","icon","container","label")),ma=(ua("progress").parts("track","filledTrack","label"),ua("drawer").parts("overlay","dialogContainer","dialog","header","closeButton","body","footer")),ya=ua("editable").parts("preview","input","textarea"),ba=ua("form").parts("container","requiredIndicator","helperText"),va=ua("formError").parts("text","icon"),_a=ua("input").parts("addon","field","element","group"),wa=ua("list").parts("container","item","icon"),xa=ua("menu").parts("button","list","item","groupTitle","icon","command","divider"),Sa=ua("modal").parts("overlay","dialogContainer","dialog","header","closeButton","body","footer"),ka=ua("numberinput").parts("root","field","stepperGroup","stepper"),Ca=(ua("pininput").parts("field"),ua("popover").parts("content","header","body","footer","popper","arrow","closeButton")),Ta=ua("progress").parts("label","filledTrack","track"),Pa=ua("radio").parts("container","control","label"),Ea=ua("select").parts("field","icon"),Aa=ua("slider").parts("container","track","thumb","filledTrack","mark"),Ia=ua("stat").parts("container","label","helpText","number","icon"),Ma=ua("switch").parts("container","track","thumb","label"),Fa=ua("table").parts("table","thead","tbody","tr","th","td","tfoot","caption"),Da=ua("tabs").parts("root","tab","tablist","tabpanel","tabpanels","indicator"),Ra=ua("tag").parts("container","label","closeButton"),Oa=ua("card").parts("container","header","body","footer");ua("stepper").parts("stepper","step","title","description","indicator","separator","icon","number");function Na(t){return{definePartsStyle:t=>t,defineMultiStyleConfig:e=>({parts:t,...e})}}const{definePartsStyle:La,defineMultiStyleConfig:Ba}=Na(da.keys),za=Ba({baseStyle:La({container:{borderTopWidth:"1px",borderColor:"inherit",_last:{borderBottomWidth:"1px"}},button:{transitionProperty:"common",transitionDuration:"normal",fontSize:"md",_focusVisible:{boxShadow:"outline"},_hover:{bg:"blackAlpha.50"},_disabled:{opacity:.4,cursor:"not-allowed"},px:"4",py:"2"},panel:{pt:"2",px:"4",pb:"5"},icon:{fontSize:"1.25em"}})});function ja(t){const e=function(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"-";return t.replace(/\s+/g,e)}(t.toString());return function(t){return t.replace(/[!-,/:-@[-^`{-~]/g,"\\$&")}(function(t){if(t.includes("\\."))return t;const e=!Number.isInteger(parseFloat(t.toString()));return e?t.replace(".","\\."):t}(e))}function Ua(t,e){return`var(${t}${e?`, ${e}`:""})`}function Va(t){return ja(`--${function(t){return[arguments.length>1&&void 0!==arguments[1]?arguments[1]:"",t].filter(Boolean).join("-")}(t,arguments.length>1&&void 0!==arguments[1]?arguments[1]:"")}`)}function $a(t,e,n){const r=Va(t,n);return{variable:r,reference:Ua(r,e)}}function Wa(t,e,n){return Math.min(Math.max(t,n),e)}class Ga extends Error{constructor(t){super(`Failed to parse color: "${t}"`)}}var Ha=Ga;function Ya(t){if("string"!==typeof t)throw new Ha(t);if("transparent"===t.trim().toLowerCase())return[0,0,0,0];let e=t.trim();e=es.test(t)?function(t){const e=t.toLowerCase().trim(),n=Ka[function(t){let e=5381,n=t.length;for(;n;)e=33*e^t.charCodeAt(--n);return(e>>>0)%2341}(e)];if(!n)throw new Ha(t);return`#${n}`}(t):t;const n=Qa.exec(e);if(n){const t=Array.from(n).slice(1);return[...t.slice(0,3).map((t=>parseInt(Xa(t,2),16))),parseInt(Xa(t[3]||"f",2),16)/255]}const r=Za.exec(e);if(r){const t=Array.from(r).slice(1);return[...t.slice(0,3).map((t=>parseInt(t,16))),parseInt(t[3]||"ff",16)/255]}const i=Ja.exec(e);if(i){const t=Array.from(i).slice(1);return[...t.slice(0,3).map((t=>parseInt(t,10))),parseFloat(t[3]||"1")]}const o=ts.exec(e);if(o){const[e,n,r,i]=Array.from(o).slice(1).map(parseFloat);if(Wa(0,100,n)!==n)throw new Ha(t);if(Wa(0,100,r)!==r)throw new Ha(t);return[...rs(e,n,r),Number.isNaN(i)?1:i]}throw new Ha(t)}const qa=t=>parseInt(t.replace(/_/g,""),36),Ka="1q29ehhb 1n09sgk7 1kl1ekf_ _yl4zsno 16z9eiv3 1p29lhp8 _bd9zg04 17u0____ _iw9zhe5 _to73___ _r45e31e _7l6g016 _jh8ouiv _zn3qba8 1jy4zshs 11u87k0u 1ro9yvyo 1aj3xael 1gz9zjz0 _3w8l4xo 1bf1ekf_ _ke3v___ _4rrkb__ 13j776yz _646mbhl _nrjr4__ _le6mbhl 1n37ehkb _m75f91n _qj3bzfz 1939yygw 11i5z6x8 _1k5f8xs 1509441m 15t5lwgf _ae2th1n _tg1ugcv 1lp1ugcv 16e14up_ _h55rw7n _ny9yavn _7a11xb_ 1ih442g9 _pv442g9 1mv16xof 14e6y7tu 1oo9zkds 17d1cisi _4v9y70f _y98m8kc 1019pq0v 12o9zda8 _348j4f4 1et50i2o _8epa8__ _ts6senj 1o350i2o 1mi9eiuo 1259yrp0 1ln80gnw _632xcoy 1cn9zldc _f29edu4 1n490c8q _9f9ziet 1b94vk74 _m49zkct 1kz6s73a 1eu9dtog _q58s1rz 1dy9sjiq __u89jo3 _aj5nkwg _ld89jo3 13h9z6wx _qa9z2ii _l119xgq _bs5arju 1hj4nwk9 1qt4nwk9 1ge6wau6 14j9zlcw 11p1edc_ _ms1zcxe _439shk6 _jt9y70f _754zsow 1la40eju _oq5p___ _x279qkz 1fa5r3rv _yd2d9ip _424tcku _8y1di2_ _zi2uabw _yy7rn9h 12yz980_ __39ljp6 1b59zg0x _n39zfzp 1fy9zest _b33k___ _hp9wq92 1il50hz4 _io472ub _lj9z3eo 19z9ykg0 _8t8iu3a 12b9bl4a 1ak5yw0o _896v4ku _tb8k8lv _s59zi6t _c09ze0p 1lg80oqn 1id9z8wb _238nba5 1kq6wgdi _154zssg _tn3zk49 _da9y6tc 1sg7cv4f _r12jvtt 1gq5fmkz 1cs9rvci _lp9jn1c _xw1tdnb 13f9zje6 16f6973h _vo7ir40 _bt5arjf _rc45e4t _hr4e100 10v4e100 _hc9zke2 _w91egv_ _sj2r1kk 13c87yx8 _vqpds__ _ni8ggk8 _tj9yqfb 1ia2j4r4 _7x9b10u 1fc9ld4j 1eq9zldr _5j9lhpx _ez9zl6o _md61fzm".split(" ").reduce(((t,e)=>{const n=qa(e.substring(0,3)),r=qa(e.substring(3)).toString(16);let i="";for(let o=0;o<6-r.length;o++)i+="0";return t[n]=`${i}${r}`,t}),{});const Xa=(t,e)=>Array.from(Array(e)).map((()=>t)).join(""),Qa=new RegExp(`^#${Xa("([a-f0-9])",3)}([a-f0-9])?$`,"i"),Za=new RegExp(`^#${Xa("([a-f0-9]{2})",3)}([a-f0-9]{2})?$`,"i"),Ja=new RegExp(`^rgba?\\(\\s*(\\d+)\\s*${Xa(",\\s*(\\d+)\\s*",2)}(?:,\\s*([\\d.]+))?\\s*\\)$`,"i"),ts=/^hsla?\(\s*([\d.]+)\s*,\s*([\d.]+)%\s*,\s*([\d.]+)%(?:\s*,\s*([\d.]+))?\s*\)$/i,es=/^[a-z]+$/i,ns=t=>Math.round(255*t),rs=(t,e,n)=>{let r=n/100;if(0===e)return[r,r,r].map(ns);const i=(t%360+360)%360/60,o=(1-Math.abs(2*r-1))*(e/100),a=o*(1-Math.abs(i%2-1));let s=0,l=0,c=0;i>=0&&i<1?(s=o,l=a):i>=1&&i<2?(s=a,l=o):i>=2&&i<3?(l=o,c=a):i>=3&&i<4?(l=a,c=o):i>=4&&i<5?(s=a,c=o):i>=5&&i<6&&(s=o,c=a);const u=r-o/2;return[s+u,l+u,c+u].map(ns)};function is(t,e,n,r){return`rgba(${Wa(0,255,t).toFixed()}, ${Wa(0,255,e).toFixed()}, ${Wa(0,255,n).toFixed()}, ${parseFloat(Wa(0,1,r).toFixed(3))})`}function os(t,e){const[n,r,i,o]=Ya(t);return is(n,r,i,o-e)}const as=(t,e,n)=>{const r=function(t,e,n,r,i){for(e=e.split?e.split("."):e,r=0;r<e.length;r++)t=t?t[e[r]]:i;return t===i?n:t}(t,`colors.${e}`,e);try{return function(t){const[e,n,r,i]=Ya(t);let o=t=>{const e=Wa(0,255,t).toString(16);return 1===e.length?`0${e}`:e};o(e),o(n),o(r),i<1&&o(Math.round(255*i))}(r),r}catch{return n??"#000000"}},ss=t=>e=>{const n=(t=>{const[e,n,r]=Ya(t);return(299*e+587*n+114*r)/1e3})(as(e,t));return n<128?"dark":"light"},ls=(t,e)=>n=>os(as(n,t),1-e);function cs(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:"1rem",e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"rgba(255, 255, 255, 0.15)";return{backgroundImage:`linear-gradient(\n    45deg,\n    ${e} 25%,\n    transparent 25%,\n    transparent 50%,\n    ${e} 50%,\n    ${e} 75%,\n    transparent 75%,\n    transparent\n  )`,backgroundSize:`${t} ${t}`}}function us(t){const e=`#${Math.floor(16777215*Math.random()).toString(16).padEnd(6,"0")}`;return t&&(n=t,0!==Object.keys(n).length)?t.string&&t.colors?function(t,e){let n=0;if(0===t.length)return e[0];for(let r=0;r<t.length;r+=1)n=t.charCodeAt(r)+((n<<5)-n),n|=0;return n=(n%e.length+e.length)%e.length,e[n]}(t.string,t.colors):t.string&&!t.colors?function(t){let e=0;if(0===t.length)return e.toString();for(let r=0;r<t.length;r+=1)e=t.charCodeAt(r)+((e<<5)-e),e|=0;let n="#";for(let r=0;r<3;r+=1){n+=`00${(e>>8*r&255).toString(16)}`.substr(-2)}return n}(t.string):t.colors&&!t.string?function(t){return t[Math.floor(Math.random()*t.length)]}(t.colors):e:e;var n}const{definePartsStyle:ds,defineMultiStyleConfig:hs}=Na(ha.keys),fs=$a("alert-fg"),ps=$a("alert-bg");function gs(t){const{theme:e,colorScheme:n}=t;return{light:`colors.${n}.100`,dark:ls(`${n}.200`,.16)(e)}}const ms=hs({baseStyle:ds({container:{bg:ps.reference,px:"4",py:"3"},title:{fontWeight:"bold",lineHeight:"6",marginEnd:"2"},description:{lineHeight:"6"},icon:{color:fs.reference,flexShrink:0,marginEnd:"3",w:"5",h:"6"},spinner:{color:fs.reference,flexShrink:0,marginEnd:"3",w:"5",h:"5"}}),variants:{subtle:ds((t=>{const{colorScheme:e}=t,n=gs(t);return{container:{[fs.variable]:`colors.${e}.600`,[ps.variable]:n.light,_dark:{[fs.variable]:`colors.${e}.200`,[ps.variable]:n.dark}}}})),"left-accent":ds((t=>{const{colorScheme:e}=t,n=gs(t);return{container:{[fs.variable]:`colors.${e}.600`,[ps.variable]:n.light,_dark:{[fs.variable]:`colors.${e}.200`,[ps.variable]:n.dark},paddingStart:"3",borderStartWidth:"4px",borderStartColor:fs.reference}}})),"top-accent":ds((t=>{const{colorScheme:e}=t,n=gs(t);return{container:{[fs.variable]:`colors.${e}.600`,[ps.variable]:n.light,_dark:{[fs.variable]:`colors.${e}.200`,[ps.variable]:n.dark},pt:"2",borderTopWidth:"4px",borderTopColor:fs.reference}}})),solid:ds((t=>{const{colorScheme:e}=t;return{container:{[fs.variable]:"colors.white",[ps.variable]:`colors.${e}.600`,_dark:{[fs.variable]:"colors.gray.900",[ps.variable]:`colors.${e}.200`},color:fs.reference}}}))},defaultProps:{variant:"subtle",colorScheme:"blue"}}),ys={px:"1px",.5:"0.125rem",1:"0.25rem",1.5:"0.375rem",2:"0.5rem",2.5:"0.625rem",3:"0.75rem",3.5:"0.875rem",4:"1rem",5:"1.25rem",6:"1.5rem",7:"1.75rem",8:"2rem",9:"2.25rem",10:"2.5rem",12:"3rem",14:"3.5rem",16:"4rem",20:"5rem",24:"6rem",28:"7rem",32:"8rem",36:"9rem",40:"10rem",44:"11rem",48:"12rem",52:"13rem",56:"14rem",60:"15rem",64:"16rem",72:"18rem",80:"20rem",96:"24rem"},bs={...ys,max:"max-content",min:"min-content",full:"100%","3xs":"14rem","2xs":"16rem",xs:"20rem",sm:"24rem",md:"28rem",lg:"32rem",xl:"36rem","2xl":"42rem","3xl":"48rem","4xl":"56rem","5xl":"64rem","6xl":"72rem","7xl":"80rem","8xl":"90rem",prose:"60ch",container:{sm:"640px",md:"768px",lg:"1024px",xl:"1280px"}};function vs(t){for(var e=arguments.length,n=new Array(e>1?e-1:0),r=1;r<e;r++)n[r-1]=arguments[r];return"function"===typeof t?t(...n):t}const{definePartsStyle:_s,defineMultiStyleConfig:ws}=Na(fa.keys),xs=$a("avatar-border-color"),Ss=$a("avatar-bg"),ks=$a("avatar-font-size"),Cs=$a("avatar-size"),Ts={borderRadius:"full",border:"0.2em solid",borderColor:xs.reference,[xs.variable]:"white",_dark:{[xs.variable]:"colors.gray.800"}},Ps={bg:Ss.reference,fontSize:ks.reference,width:Cs.reference,height:Cs.reference,lineHeight:"1",[Ss.variable]:"colors.gray.200",_dark:{[Ss.variable]:"colors.whiteAlpha.400"}},Es=t=>{const{name:e,theme:n}=t,r=e?us({string:e}):"colors.gray.400",i=(t=>e=>"dark"===ss(t)(e))(r)(n);let o="white";return i||(o="gray.800"),{bg:Ss.reference,fontSize:ks.reference,color:o,borderColor:xs.reference,verticalAlign:"top",width:Cs.reference,height:Cs.reference,"&:not([data-loaded])":{[Ss.variable]:r},[xs.variable]:"colors.white",_dark:{[xs.variable]:"colors.gray.800"}}},As={fontSize:ks.reference,lineHeight:"1"};function Is(t){const e="100%"!==t?bs[t]:void 0;return _s({container:{[Cs.variable]:e??t,[ks.variable]:`calc(${e??t} / 2.5)`},excessLabel:{[Cs.variable]:e??t,[ks.variable]:`calc(${e??t} / 2.5)`}})}const Ms=ws({baseStyle:_s((t=>({badge:vs(Ts,t),excessLabel:vs(Ps,t),container:vs(Es,t),label:As}))),sizes:{"2xs":Is(4),xs:Is(6),sm:Is(8),md:Is(12),lg:Is(16),xl:Is(24),"2xl":Is(32),full:Is("100%")},defaultProps:{size:"md"}}),Fs=function(t,e){const n={};for(const r of e)if(Array.isArray(r)){const[e,i]=r;n[e]=$a(`${t}-${e}`,i)}else n[r]=$a(`${t}-${r}`);return n}("badge",["bg","color","shadow"]),Ds=t=>{const{colorScheme:e,theme:n}=t,r=ls(`${e}.500`,.6)(n);return{[Fs.bg.variable]:`colors.${e}.500`,[Fs.color.variable]:"colors.white",_dark:{[Fs.bg.variable]:r,[Fs.color.variable]:"colors.whiteAlpha.800"}}},Rs=t=>{const{colorScheme:e,theme:n}=t,r=ls(`${e}.200`,.16)(n);return{[Fs.bg.variable]:`colors.${e}.100`,[Fs.color.variable]:`colors.${e}.800`,_dark:{[Fs.bg.variable]:r,[Fs.color.variable]:`colors.${e}.200`}}},Os=t=>{const{colorScheme:e,theme:n}=t,r=ls(`${e}.200`,.8)(n);return{[Fs.color.variable]:`colors.${e}.500`,_dark:{[Fs.color.variable]:r},[Fs.shadow.variable]:`inset 0 0 0px 1px ${Fs.color.reference}`}},Ns={baseStyle:{px:1,textTransform:"uppercase",fontSize:"xs",borderRadius:"sm",fontWeight:"bold",bg:Fs.bg.reference,color:Fs.color.reference,boxShadow:Fs.shadow.reference},variants:{solid:Ds,subtle:Rs,outline:Os},defaultProps:{variant:"subtle",colorScheme:"gray"}},{defineMultiStyleConfig:Ls,definePartsStyle:Bs}=Na(pa.keys),zs=$a("breadcrumb-link-decor"),js=Ls({baseStyle:Bs({link:{transitionProperty:"common",transitionDuration:"fast",transitionTimingFunction:"ease-out",outline:"none",color:"inherit",textDecoration:zs.reference,[zs.variable]:"none","&:not([aria-current=page])":{cursor:"pointer",_hover:{[zs.variable]:"underline"},_focusVisible:{boxShadow:"outline"}}}})});function Us(t,e){return n=>"dark"===n.colorMode?e:t}function Vs(t){const{orientation:e,vertical:n,horizontal:r}=t;return e?"vertical"===e?n:r:{}}const $s=t=>{const{colorScheme:e,theme:n}=t;if("gray"===e)return{color:Us("gray.800","whiteAlpha.900")(t),_hover:{bg:Us("gray.100","whiteAlpha.200")(t)},_active:{bg:Us("gray.200","whiteAlpha.300")(t)}};const r=ls(`${e}.200`,.12)(n),i=ls(`${e}.200`,.24)(n);return{color:Us(`${e}.600`,`${e}.200`)(t),bg:"transparent",_hover:{bg:Us(`${e}.50`,r)(t)},_active:{bg:Us(`${e}.100`,i)(t)}}},Ws={yellow:{bg:"yellow.400",color:"black",hoverBg:"yellow.500",activeBg:"yellow.600"},cyan:{bg:"cyan.400",color:"black",hoverBg:"cyan.500",activeBg:"cyan.600"}},Gs=t=>{const{colorScheme:e}=t;if("gray"===e){const e=Us("gray.100","whiteAlpha.200")(t);return{bg:e,color:Us("gray.800","whiteAlpha.900")(t),_hover:{bg:Us("gray.200","whiteAlpha.300")(t),_disabled:{bg:e}},_active:{bg:Us("gray.300","whiteAlpha.400")(t)}}}const{bg:n=`${e}.500`,color:r="white",hoverBg:i=`${e}.600`,activeBg:o=`${e}.700`}=Ws[e]??{},a=Us(n,`${e}.200`)(t);return{bg:a,color:Us(r,"gray.800")(t),_hover:{bg:Us(i,`${e}.300`)(t),_disabled:{bg:a}},_active:{bg:Us(o,`${e}.400`)(t)}}},Hs={baseStyle:{lineHeight:"1.2",borderRadius:"md",fontWeight:"semibold",transitionProperty:"common",transitionDuration:"normal",_focusVisible:{boxShadow:"outline"},_disabled:{opacity:.4,cursor:"not-allowed",boxShadow:"none"},_hover:{_disabled:{bg:"initial"}}},variants:{ghost:$s,outline:t=>{const{colorScheme:e}=t,n=Us("gray.200","whiteAlpha.300")(t);return{border:"1px solid",borderColor:"gray"===e?n:"currentColor",".chakra-button__group[data-attached][data-orientation=horizontal] > &:not(:last-of-type)":{marginEnd:"-1px"},".chakra-button__group[data-attached][data-orientation=vertical] > &:not(:last-of-type)":{marginBottom:"-1px"},...vs($s,t)}},solid:Gs,link:t=>{const{colorScheme:e}=t;return{padding:0,height:"auto",lineHeight:"normal",verticalAlign:"baseline",color:Us(`${e}.500`,`${e}.200`)(t),_hover:{textDecoration:"underline",_disabled:{textDecoration:"none"}},_active:{color:Us(`${e}.700`,`${e}.500`)(t)}}},unstyled:{bg:"none",color:"inherit",display:"inline",lineHeight:"inherit",m:"0",p:"0"}},sizes:{lg:{h:"12",minW:"12",fontSize:"lg",px:"6"},md:{h:"10",minW:"10",fontSize:"md",px:"4"},sm:{h:"8",minW:"8",fontSize:"sm",px:"3"},xs:{h:"6",minW:"6",fontSize:"xs",px:"2"}},defaultProps:{variant:"solid",size:"md",colorScheme:"gray"}},{definePartsStyle:Ys,defineMultiStyleConfig:qs}=Na(Oa.keys),Ks=$a("card-bg"),Xs=$a("card-padding"),Qs=$a("card-shadow"),Zs=$a("card-radius"),Js=$a("card-border-width","0"),tl=$a("card-border-color"),el=Ys({container:{[Ks.variable]:"colors.chakra-body-bg",backgroundColor:Ks.reference,boxShadow:Qs.reference,borderRadius:Zs.reference,color:"chakra-body-text",borderWidth:Js.reference,borderColor:tl.reference},body:{padding:Xs.reference,flex:"1 1 0%"},header:{padding:Xs.reference},footer:{padding:Xs.reference}}),nl={sm:Ys({container:{[Zs.variable]:"radii.base",[Xs.variable]:"space.3"}}),md:Ys({container:{[Zs.variable]:"radii.md",[Xs.variable]:"space.5"}}),lg:Ys({container:{[Zs.variable]:"radii.xl",[Xs.variable]:"space.7"}})},rl=qs({baseStyle:el,variants:{elevated:Ys({container:{[Qs.variable]:"shadows.base",_dark:{[Ks.variable]:"colors.gray.700"}}}),outline:Ys({container:{[Js.variable]:"1px",[tl.variable]:"colors.chakra-border-color"}}),filled:Ys({container:{[Ks.variable]:"colors.chakra-subtle-bg"}}),unstyled:{body:{[Xs.variable]:0},header:{[Xs.variable]:0},footer:{[Xs.variable]:0}}},sizes:nl,defaultProps:{variant:"elevated",size:"md"}}),{definePartsStyle:il,defineMultiStyleConfig:ol}=Na(ga.keys),al=$a("checkbox-size"),sl=t=>{const{colorScheme:e}=t;return{w:al.reference,h:al.reference,transitionProperty:"box-shadow",transitionDuration:"normal",border:"2px solid",borderRadius:"sm",borderColor:"inherit",color:"white",_checked:{bg:Us(`${e}.500`,`${e}.200`)(t),borderColor:Us(`${e}.500`,`${e}.200`)(t),color:Us("white","gray.900")(t),_hover:{bg:Us(`${e}.600`,`${e}.300`)(t),borderColor:Us(`${e}.600`,`${e}.300`)(t)},_disabled:{borderColor:Us("gray.200","transparent")(t),bg:Us("gray.200","whiteAlpha.300")(t),color:Us("gray.500","whiteAlpha.500")(t)}},_indeterminate:{bg:Us(`${e}.500`,`${e}.200`)(t),borderColor:Us(`${e}.500`,`${e}.200`)(t),color:Us("white","gray.900")(t)},_disabled:{bg:Us("gray.100","whiteAlpha.100")(t),borderColor:Us("gray.100","transparent")(t)},_focusVisible:{boxShadow:"outline"},_invalid:{borderColor:Us("red.500","red.300")(t)}}},ll={_disabled:{cursor:"not-allowed"}},cl={userSelect:"none",_disabled:{opacity:.4}},ul={transitionProperty:"transform",transitionDuration:"normal"},dl=ol({baseStyle:il((t=>({icon:ul,container:ll,control:vs(sl,t),label:cl}))),sizes:{sm:il({control:{[al.variable]:"sizes.3"},label:{fontSize:"sm"},icon:{fontSize:"3xs"}}),md:il({control:{[al.variable]:"sizes.4"},label:{fontSize:"md"},icon:{fontSize:"2xs"}}),lg:il({control:{[al.variable]:"sizes.5"},label:{fontSize:"lg"},icon:{fontSize:"2xs"}})},defaultProps:{size:"md",colorScheme:"blue"}});function hl(t){const e=function(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"-";return t.replace(/\s+/g,e)}(t.toString());return e.includes("\\.")?t:function(t){return!Number.isInteger(parseFloat(t.toString()))}(t)?e.replace(".","\\."):t}function fl(t,e){return`var(${hl(t)}${e?`, ${e}`:""})`}function pl(t){return`--${function(t){return[arguments.length>1&&void 0!==arguments[1]?arguments[1]:"",hl(t)].filter(Boolean).join("-")}(t,arguments.length>1&&void 0!==arguments[1]?arguments[1]:"")}`}function gl(t,e){const n=pl(t,e?.prefix);return{variable:n,reference:fl(n,ml(e?.fallback))}}function ml(t){return"string"===typeof t?t:t?.reference}const yl=gl("close-button-size"),bl=gl("close-button-bg"),vl={baseStyle:{w:[yl.reference],h:[yl.reference],borderRadius:"md",transitionProperty:"common",transitionDuration:"normal",_disabled:{opacity:.4,cursor:"not-allowed",boxShadow:"none"},_hover:{[bl.variable]:"colors.blackAlpha.100",_dark:{[bl.variable]:"colors.whiteAlpha.100"}},_active:{[bl.variable]:"colors.blackAlpha.200",_dark:{[bl.variable]:"colors.whiteAlpha.200"}},_focusVisible:{boxShadow:"outline"},bg:bl.reference},sizes:{lg:{[yl.variable]:"sizes.10",fontSize:"md"},md:{[yl.variable]:"sizes.8",fontSize:"xs"},sm:{[yl.variable]:"sizes.6",fontSize:"2xs"}},defaultProps:{size:"md"}},{variants:_l,defaultProps:wl}=Ns,xl={baseStyle:{fontFamily:"mono",fontSize:"sm",px:"0.2em",borderRadius:"sm",bg:Fs.bg.reference,color:Fs.color.reference,boxShadow:Fs.shadow.reference},variants:_l,defaultProps:wl},Sl={baseStyle:{w:"100%",mx:"auto",maxW:"prose",px:"4"}},kl={baseStyle:{opacity:.6,borderColor:"inherit"},variants:{solid:{borderStyle:"solid"},dashed:{borderStyle:"dashed"}},defaultProps:{variant:"solid"}},{definePartsStyle:Cl,defineMultiStyleConfig:Tl}=Na(ma.keys),Pl=$a("drawer-bg"),El=$a("drawer-box-shadow");function Al(t){return Cl("full"===t?{dialog:{maxW:"100vw",h:"100vh"}}:{dialog:{maxW:t}})}const Il={bg:"blackAlpha.600",zIndex:"modal"},Ml={display:"flex",zIndex:"modal",justifyContent:"center"},Fl=t=>{const{isFullHeight:e}=t;return{...e&&{height:"100vh"},zIndex:"modal",maxH:"100vh",color:"inherit",[Pl.variable]:"colors.white",[El.variable]:"shadows.lg",_dark:{[Pl.variable]:"colors.gray.700",[El.variable]:"shadows.dark-lg"},bg:Pl.reference,boxShadow:El.reference}},Dl={px:"6",py:"4",fontSize:"xl",fontWeight:"semibold"},Rl={position:"absolute",top:"2",insetEnd:"3"},Ol={px:"6",py:"2",flex:"1",overflow:"auto"},Nl={px:"6",py:"4"},Ll=Tl({baseStyle:Cl((t=>({overlay:Il,dialogContainer:Ml,dialog:vs(Fl,t),header:Dl,closeButton:Rl,body:Ol,footer:Nl}))),sizes:{xs:Al("xs"),sm:Al("md"),md:Al("lg"),lg:Al("2xl"),xl:Al("4xl"),full:Al("full")},defaultProps:{size:"xs"}}),{definePartsStyle:Bl,defineMultiStyleConfig:zl}=Na(ya.keys),jl=zl({baseStyle:Bl({preview:{borderRadius:"md",py:"1",transitionProperty:"common",transitionDuration:"normal"},input:{borderRadius:"md",py:"1",transitionProperty:"common",transitionDuration:"normal",width:"full",_focusVisible:{boxShadow:"outline"},_placeholder:{opacity:.6}},textarea:{borderRadius:"md",py:"1",transitionProperty:"common",transitionDuration:"normal",width:"full",_focusVisible:{boxShadow:"outline"},_placeholder:{opacity:.6}}})}),{definePartsStyle:Ul,defineMultiStyleConfig:Vl}=Na(ba.keys),$l=$a("form-control-color"),Wl=Vl({baseStyle:Ul({container:{width:"100%",position:"relative"},requiredIndicator:{marginStart:"1",[$l.variable]:"colors.red.500",_dark:{[$l.variable]:"colors.red.300"},color:$l.reference},helperText:{mt:"2",[$l.variable]:"colors.gray.600",_dark:{[$l.variable]:"colors.whiteAlpha.600"},color:$l.reference,lineHeight:"normal",fontSize:"sm"}})}),{definePartsStyle:Gl,defineMultiStyleConfig:Hl}=Na(va.keys),Yl=$a("form-error-color"),ql=Hl({baseStyle:Gl({text:{[Yl.variable]:"colors.red.500",_dark:{[Yl.variable]:"colors.red.300"},color:Yl.reference,mt:"2",fontSize:"sm",lineHeight:"normal"},icon:{marginEnd:"0.5em",[Yl.variable]:"colors.red.500",_dark:{[Yl.variable]:"colors.red.300"},color:Yl.reference}})}),Kl={baseStyle:{fontSize:"md",marginEnd:"3",mb:"2",fontWeight:"medium",transitionProperty:"common",transitionDuration:"normal",opacity:1,_disabled:{opacity:.4}}},Xl={baseStyle:{fontFamily:"heading",fontWeight:"bold"},sizes:{"4xl":{fontSize:["6xl",null,"7xl"],lineHeight:1},"3xl":{fontSize:["5xl",null,"6xl"],lineHeight:1},"2xl":{fontSize:["4xl",null,"5xl"],lineHeight:[1.2,null,1]},xl:{fontSize:["3xl",null,"4xl"],lineHeight:[1.33,null,1.2]},lg:{fontSize:["2xl",null,"3xl"],lineHeight:[1.33,null,1.2]},md:{fontSize:"xl",lineHeight:1.2},sm:{fontSize:"md",lineHeight:1.2},xs:{fontSize:"sm",lineHeight:1.2}},defaultProps:{size:"xl"}},{definePartsStyle:Ql,defineMultiStyleConfig:Zl}=Na(_a.keys),Jl=$a("input-height"),tc=$a("input-font-size"),ec=$a("input-padding"),nc=$a("input-border-radius"),rc=Ql({addon:{height:Jl.reference,fontSize:tc.reference,px:ec.reference,borderRadius:nc.reference},field:{width:"100%",height:Jl.reference,fontSize:tc.reference,px:ec.reference,borderRadius:nc.reference,minWidth:0,outline:0,position:"relative",appearance:"none",transitionProperty:"common",transitionDuration:"normal",_disabled:{opacity:.4,cursor:"not-allowed"}}}),ic={lg:{[tc.variable]:"fontSizes.lg",[ec.variable]:"space.4",[nc.variable]:"radii.md",[Jl.variable]:"sizes.12"},md:{[tc.variable]:"fontSizes.md",[ec.variable]:"space.4",[nc.variable]:"radii.md",[Jl.variable]:"sizes.10"},sm:{[tc.variable]:"fontSizes.sm",[ec.variable]:"space.3",[nc.variable]:"radii.sm",[Jl.variable]:"sizes.8"},xs:{[tc.variable]:"fontSizes.xs",[ec.variable]:"space.2",[nc.variable]:"radii.sm",[Jl.variable]:"sizes.6"}},oc={lg:Ql({field:ic.lg,group:ic.lg}),md:Ql({field:ic.md,group:ic.md}),sm:Ql({field:ic.sm,group:ic.sm}),xs:Ql({field:ic.xs,group:ic.xs})};function ac(t){const{focusBorderColor:e,errorBorderColor:n}=t;return{focusBorderColor:e||Us("blue.500","blue.300")(t),errorBorderColor:n||Us("red.500","red.300")(t)}}const sc=Ql((t=>{const{theme:e}=t,{focusBorderColor:n,errorBorderColor:r}=ac(t);return{field:{border:"1px solid",borderColor:"inherit",bg:"inherit",_hover:{borderColor:Us("gray.300","whiteAlpha.400")(t)},_readOnly:{boxShadow:"none !important",userSelect:"all"},_invalid:{borderColor:as(e,r),boxShadow:`0 0 0 1px ${as(e,r)}`},_focusVisible:{zIndex:1,borderColor:as(e,n),boxShadow:`0 0 0 1px ${as(e,n)}`}},addon:{border:"1px solid",borderColor:Us("inherit","whiteAlpha.50")(t),bg:Us("gray.100","whiteAlpha.300")(t)}}})),lc=Ql((t=>{const{theme:e}=t,{focusBorderColor:n,errorBorderColor:r}=ac(t);return{field:{border:"2px solid",borderColor:"transparent",bg:Us("gray.100","whiteAlpha.50")(t),_hover:{bg:Us("gray.200","whiteAlpha.100")(t)},_readOnly:{boxShadow:"none !important",userSelect:"all"},_invalid:{borderColor:as(e,r)},_focusVisible:{bg:"transparent",borderColor:as(e,n)}},addon:{border:"2px solid",borderColor:"transparent",bg:Us("gray.100","whiteAlpha.50")(t)}}})),cc=Ql((t=>{const{theme:e}=t,{focusBorderColor:n,errorBorderColor:r}=ac(t);return{field:{borderBottom:"1px solid",borderColor:"inherit",borderRadius:"0",px:"0",bg:"transparent",_readOnly:{boxShadow:"none !important",userSelect:"all"},_invalid:{borderColor:as(e,r),boxShadow:`0px 1px 0px 0px ${as(e,r)}`},_focusVisible:{borderColor:as(e,n),boxShadow:`0px 1px 0px 0px ${as(e,n)}`}},addon:{borderBottom:"2px solid",borderColor:"inherit",borderRadius:"0",px:"0",bg:"transparent"}}})),uc=Zl({baseStyle:rc,sizes:oc,variants:{outline:sc,filled:lc,flushed:cc,unstyled:Ql({field:{bg:"transparent",px:"0",height:"auto"},addon:{bg:"transparent",px:"0",height:"auto"}})},defaultProps:{size:"md",variant:"outline"}}),dc=$a("kbd-bg"),hc={baseStyle:{[dc.variable]:"colors.gray.100",_dark:{[dc.variable]:"colors.whiteAlpha.100"},bg:dc.reference,borderRadius:"md",borderWidth:"1px",borderBottomWidth:"3px",fontSize:"0.8em",fontWeight:"bold",lineHeight:"normal",px:"0.4em",whiteSpace:"nowrap"}},fc={baseStyle:{transitionProperty:"common",transitionDuration:"fast",transitionTimingFunction:"ease-out",cursor:"pointer",textDecoration:"none",outline:"none",color:"inherit",_hover:{textDecoration:"underline"},_focusVisible:{boxShadow:"outline"}}},{defineMultiStyleConfig:pc,definePartsStyle:gc}=Na(wa.keys),mc=pc({baseStyle:gc({icon:{marginEnd:"2",display:"inline",verticalAlign:"text-bottom"}})}),{defineMultiStyleConfig:yc,definePartsStyle:bc}=Na(xa.keys),vc=$a("menu-bg"),_c=$a("menu-shadow"),wc=yc({baseStyle:bc({button:{transitionProperty:"common",transitionDuration:"normal"},list:{[vc.variable]:"#fff",[_c.variable]:"shadows.sm",_dark:{[vc.variable]:"colors.gray.700",[_c.variable]:"shadows.dark-lg"},color:"inherit",minW:"3xs",py:"2",zIndex:"dropdown",borderRadius:"md",borderWidth:"1px",bg:vc.reference,boxShadow:_c.reference},item:{py:"1.5",px:"3",transitionProperty:"background",transitionDuration:"ultra-fast",transitionTimingFunction:"ease-in",_focus:{[vc.variable]:"colors.gray.100",_dark:{[vc.variable]:"colors.whiteAlpha.100"}},_active:{[vc.variable]:"colors.gray.200",_dark:{[vc.variable]:"colors.whiteAlpha.200"}},_expanded:{[vc.variable]:"colors.gray.100",_dark:{[vc.variable]:"colors.whiteAlpha.100"}},_disabled:{opacity:.4,cursor:"not-allowed"},bg:vc.reference},groupTitle:{mx:4,my:2,fontWeight:"semibold",fontSize:"sm"},icon:{display:"inline-flex",alignItems:"center",justifyContent:"center",flexShrink:0},command:{opacity:.6},divider:{border:0,borderBottom:"1px solid",borderColor:"inherit",my:"2",opacity:.6}})}),{defineMultiStyleConfig:xc,definePartsStyle:Sc}=Na(Sa.keys),kc=$a("modal-bg"),Cc=$a("modal-shadow"),Tc={bg:"blackAlpha.600",zIndex:"modal"},Pc=t=>{const{isCentered:e,scrollBehavior:n}=t;return{display:"flex",zIndex:"modal",justifyContent:"center",alignItems:e?"center":"flex-start",overflow:"inside"===n?"hidden":"auto",overscrollBehaviorY:"none"}},Ec=t=>{const{isCentered:e,scrollBehavior:n}=t;return{borderRadius:"md",color:"inherit",my:e?"auto":"16",mx:e?"auto":void 0,zIndex:"modal",maxH:"inside"===n?"calc(100% - 7.5rem)":void 0,[kc.variable]:"colors.white",[Cc.variable]:"shadows.lg",_dark:{[kc.variable]:"colors.gray.700",[Cc.variable]:"shadows.dark-lg"},bg:kc.reference,boxShadow:Cc.reference}},Ac={px:"6",py:"4",fontSize:"xl",fontWeight:"semibold"},Ic={position:"absolute",top:"2",insetEnd:"3"},Mc=t=>{const{scrollBehavior:e}=t;return{px:"6",py:"2",flex:"1",overflow:"inside"===e?"auto":void 0}},Fc={px:"6",py:"4"};function Dc(t){return Sc("full"===t?{dialog:{maxW:"100vw",minH:"$100vh",my:"0",borderRadius:"0"}}:{dialog:{maxW:t}})}const Rc=xc({baseStyle:Sc((t=>({overlay:Tc,dialogContainer:vs(Pc,t),dialog:vs(Ec,t),header:Ac,closeButton:Ic,body:vs(Mc,t),footer:Fc}))),sizes:{xs:Dc("xs"),sm:Dc("sm"),md:Dc("md"),lg:Dc("lg"),xl:Dc("xl"),"2xl":Dc("2xl"),"3xl":Dc("3xl"),"4xl":Dc("4xl"),"5xl":Dc("5xl"),"6xl":Dc("6xl"),full:Dc("full")},defaultProps:{size:"md"}});function Oc(t){return Array.isArray(t)}function Nc(t){const e=typeof t;return null!=t&&("object"===e||"function"===e)&&!Oc(t)}function Lc(t){return Nc(t)&&t.reference?t.reference:String(t)}const Bc=function(t){for(var e=arguments.length,n=new Array(e>1?e-1:0),r=1;r<e;r++)n[r-1]=arguments[r];return n.map(Lc).join(` ${t} `).replace(/calc/g,"")},zc=function(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return`calc(${Bc("+",...e)})`},jc=function(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return`calc(${Bc("-",...e)})`},Uc=function(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return`calc(${Bc("*",...e)})`},Vc=function(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return`calc(${Bc("/",...e)})`},$c=t=>{const e=Lc(t);return null==e||Number.isNaN(parseFloat(e))?Uc(e,-1):String(e).startsWith("-")?String(e).slice(1):`-${e}`},Wc=Object.assign((t=>({add:function(){for(var e=arguments.length,n=new Array(e),r=0;r<e;r++)n[r]=arguments[r];return Wc(zc(t,...n))},subtract:function(){for(var e=arguments.length,n=new Array(e),r=0;r<e;r++)n[r]=arguments[r];return Wc(jc(t,...n))},multiply:function(){for(var e=arguments.length,n=new Array(e),r=0;r<e;r++)n[r]=arguments[r];return Wc(Uc(t,...n))},divide:function(){for(var e=arguments.length,n=new Array(e),r=0;r<e;r++)n[r]=arguments[r];return Wc(Vc(t,...n))},negate:()=>Wc($c(t)),toString:()=>t.toString()})),{add:zc,subtract:jc,multiply:Uc,divide:Vc,negate:$c}),Gc={letterSpacings:{tighter:"-0.05em",tight:"-0.025em",normal:"0",wide:"0.025em",wider:"0.05em",widest:"0.1em"},lineHeights:{normal:"normal",none:1,shorter:1.25,short:1.375,base:1.5,tall:1.625,taller:"2",3:".75rem",4:"1rem",5:"1.25rem",6:"1.5rem",7:"1.75rem",8:"2rem",9:"2.25rem",10:"2.5rem"},fontWeights:{hairline:100,thin:200,light:300,normal:400,medium:500,semibold:600,bold:700,extrabold:800,black:900},fonts:{heading:'-apple-system, BlinkMacSystemFont, "Segoe UI", Helvetica, Arial, sans-serif, "Apple Color Emoji", "Segoe UI Emoji", "Segoe UI Symbol"',body:'-apple-system, BlinkMacSystemFont, "Segoe UI", Helvetica, Arial, sans-serif, "Apple Color Emoji", "Segoe UI Emoji", "Segoe UI Symbol"',mono:'SFMono-Regular,Menlo,Monaco,Consolas,"Liberation Mono","Courier New",monospace'},fontSizes:{"3xs":"0.45rem","2xs":"0.625rem",xs:"0.75rem",sm:"0.875rem",md:"1rem",lg:"1.125rem",xl:"1.25rem","2xl":"1.5rem","3xl":"1.875rem","4xl":"2.25rem","5xl":"3rem","6xl":"3.75rem","7xl":"4.5rem","8xl":"6rem","9xl":"8rem"}},{defineMultiStyleConfig:Hc,definePartsStyle:Yc}=Na(ka.keys),qc=gl("number-input-stepper-width"),Kc=gl("number-input-input-padding"),Xc=Wc(qc).add("0.5rem").toString(),Qc=gl("number-input-bg"),Zc=gl("number-input-color"),Jc=gl("number-input-border-color"),tu={[qc.variable]:"sizes.6",[Kc.variable]:Xc},eu=t=>vs(uc.baseStyle,t)?.field??{},nu={width:qc.reference},ru={borderStart:"1px solid",borderStartColor:Jc.reference,color:Zc.reference,bg:Qc.reference,[Zc.variable]:"colors.chakra-body-text",[Jc.variable]:"colors.chakra-border-color",_dark:{[Zc.variable]:"colors.whiteAlpha.800",[Jc.variable]:"colors.whiteAlpha.300"},_active:{[Qc.variable]:"colors.gray.200",_dark:{[Qc.variable]:"colors.whiteAlpha.300"}},_disabled:{opacity:.4,cursor:"not-allowed"}};function iu(t){const e=uc.sizes?.[t],n={lg:"md",md:"md",sm:"sm",xs:"sm"},r=e.field?.fontSize??"md",i=Gc.fontSizes[r];return Yc({field:{...e.field,paddingInlineEnd:Kc.reference,verticalAlign:"top"},stepper:{fontSize:Wc(i).multiply(.75).toString(),_first:{borderTopEndRadius:n[t]},_last:{borderBottomEndRadius:n[t],mt:"-1px",borderTopWidth:1}}})}const ou=Hc({baseStyle:Yc((t=>({root:tu,field:vs(eu,t)??{},stepperGroup:nu,stepper:ru}))),sizes:{xs:iu("xs"),sm:iu("sm"),md:iu("md"),lg:iu("lg")},variants:uc.variants,defaultProps:uc.defaultProps}),au={baseStyle:{...uc.baseStyle?.field,textAlign:"center"},sizes:{lg:{fontSize:"lg",w:12,h:12,borderRadius:"md"},md:{fontSize:"md",w:10,h:10,borderRadius:"md"},sm:{fontSize:"sm",w:8,h:8,borderRadius:"sm"},xs:{fontSize:"xs",w:6,h:6,borderRadius:"sm"}},variants:{outline:t=>vs(uc.variants?.outline,t)?.field??{},flushed:t=>vs(uc.variants?.flushed,t)?.field??{},filled:t=>vs(uc.variants?.filled,t)?.field??{},unstyled:uc.variants?.unstyled.field??{}},defaultProps:uc.defaultProps},{defineMultiStyleConfig:su,definePartsStyle:lu}=Na(Ca.keys),cu=gl("popper-bg"),uu=gl("popper-arrow-bg"),du=gl("popper-arrow-shadow-color"),hu=su({baseStyle:lu({popper:{zIndex:"popover"},content:{[cu.variable]:"colors.white",bg:cu.reference,[uu.variable]:cu.reference,[du.variable]:"colors.gray.200",_dark:{[cu.variable]:"colors.gray.700",[du.variable]:"colors.whiteAlpha.300"},width:"xs",border:"1px solid",borderColor:"inherit",borderRadius:"md",boxShadow:"sm",zIndex:"inherit",_focusVisible:{outline:0,boxShadow:"outline"}},header:{px:3,py:2,borderBottomWidth:"1px"},body:{px:3,py:2},footer:{px:3,py:2,borderTopWidth:"1px"},closeButton:{position:"absolute",borderRadius:"md",top:1,insetEnd:2,padding:2}})}),{defineMultiStyleConfig:fu,definePartsStyle:pu}=Na(Ta.keys),gu=t=>{const{colorScheme:e,theme:n,isIndeterminate:r,hasStripe:i}=t,o=Us(cs(),cs("1rem","rgba(0,0,0,0.1)"))(t),a=Us(`${e}.500`,`${e}.200`)(t),s=`linear-gradient(\n    to right,\n    transparent 0%,\n    ${as(n,a)} 50%,\n    transparent 100%\n  )`;return{...!r&&i&&o,...r?{bgImage:s}:{bgColor:a}}},mu={lineHeight:"1",fontSize:"0.25em",fontWeight:"bold",color:"white"},yu=t=>({bg:Us("gray.100","whiteAlpha.300")(t)}),bu=t=>({transitionProperty:"common",transitionDuration:"slow",...gu(t)}),vu=pu((t=>({label:mu,filledTrack:bu(t),track:yu(t)}))),_u=fu({sizes:{xs:pu({track:{h:"1"}}),sm:pu({track:{h:"2"}}),md:pu({track:{h:"3"}}),lg:pu({track:{h:"4"}})},baseStyle:vu,defaultProps:{size:"md",colorScheme:"blue"}}),{defineMultiStyleConfig:wu,definePartsStyle:xu}=Na(Pa.keys),Su=t=>{const e=vs(dl.baseStyle,t)?.control;return{...e,borderRadius:"full",_checked:{...e?._checked,_before:{content:'""',display:"inline-block",pos:"relative",w:"50%",h:"50%",borderRadius:"50%",bg:"currentColor"}}}},ku=wu({baseStyle:xu((t=>({label:dl.baseStyle?.(t).label,container:dl.baseStyle?.(t).container,control:Su(t)}))),sizes:{md:xu({control:{w:"4",h:"4"},label:{fontSize:"md"}}),lg:xu({control:{w:"5",h:"5"},label:{fontSize:"lg"}}),sm:xu({control:{width:"3",height:"3"},label:{fontSize:"sm"}})},defaultProps:{size:"md",colorScheme:"blue"}}),{defineMultiStyleConfig:Cu,definePartsStyle:Tu}=Na(Ea.keys),Pu=$a("select-bg"),Eu={paddingInlineEnd:"8"},Au=Cu({baseStyle:Tu({field:{...uc.baseStyle?.field,appearance:"none",paddingBottom:"1px",lineHeight:"normal",bg:Pu.reference,[Pu.variable]:"colors.white",_dark:{[Pu.variable]:"colors.gray.700"},"> option, > optgroup":{bg:Pu.reference}},icon:{width:"6",height:"100%",insetEnd:"2",position:"relative",color:"currentColor",fontSize:"xl",_disabled:{opacity:.5}}}),sizes:{lg:{...uc.sizes?.lg,field:{...uc.sizes?.lg.field,...Eu}},md:{...uc.sizes?.md,field:{...uc.sizes?.md.field,...Eu}},sm:{...uc.sizes?.sm,field:{...uc.sizes?.sm.field,...Eu}},xs:{...uc.sizes?.xs,field:{...uc.sizes?.xs.field,...Eu},icon:{insetEnd:"1"}}},variants:uc.variants,defaultProps:uc.defaultProps}),Iu=$a("skeleton-start-color"),Mu=$a("skeleton-end-color"),Fu={baseStyle:{[Iu.variable]:"colors.gray.100",[Mu.variable]:"colors.gray.400",_dark:{[Iu.variable]:"colors.gray.800",[Mu.variable]:"colors.gray.600"},background:Iu.reference,borderColor:Mu.reference,opacity:.7,borderRadius:"sm"}},Du=$a("skip-link-bg"),Ru={baseStyle:{borderRadius:"md",fontWeight:"semibold",_focusVisible:{boxShadow:"outline",padding:"4",position:"fixed",top:"6",insetStart:"6",[Du.variable]:"colors.white",_dark:{[Du.variable]:"colors.gray.700"},bg:Du.reference}}};function Ou(t){return Nc(t)&&t.reference?t.reference:String(t)}const Nu=function(t){for(var e=arguments.length,n=new Array(e>1?e-1:0),r=1;r<e;r++)n[r-1]=arguments[r];return n.map(Ou).join(` ${t} `).replace(/calc/g,"")},Lu=function(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return`calc(${Nu("+",...e)})`},Bu=function(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return`calc(${Nu("-",...e)})`},zu=function(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return`calc(${Nu("*",...e)})`},ju=function(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return`calc(${Nu("/",...e)})`},Uu=t=>{const e=Ou(t);return null==e||Number.isNaN(parseFloat(e))?zu(e,-1):String(e).startsWith("-")?String(e).slice(1):`-${e}`},Vu=Object.assign((t=>({add:function(){for(var e=arguments.length,n=new Array(e),r=0;r<e;r++)n[r]=arguments[r];return Vu(Lu(t,...n))},subtract:function(){for(var e=arguments.length,n=new Array(e),r=0;r<e;r++)n[r]=arguments[r];return Vu(Bu(t,...n))},multiply:function(){for(var e=arguments.length,n=new Array(e),r=0;r<e;r++)n[r]=arguments[r];return Vu(zu(t,...n))},divide:function(){for(var e=arguments.length,n=new Array(e),r=0;r<e;r++)n[r]=arguments[r];return Vu(ju(t,...n))},negate:()=>Vu(Uu(t)),toString:()=>t.toString()})),{add:Lu,subtract:Bu,multiply:zu,divide:ju,negate:Uu}),{defineMultiStyleConfig:$u,definePartsStyle:Wu}=Na(Aa.keys),Gu=$a("slider-thumb-size"),Hu=$a("slider-track-size"),Yu=$a("slider-bg"),qu=t=>{const{orientation:e}=t;return{display:"inline-block",position:"relative",cursor:"pointer",_disabled:{opacity:.6,cursor:"default",pointerEvents:"none"},...Vs({orientation:e,vertical:{h:"100%",px:Vu(Gu.reference).divide(2).toString()},horizontal:{w:"100%",py:Vu(Gu.reference).divide(2).toString()}})}},Ku=t=>({...Vs({orientation:t.orientation,horizontal:{h:Hu.reference},vertical:{w:Hu.reference}}),overflow:"hidden",borderRadius:"sm",[Yu.variable]:"colors.gray.200",_dark:{[Yu.variable]:"colors.whiteAlpha.200"},_disabled:{[Yu.variable]:"colors.gray.300",_dark:{[Yu.variable]:"colors.whiteAlpha.300"}},bg:Yu.reference}),Xu=t=>{const{orientation:e}=t;return{...Vs({orientation:e,vertical:{left:"50%",transform:"translateX(-50%)",_active:{transform:"translateX(-50%) scale(1.15)"}},horizontal:{top:"50%",transform:"translateY(-50%)",_active:{transform:"translateY(-50%) scale(1.15)"}}}),w:Gu.reference,h:Gu.reference,display:"flex",alignItems:"center",justifyContent:"center",position:"absolute",outline:0,zIndex:1,borderRadius:"full",bg:"white",boxShadow:"base",border:"1px solid",borderColor:"transparent",transitionProperty:"transform",transitionDuration:"normal",_focusVisible:{boxShadow:"outline"},_disabled:{bg:"gray.300"}}},Qu=t=>{const{colorScheme:e}=t;return{width:"inherit",height:"inherit",[Yu.variable]:`colors.${e}.500`,_dark:{[Yu.variable]:`colors.${e}.200`},bg:Yu.reference}},Zu=$u({baseStyle:Wu((t=>({container:qu(t),track:Ku(t),thumb:Xu(t),filledTrack:Qu(t)}))),sizes:{lg:Wu({container:{[Gu.variable]:"sizes.4",[Hu.variable]:"sizes.1"}}),md:Wu({container:{[Gu.variable]:"sizes.3.5",[Hu.variable]:"sizes.1"}}),sm:Wu({container:{[Gu.variable]:"sizes.2.5",[Hu.variable]:"sizes.0.5"}})},defaultProps:{size:"md",colorScheme:"blue"}}),Ju=gl("spinner-size"),td={baseStyle:{width:[Ju.reference],height:[Ju.reference]},sizes:{xs:{[Ju.variable]:"sizes.3"},sm:{[Ju.variable]:"sizes.4"},md:{[Ju.variable]:"sizes.6"},lg:{[Ju.variable]:"sizes.8"},xl:{[Ju.variable]:"sizes.12"}},defaultProps:{size:"md"}},{defineMultiStyleConfig:ed,definePartsStyle:nd}=Na(Ia.keys),rd=ed({baseStyle:nd({container:{},label:{fontWeight:"medium"},helpText:{opacity:.8,marginBottom:"2"},number:{verticalAlign:"baseline",fontWeight:"semibold"},icon:{marginEnd:1,w:"3.5",h:"3.5",verticalAlign:"middle"}}),sizes:{md:nd({label:{fontSize:"sm"},helpText:{fontSize:"sm"},number:{fontSize:"2xl"}})},defaultProps:{size:"md"}}),{defineMultiStyleConfig:id,definePartsStyle:od}=Na(["stepper","step","title","description","indicator","separator","icon","number"]),ad=$a("stepper-indicator-size"),sd=$a("stepper-icon-size"),ld=$a("stepper-title-font-size"),cd=$a("stepper-description-font-size"),ud=$a("stepper-accent-color"),dd=id({baseStyle:od((t=>{let{colorScheme:e}=t;return{stepper:{display:"flex",justifyContent:"space-between",gap:"4","&[data-orientation=vertical]":{flexDirection:"column",alignItems:"flex-start"},"&[data-orientation=horizontal]":{flexDirection:"row",alignItems:"center"},[ud.variable]:`colors.${e}.500`,_dark:{[ud.variable]:`colors.${e}.200`}},title:{fontSize:ld.reference,fontWeight:"medium"},description:{fontSize:cd.reference,color:"chakra-subtle-text"},number:{fontSize:ld.reference},step:{flexShrink:0,position:"relative",display:"flex",gap:"2","&[data-orientation=horizontal]":{alignItems:"center"},flex:"1","&:last-of-type:not([data-stretch])":{flex:"initial"}},icon:{flexShrink:0,width:sd.reference,height:sd.reference},indicator:{flexShrink:0,borderRadius:"full",width:ad.reference,height:ad.reference,display:"flex",justifyContent:"center",alignItems:"center","&[data-status=active]":{borderWidth:"2px",borderColor:ud.reference},"&[data-status=complete]":{bg:ud.reference,color:"chakra-inverse-text"},"&[data-status=incomplete]":{borderWidth:"2px"}},separator:{bg:"chakra-border-color",flex:"1","&[data-status=complete]":{bg:ud.reference},"&[data-orientation=horizontal]":{width:"100%",height:"2px",marginStart:"2"},"&[data-orientation=vertical]":{width:"2px",position:"absolute",height:"100%",maxHeight:`calc(100% - ${ad.reference} - 8px)`,top:`calc(${ad.reference} + 4px)`,insetStart:`calc(${ad.reference} / 2 - 1px)`}}}})),sizes:{xs:od({stepper:{[ad.variable]:"sizes.4",[sd.variable]:"sizes.3",[ld.variable]:"fontSizes.xs",[cd.variable]:"fontSizes.xs"}}),sm:od({stepper:{[ad.variable]:"sizes.6",[sd.variable]:"sizes.4",[ld.variable]:"fontSizes.sm",[cd.variable]:"fontSizes.xs"}}),md:od({stepper:{[ad.variable]:"sizes.8",[sd.variable]:"sizes.5",[ld.variable]:"fontSizes.md",[cd.variable]:"fontSizes.sm"}}),lg:od({stepper:{[ad.variable]:"sizes.10",[sd.variable]:"sizes.6",[ld.variable]:"fontSizes.lg",[cd.variable]:"fontSizes.md"}})},defaultProps:{size:"md",colorScheme:"blue"}}),{defineMultiStyleConfig:hd,definePartsStyle:fd}=Na(Ma.keys),pd=gl("switch-track-width"),gd=gl("switch-track-height"),md=gl("switch-track-diff"),yd=Wc.subtract(pd,gd),bd=gl("switch-thumb-x"),vd=gl("switch-bg"),_d=t=>{const{colorScheme:e}=t;return{borderRadius:"full",p:"0.5",width:[pd.reference],height:[gd.reference],transitionProperty:"common",transitionDuration:"fast",[vd.variable]:"colors.gray.300",_dark:{[vd.variable]:"colors.whiteAlpha.400"},_focusVisible:{boxShadow:"outline"},_disabled:{opacity:.4,cursor:"not-allowed"},_checked:{[vd.variable]:`colors.${e}.500`,_dark:{[vd.variable]:`colors.${e}.200`}},bg:vd.reference}},wd={bg:"white",transitionProperty:"transform",transitionDuration:"normal",borderRadius:"inherit",width:[gd.reference],height:[gd.reference],_checked:{transform:`translateX(${bd.reference})`}},xd=hd({baseStyle:fd((t=>({container:{[md.variable]:yd,[bd.variable]:md.reference,_rtl:{[bd.variable]:Wc(md).negate().toString()}},track:_d(t),thumb:wd}))),sizes:{sm:fd({container:{[pd.variable]:"1.375rem",[gd.variable]:"sizes.3"}}),md:fd({container:{[pd.variable]:"1.875rem",[gd.variable]:"sizes.4"}}),lg:fd({container:{[pd.variable]:"2.875rem",[gd.variable]:"sizes.6"}})},defaultProps:{size:"md",colorScheme:"blue"}}),{defineMultiStyleConfig:Sd,definePartsStyle:kd}=Na(Fa.keys),Cd=kd({table:{fontVariantNumeric:"lining-nums tabular-nums",borderCollapse:"collapse",width:"full"},th:{fontFamily:"heading",fontWeight:"bold",textTransform:"uppercase",letterSpacing:"wider",textAlign:"start"},td:{textAlign:"start"},caption:{mt:4,fontFamily:"heading",textAlign:"center",fontWeight:"medium"}}),Td={"&[data-is-numeric=true]":{textAlign:"end"}},Pd=Sd({baseStyle:Cd,variants:{simple:kd((t=>{const{colorScheme:e}=t;return{th:{color:Us("gray.600","gray.400")(t),borderBottom:"1px",borderColor:Us(`${e}.100`,`${e}.700`)(t),...Td},td:{borderBottom:"1px",borderColor:Us(`${e}.100`,`${e}.700`)(t),...Td},caption:{color:Us("gray.600","gray.100")(t)},tfoot:{tr:{"&:last-of-type":{th:{borderBottomWidth:0}}}}}})),striped:kd((t=>{const{colorScheme:e}=t;return{th:{color:Us("gray.600","gray.400")(t),borderBottom:"1px",borderColor:Us(`${e}.100`,`${e}.700`)(t),...Td},td:{borderBottom:"1px",borderColor:Us(`${e}.100`,`${e}.700`)(t),...Td},caption:{color:Us("gray.600","gray.100")(t)},tbody:{tr:{"&:nth-of-type(odd)":{"th, td":{borderBottomWidth:"1px",borderColor:Us(`${e}.100`,`${e}.700`)(t)},td:{background:Us(`${e}.100`,`${e}.700`)(t)}}}},tfoot:{tr:{"&:last-of-type":{th:{borderBottomWidth:0}}}}}})),unstyled:{}},sizes:{sm:kd({th:{px:"4",py:"1",lineHeight:"4",fontSize:"xs"},td:{px:"4",py:"2",fontSize:"sm",lineHeight:"4"},caption:{px:"4",py:"2",fontSize:"xs"}}),md:kd({th:{px:"6",py:"3",lineHeight:"4",fontSize:"xs"},td:{px:"6",py:"4",lineHeight:"5"},caption:{px:"6",py:"2",fontSize:"sm"}}),lg:kd({th:{px:"8",py:"4",lineHeight:"5",fontSize:"sm"},td:{px:"8",py:"5",lineHeight:"6"},caption:{px:"6",py:"2",fontSize:"md"}})},defaultProps:{variant:"simple",size:"md",colorScheme:"gray"}}),Ed=$a("tabs-color"),Ad=$a("tabs-bg"),Id=$a("tabs-border-color"),{defineMultiStyleConfig:Md,definePartsStyle:Fd}=Na(Da.keys),Dd=t=>{const{orientation:e}=t;return{display:"vertical"===e?"flex":"block"}},Rd=t=>{const{isFitted:e}=t;return{flex:e?1:void 0,transitionProperty:"common",transitionDuration:"normal",_focusVisible:{zIndex:1,boxShadow:"outline"},_disabled:{cursor:"not-allowed",opacity:.4}}},Od=t=>{const{align:e="start",orientation:n}=t;return{justifyContent:{end:"flex-end",center:"center",start:"flex-start"}[e],flexDirection:"vertical"===n?"column":"row"}},Nd={p:4},Ld=Fd((t=>({root:Dd(t),tab:Rd(t),tablist:Od(t),tabpanel:Nd}))),Bd={sm:Fd({tab:{py:1,px:4,fontSize:"sm"}}),md:Fd({tab:{fontSize:"md",py:2,px:4}}),lg:Fd({tab:{fontSize:"lg",py:3,px:4}})},zd=Fd((t=>{const{colorScheme:e,orientation:n}=t,r="vertical"===n,i=r?"borderStart":"borderBottom",o=r?"marginStart":"marginBottom";return{tablist:{[i]:"2px solid",borderColor:"inherit"},tab:{[i]:"2px solid",borderColor:"transparent",[o]:"-2px",_selected:{[Ed.variable]:`colors.${e}.600`,_dark:{[Ed.variable]:`colors.${e}.300`},borderColor:"currentColor"},_active:{[Ad.variable]:"colors.gray.200",_dark:{[Ad.variable]:"colors.whiteAlpha.300"}},_disabled:{_active:{bg:"none"}},color:Ed.reference,bg:Ad.reference}}})),jd=Fd((t=>{const{colorScheme:e}=t;return{tab:{borderTopRadius:"md",border:"1px solid",borderColor:"transparent",mb:"-1px",[Id.variable]:"transparent",_selected:{[Ed.variable]:`colors.${e}.600`,[Id.variable]:"colors.white",_dark:{[Ed.variable]:`colors.${e}.300`,[Id.variable]:"colors.gray.800"},borderColor:"inherit",borderBottomColor:Id.reference},color:Ed.reference},tablist:{mb:"-1px",borderBottom:"1px solid",borderColor:"inherit"}}})),Ud=Fd((t=>{const{colorScheme:e}=t;return{tab:{border:"1px solid",borderColor:"inherit",[Ad.variable]:"colors.gray.50",_dark:{[Ad.variable]:"colors.whiteAlpha.50"},mb:"-1px",_notLast:{marginEnd:"-1px"},_selected:{[Ad.variable]:"colors.white",[Ed.variable]:`colors.${e}.600`,_dark:{[Ad.variable]:"colors.gray.800",[Ed.variable]:`colors.${e}.300`},borderColor:"inherit",borderTopColor:"currentColor",borderBottomColor:"transparent"},color:Ed.reference,bg:Ad.reference},tablist:{mb:"-1px",borderBottom:"1px solid",borderColor:"inherit"}}})),Vd=Fd((t=>{const{colorScheme:e,theme:n}=t;return{tab:{borderRadius:"full",fontWeight:"semibold",color:"gray.600",_selected:{color:as(n,`${e}.700`),bg:as(n,`${e}.100`)}}}})),$d=Md({baseStyle:Ld,sizes:Bd,variants:{line:zd,enclosed:jd,"enclosed-colored":Ud,"soft-rounded":Vd,"solid-rounded":Fd((t=>{const{colorScheme:e}=t;return{tab:{borderRadius:"full",fontWeight:"semibold",[Ed.variable]:"colors.gray.600",_dark:{[Ed.variable]:"inherit"},_selected:{[Ed.variable]:"colors.white",[Ad.variable]:`colors.${e}.600`,_dark:{[Ed.variable]:"colors.gray.800",[Ad.variable]:`colors.${e}.300`}},color:Ed.reference,bg:Ad.reference}}})),unstyled:Fd({})},defaultProps:{size:"md",variant:"line",colorScheme:"blue"}}),{defineMultiStyleConfig:Wd,definePartsStyle:Gd}=Na(Ra.keys),Hd=$a("tag-bg"),Yd=$a("tag-color"),qd=$a("tag-shadow"),Kd=$a("tag-min-height"),Xd=$a("tag-min-width"),Qd=$a("tag-font-size"),Zd=$a("tag-padding-inline"),Jd=Gd({container:{fontWeight:"medium",lineHeight:1.2,outline:0,[Yd.variable]:Fs.color.reference,[Hd.variable]:Fs.bg.reference,[qd.variable]:Fs.shadow.reference,color:Yd.reference,bg:Hd.reference,boxShadow:qd.reference,borderRadius:"md",minH:Kd.reference,minW:Xd.reference,fontSize:Qd.reference,px:Zd.reference,_focusVisible:{[qd.variable]:"shadows.outline"}},label:{lineHeight:1.2,overflow:"visible"},closeButton:{fontSize:"lg",w:"5",h:"5",transitionProperty:"common",transitionDuration:"normal",borderRadius:"full",marginStart:"1.5",marginEnd:"-1",opacity:.5,_disabled:{opacity:.4},_focusVisible:{boxShadow:"outline",bg:"rgba(0, 0, 0, 0.14)"},_hover:{opacity:.8},_active:{opacity:1}}}),th={sm:Gd({container:{[Kd.variable]:"sizes.5",[Xd.variable]:"sizes.5",[Qd.variable]:"fontSizes.xs",[Zd.variable]:"space.2"},closeButton:{marginEnd:"-2px",marginStart:"0.35rem"}}),md:Gd({container:{[Kd.variable]:"sizes.6",[Xd.variable]:"sizes.6",[Qd.variable]:"fontSizes.sm",[Zd.variable]:"space.2"}}),lg:Gd({container:{[Kd.variable]:"sizes.8",[Xd.variable]:"sizes.8",[Qd.variable]:"fontSizes.md",[Zd.variable]:"space.3"}})},eh=Wd({variants:{subtle:Gd((t=>({container:Ns.variants?.subtle(t)}))),solid:Gd((t=>({container:Ns.variants?.solid(t)}))),outline:Gd((t=>({container:Ns.variants?.outline(t)})))},baseStyle:Jd,sizes:th,defaultProps:{size:"md",variant:"subtle",colorScheme:"gray"}}),nh={...uc.baseStyle?.field,paddingY:"2",minHeight:"20",lineHeight:"short",verticalAlign:"top"},rh={outline:t=>uc.variants?.outline(t).field??{},flushed:t=>uc.variants?.flushed(t).field??{},filled:t=>uc.variants?.filled(t).field??{},unstyled:uc.variants?.unstyled.field??{}},ih={baseStyle:nh,sizes:{xs:uc.sizes?.xs.field??{},sm:uc.sizes?.sm.field??{},md:uc.sizes?.md.field??{},lg:uc.sizes?.lg.field??{}},variants:rh,defaultProps:{size:"md",variant:"outline"}},oh=gl("tooltip-bg"),ah=gl("tooltip-fg"),sh=gl("popper-arrow-bg"),lh={bg:oh.reference,color:ah.reference,[oh.variable]:"colors.gray.700",[ah.variable]:"colors.whiteAlpha.900",_dark:{[oh.variable]:"colors.gray.300",[ah.variable]:"colors.gray.900"},[sh.variable]:oh.reference,px:"2",py:"0.5",borderRadius:"sm",fontWeight:"medium",fontSize:"sm",boxShadow:"md",maxW:"xs",zIndex:"tooltip"},ch={Accordion:za,Alert:ms,Avatar:Ms,Badge:Ns,Breadcrumb:js,Button:Hs,Checkbox:dl,CloseButton:vl,Code:xl,Container:Sl,Divider:kl,Drawer:Ll,Editable:jl,Form:Wl,FormError:ql,FormLabel:Kl,Heading:Xl,Input:uc,Kbd:hc,Link:fc,List:mc,Menu:wc,Modal:Rc,NumberInput:ou,PinInput:au,Popover:hu,Progress:_u,Radio:ku,Select:Au,Skeleton:Fu,SkipLink:Ru,Slider:Zu,Spinner:td,Stat:rd,Switch:xd,Table:Pd,Tabs:$d,Tag:eh,Textarea:ih,Tooltip:{baseStyle:lh},Card:rl,Stepper:dd},uh={property:{common:"background-color, border-color, color, fill, stroke, opacity, box-shadow, transform",colors:"background-color, border-color, color, fill, stroke",dimensions:"width, height",position:"left, right, top, bottom",background:"background-color, background-image, background-position"},easing:{"ease-in":"cubic-bezier(0.4, 0, 1, 1)","ease-out":"cubic-bezier(0, 0, 0.2, 1)","ease-in-out":"cubic-bezier(0.4, 0, 0.2, 1)"},duration:{"ultra-fast":"50ms",faster:"100ms",fast:"150ms",normal:"200ms",slow:"300ms",slower:"400ms","ultra-slow":"500ms"}},dh={breakpoints:{base:"0em",sm:"30em",md:"48em",lg:"62em",xl:"80em","2xl":"96em"},zIndices:{hide:-1,auto:"auto",base:0,docked:10,dropdown:1e3,sticky:1100,banner:1200,overlay:1300,modal:1400,popover:1500,skipLink:1600,toast:1700,tooltip:1800},radii:{none:"0",sm:"0.125rem",base:"0.25rem",md:"0.375rem",lg:"0.5rem",xl:"0.75rem","2xl":"1rem","3xl":"1.5rem",full:"9999px"},blur:{none:0,sm:"4px",base:"8px",md:"12px",lg:"16px",xl:"24px","2xl":"40px","3xl":"64px"},colors:{transparent:"transparent",current:"currentColor",black:"#000000",white:"#FFFFFF",whiteAlpha:{50:"rgba(255, 255, 255, 0.04)",100:"rgba(255, 255, 255, 0.06)",200:"rgba(255, 255, 255, 0.08)",300:"rgba(255, 255, 255, 0.16)",400:"rgba(255, 255, 255, 0.24)",500:"rgba(255, 255, 255, 0.36)",600:"rgba(255, 255, 255, 0.48)",700:"rgba(255, 255, 255, 0.64)",800:"rgba(255, 255, 255, 0.80)",900:"rgba(255, 255, 255, 0.92)"},blackAlpha:{50:"rgba(0, 0, 0, 0.04)",100:"rgba(0, 0, 0, 0.06)",200:"rgba(0, 0, 0, 0.08)",300:"rgba(0, 0, 0, 0.16)",400:"rgba(0, 0, 0, 0.24)",500:"rgba(0, 0, 0, 0.36)",600:"rgba(0, 0, 0, 0.48)",700:"rgba(0, 0, 0, 0.64)",800:"rgba(0, 0, 0, 0.80)",900:"rgba(0, 0, 0, 0.92)"},gray:{50:"#F7FAFC",100:"#EDF2F7",200:"#E2E8F0",300:"#CBD5E0",400:"#A0AEC0",500:"#718096",600:"#4A5568",700:"#2D3748",800:"#1A202C",900:"#171923"},red:{50:"#FFF5F5",100:"#FED7D7",200:"#FEB2B2",300:"#FC8181",400:"#F56565",500:"#E53E3E",600:"#C53030",700:"#9B2C2C",800:"#822727",900:"#63171B"},orange:{50:"#FFFAF0",100:"#FEEBC8",200:"#FBD38D",300:"#F6AD55",400:"#ED8936",500:"#DD6B20",600:"#C05621",700:"#9C4221",800:"#7B341E",900:"#652B19"},yellow:{50:"#FFFFF0",100:"#FEFCBF",200:"#FAF089",300:"#F6E05E",400:"#ECC94B",500:"#D69E2E",600:"#B7791F",700:"#975A16",800:"#744210",900:"#5F370E"},green:{50:"#F0FFF4",100:"#C6F6D5",200:"#9AE6B4",300:"#68D391",400:"#48BB78",500:"#38A169",600:"#2F855A",700:"#276749",800:"#22543D",900:"#1C4532"},teal:{50:"#E6FFFA",100:"#B2F5EA",200:"#81E6D9",300:"#4FD1C5",400:"#38B2AC",500:"#319795",600:"#2C7A7B",700:"#285E61",800:"#234E52",900:"#1D4044"},blue:{50:"#ebf8ff",100:"#bee3f8",200:"#90cdf4",300:"#63b3ed",400:"#4299e1",500:"#3182ce",600:"#2b6cb0",700:"#2c5282",800:"#2a4365",900:"#1A365D"},cyan:{50:"#EDFDFD",100:"#C4F1F9",200:"#9DECF9",300:"#76E4F7",400:"#0BC5EA",500:"#00B5D8",600:"#00A3C4",700:"#0987A0",800:"#086F83",900:"#065666"},purple:{50:"#FAF5FF",100:"#E9D8FD",200:"#D6BCFA",300:"#B794F4",400:"#9F7AEA",500:"#805AD5",600:"#6B46C1",700:"#553C9A",800:"#44337A",900:"#322659"},pink:{50:"#FFF5F7",100:"#FED7E2",200:"#FBB6CE",300:"#F687B3",400:"#ED64A6",500:"#D53F8C",600:"#B83280",700:"#97266D",800:"#702459",900:"#521B41"}},...Gc,sizes:bs,shadows:{xs:"0 0 0 1px rgba(0, 0, 0, 0.05)",sm:"0 1px 2px 0 rgba(0, 0, 0, 0.05)",base:"0 1px 3px 0 rgba(0, 0, 0, 0.1), 0 1px 2px 0 rgba(0, 0, 0, 0.06)",md:"0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06)",lg:"0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -2px rgba(0, 0, 0, 0.05)",xl:"0 20px 25px -5px rgba(0, 0, 0, 0.1), 0 10px 10px -5px rgba(0, 0, 0, 0.04)","2xl":"0 25px 50px -12px rgba(0, 0, 0, 0.25)",outline:"0 0 0 3px rgba(66, 153, 225, 0.6)",inner:"inset 0 2px 4px 0 rgba(0,0,0,0.06)",none:"none","dark-lg":"rgba(0, 0, 0, 0.1) 0px 0px 0px 1px, rgba(0, 0, 0, 0.2) 0px 5px 10px, rgba(0, 0, 0, 0.4) 0px 15px 40px"},space:ys,borders:{none:0,"1px":"1px solid","2px":"2px solid","4px":"4px solid","8px":"8px solid"},transition:uh},hh={colors:{"chakra-body-text":{_light:"gray.800",_dark:"whiteAlpha.900"},"chakra-body-bg":{_light:"white",_dark:"gray.800"},"chakra-border-color":{_light:"gray.200",_dark:"whiteAlpha.300"},"chakra-inverse-text":{_light:"white",_dark:"gray.800"},"chakra-subtle-bg":{_light:"gray.100",_dark:"gray.700"},"chakra-subtle-text":{_light:"gray.600",_dark:"gray.400"},"chakra-placeholder-color":{_light:"gray.500",_dark:"whiteAlpha.400"}}},fh={global:{body:{fontFamily:"body",color:"chakra-body-text",bg:"chakra-body-bg",transitionProperty:"background-color",transitionDuration:"normal",lineHeight:"base"},"*::placeholder":{color:"chakra-placeholder-color"},"*, *::before, &::after":{borderColor:"chakra-border-color"}}},ph={useSystemColorMode:!1,initialColorMode:"light",cssVarPrefix:"chakra"},gh={semanticTokens:hh,direction:"ltr",...dh,components:ch,styles:fh,config:ph},mh={semanticTokens:hh,direction:"ltr",components:{},...dh,styles:fh,config:ph};var yh=n(579);var bh=function(){function t(t){var e=this;this._insertTag=function(t){var n;n=0===e.tags.length?e.insertionPoint?e.insertionPoint.nextSibling:e.prepend?e.container.firstChild:e.before:e.tags[e.tags.length-1].nextSibling,e.container.insertBefore(t,n),e.tags.push(t)},this.isSpeedy=void 0===t.speedy||t.speedy,this.tags=[],this.ctr=0,this.nonce=t.nonce,this.key=t.key,this.container=t.container,this.prepend=t.prepend,this.insertionPoint=t.insertionPoint,this.before=null}var e=t.prototype;return e.hydrate=function(t){t.forEach(this._insertTag)},e.insert=function(t){this.ctr%(this.isSpeedy?65e3:1)===0&&this._insertTag(function(t){var e=document.createElement("style");return e.setAttribute("data-emotion",t.key),void 0!==t.nonce&&e.setAttribute("nonce",t.nonce),e.appendChild(document.createTextNode("")),e.setAttribute("data-s",""),e}(this));var e=this.tags[this.tags.length-1];if(this.isSpeedy){var n=function(t){if(t.sheet)return t.sheet;for(var e=0;e<document.styleSheets.length;e++)if(document.styleSheets[e].ownerNode===t)return document.styleSheets[e]}(e);try{n.insertRule(t,n.cssRules.length)}catch(r){}}else e.appendChild(document.createTextNode(t));this.ctr++},e.flush=function(){this.tags.forEach((function(t){var e;return null==(e=t.parentNode)?void 0:e.removeChild(t)})),this.tags=[],this.ctr=0},t}(),vh=Math.abs,_h=String.fromCharCode,wh=Object.assign;function xh(t){return t.trim()}function Sh(t,e,n){return t.replace(e,n)}function kh(t,e){return t.indexOf(e)}function Ch(t,e){return 0|t.charCodeAt(e)}function Th(t,e,n){return t.slice(e,n)}function Ph(t){return t.length}function Eh(t){return t.length}function Ah(t,e){return e.push(t),t}var Ih=1,Mh=1,Fh=0,Dh=0,Rh=0,Oh="";function Nh(t,e,n,r,i,o,a){return{value:t,root:e,parent:n,type:r,props:i,children:o,line:Ih,column:Mh,length:a,return:""}}function Lh(t,e){return wh(Nh("",null,null,"",null,null,0),t,{length:-t.length},e)}function Bh(){return Rh=Dh>0?Ch(Oh,--Dh):0,Mh--,10===Rh&&(Mh=1,Ih--),Rh}function zh(){return Rh=Dh<Fh?Ch(Oh,Dh++):0,Mh++,10===Rh&&(Mh=1,Ih++),Rh}function jh(){return Ch(Oh,Dh)}function Uh(){return Dh}function Vh(t,e){return Th(Oh,t,e)}function $h(t){switch(t){case 0:case 9:case 10:case 13:case 32:return 5;case 33:case 43:case 44:case 47:case 62:case 64:case 126:case 59:case 123:case 125:return 4;case 58:return 3;case 34:case 39:case 40:case 91:return 2;case 41:case 93:return 1}return 0}function Wh(t){return Ih=Mh=1,Fh=Ph(Oh=t),Dh=0,[]}function Gh(t){return Oh="",t}function Hh(t){return xh(Vh(Dh-1,Kh(91===t?t+2:40===t?t+1:t)))}function Yh(t){for(;(Rh=jh())&&Rh<33;)zh();return $h(t)>2||$h(Rh)>3?"":" "}function qh(t,e){for(;--e&&zh()&&!(Rh<48||Rh>102||Rh>57&&Rh<65||Rh>70&&Rh<97););return Vh(t,Uh()+(e<6&&32==jh()&&32==zh()))}function Kh(t){for(;zh();)switch(Rh){case t:return Dh;case 34:case 39:34!==t&&39!==t&&Kh(Rh);break;case 40:41===t&&Kh(t);break;case 92:zh()}return Dh}function Xh(t,e){for(;zh()&&t+Rh!==57&&(t+Rh!==84||47!==jh()););return"/*"+Vh(e,Dh-1)+"*"+_h(47===t?t:zh())}function Qh(t){for(;!$h(jh());)zh();return Vh(t,Dh)}var Zh="-ms-",Jh="-moz-",tf="-webkit-",ef="comm",nf="rule",rf="decl",of="@keyframes";function af(t,e){for(var n="",r=Eh(t),i=0;i<r;i++)n+=e(t[i],i,t,e)||"";return n}function sf(t,e,n,r){switch(t.type){case"@layer":if(t.children.length)break;case"@import":case rf:return t.return=t.return||t.value;case ef:return"";case of:return t.return=t.value+"{"+af(t.children,r)+"}";case nf:t.value=t.props.join(",")}return Ph(n=af(t.children,r))?t.return=t.value+"{"+n+"}":""}function lf(t){return Gh(cf("",null,null,null,[""],t=Wh(t),0,[0],t))}function cf(t,e,n,r,i,o,a,s,l){for(var c=0,u=0,d=a,h=0,f=0,p=0,g=1,m=1,y=1,b=0,v="",_=i,w=o,x=r,S=v;m;)switch(p=b,b=zh()){case 40:if(108!=p&&58==Ch(S,d-1)){-1!=kh(S+=Sh(Hh(b),"&","&\f"),"&\f")&&(y=-1);break}case 34:case 39:case 91:S+=Hh(b);break;case 9:case 10:case 13:case 32:S+=Yh(p);break;case 92:S+=qh(Uh()-1,7);continue;case 47:switch(jh()){case 42:case 47:Ah(df(Xh(zh(),Uh()),e,n),l);break;default:S+="/"}break;case 123*g:s[c++]=Ph(S)*y;case 125*g:case 59:case 0:switch(b){case 0:case 125:m=0;case 59+u:-1==y&&(S=Sh(S,/\f/g,"")),f>0&&Ph(S)-d&&Ah(f>32?hf(S+";",r,n,d-1):hf(Sh(S," ","")+";",r,n,d-2),l);break;case 59:S+=";";default:if(Ah(x=uf(S,e,n,c,u,i,s,v,_=[],w=[],d),o),123===b)if(0===u)cf(S,e,x,x,_,o,d,s,w);else switch(99===h&&110===Ch(S,3)?100:h){case 100:case 108:case 109:case 115:cf(t,x,x,r&&Ah(uf(t,x,x,0,0,i,s,v,i,_=[],d),w),i,w,d,s,r?_:w);break;default:cf(S,x,x,x,[""],w,0,s,w)}}c=u=f=0,g=y=1,v=S="",d=a;break;case 58:d=1+Ph(S),f=p;default:if(g<1)if(123==b)--g;else if(125==b&&0==g++&&125==Bh())continue;switch(S+=_h(b),b*g){case 38:y=u>0?1:(S+="\f",-1);break;case 44:s[c++]=(Ph(S)-1)*y,y=1;break;case 64:45===jh()&&(S+=Hh(zh())),h=jh(),u=d=Ph(v=S+=Qh(Uh())),b++;break;case 45:45===p&&2==Ph(S)&&(g=0)}}return o}function uf(t,e,n,r,i,o,a,s,l,c,u){for(var d=i-1,h=0===i?o:[""],f=Eh(h),p=0,g=0,m=0;p<r;++p)for(var y=0,b=Th(t,d+1,d=vh(g=a[p])),v=t;y<f;++y)(v=xh(g>0?h[y]+" "+b:Sh(b,/&\f/g,h[y])))&&(l[m++]=v);return Nh(t,e,n,0===i?nf:s,l,c,u)}function df(t,e,n){return Nh(t,e,n,ef,_h(Rh),Th(t,2,-2),0)}function hf(t,e,n,r){return Nh(t,e,n,rf,Th(t,0,r),Th(t,r+1,-1),r)}var ff=function(t,e,n){for(var r=0,i=0;r=i,i=jh(),38===r&&12===i&&(e[n]=1),!$h(i);)zh();return Vh(t,Dh)},pf=function(t,e){return Gh(function(t,e){var n=-1,r=44;do{switch($h(r)){case 0:38===r&&12===jh()&&(e[n]=1),t[n]+=ff(Dh-1,e,n);break;case 2:t[n]+=Hh(r);break;case 4:if(44===r){t[++n]=58===jh()?"&\f":"",e[n]=t[n].length;break}default:t[n]+=_h(r)}}while(r=zh());return t}(Wh(t),e))},gf=new WeakMap,mf=function(t){if("rule"===t.type&&t.parent&&!(t.length<1)){for(var e=t.value,n=t.parent,r=t.column===n.column&&t.line===n.line;"rule"!==n.type;)if(!(n=n.parent))return;if((1!==t.props.length||58===e.charCodeAt(0)||gf.get(n))&&!r){gf.set(t,!0);for(var i=[],o=pf(e,i),a=n.props,s=0,l=0;s<o.length;s++)for(var c=0;c<a.length;c++,l++)t.props[l]=i[s]?o[s].replace(/&\f/g,a[c]):a[c]+" "+o[s]}}},yf=function(t){if("decl"===t.type){var e=t.value;108===e.charCodeAt(0)&&98===e.charCodeAt(2)&&(t.return="",t.value="")}};function bf(t,e){switch(function(t,e){return 45^Ch(t,0)?(((e<<2^Ch(t,0))<<2^Ch(t,1))<<2^Ch(t,2))<<2^Ch(t,3):0}(t,e)){case 5103:return tf+"print-"+t+t;case 5737:case 4201:case 3177:case 3433:case 1641:case 4457:case 2921:case 5572:case 6356:case 5844:case 3191:case 6645:case 3005:case 6391:case 5879:case 5623:case 6135:case 4599:case 4855:case 4215:case 6389:case 5109:case 5365:case 5621:case 3829:return tf+t+t;case 5349:case 4246:case 4810:case 6968:case 2756:return tf+t+Jh+t+Zh+t+t;case 6828:case 4268:return tf+t+Zh+t+t;case 6165:return tf+t+Zh+"flex-"+t+t;case 5187:return tf+t+Sh(t,/(\w+).+(:[^]+)/,tf+"box-$1$2"+Zh+"flex-$1$2")+t;case 5443:return tf+t+Zh+"flex-item-"+Sh(t,/flex-|-self/,"")+t;case 4675:return tf+t+Zh+"flex-line-pack"+Sh(t,/align-content|flex-|-self/,"")+t;case 5548:return tf+t+Zh+Sh(t,"shrink","negative")+t;case 5292:return tf+t+Zh+Sh(t,"basis","preferred-size")+t;case 6060:return tf+"box-"+Sh(t,"-grow","")+tf+t+Zh+Sh(t,"grow","positive")+t;case 4554:return tf+Sh(t,/([^-])(transform)/g,"$1"+tf+"$2")+t;case 6187:return Sh(Sh(Sh(t,/(zoom-|grab)/,tf+"$1"),/(image-set)/,tf+"$1"),t,"")+t;case 5495:case 3959:return Sh(t,/(image-set\([^]*)/,tf+"$1$`$1");case 4968:return Sh(Sh(t,/(.+:)(flex-)?(.*)/,tf+"box-pack:$3"+Zh+"flex-pack:$3"),/s.+-b[^;]+/,"justify")+tf+t+t;case 4095:case 3583:case 4068:case 2532:return Sh(t,/(.+)-inline(.+)/,tf+"$1$2")+t;case 8116:case 7059:case 5753:case 5535:case 5445:case 5701:case 4933:case 4677:case 5533:case 5789:case 5021:case 4765:if(Ph(t)-1-e>6)switch(Ch(t,e+1)){case 109:if(45!==Ch(t,e+4))break;case 102:return Sh(t,/(.+:)(.+)-([^]+)/,"$1"+tf+"$2-$3$1"+Jh+(108==Ch(t,e+3)?"$3":"$2-$3"))+t;case 115:return~kh(t,"stretch")?bf(Sh(t,"stretch","fill-available"),e)+t:t}break;case 4949:if(115!==Ch(t,e+1))break;case 6444:switch(Ch(t,Ph(t)-3-(~kh(t,"!important")&&10))){case 107:return Sh(t,":",":"+tf)+t;case 101:return Sh(t,/(.+:)([^;!]+)(;|!.+)?/,"$1"+tf+(45===Ch(t,14)?"inline-":"")+"box$3$1"+tf+"$2$3$1"+Zh+"$2box$3")+t}break;case 5936:switch(Ch(t,e+11)){case 114:return tf+t+Zh+Sh(t,/[svh]\w+-[tblr]{2}/,"tb")+t;case 108:return tf+t+Zh+Sh(t,/[svh]\w+-[tblr]{2}/,"tb-rl")+t;case 45:return tf+t+Zh+Sh(t,/[svh]\w+-[tblr]{2}/,"lr")+t}return tf+t+Zh+t+t}return t}var vf=[function(t,e,n,r){if(t.length>-1&&!t.return)switch(t.type){case rf:t.return=bf(t.value,t.length);break;case of:return af([Lh(t,{value:Sh(t.value,"@","@"+tf)})],r);case nf:if(t.length)return function(t,e){return t.map(e).join("")}(t.props,(function(e){switch(function(t,e){return(t=e.exec(t))?t[0]:t}(e,/(::plac\w+|:read-\w+)/)){case":read-only":case":read-write":return af([Lh(t,{props:[Sh(e,/:(read-\w+)/,":-moz-$1")]})],r);case"::placeholder":return af([Lh(t,{props:[Sh(e,/:(plac\w+)/,":"+tf+"input-$1")]}),Lh(t,{props:[Sh(e,/:(plac\w+)/,":-moz-$1")]}),Lh(t,{props:[Sh(e,/:(plac\w+)/,Zh+"input-$1")]})],r)}return""}))}}],_f=function(t){var e=t.key;if("css"===e){var n=document.querySelectorAll("style[data-emotion]:not([data-s])");Array.prototype.forEach.call(n,(function(t){-1!==t.getAttribute("data-emotion").indexOf(" ")&&(document.head.appendChild(t),t.setAttribute("data-s",""))}))}var r,i,o=t.stylisPlugins||vf,a={},s=[];r=t.container||document.head,Array.prototype.forEach.call(document.querySelectorAll('style[data-emotion^="'+e+' "]'),(function(t){for(var e=t.getAttribute("data-emotion").split(" "),n=1;n<e.length;n++)a[e[n]]=!0;s.push(t)}));var l,c,u=[sf,(c=function(t){l.insert(t)},function(t){t.root||(t=t.return)&&c(t)})],d=function(t){var e=Eh(t);return function(n,r,i,o){for(var a="",s=0;s<e;s++)a+=t[s](n,r,i,o)||"";return a}}([mf,yf].concat(o,u));i=function(t,e,n,r){l=n,function(t){af(lf(t),d)}(t?t+"{"+e.styles+"}":e.styles),r&&(h.inserted[e.name]=!0)};var h={key:e,sheet:new bh({key:e,container:r,nonce:t.nonce,speedy:t.speedy,prepend:t.prepend,insertionPoint:t.insertionPoint}),nonce:t.nonce,inserted:a,registered:{},insert:i};return h.sheet.hydrate(s),h};function wf(){return wf=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var n=arguments[e];for(var r in n)({}).hasOwnProperty.call(n,r)&&(t[r]=n[r])}return t},wf.apply(null,arguments)}var xf=function(t){var e=new WeakMap;return function(n){if(e.has(n))return e.get(n);var r=t(n);return e.set(n,r),r}};function Sf(t,e,n){var r="";return n.split(" ").forEach((function(n){void 0!==t[n]?e.push(t[n]+";"):n&&(r+=n+" ")})),r}var kf=function(t,e,n){var r=t.key+"-"+e.name;!1===n&&void 0===t.registered[r]&&(t.registered[r]=e.styles)},Cf=function(t,e,n){kf(t,e,n);var r=t.key+"-"+e.name;if(void 0===t.inserted[e.name]){var i=e;do{t.insert(e===i?"."+r:"",i,t.sheet,!0),i=i.next}while(void 0!==i)}};var Tf={animationIterationCount:1,aspectRatio:1,borderImageOutset:1,borderImageSlice:1,borderImageWidth:1,boxFlex:1,boxFlexGroup:1,boxOrdinalGroup:1,columnCount:1,columns:1,flex:1,flexGrow:1,flexPositive:1,flexShrink:1,flexNegative:1,flexOrder:1,gridRow:1,gridRowEnd:1,gridRowSpan:1,gridRowStart:1,gridColumn:1,gridColumnEnd:1,gridColumnSpan:1,gridColumnStart:1,msGridRow:1,msGridRowSpan:1,msGridColumn:1,msGridColumnSpan:1,fontWeight:1,lineHeight:1,opacity:1,order:1,orphans:1,scale:1,tabSize:1,widows:1,zIndex:1,zoom:1,WebkitLineClamp:1,fillOpacity:1,floodOpacity:1,stopOpacity:1,strokeDasharray:1,strokeDashoffset:1,strokeMiterlimit:1,strokeOpacity:1,strokeWidth:1};function Pf(t){var e=Object.create(null);return function(n){return void 0===e[n]&&(e[n]=t(n)),e[n]}}var Ef=/[A-Z]|^ms/g,Af=/_EMO_([^_]+?)_([^]*?)_EMO_/g,If=function(t){return 45===t.charCodeAt(1)},Mf=function(t){return null!=t&&"boolean"!==typeof t},Ff=Pf((function(t){return If(t)?t:t.replace(Ef,"-$&").toLowerCase()})),Df=function(t,e){switch(t){case"animation":case"animationName":if("string"===typeof e)return e.replace(Af,(function(t,e,n){return Of={name:e,styles:n,next:Of},e}))}return 1===Tf[t]||If(t)||"number"!==typeof e||0===e?e:e+"px"};function Rf(t,e,n){if(null==n)return"";var r=n;if(void 0!==r.__emotion_styles)return r;switch(typeof n){case"boolean":return"";case"object":var i=n;if(1===i.anim)return Of={name:i.name,styles:i.styles,next:Of},i.name;var o=n;if(void 0!==o.styles){var a=o.next;if(void 0!==a)for(;void 0!==a;)Of={name:a.name,styles:a.styles,next:Of},a=a.next;return o.styles+";"}return function(t,e,n){var r="";if(Array.isArray(n))for(var i=0;i<n.length;i++)r+=Rf(t,e,n[i])+";";else for(var o in n){var a=n[o];if("object"!==typeof a){var s=a;null!=e&&void 0!==e[s]?r+=o+"{"+e[s]+"}":Mf(s)&&(r+=Ff(o)+":"+Df(o,s)+";")}else if(!Array.isArray(a)||"string"!==typeof a[0]||null!=e&&void 0!==e[a[0]]){var l=Rf(t,e,a);switch(o){case"animation":case"animationName":r+=Ff(o)+":"+l+";";break;default:r+=o+"{"+l+"}"}}else for(var c=0;c<a.length;c++)Mf(a[c])&&(r+=Ff(o)+":"+Df(o,a[c])+";")}return r}(t,e,n);case"function":if(void 0!==t){var s=Of,l=n(t);return Of=s,Rf(t,e,l)}}var c=n;if(null==e)return c;var u=e[c];return void 0!==u?u:c}var Of,Nf=/label:\s*([^\s;{]+)\s*(;|$)/g;function Lf(t,e,n){if(1===t.length&&"object"===typeof t[0]&&null!==t[0]&&void 0!==t[0].styles)return t[0];var r=!0,i="";Of=void 0;var o=t[0];null==o||void 0===o.raw?(r=!1,i+=Rf(n,e,o)):i+=o[0];for(var a=1;a<t.length;a++){if(i+=Rf(n,e,t[a]),r)i+=o[a]}Nf.lastIndex=0;for(var s,l="";null!==(s=Nf.exec(i));)l+="-"+s[1];var c=function(t){for(var e,n=0,r=0,i=t.length;i>=4;++r,i-=4)e=1540483477*(65535&(e=255&t.charCodeAt(r)|(255&t.charCodeAt(++r))<<8|(255&t.charCodeAt(++r))<<16|(255&t.charCodeAt(++r))<<24))+(59797*(e>>>16)<<16),n=1540483477*(65535&(e^=e>>>24))+(59797*(e>>>16)<<16)^1540483477*(65535&n)+(59797*(n>>>16)<<16);switch(i){case 3:n^=(255&t.charCodeAt(r+2))<<16;case 2:n^=(255&t.charCodeAt(r+1))<<8;case 1:n=1540483477*(65535&(n^=255&t.charCodeAt(r)))+(59797*(n>>>16)<<16)}return(((n=1540483477*(65535&(n^=n>>>13))+(59797*(n>>>16)<<16))^n>>>15)>>>0).toString(36)}(i)+l;return{name:c,styles:i,next:Of}}var Bf=!!h.useInsertionEffect&&h.useInsertionEffect,zf=Bf||function(t){return t()},jf=Bf||d.useLayoutEffect,Uf=d.createContext("undefined"!==typeof HTMLElement?_f({key:"css"}):null),Vf=(Uf.Provider,function(t){return(0,d.forwardRef)((function(e,n){var r=(0,d.useContext)(Uf);return t(e,r,n)}))}),$f=d.createContext({}),Wf=xf((function(t){return xf((function(e){return function(t,e){return"function"===typeof e?e(t):wf({},t,e)}(t,e)}))})),Gf=function(t){var e=d.useContext($f);return t.theme!==e&&(e=Wf(e)(t.theme)),d.createElement($f.Provider,{value:e},t.children)};var Hf={}.hasOwnProperty,Yf="__EMOTION_TYPE_PLEASE_DO_NOT_USE__",qf=function(t){var e=t.cache,n=t.serialized,r=t.isStringTag;return kf(e,n,r),zf((function(){return Cf(e,n,r)})),null},Kf=Vf((function(t,e,n){var r=t.css;"string"===typeof r&&void 0!==e.registered[r]&&(r=e.registered[r]);var i=t[Yf],o=[r],a="";"string"===typeof t.className?a=Sf(e.registered,o,t.className):null!=t.className&&(a=t.className+" ");var s=Lf(o,void 0,d.useContext($f));a+=e.key+"-"+s.name;var l={};for(var c in t)Hf.call(t,c)&&"css"!==c&&c!==Yf&&(l[c]=t[c]);return l.className=a,n&&(l.ref=n),d.createElement(d.Fragment,null,d.createElement(qf,{cache:e,serialized:s,isStringTag:"string"===typeof i}),d.createElement(i,l))}));const Xf=(0,d.createContext)({});function Qf(){const t=(0,d.useContext)(Xf);if(void 0===t)throw new Error("useColorMode must be used within a ColorModeProvider");return t}Xf.displayName="ColorModeContext";const Zf="chakra-ui-light",Jf="chakra-ui-dark";const tp="chakra-ui-color-mode";const ep=(np=tp,{ssr:!1,type:"localStorage",get(t){if(!globalThis?.document)return t;let e;try{e=localStorage.getItem(np)||t}catch(n){}return e||t},set(t){try{localStorage.setItem(np,t)}catch(e){}}});var np;function rp(t,e){const n=t.match(new RegExp(`(^| )${e}=([^;]+)`));return n?.[2]}function ip(t,e){return{ssr:!!e,type:"cookie",get:n=>e?rp(e,t):globalThis?.document&&rp(document.cookie,t)||n,set(e){document.cookie=`${t}=${e}; max-age=31536000; path=/`}}}ip(tp);const op=()=>{},ap=Boolean(globalThis?.document)?d.useLayoutEffect:d.useEffect;function sp(t,e){return"cookie"===t.type&&t.ssr?t.get(e):e}const lp=function(t){const{value:e,children:n,options:{useSystemColorMode:r,initialColorMode:i,disableTransitionOnChange:o}={},colorModeManager:a=ep}=t,s=(0,d.useContext)(Uf),l="dark"===i?"dark":"light",[c,u]=(0,d.useState)((()=>sp(a,l))),[h,f]=(0,d.useState)((()=>sp(a))),{getSystemTheme:p,setClassName:g,setDataset:m,addListener:y}=(0,d.useMemo)((()=>function(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const{preventTransition:e=!0,nonce:n}=t,r={setDataset:t=>{const n=e?r.preventTransition():void 0;document.documentElement.dataset.theme=t,document.documentElement.style.colorScheme=t,n?.()},setClassName(t){document.body.classList.add(t?Jf:Zf),document.body.classList.remove(t?Zf:Jf)},query:()=>window.matchMedia("(prefers-color-scheme: dark)"),getSystemTheme:t=>r.query().matches??"dark"===t?"dark":"light",addListener(t){const e=r.query(),n=e=>{t(e.matches?"dark":"light")};return"function"===typeof e.addListener?e.addListener(n):e.addEventListener("change",n),()=>{"function"===typeof e.removeListener?e.removeListener(n):e.removeEventListener("change",n)}},preventTransition(){const t=document.createElement("style");return t.appendChild(document.createTextNode("*{-webkit-transition:none!important;-moz-transition:none!important;-o-transition:none!important;-ms-transition:none!important;transition:none!important}")),void 0!==n&&(t.nonce=n),document.head.appendChild(t),()=>{window.getComputedStyle(document.body),requestAnimationFrame((()=>{requestAnimationFrame((()=>{document.head.removeChild(t)}))}))}}};return r}({preventTransition:o,nonce:s?.nonce})),[o,s?.nonce]),b="system"!==i||c?c:h,v=(0,d.useCallback)((t=>{const e="system"===t?p():t;u(e),g("dark"===e),m(e),a.set(e)}),[a,p,g,m]);ap((()=>{"system"===i&&f(p())}),[]),(0,d.useEffect)((()=>{const t=a.get();v(t||("system"!==i?l:"system"))}),[a,l,i,v]);const _=(0,d.useCallback)((()=>{v("dark"===b?"light":"dark")}),[b,v]);(0,d.useEffect)((()=>{if(r)return y(v)}),[r,y,v]);const w=(0,d.useMemo)((()=>({colorMode:e??b,toggleColorMode:e?op:_,setColorMode:e?op:v,forced:void 0!==e})),[b,_,v,e]);return(0,yh.jsx)(Xf.Provider,{value:w,children:n})};lp.displayName="ColorModeProvider";var cp=function(t,e){var n=arguments;if(null==e||!Hf.call(e,"css"))return d.createElement.apply(void 0,n);var r=n.length,i=new Array(r);i[0]=Kf,i[1]=function(t,e){var n={};for(var r in e)Hf.call(e,r)&&(n[r]=e[r]);return n[Yf]=t,n}(t,e);for(var o=2;o<r;o++)i[o]=n[o];return d.createElement.apply(null,i)};!function(t){var e;e||(e=t.JSX||(t.JSX={}))}(cp||(cp={}));var up=Vf((function(t,e){var n=Lf([t.styles],void 0,d.useContext($f)),r=d.useRef();return jf((function(){var t=e.key+"-global",i=new e.sheet.constructor({key:t,nonce:e.sheet.nonce,container:e.sheet.container,speedy:e.sheet.isSpeedy}),o=!1,a=document.querySelector('style[data-emotion="'+t+" "+n.name+'"]');return e.sheet.tags.length&&(i.before=e.sheet.tags[0]),null!==a&&(o=!0,a.setAttribute("data-emotion",t),i.hydrate([a])),r.current=[i,o],function(){i.flush()}}),[e]),jf((function(){var t=r.current,i=t[0];if(t[1])t[1]=!1;else{if(void 0!==n.next&&Cf(e,n.next,!0),i.tags.length){var o=i.tags[i.tags.length-1].nextElementSibling;i.before=o,i.flush()}e.insert("",n,i,!1)}}),[e,n.name]),null}));function dp(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return Lf(e)}const hp=String.raw,fp=hp`
-  :root,
-  :host {
-    --chakra-vh: 100vh;
-  }
-
-  @supports (height: -webkit-fill-available) {
-    :root,
-    :host {
-      --chakra-vh: -webkit-fill-available;
-    }
-  }
-
-  @supports (height: -moz-fill-available) {
-    :root,
-    :host {
-      --chakra-vh: -moz-fill-available;
-    }
-  }
-
-  @supports (height: 100dvh) {
-    :root,
-    :host {
-      --chakra-vh: 100dvh;
-    }
-  }
-`,pp=()=>(0,yh.jsx)(up,{styles:fp}),gp=t=>{let{scope:e=""}=t;return(0,yh.jsx)(up,{styles:hp`
-      html {
-        line-height: 1.5;
-        -webkit-text-size-adjust: 100%;
-        font-family: system-ui, sans-serif;
-        -webkit-font-smoothing: antialiased;
-        text-rendering: optimizeLegibility;
-        -moz-osx-font-smoothing: grayscale;
-        touch-action: manipulation;
-      }
-
-      body {
-        position: relative;
-        min-height: 100%;
-        margin: 0;
-        font-feature-settings: "kern";
-      }
-
-      ${e} :where(*, *::before, *::after) {
-        border-width: 0;
-        border-style: solid;
-        box-sizing: border-box;
-        word-wrap: break-word;
-      }
-
-      main {
-        display: block;
-      }
-
-      ${e} hr {
-        border-top-width: 1px;
-        box-sizing: content-box;
-        height: 0;
-        overflow: visible;
-      }
-
-      ${e} :where(pre, code, kbd,samp) {
-        font-family: SFMono-Regular, Menlo, Monaco, Consolas, monospace;
-        font-size: 1em;
-      }
-
-      ${e} a {
-        background-color: transparent;
-        color: inherit;
-        text-decoration: inherit;
-      }
-
-      ${e} abbr[title] {
-        border-bottom: none;
-        text-decoration: underline;
-        -webkit-text-decoration: underline dotted;
-        text-decoration: underline dotted;
-      }
-
-      ${e} :where(b, strong) {
-        font-weight: bold;
-      }
-
-      ${e} small {
-        font-size: 80%;
-      }
-
-      ${e} :where(sub,sup) {
-        font-size: 75%;
-        line-height: 0;
-        position: relative;
-        vertical-align: baseline;
-      }
-
-      ${e} sub {
-        bottom: -0.25em;
-      }
-
-      ${e} sup {
-        top: -0.5em;
-      }
-
-      ${e} img {
-        border-style: none;
-      }
-
-      ${e} :where(button, input, optgroup, select, textarea) {
-        font-family: inherit;
-        font-size: 100%;
-        line-height: 1.15;
-        margin: 0;
-      }
-
-      ${e} :where(button, input) {
-        overflow: visible;
-      }
-
-      ${e} :where(button, select) {
-        text-transform: none;
-      }
-
-      ${e} :where(
-          button::-moz-focus-inner,
-          [type="button"]::-moz-focus-inner,
-          [type="reset"]::-moz-focus-inner,
-          [type="submit"]::-moz-focus-inner
-        ) {
-        border-style: none;
-        padding: 0;
-      }
-
-      ${e} fieldset {
-        padding: 0.35em 0.75em 0.625em;
-      }
-
-      ${e} legend {
-        box-sizing: border-box;
-        color: inherit;
-        display: table;
-        max-width: 100%;
-        padding: 0;
-        white-space: normal;
-      }
-
-      ${e} progress {
-        vertical-align: baseline;
-      }
-
-      ${e} textarea {
-        overflow: auto;
-      }
-
-      ${e} :where([type="checkbox"], [type="radio"]) {
-        box-sizing: border-box;
-        padding: 0;
-      }
-
-      ${e} input[type="number"]::-webkit-inner-spin-button,
-      ${e} input[type="number"]::-webkit-outer-spin-button {
-        -webkit-appearance: none !important;
-      }
-
-      ${e} input[type="number"] {
-        -moz-appearance: textfield;
-      }
-
-      ${e} input[type="search"] {
-        -webkit-appearance: textfield;
-        outline-offset: -2px;
-      }
-
-      ${e} input[type="search"]::-webkit-search-decoration {
-        -webkit-appearance: none !important;
-      }
-
-      ${e} ::-webkit-file-upload-button {
-        -webkit-appearance: button;
-        font: inherit;
-      }
-
-      ${e} details {
-        display: block;
-      }
-
-      ${e} summary {
-        display: list-item;
-      }
-
-      template {
-        display: none;
-      }
-
-      [hidden] {
-        display: none !important;
-      }
-
-      ${e} :where(
-          blockquote,
-          dl,
-          dd,
-          h1,
-          h2,
-          h3,
-          h4,
-          h5,
-          h6,
-          hr,
-          figure,
-          p,
-          pre
-        ) {
-        margin: 0;
-      }
-
-      ${e} button {
-        background: transparent;
-        padding: 0;
-      }
-
-      ${e} fieldset {
-        margin: 0;
-        padding: 0;
-      }
-
-      ${e} :where(ol, ul) {
-        margin: 0;
-        padding: 0;
-      }
-
-      ${e} textarea {
-        resize: vertical;
-      }
-
-      ${e} :where(button, [role="button"]) {
-        cursor: pointer;
-      }
-
-      ${e} button::-moz-focus-inner {
-        border: 0 !important;
-      }
-
-      ${e} table {
-        border-collapse: collapse;
-      }
-
-      ${e} :where(h1, h2, h3, h4, h5, h6) {
-        font-size: inherit;
-        font-weight: inherit;
-      }
-
-      ${e} :where(button, input, optgroup, select, textarea) {
-        padding: 0;
-        line-height: inherit;
-        color: inherit;
-      }
-
-      ${e} :where(img, svg, video, canvas, audio, iframe, embed, object) {
-        display: block;
-      }
-
-      ${e} :where(img, video) {
-        max-width: 100%;
-        height: auto;
-      }
-
-      [data-js-focus-visible]
-        :focus:not([data-focus-visible-added]):not(
-          [data-focus-visible-disabled]
-        ) {
-        outline: none;
-        box-shadow: none;
-      }
-
-      ${e} select::-ms-expand {
-        display: none;
-      }
-
-      ${fp}
-    `})};function mp(t){const e=null==t?0:t.length;return e?t[e-1]:void 0}function yp(t){if(null==t)return t;const{unitless:e}=function(t){const e=parseFloat(t.toString()),n=t.toString().replace(String(e),"");return{unitless:!n,value:e,unit:n}}(t);return e||"number"===typeof t?`${t}px`:t}const bp=(t,e)=>parseInt(t[1],10)>parseInt(e[1],10)?1:-1,vp=t=>Object.fromEntries(Object.entries(t).sort(bp));function _p(t){const e=vp(t);return Object.assign(Object.values(e),e)}function wp(t){if(!t)return t;t=yp(t)??t;return"number"===typeof t?`${t+-.02}`:t.replace(/(\d+\.?\d*)/u,(t=>`${parseFloat(t)+-.02}`))}function xp(t,e){const n=["@media screen"];return t&&n.push("and",`(min-width: ${yp(t)})`),e&&n.push("and",`(max-width: ${yp(e)})`),n.join(" ")}function Sp(t){if(!t)return null;t.base=t.base??"0px";const e=_p(t),n=Object.entries(t).sort(bp).map(((t,e,n)=>{let[r,i]=t,[,o]=n[e+1]??[];return o=parseFloat(o)>0?wp(o):void 0,{_minW:wp(i),breakpoint:r,minW:i,maxW:o,maxWQuery:xp(null,o),minWQuery:xp(i),minMaxQuery:xp(i,o)}})),r=function(t){const e=Object.keys(vp(t));return new Set(e)}(t),i=Array.from(r.values());return{keys:r,normalized:e,isResponsive(t){const e=Object.keys(t);return e.length>0&&e.every((t=>r.has(t)))},asObject:vp(t),asArray:_p(t),details:n,get:t=>n.find((e=>e.breakpoint===t)),media:[null,...e.map((t=>xp(t))).slice(1)],toArrayValue(t){if(!Nc(t))throw new Error("toArrayValue: value must be an object");const e=i.map((e=>t[e]??null));for(;null===mp(e);)e.pop();return e},toObjectValue(t){if(!Array.isArray(t))throw new Error("toObjectValue: value must be an array");return t.reduce(((t,e,n)=>{const r=i[n];return null!=r&&null!=e&&(t[r]=e),t}),{})}}}var kp=n(9611);function Cp(t,e){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};const{stop:r,getKey:i}=n;return function t(n){let o=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[];if(Nc(n)||Array.isArray(n)){const a={};for(const[s,l]of Object.entries(n)){const c=i?.(s)??s,u=[...o,c];if(r?.(n,u))return e(n,o);a[c]=t(l,u)}return a}return e(n,o)}(t)}const Tp=(t,e)=>`${t}[data-closed], ${t}[data-state=closed] ${e}`,Pp=(t,e)=>`${t}:hover ${e}, ${t}[data-hover] ${e}`,Ep=(t,e)=>`${t}:focus ${e}, ${t}[data-focus] ${e}`,Ap=(t,e)=>`${t}:focus-visible ${e}`,Ip=(t,e)=>`${t}:focus-within ${e}`,Mp=(t,e)=>`${t}:active ${e}, ${t}[data-active] ${e}`,Fp=(t,e)=>`${t}:disabled ${e}, ${t}[data-disabled] ${e}`,Dp=(t,e)=>`${t}:invalid ${e}, ${t}[data-invalid] ${e}`,Rp=(t,e)=>`${t}:checked ${e}, ${t}[data-checked] ${e}`,Op=(t,e)=>`${t}:placeholder-shown ${e}`,Np=t=>Bp((e=>t(e,"&")),"[role=group]","[data-group]",".group"),Lp=t=>Bp((e=>t(e,"~ &")),"[data-peer]",".peer"),Bp=function(t){for(var e=arguments.length,n=new Array(e>1?e-1:0),r=1;r<e;r++)n[r-1]=arguments[r];return n.map(t).join(", ")},zp={_hover:"&:hover, &[data-hover]",_active:"&:active, &[data-active]",_focus:"&:focus, &[data-focus]",_highlighted:"&[data-highlighted]",_focusWithin:"&:focus-within, &[data-focus-within]",_focusVisible:"&:focus-visible, &[data-focus-visible]",_disabled:"&:disabled, &[disabled], &[aria-disabled=true], &[data-disabled]",_readOnly:"&[aria-readonly=true], &[readonly], &[data-readonly]",_before:"&::before",_after:"&::after",_empty:"&:empty, &[data-empty]",_expanded:"&[aria-expanded=true], &[data-expanded], &[data-state=expanded]",_checked:"&[aria-checked=true], &[data-checked], &[data-state=checked]",_grabbed:"&[aria-grabbed=true], &[data-grabbed]",_pressed:"&[aria-pressed=true], &[data-pressed]",_invalid:"&[aria-invalid=true], &[data-invalid]",_valid:"&[data-valid], &[data-state=valid]",_loading:"&[data-loading], &[aria-busy=true]",_selected:"&[aria-selected=true], &[data-selected]",_hidden:"&[hidden], &[data-hidden]",_autofill:"&:-webkit-autofill",_even:"&:nth-of-type(even)",_odd:"&:nth-of-type(odd)",_first:"&:first-of-type",_firstLetter:"&::first-letter",_last:"&:last-of-type",_notFirst:"&:not(:first-of-type)",_notLast:"&:not(:last-of-type)",_visited:"&:visited",_activeLink:"&[aria-current=page]",_activeStep:"&[aria-current=step]",_indeterminate:"&:indeterminate, &[aria-checked=mixed], &[data-indeterminate], &[data-state=indeterminate]",_groupOpen:Np(((t,e)=>`${t}[data-open], ${t}[open], ${t}[data-state=open] ${e}`)),_groupClosed:Np(Tp),_groupHover:Np(Pp),_peerHover:Lp(Pp),_groupFocus:Np(Ep),_peerFocus:Lp(Ep),_groupFocusVisible:Np(Ap),_peerFocusVisible:Lp(Ap),_groupActive:Np(Mp),_peerActive:Lp(Mp),_groupDisabled:Np(Fp),_peerDisabled:Lp(Fp),_groupInvalid:Np(Dp),_peerInvalid:Lp(Dp),_groupChecked:Np(Rp),_peerChecked:Lp(Rp),_groupFocusWithin:Np(Ip),_peerFocusWithin:Lp(Ip),_peerPlaceholderShown:Lp(Op),_placeholder:"&::placeholder, &[data-placeholder]",_placeholderShown:"&:placeholder-shown, &[data-placeholder-shown]",_fullScreen:"&:fullscreen, &[data-fullscreen]",_selection:"&::selection",_rtl:"[dir=rtl] &, &[dir=rtl]",_ltr:"[dir=ltr] &, &[dir=ltr]",_mediaDark:"@media (prefers-color-scheme: dark)",_mediaReduceMotion:"@media (prefers-reduced-motion: reduce)",_dark:".chakra-ui-dark &:not([data-theme]),[data-theme=dark] &:not([data-theme]),&[data-theme=dark]",_light:".chakra-ui-light &:not([data-theme]),[data-theme=light] &:not([data-theme]),&[data-theme=light]",_horizontal:"&[data-orientation=horizontal]",_vertical:"&[data-orientation=vertical]",_open:"&[data-open], &[open], &[data-state=open]",_closed:"&[data-closed], &[data-state=closed]",_complete:"&[data-complete]",_incomplete:"&[data-incomplete]",_current:"&[data-current]"},jp=Object.keys(zp);const Up=["colors","borders","borderWidths","borderStyles","fonts","fontSizes","fontWeights","gradients","letterSpacings","lineHeights","radii","space","shadows","sizes","zIndices","transition","blur","breakpoints"];function Vp(t){return function(t,e){const n={};for(const r of e)r in t&&(n[r]=t[r]);return n}(t,Up)}function $p(t,e){return $a(String(t).replace(/\./g,"-"),void 0,e)}function Wp(t){const e=function(t){const e=Vp(t),n=function(t){return t.semanticTokens}(t),r=t=>jp.includes(t)||"default"===t,i={};return Cp(e,((t,e)=>{null!=t&&(i[e.join(".")]={isSemantic:!1,value:t})})),Cp(n,((t,e)=>{null!=t&&(i[e.join(".")]={isSemantic:!0,value:t})}),{stop:t=>Object.keys(t).every(r)}),i}(t),n=t.config?.cssVarPrefix;let r={};const i={};function o(t,r){const i=[String(t).split(".")[0],r].join(".");if(!e[i])return r;const{reference:o}=$p(i,n);return o}for(const[a,s]of Object.entries(e)){const{isSemantic:t,value:e}=s,{variable:l,reference:c}=$p(a,n);if(!t){if(a.startsWith("space")){const t=a.split("."),[n,...r]=t,o=`${n}.-${r.join(".")}`,s=Vu.negate(e),u=Vu.negate(c);i[o]={value:s,var:l,varRef:u}}r[l]=e,i[a]={value:e,var:l,varRef:c};continue}const u=Nc(e)?e:{default:e};r=kp(r,Object.entries(u).reduce(((t,e)=>{let[n,r]=e;if(!r)return t;const i=o(a,`${r}`);if("default"===n)return t[l]=i,t;return t[zp?.[n]??n]={[l]:i},t}),{})),i[a]={value:c,var:l,varRef:c}}return{cssVars:r,cssMap:i}}function Gp(t){for(var e=arguments.length,n=new Array(e>1?e-1:0),r=1;r<e;r++)n[r-1]=arguments[r];return"function"===typeof t?t(...n):t}const Hp=t=>"string"===typeof t?t.replace(/!(important)?$/,"").trim():t;function Yp(t){const{scale:e,transform:n,compose:r}=t;return(t,i)=>{const o=((t,e)=>n=>{const r=String(e),i=(t=>/!(important)?$/.test(t))(r),o=Hp(r),a=t?`${t}.${o}`:o;let s=Nc(n.__cssMap)&&a in n.__cssMap?n.__cssMap[a].varRef:e;return s=Hp(s),i?`${s} !important`:s})(e,t)(i);let a=n?.(o,i)??o;return r&&(a=r(a,i)),a}}const qp=function(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return t=>e.reduce(((t,e)=>e(t)),t)};function Kp(t,e){return n=>{const r={property:n,scale:t};return r.transform=Yp({scale:t,transform:e}),r}}const Xp=t=>{let{rtl:e,ltr:n}=t;return t=>"rtl"===t.direction?e:n};const Qp=["rotate(var(--chakra-rotate, 0))","scaleX(var(--chakra-scale-x, 1))","scaleY(var(--chakra-scale-y, 1))","skewX(var(--chakra-skew-x, 0))","skewY(var(--chakra-skew-y, 0))"];const Zp={"--chakra-blur":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-brightness":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-contrast":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-grayscale":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-hue-rotate":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-invert":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-saturate":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-sepia":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-drop-shadow":"var(--chakra-empty,/*!*/ /*!*/)",filter:["var(--chakra-blur)","var(--chakra-brightness)","var(--chakra-contrast)","var(--chakra-grayscale)","var(--chakra-hue-rotate)","var(--chakra-invert)","var(--chakra-saturate)","var(--chakra-sepia)","var(--chakra-drop-shadow)"].join(" ")},Jp={backdropFilter:["var(--chakra-backdrop-blur)","var(--chakra-backdrop-brightness)","var(--chakra-backdrop-contrast)","var(--chakra-backdrop-grayscale)","var(--chakra-backdrop-hue-rotate)","var(--chakra-backdrop-invert)","var(--chakra-backdrop-opacity)","var(--chakra-backdrop-saturate)","var(--chakra-backdrop-sepia)"].join(" "),"--chakra-backdrop-blur":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-backdrop-brightness":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-backdrop-contrast":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-backdrop-grayscale":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-backdrop-hue-rotate":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-backdrop-invert":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-backdrop-opacity":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-backdrop-saturate":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-backdrop-sepia":"var(--chakra-empty,/*!*/ /*!*/)"};const tg={"row-reverse":{space:"--chakra-space-x-reverse",divide:"--chakra-divide-x-reverse"},"column-reverse":{space:"--chakra-space-y-reverse",divide:"--chakra-divide-y-reverse"}},eg={"to-t":"to top","to-tr":"to top right","to-r":"to right","to-br":"to bottom right","to-b":"to bottom","to-bl":"to bottom left","to-l":"to left","to-tl":"to top left"},ng=new Set(Object.values(eg)),rg=new Set(["none","-moz-initial","inherit","initial","revert","unset"]),ig=t=>t.trim();const og=t=>"string"===typeof t&&t.includes("(")&&t.includes(")");const ag=t=>e=>`${t}(${e})`,sg={filter:t=>"auto"!==t?t:Zp,backdropFilter:t=>"auto"!==t?t:Jp,ring:t=>function(t){return{"--chakra-ring-offset-shadow":"var(--chakra-ring-inset) 0 0 0 var(--chakra-ring-offset-width) var(--chakra-ring-offset-color)","--chakra-ring-shadow":"var(--chakra-ring-inset) 0 0 0 calc(var(--chakra-ring-width) + var(--chakra-ring-offset-width)) var(--chakra-ring-color)","--chakra-ring-width":t,boxShadow:["var(--chakra-ring-offset-shadow)","var(--chakra-ring-shadow)","var(--chakra-shadow, 0 0 #0000)"].join(", ")}}(sg.px(t)),bgClip:t=>"text"===t?{color:"transparent",backgroundClip:"text"}:{backgroundClip:t},transform:t=>"auto"===t?["translateX(var(--chakra-translate-x, 0))","translateY(var(--chakra-translate-y, 0))",...Qp].join(" "):"auto-gpu"===t?["translate3d(var(--chakra-translate-x, 0), var(--chakra-translate-y, 0), 0)",...Qp].join(" "):t,vh:t=>"$100vh"===t?"var(--chakra-vh)":t,px(t){if(null==t)return t;const{unitless:e}=(t=>{const e=parseFloat(t.toString()),n=t.toString().replace(String(e),"");return{unitless:!n,value:e,unit:n}})(t);return e||"number"===typeof t?`${t}px`:t},fraction:t=>"number"!==typeof t||t>1?t:100*t+"%",float:(t,e)=>"rtl"===e.direction?{left:"right",right:"left"}[t]:t,degree(t){if(function(t){return/^var\(--.+\)$/.test(t)}(t)||null==t)return t;const e="string"===typeof t&&!t.endsWith("deg");return"number"===typeof t||e?`${t}deg`:t},gradient:(t,e)=>function(t,e){if(null==t||rg.has(t))return t;if(!og(t)&&!rg.has(t))return`url('${t}')`;const n=/(^[a-z-A-Z]+)\((.*)\)/g.exec(t),r=n?.[1],i=n?.[2];if(!r||!i)return t;const o=r.includes("-gradient")?r:`${r}-gradient`,[a,...s]=i.split(",").map(ig).filter(Boolean);if(0===s?.length)return t;const l=a in eg?eg[a]:a;s.unshift(l);const c=s.map((t=>{if(ng.has(t))return t;const n=t.indexOf(" "),[r,i]=-1!==n?[t.substr(0,n),t.substr(n+1)]:[t],o=og(i)?i:i&&i.split(" "),a=`colors.${r}`,s=a in e.__cssMap?e.__cssMap[a].varRef:r;return o?[s,...Array.isArray(o)?o:[o]].join(" "):s}));return`${o}(${c.join(", ")})`}(t,e??{}),blur:ag("blur"),opacity:ag("opacity"),brightness:ag("brightness"),contrast:ag("contrast"),dropShadow:ag("drop-shadow"),grayscale:ag("grayscale"),hueRotate:t=>ag("hue-rotate")(sg.degree(t)),invert:ag("invert"),saturate:ag("saturate"),sepia:ag("sepia"),bgImage(t){if(null==t)return t;return og(t)||rg.has(t)?t:`url(${t})`},outline(t){const e="0"===String(t)||"none"===String(t);return null!==t&&e?{outline:"2px solid transparent",outlineOffset:"2px"}:{outline:t}},flexDirection(t){const{space:e,divide:n}=tg[t]??{},r={flexDirection:t};return e&&(r[e]=1),n&&(r[n]=1),r}},lg={borderWidths:Kp("borderWidths"),borderStyles:Kp("borderStyles"),colors:Kp("colors"),borders:Kp("borders"),gradients:Kp("gradients",sg.gradient),radii:Kp("radii",sg.px),space:Kp("space",qp(sg.vh,sg.px)),spaceT:Kp("space",qp(sg.vh,sg.px)),degreeT:t=>({property:t,transform:sg.degree}),prop:(t,e,n)=>({property:t,scale:e,...e&&{transform:Yp({scale:e,transform:n})}}),propT:(t,e)=>({property:t,transform:e}),sizes:Kp("sizes",qp(sg.vh,sg.px)),sizesT:Kp("sizes",qp(sg.vh,sg.fraction)),shadows:Kp("shadows"),logical:function(t){const{property:e,scale:n,transform:r}=t;return{scale:n,property:Xp(e),transform:n?Yp({scale:n,compose:r}):r}},blur:Kp("blur",sg.blur)},cg={background:lg.colors("background"),backgroundColor:lg.colors("backgroundColor"),backgroundImage:lg.gradients("backgroundImage"),backgroundSize:!0,backgroundPosition:!0,backgroundRepeat:!0,backgroundAttachment:!0,backgroundClip:{transform:sg.bgClip},bgSize:lg.prop("backgroundSize"),bgPosition:lg.prop("backgroundPosition"),bg:lg.colors("background"),bgColor:lg.colors("backgroundColor"),bgPos:lg.prop("backgroundPosition"),bgRepeat:lg.prop("backgroundRepeat"),bgAttachment:lg.prop("backgroundAttachment"),bgGradient:lg.gradients("backgroundImage"),bgClip:{transform:sg.bgClip}};Object.assign(cg,{bgImage:cg.backgroundImage,bgImg:cg.backgroundImage});const ug={border:lg.borders("border"),borderWidth:lg.borderWidths("borderWidth"),borderStyle:lg.borderStyles("borderStyle"),borderColor:lg.colors("borderColor"),borderRadius:lg.radii("borderRadius"),borderTop:lg.borders("borderTop"),borderBlockStart:lg.borders("borderBlockStart"),borderTopLeftRadius:lg.radii("borderTopLeftRadius"),borderStartStartRadius:lg.logical({scale:"radii",property:{ltr:"borderTopLeftRadius",rtl:"borderTopRightRadius"}}),borderEndStartRadius:lg.logical({scale:"radii",property:{ltr:"borderBottomLeftRadius",rtl:"borderBottomRightRadius"}}),borderTopRightRadius:lg.radii("borderTopRightRadius"),borderStartEndRadius:lg.logical({scale:"radii",property:{ltr:"borderTopRightRadius",rtl:"borderTopLeftRadius"}}),borderEndEndRadius:lg.logical({scale:"radii",property:{ltr:"borderBottomRightRadius",rtl:"borderBottomLeftRadius"}}),borderRight:lg.borders("borderRight"),borderInlineEnd:lg.borders("borderInlineEnd"),borderBottom:lg.borders("borderBottom"),borderBlockEnd:lg.borders("borderBlockEnd"),borderBottomLeftRadius:lg.radii("borderBottomLeftRadius"),borderBottomRightRadius:lg.radii("borderBottomRightRadius"),borderLeft:lg.borders("borderLeft"),borderInlineStart:{property:"borderInlineStart",scale:"borders"},borderInlineStartRadius:lg.logical({scale:"radii",property:{ltr:["borderTopLeftRadius","borderBottomLeftRadius"],rtl:["borderTopRightRadius","borderBottomRightRadius"]}}),borderInlineEndRadius:lg.logical({scale:"radii",property:{ltr:["borderTopRightRadius","borderBottomRightRadius"],rtl:["borderTopLeftRadius","borderBottomLeftRadius"]}}),borderX:lg.borders(["borderLeft","borderRight"]),borderInline:lg.borders("borderInline"),borderY:lg.borders(["borderTop","borderBottom"]),borderBlock:lg.borders("borderBlock"),borderTopWidth:lg.borderWidths("borderTopWidth"),borderBlockStartWidth:lg.borderWidths("borderBlockStartWidth"),borderTopColor:lg.colors("borderTopColor"),borderBlockStartColor:lg.colors("borderBlockStartColor"),borderTopStyle:lg.borderStyles("borderTopStyle"),borderBlockStartStyle:lg.borderStyles("borderBlockStartStyle"),borderBottomWidth:lg.borderWidths("borderBottomWidth"),borderBlockEndWidth:lg.borderWidths("borderBlockEndWidth"),borderBottomColor:lg.colors("borderBottomColor"),borderBlockEndColor:lg.colors("borderBlockEndColor"),borderBottomStyle:lg.borderStyles("borderBottomStyle"),borderBlockEndStyle:lg.borderStyles("borderBlockEndStyle"),borderLeftWidth:lg.borderWidths("borderLeftWidth"),borderInlineStartWidth:lg.borderWidths("borderInlineStartWidth"),borderLeftColor:lg.colors("borderLeftColor"),borderInlineStartColor:lg.colors("borderInlineStartColor"),borderLeftStyle:lg.borderStyles("borderLeftStyle"),borderInlineStartStyle:lg.borderStyles("borderInlineStartStyle"),borderRightWidth:lg.borderWidths("borderRightWidth"),borderInlineEndWidth:lg.borderWidths("borderInlineEndWidth"),borderRightColor:lg.colors("borderRightColor"),borderInlineEndColor:lg.colors("borderInlineEndColor"),borderRightStyle:lg.borderStyles("borderRightStyle"),borderInlineEndStyle:lg.borderStyles("borderInlineEndStyle"),borderTopRadius:lg.radii(["borderTopLeftRadius","borderTopRightRadius"]),borderBottomRadius:lg.radii(["borderBottomLeftRadius","borderBottomRightRadius"]),borderLeftRadius:lg.radii(["borderTopLeftRadius","borderBottomLeftRadius"]),borderRightRadius:lg.radii(["borderTopRightRadius","borderBottomRightRadius"])};Object.assign(ug,{rounded:ug.borderRadius,roundedTop:ug.borderTopRadius,roundedTopLeft:ug.borderTopLeftRadius,roundedTopRight:ug.borderTopRightRadius,roundedTopStart:ug.borderStartStartRadius,roundedTopEnd:ug.borderStartEndRadius,roundedBottom:ug.borderBottomRadius,roundedBottomLeft:ug.borderBottomLeftRadius,roundedBottomRight:ug.borderBottomRightRadius,roundedBottomStart:ug.borderEndStartRadius,roundedBottomEnd:ug.borderEndEndRadius,roundedLeft:ug.borderLeftRadius,roundedRight:ug.borderRightRadius,roundedStart:ug.borderInlineStartRadius,roundedEnd:ug.borderInlineEndRadius,borderStart:ug.borderInlineStart,borderEnd:ug.borderInlineEnd,borderTopStartRadius:ug.borderStartStartRadius,borderTopEndRadius:ug.borderStartEndRadius,borderBottomStartRadius:ug.borderEndStartRadius,borderBottomEndRadius:ug.borderEndEndRadius,borderStartRadius:ug.borderInlineStartRadius,borderEndRadius:ug.borderInlineEndRadius,borderStartWidth:ug.borderInlineStartWidth,borderEndWidth:ug.borderInlineEndWidth,borderStartColor:ug.borderInlineStartColor,borderEndColor:ug.borderInlineEndColor,borderStartStyle:ug.borderInlineStartStyle,borderEndStyle:ug.borderInlineEndStyle});const dg={color:lg.colors("color"),textColor:lg.colors("color"),fill:lg.colors("fill"),stroke:lg.colors("stroke"),accentColor:lg.colors("accentColor"),textFillColor:lg.colors("textFillColor")},hg={alignItems:!0,alignContent:!0,justifyItems:!0,justifyContent:!0,flexWrap:!0,flexDirection:{transform:sg.flexDirection},flex:!0,flexFlow:!0,flexGrow:!0,flexShrink:!0,flexBasis:lg.sizes("flexBasis"),justifySelf:!0,alignSelf:!0,order:!0,placeItems:!0,placeContent:!0,placeSelf:!0,gap:lg.space("gap"),rowGap:lg.space("rowGap"),columnGap:lg.space("columnGap")};Object.assign(hg,{flexDir:hg.flexDirection});const fg={width:lg.sizesT("width"),inlineSize:lg.sizesT("inlineSize"),height:lg.sizes("height"),blockSize:lg.sizes("blockSize"),boxSize:lg.sizes(["width","height"]),minWidth:lg.sizes("minWidth"),minInlineSize:lg.sizes("minInlineSize"),minHeight:lg.sizes("minHeight"),minBlockSize:lg.sizes("minBlockSize"),maxWidth:lg.sizes("maxWidth"),maxInlineSize:lg.sizes("maxInlineSize"),maxHeight:lg.sizes("maxHeight"),maxBlockSize:lg.sizes("maxBlockSize"),overflow:!0,overflowX:!0,overflowY:!0,overscrollBehavior:!0,overscrollBehaviorX:!0,overscrollBehaviorY:!0,display:!0,aspectRatio:!0,hideFrom:{scale:"breakpoints",transform:(t,e)=>{const n=`@media screen and (min-width: ${e.__breakpoints?.get(t)?.minW??t})`;return{[n]:{display:"none"}}}},hideBelow:{scale:"breakpoints",transform:(t,e)=>{const n=`@media screen and (max-width: ${e.__breakpoints?.get(t)?._minW??t})`;return{[n]:{display:"none"}}}},verticalAlign:!0,boxSizing:!0,boxDecorationBreak:!0,float:lg.propT("float",sg.float),objectFit:!0,objectPosition:!0,visibility:!0,isolation:!0};Object.assign(fg,{w:fg.width,h:fg.height,minW:fg.minWidth,maxW:fg.maxWidth,minH:fg.minHeight,maxH:fg.maxHeight,overscroll:fg.overscrollBehavior,overscrollX:fg.overscrollBehaviorX,overscrollY:fg.overscrollBehaviorY});const pg={filter:{transform:sg.filter},blur:lg.blur("--chakra-blur"),brightness:lg.propT("--chakra-brightness",sg.brightness),contrast:lg.propT("--chakra-contrast",sg.contrast),hueRotate:lg.propT("--chakra-hue-rotate",sg.hueRotate),invert:lg.propT("--chakra-invert",sg.invert),saturate:lg.propT("--chakra-saturate",sg.saturate),dropShadow:lg.propT("--chakra-drop-shadow",sg.dropShadow),backdropFilter:{transform:sg.backdropFilter},backdropBlur:lg.blur("--chakra-backdrop-blur"),backdropBrightness:lg.propT("--chakra-backdrop-brightness",sg.brightness),backdropContrast:lg.propT("--chakra-backdrop-contrast",sg.contrast),backdropHueRotate:lg.propT("--chakra-backdrop-hue-rotate",sg.hueRotate),backdropInvert:lg.propT("--chakra-backdrop-invert",sg.invert),backdropSaturate:lg.propT("--chakra-backdrop-saturate",sg.saturate)},gg={ring:{transform:sg.ring},ringColor:lg.colors("--chakra-ring-color"),ringOffset:lg.prop("--chakra-ring-offset-width"),ringOffsetColor:lg.colors("--chakra-ring-offset-color"),ringInset:lg.prop("--chakra-ring-inset")},mg={appearance:!0,cursor:!0,resize:!0,userSelect:!0,pointerEvents:!0,outline:{transform:sg.outline},outlineOffset:!0,outlineColor:lg.colors("outlineColor")},yg={gridGap:lg.space("gridGap"),gridColumnGap:lg.space("gridColumnGap"),gridRowGap:lg.space("gridRowGap"),gridColumn:!0,gridRow:!0,gridAutoFlow:!0,gridAutoColumns:!0,gridColumnStart:!0,gridColumnEnd:!0,gridRowStart:!0,gridRowEnd:!0,gridAutoRows:!0,gridTemplate:!0,gridTemplateColumns:!0,gridTemplateRows:!0,gridTemplateAreas:!0,gridArea:!0};const bg=(t=>{const e=new WeakMap;return(n,r,i,o)=>{if("undefined"===typeof n)return t(n,r,i);e.has(n)||e.set(n,new Map);const a=e.get(n);if(a.has(r))return a.get(r);const s=t(n,r,i,o);return a.set(r,s),s}})((function(t,e,n,r){const i="string"===typeof e?e.split("."):[e];for(r=0;r<i.length&&t;r+=1)t=t[i[r]];return void 0===t?n:t})),vg={border:"0px",clip:"rect(0, 0, 0, 0)",width:"1px",height:"1px",margin:"-1px",padding:"0px",overflow:"hidden",whiteSpace:"nowrap",position:"absolute"},_g={position:"static",width:"auto",height:"auto",clip:"auto",padding:"0",margin:"0",overflow:"visible",whiteSpace:"normal"},wg=(t,e,n)=>{const r={},i=bg(t,e,{});for(const o in i){o in n&&null!=n[o]||(r[o]=i[o])}return r},xg={srOnly:{transform:t=>!0===t?vg:"focusable"===t?_g:{}},layerStyle:{processResult:!0,transform:(t,e,n)=>wg(e,`layerStyles.${t}`,n)},textStyle:{processResult:!0,transform:(t,e,n)=>wg(e,`textStyles.${t}`,n)},apply:{processResult:!0,transform:(t,e,n)=>wg(e,t,n)}},Sg={position:!0,pos:lg.prop("position"),zIndex:lg.prop("zIndex","zIndices"),inset:lg.spaceT("inset"),insetX:lg.spaceT(["left","right"]),insetInline:lg.spaceT("insetInline"),insetY:lg.spaceT(["top","bottom"]),insetBlock:lg.spaceT("insetBlock"),top:lg.spaceT("top"),insetBlockStart:lg.spaceT("insetBlockStart"),bottom:lg.spaceT("bottom"),insetBlockEnd:lg.spaceT("insetBlockEnd"),left:lg.spaceT("left"),insetInlineStart:lg.logical({scale:"space",property:{ltr:"left",rtl:"right"}}),right:lg.spaceT("right"),insetInlineEnd:lg.logical({scale:"space",property:{ltr:"right",rtl:"left"}})};Object.assign(Sg,{insetStart:Sg.insetInlineStart,insetEnd:Sg.insetInlineEnd});const kg={boxShadow:lg.shadows("boxShadow"),mixBlendMode:!0,blendMode:lg.prop("mixBlendMode"),backgroundBlendMode:!0,bgBlendMode:lg.prop("backgroundBlendMode"),opacity:!0};Object.assign(kg,{shadow:kg.boxShadow});const Cg={margin:lg.spaceT("margin"),marginTop:lg.spaceT("marginTop"),marginBlockStart:lg.spaceT("marginBlockStart"),marginRight:lg.spaceT("marginRight"),marginInlineEnd:lg.spaceT("marginInlineEnd"),marginBottom:lg.spaceT("marginBottom"),marginBlockEnd:lg.spaceT("marginBlockEnd"),marginLeft:lg.spaceT("marginLeft"),marginInlineStart:lg.spaceT("marginInlineStart"),marginX:lg.spaceT(["marginInlineStart","marginInlineEnd"]),marginInline:lg.spaceT("marginInline"),marginY:lg.spaceT(["marginTop","marginBottom"]),marginBlock:lg.spaceT("marginBlock"),padding:lg.space("padding"),paddingTop:lg.space("paddingTop"),paddingBlockStart:lg.space("paddingBlockStart"),paddingRight:lg.space("paddingRight"),paddingBottom:lg.space("paddingBottom"),paddingBlockEnd:lg.space("paddingBlockEnd"),paddingLeft:lg.space("paddingLeft"),paddingInlineStart:lg.space("paddingInlineStart"),paddingInlineEnd:lg.space("paddingInlineEnd"),paddingX:lg.space(["paddingInlineStart","paddingInlineEnd"]),paddingInline:lg.space("paddingInline"),paddingY:lg.space(["paddingTop","paddingBottom"]),paddingBlock:lg.space("paddingBlock")};Object.assign(Cg,{m:Cg.margin,mt:Cg.marginTop,mr:Cg.marginRight,me:Cg.marginInlineEnd,marginEnd:Cg.marginInlineEnd,mb:Cg.marginBottom,ml:Cg.marginLeft,ms:Cg.marginInlineStart,marginStart:Cg.marginInlineStart,mx:Cg.marginX,my:Cg.marginY,p:Cg.padding,pt:Cg.paddingTop,py:Cg.paddingY,px:Cg.paddingX,pb:Cg.paddingBottom,pl:Cg.paddingLeft,ps:Cg.paddingInlineStart,paddingStart:Cg.paddingInlineStart,pr:Cg.paddingRight,pe:Cg.paddingInlineEnd,paddingEnd:Cg.paddingInlineEnd});const Tg={scrollBehavior:!0,scrollSnapAlign:!0,scrollSnapStop:!0,scrollSnapType:!0,scrollMargin:lg.spaceT("scrollMargin"),scrollMarginTop:lg.spaceT("scrollMarginTop"),scrollMarginBottom:lg.spaceT("scrollMarginBottom"),scrollMarginLeft:lg.spaceT("scrollMarginLeft"),scrollMarginRight:lg.spaceT("scrollMarginRight"),scrollMarginX:lg.spaceT(["scrollMarginLeft","scrollMarginRight"]),scrollMarginY:lg.spaceT(["scrollMarginTop","scrollMarginBottom"]),scrollPadding:lg.spaceT("scrollPadding"),scrollPaddingTop:lg.spaceT("scrollPaddingTop"),scrollPaddingBottom:lg.spaceT("scrollPaddingBottom"),scrollPaddingLeft:lg.spaceT("scrollPaddingLeft"),scrollPaddingRight:lg.spaceT("scrollPaddingRight"),scrollPaddingX:lg.spaceT(["scrollPaddingLeft","scrollPaddingRight"]),scrollPaddingY:lg.spaceT(["scrollPaddingTop","scrollPaddingBottom"])},Pg={fontFamily:lg.prop("fontFamily","fonts"),fontSize:lg.prop("fontSize","fontSizes",sg.px),fontWeight:lg.prop("fontWeight","fontWeights"),lineHeight:lg.prop("lineHeight","lineHeights"),letterSpacing:lg.prop("letterSpacing","letterSpacings"),textAlign:!0,fontStyle:!0,textIndent:!0,wordBreak:!0,overflowWrap:!0,textOverflow:!0,textTransform:!0,whiteSpace:!0,isTruncated:{transform(t){if(!0===t)return{overflow:"hidden",textOverflow:"ellipsis",whiteSpace:"nowrap"}}},noOfLines:{static:{overflow:"hidden",textOverflow:"ellipsis",display:"-webkit-box",WebkitBoxOrient:"vertical",WebkitLineClamp:"var(--chakra-line-clamp)"},property:"--chakra-line-clamp"}},Eg={textDecorationColor:lg.colors("textDecorationColor"),textDecoration:!0,textDecor:{property:"textDecoration"},textDecorationLine:!0,textDecorationStyle:!0,textDecorationThickness:!0,textUnderlineOffset:!0,textShadow:lg.shadows("textShadow")},Ag={clipPath:!0,transform:lg.propT("transform",sg.transform),transformOrigin:!0,translateX:lg.spaceT("--chakra-translate-x"),translateY:lg.spaceT("--chakra-translate-y"),skewX:lg.degreeT("--chakra-skew-x"),skewY:lg.degreeT("--chakra-skew-y"),scaleX:lg.prop("--chakra-scale-x"),scaleY:lg.prop("--chakra-scale-y"),scale:lg.prop(["--chakra-scale-x","--chakra-scale-y"]),rotate:lg.degreeT("--chakra-rotate")},Ig={listStyleType:!0,listStylePosition:!0,listStylePos:lg.prop("listStylePosition"),listStyleImage:!0,listStyleImg:lg.prop("listStyleImage")},Mg={transition:!0,transitionDelay:!0,animation:!0,willChange:!0,transitionDuration:lg.prop("transitionDuration","transition.duration"),transitionProperty:lg.prop("transitionProperty","transition.property"),transitionTimingFunction:lg.prop("transitionTimingFunction","transition.easing")},Fg=kp({},cg,ug,dg,hg,fg,pg,gg,mg,yg,xg,Sg,kg,Cg,Tg,Pg,Eg,Ag,Ig,Mg),Dg=Object.assign({},Cg,fg,hg,yg,Sg),Rg=(Object.keys(Dg),[...Object.keys(Fg),...jp]),Og={...Fg,...zp},Ng=t=>t in Og;const Lg=(t,e)=>t.startsWith("--")&&"string"===typeof e&&!function(t){return/^var\(--.+\)$/.test(t)}(e),Bg=(t,e)=>{if(null==e)return e;const n=e=>t.__cssMap?.[e]?.varRef,r=t=>n(t)??t,[i,o]=function(t){const e=[];let n="",r=!1;for(let i=0;i<t.length;i++){const o=t[i];"("===o?(r=!0,n+=o):")"===o?(r=!1,n+=o):","!==o||r?n+=o:(e.push(n),n="")}return n=n.trim(),n&&e.push(n),e}(e);return e=n(i)??r(o)??r(e)};function zg(t){const{configs:e={},pseudos:n={},theme:r}=t,i=function(t){let o=arguments.length>1&&void 0!==arguments[1]&&arguments[1];const a=Gp(t,r),s=(t=>e=>{if(!e.__breakpoints)return t;const{isResponsive:n,toArrayValue:r,media:i}=e.__breakpoints,o={};for(const a in t){let s=Gp(t[a],e);if(null==s)continue;if(s=Nc(s)&&n(s)?r(s):s,!Array.isArray(s)){o[a]=s;continue}const l=s.slice(0,i.length).length;for(let t=0;t<l;t+=1){const e=i?.[t];e?(o[e]=o[e]||{},null!=s[t]&&(o[e][a]=s[t])):o[a]=s[t]}}return o})(a)(r);let l={};for(let c in s){let t=Gp(s[c],r);c in n&&(c=n[c]),Lg(c,t)&&(t=Bg(r,t));let u=e[c];if(!0===u&&(u={property:c}),Nc(t)){l[c]=l[c]??{},l[c]=kp({},l[c],i(t,!0));continue}let d=u?.transform?.(t,r,a)??t;d=u?.processResult?i(d,!0):d;const h=Gp(u?.property,r);if(!o&&u?.static){const t=Gp(u.static,r);l=kp({},l,t)}if(h&&Array.isArray(h))for(const e of h)l[e]=d;else h?"&"===h&&Nc(d)?l=kp({},l,d):l[h]=d:Nc(d)?l=kp({},l,d):l[c]=d}return l};return i}const jg=t=>e=>zg({theme:e,pseudos:zp,configs:Fg})(t);function Ug(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const{name:e,strict:n=!0,hookName:r="useContext",providerName:i="Provider",errorMessage:o,defaultValue:a}=t,s=(0,d.createContext)(a);return s.displayName=e,[s.Provider,function t(){const e=(0,d.useContext)(s);if(!e&&n){const e=new Error(o??`${r} returned \`undefined\`. Seems you forgot to wrap component within ${i}`);throw e.name="ContextError",Error.captureStackTrace?.(e,t),e}return e},s]}const Vg=(t=>{const e=new WeakMap;return(n,r,i,o)=>{if("undefined"===typeof n)return t(n,r,i);e.has(n)||e.set(n,new Map);const a=e.get(n);if(a.has(r))return a.get(r);const s=t(n,r,i,o);return a.set(r,s),s}})((function(t,e,n,r){const i="string"===typeof e?e.split("."):[e];for(r=0;r<i.length&&t;r+=1)t=t[i[r]];return void 0===t?n:t}));function $g(t){const{cssVarsRoot:e,theme:n,children:r}=t,i=(0,d.useMemo)((()=>function(t){const e=function(t){const{__cssMap:e,__cssVars:n,__breakpoints:r,...i}=t;return i}(t),{cssMap:n,cssVars:r}=Wp(e);return Object.assign(e,{__cssVars:{"--chakra-ring-inset":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-ring-offset-width":"0px","--chakra-ring-offset-color":"#fff","--chakra-ring-color":"rgba(66, 153, 225, 0.6)","--chakra-ring-offset-shadow":"0 0 #0000","--chakra-ring-shadow":"0 0 #0000","--chakra-space-x-reverse":"0","--chakra-space-y-reverse":"0",...r},__cssMap:n,__breakpoints:Sp(e.breakpoints)}),e}(n)),[n]);return(0,yh.jsxs)(Gf,{theme:i,children:[(0,yh.jsx)(Wg,{root:e}),r]})}function Wg(t){let{root:e=":host, :root"}=t;const n=[e,"[data-theme]"].join(",");return(0,yh.jsx)(up,{styles:t=>({[n]:t.__cssVars})})}const[Gg,Hg]=Ug({name:"StylesContext",errorMessage:"useStyles: `styles` is undefined. Seems you forgot to wrap the components in `<StylesProvider />` "});function Yg(){const{colorMode:t}=Qf();return(0,yh.jsx)(up,{styles:e=>{const n=Gp(Vg(e,"styles.global"),{theme:e,colorMode:t});if(!n)return;return jg(n)(e)}})}const[qg,Kg]=Ug({strict:!1,name:"PortalManagerContext"});function Xg(t){const{children:e,zIndex:n}=t;return(0,yh.jsx)(qg,{value:{zIndex:n},children:e})}Xg.displayName="PortalManager";const Qg=(0,d.createContext)({getDocument:()=>document,getWindow:()=>window});function Zg(t){const{children:e,environment:n,disabled:r}=t,i=(0,d.useRef)(null),o=(0,d.useMemo)((()=>n||{getDocument:()=>i.current?.ownerDocument??document,getWindow:()=>i.current?.ownerDocument.defaultView??window}),[n]),a=!r||!n;return(0,yh.jsxs)(Qg.Provider,{value:o,children:[e,a&&(0,yh.jsx)("span",{id:"__chakra_env",hidden:!0,ref:i})]})}Qg.displayName="EnvironmentContext",Zg.displayName="EnvironmentProvider";const Jg=t=>{const{children:e,colorModeManager:n,portalZIndex:r,resetScope:i,resetCSS:o=!0,theme:a={},environment:s,cssVarsRoot:l,disableEnvironment:c,disableGlobalStyle:u}=t,d=(0,yh.jsx)(Zg,{environment:s,disabled:c,children:e});return(0,yh.jsx)($g,{theme:a,cssVarsRoot:l,children:(0,yh.jsxs)(lp,{colorModeManager:n,options:a.config,children:[o?(0,yh.jsx)(gp,{scope:i}):(0,yh.jsx)(pp,{}),!u&&(0,yh.jsx)(Yg,{}),r?(0,yh.jsx)(Xg,{zIndex:r,children:d}):d]})})},tm="undefined"!==typeof document,em=tm?d.useLayoutEffect:d.useEffect;function nm(){const t=(0,d.useRef)(!1);return em((()=>(t.current=!0,()=>{t.current=!1})),[]),t}const rm=t=>t;class im{constructor(){this.order=[],this.scheduled=new Set}add(t){if(!this.scheduled.has(t))return this.scheduled.add(t),this.order.push(t),!0}remove(t){const e=this.order.indexOf(t);-1!==e&&(this.order.splice(e,1),this.scheduled.delete(t))}clear(){this.order.length=0,this.scheduled.clear()}}const om=["prepare","read","update","preRender","render","postRender"];const{schedule:am,cancel:sm,state:lm,steps:cm}=function(t,e){let n=!1,r=!0;const i={delta:0,timestamp:0,isProcessing:!1},o=om.reduce(((t,e)=>(t[e]=function(t){let e=new im,n=new im,r=0,i=!1,o=!1;const a=new WeakSet,s={schedule:function(t){const o=arguments.length>2&&void 0!==arguments[2]&&arguments[2]&&i,s=o?e:n;return arguments.length>1&&void 0!==arguments[1]&&arguments[1]&&a.add(t),s.add(t)&&o&&i&&(r=e.order.length),t},cancel:t=>{n.remove(t),a.delete(t)},process:l=>{if(i)o=!0;else{if(i=!0,[e,n]=[n,e],n.clear(),r=e.order.length,r)for(let n=0;n<r;n++){const r=e.order[n];r(l),a.has(r)&&(s.schedule(r),t())}i=!1,o&&(o=!1,s.process(l))}}};return s}((()=>n=!0)),t)),{}),a=t=>o[t].process(i),s=()=>{const o=performance.now();n=!1,i.delta=r?1e3/60:Math.max(Math.min(o-i.timestamp,40),1),i.timestamp=o,i.isProcessing=!0,om.forEach(a),i.isProcessing=!1,n&&e&&(r=!1,t(s))},l=om.reduce(((e,a)=>{const l=o[a];return e[a]=function(e){let o=arguments.length>1&&void 0!==arguments[1]&&arguments[1],a=arguments.length>2&&void 0!==arguments[2]&&arguments[2];return n||(n=!0,r=!0,i.isProcessing||t(s)),l.schedule(e,o,a)},e}),{});return{schedule:l,cancel:t=>om.forEach((e=>o[e].cancel(t))),state:i,steps:o}}("undefined"!==typeof requestAnimationFrame?requestAnimationFrame:rm,!0);const um=(0,d.createContext)(null);function dm(t){const e=(0,d.useRef)(null);return null===e.current&&(e.current=t()),e.current}class hm extends d.Component{getSnapshotBeforeUpdate(t){const e=this.props.childRef.current;if(e&&t.isPresent&&!this.props.isPresent){const t=this.props.sizeRef.current;t.height=e.offsetHeight||0,t.width=e.offsetWidth||0,t.top=e.offsetTop,t.left=e.offsetLeft}return null}componentDidUpdate(){}render(){return this.props.children}}function fm(t){let{children:e,isPresent:n}=t;const r=(0,d.useId)(),i=(0,d.useRef)(null),o=(0,d.useRef)({width:0,height:0,top:0,left:0});return(0,d.useInsertionEffect)((()=>{const{width:t,height:e,top:a,left:s}=o.current;if(n||!i.current||!t||!e)return;i.current.dataset.motionPopId=r;const l=document.createElement("style");return document.head.appendChild(l),l.sheet&&l.sheet.insertRule(`\n          [data-motion-pop-id="${r}"] {\n            position: absolute !important;\n            width: ${t}px !important;\n            height: ${e}px !important;\n            top: ${a}px !important;\n            left: ${s}px !important;\n          }\n        `),()=>{document.head.removeChild(l)}}),[n]),d.createElement(hm,{isPresent:n,childRef:i,sizeRef:o},d.cloneElement(e,{ref:i}))}const pm=t=>{let{children:e,initial:n,isPresent:r,onExitComplete:i,custom:o,presenceAffectsLayout:a,mode:s}=t;const l=dm(gm),c=(0,d.useId)(),u=(0,d.useMemo)((()=>({id:c,initial:n,isPresent:r,custom:o,onExitComplete:t=>{l.set(t,!0);for(const e of l.values())if(!e)return;i&&i()},register:t=>(l.set(t,!1),()=>l.delete(t))})),a?void 0:[r]);return(0,d.useMemo)((()=>{l.forEach(((t,e)=>l.set(e,!1)))}),[r]),d.useEffect((()=>{!r&&!l.size&&i&&i()}),[r]),"popLayout"===s&&(e=d.createElement(fm,{isPresent:r},e)),d.createElement(um.Provider,{value:u},e)};function gm(){return new Map}const mm=(0,d.createContext)({});let ym=rm,bm=rm;const vm=t=>t.key||"";const _m=t=>{let{children:e,custom:n,initial:r=!0,onExitComplete:i,exitBeforeEnter:o,presenceAffectsLayout:a=!0,mode:s="sync"}=t;bm(!o,"Replace exitBeforeEnter with mode='wait'");const l=(0,d.useContext)(mm).forceRender||function(){const t=nm(),[e,n]=(0,d.useState)(0),r=(0,d.useCallback)((()=>{t.current&&n(e+1)}),[e]);return[(0,d.useCallback)((()=>am.postRender(r)),[r]),e]}()[0],c=nm(),u=function(t){const e=[];return d.Children.forEach(t,(t=>{(0,d.isValidElement)(t)&&e.push(t)})),e}(e);let h=u;const f=(0,d.useRef)(new Map).current,p=(0,d.useRef)(h),g=(0,d.useRef)(new Map).current,m=(0,d.useRef)(!0);var y;if(em((()=>{m.current=!1,function(t,e){t.forEach((t=>{const n=vm(t);e.set(n,t)}))}(u,g),p.current=h})),y=()=>{m.current=!0,g.clear(),f.clear()},(0,d.useEffect)((()=>()=>y()),[]),m.current)return d.createElement(d.Fragment,null,h.map((t=>d.createElement(pm,{key:vm(t),isPresent:!0,initial:!!r&&void 0,presenceAffectsLayout:a,mode:s},t))));h=[...h];const b=p.current.map(vm),v=u.map(vm),_=b.length;for(let d=0;d<_;d++){const t=b[d];-1!==v.indexOf(t)||f.has(t)||f.set(t,void 0)}return"wait"===s&&f.size&&(h=[]),f.forEach(((t,e)=>{if(-1!==v.indexOf(e))return;const r=g.get(e);if(!r)return;const o=b.indexOf(e);let m=t;if(!m){const t=()=>{f.delete(e);const t=Array.from(g.keys()).filter((t=>!v.includes(t)));if(t.forEach((t=>g.delete(t))),p.current=u.filter((n=>{const r=vm(n);return r===e||t.includes(r)})),!f.size){if(!1===c.current)return;l(),i&&i()}};m=d.createElement(pm,{key:vm(r),isPresent:!1,onExitComplete:t,custom:n,presenceAffectsLayout:a,mode:s},r),f.set(e,m)}h.splice(o,0,m)})),h=h.map((t=>{const e=t.key;return f.has(e)?t:d.createElement(pm,{key:vm(t),isPresent:!0,presenceAffectsLayout:a,mode:s},t)})),d.createElement(d.Fragment,null,f.size?h:h.map((t=>(0,d.cloneElement)(t))))},wm=(t,e)=>{const n=(0,d.useRef)(!1),r=(0,d.useRef)(!1);(0,d.useEffect)((()=>{if(n.current&&r.current)return t();r.current=!0}),e),(0,d.useEffect)((()=>(n.current=!0,()=>{n.current=!1})),[])};function xm(t,e){const n=function(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[];const n=(0,d.useRef)(t);return(0,d.useEffect)((()=>{n.current=t})),(0,d.useCallback)((function(){for(var t=arguments.length,e=new Array(t),r=0;r<t;r++)e[r]=arguments[r];return n.current?.(...e)}),e)}(t);(0,d.useEffect)((()=>{if(null==e)return;let t=null;return t=window.setTimeout((()=>{n()}),e),()=>{t&&window.clearTimeout(t)}}),[e,n])}function Sm(){return null===(t=(0,d.useContext)(um))||t.isPresent;var t}const km=(0,d.createContext)({transformPagePoint:t=>t,isStatic:!1,reducedMotion:"never"}),Cm=(0,d.createContext)({}),Tm=(0,d.createContext)({strict:!1}),Pm=t=>t.replace(/([a-z])([A-Z])/g,"$1-$2").toLowerCase(),Em="data-"+Pm("framerAppearId");function Am(t){return t&&"object"===typeof t&&Object.prototype.hasOwnProperty.call(t,"current")}function Im(t){return"string"===typeof t||Array.isArray(t)}function Mm(t){return null!==t&&"object"===typeof t&&"function"===typeof t.start}const Fm=["animate","whileInView","whileFocus","whileHover","whileTap","whileDrag","exit"],Dm=["initial",...Fm];function Rm(t){return Mm(t.animate)||Dm.some((e=>Im(t[e])))}function Om(t){return Boolean(Rm(t)||t.variants)}function Nm(t){const{initial:e,animate:n}=function(t,e){if(Rm(t)){const{initial:e,animate:n}=t;return{initial:!1===e||Im(e)?e:void 0,animate:Im(n)?n:void 0}}return!1!==t.inherit?e:{}}(t,(0,d.useContext)(Cm));return(0,d.useMemo)((()=>({initial:e,animate:n})),[Lm(e),Lm(n)])}function Lm(t){return Array.isArray(t)?t.join(" "):t}const Bm={animation:["animate","variants","whileHover","whileTap","exit","whileInView","whileFocus","whileDrag"],exit:["exit"],drag:["drag","dragControls"],focus:["whileFocus"],hover:["whileHover","onHoverStart","onHoverEnd"],tap:["whileTap","onTap","onTapStart","onTapCancel"],pan:["onPan","onPanStart","onPanSessionStart","onPanEnd"],inView:["whileInView","onViewportEnter","onViewportLeave"],layout:["layout","layoutId"]},zm={};for(const n in Bm)zm[n]={isEnabled:t=>Bm[n].some((e=>!!t[e]))};const jm=(0,d.createContext)({}),Um=Symbol.for("motionComponentSymbol");function Vm(t){let{preloadedFeatures:e,createVisualElement:n,useRender:r,useVisualState:i,Component:o}=t;e&&function(t){for(const e in t)zm[e]={...zm[e],...t[e]}}(e);const a=(0,d.forwardRef)((function(t,a){let s;const l={...(0,d.useContext)(km),...t,layoutId:$m(t)},{isStatic:c}=l,u=Nm(t),h=i(t,c);if(!c&&tm){u.visualElement=function(t,e,n,r){const{visualElement:i}=(0,d.useContext)(Cm),o=(0,d.useContext)(Tm),a=(0,d.useContext)(um),s=(0,d.useContext)(km).reducedMotion,l=(0,d.useRef)();r=r||o.renderer,!l.current&&r&&(l.current=r(t,{visualState:e,parent:i,props:n,presenceContext:a,blockInitialAnimation:!!a&&!1===a.initial,reducedMotionConfig:s}));const c=l.current;(0,d.useInsertionEffect)((()=>{c&&c.update(n,a)}));const u=(0,d.useRef)(Boolean(n[Em]&&!window.HandoffComplete));return em((()=>{c&&(c.render(),u.current&&c.animationState&&c.animationState.animateChanges())})),(0,d.useEffect)((()=>{c&&(c.updateFeatures(),!u.current&&c.animationState&&c.animationState.animateChanges(),u.current&&(u.current=!1,window.HandoffComplete=!0))})),c}(o,h,l,n);const t=(0,d.useContext)(jm),r=(0,d.useContext)(Tm).strict;u.visualElement&&(s=u.visualElement.loadFeatures(l,r,e,t))}return d.createElement(Cm.Provider,{value:u},s&&u.visualElement?d.createElement(s,{visualElement:u.visualElement,...l}):null,r(o,t,function(t,e,n){return(0,d.useCallback)((r=>{r&&t.mount&&t.mount(r),e&&(r?e.mount(r):e.unmount()),n&&("function"===typeof n?n(r):Am(n)&&(n.current=r))}),[e])}(h,u.visualElement,a),h,c,u.visualElement))}));return a[Um]=o,a}function $m(t){let{layoutId:e}=t;const n=(0,d.useContext)(mm).id;return n&&void 0!==e?n+"-"+e:e}function Wm(t){function e(e){return Vm(t(e,arguments.length>1&&void 0!==arguments[1]?arguments[1]:{}))}if("undefined"===typeof Proxy)return e;const n=new Map;return new Proxy(e,{get:(t,r)=>(n.has(r)||n.set(r,e(r)),n.get(r))})}const Gm=["animate","circle","defs","desc","ellipse","g","image","line","filter","marker","mask","metadata","path","pattern","polygon","polyline","rect","stop","switch","symbol","svg","text","tspan","use","view"];function Hm(t){return"string"===typeof t&&!t.includes("-")&&!!(Gm.indexOf(t)>-1||/[A-Z]/.test(t))}const Ym={};const qm=["transformPerspective","x","y","z","translateX","translateY","translateZ","scale","scaleX","scaleY","rotate","rotateX","rotateY","rotateZ","skew","skewX","skewY"],Km=new Set(qm);function Xm(t,e){let{layout:n,layoutId:r}=e;return Km.has(t)||t.startsWith("origin")||(n||void 0!==r)&&(!!Ym[t]||"opacity"===t)}const Qm=t=>Boolean(t&&t.getVelocity),Zm={x:"translateX",y:"translateY",z:"translateZ",transformPerspective:"perspective"},Jm=qm.length;const ty=t=>e=>"string"===typeof e&&e.startsWith(t),ey=ty("--"),ny=ty("var(--"),ry=(t,e)=>e&&"number"===typeof t?e.transform(t):t,iy=(t,e,n)=>Math.min(Math.max(n,t),e),oy={test:t=>"number"===typeof t,parse:parseFloat,transform:t=>t},ay={...oy,transform:t=>iy(0,1,t)},sy={...oy,default:1},ly=t=>Math.round(1e5*t)/1e5,cy=/(-)?([\d]*\.?[\d])+/g,uy=/(#[0-9a-f]{3,8}|(rgb|hsl)a?\((-?[\d\.]+%?[,\s]+){2}(-?[\d\.]+%?)\s*[\,\/]?\s*[\d\.]*%?\))/gi,dy=/^(#[0-9a-f]{3,8}|(rgb|hsl)a?\((-?[\d\.]+%?[,\s]+){2}(-?[\d\.]+%?)\s*[\,\/]?\s*[\d\.]*%?\))$/i;function hy(t){return"string"===typeof t}const fy=t=>({test:e=>hy(e)&&e.endsWith(t)&&1===e.split(" ").length,parse:parseFloat,transform:e=>`${e}${t}`}),py=fy("deg"),gy=fy("%"),my=fy("px"),yy=fy("vh"),by=fy("vw"),vy={...gy,parse:t=>gy.parse(t)/100,transform:t=>gy.transform(100*t)},_y={...oy,transform:Math.round},wy={borderWidth:my,borderTopWidth:my,borderRightWidth:my,borderBottomWidth:my,borderLeftWidth:my,borderRadius:my,radius:my,borderTopLeftRadius:my,borderTopRightRadius:my,borderBottomRightRadius:my,borderBottomLeftRadius:my,width:my,maxWidth:my,height:my,maxHeight:my,size:my,top:my,right:my,bottom:my,left:my,padding:my,paddingTop:my,paddingRight:my,paddingBottom:my,paddingLeft:my,margin:my,marginTop:my,marginRight:my,marginBottom:my,marginLeft:my,rotate:py,rotateX:py,rotateY:py,rotateZ:py,scale:sy,scaleX:sy,scaleY:sy,scaleZ:sy,skew:py,skewX:py,skewY:py,distance:my,translateX:my,translateY:my,translateZ:my,x:my,y:my,z:my,perspective:my,transformPerspective:my,opacity:ay,originX:vy,originY:vy,originZ:my,zIndex:_y,fillOpacity:ay,strokeOpacity:ay,numOctaves:_y};function xy(t,e,n,r){const{style:i,vars:o,transform:a,transformOrigin:s}=t;let l=!1,c=!1,u=!0;for(const d in e){const t=e[d];if(ey(d)){o[d]=t;continue}const n=wy[d],r=ry(t,n);if(Km.has(d)){if(l=!0,a[d]=r,!u)continue;t!==(n.default||0)&&(u=!1)}else d.startsWith("origin")?(c=!0,s[d]=r):i[d]=r}if(e.transform||(l||r?i.transform=function(t,e,n,r){let{enableHardwareAcceleration:i=!0,allowTransformNone:o=!0}=e,a="";for(let s=0;s<Jm;s++){const e=qm[s];void 0!==t[e]&&(a+=`${Zm[e]||e}(${t[e]}) `)}return i&&!t.z&&(a+="translateZ(0)"),a=a.trim(),r?a=r(t,n?"":a):o&&n&&(a="none"),a}(t.transform,n,u,r):i.transform&&(i.transform="none")),c){const{originX:t="50%",originY:e="50%",originZ:n=0}=s;i.transformOrigin=`${t} ${e} ${n}`}}const Sy=()=>({style:{},transform:{},transformOrigin:{},vars:{}});function ky(t,e,n){for(const r in e)Qm(e[r])||Xm(r,n)||(t[r]=e[r])}function Cy(t,e,n){const r={};return ky(r,t.style||{},t),Object.assign(r,function(t,e,n){let{transformTemplate:r}=t;return(0,d.useMemo)((()=>{const t={style:{},transform:{},transformOrigin:{},vars:{}};return xy(t,e,{enableHardwareAcceleration:!n},r),Object.assign({},t.vars,t.style)}),[e])}(t,e,n)),t.transformValues?t.transformValues(r):r}function Ty(t,e,n){const r={},i=Cy(t,e,n);return t.drag&&!1!==t.dragListener&&(r.draggable=!1,i.userSelect=i.WebkitUserSelect=i.WebkitTouchCallout="none",i.touchAction=!0===t.drag?"none":"pan-"+("x"===t.drag?"y":"x")),void 0===t.tabIndex&&(t.onTap||t.onTapStart||t.whileTap)&&(r.tabIndex=0),r.style=i,r}const Py=new Set(["animate","exit","variants","initial","style","values","variants","transition","transformTemplate","transformValues","custom","inherit","onBeforeLayoutMeasure","onAnimationStart","onAnimationComplete","onUpdate","onDragStart","onDrag","onDragEnd","onMeasureDragConstraints","onDirectionLock","onDragTransitionEnd","_dragX","_dragY","onHoverStart","onHoverEnd","onViewportEnter","onViewportLeave","globalTapTarget","ignoreStrict","viewport"]);function Ey(t){return t.startsWith("while")||t.startsWith("drag")&&"draggable"!==t||t.startsWith("layout")||t.startsWith("onTap")||t.startsWith("onPan")||t.startsWith("onLayout")||Py.has(t)}let Ay=t=>!Ey(t);try{(Iy=require("@emotion/is-prop-valid").default)&&(Ay=t=>t.startsWith("on")?!Ey(t):Iy(t))}catch(pt){}var Iy;function My(t,e,n){return"string"===typeof t?t:my.transform(e+n*t)}const Fy={offset:"stroke-dashoffset",array:"stroke-dasharray"},Dy={offset:"strokeDashoffset",array:"strokeDasharray"};function Ry(t,e,n,r,i){let{attrX:o,attrY:a,attrScale:s,originX:l,originY:c,pathLength:u,pathSpacing:d=1,pathOffset:h=0,...f}=e;if(xy(t,f,n,i),r)return void(t.style.viewBox&&(t.attrs.viewBox=t.style.viewBox));t.attrs=t.style,t.style={};const{attrs:p,style:g,dimensions:m}=t;p.transform&&(m&&(g.transform=p.transform),delete p.transform),m&&(void 0!==l||void 0!==c||g.transform)&&(g.transformOrigin=function(t,e,n){return`${My(e,t.x,t.width)} ${My(n,t.y,t.height)}`}(m,void 0!==l?l:.5,void 0!==c?c:.5)),void 0!==o&&(p.x=o),void 0!==a&&(p.y=a),void 0!==s&&(p.scale=s),void 0!==u&&function(t,e){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:1,r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:0,i=!(arguments.length>4&&void 0!==arguments[4])||arguments[4];t.pathLength=1;const o=i?Fy:Dy;t[o.offset]=my.transform(-r);const a=my.transform(e),s=my.transform(n);t[o.array]=`${a} ${s}`}(p,u,d,h,!1)}const Oy=()=>({style:{},transform:{},transformOrigin:{},vars:{},attrs:{}}),Ny=t=>"string"===typeof t&&"svg"===t.toLowerCase();function Ly(t,e,n,r){const i=(0,d.useMemo)((()=>{const n={style:{},transform:{},transformOrigin:{},vars:{},attrs:{}};return Ry(n,e,{enableHardwareAcceleration:!1},Ny(r),t.transformTemplate),{...n.attrs,style:{...n.style}}}),[e]);if(t.style){const e={};ky(e,t.style,t),i.style={...e,...i.style}}return i}function By(){let t=arguments.length>0&&void 0!==arguments[0]&&arguments[0];return(e,n,r,i,o)=>{let{latestValues:a}=i;const s=(Hm(e)?Ly:Ty)(n,a,o,e),l=function(t,e,n){const r={};for(const i in t)"values"===i&&"object"===typeof t.values||(Ay(i)||!0===n&&Ey(i)||!e&&!Ey(i)||t.draggable&&i.startsWith("onDrag"))&&(r[i]=t[i]);return r}(n,"string"===typeof e,t),c={...l,...s,ref:r},{children:u}=n,h=(0,d.useMemo)((()=>Qm(u)?u.get():u),[u]);return(0,d.createElement)(e,{...c,children:h})}}function zy(t,e,n,r){let{style:i,vars:o}=e;Object.assign(t.style,i,r&&r.getProjectionStyles(n));for(const a in o)t.style.setProperty(a,o[a])}const jy=new Set(["baseFrequency","diffuseConstant","kernelMatrix","kernelUnitLength","keySplines","keyTimes","limitingConeAngle","markerHeight","markerWidth","numOctaves","targetX","targetY","surfaceScale","specularConstant","specularExponent","stdDeviation","tableValues","viewBox","gradientTransform","pathLength","startOffset","textLength","lengthAdjust"]);function Uy(t,e,n,r){zy(t,e,void 0,r);for(const i in e.attrs)t.setAttribute(jy.has(i)?i:Pm(i),e.attrs[i])}function Vy(t,e){const{style:n}=t,r={};for(const i in n)(Qm(n[i])||e.style&&Qm(e.style[i])||Xm(i,t))&&(r[i]=n[i]);return r}function $y(t,e){const n=Vy(t,e);for(const r in t)if(Qm(t[r])||Qm(e[r])){n[-1!==qm.indexOf(r)?"attr"+r.charAt(0).toUpperCase()+r.substring(1):r]=t[r]}return n}function Wy(t,e,n){let r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{},i=arguments.length>4&&void 0!==arguments[4]?arguments[4]:{};return"function"===typeof e&&(e=e(void 0!==n?n:t.custom,r,i)),"string"===typeof e&&(e=t.variants&&t.variants[e]),"function"===typeof e&&(e=e(void 0!==n?n:t.custom,r,i)),e}const Gy=t=>Array.isArray(t);function Hy(t){const e=Qm(t)?t.get():t;return n=e,Boolean(n&&"object"===typeof n&&n.mix&&n.toValue)?e.toValue():e;var n}const Yy=t=>(e,n)=>{const r=(0,d.useContext)(Cm),i=(0,d.useContext)(um),o=()=>function(t,e,n,r){let{scrapeMotionValuesFromProps:i,createRenderState:o,onMount:a}=t;const s={latestValues:qy(e,n,r,i),renderState:o()};return a&&(s.mount=t=>a(e,t,s)),s}(t,e,r,i);return n?o():dm(o)};function qy(t,e,n,r){const i={},o=r(t,{});for(const h in o)i[h]=Hy(o[h]);let{initial:a,animate:s}=t;const l=Rm(t),c=Om(t);e&&c&&!l&&!1!==t.inherit&&(void 0===a&&(a=e.initial),void 0===s&&(s=e.animate));let u=!!n&&!1===n.initial;u=u||!1===a;const d=u?s:a;if(d&&"boolean"!==typeof d&&!Mm(d)){(Array.isArray(d)?d:[d]).forEach((e=>{const n=Wy(t,e);if(!n)return;const{transitionEnd:r,transition:o,...a}=n;for(const t in a){let e=a[t];if(Array.isArray(e)){e=e[u?e.length-1:0]}null!==e&&(i[t]=e)}for(const t in r)i[t]=r[t]}))}return i}const Ky={useVisualState:Yy({scrapeMotionValuesFromProps:$y,createRenderState:Oy,onMount:(t,e,n)=>{let{renderState:r,latestValues:i}=n;am.read((()=>{try{r.dimensions="function"===typeof e.getBBox?e.getBBox():e.getBoundingClientRect()}catch(t){r.dimensions={x:0,y:0,width:0,height:0}}})),am.render((()=>{Ry(r,i,{enableHardwareAcceleration:!1},Ny(e.tagName),t.transformTemplate),Uy(e,r)}))}})},Xy={useVisualState:Yy({scrapeMotionValuesFromProps:Vy,createRenderState:Sy})};function Qy(t,e,n){let r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{passive:!0};return t.addEventListener(e,n,r),()=>t.removeEventListener(e,n)}const Zy=t=>"mouse"===t.pointerType?"number"!==typeof t.button||t.button<=0:!1!==t.isPrimary;function Jy(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"page";return{point:{x:t[e+"X"],y:t[e+"Y"]}}}function tb(t,e,n,r){return Qy(t,e,(t=>e=>Zy(e)&&t(e,Jy(e)))(n),r)}const eb=(t,e)=>n=>e(t(n)),nb=function(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return e.reduce(eb)};function rb(t){let e=null;return()=>{const n=()=>{e=null};return null===e&&(e=t,n)}}const ib=rb("dragHorizontal"),ob=rb("dragVertical");function ab(t){let e=!1;if("y"===t)e=ob();else if("x"===t)e=ib();else{const t=ib(),n=ob();t&&n?e=()=>{t(),n()}:(t&&t(),n&&n())}return e}function sb(){const t=ab(!0);return!t||(t(),!1)}class lb{constructor(t){this.isMounted=!1,this.node=t}update(){}}function cb(t,e){const n="pointer"+(e?"enter":"leave"),r="onHover"+(e?"Start":"End");return tb(t.current,n,((n,i)=>{if("touch"===n.pointerType||sb())return;const o=t.getProps();t.animationState&&o.whileHover&&t.animationState.setActive("whileHover",e),o[r]&&am.update((()=>o[r](n,i)))}),{passive:!t.getProps()[r]})}const ub=(t,e)=>!!e&&(t===e||ub(t,e.parentElement));function db(t,e){if(!e)return;const n=new PointerEvent("pointer"+t);e(n,Jy(n))}const hb=new WeakMap,fb=new WeakMap,pb=t=>{const e=hb.get(t.target);e&&e(t)},gb=t=>{t.forEach(pb)};function mb(t,e,n){const r=function(t){let{root:e,...n}=t;const r=e||document;fb.has(r)||fb.set(r,{});const i=fb.get(r),o=JSON.stringify(n);return i[o]||(i[o]=new IntersectionObserver(gb,{root:e,...n})),i[o]}(e);return hb.set(t,n),r.observe(t),()=>{hb.delete(t),r.unobserve(t)}}const yb={some:0,all:1};const bb={inView:{Feature:class extends lb{constructor(){super(...arguments),this.hasEnteredView=!1,this.isInView=!1}startObserver(){this.unmount();const{viewport:t={}}=this.node.getProps(),{root:e,margin:n,amount:r="some",once:i}=t,o={root:e?e.current:void 0,rootMargin:n,threshold:"number"===typeof r?r:yb[r]};return mb(this.node.current,o,(t=>{const{isIntersecting:e}=t;if(this.isInView===e)return;if(this.isInView=e,i&&!e&&this.hasEnteredView)return;e&&(this.hasEnteredView=!0),this.node.animationState&&this.node.animationState.setActive("whileInView",e);const{onViewportEnter:n,onViewportLeave:r}=this.node.getProps(),o=e?n:r;o&&o(t)}))}mount(){this.startObserver()}update(){if("undefined"===typeof IntersectionObserver)return;const{props:t,prevProps:e}=this.node,n=["amount","margin","root"].some(function(t){let{viewport:e={}}=t,{viewport:n={}}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};return t=>e[t]!==n[t]}(t,e));n&&this.startObserver()}unmount(){}}},tap:{Feature:class extends lb{constructor(){super(...arguments),this.removeStartListeners=rm,this.removeEndListeners=rm,this.removeAccessibleListeners=rm,this.startPointerPress=(t,e)=>{if(this.isPressing)return;this.removeEndListeners();const n=this.node.getProps(),r=tb(window,"pointerup",((t,e)=>{if(!this.checkPressEnd())return;const{onTap:n,onTapCancel:r,globalTapTarget:i}=this.node.getProps();am.update((()=>{i||ub(this.node.current,t.target)?n&&n(t,e):r&&r(t,e)}))}),{passive:!(n.onTap||n.onPointerUp)}),i=tb(window,"pointercancel",((t,e)=>this.cancelPress(t,e)),{passive:!(n.onTapCancel||n.onPointerCancel)});this.removeEndListeners=nb(r,i),this.startPress(t,e)},this.startAccessiblePress=()=>{const t=Qy(this.node.current,"keydown",(t=>{if("Enter"!==t.key||this.isPressing)return;this.removeEndListeners(),this.removeEndListeners=Qy(this.node.current,"keyup",(t=>{"Enter"===t.key&&this.checkPressEnd()&&db("up",((t,e)=>{const{onTap:n}=this.node.getProps();n&&am.update((()=>n(t,e)))}))})),db("down",((t,e)=>{this.startPress(t,e)}))})),e=Qy(this.node.current,"blur",(()=>{this.isPressing&&db("cancel",((t,e)=>this.cancelPress(t,e)))}));this.removeAccessibleListeners=nb(t,e)}}startPress(t,e){this.isPressing=!0;const{onTapStart:n,whileTap:r}=this.node.getProps();r&&this.node.animationState&&this.node.animationState.setActive("whileTap",!0),n&&am.update((()=>n(t,e)))}checkPressEnd(){this.removeEndListeners(),this.isPressing=!1;return this.node.getProps().whileTap&&this.node.animationState&&this.node.animationState.setActive("whileTap",!1),!sb()}cancelPress(t,e){if(!this.checkPressEnd())return;const{onTapCancel:n}=this.node.getProps();n&&am.update((()=>n(t,e)))}mount(){const t=this.node.getProps(),e=tb(t.globalTapTarget?window:this.node.current,"pointerdown",this.startPointerPress,{passive:!(t.onTapStart||t.onPointerStart)}),n=Qy(this.node.current,"focus",this.startAccessiblePress);this.removeStartListeners=nb(e,n)}unmount(){this.removeStartListeners(),this.removeEndListeners(),this.removeAccessibleListeners()}}},focus:{Feature:class extends lb{constructor(){super(...arguments),this.isActive=!1}onFocus(){let t=!1;try{t=this.node.current.matches(":focus-visible")}catch(e){t=!0}t&&this.node.animationState&&(this.node.animationState.setActive("whileFocus",!0),this.isActive=!0)}onBlur(){this.isActive&&this.node.animationState&&(this.node.animationState.setActive("whileFocus",!1),this.isActive=!1)}mount(){this.unmount=nb(Qy(this.node.current,"focus",(()=>this.onFocus())),Qy(this.node.current,"blur",(()=>this.onBlur())))}unmount(){}}},hover:{Feature:class extends lb{mount(){this.unmount=nb(cb(this.node,!0),cb(this.node,!1))}unmount(){}}}};function vb(t,e){if(!Array.isArray(e))return!1;const n=e.length;if(n!==t.length)return!1;for(let r=0;r<n;r++)if(e[r]!==t[r])return!1;return!0}function _b(t,e,n){const r=t.getProps();return Wy(r,e,void 0!==n?n:r.custom,function(t){const e={};return t.values.forEach(((t,n)=>e[n]=t.get())),e}(t),function(t){const e={};return t.values.forEach(((t,n)=>e[n]=t.getVelocity())),e}(t))}const wb=t=>1e3*t,xb=t=>t/1e3,Sb=!1,kb=t=>Array.isArray(t)&&"number"===typeof t[0];function Cb(t){return Boolean(!t||"string"===typeof t&&Pb[t]||kb(t)||Array.isArray(t)&&t.every(Cb))}const Tb=t=>{let[e,n,r,i]=t;return`cubic-bezier(${e}, ${n}, ${r}, ${i})`},Pb={linear:"linear",ease:"ease",easeIn:"ease-in",easeOut:"ease-out",easeInOut:"ease-in-out",circIn:Tb([0,.65,.55,1]),circOut:Tb([.55,0,1,.45]),backIn:Tb([.31,.01,.66,-.59]),backOut:Tb([.33,1.53,.69,.99])};function Eb(t){if(t)return kb(t)?Tb(t):Array.isArray(t)?t.map(Eb):Pb[t]}const Ab=(t,e,n)=>(((1-3*n+3*e)*t+(3*n-6*e))*t+3*e)*t;function Ib(t,e,n,r){if(t===e&&n===r)return rm;const i=e=>function(t,e,n,r,i){let o,a,s=0;do{a=e+(n-e)/2,o=Ab(a,r,i)-t,o>0?n=a:e=a}while(Math.abs(o)>1e-7&&++s<12);return a}(e,0,1,t,n);return t=>0===t||1===t?t:Ab(i(t),e,r)}const Mb=Ib(.42,0,1,1),Fb=Ib(0,0,.58,1),Db=Ib(.42,0,.58,1),Rb=t=>e=>e<=.5?t(2*e)/2:(2-t(2*(1-e)))/2,Ob=t=>e=>1-t(1-e),Nb=t=>1-Math.sin(Math.acos(t)),Lb=Ob(Nb),Bb=Rb(Nb),zb=Ib(.33,1.53,.69,.99),jb=Ob(zb),Ub=Rb(jb),Vb={linear:rm,easeIn:Mb,easeInOut:Db,easeOut:Fb,circIn:Nb,circInOut:Bb,circOut:Lb,backIn:jb,backInOut:Ub,backOut:zb,anticipate:t=>(t*=2)<1?.5*jb(t):.5*(2-Math.pow(2,-10*(t-1)))},$b=t=>{if(Array.isArray(t)){bm(4===t.length,"Cubic bezier arrays must contain four numerical values.");const[e,n,r,i]=t;return Ib(e,n,r,i)}return"string"===typeof t?(bm(void 0!==Vb[t],`Invalid easing type '${t}'`),Vb[t]):t},Wb=(t,e)=>n=>Boolean(hy(n)&&dy.test(n)&&n.startsWith(t)||e&&Object.prototype.hasOwnProperty.call(n,e)),Gb=(t,e,n)=>r=>{if(!hy(r))return r;const[i,o,a,s]=r.match(cy);return{[t]:parseFloat(i),[e]:parseFloat(o),[n]:parseFloat(a),alpha:void 0!==s?parseFloat(s):1}},Hb={...oy,transform:t=>Math.round((t=>iy(0,255,t))(t))},Yb={test:Wb("rgb","red"),parse:Gb("red","green","blue"),transform:t=>{let{red:e,green:n,blue:r,alpha:i=1}=t;return"rgba("+Hb.transform(e)+", "+Hb.transform(n)+", "+Hb.transform(r)+", "+ly(ay.transform(i))+")"}};const qb={test:Wb("#"),parse:function(t){let e="",n="",r="",i="";return t.length>5?(e=t.substring(1,3),n=t.substring(3,5),r=t.substring(5,7),i=t.substring(7,9)):(e=t.substring(1,2),n=t.substring(2,3),r=t.substring(3,4),i=t.substring(4,5),e+=e,n+=n,r+=r,i+=i),{red:parseInt(e,16),green:parseInt(n,16),blue:parseInt(r,16),alpha:i?parseInt(i,16)/255:1}},transform:Yb.transform},Kb={test:Wb("hsl","hue"),parse:Gb("hue","saturation","lightness"),transform:t=>{let{hue:e,saturation:n,lightness:r,alpha:i=1}=t;return"hsla("+Math.round(e)+", "+gy.transform(ly(n))+", "+gy.transform(ly(r))+", "+ly(ay.transform(i))+")"}},Xb={test:t=>Yb.test(t)||qb.test(t)||Kb.test(t),parse:t=>Yb.test(t)?Yb.parse(t):Kb.test(t)?Kb.parse(t):qb.parse(t),transform:t=>hy(t)?t:t.hasOwnProperty("red")?Yb.transform(t):Kb.transform(t)},Qb=(t,e,n)=>-n*t+n*e+t;function Zb(t,e,n){return n<0&&(n+=1),n>1&&(n-=1),n<1/6?t+6*(e-t)*n:n<.5?e:n<2/3?t+(e-t)*(2/3-n)*6:t}const Jb=(t,e,n)=>{const r=t*t;return Math.sqrt(Math.max(0,n*(e*e-r)+r))},tv=[qb,Yb,Kb];function ev(t){const e=(n=t,tv.find((t=>t.test(n))));var n;bm(Boolean(e),`'${t}' is not an animatable color. Use the equivalent color code instead.`);let r=e.parse(t);return e===Kb&&(r=function(t){let{hue:e,saturation:n,lightness:r,alpha:i}=t;e/=360,n/=100,r/=100;let o=0,a=0,s=0;if(n){const t=r<.5?r*(1+n):r+n-r*n,i=2*r-t;o=Zb(i,t,e+1/3),a=Zb(i,t,e),s=Zb(i,t,e-1/3)}else o=a=s=r;return{red:Math.round(255*o),green:Math.round(255*a),blue:Math.round(255*s),alpha:i}}(r)),r}const nv=(t,e)=>{const n=ev(t),r=ev(e),i={...n};return t=>(i.red=Jb(n.red,r.red,t),i.green=Jb(n.green,r.green,t),i.blue=Jb(n.blue,r.blue,t),i.alpha=Qb(n.alpha,r.alpha,t),Yb.transform(i))};const rv={regex:/var\s*\(\s*--[\w-]+(\s*,\s*(?:(?:[^)(]|\((?:[^)(]+|\([^)(]*\))*\))*)+)?\s*\)/g,countKey:"Vars",token:"${v}",parse:rm},iv={regex:uy,countKey:"Colors",token:"${c}",parse:Xb.parse},ov={regex:cy,countKey:"Numbers",token:"${n}",parse:oy.parse};function av(t,e){let{regex:n,countKey:r,token:i,parse:o}=e;const a=t.tokenised.match(n);a&&(t["num"+r]=a.length,t.tokenised=t.tokenised.replace(n,i),t.values.push(...a.map(o)))}function sv(t){const e=t.toString(),n={value:e,tokenised:e,values:[],numVars:0,numColors:0,numNumbers:0};return n.value.includes("var(--")&&av(n,rv),av(n,iv),av(n,ov),n}function lv(t){return sv(t).values}function cv(t){const{values:e,numColors:n,numVars:r,tokenised:i}=sv(t),o=e.length;return t=>{let e=i;for(let i=0;i<o;i++)e=i<r?e.replace(rv.token,t[i]):i<r+n?e.replace(iv.token,Xb.transform(t[i])):e.replace(ov.token,ly(t[i]));return e}}const uv=t=>"number"===typeof t?0:t;const dv={test:function(t){var e,n;return isNaN(t)&&hy(t)&&((null===(e=t.match(cy))||void 0===e?void 0:e.length)||0)+((null===(n=t.match(uy))||void 0===n?void 0:n.length)||0)>0},parse:lv,createTransformer:cv,getAnimatableNone:function(t){const e=lv(t);return cv(t)(e.map(uv))}},hv=(t,e)=>n=>`${n>0?e:t}`;function fv(t,e){return"number"===typeof t?n=>Qb(t,e,n):Xb.test(t)?nv(t,e):t.startsWith("var(")?hv(t,e):mv(t,e)}const pv=(t,e)=>{const n=[...t],r=n.length,i=t.map(((t,n)=>fv(t,e[n])));return t=>{for(let e=0;e<r;e++)n[e]=i[e](t);return n}},gv=(t,e)=>{const n={...t,...e},r={};for(const i in n)void 0!==t[i]&&void 0!==e[i]&&(r[i]=fv(t[i],e[i]));return t=>{for(const e in r)n[e]=r[e](t);return n}},mv=(t,e)=>{const n=dv.createTransformer(e),r=sv(t),i=sv(e);return r.numVars===i.numVars&&r.numColors===i.numColors&&r.numNumbers>=i.numNumbers?nb(pv(r.values,i.values),n):(ym(!0,`Complex values '${t}' and '${e}' too different to mix. Ensure all colors are of the same type, and that each contains the same quantity of number and color values. Falling back to instant transition.`),hv(t,e))},yv=(t,e,n)=>{const r=e-t;return 0===r?1:(n-t)/r},bv=(t,e)=>n=>Qb(t,e,n);function vv(t,e,n){const r=[],i=n||("number"===typeof(o=t[0])?bv:"string"===typeof o?Xb.test(o)?nv:mv:Array.isArray(o)?pv:"object"===typeof o?gv:bv);var o;const a=t.length-1;for(let s=0;s<a;s++){let n=i(t[s],t[s+1]);if(e){const t=Array.isArray(e)?e[s]||rm:e;n=nb(t,n)}r.push(n)}return r}function _v(t,e){let{clamp:n=!0,ease:r,mixer:i}=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};const o=t.length;if(bm(o===e.length,"Both input and output ranges must be the same length"),1===o)return()=>e[0];t[0]>t[o-1]&&(t=[...t].reverse(),e=[...e].reverse());const a=vv(e,r,i),s=a.length,l=e=>{let n=0;if(s>1)for(;n<t.length-2&&!(e<t[n+1]);n++);const r=yv(t[n],t[n+1],e);return a[n](r)};return n?e=>l(iy(t[0],t[o-1],e)):l}function wv(t){const e=[0];return function(t,e){const n=t[t.length-1];for(let r=1;r<=e;r++){const i=yv(0,e,r);t.push(Qb(n,1,i))}}(e,t.length-1),e}function xv(t){let{duration:e=300,keyframes:n,times:r,ease:i="easeInOut"}=t;const o=(t=>Array.isArray(t)&&"number"!==typeof t[0])(i)?i.map($b):$b(i),a={done:!1,value:n[0]},s=function(t,e){return t.map((t=>t*e))}(r&&r.length===n.length?r:wv(n),e),l=_v(s,n,{ease:Array.isArray(o)?o:(c=n,u=o,c.map((()=>u||Db)).splice(0,c.length-1))});var c,u;return{calculatedDuration:e,next:t=>(a.value=l(t),a.done=t>=e,a)}}function Sv(t,e){return e?t*(1e3/e):0}function kv(t,e,n){const r=Math.max(e-5,0);return Sv(n-t(r),e-r)}const Cv=.001;function Tv(t){let e,n,{duration:r=800,bounce:i=.25,velocity:o=0,mass:a=1}=t;ym(r<=wb(10),"Spring duration must be 10 seconds or less");let s=1-i;s=iy(.05,1,s),r=iy(.01,10,xb(r)),s<1?(e=t=>{const e=t*s,n=e*r,i=e-o,a=Ev(t,s),l=Math.exp(-n);return Cv-i/a*l},n=t=>{const n=t*s*r,i=n*o+o,a=Math.pow(s,2)*Math.pow(t,2)*r,l=Math.exp(-n),c=Ev(Math.pow(t,2),s);return(-e(t)+Cv>0?-1:1)*((i-a)*l)/c}):(e=t=>Math.exp(-t*r)*((t-o)*r+1)-.001,n=t=>Math.exp(-t*r)*(r*r*(o-t)));const l=function(t,e,n){let r=n;for(let i=1;i<Pv;i++)r-=t(r)/e(r);return r}(e,n,5/r);if(r=wb(r),isNaN(l))return{stiffness:100,damping:10,duration:r};{const t=Math.pow(l,2)*a;return{stiffness:t,damping:2*s*Math.sqrt(a*t),duration:r}}}const Pv=12;function Ev(t,e){return t*Math.sqrt(1-e*e)}const Av=["duration","bounce"],Iv=["stiffness","damping","mass"];function Mv(t,e){return e.some((e=>void 0!==t[e]))}function Fv(t){let{keyframes:e,restDelta:n,restSpeed:r,...i}=t;const o=e[0],a=e[e.length-1],s={done:!1,value:o},{stiffness:l,damping:c,mass:u,duration:d,velocity:h,isResolvedFromDuration:f}=function(t){let e={velocity:0,stiffness:100,damping:10,mass:1,isResolvedFromDuration:!1,...t};if(!Mv(t,Iv)&&Mv(t,Av)){const n=Tv(t);e={...e,...n,mass:1},e.isResolvedFromDuration=!0}return e}({...i,velocity:-xb(i.velocity||0)}),p=h||0,g=c/(2*Math.sqrt(l*u)),m=a-o,y=xb(Math.sqrt(l/u)),b=Math.abs(m)<5;let v;if(r||(r=b?.01:2),n||(n=b?.005:.5),g<1){const t=Ev(y,g);v=e=>{const n=Math.exp(-g*y*e);return a-n*((p+g*y*m)/t*Math.sin(t*e)+m*Math.cos(t*e))}}else if(1===g)v=t=>a-Math.exp(-y*t)*(m+(p+y*m)*t);else{const t=y*Math.sqrt(g*g-1);v=e=>{const n=Math.exp(-g*y*e),r=Math.min(t*e,300);return a-n*((p+g*y*m)*Math.sinh(r)+t*m*Math.cosh(r))/t}}return{calculatedDuration:f&&d||null,next:t=>{const e=v(t);if(f)s.done=t>=d;else{let i=p;0!==t&&(i=g<1?kv(v,t,e):0);const o=Math.abs(i)<=r,l=Math.abs(a-e)<=n;s.done=o&&l}return s.value=s.done?a:e,s}}}function Dv(t){let{keyframes:e,velocity:n=0,power:r=.8,timeConstant:i=325,bounceDamping:o=10,bounceStiffness:a=500,modifyTarget:s,min:l,max:c,restDelta:u=.5,restSpeed:d}=t;const h=e[0],f={done:!1,value:h},p=t=>void 0===l?c:void 0===c||Math.abs(l-t)<Math.abs(c-t)?l:c;let g=r*n;const m=h+g,y=void 0===s?m:s(m);y!==m&&(g=y-h);const b=t=>-g*Math.exp(-t/i),v=t=>y+b(t),_=t=>{const e=b(t),n=v(t);f.done=Math.abs(e)<=u,f.value=f.done?y:n};let w,x;const S=t=>{var e;(e=f.value,void 0!==l&&e<l||void 0!==c&&e>c)&&(w=t,x=Fv({keyframes:[f.value,p(f.value)],velocity:kv(v,t,f.value),damping:o,stiffness:a,restDelta:u,restSpeed:d}))};return S(0),{calculatedDuration:null,next:t=>{let e=!1;return x||void 0!==w||(e=!0,_(t),S(t)),void 0!==w&&t>w?x.next(t-w):(!e&&_(t),f)}}}const Rv=t=>{const e=e=>{let{timestamp:n}=e;return t(n)};return{start:()=>am.update(e,!0),stop:()=>sm(e),now:()=>lm.isProcessing?lm.timestamp:performance.now()}};function Ov(t){let e=0;let n=t.next(e);for(;!n.done&&e<2e4;)e+=50,n=t.next(e);return e>=2e4?1/0:e}const Nv={decay:Dv,inertia:Dv,tween:xv,keyframes:xv,spring:Fv};function Lv(t){let e,n,{autoplay:r=!0,delay:i=0,driver:o=Rv,keyframes:a,type:s="keyframes",repeat:l=0,repeatDelay:c=0,repeatType:u="loop",onPlay:d,onStop:h,onComplete:f,onUpdate:p,...g}=t,m=1,y=!1;const b=()=>{n=new Promise((t=>{e=t}))};let v;b();const _=Nv[s]||xv;let w;_!==xv&&"number"!==typeof a[0]&&(w=_v([0,100],a,{clamp:!1}),a=[0,100]);const x=_({...g,keyframes:a});let S;"mirror"===u&&(S=_({...g,keyframes:[...a].reverse(),velocity:-(g.velocity||0)}));let k="idle",C=null,T=null,P=null;null===x.calculatedDuration&&l&&(x.calculatedDuration=Ov(x));const{calculatedDuration:E}=x;let A=1/0,I=1/0;null!==E&&(A=E+c,I=A*(l+1)-c);let M=0;const F=t=>{if(null===T)return;m>0&&(T=Math.min(T,t)),m<0&&(T=Math.min(t-I/m,T)),M=null!==C?C:Math.round(t-T)*m;const e=M-i*(m>=0?1:-1),n=m>=0?e<0:e>I;M=Math.max(e,0),"finished"===k&&null===C&&(M=I);let r=M,o=x;if(l){const t=Math.min(M,I)/A;let e=Math.floor(t),n=t%1;!n&&t>=1&&(n=1),1===n&&e--,e=Math.min(e,l+1);Boolean(e%2)&&("reverse"===u?(n=1-n,c&&(n-=c/A)):"mirror"===u&&(o=S)),r=iy(0,1,n)*A}const s=n?{done:!1,value:a[0]}:o.next(r);w&&(s.value=w(s.value));let{done:d}=s;n||null===E||(d=m>=0?M>=I:M<=0);const h=null===C&&("finished"===k||"running"===k&&d);return p&&p(s.value),h&&O(),s},D=()=>{v&&v.stop(),v=void 0},R=()=>{k="idle",D(),e(),b(),T=P=null},O=()=>{k="finished",f&&f(),D(),e()},N=()=>{if(y)return;v||(v=o(F));const t=v.now();d&&d(),null!==C?T=t-C:T&&"finished"!==k||(T=t),"finished"===k&&b(),P=T,C=null,k="running",v.start()};r&&N();const L={then:(t,e)=>n.then(t,e),get time(){return xb(M)},set time(t){t=wb(t),M=t,null===C&&v&&0!==m?T=v.now()-t/m:C=t},get duration(){const t=null===x.calculatedDuration?Ov(x):x.calculatedDuration;return xb(t)},get speed(){return m},set speed(t){t!==m&&v&&(m=t,L.time=xb(M))},get state(){return k},play:N,pause:()=>{k="paused",C=M},stop:()=>{y=!0,"idle"!==k&&(k="idle",h&&h(),R())},cancel:()=>{null!==P&&F(P),R()},complete:()=>{k="finished"},sample:t=>(T=0,F(t))};return L}const Bv=function(t){let e;return()=>(void 0===e&&(e=t()),e)}((()=>Object.hasOwnProperty.call(Element.prototype,"animate"))),zv=new Set(["opacity","clipPath","filter","transform","backgroundColor"]);function jv(t,e,n){let{onUpdate:r,onComplete:i,...o}=n;if(!(Bv()&&zv.has(e)&&!o.repeatDelay&&"mirror"!==o.repeatType&&0!==o.damping&&"inertia"!==o.type))return!1;let a,s,l=!1,c=!1;const u=()=>{s=new Promise((t=>{a=t}))};u();let{keyframes:d,duration:h=300,ease:f,times:p}=o;if(((t,e)=>"spring"===e.type||"backgroundColor"===t||!Cb(e.ease))(e,o)){const t=Lv({...o,repeat:0,delay:0});let e={done:!1,value:d[0]};const n=[];let r=0;for(;!e.done&&r<2e4;)e=t.sample(r),n.push(e.value),r+=10;p=void 0,d=n,h=r-10,f="linear"}const g=function(t,e,n){let{delay:r=0,duration:i,repeat:o=0,repeatType:a="loop",ease:s,times:l}=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{};const c={[e]:n};l&&(c.offset=l);const u=Eb(s);return Array.isArray(u)&&(c.easing=u),t.animate(c,{delay:r,duration:i,easing:Array.isArray(u)?"linear":u,fill:"both",iterations:o+1,direction:"reverse"===a?"alternate":"normal"})}(t.owner.current,e,d,{...o,duration:h,ease:f,times:p}),m=()=>{c=!1,g.cancel()},y=()=>{c=!0,am.update(m),a(),u()};g.onfinish=()=>{c||(t.set(function(t,e){let{repeat:n,repeatType:r="loop"}=e;return t[n&&"loop"!==r&&n%2===1?0:t.length-1]}(d,o)),i&&i(),y())};return{then:(t,e)=>s.then(t,e),attachTimeline:t=>(g.timeline=t,g.onfinish=null,rm),get time(){return xb(g.currentTime||0)},set time(t){g.currentTime=wb(t)},get speed(){return g.playbackRate},set speed(t){g.playbackRate=t},get duration(){return xb(h)},play:()=>{l||(g.play(),sm(m))},pause:()=>g.pause(),stop:()=>{if(l=!0,"idle"===g.playState)return;const{currentTime:e}=g;if(e){const n=Lv({...o,autoplay:!1});t.setWithVelocity(n.sample(e-10).value,n.sample(e).value,10)}y()},complete:()=>{c||g.finish()},cancel:y}}const Uv={type:"spring",stiffness:500,damping:25,restSpeed:10},Vv={type:"keyframes",duration:.8},$v={type:"keyframes",ease:[.25,.1,.35,1],duration:.3},Wv=(t,e)=>{let{keyframes:n}=e;return n.length>2?Vv:Km.has(t)?t.startsWith("scale")?{type:"spring",stiffness:550,damping:0===n[1]?2*Math.sqrt(550):30,restSpeed:10}:Uv:$v},Gv=(t,e)=>"zIndex"!==t&&(!("number"!==typeof e&&!Array.isArray(e))||!("string"!==typeof e||!dv.test(e)&&"0"!==e||e.startsWith("url("))),Hv=new Set(["brightness","contrast","saturate","opacity"]);function Yv(t){const[e,n]=t.slice(0,-1).split("(");if("drop-shadow"===e)return t;const[r]=n.match(cy)||[];if(!r)return t;const i=n.replace(r,"");let o=Hv.has(e)?1:0;return r!==n&&(o*=100),e+"("+o+i+")"}const qv=/([a-z-]*)\(.*?\)/g,Kv={...dv,getAnimatableNone:t=>{const e=t.match(qv);return e?e.map(Yv).join(" "):t}},Xv={...wy,color:Xb,backgroundColor:Xb,outlineColor:Xb,fill:Xb,stroke:Xb,borderColor:Xb,borderTopColor:Xb,borderRightColor:Xb,borderBottomColor:Xb,borderLeftColor:Xb,filter:Kv,WebkitFilter:Kv},Qv=t=>Xv[t];function Zv(t,e){let n=Qv(t);return n!==Kv&&(n=dv),n.getAnimatableNone?n.getAnimatableNone(e):void 0}const Jv=t=>/^0[^.\s]+$/.test(t);function t_(t){return"number"===typeof t?0===t:null!==t?"none"===t||"0"===t||Jv(t):void 0}function e_(t,e){return t[e]||t.default||t}const n_=!1,r_=function(t,e,n){let r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{};return i=>{const o=e_(r,t)||{},a=o.delay||r.delay||0;let{elapsed:s=0}=r;s-=wb(a);const l=function(t,e,n,r){const i=Gv(e,n);let o;o=Array.isArray(n)?[...n]:[null,n];const a=void 0!==r.from?r.from:t.get();let s;const l=[];for(let c=0;c<o.length;c++)null===o[c]&&(o[c]=0===c?a:o[c-1]),t_(o[c])&&l.push(c),"string"===typeof o[c]&&"none"!==o[c]&&"0"!==o[c]&&(s=o[c]);if(i&&l.length&&s)for(let c=0;c<l.length;c++)o[l[c]]=Zv(e,s);return o}(e,t,n,o),c=l[0],u=l[l.length-1],d=Gv(t,c),h=Gv(t,u);ym(d===h,`You are trying to animate ${t} from "${c}" to "${u}". ${c} is not an animatable value - to enable this animation set ${c} to a value animatable to ${u} via the \`style\` property.`);let f={keyframes:l,velocity:e.getVelocity(),ease:"easeOut",...o,delay:-s,onUpdate:t=>{e.set(t),o.onUpdate&&o.onUpdate(t)},onComplete:()=>{i(),o.onComplete&&o.onComplete()}};if(function(t){let{when:e,delay:n,delayChildren:r,staggerChildren:i,staggerDirection:o,repeat:a,repeatType:s,repeatDelay:l,from:c,elapsed:u,...d}=t;return!!Object.keys(d).length}(o)||(f={...f,...Wv(t,f)}),f.duration&&(f.duration=wb(f.duration)),f.repeatDelay&&(f.repeatDelay=wb(f.repeatDelay)),!d||!h||Sb||!1===o.type||n_)return function(t){let{keyframes:e,delay:n,onUpdate:r,onComplete:i}=t;const o=()=>(r&&r(e[e.length-1]),i&&i(),{time:0,speed:1,duration:0,play:rm,pause:rm,stop:rm,then:t=>(t(),Promise.resolve()),cancel:rm,complete:rm});return n?Lv({keyframes:[0,1],duration:0,delay:n,onComplete:o}):o()}(Sb?{...f,delay:0}:f);if(!r.isHandoff&&e.owner&&e.owner.current instanceof HTMLElement&&!e.owner.getProps().onUpdate){const n=jv(e,t,f);if(n)return n}return Lv(f)}};function i_(t){return Boolean(Qm(t)&&t.add)}const o_=t=>/^\-?\d*\.?\d+$/.test(t);function a_(t,e){-1===t.indexOf(e)&&t.push(e)}function s_(t,e){const n=t.indexOf(e);n>-1&&t.splice(n,1)}class l_{constructor(){this.subscriptions=[]}add(t){return a_(this.subscriptions,t),()=>s_(this.subscriptions,t)}notify(t,e,n){const r=this.subscriptions.length;if(r)if(1===r)this.subscriptions[0](t,e,n);else for(let i=0;i<r;i++){const r=this.subscriptions[i];r&&r(t,e,n)}}getSize(){return this.subscriptions.length}clear(){this.subscriptions.length=0}}const c_={current:void 0};class u_{constructor(t){var e=this;let n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};var r;this.version="10.18.0",this.timeDelta=0,this.lastUpdated=0,this.canTrackVelocity=!1,this.events={},this.updateAndNotify=function(t){let n=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];e.prev=e.current,e.current=t;const{delta:r,timestamp:i}=lm;e.lastUpdated!==i&&(e.timeDelta=r,e.lastUpdated=i,am.postRender(e.scheduleVelocityCheck)),e.prev!==e.current&&e.events.change&&e.events.change.notify(e.current),e.events.velocityChange&&e.events.velocityChange.notify(e.getVelocity()),n&&e.events.renderRequest&&e.events.renderRequest.notify(e.current)},this.scheduleVelocityCheck=()=>am.postRender(this.velocityCheck),this.velocityCheck=t=>{let{timestamp:e}=t;e!==this.lastUpdated&&(this.prev=this.current,this.events.velocityChange&&this.events.velocityChange.notify(this.getVelocity()))},this.hasAnimated=!1,this.prev=this.current=t,this.canTrackVelocity=(r=this.current,!isNaN(parseFloat(r))),this.owner=n.owner}onChange(t){return this.on("change",t)}on(t,e){this.events[t]||(this.events[t]=new l_);const n=this.events[t].add(e);return"change"===t?()=>{n(),am.read((()=>{this.events.change.getSize()||this.stop()}))}:n}clearListeners(){for(const t in this.events)this.events[t].clear()}attach(t,e){this.passiveEffect=t,this.stopPassiveEffect=e}set(t){let e=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];e&&this.passiveEffect?this.passiveEffect(t,this.updateAndNotify):this.updateAndNotify(t,e)}setWithVelocity(t,e,n){this.set(e),this.prev=t,this.timeDelta=n}jump(t){this.updateAndNotify(t),this.prev=t,this.stop(),this.stopPassiveEffect&&this.stopPassiveEffect()}get(){return c_.current&&c_.current.push(this),this.current}getPrevious(){return this.prev}getVelocity(){return this.canTrackVelocity?Sv(parseFloat(this.current)-parseFloat(this.prev),this.timeDelta):0}start(t){return this.stop(),new Promise((e=>{this.hasAnimated=!0,this.animation=t(e),this.events.animationStart&&this.events.animationStart.notify()})).then((()=>{this.events.animationComplete&&this.events.animationComplete.notify(),this.clearAnimation()}))}stop(){this.animation&&(this.animation.stop(),this.events.animationCancel&&this.events.animationCancel.notify()),this.clearAnimation()}isAnimating(){return!!this.animation}clearAnimation(){delete this.animation}destroy(){this.clearListeners(),this.stop(),this.stopPassiveEffect&&this.stopPassiveEffect()}}function d_(t,e){return new u_(t,e)}const h_=t=>e=>e.test(t),f_=[oy,my,gy,py,by,yy,{test:t=>"auto"===t,parse:t=>t}],p_=t=>f_.find(h_(t)),g_=[...f_,Xb,dv];function m_(t,e,n){t.hasValue(e)?t.getValue(e).set(n):t.addValue(e,d_(n))}function y_(t,e){const n=_b(t,e);let{transitionEnd:r={},transition:i={},...o}=n?t.makeTargetAnimatable(n,!1):{};o={...o,...r};for(const s in o){m_(t,s,(a=o[s],Gy(a)?a[a.length-1]||0:a))}var a}function b_(t,e){if(!e)return;return(e[t]||e.default||e).from}function v_(t,e){let{protectedKeys:n,needsAnimating:r}=t;const i=n.hasOwnProperty(e)&&!0!==r[e];return r[e]=!1,i}function __(t,e){const n=t.get();if(!Array.isArray(e))return n!==e;for(let r=0;r<e.length;r++)if(e[r]!==n)return!0}function w_(t,e){let{delay:n=0,transitionOverride:r,type:i}=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{},{transition:o=t.getDefaultTransition(),transitionEnd:a,...s}=t.makeTargetAnimatable(e);const l=t.getValue("willChange");r&&(o=r);const c=[],u=i&&t.animationState&&t.animationState.getState()[i];for(const d in s){const e=t.getValue(d),r=s[d];if(!e||void 0===r||u&&v_(u,d))continue;const i={delay:n,elapsed:0,...e_(o||{},d)};if(window.HandoffAppearAnimations){const n=t.getProps()[Em];if(n){const t=window.HandoffAppearAnimations(n,d,e,am);null!==t&&(i.elapsed=t,i.isHandoff=!0)}}let a=!i.isHandoff&&!__(e,r);if("spring"===i.type&&(e.getVelocity()||i.velocity)&&(a=!1),e.animation&&(a=!1),a)continue;e.start(r_(d,e,r,t.shouldReduceMotion&&Km.has(d)?{type:!1}:i));const h=e.animation;i_(l)&&(l.add(d),h.then((()=>l.remove(d)))),c.push(h)}return a&&Promise.all(c).then((()=>{a&&y_(t,a)})),c}function x_(t,e){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};const r=_b(t,e,n.custom);let{transition:i=t.getDefaultTransition()||{}}=r||{};n.transitionOverride&&(i=n.transitionOverride);const o=r?()=>Promise.all(w_(t,r,n)):()=>Promise.resolve(),a=t.variantChildren&&t.variantChildren.size?function(){let r=arguments.length>0&&void 0!==arguments[0]?arguments[0]:0;const{delayChildren:o=0,staggerChildren:a,staggerDirection:s}=i;return function(t,e){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0,r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:0,i=arguments.length>4&&void 0!==arguments[4]?arguments[4]:1,o=arguments.length>5?arguments[5]:void 0;const a=[],s=(t.variantChildren.size-1)*r,l=1===i?function(){return(arguments.length>0&&void 0!==arguments[0]?arguments[0]:0)*r}:function(){return s-(arguments.length>0&&void 0!==arguments[0]?arguments[0]:0)*r};return Array.from(t.variantChildren).sort(S_).forEach(((t,r)=>{t.notify("AnimationStart",e),a.push(x_(t,e,{...o,delay:n+l(r)}).then((()=>t.notify("AnimationComplete",e))))})),Promise.all(a)}(t,e,o+r,a,s,n)}:()=>Promise.resolve(),{when:s}=i;if(s){const[t,e]="beforeChildren"===s?[o,a]:[a,o];return t().then((()=>e()))}return Promise.all([o(),a(n.delay)])}function S_(t,e){return t.sortNodePosition(e)}const k_=[...Fm].reverse(),C_=Fm.length;function T_(t){return e=>Promise.all(e.map((e=>{let{animation:n,options:r}=e;return function(t,e){let n,r=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};if(t.notify("AnimationStart",e),Array.isArray(e)){const i=e.map((e=>x_(t,e,r)));n=Promise.all(i)}else if("string"===typeof e)n=x_(t,e,r);else{const i="function"===typeof e?_b(t,e,r.custom):e;n=Promise.all(w_(t,i,r))}return n.then((()=>t.notify("AnimationComplete",e)))}(t,n,r)})))}function P_(t){let e=T_(t);const n={animate:A_(!0),whileInView:A_(),whileHover:A_(),whileTap:A_(),whileDrag:A_(),whileFocus:A_(),exit:A_()};let r=!0;const i=(e,n)=>{const r=_b(t,n);if(r){const{transition:t,transitionEnd:n,...i}=r;e={...e,...i,...n}}return e};function o(o,a){const s=t.getProps(),l=t.getVariantContext(!0)||{},c=[],u=new Set;let d={},h=1/0;for(let e=0;e<C_;e++){const f=k_[e],p=n[f],g=void 0!==s[f]?s[f]:l[f],m=Im(g),y=f===a?p.isActive:null;!1===y&&(h=e);let b=g===l[f]&&g!==s[f]&&m;if(b&&r&&t.manuallyAnimateOnMount&&(b=!1),p.protectedKeys={...d},!p.isActive&&null===y||!g&&!p.prevProp||Mm(g)||"boolean"===typeof g)continue;let v=E_(p.prevProp,g)||f===a&&p.isActive&&!b&&m||e>h&&m,_=!1;const w=Array.isArray(g)?g:[g];let x=w.reduce(i,{});!1===y&&(x={});const{prevResolvedValues:S={}}=p,k={...S,...x},C=t=>{v=!0,u.has(t)&&(_=!0,u.delete(t)),p.needsAnimating[t]=!0};for(const t in k){const e=x[t],n=S[t];if(d.hasOwnProperty(t))continue;let r=!1;r=Gy(e)&&Gy(n)?!vb(e,n):e!==n,r?void 0!==e?C(t):u.add(t):void 0!==e&&u.has(t)?C(t):p.protectedKeys[t]=!0}p.prevProp=g,p.prevResolvedValues=x,p.isActive&&(d={...d,...x}),r&&t.blockInitialAnimation&&(v=!1),!v||b&&!_||c.push(...w.map((t=>({animation:t,options:{type:f,...o}}))))}if(u.size){const e={};u.forEach((n=>{const r=t.getBaseTarget(n);void 0!==r&&(e[n]=r)})),c.push({animation:e})}let f=Boolean(c.length);return!r||!1!==s.initial&&s.initial!==s.animate||t.manuallyAnimateOnMount||(f=!1),r=!1,f?e(c):Promise.resolve()}return{animateChanges:o,setActive:function(e,r,i){var a;if(n[e].isActive===r)return Promise.resolve();null===(a=t.variantChildren)||void 0===a||a.forEach((t=>{var n;return null===(n=t.animationState)||void 0===n?void 0:n.setActive(e,r)})),n[e].isActive=r;const s=o(i,e);for(const t in n)n[t].protectedKeys={};return s},setAnimateFunction:function(n){e=n(t)},getState:()=>n}}function E_(t,e){return"string"===typeof e?e!==t:!!Array.isArray(e)&&!vb(e,t)}function A_(){return{isActive:arguments.length>0&&void 0!==arguments[0]&&arguments[0],protectedKeys:{},needsAnimating:{},prevResolvedValues:{}}}let I_=0;const M_={animation:{Feature:class extends lb{constructor(t){super(t),t.animationState||(t.animationState=P_(t))}updateAnimationControlsSubscription(){const{animate:t}=this.node.getProps();this.unmount(),Mm(t)&&(this.unmount=t.subscribe(this.node))}mount(){this.updateAnimationControlsSubscription()}update(){const{animate:t}=this.node.getProps(),{animate:e}=this.node.prevProps||{};t!==e&&this.updateAnimationControlsSubscription()}unmount(){}}},exit:{Feature:class extends lb{constructor(){super(...arguments),this.id=I_++}update(){if(!this.node.presenceContext)return;const{isPresent:t,onExitComplete:e,custom:n}=this.node.presenceContext,{isPresent:r}=this.node.prevPresenceContext||{};if(!this.node.animationState||t===r)return;const i=this.node.animationState.setActive("exit",!t,{custom:null!==n&&void 0!==n?n:this.node.getProps().custom});e&&!t&&i.then((()=>e(this.id)))}mount(){const{register:t}=this.node.presenceContext||{};t&&(this.unmount=t(this.id))}unmount(){}}}},F_=(t,e)=>Math.abs(t-e);class D_{constructor(t,e){let{transformPagePoint:n,contextWindow:r,dragSnapToOrigin:i=!1}=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};if(this.startEvent=null,this.lastMoveEvent=null,this.lastMoveEventInfo=null,this.handlers={},this.contextWindow=window,this.updatePoint=()=>{if(!this.lastMoveEvent||!this.lastMoveEventInfo)return;const t=N_(this.lastMoveEventInfo,this.history),e=null!==this.startEvent,n=function(t,e){const n=F_(t.x,e.x),r=F_(t.y,e.y);return Math.sqrt(n**2+r**2)}(t.offset,{x:0,y:0})>=3;if(!e&&!n)return;const{point:r}=t,{timestamp:i}=lm;this.history.push({...r,timestamp:i});const{onStart:o,onMove:a}=this.handlers;e||(o&&o(this.lastMoveEvent,t),this.startEvent=this.lastMoveEvent),a&&a(this.lastMoveEvent,t)},this.handlePointerMove=(t,e)=>{this.lastMoveEvent=t,this.lastMoveEventInfo=R_(e,this.transformPagePoint),am.update(this.updatePoint,!0)},this.handlePointerUp=(t,e)=>{this.end();const{onEnd:n,onSessionEnd:r,resumeAnimation:i}=this.handlers;if(this.dragSnapToOrigin&&i&&i(),!this.lastMoveEvent||!this.lastMoveEventInfo)return;const o=N_("pointercancel"===t.type?this.lastMoveEventInfo:R_(e,this.transformPagePoint),this.history);this.startEvent&&n&&n(t,o),r&&r(t,o)},!Zy(t))return;this.dragSnapToOrigin=i,this.handlers=e,this.transformPagePoint=n,this.contextWindow=r||window;const o=R_(Jy(t),this.transformPagePoint),{point:a}=o,{timestamp:s}=lm;this.history=[{...a,timestamp:s}];const{onSessionStart:l}=e;l&&l(t,N_(o,this.history)),this.removeListeners=nb(tb(this.contextWindow,"pointermove",this.handlePointerMove),tb(this.contextWindow,"pointerup",this.handlePointerUp),tb(this.contextWindow,"pointercancel",this.handlePointerUp))}updateHandlers(t){this.handlers=t}end(){this.removeListeners&&this.removeListeners(),sm(this.updatePoint)}}function R_(t,e){return e?{point:e(t.point)}:t}function O_(t,e){return{x:t.x-e.x,y:t.y-e.y}}function N_(t,e){let{point:n}=t;return{point:n,delta:O_(n,B_(e)),offset:O_(n,L_(e)),velocity:z_(e,.1)}}function L_(t){return t[0]}function B_(t){return t[t.length-1]}function z_(t,e){if(t.length<2)return{x:0,y:0};let n=t.length-1,r=null;const i=B_(t);for(;n>=0&&(r=t[n],!(i.timestamp-r.timestamp>wb(e)));)n--;if(!r)return{x:0,y:0};const o=xb(i.timestamp-r.timestamp);if(0===o)return{x:0,y:0};const a={x:(i.x-r.x)/o,y:(i.y-r.y)/o};return a.x===1/0&&(a.x=0),a.y===1/0&&(a.y=0),a}function j_(t){return t.max-t.min}function U_(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0,n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:.01;return Math.abs(t-e)<=n}function V_(t,e,n){let r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:.5;t.origin=r,t.originPoint=Qb(e.min,e.max,t.origin),t.scale=j_(n)/j_(e),(U_(t.scale,1,1e-4)||isNaN(t.scale))&&(t.scale=1),t.translate=Qb(n.min,n.max,t.origin)-t.originPoint,(U_(t.translate)||isNaN(t.translate))&&(t.translate=0)}function $_(t,e,n,r){V_(t.x,e.x,n.x,r?r.originX:void 0),V_(t.y,e.y,n.y,r?r.originY:void 0)}function W_(t,e,n){t.min=n.min+e.min,t.max=t.min+j_(e)}function G_(t,e,n){t.min=e.min-n.min,t.max=t.min+j_(e)}function H_(t,e,n){G_(t.x,e.x,n.x),G_(t.y,e.y,n.y)}function Y_(t,e,n){return{min:void 0!==e?t.min+e:void 0,max:void 0!==n?t.max+n-(t.max-t.min):void 0}}function q_(t,e){let n=e.min-t.min,r=e.max-t.max;return e.max-e.min<t.max-t.min&&([n,r]=[r,n]),{min:n,max:r}}const K_=.35;function X_(t,e,n){return{min:Q_(t,e),max:Q_(t,n)}}function Q_(t,e){return"number"===typeof t?t:t[e]||0}function Z_(t){return[t("x"),t("y")]}function J_(t){let{top:e,left:n,right:r,bottom:i}=t;return{x:{min:n,max:r},y:{min:e,max:i}}}function tw(t){return void 0===t||1===t}function ew(t){let{scale:e,scaleX:n,scaleY:r}=t;return!tw(e)||!tw(n)||!tw(r)}function nw(t){return ew(t)||rw(t)||t.z||t.rotate||t.rotateX||t.rotateY}function rw(t){return iw(t.x)||iw(t.y)}function iw(t){return t&&"0%"!==t}function ow(t,e,n){return n+e*(t-n)}function aw(t,e,n,r,i){return void 0!==i&&(t=ow(t,i,r)),ow(t,n,r)+e}function sw(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0,n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:1,r=arguments.length>3?arguments[3]:void 0,i=arguments.length>4?arguments[4]:void 0;t.min=aw(t.min,e,n,r,i),t.max=aw(t.max,e,n,r,i)}function lw(t,e){let{x:n,y:r}=e;sw(t.x,n.translate,n.scale,n.originPoint),sw(t.y,r.translate,r.scale,r.originPoint)}function cw(t){return Number.isInteger(t)||t>1.0000000000001||t<.999999999999?t:1}function uw(t,e){t.min=t.min+e,t.max=t.max+e}function dw(t,e,n){let[r,i,o]=n;const a=void 0!==e[o]?e[o]:.5,s=Qb(t.min,t.max,a);sw(t,e[r],e[i],s,e.scale)}const hw=["x","scaleX","originX"],fw=["y","scaleY","originY"];function pw(t,e){dw(t.x,e,hw),dw(t.y,e,fw)}function gw(t,e){return J_(function(t,e){if(!e)return t;const n=e({x:t.left,y:t.top}),r=e({x:t.right,y:t.bottom});return{top:n.y,left:n.x,bottom:r.y,right:r.x}}(t.getBoundingClientRect(),e))}const mw=t=>{let{current:e}=t;return e?e.ownerDocument.defaultView:null},yw=new WeakMap;class bw{constructor(t){this.openGlobalLock=null,this.isDragging=!1,this.currentDirection=null,this.originPoint={x:0,y:0},this.constraints=!1,this.hasMutatedConstraints=!1,this.elastic={x:{min:0,max:0},y:{min:0,max:0}},this.visualElement=t}start(t){let{snapToCursor:e=!1}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};const{presenceContext:n}=this.visualElement;if(n&&!1===n.isPresent)return;const{dragSnapToOrigin:r}=this.getProps();this.panSession=new D_(t,{onSessionStart:t=>{const{dragSnapToOrigin:n}=this.getProps();n?this.pauseAnimation():this.stopAnimation(),e&&this.snapToCursor(Jy(t,"page").point)},onStart:(t,e)=>{const{drag:n,dragPropagation:r,onDragStart:i}=this.getProps();if(n&&!r&&(this.openGlobalLock&&this.openGlobalLock(),this.openGlobalLock=ab(n),!this.openGlobalLock))return;this.isDragging=!0,this.currentDirection=null,this.resolveConstraints(),this.visualElement.projection&&(this.visualElement.projection.isAnimationBlocked=!0,this.visualElement.projection.target=void 0),Z_((t=>{let e=this.getAxisMotionValue(t).get()||0;if(gy.test(e)){const{projection:n}=this.visualElement;if(n&&n.layout){const r=n.layout.layoutBox[t];if(r){e=j_(r)*(parseFloat(e)/100)}}}this.originPoint[t]=e})),i&&am.update((()=>i(t,e)),!1,!0);const{animationState:o}=this.visualElement;o&&o.setActive("whileDrag",!0)},onMove:(t,e)=>{const{dragPropagation:n,dragDirectionLock:r,onDirectionLock:i,onDrag:o}=this.getProps();if(!n&&!this.openGlobalLock)return;const{offset:a}=e;if(r&&null===this.currentDirection)return this.currentDirection=function(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:10,n=null;Math.abs(t.y)>e?n="y":Math.abs(t.x)>e&&(n="x");return n}(a),void(null!==this.currentDirection&&i&&i(this.currentDirection));this.updateAxis("x",e.point,a),this.updateAxis("y",e.point,a),this.visualElement.render(),o&&o(t,e)},onSessionEnd:(t,e)=>this.stop(t,e),resumeAnimation:()=>Z_((t=>{var e;return"paused"===this.getAnimationState(t)&&(null===(e=this.getAxisMotionValue(t).animation)||void 0===e?void 0:e.play())}))},{transformPagePoint:this.visualElement.getTransformPagePoint(),dragSnapToOrigin:r,contextWindow:mw(this.visualElement)})}stop(t,e){const n=this.isDragging;if(this.cancel(),!n)return;const{velocity:r}=e;this.startAnimation(r);const{onDragEnd:i}=this.getProps();i&&am.update((()=>i(t,e)))}cancel(){this.isDragging=!1;const{projection:t,animationState:e}=this.visualElement;t&&(t.isAnimationBlocked=!1),this.panSession&&this.panSession.end(),this.panSession=void 0;const{dragPropagation:n}=this.getProps();!n&&this.openGlobalLock&&(this.openGlobalLock(),this.openGlobalLock=null),e&&e.setActive("whileDrag",!1)}updateAxis(t,e,n){const{drag:r}=this.getProps();if(!n||!vw(t,r,this.currentDirection))return;const i=this.getAxisMotionValue(t);let o=this.originPoint[t]+n[t];this.constraints&&this.constraints[t]&&(o=function(t,e,n){let{min:r,max:i}=e;return void 0!==r&&t<r?t=n?Qb(r,t,n.min):Math.max(t,r):void 0!==i&&t>i&&(t=n?Qb(i,t,n.max):Math.min(t,i)),t}(o,this.constraints[t],this.elastic[t])),i.set(o)}resolveConstraints(){var t;const{dragConstraints:e,dragElastic:n}=this.getProps(),r=this.visualElement.projection&&!this.visualElement.projection.layout?this.visualElement.projection.measure(!1):null===(t=this.visualElement.projection)||void 0===t?void 0:t.layout,i=this.constraints;e&&Am(e)?this.constraints||(this.constraints=this.resolveRefConstraints()):this.constraints=!(!e||!r)&&function(t,e){let{top:n,left:r,bottom:i,right:o}=e;return{x:Y_(t.x,r,o),y:Y_(t.y,n,i)}}(r.layoutBox,e),this.elastic=function(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:K_;return!1===t?t=0:!0===t&&(t=K_),{x:X_(t,"left","right"),y:X_(t,"top","bottom")}}(n),i!==this.constraints&&r&&this.constraints&&!this.hasMutatedConstraints&&Z_((t=>{this.getAxisMotionValue(t)&&(this.constraints[t]=function(t,e){const n={};return void 0!==e.min&&(n.min=e.min-t.min),void 0!==e.max&&(n.max=e.max-t.min),n}(r.layoutBox[t],this.constraints[t]))}))}resolveRefConstraints(){const{dragConstraints:t,onMeasureDragConstraints:e}=this.getProps();if(!t||!Am(t))return!1;const n=t.current;bm(null!==n,"If `dragConstraints` is set as a React ref, that ref must be passed to another component's `ref` prop.");const{projection:r}=this.visualElement;if(!r||!r.layout)return!1;const i=function(t,e,n){const r=gw(t,n),{scroll:i}=e;return i&&(uw(r.x,i.offset.x),uw(r.y,i.offset.y)),r}(n,r.root,this.visualElement.getTransformPagePoint());let o=function(t,e){return{x:q_(t.x,e.x),y:q_(t.y,e.y)}}(r.layout.layoutBox,i);if(e){const t=e(function(t){let{x:e,y:n}=t;return{top:n.min,right:e.max,bottom:n.max,left:e.min}}(o));this.hasMutatedConstraints=!!t,t&&(o=J_(t))}return o}startAnimation(t){const{drag:e,dragMomentum:n,dragElastic:r,dragTransition:i,dragSnapToOrigin:o,onDragTransitionEnd:a}=this.getProps(),s=this.constraints||{},l=Z_((a=>{if(!vw(a,e,this.currentDirection))return;let l=s&&s[a]||{};o&&(l={min:0,max:0});const c=r?200:1e6,u=r?40:1e7,d={type:"inertia",velocity:n?t[a]:0,bounceStiffness:c,bounceDamping:u,timeConstant:750,restDelta:1,restSpeed:10,...i,...l};return this.startAxisValueAnimation(a,d)}));return Promise.all(l).then(a)}startAxisValueAnimation(t,e){const n=this.getAxisMotionValue(t);return n.start(r_(t,n,0,e))}stopAnimation(){Z_((t=>this.getAxisMotionValue(t).stop()))}pauseAnimation(){Z_((t=>{var e;return null===(e=this.getAxisMotionValue(t).animation)||void 0===e?void 0:e.pause()}))}getAnimationState(t){var e;return null===(e=this.getAxisMotionValue(t).animation)||void 0===e?void 0:e.state}getAxisMotionValue(t){const e="_drag"+t.toUpperCase(),n=this.visualElement.getProps(),r=n[e];return r||this.visualElement.getValue(t,(n.initial?n.initial[t]:void 0)||0)}snapToCursor(t){Z_((e=>{const{drag:n}=this.getProps();if(!vw(e,n,this.currentDirection))return;const{projection:r}=this.visualElement,i=this.getAxisMotionValue(e);if(r&&r.layout){const{min:n,max:o}=r.layout.layoutBox[e];i.set(t[e]-Qb(n,o,.5))}}))}scalePositionWithinConstraints(){if(!this.visualElement.current)return;const{drag:t,dragConstraints:e}=this.getProps(),{projection:n}=this.visualElement;if(!Am(e)||!n||!this.constraints)return;this.stopAnimation();const r={x:0,y:0};Z_((t=>{const e=this.getAxisMotionValue(t);if(e){const n=e.get();r[t]=function(t,e){let n=.5;const r=j_(t),i=j_(e);return i>r?n=yv(e.min,e.max-r,t.min):r>i&&(n=yv(t.min,t.max-i,e.min)),iy(0,1,n)}({min:n,max:n},this.constraints[t])}}));const{transformTemplate:i}=this.visualElement.getProps();this.visualElement.current.style.transform=i?i({},""):"none",n.root&&n.root.updateScroll(),n.updateLayout(),this.resolveConstraints(),Z_((e=>{if(!vw(e,t,null))return;const n=this.getAxisMotionValue(e),{min:i,max:o}=this.constraints[e];n.set(Qb(i,o,r[e]))}))}addListeners(){if(!this.visualElement.current)return;yw.set(this.visualElement,this);const t=tb(this.visualElement.current,"pointerdown",(t=>{const{drag:e,dragListener:n=!0}=this.getProps();e&&n&&this.start(t)})),e=()=>{const{dragConstraints:t}=this.getProps();Am(t)&&(this.constraints=this.resolveRefConstraints())},{projection:n}=this.visualElement,r=n.addEventListener("measure",e);n&&!n.layout&&(n.root&&n.root.updateScroll(),n.updateLayout()),e();const i=Qy(window,"resize",(()=>this.scalePositionWithinConstraints())),o=n.addEventListener("didUpdate",(t=>{let{delta:e,hasLayoutChanged:n}=t;this.isDragging&&n&&(Z_((t=>{const n=this.getAxisMotionValue(t);n&&(this.originPoint[t]+=e[t].translate,n.set(n.get()+e[t].translate))})),this.visualElement.render())}));return()=>{i(),t(),r(),o&&o()}}getProps(){const t=this.visualElement.getProps(),{drag:e=!1,dragDirectionLock:n=!1,dragPropagation:r=!1,dragConstraints:i=!1,dragElastic:o=K_,dragMomentum:a=!0}=t;return{...t,drag:e,dragDirectionLock:n,dragPropagation:r,dragConstraints:i,dragElastic:o,dragMomentum:a}}}function vw(t,e,n){return(!0===e||e===t)&&(null===n||n===t)}const _w=t=>(e,n)=>{t&&am.update((()=>t(e,n)))};const ww={hasAnimatedSinceResize:!0,hasEverUpdated:!1};function xw(t,e){return e.max===e.min?0:t/(e.max-e.min)*100}const Sw={correct:(t,e)=>{if(!e.target)return t;if("string"===typeof t){if(!my.test(t))return t;t=parseFloat(t)}return`${xw(t,e.target.x)}% ${xw(t,e.target.y)}%`}},kw={correct:(t,e)=>{let{treeScale:n,projectionDelta:r}=e;const i=t,o=dv.parse(t);if(o.length>5)return i;const a=dv.createTransformer(t),s="number"!==typeof o[0]?1:0,l=r.x.scale*n.x,c=r.y.scale*n.y;o[0+s]/=l,o[1+s]/=c;const u=Qb(l,c,.5);return"number"===typeof o[2+s]&&(o[2+s]/=u),"number"===typeof o[3+s]&&(o[3+s]/=u),a(o)}};class Cw extends d.Component{componentDidMount(){const{visualElement:t,layoutGroup:e,switchLayoutGroup:n,layoutId:r}=this.props,{projection:i}=t;var o;o=Pw,Object.assign(Ym,o),i&&(e.group&&e.group.add(i),n&&n.register&&r&&n.register(i),i.root.didUpdate(),i.addEventListener("animationComplete",(()=>{this.safeToRemove()})),i.setOptions({...i.options,onExitComplete:()=>this.safeToRemove()})),ww.hasEverUpdated=!0}getSnapshotBeforeUpdate(t){const{layoutDependency:e,visualElement:n,drag:r,isPresent:i}=this.props,o=n.projection;return o?(o.isPresent=i,r||t.layoutDependency!==e||void 0===e?o.willUpdate():this.safeToRemove(),t.isPresent!==i&&(i?o.promote():o.relegate()||am.postRender((()=>{const t=o.getStack();t&&t.members.length||this.safeToRemove()}))),null):null}componentDidUpdate(){const{projection:t}=this.props.visualElement;t&&(t.root.didUpdate(),queueMicrotask((()=>{!t.currentAnimation&&t.isLead()&&this.safeToRemove()})))}componentWillUnmount(){const{visualElement:t,layoutGroup:e,switchLayoutGroup:n}=this.props,{projection:r}=t;r&&(r.scheduleCheckAfterUnmount(),e&&e.group&&e.group.remove(r),n&&n.deregister&&n.deregister(r))}safeToRemove(){const{safeToRemove:t}=this.props;t&&t()}render(){return null}}function Tw(t){const[e,n]=function(){const t=(0,d.useContext)(um);if(null===t)return[!0,null];const{isPresent:e,onExitComplete:n,register:r}=t,i=(0,d.useId)();return(0,d.useEffect)((()=>r(i)),[]),!e&&n?[!1,()=>n&&n(i)]:[!0]}(),r=(0,d.useContext)(mm);return d.createElement(Cw,{...t,layoutGroup:r,switchLayoutGroup:(0,d.useContext)(jm),isPresent:e,safeToRemove:n})}const Pw={borderRadius:{...Sw,applyTo:["borderTopLeftRadius","borderTopRightRadius","borderBottomLeftRadius","borderBottomRightRadius"]},borderTopLeftRadius:Sw,borderTopRightRadius:Sw,borderBottomLeftRadius:Sw,borderBottomRightRadius:Sw,boxShadow:kw},Ew=["TopLeft","TopRight","BottomLeft","BottomRight"],Aw=Ew.length,Iw=t=>"string"===typeof t?parseFloat(t):t,Mw=t=>"number"===typeof t||my.test(t);function Fw(t,e){return void 0!==t[e]?t[e]:t.borderRadius}const Dw=Ow(0,.5,Lb),Rw=Ow(.5,.95,rm);function Ow(t,e,n){return r=>r<t?0:r>e?1:n(yv(t,e,r))}function Nw(t,e){t.min=e.min,t.max=e.max}function Lw(t,e){Nw(t.x,e.x),Nw(t.y,e.y)}function Bw(t,e,n,r,i){return t=ow(t-=e,1/n,r),void 0!==i&&(t=ow(t,1/i,r)),t}function zw(t,e,n,r,i){let[o,a,s]=n;!function(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0,n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:1,r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:.5,i=arguments.length>4?arguments[4]:void 0,o=arguments.length>5&&void 0!==arguments[5]?arguments[5]:t,a=arguments.length>6&&void 0!==arguments[6]?arguments[6]:t;gy.test(e)&&(e=parseFloat(e),e=Qb(a.min,a.max,e/100)-a.min);if("number"!==typeof e)return;let s=Qb(o.min,o.max,r);t===o&&(s-=e),t.min=Bw(t.min,e,n,s,i),t.max=Bw(t.max,e,n,s,i)}(t,e[o],e[a],e[s],e.scale,r,i)}const jw=["x","scaleX","originX"],Uw=["y","scaleY","originY"];function Vw(t,e,n,r){zw(t.x,e,jw,n?n.x:void 0,r?r.x:void 0),zw(t.y,e,Uw,n?n.y:void 0,r?r.y:void 0)}function $w(t){return 0===t.translate&&1===t.scale}function Ww(t){return $w(t.x)&&$w(t.y)}function Gw(t,e){return Math.round(t.x.min)===Math.round(e.x.min)&&Math.round(t.x.max)===Math.round(e.x.max)&&Math.round(t.y.min)===Math.round(e.y.min)&&Math.round(t.y.max)===Math.round(e.y.max)}function Hw(t){return j_(t.x)/j_(t.y)}class Yw{constructor(){this.members=[]}add(t){a_(this.members,t),t.scheduleRender()}remove(t){if(s_(this.members,t),t===this.prevLead&&(this.prevLead=void 0),t===this.lead){const t=this.members[this.members.length-1];t&&this.promote(t)}}relegate(t){const e=this.members.findIndex((e=>t===e));if(0===e)return!1;let n;for(let r=e;r>=0;r--){const t=this.members[r];if(!1!==t.isPresent){n=t;break}}return!!n&&(this.promote(n),!0)}promote(t,e){const n=this.lead;if(t!==n&&(this.prevLead=n,this.lead=t,t.show(),n)){n.instance&&n.scheduleRender(),t.scheduleRender(),t.resumeFrom=n,e&&(t.resumeFrom.preserveOpacity=!0),n.snapshot&&(t.snapshot=n.snapshot,t.snapshot.latestValues=n.animationValues||n.latestValues),t.root&&t.root.isUpdating&&(t.isLayoutDirty=!0);const{crossfade:r}=t.options;!1===r&&n.hide()}}exitAnimationComplete(){this.members.forEach((t=>{const{options:e,resumingFrom:n}=t;e.onExitComplete&&e.onExitComplete(),n&&n.options.onExitComplete&&n.options.onExitComplete()}))}scheduleRender(){this.members.forEach((t=>{t.instance&&t.scheduleRender(!1)}))}removeLeadSnapshot(){this.lead&&this.lead.snapshot&&(this.lead.snapshot=void 0)}}function qw(t,e,n){let r="";const i=t.x.translate/e.x,o=t.y.translate/e.y;if((i||o)&&(r=`translate3d(${i}px, ${o}px, 0) `),1===e.x&&1===e.y||(r+=`scale(${1/e.x}, ${1/e.y}) `),n){const{rotate:t,rotateX:e,rotateY:i}=n;t&&(r+=`rotate(${t}deg) `),e&&(r+=`rotateX(${e}deg) `),i&&(r+=`rotateY(${i}deg) `)}const a=t.x.scale*e.x,s=t.y.scale*e.y;return 1===a&&1===s||(r+=`scale(${a}, ${s})`),r||"none"}const Kw=(t,e)=>t.depth-e.depth;class Xw{constructor(){this.children=[],this.isDirty=!1}add(t){a_(this.children,t),this.isDirty=!0}remove(t){s_(this.children,t),this.isDirty=!0}forEach(t){this.isDirty&&this.children.sort(Kw),this.isDirty=!1,this.children.forEach(t)}}const Qw=["","X","Y","Z"],Zw={visibility:"hidden"};let Jw=0;const tx={type:"projectionFrame",totalNodes:0,resolvedTargetDeltas:0,recalculatedProjection:0};function ex(t){let{attachResizeListener:e,defaultParent:n,measureScroll:r,checkIsScrollRoot:i,resetTransform:o}=t;return class{constructor(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:null===n||void 0===n?void 0:n();this.id=Jw++,this.animationId=0,this.children=new Set,this.options={},this.isTreeAnimating=!1,this.isAnimationBlocked=!1,this.isLayoutDirty=!1,this.isProjectionDirty=!1,this.isSharedProjectionDirty=!1,this.isTransformDirty=!1,this.updateManuallyBlocked=!1,this.updateBlockedByResize=!1,this.isUpdating=!1,this.isSVG=!1,this.needsReset=!1,this.shouldResetTransform=!1,this.treeScale={x:1,y:1},this.eventHandlers=new Map,this.hasTreeAnimated=!1,this.updateScheduled=!1,this.projectionUpdateScheduled=!1,this.checkUpdateFailed=()=>{this.isUpdating&&(this.isUpdating=!1,this.clearAllSnapshots())},this.updateProjection=()=>{var t;this.projectionUpdateScheduled=!1,tx.totalNodes=tx.resolvedTargetDeltas=tx.recalculatedProjection=0,this.nodes.forEach(ix),this.nodes.forEach(dx),this.nodes.forEach(hx),this.nodes.forEach(ox),t=tx,window.MotionDebug&&window.MotionDebug.record(t)},this.hasProjected=!1,this.isVisible=!0,this.animationProgress=0,this.sharedNodes=new Map,this.latestValues=t,this.root=e?e.root||e:this,this.path=e?[...e.path,e]:[],this.parent=e,this.depth=e?e.depth+1:0;for(let n=0;n<this.path.length;n++)this.path[n].shouldResetTransform=!0;this.root===this&&(this.nodes=new Xw)}addEventListener(t,e){return this.eventHandlers.has(t)||this.eventHandlers.set(t,new l_),this.eventHandlers.get(t).add(e)}notifyListeners(t){const e=this.eventHandlers.get(t);for(var n=arguments.length,r=new Array(n>1?n-1:0),i=1;i<n;i++)r[i-1]=arguments[i];e&&e.notify(...r)}hasListeners(t){return this.eventHandlers.has(t)}mount(t){let n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.root.hasTreeAnimated;if(this.instance)return;var r;this.isSVG=(r=t)instanceof SVGElement&&"svg"!==r.tagName,this.instance=t;const{layoutId:i,layout:o,visualElement:a}=this.options;if(a&&!a.current&&a.mount(t),this.root.nodes.add(this),this.parent&&this.parent.children.add(this),n&&(o||i)&&(this.isLayoutDirty=!0),e){let n;const r=()=>this.root.updateBlockedByResize=!1;e(t,(()=>{this.root.updateBlockedByResize=!0,n&&n(),n=function(t,e){const n=performance.now(),r=i=>{let{timestamp:o}=i;const a=o-n;a>=e&&(sm(r),t(a-e))};return am.read(r,!0),()=>sm(r)}(r,250),ww.hasAnimatedSinceResize&&(ww.hasAnimatedSinceResize=!1,this.nodes.forEach(ux))}))}i&&this.root.registerSharedNode(i,this),!1!==this.options.animate&&a&&(i||o)&&this.addEventListener("didUpdate",(t=>{let{delta:e,hasLayoutChanged:n,hasRelativeTargetChanged:r,layout:i}=t;if(this.isTreeAnimationBlocked())return this.target=void 0,void(this.relativeTarget=void 0);const o=this.options.transition||a.getDefaultTransition()||bx,{onLayoutAnimationStart:s,onLayoutAnimationComplete:l}=a.getProps(),c=!this.targetLayout||!Gw(this.targetLayout,i)||r,u=!n&&r;if(this.options.layoutRoot||this.resumeFrom&&this.resumeFrom.instance||u||n&&(c||!this.currentAnimation)){this.resumeFrom&&(this.resumingFrom=this.resumeFrom,this.resumingFrom.resumingFrom=void 0),this.setAnimationOrigin(e,u);const t={...e_(o,"layout"),onPlay:s,onComplete:l};(a.shouldReduceMotion||this.options.layoutRoot)&&(t.delay=0,t.type=!1),this.startAnimation(t)}else n||ux(this),this.isLead()&&this.options.onExitComplete&&this.options.onExitComplete();this.targetLayout=i}))}unmount(){this.options.layoutId&&this.willUpdate(),this.root.nodes.remove(this);const t=this.getStack();t&&t.remove(this),this.parent&&this.parent.children.delete(this),this.instance=void 0,sm(this.updateProjection)}blockUpdate(){this.updateManuallyBlocked=!0}unblockUpdate(){this.updateManuallyBlocked=!1}isUpdateBlocked(){return this.updateManuallyBlocked||this.updateBlockedByResize}isTreeAnimationBlocked(){return this.isAnimationBlocked||this.parent&&this.parent.isTreeAnimationBlocked()||!1}startUpdate(){this.isUpdateBlocked()||(this.isUpdating=!0,this.nodes&&this.nodes.forEach(fx),this.animationId++)}getTransformTemplate(){const{visualElement:t}=this.options;return t&&t.getProps().transformTemplate}willUpdate(){let t=!(arguments.length>0&&void 0!==arguments[0])||arguments[0];if(this.root.hasTreeAnimated=!0,this.root.isUpdateBlocked())return void(this.options.onExitComplete&&this.options.onExitComplete());if(!this.root.isUpdating&&this.root.startUpdate(),this.isLayoutDirty)return;this.isLayoutDirty=!0;for(let i=0;i<this.path.length;i++){const t=this.path[i];t.shouldResetTransform=!0,t.updateScroll("snapshot"),t.options.layoutRoot&&t.willUpdate(!1)}const{layoutId:e,layout:n}=this.options;if(void 0===e&&!n)return;const r=this.getTransformTemplate();this.prevTransformTemplateValue=r?r(this.latestValues,""):void 0,this.updateSnapshot(),t&&this.notifyListeners("willUpdate")}update(){this.updateScheduled=!1;if(this.isUpdateBlocked())return this.unblockUpdate(),this.clearAllSnapshots(),void this.nodes.forEach(sx);this.isUpdating||this.nodes.forEach(lx),this.isUpdating=!1,this.nodes.forEach(cx),this.nodes.forEach(nx),this.nodes.forEach(rx),this.clearAllSnapshots();const t=performance.now();lm.delta=iy(0,1e3/60,t-lm.timestamp),lm.timestamp=t,lm.isProcessing=!0,cm.update.process(lm),cm.preRender.process(lm),cm.render.process(lm),lm.isProcessing=!1}didUpdate(){this.updateScheduled||(this.updateScheduled=!0,queueMicrotask((()=>this.update())))}clearAllSnapshots(){this.nodes.forEach(ax),this.sharedNodes.forEach(px)}scheduleUpdateProjection(){this.projectionUpdateScheduled||(this.projectionUpdateScheduled=!0,am.preRender(this.updateProjection,!1,!0))}scheduleCheckAfterUnmount(){am.postRender((()=>{this.isLayoutDirty?this.root.didUpdate():this.root.checkUpdateFailed()}))}updateSnapshot(){!this.snapshot&&this.instance&&(this.snapshot=this.measure())}updateLayout(){if(!this.instance)return;if(this.updateScroll(),(!this.options.alwaysMeasureLayout||!this.isLead())&&!this.isLayoutDirty)return;if(this.resumeFrom&&!this.resumeFrom.instance)for(let n=0;n<this.path.length;n++){this.path[n].updateScroll()}const t=this.layout;this.layout=this.measure(!1),this.layoutCorrected={x:{min:0,max:0},y:{min:0,max:0}},this.isLayoutDirty=!1,this.projectionDelta=void 0,this.notifyListeners("measure",this.layout.layoutBox);const{visualElement:e}=this.options;e&&e.notify("LayoutMeasure",this.layout.layoutBox,t?t.layoutBox:void 0)}updateScroll(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:"measure",e=Boolean(this.options.layoutScroll&&this.instance);this.scroll&&this.scroll.animationId===this.root.animationId&&this.scroll.phase===t&&(e=!1),e&&(this.scroll={animationId:this.root.animationId,phase:t,isRoot:i(this.instance),offset:r(this.instance)})}resetTransform(){if(!o)return;const t=this.isLayoutDirty||this.shouldResetTransform,e=this.projectionDelta&&!Ww(this.projectionDelta),n=this.getTransformTemplate(),r=n?n(this.latestValues,""):void 0,i=r!==this.prevTransformTemplateValue;t&&(e||nw(this.latestValues)||i)&&(o(this.instance,r),this.shouldResetTransform=!1,this.scheduleRender())}measure(){let t=!(arguments.length>0&&void 0!==arguments[0])||arguments[0];const e=this.measurePageBox();let n=this.removeElementScroll(e);var r;return t&&(n=this.removeTransform(n)),wx((r=n).x),wx(r.y),{animationId:this.root.animationId,measuredBox:e,layoutBox:n,latestValues:{},source:this.id}}measurePageBox(){const{visualElement:t}=this.options;if(!t)return{x:{min:0,max:0},y:{min:0,max:0}};const e=t.measureViewportBox(),{scroll:n}=this.root;return n&&(uw(e.x,n.offset.x),uw(e.y,n.offset.y)),e}removeElementScroll(t){const e={x:{min:0,max:0},y:{min:0,max:0}};Lw(e,t);for(let n=0;n<this.path.length;n++){const r=this.path[n],{scroll:i,options:o}=r;if(r!==this.root&&i&&o.layoutScroll){if(i.isRoot){Lw(e,t);const{scroll:n}=this.root;n&&(uw(e.x,-n.offset.x),uw(e.y,-n.offset.y))}uw(e.x,i.offset.x),uw(e.y,i.offset.y)}}return e}applyTransform(t){let e=arguments.length>1&&void 0!==arguments[1]&&arguments[1];const n={x:{min:0,max:0},y:{min:0,max:0}};Lw(n,t);for(let r=0;r<this.path.length;r++){const t=this.path[r];!e&&t.options.layoutScroll&&t.scroll&&t!==t.root&&pw(n,{x:-t.scroll.offset.x,y:-t.scroll.offset.y}),nw(t.latestValues)&&pw(n,t.latestValues)}return nw(this.latestValues)&&pw(n,this.latestValues),n}removeTransform(t){const e={x:{min:0,max:0},y:{min:0,max:0}};Lw(e,t);for(let n=0;n<this.path.length;n++){const t=this.path[n];if(!t.instance)continue;if(!nw(t.latestValues))continue;ew(t.latestValues)&&t.updateSnapshot();const r={x:{min:0,max:0},y:{min:0,max:0}};Lw(r,t.measurePageBox()),Vw(e,t.latestValues,t.snapshot?t.snapshot.layoutBox:void 0,r)}return nw(this.latestValues)&&Vw(e,this.latestValues),e}setTargetDelta(t){this.targetDelta=t,this.root.scheduleUpdateProjection(),this.isProjectionDirty=!0}setOptions(t){this.options={...this.options,...t,crossfade:void 0===t.crossfade||t.crossfade}}clearMeasurements(){this.scroll=void 0,this.layout=void 0,this.snapshot=void 0,this.prevTransformTemplateValue=void 0,this.targetDelta=void 0,this.target=void 0,this.isLayoutDirty=!1}forceRelativeParentToResolveTarget(){this.relativeParent&&this.relativeParent.resolvedRelativeTargetAt!==lm.timestamp&&this.relativeParent.resolveTargetDelta(!0)}resolveTargetDelta(){let t=arguments.length>0&&void 0!==arguments[0]&&arguments[0];var e;const n=this.getLead();this.isProjectionDirty||(this.isProjectionDirty=n.isProjectionDirty),this.isTransformDirty||(this.isTransformDirty=n.isTransformDirty),this.isSharedProjectionDirty||(this.isSharedProjectionDirty=n.isSharedProjectionDirty);const r=Boolean(this.resumingFrom)||this!==n;if(!(t||r&&this.isSharedProjectionDirty||this.isProjectionDirty||(null===(e=this.parent)||void 0===e?void 0:e.isProjectionDirty)||this.attemptToResolveRelativeTarget))return;const{layout:i,layoutId:o}=this.options;if(this.layout&&(i||o)){if(this.resolvedRelativeTargetAt=lm.timestamp,!this.targetDelta&&!this.relativeTarget){const t=this.getClosestProjectingParent();t&&t.layout&&1!==this.animationProgress?(this.relativeParent=t,this.forceRelativeParentToResolveTarget(),this.relativeTarget={x:{min:0,max:0},y:{min:0,max:0}},this.relativeTargetOrigin={x:{min:0,max:0},y:{min:0,max:0}},H_(this.relativeTargetOrigin,this.layout.layoutBox,t.layout.layoutBox),Lw(this.relativeTarget,this.relativeTargetOrigin)):this.relativeParent=this.relativeTarget=void 0}if(this.relativeTarget||this.targetDelta){var a,s,l;if(this.target||(this.target={x:{min:0,max:0},y:{min:0,max:0}},this.targetWithTransforms={x:{min:0,max:0},y:{min:0,max:0}}),this.relativeTarget&&this.relativeTargetOrigin&&this.relativeParent&&this.relativeParent.target?(this.forceRelativeParentToResolveTarget(),a=this.target,s=this.relativeTarget,l=this.relativeParent.target,W_(a.x,s.x,l.x),W_(a.y,s.y,l.y)):this.targetDelta?(Boolean(this.resumingFrom)?this.target=this.applyTransform(this.layout.layoutBox):Lw(this.target,this.layout.layoutBox),lw(this.target,this.targetDelta)):Lw(this.target,this.layout.layoutBox),this.attemptToResolveRelativeTarget){this.attemptToResolveRelativeTarget=!1;const t=this.getClosestProjectingParent();t&&Boolean(t.resumingFrom)===Boolean(this.resumingFrom)&&!t.options.layoutScroll&&t.target&&1!==this.animationProgress?(this.relativeParent=t,this.forceRelativeParentToResolveTarget(),this.relativeTarget={x:{min:0,max:0},y:{min:0,max:0}},this.relativeTargetOrigin={x:{min:0,max:0},y:{min:0,max:0}},H_(this.relativeTargetOrigin,this.target,t.target),Lw(this.relativeTarget,this.relativeTargetOrigin)):this.relativeParent=this.relativeTarget=void 0}tx.resolvedTargetDeltas++}}}getClosestProjectingParent(){if(this.parent&&!ew(this.parent.latestValues)&&!rw(this.parent.latestValues))return this.parent.isProjecting()?this.parent:this.parent.getClosestProjectingParent()}isProjecting(){return Boolean((this.relativeTarget||this.targetDelta||this.options.layoutRoot)&&this.layout)}calcProjection(){var t;const e=this.getLead(),n=Boolean(this.resumingFrom)||this!==e;let r=!0;if((this.isProjectionDirty||(null===(t=this.parent)||void 0===t?void 0:t.isProjectionDirty))&&(r=!1),n&&(this.isSharedProjectionDirty||this.isTransformDirty)&&(r=!1),this.resolvedRelativeTargetAt===lm.timestamp&&(r=!1),r)return;const{layout:i,layoutId:o}=this.options;if(this.isTreeAnimating=Boolean(this.parent&&this.parent.isTreeAnimating||this.currentAnimation||this.pendingAnimation),this.isTreeAnimating||(this.targetDelta=this.relativeTarget=void 0),!this.layout||!i&&!o)return;Lw(this.layoutCorrected,this.layout.layoutBox);const a=this.treeScale.x,s=this.treeScale.y;!function(t,e,n){let r=arguments.length>3&&void 0!==arguments[3]&&arguments[3];const i=n.length;if(!i)return;let o,a;e.x=e.y=1;for(let s=0;s<i;s++){o=n[s],a=o.projectionDelta;const i=o.instance;i&&i.style&&"contents"===i.style.display||(r&&o.options.layoutScroll&&o.scroll&&o!==o.root&&pw(t,{x:-o.scroll.offset.x,y:-o.scroll.offset.y}),a&&(e.x*=a.x.scale,e.y*=a.y.scale,lw(t,a)),r&&nw(o.latestValues)&&pw(t,o.latestValues))}e.x=cw(e.x),e.y=cw(e.y)}(this.layoutCorrected,this.treeScale,this.path,n),!e.layout||e.target||1===this.treeScale.x&&1===this.treeScale.y||(e.target=e.layout.layoutBox);const{target:l}=e;if(!l)return void(this.projectionTransform&&(this.projectionDelta={x:{translate:0,scale:1,origin:0,originPoint:0},y:{translate:0,scale:1,origin:0,originPoint:0}},this.projectionTransform="none",this.scheduleRender()));this.projectionDelta||(this.projectionDelta={x:{translate:0,scale:1,origin:0,originPoint:0},y:{translate:0,scale:1,origin:0,originPoint:0}},this.projectionDeltaWithTransform={x:{translate:0,scale:1,origin:0,originPoint:0},y:{translate:0,scale:1,origin:0,originPoint:0}});const c=this.projectionTransform;$_(this.projectionDelta,this.layoutCorrected,l,this.latestValues),this.projectionTransform=qw(this.projectionDelta,this.treeScale),this.projectionTransform===c&&this.treeScale.x===a&&this.treeScale.y===s||(this.hasProjected=!0,this.scheduleRender(),this.notifyListeners("projectionUpdate",l)),tx.recalculatedProjection++}hide(){this.isVisible=!1}show(){this.isVisible=!0}scheduleRender(){let t=!(arguments.length>0&&void 0!==arguments[0])||arguments[0];if(this.options.scheduleRender&&this.options.scheduleRender(),t){const t=this.getStack();t&&t.scheduleRender()}this.resumingFrom&&!this.resumingFrom.instance&&(this.resumingFrom=void 0)}setAnimationOrigin(t){let e=arguments.length>1&&void 0!==arguments[1]&&arguments[1];const n=this.snapshot,r=n?n.latestValues:{},i={...this.latestValues},o={x:{translate:0,scale:1,origin:0,originPoint:0},y:{translate:0,scale:1,origin:0,originPoint:0}};this.relativeParent&&this.relativeParent.options.layoutRoot||(this.relativeTarget=this.relativeTargetOrigin=void 0),this.attemptToResolveRelativeTarget=!e;const a={x:{min:0,max:0},y:{min:0,max:0}},s=(n?n.source:void 0)!==(this.layout?this.layout.source:void 0),l=this.getStack(),c=!l||l.members.length<=1,u=Boolean(s&&!c&&!0===this.options.crossfade&&!this.path.some(yx));let d;this.animationProgress=0,this.mixTargetDelta=e=>{const n=e/1e3;var l,h;gx(o.x,t.x,n),gx(o.y,t.y,n),this.setTargetDelta(o),this.relativeTarget&&this.relativeTargetOrigin&&this.layout&&this.relativeParent&&this.relativeParent.layout&&(H_(a,this.layout.layoutBox,this.relativeParent.layout.layoutBox),function(t,e,n,r){mx(t.x,e.x,n.x,r),mx(t.y,e.y,n.y,r)}(this.relativeTarget,this.relativeTargetOrigin,a,n),d&&(l=this.relativeTarget,h=d,l.x.min===h.x.min&&l.x.max===h.x.max&&l.y.min===h.y.min&&l.y.max===h.y.max)&&(this.isProjectionDirty=!1),d||(d={x:{min:0,max:0},y:{min:0,max:0}}),Lw(d,this.relativeTarget)),s&&(this.animationValues=i,function(t,e,n,r,i,o){i?(t.opacity=Qb(0,void 0!==n.opacity?n.opacity:1,Dw(r)),t.opacityExit=Qb(void 0!==e.opacity?e.opacity:1,0,Rw(r))):o&&(t.opacity=Qb(void 0!==e.opacity?e.opacity:1,void 0!==n.opacity?n.opacity:1,r));for(let a=0;a<Aw;a++){const i=`border${Ew[a]}Radius`;let o=Fw(e,i),s=Fw(n,i);void 0===o&&void 0===s||(o||(o=0),s||(s=0),0===o||0===s||Mw(o)===Mw(s)?(t[i]=Math.max(Qb(Iw(o),Iw(s),r),0),(gy.test(s)||gy.test(o))&&(t[i]+="%")):t[i]=s)}(e.rotate||n.rotate)&&(t.rotate=Qb(e.rotate||0,n.rotate||0,r))}(i,r,this.latestValues,n,u,c)),this.root.scheduleUpdateProjection(),this.scheduleRender(),this.animationProgress=n},this.mixTargetDelta(this.options.layoutRoot?1e3:0)}startAnimation(t){this.notifyListeners("animationStart"),this.currentAnimation&&this.currentAnimation.stop(),this.resumingFrom&&this.resumingFrom.currentAnimation&&this.resumingFrom.currentAnimation.stop(),this.pendingAnimation&&(sm(this.pendingAnimation),this.pendingAnimation=void 0),this.pendingAnimation=am.update((()=>{ww.hasAnimatedSinceResize=!0,this.currentAnimation=function(t,e,n){const r=Qm(t)?t:d_(t);return r.start(r_("",r,e,n)),r.animation}(0,1e3,{...t,onUpdate:e=>{this.mixTargetDelta(e),t.onUpdate&&t.onUpdate(e)},onComplete:()=>{t.onComplete&&t.onComplete(),this.completeAnimation()}}),this.resumingFrom&&(this.resumingFrom.currentAnimation=this.currentAnimation),this.pendingAnimation=void 0}))}completeAnimation(){this.resumingFrom&&(this.resumingFrom.currentAnimation=void 0,this.resumingFrom.preserveOpacity=void 0);const t=this.getStack();t&&t.exitAnimationComplete(),this.resumingFrom=this.currentAnimation=this.animationValues=void 0,this.notifyListeners("animationComplete")}finishAnimation(){this.currentAnimation&&(this.mixTargetDelta&&this.mixTargetDelta(1e3),this.currentAnimation.stop()),this.completeAnimation()}applyTransformsToTarget(){const t=this.getLead();let{targetWithTransforms:e,target:n,layout:r,latestValues:i}=t;if(e&&n&&r){if(this!==t&&this.layout&&r&&xx(this.options.animationType,this.layout.layoutBox,r.layoutBox)){n=this.target||{x:{min:0,max:0},y:{min:0,max:0}};const e=j_(this.layout.layoutBox.x);n.x.min=t.target.x.min,n.x.max=n.x.min+e;const r=j_(this.layout.layoutBox.y);n.y.min=t.target.y.min,n.y.max=n.y.min+r}Lw(e,n),pw(e,i),$_(this.projectionDeltaWithTransform,this.layoutCorrected,e,i)}}registerSharedNode(t,e){this.sharedNodes.has(t)||this.sharedNodes.set(t,new Yw);this.sharedNodes.get(t).add(e);const n=e.options.initialPromotionConfig;e.promote({transition:n?n.transition:void 0,preserveFollowOpacity:n&&n.shouldPreserveFollowOpacity?n.shouldPreserveFollowOpacity(e):void 0})}isLead(){const t=this.getStack();return!t||t.lead===this}getLead(){var t;const{layoutId:e}=this.options;return e&&(null===(t=this.getStack())||void 0===t?void 0:t.lead)||this}getPrevLead(){var t;const{layoutId:e}=this.options;return e?null===(t=this.getStack())||void 0===t?void 0:t.prevLead:void 0}getStack(){const{layoutId:t}=this.options;if(t)return this.root.sharedNodes.get(t)}promote(){let{needsReset:t,transition:e,preserveFollowOpacity:n}=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const r=this.getStack();r&&r.promote(this,n),t&&(this.projectionDelta=void 0,this.needsReset=!0),e&&this.setOptions({transition:e})}relegate(){const t=this.getStack();return!!t&&t.relegate(this)}resetRotation(){const{visualElement:t}=this.options;if(!t)return;let e=!1;const{latestValues:n}=t;if((n.rotate||n.rotateX||n.rotateY||n.rotateZ)&&(e=!0),!e)return;const r={};for(let i=0;i<Qw.length;i++){const e="rotate"+Qw[i];n[e]&&(r[e]=n[e],t.setStaticValue(e,0))}t.render();for(const i in r)t.setStaticValue(i,r[i]);t.scheduleRender()}getProjectionStyles(t){var e,n;if(!this.instance||this.isSVG)return;if(!this.isVisible)return Zw;const r={visibility:""},i=this.getTransformTemplate();if(this.needsReset)return this.needsReset=!1,r.opacity="",r.pointerEvents=Hy(null===t||void 0===t?void 0:t.pointerEvents)||"",r.transform=i?i(this.latestValues,""):"none",r;const o=this.getLead();if(!this.projectionDelta||!this.layout||!o.target){const e={};return this.options.layoutId&&(e.opacity=void 0!==this.latestValues.opacity?this.latestValues.opacity:1,e.pointerEvents=Hy(null===t||void 0===t?void 0:t.pointerEvents)||""),this.hasProjected&&!nw(this.latestValues)&&(e.transform=i?i({},""):"none",this.hasProjected=!1),e}const a=o.animationValues||o.latestValues;this.applyTransformsToTarget(),r.transform=qw(this.projectionDeltaWithTransform,this.treeScale,a),i&&(r.transform=i(a,r.transform));const{x:s,y:l}=this.projectionDelta;r.transformOrigin=`${100*s.origin}% ${100*l.origin}% 0`,o.animationValues?r.opacity=o===this?null!==(n=null!==(e=a.opacity)&&void 0!==e?e:this.latestValues.opacity)&&void 0!==n?n:1:this.preserveOpacity?this.latestValues.opacity:a.opacityExit:r.opacity=o===this?void 0!==a.opacity?a.opacity:"":void 0!==a.opacityExit?a.opacityExit:0;for(const c in Ym){if(void 0===a[c])continue;const{correct:t,applyTo:e}=Ym[c],n="none"===r.transform?a[c]:t(a[c],o);if(e){const t=e.length;for(let i=0;i<t;i++)r[e[i]]=n}else r[c]=n}return this.options.layoutId&&(r.pointerEvents=o===this?Hy(null===t||void 0===t?void 0:t.pointerEvents)||"":"none"),r}clearSnapshot(){this.resumeFrom=this.snapshot=void 0}resetTree(){this.root.nodes.forEach((t=>{var e;return null===(e=t.currentAnimation)||void 0===e?void 0:e.stop()})),this.root.nodes.forEach(sx),this.root.sharedNodes.clear()}}}function nx(t){t.updateLayout()}function rx(t){var e;const n=(null===(e=t.resumeFrom)||void 0===e?void 0:e.snapshot)||t.snapshot;if(t.isLead()&&t.layout&&n&&t.hasListeners("didUpdate")){const{layoutBox:e,measuredBox:r}=t.layout,{animationType:i}=t.options,o=n.source!==t.layout.source;"size"===i?Z_((t=>{const r=o?n.measuredBox[t]:n.layoutBox[t],i=j_(r);r.min=e[t].min,r.max=r.min+i})):xx(i,n.layoutBox,e)&&Z_((r=>{const i=o?n.measuredBox[r]:n.layoutBox[r],a=j_(e[r]);i.max=i.min+a,t.relativeTarget&&!t.currentAnimation&&(t.isProjectionDirty=!0,t.relativeTarget[r].max=t.relativeTarget[r].min+a)}));const a={x:{translate:0,scale:1,origin:0,originPoint:0},y:{translate:0,scale:1,origin:0,originPoint:0}};$_(a,e,n.layoutBox);const s={x:{translate:0,scale:1,origin:0,originPoint:0},y:{translate:0,scale:1,origin:0,originPoint:0}};o?$_(s,t.applyTransform(r,!0),n.measuredBox):$_(s,e,n.layoutBox);const l=!Ww(a);let c=!1;if(!t.resumeFrom){const r=t.getClosestProjectingParent();if(r&&!r.resumeFrom){const{snapshot:i,layout:o}=r;if(i&&o){const a={x:{min:0,max:0},y:{min:0,max:0}};H_(a,n.layoutBox,i.layoutBox);const s={x:{min:0,max:0},y:{min:0,max:0}};H_(s,e,o.layoutBox),Gw(a,s)||(c=!0),r.options.layoutRoot&&(t.relativeTarget=s,t.relativeTargetOrigin=a,t.relativeParent=r)}}}t.notifyListeners("didUpdate",{layout:e,snapshot:n,delta:s,layoutDelta:a,hasLayoutChanged:l,hasRelativeTargetChanged:c})}else if(t.isLead()){const{onExitComplete:e}=t.options;e&&e()}t.options.transition=void 0}function ix(t){tx.totalNodes++,t.parent&&(t.isProjecting()||(t.isProjectionDirty=t.parent.isProjectionDirty),t.isSharedProjectionDirty||(t.isSharedProjectionDirty=Boolean(t.isProjectionDirty||t.parent.isProjectionDirty||t.parent.isSharedProjectionDirty)),t.isTransformDirty||(t.isTransformDirty=t.parent.isTransformDirty))}function ox(t){t.isProjectionDirty=t.isSharedProjectionDirty=t.isTransformDirty=!1}function ax(t){t.clearSnapshot()}function sx(t){t.clearMeasurements()}function lx(t){t.isLayoutDirty=!1}function cx(t){const{visualElement:e}=t.options;e&&e.getProps().onBeforeLayoutMeasure&&e.notify("BeforeLayoutMeasure"),t.resetTransform()}function ux(t){t.finishAnimation(),t.targetDelta=t.relativeTarget=t.target=void 0,t.isProjectionDirty=!0}function dx(t){t.resolveTargetDelta()}function hx(t){t.calcProjection()}function fx(t){t.resetRotation()}function px(t){t.removeLeadSnapshot()}function gx(t,e,n){t.translate=Qb(e.translate,0,n),t.scale=Qb(e.scale,1,n),t.origin=e.origin,t.originPoint=e.originPoint}function mx(t,e,n,r){t.min=Qb(e.min,n.min,r),t.max=Qb(e.max,n.max,r)}function yx(t){return t.animationValues&&void 0!==t.animationValues.opacityExit}const bx={duration:.45,ease:[.4,0,.1,1]},vx=t=>"undefined"!==typeof navigator&&navigator.userAgent.toLowerCase().includes(t),_x=vx("applewebkit/")&&!vx("chrome/")?Math.round:rm;function wx(t){t.min=_x(t.min),t.max=_x(t.max)}function xx(t,e,n){return"position"===t||"preserve-aspect"===t&&!U_(Hw(e),Hw(n),.2)}const Sx=ex({attachResizeListener:(t,e)=>Qy(t,"resize",e),measureScroll:()=>({x:document.documentElement.scrollLeft||document.body.scrollLeft,y:document.documentElement.scrollTop||document.body.scrollTop}),checkIsScrollRoot:()=>!0}),kx={current:void 0},Cx=ex({measureScroll:t=>({x:t.scrollLeft,y:t.scrollTop}),defaultParent:()=>{if(!kx.current){const t=new Sx({});t.mount(window),t.setOptions({layoutScroll:!0}),kx.current=t}return kx.current},resetTransform:(t,e)=>{t.style.transform=void 0!==e?e:"none"},checkIsScrollRoot:t=>Boolean("fixed"===window.getComputedStyle(t).position)}),Tx={pan:{Feature:class extends lb{constructor(){super(...arguments),this.removePointerDownListener=rm}onPointerDown(t){this.session=new D_(t,this.createPanHandlers(),{transformPagePoint:this.node.getTransformPagePoint(),contextWindow:mw(this.node)})}createPanHandlers(){const{onPanSessionStart:t,onPanStart:e,onPan:n,onPanEnd:r}=this.node.getProps();return{onSessionStart:_w(t),onStart:_w(e),onMove:n,onEnd:(t,e)=>{delete this.session,r&&am.update((()=>r(t,e)))}}}mount(){this.removePointerDownListener=tb(this.node.current,"pointerdown",(t=>this.onPointerDown(t)))}update(){this.session&&this.session.updateHandlers(this.createPanHandlers())}unmount(){this.removePointerDownListener(),this.session&&this.session.end()}}},drag:{Feature:class extends lb{constructor(t){super(t),this.removeGroupControls=rm,this.removeListeners=rm,this.controls=new bw(t)}mount(){const{dragControls:t}=this.node.getProps();t&&(this.removeGroupControls=t.subscribe(this.controls)),this.removeListeners=this.controls.addListeners()||rm}unmount(){this.removeGroupControls(),this.removeListeners()}},ProjectionNode:Cx,MeasureLayout:Tw}},Px=/var\((--[a-zA-Z0-9-_]+),? ?([a-zA-Z0-9 ()%#.,-]+)?\)/;function Ex(t,e){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:1;bm(n<=4,`Max CSS variable fallback depth detected in property "${t}". This may indicate a circular fallback dependency.`);const[r,i]=function(t){const e=Px.exec(t);if(!e)return[,];const[,n,r]=e;return[n,r]}(t);if(!r)return;const o=window.getComputedStyle(e).getPropertyValue(r);if(o){const t=o.trim();return o_(t)?parseFloat(t):t}return ny(i)?Ex(i,e,n+1):i}const Ax=new Set(["width","height","top","left","right","bottom","x","y","translateX","translateY"]),Ix=t=>Ax.has(t),Mx=t=>t===oy||t===my,Fx=(t,e)=>parseFloat(t.split(", ")[e]),Dx=(t,e)=>(n,r)=>{let{transform:i}=r;if("none"===i||!i)return 0;const o=i.match(/^matrix3d\((.+)\)$/);if(o)return Fx(o[1],e);{const e=i.match(/^matrix\((.+)\)$/);return e?Fx(e[1],t):0}},Rx=new Set(["x","y","z"]),Ox=qm.filter((t=>!Rx.has(t)));const Nx={width:(t,e)=>{let{x:n}=t,{paddingLeft:r="0",paddingRight:i="0"}=e;return n.max-n.min-parseFloat(r)-parseFloat(i)},height:(t,e)=>{let{y:n}=t,{paddingTop:r="0",paddingBottom:i="0"}=e;return n.max-n.min-parseFloat(r)-parseFloat(i)},top:(t,e)=>{let{top:n}=e;return parseFloat(n)},left:(t,e)=>{let{left:n}=e;return parseFloat(n)},bottom:(t,e)=>{let{y:n}=t,{top:r}=e;return parseFloat(r)+(n.max-n.min)},right:(t,e)=>{let{x:n}=t,{left:r}=e;return parseFloat(r)+(n.max-n.min)},x:Dx(4,13),y:Dx(5,14)};Nx.translateX=Nx.x,Nx.translateY=Nx.y;const Lx=function(t,e){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{},r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{};e={...e},r={...r};const i=Object.keys(e).filter(Ix);let o=[],a=!1;const s=[];if(i.forEach((i=>{const l=t.getValue(i);if(!t.hasValue(i))return;let c=n[i],u=p_(c);const d=e[i];let h;if(Gy(d)){const t=d.length,e=null===d[0]?1:0;c=d[e],u=p_(c);for(let n=e;n<t&&null!==d[n];n++)h?bm(p_(d[n])===h,"All keyframes must be of the same type"):(h=p_(d[n]),bm(h===u||Mx(u)&&Mx(h),"Keyframes must be of the same dimension as the current value"))}else h=p_(d);if(u!==h)if(Mx(u)&&Mx(h)){const t=l.get();"string"===typeof t&&l.set(parseFloat(t)),"string"===typeof d?e[i]=parseFloat(d):Array.isArray(d)&&h===my&&(e[i]=d.map(parseFloat))}else(null===u||void 0===u?void 0:u.transform)&&(null===h||void 0===h?void 0:h.transform)&&(0===c||0===d)?0===c?l.set(h.transform(c)):e[i]=u.transform(d):(a||(o=function(t){const e=[];return Ox.forEach((n=>{const r=t.getValue(n);void 0!==r&&(e.push([n,r.get()]),r.set(n.startsWith("scale")?1:0))})),e.length&&t.render(),e}(t),a=!0),s.push(i),r[i]=void 0!==r[i]?r[i]:e[i],l.jump(d))})),s.length){const n=s.indexOf("height")>=0?window.pageYOffset:null,i=((t,e,n)=>{const r=e.measureViewportBox(),i=e.current,o=getComputedStyle(i),{display:a}=o,s={};"none"===a&&e.setStaticValue("display",t.display||"block"),n.forEach((t=>{s[t]=Nx[t](r,o)})),e.render();const l=e.measureViewportBox();return n.forEach((n=>{const r=e.getValue(n);r&&r.jump(s[n]),t[n]=Nx[n](l,o)})),t})(e,t,s);return o.length&&o.forEach((e=>{let[n,r]=e;t.getValue(n).set(r)})),t.render(),tm&&null!==n&&window.scrollTo({top:n}),{target:i,transitionEnd:r}}return{target:e,transitionEnd:r}};function Bx(t,e,n,r){return(t=>Object.keys(t).some(Ix))(e)?Lx(t,e,n,r):{target:e,transitionEnd:r}}const zx=(t,e,n,r)=>{const i=function(t,e,n){let{...r}=e;const i=t.current;if(!(i instanceof Element))return{target:r,transitionEnd:n};n&&(n={...n}),t.values.forEach((t=>{const e=t.get();if(!ny(e))return;const n=Ex(e,i);n&&t.set(n)}));for(const o in r){const t=r[o];if(!ny(t))continue;const e=Ex(t,i);e&&(r[o]=e,n||(n={}),void 0===n[o]&&(n[o]=t))}return{target:r,transitionEnd:n}}(t,e,r);return Bx(t,e=i.target,n,r=i.transitionEnd)},jx={current:null},Ux={current:!1};const Vx=new WeakMap,$x=Object.keys(zm),Wx=$x.length,Gx=["AnimationStart","AnimationComplete","Update","BeforeLayoutMeasure","LayoutMeasure","LayoutAnimationStart","LayoutAnimationComplete"],Hx=Dm.length;class Yx{constructor(t){let{parent:e,props:n,presenceContext:r,reducedMotionConfig:i,visualState:o}=t,a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};this.current=null,this.children=new Set,this.isVariantNode=!1,this.isControllingVariants=!1,this.shouldReduceMotion=null,this.values=new Map,this.features={},this.valueSubscriptions=new Map,this.prevMotionValues={},this.events={},this.propEventSubscriptions={},this.notifyUpdate=()=>this.notify("Update",this.latestValues),this.render=()=>{this.current&&(this.triggerBuild(),this.renderInstance(this.current,this.renderState,this.props.style,this.projection))},this.scheduleRender=()=>am.render(this.render,!1,!0);const{latestValues:s,renderState:l}=o;this.latestValues=s,this.baseTarget={...s},this.initialValues=n.initial?{...s}:{},this.renderState=l,this.parent=e,this.props=n,this.presenceContext=r,this.depth=e?e.depth+1:0,this.reducedMotionConfig=i,this.options=a,this.isControllingVariants=Rm(n),this.isVariantNode=Om(n),this.isVariantNode&&(this.variantChildren=new Set),this.manuallyAnimateOnMount=Boolean(e&&e.current);const{willChange:c,...u}=this.scrapeMotionValuesFromProps(n,{});for(const d in u){const t=u[d];void 0!==s[d]&&Qm(t)&&(t.set(s[d],!1),i_(c)&&c.add(d))}}scrapeMotionValuesFromProps(t,e){return{}}mount(t){this.current=t,Vx.set(t,this),this.projection&&!this.projection.instance&&this.projection.mount(t),this.parent&&this.isVariantNode&&!this.isControllingVariants&&(this.removeFromVariantTree=this.parent.addVariantChild(this)),this.values.forEach(((t,e)=>this.bindToMotionValue(e,t))),Ux.current||function(){if(Ux.current=!0,tm)if(window.matchMedia){const t=window.matchMedia("(prefers-reduced-motion)"),e=()=>jx.current=t.matches;t.addListener(e),e()}else jx.current=!1}(),this.shouldReduceMotion="never"!==this.reducedMotionConfig&&("always"===this.reducedMotionConfig||jx.current),this.parent&&this.parent.children.add(this),this.update(this.props,this.presenceContext)}unmount(){Vx.delete(this.current),this.projection&&this.projection.unmount(),sm(this.notifyUpdate),sm(this.render),this.valueSubscriptions.forEach((t=>t())),this.removeFromVariantTree&&this.removeFromVariantTree(),this.parent&&this.parent.children.delete(this);for(const t in this.events)this.events[t].clear();for(const t in this.features)this.features[t].unmount();this.current=null}bindToMotionValue(t,e){const n=Km.has(t),r=e.on("change",(e=>{this.latestValues[t]=e,this.props.onUpdate&&am.update(this.notifyUpdate,!1,!0),n&&this.projection&&(this.projection.isTransformDirty=!0)})),i=e.on("renderRequest",this.scheduleRender);this.valueSubscriptions.set(t,(()=>{r(),i()}))}sortNodePosition(t){return this.current&&this.sortInstanceNodePosition&&this.type===t.type?this.sortInstanceNodePosition(this.current,t.current):0}loadFeatures(t,e,n,r){let i,o,{children:a,...s}=t;for(let l=0;l<Wx;l++){const t=$x[l],{isEnabled:e,Feature:n,ProjectionNode:r,MeasureLayout:a}=zm[t];r&&(i=r),e(s)&&(!this.features[t]&&n&&(this.features[t]=new n(this)),a&&(o=a))}if(("html"===this.type||"svg"===this.type)&&!this.projection&&i){this.projection=new i(this.latestValues,this.parent&&this.parent.projection);const{layoutId:t,layout:e,drag:n,dragConstraints:o,layoutScroll:a,layoutRoot:l}=s;this.projection.setOptions({layoutId:t,layout:e,alwaysMeasureLayout:Boolean(n)||o&&Am(o),visualElement:this,scheduleRender:()=>this.scheduleRender(),animationType:"string"===typeof e?e:"both",initialPromotionConfig:r,layoutScroll:a,layoutRoot:l})}return o}updateFeatures(){for(const t in this.features){const e=this.features[t];e.isMounted?e.update():(e.mount(),e.isMounted=!0)}}triggerBuild(){this.build(this.renderState,this.latestValues,this.options,this.props)}measureViewportBox(){return this.current?this.measureInstanceViewportBox(this.current,this.props):{x:{min:0,max:0},y:{min:0,max:0}}}getStaticValue(t){return this.latestValues[t]}setStaticValue(t,e){this.latestValues[t]=e}makeTargetAnimatable(t){let e=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];return this.makeTargetAnimatableFromInstance(t,this.props,e)}update(t,e){(t.transformTemplate||this.props.transformTemplate)&&this.scheduleRender(),this.prevProps=this.props,this.props=t,this.prevPresenceContext=this.presenceContext,this.presenceContext=e;for(let n=0;n<Gx.length;n++){const e=Gx[n];this.propEventSubscriptions[e]&&(this.propEventSubscriptions[e](),delete this.propEventSubscriptions[e]);const r=t["on"+e];r&&(this.propEventSubscriptions[e]=this.on(e,r))}this.prevMotionValues=function(t,e,n){const{willChange:r}=e;for(const i in e){const o=e[i],a=n[i];if(Qm(o))t.addValue(i,o),i_(r)&&r.add(i);else if(Qm(a))t.addValue(i,d_(o,{owner:t})),i_(r)&&r.remove(i);else if(a!==o)if(t.hasValue(i)){const e=t.getValue(i);!e.hasAnimated&&e.set(o)}else{const e=t.getStaticValue(i);t.addValue(i,d_(void 0!==e?e:o,{owner:t}))}}for(const i in n)void 0===e[i]&&t.removeValue(i);return e}(this,this.scrapeMotionValuesFromProps(t,this.prevProps),this.prevMotionValues),this.handleChildMotionValue&&this.handleChildMotionValue()}getProps(){return this.props}getVariant(t){return this.props.variants?this.props.variants[t]:void 0}getDefaultTransition(){return this.props.transition}getTransformPagePoint(){return this.props.transformPagePoint}getClosestVariantNode(){return this.isVariantNode?this:this.parent?this.parent.getClosestVariantNode():void 0}getVariantContext(){if(arguments.length>0&&void 0!==arguments[0]&&arguments[0])return this.parent?this.parent.getVariantContext():void 0;if(!this.isControllingVariants){const t=this.parent&&this.parent.getVariantContext()||{};return void 0!==this.props.initial&&(t.initial=this.props.initial),t}const t={};for(let e=0;e<Hx;e++){const n=Dm[e],r=this.props[n];(Im(r)||!1===r)&&(t[n]=r)}return t}addVariantChild(t){const e=this.getClosestVariantNode();if(e)return e.variantChildren&&e.variantChildren.add(t),()=>e.variantChildren.delete(t)}addValue(t,e){e!==this.values.get(t)&&(this.removeValue(t),this.bindToMotionValue(t,e)),this.values.set(t,e),this.latestValues[t]=e.get()}removeValue(t){this.values.delete(t);const e=this.valueSubscriptions.get(t);e&&(e(),this.valueSubscriptions.delete(t)),delete this.latestValues[t],this.removeValueFromRenderState(t,this.renderState)}hasValue(t){return this.values.has(t)}getValue(t,e){if(this.props.values&&this.props.values[t])return this.props.values[t];let n=this.values.get(t);return void 0===n&&void 0!==e&&(n=d_(e,{owner:this}),this.addValue(t,n)),n}readValue(t){var e;return void 0===this.latestValues[t]&&this.current?null!==(e=this.getBaseTargetFromProps(this.props,t))&&void 0!==e?e:this.readValueFromInstance(this.current,t,this.options):this.latestValues[t]}setBaseTarget(t,e){this.baseTarget[t]=e}getBaseTarget(t){var e;const{initial:n}=this.props,r="string"===typeof n||"object"===typeof n?null===(e=Wy(this.props,n))||void 0===e?void 0:e[t]:void 0;if(n&&void 0!==r)return r;const i=this.getBaseTargetFromProps(this.props,t);return void 0===i||Qm(i)?void 0!==this.initialValues[t]&&void 0===r?void 0:this.baseTarget[t]:i}on(t,e){return this.events[t]||(this.events[t]=new l_),this.events[t].add(e)}notify(t){if(this.events[t]){for(var e=arguments.length,n=new Array(e>1?e-1:0),r=1;r<e;r++)n[r-1]=arguments[r];this.events[t].notify(...n)}}}class qx extends Yx{sortInstanceNodePosition(t,e){return 2&t.compareDocumentPosition(e)?1:-1}getBaseTargetFromProps(t,e){return t.style?t.style[e]:void 0}removeValueFromRenderState(t,e){let{vars:n,style:r}=e;delete n[t],delete r[t]}makeTargetAnimatableFromInstance(t,e,n){let{transition:r,transitionEnd:i,...o}=t,{transformValues:a}=e,s=function(t,e,n){const r={};for(const i in t){const t=b_(i,e);if(void 0!==t)r[i]=t;else{const t=n.getValue(i);t&&(r[i]=t.get())}}return r}(o,r||{},this);if(a&&(i&&(i=a(i)),o&&(o=a(o)),s&&(s=a(s))),n){!function(t,e,n){var r,i;const o=Object.keys(e).filter((e=>!t.hasValue(e))),a=o.length;var s;if(a)for(let l=0;l<a;l++){const a=o[l],c=e[a];let u=null;Array.isArray(c)&&(u=c[0]),null===u&&(u=null!==(i=null!==(r=n[a])&&void 0!==r?r:t.readValue(a))&&void 0!==i?i:e[a]),void 0!==u&&null!==u&&("string"===typeof u&&(o_(u)||Jv(u))?u=parseFloat(u):(s=u,!g_.find(h_(s))&&dv.test(c)&&(u=Zv(a,c))),t.addValue(a,d_(u,{owner:t})),void 0===n[a]&&(n[a]=u),null!==u&&t.setBaseTarget(a,u))}}(this,o,s);const t=zx(this,o,s,i);i=t.transitionEnd,o=t.target}return{transition:r,transitionEnd:i,...o}}}class Kx extends qx{constructor(){super(...arguments),this.type="html"}readValueFromInstance(t,e){if(Km.has(e)){const t=Qv(e);return t&&t.default||0}{const r=(n=t,window.getComputedStyle(n)),i=(ey(e)?r.getPropertyValue(e):r[e])||0;return"string"===typeof i?i.trim():i}var n}measureInstanceViewportBox(t,e){let{transformPagePoint:n}=e;return gw(t,n)}build(t,e,n,r){xy(t,e,n,r.transformTemplate)}scrapeMotionValuesFromProps(t,e){return Vy(t,e)}handleChildMotionValue(){this.childSubscription&&(this.childSubscription(),delete this.childSubscription);const{children:t}=this.props;Qm(t)&&(this.childSubscription=t.on("change",(t=>{this.current&&(this.current.textContent=`${t}`)})))}renderInstance(t,e,n,r){zy(t,e,n,r)}}class Xx extends qx{constructor(){super(...arguments),this.type="svg",this.isSVGTag=!1}getBaseTargetFromProps(t,e){return t[e]}readValueFromInstance(t,e){if(Km.has(e)){const t=Qv(e);return t&&t.default||0}return e=jy.has(e)?e:Pm(e),t.getAttribute(e)}measureInstanceViewportBox(){return{x:{min:0,max:0},y:{min:0,max:0}}}scrapeMotionValuesFromProps(t,e){return $y(t,e)}build(t,e,n,r){Ry(t,e,n,this.isSVGTag,r.transformTemplate)}renderInstance(t,e,n,r){Uy(t,e,0,r)}mount(t){this.isSVGTag=Ny(t.tagName),super.mount(t)}}const Qx=(t,e)=>Hm(t)?new Xx(e,{enableHardwareAcceleration:!1}):new Kx(e,{enableHardwareAcceleration:!0}),Zx={...M_,...bb,...Tx,...{layout:{ProjectionNode:Cx,MeasureLayout:Tw}}},Jx=Wm(((t,e)=>function(t,e,n,r){let{forwardMotionProps:i=!1}=e;return{...Hm(t)?Ky:Xy,preloadedFeatures:n,useRender:By(i),createVisualElement:r,Component:t}}(t,e,Zx,Qx)));const tS=(t,e)=>t.find((t=>t.id===e));function eS(t,e){const n=nS(t,e);return{position:n,index:n?t[n].findIndex((t=>t.id===e)):-1}}function nS(t,e){for(const[n,r]of Object.entries(t))if(tS(r,e))return n}function rS(t){return{position:"fixed",zIndex:"var(--toast-z-index, 5500)",pointerEvents:"none",display:"flex",flexDirection:"column",margin:"top"===t||"bottom"===t?"0 auto":void 0,top:t.includes("top")?"env(safe-area-inset-top, 0px)":void 0,bottom:t.includes("bottom")?"env(safe-area-inset-bottom, 0px)":void 0,right:t.includes("left")?void 0:"env(safe-area-inset-right, 0px)",left:t.includes("right")?void 0:"env(safe-area-inset-left, 0px)"}}function iS(t){const e=Object.assign({},t);for(let n in e)void 0===e[n]&&delete e[n];return e}var oS=/^((children|dangerouslySetInnerHTML|key|ref|autoFocus|defaultValue|defaultChecked|innerHTML|suppressContentEditableWarning|suppressHydrationWarning|valueLink|abbr|accept|acceptCharset|accessKey|action|allow|allowUserMedia|allowPaymentRequest|allowFullScreen|allowTransparency|alt|async|autoComplete|autoPlay|capture|cellPadding|cellSpacing|challenge|charSet|checked|cite|classID|className|cols|colSpan|content|contentEditable|contextMenu|controls|controlsList|coords|crossOrigin|data|dateTime|decoding|default|defer|dir|disabled|disablePictureInPicture|disableRemotePlayback|download|draggable|encType|enterKeyHint|fetchpriority|fetchPriority|form|formAction|formEncType|formMethod|formNoValidate|formTarget|frameBorder|headers|height|hidden|high|href|hrefLang|htmlFor|httpEquiv|id|inputMode|integrity|is|keyParams|keyType|kind|label|lang|list|loading|loop|low|marginHeight|marginWidth|max|maxLength|media|mediaGroup|method|min|minLength|multiple|muted|name|nonce|noValidate|open|optimum|pattern|placeholder|playsInline|poster|preload|profile|radioGroup|readOnly|referrerPolicy|rel|required|reversed|role|rows|rowSpan|sandbox|scope|scoped|scrolling|seamless|selected|shape|size|sizes|slot|span|spellCheck|src|srcDoc|srcLang|srcSet|start|step|style|summary|tabIndex|target|title|translate|type|useMap|value|width|wmode|wrap|about|datatype|inlist|prefix|property|resource|typeof|vocab|autoCapitalize|autoCorrect|autoSave|color|incremental|fallback|inert|itemProp|itemScope|itemType|itemID|itemRef|on|option|results|security|unselectable|accentHeight|accumulate|additive|alignmentBaseline|allowReorder|alphabetic|amplitude|arabicForm|ascent|attributeName|attributeType|autoReverse|azimuth|baseFrequency|baselineShift|baseProfile|bbox|begin|bias|by|calcMode|capHeight|clip|clipPathUnits|clipPath|clipRule|colorInterpolation|colorInterpolationFilters|colorProfile|colorRendering|contentScriptType|contentStyleType|cursor|cx|cy|d|decelerate|descent|diffuseConstant|direction|display|divisor|dominantBaseline|dur|dx|dy|edgeMode|elevation|enableBackground|end|exponent|externalResourcesRequired|fill|fillOpacity|fillRule|filter|filterRes|filterUnits|floodColor|floodOpacity|focusable|fontFamily|fontSize|fontSizeAdjust|fontStretch|fontStyle|fontVariant|fontWeight|format|from|fr|fx|fy|g1|g2|glyphName|glyphOrientationHorizontal|glyphOrientationVertical|glyphRef|gradientTransform|gradientUnits|hanging|horizAdvX|horizOriginX|ideographic|imageRendering|in|in2|intercept|k|k1|k2|k3|k4|kernelMatrix|kernelUnitLength|kerning|keyPoints|keySplines|keyTimes|lengthAdjust|letterSpacing|lightingColor|limitingConeAngle|local|markerEnd|markerMid|markerStart|markerHeight|markerUnits|markerWidth|mask|maskContentUnits|maskUnits|mathematical|mode|numOctaves|offset|opacity|operator|order|orient|orientation|origin|overflow|overlinePosition|overlineThickness|panose1|paintOrder|pathLength|patternContentUnits|patternTransform|patternUnits|pointerEvents|points|pointsAtX|pointsAtY|pointsAtZ|preserveAlpha|preserveAspectRatio|primitiveUnits|r|radius|refX|refY|renderingIntent|repeatCount|repeatDur|requiredExtensions|requiredFeatures|restart|result|rotate|rx|ry|scale|seed|shapeRendering|slope|spacing|specularConstant|specularExponent|speed|spreadMethod|startOffset|stdDeviation|stemh|stemv|stitchTiles|stopColor|stopOpacity|strikethroughPosition|strikethroughThickness|string|stroke|strokeDasharray|strokeDashoffset|strokeLinecap|strokeLinejoin|strokeMiterlimit|strokeOpacity|strokeWidth|surfaceScale|systemLanguage|tableValues|targetX|targetY|textAnchor|textDecoration|textRendering|textLength|to|transform|u1|u2|underlinePosition|underlineThickness|unicode|unicodeBidi|unicodeRange|unitsPerEm|vAlphabetic|vHanging|vIdeographic|vMathematical|values|vectorEffect|version|vertAdvY|vertOriginX|vertOriginY|viewBox|viewTarget|visibility|widths|wordSpacing|writingMode|x|xHeight|x1|x2|xChannelSelector|xlinkActuate|xlinkArcrole|xlinkHref|xlinkRole|xlinkShow|xlinkTitle|xlinkType|xmlBase|xmlns|xmlnsXlink|xmlLang|xmlSpace|y|y1|y2|yChannelSelector|z|zoomAndPan|for|class|autofocus)|(([Dd][Aa][Tt][Aa]|[Aa][Rr][Ii][Aa]|x)-.*))$/,aS=Pf((function(t){return oS.test(t)||111===t.charCodeAt(0)&&110===t.charCodeAt(1)&&t.charCodeAt(2)<91})),sS=function(t){return"theme"!==t},lS=function(t){return"string"===typeof t&&t.charCodeAt(0)>96?aS:sS},cS=function(t,e,n){var r;if(e){var i=e.shouldForwardProp;r=t.__emotion_forwardProp&&i?function(e){return t.__emotion_forwardProp(e)&&i(e)}:i}return"function"!==typeof r&&n&&(r=t.__emotion_forwardProp),r},uS=function(t){var e=t.cache,n=t.serialized,r=t.isStringTag;return kf(e,n,r),zf((function(){return Cf(e,n,r)})),null},dS=function t(e,n){var r,i,o=e.__emotion_real===e,a=o&&e.__emotion_base||e;void 0!==n&&(r=n.label,i=n.target);var s=cS(e,n,o),l=s||lS(a),c=!l("as");return function(){var u=arguments,h=o&&void 0!==e.__emotion_styles?e.__emotion_styles.slice(0):[];if(void 0!==r&&h.push("label:"+r+";"),null==u[0]||void 0===u[0].raw)h.push.apply(h,u);else{var f=u[0];h.push(f[0]);for(var p=u.length,g=1;g<p;g++)h.push(u[g],f[g])}var m=Vf((function(t,e,n){var r=c&&t.as||a,o="",u=[],f=t;if(null==t.theme){for(var p in f={},t)f[p]=t[p];f.theme=d.useContext($f)}"string"===typeof t.className?o=Sf(e.registered,u,t.className):null!=t.className&&(o=t.className+" ");var g=Lf(h.concat(u),e.registered,f);o+=e.key+"-"+g.name,void 0!==i&&(o+=" "+i);var m=c&&void 0===s?lS(r):l,y={};for(var b in t)c&&"as"===b||m(b)&&(y[b]=t[b]);return y.className=o,n&&(y.ref=n),d.createElement(d.Fragment,null,d.createElement(uS,{cache:e,serialized:g,isStringTag:"string"===typeof r}),d.createElement(r,y))}));return m.displayName=void 0!==r?r:"Styled("+("string"===typeof a?a:a.displayName||a.name||"Component")+")",m.defaultProps=e.defaultProps,m.__emotion_real=m,m.__emotion_base=a,m.__emotion_styles=h,m.__emotion_forwardProp=s,Object.defineProperty(m,"toString",{value:function(){return"."+i}}),m.withComponent=function(e,r){return t(e,wf({},n,r,{shouldForwardProp:cS(m,r,!0)})).apply(void 0,h)},m}}.bind(null);["a","abbr","address","area","article","aside","audio","b","base","bdi","bdo","big","blockquote","body","br","button","canvas","caption","cite","code","col","colgroup","data","datalist","dd","del","details","dfn","dialog","div","dl","dt","em","embed","fieldset","figcaption","figure","footer","form","h1","h2","h3","h4","h5","h6","head","header","hgroup","hr","html","i","iframe","img","input","ins","kbd","keygen","label","legend","li","link","main","map","mark","marquee","menu","menuitem","meta","meter","nav","noscript","object","ol","optgroup","option","output","p","param","picture","pre","progress","q","rp","rt","ruby","s","samp","script","section","select","small","source","span","strong","style","sub","summary","sup","table","tbody","td","textarea","tfoot","th","thead","time","title","tr","track","u","ul","var","video","wbr","circle","clipPath","defs","ellipse","foreignObject","g","image","line","linearGradient","mask","path","pattern","polygon","polyline","radialGradient","rect","stop","svg","text","tspan"].forEach((function(t){dS[t]=dS(t)}));const hS=new Set([...Rg,"textStyle","layerStyle","apply","noOfLines","focusBorderColor","errorBorderColor","as","__css","css","sx"]),fS=new Set(["htmlWidth","htmlHeight","htmlSize","htmlTranslate"]);function pS(t){return(fS.has(t)||!hS.has(t))&&"_"!==t[0]}const gS=(mS=dS).default||mS;var mS;const yS=t=>{let{baseStyle:e}=t;return t=>{const{theme:n,css:r,__css:i,sx:o,...a}=t,[s]=function(t){const e=Object.getOwnPropertyDescriptors(t),n=Object.keys(e),r=t=>{const n={};for(let r=0;r<t.length;r++){const i=t[r];e[i]&&(Object.defineProperty(n,i,e[i]),delete e[i])}return n};for(var i=arguments.length,o=new Array(i>1?i-1:0),a=1;a<i;a++)o[a-1]=arguments[a];return o.map((t=>r(Array.isArray(t)?t:n.filter(t)))).concat(r(n))}(a,Ng),l=function(t){if(null==t)throw new TypeError("Cannot convert undefined or null to object");const e={...t};for(var n=arguments.length,r=new Array(n>1?n-1:0),i=1;i<n;i++)r[i-1]=arguments[i];for(const o of r)if(null!=o)for(const t in o)Object.prototype.hasOwnProperty.call(o,t)&&(t in e&&delete e[t],e[t]=o[t]);return e}({},i,Gp(e,t),iS(s),o),c=jg(l)(t.theme);return r?[c,r]:c}};function bS(t,e){const{baseStyle:n,...r}=e??{};r.shouldForwardProp||(r.shouldForwardProp=pS);const i=yS({baseStyle:n}),o=gS(t,r)(i);return(0,d.forwardRef)((function(t,e){const{children:n,...r}=t,{colorMode:i,forced:a}=Qf(),s=a?i:void 0;return(0,d.createElement)(o,{ref:e,"data-theme":s,...r},n)}))}const vS=function(){const t=new Map;return new Proxy(bS,{apply:(t,e,n)=>bS(...n),get:(e,n)=>(t.has(n)||t.set(n,bS(n)),t.get(n))})}(),_S={initial:t=>{const{position:e}=t,n=["top","bottom"].includes(e)?"y":"x";let r=["top-right","bottom-right"].includes(e)?1:-1;return"bottom"===e&&(r=1),{opacity:0,[n]:24*r}},animate:{opacity:1,y:0,x:0,scale:1,transition:{duration:.4,ease:[.4,0,.2,1]}},exit:{opacity:0,scale:.85,transition:{duration:.2,ease:[.4,0,1,1]}}},wS=(0,d.memo)((t=>{const{id:e,message:n,onCloseComplete:r,onRequestRemove:i,requestClose:o=!1,position:a="bottom",duration:s=5e3,containerStyle:l,motionVariants:c=_S,toastSpacing:u="0.5rem"}=t,[h,f]=(0,d.useState)(s),p=Sm();wm((()=>{p||r?.()}),[p]),wm((()=>{f(s)}),[s]);const g=()=>{p&&i()};(0,d.useEffect)((()=>{p&&o&&i()}),[p,o,i]),xm(g,h);const m=(0,d.useMemo)((()=>({pointerEvents:"auto",maxWidth:560,minWidth:300,margin:u,...l})),[l,u]),y=(0,d.useMemo)((()=>function(t){let e="center";return t.includes("right")&&(e="flex-end"),t.includes("left")&&(e="flex-start"),{display:"flex",flexDirection:"column",alignItems:e}}(a)),[a]);return(0,yh.jsx)(Jx.div,{layout:!0,className:"chakra-toast",variants:c,initial:"initial",animate:"animate",exit:"exit",onHoverStart:()=>f(null),onHoverEnd:()=>f(s),custom:{position:a},style:y,children:(0,yh.jsx)(vS.div,{role:"status","aria-atomic":"true",className:"chakra-toast__inner",__css:m,children:Gp(n,{id:e,onClose:g})})})}));function xS(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[];const n=Object.assign({},t);for(const r of e)r in n&&delete n[r];return n}function SS(t){return xS(t,["styleConfig","size","variant","colorScheme"])}wS.displayName="ToastComponent";const kS=function(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return e.filter(Boolean).join(" ")};function CS(t){return(0,d.forwardRef)(t)}function TS(t,e){for(let n=e+1;n<t.length;n++)if(null!=t[n])return n;return-1}function PS(t){const e=t.__breakpoints;return function(t,n,r,i){if(!e)return;const o={},a=function(t,e){return Array.isArray(t)?t:Nc(t)?e(t):null!=t?[t]:void 0}(r,e.toArrayValue);if(!a)return o;const s=a.length,l=1===s,c=!!t.parts;for(let u=0;u<s;u++){const r=e.details[u],s=e.details[TS(a,u)],d=xp(r.minW,s?._minW),h=Gp(t[n]?.[a[u]],i);h&&(c?t.parts?.forEach((t=>{kp(o,{[t]:l?h[t]:{[d]:h[t]}})})):c?o[d]=h:l?kp(o,h):o[d]=h)}return o}}var ES=n(6366);function AS(){return{...Qf(),theme:function(){const t=(0,d.useContext)($f);if(!t)throw Error("useTheme: `theme` is undefined. Seems you forgot to wrap your app in `<ChakraProvider />` or `<ThemeProvider />`");return t}()}}function IS(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};const{styleConfig:n,...r}=e,{theme:i,colorMode:o}=AS(),a=t?Vg(i,`components.${t}`):void 0,s=n||a,l=kp({theme:i,colorMode:o},s?.defaultProps??{},iS(xS(r,["children"])),((t,e)=>t?void 0:e)),c=(0,d.useRef)({});if(s){const t=function(t){return e=>{const{variant:n,size:r,theme:i}=e,o=PS(i);return kp({},Gp(t.baseStyle??{},e),o(t,"sizes",r,e),o(t,"variants",n,e))}}(s),e=t(l);ES(c.current,e)||(c.current=e)}return c.current}function MS(t){return IS(t,arguments.length>1&&void 0!==arguments[1]?arguments[1]:{})}function FS(t){return IS(t,arguments.length>1&&void 0!==arguments[1]?arguments[1]:{})}const DS={path:(0,yh.jsxs)("g",{stroke:"currentColor",strokeWidth:"1.5",children:[(0,yh.jsx)("path",{strokeLinecap:"round",fill:"none",d:"M9,9a3,3,0,1,1,4,2.829,1.5,1.5,0,0,0-1,1.415V14.25"}),(0,yh.jsx)("path",{fill:"currentColor",strokeLinecap:"round",d:"M12,17.25a.375.375,0,1,0,.375.375A.375.375,0,0,0,12,17.25h0"}),(0,yh.jsx)("circle",{fill:"none",strokeMiterlimit:"10",cx:"12",cy:"12",r:"11.25"})]}),viewBox:"0 0 24 24"},RS=CS(((t,e)=>{const{as:n,viewBox:r,color:i="currentColor",focusable:o=!1,children:a,className:s,__css:l,...c}=t,u={ref:e,focusable:o,className:kS("chakra-icon",s),__css:{w:"1em",h:"1em",display:"inline-block",lineHeight:"1em",flexShrink:0,color:i,...l,...MS("Icon",t)}},d=r??DS.viewBox;if(n&&"string"!==typeof n)return(0,yh.jsx)(vS.svg,{as:n,...u,...c});const h=a??DS.path;return(0,yh.jsx)(vS.svg,{verticalAlign:"middle",viewBox:d,...u,...c,children:h})}));function OS(t){return(0,yh.jsx)(RS,{viewBox:"0 0 24 24",...t,children:(0,yh.jsx)("path",{fill:"currentColor",d:"M11.983,0a12.206,12.206,0,0,0-8.51,3.653A11.8,11.8,0,0,0,0,12.207,11.779,11.779,0,0,0,11.8,24h.214A12.111,12.111,0,0,0,24,11.791h0A11.766,11.766,0,0,0,11.983,0ZM10.5,16.542a1.476,1.476,0,0,1,1.449-1.53h.027a1.527,1.527,0,0,1,1.523,1.47,1.475,1.475,0,0,1-1.449,1.53h-.027A1.529,1.529,0,0,1,10.5,16.542ZM11,12.5v-6a1,1,0,0,1,2,0v6a1,1,0,1,1-2,0Z"})})}RS.displayName="Icon";const NS=function(){var t=dp.apply(void 0,arguments),e="animation-"+t.name;return{name:e,styles:"@keyframes "+e+"{"+t.styles+"}",anim:1,toString:function(){return"_EMO_"+this.name+"_"+this.styles+"_EMO_"}}}({"0%":{transform:"rotate(0deg)"},"100%":{transform:"rotate(360deg)"}}),LS=CS(((t,e)=>{const n=MS("Spinner",t),{label:r="Loading...",thickness:i="2px",speed:o="0.45s",emptyColor:a="transparent",className:s,...l}=SS(t),c=kS("chakra-spinner",s),u={display:"inline-block",borderColor:"currentColor",borderStyle:"solid",borderRadius:"99999px",borderWidth:i,borderBottomColor:a,borderLeftColor:a,animation:`${NS} ${o} linear infinite`,...n};return(0,yh.jsx)(vS.div,{ref:e,__css:u,className:c,...l,children:r&&(0,yh.jsx)(vS.span,{srOnly:!0,children:r})})}));LS.displayName="Spinner";const[BS,zS]=Ug({name:"AlertContext",hookName:"useAlertContext",providerName:"<Alert />"}),[jS,US]=Ug({name:"AlertStylesContext",hookName:"useAlertStyles",providerName:"<Alert />"}),VS={info:{icon:function(t){return(0,yh.jsx)(RS,{viewBox:"0 0 24 24",...t,children:(0,yh.jsx)("path",{fill:"currentColor",d:"M12,0A12,12,0,1,0,24,12,12.013,12.013,0,0,0,12,0Zm.25,5a1.5,1.5,0,1,1-1.5,1.5A1.5,1.5,0,0,1,12.25,5ZM14.5,18.5h-4a1,1,0,0,1,0-2h.75a.25.25,0,0,0,.25-.25v-4.5a.25.25,0,0,0-.25-.25H10.5a1,1,0,0,1,0-2h1a2,2,0,0,1,2,2v4.75a.25.25,0,0,0,.25.25h.75a1,1,0,1,1,0,2Z"})})},colorScheme:"blue"},warning:{icon:OS,colorScheme:"orange"},success:{icon:function(t){return(0,yh.jsx)(RS,{viewBox:"0 0 24 24",...t,children:(0,yh.jsx)("path",{fill:"currentColor",d:"M12,0A12,12,0,1,0,24,12,12.014,12.014,0,0,0,12,0Zm6.927,8.2-6.845,9.289a1.011,1.011,0,0,1-1.43.188L5.764,13.769a1,1,0,1,1,1.25-1.562l4.076,3.261,6.227-8.451A1,1,0,1,1,18.927,8.2Z"})})},colorScheme:"green"},error:{icon:OS,colorScheme:"red"},loading:{icon:LS,colorScheme:"blue"}};const $S=CS((function(t,e){const{status:n="info",addRole:r=!0,...i}=SS(t),o=t.colorScheme??function(t){return VS[t].colorScheme}(n),a=FS("Alert",{...t,colorScheme:o}),s={width:"100%",display:"flex",alignItems:"center",position:"relative",overflow:"hidden",...a.container};return(0,yh.jsx)(BS,{value:{status:n},children:(0,yh.jsx)(jS,{value:a,children:(0,yh.jsx)(vS.div,{"data-status":n,role:r?"alert":void 0,ref:e,...i,className:kS("chakra-alert",t.className),__css:s})})})}));function WS(t){const{status:e}=zS(),n=function(t){return VS[t].icon}(e),r=US(),i="loading"===e?r.spinner:r.icon;return(0,yh.jsx)(vS.span,{display:"inherit","data-status":e,...t,className:kS("chakra-alert__icon",t.className),__css:i,children:t.children||(0,yh.jsx)(n,{h:"100%",w:"100%"})})}$S.displayName="Alert",WS.displayName="AlertIcon";const GS=CS((function(t,e){const n=US(),{status:r}=zS();return(0,yh.jsx)(vS.div,{ref:e,"data-status":r,...t,className:kS("chakra-alert__title",t.className),__css:n.title})}));GS.displayName="AlertTitle";const HS=CS((function(t,e){const{status:n}=zS(),r={display:"inline",...US().description};return(0,yh.jsx)(vS.div,{ref:e,"data-status":n,...t,className:kS("chakra-alert__desc",t.className),__css:r})}));function YS(t){return(0,yh.jsx)(RS,{focusable:"false","aria-hidden":!0,...t,children:(0,yh.jsx)("path",{fill:"currentColor",d:"M.439,21.44a1.5,1.5,0,0,0,2.122,2.121L11.823,14.3a.25.25,0,0,1,.354,0l9.262,9.263a1.5,1.5,0,1,0,2.122-2.121L14.3,12.177a.25.25,0,0,1,0-.354l9.263-9.262A1.5,1.5,0,0,0,21.439.44L12.177,9.7a.25.25,0,0,1-.354,0L2.561.44A1.5,1.5,0,0,0,.439,2.561L9.7,11.823a.25.25,0,0,1,0,.354Z"})})}HS.displayName="AlertDescription";const qS=CS((function(t,e){const n=MS("CloseButton",t),{children:r,isDisabled:i,__css:o,...a}=SS(t);return(0,yh.jsx)(vS.button,{type:"button","aria-label":"Close",ref:e,disabled:i,__css:{outline:0,display:"flex",alignItems:"center",justifyContent:"center",flexShrink:0,...n,...o},...a,children:r||(0,yh.jsx)(YS,{width:"1em",height:"1em"})})}));qS.displayName="CloseButton";const KS=t=>{const{status:e,variant:n="solid",id:r,title:i,isClosable:o,onClose:a,description:s,colorScheme:l,icon:c}=t,u=r?{root:`toast-${r}`,title:`toast-${r}-title`,description:`toast-${r}-description`}:void 0;return(0,yh.jsxs)($S,{addRole:!1,status:e,variant:n,id:u?.root,alignItems:"start",borderRadius:"md",boxShadow:"lg",paddingEnd:8,textAlign:"start",width:"auto",colorScheme:l,children:[(0,yh.jsx)(WS,{children:c}),(0,yh.jsxs)(vS.div,{flex:"1",maxWidth:"100%",children:[i&&(0,yh.jsx)(GS,{id:u?.title,children:i}),s&&(0,yh.jsx)(HS,{id:u?.description,display:"block",children:s})]}),o&&(0,yh.jsx)(qS,{size:"sm",onClick:a,position:"absolute",insetEnd:1,top:1})]})};function XS(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const{render:e,toastComponent:n=KS}=t;return r=>"function"===typeof e?e({...r,...t}):(0,yh.jsx)(n,{...r,...t})}const QS=function(t){let e=t;const n=new Set,r=t=>{e=t(e),n.forEach((t=>t()))};return{getState:()=>e,subscribe:e=>(n.add(e),()=>{r((()=>t)),n.delete(e)}),removeToast:(t,e)=>{r((n=>({...n,[e]:n[e].filter((e=>e.id!=t))})))},notify:(t,e)=>{const n=function(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};ZS+=1;const n=e.id??ZS,r=e.position??"bottom";return{id:n,message:t,position:r,duration:e.duration,onCloseComplete:e.onCloseComplete,onRequestRemove:()=>QS.removeToast(String(n),r),status:e.status,requestClose:!1,containerStyle:e.containerStyle}}(t,e),{position:i,id:o}=n;return r((t=>{const e=i.includes("top")?[n,...t[i]??[]]:[...t[i]??[],n];return{...t,[i]:e}})),o},update:(t,e)=>{t&&r((n=>{const r={...n},{position:i,index:o}=eS(r,t);return i&&-1!==o&&(r[i][o]={...r[i][o],...e,message:XS(e)}),r}))},closeAll:function(){let{positions:t}=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};r((e=>(t??["bottom","bottom-right","bottom-left","top","top-left","top-right"]).reduce(((t,n)=>(t[n]=e[n].map((t=>({...t,requestClose:!0}))),t)),{...e})))},close:t=>{r((e=>{const n=nS(e,t);return n?{...e,[n]:e[n].map((e=>e.id==t?{...e,requestClose:!0}:e))}:e}))},isActive:t=>Boolean(eS(QS.getState(),t).position)}}({top:[],"top-left":[],"top-right":[],"bottom-left":[],bottom:[],"bottom-right":[]});let ZS=0;const JS=Boolean(globalThis?.document)?d.useLayoutEffect:d.useEffect;var tk=n(7950);const[ek,nk]=Ug({strict:!1,name:"PortalContext"}),rk="chakra-portal",ik=t=>(0,yh.jsx)("div",{className:"chakra-portal-zIndex",style:{position:"absolute",zIndex:t.zIndex,top:0,left:0,right:0},children:t.children}),ok=t=>{const{appendToParentPortal:e,children:n}=t,[r,i]=(0,d.useState)(null),o=(0,d.useRef)(null),[,a]=(0,d.useState)({});(0,d.useEffect)((()=>a({})),[]);const s=nk(),l=Kg();JS((()=>{if(!r)return;const t=r.ownerDocument,n=e?s??t.body:t.body;if(!n)return;o.current=t.createElement("div"),o.current.className=rk,n.appendChild(o.current),a({});const i=o.current;return()=>{n.contains(i)&&n.removeChild(i)}}),[r]);const c=l?.zIndex?(0,yh.jsx)(ik,{zIndex:l?.zIndex,children:n}):n;return o.current?(0,tk.createPortal)((0,yh.jsx)(ek,{value:o.current,children:c}),o.current):(0,yh.jsx)("span",{ref:t=>{t&&i(t)}})},ak=t=>{const{children:e,containerRef:n,appendToParentPortal:r}=t,i=n.current,o=i??("undefined"!==typeof window?document.body:void 0),a=(0,d.useMemo)((()=>{const t=i?.ownerDocument.createElement("div");return t&&(t.className=rk),t}),[i]),[,s]=(0,d.useState)({});return JS((()=>s({})),[]),JS((()=>{if(a&&o)return o.appendChild(a),()=>{o.removeChild(a)}}),[a,o]),o&&a?(0,tk.createPortal)((0,yh.jsx)(ek,{value:r?a:null,children:e}),a):null};function sk(t){const e={appendToParentPortal:!0,...t},{containerRef:n,...r}=e;return n?(0,yh.jsx)(ak,{containerRef:n,...r}):(0,yh.jsx)(ok,{...r})}sk.className=rk,sk.selector=".chakra-portal",sk.displayName="Portal";const[lk,ck]=Ug({name:"ToastOptionsContext",strict:!1}),uk=t=>{const e=(0,d.useSyncExternalStore)(QS.subscribe,QS.getState,QS.getState),{motionVariants:n,component:r=wS,portalProps:i,animatePresenceProps:o}=t,a=Object.keys(e).map((t=>{const i=e[t];return(0,yh.jsx)("div",{role:"region","aria-live":"polite","aria-label":`Notifications-${t}`,id:`chakra-toast-manager-${t}`,style:rS(t),children:(0,yh.jsx)(_m,{...o,initial:!1,children:i.map((t=>(0,yh.jsx)(r,{motionVariants:n,...t},t.id)))})},t)}));return(0,yh.jsx)(sk,{...i,children:a})},dk=(hk=gh,function(t){let{children:e,theme:n=hk,toastOptions:r,...i}=t;return(0,yh.jsxs)(Jg,{theme:n,...i,children:[(0,yh.jsx)(lk,{value:r?.defaultOptions,children:e}),(0,yh.jsx)(uk,{...r})]})});var hk;const fk=t=>(0,yh.jsx)(vS.div,{className:"chakra-stack__item",...t,__css:{display:"inline-block",flex:"0 0 auto",minWidth:0,...t.__css}});fk.displayName="StackItem";Object.freeze(["base","sm","md","lg","xl","2xl"]);const pk=CS(((t,e)=>{const{isInline:n,direction:r,align:i,justify:o,spacing:a="0.5rem",wrap:s,children:l,divider:c,className:u,shouldWrapChildren:h,...f}=t,p=n?"row":r??"column",g=(0,d.useMemo)((()=>function(t){const{spacing:e,direction:n}=t,r={column:{my:e,mx:0,borderLeftWidth:0,borderBottomWidth:"1px"},"column-reverse":{my:e,mx:0,borderLeftWidth:0,borderBottomWidth:"1px"},row:{mx:e,my:0,borderLeftWidth:"1px",borderBottomWidth:0},"row-reverse":{mx:e,my:0,borderLeftWidth:"1px",borderBottomWidth:0}};return{"&":(i=n,o=t=>r[t],Array.isArray(i)?i.map((t=>null===t?null:o(t))):Nc(i)?Object.keys(i).reduce(((t,e)=>(t[e]=o(i[e]),t)),{}):null!=i?o(i):null)};var i,o}({spacing:a,direction:p})),[a,p]),m=!!c,y=!h&&!m,b=(0,d.useMemo)((()=>{const t=function(t){return d.Children.toArray(t).filter((t=>(0,d.isValidElement)(t)))}(l);return y?t:t.map(((e,n)=>{const r="undefined"!==typeof e.key?e.key:n,i=n+1===t.length,o=h?(0,yh.jsx)(fk,{children:e},r):e;if(!m)return o;const a=(0,d.cloneElement)(c,{__css:g}),s=i?null:a;return(0,yh.jsxs)(d.Fragment,{children:[o,s]},r)}))}),[c,g,m,y,h,l]),v=kS("chakra-stack",u);return(0,yh.jsx)(vS.div,{ref:e,display:"flex",alignItems:i,justifyContent:o,flexDirection:p,flexWrap:s,gap:m?void 0:a,className:v,...f,children:b})}));pk.displayName="Stack";const gk=CS(((t,e)=>(0,yh.jsx)(pk,{align:"center",...t,direction:"column",ref:e})));gk.displayName="VStack";const mk=vS("div");mk.displayName="Box";const yk=CS((function(t,e){const n=MS("Text",t),{className:r,align:i,decoration:o,casing:a,...s}=SS(t),l=iS({textAlign:t.align,textDecoration:t.decoration,textTransform:t.casing});return(0,yh.jsx)(vS.p,{ref:e,className:kS("chakra-text",t.className),...l,...s,__css:n})}));yk.displayName="Text";const bk=CS((function(t,e){const{direction:n,align:r,justify:i,wrap:o,basis:a,grow:s,shrink:l,...c}=t,u={display:"flex",flexDirection:n,alignItems:r,justifyContent:i,flexWrap:o,flexBasis:a,flexGrow:s,flexShrink:l};return(0,yh.jsx)(vS.div,{ref:e,__css:u,...c})}));bk.displayName="Flex";const vk=CS(((t,e)=>(0,yh.jsx)(pk,{align:"center",...t,direction:"row",ref:e})));vk.displayName="HStack";const _k=t=>t?"":void 0,wk=t=>!!t||void 0;function xk(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return function(t){e.some((e=>(e?.(t),t?.defaultPrevented)))}}function Sk(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return t=>{e.forEach((e=>{!function(t,e){if(null!=t)if("function"!==typeof t)try{t.current=e}catch(cT){throw new Error(`Cannot assign value '${e}' to ref '${t}'`)}else t(e)}(e,t)}))}}function kk(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return(0,d.useMemo)((()=>Sk(...e)),e)}const[Ck,Tk]=Ug({name:"FormControlStylesContext",errorMessage:"useFormControlStyles returned is 'undefined'. Seems you forgot to wrap the components in \"<FormControl />\" "}),[Pk,Ek]=Ug({strict:!1,name:"FormControlContext"});const Ak=CS((function(t,e){const n=FS("Form",t),r=SS(t),{getRootProps:i,htmlProps:o,...a}=function(t){const{id:e,isRequired:n,isInvalid:r,isDisabled:i,isReadOnly:o,...a}=t,s=(0,d.useId)(),l=e||`field-${s}`,c=`${l}-label`,u=`${l}-feedback`,h=`${l}-helptext`,[f,p]=(0,d.useState)(!1),[g,m]=(0,d.useState)(!1),[y,b]=(0,d.useState)(!1),v=(0,d.useCallback)((function(){return{id:h,...arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},ref:Sk(arguments.length>1&&void 0!==arguments[1]?arguments[1]:null,(t=>{t&&m(!0)}))}}),[h]),_=(0,d.useCallback)((function(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:null;return{...t,ref:e,"data-focus":_k(y),"data-disabled":_k(i),"data-invalid":_k(r),"data-readonly":_k(o),id:void 0!==t.id?t.id:c,htmlFor:void 0!==t.htmlFor?t.htmlFor:l}}),[l,i,y,r,o,c]),w=(0,d.useCallback)((function(){return{id:u,...arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},ref:Sk(arguments.length>1&&void 0!==arguments[1]?arguments[1]:null,(t=>{t&&p(!0)})),"aria-live":"polite"}}),[u]),x=(0,d.useCallback)((function(){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:null;return{...arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},...a,ref:t,role:"group","data-focus":_k(y),"data-disabled":_k(i),"data-invalid":_k(r),"data-readonly":_k(o)}}),[a,i,y,r,o]),S=(0,d.useCallback)((function(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:null;return{...t,ref:e,role:"presentation","aria-hidden":!0,children:t.children||"*"}}),[]);return{isRequired:!!n,isInvalid:!!r,isReadOnly:!!o,isDisabled:!!i,isFocused:!!y,onFocus:()=>b(!0),onBlur:()=>b(!1),hasFeedbackText:f,setHasFeedbackText:p,hasHelpText:g,setHasHelpText:m,id:l,labelId:c,feedbackId:u,helpTextId:h,htmlProps:a,getHelpTextProps:v,getErrorMessageProps:w,getRootProps:x,getLabelProps:_,getRequiredIndicatorProps:S}}(r),s=kS("chakra-form-control",t.className);return(0,yh.jsx)(Pk,{value:a,children:(0,yh.jsx)(Ck,{value:n,children:(0,yh.jsx)(vS.div,{...i({},e),className:s,__css:n.container})})})}));Ak.displayName="FormControl";const Ik=CS((function(t,e){const n=Ek(),r=Tk(),i=kS("chakra-form__helper-text",t.className);return(0,yh.jsx)(vS.div,{...n?.getHelpTextProps(t,e),__css:r.helperText,className:i})}));function Mk(t){const{isDisabled:e,isInvalid:n,isReadOnly:r,isRequired:i,...o}=function(t){const e=Ek(),{id:n,disabled:r,readOnly:i,required:o,isRequired:a,isInvalid:s,isReadOnly:l,isDisabled:c,onFocus:u,onBlur:d,...h}=t,f=t["aria-describedby"]?[t["aria-describedby"]]:[];e?.hasFeedbackText&&e?.isInvalid&&f.push(e.feedbackId);e?.hasHelpText&&f.push(e.helpTextId);return{...h,"aria-describedby":f.join(" ")||void 0,id:n??e?.id,isDisabled:r??c??e?.isDisabled,isReadOnly:i??l??e?.isReadOnly,isRequired:o??a??e?.isRequired,isInvalid:s??e?.isInvalid,onFocus:xk(e?.onFocus,u),onBlur:xk(e?.onBlur,d)}}(t);return{...o,disabled:e,readOnly:r,required:i,"aria-invalid":wk(n),"aria-required":wk(i),"aria-readonly":wk(r)}}Ik.displayName="FormHelperText";const Fk=CS((function(t,e){const{htmlSize:n,...r}=t,i=FS("Input",r),o=Mk(SS(r)),a=kS("chakra-input",t.className);return(0,yh.jsx)(vS.input,{size:n,...o,__css:i.field,ref:e,className:a})}));Fk.displayName="Input",Fk.id="Input";const[Dk,Rk]=Ug({strict:!1,name:"ButtonGroupContext"});function Ok(t){const{children:e,className:n,...r}=t,i=(0,d.isValidElement)(e)?(0,d.cloneElement)(e,{"aria-hidden":!0,focusable:!1}):e,o=kS("chakra-button__icon",n);return(0,yh.jsx)(vS.span,{display:"inline-flex",alignSelf:"center",flexShrink:0,...r,className:o,children:i})}function Nk(t){const{label:e,placement:n,spacing:r="0.5rem",children:i=(0,yh.jsx)(LS,{color:"currentColor",width:"1em",height:"1em"}),className:o,__css:a,...s}=t,l=kS("chakra-button__spinner",o),c="start"===n?"marginEnd":"marginStart",u=(0,d.useMemo)((()=>({display:"flex",alignItems:"center",position:e?"relative":"absolute",[c]:e?r:0,fontSize:"1em",lineHeight:"normal",...a})),[a,e,c,r]);return(0,yh.jsx)(vS.div,{className:l,...s,__css:u,children:i})}Ok.displayName="ButtonIcon",Nk.displayName="ButtonSpinner";const Lk=CS(((t,e)=>{const n=Rk(),r=MS("Button",{...n,...t}),{isDisabled:i=n?.isDisabled,isLoading:o,isActive:a,children:s,leftIcon:l,rightIcon:c,loadingText:u,iconSpacing:h="0.5rem",type:f,spinner:p,spinnerPlacement:g="start",className:m,as:y,shouldWrapChildren:b,...v}=SS(t),_=(0,d.useMemo)((()=>{const t={...r?._focus,zIndex:1};return{display:"inline-flex",appearance:"none",alignItems:"center",justifyContent:"center",userSelect:"none",position:"relative",whiteSpace:"nowrap",verticalAlign:"middle",outline:"none",...r,...!!n&&{_focus:t}}}),[r,n]),{ref:w,type:x}=function(t){const[e,n]=(0,d.useState)(!t),r=(0,d.useCallback)((t=>{t&&n("BUTTON"===t.tagName)}),[]);return{ref:r,type:e?"button":void 0}}(y),S={rightIcon:c,leftIcon:l,iconSpacing:h,children:s,shouldWrapChildren:b};return(0,yh.jsxs)(vS.button,{disabled:i||o,ref:kk(e,w),as:y,type:f??x,"data-active":_k(a),"data-loading":_k(o),__css:_,className:kS("chakra-button",m),...v,children:[o&&"start"===g&&(0,yh.jsx)(Nk,{className:"chakra-button__spinner--start",label:u,placement:"start",spacing:h,children:p}),o?u||(0,yh.jsx)(vS.span,{opacity:0,children:(0,yh.jsx)(Bk,{...S})}):(0,yh.jsx)(Bk,{...S}),o&&"end"===g&&(0,yh.jsx)(Nk,{className:"chakra-button__spinner--end",label:u,placement:"end",spacing:h,children:p})]})}));function Bk(t){const{leftIcon:e,rightIcon:n,children:r,iconSpacing:i,shouldWrapChildren:o}=t;return o?(0,yh.jsxs)("span",{style:{display:"contents"},children:[e&&(0,yh.jsx)(Ok,{marginEnd:i,children:e}),r,n&&(0,yh.jsx)(Ok,{marginStart:i,children:n})]}):(0,yh.jsxs)(yh.Fragment,{children:[e&&(0,yh.jsx)(Ok,{marginEnd:i,children:e}),r,n&&(0,yh.jsx)(Ok,{marginStart:i,children:n})]})}Lk.displayName="Button";const zk=vS("div",{baseStyle:{display:"flex",alignItems:"center",justifyContent:"center"}});zk.displayName="Center";const jk={horizontal:{insetStart:"50%",transform:"translateX(-50%)"},vertical:{top:"50%",transform:"translateY(-50%)"},both:{insetStart:"50%",top:"50%",transform:"translate(-50%, -50%)"}},Uk=(CS((function(t,e){const{axis:n="both",...r}=t;return(0,yh.jsx)(vS.div,{ref:e,__css:jk[n],...r,position:"absolute"})})),["borders","breakpoints","colors","components","config","direction","fonts","fontSizes","fontWeights","letterSpacings","lineHeights","radii","shadows","sizes","space","styles","transition","zIndices"]);function Vk(t){return"function"===typeof t}const $k=t=>function(){for(var e=arguments.length,n=new Array(e),r=0;r<e;r++)n[r]=arguments[r];let i=[...n],o=n[n.length-1];var a;return Nc(a=o)&&Uk.every((t=>Object.prototype.hasOwnProperty.call(a,t)))&&i.length>1?i=i.slice(0,i.length-1):o=t,function(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return t=>e.reduce(((t,e)=>e(t)),t)}(...i.map((t=>e=>Vk(t)?t(e):function(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return kp({},...e,Gk)}(e,t))))(o)},Wk=$k(gh);$k(mh);function Gk(t,e,n,r){return(Vk(t)||Vk(e))&&Object.prototype.hasOwnProperty.call(r,n)?function(){const n=Vk(t)?t(...arguments):t,r=Vk(e)?e(...arguments):e;return kp({},n,r,Gk)}:Nc(t)&&Oc(e)||Oc(t)&&Nc(e)?e:void 0}var Hk=n(8627),Yk=n.n(Hk),qk=n(2157),Kk=n.n(qk),Xk=n(1650),Qk=n.n(Xk),Zk=n(2016),Jk=n.n(Zk),tC=n(9586),eC=n(4602);const nC={children:!0,ref:!0,key:!0,style:!0,forwardedRef:!0,unstable_applyCache:!0,unstable_applyDrawHitFromCache:!0};let rC=!1,iC=!1;const oC=".react-konva-event";let aC=!1;const sC="ReactKonva: You have a Konva node with draggable = true and position defined but no onDragMove or onDragEnd events are handled.\nPosition of a node will be changed during drag&drop, so you should update state of the react app as well.\nConsider to add onDragMove or onDragEnd events.\nFor more info see: https://github.com/konvajs/react-konva/issues/256\n",lC='ReactKonva: You are using "zIndex" attribute for a Konva node.\nreact-konva may get confused with ordering. Just define correct order of elements in your render function of a component.\nFor more info see: https://github.com/konvajs/react-konva/issues/194\n',cC={};function uC(t,e){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:cC;if(!rC&&"zIndex"in e&&(console.warn(lC),rC=!0),!iC&&e.draggable){var r=void 0!==e.x||void 0!==e.y,i=e.onDragEnd||e.onDragMove;r&&!i&&(console.warn(sC),iC=!0)}for(var o in n)if(!nC[o]){var a="on"===o.slice(0,2),s=n[o]!==e[o];if(a&&s)"content"===(f=o.substr(2).toLowerCase()).substr(0,7)&&(f="content"+f.substr(7,1).toUpperCase()+f.substr(8)),t.off(f,n[o]);!e.hasOwnProperty(o)&&t.setAttr(o,void 0)}var l=aC||e._useStrictMode,c={},u=!1;const d={};for(var o in e)if(!nC[o]){a="on"===o.slice(0,2);var h=n[o]!==e[o];if(a&&h)"content"===(f=o.substr(2).toLowerCase()).substr(0,7)&&(f="content"+f.substr(7,1).toUpperCase()+f.substr(8)),e[o]&&(d[f]=e[o]);!a&&(e[o]!==n[o]||l&&e[o]!==t.getAttr(o))&&(u=!0,c[o]=e[o])}for(var f in u&&(t.setAttrs(c),dC(t)),d)t.on(f+oC,d[f])}function dC(t){if(!eC.Konva.autoDrawEnabled){var e=t.getLayer()||t.getStage();e&&e.batchDraw()}}var hC=n(8853);const fC={},pC={};function gC(t,e){"string"!==typeof e?(t.add(e),dC(t)):console.error(`Do not use plain text as child of Konva.Node. You are using text: ${e}`)}function mC(t,e,n){let r=Qk()[t];r||(console.error(`Konva has no node with the type ${t}. Group will be used instead. If you use minimal version of react-konva, just import required nodes into Konva: "import "konva/lib/shapes/${t}"  If you want to render DOM elements as part of canvas tree take a look into this demo: https://konvajs.github.io/docs/react/DOM_Portal.html`),r=Qk().Group);const i={},o={};for(var a in e){"on"===a.slice(0,2)?o[a]=e[a]:i[a]=e[a]}const s=new r(i);return uC(s,o),s}function yC(t,e,n){console.error(`Text components are not supported for now in ReactKonva. Your text is: "${t}"`)}function bC(t,e,n){return!1}function vC(t){return t}function _C(){return null}function wC(){return null}function xC(t,e,n,r){return pC}function SC(){}function kC(t){}function CC(t,e){return!1}function TC(){return fC}function PC(){return fC}Qk().Node.prototype._applyProps=uC;const EC=setTimeout,AC=clearTimeout,IC=-1;function MC(t,e){return!1}const FC=!1,DC=!0,RC=!0;function OC(t,e){e.parent===t?e.moveToTop():t.add(e),dC(t)}function NC(t,e){e.parent===t?e.moveToTop():t.add(e),dC(t)}function LC(t,e,n){e._remove(),t.add(e),e.setZIndex(n.getZIndex()),dC(t)}function BC(t,e,n){LC(t,e,n)}function zC(t,e){e.destroy(),e.off(oC),dC(t)}function jC(t,e){e.destroy(),e.off(oC),dC(t)}function UC(t,e,n){console.error(`Text components are not yet supported in ReactKonva. You text is: "${n}"`)}function VC(t,e,n){}function $C(t,e,n,r,i){uC(t,i,r)}function WC(t){t.hide(),dC(t)}function GC(t){}function HC(t,e){(null==e.visible||e.visible)&&t.show()}function YC(t,e){}function qC(t){}function KC(){}const XC=()=>tC.DefaultEventPriority;var QC,ZC,JC=Object.defineProperty,tT=Object.defineProperties,eT=Object.getOwnPropertyDescriptors,nT=Object.getOwnPropertySymbols,rT=Object.prototype.hasOwnProperty,iT=Object.prototype.propertyIsEnumerable,oT=(t,e,n)=>e in t?JC(t,e,{enumerable:!0,configurable:!0,writable:!0,value:n}):t[e]=n,aT=(t,e)=>{for(var n in e||(e={}))rT.call(e,n)&&oT(t,n,e[n]);if(nT)for(var n of nT(e))iT.call(e,n)&&oT(t,n,e[n]);return t};"undefined"===typeof window||!(null==(QC=window.document)?void 0:QC.createElement)&&"ReactNative"!==(null==(ZC=window.navigator)?void 0:ZC.product)?d.useEffect:d.useLayoutEffect;function sT(t,e,n){if(!t)return;if(!0===n(t))return t;let r=e?t.return:t.child;for(;r;){const t=sT(r,e,n);if(t)return t;r=e?null:r.sibling}}function lT(t){try{return Object.defineProperties(t,{_currentRenderer:{get:()=>null,set(){}},_currentRenderer2:{get:()=>null,set(){}}})}catch(e){return t}}const cT=console.error;console.error=function(){const t=[...arguments].join("");if(!(null==t?void 0:t.startsWith("Warning:"))||!t.includes("useContext"))return cT.apply(this,arguments);console.error=cT};const uT=lT(d.createContext(null));class dT extends d.Component{render(){return d.createElement(uT.Provider,{value:this._reactInternals},this.props.children)}}function hT(){const t=d.useContext(uT);if(null===t)throw new Error("its-fine: useFiber must be called within a <FiberProvider />!");const e=d.useId(),n=d.useMemo((()=>{for(const n of[t,null==t?void 0:t.alternate]){if(!n)continue;const t=sT(n,!1,(t=>{let n=t.memoizedState;for(;n;){if(n.memoizedState===e)return!0;n=n.next}}));if(t)return t}}),[t,e]);return n}function fT(){const t=function(){const t=hT(),[e]=d.useState((()=>new Map));e.clear();let n=t;for(;n;){if(n.type&&"object"===typeof n.type){const t=void 0===n.type._context&&n.type.Provider===n.type?n.type:n.type._context;t&&t!==uT&&!e.has(t)&&e.set(t,d.useContext(lT(t)))}n=n.return}return e}();return d.useMemo((()=>Array.from(t.keys()).reduce(((e,n)=>r=>{return d.createElement(e,null,d.createElement(n.Provider,(i=aT({},r),o={value:t.get(n)},tT(i,eT(o)))));var i,o}),(t=>d.createElement(dT,aT({},t))))),[t])}const pT=t=>{const e=d.useRef(),n=d.useRef(),r=d.useRef(),i=function(t){const e=d.useRef({});return d.useLayoutEffect((()=>{e.current=t})),d.useLayoutEffect((()=>()=>{e.current={}}),[]),e.current}(t),o=fT(),a=e=>{const{forwardedRef:n}=t;n&&("function"===typeof n?n(e):n.current=e)};return d.useLayoutEffect((()=>(n.current=new(Qk().Stage)({width:t.width,height:t.height,container:e.current}),a(n.current),r.current=yT.createContainer(n.current,tC.LegacyRoot,!1,null),yT.updateContainer(d.createElement(o,{},t.children),r.current),()=>{Qk().isBrowser&&(a(null),yT.updateContainer(null,r.current,null),n.current.destroy())})),[]),d.useLayoutEffect((()=>{a(n.current),uC(n.current,t,i),yT.updateContainer(d.createElement(o,{},t.children),r.current,null)})),d.createElement("div",{ref:e,id:t.id,accessKey:t.accessKey,className:t.className,role:t.role,style:t.style,tabIndex:t.tabIndex,title:t.title})},gT="Layer",mT="Rect",yT=Jk()(t);yT.injectIntoDevTools({findHostInstanceByFiber:()=>null,bundleType:0,version:d.version,rendererPackageName:"react-konva"});const bT=d.forwardRef(((t,e)=>d.createElement(dT,{},d.createElement(pT,{...t,forwardedRef:e})))),vT=t=>{let{rectProps:e,onChange:n,isSelected:r,onClick:i,scale:o,strokeWidth:a,mode:s="Edit"}=t;const l=(0,d.useRef)(null),c=(0,d.useRef)(null);(0,d.useEffect)((()=>{var t;r&&c.current&&l.current&&(c.current.nodes([l.current]),c.current.visible(!0),c.current.enabledAnchors(["top-left","top-center","top-right","middle-left","middle-right","bottom-left","bottom-center","bottom-right"]),c.current.keepRatio(!1),c.current.rotateEnabled(!1),c.current.padding(2),c.current.anchorSize(10),c.current.anchorStrokeWidth(2),c.current.anchorFill("#FFFFFF"),c.current.anchorStroke(e.stroke||"#0000FF"),c.current.anchorCornerRadius(4),null===(t=c.current.getLayer())||void 0===t||t.batchDraw())}),[r,e.stroke]);const u="Edit"===s;return(0,yh.jsxs)(yh.Fragment,{children:[(0,yh.jsx)(mT,{ref:l,x:e.x*o,y:e.y*o,width:e.width*o,height:e.height*o,stroke:e.stroke,strokeWidth:a,dash:[5,5],fill:r?e.stroke+"20":"transparent",draggable:u,onClick:i,onTap:i,onDragEnd:t=>{if(!l.current)return;const r=l.current;n({...e,x:r.x()/o,y:r.y()/o})},onTransformEnd:t=>{if(!l.current)return;const r=l.current,i=r.scaleX(),a=r.scaleY();r.scaleX(1),r.scaleY(1),n({...e,x:r.x()/o,y:r.y()/o,width:Math.max(5,r.width()*i)/o,height:Math.max(5,r.height()*a)/o})}}),r&&"Edit"===s&&(0,yh.jsx)("Transformer",{ref:c,anchorStroke:e.stroke||"#0000FF",anchorFill:"#FFFFFF",anchorSize:10,anchorCornerRadius:4,borderStroke:e.stroke||"#0000FF",borderDash:[3,3],borderStrokeWidth:1,boundBoxFunc:(t,e)=>e.width<5||e.height<5?t:e})]})},_T=t=>{const{rectangles:e,mode:n,selectedId:r,setSelectedId:i,setRectangles:o,setLabel:a,color_map:s,scale:l,label:c,image_size:u,image:h,strokeWidth:f,isLabelEditMode:p=!1,setIsLabelEditMode:g=()=>{},handleLabelInputChange:m=()=>{},showLabels:y=!1,suggestedLabels:b=[],showSuggestions:v=!1,setShowSuggestions:_=()=>{},handleSuggestionSelect:w=()=>{},isLoadingLabels:x=!1}=t,[S,k]=(0,d.useState)(null),[C,T]=(0,d.useState)({x:0,y:0}),[P,E]=(0,d.useState)(!1),[A,I]=(0,d.useState)(null),[M,F]=(0,d.useState)({x:0,y:0}),D=d.useRef(null);(0,d.useEffect)((()=>{p&&D.current&&setTimeout((()=>{var t;null===(t=D.current)||void 0===t||t.focus(),_(!0)}),100)}),[p]),(0,d.useEffect)((()=>{if(r){const t=e.find((t=>t.id===r));t&&F({x:(t.x+t.width/2)*l+C.x,y:(t.y-30)*l+C.y})}}),[r,e,l,C]);(0,d.useEffect)((()=>{const t=t=>{"Delete"===t.key&&null!==r&&(o((t=>t.filter((t=>t.id!==r)))),i(null),g(!1))};return window.addEventListener("keydown",t),()=>window.removeEventListener("keydown",t)}),[r,o,i,g]);(0,d.useEffect)((()=>{console.log("BBoxCanvas: suggestedLabels \ubcc0\uacbd\ub428",b),console.log("showSuggestions:",v),console.log("suggestedLabels:",b),v&&b.length>0&&console.log("\ucd94\ucc9c UI \ud45c\uc2dc\ub428")}),[b,v]);const R=d.useRef(null);return(0,yh.jsxs)("div",{ref:R,style:{position:"relative",width:u[0]*l+"px",height:u[1]*l+"px",overflow:"hidden",border:"2px solid #3182CE",borderRadius:"4px",boxShadow:"0 0 10px rgba(0,0,0,0.1)",background:"repeating-conic-gradient(#f0f0f0 0% 25%, #e0e0e0 0% 50%) 50% / 20px 20px"},children:[(0,yh.jsxs)(bT,{width:u[0]*l,height:u[1]*l,onMouseDown:t=>{const e=t.target instanceof Kk().Rect,o=t.target.getStage();if(!o)return;const s=o.getPointerPosition();s&&("Edit"!==n||e?"Draw"!==n||e?e||(i(null),g(!1)):null===r?(k([(s.x-C.x)/l,(s.y-C.y)/l,(s.x-C.x)/l,(s.y-C.y)/l]),a("")):(i(null),g(!1)):(E(!0),I({x:s.x,y:s.y})))},onMouseMove:t=>{const e=t.target.getStage();if(!e)return;const r=e.getPointerPosition();r&&(null!==S&&"Draw"===n?k([S[0],S[1],(r.x-C.x)/l,(r.y-C.y)/l]):P&&"Edit"===n&&(T({x:C.x+(r.x-A.x),y:C.y+(r.y-A.y)}),I({x:r.x,y:r.y})))},onMouseUp:()=>{if(null!==S&&"Draw"===n&&Math.abs(S[2]-S[0])>5&&Math.abs(S[3]-S[1])>5){const t=`bbox-${e.length}`;a(""),o((e=>[...e,{x:Math.min(S[0],S[2]),y:Math.min(S[1],S[3]),width:Math.abs(S[2]-S[0]),height:Math.abs(S[3]-S[1]),label:c,stroke:s[c]||"#39FF14",id:t}])),i(t),g(!0)}k(null),E(!1),I(null)},children:[(0,yh.jsx)(gT,{x:C.x,y:C.y,children:(0,yh.jsx)(mT,{x:0,y:0,width:u[0]*l,height:u[1]*l,fill:"#FFFFFF",stroke:"#DDDDDD",strokeWidth:1})}),(0,yh.jsx)(gT,{x:C.x,y:C.y,children:(0,yh.jsx)("Image",{image:h||void 0,scaleX:l,scaleY:l})}),(0,yh.jsxs)(gT,{x:C.x,y:C.y,children:[e.map((t=>(0,yh.jsxs)("Group",{children:[(0,yh.jsx)(vT,{rectProps:t,scale:l,strokeWidth:f,isSelected:t.id===r,onClick:()=>{i(t.id),a(t.label)},mode:n,onChange:t=>{o((e=>e.map((e=>e.id===t.id?t:e))))}}),y&&(0,yh.jsxs)("Label",{x:t.x*l,y:t.y*l-20,opacity:.8,children:[(0,yh.jsx)("Tag",{fill:"#2F4F4F",cornerRadius:3,pointerDirection:"down",pointerWidth:10,pointerHeight:10,lineJoin:"round"}),(0,yh.jsx)("Text",{text:t.label||"unlabeled",padding:3,fontFamily:"Arial",fontSize:25,fill:"white"})]})]},t.id))),S&&(0,yh.jsx)(mT,{fill:"#39FF144D",x:Math.min(S[0],S[2])*l,y:Math.min(S[1],S[3])*l,width:Math.abs(S[2]-S[0])*l,height:Math.abs(S[3]-S[1])*l,stroke:"#39FF14",strokeWidth:1})]})]}),p&&r&&R.current&&(0,yh.jsxs)("div",{style:{position:"absolute",top:`${M.y}px`,left:`${M.x}px`,transform:"translate(-50%, -100%)",zIndex:1e3,background:"white",padding:"5px",borderRadius:"4px",boxShadow:"0 2px 5px rgba(0,0,0,0.2)"},children:[(0,yh.jsx)(Fk,{ref:D,size:"sm",value:c,placeholder:"\ub77c\ubca8 \uc785\ub825",onChange:m,onBlur:()=>{setTimeout((()=>{var t;null!==(t=document.activeElement)&&void 0!==t&&t.classList.contains("suggestion-item")||(g(!1),_(!1))}),200)},onKeyDown:t=>{("Enter"===t.key||"Escape"===t.key)&&g(!1)},width:"200px"}),v&&(0,yh.jsx)(mk,{mt:1,p:2,bg:"white",borderRadius:"md",boxShadow:"sm",border:"1px solid",borderColor:"gray.200",width:"200px",children:x?(0,yh.jsx)("div",{style:{padding:"10px",textAlign:"center",color:"gray"},children:"\ud14d\uc2a4\ud2b8 \uc778\uc2dd \uc911..."}):b.length>0?(0,yh.jsx)("div",{style:{display:"flex",flexDirection:"column",gap:"5px",maxHeight:"150px",overflowY:"auto"},children:b.map(((t,e)=>(0,yh.jsx)("div",{className:"suggestion-item",style:{padding:"5px 8px",borderRadius:"3px",cursor:"pointer",backgroundColor:t===c?"#e2f1ff":"transparent",fontWeight:t===c?"bold":"normal"},onMouseDown:e=>{e.preventDefault(),w(t)},children:t},e)))}):(0,yh.jsx)("div",{style:{padding:"10px",textAlign:"center",color:"gray"},children:"\ucd94\ucc9c \ud14d\uc2a4\ud2b8\uac00 \uc5c6\uc2b5\ub2c8\ub2e4"})})]})]})};var wT=n(3950),xT=n.n(wT);const ST=Wk({config:{initialColorMode:"light",useSystemColorMode:!1}}),kT=function(t){var e=function(e){function n(t){var n=e.call(this,t)||this;return n.componentDidMount=function(){sa.events.addEventListener(sa.RENDER_EVENT,n.onRenderEvent),sa.setComponentReady()},n.componentDidUpdate=function(){null!=n.state.componentError&&sa.setFrameHeight()},n.componentWillUnmount=function(){sa.events.removeEventListener(sa.RENDER_EVENT,n.onRenderEvent)},n.onRenderEvent=function(t){n.setState({renderData:t.detail})},n.state={renderData:void 0,componentError:void 0},n}return ca(n,e),n.prototype.render=function(){return null!=this.state.componentError?m.createElement("div",null,m.createElement("h1",null,"Component Error"),m.createElement("span",null,this.state.componentError.message)):null==this.state.renderData?null:m.createElement(t,{width:window.innerWidth,disabled:this.state.renderData.disabled,args:this.state.renderData.args,theme:this.state.renderData.theme})},n.getDerivedStateFromError=function(t){return{componentError:t}},n}(m.PureComponent);return g()(e,t)}((t=>{let{args:e}=t;const{image_url:n,image_size:r,bbox_info:i,color_map:o,line_width:a,use_space:s,ocr_suggestions:l}=e,c=new URLSearchParams(window.location.search).get("streamlitUrl"),[u]=Yk()(c+n),[h,f]=(0,d.useState)(i.map(((t,e)=>({x:t.bbox[0],y:t.bbox[1],width:t.bbox[2],height:t.bbox[3],label:t.label,stroke:"#39FF14",id:"bbox-"+e})))),[p,g]=(0,d.useState)(null),[m,y]=(0,d.useState)(""),[b,v]=(0,d.useState)("Draw"),[_,w]=(0,d.useState)(!1),[x,S]=(0,d.useState)(1),[k,C]=(0,d.useState)(!1),[T,P]=(0,d.useState)(!1),E=(0,d.useRef)(null),{requestOcrForBox:A,handleOcrResponse:I,resetOcrState:M,suggestedLabels:F,showSuggestions:D,isLoading:R,setShowSuggestions:O}=(t=>{let{rectangles:e,scale:n,mode:r}=t;const[i,o]=(0,d.useState)([]),[a,s]=(0,d.useState)(!1),[l,c]=(0,d.useState)(!1),u=(0,d.useRef)(!1),h=(0,d.useRef)(null),[f,p]=(0,d.useState)(null),g=()=>{u.current=!1,h.current=null,p(null)};return{requestOcrForBox:t=>{if(u.current||h.current===t)return;const i=e.find((e=>e.id===t));var o;i&&(u.current=!0,h.current=t,c(!0),sa.setComponentValue({mode:r,bboxes:(o=e,o.map((t=>({box_id:t.id,bbox:[t.x,t.y,t.width,t.height],label:t.label||""})))),scale:n,request_ocr:!0,selected_box_id:t,selected_box_coords:[i.x,i.y,i.width,i.height]}),p(t))},handleOcrResponse:t=>{t&&0!==t.length&&(o(t),s(!0),c(!1),g())},resetOcrState:g,suggestedLabels:i,showSuggestions:a,isLoading:l,setShowSuggestions:s}})({rectangles:h,scale:x,mode:b});(0,d.useEffect)((()=>{if(p){const t=h.find((t=>t.id===p));t&&y(t.label)}}),[p,h]);const N=t=>{y(t.target.value)},L=()=>{null!==p&&f((t=>t.map((t=>t.id===p?{...t,label:m,stroke:"#39FF14"}:t))))},B=(0,d.useRef)(null);console.log(e.request_ocr,e.ocr_suggestions,B.current),(0,d.useEffect)((()=>{!0===e.request_ocr&&e.ocr_suggestions&&e.ocr_suggestions.length>0&&JSON.stringify(e.ocr_suggestions)!==JSON.stringify(B.current)&&(B.current=e.ocr_suggestions,I(e.ocr_suggestions),H({request_ocr:!1}),console.log("request_ocr \ubcc0\ud588\ub098??",e.request_ocr))}),[e.ocr_suggestions,e.ocr_suggestions]),(0,d.useEffect)((()=>{const t=t=>{if("streamlit:render"===t.data.type)try{const e=t.data.args;null!==e&&void 0!==e&&e.ocr_suggestions&&Array.isArray(e.ocr_suggestions)&&I(e.ocr_suggestions)}catch(cT){console.error("Error handling OCR suggestions from message:",cT)}};return window.addEventListener("message",t),()=>window.removeEventListener("message",t)}),[]),(0,d.useEffect)((()=>{!1!==e.request_ocr&&void 0!==e.request_ocr||M()}),[e.request_ocr]);const z=xT()((()=>{r[1]>0&&sa.setFrameHeight(r[1]*G.current+100)}),100);(0,d.useEffect)((()=>((()=>{if(1===x&&r[0]>0){const t=.8*window.innerWidth/r[0];S(Math.min(t,1))}})(),z(),window.addEventListener("resize",z),()=>{window.removeEventListener("resize",z)})),[r,x]);const j=(0,d.useRef)(b),U=(0,d.useRef)(p),V=(0,d.useRef)(s),$=(0,d.useRef)(_),W=(0,d.useRef)(h),G=(0,d.useRef)(x);(0,d.useEffect)((()=>{j.current=b}),[b]),(0,d.useEffect)((()=>{U.current=p}),[p]),(0,d.useEffect)((()=>{V.current=s}),[s]),(0,d.useEffect)((()=>{$.current=_}),[_]),(0,d.useEffect)((()=>{W.current=h}),[h]),(0,d.useEffect)((()=>{G.current=x}),[x]);const H=function(){const t=function(){var t,e,n,r;let i=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const o=null!==(t=i.mode)&&void 0!==t?t:j.current,a=null!==(e=i.selectedBoxId)&&void 0!==e?e:U.current,s=W.current,l=G.current,c=s.find((t=>t.id===a)),u={mode:o,bboxes:(d=s,d.map((t=>({box_id:t.id,bbox:[t.x,t.y,t.width,t.height],label:t.label||""})))),scale:l,save_requested:null!==(n=i.save_requested)&&void 0!==n&&n,request_ocr:null!==(r=i.request_ocr)&&void 0!==r&&r};var d;return c&&(u.selected_box_id=c.id,u.selected_box_coords=[c.x,c.y,c.width,c.height]),u}(arguments.length>0&&void 0!==arguments[0]?arguments[0]:{});sa.setComponentValue(t)};(0,d.useEffect)((()=>{const t=t=>{j.current;const e=U.current,n=V.current,r=$.current;W.current;n&&"Space"===t.code&&H(),t.ctrlKey&&"KeyE"===t.code&&(t.preventDefault(),v("Edit"),H({mode:"Edit"})),t.ctrlKey&&"KeyD"===t.code&&(t.preventDefault(),v("Draw"),H({mode:"Draw"})),t.ctrlKey&&"KeyL"===t.code&&(t.preventDefault(),e&&(w(!0),O(!0))),t.ctrlKey&&"KeyM"===t.code&&(t.preventDefault(),e&&A(e)),t.ctrlKey&&"KeyR"===t.code&&(t.preventDefault(),P((t=>!t))),t.ctrlKey&&"KeyS"===t.code&&(t.preventDefault(),C(!0),setTimeout((()=>{C(!1)}),3e3),H({save_requested:!0})),"Delete"===t.code&&e&&(t.preventDefault(),f((t=>t.filter((t=>t.id!==e)))),g(null),w(!1)),"Escape"===t.code&&(t.preventDefault(),(r||e)&&(w(!1),g(null)))};return window.addEventListener("keydown",t),()=>{window.removeEventListener("keydown",t)}}),[]),(0,d.useEffect)((()=>{const t=xT()((t=>{S(t)}),50),e=e=>{var n;if(e.ctrlKey&&null!==(n=E.current)&&void 0!==n&&n.contains(e.target)){e.preventDefault();let n=G.current+(e.deltaY<0?.1:-.1);n=Math.min(Math.max(n,.5),3),t(n)}};return window.addEventListener("wheel",e,{passive:!1}),()=>{window.removeEventListener("wheel",e)}}),[]);const Y=t=>{v(t),H({mode:t})};return(0,yh.jsx)(dk,{theme:ST,children:(0,yh.jsxs)(gk,{spacing:4,align:"stretch",children:[k&&(0,yh.jsx)(mk,{p:3,bg:"green.100",color:"green.800",borderRadius:"md",position:"fixed",top:"20px",left:"50%",transform:"translateX(-50%)",zIndex:100,boxShadow:"md",children:(0,yh.jsx)(yk,{fontWeight:"bold",children:"\ud83d\udcbe \uc5b4\ub178\ud14c\uc774\uc158 \uc800\uc7a5 \uc694\uccad\uc774 \uc804\uc1a1\ub418\uc5c8\uc2b5\ub2c8\ub2e4!"})}),(0,yh.jsxs)(mk,{p:3,bg:"gray.200",borderRadius:"md",position:"sticky",top:0,zIndex:10,borderWidth:"1px",boxShadow:"sm",children:[(0,yh.jsxs)(bk,{justifyContent:"space-between",alignItems:"center",children:[(0,yh.jsx)(vk,{spacing:4,children:(0,yh.jsxs)(mk,{children:[(0,yh.jsx)(yk,{fontSize:"sm",mb:1,color:"black",children:"Class"}),(0,yh.jsx)(Fk,{value:m,onChange:N,onBlur:L,onKeyDown:t=>{"Enter"===t.key&&L()},placeholder:"Enter label",size:"sm",width:"200px",bg:"white",borderColor:"gray.200"})]})}),(0,yh.jsxs)(vk,{children:[(0,yh.jsxs)(yk,{fontSize:"sm",mr:2,color:"black",children:["Zoom: ",(t=>`${Math.round(100*t)}%`)(x)]}),(0,yh.jsx)(Lk,{size:"sm",colorScheme:"teal",variant:T?"solid":"outline",onClick:()=>P((t=>!t)),children:T?"Hide Labels":"Show Labels"}),(0,yh.jsx)(Lk,{size:"sm",colorScheme:"green",variant:"Draw"===b?"solid":"outline",onClick:()=>Y("Draw"),children:"Draw"}),(0,yh.jsx)(Lk,{size:"sm",colorScheme:"blue",variant:"Edit"===b?"solid":"outline",onClick:()=>Y("Edit"),children:"Edit"}),(0,yh.jsx)(Lk,{size:"sm",colorScheme:"purple",onClick:()=>{C(!0),setTimeout((()=>C(!1)),3e3),H({save_requested:!0})},children:"Save"})]})]}),(0,yh.jsx)(bk,{mt:2,justifyContent:"space-between",alignItems:"center",children:(0,yh.jsxs)(yk,{fontSize:"xs",color:"black",children:["Selected Items: ",h.length]})})]}),(0,yh.jsx)(mk,{ref:E,children:(0,yh.jsx)(zk,{children:(0,yh.jsx)(_T,{rectangles:h,mode:b,selectedId:p,scale:x,setSelectedId:g,setRectangles:f,setLabel:y,color_map:o,label:m,image:u,image_size:r,strokeWidth:a,isLabelEditMode:_,setIsLabelEditMode:w,handleLabelInputChange:N,showLabels:T,suggestedLabels:F,showSuggestions:D,setShowSuggestions:O,handleSuggestionSelect:t=>{y(t),null!==p&&f((e=>e.map((e=>e.id===p?{...e,label:t,stroke:"#39FF14"}:e)))),O(!1)},isLoadingLabels:R})})})]})})})),CT=document.getElementById("root");if(!CT)throw new Error("Failed to find the root element");(0,f.H)(CT).render((0,yh.jsx)(d.StrictMode,{children:(0,yh.jsx)(kT,{})}))})()})();
-//# sourceMappingURL=main.4f1cc942.js.map
\ No newline at end of file
@@ -0,0 +1,282 @@
+/*! For license information please see main.c3715ea4.js.LICENSE.txt */
+(()=>{var t,e,n={21:(t,e)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Solarize=void 0,e.Solarize=function(t){const e=t.data,n=t.width,r=4*n;let i=t.height;do{const t=(i-1)*r;let o=n;do{const n=t+4*(o-1);let r=e[n],i=e[n+1],a=e[n+2];r>127&&(r=255-r),i>127&&(i=255-i),a>127&&(a=255-a),e[n]=r,e[n+1]=i,e[n+2]=a}while(--o)}while(--i)}},291:t=>{var e="undefined"!=typeof Element,n="function"==typeof Map,r="function"==typeof Set,i="function"==typeof ArrayBuffer&&!!ArrayBuffer.isView;function o(t,a){if(t===a)return!0;if(t&&a&&"object"==typeof t&&"object"==typeof a){if(t.constructor!==a.constructor)return!1;var s,l,c,u;if(Array.isArray(t)){if((s=t.length)!=a.length)return!1;for(l=s;0!=l--;)if(!o(t[l],a[l]))return!1;return!0}if(n&&t instanceof Map&&a instanceof Map){if(t.size!==a.size)return!1;for(u=t.entries();!(l=u.next()).done;)if(!a.has(l.value[0]))return!1;for(u=t.entries();!(l=u.next()).done;)if(!o(l.value[1],a.get(l.value[0])))return!1;return!0}if(r&&t instanceof Set&&a instanceof Set){if(t.size!==a.size)return!1;for(u=t.entries();!(l=u.next()).done;)if(!a.has(l.value[0]))return!1;return!0}if(i&&ArrayBuffer.isView(t)&&ArrayBuffer.isView(a)){if((s=t.length)!=a.length)return!1;for(l=s;0!=l--;)if(t[l]!==a[l])return!1;return!0}if(t.constructor===RegExp)return t.source===a.source&&t.flags===a.flags;if(t.valueOf!==Object.prototype.valueOf&&"function"==typeof t.valueOf&&"function"==typeof a.valueOf)return t.valueOf()===a.valueOf();if(t.toString!==Object.prototype.toString&&"function"==typeof t.toString&&"function"==typeof a.toString)return t.toString()===a.toString();if((s=(c=Object.keys(t)).length)!==Object.keys(a).length)return!1;for(l=s;0!=l--;)if(!Object.prototype.hasOwnProperty.call(a,c[l]))return!1;if(e&&t instanceof Element)return!1;for(l=s;0!=l--;)if(("_owner"!==c[l]&&"__v"!==c[l]&&"__o"!==c[l]||!t.$$typeof)&&!o(t[c[l]],a[c[l]]))return!1;return!0}return t!=t&&a!=a}t.exports=function(t,e){try{return o(t,e)}catch(t){if((t.message||"").match(/stack|recursion/i))return console.warn("react-fast-compare cannot handle circular refs"),!1;throw t}}},501:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Threshold=void 0;const r=n(3100),i=n(5304),o=n(4715);e.Threshold=function(t){const e=255*this.threshold(),n=t.data,r=n.length;for(let t=0;t<r;t+=1)n[t]=n[t]<e?0:255},r.Factory.addGetterSetter(i.Node,"threshold",.5,(0,o.getNumberValidator)(),r.Factory.afterSetFilter)},550:t=>{var e=Object.prototype.toString;t.exports=function(t){return e.call(t)}},551:(t,e)=>{"use strict";var n=Symbol.for("react.element"),r=Symbol.for("react.portal"),i=Symbol.for("react.fragment"),o=Symbol.for("react.strict_mode"),a=Symbol.for("react.profiler"),s=Symbol.for("react.provider"),l=Symbol.for("react.context"),c=Symbol.for("react.forward_ref"),u=Symbol.for("react.suspense"),d=Symbol.for("react.memo"),h=Symbol.for("react.lazy"),f=Symbol.iterator,p={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},g=Object.assign,m={};function y(t,e,n){this.props=t,this.context=e,this.refs=m,this.updater=n||p}function b(){}function v(t,e,n){this.props=t,this.context=e,this.refs=m,this.updater=n||p}y.prototype.isReactComponent={},y.prototype.setState=function(t,e){if("object"!=typeof t&&"function"!=typeof t&&null!=t)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,t,e,"setState")},y.prototype.forceUpdate=function(t){this.updater.enqueueForceUpdate(this,t,"forceUpdate")},b.prototype=y.prototype;var _=v.prototype=new b;_.constructor=v,g(_,y.prototype),_.isPureReactComponent=!0;var w=Array.isArray,x=Object.prototype.hasOwnProperty,S={current:null},k={key:!0,ref:!0,__self:!0,__source:!0};function C(t,e,r){var i,o={},a=null,s=null;if(null!=e)for(i in void 0!==e.ref&&(s=e.ref),void 0!==e.key&&(a=""+e.key),e)x.call(e,i)&&!k.hasOwnProperty(i)&&(o[i]=e[i]);var l=arguments.length-2;if(1===l)o.children=r;else if(1<l){for(var c=Array(l),u=0;u<l;u++)c[u]=arguments[u+2];o.children=c}if(t&&t.defaultProps)for(i in l=t.defaultProps)void 0===o[i]&&(o[i]=l[i]);return{$$typeof:n,type:t,key:a,ref:s,props:o,_owner:S.current}}function T(t){return"object"==typeof t&&null!==t&&t.$$typeof===n}var E=/\/+/g;function P(t,e){return"object"==typeof t&&null!==t&&null!=t.key?function(t){var e={"=":"=0",":":"=2"};return"$"+t.replace(/[=:]/g,(function(t){return e[t]}))}(""+t.key):e.toString(36)}function I(t,e,i,o,a){var s=typeof t;"undefined"!==s&&"boolean"!==s||(t=null);var l=!1;if(null===t)l=!0;else switch(s){case"string":case"number":l=!0;break;case"object":switch(t.$$typeof){case n:case r:l=!0}}if(l)return a=a(l=t),t=""===o?"."+P(l,0):o,w(a)?(i="",null!=t&&(i=t.replace(E,"$&/")+"/"),I(a,e,i,"",(function(t){return t}))):null!=a&&(T(a)&&(a=function(t,e){return{$$typeof:n,type:t.type,key:e,ref:t.ref,props:t.props,_owner:t._owner}}(a,i+(!a.key||l&&l.key===a.key?"":(""+a.key).replace(E,"$&/")+"/")+t)),e.push(a)),1;if(l=0,o=""===o?".":o+":",w(t))for(var c=0;c<t.length;c++){var u=o+P(s=t[c],c);l+=I(s,e,i,u,a)}else if(u=function(t){return null===t||"object"!=typeof t?null:"function"==typeof(t=f&&t[f]||t["@@iterator"])?t:null}(t),"function"==typeof u)for(t=u.call(t),c=0;!(s=t.next()).done;)l+=I(s=s.value,e,i,u=o+P(s,c++),a);else if("object"===s)throw e=String(t),Error("Objects are not valid as a React child (found: "+("[object Object]"===e?"object with keys {"+Object.keys(t).join(", ")+"}":e)+"). If you meant to render a collection of children, use an array instead.");return l}function A(t,e,n){if(null==t)return t;var r=[],i=0;return I(t,r,"","",(function(t){return e.call(n,t,i++)})),r}function M(t){if(-1===t._status){var e=t._result;(e=e()).then((function(e){0!==t._status&&-1!==t._status||(t._status=1,t._result=e)}),(function(e){0!==t._status&&-1!==t._status||(t._status=2,t._result=e)})),-1===t._status&&(t._status=0,t._result=e)}if(1===t._status)return t._result.default;throw t._result}var D={current:null},F={transition:null},R={ReactCurrentDispatcher:D,ReactCurrentBatchConfig:F,ReactCurrentOwner:S};function B(){throw Error("act(...) is not supported in production builds of React.")}e.Children={map:A,forEach:function(t,e,n){A(t,(function(){e.apply(this,arguments)}),n)},count:function(t){var e=0;return A(t,(function(){e++})),e},toArray:function(t){return A(t,(function(t){return t}))||[]},only:function(t){if(!T(t))throw Error("React.Children.only expected to receive a single React element child.");return t}},e.Component=y,e.Fragment=i,e.Profiler=a,e.PureComponent=v,e.StrictMode=o,e.Suspense=u,e.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=R,e.act=B,e.cloneElement=function(t,e,r){if(null==t)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+t+".");var i=g({},t.props),o=t.key,a=t.ref,s=t._owner;if(null!=e){if(void 0!==e.ref&&(a=e.ref,s=S.current),void 0!==e.key&&(o=""+e.key),t.type&&t.type.defaultProps)var l=t.type.defaultProps;for(c in e)x.call(e,c)&&!k.hasOwnProperty(c)&&(i[c]=void 0===e[c]&&void 0!==l?l[c]:e[c])}var c=arguments.length-2;if(1===c)i.children=r;else if(1<c){l=Array(c);for(var u=0;u<c;u++)l[u]=arguments[u+2];i.children=l}return{$$typeof:n,type:t.type,key:o,ref:a,props:i,_owner:s}},e.createContext=function(t){return(t={$$typeof:l,_currentValue:t,_currentValue2:t,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null}).Provider={$$typeof:s,_context:t},t.Consumer=t},e.createElement=C,e.createFactory=function(t){var e=C.bind(null,t);return e.type=t,e},e.createRef=function(){return{current:null}},e.forwardRef=function(t){return{$$typeof:c,render:t}},e.isValidElement=T,e.lazy=function(t){return{$$typeof:h,_payload:{_status:-1,_result:t},_init:M}},e.memo=function(t,e){return{$$typeof:d,type:t,compare:void 0===e?null:e}},e.startTransition=function(t){var e=F.transition;F.transition={};try{t()}finally{F.transition=e}},e.unstable_act=B,e.useCallback=function(t,e){return D.current.useCallback(t,e)},e.useContext=function(t){return D.current.useContext(t)},e.useDebugValue=function(){},e.useDeferredValue=function(t){return D.current.useDeferredValue(t)},e.useEffect=function(t,e){return D.current.useEffect(t,e)},e.useId=function(){return D.current.useId()},e.useImperativeHandle=function(t,e,n){return D.current.useImperativeHandle(t,e,n)},e.useInsertionEffect=function(t,e){return D.current.useInsertionEffect(t,e)},e.useLayoutEffect=function(t,e){return D.current.useLayoutEffect(t,e)},e.useMemo=function(t,e){return D.current.useMemo(t,e)},e.useReducer=function(t,e,n){return D.current.useReducer(t,e,n)},e.useRef=function(t){return D.current.useRef(t)},e.useState=function(t){return D.current.useState(t)},e.useSyncExternalStore=function(t,e,n){return D.current.useSyncExternalStore(t,e,n)},e.useTransition=function(){return D.current.useTransition()},e.version="18.3.1"},602:(t,e,n)=>{t=n.nmd(t);var r="__lodash_hash_undefined__",i=9007199254740991,o="[object Arguments]",a="[object Function]",s="[object Object]",l=/^\[object .+?Constructor\]$/,c=/^(?:0|[1-9]\d*)$/,u={};u["[object Float32Array]"]=u["[object Float64Array]"]=u["[object Int8Array]"]=u["[object Int16Array]"]=u["[object Int32Array]"]=u["[object Uint8Array]"]=u["[object Uint8ClampedArray]"]=u["[object Uint16Array]"]=u["[object Uint32Array]"]=!0,u[o]=u["[object Array]"]=u["[object ArrayBuffer]"]=u["[object Boolean]"]=u["[object DataView]"]=u["[object Date]"]=u["[object Error]"]=u[a]=u["[object Map]"]=u["[object Number]"]=u[s]=u["[object RegExp]"]=u["[object Set]"]=u["[object String]"]=u["[object WeakMap]"]=!1;var d,h,f,p="object"==typeof n.g&&n.g&&n.g.Object===Object&&n.g,g="object"==typeof self&&self&&self.Object===Object&&self,m=p||g||Function("return this")(),y=e&&!e.nodeType&&e,b=y&&t&&!t.nodeType&&t,v=b&&b.exports===y,_=v&&p.process,w=function(){try{return b&&b.require&&b.require("util").types||_&&_.binding&&_.binding("util")}catch(t){}}(),x=w&&w.isTypedArray,S=Array.prototype,k=Function.prototype,C=Object.prototype,T=m["__core-js_shared__"],E=k.toString,P=C.hasOwnProperty,I=(d=/[^.]+$/.exec(T&&T.keys&&T.keys.IE_PROTO||""))?"Symbol(src)_1."+d:"",A=C.toString,M=E.call(Object),D=RegExp("^"+E.call(P).replace(/[\\^$.*+?()[\]{}|]/g,"\\$&").replace(/hasOwnProperty|(function).*?(?=\\\()| for .+?(?=\\\])/g,"$1.*?")+"$"),F=v?m.Buffer:void 0,R=m.Symbol,B=m.Uint8Array,L=(F&&F.allocUnsafe,h=Object.getPrototypeOf,f=Object,function(t){return h(f(t))}),N=Object.create,O=C.propertyIsEnumerable,z=S.splice,U=R?R.toStringTag:void 0,j=function(){try{var t=st(Object,"defineProperty");return t({},"",{}),t}catch(t){}}(),V=F?F.isBuffer:void 0,$=Math.max,W=Date.now,G=st(m,"Map"),H=st(Object,"create"),Y=function(){function t(){}return function(e){if(!vt(e))return{};if(N)return N(e);t.prototype=e;var n=new t;return t.prototype=void 0,n}}();function q(t){var e=-1,n=null==t?0:t.length;for(this.clear();++e<n;){var r=t[e];this.set(r[0],r[1])}}function K(t){var e=-1,n=null==t?0:t.length;for(this.clear();++e<n;){var r=t[e];this.set(r[0],r[1])}}function X(t){var e=-1,n=null==t?0:t.length;for(this.clear();++e<n;){var r=t[e];this.set(r[0],r[1])}}function Q(t){var e=this.__data__=new K(t);this.size=e.size}function Z(t,e,n){(void 0!==n&&!ht(t[e],n)||void 0===n&&!(e in t))&&et(t,e,n)}function J(t,e,n){var r=t[e];P.call(t,e)&&ht(r,n)&&(void 0!==n||e in t)||et(t,e,n)}function tt(t,e){for(var n=t.length;n--;)if(ht(t[n][0],e))return n;return-1}function et(t,e,n){"__proto__"==e&&j?j(t,e,{configurable:!0,enumerable:!0,value:n,writable:!0}):t[e]=n}q.prototype.clear=function(){this.__data__=H?H(null):{},this.size=0},q.prototype.delete=function(t){var e=this.has(t)&&delete this.__data__[t];return this.size-=e?1:0,e},q.prototype.get=function(t){var e=this.__data__;if(H){var n=e[t];return n===r?void 0:n}return P.call(e,t)?e[t]:void 0},q.prototype.has=function(t){var e=this.__data__;return H?void 0!==e[t]:P.call(e,t)},q.prototype.set=function(t,e){var n=this.__data__;return this.size+=this.has(t)?0:1,n[t]=H&&void 0===e?r:e,this},K.prototype.clear=function(){this.__data__=[],this.size=0},K.prototype.delete=function(t){var e=this.__data__,n=tt(e,t);return!(n<0||(n==e.length-1?e.pop():z.call(e,n,1),--this.size,0))},K.prototype.get=function(t){var e=this.__data__,n=tt(e,t);return n<0?void 0:e[n][1]},K.prototype.has=function(t){return tt(this.__data__,t)>-1},K.prototype.set=function(t,e){var n=this.__data__,r=tt(n,t);return r<0?(++this.size,n.push([t,e])):n[r][1]=e,this},X.prototype.clear=function(){this.size=0,this.__data__={hash:new q,map:new(G||K),string:new q}},X.prototype.delete=function(t){var e=at(this,t).delete(t);return this.size-=e?1:0,e},X.prototype.get=function(t){return at(this,t).get(t)},X.prototype.has=function(t){return at(this,t).has(t)},X.prototype.set=function(t,e){var n=at(this,t),r=n.size;return n.set(t,e),this.size+=n.size==r?0:1,this},Q.prototype.clear=function(){this.__data__=new K,this.size=0},Q.prototype.delete=function(t){var e=this.__data__,n=e.delete(t);return this.size=e.size,n},Q.prototype.get=function(t){return this.__data__.get(t)},Q.prototype.has=function(t){return this.__data__.has(t)},Q.prototype.set=function(t,e){var n=this.__data__;if(n instanceof K){var r=n.__data__;if(!G||r.length<199)return r.push([t,e]),this.size=++n.size,this;n=this.__data__=new X(r)}return n.set(t,e),this.size=n.size,this};function nt(t){return null==t?void 0===t?"[object Undefined]":"[object Null]":U&&U in Object(t)?function(t){var e=P.call(t,U),n=t[U];try{t[U]=void 0;var r=!0}catch(t){}var i=A.call(t);return r&&(e?t[U]=n:delete t[U]),i}(t):function(t){return A.call(t)}(t)}function rt(t){return _t(t)&&nt(t)==o}function it(t,e,n,r,i){t!==e&&function(t,e,n){for(var r=-1,i=Object(t),o=n(t),a=o.length;a--;){var s=o[++r];if(!1===e(i[s],s,i))break}}(e,(function(o,a){if(i||(i=new Q),vt(o))!function(t,e,n,r,i,o,a){var l=ut(t,n),c=ut(e,n),u=a.get(c);if(u)Z(t,n,u);else{var d,h,f,p,g,m=o?o(l,c,n+"",t,e,a):void 0,y=void 0===m;if(y){var b=pt(c),v=!b&&mt(c),_=!b&&!v&&wt(c);m=c,b||v||_?pt(l)?m=l:_t(g=l)&&gt(g)?m=function(t,e){var n=-1,r=t.length;for(e||(e=Array(r));++n<r;)e[n]=t[n];return e}(l):v?(y=!1,m=function(t){return t.slice()}(c)):_?(y=!1,p=new(f=(d=c).buffer).constructor(f.byteLength),new B(p).set(new B(f)),h=p,m=new d.constructor(h,d.byteOffset,d.length)):m=[]:function(t){if(!_t(t)||nt(t)!=s)return!1;var e=L(t);if(null===e)return!0;var n=P.call(e,"constructor")&&e.constructor;return"function"==typeof n&&n instanceof n&&E.call(n)==M}(c)||ft(c)?(m=l,ft(l)?m=function(t){return function(t,e,n){var r=!n;n||(n={});for(var i=-1,o=e.length;++i<o;){var a=e[i],s=void 0;void 0===s&&(s=t[a]),r?et(n,a,s):J(n,a,s)}return n}(t,xt(t))}(l):vt(l)&&!yt(l)||(m=function(t){return"function"!=typeof t.constructor||ct(t)?{}:Y(L(t))}(c))):y=!1}y&&(a.set(c,m),i(m,c,r,o,a),a.delete(c)),Z(t,n,m)}}(t,e,a,n,it,r,i);else{var l=r?r(ut(t,a),o,a+"",t,e,i):void 0;void 0===l&&(l=o),Z(t,a,l)}}),xt)}var ot=j?function(t,e){return j(t,"toString",{configurable:!0,enumerable:!1,value:(n=e,function(){return n}),writable:!0});var n}:Ct;function at(t,e){var n,r,i=t.__data__;return("string"==(r=typeof(n=e))||"number"==r||"symbol"==r||"boolean"==r?"__proto__"!==n:null===n)?i["string"==typeof e?"string":"hash"]:i.map}function st(t,e){var n=function(t,e){return null==t?void 0:t[e]}(t,e);return function(t){return!(!vt(t)||function(t){return!!I&&I in t}(t))&&(yt(t)?D:l).test(function(t){if(null!=t){try{return E.call(t)}catch(t){}try{return t+""}catch(t){}}return""}(t))}(n)?n:void 0}function lt(t,e){var n=typeof t;return!!(e=null==e?i:e)&&("number"==n||"symbol"!=n&&c.test(t))&&t>-1&&t%1==0&&t<e}function ct(t){var e=t&&t.constructor;return t===("function"==typeof e&&e.prototype||C)}function ut(t,e){if(("constructor"!==e||"function"!=typeof t[e])&&"__proto__"!=e)return t[e]}var dt=function(t){var e=0,n=0;return function(){var r=W(),i=16-(r-n);if(n=r,i>0){if(++e>=800)return arguments[0]}else e=0;return t.apply(void 0,arguments)}}(ot);function ht(t,e){return t===e||t!=t&&e!=e}var ft=rt(function(){return arguments}())?rt:function(t){return _t(t)&&P.call(t,"callee")&&!O.call(t,"callee")},pt=Array.isArray;function gt(t){return null!=t&&bt(t.length)&&!yt(t)}var mt=V||function(){return!1};function yt(t){if(!vt(t))return!1;var e=nt(t);return e==a||"[object GeneratorFunction]"==e||"[object AsyncFunction]"==e||"[object Proxy]"==e}function bt(t){return"number"==typeof t&&t>-1&&t%1==0&&t<=i}function vt(t){var e=typeof t;return null!=t&&("object"==e||"function"==e)}function _t(t){return null!=t&&"object"==typeof t}var wt=x?function(t){return function(e){return t(e)}}(x):function(t){return _t(t)&&bt(t.length)&&!!u[nt(t)]};function xt(t){return gt(t)?function(t,e){var n=pt(t),r=!n&&ft(t),i=!n&&!r&&mt(t),o=!n&&!r&&!i&&wt(t),a=n||r||i||o,s=a?function(t,e){for(var n=-1,r=Array(t);++n<t;)r[n]=e(n);return r}(t.length,String):[],l=s.length;for(var c in t)!e&&!P.call(t,c)||a&&("length"==c||i&&("offset"==c||"parent"==c)||o&&("buffer"==c||"byteLength"==c||"byteOffset"==c)||lt(c,l))||s.push(c);return s}(t,!0):function(t){if(!vt(t))return function(t){var e=[];if(null!=t)for(var n in Object(t))e.push(n);return e}(t);var e=ct(t),n=[];for(var r in t)("constructor"!=r||!e&&P.call(t,r))&&n.push(r);return n}(t)}var St,kt=(St=function(t,e,n,r){it(t,e,n,r)},function(t,e){return dt(function(t,e,n){return e=$(void 0===e?t.length-1:e,0),function(){for(var r=arguments,i=-1,o=$(r.length-e,0),a=Array(o);++i<o;)a[i]=r[e+i];i=-1;for(var s=Array(e+1);++i<e;)s[i]=r[i];return s[e]=n(a),function(t,e,n){switch(n.length){case 0:return t.call(e);case 1:return t.call(e,n[0]);case 2:return t.call(e,n[0],n[1]);case 3:return t.call(e,n[0],n[1],n[2])}return t.apply(e,n)}(t,this,s)}}(t,e,Ct),t+"")}((function(t,e){var n=-1,r=e.length,i=r>1?e[r-1]:void 0,o=r>2?e[2]:void 0;for(i=St.length>3&&"function"==typeof i?(r--,i):void 0,o&&function(t,e,n){if(!vt(n))return!1;var r=typeof e;return!!("number"==r?gt(n)&&lt(e,n.length):"string"==r&&e in n)&&ht(n[e],t)}(e[0],e[1],o)&&(i=r<3?void 0:i,r=1),t=Object(t);++n<r;){var a=e[n];a&&St(t,a,n,i)}return t})));function Ct(t){return t}t.exports=kt},664:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Enhance=void 0;const r=n(3100),i=n(5304),o=n(4715);function a(t,e,n,r,i){const o=n-e,a=i-r;if(0===o)return r+a/2;if(0===a)return r;let s=(t-e)/o;return s=a*s+r,s}e.Enhance=function(t){const e=t.data,n=e.length;let r,i,o,s=e[0],l=s,c=e[1],u=c,d=e[2],h=d;const f=this.enhance();if(0===f)return;for(let t=0;t<n;t+=4)r=e[t+0],r<s?s=r:r>l&&(l=r),i=e[t+1],i<c?c=i:i>u&&(u=i),o=e[t+2],o<d?d=o:o>h&&(h=o);let p,g,m,y,b,v,_,w,x;l===s&&(l=255,s=0),u===c&&(u=255,c=0),h===d&&(h=255,d=0),f>0?(g=l+f*(255-l),m=s-f*(s-0),b=u+f*(255-u),v=c-f*(c-0),w=h+f*(255-h),x=d-f*(d-0)):(p=.5*(l+s),g=l+f*(l-p),m=s+f*(s-p),y=.5*(u+c),b=u+f*(u-y),v=c+f*(c-y),_=.5*(h+d),w=h+f*(h-_),x=d+f*(d-_));for(let t=0;t<n;t+=4)e[t+0]=a(e[t+0],s,l,m,g),e[t+1]=a(e[t+1],c,u,v,b),e[t+2]=a(e[t+2],d,h,x,w)},r.Factory.addGetterSetter(i.Node,"enhance",0,(0,o.getNumberValidator)(),r.Factory.afterSetFilter)},760:(t,e,n)=>{var r=n(3308);t.exports=function(t,e,n){const i=r.useRef("loading"),o=r.useRef(),[a,s]=r.useState(0),l=r.useRef(),c=r.useRef(),u=r.useRef();return l.current===t&&c.current===e&&u.current===n||(i.current="loading",o.current=void 0,l.current=t,c.current=e,u.current=n),r.useLayoutEffect((function(){if(t){var r=document.createElement("img");return r.addEventListener("load",a),r.addEventListener("error",l),e&&(r.crossOrigin=e),n&&(r.referrerPolicy=n),r.src=t,function(){r.removeEventListener("load",a),r.removeEventListener("error",l)}}function a(){i.current="loaded",o.current=r,s(Math.random())}function l(){i.current="failed",o.current=void 0,s(Math.random())}}),[t,e,n]),[o.current,i.current]}},951:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e._registerNode=e.Konva=e.glob=void 0;const r=Math.PI/180;e.glob=void 0!==n.g?n.g:"undefined"!=typeof window?window:"undefined"!=typeof WorkerGlobalScope?self:{},e.Konva={_global:e.glob,version:"9.3.20",isBrowser:"undefined"!=typeof window&&("[object Window]"==={}.toString.call(window)||"[object global]"==={}.toString.call(window)),isUnminified:/param/.test(function(t){}.toString()),dblClickWindow:400,getAngle:t=>e.Konva.angleDeg?t*r:t,enableTrace:!1,pointerEventsEnabled:!0,autoDrawEnabled:!0,hitOnDragEnabled:!1,capturePointerEventsEnabled:!1,_mouseListenClick:!1,_touchListenClick:!1,_pointerListenClick:!1,_mouseInDblClickWindow:!1,_touchInDblClickWindow:!1,_pointerInDblClickWindow:!1,_mouseDblClickPointerId:null,_touchDblClickPointerId:null,_pointerDblClickPointerId:null,_fixTextRendering:!1,pixelRatio:"undefined"!=typeof window&&window.devicePixelRatio||1,dragDistance:3,angleDeg:!0,showWarnings:!0,dragButtons:[0,1],isDragging:()=>e.Konva.DD.isDragging,isTransforming(){var t;return null===(t=e.Konva.Transformer)||void 0===t?void 0:t.isTransforming()},isDragReady:()=>!!e.Konva.DD.node,releaseCanvasOnDestroy:!0,document:e.glob.document,_injectGlobal(t){e.glob.Konva=t}},e._registerNode=t=>{e.Konva[t.prototype.getClassName()]=t},e.Konva._injectGlobal(e.Konva)},1175:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Emboss=void 0;const r=n(3100),i=n(5304),o=n(9532),a=n(4715);e.Emboss=function(t){const e=10*this.embossStrength(),n=255*this.embossWhiteLevel(),r=this.embossDirection(),i=this.embossBlend(),a=t.data,s=t.width,l=t.height,c=4*s;let u=0,d=0,h=l;switch(r){case"top-left":u=-1,d=-1;break;case"top":u=-1,d=0;break;case"top-right":u=-1,d=1;break;case"right":u=0,d=1;break;case"bottom-right":u=1,d=1;break;case"bottom":u=1,d=0;break;case"bottom-left":u=1,d=-1;break;case"left":u=0,d=-1;break;default:o.Util.error("Unknown emboss direction: "+r)}do{const t=(h-1)*c;let r=u;h+r<1&&(r=0),h+r>l&&(r=0);const o=(h-1+r)*s*4;let f=s;do{const r=t+4*(f-1);let l=d;f+l<1&&(l=0),f+l>s&&(l=0);const c=o+4*(f-1+l),u=a[r]-a[c],h=a[r+1]-a[c+1],p=a[r+2]-a[c+2];let g=u;const m=g>0?g:-g;if((h>0?h:-h)>m&&(g=h),(p>0?p:-p)>m&&(g=p),g*=e,i){const t=a[r]+g,e=a[r+1]+g,n=a[r+2]+g;a[r]=t>255?255:t<0?0:t,a[r+1]=e>255?255:e<0?0:e,a[r+2]=n>255?255:n<0?0:n}else{let t=n-g;t<0?t=0:t>255&&(t=255),a[r]=a[r+1]=a[r+2]=t}}while(--f)}while(--h)},r.Factory.addGetterSetter(i.Node,"embossStrength",.5,(0,a.getNumberValidator)(),r.Factory.afterSetFilter),r.Factory.addGetterSetter(i.Node,"embossWhiteLevel",.5,(0,a.getNumberValidator)(),r.Factory.afterSetFilter),r.Factory.addGetterSetter(i.Node,"embossDirection","top-left",void 0,r.Factory.afterSetFilter),r.Factory.addGetterSetter(i.Node,"embossBlend",!1,void 0,r.Factory.afterSetFilter)},1323:(t,e,n)=>{"use strict";t.exports=n(1679)},1484:(t,e,n)=>{var r=n(2637);t.exports=function(){return r.Date.now()}},1493:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Blur=void 0;const r=n(3100),i=n(5304),o=n(4715);function a(){this.r=0,this.g=0,this.b=0,this.a=0,this.next=null}const s=[512,512,456,512,328,456,335,512,405,328,271,456,388,335,292,512,454,405,364,328,298,271,496,456,420,388,360,335,312,292,273,512,482,454,428,405,383,364,345,328,312,298,284,271,259,496,475,456,437,420,404,388,374,360,347,335,323,312,302,292,282,273,265,512,497,482,468,454,441,428,417,405,394,383,373,364,354,345,337,328,320,312,305,298,291,284,278,271,265,259,507,496,485,475,465,456,446,437,428,420,412,404,396,388,381,374,367,360,354,347,341,335,329,323,318,312,307,302,297,292,287,282,278,273,269,265,261,512,505,497,489,482,475,468,461,454,447,441,435,428,422,417,411,405,399,394,389,383,378,373,368,364,359,354,350,345,341,337,332,328,324,320,316,312,309,305,301,298,294,291,287,284,281,278,274,271,268,265,262,259,257,507,501,496,491,485,480,475,470,465,460,456,451,446,442,437,433,428,424,420,416,412,408,404,400,396,392,388,385,381,377,374,370,367,363,360,357,354,350,347,344,341,338,335,332,329,326,323,320,318,315,312,310,307,304,302,299,297,294,292,289,287,285,282,280,278,275,273,271,269,267,265,263,261,259],l=[9,11,12,13,13,14,14,15,15,15,15,16,16,16,16,17,17,17,17,17,17,17,18,18,18,18,18,18,18,18,18,19,19,19,19,19,19,19,19,19,19,19,19,19,19,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24];e.Blur=function(t){const e=Math.round(this.blurRadius());e>0&&function(t,e){const n=t.data,r=t.width,i=t.height;let o,c,u,d,h,f,p,g,m,y,b,v,_,w,x,S,k,C,T,E,P,I,A,M;const D=e+e+1,F=r-1,R=i-1,B=e+1,L=B*(B+1)/2,N=new a,O=s[e],z=l[e];let U=null,j=N,V=null,$=null;for(u=1;u<D;u++)j=j.next=new a,u===B&&(U=j);for(j.next=N,p=f=0,c=0;c<i;c++){for(S=k=C=T=g=m=y=b=0,v=B*(E=n[f]),_=B*(P=n[f+1]),w=B*(I=n[f+2]),x=B*(A=n[f+3]),g+=L*E,m+=L*P,y+=L*I,b+=L*A,j=N,u=0;u<B;u++)j.r=E,j.g=P,j.b=I,j.a=A,j=j.next;for(u=1;u<B;u++)d=f+((F<u?F:u)<<2),g+=(j.r=E=n[d])*(M=B-u),m+=(j.g=P=n[d+1])*M,y+=(j.b=I=n[d+2])*M,b+=(j.a=A=n[d+3])*M,S+=E,k+=P,C+=I,T+=A,j=j.next;for(V=N,$=U,o=0;o<r;o++)n[f+3]=A=b*O>>z,0!==A?(A=255/A,n[f]=(g*O>>z)*A,n[f+1]=(m*O>>z)*A,n[f+2]=(y*O>>z)*A):n[f]=n[f+1]=n[f+2]=0,g-=v,m-=_,y-=w,b-=x,v-=V.r,_-=V.g,w-=V.b,x-=V.a,d=p+((d=o+e+1)<F?d:F)<<2,S+=V.r=n[d],k+=V.g=n[d+1],C+=V.b=n[d+2],T+=V.a=n[d+3],g+=S,m+=k,y+=C,b+=T,V=V.next,v+=E=$.r,_+=P=$.g,w+=I=$.b,x+=A=$.a,S-=E,k-=P,C-=I,T-=A,$=$.next,f+=4;p+=r}for(o=0;o<r;o++){for(k=C=T=S=m=y=b=g=0,f=o<<2,v=B*(E=n[f]),_=B*(P=n[f+1]),w=B*(I=n[f+2]),x=B*(A=n[f+3]),g+=L*E,m+=L*P,y+=L*I,b+=L*A,j=N,u=0;u<B;u++)j.r=E,j.g=P,j.b=I,j.a=A,j=j.next;for(h=r,u=1;u<=e;u++)f=h+o<<2,g+=(j.r=E=n[f])*(M=B-u),m+=(j.g=P=n[f+1])*M,y+=(j.b=I=n[f+2])*M,b+=(j.a=A=n[f+3])*M,S+=E,k+=P,C+=I,T+=A,j=j.next,u<R&&(h+=r);for(f=o,V=N,$=U,c=0;c<i;c++)d=f<<2,n[d+3]=A=b*O>>z,A>0?(A=255/A,n[d]=(g*O>>z)*A,n[d+1]=(m*O>>z)*A,n[d+2]=(y*O>>z)*A):n[d]=n[d+1]=n[d+2]=0,g-=v,m-=_,y-=w,b-=x,v-=V.r,_-=V.g,w-=V.b,x-=V.a,d=o+((d=c+B)<R?d:R)*r<<2,g+=S+=V.r=n[d],m+=k+=V.g=n[d+1],y+=C+=V.b=n[d+2],b+=T+=V.a=n[d+3],V=V.next,v+=E=$.r,_+=P=$.g,w+=I=$.b,x+=A=$.a,S-=E,k-=P,C-=I,T-=A,$=$.next,f+=r}}(t,e)},r.Factory.addGetterSetter(i.Node,"blurRadius",0,(0,o.getNumberValidator)(),r.Factory.afterSetFilter)},1628:(t,e,n)=>{"use strict";var r=n(3308),i=Symbol.for("react.element"),o=Symbol.for("react.fragment"),a=Object.prototype.hasOwnProperty,s=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,l={key:!0,ref:!0,__self:!0,__source:!0};function c(t,e,n){var r,o={},c=null,u=null;for(r in void 0!==n&&(c=""+n),void 0!==e.key&&(c=""+e.key),void 0!==e.ref&&(u=e.ref),e)a.call(e,r)&&!l.hasOwnProperty(r)&&(o[r]=e[r]);if(t&&t.defaultProps)for(r in e=t.defaultProps)void 0===o[r]&&(o[r]=e[r]);return{$$typeof:i,type:t,key:c,ref:u,props:o,_owner:s.current}}e.Fragment=o,e.jsx=c,e.jsxs=c},1672:(t,e,n)=>{var r=n(1681),i=n(5987),o=n(550),a=r?r.toStringTag:void 0;t.exports=function(t){return null==t?void 0===t?"[object Undefined]":"[object Null]":a&&a in Object(t)?i(t):o(t)}},1679:(t,e)=>{"use strict";var n="function"==typeof Symbol&&Symbol.for,r=n?Symbol.for("react.element"):60103,i=n?Symbol.for("react.portal"):60106,o=n?Symbol.for("react.fragment"):60107,a=n?Symbol.for("react.strict_mode"):60108,s=n?Symbol.for("react.profiler"):60114,l=n?Symbol.for("react.provider"):60109,c=n?Symbol.for("react.context"):60110,u=n?Symbol.for("react.async_mode"):60111,d=n?Symbol.for("react.concurrent_mode"):60111,h=n?Symbol.for("react.forward_ref"):60112,f=n?Symbol.for("react.suspense"):60113,p=n?Symbol.for("react.suspense_list"):60120,g=n?Symbol.for("react.memo"):60115,m=n?Symbol.for("react.lazy"):60116,y=n?Symbol.for("react.block"):60121,b=n?Symbol.for("react.fundamental"):60117,v=n?Symbol.for("react.responder"):60118,_=n?Symbol.for("react.scope"):60119;function w(t){if("object"==typeof t&&null!==t){var e=t.$$typeof;switch(e){case r:switch(t=t.type){case u:case d:case o:case s:case a:case f:return t;default:switch(t=t&&t.$$typeof){case c:case h:case m:case g:case l:return t;default:return e}}case i:return e}}}function x(t){return w(t)===d}e.AsyncMode=u,e.ConcurrentMode=d,e.ContextConsumer=c,e.ContextProvider=l,e.Element=r,e.ForwardRef=h,e.Fragment=o,e.Lazy=m,e.Memo=g,e.Portal=i,e.Profiler=s,e.StrictMode=a,e.Suspense=f,e.isAsyncMode=function(t){return x(t)||w(t)===u},e.isConcurrentMode=x,e.isContextConsumer=function(t){return w(t)===c},e.isContextProvider=function(t){return w(t)===l},e.isElement=function(t){return"object"==typeof t&&null!==t&&t.$$typeof===r},e.isForwardRef=function(t){return w(t)===h},e.isFragment=function(t){return w(t)===o},e.isLazy=function(t){return w(t)===m},e.isMemo=function(t){return w(t)===g},e.isPortal=function(t){return w(t)===i},e.isProfiler=function(t){return w(t)===s},e.isStrictMode=function(t){return w(t)===a},e.isSuspense=function(t){return w(t)===f},e.isValidElementType=function(t){return"string"==typeof t||"function"==typeof t||t===o||t===d||t===s||t===a||t===f||t===p||"object"==typeof t&&null!==t&&(t.$$typeof===m||t.$$typeof===g||t.$$typeof===l||t.$$typeof===c||t.$$typeof===h||t.$$typeof===b||t.$$typeof===v||t.$$typeof===_||t.$$typeof===y)},e.typeOf=w},1681:(t,e,n)=>{var r=n(2637).Symbol;t.exports=r},1691:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Layer=void 0;const r=n(9532),i=n(7081),o=n(5304),a=n(3100),s=n(9164),l=n(4715),c=n(3123),u=n(951),d=[{x:0,y:0},{x:-1,y:-1},{x:1,y:-1},{x:1,y:1},{x:-1,y:1}],h=d.length;class f extends i.Container{constructor(t){super(t),this.canvas=new s.SceneCanvas,this.hitCanvas=new s.HitCanvas({pixelRatio:1}),this._waitingForDraw=!1,this.on("visibleChange.konva",this._checkVisibility),this._checkVisibility(),this.on("imageSmoothingEnabledChange.konva",this._setSmoothEnabled),this._setSmoothEnabled()}createPNGStream(){return this.canvas._canvas.createPNGStream()}getCanvas(){return this.canvas}getNativeCanvasElement(){return this.canvas._canvas}getHitCanvas(){return this.hitCanvas}getContext(){return this.getCanvas().getContext()}clear(t){return this.getContext().clear(t),this.getHitCanvas().getContext().clear(t),this}setZIndex(t){super.setZIndex(t);const e=this.getStage();return e&&e.content&&(e.content.removeChild(this.getNativeCanvasElement()),t<e.children.length-1?e.content.insertBefore(this.getNativeCanvasElement(),e.children[t+1].getCanvas()._canvas):e.content.appendChild(this.getNativeCanvasElement())),this}moveToTop(){o.Node.prototype.moveToTop.call(this);const t=this.getStage();return t&&t.content&&(t.content.removeChild(this.getNativeCanvasElement()),t.content.appendChild(this.getNativeCanvasElement())),!0}moveUp(){if(!o.Node.prototype.moveUp.call(this))return!1;const t=this.getStage();return!(!t||!t.content||(t.content.removeChild(this.getNativeCanvasElement()),this.index<t.children.length-1?t.content.insertBefore(this.getNativeCanvasElement(),t.children[this.index+1].getCanvas()._canvas):t.content.appendChild(this.getNativeCanvasElement()),0))}moveDown(){if(o.Node.prototype.moveDown.call(this)){const t=this.getStage();if(t){const e=t.children;t.content&&(t.content.removeChild(this.getNativeCanvasElement()),t.content.insertBefore(this.getNativeCanvasElement(),e[this.index+1].getCanvas()._canvas))}return!0}return!1}moveToBottom(){if(o.Node.prototype.moveToBottom.call(this)){const t=this.getStage();if(t){const e=t.children;t.content&&(t.content.removeChild(this.getNativeCanvasElement()),t.content.insertBefore(this.getNativeCanvasElement(),e[1].getCanvas()._canvas))}return!0}return!1}getLayer(){return this}remove(){const t=this.getNativeCanvasElement();return o.Node.prototype.remove.call(this),t&&t.parentNode&&r.Util._isInDocument(t)&&t.parentNode.removeChild(t),this}getStage(){return this.parent}setSize({width:t,height:e}){return this.canvas.setSize(t,e),this.hitCanvas.setSize(t,e),this._setSmoothEnabled(),this}_validateAdd(t){const e=t.getType();"Group"!==e&&"Shape"!==e&&r.Util.throw("You may only add groups and shapes to a layer.")}_toKonvaCanvas(t){return(t=t||{}).width=t.width||this.getWidth(),t.height=t.height||this.getHeight(),t.x=void 0!==t.x?t.x:this.x(),t.y=void 0!==t.y?t.y:this.y(),o.Node.prototype._toKonvaCanvas.call(this,t)}_checkVisibility(){const t=this.visible();this.canvas._canvas.style.display=t?"block":"none"}_setSmoothEnabled(){this.getContext()._context.imageSmoothingEnabled=this.imageSmoothingEnabled()}getWidth(){if(this.parent)return this.parent.width()}setWidth(){r.Util.warn('Can not change width of layer. Use "stage.width(value)" function instead.')}getHeight(){if(this.parent)return this.parent.height()}setHeight(){r.Util.warn('Can not change height of layer. Use "stage.height(value)" function instead.')}batchDraw(){return this._waitingForDraw||(this._waitingForDraw=!0,r.Util.requestAnimFrame((()=>{this.draw(),this._waitingForDraw=!1}))),this}getIntersection(t){if(!this.isListening()||!this.isVisible())return null;let e=1,n=!1;for(;;){for(let r=0;r<h;r++){const i=d[r],o=this._getIntersection({x:t.x+i.x*e,y:t.y+i.y*e}),a=o.shape;if(a)return a;if(n=!!o.antialiased,!o.antialiased)break}if(!n)return null;e+=1}}_getIntersection(t){const e=this.hitCanvas.pixelRatio,n=this.hitCanvas.context.getImageData(Math.round(t.x*e),Math.round(t.y*e),1,1).data,i=n[3];if(255===i){const t=r.Util._rgbToHex(n[0],n[1],n[2]),e=c.shapes["#"+t];return e?{shape:e}:{antialiased:!0}}return i>0?{antialiased:!0}:{}}drawScene(t,e){const n=this.getLayer(),r=t||n&&n.getCanvas();return this._fire("beforeDraw",{node:this}),this.clearBeforeDraw()&&r.getContext().clear(),i.Container.prototype.drawScene.call(this,r,e),this._fire("draw",{node:this}),this}drawHit(t,e){const n=this.getLayer(),r=t||n&&n.hitCanvas;return n&&n.clearBeforeDraw()&&n.getHitCanvas().getContext().clear(),i.Container.prototype.drawHit.call(this,r,e),this}enableHitGraph(){return this.hitGraphEnabled(!0),this}disableHitGraph(){return this.hitGraphEnabled(!1),this}setHitGraphEnabled(t){r.Util.warn("hitGraphEnabled method is deprecated. Please use layer.listening() instead."),this.listening(t)}getHitGraphEnabled(t){return r.Util.warn("hitGraphEnabled method is deprecated. Please use layer.listening() instead."),this.listening()}toggleHitCanvas(){if(!this.parent||!this.parent.content)return;const t=this.parent;this.hitCanvas._canvas.parentNode?t.content.removeChild(this.hitCanvas._canvas):t.content.appendChild(this.hitCanvas._canvas)}destroy(){return r.Util.releaseCanvas(this.getNativeCanvasElement(),this.getHitCanvas()._canvas),super.destroy()}}e.Layer=f,f.prototype.nodeType="Layer",(0,u._registerNode)(f),a.Factory.addGetterSetter(f,"imageSmoothingEnabled",!0),a.Factory.addGetterSetter(f,"clearBeforeDraw",!0),a.Factory.addGetterSetter(f,"hitGraphEnabled",!0,(0,l.getBooleanValidator)())},1810:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.getCapturedShape=function(t){return i.get(t)},e.createEvent=a,e.hasPointerCapture=function(t,e){return i.get(t)===e},e.setPointerCapture=function(t,e){s(t),e.getStage()&&(i.set(t,e),o&&e._fire("gotpointercapture",a(new PointerEvent("gotpointercapture"))))},e.releaseCapture=s;const r=n(951),i=new Map,o=void 0!==r.Konva._global.PointerEvent;function a(t){return{evt:t,pointerId:t.pointerId}}function s(t,e){const n=i.get(t);if(!n)return;const r=n.getStage();r&&r.content,i.delete(t),o&&n._fire("lostpointercapture",a(new PointerEvent("lostpointercapture")))}},1894:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.RGBA=void 0;const r=n(3100),i=n(5304),o=n(4715);e.RGBA=function(t){const e=t.data,n=e.length,r=this.red(),i=this.green(),o=this.blue(),a=this.alpha();for(let t=0;t<n;t+=4){const n=1-a;e[t]=r*a+e[t]*n,e[t+1]=i*a+e[t+1]*n,e[t+2]=o*a+e[t+2]*n}},r.Factory.addGetterSetter(i.Node,"red",0,(function(t){return this._filterUpToDate=!1,t>255?255:t<0?0:Math.round(t)})),r.Factory.addGetterSetter(i.Node,"green",0,(function(t){return this._filterUpToDate=!1,t>255?255:t<0?0:Math.round(t)})),r.Factory.addGetterSetter(i.Node,"blue",0,o.RGBComponent,r.Factory.afterSetFilter),r.Factory.addGetterSetter(i.Node,"alpha",1,(function(t){return this._filterUpToDate=!1,t>1?1:t<0?0:t}))},1952:(t,e)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Sepia=void 0,e.Sepia=function(t){const e=t.data,n=e.length;for(let t=0;t<n;t+=4){const n=e[t+0],r=e[t+1],i=e[t+2];e[t+0]=Math.min(255,.393*n+.769*r+.189*i),e[t+1]=Math.min(255,.349*n+.686*r+.168*i),e[t+2]=Math.min(255,.272*n+.534*r+.131*i)}}},2033:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Kaleidoscope=void 0;const r=n(3100),i=n(5304),o=n(9532),a=n(4715);e.Kaleidoscope=function(t){const e=t.width,n=t.height;let r,i,a,s,l,c,u,d,h,f,p=Math.round(this.kaleidoscopePower());const g=Math.round(this.kaleidoscopeAngle()),m=Math.floor(e*(g%360)/360);if(p<1)return;const y=o.Util.createCanvasElement();y.width=e,y.height=n;const b=y.getContext("2d").getImageData(0,0,e,n);o.Util.releaseCanvas(y),function(t,e,n){const r=t.data,i=e.data,o=t.width,a=t.height,s=n.polarCenterX||o/2,l=n.polarCenterY||a/2;let c=Math.sqrt(s*s+l*l),u=o-s,d=a-l;const h=Math.sqrt(u*u+d*d);c=h>c?h:c;const f=a,p=o,g=360/p*Math.PI/180;for(let t=0;t<p;t+=1){const e=Math.sin(t*g),n=Math.cos(t*g);for(let a=0;a<f;a+=1){u=Math.floor(s+c*a/f*n),d=Math.floor(l+c*a/f*e);let h=4*(d*o+u);const p=r[h+0],g=r[h+1],m=r[h+2],y=r[h+3];h=4*(t+a*o),i[h+0]=p,i[h+1]=g,i[h+2]=m,i[h+3]=y}}}(t,b,{polarCenterX:e/2,polarCenterY:n/2});let v=e/Math.pow(2,p);for(;v<=8;)v*=2,p-=1;v=Math.ceil(v);let _=v,w=0,x=_,S=1;for(m+v>e&&(w=_,x=0,S=-1),i=0;i<n;i+=1)for(r=w;r!==x;r+=S)a=Math.round(r+m)%e,h=4*(e*i+a),l=b.data[h+0],c=b.data[h+1],u=b.data[h+2],d=b.data[h+3],f=4*(e*i+r),b.data[f+0]=l,b.data[f+1]=c,b.data[f+2]=u,b.data[f+3]=d;for(i=0;i<n;i+=1)for(_=Math.floor(v),s=0;s<p;s+=1){for(r=0;r<_+1;r+=1)h=4*(e*i+r),l=b.data[h+0],c=b.data[h+1],u=b.data[h+2],d=b.data[h+3],f=4*(e*i+2*_-r-1),b.data[f+0]=l,b.data[f+1]=c,b.data[f+2]=u,b.data[f+3]=d;_*=2}!function(t,e,n){const r=t.data,i=e.data,o=t.width,a=t.height,s=n.polarCenterX||o/2,l=n.polarCenterY||a/2;let c=Math.sqrt(s*s+l*l),u=o-s,d=a-l;const h=Math.sqrt(u*u+d*d);c=h>c?h:c;const f=a,p=o,g=n.polarRotation||0;let m,y;for(u=0;u<o;u+=1)for(d=0;d<a;d+=1){const t=u-s,e=d-l,n=Math.sqrt(t*t+e*e)*f/c;let a=(180*Math.atan2(e,t)/Math.PI+360+g)%360;a=a*p/360,m=Math.floor(a),y=Math.floor(n);let h=4*(y*o+m);const b=r[h+0],v=r[h+1],_=r[h+2],w=r[h+3];h=4*(d*o+u),i[h+0]=b,i[h+1]=v,i[h+2]=_,i[h+3]=w}}(b,t,{polarRotation:0})},r.Factory.addGetterSetter(i.Node,"kaleidoscopePower",2,(0,a.getNumberValidator)(),r.Factory.afterSetFilter),r.Factory.addGetterSetter(i.Node,"kaleidoscopeAngle",0,(0,a.getNumberValidator)(),r.Factory.afterSetFilter)},2384:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Arrow=void 0;const r=n(3100),i=n(6995),o=n(4715),a=n(951),s=n(2878);class l extends i.Line{_sceneFunc(t){super._sceneFunc(t);const e=2*Math.PI,n=this.points();let r=n;const i=0!==this.tension()&&n.length>4;i&&(r=this.getTensionPoints());const o=this.pointerLength(),a=n.length;let l,c;if(i){const t=[r[r.length-4],r[r.length-3],r[r.length-2],r[r.length-1],n[a-2],n[a-1]],e=s.Path.calcLength(r[r.length-4],r[r.length-3],"C",t),i=s.Path.getPointOnQuadraticBezier(Math.min(1,1-o/e),t[0],t[1],t[2],t[3],t[4],t[5]);l=n[a-2]-i.x,c=n[a-1]-i.y}else l=n[a-2]-n[a-4],c=n[a-1]-n[a-3];const u=(Math.atan2(c,l)+e)%e,d=this.pointerWidth();this.pointerAtEnding()&&(t.save(),t.beginPath(),t.translate(n[a-2],n[a-1]),t.rotate(u),t.moveTo(0,0),t.lineTo(-o,d/2),t.lineTo(-o,-d/2),t.closePath(),t.restore(),this.__fillStroke(t)),this.pointerAtBeginning()&&(t.save(),t.beginPath(),t.translate(n[0],n[1]),i?(l=(r[0]+r[2])/2-n[0],c=(r[1]+r[3])/2-n[1]):(l=n[2]-n[0],c=n[3]-n[1]),t.rotate((Math.atan2(-c,-l)+e)%e),t.moveTo(0,0),t.lineTo(-o,d/2),t.lineTo(-o,-d/2),t.closePath(),t.restore(),this.__fillStroke(t))}__fillStroke(t){const e=this.dashEnabled();e&&(this.attrs.dashEnabled=!1,t.setLineDash([])),t.fillStrokeShape(this),e&&(this.attrs.dashEnabled=!0)}getSelfRect(){const t=super.getSelfRect(),e=this.pointerWidth()/2;return{x:t.x,y:t.y-e,width:t.width,height:t.height+2*e}}}e.Arrow=l,l.prototype.className="Arrow",(0,a._registerNode)(l),r.Factory.addGetterSetter(l,"pointerLength",10,(0,o.getNumberValidator)()),r.Factory.addGetterSetter(l,"pointerWidth",10,(0,o.getNumberValidator)()),r.Factory.addGetterSetter(l,"pointerAtBeginning",!1),r.Factory.addGetterSetter(l,"pointerAtEnding",!0)},2637:(t,e,n)=>{var r=n(3384),i="object"==typeof self&&self&&self.Object===Object&&self,o=r||i||Function("return this")();t.exports=o},2802:(t,e,n)=>{"use strict";var r=n(1323),i={childContextTypes:!0,contextType:!0,contextTypes:!0,defaultProps:!0,displayName:!0,getDefaultProps:!0,getDerivedStateFromError:!0,getDerivedStateFromProps:!0,mixins:!0,propTypes:!0,type:!0},o={name:!0,length:!0,prototype:!0,caller:!0,callee:!0,arguments:!0,arity:!0},a={$$typeof:!0,compare:!0,defaultProps:!0,displayName:!0,propTypes:!0,type:!0},s={};function l(t){return r.isMemo(t)?a:s[t.$$typeof]||i}s[r.ForwardRef]={$$typeof:!0,render:!0,defaultProps:!0,displayName:!0,propTypes:!0},s[r.Memo]=a;var c=Object.defineProperty,u=Object.getOwnPropertyNames,d=Object.getOwnPropertySymbols,h=Object.getOwnPropertyDescriptor,f=Object.getPrototypeOf,p=Object.prototype;t.exports=function t(e,n,r){if("string"!=typeof n){if(p){var i=f(n);i&&i!==p&&t(e,i,r)}var a=u(n);d&&(a=a.concat(d(n)));for(var s=l(e),g=l(n),m=0;m<a.length;++m){var y=a[m];if(!(o[y]||r&&r[y]||g&&g[y]||s&&s[y])){var b=h(n,y);try{c(e,y,b)}catch(t){}}}}return e}},2878:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Path=void 0;const r=n(3100),i=n(3123),o=n(951),a=n(8274);class s extends i.Shape{constructor(t){super(t),this.dataArray=[],this.pathLength=0,this._readDataAttribute(),this.on("dataChange.konva",(function(){this._readDataAttribute()}))}_readDataAttribute(){this.dataArray=s.parsePathData(this.data()),this.pathLength=s.getPathLength(this.dataArray)}_sceneFunc(t){const e=this.dataArray;t.beginPath();let n=!1;for(let p=0;p<e.length;p++){const g=e[p].command,m=e[p].points;switch(g){case"L":t.lineTo(m[0],m[1]);break;case"M":t.moveTo(m[0],m[1]);break;case"C":t.bezierCurveTo(m[0],m[1],m[2],m[3],m[4],m[5]);break;case"Q":t.quadraticCurveTo(m[0],m[1],m[2],m[3]);break;case"A":var r=m[0],i=m[1],o=m[2],a=m[3],s=m[4],l=m[5],c=m[6],u=m[7],d=o>a?o:a,h=o>a?1:o/a,f=o>a?a/o:1;t.translate(r,i),t.rotate(c),t.scale(h,f),t.arc(0,0,d,s,s+l,1-u),t.scale(1/h,1/f),t.rotate(-c),t.translate(-r,-i);break;case"z":n=!0,t.closePath()}}n||this.hasFill()?t.fillStrokeShape(this):t.strokeShape(this)}getSelfRect(){let t=[];this.dataArray.forEach((function(e){if("A"===e.command){const n=e.points[4],r=e.points[5],i=e.points[4]+r;let o=Math.PI/180;if(Math.abs(n-i)<o&&(o=Math.abs(n-i)),r<0)for(let r=n-o;r>i;r-=o){const n=s.getPointOnEllipticalArc(e.points[0],e.points[1],e.points[2],e.points[3],r,0);t.push(n.x,n.y)}else for(let r=n+o;r<i;r+=o){const n=s.getPointOnEllipticalArc(e.points[0],e.points[1],e.points[2],e.points[3],r,0);t.push(n.x,n.y)}}else if("C"===e.command)for(let n=0;n<=1;n+=.01){const r=s.getPointOnCubicBezier(n,e.start.x,e.start.y,e.points[0],e.points[1],e.points[2],e.points[3],e.points[4],e.points[5]);t.push(r.x,r.y)}else t=t.concat(e.points)}));let e,n,r=t[0],i=t[0],o=t[1],a=t[1];for(let s=0;s<t.length/2;s++)e=t[2*s],n=t[2*s+1],isNaN(e)||(r=Math.min(r,e),i=Math.max(i,e)),isNaN(n)||(o=Math.min(o,n),a=Math.max(a,n));return{x:r,y:o,width:i-r,height:a-o}}getLength(){return this.pathLength}getPointAtLength(t){return s.getPointAtLengthOfDataArray(t,this.dataArray)}static getLineLength(t,e,n,r){return Math.sqrt((n-t)*(n-t)+(r-e)*(r-e))}static getPathLength(t){let e=0;for(let n=0;n<t.length;++n)e+=t[n].pathLength;return e}static getPointAtLengthOfDataArray(t,e){let n,r=0,i=e.length;if(!i)return null;for(;r<i&&t>e[r].pathLength;)t-=e[r].pathLength,++r;if(r===i)return n=e[r-1].points.slice(-2),{x:n[0],y:n[1]};if(t<.01)return n=e[r].points.slice(0,2),{x:n[0],y:n[1]};const o=e[r],l=o.points;switch(o.command){case"L":return s.getPointOnLine(t,o.start.x,o.start.y,l[0],l[1]);case"C":return s.getPointOnCubicBezier((0,a.t2length)(t,s.getPathLength(e),(t=>(0,a.getCubicArcLength)([o.start.x,l[0],l[2],l[4]],[o.start.y,l[1],l[3],l[5]],t))),o.start.x,o.start.y,l[0],l[1],l[2],l[3],l[4],l[5]);case"Q":return s.getPointOnQuadraticBezier((0,a.t2length)(t,s.getPathLength(e),(t=>(0,a.getQuadraticArcLength)([o.start.x,l[0],l[2]],[o.start.y,l[1],l[3]],t))),o.start.x,o.start.y,l[0],l[1],l[2],l[3]);case"A":var c=l[0],u=l[1],d=l[2],h=l[3],f=l[4],p=l[5],g=l[6];return f+=p*t/o.pathLength,s.getPointOnEllipticalArc(c,u,d,h,f,g)}return null}static getPointOnLine(t,e,n,r,i,o,a){o=null!=o?o:e,a=null!=a?a:n;const s=this.getLineLength(e,n,r,i);if(s<1e-10)return{x:e,y:n};if(r===e)return{x:o,y:a+(i>n?t:-t)};const l=(i-n)/(r-e),c=Math.sqrt(t*t/(1+l*l))*(r<e?-1:1),u=l*c;if(Math.abs(a-n-l*(o-e))<1e-10)return{x:o+c,y:a+u};const d=((o-e)*(r-e)+(a-n)*(i-n))/(s*s),h=e+d*(r-e),f=n+d*(i-n),p=this.getLineLength(o,a,h,f),g=Math.sqrt(t*t-p*p),m=Math.sqrt(g*g/(1+l*l))*(r<e?-1:1);return{x:h+m,y:f+l*m}}static getPointOnCubicBezier(t,e,n,r,i,o,a,s,l){function c(t){return t*t*t}function u(t){return 3*t*t*(1-t)}function d(t){return 3*t*(1-t)*(1-t)}function h(t){return(1-t)*(1-t)*(1-t)}return{x:s*c(t)+o*u(t)+r*d(t)+e*h(t),y:l*c(t)+a*u(t)+i*d(t)+n*h(t)}}static getPointOnQuadraticBezier(t,e,n,r,i,o,a){function s(t){return t*t}function l(t){return 2*t*(1-t)}function c(t){return(1-t)*(1-t)}return{x:o*s(t)+r*l(t)+e*c(t),y:a*s(t)+i*l(t)+n*c(t)}}static getPointOnEllipticalArc(t,e,n,r,i,o){const a=Math.cos(o),s=Math.sin(o),l=n*Math.cos(i),c=r*Math.sin(i);return{x:t+(l*a-c*s),y:e+(l*s+c*a)}}static parsePathData(t){if(!t)return[];let e=t;const n=["m","M","l","L","v","V","h","H","z","Z","c","C","q","Q","t","T","s","S","a","A"];e=e.replace(new RegExp(" ","g"),",");for(var r=0;r<n.length;r++)e=e.replace(new RegExp(n[r],"g"),"|"+n[r]);const i=e.split("|"),o=[],a=[];let s=0,l=0;const c=/([-+]?((\d+\.\d+)|((\d+)|(\.\d+)))(?:e[-+]?\d+)?)/gi;let u;for(r=1;r<i.length;r++){let t=i[r],e=t.charAt(0);for(t=t.slice(1),a.length=0;u=c.exec(t);)a.push(u[0]);const n=[];for(let t=0,e=a.length;t<e;t++){if("00"===a[t]){n.push(0,0);continue}const e=parseFloat(a[t]);isNaN(e)?n.push(0):n.push(e)}for(;n.length>0&&!isNaN(n[0]);){let t="",r=[];const i=s,a=l;var d,h,f,p,g,m,y,b,v,_;switch(e){case"l":s+=n.shift(),l+=n.shift(),t="L",r.push(s,l);break;case"L":s=n.shift(),l=n.shift(),r.push(s,l);break;case"m":var w=n.shift(),x=n.shift();if(s+=w,l+=x,t="M",o.length>2&&"z"===o[o.length-1].command)for(let t=o.length-2;t>=0;t--)if("M"===o[t].command){s=o[t].points[0]+w,l=o[t].points[1]+x;break}r.push(s,l),e="l";break;case"M":s=n.shift(),l=n.shift(),t="M",r.push(s,l),e="L";break;case"h":s+=n.shift(),t="L",r.push(s,l);break;case"H":s=n.shift(),t="L",r.push(s,l);break;case"v":l+=n.shift(),t="L",r.push(s,l);break;case"V":l=n.shift(),t="L",r.push(s,l);break;case"C":r.push(n.shift(),n.shift(),n.shift(),n.shift()),s=n.shift(),l=n.shift(),r.push(s,l);break;case"c":r.push(s+n.shift(),l+n.shift(),s+n.shift(),l+n.shift()),s+=n.shift(),l+=n.shift(),t="C",r.push(s,l);break;case"S":h=s,f=l,"C"===(d=o[o.length-1]).command&&(h=s+(s-d.points[2]),f=l+(l-d.points[3])),r.push(h,f,n.shift(),n.shift()),s=n.shift(),l=n.shift(),t="C",r.push(s,l);break;case"s":h=s,f=l,"C"===(d=o[o.length-1]).command&&(h=s+(s-d.points[2]),f=l+(l-d.points[3])),r.push(h,f,s+n.shift(),l+n.shift()),s+=n.shift(),l+=n.shift(),t="C",r.push(s,l);break;case"Q":r.push(n.shift(),n.shift()),s=n.shift(),l=n.shift(),r.push(s,l);break;case"q":r.push(s+n.shift(),l+n.shift()),s+=n.shift(),l+=n.shift(),t="Q",r.push(s,l);break;case"T":h=s,f=l,"Q"===(d=o[o.length-1]).command&&(h=s+(s-d.points[0]),f=l+(l-d.points[1])),s=n.shift(),l=n.shift(),t="Q",r.push(h,f,s,l);break;case"t":h=s,f=l,"Q"===(d=o[o.length-1]).command&&(h=s+(s-d.points[0]),f=l+(l-d.points[1])),s+=n.shift(),l+=n.shift(),t="Q",r.push(h,f,s,l);break;case"A":p=n.shift(),g=n.shift(),m=n.shift(),y=n.shift(),b=n.shift(),v=s,_=l,s=n.shift(),l=n.shift(),t="A",r=this.convertEndpointToCenterParameterization(v,_,s,l,y,b,p,g,m);break;case"a":p=n.shift(),g=n.shift(),m=n.shift(),y=n.shift(),b=n.shift(),v=s,_=l,s+=n.shift(),l+=n.shift(),t="A",r=this.convertEndpointToCenterParameterization(v,_,s,l,y,b,p,g,m)}o.push({command:t||e,points:r,start:{x:i,y:a},pathLength:this.calcLength(i,a,t||e,r)})}"z"!==e&&"Z"!==e||o.push({command:"z",points:[],start:void 0,pathLength:0})}return o}static calcLength(t,e,n,r){let i,o,l,c;const u=s;switch(n){case"L":return u.getLineLength(t,e,r[0],r[1]);case"C":return(0,a.getCubicArcLength)([t,r[0],r[2],r[4]],[e,r[1],r[3],r[5]],1);case"Q":return(0,a.getQuadraticArcLength)([t,r[0],r[2]],[e,r[1],r[3]],1);case"A":i=0;var d=r[4],h=r[5],f=r[4]+h,p=Math.PI/180;if(Math.abs(d-f)<p&&(p=Math.abs(d-f)),o=u.getPointOnEllipticalArc(r[0],r[1],r[2],r[3],d,0),h<0)for(c=d-p;c>f;c-=p)l=u.getPointOnEllipticalArc(r[0],r[1],r[2],r[3],c,0),i+=u.getLineLength(o.x,o.y,l.x,l.y),o=l;else for(c=d+p;c<f;c+=p)l=u.getPointOnEllipticalArc(r[0],r[1],r[2],r[3],c,0),i+=u.getLineLength(o.x,o.y,l.x,l.y),o=l;return l=u.getPointOnEllipticalArc(r[0],r[1],r[2],r[3],f,0),i+=u.getLineLength(o.x,o.y,l.x,l.y),i}return 0}static convertEndpointToCenterParameterization(t,e,n,r,i,o,a,s,l){const c=l*(Math.PI/180),u=Math.cos(c)*(t-n)/2+Math.sin(c)*(e-r)/2,d=-1*Math.sin(c)*(t-n)/2+Math.cos(c)*(e-r)/2,h=u*u/(a*a)+d*d/(s*s);h>1&&(a*=Math.sqrt(h),s*=Math.sqrt(h));let f=Math.sqrt((a*a*(s*s)-a*a*(d*d)-s*s*(u*u))/(a*a*(d*d)+s*s*(u*u)));i===o&&(f*=-1),isNaN(f)&&(f=0);const p=f*a*d/s,g=f*-s*u/a,m=(t+n)/2+Math.cos(c)*p-Math.sin(c)*g,y=(e+r)/2+Math.sin(c)*p+Math.cos(c)*g,b=function(t){return Math.sqrt(t[0]*t[0]+t[1]*t[1])},v=function(t,e){return(t[0]*e[0]+t[1]*e[1])/(b(t)*b(e))},_=function(t,e){return(t[0]*e[1]<t[1]*e[0]?-1:1)*Math.acos(v(t,e))},w=_([1,0],[(u-p)/a,(d-g)/s]),x=[(u-p)/a,(d-g)/s],S=[(-1*u-p)/a,(-1*d-g)/s];let k=_(x,S);return v(x,S)<=-1&&(k=Math.PI),v(x,S)>=1&&(k=0),0===o&&k>0&&(k-=2*Math.PI),1===o&&k<0&&(k+=2*Math.PI),[m,y,a,s,w,k,c,o]}}e.Path=s,s.prototype.className="Path",s.prototype._attrsAffectingSize=["data"],(0,o._registerNode)(s),r.Factory.addGetterSetter(s,"data")},2916:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.DD=void 0;const r=n(951),i=n(9532);e.DD={get isDragging(){let t=!1;return e.DD._dragElements.forEach((e=>{"dragging"===e.dragStatus&&(t=!0)})),t},justDragged:!1,get node(){let t;return e.DD._dragElements.forEach((e=>{t=e.node})),t},_dragElements:new Map,_drag(t){const n=[];e.DD._dragElements.forEach(((e,r)=>{const{node:o}=e,a=o.getStage();a.setPointersPositions(t),void 0===e.pointerId&&(e.pointerId=i.Util._getFirstPointerId(t));const s=a._changedPointerPositions.find((t=>t.id===e.pointerId));if(s){if("dragging"!==e.dragStatus){const n=o.dragDistance();if(Math.max(Math.abs(s.x-e.startPointerPos.x),Math.abs(s.y-e.startPointerPos.y))<n)return;if(o.startDrag({evt:t}),!o.isDragging())return}o._setDragPosition(t,e),n.push(o)}})),n.forEach((e=>{e.fire("dragmove",{type:"dragmove",target:e,evt:t},!0)}))},_endDragBefore(t){const n=[];e.DD._dragElements.forEach((i=>{const{node:o}=i,a=o.getStage();if(t&&a.setPointersPositions(t),!a._changedPointerPositions.find((t=>t.id===i.pointerId)))return;"dragging"!==i.dragStatus&&"stopped"!==i.dragStatus||(e.DD.justDragged=!0,r.Konva._mouseListenClick=!1,r.Konva._touchListenClick=!1,r.Konva._pointerListenClick=!1,i.dragStatus="stopped");const s=i.node.getLayer()||i.node instanceof r.Konva.Stage&&i.node;s&&-1===n.indexOf(s)&&n.push(s)})),n.forEach((t=>{t.draw()}))},_endDragAfter(t){e.DD._dragElements.forEach(((n,r)=>{"stopped"===n.dragStatus&&n.node.fire("dragend",{type:"dragend",target:n.node,evt:t},!0),"dragging"!==n.dragStatus&&e.DD._dragElements.delete(r)}))}},r.Konva.isBrowser&&(window.addEventListener("mouseup",e.DD._endDragBefore,!0),window.addEventListener("touchend",e.DD._endDragBefore,!0),window.addEventListener("touchcancel",e.DD._endDragBefore,!0),window.addEventListener("mousemove",e.DD._drag),window.addEventListener("touchmove",e.DD._drag),window.addEventListener("mouseup",e.DD._endDragAfter,!1),window.addEventListener("touchend",e.DD._endDragAfter,!1),window.addEventListener("touchcancel",e.DD._endDragAfter,!1))},3100:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Factory=void 0;const r=n(9532),i=n(4715),o="get",a="set";e.Factory={addGetterSetter(t,n,r,i,o){e.Factory.addGetter(t,n,r),e.Factory.addSetter(t,n,i,o),e.Factory.addOverloadedGetterSetter(t,n)},addGetter(t,e,n){var i=o+r.Util._capitalize(e);t.prototype[i]=t.prototype[i]||function(){const t=this.attrs[e];return void 0===t?n:t}},addSetter(t,n,i,o){var s=a+r.Util._capitalize(n);t.prototype[s]||e.Factory.overWriteSetter(t,n,i,o)},overWriteSetter(t,e,n,i){var o=a+r.Util._capitalize(e);t.prototype[o]=function(t){return n&&null!=t&&(t=n.call(this,t,e)),this._setAttr(e,t),i&&i.call(this),this}},addComponentsGetterSetter(t,n,s,l,c){const u=s.length,d=r.Util._capitalize,h=o+d(n),f=a+d(n);t.prototype[h]=function(){const t={};for(let e=0;e<u;e++){const r=s[e];t[r]=this.getAttr(n+d(r))}return t};const p=(0,i.getComponentValidator)(s);t.prototype[f]=function(t){const e=this.attrs[n];l&&(t=l.call(this,t,n)),p&&p.call(this,t,n);for(const e in t)t.hasOwnProperty(e)&&this._setAttr(n+d(e),t[e]);return t||s.forEach((t=>{this._setAttr(n+d(t),void 0)})),this._fireChangeEvent(n,e,t),c&&c.call(this),this},e.Factory.addOverloadedGetterSetter(t,n)},addOverloadedGetterSetter(t,e){var n=r.Util._capitalize(e),i=a+n,s=o+n;t.prototype[e]=function(){return arguments.length?(this[i](arguments[0]),this):this[s]()}},addDeprecatedGetterSetter(t,n,i,a){r.Util.error("Adding deprecated "+n);const s=o+r.Util._capitalize(n),l=n+" property is deprecated and will be removed soon. Look at Konva change log for more information.";t.prototype[s]=function(){r.Util.error(l);const t=this.attrs[n];return void 0===t?i:t},e.Factory.addSetter(t,n,a,(function(){r.Util.error(l)})),e.Factory.addOverloadedGetterSetter(t,n)},backCompat(t,e){r.Util.each(e,(function(e,n){const i=t.prototype[n],s=o+r.Util._capitalize(e),l=a+r.Util._capitalize(e);function c(){i.apply(this,arguments),r.Util.error('"'+e+'" method is deprecated and will be removed soon. Use ""'+n+'" instead.')}t.prototype[e]=c,t.prototype[s]=c,t.prototype[l]=c}))},afterSetFilter(){this._filterUpToDate=!1}}},3123:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Shape=e.shapes=void 0;const r=n(951),i=n(9532),o=n(3100),a=n(5304),s=n(4715),l=n(951),c=n(1810),u="hasShadow",d="shadowRGBA",h="patternImage",f="linearGradient",p="radialGradient";let g;function m(){return g||(g=i.Util.createCanvasElement().getContext("2d"),g)}e.shapes={};class y extends a.Node{constructor(t){let n;for(super(t);n=i.Util.getRandomColor(),!n||n in e.shapes;);this.colorKey=n,e.shapes[n]=this}getContext(){return i.Util.warn("shape.getContext() method is deprecated. Please do not use it."),this.getLayer().getContext()}getCanvas(){return i.Util.warn("shape.getCanvas() method is deprecated. Please do not use it."),this.getLayer().getCanvas()}getSceneFunc(){return this.attrs.sceneFunc||this._sceneFunc}getHitFunc(){return this.attrs.hitFunc||this._hitFunc}hasShadow(){return this._getCache(u,this._hasShadow)}_hasShadow(){return this.shadowEnabled()&&0!==this.shadowOpacity()&&!!(this.shadowColor()||this.shadowBlur()||this.shadowOffsetX()||this.shadowOffsetY())}_getFillPattern(){return this._getCache(h,this.__getFillPattern)}__getFillPattern(){if(this.fillPatternImage()){const t=m().createPattern(this.fillPatternImage(),this.fillPatternRepeat()||"repeat");if(t&&t.setTransform){const e=new i.Transform;e.translate(this.fillPatternX(),this.fillPatternY()),e.rotate(r.Konva.getAngle(this.fillPatternRotation())),e.scale(this.fillPatternScaleX(),this.fillPatternScaleY()),e.translate(-1*this.fillPatternOffsetX(),-1*this.fillPatternOffsetY());const n=e.getMatrix(),o="undefined"==typeof DOMMatrix?{a:n[0],b:n[1],c:n[2],d:n[3],e:n[4],f:n[5]}:new DOMMatrix(n);t.setTransform(o)}return t}}_getLinearGradient(){return this._getCache(f,this.__getLinearGradient)}__getLinearGradient(){const t=this.fillLinearGradientColorStops();if(t){const e=m(),n=this.fillLinearGradientStartPoint(),r=this.fillLinearGradientEndPoint(),i=e.createLinearGradient(n.x,n.y,r.x,r.y);for(let e=0;e<t.length;e+=2)i.addColorStop(t[e],t[e+1]);return i}}_getRadialGradient(){return this._getCache(p,this.__getRadialGradient)}__getRadialGradient(){const t=this.fillRadialGradientColorStops();if(t){const e=m(),n=this.fillRadialGradientStartPoint(),r=this.fillRadialGradientEndPoint(),i=e.createRadialGradient(n.x,n.y,this.fillRadialGradientStartRadius(),r.x,r.y,this.fillRadialGradientEndRadius());for(let e=0;e<t.length;e+=2)i.addColorStop(t[e],t[e+1]);return i}}getShadowRGBA(){return this._getCache(d,this._getShadowRGBA)}_getShadowRGBA(){if(!this.hasShadow())return;const t=i.Util.colorToRGBA(this.shadowColor());return t?"rgba("+t.r+","+t.g+","+t.b+","+t.a*(this.shadowOpacity()||1)+")":void 0}hasFill(){return this._calculate("hasFill",["fillEnabled","fill","fillPatternImage","fillLinearGradientColorStops","fillRadialGradientColorStops"],(()=>this.fillEnabled()&&!!(this.fill()||this.fillPatternImage()||this.fillLinearGradientColorStops()||this.fillRadialGradientColorStops())))}hasStroke(){return this._calculate("hasStroke",["strokeEnabled","strokeWidth","stroke","strokeLinearGradientColorStops"],(()=>this.strokeEnabled()&&this.strokeWidth()&&!(!this.stroke()&&!this.strokeLinearGradientColorStops())))}hasHitStroke(){const t=this.hitStrokeWidth();return"auto"===t?this.hasStroke():this.strokeEnabled()&&!!t}intersects(t){const e=this.getStage();if(!e)return!1;const n=e.bufferHitCanvas;return n.getContext().clear(),this.drawHit(n,void 0,!0),n.context.getImageData(Math.round(t.x),Math.round(t.y),1,1).data[3]>0}destroy(){return a.Node.prototype.destroy.call(this),delete e.shapes[this.colorKey],delete this.colorKey,this}_useBufferCanvas(t){var e;if(null!==(e=this.attrs.perfectDrawEnabled)&&void 0!==e&&!e)return!1;const n=t||this.hasFill(),r=this.hasStroke(),i=1!==this.getAbsoluteOpacity();if(n&&r&&i)return!0;const o=this.hasShadow(),a=this.shadowForStrokeEnabled();return!!(n&&r&&o&&a)}setStrokeHitEnabled(t){i.Util.warn("strokeHitEnabled property is deprecated. Please use hitStrokeWidth instead."),t?this.hitStrokeWidth("auto"):this.hitStrokeWidth(0)}getStrokeHitEnabled(){return 0!==this.hitStrokeWidth()}getSelfRect(){const t=this.size();return{x:this._centroid?-t.width/2:0,y:this._centroid?-t.height/2:0,width:t.width,height:t.height}}getClientRect(t={}){let e=!1,n=this.getParent();for(;n;){if(n.isCached()){e=!0;break}n=n.getParent()}const r=t.skipTransform,i=t.relativeTo||e&&this.getStage()||void 0,o=this.getSelfRect(),a=!t.skipStroke&&this.hasStroke()&&this.strokeWidth()||0,s=o.width+a,l=o.height+a,c=!t.skipShadow&&this.hasShadow(),u=c?this.shadowOffsetX():0,d=c?this.shadowOffsetY():0,h=s+Math.abs(u),f=l+Math.abs(d),p=c&&this.shadowBlur()||0,g={width:h+2*p,height:f+2*p,x:-(a/2+p)+Math.min(u,0)+o.x,y:-(a/2+p)+Math.min(d,0)+o.y};return r?g:this._transformedRect(g,i)}drawScene(t,e,n){const r=this.getLayer();let i,o,a=t||r.getCanvas(),s=a.getContext(),l=this._getCanvasCache(),c=this.getSceneFunc(),u=this.hasShadow();const d=a.isCache,h=e===this;if(!this.isVisible()&&!h)return this;if(l){s.save();const t=this.getAbsoluteTransform(e).getMatrix();return s.transform(t[0],t[1],t[2],t[3],t[4],t[5]),this._drawCachedSceneCanvas(s),s.restore(),this}if(!c)return this;if(s.save(),this._useBufferCanvas()&&!d){i=this.getStage();const t=n||i.bufferCanvas;o=t.getContext(),o.clear(),o.save(),o._applyLineJoin(this);var f=this.getAbsoluteTransform(e).getMatrix();o.transform(f[0],f[1],f[2],f[3],f[4],f[5]),c.call(this,o,this),o.restore();const r=t.pixelRatio;u&&s._applyShadow(this),s._applyOpacity(this),s._applyGlobalCompositeOperation(this),s.drawImage(t._canvas,0,0,t.width/r,t.height/r)}else s._applyLineJoin(this),h||(f=this.getAbsoluteTransform(e).getMatrix(),s.transform(f[0],f[1],f[2],f[3],f[4],f[5]),s._applyOpacity(this),s._applyGlobalCompositeOperation(this)),u&&s._applyShadow(this),c.call(this,s,this);return s.restore(),this}drawHit(t,e,n=!1){if(!this.shouldDrawHit(e,n))return this;const r=this.getLayer(),o=t||r.hitCanvas,a=o&&o.getContext(),s=this.hitFunc()||this.sceneFunc(),l=this._getCanvasCache(),c=l&&l.hit;if(this.colorKey||i.Util.warn("Looks like your canvas has a destroyed shape in it. Do not reuse shape after you destroyed it. If you want to reuse shape you should call remove() instead of destroy()"),c){a.save();const t=this.getAbsoluteTransform(e).getMatrix();return a.transform(t[0],t[1],t[2],t[3],t[4],t[5]),this._drawCachedHitCanvas(a),a.restore(),this}if(!s)return this;if(a.save(),a._applyLineJoin(this),this!==e){const t=this.getAbsoluteTransform(e).getMatrix();a.transform(t[0],t[1],t[2],t[3],t[4],t[5])}return s.call(this,a,this),a.restore(),this}drawHitFromCache(t=0){const e=this._getCanvasCache(),n=this._getCachedSceneCanvas(),r=e.hit,o=r.getContext(),a=r.getWidth(),s=r.getHeight();o.clear(),o.drawImage(n._canvas,0,0,a,s);try{const e=o.getImageData(0,0,a,s),n=e.data,r=n.length,l=i.Util._hexToRgb(this.colorKey);for(let e=0;e<r;e+=4)n[e+3]>t?(n[e]=l.r,n[e+1]=l.g,n[e+2]=l.b,n[e+3]=255):n[e+3]=0;o.putImageData(e,0,0)}catch(t){i.Util.error("Unable to draw hit graph from cached scene canvas. "+t.message)}return this}hasPointerCapture(t){return c.hasPointerCapture(t,this)}setPointerCapture(t){c.setPointerCapture(t,this)}releaseCapture(t){c.releaseCapture(t,this)}}e.Shape=y,y.prototype._fillFunc=function(t){const e=this.attrs.fillRule;e?t.fill(e):t.fill()},y.prototype._strokeFunc=function(t){t.stroke()},y.prototype._fillFuncHit=function(t){const e=this.attrs.fillRule;e?t.fill(e):t.fill()},y.prototype._strokeFuncHit=function(t){t.stroke()},y.prototype._centroid=!1,y.prototype.nodeType="Shape",(0,l._registerNode)(y),y.prototype.eventListeners={},y.prototype.on.call(y.prototype,"shadowColorChange.konva shadowBlurChange.konva shadowOffsetChange.konva shadowOpacityChange.konva shadowEnabledChange.konva",(function(){this._clearCache(u)})),y.prototype.on.call(y.prototype,"shadowColorChange.konva shadowOpacityChange.konva shadowEnabledChange.konva",(function(){this._clearCache(d)})),y.prototype.on.call(y.prototype,"fillPriorityChange.konva fillPatternImageChange.konva fillPatternRepeatChange.konva fillPatternScaleXChange.konva fillPatternScaleYChange.konva fillPatternOffsetXChange.konva fillPatternOffsetYChange.konva fillPatternXChange.konva fillPatternYChange.konva fillPatternRotationChange.konva",(function(){this._clearCache(h)})),y.prototype.on.call(y.prototype,"fillPriorityChange.konva fillLinearGradientColorStopsChange.konva fillLinearGradientStartPointXChange.konva fillLinearGradientStartPointYChange.konva fillLinearGradientEndPointXChange.konva fillLinearGradientEndPointYChange.konva",(function(){this._clearCache(f)})),y.prototype.on.call(y.prototype,"fillPriorityChange.konva fillRadialGradientColorStopsChange.konva fillRadialGradientStartPointXChange.konva fillRadialGradientStartPointYChange.konva fillRadialGradientEndPointXChange.konva fillRadialGradientEndPointYChange.konva fillRadialGradientStartRadiusChange.konva fillRadialGradientEndRadiusChange.konva",(function(){this._clearCache(p)})),o.Factory.addGetterSetter(y,"stroke",void 0,(0,s.getStringOrGradientValidator)()),o.Factory.addGetterSetter(y,"strokeWidth",2,(0,s.getNumberValidator)()),o.Factory.addGetterSetter(y,"fillAfterStrokeEnabled",!1),o.Factory.addGetterSetter(y,"hitStrokeWidth","auto",(0,s.getNumberOrAutoValidator)()),o.Factory.addGetterSetter(y,"strokeHitEnabled",!0,(0,s.getBooleanValidator)()),o.Factory.addGetterSetter(y,"perfectDrawEnabled",!0,(0,s.getBooleanValidator)()),o.Factory.addGetterSetter(y,"shadowForStrokeEnabled",!0,(0,s.getBooleanValidator)()),o.Factory.addGetterSetter(y,"lineJoin"),o.Factory.addGetterSetter(y,"lineCap"),o.Factory.addGetterSetter(y,"sceneFunc"),o.Factory.addGetterSetter(y,"hitFunc"),o.Factory.addGetterSetter(y,"dash"),o.Factory.addGetterSetter(y,"dashOffset",0,(0,s.getNumberValidator)()),o.Factory.addGetterSetter(y,"shadowColor",void 0,(0,s.getStringValidator)()),o.Factory.addGetterSetter(y,"shadowBlur",0,(0,s.getNumberValidator)()),o.Factory.addGetterSetter(y,"shadowOpacity",1,(0,s.getNumberValidator)()),o.Factory.addComponentsGetterSetter(y,"shadowOffset",["x","y"]),o.Factory.addGetterSetter(y,"shadowOffsetX",0,(0,s.getNumberValidator)()),o.Factory.addGetterSetter(y,"shadowOffsetY",0,(0,s.getNumberValidator)()),o.Factory.addGetterSetter(y,"fillPatternImage"),o.Factory.addGetterSetter(y,"fill",void 0,(0,s.getStringOrGradientValidator)()),o.Factory.addGetterSetter(y,"fillPatternX",0,(0,s.getNumberValidator)()),o.Factory.addGetterSetter(y,"fillPatternY",0,(0,s.getNumberValidator)()),o.Factory.addGetterSetter(y,"fillLinearGradientColorStops"),o.Factory.addGetterSetter(y,"strokeLinearGradientColorStops"),o.Factory.addGetterSetter(y,"fillRadialGradientStartRadius",0),o.Factory.addGetterSetter(y,"fillRadialGradientEndRadius",0),o.Factory.addGetterSetter(y,"fillRadialGradientColorStops"),o.Factory.addGetterSetter(y,"fillPatternRepeat","repeat"),o.Factory.addGetterSetter(y,"fillEnabled",!0),o.Factory.addGetterSetter(y,"strokeEnabled",!0),o.Factory.addGetterSetter(y,"shadowEnabled",!0),o.Factory.addGetterSetter(y,"dashEnabled",!0),o.Factory.addGetterSetter(y,"strokeScaleEnabled",!0),o.Factory.addGetterSetter(y,"fillPriority","color"),o.Factory.addComponentsGetterSetter(y,"fillPatternOffset",["x","y"]),o.Factory.addGetterSetter(y,"fillPatternOffsetX",0,(0,s.getNumberValidator)()),o.Factory.addGetterSetter(y,"fillPatternOffsetY",0,(0,s.getNumberValidator)()),o.Factory.addComponentsGetterSetter(y,"fillPatternScale",["x","y"]),o.Factory.addGetterSetter(y,"fillPatternScaleX",1,(0,s.getNumberValidator)()),o.Factory.addGetterSetter(y,"fillPatternScaleY",1,(0,s.getNumberValidator)()),o.Factory.addComponentsGetterSetter(y,"fillLinearGradientStartPoint",["x","y"]),o.Factory.addComponentsGetterSetter(y,"strokeLinearGradientStartPoint",["x","y"]),o.Factory.addGetterSetter(y,"fillLinearGradientStartPointX",0),o.Factory.addGetterSetter(y,"strokeLinearGradientStartPointX",0),o.Factory.addGetterSetter(y,"fillLinearGradientStartPointY",0),o.Factory.addGetterSetter(y,"strokeLinearGradientStartPointY",0),o.Factory.addComponentsGetterSetter(y,"fillLinearGradientEndPoint",["x","y"]),o.Factory.addComponentsGetterSetter(y,"strokeLinearGradientEndPoint",["x","y"]),o.Factory.addGetterSetter(y,"fillLinearGradientEndPointX",0),o.Factory.addGetterSetter(y,"strokeLinearGradientEndPointX",0),o.Factory.addGetterSetter(y,"fillLinearGradientEndPointY",0),o.Factory.addGetterSetter(y,"strokeLinearGradientEndPointY",0),o.Factory.addComponentsGetterSetter(y,"fillRadialGradientStartPoint",["x","y"]),o.Factory.addGetterSetter(y,"fillRadialGradientStartPointX",0),o.Factory.addGetterSetter(y,"fillRadialGradientStartPointY",0),o.Factory.addComponentsGetterSetter(y,"fillRadialGradientEndPoint",["x","y"]),o.Factory.addGetterSetter(y,"fillRadialGradientEndPointX",0),o.Factory.addGetterSetter(y,"fillRadialGradientEndPointY",0),o.Factory.addGetterSetter(y,"fillPatternRotation",0),o.Factory.addGetterSetter(y,"fillRule",void 0,(0,s.getStringValidator)()),o.Factory.backCompat(y,{dashArray:"dash",getDashArray:"getDash",setDashArray:"getDash",drawFunc:"sceneFunc",getDrawFunc:"getSceneFunc",setDrawFunc:"setSceneFunc",drawHitFunc:"hitFunc",getDrawHitFunc:"getHitFunc",setDrawHitFunc:"setHitFunc"})},3308:(t,e,n)=>{"use strict";t.exports=n(551)},3326:(t,e,n)=>{var r=n(8608),i=n(4781),o=n(8858),a=/^[-+]0x[0-9a-f]+$/i,s=/^0b[01]+$/i,l=/^0o[0-7]+$/i,c=parseInt;t.exports=function(t){if("number"==typeof t)return t;if(o(t))return NaN;if(i(t)){var e="function"==typeof t.valueOf?t.valueOf():t;t=i(e)?e+"":e}if("string"!=typeof t)return 0===t?t:+t;t=r(t);var n=s.test(t);return n||l.test(t)?c(t.slice(2),n?2:8):a.test(t)?NaN:+t}},3384:(t,e,n)=>{var r="object"==typeof n.g&&n.g&&n.g.Object===Object&&n.g;t.exports=r},3468:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Pixelate=void 0;const r=n(3100),i=n(9532),o=n(5304),a=n(4715);e.Pixelate=function(t){let e,n,r,o,a,s,l,c,u,d,h,f,p,g,m=Math.ceil(this.pixelSize()),y=t.width,b=t.height,v=Math.ceil(y/m),_=Math.ceil(b/m),w=t.data;if(m<=0)i.Util.error("pixelSize value can not be <= 0");else for(f=0;f<v;f+=1)for(p=0;p<_;p+=1){for(o=0,a=0,s=0,l=0,c=f*m,u=c+m,d=p*m,h=d+m,g=0,e=c;e<u;e+=1)if(!(e>=y))for(n=d;n<h;n+=1)n>=b||(r=4*(y*n+e),o+=w[r+0],a+=w[r+1],s+=w[r+2],l+=w[r+3],g+=1);for(o/=g,a/=g,s/=g,l/=g,e=c;e<u;e+=1)if(!(e>=y))for(n=d;n<h;n+=1)n>=b||(r=4*(y*n+e),w[r+0]=o,w[r+1]=a,w[r+2]=s,w[r+3]=l)}},r.Factory.addGetterSetter(o.Node,"pixelSize",8,(0,a.getNumberValidator)(),r.Factory.afterSetFilter)},3527:(t,e,n)=>{t.exports=function(t){var e={},r=n(3308),i=n(8494),o=Object.assign;function a(t){for(var e="https://reactjs.org/docs/error-decoder.html?invariant="+t,n=1;n<arguments.length;n++)e+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+t+"; visit "+e+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var s=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,l=Symbol.for("react.element"),c=Symbol.for("react.portal"),u=Symbol.for("react.fragment"),d=Symbol.for("react.strict_mode"),h=Symbol.for("react.profiler"),f=Symbol.for("react.provider"),p=Symbol.for("react.context"),g=Symbol.for("react.forward_ref"),m=Symbol.for("react.suspense"),y=Symbol.for("react.suspense_list"),b=Symbol.for("react.memo"),v=Symbol.for("react.lazy");Symbol.for("react.scope"),Symbol.for("react.debug_trace_mode");var _=Symbol.for("react.offscreen");Symbol.for("react.legacy_hidden"),Symbol.for("react.cache"),Symbol.for("react.tracing_marker");var w=Symbol.iterator;function x(t){return null===t||"object"!=typeof t?null:"function"==typeof(t=w&&t[w]||t["@@iterator"])?t:null}function S(t){if(null==t)return null;if("function"==typeof t)return t.displayName||t.name||null;if("string"==typeof t)return t;switch(t){case u:return"Fragment";case c:return"Portal";case h:return"Profiler";case d:return"StrictMode";case m:return"Suspense";case y:return"SuspenseList"}if("object"==typeof t)switch(t.$$typeof){case p:return(t.displayName||"Context")+".Consumer";case f:return(t._context.displayName||"Context")+".Provider";case g:var e=t.render;return(t=t.displayName)||(t=""!==(t=e.displayName||e.name||"")?"ForwardRef("+t+")":"ForwardRef"),t;case b:return null!==(e=t.displayName||null)?e:S(t.type)||"Memo";case v:e=t._payload,t=t._init;try{return S(t(e))}catch(t){}}return null}function k(t){var e=t.type;switch(t.tag){case 24:return"Cache";case 9:return(e.displayName||"Context")+".Consumer";case 10:return(e._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return t=(t=e.render).displayName||t.name||"",e.displayName||(""!==t?"ForwardRef("+t+")":"ForwardRef");case 7:return"Fragment";case 5:return e;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return S(e);case 8:return e===d?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if("function"==typeof e)return e.displayName||e.name||null;if("string"==typeof e)return e}return null}function C(t){var e=t,n=t;if(t.alternate)for(;e.return;)e=e.return;else{t=e;do{!!(4098&(e=t).flags)&&(n=e.return),t=e.return}while(t)}return 3===e.tag?n:null}function T(t){if(C(t)!==t)throw Error(a(188))}function E(t){var e=t.alternate;if(!e){if(null===(e=C(t)))throw Error(a(188));return e!==t?null:t}for(var n=t,r=e;;){var i=n.return;if(null===i)break;var o=i.alternate;if(null===o){if(null!==(r=i.return)){n=r;continue}break}if(i.child===o.child){for(o=i.child;o;){if(o===n)return T(i),t;if(o===r)return T(i),e;o=o.sibling}throw Error(a(188))}if(n.return!==r.return)n=i,r=o;else{for(var s=!1,l=i.child;l;){if(l===n){s=!0,n=i,r=o;break}if(l===r){s=!0,r=i,n=o;break}l=l.sibling}if(!s){for(l=o.child;l;){if(l===n){s=!0,n=o,r=i;break}if(l===r){s=!0,r=o,n=i;break}l=l.sibling}if(!s)throw Error(a(189))}}if(n.alternate!==r)throw Error(a(190))}if(3!==n.tag)throw Error(a(188));return n.stateNode.current===n?t:e}function P(t){return null!==(t=E(t))?I(t):null}function I(t){if(5===t.tag||6===t.tag)return t;for(t=t.child;null!==t;){var e=I(t);if(null!==e)return e;t=t.sibling}return null}function A(t){if(5===t.tag||6===t.tag)return t;for(t=t.child;null!==t;){if(4!==t.tag){var e=A(t);if(null!==e)return e}t=t.sibling}return null}var M,D=Array.isArray,F=t.getPublicInstance,R=t.getRootHostContext,B=t.getChildHostContext,L=t.prepareForCommit,N=t.resetAfterCommit,O=t.createInstance,z=t.appendInitialChild,U=t.finalizeInitialChildren,j=t.prepareUpdate,V=t.shouldSetTextContent,$=t.createTextInstance,W=t.scheduleTimeout,G=t.cancelTimeout,H=t.noTimeout,Y=t.isPrimaryRenderer,q=t.supportsMutation,K=t.supportsPersistence,X=t.supportsHydration,Q=t.getInstanceFromNode,Z=t.preparePortalMount,J=t.getCurrentEventPriority,tt=t.detachDeletedInstance,et=t.supportsMicrotasks,nt=t.scheduleMicrotask,rt=t.supportsTestSelectors,it=t.findFiberRoot,ot=t.getBoundingRect,at=t.getTextContent,st=t.isHiddenSubtree,lt=t.matchAccessibilityRole,ct=t.setFocusIfFocusable,ut=t.setupIntersectionObserver,dt=t.appendChild,ht=t.appendChildToContainer,ft=t.commitTextUpdate,pt=t.commitMount,gt=t.commitUpdate,mt=t.insertBefore,yt=t.insertInContainerBefore,bt=t.removeChild,vt=t.removeChildFromContainer,_t=t.resetTextContent,wt=t.hideInstance,xt=t.hideTextInstance,St=t.unhideInstance,kt=t.unhideTextInstance,Ct=t.clearContainer,Tt=t.cloneInstance,Et=t.createContainerChildSet,Pt=t.appendChildToContainerChildSet,It=t.finalizeContainerChildren,At=t.replaceContainerChildren,Mt=t.cloneHiddenInstance,Dt=t.cloneHiddenTextInstance,Ft=t.canHydrateInstance,Rt=t.canHydrateTextInstance,Bt=t.canHydrateSuspenseInstance,Lt=t.isSuspenseInstancePending,Nt=t.isSuspenseInstanceFallback,Ot=t.getSuspenseInstanceFallbackErrorDetails,zt=t.registerSuspenseInstanceRetry,Ut=t.getNextHydratableSibling,jt=t.getFirstHydratableChild,Vt=t.getFirstHydratableChildWithinContainer,$t=t.getFirstHydratableChildWithinSuspenseInstance,Wt=t.hydrateInstance,Gt=t.hydrateTextInstance,Ht=t.hydrateSuspenseInstance,Yt=t.getNextHydratableInstanceAfterSuspenseInstance,qt=t.commitHydratedContainer,Kt=t.commitHydratedSuspenseInstance,Xt=t.clearSuspenseBoundary,Qt=t.clearSuspenseBoundaryFromContainer,Zt=t.shouldDeleteUnhydratedTailInstances,Jt=t.didNotMatchHydratedContainerTextInstance,te=t.didNotMatchHydratedTextInstance;function ee(t){if(void 0===M)try{throw Error()}catch(t){var e=t.stack.trim().match(/\n( *(at )?)/);M=e&&e[1]||""}return"\n"+M+t}var ne=!1;function re(t,e){if(!t||ne)return"";ne=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(e)if(e=function(){throw Error()},Object.defineProperty(e.prototype,"props",{set:function(){throw Error()}}),"object"==typeof Reflect&&Reflect.construct){try{Reflect.construct(e,[])}catch(t){var r=t}Reflect.construct(t,[],e)}else{try{e.call()}catch(t){r=t}t.call(e.prototype)}else{try{throw Error()}catch(t){r=t}t()}}catch(e){if(e&&r&&"string"==typeof e.stack){for(var i=e.stack.split("\n"),o=r.stack.split("\n"),a=i.length-1,s=o.length-1;1<=a&&0<=s&&i[a]!==o[s];)s--;for(;1<=a&&0<=s;a--,s--)if(i[a]!==o[s]){if(1!==a||1!==s)do{if(a--,0>--s||i[a]!==o[s]){var l="\n"+i[a].replace(" at new "," at ");return t.displayName&&l.includes("<anonymous>")&&(l=l.replace("<anonymous>",t.displayName)),l}}while(1<=a&&0<=s);break}}}finally{ne=!1,Error.prepareStackTrace=n}return(t=t?t.displayName||t.name:"")?ee(t):""}var ie=Object.prototype.hasOwnProperty,oe=[],ae=-1;function se(t){return{current:t}}function le(t){0>ae||(t.current=oe[ae],oe[ae]=null,ae--)}function ce(t,e){ae++,oe[ae]=t.current,t.current=e}var ue={},de=se(ue),he=se(!1),fe=ue;function pe(t,e){var n=t.type.contextTypes;if(!n)return ue;var r=t.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===e)return r.__reactInternalMemoizedMaskedChildContext;var i,o={};for(i in n)o[i]=e[i];return r&&((t=t.stateNode).__reactInternalMemoizedUnmaskedChildContext=e,t.__reactInternalMemoizedMaskedChildContext=o),o}function ge(t){return null!=t.childContextTypes}function me(){le(he),le(de)}function ye(t,e,n){if(de.current!==ue)throw Error(a(168));ce(de,e),ce(he,n)}function be(t,e,n){var r=t.stateNode;if(e=e.childContextTypes,"function"!=typeof r.getChildContext)return n;for(var i in r=r.getChildContext())if(!(i in e))throw Error(a(108,k(t)||"Unknown",i));return o({},n,r)}function ve(t){return t=(t=t.stateNode)&&t.__reactInternalMemoizedMergedChildContext||ue,fe=de.current,ce(de,t),ce(he,he.current),!0}function _e(t,e,n){var r=t.stateNode;if(!r)throw Error(a(169));n?(t=be(t,e,fe),r.__reactInternalMemoizedMergedChildContext=t,le(he),le(de),ce(de,t)):le(he),ce(he,n)}var we=Math.clz32?Math.clz32:function(t){return 0==(t>>>=0)?32:31-(xe(t)/Se|0)|0},xe=Math.log,Se=Math.LN2,ke=64,Ce=4194304;function Te(t){switch(t&-t){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return 4194240&t;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return 130023424&t;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return t}}function Ee(t,e){var n=t.pendingLanes;if(0===n)return 0;var r=0,i=t.suspendedLanes,o=t.pingedLanes,a=268435455&n;if(0!==a){var s=a&~i;0!==s?r=Te(s):0!=(o&=a)&&(r=Te(o))}else 0!=(a=n&~i)?r=Te(a):0!==o&&(r=Te(o));if(0===r)return 0;if(0!==e&&e!==r&&!(e&i)&&((i=r&-r)>=(o=e&-e)||16===i&&4194240&o))return e;if(4&r&&(r|=16&n),0!==(e=t.entangledLanes))for(t=t.entanglements,e&=r;0<e;)i=1<<(n=31-we(e)),r|=t[n],e&=~i;return r}function Pe(t,e){switch(t){case 1:case 2:case 4:return e+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e+5e3;default:return-1}}function Ie(t){return 0!=(t=-1073741825&t.pendingLanes)?t:1073741824&t?1073741824:0}function Ae(){var t=ke;return!(4194240&(ke<<=1))&&(ke=64),t}function Me(t){for(var e=[],n=0;31>n;n++)e.push(t);return e}function De(t,e,n){t.pendingLanes|=e,536870912!==e&&(t.suspendedLanes=0,t.pingedLanes=0),(t=t.eventTimes)[e=31-we(e)]=n}function Fe(t,e){var n=t.entangledLanes|=e;for(t=t.entanglements;n;){var r=31-we(n),i=1<<r;i&e|t[r]&e&&(t[r]|=e),n&=~i}}var Re=0;function Be(t){return 1<(t&=-t)?4<t?268435455&t?16:536870912:4:1}var Le=i.unstable_scheduleCallback,Ne=i.unstable_cancelCallback,Oe=i.unstable_shouldYield,ze=i.unstable_requestPaint,Ue=i.unstable_now,je=i.unstable_ImmediatePriority,Ve=i.unstable_UserBlockingPriority,$e=i.unstable_NormalPriority,We=i.unstable_IdlePriority,Ge=null,He=null,Ye="function"==typeof Object.is?Object.is:function(t,e){return t===e&&(0!==t||1/t==1/e)||t!=t&&e!=e},qe=null,Ke=!1,Xe=!1;function Qe(t){null===qe?qe=[t]:qe.push(t)}function Ze(){if(!Xe&&null!==qe){Xe=!0;var t=0,e=Re;try{var n=qe;for(Re=1;t<n.length;t++){var r=n[t];do{r=r(!0)}while(null!==r)}qe=null,Ke=!1}catch(e){throw null!==qe&&(qe=qe.slice(t+1)),Le(je,Ze),e}finally{Re=e,Xe=!1}}return null}var Je=[],tn=0,en=null,nn=0,rn=[],on=0,an=null,sn=1,ln="";function cn(t,e){Je[tn++]=nn,Je[tn++]=en,en=t,nn=e}function un(t,e,n){rn[on++]=sn,rn[on++]=ln,rn[on++]=an,an=t;var r=sn;t=ln;var i=32-we(r)-1;r&=~(1<<i),n+=1;var o=32-we(e)+i;if(30<o){var a=i-i%5;o=(r&(1<<a)-1).toString(32),r>>=a,i-=a,sn=1<<32-we(e)+i|n<<i|r,ln=o+t}else sn=1<<o|n<<i|r,ln=t}function dn(t){null!==t.return&&(cn(t,1),un(t,1,0))}function hn(t){for(;t===en;)en=Je[--tn],Je[tn]=null,nn=Je[--tn],Je[tn]=null;for(;t===an;)an=rn[--on],rn[on]=null,ln=rn[--on],rn[on]=null,sn=rn[--on],rn[on]=null}var fn=null,pn=null,gn=!1,mn=!1,yn=null;function bn(t,e){var n=as(5,null,null,0);n.elementType="DELETED",n.stateNode=e,n.return=t,null===(e=t.deletions)?(t.deletions=[n],t.flags|=16):e.push(n)}function vn(t,e){switch(t.tag){case 5:return null!==(e=Ft(e,t.type,t.pendingProps))&&(t.stateNode=e,fn=t,pn=jt(e),!0);case 6:return null!==(e=Rt(e,t.pendingProps))&&(t.stateNode=e,fn=t,pn=null,!0);case 13:if(null!==(e=Bt(e))){var n=null!==an?{id:sn,overflow:ln}:null;return t.memoizedState={dehydrated:e,treeContext:n,retryLane:1073741824},(n=as(18,null,null,0)).stateNode=e,n.return=t,t.child=n,fn=t,pn=null,!0}return!1;default:return!1}}function _n(t){return!(!(1&t.mode)||128&t.flags)}function wn(t){if(gn){var e=pn;if(e){var n=e;if(!vn(t,e)){if(_n(t))throw Error(a(418));e=Ut(n);var r=fn;e&&vn(t,e)?bn(r,n):(t.flags=-4097&t.flags|2,gn=!1,fn=t)}}else{if(_n(t))throw Error(a(418));t.flags=-4097&t.flags|2,gn=!1,fn=t}}}function xn(t){for(t=t.return;null!==t&&5!==t.tag&&3!==t.tag&&13!==t.tag;)t=t.return;fn=t}function Sn(t){if(!X||t!==fn)return!1;if(!gn)return xn(t),gn=!0,!1;if(3!==t.tag&&(5!==t.tag||Zt(t.type)&&!V(t.type,t.memoizedProps))){var e=pn;if(e){if(_n(t))throw kn(),Error(a(418));for(;e;)bn(t,e),e=Ut(e)}}if(xn(t),13===t.tag){if(!X)throw Error(a(316));if(!(t=null!==(t=t.memoizedState)?t.dehydrated:null))throw Error(a(317));pn=Yt(t)}else pn=fn?Ut(t.stateNode):null;return!0}function kn(){for(var t=pn;t;)t=Ut(t)}function Cn(){X&&(pn=fn=null,mn=gn=!1)}function Tn(t){null===yn?yn=[t]:yn.push(t)}var En=s.ReactCurrentBatchConfig;function Pn(t,e){if(Ye(t,e))return!0;if("object"!=typeof t||null===t||"object"!=typeof e||null===e)return!1;var n=Object.keys(t),r=Object.keys(e);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var i=n[r];if(!ie.call(e,i)||!Ye(t[i],e[i]))return!1}return!0}function In(t){switch(t.tag){case 5:return ee(t.type);case 16:return ee("Lazy");case 13:return ee("Suspense");case 19:return ee("SuspenseList");case 0:case 2:case 15:return re(t.type,!1);case 11:return re(t.type.render,!1);case 1:return re(t.type,!0);default:return""}}function An(t,e,n){if(null!==(t=n.ref)&&"function"!=typeof t&&"object"!=typeof t){if(n._owner){if(n=n._owner){if(1!==n.tag)throw Error(a(309));var r=n.stateNode}if(!r)throw Error(a(147,t));var i=r,o=""+t;return null!==e&&null!==e.ref&&"function"==typeof e.ref&&e.ref._stringRef===o?e.ref:(e=function(t){var e=i.refs;null===t?delete e[o]:e[o]=t},e._stringRef=o,e)}if("string"!=typeof t)throw Error(a(284));if(!n._owner)throw Error(a(290,t))}return t}function Mn(t,e){throw t=Object.prototype.toString.call(e),Error(a(31,"[object Object]"===t?"object with keys {"+Object.keys(e).join(", ")+"}":t))}function Dn(t){return(0,t._init)(t._payload)}function Fn(t){function e(e,n){if(t){var r=e.deletions;null===r?(e.deletions=[n],e.flags|=16):r.push(n)}}function n(n,r){if(!t)return null;for(;null!==r;)e(n,r),r=r.sibling;return null}function r(t,e){for(t=new Map;null!==e;)null!==e.key?t.set(e.key,e):t.set(e.index,e),e=e.sibling;return t}function i(t,e){return(t=ls(t,e)).index=0,t.sibling=null,t}function o(e,n,r){return e.index=r,t?null!==(r=e.alternate)?(r=r.index)<n?(e.flags|=2,n):r:(e.flags|=2,n):(e.flags|=1048576,n)}function s(e){return t&&null===e.alternate&&(e.flags|=2),e}function d(t,e,n,r){return null===e||6!==e.tag?((e=hs(n,t.mode,r)).return=t,e):((e=i(e,n)).return=t,e)}function h(t,e,n,r){var o=n.type;return o===u?p(t,e,n.props.children,r,n.key):null!==e&&(e.elementType===o||"object"==typeof o&&null!==o&&o.$$typeof===v&&Dn(o)===e.type)?((r=i(e,n.props)).ref=An(t,e,n),r.return=t,r):((r=cs(n.type,n.key,n.props,null,t.mode,r)).ref=An(t,e,n),r.return=t,r)}function f(t,e,n,r){return null===e||4!==e.tag||e.stateNode.containerInfo!==n.containerInfo||e.stateNode.implementation!==n.implementation?((e=fs(n,t.mode,r)).return=t,e):((e=i(e,n.children||[])).return=t,e)}function p(t,e,n,r,o){return null===e||7!==e.tag?((e=us(n,t.mode,r,o)).return=t,e):((e=i(e,n)).return=t,e)}function g(t,e,n){if("string"==typeof e&&""!==e||"number"==typeof e)return(e=hs(""+e,t.mode,n)).return=t,e;if("object"==typeof e&&null!==e){switch(e.$$typeof){case l:return(n=cs(e.type,e.key,e.props,null,t.mode,n)).ref=An(t,null,e),n.return=t,n;case c:return(e=fs(e,t.mode,n)).return=t,e;case v:return g(t,(0,e._init)(e._payload),n)}if(D(e)||x(e))return(e=us(e,t.mode,n,null)).return=t,e;Mn(t,e)}return null}function m(t,e,n,r){var i=null!==e?e.key:null;if("string"==typeof n&&""!==n||"number"==typeof n)return null!==i?null:d(t,e,""+n,r);if("object"==typeof n&&null!==n){switch(n.$$typeof){case l:return n.key===i?h(t,e,n,r):null;case c:return n.key===i?f(t,e,n,r):null;case v:return m(t,e,(i=n._init)(n._payload),r)}if(D(n)||x(n))return null!==i?null:p(t,e,n,r,null);Mn(t,n)}return null}function y(t,e,n,r,i){if("string"==typeof r&&""!==r||"number"==typeof r)return d(e,t=t.get(n)||null,""+r,i);if("object"==typeof r&&null!==r){switch(r.$$typeof){case l:return h(e,t=t.get(null===r.key?n:r.key)||null,r,i);case c:return f(e,t=t.get(null===r.key?n:r.key)||null,r,i);case v:return y(t,e,n,(0,r._init)(r._payload),i)}if(D(r)||x(r))return p(e,t=t.get(n)||null,r,i,null);Mn(e,r)}return null}function b(i,a,s,l){for(var c=null,u=null,d=a,h=a=0,f=null;null!==d&&h<s.length;h++){d.index>h?(f=d,d=null):f=d.sibling;var p=m(i,d,s[h],l);if(null===p){null===d&&(d=f);break}t&&d&&null===p.alternate&&e(i,d),a=o(p,a,h),null===u?c=p:u.sibling=p,u=p,d=f}if(h===s.length)return n(i,d),gn&&cn(i,h),c;if(null===d){for(;h<s.length;h++)null!==(d=g(i,s[h],l))&&(a=o(d,a,h),null===u?c=d:u.sibling=d,u=d);return gn&&cn(i,h),c}for(d=r(i,d);h<s.length;h++)null!==(f=y(d,i,h,s[h],l))&&(t&&null!==f.alternate&&d.delete(null===f.key?h:f.key),a=o(f,a,h),null===u?c=f:u.sibling=f,u=f);return t&&d.forEach((function(t){return e(i,t)})),gn&&cn(i,h),c}function _(i,s,l,c){var u=x(l);if("function"!=typeof u)throw Error(a(150));if(null==(l=u.call(l)))throw Error(a(151));for(var d=u=null,h=s,f=s=0,p=null,b=l.next();null!==h&&!b.done;f++,b=l.next()){h.index>f?(p=h,h=null):p=h.sibling;var v=m(i,h,b.value,c);if(null===v){null===h&&(h=p);break}t&&h&&null===v.alternate&&e(i,h),s=o(v,s,f),null===d?u=v:d.sibling=v,d=v,h=p}if(b.done)return n(i,h),gn&&cn(i,f),u;if(null===h){for(;!b.done;f++,b=l.next())null!==(b=g(i,b.value,c))&&(s=o(b,s,f),null===d?u=b:d.sibling=b,d=b);return gn&&cn(i,f),u}for(h=r(i,h);!b.done;f++,b=l.next())null!==(b=y(h,i,f,b.value,c))&&(t&&null!==b.alternate&&h.delete(null===b.key?f:b.key),s=o(b,s,f),null===d?u=b:d.sibling=b,d=b);return t&&h.forEach((function(t){return e(i,t)})),gn&&cn(i,f),u}return function t(r,o,a,d){if("object"==typeof a&&null!==a&&a.type===u&&null===a.key&&(a=a.props.children),"object"==typeof a&&null!==a){switch(a.$$typeof){case l:t:{for(var h=a.key,f=o;null!==f;){if(f.key===h){if((h=a.type)===u){if(7===f.tag){n(r,f.sibling),(o=i(f,a.props.children)).return=r,r=o;break t}}else if(f.elementType===h||"object"==typeof h&&null!==h&&h.$$typeof===v&&Dn(h)===f.type){n(r,f.sibling),(o=i(f,a.props)).ref=An(r,f,a),o.return=r,r=o;break t}n(r,f);break}e(r,f),f=f.sibling}a.type===u?((o=us(a.props.children,r.mode,d,a.key)).return=r,r=o):((d=cs(a.type,a.key,a.props,null,r.mode,d)).ref=An(r,o,a),d.return=r,r=d)}return s(r);case c:t:{for(f=a.key;null!==o;){if(o.key===f){if(4===o.tag&&o.stateNode.containerInfo===a.containerInfo&&o.stateNode.implementation===a.implementation){n(r,o.sibling),(o=i(o,a.children||[])).return=r,r=o;break t}n(r,o);break}e(r,o),o=o.sibling}(o=fs(a,r.mode,d)).return=r,r=o}return s(r);case v:return t(r,o,(f=a._init)(a._payload),d)}if(D(a))return b(r,o,a,d);if(x(a))return _(r,o,a,d);Mn(r,a)}return"string"==typeof a&&""!==a||"number"==typeof a?(a=""+a,null!==o&&6===o.tag?(n(r,o.sibling),(o=i(o,a)).return=r,r=o):(n(r,o),(o=hs(a,r.mode,d)).return=r,r=o),s(r)):n(r,o)}}var Rn=Fn(!0),Bn=Fn(!1),Ln=se(null),Nn=null,On=null,zn=null;function Un(){zn=On=Nn=null}function jn(t,e,n){Y?(ce(Ln,e._currentValue),e._currentValue=n):(ce(Ln,e._currentValue2),e._currentValue2=n)}function Vn(t){var e=Ln.current;le(Ln),Y?t._currentValue=e:t._currentValue2=e}function $n(t,e,n){for(;null!==t;){var r=t.alternate;if((t.childLanes&e)!==e?(t.childLanes|=e,null!==r&&(r.childLanes|=e)):null!==r&&(r.childLanes&e)!==e&&(r.childLanes|=e),t===n)break;t=t.return}}function Wn(t,e){Nn=t,zn=On=null,null!==(t=t.dependencies)&&null!==t.firstContext&&(!!(t.lanes&e)&&(Fi=!0),t.firstContext=null)}function Gn(t){var e=Y?t._currentValue:t._currentValue2;if(zn!==t)if(t={context:t,memoizedValue:e,next:null},null===On){if(null===Nn)throw Error(a(308));On=t,Nn.dependencies={lanes:0,firstContext:t}}else On=On.next=t;return e}var Hn=null;function Yn(t){null===Hn?Hn=[t]:Hn.push(t)}function qn(t,e,n,r){var i=e.interleaved;return null===i?(n.next=n,Yn(e)):(n.next=i.next,i.next=n),e.interleaved=n,Kn(t,r)}function Kn(t,e){t.lanes|=e;var n=t.alternate;for(null!==n&&(n.lanes|=e),n=t,t=t.return;null!==t;)t.childLanes|=e,null!==(n=t.alternate)&&(n.childLanes|=e),n=t,t=t.return;return 3===n.tag?n.stateNode:null}var Xn=!1;function Qn(t){t.updateQueue={baseState:t.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function Zn(t,e){t=t.updateQueue,e.updateQueue===t&&(e.updateQueue={baseState:t.baseState,firstBaseUpdate:t.firstBaseUpdate,lastBaseUpdate:t.lastBaseUpdate,shared:t.shared,effects:t.effects})}function Jn(t,e){return{eventTime:t,lane:e,tag:0,payload:null,callback:null,next:null}}function tr(t,e,n){var r=t.updateQueue;if(null===r)return null;if(r=r.shared,2&na){var i=r.pending;return null===i?e.next=e:(e.next=i.next,i.next=e),r.pending=e,Kn(t,n)}return null===(i=r.interleaved)?(e.next=e,Yn(r)):(e.next=i.next,i.next=e),r.interleaved=e,Kn(t,n)}function er(t,e,n){if(null!==(e=e.updateQueue)&&(e=e.shared,4194240&n)){var r=e.lanes;n|=r&=t.pendingLanes,e.lanes=n,Fe(t,n)}}function nr(t,e){var n=t.updateQueue,r=t.alternate;if(null!==r&&n===(r=r.updateQueue)){var i=null,o=null;if(null!==(n=n.firstBaseUpdate)){do{var a={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};null===o?i=o=a:o=o.next=a,n=n.next}while(null!==n);null===o?i=o=e:o=o.next=e}else i=o=e;return n={baseState:r.baseState,firstBaseUpdate:i,lastBaseUpdate:o,shared:r.shared,effects:r.effects},void(t.updateQueue=n)}null===(t=n.lastBaseUpdate)?n.firstBaseUpdate=e:t.next=e,n.lastBaseUpdate=e}function rr(t,e,n,r){var i=t.updateQueue;Xn=!1;var a=i.firstBaseUpdate,s=i.lastBaseUpdate,l=i.shared.pending;if(null!==l){i.shared.pending=null;var c=l,u=c.next;c.next=null,null===s?a=u:s.next=u,s=c;var d=t.alternate;null!==d&&(l=(d=d.updateQueue).lastBaseUpdate)!==s&&(null===l?d.firstBaseUpdate=u:l.next=u,d.lastBaseUpdate=c)}if(null!==a){var h=i.baseState;for(s=0,d=u=c=null,l=a;;){var f=l.lane,p=l.eventTime;if((r&f)===f){null!==d&&(d=d.next={eventTime:p,lane:0,tag:l.tag,payload:l.payload,callback:l.callback,next:null});t:{var g=t,m=l;switch(f=e,p=n,m.tag){case 1:if("function"==typeof(g=m.payload)){h=g.call(p,h,f);break t}h=g;break t;case 3:g.flags=-65537&g.flags|128;case 0:if(null==(f="function"==typeof(g=m.payload)?g.call(p,h,f):g))break t;h=o({},h,f);break t;case 2:Xn=!0}}null!==l.callback&&0!==l.lane&&(t.flags|=64,null===(f=i.effects)?i.effects=[l]:f.push(l))}else p={eventTime:p,lane:f,tag:l.tag,payload:l.payload,callback:l.callback,next:null},null===d?(u=d=p,c=h):d=d.next=p,s|=f;if(null===(l=l.next)){if(null===(l=i.shared.pending))break;l=(f=l).next,f.next=null,i.lastBaseUpdate=f,i.shared.pending=null}}if(null===d&&(c=h),i.baseState=c,i.firstBaseUpdate=u,i.lastBaseUpdate=d,null!==(e=i.shared.interleaved)){i=e;do{s|=i.lane,i=i.next}while(i!==e)}else null===a&&(i.shared.lanes=0);ua|=s,t.lanes=s,t.memoizedState=h}}function ir(t,e,n){if(t=e.effects,e.effects=null,null!==t)for(e=0;e<t.length;e++){var r=t[e],i=r.callback;if(null!==i){if(r.callback=null,r=n,"function"!=typeof i)throw Error(a(191,i));i.call(r)}}}var or={},ar=se(or),sr=se(or),lr=se(or);function cr(t){if(t===or)throw Error(a(174));return t}function ur(t,e){ce(lr,e),ce(sr,t),ce(ar,or),t=R(e),le(ar),ce(ar,t)}function dr(){le(ar),le(sr),le(lr)}function hr(t){var e=cr(lr.current),n=cr(ar.current);n!==(e=B(n,t.type,e))&&(ce(sr,t),ce(ar,e))}function fr(t){sr.current===t&&(le(ar),le(sr))}var pr=se(0);function gr(t){for(var e=t;null!==e;){if(13===e.tag){var n=e.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||Lt(n)||Nt(n)))return e}else if(19===e.tag&&void 0!==e.memoizedProps.revealOrder){if(128&e.flags)return e}else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break;for(;null===e.sibling;){if(null===e.return||e.return===t)return null;e=e.return}e.sibling.return=e.return,e=e.sibling}return null}var mr=[];function yr(){for(var t=0;t<mr.length;t++){var e=mr[t];Y?e._workInProgressVersionPrimary=null:e._workInProgressVersionSecondary=null}mr.length=0}var br=s.ReactCurrentDispatcher,vr=s.ReactCurrentBatchConfig,_r=0,wr=null,xr=null,Sr=null,kr=!1,Cr=!1,Tr=0,Er=0;function Pr(){throw Error(a(321))}function Ir(t,e){if(null===e)return!1;for(var n=0;n<e.length&&n<t.length;n++)if(!Ye(t[n],e[n]))return!1;return!0}function Ar(t,e,n,r,i,o){if(_r=o,wr=e,e.memoizedState=null,e.updateQueue=null,e.lanes=0,br.current=null===t||null===t.memoizedState?fi:pi,t=n(r,i),Cr){o=0;do{if(Cr=!1,Tr=0,25<=o)throw Error(a(301));o+=1,Sr=xr=null,e.updateQueue=null,br.current=gi,t=n(r,i)}while(Cr)}if(br.current=hi,e=null!==xr&&null!==xr.next,_r=0,Sr=xr=wr=null,kr=!1,e)throw Error(a(300));return t}function Mr(){var t=0!==Tr;return Tr=0,t}function Dr(){var t={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===Sr?wr.memoizedState=Sr=t:Sr=Sr.next=t,Sr}function Fr(){if(null===xr){var t=wr.alternate;t=null!==t?t.memoizedState:null}else t=xr.next;var e=null===Sr?wr.memoizedState:Sr.next;if(null!==e)Sr=e,xr=t;else{if(null===t)throw Error(a(310));t={memoizedState:(xr=t).memoizedState,baseState:xr.baseState,baseQueue:xr.baseQueue,queue:xr.queue,next:null},null===Sr?wr.memoizedState=Sr=t:Sr=Sr.next=t}return Sr}function Rr(t,e){return"function"==typeof e?e(t):e}function Br(t){var e=Fr(),n=e.queue;if(null===n)throw Error(a(311));n.lastRenderedReducer=t;var r=xr,i=r.baseQueue,o=n.pending;if(null!==o){if(null!==i){var s=i.next;i.next=o.next,o.next=s}r.baseQueue=i=o,n.pending=null}if(null!==i){o=i.next,r=r.baseState;var l=s=null,c=null,u=o;do{var d=u.lane;if((_r&d)===d)null!==c&&(c=c.next={lane:0,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null}),r=u.hasEagerState?u.eagerState:t(r,u.action);else{var h={lane:d,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null};null===c?(l=c=h,s=r):c=c.next=h,wr.lanes|=d,ua|=d}u=u.next}while(null!==u&&u!==o);null===c?s=r:c.next=l,Ye(r,e.memoizedState)||(Fi=!0),e.memoizedState=r,e.baseState=s,e.baseQueue=c,n.lastRenderedState=r}if(null!==(t=n.interleaved)){i=t;do{o=i.lane,wr.lanes|=o,ua|=o,i=i.next}while(i!==t)}else null===i&&(n.lanes=0);return[e.memoizedState,n.dispatch]}function Lr(t){var e=Fr(),n=e.queue;if(null===n)throw Error(a(311));n.lastRenderedReducer=t;var r=n.dispatch,i=n.pending,o=e.memoizedState;if(null!==i){n.pending=null;var s=i=i.next;do{o=t(o,s.action),s=s.next}while(s!==i);Ye(o,e.memoizedState)||(Fi=!0),e.memoizedState=o,null===e.baseQueue&&(e.baseState=o),n.lastRenderedState=o}return[o,r]}function Nr(){}function Or(t,e){var n=wr,r=Fr(),i=e(),o=!Ye(r.memoizedState,i);if(o&&(r.memoizedState=i,Fi=!0),r=r.queue,Xr(jr.bind(null,n,r,t),[t]),r.getSnapshot!==e||o||null!==Sr&&1&Sr.memoizedState.tag){if(n.flags|=2048,Gr(9,Ur.bind(null,n,r,i,e),void 0,null),null===ra)throw Error(a(349));30&_r||zr(n,e,i)}return i}function zr(t,e,n){t.flags|=16384,t={getSnapshot:e,value:n},null===(e=wr.updateQueue)?(e={lastEffect:null,stores:null},wr.updateQueue=e,e.stores=[t]):null===(n=e.stores)?e.stores=[t]:n.push(t)}function Ur(t,e,n,r){e.value=n,e.getSnapshot=r,Vr(e)&&$r(t)}function jr(t,e,n){return n((function(){Vr(e)&&$r(t)}))}function Vr(t){var e=t.getSnapshot;t=t.value;try{var n=e();return!Ye(t,n)}catch(t){return!0}}function $r(t){var e=Kn(t,1);null!==e&&Da(e,t,1,-1)}function Wr(t){var e=Dr();return"function"==typeof t&&(t=t()),e.memoizedState=e.baseState=t,t={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:Rr,lastRenderedState:t},e.queue=t,t=t.dispatch=li.bind(null,wr,t),[e.memoizedState,t]}function Gr(t,e,n,r){return t={tag:t,create:e,destroy:n,deps:r,next:null},null===(e=wr.updateQueue)?(e={lastEffect:null,stores:null},wr.updateQueue=e,e.lastEffect=t.next=t):null===(n=e.lastEffect)?e.lastEffect=t.next=t:(r=n.next,n.next=t,t.next=r,e.lastEffect=t),t}function Hr(){return Fr().memoizedState}function Yr(t,e,n,r){var i=Dr();wr.flags|=t,i.memoizedState=Gr(1|e,n,void 0,void 0===r?null:r)}function qr(t,e,n,r){var i=Fr();r=void 0===r?null:r;var o=void 0;if(null!==xr){var a=xr.memoizedState;if(o=a.destroy,null!==r&&Ir(r,a.deps))return void(i.memoizedState=Gr(e,n,o,r))}wr.flags|=t,i.memoizedState=Gr(1|e,n,o,r)}function Kr(t,e){return Yr(8390656,8,t,e)}function Xr(t,e){return qr(2048,8,t,e)}function Qr(t,e){return qr(4,2,t,e)}function Zr(t,e){return qr(4,4,t,e)}function Jr(t,e){return"function"==typeof e?(t=t(),e(t),function(){e(null)}):null!=e?(t=t(),e.current=t,function(){e.current=null}):void 0}function ti(t,e,n){return n=null!=n?n.concat([t]):null,qr(4,4,Jr.bind(null,e,t),n)}function ei(){}function ni(t,e){var n=Fr();e=void 0===e?null:e;var r=n.memoizedState;return null!==r&&null!==e&&Ir(e,r[1])?r[0]:(n.memoizedState=[t,e],t)}function ri(t,e){var n=Fr();e=void 0===e?null:e;var r=n.memoizedState;return null!==r&&null!==e&&Ir(e,r[1])?r[0]:(t=t(),n.memoizedState=[t,e],t)}function ii(t,e,n){return 21&_r?(Ye(n,e)||(n=Ae(),wr.lanes|=n,ua|=n,t.baseState=!0),e):(t.baseState&&(t.baseState=!1,Fi=!0),t.memoizedState=n)}function oi(t,e){var n=Re;Re=0!==n&&4>n?n:4,t(!0);var r=vr.transition;vr.transition={};try{t(!1),e()}finally{Re=n,vr.transition=r}}function ai(){return Fr().memoizedState}function si(t,e,n){var r=Ma(t);n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},ci(t)?ui(e,n):null!==(n=qn(t,e,n,r))&&(Da(n,t,r,Aa()),di(n,e,r))}function li(t,e,n){var r=Ma(t),i={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(ci(t))ui(e,i);else{var o=t.alternate;if(0===t.lanes&&(null===o||0===o.lanes)&&null!==(o=e.lastRenderedReducer))try{var a=e.lastRenderedState,s=o(a,n);if(i.hasEagerState=!0,i.eagerState=s,Ye(s,a)){var l=e.interleaved;return null===l?(i.next=i,Yn(e)):(i.next=l.next,l.next=i),void(e.interleaved=i)}}catch(t){}null!==(n=qn(t,e,i,r))&&(Da(n,t,r,i=Aa()),di(n,e,r))}}function ci(t){var e=t.alternate;return t===wr||null!==e&&e===wr}function ui(t,e){Cr=kr=!0;var n=t.pending;null===n?e.next=e:(e.next=n.next,n.next=e),t.pending=e}function di(t,e,n){if(4194240&n){var r=e.lanes;n|=r&=t.pendingLanes,e.lanes=n,Fe(t,n)}}var hi={readContext:Gn,useCallback:Pr,useContext:Pr,useEffect:Pr,useImperativeHandle:Pr,useInsertionEffect:Pr,useLayoutEffect:Pr,useMemo:Pr,useReducer:Pr,useRef:Pr,useState:Pr,useDebugValue:Pr,useDeferredValue:Pr,useTransition:Pr,useMutableSource:Pr,useSyncExternalStore:Pr,useId:Pr,unstable_isNewReconciler:!1},fi={readContext:Gn,useCallback:function(t,e){return Dr().memoizedState=[t,void 0===e?null:e],t},useContext:Gn,useEffect:Kr,useImperativeHandle:function(t,e,n){return n=null!=n?n.concat([t]):null,Yr(4194308,4,Jr.bind(null,e,t),n)},useLayoutEffect:function(t,e){return Yr(4194308,4,t,e)},useInsertionEffect:function(t,e){return Yr(4,2,t,e)},useMemo:function(t,e){var n=Dr();return e=void 0===e?null:e,t=t(),n.memoizedState=[t,e],t},useReducer:function(t,e,n){var r=Dr();return e=void 0!==n?n(e):e,r.memoizedState=r.baseState=e,t={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:t,lastRenderedState:e},r.queue=t,t=t.dispatch=si.bind(null,wr,t),[r.memoizedState,t]},useRef:function(t){return t={current:t},Dr().memoizedState=t},useState:Wr,useDebugValue:ei,useDeferredValue:function(t){return Dr().memoizedState=t},useTransition:function(){var t=Wr(!1),e=t[0];return t=oi.bind(null,t[1]),Dr().memoizedState=t,[e,t]},useMutableSource:function(){},useSyncExternalStore:function(t,e,n){var r=wr,i=Dr();if(gn){if(void 0===n)throw Error(a(407));n=n()}else{if(n=e(),null===ra)throw Error(a(349));30&_r||zr(r,e,n)}i.memoizedState=n;var o={value:n,getSnapshot:e};return i.queue=o,Kr(jr.bind(null,r,o,t),[t]),r.flags|=2048,Gr(9,Ur.bind(null,r,o,n,e),void 0,null),n},useId:function(){var t=Dr(),e=ra.identifierPrefix;if(gn){var n=ln;e=":"+e+"R"+(n=(sn&~(1<<32-we(sn)-1)).toString(32)+n),0<(n=Tr++)&&(e+="H"+n.toString(32)),e+=":"}else e=":"+e+"r"+(n=Er++).toString(32)+":";return t.memoizedState=e},unstable_isNewReconciler:!1},pi={readContext:Gn,useCallback:ni,useContext:Gn,useEffect:Xr,useImperativeHandle:ti,useInsertionEffect:Qr,useLayoutEffect:Zr,useMemo:ri,useReducer:Br,useRef:Hr,useState:function(){return Br(Rr)},useDebugValue:ei,useDeferredValue:function(t){return ii(Fr(),xr.memoizedState,t)},useTransition:function(){return[Br(Rr)[0],Fr().memoizedState]},useMutableSource:Nr,useSyncExternalStore:Or,useId:ai,unstable_isNewReconciler:!1},gi={readContext:Gn,useCallback:ni,useContext:Gn,useEffect:Xr,useImperativeHandle:ti,useInsertionEffect:Qr,useLayoutEffect:Zr,useMemo:ri,useReducer:Lr,useRef:Hr,useState:function(){return Lr(Rr)},useDebugValue:ei,useDeferredValue:function(t){var e=Fr();return null===xr?e.memoizedState=t:ii(e,xr.memoizedState,t)},useTransition:function(){return[Lr(Rr)[0],Fr().memoizedState]},useMutableSource:Nr,useSyncExternalStore:Or,useId:ai,unstable_isNewReconciler:!1};function mi(t,e){if(t&&t.defaultProps){for(var n in e=o({},e),t=t.defaultProps)void 0===e[n]&&(e[n]=t[n]);return e}return e}function yi(t,e,n,r){n=null==(n=n(r,e=t.memoizedState))?e:o({},e,n),t.memoizedState=n,0===t.lanes&&(t.updateQueue.baseState=n)}var bi={isMounted:function(t){return!!(t=t._reactInternals)&&C(t)===t},enqueueSetState:function(t,e,n){t=t._reactInternals;var r=Aa(),i=Ma(t),o=Jn(r,i);o.payload=e,null!=n&&(o.callback=n),null!==(e=tr(t,o,i))&&(Da(e,t,i,r),er(e,t,i))},enqueueReplaceState:function(t,e,n){t=t._reactInternals;var r=Aa(),i=Ma(t),o=Jn(r,i);o.tag=1,o.payload=e,null!=n&&(o.callback=n),null!==(e=tr(t,o,i))&&(Da(e,t,i,r),er(e,t,i))},enqueueForceUpdate:function(t,e){t=t._reactInternals;var n=Aa(),r=Ma(t),i=Jn(n,r);i.tag=2,null!=e&&(i.callback=e),null!==(e=tr(t,i,r))&&(Da(e,t,r,n),er(e,t,r))}};function vi(t,e,n,r,i,o,a){return"function"==typeof(t=t.stateNode).shouldComponentUpdate?t.shouldComponentUpdate(r,o,a):!(e.prototype&&e.prototype.isPureReactComponent&&Pn(n,r)&&Pn(i,o))}function _i(t,e,n){var r=!1,i=ue,o=e.contextType;return"object"==typeof o&&null!==o?o=Gn(o):(i=ge(e)?fe:de.current,o=(r=null!=(r=e.contextTypes))?pe(t,i):ue),e=new e(n,o),t.memoizedState=null!==e.state&&void 0!==e.state?e.state:null,e.updater=bi,t.stateNode=e,e._reactInternals=t,r&&((t=t.stateNode).__reactInternalMemoizedUnmaskedChildContext=i,t.__reactInternalMemoizedMaskedChildContext=o),e}function wi(t,e,n,r){t=e.state,"function"==typeof e.componentWillReceiveProps&&e.componentWillReceiveProps(n,r),"function"==typeof e.UNSAFE_componentWillReceiveProps&&e.UNSAFE_componentWillReceiveProps(n,r),e.state!==t&&bi.enqueueReplaceState(e,e.state,null)}function xi(t,e,n,r){var i=t.stateNode;i.props=n,i.state=t.memoizedState,i.refs={},Qn(t);var o=e.contextType;"object"==typeof o&&null!==o?i.context=Gn(o):(o=ge(e)?fe:de.current,i.context=pe(t,o)),i.state=t.memoizedState,"function"==typeof(o=e.getDerivedStateFromProps)&&(yi(t,e,o,n),i.state=t.memoizedState),"function"==typeof e.getDerivedStateFromProps||"function"==typeof i.getSnapshotBeforeUpdate||"function"!=typeof i.UNSAFE_componentWillMount&&"function"!=typeof i.componentWillMount||(e=i.state,"function"==typeof i.componentWillMount&&i.componentWillMount(),"function"==typeof i.UNSAFE_componentWillMount&&i.UNSAFE_componentWillMount(),e!==i.state&&bi.enqueueReplaceState(i,i.state,null),rr(t,n,i,r),i.state=t.memoizedState),"function"==typeof i.componentDidMount&&(t.flags|=4194308)}function Si(t,e){try{var n="",r=e;do{n+=In(r),r=r.return}while(r);var i=n}catch(t){i="\nError generating stack: "+t.message+"\n"+t.stack}return{value:t,source:e,stack:i,digest:null}}function ki(t,e,n){return{value:t,source:null,stack:null!=n?n:null,digest:null!=e?e:null}}function Ci(t,e){try{console.error(e.value)}catch(t){setTimeout((function(){throw t}))}}var Ti="function"==typeof WeakMap?WeakMap:Map;function Ei(t,e,n){(n=Jn(-1,n)).tag=3,n.payload={element:null};var r=e.value;return n.callback=function(){_a||(_a=!0,wa=r),Ci(0,e)},n}function Pi(t,e,n){(n=Jn(-1,n)).tag=3;var r=t.type.getDerivedStateFromError;if("function"==typeof r){var i=e.value;n.payload=function(){return r(i)},n.callback=function(){Ci(0,e)}}var o=t.stateNode;return null!==o&&"function"==typeof o.componentDidCatch&&(n.callback=function(){Ci(0,e),"function"!=typeof r&&(null===xa?xa=new Set([this]):xa.add(this));var t=e.stack;this.componentDidCatch(e.value,{componentStack:null!==t?t:""})}),n}function Ii(t,e,n){var r=t.pingCache;if(null===r){r=t.pingCache=new Ti;var i=new Set;r.set(e,i)}else void 0===(i=r.get(e))&&(i=new Set,r.set(e,i));i.has(n)||(i.add(n),t=ts.bind(null,t,e,n),e.then(t,t))}function Ai(t){do{var e;if((e=13===t.tag)&&(e=null===(e=t.memoizedState)||null!==e.dehydrated),e)return t;t=t.return}while(null!==t);return null}function Mi(t,e,n,r,i){return 1&t.mode?(t.flags|=65536,t.lanes=i,t):(t===e?t.flags|=65536:(t.flags|=128,n.flags|=131072,n.flags&=-52805,1===n.tag&&(null===n.alternate?n.tag=17:((e=Jn(-1,1)).tag=2,tr(n,e,1))),n.lanes|=1),t)}var Di=s.ReactCurrentOwner,Fi=!1;function Ri(t,e,n,r){e.child=null===t?Bn(e,null,n,r):Rn(e,t.child,n,r)}function Bi(t,e,n,r,i){n=n.render;var o=e.ref;return Wn(e,i),r=Ar(t,e,n,r,o,i),n=Mr(),null===t||Fi?(gn&&n&&dn(e),e.flags|=1,Ri(t,e,r,i),e.child):(e.updateQueue=t.updateQueue,e.flags&=-2053,t.lanes&=~i,io(t,e,i))}function Li(t,e,n,r,i){if(null===t){var o=n.type;return"function"!=typeof o||ss(o)||void 0!==o.defaultProps||null!==n.compare||void 0!==n.defaultProps?((t=cs(n.type,null,r,e,e.mode,i)).ref=e.ref,t.return=e,e.child=t):(e.tag=15,e.type=o,Ni(t,e,o,r,i))}if(o=t.child,!(t.lanes&i)){var a=o.memoizedProps;if((n=null!==(n=n.compare)?n:Pn)(a,r)&&t.ref===e.ref)return io(t,e,i)}return e.flags|=1,(t=ls(o,r)).ref=e.ref,t.return=e,e.child=t}function Ni(t,e,n,r,i){if(null!==t){var o=t.memoizedProps;if(Pn(o,r)&&t.ref===e.ref){if(Fi=!1,e.pendingProps=r=o,!(t.lanes&i))return e.lanes=t.lanes,io(t,e,i);131072&t.flags&&(Fi=!0)}}return Ui(t,e,n,r,i)}function Oi(t,e,n){var r=e.pendingProps,i=r.children,o=null!==t?t.memoizedState:null;if("hidden"===r.mode)if(1&e.mode){if(!(1073741824&n))return t=null!==o?o.baseLanes|n:n,e.lanes=e.childLanes=1073741824,e.memoizedState={baseLanes:t,cachePool:null,transitions:null},e.updateQueue=null,ce(sa,aa),aa|=t,null;e.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=null!==o?o.baseLanes:n,ce(sa,aa),aa|=r}else e.memoizedState={baseLanes:0,cachePool:null,transitions:null},ce(sa,aa),aa|=n;else null!==o?(r=o.baseLanes|n,e.memoizedState=null):r=n,ce(sa,aa),aa|=r;return Ri(t,e,i,n),e.child}function zi(t,e){var n=e.ref;(null===t&&null!==n||null!==t&&t.ref!==n)&&(e.flags|=512,e.flags|=2097152)}function Ui(t,e,n,r,i){var o=ge(n)?fe:de.current;return o=pe(e,o),Wn(e,i),n=Ar(t,e,n,r,o,i),r=Mr(),null===t||Fi?(gn&&r&&dn(e),e.flags|=1,Ri(t,e,n,i),e.child):(e.updateQueue=t.updateQueue,e.flags&=-2053,t.lanes&=~i,io(t,e,i))}function ji(t,e,n,r,i){if(ge(n)){var o=!0;ve(e)}else o=!1;if(Wn(e,i),null===e.stateNode)ro(t,e),_i(e,n,r),xi(e,n,r,i),r=!0;else if(null===t){var a=e.stateNode,s=e.memoizedProps;a.props=s;var l=a.context,c=n.contextType;c="object"==typeof c&&null!==c?Gn(c):pe(e,c=ge(n)?fe:de.current);var u=n.getDerivedStateFromProps,d="function"==typeof u||"function"==typeof a.getSnapshotBeforeUpdate;d||"function"!=typeof a.UNSAFE_componentWillReceiveProps&&"function"!=typeof a.componentWillReceiveProps||(s!==r||l!==c)&&wi(e,a,r,c),Xn=!1;var h=e.memoizedState;a.state=h,rr(e,r,a,i),l=e.memoizedState,s!==r||h!==l||he.current||Xn?("function"==typeof u&&(yi(e,n,u,r),l=e.memoizedState),(s=Xn||vi(e,n,s,r,h,l,c))?(d||"function"!=typeof a.UNSAFE_componentWillMount&&"function"!=typeof a.componentWillMount||("function"==typeof a.componentWillMount&&a.componentWillMount(),"function"==typeof a.UNSAFE_componentWillMount&&a.UNSAFE_componentWillMount()),"function"==typeof a.componentDidMount&&(e.flags|=4194308)):("function"==typeof a.componentDidMount&&(e.flags|=4194308),e.memoizedProps=r,e.memoizedState=l),a.props=r,a.state=l,a.context=c,r=s):("function"==typeof a.componentDidMount&&(e.flags|=4194308),r=!1)}else{a=e.stateNode,Zn(t,e),s=e.memoizedProps,c=e.type===e.elementType?s:mi(e.type,s),a.props=c,d=e.pendingProps,h=a.context,l="object"==typeof(l=n.contextType)&&null!==l?Gn(l):pe(e,l=ge(n)?fe:de.current);var f=n.getDerivedStateFromProps;(u="function"==typeof f||"function"==typeof a.getSnapshotBeforeUpdate)||"function"!=typeof a.UNSAFE_componentWillReceiveProps&&"function"!=typeof a.componentWillReceiveProps||(s!==d||h!==l)&&wi(e,a,r,l),Xn=!1,h=e.memoizedState,a.state=h,rr(e,r,a,i);var p=e.memoizedState;s!==d||h!==p||he.current||Xn?("function"==typeof f&&(yi(e,n,f,r),p=e.memoizedState),(c=Xn||vi(e,n,c,r,h,p,l)||!1)?(u||"function"!=typeof a.UNSAFE_componentWillUpdate&&"function"!=typeof a.componentWillUpdate||("function"==typeof a.componentWillUpdate&&a.componentWillUpdate(r,p,l),"function"==typeof a.UNSAFE_componentWillUpdate&&a.UNSAFE_componentWillUpdate(r,p,l)),"function"==typeof a.componentDidUpdate&&(e.flags|=4),"function"==typeof a.getSnapshotBeforeUpdate&&(e.flags|=1024)):("function"!=typeof a.componentDidUpdate||s===t.memoizedProps&&h===t.memoizedState||(e.flags|=4),"function"!=typeof a.getSnapshotBeforeUpdate||s===t.memoizedProps&&h===t.memoizedState||(e.flags|=1024),e.memoizedProps=r,e.memoizedState=p),a.props=r,a.state=p,a.context=l,r=c):("function"!=typeof a.componentDidUpdate||s===t.memoizedProps&&h===t.memoizedState||(e.flags|=4),"function"!=typeof a.getSnapshotBeforeUpdate||s===t.memoizedProps&&h===t.memoizedState||(e.flags|=1024),r=!1)}return Vi(t,e,n,r,o,i)}function Vi(t,e,n,r,i,o){zi(t,e);var a=!!(128&e.flags);if(!r&&!a)return i&&_e(e,n,!1),io(t,e,o);r=e.stateNode,Di.current=e;var s=a&&"function"!=typeof n.getDerivedStateFromError?null:r.render();return e.flags|=1,null!==t&&a?(e.child=Rn(e,t.child,null,o),e.child=Rn(e,null,s,o)):Ri(t,e,s,o),e.memoizedState=r.state,i&&_e(e,n,!0),e.child}function $i(t){var e=t.stateNode;e.pendingContext?ye(0,e.pendingContext,e.pendingContext!==e.context):e.context&&ye(0,e.context,!1),ur(t,e.containerInfo)}function Wi(t,e,n,r,i){return Cn(),Tn(i),e.flags|=256,Ri(t,e,n,r),e.child}var Gi,Hi,Yi,qi,Ki={dehydrated:null,treeContext:null,retryLane:0};function Xi(t){return{baseLanes:t,cachePool:null,transitions:null}}function Qi(t,e,n){var r,i=e.pendingProps,o=pr.current,s=!1,l=!!(128&e.flags);if((r=l)||(r=(null===t||null!==t.memoizedState)&&!!(2&o)),r?(s=!0,e.flags&=-129):null!==t&&null===t.memoizedState||(o|=1),ce(pr,1&o),null===t)return wn(e),null!==(t=e.memoizedState)&&null!==(t=t.dehydrated)?(1&e.mode?Nt(t)?e.lanes=8:e.lanes=1073741824:e.lanes=1,null):(l=i.children,t=i.fallback,s?(i=e.mode,s=e.child,l={mode:"hidden",children:l},1&i||null===s?s=ds(l,i,0,null):(s.childLanes=0,s.pendingProps=l),t=us(t,i,n,null),s.return=e,t.return=e,s.sibling=t,e.child=s,e.child.memoizedState=Xi(n),e.memoizedState=Ki,t):Zi(e,l));if(null!==(o=t.memoizedState)&&null!==(r=o.dehydrated))return function(t,e,n,r,i,o,s){if(n)return 256&e.flags?(e.flags&=-257,Ji(t,e,s,r=ki(Error(a(422))))):null!==e.memoizedState?(e.child=t.child,e.flags|=128,null):(o=r.fallback,i=e.mode,r=ds({mode:"visible",children:r.children},i,0,null),(o=us(o,i,s,null)).flags|=2,r.return=e,o.return=e,r.sibling=o,e.child=r,1&e.mode&&Rn(e,t.child,null,s),e.child.memoizedState=Xi(s),e.memoizedState=Ki,o);if(!(1&e.mode))return Ji(t,e,s,null);if(Nt(i))return r=Ot(i).digest,Ji(t,e,s,r=ki(o=Error(a(419)),r,void 0));if(n=!!(s&t.childLanes),Fi||n){if(null!==(r=ra)){switch(s&-s){case 4:i=2;break;case 16:i=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:i=32;break;case 536870912:i=268435456;break;default:i=0}0!==(i=i&(r.suspendedLanes|s)?0:i)&&i!==o.retryLane&&(o.retryLane=i,Kn(t,i),Da(r,t,i,-1))}return Wa(),Ji(t,e,s,r=ki(Error(a(421))))}return Lt(i)?(e.flags|=128,e.child=t.child,e=ns.bind(null,t),zt(i,e),null):(t=o.treeContext,X&&(pn=$t(i),fn=e,gn=!0,yn=null,mn=!1,null!==t&&(rn[on++]=sn,rn[on++]=ln,rn[on++]=an,sn=t.id,ln=t.overflow,an=e)),(e=Zi(e,r.children)).flags|=4096,e)}(t,e,l,i,r,o,n);if(s){s=i.fallback,l=e.mode,r=(o=t.child).sibling;var c={mode:"hidden",children:i.children};return 1&l||e.child===o?(i=ls(o,c)).subtreeFlags=14680064&o.subtreeFlags:((i=e.child).childLanes=0,i.pendingProps=c,e.deletions=null),null!==r?s=ls(r,s):(s=us(s,l,n,null)).flags|=2,s.return=e,i.return=e,i.sibling=s,e.child=i,i=s,s=e.child,l=null===(l=t.child.memoizedState)?Xi(n):{baseLanes:l.baseLanes|n,cachePool:null,transitions:l.transitions},s.memoizedState=l,s.childLanes=t.childLanes&~n,e.memoizedState=Ki,i}return t=(s=t.child).sibling,i=ls(s,{mode:"visible",children:i.children}),!(1&e.mode)&&(i.lanes=n),i.return=e,i.sibling=null,null!==t&&(null===(n=e.deletions)?(e.deletions=[t],e.flags|=16):n.push(t)),e.child=i,e.memoizedState=null,i}function Zi(t,e){return(e=ds({mode:"visible",children:e},t.mode,0,null)).return=t,t.child=e}function Ji(t,e,n,r){return null!==r&&Tn(r),Rn(e,t.child,null,n),(t=Zi(e,e.pendingProps.children)).flags|=2,e.memoizedState=null,t}function to(t,e,n){t.lanes|=e;var r=t.alternate;null!==r&&(r.lanes|=e),$n(t.return,e,n)}function eo(t,e,n,r,i){var o=t.memoizedState;null===o?t.memoizedState={isBackwards:e,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:i}:(o.isBackwards=e,o.rendering=null,o.renderingStartTime=0,o.last=r,o.tail=n,o.tailMode=i)}function no(t,e,n){var r=e.pendingProps,i=r.revealOrder,o=r.tail;if(Ri(t,e,r.children,n),2&(r=pr.current))r=1&r|2,e.flags|=128;else{if(null!==t&&128&t.flags)t:for(t=e.child;null!==t;){if(13===t.tag)null!==t.memoizedState&&to(t,n,e);else if(19===t.tag)to(t,n,e);else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break t;for(;null===t.sibling;){if(null===t.return||t.return===e)break t;t=t.return}t.sibling.return=t.return,t=t.sibling}r&=1}if(ce(pr,r),1&e.mode)switch(i){case"forwards":for(n=e.child,i=null;null!==n;)null!==(t=n.alternate)&&null===gr(t)&&(i=n),n=n.sibling;null===(n=i)?(i=e.child,e.child=null):(i=n.sibling,n.sibling=null),eo(e,!1,i,n,o);break;case"backwards":for(n=null,i=e.child,e.child=null;null!==i;){if(null!==(t=i.alternate)&&null===gr(t)){e.child=i;break}t=i.sibling,i.sibling=n,n=i,i=t}eo(e,!0,n,null,o);break;case"together":eo(e,!1,null,null,void 0);break;default:e.memoizedState=null}else e.memoizedState=null;return e.child}function ro(t,e){!(1&e.mode)&&null!==t&&(t.alternate=null,e.alternate=null,e.flags|=2)}function io(t,e,n){if(null!==t&&(e.dependencies=t.dependencies),ua|=e.lanes,!(n&e.childLanes))return null;if(null!==t&&e.child!==t.child)throw Error(a(153));if(null!==e.child){for(n=ls(t=e.child,t.pendingProps),e.child=n,n.return=e;null!==t.sibling;)t=t.sibling,(n=n.sibling=ls(t,t.pendingProps)).return=e;n.sibling=null}return e.child}function oo(t){t.flags|=4}function ao(t,e){if(null!==t&&t.child===e.child)return!0;if(16&e.flags)return!1;for(t=e.child;null!==t;){if(12854&t.flags||12854&t.subtreeFlags)return!1;t=t.sibling}return!0}if(q)Gi=function(t,e){for(var n=e.child;null!==n;){if(5===n.tag||6===n.tag)z(t,n.stateNode);else if(4!==n.tag&&null!==n.child){n.child.return=n,n=n.child;continue}if(n===e)break;for(;null===n.sibling;){if(null===n.return||n.return===e)return;n=n.return}n.sibling.return=n.return,n=n.sibling}},Hi=function(){},Yi=function(t,e,n,r,i){if((t=t.memoizedProps)!==r){var o=e.stateNode,a=cr(ar.current);n=j(o,n,t,r,i,a),(e.updateQueue=n)&&oo(e)}},qi=function(t,e,n,r){n!==r&&oo(e)};else if(K){Gi=function(t,e,n,r){for(var i=e.child;null!==i;){if(5===i.tag){var o=i.stateNode;n&&r&&(o=Mt(o,i.type,i.memoizedProps,i)),z(t,o)}else if(6===i.tag)o=i.stateNode,n&&r&&(o=Dt(o,i.memoizedProps,i)),z(t,o);else if(4!==i.tag)if(22===i.tag&&null!==i.memoizedState)null!==(o=i.child)&&(o.return=i),Gi(t,i,!0,!0);else if(null!==i.child){i.child.return=i,i=i.child;continue}if(i===e)break;for(;null===i.sibling;){if(null===i.return||i.return===e)return;i=i.return}i.sibling.return=i.return,i=i.sibling}};var so=function(t,e,n,r){for(var i=e.child;null!==i;){if(5===i.tag){var o=i.stateNode;n&&r&&(o=Mt(o,i.type,i.memoizedProps,i)),Pt(t,o)}else if(6===i.tag)o=i.stateNode,n&&r&&(o=Dt(o,i.memoizedProps,i)),Pt(t,o);else if(4!==i.tag)if(22===i.tag&&null!==i.memoizedState)null!==(o=i.child)&&(o.return=i),so(t,i,!0,!0);else if(null!==i.child){i.child.return=i,i=i.child;continue}if(i===e)break;for(;null===i.sibling;){if(null===i.return||i.return===e)return;i=i.return}i.sibling.return=i.return,i=i.sibling}};Hi=function(t,e){var n=e.stateNode;if(!ao(t,e)){t=n.containerInfo;var r=Et(t);so(r,e,!1,!1),n.pendingChildren=r,oo(e),It(t,r)}},Yi=function(t,e,n,r,i){var o=t.stateNode,a=t.memoizedProps;if((t=ao(t,e))&&a===r)e.stateNode=o;else{var s=e.stateNode,l=cr(ar.current),c=null;a!==r&&(c=j(s,n,a,r,i,l)),t&&null===c?e.stateNode=o:(o=Tt(o,c,n,a,r,e,t,s),U(o,n,r,i,l)&&oo(e),e.stateNode=o,t?oo(e):Gi(o,e,!1,!1))}},qi=function(t,e,n,r){n!==r?(t=cr(lr.current),n=cr(ar.current),e.stateNode=$(r,t,n,e),oo(e)):e.stateNode=t.stateNode}}else Hi=function(){},Yi=function(){},qi=function(){};function lo(t,e){if(!gn)switch(t.tailMode){case"hidden":e=t.tail;for(var n=null;null!==e;)null!==e.alternate&&(n=e),e=e.sibling;null===n?t.tail=null:n.sibling=null;break;case"collapsed":n=t.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?e||null===t.tail?t.tail=null:t.tail.sibling=null:r.sibling=null}}function co(t){var e=null!==t.alternate&&t.alternate.child===t.child,n=0,r=0;if(e)for(var i=t.child;null!==i;)n|=i.lanes|i.childLanes,r|=14680064&i.subtreeFlags,r|=14680064&i.flags,i.return=t,i=i.sibling;else for(i=t.child;null!==i;)n|=i.lanes|i.childLanes,r|=i.subtreeFlags,r|=i.flags,i.return=t,i=i.sibling;return t.subtreeFlags|=r,t.childLanes=n,e}function uo(t,e,n){var r=e.pendingProps;switch(hn(e),e.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return co(e),null;case 1:case 17:return ge(e.type)&&me(),co(e),null;case 3:return n=e.stateNode,dr(),le(he),le(de),yr(),n.pendingContext&&(n.context=n.pendingContext,n.pendingContext=null),null!==t&&null!==t.child||(Sn(e)?oo(e):null===t||t.memoizedState.isDehydrated&&!(256&e.flags)||(e.flags|=1024,null!==yn&&(La(yn),yn=null))),Hi(t,e),co(e),null;case 5:fr(e),n=cr(lr.current);var i=e.type;if(null!==t&&null!=e.stateNode)Yi(t,e,i,r,n),t.ref!==e.ref&&(e.flags|=512,e.flags|=2097152);else{if(!r){if(null===e.stateNode)throw Error(a(166));return co(e),null}if(t=cr(ar.current),Sn(e)){if(!X)throw Error(a(175));t=Wt(e.stateNode,e.type,e.memoizedProps,n,t,e,!mn),e.updateQueue=t,null!==t&&oo(e)}else{var o=O(i,r,n,t,e);Gi(o,e,!1,!1),e.stateNode=o,U(o,i,r,n,t)&&oo(e)}null!==e.ref&&(e.flags|=512,e.flags|=2097152)}return co(e),null;case 6:if(t&&null!=e.stateNode)qi(t,e,t.memoizedProps,r);else{if("string"!=typeof r&&null===e.stateNode)throw Error(a(166));if(t=cr(lr.current),n=cr(ar.current),Sn(e)){if(!X)throw Error(a(176));if(t=e.stateNode,n=e.memoizedProps,(r=Gt(t,n,e,!mn))&&null!==(i=fn))switch(i.tag){case 3:Jt(i.stateNode.containerInfo,t,n,!!(1&i.mode));break;case 5:te(i.type,i.memoizedProps,i.stateNode,t,n,!!(1&i.mode))}r&&oo(e)}else e.stateNode=$(r,t,n,e)}return co(e),null;case 13:if(le(pr),r=e.memoizedState,null===t||null!==t.memoizedState&&null!==t.memoizedState.dehydrated){if(gn&&null!==pn&&1&e.mode&&!(128&e.flags))kn(),Cn(),e.flags|=98560,i=!1;else if(i=Sn(e),null!==r&&null!==r.dehydrated){if(null===t){if(!i)throw Error(a(318));if(!X)throw Error(a(344));if(!(i=null!==(i=e.memoizedState)?i.dehydrated:null))throw Error(a(317));Ht(i,e)}else Cn(),!(128&e.flags)&&(e.memoizedState=null),e.flags|=4;co(e),i=!1}else null!==yn&&(La(yn),yn=null),i=!0;if(!i)return 65536&e.flags?e:null}return 128&e.flags?(e.lanes=n,e):((n=null!==r)!=(null!==t&&null!==t.memoizedState)&&n&&(e.child.flags|=8192,1&e.mode&&(null===t||1&pr.current?0===la&&(la=3):Wa())),null!==e.updateQueue&&(e.flags|=4),co(e),null);case 4:return dr(),Hi(t,e),null===t&&Z(e.stateNode.containerInfo),co(e),null;case 10:return Vn(e.type._context),co(e),null;case 19:if(le(pr),null===(i=e.memoizedState))return co(e),null;if(r=!!(128&e.flags),null===(o=i.rendering))if(r)lo(i,!1);else{if(0!==la||null!==t&&128&t.flags)for(t=e.child;null!==t;){if(null!==(o=gr(t))){for(e.flags|=128,lo(i,!1),null!==(t=o.updateQueue)&&(e.updateQueue=t,e.flags|=4),e.subtreeFlags=0,t=n,n=e.child;null!==n;)i=t,(r=n).flags&=14680066,null===(o=r.alternate)?(r.childLanes=0,r.lanes=i,r.child=null,r.subtreeFlags=0,r.memoizedProps=null,r.memoizedState=null,r.updateQueue=null,r.dependencies=null,r.stateNode=null):(r.childLanes=o.childLanes,r.lanes=o.lanes,r.child=o.child,r.subtreeFlags=0,r.deletions=null,r.memoizedProps=o.memoizedProps,r.memoizedState=o.memoizedState,r.updateQueue=o.updateQueue,r.type=o.type,i=o.dependencies,r.dependencies=null===i?null:{lanes:i.lanes,firstContext:i.firstContext}),n=n.sibling;return ce(pr,1&pr.current|2),e.child}t=t.sibling}null!==i.tail&&Ue()>ma&&(e.flags|=128,r=!0,lo(i,!1),e.lanes=4194304)}else{if(!r)if(null!==(t=gr(o))){if(e.flags|=128,r=!0,null!==(t=t.updateQueue)&&(e.updateQueue=t,e.flags|=4),lo(i,!0),null===i.tail&&"hidden"===i.tailMode&&!o.alternate&&!gn)return co(e),null}else 2*Ue()-i.renderingStartTime>ma&&1073741824!==n&&(e.flags|=128,r=!0,lo(i,!1),e.lanes=4194304);i.isBackwards?(o.sibling=e.child,e.child=o):(null!==(t=i.last)?t.sibling=o:e.child=o,i.last=o)}return null!==i.tail?(e=i.tail,i.rendering=e,i.tail=e.sibling,i.renderingStartTime=Ue(),e.sibling=null,t=pr.current,ce(pr,r?1&t|2:1&t),e):(co(e),null);case 22:case 23:return Ua(),n=null!==e.memoizedState,null!==t&&null!==t.memoizedState!==n&&(e.flags|=8192),n&&1&e.mode?!!(1073741824&aa)&&(co(e),q&&6&e.subtreeFlags&&(e.flags|=8192)):co(e),null;case 24:case 25:return null}throw Error(a(156,e.tag))}function ho(t,e){switch(hn(e),e.tag){case 1:return ge(e.type)&&me(),65536&(t=e.flags)?(e.flags=-65537&t|128,e):null;case 3:return dr(),le(he),le(de),yr(),65536&(t=e.flags)&&!(128&t)?(e.flags=-65537&t|128,e):null;case 5:return fr(e),null;case 13:if(le(pr),null!==(t=e.memoizedState)&&null!==t.dehydrated){if(null===e.alternate)throw Error(a(340));Cn()}return 65536&(t=e.flags)?(e.flags=-65537&t|128,e):null;case 19:return le(pr),null;case 4:return dr(),null;case 10:return Vn(e.type._context),null;case 22:case 23:return Ua(),null;default:return null}}var fo=!1,po=!1,go="function"==typeof WeakSet?WeakSet:Set,mo=null;function yo(t,e){var n=t.ref;if(null!==n)if("function"==typeof n)try{n(null)}catch(n){Ja(t,e,n)}else n.current=null}function bo(t,e,n){try{n()}catch(n){Ja(t,e,n)}}var vo=!1;function _o(t,e,n){var r=e.updateQueue;if(null!==(r=null!==r?r.lastEffect:null)){var i=r=r.next;do{if((i.tag&t)===t){var o=i.destroy;i.destroy=void 0,void 0!==o&&bo(e,n,o)}i=i.next}while(i!==r)}}function wo(t,e){if(null!==(e=null!==(e=e.updateQueue)?e.lastEffect:null)){var n=e=e.next;do{if((n.tag&t)===t){var r=n.create;n.destroy=r()}n=n.next}while(n!==e)}}function xo(t){var e=t.ref;if(null!==e){var n=t.stateNode;t=5===t.tag?F(n):n,"function"==typeof e?e(t):e.current=t}}function So(t){var e=t.alternate;null!==e&&(t.alternate=null,So(e)),t.child=null,t.deletions=null,t.sibling=null,5===t.tag&&null!==(e=t.stateNode)&&tt(e),t.stateNode=null,t.return=null,t.dependencies=null,t.memoizedProps=null,t.memoizedState=null,t.pendingProps=null,t.stateNode=null,t.updateQueue=null}function ko(t){return 5===t.tag||3===t.tag||4===t.tag}function Co(t){t:for(;;){for(;null===t.sibling;){if(null===t.return||ko(t.return))return null;t=t.return}for(t.sibling.return=t.return,t=t.sibling;5!==t.tag&&6!==t.tag&&18!==t.tag;){if(2&t.flags)continue t;if(null===t.child||4===t.tag)continue t;t.child.return=t,t=t.child}if(!(2&t.flags))return t.stateNode}}function To(t,e,n){var r=t.tag;if(5===r||6===r)t=t.stateNode,e?yt(n,t,e):ht(n,t);else if(4!==r&&null!==(t=t.child))for(To(t,e,n),t=t.sibling;null!==t;)To(t,e,n),t=t.sibling}function Eo(t,e,n){var r=t.tag;if(5===r||6===r)t=t.stateNode,e?mt(n,t,e):dt(n,t);else if(4!==r&&null!==(t=t.child))for(Eo(t,e,n),t=t.sibling;null!==t;)Eo(t,e,n),t=t.sibling}var Po=null,Io=!1;function Ao(t,e,n){for(n=n.child;null!==n;)Mo(t,e,n),n=n.sibling}function Mo(t,e,n){if(He&&"function"==typeof He.onCommitFiberUnmount)try{He.onCommitFiberUnmount(Ge,n)}catch(t){}switch(n.tag){case 5:po||yo(n,e);case 6:if(q){var r=Po,i=Io;Po=null,Ao(t,e,n),Io=i,null!==(Po=r)&&(Io?vt(Po,n.stateNode):bt(Po,n.stateNode))}else Ao(t,e,n);break;case 18:q&&null!==Po&&(Io?Qt(Po,n.stateNode):Xt(Po,n.stateNode));break;case 4:q?(r=Po,i=Io,Po=n.stateNode.containerInfo,Io=!0,Ao(t,e,n),Po=r,Io=i):(K&&(r=n.stateNode.containerInfo,i=Et(r),At(r,i)),Ao(t,e,n));break;case 0:case 11:case 14:case 15:if(!po&&null!==(r=n.updateQueue)&&null!==(r=r.lastEffect)){i=r=r.next;do{var o=i,a=o.destroy;o=o.tag,void 0!==a&&(2&o||4&o)&&bo(n,e,a),i=i.next}while(i!==r)}Ao(t,e,n);break;case 1:if(!po&&(yo(n,e),"function"==typeof(r=n.stateNode).componentWillUnmount))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(t){Ja(n,e,t)}Ao(t,e,n);break;case 21:Ao(t,e,n);break;case 22:1&n.mode?(po=(r=po)||null!==n.memoizedState,Ao(t,e,n),po=r):Ao(t,e,n);break;default:Ao(t,e,n)}}function Do(t){var e=t.updateQueue;if(null!==e){t.updateQueue=null;var n=t.stateNode;null===n&&(n=t.stateNode=new go),e.forEach((function(e){var r=rs.bind(null,t,e);n.has(e)||(n.add(e),e.then(r,r))}))}}function Fo(t,e){var n=e.deletions;if(null!==n)for(var r=0;r<n.length;r++){var i=n[r];try{var o=t,s=e;if(q){var l=s;t:for(;null!==l;){switch(l.tag){case 5:Po=l.stateNode,Io=!1;break t;case 3:case 4:Po=l.stateNode.containerInfo,Io=!0;break t}l=l.return}if(null===Po)throw Error(a(160));Mo(o,s,i),Po=null,Io=!1}else Mo(o,s,i);var c=i.alternate;null!==c&&(c.return=null),i.return=null}catch(t){Ja(i,e,t)}}if(12854&e.subtreeFlags)for(e=e.child;null!==e;)Ro(e,t),e=e.sibling}function Ro(t,e){var n=t.alternate,r=t.flags;switch(t.tag){case 0:case 11:case 14:case 15:if(Fo(e,t),Bo(t),4&r){try{_o(3,t,t.return),wo(3,t)}catch(e){Ja(t,t.return,e)}try{_o(5,t,t.return)}catch(e){Ja(t,t.return,e)}}break;case 1:Fo(e,t),Bo(t),512&r&&null!==n&&yo(n,n.return);break;case 5:if(Fo(e,t),Bo(t),512&r&&null!==n&&yo(n,n.return),q){if(32&t.flags){var i=t.stateNode;try{_t(i)}catch(e){Ja(t,t.return,e)}}if(4&r&&null!=(i=t.stateNode)){var o=t.memoizedProps;if(n=null!==n?n.memoizedProps:o,r=t.type,e=t.updateQueue,t.updateQueue=null,null!==e)try{gt(i,e,r,n,o,t)}catch(e){Ja(t,t.return,e)}}}break;case 6:if(Fo(e,t),Bo(t),4&r&&q){if(null===t.stateNode)throw Error(a(162));i=t.stateNode,o=t.memoizedProps,n=null!==n?n.memoizedProps:o;try{ft(i,n,o)}catch(e){Ja(t,t.return,e)}}break;case 3:if(Fo(e,t),Bo(t),4&r){if(q&&X&&null!==n&&n.memoizedState.isDehydrated)try{qt(e.containerInfo)}catch(e){Ja(t,t.return,e)}if(K){i=e.containerInfo,o=e.pendingChildren;try{At(i,o)}catch(e){Ja(t,t.return,e)}}}break;case 4:if(Fo(e,t),Bo(t),4&r&&K){i=(o=t.stateNode).containerInfo,o=o.pendingChildren;try{At(i,o)}catch(e){Ja(t,t.return,e)}}break;case 13:Fo(e,t),Bo(t),8192&(i=t.child).flags&&(o=null!==i.memoizedState,i.stateNode.isHidden=o,!o||null!==i.alternate&&null!==i.alternate.memoizedState||(ga=Ue())),4&r&&Do(t);break;case 22:var s=null!==n&&null!==n.memoizedState;if(1&t.mode?(po=(n=po)||s,Fo(e,t),po=n):Fo(e,t),Bo(t),8192&r){if(n=null!==t.memoizedState,(t.stateNode.isHidden=n)&&!s&&1&t.mode)for(mo=t,r=t.child;null!==r;){for(e=mo=r;null!==mo;){var l=(s=mo).child;switch(s.tag){case 0:case 11:case 14:case 15:_o(4,s,s.return);break;case 1:yo(s,s.return);var c=s.stateNode;if("function"==typeof c.componentWillUnmount){var u=s,d=s.return;try{var h=u;c.props=h.memoizedProps,c.state=h.memoizedState,c.componentWillUnmount()}catch(t){Ja(u,d,t)}}break;case 5:yo(s,s.return);break;case 22:if(null!==s.memoizedState){zo(e);continue}}null!==l?(l.return=s,mo=l):zo(e)}r=r.sibling}if(q)t:if(r=null,q)for(e=t;;){if(5===e.tag){if(null===r){r=e;try{i=e.stateNode,n?wt(i):St(e.stateNode,e.memoizedProps)}catch(e){Ja(t,t.return,e)}}}else if(6===e.tag){if(null===r)try{o=e.stateNode,n?xt(o):kt(o,e.memoizedProps)}catch(e){Ja(t,t.return,e)}}else if((22!==e.tag&&23!==e.tag||null===e.memoizedState||e===t)&&null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break t;for(;null===e.sibling;){if(null===e.return||e.return===t)break t;r===e&&(r=null),e=e.return}r===e&&(r=null),e.sibling.return=e.return,e=e.sibling}}break;case 19:Fo(e,t),Bo(t),4&r&&Do(t);break;case 21:break;default:Fo(e,t),Bo(t)}}function Bo(t){var e=t.flags;if(2&e){try{if(q){t:{for(var n=t.return;null!==n;){if(ko(n)){var r=n;break t}n=n.return}throw Error(a(160))}switch(r.tag){case 5:var i=r.stateNode;32&r.flags&&(_t(i),r.flags&=-33),Eo(t,Co(t),i);break;case 3:case 4:var o=r.stateNode.containerInfo;To(t,Co(t),o);break;default:throw Error(a(161))}}}catch(e){Ja(t,t.return,e)}t.flags&=-3}4096&e&&(t.flags&=-4097)}function Lo(t,e,n){mo=t,No(t,e,n)}function No(t,e,n){for(var r=!!(1&t.mode);null!==mo;){var i=mo,o=i.child;if(22===i.tag&&r){var a=null!==i.memoizedState||fo;if(!a){var s=i.alternate,l=null!==s&&null!==s.memoizedState||po;s=fo;var c=po;if(fo=a,(po=l)&&!c)for(mo=i;null!==mo;)l=(a=mo).child,22===a.tag&&null!==a.memoizedState?Uo(i):null!==l?(l.return=a,mo=l):Uo(i);for(;null!==o;)mo=o,No(o,e,n),o=o.sibling;mo=i,fo=s,po=c}Oo(t)}else 8772&i.subtreeFlags&&null!==o?(o.return=i,mo=o):Oo(t)}}function Oo(t){for(;null!==mo;){var e=mo;if(8772&e.flags){var n=e.alternate;try{if(8772&e.flags)switch(e.tag){case 0:case 11:case 15:po||wo(5,e);break;case 1:var r=e.stateNode;if(4&e.flags&&!po)if(null===n)r.componentDidMount();else{var i=e.elementType===e.type?n.memoizedProps:mi(e.type,n.memoizedProps);r.componentDidUpdate(i,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var o=e.updateQueue;null!==o&&ir(e,o,r);break;case 3:var s=e.updateQueue;if(null!==s){if(n=null,null!==e.child)switch(e.child.tag){case 5:n=F(e.child.stateNode);break;case 1:n=e.child.stateNode}ir(e,s,n)}break;case 5:var l=e.stateNode;null===n&&4&e.flags&&pt(l,e.type,e.memoizedProps,e);break;case 6:case 4:case 12:case 19:case 17:case 21:case 22:case 23:case 25:break;case 13:if(X&&null===e.memoizedState){var c=e.alternate;if(null!==c){var u=c.memoizedState;if(null!==u){var d=u.dehydrated;null!==d&&Kt(d)}}}break;default:throw Error(a(163))}po||512&e.flags&&xo(e)}catch(t){Ja(e,e.return,t)}}if(e===t){mo=null;break}if(null!==(n=e.sibling)){n.return=e.return,mo=n;break}mo=e.return}}function zo(t){for(;null!==mo;){var e=mo;if(e===t){mo=null;break}var n=e.sibling;if(null!==n){n.return=e.return,mo=n;break}mo=e.return}}function Uo(t){for(;null!==mo;){var e=mo;try{switch(e.tag){case 0:case 11:case 15:var n=e.return;try{wo(4,e)}catch(t){Ja(e,n,t)}break;case 1:var r=e.stateNode;if("function"==typeof r.componentDidMount){var i=e.return;try{r.componentDidMount()}catch(t){Ja(e,i,t)}}var o=e.return;try{xo(e)}catch(t){Ja(e,o,t)}break;case 5:var a=e.return;try{xo(e)}catch(t){Ja(e,a,t)}}}catch(t){Ja(e,e.return,t)}if(e===t){mo=null;break}var s=e.sibling;if(null!==s){s.return=e.return,mo=s;break}mo=e.return}}var jo=0,Vo=1,$o=2,Wo=3,Go=4;if("function"==typeof Symbol&&Symbol.for){var Ho=Symbol.for;jo=Ho("selector.component"),Vo=Ho("selector.has_pseudo_class"),$o=Ho("selector.role"),Wo=Ho("selector.test_id"),Go=Ho("selector.text")}function Yo(t){var e=Q(t);if(null!=e){if("string"!=typeof e.memoizedProps["data-testname"])throw Error(a(364));return e}if(null===(t=it(t)))throw Error(a(362));return t.stateNode.current}function qo(t,e){switch(e.$$typeof){case jo:if(t.type===e.value)return!0;break;case Vo:t:{e=e.value,t=[t,0];for(var n=0;n<t.length;){var r=t[n++],i=t[n++],o=e[i];if(5!==r.tag||!st(r)){for(;null!=o&&qo(r,o);)o=e[++i];if(i===e.length){e=!0;break t}for(r=r.child;null!==r;)t.push(r,i),r=r.sibling}}e=!1}return e;case $o:if(5===t.tag&&lt(t.stateNode,e.value))return!0;break;case Go:if((5===t.tag||6===t.tag)&&null!==(t=at(t))&&0<=t.indexOf(e.value))return!0;break;case Wo:if(5===t.tag&&"string"==typeof(t=t.memoizedProps["data-testname"])&&t.toLowerCase()===e.value.toLowerCase())return!0;break;default:throw Error(a(365))}return!1}function Ko(t){switch(t.$$typeof){case jo:return"<"+(S(t.value)||"Unknown")+">";case Vo:return":has("+(Ko(t)||"")+")";case $o:return'[role="'+t.value+'"]';case Go:return'"'+t.value+'"';case Wo:return'[data-testname="'+t.value+'"]';default:throw Error(a(365))}}function Xo(t,e){var n=[];t=[t,0];for(var r=0;r<t.length;){var i=t[r++],o=t[r++],a=e[o];if(5!==i.tag||!st(i)){for(;null!=a&&qo(i,a);)a=e[++o];if(o===e.length)n.push(i);else for(i=i.child;null!==i;)t.push(i,o),i=i.sibling}}return n}function Qo(t,e){if(!rt)throw Error(a(363));t=Xo(t=Yo(t),e),e=[],t=Array.from(t);for(var n=0;n<t.length;){var r=t[n++];if(5===r.tag)st(r)||e.push(r.stateNode);else for(r=r.child;null!==r;)t.push(r),r=r.sibling}return e}var Zo=Math.ceil,Jo=s.ReactCurrentDispatcher,ta=s.ReactCurrentOwner,ea=s.ReactCurrentBatchConfig,na=0,ra=null,ia=null,oa=0,aa=0,sa=se(0),la=0,ca=null,ua=0,da=0,ha=0,fa=null,pa=null,ga=0,ma=1/0,ya=null;function ba(){ma=Ue()+500}var va,_a=!1,wa=null,xa=null,Sa=!1,ka=null,Ca=0,Ta=0,Ea=null,Pa=-1,Ia=0;function Aa(){return 6&na?Ue():-1!==Pa?Pa:Pa=Ue()}function Ma(t){return 1&t.mode?2&na&&0!==oa?oa&-oa:null!==En.transition?(0===Ia&&(Ia=Ae()),Ia):0!==(t=Re)?t:J():1}function Da(t,e,n,r){if(50<Ta)throw Ta=0,Ea=null,Error(a(185));De(t,n,r),2&na&&t===ra||(t===ra&&(!(2&na)&&(da|=n),4===la&&Na(t,oa)),Fa(t,r),1===n&&0===na&&!(1&e.mode)&&(ba(),Ke&&Ze()))}function Fa(t,e){var n=t.callbackNode;!function(t,e){for(var n=t.suspendedLanes,r=t.pingedLanes,i=t.expirationTimes,o=t.pendingLanes;0<o;){var a=31-we(o),s=1<<a,l=i[a];-1===l?s&n&&!(s&r)||(i[a]=Pe(s,e)):l<=e&&(t.expiredLanes|=s),o&=~s}}(t,e);var r=Ee(t,t===ra?oa:0);if(0===r)null!==n&&Ne(n),t.callbackNode=null,t.callbackPriority=0;else if(e=r&-r,t.callbackPriority!==e){if(null!=n&&Ne(n),1===e)0===t.tag?function(t){Ke=!0,Qe(t)}(Oa.bind(null,t)):Qe(Oa.bind(null,t)),et?nt((function(){!(6&na)&&Ze()})):Le(je,Ze),n=null;else{switch(Be(r)){case 1:n=je;break;case 4:n=Ve;break;case 16:default:n=$e;break;case 536870912:n=We}n=is(n,Ra.bind(null,t))}t.callbackPriority=e,t.callbackNode=n}}function Ra(t,e){if(Pa=-1,Ia=0,6&na)throw Error(a(327));var n=t.callbackNode;if(Qa()&&t.callbackNode!==n)return null;var r=Ee(t,t===ra?oa:0);if(0===r)return null;if(30&r||r&t.expiredLanes||e)e=Ga(t,r);else{e=r;var i=na;na|=2;var o=$a();for(ra===t&&oa===e||(ya=null,ba(),ja(t,e));;)try{Ya();break}catch(e){Va(t,e)}Un(),Jo.current=o,na=i,null!==ia?e=0:(ra=null,oa=0,e=la)}if(0!==e){if(2===e&&0!==(i=Ie(t))&&(r=i,e=Ba(t,i)),1===e)throw n=ca,ja(t,0),Na(t,r),Fa(t,Ue()),n;if(6===e)Na(t,r);else{if(i=t.current.alternate,!(30&r||function(t){for(var e=t;;){if(16384&e.flags){var n=e.updateQueue;if(null!==n&&null!==(n=n.stores))for(var r=0;r<n.length;r++){var i=n[r],o=i.getSnapshot;i=i.value;try{if(!Ye(o(),i))return!1}catch(t){return!1}}}if(n=e.child,16384&e.subtreeFlags&&null!==n)n.return=e,e=n;else{if(e===t)break;for(;null===e.sibling;){if(null===e.return||e.return===t)return!0;e=e.return}e.sibling.return=e.return,e=e.sibling}}return!0}(i)||(e=Ga(t,r),2===e&&(o=Ie(t),0!==o&&(r=o,e=Ba(t,o))),1!==e)))throw n=ca,ja(t,0),Na(t,r),Fa(t,Ue()),n;switch(t.finishedWork=i,t.finishedLanes=r,e){case 0:case 1:throw Error(a(345));case 2:case 5:Xa(t,pa,ya);break;case 3:if(Na(t,r),(130023424&r)===r&&10<(e=ga+500-Ue())){if(0!==Ee(t,0))break;if(((i=t.suspendedLanes)&r)!==r){Aa(),t.pingedLanes|=t.suspendedLanes&i;break}t.timeoutHandle=W(Xa.bind(null,t,pa,ya),e);break}Xa(t,pa,ya);break;case 4:if(Na(t,r),(4194240&r)===r)break;for(e=t.eventTimes,i=-1;0<r;){var s=31-we(r);o=1<<s,(s=e[s])>i&&(i=s),r&=~o}if(r=i,10<(r=(120>(r=Ue()-r)?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*Zo(r/1960))-r)){t.timeoutHandle=W(Xa.bind(null,t,pa,ya),r);break}Xa(t,pa,ya);break;default:throw Error(a(329))}}}return Fa(t,Ue()),t.callbackNode===n?Ra.bind(null,t):null}function Ba(t,e){var n=fa;return t.current.memoizedState.isDehydrated&&(ja(t,e).flags|=256),2!==(t=Ga(t,e))&&(e=pa,pa=n,null!==e&&La(e)),t}function La(t){null===pa?pa=t:pa.push.apply(pa,t)}function Na(t,e){for(e&=~ha,e&=~da,t.suspendedLanes|=e,t.pingedLanes&=~e,t=t.expirationTimes;0<e;){var n=31-we(e),r=1<<n;t[n]=-1,e&=~r}}function Oa(t){if(6&na)throw Error(a(327));Qa();var e=Ee(t,0);if(!(1&e))return Fa(t,Ue()),null;var n=Ga(t,e);if(0!==t.tag&&2===n){var r=Ie(t);0!==r&&(e=r,n=Ba(t,r))}if(1===n)throw n=ca,ja(t,0),Na(t,e),Fa(t,Ue()),n;if(6===n)throw Error(a(345));return t.finishedWork=t.current.alternate,t.finishedLanes=e,Xa(t,pa,ya),Fa(t,Ue()),null}function za(t){null!==ka&&0===ka.tag&&!(6&na)&&Qa();var e=na;na|=1;var n=ea.transition,r=Re;try{if(ea.transition=null,Re=1,t)return t()}finally{Re=r,ea.transition=n,!(6&(na=e))&&Ze()}}function Ua(){aa=sa.current,le(sa)}function ja(t,e){t.finishedWork=null,t.finishedLanes=0;var n=t.timeoutHandle;if(n!==H&&(t.timeoutHandle=H,G(n)),null!==ia)for(n=ia.return;null!==n;){var r=n;switch(hn(r),r.tag){case 1:null!=(r=r.type.childContextTypes)&&me();break;case 3:dr(),le(he),le(de),yr();break;case 5:fr(r);break;case 4:dr();break;case 13:case 19:le(pr);break;case 10:Vn(r.type._context);break;case 22:case 23:Ua()}n=n.return}if(ra=t,ia=t=ls(t.current,null),oa=aa=e,la=0,ca=null,ha=da=ua=0,pa=fa=null,null!==Hn){for(e=0;e<Hn.length;e++)if(null!==(r=(n=Hn[e]).interleaved)){n.interleaved=null;var i=r.next,o=n.pending;if(null!==o){var a=o.next;o.next=i,r.next=a}n.pending=r}Hn=null}return t}function Va(t,e){for(;;){var n=ia;try{if(Un(),br.current=hi,kr){for(var r=wr.memoizedState;null!==r;){var i=r.queue;null!==i&&(i.pending=null),r=r.next}kr=!1}if(_r=0,Sr=xr=wr=null,Cr=!1,Tr=0,ta.current=null,null===n||null===n.return){la=1,ca=e,ia=null;break}t:{var o=t,s=n.return,l=n,c=e;if(e=oa,l.flags|=32768,null!==c&&"object"==typeof c&&"function"==typeof c.then){var u=c,d=l,h=d.tag;if(!(1&d.mode||0!==h&&11!==h&&15!==h)){var f=d.alternate;f?(d.updateQueue=f.updateQueue,d.memoizedState=f.memoizedState,d.lanes=f.lanes):(d.updateQueue=null,d.memoizedState=null)}var p=Ai(s);if(null!==p){p.flags&=-257,Mi(p,s,l,0,e),1&p.mode&&Ii(o,u,e),c=u;var g=(e=p).updateQueue;if(null===g){var m=new Set;m.add(c),e.updateQueue=m}else g.add(c);break t}if(!(1&e)){Ii(o,u,e),Wa();break t}c=Error(a(426))}else if(gn&&1&l.mode){var y=Ai(s);if(null!==y){!(65536&y.flags)&&(y.flags|=256),Mi(y,s,l,0,e),Tn(Si(c,l));break t}}o=c=Si(c,l),4!==la&&(la=2),null===fa?fa=[o]:fa.push(o),o=s;do{switch(o.tag){case 3:o.flags|=65536,e&=-e,o.lanes|=e,nr(o,Ei(0,c,e));break t;case 1:l=c;var b=o.type,v=o.stateNode;if(!(128&o.flags||"function"!=typeof b.getDerivedStateFromError&&(null===v||"function"!=typeof v.componentDidCatch||null!==xa&&xa.has(v)))){o.flags|=65536,e&=-e,o.lanes|=e,nr(o,Pi(o,l,e));break t}}o=o.return}while(null!==o)}Ka(n)}catch(t){e=t,ia===n&&null!==n&&(ia=n=n.return);continue}break}}function $a(){var t=Jo.current;return Jo.current=hi,null===t?hi:t}function Wa(){0!==la&&3!==la&&2!==la||(la=4),null===ra||!(268435455&ua)&&!(268435455&da)||Na(ra,oa)}function Ga(t,e){var n=na;na|=2;var r=$a();for(ra===t&&oa===e||(ya=null,ja(t,e));;)try{Ha();break}catch(e){Va(t,e)}if(Un(),na=n,Jo.current=r,null!==ia)throw Error(a(261));return ra=null,oa=0,la}function Ha(){for(;null!==ia;)qa(ia)}function Ya(){for(;null!==ia&&!Oe();)qa(ia)}function qa(t){var e=va(t.alternate,t,aa);t.memoizedProps=t.pendingProps,null===e?Ka(t):ia=e,ta.current=null}function Ka(t){var e=t;do{var n=e.alternate;if(t=e.return,32768&e.flags){if(null!==(n=ho(n,e)))return n.flags&=32767,void(ia=n);if(null===t)return la=6,void(ia=null);t.flags|=32768,t.subtreeFlags=0,t.deletions=null}else if(null!==(n=uo(n,e,aa)))return void(ia=n);if(null!==(e=e.sibling))return void(ia=e);ia=e=t}while(null!==e);0===la&&(la=5)}function Xa(t,e,n){var r=Re,i=ea.transition;try{ea.transition=null,Re=1,function(t,e,n,r){do{Qa()}while(null!==ka);if(6&na)throw Error(a(327));n=t.finishedWork;var i=t.finishedLanes;if(null===n)return null;if(t.finishedWork=null,t.finishedLanes=0,n===t.current)throw Error(a(177));t.callbackNode=null,t.callbackPriority=0;var o=n.lanes|n.childLanes;if(function(t,e){var n=t.pendingLanes&~e;t.pendingLanes=e,t.suspendedLanes=0,t.pingedLanes=0,t.expiredLanes&=e,t.mutableReadLanes&=e,t.entangledLanes&=e,e=t.entanglements;var r=t.eventTimes;for(t=t.expirationTimes;0<n;){var i=31-we(n),o=1<<i;e[i]=0,r[i]=-1,t[i]=-1,n&=~o}}(t,o),t===ra&&(ia=ra=null,oa=0),!(2064&n.subtreeFlags)&&!(2064&n.flags)||Sa||(Sa=!0,is($e,(function(){return Qa(),null}))),o=!!(15990&n.flags),15990&n.subtreeFlags||o){o=ea.transition,ea.transition=null;var s=Re;Re=1;var l=na;na|=4,ta.current=null,function(t,e){for(L(t.containerInfo),mo=e;null!==mo;)if(e=(t=mo).child,1028&t.subtreeFlags&&null!==e)e.return=t,mo=e;else for(;null!==mo;){t=mo;try{var n=t.alternate;if(1024&t.flags)switch(t.tag){case 0:case 11:case 15:case 5:case 6:case 4:case 17:break;case 1:if(null!==n){var r=n.memoizedProps,i=n.memoizedState,o=t.stateNode,s=o.getSnapshotBeforeUpdate(t.elementType===t.type?r:mi(t.type,r),i);o.__reactInternalSnapshotBeforeUpdate=s}break;case 3:q&&Ct(t.stateNode.containerInfo);break;default:throw Error(a(163))}}catch(e){Ja(t,t.return,e)}if(null!==(e=t.sibling)){e.return=t.return,mo=e;break}mo=t.return}n=vo,vo=!1}(t,n),Ro(n,t),N(t.containerInfo),t.current=n,Lo(n,t,i),ze(),na=l,Re=s,ea.transition=o}else t.current=n;if(Sa&&(Sa=!1,ka=t,Ca=i),0===(o=t.pendingLanes)&&(xa=null),function(t){if(He&&"function"==typeof He.onCommitFiberRoot)try{He.onCommitFiberRoot(Ge,t,void 0,!(128&~t.current.flags))}catch(t){}}(n.stateNode),Fa(t,Ue()),null!==e)for(r=t.onRecoverableError,n=0;n<e.length;n++)r((i=e[n]).value,{componentStack:i.stack,digest:i.digest});if(_a)throw _a=!1,t=wa,wa=null,t;!!(1&Ca)&&0!==t.tag&&Qa(),1&(o=t.pendingLanes)?t===Ea?Ta++:(Ta=0,Ea=t):Ta=0,Ze()}(t,e,n,r)}finally{ea.transition=i,Re=r}return null}function Qa(){if(null!==ka){var t=Be(Ca),e=ea.transition,n=Re;try{if(ea.transition=null,Re=16>t?16:t,null===ka)var r=!1;else{if(t=ka,ka=null,Ca=0,6&na)throw Error(a(331));var i=na;for(na|=4,mo=t.current;null!==mo;){var o=mo,s=o.child;if(16&mo.flags){var l=o.deletions;if(null!==l){for(var c=0;c<l.length;c++){var u=l[c];for(mo=u;null!==mo;){var d=mo;switch(d.tag){case 0:case 11:case 15:_o(8,d,o)}var h=d.child;if(null!==h)h.return=d,mo=h;else for(;null!==mo;){var f=(d=mo).sibling,p=d.return;if(So(d),d===u){mo=null;break}if(null!==f){f.return=p,mo=f;break}mo=p}}}var g=o.alternate;if(null!==g){var m=g.child;if(null!==m){g.child=null;do{var y=m.sibling;m.sibling=null,m=y}while(null!==m)}}mo=o}}if(2064&o.subtreeFlags&&null!==s)s.return=o,mo=s;else t:for(;null!==mo;){if(2048&(o=mo).flags)switch(o.tag){case 0:case 11:case 15:_o(9,o,o.return)}var b=o.sibling;if(null!==b){b.return=o.return,mo=b;break t}mo=o.return}}var v=t.current;for(mo=v;null!==mo;){var _=(s=mo).child;if(2064&s.subtreeFlags&&null!==_)_.return=s,mo=_;else t:for(s=v;null!==mo;){if(2048&(l=mo).flags)try{switch(l.tag){case 0:case 11:case 15:wo(9,l)}}catch(t){Ja(l,l.return,t)}if(l===s){mo=null;break t}var w=l.sibling;if(null!==w){w.return=l.return,mo=w;break t}mo=l.return}}if(na=i,Ze(),He&&"function"==typeof He.onPostCommitFiberRoot)try{He.onPostCommitFiberRoot(Ge,t)}catch(t){}r=!0}return r}finally{Re=n,ea.transition=e}}return!1}function Za(t,e,n){t=tr(t,e=Ei(0,e=Si(n,e),1),1),e=Aa(),null!==t&&(De(t,1,e),Fa(t,e))}function Ja(t,e,n){if(3===t.tag)Za(t,t,n);else for(;null!==e;){if(3===e.tag){Za(e,t,n);break}if(1===e.tag){var r=e.stateNode;if("function"==typeof e.type.getDerivedStateFromError||"function"==typeof r.componentDidCatch&&(null===xa||!xa.has(r))){e=tr(e,t=Pi(e,t=Si(n,t),1),1),t=Aa(),null!==e&&(De(e,1,t),Fa(e,t));break}}e=e.return}}function ts(t,e,n){var r=t.pingCache;null!==r&&r.delete(e),e=Aa(),t.pingedLanes|=t.suspendedLanes&n,ra===t&&(oa&n)===n&&(4===la||3===la&&(130023424&oa)===oa&&500>Ue()-ga?ja(t,0):ha|=n),Fa(t,e)}function es(t,e){0===e&&(1&t.mode?(e=Ce,!(130023424&(Ce<<=1))&&(Ce=4194304)):e=1);var n=Aa();null!==(t=Kn(t,e))&&(De(t,e,n),Fa(t,n))}function ns(t){var e=t.memoizedState,n=0;null!==e&&(n=e.retryLane),es(t,n)}function rs(t,e){var n=0;switch(t.tag){case 13:var r=t.stateNode,i=t.memoizedState;null!==i&&(n=i.retryLane);break;case 19:r=t.stateNode;break;default:throw Error(a(314))}null!==r&&r.delete(e),es(t,n)}function is(t,e){return Le(t,e)}function os(t,e,n,r){this.tag=t,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=e,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function as(t,e,n,r){return new os(t,e,n,r)}function ss(t){return!(!(t=t.prototype)||!t.isReactComponent)}function ls(t,e){var n=t.alternate;return null===n?((n=as(t.tag,e,t.key,t.mode)).elementType=t.elementType,n.type=t.type,n.stateNode=t.stateNode,n.alternate=t,t.alternate=n):(n.pendingProps=e,n.type=t.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=14680064&t.flags,n.childLanes=t.childLanes,n.lanes=t.lanes,n.child=t.child,n.memoizedProps=t.memoizedProps,n.memoizedState=t.memoizedState,n.updateQueue=t.updateQueue,e=t.dependencies,n.dependencies=null===e?null:{lanes:e.lanes,firstContext:e.firstContext},n.sibling=t.sibling,n.index=t.index,n.ref=t.ref,n}function cs(t,e,n,r,i,o){var s=2;if(r=t,"function"==typeof t)ss(t)&&(s=1);else if("string"==typeof t)s=5;else t:switch(t){case u:return us(n.children,i,o,e);case d:s=8,i|=8;break;case h:return(t=as(12,n,e,2|i)).elementType=h,t.lanes=o,t;case m:return(t=as(13,n,e,i)).elementType=m,t.lanes=o,t;case y:return(t=as(19,n,e,i)).elementType=y,t.lanes=o,t;case _:return ds(n,i,o,e);default:if("object"==typeof t&&null!==t)switch(t.$$typeof){case f:s=10;break t;case p:s=9;break t;case g:s=11;break t;case b:s=14;break t;case v:s=16,r=null;break t}throw Error(a(130,null==t?t:typeof t,""))}return(e=as(s,n,e,i)).elementType=t,e.type=r,e.lanes=o,e}function us(t,e,n,r){return(t=as(7,t,r,e)).lanes=n,t}function ds(t,e,n,r){return(t=as(22,t,r,e)).elementType=_,t.lanes=n,t.stateNode={isHidden:!1},t}function hs(t,e,n){return(t=as(6,t,null,e)).lanes=n,t}function fs(t,e,n){return(e=as(4,null!==t.children?t.children:[],t.key,e)).lanes=n,e.stateNode={containerInfo:t.containerInfo,pendingChildren:null,implementation:t.implementation},e}function ps(t,e,n,r,i){this.tag=e,this.containerInfo=t,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=H,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=Me(0),this.expirationTimes=Me(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Me(0),this.identifierPrefix=r,this.onRecoverableError=i,X&&(this.mutableSourceEagerHydrationData=null)}function gs(t,e,n,r,i,o,a,s,l){return t=new ps(t,e,n,s,l),1===e?(e=1,!0===o&&(e|=8)):e=0,o=as(3,null,null,e),t.current=o,o.stateNode=t,o.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},Qn(o),t}function ms(t){if(!t)return ue;t:{if(C(t=t._reactInternals)!==t||1!==t.tag)throw Error(a(170));var e=t;do{switch(e.tag){case 3:e=e.stateNode.context;break t;case 1:if(ge(e.type)){e=e.stateNode.__reactInternalMemoizedMergedChildContext;break t}}e=e.return}while(null!==e);throw Error(a(171))}if(1===t.tag){var n=t.type;if(ge(n))return be(t,n,e)}return e}function ys(t){var e=t._reactInternals;if(void 0===e){if("function"==typeof t.render)throw Error(a(188));throw t=Object.keys(t).join(","),Error(a(268,t))}return null===(t=P(e))?null:t.stateNode}function bs(t,e){if(null!==(t=t.memoizedState)&&null!==t.dehydrated){var n=t.retryLane;t.retryLane=0!==n&&n<e?n:e}}function vs(t,e){bs(t,e),(t=t.alternate)&&bs(t,e)}function _s(t){return null===(t=P(t))?null:t.stateNode}function ws(){return null}return va=function(t,e,n){if(null!==t)if(t.memoizedProps!==e.pendingProps||he.current)Fi=!0;else{if(!(t.lanes&n||128&e.flags))return Fi=!1,function(t,e,n){switch(e.tag){case 3:$i(e),Cn();break;case 5:hr(e);break;case 1:ge(e.type)&&ve(e);break;case 4:ur(e,e.stateNode.containerInfo);break;case 10:jn(0,e.type._context,e.memoizedProps.value);break;case 13:var r=e.memoizedState;if(null!==r)return null!==r.dehydrated?(ce(pr,1&pr.current),e.flags|=128,null):n&e.child.childLanes?Qi(t,e,n):(ce(pr,1&pr.current),null!==(t=io(t,e,n))?t.sibling:null);ce(pr,1&pr.current);break;case 19:if(r=!!(n&e.childLanes),128&t.flags){if(r)return no(t,e,n);e.flags|=128}var i=e.memoizedState;if(null!==i&&(i.rendering=null,i.tail=null,i.lastEffect=null),ce(pr,pr.current),r)break;return null;case 22:case 23:return e.lanes=0,Oi(t,e,n)}return io(t,e,n)}(t,e,n);Fi=!!(131072&t.flags)}else Fi=!1,gn&&1048576&e.flags&&un(e,nn,e.index);switch(e.lanes=0,e.tag){case 2:var r=e.type;ro(t,e),t=e.pendingProps;var i=pe(e,de.current);Wn(e,n),i=Ar(null,e,r,t,i,n);var o=Mr();return e.flags|=1,"object"==typeof i&&null!==i&&"function"==typeof i.render&&void 0===i.$$typeof?(e.tag=1,e.memoizedState=null,e.updateQueue=null,ge(r)?(o=!0,ve(e)):o=!1,e.memoizedState=null!==i.state&&void 0!==i.state?i.state:null,Qn(e),i.updater=bi,e.stateNode=i,i._reactInternals=e,xi(e,r,t,n),e=Vi(null,e,r,!0,o,n)):(e.tag=0,gn&&o&&dn(e),Ri(null,e,i,n),e=e.child),e;case 16:r=e.elementType;t:{switch(ro(t,e),t=e.pendingProps,r=(i=r._init)(r._payload),e.type=r,i=e.tag=function(t){if("function"==typeof t)return ss(t)?1:0;if(null!=t){if((t=t.$$typeof)===g)return 11;if(t===b)return 14}return 2}(r),t=mi(r,t),i){case 0:e=Ui(null,e,r,t,n);break t;case 1:e=ji(null,e,r,t,n);break t;case 11:e=Bi(null,e,r,t,n);break t;case 14:e=Li(null,e,r,mi(r.type,t),n);break t}throw Error(a(306,r,""))}return e;case 0:return r=e.type,i=e.pendingProps,Ui(t,e,r,i=e.elementType===r?i:mi(r,i),n);case 1:return r=e.type,i=e.pendingProps,ji(t,e,r,i=e.elementType===r?i:mi(r,i),n);case 3:t:{if($i(e),null===t)throw Error(a(387));r=e.pendingProps,i=(o=e.memoizedState).element,Zn(t,e),rr(e,r,null,n);var s=e.memoizedState;if(r=s.element,X&&o.isDehydrated){if(o={element:r,isDehydrated:!1,cache:s.cache,pendingSuspenseBoundaries:s.pendingSuspenseBoundaries,transitions:s.transitions},e.updateQueue.baseState=o,e.memoizedState=o,256&e.flags){e=Wi(t,e,r,n,i=Si(Error(a(423)),e));break t}if(r!==i){e=Wi(t,e,r,n,i=Si(Error(a(424)),e));break t}for(X&&(pn=Vt(e.stateNode.containerInfo),fn=e,gn=!0,yn=null,mn=!1),n=Bn(e,null,r,n),e.child=n;n;)n.flags=-3&n.flags|4096,n=n.sibling}else{if(Cn(),r===i){e=io(t,e,n);break t}Ri(t,e,r,n)}e=e.child}return e;case 5:return hr(e),null===t&&wn(e),r=e.type,i=e.pendingProps,o=null!==t?t.memoizedProps:null,s=i.children,V(r,i)?s=null:null!==o&&V(r,o)&&(e.flags|=32),zi(t,e),Ri(t,e,s,n),e.child;case 6:return null===t&&wn(e),null;case 13:return Qi(t,e,n);case 4:return ur(e,e.stateNode.containerInfo),r=e.pendingProps,null===t?e.child=Rn(e,null,r,n):Ri(t,e,r,n),e.child;case 11:return r=e.type,i=e.pendingProps,Bi(t,e,r,i=e.elementType===r?i:mi(r,i),n);case 7:return Ri(t,e,e.pendingProps,n),e.child;case 8:case 12:return Ri(t,e,e.pendingProps.children,n),e.child;case 10:t:{if(r=e.type._context,i=e.pendingProps,o=e.memoizedProps,jn(0,r,s=i.value),null!==o)if(Ye(o.value,s)){if(o.children===i.children&&!he.current){e=io(t,e,n);break t}}else for(null!==(o=e.child)&&(o.return=e);null!==o;){var l=o.dependencies;if(null!==l){s=o.child;for(var c=l.firstContext;null!==c;){if(c.context===r){if(1===o.tag){(c=Jn(-1,n&-n)).tag=2;var u=o.updateQueue;if(null!==u){var d=(u=u.shared).pending;null===d?c.next=c:(c.next=d.next,d.next=c),u.pending=c}}o.lanes|=n,null!==(c=o.alternate)&&(c.lanes|=n),$n(o.return,n,e),l.lanes|=n;break}c=c.next}}else if(10===o.tag)s=o.type===e.type?null:o.child;else if(18===o.tag){if(null===(s=o.return))throw Error(a(341));s.lanes|=n,null!==(l=s.alternate)&&(l.lanes|=n),$n(s,n,e),s=o.sibling}else s=o.child;if(null!==s)s.return=o;else for(s=o;null!==s;){if(s===e){s=null;break}if(null!==(o=s.sibling)){o.return=s.return,s=o;break}s=s.return}o=s}Ri(t,e,i.children,n),e=e.child}return e;case 9:return i=e.type,r=e.pendingProps.children,Wn(e,n),r=r(i=Gn(i)),e.flags|=1,Ri(t,e,r,n),e.child;case 14:return i=mi(r=e.type,e.pendingProps),Li(t,e,r,i=mi(r.type,i),n);case 15:return Ni(t,e,e.type,e.pendingProps,n);case 17:return r=e.type,i=e.pendingProps,i=e.elementType===r?i:mi(r,i),ro(t,e),e.tag=1,ge(r)?(t=!0,ve(e)):t=!1,Wn(e,n),_i(e,r,i),xi(e,r,i,n),Vi(null,e,r,!0,t,n);case 19:return no(t,e,n);case 22:return Oi(t,e,n)}throw Error(a(156,e.tag))},e.attemptContinuousHydration=function(t){if(13===t.tag){var e=Kn(t,134217728);null!==e&&Da(e,t,134217728,Aa()),vs(t,134217728)}},e.attemptDiscreteHydration=function(t){if(13===t.tag){var e=Kn(t,1);null!==e&&Da(e,t,1,Aa()),vs(t,1)}},e.attemptHydrationAtCurrentPriority=function(t){if(13===t.tag){var e=Ma(t),n=Kn(t,e);null!==n&&Da(n,t,e,Aa()),vs(t,e)}},e.attemptSynchronousHydration=function(t){switch(t.tag){case 3:var e=t.stateNode;if(e.current.memoizedState.isDehydrated){var n=Te(e.pendingLanes);0!==n&&(Fe(e,1|n),Fa(e,Ue()),!(6&na)&&(ba(),Ze()))}break;case 13:za((function(){var e=Kn(t,1);if(null!==e){var n=Aa();Da(e,t,1,n)}})),vs(t,1)}},e.batchedUpdates=function(t,e){var n=na;na|=1;try{return t(e)}finally{0===(na=n)&&(ba(),Ke&&Ze())}},e.createComponentSelector=function(t){return{$$typeof:jo,value:t}},e.createContainer=function(t,e,n,r,i,o,a){return gs(t,e,!1,null,0,r,0,o,a)},e.createHasPseudoClassSelector=function(t){return{$$typeof:Vo,value:t}},e.createHydrationContainer=function(t,e,n,r,i,o,a,s,l){return(t=gs(n,r,!0,t,0,o,0,s,l)).context=ms(null),n=t.current,(o=Jn(r=Aa(),i=Ma(n))).callback=null!=e?e:null,tr(n,o,i),t.current.lanes=i,De(t,i,r),Fa(t,r),t},e.createPortal=function(t,e,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:c,key:null==r?null:""+r,children:t,containerInfo:e,implementation:n}},e.createRoleSelector=function(t){return{$$typeof:$o,value:t}},e.createTestNameSelector=function(t){return{$$typeof:Wo,value:t}},e.createTextSelector=function(t){return{$$typeof:Go,value:t}},e.deferredUpdates=function(t){var e=Re,n=ea.transition;try{return ea.transition=null,Re=16,t()}finally{Re=e,ea.transition=n}},e.discreteUpdates=function(t,e,n,r,i){var o=Re,a=ea.transition;try{return ea.transition=null,Re=1,t(e,n,r,i)}finally{Re=o,ea.transition=a,0===na&&ba()}},e.findAllNodes=Qo,e.findBoundingRects=function(t,e){if(!rt)throw Error(a(363));e=Qo(t,e),t=[];for(var n=0;n<e.length;n++)t.push(ot(e[n]));for(e=t.length-1;0<e;e--)for(var r=(n=t[e]).x,i=r+n.width,o=n.y,s=o+n.height,l=e-1;0<=l;l--)if(e!==l){var c=t[l],u=c.x,d=u+c.width,h=c.y,f=h+c.height;if(r>=u&&o>=h&&i<=d&&s<=f){t.splice(e,1);break}if(!(r!==u||n.width!==c.width||f<o||h>s)){h>o&&(c.height+=h-o,c.y=o),f<s&&(c.height=s-h),t.splice(e,1);break}if(!(o!==h||n.height!==c.height||d<r||u>i)){u>r&&(c.width+=u-r,c.x=r),d<i&&(c.width=i-u),t.splice(e,1);break}}return t},e.findHostInstance=ys,e.findHostInstanceWithNoPortals=function(t){return null===(t=null!==(t=E(t))?A(t):null)?null:t.stateNode},e.findHostInstanceWithWarning=function(t){return ys(t)},e.flushControlled=function(t){var e=na;na|=1;var n=ea.transition,r=Re;try{ea.transition=null,Re=1,t()}finally{Re=r,ea.transition=n,0===(na=e)&&(ba(),Ze())}},e.flushPassiveEffects=Qa,e.flushSync=za,e.focusWithin=function(t,e){if(!rt)throw Error(a(363));for(e=Xo(t=Yo(t),e),e=Array.from(e),t=0;t<e.length;){var n=e[t++];if(!st(n)){if(5===n.tag&&ct(n.stateNode))return!0;for(n=n.child;null!==n;)e.push(n),n=n.sibling}}return!1},e.getCurrentUpdatePriority=function(){return Re},e.getFindAllNodesFailureDescription=function(t,e){if(!rt)throw Error(a(363));var n=0,r=[];t=[Yo(t),0];for(var i=0;i<t.length;){var o=t[i++],s=t[i++],l=e[s];if((5!==o.tag||!st(o))&&(qo(o,l)&&(r.push(Ko(l)),++s>n&&(n=s)),s<e.length))for(o=o.child;null!==o;)t.push(o,s),o=o.sibling}if(n<e.length){for(t=[];n<e.length;n++)t.push(Ko(e[n]));return"findAllNodes was able to match part of the selector:\n  "+r.join(" > ")+"\n\nNo matching component was found for:\n  "+t.join(" > ")}return null},e.getPublicRootInstance=function(t){return(t=t.current).child?5===t.child.tag?F(t.child.stateNode):t.child.stateNode:null},e.injectIntoDevTools=function(t){if(t={bundleType:t.bundleType,version:t.version,rendererPackageName:t.rendererPackageName,rendererConfig:t.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:s.ReactCurrentDispatcher,findHostInstanceByFiber:_s,findFiberByHostInstance:t.findFiberByHostInstance||ws,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1"},"undefined"==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__)t=!1;else{var e=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(e.isDisabled||!e.supportsFiber)t=!0;else{try{Ge=e.inject(t),He=e}catch(t){}t=!!e.checkDCE}}return t},e.isAlreadyRendering=function(){return!1},e.observeVisibleRects=function(t,e,n,r){if(!rt)throw Error(a(363));t=Qo(t,e);var i=ut(t,n,r).disconnect;return{disconnect:function(){i()}}},e.registerMutableSourceForHydration=function(t,e){var n=e._getVersion;n=n(e._source),null==t.mutableSourceEagerHydrationData?t.mutableSourceEagerHydrationData=[e,n]:t.mutableSourceEagerHydrationData.push(e,n)},e.runWithPriority=function(t,e){var n=Re;try{return Re=t,e()}finally{Re=n}},e.shouldError=function(){return null},e.shouldSuspend=function(){return!1},e.updateContainer=function(t,e,n,r){var i=e.current,o=Aa(),a=Ma(i);return n=ms(n),null===e.context?e.context=n:e.pendingContext=n,(e=Jn(o,a)).payload={element:t},null!==(r=void 0===r?null:r)&&(e.callback=r),null!==(t=tr(i,e,a))&&(Da(t,i,a,o),er(t,i,a)),a},e}},3642:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Contrast=void 0;const r=n(3100),i=n(5304),o=n(4715);e.Contrast=function(t){const e=Math.pow((this.contrast()+100)/100,2),n=t.data,r=n.length;let i=150,o=150,a=150;for(let t=0;t<r;t+=4)i=n[t],o=n[t+1],a=n[t+2],i/=255,i-=.5,i*=e,i+=.5,i*=255,o/=255,o-=.5,o*=e,o+=.5,o*=255,a/=255,a-=.5,a*=e,a+=.5,a*=255,i=i<0?0:i>255?255:i,o=o<0?0:o>255?255:o,a=a<0?0:a>255?255:a,n[t]=i,n[t+1]=o,n[t+2]=a},r.Factory.addGetterSetter(i.Node,"contrast",0,(0,o.getNumberValidator)(),r.Factory.afterSetFilter)},3895:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Konva=void 0;var r=n(6488);Object.defineProperty(e,"Konva",{enumerable:!0,get:function(){return r.Konva}});const i=n(6488);t.exports=i.Konva},3945:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.RGB=void 0;const r=n(3100),i=n(5304),o=n(4715);e.RGB=function(t){const e=t.data,n=e.length,r=this.red(),i=this.green(),o=this.blue();for(let t=0;t<n;t+=4){const n=(.34*e[t]+.5*e[t+1]+.16*e[t+2])/255;e[t]=n*r,e[t+1]=n*i,e[t+2]=n*o,e[t+3]=e[t+3]}},r.Factory.addGetterSetter(i.Node,"red",0,(function(t){return this._filterUpToDate=!1,t>255?255:t<0?0:Math.round(t)})),r.Factory.addGetterSetter(i.Node,"green",0,(function(t){return this._filterUpToDate=!1,t>255?255:t<0?0:Math.round(t)})),r.Factory.addGetterSetter(i.Node,"blue",0,o.RGBComponent,r.Factory.afterSetFilter)},4197:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Arc=void 0;const r=n(3100),i=n(3123),o=n(951),a=n(4715),s=n(951);class l extends i.Shape{_sceneFunc(t){const e=o.Konva.getAngle(this.angle()),n=this.clockwise();t.beginPath(),t.arc(0,0,this.outerRadius(),0,e,n),t.arc(0,0,this.innerRadius(),e,0,!n),t.closePath(),t.fillStrokeShape(this)}getWidth(){return 2*this.outerRadius()}getHeight(){return 2*this.outerRadius()}setWidth(t){this.outerRadius(t/2)}setHeight(t){this.outerRadius(t/2)}getSelfRect(){const t=this.innerRadius(),e=this.outerRadius(),n=this.clockwise(),r=o.Konva.getAngle(n?360-this.angle():this.angle()),i=Math.cos(Math.min(r,Math.PI)),a=Math.sin(Math.min(Math.max(Math.PI,r),3*Math.PI/2)),s=Math.sin(Math.min(r,Math.PI/2)),l=i*(i>0?t:e),c=a*(a>0?t:e),u=s*(s>0?e:t);return{x:l,y:n?-1*u:c,width:1*e-l,height:u-c}}}e.Arc=l,l.prototype._centroid=!0,l.prototype.className="Arc",l.prototype._attrsAffectingSize=["innerRadius","outerRadius","angle","clockwise"],(0,s._registerNode)(l),r.Factory.addGetterSetter(l,"innerRadius",0,(0,a.getNumberValidator)()),r.Factory.addGetterSetter(l,"outerRadius",0,(0,a.getNumberValidator)()),r.Factory.addGetterSetter(l,"angle",0,(0,a.getNumberValidator)()),r.Factory.addGetterSetter(l,"clockwise",!1,(0,a.getBooleanValidator)())},4311:(t,e,n)=>{"use strict";var r=n(3308),i=n(8494);function o(t){for(var e="https://reactjs.org/docs/error-decoder.html?invariant="+t,n=1;n<arguments.length;n++)e+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+t+"; visit "+e+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var a=new Set,s={};function l(t,e){c(t,e),c(t+"Capture",e)}function c(t,e){for(s[t]=e,t=0;t<e.length;t++)a.add(e[t])}var u=!("undefined"==typeof window||void 0===window.document||void 0===window.document.createElement),d=Object.prototype.hasOwnProperty,h=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,f={},p={};function g(t,e,n,r,i,o,a){this.acceptsBooleans=2===e||3===e||4===e,this.attributeName=r,this.attributeNamespace=i,this.mustUseProperty=n,this.propertyName=t,this.type=e,this.sanitizeURL=o,this.removeEmptyString=a}var m={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach((function(t){m[t]=new g(t,0,!1,t,null,!1,!1)})),[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach((function(t){var e=t[0];m[e]=new g(e,1,!1,t[1],null,!1,!1)})),["contentEditable","draggable","spellCheck","value"].forEach((function(t){m[t]=new g(t,2,!1,t.toLowerCase(),null,!1,!1)})),["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach((function(t){m[t]=new g(t,2,!1,t,null,!1,!1)})),"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach((function(t){m[t]=new g(t,3,!1,t.toLowerCase(),null,!1,!1)})),["checked","multiple","muted","selected"].forEach((function(t){m[t]=new g(t,3,!0,t,null,!1,!1)})),["capture","download"].forEach((function(t){m[t]=new g(t,4,!1,t,null,!1,!1)})),["cols","rows","size","span"].forEach((function(t){m[t]=new g(t,6,!1,t,null,!1,!1)})),["rowSpan","start"].forEach((function(t){m[t]=new g(t,5,!1,t.toLowerCase(),null,!1,!1)}));var y=/[\-:]([a-z])/g;function b(t){return t[1].toUpperCase()}function v(t,e,n,r){var i=m.hasOwnProperty(e)?m[e]:null;(null!==i?0!==i.type:r||!(2<e.length)||"o"!==e[0]&&"O"!==e[0]||"n"!==e[1]&&"N"!==e[1])&&(function(t,e,n,r){if(null==e||function(t,e,n,r){if(null!==n&&0===n.type)return!1;switch(typeof e){case"function":case"symbol":return!0;case"boolean":return!r&&(null!==n?!n.acceptsBooleans:"data-"!==(t=t.toLowerCase().slice(0,5))&&"aria-"!==t);default:return!1}}(t,e,n,r))return!0;if(r)return!1;if(null!==n)switch(n.type){case 3:return!e;case 4:return!1===e;case 5:return isNaN(e);case 6:return isNaN(e)||1>e}return!1}(e,n,i,r)&&(n=null),r||null===i?function(t){return!!d.call(p,t)||!d.call(f,t)&&(h.test(t)?p[t]=!0:(f[t]=!0,!1))}(e)&&(null===n?t.removeAttribute(e):t.setAttribute(e,""+n)):i.mustUseProperty?t[i.propertyName]=null===n?3!==i.type&&"":n:(e=i.attributeName,r=i.attributeNamespace,null===n?t.removeAttribute(e):(n=3===(i=i.type)||4===i&&!0===n?"":""+n,r?t.setAttributeNS(r,e,n):t.setAttribute(e,n))))}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach((function(t){var e=t.replace(y,b);m[e]=new g(e,1,!1,t,null,!1,!1)})),"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach((function(t){var e=t.replace(y,b);m[e]=new g(e,1,!1,t,"http://www.w3.org/1999/xlink",!1,!1)})),["xml:base","xml:lang","xml:space"].forEach((function(t){var e=t.replace(y,b);m[e]=new g(e,1,!1,t,"http://www.w3.org/XML/1998/namespace",!1,!1)})),["tabIndex","crossOrigin"].forEach((function(t){m[t]=new g(t,1,!1,t.toLowerCase(),null,!1,!1)})),m.xlinkHref=new g("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1),["src","href","action","formAction"].forEach((function(t){m[t]=new g(t,1,!1,t.toLowerCase(),null,!0,!0)}));var _=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,w=Symbol.for("react.element"),x=Symbol.for("react.portal"),S=Symbol.for("react.fragment"),k=Symbol.for("react.strict_mode"),C=Symbol.for("react.profiler"),T=Symbol.for("react.provider"),E=Symbol.for("react.context"),P=Symbol.for("react.forward_ref"),I=Symbol.for("react.suspense"),A=Symbol.for("react.suspense_list"),M=Symbol.for("react.memo"),D=Symbol.for("react.lazy");Symbol.for("react.scope"),Symbol.for("react.debug_trace_mode");var F=Symbol.for("react.offscreen");Symbol.for("react.legacy_hidden"),Symbol.for("react.cache"),Symbol.for("react.tracing_marker");var R=Symbol.iterator;function B(t){return null===t||"object"!=typeof t?null:"function"==typeof(t=R&&t[R]||t["@@iterator"])?t:null}var L,N=Object.assign;function O(t){if(void 0===L)try{throw Error()}catch(t){var e=t.stack.trim().match(/\n( *(at )?)/);L=e&&e[1]||""}return"\n"+L+t}var z=!1;function U(t,e){if(!t||z)return"";z=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(e)if(e=function(){throw Error()},Object.defineProperty(e.prototype,"props",{set:function(){throw Error()}}),"object"==typeof Reflect&&Reflect.construct){try{Reflect.construct(e,[])}catch(t){var r=t}Reflect.construct(t,[],e)}else{try{e.call()}catch(t){r=t}t.call(e.prototype)}else{try{throw Error()}catch(t){r=t}t()}}catch(e){if(e&&r&&"string"==typeof e.stack){for(var i=e.stack.split("\n"),o=r.stack.split("\n"),a=i.length-1,s=o.length-1;1<=a&&0<=s&&i[a]!==o[s];)s--;for(;1<=a&&0<=s;a--,s--)if(i[a]!==o[s]){if(1!==a||1!==s)do{if(a--,0>--s||i[a]!==o[s]){var l="\n"+i[a].replace(" at new "," at ");return t.displayName&&l.includes("<anonymous>")&&(l=l.replace("<anonymous>",t.displayName)),l}}while(1<=a&&0<=s);break}}}finally{z=!1,Error.prepareStackTrace=n}return(t=t?t.displayName||t.name:"")?O(t):""}function j(t){switch(t.tag){case 5:return O(t.type);case 16:return O("Lazy");case 13:return O("Suspense");case 19:return O("SuspenseList");case 0:case 2:case 15:return U(t.type,!1);case 11:return U(t.type.render,!1);case 1:return U(t.type,!0);default:return""}}function V(t){if(null==t)return null;if("function"==typeof t)return t.displayName||t.name||null;if("string"==typeof t)return t;switch(t){case S:return"Fragment";case x:return"Portal";case C:return"Profiler";case k:return"StrictMode";case I:return"Suspense";case A:return"SuspenseList"}if("object"==typeof t)switch(t.$$typeof){case E:return(t.displayName||"Context")+".Consumer";case T:return(t._context.displayName||"Context")+".Provider";case P:var e=t.render;return(t=t.displayName)||(t=""!==(t=e.displayName||e.name||"")?"ForwardRef("+t+")":"ForwardRef"),t;case M:return null!==(e=t.displayName||null)?e:V(t.type)||"Memo";case D:e=t._payload,t=t._init;try{return V(t(e))}catch(t){}}return null}function $(t){var e=t.type;switch(t.tag){case 24:return"Cache";case 9:return(e.displayName||"Context")+".Consumer";case 10:return(e._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return t=(t=e.render).displayName||t.name||"",e.displayName||(""!==t?"ForwardRef("+t+")":"ForwardRef");case 7:return"Fragment";case 5:return e;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return V(e);case 8:return e===k?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if("function"==typeof e)return e.displayName||e.name||null;if("string"==typeof e)return e}return null}function W(t){switch(typeof t){case"boolean":case"number":case"string":case"undefined":case"object":return t;default:return""}}function G(t){var e=t.type;return(t=t.nodeName)&&"input"===t.toLowerCase()&&("checkbox"===e||"radio"===e)}function H(t){t._valueTracker||(t._valueTracker=function(t){var e=G(t)?"checked":"value",n=Object.getOwnPropertyDescriptor(t.constructor.prototype,e),r=""+t[e];if(!t.hasOwnProperty(e)&&void 0!==n&&"function"==typeof n.get&&"function"==typeof n.set){var i=n.get,o=n.set;return Object.defineProperty(t,e,{configurable:!0,get:function(){return i.call(this)},set:function(t){r=""+t,o.call(this,t)}}),Object.defineProperty(t,e,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(t){r=""+t},stopTracking:function(){t._valueTracker=null,delete t[e]}}}}(t))}function Y(t){if(!t)return!1;var e=t._valueTracker;if(!e)return!0;var n=e.getValue(),r="";return t&&(r=G(t)?t.checked?"true":"false":t.value),(t=r)!==n&&(e.setValue(t),!0)}function q(t){if(void 0===(t=t||("undefined"!=typeof document?document:void 0)))return null;try{return t.activeElement||t.body}catch(e){return t.body}}function K(t,e){var n=e.checked;return N({},e,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:null!=n?n:t._wrapperState.initialChecked})}function X(t,e){var n=null==e.defaultValue?"":e.defaultValue,r=null!=e.checked?e.checked:e.defaultChecked;n=W(null!=e.value?e.value:n),t._wrapperState={initialChecked:r,initialValue:n,controlled:"checkbox"===e.type||"radio"===e.type?null!=e.checked:null!=e.value}}function Q(t,e){null!=(e=e.checked)&&v(t,"checked",e,!1)}function Z(t,e){Q(t,e);var n=W(e.value),r=e.type;if(null!=n)"number"===r?(0===n&&""===t.value||t.value!=n)&&(t.value=""+n):t.value!==""+n&&(t.value=""+n);else if("submit"===r||"reset"===r)return void t.removeAttribute("value");e.hasOwnProperty("value")?tt(t,e.type,n):e.hasOwnProperty("defaultValue")&&tt(t,e.type,W(e.defaultValue)),null==e.checked&&null!=e.defaultChecked&&(t.defaultChecked=!!e.defaultChecked)}function J(t,e,n){if(e.hasOwnProperty("value")||e.hasOwnProperty("defaultValue")){var r=e.type;if(!("submit"!==r&&"reset"!==r||void 0!==e.value&&null!==e.value))return;e=""+t._wrapperState.initialValue,n||e===t.value||(t.value=e),t.defaultValue=e}""!==(n=t.name)&&(t.name=""),t.defaultChecked=!!t._wrapperState.initialChecked,""!==n&&(t.name=n)}function tt(t,e,n){"number"===e&&q(t.ownerDocument)===t||(null==n?t.defaultValue=""+t._wrapperState.initialValue:t.defaultValue!==""+n&&(t.defaultValue=""+n))}var et=Array.isArray;function nt(t,e,n,r){if(t=t.options,e){e={};for(var i=0;i<n.length;i++)e["$"+n[i]]=!0;for(n=0;n<t.length;n++)i=e.hasOwnProperty("$"+t[n].value),t[n].selected!==i&&(t[n].selected=i),i&&r&&(t[n].defaultSelected=!0)}else{for(n=""+W(n),e=null,i=0;i<t.length;i++){if(t[i].value===n)return t[i].selected=!0,void(r&&(t[i].defaultSelected=!0));null!==e||t[i].disabled||(e=t[i])}null!==e&&(e.selected=!0)}}function rt(t,e){if(null!=e.dangerouslySetInnerHTML)throw Error(o(91));return N({},e,{value:void 0,defaultValue:void 0,children:""+t._wrapperState.initialValue})}function it(t,e){var n=e.value;if(null==n){if(n=e.children,e=e.defaultValue,null!=n){if(null!=e)throw Error(o(92));if(et(n)){if(1<n.length)throw Error(o(93));n=n[0]}e=n}null==e&&(e=""),n=e}t._wrapperState={initialValue:W(n)}}function ot(t,e){var n=W(e.value),r=W(e.defaultValue);null!=n&&((n=""+n)!==t.value&&(t.value=n),null==e.defaultValue&&t.defaultValue!==n&&(t.defaultValue=n)),null!=r&&(t.defaultValue=""+r)}function at(t){var e=t.textContent;e===t._wrapperState.initialValue&&""!==e&&null!==e&&(t.value=e)}function st(t){switch(t){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function lt(t,e){return null==t||"http://www.w3.org/1999/xhtml"===t?st(e):"http://www.w3.org/2000/svg"===t&&"foreignObject"===e?"http://www.w3.org/1999/xhtml":t}var ct,ut,dt=(ut=function(t,e){if("http://www.w3.org/2000/svg"!==t.namespaceURI||"innerHTML"in t)t.innerHTML=e;else{for((ct=ct||document.createElement("div")).innerHTML="<svg>"+e.valueOf().toString()+"</svg>",e=ct.firstChild;t.firstChild;)t.removeChild(t.firstChild);for(;e.firstChild;)t.appendChild(e.firstChild)}},"undefined"!=typeof MSApp&&MSApp.execUnsafeLocalFunction?function(t,e,n,r){MSApp.execUnsafeLocalFunction((function(){return ut(t,e)}))}:ut);function ht(t,e){if(e){var n=t.firstChild;if(n&&n===t.lastChild&&3===n.nodeType)return void(n.nodeValue=e)}t.textContent=e}var ft={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},pt=["Webkit","ms","Moz","O"];function gt(t,e,n){return null==e||"boolean"==typeof e||""===e?"":n||"number"!=typeof e||0===e||ft.hasOwnProperty(t)&&ft[t]?(""+e).trim():e+"px"}function mt(t,e){for(var n in t=t.style,e)if(e.hasOwnProperty(n)){var r=0===n.indexOf("--"),i=gt(n,e[n],r);"float"===n&&(n="cssFloat"),r?t.setProperty(n,i):t[n]=i}}Object.keys(ft).forEach((function(t){pt.forEach((function(e){e=e+t.charAt(0).toUpperCase()+t.substring(1),ft[e]=ft[t]}))}));var yt=N({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function bt(t,e){if(e){if(yt[t]&&(null!=e.children||null!=e.dangerouslySetInnerHTML))throw Error(o(137,t));if(null!=e.dangerouslySetInnerHTML){if(null!=e.children)throw Error(o(60));if("object"!=typeof e.dangerouslySetInnerHTML||!("__html"in e.dangerouslySetInnerHTML))throw Error(o(61))}if(null!=e.style&&"object"!=typeof e.style)throw Error(o(62))}}function vt(t,e){if(-1===t.indexOf("-"))return"string"==typeof e.is;switch(t){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var _t=null;function wt(t){return(t=t.target||t.srcElement||window).correspondingUseElement&&(t=t.correspondingUseElement),3===t.nodeType?t.parentNode:t}var xt=null,St=null,kt=null;function Ct(t){if(t=vi(t)){if("function"!=typeof xt)throw Error(o(280));var e=t.stateNode;e&&(e=wi(e),xt(t.stateNode,t.type,e))}}function Tt(t){St?kt?kt.push(t):kt=[t]:St=t}function Et(){if(St){var t=St,e=kt;if(kt=St=null,Ct(t),e)for(t=0;t<e.length;t++)Ct(e[t])}}function Pt(t,e){return t(e)}function It(){}var At=!1;function Mt(t,e,n){if(At)return t(e,n);At=!0;try{return Pt(t,e,n)}finally{At=!1,(null!==St||null!==kt)&&(It(),Et())}}function Dt(t,e){var n=t.stateNode;if(null===n)return null;var r=wi(n);if(null===r)return null;n=r[e];t:switch(e){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(t=t.type)||"input"===t||"select"===t||"textarea"===t)),t=!r;break t;default:t=!1}if(t)return null;if(n&&"function"!=typeof n)throw Error(o(231,e,typeof n));return n}var Ft=!1;if(u)try{var Rt={};Object.defineProperty(Rt,"passive",{get:function(){Ft=!0}}),window.addEventListener("test",Rt,Rt),window.removeEventListener("test",Rt,Rt)}catch(ut){Ft=!1}function Bt(t,e,n,r,i,o,a,s,l){var c=Array.prototype.slice.call(arguments,3);try{e.apply(n,c)}catch(t){this.onError(t)}}var Lt=!1,Nt=null,Ot=!1,zt=null,Ut={onError:function(t){Lt=!0,Nt=t}};function jt(t,e,n,r,i,o,a,s,l){Lt=!1,Nt=null,Bt.apply(Ut,arguments)}function Vt(t){var e=t,n=t;if(t.alternate)for(;e.return;)e=e.return;else{t=e;do{!!(4098&(e=t).flags)&&(n=e.return),t=e.return}while(t)}return 3===e.tag?n:null}function $t(t){if(13===t.tag){var e=t.memoizedState;if(null===e&&null!==(t=t.alternate)&&(e=t.memoizedState),null!==e)return e.dehydrated}return null}function Wt(t){if(Vt(t)!==t)throw Error(o(188))}function Gt(t){return null!==(t=function(t){var e=t.alternate;if(!e){if(null===(e=Vt(t)))throw Error(o(188));return e!==t?null:t}for(var n=t,r=e;;){var i=n.return;if(null===i)break;var a=i.alternate;if(null===a){if(null!==(r=i.return)){n=r;continue}break}if(i.child===a.child){for(a=i.child;a;){if(a===n)return Wt(i),t;if(a===r)return Wt(i),e;a=a.sibling}throw Error(o(188))}if(n.return!==r.return)n=i,r=a;else{for(var s=!1,l=i.child;l;){if(l===n){s=!0,n=i,r=a;break}if(l===r){s=!0,r=i,n=a;break}l=l.sibling}if(!s){for(l=a.child;l;){if(l===n){s=!0,n=a,r=i;break}if(l===r){s=!0,r=a,n=i;break}l=l.sibling}if(!s)throw Error(o(189))}}if(n.alternate!==r)throw Error(o(190))}if(3!==n.tag)throw Error(o(188));return n.stateNode.current===n?t:e}(t))?Ht(t):null}function Ht(t){if(5===t.tag||6===t.tag)return t;for(t=t.child;null!==t;){var e=Ht(t);if(null!==e)return e;t=t.sibling}return null}var Yt=i.unstable_scheduleCallback,qt=i.unstable_cancelCallback,Kt=i.unstable_shouldYield,Xt=i.unstable_requestPaint,Qt=i.unstable_now,Zt=i.unstable_getCurrentPriorityLevel,Jt=i.unstable_ImmediatePriority,te=i.unstable_UserBlockingPriority,ee=i.unstable_NormalPriority,ne=i.unstable_LowPriority,re=i.unstable_IdlePriority,ie=null,oe=null,ae=Math.clz32?Math.clz32:function(t){return 0===(t>>>=0)?32:31-(se(t)/le|0)|0},se=Math.log,le=Math.LN2,ce=64,ue=4194304;function de(t){switch(t&-t){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return 4194240&t;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return 130023424&t;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return t}}function he(t,e){var n=t.pendingLanes;if(0===n)return 0;var r=0,i=t.suspendedLanes,o=t.pingedLanes,a=268435455&n;if(0!==a){var s=a&~i;0!==s?r=de(s):0!=(o&=a)&&(r=de(o))}else 0!=(a=n&~i)?r=de(a):0!==o&&(r=de(o));if(0===r)return 0;if(0!==e&&e!==r&&!(e&i)&&((i=r&-r)>=(o=e&-e)||16===i&&4194240&o))return e;if(4&r&&(r|=16&n),0!==(e=t.entangledLanes))for(t=t.entanglements,e&=r;0<e;)i=1<<(n=31-ae(e)),r|=t[n],e&=~i;return r}function fe(t,e){switch(t){case 1:case 2:case 4:return e+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e+5e3;default:return-1}}function pe(t){return 0!=(t=-1073741825&t.pendingLanes)?t:1073741824&t?1073741824:0}function ge(){var t=ce;return!(4194240&(ce<<=1))&&(ce=64),t}function me(t){for(var e=[],n=0;31>n;n++)e.push(t);return e}function ye(t,e,n){t.pendingLanes|=e,536870912!==e&&(t.suspendedLanes=0,t.pingedLanes=0),(t=t.eventTimes)[e=31-ae(e)]=n}function be(t,e){var n=t.entangledLanes|=e;for(t=t.entanglements;n;){var r=31-ae(n),i=1<<r;i&e|t[r]&e&&(t[r]|=e),n&=~i}}var ve=0;function _e(t){return 1<(t&=-t)?4<t?268435455&t?16:536870912:4:1}var we,xe,Se,ke,Ce,Te=!1,Ee=[],Pe=null,Ie=null,Ae=null,Me=new Map,De=new Map,Fe=[],Re="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function Be(t,e){switch(t){case"focusin":case"focusout":Pe=null;break;case"dragenter":case"dragleave":Ie=null;break;case"mouseover":case"mouseout":Ae=null;break;case"pointerover":case"pointerout":Me.delete(e.pointerId);break;case"gotpointercapture":case"lostpointercapture":De.delete(e.pointerId)}}function Le(t,e,n,r,i,o){return null===t||t.nativeEvent!==o?(t={blockedOn:e,domEventName:n,eventSystemFlags:r,nativeEvent:o,targetContainers:[i]},null!==e&&null!==(e=vi(e))&&xe(e),t):(t.eventSystemFlags|=r,e=t.targetContainers,null!==i&&-1===e.indexOf(i)&&e.push(i),t)}function Ne(t){var e=bi(t.target);if(null!==e){var n=Vt(e);if(null!==n)if(13===(e=n.tag)){if(null!==(e=$t(n)))return t.blockedOn=e,void Ce(t.priority,(function(){Se(n)}))}else if(3===e&&n.stateNode.current.memoizedState.isDehydrated)return void(t.blockedOn=3===n.tag?n.stateNode.containerInfo:null)}t.blockedOn=null}function Oe(t){if(null!==t.blockedOn)return!1;for(var e=t.targetContainers;0<e.length;){var n=Ke(t.domEventName,t.eventSystemFlags,e[0],t.nativeEvent);if(null!==n)return null!==(e=vi(n))&&xe(e),t.blockedOn=n,!1;var r=new(n=t.nativeEvent).constructor(n.type,n);_t=r,n.target.dispatchEvent(r),_t=null,e.shift()}return!0}function ze(t,e,n){Oe(t)&&n.delete(e)}function Ue(){Te=!1,null!==Pe&&Oe(Pe)&&(Pe=null),null!==Ie&&Oe(Ie)&&(Ie=null),null!==Ae&&Oe(Ae)&&(Ae=null),Me.forEach(ze),De.forEach(ze)}function je(t,e){t.blockedOn===e&&(t.blockedOn=null,Te||(Te=!0,i.unstable_scheduleCallback(i.unstable_NormalPriority,Ue)))}function Ve(t){function e(e){return je(e,t)}if(0<Ee.length){je(Ee[0],t);for(var n=1;n<Ee.length;n++){var r=Ee[n];r.blockedOn===t&&(r.blockedOn=null)}}for(null!==Pe&&je(Pe,t),null!==Ie&&je(Ie,t),null!==Ae&&je(Ae,t),Me.forEach(e),De.forEach(e),n=0;n<Fe.length;n++)(r=Fe[n]).blockedOn===t&&(r.blockedOn=null);for(;0<Fe.length&&null===(n=Fe[0]).blockedOn;)Ne(n),null===n.blockedOn&&Fe.shift()}var $e=_.ReactCurrentBatchConfig,We=!0;function Ge(t,e,n,r){var i=ve,o=$e.transition;$e.transition=null;try{ve=1,Ye(t,e,n,r)}finally{ve=i,$e.transition=o}}function He(t,e,n,r){var i=ve,o=$e.transition;$e.transition=null;try{ve=4,Ye(t,e,n,r)}finally{ve=i,$e.transition=o}}function Ye(t,e,n,r){if(We){var i=Ke(t,e,n,r);if(null===i)Wr(t,e,r,qe,n),Be(t,r);else if(function(t,e,n,r,i){switch(e){case"focusin":return Pe=Le(Pe,t,e,n,r,i),!0;case"dragenter":return Ie=Le(Ie,t,e,n,r,i),!0;case"mouseover":return Ae=Le(Ae,t,e,n,r,i),!0;case"pointerover":var o=i.pointerId;return Me.set(o,Le(Me.get(o)||null,t,e,n,r,i)),!0;case"gotpointercapture":return o=i.pointerId,De.set(o,Le(De.get(o)||null,t,e,n,r,i)),!0}return!1}(i,t,e,n,r))r.stopPropagation();else if(Be(t,r),4&e&&-1<Re.indexOf(t)){for(;null!==i;){var o=vi(i);if(null!==o&&we(o),null===(o=Ke(t,e,n,r))&&Wr(t,e,r,qe,n),o===i)break;i=o}null!==i&&r.stopPropagation()}else Wr(t,e,r,null,n)}}var qe=null;function Ke(t,e,n,r){if(qe=null,null!==(t=bi(t=wt(r))))if(null===(e=Vt(t)))t=null;else if(13===(n=e.tag)){if(null!==(t=$t(e)))return t;t=null}else if(3===n){if(e.stateNode.current.memoizedState.isDehydrated)return 3===e.tag?e.stateNode.containerInfo:null;t=null}else e!==t&&(t=null);return qe=t,null}function Xe(t){switch(t){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(Zt()){case Jt:return 1;case te:return 4;case ee:case ne:return 16;case re:return 536870912;default:return 16}default:return 16}}var Qe=null,Ze=null,Je=null;function tn(){if(Je)return Je;var t,e,n=Ze,r=n.length,i="value"in Qe?Qe.value:Qe.textContent,o=i.length;for(t=0;t<r&&n[t]===i[t];t++);var a=r-t;for(e=1;e<=a&&n[r-e]===i[o-e];e++);return Je=i.slice(t,1<e?1-e:void 0)}function en(t){var e=t.keyCode;return"charCode"in t?0===(t=t.charCode)&&13===e&&(t=13):t=e,10===t&&(t=13),32<=t||13===t?t:0}function nn(){return!0}function rn(){return!1}function on(t){function e(e,n,r,i,o){for(var a in this._reactName=e,this._targetInst=r,this.type=n,this.nativeEvent=i,this.target=o,this.currentTarget=null,t)t.hasOwnProperty(a)&&(e=t[a],this[a]=e?e(i):i[a]);return this.isDefaultPrevented=(null!=i.defaultPrevented?i.defaultPrevented:!1===i.returnValue)?nn:rn,this.isPropagationStopped=rn,this}return N(e.prototype,{preventDefault:function(){this.defaultPrevented=!0;var t=this.nativeEvent;t&&(t.preventDefault?t.preventDefault():"unknown"!=typeof t.returnValue&&(t.returnValue=!1),this.isDefaultPrevented=nn)},stopPropagation:function(){var t=this.nativeEvent;t&&(t.stopPropagation?t.stopPropagation():"unknown"!=typeof t.cancelBubble&&(t.cancelBubble=!0),this.isPropagationStopped=nn)},persist:function(){},isPersistent:nn}),e}var an,sn,ln,cn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(t){return t.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},un=on(cn),dn=N({},cn,{view:0,detail:0}),hn=on(dn),fn=N({},dn,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:Cn,button:0,buttons:0,relatedTarget:function(t){return void 0===t.relatedTarget?t.fromElement===t.srcElement?t.toElement:t.fromElement:t.relatedTarget},movementX:function(t){return"movementX"in t?t.movementX:(t!==ln&&(ln&&"mousemove"===t.type?(an=t.screenX-ln.screenX,sn=t.screenY-ln.screenY):sn=an=0,ln=t),an)},movementY:function(t){return"movementY"in t?t.movementY:sn}}),pn=on(fn),gn=on(N({},fn,{dataTransfer:0})),mn=on(N({},dn,{relatedTarget:0})),yn=on(N({},cn,{animationName:0,elapsedTime:0,pseudoElement:0})),bn=N({},cn,{clipboardData:function(t){return"clipboardData"in t?t.clipboardData:window.clipboardData}}),vn=on(bn),_n=on(N({},cn,{data:0})),wn={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},xn={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},Sn={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function kn(t){var e=this.nativeEvent;return e.getModifierState?e.getModifierState(t):!!(t=Sn[t])&&!!e[t]}function Cn(){return kn}var Tn=N({},dn,{key:function(t){if(t.key){var e=wn[t.key]||t.key;if("Unidentified"!==e)return e}return"keypress"===t.type?13===(t=en(t))?"Enter":String.fromCharCode(t):"keydown"===t.type||"keyup"===t.type?xn[t.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:Cn,charCode:function(t){return"keypress"===t.type?en(t):0},keyCode:function(t){return"keydown"===t.type||"keyup"===t.type?t.keyCode:0},which:function(t){return"keypress"===t.type?en(t):"keydown"===t.type||"keyup"===t.type?t.keyCode:0}}),En=on(Tn),Pn=on(N({},fn,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),In=on(N({},dn,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:Cn})),An=on(N({},cn,{propertyName:0,elapsedTime:0,pseudoElement:0})),Mn=N({},fn,{deltaX:function(t){return"deltaX"in t?t.deltaX:"wheelDeltaX"in t?-t.wheelDeltaX:0},deltaY:function(t){return"deltaY"in t?t.deltaY:"wheelDeltaY"in t?-t.wheelDeltaY:"wheelDelta"in t?-t.wheelDelta:0},deltaZ:0,deltaMode:0}),Dn=on(Mn),Fn=[9,13,27,32],Rn=u&&"CompositionEvent"in window,Bn=null;u&&"documentMode"in document&&(Bn=document.documentMode);var Ln=u&&"TextEvent"in window&&!Bn,Nn=u&&(!Rn||Bn&&8<Bn&&11>=Bn),On=String.fromCharCode(32),zn=!1;function Un(t,e){switch(t){case"keyup":return-1!==Fn.indexOf(e.keyCode);case"keydown":return 229!==e.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function jn(t){return"object"==typeof(t=t.detail)&&"data"in t?t.data:null}var Vn=!1,$n={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Wn(t){var e=t&&t.nodeName&&t.nodeName.toLowerCase();return"input"===e?!!$n[t.type]:"textarea"===e}function Gn(t,e,n,r){Tt(r),0<(e=Hr(e,"onChange")).length&&(n=new un("onChange","change",null,n,r),t.push({event:n,listeners:e}))}var Hn=null,Yn=null;function qn(t){Or(t,0)}function Kn(t){if(Y(_i(t)))return t}function Xn(t,e){if("change"===t)return e}var Qn=!1;if(u){var Zn;if(u){var Jn="oninput"in document;if(!Jn){var tr=document.createElement("div");tr.setAttribute("oninput","return;"),Jn="function"==typeof tr.oninput}Zn=Jn}else Zn=!1;Qn=Zn&&(!document.documentMode||9<document.documentMode)}function er(){Hn&&(Hn.detachEvent("onpropertychange",nr),Yn=Hn=null)}function nr(t){if("value"===t.propertyName&&Kn(Yn)){var e=[];Gn(e,Yn,t,wt(t)),Mt(qn,e)}}function rr(t,e,n){"focusin"===t?(er(),Yn=n,(Hn=e).attachEvent("onpropertychange",nr)):"focusout"===t&&er()}function ir(t){if("selectionchange"===t||"keyup"===t||"keydown"===t)return Kn(Yn)}function or(t,e){if("click"===t)return Kn(e)}function ar(t,e){if("input"===t||"change"===t)return Kn(e)}var sr="function"==typeof Object.is?Object.is:function(t,e){return t===e&&(0!==t||1/t==1/e)||t!=t&&e!=e};function lr(t,e){if(sr(t,e))return!0;if("object"!=typeof t||null===t||"object"!=typeof e||null===e)return!1;var n=Object.keys(t),r=Object.keys(e);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var i=n[r];if(!d.call(e,i)||!sr(t[i],e[i]))return!1}return!0}function cr(t){for(;t&&t.firstChild;)t=t.firstChild;return t}function ur(t,e){var n,r=cr(t);for(t=0;r;){if(3===r.nodeType){if(n=t+r.textContent.length,t<=e&&n>=e)return{node:r,offset:e-t};t=n}t:{for(;r;){if(r.nextSibling){r=r.nextSibling;break t}r=r.parentNode}r=void 0}r=cr(r)}}function dr(t,e){return!(!t||!e)&&(t===e||(!t||3!==t.nodeType)&&(e&&3===e.nodeType?dr(t,e.parentNode):"contains"in t?t.contains(e):!!t.compareDocumentPosition&&!!(16&t.compareDocumentPosition(e))))}function hr(){for(var t=window,e=q();e instanceof t.HTMLIFrameElement;){try{var n="string"==typeof e.contentWindow.location.href}catch(t){n=!1}if(!n)break;e=q((t=e.contentWindow).document)}return e}function fr(t){var e=t&&t.nodeName&&t.nodeName.toLowerCase();return e&&("input"===e&&("text"===t.type||"search"===t.type||"tel"===t.type||"url"===t.type||"password"===t.type)||"textarea"===e||"true"===t.contentEditable)}function pr(t){var e=hr(),n=t.focusedElem,r=t.selectionRange;if(e!==n&&n&&n.ownerDocument&&dr(n.ownerDocument.documentElement,n)){if(null!==r&&fr(n))if(e=r.start,void 0===(t=r.end)&&(t=e),"selectionStart"in n)n.selectionStart=e,n.selectionEnd=Math.min(t,n.value.length);else if((t=(e=n.ownerDocument||document)&&e.defaultView||window).getSelection){t=t.getSelection();var i=n.textContent.length,o=Math.min(r.start,i);r=void 0===r.end?o:Math.min(r.end,i),!t.extend&&o>r&&(i=r,r=o,o=i),i=ur(n,o);var a=ur(n,r);i&&a&&(1!==t.rangeCount||t.anchorNode!==i.node||t.anchorOffset!==i.offset||t.focusNode!==a.node||t.focusOffset!==a.offset)&&((e=e.createRange()).setStart(i.node,i.offset),t.removeAllRanges(),o>r?(t.addRange(e),t.extend(a.node,a.offset)):(e.setEnd(a.node,a.offset),t.addRange(e)))}for(e=[],t=n;t=t.parentNode;)1===t.nodeType&&e.push({element:t,left:t.scrollLeft,top:t.scrollTop});for("function"==typeof n.focus&&n.focus(),n=0;n<e.length;n++)(t=e[n]).element.scrollLeft=t.left,t.element.scrollTop=t.top}}var gr=u&&"documentMode"in document&&11>=document.documentMode,mr=null,yr=null,br=null,vr=!1;function _r(t,e,n){var r=n.window===n?n.document:9===n.nodeType?n:n.ownerDocument;vr||null==mr||mr!==q(r)||(r="selectionStart"in(r=mr)&&fr(r)?{start:r.selectionStart,end:r.selectionEnd}:{anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},br&&lr(br,r)||(br=r,0<(r=Hr(yr,"onSelect")).length&&(e=new un("onSelect","select",null,e,n),t.push({event:e,listeners:r}),e.target=mr)))}function wr(t,e){var n={};return n[t.toLowerCase()]=e.toLowerCase(),n["Webkit"+t]="webkit"+e,n["Moz"+t]="moz"+e,n}var xr={animationend:wr("Animation","AnimationEnd"),animationiteration:wr("Animation","AnimationIteration"),animationstart:wr("Animation","AnimationStart"),transitionend:wr("Transition","TransitionEnd")},Sr={},kr={};function Cr(t){if(Sr[t])return Sr[t];if(!xr[t])return t;var e,n=xr[t];for(e in n)if(n.hasOwnProperty(e)&&e in kr)return Sr[t]=n[e];return t}u&&(kr=document.createElement("div").style,"AnimationEvent"in window||(delete xr.animationend.animation,delete xr.animationiteration.animation,delete xr.animationstart.animation),"TransitionEvent"in window||delete xr.transitionend.transition);var Tr=Cr("animationend"),Er=Cr("animationiteration"),Pr=Cr("animationstart"),Ir=Cr("transitionend"),Ar=new Map,Mr="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Dr(t,e){Ar.set(t,e),l(e,[t])}for(var Fr=0;Fr<Mr.length;Fr++){var Rr=Mr[Fr];Dr(Rr.toLowerCase(),"on"+(Rr[0].toUpperCase()+Rr.slice(1)))}Dr(Tr,"onAnimationEnd"),Dr(Er,"onAnimationIteration"),Dr(Pr,"onAnimationStart"),Dr("dblclick","onDoubleClick"),Dr("focusin","onFocus"),Dr("focusout","onBlur"),Dr(Ir,"onTransitionEnd"),c("onMouseEnter",["mouseout","mouseover"]),c("onMouseLeave",["mouseout","mouseover"]),c("onPointerEnter",["pointerout","pointerover"]),c("onPointerLeave",["pointerout","pointerover"]),l("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),l("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),l("onBeforeInput",["compositionend","keypress","textInput","paste"]),l("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),l("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),l("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Br="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Lr=new Set("cancel close invalid load scroll toggle".split(" ").concat(Br));function Nr(t,e,n){var r=t.type||"unknown-event";t.currentTarget=n,function(t,e,n,r,i,a,s,l,c){if(jt.apply(this,arguments),Lt){if(!Lt)throw Error(o(198));var u=Nt;Lt=!1,Nt=null,Ot||(Ot=!0,zt=u)}}(r,e,void 0,t),t.currentTarget=null}function Or(t,e){e=!!(4&e);for(var n=0;n<t.length;n++){var r=t[n],i=r.event;r=r.listeners;t:{var o=void 0;if(e)for(var a=r.length-1;0<=a;a--){var s=r[a],l=s.instance,c=s.currentTarget;if(s=s.listener,l!==o&&i.isPropagationStopped())break t;Nr(i,s,c),o=l}else for(a=0;a<r.length;a++){if(l=(s=r[a]).instance,c=s.currentTarget,s=s.listener,l!==o&&i.isPropagationStopped())break t;Nr(i,s,c),o=l}}}if(Ot)throw t=zt,Ot=!1,zt=null,t}function zr(t,e){var n=e[gi];void 0===n&&(n=e[gi]=new Set);var r=t+"__bubble";n.has(r)||($r(e,t,2,!1),n.add(r))}function Ur(t,e,n){var r=0;e&&(r|=4),$r(n,t,r,e)}var jr="_reactListening"+Math.random().toString(36).slice(2);function Vr(t){if(!t[jr]){t[jr]=!0,a.forEach((function(e){"selectionchange"!==e&&(Lr.has(e)||Ur(e,!1,t),Ur(e,!0,t))}));var e=9===t.nodeType?t:t.ownerDocument;null===e||e[jr]||(e[jr]=!0,Ur("selectionchange",!1,e))}}function $r(t,e,n,r){switch(Xe(e)){case 1:var i=Ge;break;case 4:i=He;break;default:i=Ye}n=i.bind(null,e,n,t),i=void 0,!Ft||"touchstart"!==e&&"touchmove"!==e&&"wheel"!==e||(i=!0),r?void 0!==i?t.addEventListener(e,n,{capture:!0,passive:i}):t.addEventListener(e,n,!0):void 0!==i?t.addEventListener(e,n,{passive:i}):t.addEventListener(e,n,!1)}function Wr(t,e,n,r,i){var o=r;if(!(1&e||2&e||null===r))t:for(;;){if(null===r)return;var a=r.tag;if(3===a||4===a){var s=r.stateNode.containerInfo;if(s===i||8===s.nodeType&&s.parentNode===i)break;if(4===a)for(a=r.return;null!==a;){var l=a.tag;if((3===l||4===l)&&((l=a.stateNode.containerInfo)===i||8===l.nodeType&&l.parentNode===i))return;a=a.return}for(;null!==s;){if(null===(a=bi(s)))return;if(5===(l=a.tag)||6===l){r=o=a;continue t}s=s.parentNode}}r=r.return}Mt((function(){var r=o,i=wt(n),a=[];t:{var s=Ar.get(t);if(void 0!==s){var l=un,c=t;switch(t){case"keypress":if(0===en(n))break t;case"keydown":case"keyup":l=En;break;case"focusin":c="focus",l=mn;break;case"focusout":c="blur",l=mn;break;case"beforeblur":case"afterblur":l=mn;break;case"click":if(2===n.button)break t;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":l=pn;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":l=gn;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":l=In;break;case Tr:case Er:case Pr:l=yn;break;case Ir:l=An;break;case"scroll":l=hn;break;case"wheel":l=Dn;break;case"copy":case"cut":case"paste":l=vn;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":l=Pn}var u=!!(4&e),d=!u&&"scroll"===t,h=u?null!==s?s+"Capture":null:s;u=[];for(var f,p=r;null!==p;){var g=(f=p).stateNode;if(5===f.tag&&null!==g&&(f=g,null!==h&&null!=(g=Dt(p,h))&&u.push(Gr(p,g,f))),d)break;p=p.return}0<u.length&&(s=new l(s,c,null,n,i),a.push({event:s,listeners:u}))}}if(!(7&e)){if(l="mouseout"===t||"pointerout"===t,(!(s="mouseover"===t||"pointerover"===t)||n===_t||!(c=n.relatedTarget||n.fromElement)||!bi(c)&&!c[pi])&&(l||s)&&(s=i.window===i?i:(s=i.ownerDocument)?s.defaultView||s.parentWindow:window,l?(l=r,null!==(c=(c=n.relatedTarget||n.toElement)?bi(c):null)&&(c!==(d=Vt(c))||5!==c.tag&&6!==c.tag)&&(c=null)):(l=null,c=r),l!==c)){if(u=pn,g="onMouseLeave",h="onMouseEnter",p="mouse","pointerout"!==t&&"pointerover"!==t||(u=Pn,g="onPointerLeave",h="onPointerEnter",p="pointer"),d=null==l?s:_i(l),f=null==c?s:_i(c),(s=new u(g,p+"leave",l,n,i)).target=d,s.relatedTarget=f,g=null,bi(i)===r&&((u=new u(h,p+"enter",c,n,i)).target=f,u.relatedTarget=d,g=u),d=g,l&&c)t:{for(h=c,p=0,f=u=l;f;f=Yr(f))p++;for(f=0,g=h;g;g=Yr(g))f++;for(;0<p-f;)u=Yr(u),p--;for(;0<f-p;)h=Yr(h),f--;for(;p--;){if(u===h||null!==h&&u===h.alternate)break t;u=Yr(u),h=Yr(h)}u=null}else u=null;null!==l&&qr(a,s,l,u,!1),null!==c&&null!==d&&qr(a,d,c,u,!0)}if("select"===(l=(s=r?_i(r):window).nodeName&&s.nodeName.toLowerCase())||"input"===l&&"file"===s.type)var m=Xn;else if(Wn(s))if(Qn)m=ar;else{m=ir;var y=rr}else(l=s.nodeName)&&"input"===l.toLowerCase()&&("checkbox"===s.type||"radio"===s.type)&&(m=or);switch(m&&(m=m(t,r))?Gn(a,m,n,i):(y&&y(t,s,r),"focusout"===t&&(y=s._wrapperState)&&y.controlled&&"number"===s.type&&tt(s,"number",s.value)),y=r?_i(r):window,t){case"focusin":(Wn(y)||"true"===y.contentEditable)&&(mr=y,yr=r,br=null);break;case"focusout":br=yr=mr=null;break;case"mousedown":vr=!0;break;case"contextmenu":case"mouseup":case"dragend":vr=!1,_r(a,n,i);break;case"selectionchange":if(gr)break;case"keydown":case"keyup":_r(a,n,i)}var b;if(Rn)t:{switch(t){case"compositionstart":var v="onCompositionStart";break t;case"compositionend":v="onCompositionEnd";break t;case"compositionupdate":v="onCompositionUpdate";break t}v=void 0}else Vn?Un(t,n)&&(v="onCompositionEnd"):"keydown"===t&&229===n.keyCode&&(v="onCompositionStart");v&&(Nn&&"ko"!==n.locale&&(Vn||"onCompositionStart"!==v?"onCompositionEnd"===v&&Vn&&(b=tn()):(Ze="value"in(Qe=i)?Qe.value:Qe.textContent,Vn=!0)),0<(y=Hr(r,v)).length&&(v=new _n(v,t,null,n,i),a.push({event:v,listeners:y}),(b||null!==(b=jn(n)))&&(v.data=b))),(b=Ln?function(t,e){switch(t){case"compositionend":return jn(e);case"keypress":return 32!==e.which?null:(zn=!0,On);case"textInput":return(t=e.data)===On&&zn?null:t;default:return null}}(t,n):function(t,e){if(Vn)return"compositionend"===t||!Rn&&Un(t,e)?(t=tn(),Je=Ze=Qe=null,Vn=!1,t):null;switch(t){case"paste":default:return null;case"keypress":if(!(e.ctrlKey||e.altKey||e.metaKey)||e.ctrlKey&&e.altKey){if(e.char&&1<e.char.length)return e.char;if(e.which)return String.fromCharCode(e.which)}return null;case"compositionend":return Nn&&"ko"!==e.locale?null:e.data}}(t,n))&&0<(r=Hr(r,"onBeforeInput")).length&&(i=new _n("onBeforeInput","beforeinput",null,n,i),a.push({event:i,listeners:r}),i.data=b)}Or(a,e)}))}function Gr(t,e,n){return{instance:t,listener:e,currentTarget:n}}function Hr(t,e){for(var n=e+"Capture",r=[];null!==t;){var i=t,o=i.stateNode;5===i.tag&&null!==o&&(i=o,null!=(o=Dt(t,n))&&r.unshift(Gr(t,o,i)),null!=(o=Dt(t,e))&&r.push(Gr(t,o,i))),t=t.return}return r}function Yr(t){if(null===t)return null;do{t=t.return}while(t&&5!==t.tag);return t||null}function qr(t,e,n,r,i){for(var o=e._reactName,a=[];null!==n&&n!==r;){var s=n,l=s.alternate,c=s.stateNode;if(null!==l&&l===r)break;5===s.tag&&null!==c&&(s=c,i?null!=(l=Dt(n,o))&&a.unshift(Gr(n,l,s)):i||null!=(l=Dt(n,o))&&a.push(Gr(n,l,s))),n=n.return}0!==a.length&&t.push({event:e,listeners:a})}var Kr=/\r\n?/g,Xr=/\u0000|\uFFFD/g;function Qr(t){return("string"==typeof t?t:""+t).replace(Kr,"\n").replace(Xr,"")}function Zr(t,e,n){if(e=Qr(e),Qr(t)!==e&&n)throw Error(o(425))}function Jr(){}var ti=null,ei=null;function ni(t,e){return"textarea"===t||"noscript"===t||"string"==typeof e.children||"number"==typeof e.children||"object"==typeof e.dangerouslySetInnerHTML&&null!==e.dangerouslySetInnerHTML&&null!=e.dangerouslySetInnerHTML.__html}var ri="function"==typeof setTimeout?setTimeout:void 0,ii="function"==typeof clearTimeout?clearTimeout:void 0,oi="function"==typeof Promise?Promise:void 0,ai="function"==typeof queueMicrotask?queueMicrotask:void 0!==oi?function(t){return oi.resolve(null).then(t).catch(si)}:ri;function si(t){setTimeout((function(){throw t}))}function li(t,e){var n=e,r=0;do{var i=n.nextSibling;if(t.removeChild(n),i&&8===i.nodeType)if("/$"===(n=i.data)){if(0===r)return t.removeChild(i),void Ve(e);r--}else"$"!==n&&"$?"!==n&&"$!"!==n||r++;n=i}while(n);Ve(e)}function ci(t){for(;null!=t;t=t.nextSibling){var e=t.nodeType;if(1===e||3===e)break;if(8===e){if("$"===(e=t.data)||"$!"===e||"$?"===e)break;if("/$"===e)return null}}return t}function ui(t){t=t.previousSibling;for(var e=0;t;){if(8===t.nodeType){var n=t.data;if("$"===n||"$!"===n||"$?"===n){if(0===e)return t;e--}else"/$"===n&&e++}t=t.previousSibling}return null}var di=Math.random().toString(36).slice(2),hi="__reactFiber$"+di,fi="__reactProps$"+di,pi="__reactContainer$"+di,gi="__reactEvents$"+di,mi="__reactListeners$"+di,yi="__reactHandles$"+di;function bi(t){var e=t[hi];if(e)return e;for(var n=t.parentNode;n;){if(e=n[pi]||n[hi]){if(n=e.alternate,null!==e.child||null!==n&&null!==n.child)for(t=ui(t);null!==t;){if(n=t[hi])return n;t=ui(t)}return e}n=(t=n).parentNode}return null}function vi(t){return!(t=t[hi]||t[pi])||5!==t.tag&&6!==t.tag&&13!==t.tag&&3!==t.tag?null:t}function _i(t){if(5===t.tag||6===t.tag)return t.stateNode;throw Error(o(33))}function wi(t){return t[fi]||null}var xi=[],Si=-1;function ki(t){return{current:t}}function Ci(t){0>Si||(t.current=xi[Si],xi[Si]=null,Si--)}function Ti(t,e){Si++,xi[Si]=t.current,t.current=e}var Ei={},Pi=ki(Ei),Ii=ki(!1),Ai=Ei;function Mi(t,e){var n=t.type.contextTypes;if(!n)return Ei;var r=t.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===e)return r.__reactInternalMemoizedMaskedChildContext;var i,o={};for(i in n)o[i]=e[i];return r&&((t=t.stateNode).__reactInternalMemoizedUnmaskedChildContext=e,t.__reactInternalMemoizedMaskedChildContext=o),o}function Di(t){return null!=t.childContextTypes}function Fi(){Ci(Ii),Ci(Pi)}function Ri(t,e,n){if(Pi.current!==Ei)throw Error(o(168));Ti(Pi,e),Ti(Ii,n)}function Bi(t,e,n){var r=t.stateNode;if(e=e.childContextTypes,"function"!=typeof r.getChildContext)return n;for(var i in r=r.getChildContext())if(!(i in e))throw Error(o(108,$(t)||"Unknown",i));return N({},n,r)}function Li(t){return t=(t=t.stateNode)&&t.__reactInternalMemoizedMergedChildContext||Ei,Ai=Pi.current,Ti(Pi,t),Ti(Ii,Ii.current),!0}function Ni(t,e,n){var r=t.stateNode;if(!r)throw Error(o(169));n?(t=Bi(t,e,Ai),r.__reactInternalMemoizedMergedChildContext=t,Ci(Ii),Ci(Pi),Ti(Pi,t)):Ci(Ii),Ti(Ii,n)}var Oi=null,zi=!1,Ui=!1;function ji(t){null===Oi?Oi=[t]:Oi.push(t)}function Vi(){if(!Ui&&null!==Oi){Ui=!0;var t=0,e=ve;try{var n=Oi;for(ve=1;t<n.length;t++){var r=n[t];do{r=r(!0)}while(null!==r)}Oi=null,zi=!1}catch(e){throw null!==Oi&&(Oi=Oi.slice(t+1)),Yt(Jt,Vi),e}finally{ve=e,Ui=!1}}return null}var $i=[],Wi=0,Gi=null,Hi=0,Yi=[],qi=0,Ki=null,Xi=1,Qi="";function Zi(t,e){$i[Wi++]=Hi,$i[Wi++]=Gi,Gi=t,Hi=e}function Ji(t,e,n){Yi[qi++]=Xi,Yi[qi++]=Qi,Yi[qi++]=Ki,Ki=t;var r=Xi;t=Qi;var i=32-ae(r)-1;r&=~(1<<i),n+=1;var o=32-ae(e)+i;if(30<o){var a=i-i%5;o=(r&(1<<a)-1).toString(32),r>>=a,i-=a,Xi=1<<32-ae(e)+i|n<<i|r,Qi=o+t}else Xi=1<<o|n<<i|r,Qi=t}function to(t){null!==t.return&&(Zi(t,1),Ji(t,1,0))}function eo(t){for(;t===Gi;)Gi=$i[--Wi],$i[Wi]=null,Hi=$i[--Wi],$i[Wi]=null;for(;t===Ki;)Ki=Yi[--qi],Yi[qi]=null,Qi=Yi[--qi],Yi[qi]=null,Xi=Yi[--qi],Yi[qi]=null}var no=null,ro=null,io=!1,oo=null;function ao(t,e){var n=Mc(5,null,null,0);n.elementType="DELETED",n.stateNode=e,n.return=t,null===(e=t.deletions)?(t.deletions=[n],t.flags|=16):e.push(n)}function so(t,e){switch(t.tag){case 5:var n=t.type;return null!==(e=1!==e.nodeType||n.toLowerCase()!==e.nodeName.toLowerCase()?null:e)&&(t.stateNode=e,no=t,ro=ci(e.firstChild),!0);case 6:return null!==(e=""===t.pendingProps||3!==e.nodeType?null:e)&&(t.stateNode=e,no=t,ro=null,!0);case 13:return null!==(e=8!==e.nodeType?null:e)&&(n=null!==Ki?{id:Xi,overflow:Qi}:null,t.memoizedState={dehydrated:e,treeContext:n,retryLane:1073741824},(n=Mc(18,null,null,0)).stateNode=e,n.return=t,t.child=n,no=t,ro=null,!0);default:return!1}}function lo(t){return!(!(1&t.mode)||128&t.flags)}function co(t){if(io){var e=ro;if(e){var n=e;if(!so(t,e)){if(lo(t))throw Error(o(418));e=ci(n.nextSibling);var r=no;e&&so(t,e)?ao(r,n):(t.flags=-4097&t.flags|2,io=!1,no=t)}}else{if(lo(t))throw Error(o(418));t.flags=-4097&t.flags|2,io=!1,no=t}}}function uo(t){for(t=t.return;null!==t&&5!==t.tag&&3!==t.tag&&13!==t.tag;)t=t.return;no=t}function ho(t){if(t!==no)return!1;if(!io)return uo(t),io=!0,!1;var e;if((e=3!==t.tag)&&!(e=5!==t.tag)&&(e="head"!==(e=t.type)&&"body"!==e&&!ni(t.type,t.memoizedProps)),e&&(e=ro)){if(lo(t))throw fo(),Error(o(418));for(;e;)ao(t,e),e=ci(e.nextSibling)}if(uo(t),13===t.tag){if(!(t=null!==(t=t.memoizedState)?t.dehydrated:null))throw Error(o(317));t:{for(t=t.nextSibling,e=0;t;){if(8===t.nodeType){var n=t.data;if("/$"===n){if(0===e){ro=ci(t.nextSibling);break t}e--}else"$"!==n&&"$!"!==n&&"$?"!==n||e++}t=t.nextSibling}ro=null}}else ro=no?ci(t.stateNode.nextSibling):null;return!0}function fo(){for(var t=ro;t;)t=ci(t.nextSibling)}function po(){ro=no=null,io=!1}function go(t){null===oo?oo=[t]:oo.push(t)}var mo=_.ReactCurrentBatchConfig;function yo(t,e,n){if(null!==(t=n.ref)&&"function"!=typeof t&&"object"!=typeof t){if(n._owner){if(n=n._owner){if(1!==n.tag)throw Error(o(309));var r=n.stateNode}if(!r)throw Error(o(147,t));var i=r,a=""+t;return null!==e&&null!==e.ref&&"function"==typeof e.ref&&e.ref._stringRef===a?e.ref:(e=function(t){var e=i.refs;null===t?delete e[a]:e[a]=t},e._stringRef=a,e)}if("string"!=typeof t)throw Error(o(284));if(!n._owner)throw Error(o(290,t))}return t}function bo(t,e){throw t=Object.prototype.toString.call(e),Error(o(31,"[object Object]"===t?"object with keys {"+Object.keys(e).join(", ")+"}":t))}function vo(t){return(0,t._init)(t._payload)}function _o(t){function e(e,n){if(t){var r=e.deletions;null===r?(e.deletions=[n],e.flags|=16):r.push(n)}}function n(n,r){if(!t)return null;for(;null!==r;)e(n,r),r=r.sibling;return null}function r(t,e){for(t=new Map;null!==e;)null!==e.key?t.set(e.key,e):t.set(e.index,e),e=e.sibling;return t}function i(t,e){return(t=Fc(t,e)).index=0,t.sibling=null,t}function a(e,n,r){return e.index=r,t?null!==(r=e.alternate)?(r=r.index)<n?(e.flags|=2,n):r:(e.flags|=2,n):(e.flags|=1048576,n)}function s(e){return t&&null===e.alternate&&(e.flags|=2),e}function l(t,e,n,r){return null===e||6!==e.tag?((e=Nc(n,t.mode,r)).return=t,e):((e=i(e,n)).return=t,e)}function c(t,e,n,r){var o=n.type;return o===S?d(t,e,n.props.children,r,n.key):null!==e&&(e.elementType===o||"object"==typeof o&&null!==o&&o.$$typeof===D&&vo(o)===e.type)?((r=i(e,n.props)).ref=yo(t,e,n),r.return=t,r):((r=Rc(n.type,n.key,n.props,null,t.mode,r)).ref=yo(t,e,n),r.return=t,r)}function u(t,e,n,r){return null===e||4!==e.tag||e.stateNode.containerInfo!==n.containerInfo||e.stateNode.implementation!==n.implementation?((e=Oc(n,t.mode,r)).return=t,e):((e=i(e,n.children||[])).return=t,e)}function d(t,e,n,r,o){return null===e||7!==e.tag?((e=Bc(n,t.mode,r,o)).return=t,e):((e=i(e,n)).return=t,e)}function h(t,e,n){if("string"==typeof e&&""!==e||"number"==typeof e)return(e=Nc(""+e,t.mode,n)).return=t,e;if("object"==typeof e&&null!==e){switch(e.$$typeof){case w:return(n=Rc(e.type,e.key,e.props,null,t.mode,n)).ref=yo(t,null,e),n.return=t,n;case x:return(e=Oc(e,t.mode,n)).return=t,e;case D:return h(t,(0,e._init)(e._payload),n)}if(et(e)||B(e))return(e=Bc(e,t.mode,n,null)).return=t,e;bo(t,e)}return null}function f(t,e,n,r){var i=null!==e?e.key:null;if("string"==typeof n&&""!==n||"number"==typeof n)return null!==i?null:l(t,e,""+n,r);if("object"==typeof n&&null!==n){switch(n.$$typeof){case w:return n.key===i?c(t,e,n,r):null;case x:return n.key===i?u(t,e,n,r):null;case D:return f(t,e,(i=n._init)(n._payload),r)}if(et(n)||B(n))return null!==i?null:d(t,e,n,r,null);bo(t,n)}return null}function p(t,e,n,r,i){if("string"==typeof r&&""!==r||"number"==typeof r)return l(e,t=t.get(n)||null,""+r,i);if("object"==typeof r&&null!==r){switch(r.$$typeof){case w:return c(e,t=t.get(null===r.key?n:r.key)||null,r,i);case x:return u(e,t=t.get(null===r.key?n:r.key)||null,r,i);case D:return p(t,e,n,(0,r._init)(r._payload),i)}if(et(r)||B(r))return d(e,t=t.get(n)||null,r,i,null);bo(e,r)}return null}function g(i,o,s,l){for(var c=null,u=null,d=o,g=o=0,m=null;null!==d&&g<s.length;g++){d.index>g?(m=d,d=null):m=d.sibling;var y=f(i,d,s[g],l);if(null===y){null===d&&(d=m);break}t&&d&&null===y.alternate&&e(i,d),o=a(y,o,g),null===u?c=y:u.sibling=y,u=y,d=m}if(g===s.length)return n(i,d),io&&Zi(i,g),c;if(null===d){for(;g<s.length;g++)null!==(d=h(i,s[g],l))&&(o=a(d,o,g),null===u?c=d:u.sibling=d,u=d);return io&&Zi(i,g),c}for(d=r(i,d);g<s.length;g++)null!==(m=p(d,i,g,s[g],l))&&(t&&null!==m.alternate&&d.delete(null===m.key?g:m.key),o=a(m,o,g),null===u?c=m:u.sibling=m,u=m);return t&&d.forEach((function(t){return e(i,t)})),io&&Zi(i,g),c}function m(i,s,l,c){var u=B(l);if("function"!=typeof u)throw Error(o(150));if(null==(l=u.call(l)))throw Error(o(151));for(var d=u=null,g=s,m=s=0,y=null,b=l.next();null!==g&&!b.done;m++,b=l.next()){g.index>m?(y=g,g=null):y=g.sibling;var v=f(i,g,b.value,c);if(null===v){null===g&&(g=y);break}t&&g&&null===v.alternate&&e(i,g),s=a(v,s,m),null===d?u=v:d.sibling=v,d=v,g=y}if(b.done)return n(i,g),io&&Zi(i,m),u;if(null===g){for(;!b.done;m++,b=l.next())null!==(b=h(i,b.value,c))&&(s=a(b,s,m),null===d?u=b:d.sibling=b,d=b);return io&&Zi(i,m),u}for(g=r(i,g);!b.done;m++,b=l.next())null!==(b=p(g,i,m,b.value,c))&&(t&&null!==b.alternate&&g.delete(null===b.key?m:b.key),s=a(b,s,m),null===d?u=b:d.sibling=b,d=b);return t&&g.forEach((function(t){return e(i,t)})),io&&Zi(i,m),u}return function t(r,o,a,l){if("object"==typeof a&&null!==a&&a.type===S&&null===a.key&&(a=a.props.children),"object"==typeof a&&null!==a){switch(a.$$typeof){case w:t:{for(var c=a.key,u=o;null!==u;){if(u.key===c){if((c=a.type)===S){if(7===u.tag){n(r,u.sibling),(o=i(u,a.props.children)).return=r,r=o;break t}}else if(u.elementType===c||"object"==typeof c&&null!==c&&c.$$typeof===D&&vo(c)===u.type){n(r,u.sibling),(o=i(u,a.props)).ref=yo(r,u,a),o.return=r,r=o;break t}n(r,u);break}e(r,u),u=u.sibling}a.type===S?((o=Bc(a.props.children,r.mode,l,a.key)).return=r,r=o):((l=Rc(a.type,a.key,a.props,null,r.mode,l)).ref=yo(r,o,a),l.return=r,r=l)}return s(r);case x:t:{for(u=a.key;null!==o;){if(o.key===u){if(4===o.tag&&o.stateNode.containerInfo===a.containerInfo&&o.stateNode.implementation===a.implementation){n(r,o.sibling),(o=i(o,a.children||[])).return=r,r=o;break t}n(r,o);break}e(r,o),o=o.sibling}(o=Oc(a,r.mode,l)).return=r,r=o}return s(r);case D:return t(r,o,(u=a._init)(a._payload),l)}if(et(a))return g(r,o,a,l);if(B(a))return m(r,o,a,l);bo(r,a)}return"string"==typeof a&&""!==a||"number"==typeof a?(a=""+a,null!==o&&6===o.tag?(n(r,o.sibling),(o=i(o,a)).return=r,r=o):(n(r,o),(o=Nc(a,r.mode,l)).return=r,r=o),s(r)):n(r,o)}}var wo=_o(!0),xo=_o(!1),So=ki(null),ko=null,Co=null,To=null;function Eo(){To=Co=ko=null}function Po(t){var e=So.current;Ci(So),t._currentValue=e}function Io(t,e,n){for(;null!==t;){var r=t.alternate;if((t.childLanes&e)!==e?(t.childLanes|=e,null!==r&&(r.childLanes|=e)):null!==r&&(r.childLanes&e)!==e&&(r.childLanes|=e),t===n)break;t=t.return}}function Ao(t,e){ko=t,To=Co=null,null!==(t=t.dependencies)&&null!==t.firstContext&&(!!(t.lanes&e)&&(vs=!0),t.firstContext=null)}function Mo(t){var e=t._currentValue;if(To!==t)if(t={context:t,memoizedValue:e,next:null},null===Co){if(null===ko)throw Error(o(308));Co=t,ko.dependencies={lanes:0,firstContext:t}}else Co=Co.next=t;return e}var Do=null;function Fo(t){null===Do?Do=[t]:Do.push(t)}function Ro(t,e,n,r){var i=e.interleaved;return null===i?(n.next=n,Fo(e)):(n.next=i.next,i.next=n),e.interleaved=n,Bo(t,r)}function Bo(t,e){t.lanes|=e;var n=t.alternate;for(null!==n&&(n.lanes|=e),n=t,t=t.return;null!==t;)t.childLanes|=e,null!==(n=t.alternate)&&(n.childLanes|=e),n=t,t=t.return;return 3===n.tag?n.stateNode:null}var Lo=!1;function No(t){t.updateQueue={baseState:t.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function Oo(t,e){t=t.updateQueue,e.updateQueue===t&&(e.updateQueue={baseState:t.baseState,firstBaseUpdate:t.firstBaseUpdate,lastBaseUpdate:t.lastBaseUpdate,shared:t.shared,effects:t.effects})}function zo(t,e){return{eventTime:t,lane:e,tag:0,payload:null,callback:null,next:null}}function Uo(t,e,n){var r=t.updateQueue;if(null===r)return null;if(r=r.shared,2&Pl){var i=r.pending;return null===i?e.next=e:(e.next=i.next,i.next=e),r.pending=e,Bo(t,n)}return null===(i=r.interleaved)?(e.next=e,Fo(r)):(e.next=i.next,i.next=e),r.interleaved=e,Bo(t,n)}function jo(t,e,n){if(null!==(e=e.updateQueue)&&(e=e.shared,4194240&n)){var r=e.lanes;n|=r&=t.pendingLanes,e.lanes=n,be(t,n)}}function Vo(t,e){var n=t.updateQueue,r=t.alternate;if(null!==r&&n===(r=r.updateQueue)){var i=null,o=null;if(null!==(n=n.firstBaseUpdate)){do{var a={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};null===o?i=o=a:o=o.next=a,n=n.next}while(null!==n);null===o?i=o=e:o=o.next=e}else i=o=e;return n={baseState:r.baseState,firstBaseUpdate:i,lastBaseUpdate:o,shared:r.shared,effects:r.effects},void(t.updateQueue=n)}null===(t=n.lastBaseUpdate)?n.firstBaseUpdate=e:t.next=e,n.lastBaseUpdate=e}function $o(t,e,n,r){var i=t.updateQueue;Lo=!1;var o=i.firstBaseUpdate,a=i.lastBaseUpdate,s=i.shared.pending;if(null!==s){i.shared.pending=null;var l=s,c=l.next;l.next=null,null===a?o=c:a.next=c,a=l;var u=t.alternate;null!==u&&(s=(u=u.updateQueue).lastBaseUpdate)!==a&&(null===s?u.firstBaseUpdate=c:s.next=c,u.lastBaseUpdate=l)}if(null!==o){var d=i.baseState;for(a=0,u=c=l=null,s=o;;){var h=s.lane,f=s.eventTime;if((r&h)===h){null!==u&&(u=u.next={eventTime:f,lane:0,tag:s.tag,payload:s.payload,callback:s.callback,next:null});t:{var p=t,g=s;switch(h=e,f=n,g.tag){case 1:if("function"==typeof(p=g.payload)){d=p.call(f,d,h);break t}d=p;break t;case 3:p.flags=-65537&p.flags|128;case 0:if(null==(h="function"==typeof(p=g.payload)?p.call(f,d,h):p))break t;d=N({},d,h);break t;case 2:Lo=!0}}null!==s.callback&&0!==s.lane&&(t.flags|=64,null===(h=i.effects)?i.effects=[s]:h.push(s))}else f={eventTime:f,lane:h,tag:s.tag,payload:s.payload,callback:s.callback,next:null},null===u?(c=u=f,l=d):u=u.next=f,a|=h;if(null===(s=s.next)){if(null===(s=i.shared.pending))break;s=(h=s).next,h.next=null,i.lastBaseUpdate=h,i.shared.pending=null}}if(null===u&&(l=d),i.baseState=l,i.firstBaseUpdate=c,i.lastBaseUpdate=u,null!==(e=i.shared.interleaved)){i=e;do{a|=i.lane,i=i.next}while(i!==e)}else null===o&&(i.shared.lanes=0);Ll|=a,t.lanes=a,t.memoizedState=d}}function Wo(t,e,n){if(t=e.effects,e.effects=null,null!==t)for(e=0;e<t.length;e++){var r=t[e],i=r.callback;if(null!==i){if(r.callback=null,r=n,"function"!=typeof i)throw Error(o(191,i));i.call(r)}}}var Go={},Ho=ki(Go),Yo=ki(Go),qo=ki(Go);function Ko(t){if(t===Go)throw Error(o(174));return t}function Xo(t,e){switch(Ti(qo,e),Ti(Yo,t),Ti(Ho,Go),t=e.nodeType){case 9:case 11:e=(e=e.documentElement)?e.namespaceURI:lt(null,"");break;default:e=lt(e=(t=8===t?e.parentNode:e).namespaceURI||null,t=t.tagName)}Ci(Ho),Ti(Ho,e)}function Qo(){Ci(Ho),Ci(Yo),Ci(qo)}function Zo(t){Ko(qo.current);var e=Ko(Ho.current),n=lt(e,t.type);e!==n&&(Ti(Yo,t),Ti(Ho,n))}function Jo(t){Yo.current===t&&(Ci(Ho),Ci(Yo))}var ta=ki(0);function ea(t){for(var e=t;null!==e;){if(13===e.tag){var n=e.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||"$?"===n.data||"$!"===n.data))return e}else if(19===e.tag&&void 0!==e.memoizedProps.revealOrder){if(128&e.flags)return e}else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break;for(;null===e.sibling;){if(null===e.return||e.return===t)return null;e=e.return}e.sibling.return=e.return,e=e.sibling}return null}var na=[];function ra(){for(var t=0;t<na.length;t++)na[t]._workInProgressVersionPrimary=null;na.length=0}var ia=_.ReactCurrentDispatcher,oa=_.ReactCurrentBatchConfig,aa=0,sa=null,la=null,ca=null,ua=!1,da=!1,ha=0,fa=0;function pa(){throw Error(o(321))}function ga(t,e){if(null===e)return!1;for(var n=0;n<e.length&&n<t.length;n++)if(!sr(t[n],e[n]))return!1;return!0}function ma(t,e,n,r,i,a){if(aa=a,sa=e,e.memoizedState=null,e.updateQueue=null,e.lanes=0,ia.current=null===t||null===t.memoizedState?Ja:ts,t=n(r,i),da){a=0;do{if(da=!1,ha=0,25<=a)throw Error(o(301));a+=1,ca=la=null,e.updateQueue=null,ia.current=es,t=n(r,i)}while(da)}if(ia.current=Za,e=null!==la&&null!==la.next,aa=0,ca=la=sa=null,ua=!1,e)throw Error(o(300));return t}function ya(){var t=0!==ha;return ha=0,t}function ba(){var t={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===ca?sa.memoizedState=ca=t:ca=ca.next=t,ca}function va(){if(null===la){var t=sa.alternate;t=null!==t?t.memoizedState:null}else t=la.next;var e=null===ca?sa.memoizedState:ca.next;if(null!==e)ca=e,la=t;else{if(null===t)throw Error(o(310));t={memoizedState:(la=t).memoizedState,baseState:la.baseState,baseQueue:la.baseQueue,queue:la.queue,next:null},null===ca?sa.memoizedState=ca=t:ca=ca.next=t}return ca}function _a(t,e){return"function"==typeof e?e(t):e}function wa(t){var e=va(),n=e.queue;if(null===n)throw Error(o(311));n.lastRenderedReducer=t;var r=la,i=r.baseQueue,a=n.pending;if(null!==a){if(null!==i){var s=i.next;i.next=a.next,a.next=s}r.baseQueue=i=a,n.pending=null}if(null!==i){a=i.next,r=r.baseState;var l=s=null,c=null,u=a;do{var d=u.lane;if((aa&d)===d)null!==c&&(c=c.next={lane:0,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null}),r=u.hasEagerState?u.eagerState:t(r,u.action);else{var h={lane:d,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null};null===c?(l=c=h,s=r):c=c.next=h,sa.lanes|=d,Ll|=d}u=u.next}while(null!==u&&u!==a);null===c?s=r:c.next=l,sr(r,e.memoizedState)||(vs=!0),e.memoizedState=r,e.baseState=s,e.baseQueue=c,n.lastRenderedState=r}if(null!==(t=n.interleaved)){i=t;do{a=i.lane,sa.lanes|=a,Ll|=a,i=i.next}while(i!==t)}else null===i&&(n.lanes=0);return[e.memoizedState,n.dispatch]}function xa(t){var e=va(),n=e.queue;if(null===n)throw Error(o(311));n.lastRenderedReducer=t;var r=n.dispatch,i=n.pending,a=e.memoizedState;if(null!==i){n.pending=null;var s=i=i.next;do{a=t(a,s.action),s=s.next}while(s!==i);sr(a,e.memoizedState)||(vs=!0),e.memoizedState=a,null===e.baseQueue&&(e.baseState=a),n.lastRenderedState=a}return[a,r]}function Sa(){}function ka(t,e){var n=sa,r=va(),i=e(),a=!sr(r.memoizedState,i);if(a&&(r.memoizedState=i,vs=!0),r=r.queue,La(Ea.bind(null,n,r,t),[t]),r.getSnapshot!==e||a||null!==ca&&1&ca.memoizedState.tag){if(n.flags|=2048,Ma(9,Ta.bind(null,n,r,i,e),void 0,null),null===Il)throw Error(o(349));30&aa||Ca(n,e,i)}return i}function Ca(t,e,n){t.flags|=16384,t={getSnapshot:e,value:n},null===(e=sa.updateQueue)?(e={lastEffect:null,stores:null},sa.updateQueue=e,e.stores=[t]):null===(n=e.stores)?e.stores=[t]:n.push(t)}function Ta(t,e,n,r){e.value=n,e.getSnapshot=r,Pa(e)&&Ia(t)}function Ea(t,e,n){return n((function(){Pa(e)&&Ia(t)}))}function Pa(t){var e=t.getSnapshot;t=t.value;try{var n=e();return!sr(t,n)}catch(t){return!0}}function Ia(t){var e=Bo(t,1);null!==e&&nc(e,t,1,-1)}function Aa(t){var e=ba();return"function"==typeof t&&(t=t()),e.memoizedState=e.baseState=t,t={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:_a,lastRenderedState:t},e.queue=t,t=t.dispatch=qa.bind(null,sa,t),[e.memoizedState,t]}function Ma(t,e,n,r){return t={tag:t,create:e,destroy:n,deps:r,next:null},null===(e=sa.updateQueue)?(e={lastEffect:null,stores:null},sa.updateQueue=e,e.lastEffect=t.next=t):null===(n=e.lastEffect)?e.lastEffect=t.next=t:(r=n.next,n.next=t,t.next=r,e.lastEffect=t),t}function Da(){return va().memoizedState}function Fa(t,e,n,r){var i=ba();sa.flags|=t,i.memoizedState=Ma(1|e,n,void 0,void 0===r?null:r)}function Ra(t,e,n,r){var i=va();r=void 0===r?null:r;var o=void 0;if(null!==la){var a=la.memoizedState;if(o=a.destroy,null!==r&&ga(r,a.deps))return void(i.memoizedState=Ma(e,n,o,r))}sa.flags|=t,i.memoizedState=Ma(1|e,n,o,r)}function Ba(t,e){return Fa(8390656,8,t,e)}function La(t,e){return Ra(2048,8,t,e)}function Na(t,e){return Ra(4,2,t,e)}function Oa(t,e){return Ra(4,4,t,e)}function za(t,e){return"function"==typeof e?(t=t(),e(t),function(){e(null)}):null!=e?(t=t(),e.current=t,function(){e.current=null}):void 0}function Ua(t,e,n){return n=null!=n?n.concat([t]):null,Ra(4,4,za.bind(null,e,t),n)}function ja(){}function Va(t,e){var n=va();e=void 0===e?null:e;var r=n.memoizedState;return null!==r&&null!==e&&ga(e,r[1])?r[0]:(n.memoizedState=[t,e],t)}function $a(t,e){var n=va();e=void 0===e?null:e;var r=n.memoizedState;return null!==r&&null!==e&&ga(e,r[1])?r[0]:(t=t(),n.memoizedState=[t,e],t)}function Wa(t,e,n){return 21&aa?(sr(n,e)||(n=ge(),sa.lanes|=n,Ll|=n,t.baseState=!0),e):(t.baseState&&(t.baseState=!1,vs=!0),t.memoizedState=n)}function Ga(t,e){var n=ve;ve=0!==n&&4>n?n:4,t(!0);var r=oa.transition;oa.transition={};try{t(!1),e()}finally{ve=n,oa.transition=r}}function Ha(){return va().memoizedState}function Ya(t,e,n){var r=ec(t);n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},Ka(t)?Xa(e,n):null!==(n=Ro(t,e,n,r))&&(nc(n,t,r,tc()),Qa(n,e,r))}function qa(t,e,n){var r=ec(t),i={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(Ka(t))Xa(e,i);else{var o=t.alternate;if(0===t.lanes&&(null===o||0===o.lanes)&&null!==(o=e.lastRenderedReducer))try{var a=e.lastRenderedState,s=o(a,n);if(i.hasEagerState=!0,i.eagerState=s,sr(s,a)){var l=e.interleaved;return null===l?(i.next=i,Fo(e)):(i.next=l.next,l.next=i),void(e.interleaved=i)}}catch(t){}null!==(n=Ro(t,e,i,r))&&(nc(n,t,r,i=tc()),Qa(n,e,r))}}function Ka(t){var e=t.alternate;return t===sa||null!==e&&e===sa}function Xa(t,e){da=ua=!0;var n=t.pending;null===n?e.next=e:(e.next=n.next,n.next=e),t.pending=e}function Qa(t,e,n){if(4194240&n){var r=e.lanes;n|=r&=t.pendingLanes,e.lanes=n,be(t,n)}}var Za={readContext:Mo,useCallback:pa,useContext:pa,useEffect:pa,useImperativeHandle:pa,useInsertionEffect:pa,useLayoutEffect:pa,useMemo:pa,useReducer:pa,useRef:pa,useState:pa,useDebugValue:pa,useDeferredValue:pa,useTransition:pa,useMutableSource:pa,useSyncExternalStore:pa,useId:pa,unstable_isNewReconciler:!1},Ja={readContext:Mo,useCallback:function(t,e){return ba().memoizedState=[t,void 0===e?null:e],t},useContext:Mo,useEffect:Ba,useImperativeHandle:function(t,e,n){return n=null!=n?n.concat([t]):null,Fa(4194308,4,za.bind(null,e,t),n)},useLayoutEffect:function(t,e){return Fa(4194308,4,t,e)},useInsertionEffect:function(t,e){return Fa(4,2,t,e)},useMemo:function(t,e){var n=ba();return e=void 0===e?null:e,t=t(),n.memoizedState=[t,e],t},useReducer:function(t,e,n){var r=ba();return e=void 0!==n?n(e):e,r.memoizedState=r.baseState=e,t={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:t,lastRenderedState:e},r.queue=t,t=t.dispatch=Ya.bind(null,sa,t),[r.memoizedState,t]},useRef:function(t){return t={current:t},ba().memoizedState=t},useState:Aa,useDebugValue:ja,useDeferredValue:function(t){return ba().memoizedState=t},useTransition:function(){var t=Aa(!1),e=t[0];return t=Ga.bind(null,t[1]),ba().memoizedState=t,[e,t]},useMutableSource:function(){},useSyncExternalStore:function(t,e,n){var r=sa,i=ba();if(io){if(void 0===n)throw Error(o(407));n=n()}else{if(n=e(),null===Il)throw Error(o(349));30&aa||Ca(r,e,n)}i.memoizedState=n;var a={value:n,getSnapshot:e};return i.queue=a,Ba(Ea.bind(null,r,a,t),[t]),r.flags|=2048,Ma(9,Ta.bind(null,r,a,n,e),void 0,null),n},useId:function(){var t=ba(),e=Il.identifierPrefix;if(io){var n=Qi;e=":"+e+"R"+(n=(Xi&~(1<<32-ae(Xi)-1)).toString(32)+n),0<(n=ha++)&&(e+="H"+n.toString(32)),e+=":"}else e=":"+e+"r"+(n=fa++).toString(32)+":";return t.memoizedState=e},unstable_isNewReconciler:!1},ts={readContext:Mo,useCallback:Va,useContext:Mo,useEffect:La,useImperativeHandle:Ua,useInsertionEffect:Na,useLayoutEffect:Oa,useMemo:$a,useReducer:wa,useRef:Da,useState:function(){return wa(_a)},useDebugValue:ja,useDeferredValue:function(t){return Wa(va(),la.memoizedState,t)},useTransition:function(){return[wa(_a)[0],va().memoizedState]},useMutableSource:Sa,useSyncExternalStore:ka,useId:Ha,unstable_isNewReconciler:!1},es={readContext:Mo,useCallback:Va,useContext:Mo,useEffect:La,useImperativeHandle:Ua,useInsertionEffect:Na,useLayoutEffect:Oa,useMemo:$a,useReducer:xa,useRef:Da,useState:function(){return xa(_a)},useDebugValue:ja,useDeferredValue:function(t){var e=va();return null===la?e.memoizedState=t:Wa(e,la.memoizedState,t)},useTransition:function(){return[xa(_a)[0],va().memoizedState]},useMutableSource:Sa,useSyncExternalStore:ka,useId:Ha,unstable_isNewReconciler:!1};function ns(t,e){if(t&&t.defaultProps){for(var n in e=N({},e),t=t.defaultProps)void 0===e[n]&&(e[n]=t[n]);return e}return e}function rs(t,e,n,r){n=null==(n=n(r,e=t.memoizedState))?e:N({},e,n),t.memoizedState=n,0===t.lanes&&(t.updateQueue.baseState=n)}var is={isMounted:function(t){return!!(t=t._reactInternals)&&Vt(t)===t},enqueueSetState:function(t,e,n){t=t._reactInternals;var r=tc(),i=ec(t),o=zo(r,i);o.payload=e,null!=n&&(o.callback=n),null!==(e=Uo(t,o,i))&&(nc(e,t,i,r),jo(e,t,i))},enqueueReplaceState:function(t,e,n){t=t._reactInternals;var r=tc(),i=ec(t),o=zo(r,i);o.tag=1,o.payload=e,null!=n&&(o.callback=n),null!==(e=Uo(t,o,i))&&(nc(e,t,i,r),jo(e,t,i))},enqueueForceUpdate:function(t,e){t=t._reactInternals;var n=tc(),r=ec(t),i=zo(n,r);i.tag=2,null!=e&&(i.callback=e),null!==(e=Uo(t,i,r))&&(nc(e,t,r,n),jo(e,t,r))}};function os(t,e,n,r,i,o,a){return"function"==typeof(t=t.stateNode).shouldComponentUpdate?t.shouldComponentUpdate(r,o,a):!(e.prototype&&e.prototype.isPureReactComponent&&lr(n,r)&&lr(i,o))}function as(t,e,n){var r=!1,i=Ei,o=e.contextType;return"object"==typeof o&&null!==o?o=Mo(o):(i=Di(e)?Ai:Pi.current,o=(r=null!=(r=e.contextTypes))?Mi(t,i):Ei),e=new e(n,o),t.memoizedState=null!==e.state&&void 0!==e.state?e.state:null,e.updater=is,t.stateNode=e,e._reactInternals=t,r&&((t=t.stateNode).__reactInternalMemoizedUnmaskedChildContext=i,t.__reactInternalMemoizedMaskedChildContext=o),e}function ss(t,e,n,r){t=e.state,"function"==typeof e.componentWillReceiveProps&&e.componentWillReceiveProps(n,r),"function"==typeof e.UNSAFE_componentWillReceiveProps&&e.UNSAFE_componentWillReceiveProps(n,r),e.state!==t&&is.enqueueReplaceState(e,e.state,null)}function ls(t,e,n,r){var i=t.stateNode;i.props=n,i.state=t.memoizedState,i.refs={},No(t);var o=e.contextType;"object"==typeof o&&null!==o?i.context=Mo(o):(o=Di(e)?Ai:Pi.current,i.context=Mi(t,o)),i.state=t.memoizedState,"function"==typeof(o=e.getDerivedStateFromProps)&&(rs(t,e,o,n),i.state=t.memoizedState),"function"==typeof e.getDerivedStateFromProps||"function"==typeof i.getSnapshotBeforeUpdate||"function"!=typeof i.UNSAFE_componentWillMount&&"function"!=typeof i.componentWillMount||(e=i.state,"function"==typeof i.componentWillMount&&i.componentWillMount(),"function"==typeof i.UNSAFE_componentWillMount&&i.UNSAFE_componentWillMount(),e!==i.state&&is.enqueueReplaceState(i,i.state,null),$o(t,n,i,r),i.state=t.memoizedState),"function"==typeof i.componentDidMount&&(t.flags|=4194308)}function cs(t,e){try{var n="",r=e;do{n+=j(r),r=r.return}while(r);var i=n}catch(t){i="\nError generating stack: "+t.message+"\n"+t.stack}return{value:t,source:e,stack:i,digest:null}}function us(t,e,n){return{value:t,source:null,stack:null!=n?n:null,digest:null!=e?e:null}}function ds(t,e){try{console.error(e.value)}catch(t){setTimeout((function(){throw t}))}}var hs="function"==typeof WeakMap?WeakMap:Map;function fs(t,e,n){(n=zo(-1,n)).tag=3,n.payload={element:null};var r=e.value;return n.callback=function(){Wl||(Wl=!0,Gl=r),ds(0,e)},n}function ps(t,e,n){(n=zo(-1,n)).tag=3;var r=t.type.getDerivedStateFromError;if("function"==typeof r){var i=e.value;n.payload=function(){return r(i)},n.callback=function(){ds(0,e)}}var o=t.stateNode;return null!==o&&"function"==typeof o.componentDidCatch&&(n.callback=function(){ds(0,e),"function"!=typeof r&&(null===Hl?Hl=new Set([this]):Hl.add(this));var t=e.stack;this.componentDidCatch(e.value,{componentStack:null!==t?t:""})}),n}function gs(t,e,n){var r=t.pingCache;if(null===r){r=t.pingCache=new hs;var i=new Set;r.set(e,i)}else void 0===(i=r.get(e))&&(i=new Set,r.set(e,i));i.has(n)||(i.add(n),t=Cc.bind(null,t,e,n),e.then(t,t))}function ms(t){do{var e;if((e=13===t.tag)&&(e=null===(e=t.memoizedState)||null!==e.dehydrated),e)return t;t=t.return}while(null!==t);return null}function ys(t,e,n,r,i){return 1&t.mode?(t.flags|=65536,t.lanes=i,t):(t===e?t.flags|=65536:(t.flags|=128,n.flags|=131072,n.flags&=-52805,1===n.tag&&(null===n.alternate?n.tag=17:((e=zo(-1,1)).tag=2,Uo(n,e,1))),n.lanes|=1),t)}var bs=_.ReactCurrentOwner,vs=!1;function _s(t,e,n,r){e.child=null===t?xo(e,null,n,r):wo(e,t.child,n,r)}function ws(t,e,n,r,i){n=n.render;var o=e.ref;return Ao(e,i),r=ma(t,e,n,r,o,i),n=ya(),null===t||vs?(io&&n&&to(e),e.flags|=1,_s(t,e,r,i),e.child):(e.updateQueue=t.updateQueue,e.flags&=-2053,t.lanes&=~i,Ws(t,e,i))}function xs(t,e,n,r,i){if(null===t){var o=n.type;return"function"!=typeof o||Dc(o)||void 0!==o.defaultProps||null!==n.compare||void 0!==n.defaultProps?((t=Rc(n.type,null,r,e,e.mode,i)).ref=e.ref,t.return=e,e.child=t):(e.tag=15,e.type=o,Ss(t,e,o,r,i))}if(o=t.child,!(t.lanes&i)){var a=o.memoizedProps;if((n=null!==(n=n.compare)?n:lr)(a,r)&&t.ref===e.ref)return Ws(t,e,i)}return e.flags|=1,(t=Fc(o,r)).ref=e.ref,t.return=e,e.child=t}function Ss(t,e,n,r,i){if(null!==t){var o=t.memoizedProps;if(lr(o,r)&&t.ref===e.ref){if(vs=!1,e.pendingProps=r=o,!(t.lanes&i))return e.lanes=t.lanes,Ws(t,e,i);131072&t.flags&&(vs=!0)}}return Ts(t,e,n,r,i)}function ks(t,e,n){var r=e.pendingProps,i=r.children,o=null!==t?t.memoizedState:null;if("hidden"===r.mode)if(1&e.mode){if(!(1073741824&n))return t=null!==o?o.baseLanes|n:n,e.lanes=e.childLanes=1073741824,e.memoizedState={baseLanes:t,cachePool:null,transitions:null},e.updateQueue=null,Ti(Fl,Dl),Dl|=t,null;e.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=null!==o?o.baseLanes:n,Ti(Fl,Dl),Dl|=r}else e.memoizedState={baseLanes:0,cachePool:null,transitions:null},Ti(Fl,Dl),Dl|=n;else null!==o?(r=o.baseLanes|n,e.memoizedState=null):r=n,Ti(Fl,Dl),Dl|=r;return _s(t,e,i,n),e.child}function Cs(t,e){var n=e.ref;(null===t&&null!==n||null!==t&&t.ref!==n)&&(e.flags|=512,e.flags|=2097152)}function Ts(t,e,n,r,i){var o=Di(n)?Ai:Pi.current;return o=Mi(e,o),Ao(e,i),n=ma(t,e,n,r,o,i),r=ya(),null===t||vs?(io&&r&&to(e),e.flags|=1,_s(t,e,n,i),e.child):(e.updateQueue=t.updateQueue,e.flags&=-2053,t.lanes&=~i,Ws(t,e,i))}function Es(t,e,n,r,i){if(Di(n)){var o=!0;Li(e)}else o=!1;if(Ao(e,i),null===e.stateNode)$s(t,e),as(e,n,r),ls(e,n,r,i),r=!0;else if(null===t){var a=e.stateNode,s=e.memoizedProps;a.props=s;var l=a.context,c=n.contextType;c="object"==typeof c&&null!==c?Mo(c):Mi(e,c=Di(n)?Ai:Pi.current);var u=n.getDerivedStateFromProps,d="function"==typeof u||"function"==typeof a.getSnapshotBeforeUpdate;d||"function"!=typeof a.UNSAFE_componentWillReceiveProps&&"function"!=typeof a.componentWillReceiveProps||(s!==r||l!==c)&&ss(e,a,r,c),Lo=!1;var h=e.memoizedState;a.state=h,$o(e,r,a,i),l=e.memoizedState,s!==r||h!==l||Ii.current||Lo?("function"==typeof u&&(rs(e,n,u,r),l=e.memoizedState),(s=Lo||os(e,n,s,r,h,l,c))?(d||"function"!=typeof a.UNSAFE_componentWillMount&&"function"!=typeof a.componentWillMount||("function"==typeof a.componentWillMount&&a.componentWillMount(),"function"==typeof a.UNSAFE_componentWillMount&&a.UNSAFE_componentWillMount()),"function"==typeof a.componentDidMount&&(e.flags|=4194308)):("function"==typeof a.componentDidMount&&(e.flags|=4194308),e.memoizedProps=r,e.memoizedState=l),a.props=r,a.state=l,a.context=c,r=s):("function"==typeof a.componentDidMount&&(e.flags|=4194308),r=!1)}else{a=e.stateNode,Oo(t,e),s=e.memoizedProps,c=e.type===e.elementType?s:ns(e.type,s),a.props=c,d=e.pendingProps,h=a.context,l="object"==typeof(l=n.contextType)&&null!==l?Mo(l):Mi(e,l=Di(n)?Ai:Pi.current);var f=n.getDerivedStateFromProps;(u="function"==typeof f||"function"==typeof a.getSnapshotBeforeUpdate)||"function"!=typeof a.UNSAFE_componentWillReceiveProps&&"function"!=typeof a.componentWillReceiveProps||(s!==d||h!==l)&&ss(e,a,r,l),Lo=!1,h=e.memoizedState,a.state=h,$o(e,r,a,i);var p=e.memoizedState;s!==d||h!==p||Ii.current||Lo?("function"==typeof f&&(rs(e,n,f,r),p=e.memoizedState),(c=Lo||os(e,n,c,r,h,p,l)||!1)?(u||"function"!=typeof a.UNSAFE_componentWillUpdate&&"function"!=typeof a.componentWillUpdate||("function"==typeof a.componentWillUpdate&&a.componentWillUpdate(r,p,l),"function"==typeof a.UNSAFE_componentWillUpdate&&a.UNSAFE_componentWillUpdate(r,p,l)),"function"==typeof a.componentDidUpdate&&(e.flags|=4),"function"==typeof a.getSnapshotBeforeUpdate&&(e.flags|=1024)):("function"!=typeof a.componentDidUpdate||s===t.memoizedProps&&h===t.memoizedState||(e.flags|=4),"function"!=typeof a.getSnapshotBeforeUpdate||s===t.memoizedProps&&h===t.memoizedState||(e.flags|=1024),e.memoizedProps=r,e.memoizedState=p),a.props=r,a.state=p,a.context=l,r=c):("function"!=typeof a.componentDidUpdate||s===t.memoizedProps&&h===t.memoizedState||(e.flags|=4),"function"!=typeof a.getSnapshotBeforeUpdate||s===t.memoizedProps&&h===t.memoizedState||(e.flags|=1024),r=!1)}return Ps(t,e,n,r,o,i)}function Ps(t,e,n,r,i,o){Cs(t,e);var a=!!(128&e.flags);if(!r&&!a)return i&&Ni(e,n,!1),Ws(t,e,o);r=e.stateNode,bs.current=e;var s=a&&"function"!=typeof n.getDerivedStateFromError?null:r.render();return e.flags|=1,null!==t&&a?(e.child=wo(e,t.child,null,o),e.child=wo(e,null,s,o)):_s(t,e,s,o),e.memoizedState=r.state,i&&Ni(e,n,!0),e.child}function Is(t){var e=t.stateNode;e.pendingContext?Ri(0,e.pendingContext,e.pendingContext!==e.context):e.context&&Ri(0,e.context,!1),Xo(t,e.containerInfo)}function As(t,e,n,r,i){return po(),go(i),e.flags|=256,_s(t,e,n,r),e.child}var Ms,Ds,Fs,Rs,Bs={dehydrated:null,treeContext:null,retryLane:0};function Ls(t){return{baseLanes:t,cachePool:null,transitions:null}}function Ns(t,e,n){var r,i=e.pendingProps,a=ta.current,s=!1,l=!!(128&e.flags);if((r=l)||(r=(null===t||null!==t.memoizedState)&&!!(2&a)),r?(s=!0,e.flags&=-129):null!==t&&null===t.memoizedState||(a|=1),Ti(ta,1&a),null===t)return co(e),null!==(t=e.memoizedState)&&null!==(t=t.dehydrated)?(1&e.mode?"$!"===t.data?e.lanes=8:e.lanes=1073741824:e.lanes=1,null):(l=i.children,t=i.fallback,s?(i=e.mode,s=e.child,l={mode:"hidden",children:l},1&i||null===s?s=Lc(l,i,0,null):(s.childLanes=0,s.pendingProps=l),t=Bc(t,i,n,null),s.return=e,t.return=e,s.sibling=t,e.child=s,e.child.memoizedState=Ls(n),e.memoizedState=Bs,t):Os(e,l));if(null!==(a=t.memoizedState)&&null!==(r=a.dehydrated))return function(t,e,n,r,i,a,s){if(n)return 256&e.flags?(e.flags&=-257,zs(t,e,s,r=us(Error(o(422))))):null!==e.memoizedState?(e.child=t.child,e.flags|=128,null):(a=r.fallback,i=e.mode,r=Lc({mode:"visible",children:r.children},i,0,null),(a=Bc(a,i,s,null)).flags|=2,r.return=e,a.return=e,r.sibling=a,e.child=r,1&e.mode&&wo(e,t.child,null,s),e.child.memoizedState=Ls(s),e.memoizedState=Bs,a);if(!(1&e.mode))return zs(t,e,s,null);if("$!"===i.data){if(r=i.nextSibling&&i.nextSibling.dataset)var l=r.dgst;return r=l,zs(t,e,s,r=us(a=Error(o(419)),r,void 0))}if(l=!!(s&t.childLanes),vs||l){if(null!==(r=Il)){switch(s&-s){case 4:i=2;break;case 16:i=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:i=32;break;case 536870912:i=268435456;break;default:i=0}0!==(i=i&(r.suspendedLanes|s)?0:i)&&i!==a.retryLane&&(a.retryLane=i,Bo(t,i),nc(r,t,i,-1))}return gc(),zs(t,e,s,r=us(Error(o(421))))}return"$?"===i.data?(e.flags|=128,e.child=t.child,e=Ec.bind(null,t),i._reactRetry=e,null):(t=a.treeContext,ro=ci(i.nextSibling),no=e,io=!0,oo=null,null!==t&&(Yi[qi++]=Xi,Yi[qi++]=Qi,Yi[qi++]=Ki,Xi=t.id,Qi=t.overflow,Ki=e),(e=Os(e,r.children)).flags|=4096,e)}(t,e,l,i,r,a,n);if(s){s=i.fallback,l=e.mode,r=(a=t.child).sibling;var c={mode:"hidden",children:i.children};return 1&l||e.child===a?(i=Fc(a,c)).subtreeFlags=14680064&a.subtreeFlags:((i=e.child).childLanes=0,i.pendingProps=c,e.deletions=null),null!==r?s=Fc(r,s):(s=Bc(s,l,n,null)).flags|=2,s.return=e,i.return=e,i.sibling=s,e.child=i,i=s,s=e.child,l=null===(l=t.child.memoizedState)?Ls(n):{baseLanes:l.baseLanes|n,cachePool:null,transitions:l.transitions},s.memoizedState=l,s.childLanes=t.childLanes&~n,e.memoizedState=Bs,i}return t=(s=t.child).sibling,i=Fc(s,{mode:"visible",children:i.children}),!(1&e.mode)&&(i.lanes=n),i.return=e,i.sibling=null,null!==t&&(null===(n=e.deletions)?(e.deletions=[t],e.flags|=16):n.push(t)),e.child=i,e.memoizedState=null,i}function Os(t,e){return(e=Lc({mode:"visible",children:e},t.mode,0,null)).return=t,t.child=e}function zs(t,e,n,r){return null!==r&&go(r),wo(e,t.child,null,n),(t=Os(e,e.pendingProps.children)).flags|=2,e.memoizedState=null,t}function Us(t,e,n){t.lanes|=e;var r=t.alternate;null!==r&&(r.lanes|=e),Io(t.return,e,n)}function js(t,e,n,r,i){var o=t.memoizedState;null===o?t.memoizedState={isBackwards:e,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:i}:(o.isBackwards=e,o.rendering=null,o.renderingStartTime=0,o.last=r,o.tail=n,o.tailMode=i)}function Vs(t,e,n){var r=e.pendingProps,i=r.revealOrder,o=r.tail;if(_s(t,e,r.children,n),2&(r=ta.current))r=1&r|2,e.flags|=128;else{if(null!==t&&128&t.flags)t:for(t=e.child;null!==t;){if(13===t.tag)null!==t.memoizedState&&Us(t,n,e);else if(19===t.tag)Us(t,n,e);else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break t;for(;null===t.sibling;){if(null===t.return||t.return===e)break t;t=t.return}t.sibling.return=t.return,t=t.sibling}r&=1}if(Ti(ta,r),1&e.mode)switch(i){case"forwards":for(n=e.child,i=null;null!==n;)null!==(t=n.alternate)&&null===ea(t)&&(i=n),n=n.sibling;null===(n=i)?(i=e.child,e.child=null):(i=n.sibling,n.sibling=null),js(e,!1,i,n,o);break;case"backwards":for(n=null,i=e.child,e.child=null;null!==i;){if(null!==(t=i.alternate)&&null===ea(t)){e.child=i;break}t=i.sibling,i.sibling=n,n=i,i=t}js(e,!0,n,null,o);break;case"together":js(e,!1,null,null,void 0);break;default:e.memoizedState=null}else e.memoizedState=null;return e.child}function $s(t,e){!(1&e.mode)&&null!==t&&(t.alternate=null,e.alternate=null,e.flags|=2)}function Ws(t,e,n){if(null!==t&&(e.dependencies=t.dependencies),Ll|=e.lanes,!(n&e.childLanes))return null;if(null!==t&&e.child!==t.child)throw Error(o(153));if(null!==e.child){for(n=Fc(t=e.child,t.pendingProps),e.child=n,n.return=e;null!==t.sibling;)t=t.sibling,(n=n.sibling=Fc(t,t.pendingProps)).return=e;n.sibling=null}return e.child}function Gs(t,e){if(!io)switch(t.tailMode){case"hidden":e=t.tail;for(var n=null;null!==e;)null!==e.alternate&&(n=e),e=e.sibling;null===n?t.tail=null:n.sibling=null;break;case"collapsed":n=t.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?e||null===t.tail?t.tail=null:t.tail.sibling=null:r.sibling=null}}function Hs(t){var e=null!==t.alternate&&t.alternate.child===t.child,n=0,r=0;if(e)for(var i=t.child;null!==i;)n|=i.lanes|i.childLanes,r|=14680064&i.subtreeFlags,r|=14680064&i.flags,i.return=t,i=i.sibling;else for(i=t.child;null!==i;)n|=i.lanes|i.childLanes,r|=i.subtreeFlags,r|=i.flags,i.return=t,i=i.sibling;return t.subtreeFlags|=r,t.childLanes=n,e}function Ys(t,e,n){var r=e.pendingProps;switch(eo(e),e.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return Hs(e),null;case 1:case 17:return Di(e.type)&&Fi(),Hs(e),null;case 3:return r=e.stateNode,Qo(),Ci(Ii),Ci(Pi),ra(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),null!==t&&null!==t.child||(ho(e)?e.flags|=4:null===t||t.memoizedState.isDehydrated&&!(256&e.flags)||(e.flags|=1024,null!==oo&&(ac(oo),oo=null))),Ds(t,e),Hs(e),null;case 5:Jo(e);var i=Ko(qo.current);if(n=e.type,null!==t&&null!=e.stateNode)Fs(t,e,n,r,i),t.ref!==e.ref&&(e.flags|=512,e.flags|=2097152);else{if(!r){if(null===e.stateNode)throw Error(o(166));return Hs(e),null}if(t=Ko(Ho.current),ho(e)){r=e.stateNode,n=e.type;var a=e.memoizedProps;switch(r[hi]=e,r[fi]=a,t=!!(1&e.mode),n){case"dialog":zr("cancel",r),zr("close",r);break;case"iframe":case"object":case"embed":zr("load",r);break;case"video":case"audio":for(i=0;i<Br.length;i++)zr(Br[i],r);break;case"source":zr("error",r);break;case"img":case"image":case"link":zr("error",r),zr("load",r);break;case"details":zr("toggle",r);break;case"input":X(r,a),zr("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!a.multiple},zr("invalid",r);break;case"textarea":it(r,a),zr("invalid",r)}for(var l in bt(n,a),i=null,a)if(a.hasOwnProperty(l)){var c=a[l];"children"===l?"string"==typeof c?r.textContent!==c&&(!0!==a.suppressHydrationWarning&&Zr(r.textContent,c,t),i=["children",c]):"number"==typeof c&&r.textContent!==""+c&&(!0!==a.suppressHydrationWarning&&Zr(r.textContent,c,t),i=["children",""+c]):s.hasOwnProperty(l)&&null!=c&&"onScroll"===l&&zr("scroll",r)}switch(n){case"input":H(r),J(r,a,!0);break;case"textarea":H(r),at(r);break;case"select":case"option":break;default:"function"==typeof a.onClick&&(r.onclick=Jr)}r=i,e.updateQueue=r,null!==r&&(e.flags|=4)}else{l=9===i.nodeType?i:i.ownerDocument,"http://www.w3.org/1999/xhtml"===t&&(t=st(n)),"http://www.w3.org/1999/xhtml"===t?"script"===n?((t=l.createElement("div")).innerHTML="<script><\/script>",t=t.removeChild(t.firstChild)):"string"==typeof r.is?t=l.createElement(n,{is:r.is}):(t=l.createElement(n),"select"===n&&(l=t,r.multiple?l.multiple=!0:r.size&&(l.size=r.size))):t=l.createElementNS(t,n),t[hi]=e,t[fi]=r,Ms(t,e,!1,!1),e.stateNode=t;t:{switch(l=vt(n,r),n){case"dialog":zr("cancel",t),zr("close",t),i=r;break;case"iframe":case"object":case"embed":zr("load",t),i=r;break;case"video":case"audio":for(i=0;i<Br.length;i++)zr(Br[i],t);i=r;break;case"source":zr("error",t),i=r;break;case"img":case"image":case"link":zr("error",t),zr("load",t),i=r;break;case"details":zr("toggle",t),i=r;break;case"input":X(t,r),i=K(t,r),zr("invalid",t);break;case"option":default:i=r;break;case"select":t._wrapperState={wasMultiple:!!r.multiple},i=N({},r,{value:void 0}),zr("invalid",t);break;case"textarea":it(t,r),i=rt(t,r),zr("invalid",t)}for(a in bt(n,i),c=i)if(c.hasOwnProperty(a)){var u=c[a];"style"===a?mt(t,u):"dangerouslySetInnerHTML"===a?null!=(u=u?u.__html:void 0)&&dt(t,u):"children"===a?"string"==typeof u?("textarea"!==n||""!==u)&&ht(t,u):"number"==typeof u&&ht(t,""+u):"suppressContentEditableWarning"!==a&&"suppressHydrationWarning"!==a&&"autoFocus"!==a&&(s.hasOwnProperty(a)?null!=u&&"onScroll"===a&&zr("scroll",t):null!=u&&v(t,a,u,l))}switch(n){case"input":H(t),J(t,r,!1);break;case"textarea":H(t),at(t);break;case"option":null!=r.value&&t.setAttribute("value",""+W(r.value));break;case"select":t.multiple=!!r.multiple,null!=(a=r.value)?nt(t,!!r.multiple,a,!1):null!=r.defaultValue&&nt(t,!!r.multiple,r.defaultValue,!0);break;default:"function"==typeof i.onClick&&(t.onclick=Jr)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break t;case"img":r=!0;break t;default:r=!1}}r&&(e.flags|=4)}null!==e.ref&&(e.flags|=512,e.flags|=2097152)}return Hs(e),null;case 6:if(t&&null!=e.stateNode)Rs(t,e,t.memoizedProps,r);else{if("string"!=typeof r&&null===e.stateNode)throw Error(o(166));if(n=Ko(qo.current),Ko(Ho.current),ho(e)){if(r=e.stateNode,n=e.memoizedProps,r[hi]=e,(a=r.nodeValue!==n)&&null!==(t=no))switch(t.tag){case 3:Zr(r.nodeValue,n,!!(1&t.mode));break;case 5:!0!==t.memoizedProps.suppressHydrationWarning&&Zr(r.nodeValue,n,!!(1&t.mode))}a&&(e.flags|=4)}else(r=(9===n.nodeType?n:n.ownerDocument).createTextNode(r))[hi]=e,e.stateNode=r}return Hs(e),null;case 13:if(Ci(ta),r=e.memoizedState,null===t||null!==t.memoizedState&&null!==t.memoizedState.dehydrated){if(io&&null!==ro&&1&e.mode&&!(128&e.flags))fo(),po(),e.flags|=98560,a=!1;else if(a=ho(e),null!==r&&null!==r.dehydrated){if(null===t){if(!a)throw Error(o(318));if(!(a=null!==(a=e.memoizedState)?a.dehydrated:null))throw Error(o(317));a[hi]=e}else po(),!(128&e.flags)&&(e.memoizedState=null),e.flags|=4;Hs(e),a=!1}else null!==oo&&(ac(oo),oo=null),a=!0;if(!a)return 65536&e.flags?e:null}return 128&e.flags?(e.lanes=n,e):((r=null!==r)!=(null!==t&&null!==t.memoizedState)&&r&&(e.child.flags|=8192,1&e.mode&&(null===t||1&ta.current?0===Rl&&(Rl=3):gc())),null!==e.updateQueue&&(e.flags|=4),Hs(e),null);case 4:return Qo(),Ds(t,e),null===t&&Vr(e.stateNode.containerInfo),Hs(e),null;case 10:return Po(e.type._context),Hs(e),null;case 19:if(Ci(ta),null===(a=e.memoizedState))return Hs(e),null;if(r=!!(128&e.flags),null===(l=a.rendering))if(r)Gs(a,!1);else{if(0!==Rl||null!==t&&128&t.flags)for(t=e.child;null!==t;){if(null!==(l=ea(t))){for(e.flags|=128,Gs(a,!1),null!==(r=l.updateQueue)&&(e.updateQueue=r,e.flags|=4),e.subtreeFlags=0,r=n,n=e.child;null!==n;)t=r,(a=n).flags&=14680066,null===(l=a.alternate)?(a.childLanes=0,a.lanes=t,a.child=null,a.subtreeFlags=0,a.memoizedProps=null,a.memoizedState=null,a.updateQueue=null,a.dependencies=null,a.stateNode=null):(a.childLanes=l.childLanes,a.lanes=l.lanes,a.child=l.child,a.subtreeFlags=0,a.deletions=null,a.memoizedProps=l.memoizedProps,a.memoizedState=l.memoizedState,a.updateQueue=l.updateQueue,a.type=l.type,t=l.dependencies,a.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext}),n=n.sibling;return Ti(ta,1&ta.current|2),e.child}t=t.sibling}null!==a.tail&&Qt()>Vl&&(e.flags|=128,r=!0,Gs(a,!1),e.lanes=4194304)}else{if(!r)if(null!==(t=ea(l))){if(e.flags|=128,r=!0,null!==(n=t.updateQueue)&&(e.updateQueue=n,e.flags|=4),Gs(a,!0),null===a.tail&&"hidden"===a.tailMode&&!l.alternate&&!io)return Hs(e),null}else 2*Qt()-a.renderingStartTime>Vl&&1073741824!==n&&(e.flags|=128,r=!0,Gs(a,!1),e.lanes=4194304);a.isBackwards?(l.sibling=e.child,e.child=l):(null!==(n=a.last)?n.sibling=l:e.child=l,a.last=l)}return null!==a.tail?(e=a.tail,a.rendering=e,a.tail=e.sibling,a.renderingStartTime=Qt(),e.sibling=null,n=ta.current,Ti(ta,r?1&n|2:1&n),e):(Hs(e),null);case 22:case 23:return dc(),r=null!==e.memoizedState,null!==t&&null!==t.memoizedState!==r&&(e.flags|=8192),r&&1&e.mode?!!(1073741824&Dl)&&(Hs(e),6&e.subtreeFlags&&(e.flags|=8192)):Hs(e),null;case 24:case 25:return null}throw Error(o(156,e.tag))}function qs(t,e){switch(eo(e),e.tag){case 1:return Di(e.type)&&Fi(),65536&(t=e.flags)?(e.flags=-65537&t|128,e):null;case 3:return Qo(),Ci(Ii),Ci(Pi),ra(),65536&(t=e.flags)&&!(128&t)?(e.flags=-65537&t|128,e):null;case 5:return Jo(e),null;case 13:if(Ci(ta),null!==(t=e.memoizedState)&&null!==t.dehydrated){if(null===e.alternate)throw Error(o(340));po()}return 65536&(t=e.flags)?(e.flags=-65537&t|128,e):null;case 19:return Ci(ta),null;case 4:return Qo(),null;case 10:return Po(e.type._context),null;case 22:case 23:return dc(),null;default:return null}}Ms=function(t,e){for(var n=e.child;null!==n;){if(5===n.tag||6===n.tag)t.appendChild(n.stateNode);else if(4!==n.tag&&null!==n.child){n.child.return=n,n=n.child;continue}if(n===e)break;for(;null===n.sibling;){if(null===n.return||n.return===e)return;n=n.return}n.sibling.return=n.return,n=n.sibling}},Ds=function(){},Fs=function(t,e,n,r){var i=t.memoizedProps;if(i!==r){t=e.stateNode,Ko(Ho.current);var o,a=null;switch(n){case"input":i=K(t,i),r=K(t,r),a=[];break;case"select":i=N({},i,{value:void 0}),r=N({},r,{value:void 0}),a=[];break;case"textarea":i=rt(t,i),r=rt(t,r),a=[];break;default:"function"!=typeof i.onClick&&"function"==typeof r.onClick&&(t.onclick=Jr)}for(u in bt(n,r),n=null,i)if(!r.hasOwnProperty(u)&&i.hasOwnProperty(u)&&null!=i[u])if("style"===u){var l=i[u];for(o in l)l.hasOwnProperty(o)&&(n||(n={}),n[o]="")}else"dangerouslySetInnerHTML"!==u&&"children"!==u&&"suppressContentEditableWarning"!==u&&"suppressHydrationWarning"!==u&&"autoFocus"!==u&&(s.hasOwnProperty(u)?a||(a=[]):(a=a||[]).push(u,null));for(u in r){var c=r[u];if(l=null!=i?i[u]:void 0,r.hasOwnProperty(u)&&c!==l&&(null!=c||null!=l))if("style"===u)if(l){for(o in l)!l.hasOwnProperty(o)||c&&c.hasOwnProperty(o)||(n||(n={}),n[o]="");for(o in c)c.hasOwnProperty(o)&&l[o]!==c[o]&&(n||(n={}),n[o]=c[o])}else n||(a||(a=[]),a.push(u,n)),n=c;else"dangerouslySetInnerHTML"===u?(c=c?c.__html:void 0,l=l?l.__html:void 0,null!=c&&l!==c&&(a=a||[]).push(u,c)):"children"===u?"string"!=typeof c&&"number"!=typeof c||(a=a||[]).push(u,""+c):"suppressContentEditableWarning"!==u&&"suppressHydrationWarning"!==u&&(s.hasOwnProperty(u)?(null!=c&&"onScroll"===u&&zr("scroll",t),a||l===c||(a=[])):(a=a||[]).push(u,c))}n&&(a=a||[]).push("style",n);var u=a;(e.updateQueue=u)&&(e.flags|=4)}},Rs=function(t,e,n,r){n!==r&&(e.flags|=4)};var Ks=!1,Xs=!1,Qs="function"==typeof WeakSet?WeakSet:Set,Zs=null;function Js(t,e){var n=t.ref;if(null!==n)if("function"==typeof n)try{n(null)}catch(n){kc(t,e,n)}else n.current=null}function tl(t,e,n){try{n()}catch(n){kc(t,e,n)}}var el=!1;function nl(t,e,n){var r=e.updateQueue;if(null!==(r=null!==r?r.lastEffect:null)){var i=r=r.next;do{if((i.tag&t)===t){var o=i.destroy;i.destroy=void 0,void 0!==o&&tl(e,n,o)}i=i.next}while(i!==r)}}function rl(t,e){if(null!==(e=null!==(e=e.updateQueue)?e.lastEffect:null)){var n=e=e.next;do{if((n.tag&t)===t){var r=n.create;n.destroy=r()}n=n.next}while(n!==e)}}function il(t){var e=t.ref;if(null!==e){var n=t.stateNode;t.tag,t=n,"function"==typeof e?e(t):e.current=t}}function ol(t){var e=t.alternate;null!==e&&(t.alternate=null,ol(e)),t.child=null,t.deletions=null,t.sibling=null,5===t.tag&&null!==(e=t.stateNode)&&(delete e[hi],delete e[fi],delete e[gi],delete e[mi],delete e[yi]),t.stateNode=null,t.return=null,t.dependencies=null,t.memoizedProps=null,t.memoizedState=null,t.pendingProps=null,t.stateNode=null,t.updateQueue=null}function al(t){return 5===t.tag||3===t.tag||4===t.tag}function sl(t){t:for(;;){for(;null===t.sibling;){if(null===t.return||al(t.return))return null;t=t.return}for(t.sibling.return=t.return,t=t.sibling;5!==t.tag&&6!==t.tag&&18!==t.tag;){if(2&t.flags)continue t;if(null===t.child||4===t.tag)continue t;t.child.return=t,t=t.child}if(!(2&t.flags))return t.stateNode}}function ll(t,e,n){var r=t.tag;if(5===r||6===r)t=t.stateNode,e?8===n.nodeType?n.parentNode.insertBefore(t,e):n.insertBefore(t,e):(8===n.nodeType?(e=n.parentNode).insertBefore(t,n):(e=n).appendChild(t),null!=(n=n._reactRootContainer)||null!==e.onclick||(e.onclick=Jr));else if(4!==r&&null!==(t=t.child))for(ll(t,e,n),t=t.sibling;null!==t;)ll(t,e,n),t=t.sibling}function cl(t,e,n){var r=t.tag;if(5===r||6===r)t=t.stateNode,e?n.insertBefore(t,e):n.appendChild(t);else if(4!==r&&null!==(t=t.child))for(cl(t,e,n),t=t.sibling;null!==t;)cl(t,e,n),t=t.sibling}var ul=null,dl=!1;function hl(t,e,n){for(n=n.child;null!==n;)fl(t,e,n),n=n.sibling}function fl(t,e,n){if(oe&&"function"==typeof oe.onCommitFiberUnmount)try{oe.onCommitFiberUnmount(ie,n)}catch(t){}switch(n.tag){case 5:Xs||Js(n,e);case 6:var r=ul,i=dl;ul=null,hl(t,e,n),dl=i,null!==(ul=r)&&(dl?(t=ul,n=n.stateNode,8===t.nodeType?t.parentNode.removeChild(n):t.removeChild(n)):ul.removeChild(n.stateNode));break;case 18:null!==ul&&(dl?(t=ul,n=n.stateNode,8===t.nodeType?li(t.parentNode,n):1===t.nodeType&&li(t,n),Ve(t)):li(ul,n.stateNode));break;case 4:r=ul,i=dl,ul=n.stateNode.containerInfo,dl=!0,hl(t,e,n),ul=r,dl=i;break;case 0:case 11:case 14:case 15:if(!Xs&&null!==(r=n.updateQueue)&&null!==(r=r.lastEffect)){i=r=r.next;do{var o=i,a=o.destroy;o=o.tag,void 0!==a&&(2&o||4&o)&&tl(n,e,a),i=i.next}while(i!==r)}hl(t,e,n);break;case 1:if(!Xs&&(Js(n,e),"function"==typeof(r=n.stateNode).componentWillUnmount))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(t){kc(n,e,t)}hl(t,e,n);break;case 21:hl(t,e,n);break;case 22:1&n.mode?(Xs=(r=Xs)||null!==n.memoizedState,hl(t,e,n),Xs=r):hl(t,e,n);break;default:hl(t,e,n)}}function pl(t){var e=t.updateQueue;if(null!==e){t.updateQueue=null;var n=t.stateNode;null===n&&(n=t.stateNode=new Qs),e.forEach((function(e){var r=Pc.bind(null,t,e);n.has(e)||(n.add(e),e.then(r,r))}))}}function gl(t,e){var n=e.deletions;if(null!==n)for(var r=0;r<n.length;r++){var i=n[r];try{var a=t,s=e,l=s;t:for(;null!==l;){switch(l.tag){case 5:ul=l.stateNode,dl=!1;break t;case 3:case 4:ul=l.stateNode.containerInfo,dl=!0;break t}l=l.return}if(null===ul)throw Error(o(160));fl(a,s,i),ul=null,dl=!1;var c=i.alternate;null!==c&&(c.return=null),i.return=null}catch(t){kc(i,e,t)}}if(12854&e.subtreeFlags)for(e=e.child;null!==e;)ml(e,t),e=e.sibling}function ml(t,e){var n=t.alternate,r=t.flags;switch(t.tag){case 0:case 11:case 14:case 15:if(gl(e,t),yl(t),4&r){try{nl(3,t,t.return),rl(3,t)}catch(e){kc(t,t.return,e)}try{nl(5,t,t.return)}catch(e){kc(t,t.return,e)}}break;case 1:gl(e,t),yl(t),512&r&&null!==n&&Js(n,n.return);break;case 5:if(gl(e,t),yl(t),512&r&&null!==n&&Js(n,n.return),32&t.flags){var i=t.stateNode;try{ht(i,"")}catch(e){kc(t,t.return,e)}}if(4&r&&null!=(i=t.stateNode)){var a=t.memoizedProps,s=null!==n?n.memoizedProps:a,l=t.type,c=t.updateQueue;if(t.updateQueue=null,null!==c)try{"input"===l&&"radio"===a.type&&null!=a.name&&Q(i,a),vt(l,s);var u=vt(l,a);for(s=0;s<c.length;s+=2){var d=c[s],h=c[s+1];"style"===d?mt(i,h):"dangerouslySetInnerHTML"===d?dt(i,h):"children"===d?ht(i,h):v(i,d,h,u)}switch(l){case"input":Z(i,a);break;case"textarea":ot(i,a);break;case"select":var f=i._wrapperState.wasMultiple;i._wrapperState.wasMultiple=!!a.multiple;var p=a.value;null!=p?nt(i,!!a.multiple,p,!1):f!==!!a.multiple&&(null!=a.defaultValue?nt(i,!!a.multiple,a.defaultValue,!0):nt(i,!!a.multiple,a.multiple?[]:"",!1))}i[fi]=a}catch(e){kc(t,t.return,e)}}break;case 6:if(gl(e,t),yl(t),4&r){if(null===t.stateNode)throw Error(o(162));i=t.stateNode,a=t.memoizedProps;try{i.nodeValue=a}catch(e){kc(t,t.return,e)}}break;case 3:if(gl(e,t),yl(t),4&r&&null!==n&&n.memoizedState.isDehydrated)try{Ve(e.containerInfo)}catch(e){kc(t,t.return,e)}break;case 4:default:gl(e,t),yl(t);break;case 13:gl(e,t),yl(t),8192&(i=t.child).flags&&(a=null!==i.memoizedState,i.stateNode.isHidden=a,!a||null!==i.alternate&&null!==i.alternate.memoizedState||(jl=Qt())),4&r&&pl(t);break;case 22:if(d=null!==n&&null!==n.memoizedState,1&t.mode?(Xs=(u=Xs)||d,gl(e,t),Xs=u):gl(e,t),yl(t),8192&r){if(u=null!==t.memoizedState,(t.stateNode.isHidden=u)&&!d&&1&t.mode)for(Zs=t,d=t.child;null!==d;){for(h=Zs=d;null!==Zs;){switch(p=(f=Zs).child,f.tag){case 0:case 11:case 14:case 15:nl(4,f,f.return);break;case 1:Js(f,f.return);var g=f.stateNode;if("function"==typeof g.componentWillUnmount){r=f,n=f.return;try{e=r,g.props=e.memoizedProps,g.state=e.memoizedState,g.componentWillUnmount()}catch(t){kc(r,n,t)}}break;case 5:Js(f,f.return);break;case 22:if(null!==f.memoizedState){wl(h);continue}}null!==p?(p.return=f,Zs=p):wl(h)}d=d.sibling}t:for(d=null,h=t;;){if(5===h.tag){if(null===d){d=h;try{i=h.stateNode,u?"function"==typeof(a=i.style).setProperty?a.setProperty("display","none","important"):a.display="none":(l=h.stateNode,s=null!=(c=h.memoizedProps.style)&&c.hasOwnProperty("display")?c.display:null,l.style.display=gt("display",s))}catch(e){kc(t,t.return,e)}}}else if(6===h.tag){if(null===d)try{h.stateNode.nodeValue=u?"":h.memoizedProps}catch(e){kc(t,t.return,e)}}else if((22!==h.tag&&23!==h.tag||null===h.memoizedState||h===t)&&null!==h.child){h.child.return=h,h=h.child;continue}if(h===t)break t;for(;null===h.sibling;){if(null===h.return||h.return===t)break t;d===h&&(d=null),h=h.return}d===h&&(d=null),h.sibling.return=h.return,h=h.sibling}}break;case 19:gl(e,t),yl(t),4&r&&pl(t);case 21:}}function yl(t){var e=t.flags;if(2&e){try{t:{for(var n=t.return;null!==n;){if(al(n)){var r=n;break t}n=n.return}throw Error(o(160))}switch(r.tag){case 5:var i=r.stateNode;32&r.flags&&(ht(i,""),r.flags&=-33),cl(t,sl(t),i);break;case 3:case 4:var a=r.stateNode.containerInfo;ll(t,sl(t),a);break;default:throw Error(o(161))}}catch(e){kc(t,t.return,e)}t.flags&=-3}4096&e&&(t.flags&=-4097)}function bl(t,e,n){Zs=t,vl(t,e,n)}function vl(t,e,n){for(var r=!!(1&t.mode);null!==Zs;){var i=Zs,o=i.child;if(22===i.tag&&r){var a=null!==i.memoizedState||Ks;if(!a){var s=i.alternate,l=null!==s&&null!==s.memoizedState||Xs;s=Ks;var c=Xs;if(Ks=a,(Xs=l)&&!c)for(Zs=i;null!==Zs;)l=(a=Zs).child,22===a.tag&&null!==a.memoizedState?xl(i):null!==l?(l.return=a,Zs=l):xl(i);for(;null!==o;)Zs=o,vl(o,e,n),o=o.sibling;Zs=i,Ks=s,Xs=c}_l(t)}else 8772&i.subtreeFlags&&null!==o?(o.return=i,Zs=o):_l(t)}}function _l(t){for(;null!==Zs;){var e=Zs;if(8772&e.flags){var n=e.alternate;try{if(8772&e.flags)switch(e.tag){case 0:case 11:case 15:Xs||rl(5,e);break;case 1:var r=e.stateNode;if(4&e.flags&&!Xs)if(null===n)r.componentDidMount();else{var i=e.elementType===e.type?n.memoizedProps:ns(e.type,n.memoizedProps);r.componentDidUpdate(i,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var a=e.updateQueue;null!==a&&Wo(e,a,r);break;case 3:var s=e.updateQueue;if(null!==s){if(n=null,null!==e.child)switch(e.child.tag){case 5:case 1:n=e.child.stateNode}Wo(e,s,n)}break;case 5:var l=e.stateNode;if(null===n&&4&e.flags){n=l;var c=e.memoizedProps;switch(e.type){case"button":case"input":case"select":case"textarea":c.autoFocus&&n.focus();break;case"img":c.src&&(n.src=c.src)}}break;case 6:case 4:case 12:case 19:case 17:case 21:case 22:case 23:case 25:break;case 13:if(null===e.memoizedState){var u=e.alternate;if(null!==u){var d=u.memoizedState;if(null!==d){var h=d.dehydrated;null!==h&&Ve(h)}}}break;default:throw Error(o(163))}Xs||512&e.flags&&il(e)}catch(t){kc(e,e.return,t)}}if(e===t){Zs=null;break}if(null!==(n=e.sibling)){n.return=e.return,Zs=n;break}Zs=e.return}}function wl(t){for(;null!==Zs;){var e=Zs;if(e===t){Zs=null;break}var n=e.sibling;if(null!==n){n.return=e.return,Zs=n;break}Zs=e.return}}function xl(t){for(;null!==Zs;){var e=Zs;try{switch(e.tag){case 0:case 11:case 15:var n=e.return;try{rl(4,e)}catch(t){kc(e,n,t)}break;case 1:var r=e.stateNode;if("function"==typeof r.componentDidMount){var i=e.return;try{r.componentDidMount()}catch(t){kc(e,i,t)}}var o=e.return;try{il(e)}catch(t){kc(e,o,t)}break;case 5:var a=e.return;try{il(e)}catch(t){kc(e,a,t)}}}catch(t){kc(e,e.return,t)}if(e===t){Zs=null;break}var s=e.sibling;if(null!==s){s.return=e.return,Zs=s;break}Zs=e.return}}var Sl,kl=Math.ceil,Cl=_.ReactCurrentDispatcher,Tl=_.ReactCurrentOwner,El=_.ReactCurrentBatchConfig,Pl=0,Il=null,Al=null,Ml=0,Dl=0,Fl=ki(0),Rl=0,Bl=null,Ll=0,Nl=0,Ol=0,zl=null,Ul=null,jl=0,Vl=1/0,$l=null,Wl=!1,Gl=null,Hl=null,Yl=!1,ql=null,Kl=0,Xl=0,Ql=null,Zl=-1,Jl=0;function tc(){return 6&Pl?Qt():-1!==Zl?Zl:Zl=Qt()}function ec(t){return 1&t.mode?2&Pl&&0!==Ml?Ml&-Ml:null!==mo.transition?(0===Jl&&(Jl=ge()),Jl):0!==(t=ve)?t:t=void 0===(t=window.event)?16:Xe(t.type):1}function nc(t,e,n,r){if(50<Xl)throw Xl=0,Ql=null,Error(o(185));ye(t,n,r),2&Pl&&t===Il||(t===Il&&(!(2&Pl)&&(Nl|=n),4===Rl&&sc(t,Ml)),rc(t,r),1===n&&0===Pl&&!(1&e.mode)&&(Vl=Qt()+500,zi&&Vi()))}function rc(t,e){var n=t.callbackNode;!function(t,e){for(var n=t.suspendedLanes,r=t.pingedLanes,i=t.expirationTimes,o=t.pendingLanes;0<o;){var a=31-ae(o),s=1<<a,l=i[a];-1===l?s&n&&!(s&r)||(i[a]=fe(s,e)):l<=e&&(t.expiredLanes|=s),o&=~s}}(t,e);var r=he(t,t===Il?Ml:0);if(0===r)null!==n&&qt(n),t.callbackNode=null,t.callbackPriority=0;else if(e=r&-r,t.callbackPriority!==e){if(null!=n&&qt(n),1===e)0===t.tag?function(t){zi=!0,ji(t)}(lc.bind(null,t)):ji(lc.bind(null,t)),ai((function(){!(6&Pl)&&Vi()})),n=null;else{switch(_e(r)){case 1:n=Jt;break;case 4:n=te;break;case 16:default:n=ee;break;case 536870912:n=re}n=Ic(n,ic.bind(null,t))}t.callbackPriority=e,t.callbackNode=n}}function ic(t,e){if(Zl=-1,Jl=0,6&Pl)throw Error(o(327));var n=t.callbackNode;if(xc()&&t.callbackNode!==n)return null;var r=he(t,t===Il?Ml:0);if(0===r)return null;if(30&r||r&t.expiredLanes||e)e=mc(t,r);else{e=r;var i=Pl;Pl|=2;var a=pc();for(Il===t&&Ml===e||($l=null,Vl=Qt()+500,hc(t,e));;)try{bc();break}catch(e){fc(t,e)}Eo(),Cl.current=a,Pl=i,null!==Al?e=0:(Il=null,Ml=0,e=Rl)}if(0!==e){if(2===e&&0!==(i=pe(t))&&(r=i,e=oc(t,i)),1===e)throw n=Bl,hc(t,0),sc(t,r),rc(t,Qt()),n;if(6===e)sc(t,r);else{if(i=t.current.alternate,!(30&r||function(t){for(var e=t;;){if(16384&e.flags){var n=e.updateQueue;if(null!==n&&null!==(n=n.stores))for(var r=0;r<n.length;r++){var i=n[r],o=i.getSnapshot;i=i.value;try{if(!sr(o(),i))return!1}catch(t){return!1}}}if(n=e.child,16384&e.subtreeFlags&&null!==n)n.return=e,e=n;else{if(e===t)break;for(;null===e.sibling;){if(null===e.return||e.return===t)return!0;e=e.return}e.sibling.return=e.return,e=e.sibling}}return!0}(i)||(e=mc(t,r),2===e&&(a=pe(t),0!==a&&(r=a,e=oc(t,a))),1!==e)))throw n=Bl,hc(t,0),sc(t,r),rc(t,Qt()),n;switch(t.finishedWork=i,t.finishedLanes=r,e){case 0:case 1:throw Error(o(345));case 2:case 5:wc(t,Ul,$l);break;case 3:if(sc(t,r),(130023424&r)===r&&10<(e=jl+500-Qt())){if(0!==he(t,0))break;if(((i=t.suspendedLanes)&r)!==r){tc(),t.pingedLanes|=t.suspendedLanes&i;break}t.timeoutHandle=ri(wc.bind(null,t,Ul,$l),e);break}wc(t,Ul,$l);break;case 4:if(sc(t,r),(4194240&r)===r)break;for(e=t.eventTimes,i=-1;0<r;){var s=31-ae(r);a=1<<s,(s=e[s])>i&&(i=s),r&=~a}if(r=i,10<(r=(120>(r=Qt()-r)?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*kl(r/1960))-r)){t.timeoutHandle=ri(wc.bind(null,t,Ul,$l),r);break}wc(t,Ul,$l);break;default:throw Error(o(329))}}}return rc(t,Qt()),t.callbackNode===n?ic.bind(null,t):null}function oc(t,e){var n=zl;return t.current.memoizedState.isDehydrated&&(hc(t,e).flags|=256),2!==(t=mc(t,e))&&(e=Ul,Ul=n,null!==e&&ac(e)),t}function ac(t){null===Ul?Ul=t:Ul.push.apply(Ul,t)}function sc(t,e){for(e&=~Ol,e&=~Nl,t.suspendedLanes|=e,t.pingedLanes&=~e,t=t.expirationTimes;0<e;){var n=31-ae(e),r=1<<n;t[n]=-1,e&=~r}}function lc(t){if(6&Pl)throw Error(o(327));xc();var e=he(t,0);if(!(1&e))return rc(t,Qt()),null;var n=mc(t,e);if(0!==t.tag&&2===n){var r=pe(t);0!==r&&(e=r,n=oc(t,r))}if(1===n)throw n=Bl,hc(t,0),sc(t,e),rc(t,Qt()),n;if(6===n)throw Error(o(345));return t.finishedWork=t.current.alternate,t.finishedLanes=e,wc(t,Ul,$l),rc(t,Qt()),null}function cc(t,e){var n=Pl;Pl|=1;try{return t(e)}finally{0===(Pl=n)&&(Vl=Qt()+500,zi&&Vi())}}function uc(t){null!==ql&&0===ql.tag&&!(6&Pl)&&xc();var e=Pl;Pl|=1;var n=El.transition,r=ve;try{if(El.transition=null,ve=1,t)return t()}finally{ve=r,El.transition=n,!(6&(Pl=e))&&Vi()}}function dc(){Dl=Fl.current,Ci(Fl)}function hc(t,e){t.finishedWork=null,t.finishedLanes=0;var n=t.timeoutHandle;if(-1!==n&&(t.timeoutHandle=-1,ii(n)),null!==Al)for(n=Al.return;null!==n;){var r=n;switch(eo(r),r.tag){case 1:null!=(r=r.type.childContextTypes)&&Fi();break;case 3:Qo(),Ci(Ii),Ci(Pi),ra();break;case 5:Jo(r);break;case 4:Qo();break;case 13:case 19:Ci(ta);break;case 10:Po(r.type._context);break;case 22:case 23:dc()}n=n.return}if(Il=t,Al=t=Fc(t.current,null),Ml=Dl=e,Rl=0,Bl=null,Ol=Nl=Ll=0,Ul=zl=null,null!==Do){for(e=0;e<Do.length;e++)if(null!==(r=(n=Do[e]).interleaved)){n.interleaved=null;var i=r.next,o=n.pending;if(null!==o){var a=o.next;o.next=i,r.next=a}n.pending=r}Do=null}return t}function fc(t,e){for(;;){var n=Al;try{if(Eo(),ia.current=Za,ua){for(var r=sa.memoizedState;null!==r;){var i=r.queue;null!==i&&(i.pending=null),r=r.next}ua=!1}if(aa=0,ca=la=sa=null,da=!1,ha=0,Tl.current=null,null===n||null===n.return){Rl=1,Bl=e,Al=null;break}t:{var a=t,s=n.return,l=n,c=e;if(e=Ml,l.flags|=32768,null!==c&&"object"==typeof c&&"function"==typeof c.then){var u=c,d=l,h=d.tag;if(!(1&d.mode||0!==h&&11!==h&&15!==h)){var f=d.alternate;f?(d.updateQueue=f.updateQueue,d.memoizedState=f.memoizedState,d.lanes=f.lanes):(d.updateQueue=null,d.memoizedState=null)}var p=ms(s);if(null!==p){p.flags&=-257,ys(p,s,l,0,e),1&p.mode&&gs(a,u,e),c=u;var g=(e=p).updateQueue;if(null===g){var m=new Set;m.add(c),e.updateQueue=m}else g.add(c);break t}if(!(1&e)){gs(a,u,e),gc();break t}c=Error(o(426))}else if(io&&1&l.mode){var y=ms(s);if(null!==y){!(65536&y.flags)&&(y.flags|=256),ys(y,s,l,0,e),go(cs(c,l));break t}}a=c=cs(c,l),4!==Rl&&(Rl=2),null===zl?zl=[a]:zl.push(a),a=s;do{switch(a.tag){case 3:a.flags|=65536,e&=-e,a.lanes|=e,Vo(a,fs(0,c,e));break t;case 1:l=c;var b=a.type,v=a.stateNode;if(!(128&a.flags||"function"!=typeof b.getDerivedStateFromError&&(null===v||"function"!=typeof v.componentDidCatch||null!==Hl&&Hl.has(v)))){a.flags|=65536,e&=-e,a.lanes|=e,Vo(a,ps(a,l,e));break t}}a=a.return}while(null!==a)}_c(n)}catch(t){e=t,Al===n&&null!==n&&(Al=n=n.return);continue}break}}function pc(){var t=Cl.current;return Cl.current=Za,null===t?Za:t}function gc(){0!==Rl&&3!==Rl&&2!==Rl||(Rl=4),null===Il||!(268435455&Ll)&&!(268435455&Nl)||sc(Il,Ml)}function mc(t,e){var n=Pl;Pl|=2;var r=pc();for(Il===t&&Ml===e||($l=null,hc(t,e));;)try{yc();break}catch(e){fc(t,e)}if(Eo(),Pl=n,Cl.current=r,null!==Al)throw Error(o(261));return Il=null,Ml=0,Rl}function yc(){for(;null!==Al;)vc(Al)}function bc(){for(;null!==Al&&!Kt();)vc(Al)}function vc(t){var e=Sl(t.alternate,t,Dl);t.memoizedProps=t.pendingProps,null===e?_c(t):Al=e,Tl.current=null}function _c(t){var e=t;do{var n=e.alternate;if(t=e.return,32768&e.flags){if(null!==(n=qs(n,e)))return n.flags&=32767,void(Al=n);if(null===t)return Rl=6,void(Al=null);t.flags|=32768,t.subtreeFlags=0,t.deletions=null}else if(null!==(n=Ys(n,e,Dl)))return void(Al=n);if(null!==(e=e.sibling))return void(Al=e);Al=e=t}while(null!==e);0===Rl&&(Rl=5)}function wc(t,e,n){var r=ve,i=El.transition;try{El.transition=null,ve=1,function(t,e,n,r){do{xc()}while(null!==ql);if(6&Pl)throw Error(o(327));n=t.finishedWork;var i=t.finishedLanes;if(null===n)return null;if(t.finishedWork=null,t.finishedLanes=0,n===t.current)throw Error(o(177));t.callbackNode=null,t.callbackPriority=0;var a=n.lanes|n.childLanes;if(function(t,e){var n=t.pendingLanes&~e;t.pendingLanes=e,t.suspendedLanes=0,t.pingedLanes=0,t.expiredLanes&=e,t.mutableReadLanes&=e,t.entangledLanes&=e,e=t.entanglements;var r=t.eventTimes;for(t=t.expirationTimes;0<n;){var i=31-ae(n),o=1<<i;e[i]=0,r[i]=-1,t[i]=-1,n&=~o}}(t,a),t===Il&&(Al=Il=null,Ml=0),!(2064&n.subtreeFlags)&&!(2064&n.flags)||Yl||(Yl=!0,Ic(ee,(function(){return xc(),null}))),a=!!(15990&n.flags),15990&n.subtreeFlags||a){a=El.transition,El.transition=null;var s=ve;ve=1;var l=Pl;Pl|=4,Tl.current=null,function(t,e){if(ti=We,fr(t=hr())){if("selectionStart"in t)var n={start:t.selectionStart,end:t.selectionEnd};else t:{var r=(n=(n=t.ownerDocument)&&n.defaultView||window).getSelection&&n.getSelection();if(r&&0!==r.rangeCount){n=r.anchorNode;var i=r.anchorOffset,a=r.focusNode;r=r.focusOffset;try{n.nodeType,a.nodeType}catch(t){n=null;break t}var s=0,l=-1,c=-1,u=0,d=0,h=t,f=null;e:for(;;){for(var p;h!==n||0!==i&&3!==h.nodeType||(l=s+i),h!==a||0!==r&&3!==h.nodeType||(c=s+r),3===h.nodeType&&(s+=h.nodeValue.length),null!==(p=h.firstChild);)f=h,h=p;for(;;){if(h===t)break e;if(f===n&&++u===i&&(l=s),f===a&&++d===r&&(c=s),null!==(p=h.nextSibling))break;f=(h=f).parentNode}h=p}n=-1===l||-1===c?null:{start:l,end:c}}else n=null}n=n||{start:0,end:0}}else n=null;for(ei={focusedElem:t,selectionRange:n},We=!1,Zs=e;null!==Zs;)if(t=(e=Zs).child,1028&e.subtreeFlags&&null!==t)t.return=e,Zs=t;else for(;null!==Zs;){e=Zs;try{var g=e.alternate;if(1024&e.flags)switch(e.tag){case 0:case 11:case 15:case 5:case 6:case 4:case 17:break;case 1:if(null!==g){var m=g.memoizedProps,y=g.memoizedState,b=e.stateNode,v=b.getSnapshotBeforeUpdate(e.elementType===e.type?m:ns(e.type,m),y);b.__reactInternalSnapshotBeforeUpdate=v}break;case 3:var _=e.stateNode.containerInfo;1===_.nodeType?_.textContent="":9===_.nodeType&&_.documentElement&&_.removeChild(_.documentElement);break;default:throw Error(o(163))}}catch(t){kc(e,e.return,t)}if(null!==(t=e.sibling)){t.return=e.return,Zs=t;break}Zs=e.return}g=el,el=!1}(t,n),ml(n,t),pr(ei),We=!!ti,ei=ti=null,t.current=n,bl(n,t,i),Xt(),Pl=l,ve=s,El.transition=a}else t.current=n;if(Yl&&(Yl=!1,ql=t,Kl=i),0===(a=t.pendingLanes)&&(Hl=null),function(t){if(oe&&"function"==typeof oe.onCommitFiberRoot)try{oe.onCommitFiberRoot(ie,t,void 0,!(128&~t.current.flags))}catch(t){}}(n.stateNode),rc(t,Qt()),null!==e)for(r=t.onRecoverableError,n=0;n<e.length;n++)r((i=e[n]).value,{componentStack:i.stack,digest:i.digest});if(Wl)throw Wl=!1,t=Gl,Gl=null,t;!!(1&Kl)&&0!==t.tag&&xc(),1&(a=t.pendingLanes)?t===Ql?Xl++:(Xl=0,Ql=t):Xl=0,Vi()}(t,e,n,r)}finally{El.transition=i,ve=r}return null}function xc(){if(null!==ql){var t=_e(Kl),e=El.transition,n=ve;try{if(El.transition=null,ve=16>t?16:t,null===ql)var r=!1;else{if(t=ql,ql=null,Kl=0,6&Pl)throw Error(o(331));var i=Pl;for(Pl|=4,Zs=t.current;null!==Zs;){var a=Zs,s=a.child;if(16&Zs.flags){var l=a.deletions;if(null!==l){for(var c=0;c<l.length;c++){var u=l[c];for(Zs=u;null!==Zs;){var d=Zs;switch(d.tag){case 0:case 11:case 15:nl(8,d,a)}var h=d.child;if(null!==h)h.return=d,Zs=h;else for(;null!==Zs;){var f=(d=Zs).sibling,p=d.return;if(ol(d),d===u){Zs=null;break}if(null!==f){f.return=p,Zs=f;break}Zs=p}}}var g=a.alternate;if(null!==g){var m=g.child;if(null!==m){g.child=null;do{var y=m.sibling;m.sibling=null,m=y}while(null!==m)}}Zs=a}}if(2064&a.subtreeFlags&&null!==s)s.return=a,Zs=s;else t:for(;null!==Zs;){if(2048&(a=Zs).flags)switch(a.tag){case 0:case 11:case 15:nl(9,a,a.return)}var b=a.sibling;if(null!==b){b.return=a.return,Zs=b;break t}Zs=a.return}}var v=t.current;for(Zs=v;null!==Zs;){var _=(s=Zs).child;if(2064&s.subtreeFlags&&null!==_)_.return=s,Zs=_;else t:for(s=v;null!==Zs;){if(2048&(l=Zs).flags)try{switch(l.tag){case 0:case 11:case 15:rl(9,l)}}catch(t){kc(l,l.return,t)}if(l===s){Zs=null;break t}var w=l.sibling;if(null!==w){w.return=l.return,Zs=w;break t}Zs=l.return}}if(Pl=i,Vi(),oe&&"function"==typeof oe.onPostCommitFiberRoot)try{oe.onPostCommitFiberRoot(ie,t)}catch(t){}r=!0}return r}finally{ve=n,El.transition=e}}return!1}function Sc(t,e,n){t=Uo(t,e=fs(0,e=cs(n,e),1),1),e=tc(),null!==t&&(ye(t,1,e),rc(t,e))}function kc(t,e,n){if(3===t.tag)Sc(t,t,n);else for(;null!==e;){if(3===e.tag){Sc(e,t,n);break}if(1===e.tag){var r=e.stateNode;if("function"==typeof e.type.getDerivedStateFromError||"function"==typeof r.componentDidCatch&&(null===Hl||!Hl.has(r))){e=Uo(e,t=ps(e,t=cs(n,t),1),1),t=tc(),null!==e&&(ye(e,1,t),rc(e,t));break}}e=e.return}}function Cc(t,e,n){var r=t.pingCache;null!==r&&r.delete(e),e=tc(),t.pingedLanes|=t.suspendedLanes&n,Il===t&&(Ml&n)===n&&(4===Rl||3===Rl&&(130023424&Ml)===Ml&&500>Qt()-jl?hc(t,0):Ol|=n),rc(t,e)}function Tc(t,e){0===e&&(1&t.mode?(e=ue,!(130023424&(ue<<=1))&&(ue=4194304)):e=1);var n=tc();null!==(t=Bo(t,e))&&(ye(t,e,n),rc(t,n))}function Ec(t){var e=t.memoizedState,n=0;null!==e&&(n=e.retryLane),Tc(t,n)}function Pc(t,e){var n=0;switch(t.tag){case 13:var r=t.stateNode,i=t.memoizedState;null!==i&&(n=i.retryLane);break;case 19:r=t.stateNode;break;default:throw Error(o(314))}null!==r&&r.delete(e),Tc(t,n)}function Ic(t,e){return Yt(t,e)}function Ac(t,e,n,r){this.tag=t,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=e,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Mc(t,e,n,r){return new Ac(t,e,n,r)}function Dc(t){return!(!(t=t.prototype)||!t.isReactComponent)}function Fc(t,e){var n=t.alternate;return null===n?((n=Mc(t.tag,e,t.key,t.mode)).elementType=t.elementType,n.type=t.type,n.stateNode=t.stateNode,n.alternate=t,t.alternate=n):(n.pendingProps=e,n.type=t.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=14680064&t.flags,n.childLanes=t.childLanes,n.lanes=t.lanes,n.child=t.child,n.memoizedProps=t.memoizedProps,n.memoizedState=t.memoizedState,n.updateQueue=t.updateQueue,e=t.dependencies,n.dependencies=null===e?null:{lanes:e.lanes,firstContext:e.firstContext},n.sibling=t.sibling,n.index=t.index,n.ref=t.ref,n}function Rc(t,e,n,r,i,a){var s=2;if(r=t,"function"==typeof t)Dc(t)&&(s=1);else if("string"==typeof t)s=5;else t:switch(t){case S:return Bc(n.children,i,a,e);case k:s=8,i|=8;break;case C:return(t=Mc(12,n,e,2|i)).elementType=C,t.lanes=a,t;case I:return(t=Mc(13,n,e,i)).elementType=I,t.lanes=a,t;case A:return(t=Mc(19,n,e,i)).elementType=A,t.lanes=a,t;case F:return Lc(n,i,a,e);default:if("object"==typeof t&&null!==t)switch(t.$$typeof){case T:s=10;break t;case E:s=9;break t;case P:s=11;break t;case M:s=14;break t;case D:s=16,r=null;break t}throw Error(o(130,null==t?t:typeof t,""))}return(e=Mc(s,n,e,i)).elementType=t,e.type=r,e.lanes=a,e}function Bc(t,e,n,r){return(t=Mc(7,t,r,e)).lanes=n,t}function Lc(t,e,n,r){return(t=Mc(22,t,r,e)).elementType=F,t.lanes=n,t.stateNode={isHidden:!1},t}function Nc(t,e,n){return(t=Mc(6,t,null,e)).lanes=n,t}function Oc(t,e,n){return(e=Mc(4,null!==t.children?t.children:[],t.key,e)).lanes=n,e.stateNode={containerInfo:t.containerInfo,pendingChildren:null,implementation:t.implementation},e}function zc(t,e,n,r,i){this.tag=e,this.containerInfo=t,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=me(0),this.expirationTimes=me(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=me(0),this.identifierPrefix=r,this.onRecoverableError=i,this.mutableSourceEagerHydrationData=null}function Uc(t,e,n,r,i,o,a,s,l){return t=new zc(t,e,n,s,l),1===e?(e=1,!0===o&&(e|=8)):e=0,o=Mc(3,null,null,e),t.current=o,o.stateNode=t,o.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},No(o),t}function jc(t){if(!t)return Ei;t:{if(Vt(t=t._reactInternals)!==t||1!==t.tag)throw Error(o(170));var e=t;do{switch(e.tag){case 3:e=e.stateNode.context;break t;case 1:if(Di(e.type)){e=e.stateNode.__reactInternalMemoizedMergedChildContext;break t}}e=e.return}while(null!==e);throw Error(o(171))}if(1===t.tag){var n=t.type;if(Di(n))return Bi(t,n,e)}return e}function Vc(t,e,n,r,i,o,a,s,l){return(t=Uc(n,r,!0,t,0,o,0,s,l)).context=jc(null),n=t.current,(o=zo(r=tc(),i=ec(n))).callback=null!=e?e:null,Uo(n,o,i),t.current.lanes=i,ye(t,i,r),rc(t,r),t}function $c(t,e,n,r){var i=e.current,o=tc(),a=ec(i);return n=jc(n),null===e.context?e.context=n:e.pendingContext=n,(e=zo(o,a)).payload={element:t},null!==(r=void 0===r?null:r)&&(e.callback=r),null!==(t=Uo(i,e,a))&&(nc(t,i,a,o),jo(t,i,a)),a}function Wc(t){return(t=t.current).child?(t.child.tag,t.child.stateNode):null}function Gc(t,e){if(null!==(t=t.memoizedState)&&null!==t.dehydrated){var n=t.retryLane;t.retryLane=0!==n&&n<e?n:e}}function Hc(t,e){Gc(t,e),(t=t.alternate)&&Gc(t,e)}Sl=function(t,e,n){if(null!==t)if(t.memoizedProps!==e.pendingProps||Ii.current)vs=!0;else{if(!(t.lanes&n||128&e.flags))return vs=!1,function(t,e,n){switch(e.tag){case 3:Is(e),po();break;case 5:Zo(e);break;case 1:Di(e.type)&&Li(e);break;case 4:Xo(e,e.stateNode.containerInfo);break;case 10:var r=e.type._context,i=e.memoizedProps.value;Ti(So,r._currentValue),r._currentValue=i;break;case 13:if(null!==(r=e.memoizedState))return null!==r.dehydrated?(Ti(ta,1&ta.current),e.flags|=128,null):n&e.child.childLanes?Ns(t,e,n):(Ti(ta,1&ta.current),null!==(t=Ws(t,e,n))?t.sibling:null);Ti(ta,1&ta.current);break;case 19:if(r=!!(n&e.childLanes),128&t.flags){if(r)return Vs(t,e,n);e.flags|=128}if(null!==(i=e.memoizedState)&&(i.rendering=null,i.tail=null,i.lastEffect=null),Ti(ta,ta.current),r)break;return null;case 22:case 23:return e.lanes=0,ks(t,e,n)}return Ws(t,e,n)}(t,e,n);vs=!!(131072&t.flags)}else vs=!1,io&&1048576&e.flags&&Ji(e,Hi,e.index);switch(e.lanes=0,e.tag){case 2:var r=e.type;$s(t,e),t=e.pendingProps;var i=Mi(e,Pi.current);Ao(e,n),i=ma(null,e,r,t,i,n);var a=ya();return e.flags|=1,"object"==typeof i&&null!==i&&"function"==typeof i.render&&void 0===i.$$typeof?(e.tag=1,e.memoizedState=null,e.updateQueue=null,Di(r)?(a=!0,Li(e)):a=!1,e.memoizedState=null!==i.state&&void 0!==i.state?i.state:null,No(e),i.updater=is,e.stateNode=i,i._reactInternals=e,ls(e,r,t,n),e=Ps(null,e,r,!0,a,n)):(e.tag=0,io&&a&&to(e),_s(null,e,i,n),e=e.child),e;case 16:r=e.elementType;t:{switch($s(t,e),t=e.pendingProps,r=(i=r._init)(r._payload),e.type=r,i=e.tag=function(t){if("function"==typeof t)return Dc(t)?1:0;if(null!=t){if((t=t.$$typeof)===P)return 11;if(t===M)return 14}return 2}(r),t=ns(r,t),i){case 0:e=Ts(null,e,r,t,n);break t;case 1:e=Es(null,e,r,t,n);break t;case 11:e=ws(null,e,r,t,n);break t;case 14:e=xs(null,e,r,ns(r.type,t),n);break t}throw Error(o(306,r,""))}return e;case 0:return r=e.type,i=e.pendingProps,Ts(t,e,r,i=e.elementType===r?i:ns(r,i),n);case 1:return r=e.type,i=e.pendingProps,Es(t,e,r,i=e.elementType===r?i:ns(r,i),n);case 3:t:{if(Is(e),null===t)throw Error(o(387));r=e.pendingProps,i=(a=e.memoizedState).element,Oo(t,e),$o(e,r,null,n);var s=e.memoizedState;if(r=s.element,a.isDehydrated){if(a={element:r,isDehydrated:!1,cache:s.cache,pendingSuspenseBoundaries:s.pendingSuspenseBoundaries,transitions:s.transitions},e.updateQueue.baseState=a,e.memoizedState=a,256&e.flags){e=As(t,e,r,n,i=cs(Error(o(423)),e));break t}if(r!==i){e=As(t,e,r,n,i=cs(Error(o(424)),e));break t}for(ro=ci(e.stateNode.containerInfo.firstChild),no=e,io=!0,oo=null,n=xo(e,null,r,n),e.child=n;n;)n.flags=-3&n.flags|4096,n=n.sibling}else{if(po(),r===i){e=Ws(t,e,n);break t}_s(t,e,r,n)}e=e.child}return e;case 5:return Zo(e),null===t&&co(e),r=e.type,i=e.pendingProps,a=null!==t?t.memoizedProps:null,s=i.children,ni(r,i)?s=null:null!==a&&ni(r,a)&&(e.flags|=32),Cs(t,e),_s(t,e,s,n),e.child;case 6:return null===t&&co(e),null;case 13:return Ns(t,e,n);case 4:return Xo(e,e.stateNode.containerInfo),r=e.pendingProps,null===t?e.child=wo(e,null,r,n):_s(t,e,r,n),e.child;case 11:return r=e.type,i=e.pendingProps,ws(t,e,r,i=e.elementType===r?i:ns(r,i),n);case 7:return _s(t,e,e.pendingProps,n),e.child;case 8:case 12:return _s(t,e,e.pendingProps.children,n),e.child;case 10:t:{if(r=e.type._context,i=e.pendingProps,a=e.memoizedProps,s=i.value,Ti(So,r._currentValue),r._currentValue=s,null!==a)if(sr(a.value,s)){if(a.children===i.children&&!Ii.current){e=Ws(t,e,n);break t}}else for(null!==(a=e.child)&&(a.return=e);null!==a;){var l=a.dependencies;if(null!==l){s=a.child;for(var c=l.firstContext;null!==c;){if(c.context===r){if(1===a.tag){(c=zo(-1,n&-n)).tag=2;var u=a.updateQueue;if(null!==u){var d=(u=u.shared).pending;null===d?c.next=c:(c.next=d.next,d.next=c),u.pending=c}}a.lanes|=n,null!==(c=a.alternate)&&(c.lanes|=n),Io(a.return,n,e),l.lanes|=n;break}c=c.next}}else if(10===a.tag)s=a.type===e.type?null:a.child;else if(18===a.tag){if(null===(s=a.return))throw Error(o(341));s.lanes|=n,null!==(l=s.alternate)&&(l.lanes|=n),Io(s,n,e),s=a.sibling}else s=a.child;if(null!==s)s.return=a;else for(s=a;null!==s;){if(s===e){s=null;break}if(null!==(a=s.sibling)){a.return=s.return,s=a;break}s=s.return}a=s}_s(t,e,i.children,n),e=e.child}return e;case 9:return i=e.type,r=e.pendingProps.children,Ao(e,n),r=r(i=Mo(i)),e.flags|=1,_s(t,e,r,n),e.child;case 14:return i=ns(r=e.type,e.pendingProps),xs(t,e,r,i=ns(r.type,i),n);case 15:return Ss(t,e,e.type,e.pendingProps,n);case 17:return r=e.type,i=e.pendingProps,i=e.elementType===r?i:ns(r,i),$s(t,e),e.tag=1,Di(r)?(t=!0,Li(e)):t=!1,Ao(e,n),as(e,r,i),ls(e,r,i,n),Ps(null,e,r,!0,t,n);case 19:return Vs(t,e,n);case 22:return ks(t,e,n)}throw Error(o(156,e.tag))};var Yc="function"==typeof reportError?reportError:function(t){console.error(t)};function qc(t){this._internalRoot=t}function Kc(t){this._internalRoot=t}function Xc(t){return!(!t||1!==t.nodeType&&9!==t.nodeType&&11!==t.nodeType)}function Qc(t){return!(!t||1!==t.nodeType&&9!==t.nodeType&&11!==t.nodeType&&(8!==t.nodeType||" react-mount-point-unstable "!==t.nodeValue))}function Zc(){}function Jc(t,e,n,r,i){var o=n._reactRootContainer;if(o){var a=o;if("function"==typeof i){var s=i;i=function(){var t=Wc(a);s.call(t)}}$c(e,a,t,i)}else a=function(t,e,n,r,i){if(i){if("function"==typeof r){var o=r;r=function(){var t=Wc(a);o.call(t)}}var a=Vc(e,r,t,0,null,!1,0,"",Zc);return t._reactRootContainer=a,t[pi]=a.current,Vr(8===t.nodeType?t.parentNode:t),uc(),a}for(;i=t.lastChild;)t.removeChild(i);if("function"==typeof r){var s=r;r=function(){var t=Wc(l);s.call(t)}}var l=Uc(t,0,!1,null,0,!1,0,"",Zc);return t._reactRootContainer=l,t[pi]=l.current,Vr(8===t.nodeType?t.parentNode:t),uc((function(){$c(e,l,n,r)})),l}(n,e,t,i,r);return Wc(a)}Kc.prototype.render=qc.prototype.render=function(t){var e=this._internalRoot;if(null===e)throw Error(o(409));$c(t,e,null,null)},Kc.prototype.unmount=qc.prototype.unmount=function(){var t=this._internalRoot;if(null!==t){this._internalRoot=null;var e=t.containerInfo;uc((function(){$c(null,t,null,null)})),e[pi]=null}},Kc.prototype.unstable_scheduleHydration=function(t){if(t){var e=ke();t={blockedOn:null,target:t,priority:e};for(var n=0;n<Fe.length&&0!==e&&e<Fe[n].priority;n++);Fe.splice(n,0,t),0===n&&Ne(t)}},we=function(t){switch(t.tag){case 3:var e=t.stateNode;if(e.current.memoizedState.isDehydrated){var n=de(e.pendingLanes);0!==n&&(be(e,1|n),rc(e,Qt()),!(6&Pl)&&(Vl=Qt()+500,Vi()))}break;case 13:uc((function(){var e=Bo(t,1);if(null!==e){var n=tc();nc(e,t,1,n)}})),Hc(t,1)}},xe=function(t){if(13===t.tag){var e=Bo(t,134217728);null!==e&&nc(e,t,134217728,tc()),Hc(t,134217728)}},Se=function(t){if(13===t.tag){var e=ec(t),n=Bo(t,e);null!==n&&nc(n,t,e,tc()),Hc(t,e)}},ke=function(){return ve},Ce=function(t,e){var n=ve;try{return ve=t,e()}finally{ve=n}},xt=function(t,e,n){switch(e){case"input":if(Z(t,n),e=n.name,"radio"===n.type&&null!=e){for(n=t;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+e)+'][type="radio"]'),e=0;e<n.length;e++){var r=n[e];if(r!==t&&r.form===t.form){var i=wi(r);if(!i)throw Error(o(90));Y(r),Z(r,i)}}}break;case"textarea":ot(t,n);break;case"select":null!=(e=n.value)&&nt(t,!!n.multiple,e,!1)}},Pt=cc,It=uc;var tu={usingClientEntryPoint:!1,Events:[vi,_i,wi,Tt,Et,cc]},eu={findFiberByHostInstance:bi,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},nu={bundleType:eu.bundleType,version:eu.version,rendererPackageName:eu.rendererPackageName,rendererConfig:eu.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:_.ReactCurrentDispatcher,findHostInstanceByFiber:function(t){return null===(t=Gt(t))?null:t.stateNode},findFiberByHostInstance:eu.findFiberByHostInstance||function(){return null},findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var ru=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!ru.isDisabled&&ru.supportsFiber)try{ie=ru.inject(nu),oe=ru}catch(ut){}}e.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=tu,e.createPortal=function(t,e){var n=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!Xc(e))throw Error(o(200));return function(t,e,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:x,key:null==r?null:""+r,children:t,containerInfo:e,implementation:n}}(t,e,null,n)},e.createRoot=function(t,e){if(!Xc(t))throw Error(o(299));var n=!1,r="",i=Yc;return null!=e&&(!0===e.unstable_strictMode&&(n=!0),void 0!==e.identifierPrefix&&(r=e.identifierPrefix),void 0!==e.onRecoverableError&&(i=e.onRecoverableError)),e=Uc(t,1,!1,null,0,n,0,r,i),t[pi]=e.current,Vr(8===t.nodeType?t.parentNode:t),new qc(e)},e.findDOMNode=function(t){if(null==t)return null;if(1===t.nodeType)return t;var e=t._reactInternals;if(void 0===e){if("function"==typeof t.render)throw Error(o(188));throw t=Object.keys(t).join(","),Error(o(268,t))}return null===(t=Gt(e))?null:t.stateNode},e.flushSync=function(t){return uc(t)},e.hydrate=function(t,e,n){if(!Qc(e))throw Error(o(200));return Jc(null,t,e,!0,n)},e.hydrateRoot=function(t,e,n){if(!Xc(t))throw Error(o(405));var r=null!=n&&n.hydratedSources||null,i=!1,a="",s=Yc;if(null!=n&&(!0===n.unstable_strictMode&&(i=!0),void 0!==n.identifierPrefix&&(a=n.identifierPrefix),void 0!==n.onRecoverableError&&(s=n.onRecoverableError)),e=Vc(e,null,t,1,null!=n?n:null,i,0,a,s),t[pi]=e.current,Vr(t),r)for(t=0;t<r.length;t++)i=(i=(n=r[t])._getVersion)(n._source),null==e.mutableSourceEagerHydrationData?e.mutableSourceEagerHydrationData=[n,i]:e.mutableSourceEagerHydrationData.push(n,i);return new Kc(e)},e.render=function(t,e,n){if(!Qc(e))throw Error(o(200));return Jc(null,t,e,!1,n)},e.unmountComponentAtNode=function(t){if(!Qc(t))throw Error(o(40));return!!t._reactRootContainer&&(uc((function(){Jc(null,null,t,!1,(function(){t._reactRootContainer=null,t[pi]=null}))})),!0)},e.unstable_batchedUpdates=cc,e.unstable_renderSubtreeIntoContainer=function(t,e,n,r){if(!Qc(n))throw Error(o(200));if(null==t||void 0===t._reactInternals)throw Error(o(38));return Jc(t,e,n,!1,r)},e.version="18.3.1-next-f1338f8080-20240426"},4372:(t,e,n)=>{"use strict";t.exports=n(4591)},4379:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Ellipse=void 0;const r=n(3100),i=n(3123),o=n(4715),a=n(951);class s extends i.Shape{_sceneFunc(t){const e=this.radiusX(),n=this.radiusY();t.beginPath(),t.save(),e!==n&&t.scale(1,n/e),t.arc(0,0,e,0,2*Math.PI,!1),t.restore(),t.closePath(),t.fillStrokeShape(this)}getWidth(){return 2*this.radiusX()}getHeight(){return 2*this.radiusY()}setWidth(t){this.radiusX(t/2)}setHeight(t){this.radiusY(t/2)}}e.Ellipse=s,s.prototype.className="Ellipse",s.prototype._centroid=!0,s.prototype._attrsAffectingSize=["radiusX","radiusY"],(0,a._registerNode)(s),r.Factory.addComponentsGetterSetter(s,"radius",["x","y"]),r.Factory.addGetterSetter(s,"radiusX",0,(0,o.getNumberValidator)()),r.Factory.addGetterSetter(s,"radiusY",0,(0,o.getNumberValidator)())},4384:(t,e,n)=>{"use strict";t.exports=n(1628)},4396:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Stage=e.stages=void 0;const r=n(9532),i=n(3100),o=n(7081),a=n(951),s=n(9164),l=n(2916),c=n(951),u=n(1810),d="mouseleave",h="mouseover",f="mouseenter",p="mousemove",g="mousedown",m="mouseup",y="pointermove",b="pointerdown",v="pointerup",_="pointercancel",w="pointerout",x="pointerleave",S="pointerover",k="pointerenter",C="contextmenu",T="touchstart",E="touchend",P="touchmove",I="touchcancel",A="wheel",M=[[f,"_pointerenter"],[g,"_pointerdown"],[p,"_pointermove"],[m,"_pointerup"],[d,"_pointerleave"],[T,"_pointerdown"],[P,"_pointermove"],[E,"_pointerup"],[I,"_pointercancel"],[h,"_pointerover"],[A,"_wheel"],[C,"_contextmenu"],[b,"_pointerdown"],[y,"_pointermove"],[v,"_pointerup"],[_,"_pointercancel"],["lostpointercapture","_lostpointercapture"]],D={mouse:{[w]:"mouseout",[x]:d,[S]:h,[k]:f,[y]:p,[b]:g,[v]:m,[_]:"mousecancel",pointerclick:"click",pointerdblclick:"dblclick"},touch:{[w]:"touchout",[x]:"touchleave",[S]:"touchover",[k]:"touchenter",[y]:P,[b]:T,[v]:E,[_]:I,pointerclick:"tap",pointerdblclick:"dbltap"},pointer:{[w]:w,[x]:x,[S]:S,[k]:k,[y]:y,[b]:b,[v]:v,[_]:_,pointerclick:"pointerclick",pointerdblclick:"pointerdblclick"}},F=t=>t.indexOf("pointer")>=0?"pointer":t.indexOf("touch")>=0?"touch":"mouse",R=t=>{const e=F(t);return"pointer"===e?a.Konva.pointerEventsEnabled&&D.pointer:"touch"===e?D.touch:"mouse"===e?D.mouse:void 0};function B(t={}){return(t.clipFunc||t.clipWidth||t.clipHeight)&&r.Util.warn("Stage does not support clipping. Please use clip for Layers or Groups."),t}e.stages=[];class L extends o.Container{constructor(t){super(B(t)),this._pointerPositions=[],this._changedPointerPositions=[],this._buildDOM(),this._bindContentEvents(),e.stages.push(this),this.on("widthChange.konva heightChange.konva",this._resizeDOM),this.on("visibleChange.konva",this._checkVisibility),this.on("clipWidthChange.konva clipHeightChange.konva clipFuncChange.konva",(()=>{B(this.attrs)})),this._checkVisibility()}_validateAdd(t){const e="Layer"===t.getType(),n="FastLayer"===t.getType();e||n||r.Util.throw("You may only add layers to the stage.")}_checkVisibility(){if(!this.content)return;const t=this.visible()?"":"none";this.content.style.display=t}setContainer(t){if("string"==typeof t){if("."===t.charAt(0)){const e=t.slice(1);t=document.getElementsByClassName(e)[0]}else{var e;e="#"!==t.charAt(0)?t:t.slice(1),t=document.getElementById(e)}if(!t)throw"Can not find container in document with id "+e}return this._setAttr("container",t),this.content&&(this.content.parentElement&&this.content.parentElement.removeChild(this.content),t.appendChild(this.content)),this}shouldDrawHit(){return!0}clear(){const t=this.children,e=t.length;for(let n=0;n<e;n++)t[n].clear();return this}clone(t){return t||(t={}),t.container="undefined"!=typeof document&&document.createElement("div"),o.Container.prototype.clone.call(this,t)}destroy(){super.destroy();const t=this.content;t&&r.Util._isInDocument(t)&&this.container().removeChild(t);const n=e.stages.indexOf(this);return n>-1&&e.stages.splice(n,1),r.Util.releaseCanvas(this.bufferCanvas._canvas,this.bufferHitCanvas._canvas),this}getPointerPosition(){const t=this._pointerPositions[0]||this._changedPointerPositions[0];return t?{x:t.x,y:t.y}:(r.Util.warn("Pointer position is missing and not registered by the stage. Looks like it is outside of the stage container. You can set it manually from event: stage.setPointersPositions(event);"),null)}_getPointerById(t){return this._pointerPositions.find((e=>e.id===t))}getPointersPositions(){return this._pointerPositions}getStage(){return this}getContent(){return this.content}_toKonvaCanvas(t){(t=t||{}).x=t.x||0,t.y=t.y||0,t.width=t.width||this.width(),t.height=t.height||this.height();const e=new s.SceneCanvas({width:t.width,height:t.height,pixelRatio:t.pixelRatio||1}),n=e.getContext()._context,r=this.children;return(t.x||t.y)&&n.translate(-1*t.x,-1*t.y),r.forEach((function(e){if(!e.isVisible())return;const r=e._toKonvaCanvas(t);n.drawImage(r._canvas,t.x,t.y,r.getWidth()/r.getPixelRatio(),r.getHeight()/r.getPixelRatio())})),e}getIntersection(t){if(!t)return null;const e=this.children;for(let n=e.length-1;n>=0;n--){const r=e[n].getIntersection(t);if(r)return r}return null}_resizeDOM(){const t=this.width(),e=this.height();this.content&&(this.content.style.width=t+"px",this.content.style.height=e+"px"),this.bufferCanvas.setSize(t,e),this.bufferHitCanvas.setSize(t,e),this.children.forEach((n=>{n.setSize({width:t,height:e}),n.draw()}))}add(t,...e){if(arguments.length>1){for(let t=0;t<arguments.length;t++)this.add(arguments[t]);return this}super.add(t);const n=this.children.length;return n>5&&r.Util.warn("The stage has "+n+" layers. Recommended maximum number of layers is 3-5. Adding more layers into the stage may drop the performance. Rethink your tree structure, you can use Konva.Group."),t.setSize({width:this.width(),height:this.height()}),t.draw(),a.Konva.isBrowser&&this.content.appendChild(t.canvas._canvas),this}getParent(){return null}getLayer(){return null}hasPointerCapture(t){return u.hasPointerCapture(t,this)}setPointerCapture(t){u.setPointerCapture(t,this)}releaseCapture(t){u.releaseCapture(t,this)}getLayers(){return this.children}_bindContentEvents(){a.Konva.isBrowser&&M.forEach((([t,e])=>{this.content.addEventListener(t,(t=>{this[e](t)}),{passive:!1})}))}_pointerenter(t){this.setPointersPositions(t);const e=R(t.type);e&&this._fire(e.pointerenter,{evt:t,target:this,currentTarget:this})}_pointerover(t){this.setPointersPositions(t);const e=R(t.type);e&&this._fire(e.pointerover,{evt:t,target:this,currentTarget:this})}_getTargetShape(t){let e=this[t+"targetShape"];return e&&!e.getStage()&&(e=null),e}_pointerleave(t){const e=R(t.type),n=F(t.type);if(!e)return;this.setPointersPositions(t);const r=this._getTargetShape(n),i=!(a.Konva.isDragging()||a.Konva.isTransforming())||a.Konva.hitOnDragEnabled;r&&i?(r._fireAndBubble(e.pointerout,{evt:t}),r._fireAndBubble(e.pointerleave,{evt:t}),this._fire(e.pointerleave,{evt:t,target:this,currentTarget:this}),this[n+"targetShape"]=null):i&&(this._fire(e.pointerleave,{evt:t,target:this,currentTarget:this}),this._fire(e.pointerout,{evt:t,target:this,currentTarget:this})),this.pointerPos=null,this._pointerPositions=[]}_pointerdown(t){const e=R(t.type),n=F(t.type);if(!e)return;this.setPointersPositions(t);let r=!1;this._changedPointerPositions.forEach((i=>{const o=this.getIntersection(i);if(l.DD.justDragged=!1,a.Konva["_"+n+"ListenClick"]=!0,!o||!o.isListening())return void(this[n+"ClickStartShape"]=void 0);a.Konva.capturePointerEventsEnabled&&o.setPointerCapture(i.id),this[n+"ClickStartShape"]=o,o._fireAndBubble(e.pointerdown,{evt:t,pointerId:i.id}),r=!0;const s=t.type.indexOf("touch")>=0;o.preventDefault()&&t.cancelable&&s&&t.preventDefault()})),r||this._fire(e.pointerdown,{evt:t,target:this,currentTarget:this,pointerId:this._pointerPositions[0].id})}_pointermove(t){const e=R(t.type),n=F(t.type);if(!e)return;if(a.Konva.isDragging()&&l.DD.node.preventDefault()&&t.cancelable&&t.preventDefault(),this.setPointersPositions(t),(a.Konva.isDragging()||a.Konva.isTransforming())&&!a.Konva.hitOnDragEnabled)return;const r={};let i=!1;const o=this._getTargetShape(n);this._changedPointerPositions.forEach((a=>{const s=u.getCapturedShape(a.id)||this.getIntersection(a),l=a.id,c={evt:t,pointerId:l},d=o!==s;if(d&&o&&(o._fireAndBubble(e.pointerout,{...c},s),o._fireAndBubble(e.pointerleave,{...c},s)),s){if(r[s._id])return;r[s._id]=!0}s&&s.isListening()?(i=!0,d&&(s._fireAndBubble(e.pointerover,{...c},o),s._fireAndBubble(e.pointerenter,{...c},o),this[n+"targetShape"]=s),s._fireAndBubble(e.pointermove,{...c})):o&&(this._fire(e.pointerover,{evt:t,target:this,currentTarget:this,pointerId:l}),this[n+"targetShape"]=null)})),i||this._fire(e.pointermove,{evt:t,target:this,currentTarget:this,pointerId:this._changedPointerPositions[0].id})}_pointerup(t){const e=R(t.type),n=F(t.type);if(!e)return;this.setPointersPositions(t);const r=this[n+"ClickStartShape"],i=this[n+"ClickEndShape"],o={};let s=!1;this._changedPointerPositions.forEach((c=>{const d=u.getCapturedShape(c.id)||this.getIntersection(c);if(d){if(d.releaseCapture(c.id),o[d._id])return;o[d._id]=!0}const h=c.id,f={evt:t,pointerId:h};let p=!1;a.Konva["_"+n+"InDblClickWindow"]?(p=!0,clearTimeout(this[n+"DblTimeout"])):l.DD.justDragged||(a.Konva["_"+n+"InDblClickWindow"]=!0,clearTimeout(this[n+"DblTimeout"])),this[n+"DblTimeout"]=setTimeout((function(){a.Konva["_"+n+"InDblClickWindow"]=!1}),a.Konva.dblClickWindow),d&&d.isListening()?(s=!0,this[n+"ClickEndShape"]=d,d._fireAndBubble(e.pointerup,{...f}),a.Konva["_"+n+"ListenClick"]&&r&&r===d&&(d._fireAndBubble(e.pointerclick,{...f}),p&&i&&i===d&&d._fireAndBubble(e.pointerdblclick,{...f}))):(this[n+"ClickEndShape"]=null,a.Konva["_"+n+"ListenClick"]&&this._fire(e.pointerclick,{evt:t,target:this,currentTarget:this,pointerId:h}),p&&this._fire(e.pointerdblclick,{evt:t,target:this,currentTarget:this,pointerId:h}))})),s||this._fire(e.pointerup,{evt:t,target:this,currentTarget:this,pointerId:this._changedPointerPositions[0].id}),a.Konva["_"+n+"ListenClick"]=!1,t.cancelable&&"touch"!==n&&"pointer"!==n&&t.preventDefault()}_contextmenu(t){this.setPointersPositions(t);const e=this.getIntersection(this.getPointerPosition());e&&e.isListening()?e._fireAndBubble(C,{evt:t}):this._fire(C,{evt:t,target:this,currentTarget:this})}_wheel(t){this.setPointersPositions(t);const e=this.getIntersection(this.getPointerPosition());e&&e.isListening()?e._fireAndBubble(A,{evt:t}):this._fire(A,{evt:t,target:this,currentTarget:this})}_pointercancel(t){this.setPointersPositions(t);const e=u.getCapturedShape(t.pointerId)||this.getIntersection(this.getPointerPosition());e&&e._fireAndBubble(v,u.createEvent(t)),u.releaseCapture(t.pointerId)}_lostpointercapture(t){u.releaseCapture(t.pointerId)}setPointersPositions(t){const e=this._getContentPosition();let n=null,i=null;void 0!==(t=t||window.event).touches?(this._pointerPositions=[],this._changedPointerPositions=[],Array.prototype.forEach.call(t.touches,(t=>{this._pointerPositions.push({id:t.identifier,x:(t.clientX-e.left)/e.scaleX,y:(t.clientY-e.top)/e.scaleY})})),Array.prototype.forEach.call(t.changedTouches||t.touches,(t=>{this._changedPointerPositions.push({id:t.identifier,x:(t.clientX-e.left)/e.scaleX,y:(t.clientY-e.top)/e.scaleY})}))):(n=(t.clientX-e.left)/e.scaleX,i=(t.clientY-e.top)/e.scaleY,this.pointerPos={x:n,y:i},this._pointerPositions=[{x:n,y:i,id:r.Util._getFirstPointerId(t)}],this._changedPointerPositions=[{x:n,y:i,id:r.Util._getFirstPointerId(t)}])}_setPointerPosition(t){r.Util.warn('Method _setPointerPosition is deprecated. Use "stage.setPointersPositions(event)" instead.'),this.setPointersPositions(t)}_getContentPosition(){if(!this.content||!this.content.getBoundingClientRect)return{top:0,left:0,scaleX:1,scaleY:1};const t=this.content.getBoundingClientRect();return{top:t.top,left:t.left,scaleX:t.width/this.content.clientWidth||1,scaleY:t.height/this.content.clientHeight||1}}_buildDOM(){if(this.bufferCanvas=new s.SceneCanvas({width:this.width(),height:this.height()}),this.bufferHitCanvas=new s.HitCanvas({pixelRatio:1,width:this.width(),height:this.height()}),!a.Konva.isBrowser)return;const t=this.container();if(!t)throw"Stage has no container. A container is required.";t.innerHTML="",this.content=document.createElement("div"),this.content.style.position="relative",this.content.style.userSelect="none",this.content.className="konvajs-content",this.content.setAttribute("role","presentation"),t.appendChild(this.content),this._resizeDOM()}cache(){return r.Util.warn("Cache function is not allowed for stage. You may use cache only for layers, groups and shapes."),this}clearCache(){return this}batchDraw(){return this.getChildren().forEach((function(t){t.batchDraw()})),this}}e.Stage=L,L.prototype.nodeType="Stage",(0,c._registerNode)(L),i.Factory.addGetterSetter(L,"container"),a.Konva.isBrowser&&document.addEventListener("visibilitychange",(()=>{e.stages.forEach((t=>{t.batchDraw()}))}))},4591:(t,e)=>{"use strict";e.DefaultEventPriority=16,e.LegacyRoot=0},4610:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Transformer=void 0;const r=n(9532),i=n(3100),o=n(5304),a=n(3123),s=n(8803),l=n(6445),c=n(951),u=n(4715),d=n(951),h="tr-konva",f=["resizeEnabledChange","rotateAnchorOffsetChange","rotateEnabledChange","enabledAnchorsChange","anchorSizeChange","borderEnabledChange","borderStrokeChange","borderStrokeWidthChange","borderDashChange","anchorStrokeChange","anchorStrokeWidthChange","anchorFillChange","anchorCornerRadiusChange","ignoreStrokeChange","anchorStyleFuncChange"].map((t=>t+`.${h}`)).join(" "),p="nodesRect",g=["widthChange","heightChange","scaleXChange","scaleYChange","skewXChange","skewYChange","rotationChange","offsetXChange","offsetYChange","transformsEnabledChange","strokeWidthChange"],m={"top-left":-45,"top-center":0,"top-right":45,"middle-right":-90,"middle-left":90,"bottom-left":-135,"bottom-center":180,"bottom-right":135},y="ontouchstart"in c.Konva._global,b=["top-left","top-center","top-right","middle-right","middle-left","bottom-left","bottom-center","bottom-right"];function v(t,e,n){const r=n.x+(t.x-n.x)*Math.cos(e)-(t.y-n.y)*Math.sin(e),i=n.y+(t.x-n.x)*Math.sin(e)+(t.y-n.y)*Math.cos(e);return{...t,rotation:t.rotation+e,x:r,y:i}}let _=0;class w extends l.Group{constructor(t){super(t),this._movingAnchorName=null,this._transforming=!1,this._createElements(),this._handleMouseMove=this._handleMouseMove.bind(this),this._handleMouseUp=this._handleMouseUp.bind(this),this.update=this.update.bind(this),this.on(f,this.update),this.getNode()&&this.update()}attachTo(t){return this.setNode(t),this}setNode(t){return r.Util.warn("tr.setNode(shape), tr.node(shape) and tr.attachTo(shape) methods are deprecated. Please use tr.nodes(nodesArray) instead."),this.setNodes([t])}getNode(){return this._nodes&&this._nodes[0]}_getEventNamespace(){return h+this._id}setNodes(t=[]){this._nodes&&this._nodes.length&&this.detach();const e=t.filter((t=>!t.isAncestorOf(this)||(r.Util.error("Konva.Transformer cannot be an a child of the node you are trying to attach"),!1)));return this._nodes=t=e,1===t.length&&this.useSingleNodeRotation()?this.rotation(t[0].getAbsoluteRotation()):this.rotation(0),this._nodes.forEach((t=>{const e=()=>{1===this.nodes().length&&this.useSingleNodeRotation()&&this.rotation(this.nodes()[0].getAbsoluteRotation()),this._resetTransformCache(),this._transforming||this.isDragging()||this.update()};if(t._attrsAffectingSize.length){const n=t._attrsAffectingSize.map((t=>t+"Change."+this._getEventNamespace())).join(" ");t.on(n,e)}t.on(g.map((t=>t+`.${this._getEventNamespace()}`)).join(" "),e),t.on(`absoluteTransformChange.${this._getEventNamespace()}`,e),this._proxyDrag(t)})),this._resetTransformCache(),!!this.findOne(".top-left")&&this.update(),this}_proxyDrag(t){let e;t.on(`dragstart.${this._getEventNamespace()}`,(n=>{e=t.getAbsolutePosition(),this.isDragging()||t===this.findOne(".back")||this.startDrag(n,!1)})),t.on(`dragmove.${this._getEventNamespace()}`,(n=>{if(!e)return;const r=t.getAbsolutePosition(),i=r.x-e.x,o=r.y-e.y;this.nodes().forEach((e=>{if(e===t)return;if(e.isDragging())return;const r=e.getAbsolutePosition();e.setAbsolutePosition({x:r.x+i,y:r.y+o}),e.startDrag(n)})),e=null}))}getNodes(){return this._nodes||[]}getActiveAnchor(){return this._movingAnchorName}detach(){this._nodes&&this._nodes.forEach((t=>{t.off("."+this._getEventNamespace())})),this._nodes=[],this._resetTransformCache()}_resetTransformCache(){this._clearCache(p),this._clearCache("transform"),this._clearSelfAndDescendantCache("absoluteTransform")}_getNodeRect(){return this._getCache(p,this.__getNodeRect)}__getNodeShape(t,e=this.rotation(),n){const r=t.getClientRect({skipTransform:!0,skipShadow:!0,skipStroke:this.ignoreStroke()}),i=t.getAbsoluteScale(n),o=t.getAbsolutePosition(n),a=r.x*i.x-t.offsetX()*i.x,s=r.y*i.y-t.offsetY()*i.y,l=(c.Konva.getAngle(t.getAbsoluteRotation())+2*Math.PI)%(2*Math.PI);return v({x:o.x+a*Math.cos(l)+s*Math.sin(-l),y:o.y+s*Math.cos(l)+a*Math.sin(l),width:r.width*i.x,height:r.height*i.y,rotation:l},-c.Konva.getAngle(e),{x:0,y:0})}__getNodeRect(){if(!this.getNode())return{x:-1e8,y:-1e8,width:0,height:0,rotation:0};const t=[];this.nodes().map((e=>{const n=e.getClientRect({skipTransform:!0,skipShadow:!0,skipStroke:this.ignoreStroke()}),r=[{x:n.x,y:n.y},{x:n.x+n.width,y:n.y},{x:n.x+n.width,y:n.y+n.height},{x:n.x,y:n.y+n.height}],i=e.getAbsoluteTransform();r.forEach((function(e){const n=i.point(e);t.push(n)}))}));const e=new r.Transform;e.rotate(-c.Konva.getAngle(this.rotation()));let n=1/0,i=1/0,o=-1/0,a=-1/0;t.forEach((function(t){const r=e.point(t);void 0===n&&(n=o=r.x,i=a=r.y),n=Math.min(n,r.x),i=Math.min(i,r.y),o=Math.max(o,r.x),a=Math.max(a,r.y)})),e.invert();const s=e.point({x:n,y:i});return{x:s.x,y:s.y,width:o-n,height:a-i,rotation:c.Konva.getAngle(this.rotation())}}getX(){return this._getNodeRect().x}getY(){return this._getNodeRect().y}getWidth(){return this._getNodeRect().width}getHeight(){return this._getNodeRect().height}_createElements(){this._createBack(),b.forEach((t=>{this._createAnchor(t)})),this._createAnchor("rotater")}_createAnchor(t){const e=new s.Rect({stroke:"rgb(0, 161, 255)",fill:"white",strokeWidth:1,name:t+" _anchor",dragDistance:0,draggable:!0,hitStrokeWidth:y?10:"auto"}),n=this;e.on("mousedown touchstart",(function(t){n._handleMouseDown(t)})),e.on("dragstart",(t=>{e.stopDrag(),t.cancelBubble=!0})),e.on("dragend",(t=>{t.cancelBubble=!0})),e.on("mouseenter",(()=>{const n=c.Konva.getAngle(this.rotation()),i=this.rotateAnchorCursor(),o=function(t,e,n){if("rotater"===t)return n;e+=r.Util.degToRad(m[t]||0);const i=(r.Util.radToDeg(e)%360+360)%360;return r.Util._inRange(i,337.5,360)||r.Util._inRange(i,0,22.5)?"ns-resize":r.Util._inRange(i,22.5,67.5)?"nesw-resize":r.Util._inRange(i,67.5,112.5)?"ew-resize":r.Util._inRange(i,112.5,157.5)?"nwse-resize":r.Util._inRange(i,157.5,202.5)?"ns-resize":r.Util._inRange(i,202.5,247.5)?"nesw-resize":r.Util._inRange(i,247.5,292.5)?"ew-resize":r.Util._inRange(i,292.5,337.5)?"nwse-resize":(r.Util.error("Transformer has unknown angle for cursor detection: "+i),"pointer")}(t,n,i);e.getStage().content&&(e.getStage().content.style.cursor=o),this._cursorChange=!0})),e.on("mouseout",(()=>{e.getStage().content&&(e.getStage().content.style.cursor=""),this._cursorChange=!1})),this.add(e)}_createBack(){const t=new a.Shape({name:"back",width:0,height:0,draggable:!0,sceneFunc(t,e){const n=e.getParent(),i=n.padding();t.beginPath(),t.rect(-i,-i,e.width()+2*i,e.height()+2*i),t.moveTo(e.width()/2,-i),n.rotateEnabled()&&n.rotateLineVisible()&&t.lineTo(e.width()/2,-n.rotateAnchorOffset()*r.Util._sign(e.height())-i),t.fillStrokeShape(e)},hitFunc:(t,e)=>{if(!this.shouldOverdrawWholeArea())return;const n=this.padding();t.beginPath(),t.rect(-n,-n,e.width()+2*n,e.height()+2*n),t.fillStrokeShape(e)}});this.add(t),this._proxyDrag(t),t.on("dragstart",(t=>{t.cancelBubble=!0})),t.on("dragmove",(t=>{t.cancelBubble=!0})),t.on("dragend",(t=>{t.cancelBubble=!0})),this.on("dragmove",(t=>{this.update()}))}_handleMouseDown(t){if(this._transforming)return;this._movingAnchorName=t.target.name().split(" ")[0];const e=this._getNodeRect(),n=e.width,r=e.height,i=Math.sqrt(Math.pow(n,2)+Math.pow(r,2));this.sin=Math.abs(r/i),this.cos=Math.abs(n/i),"undefined"!=typeof window&&(window.addEventListener("mousemove",this._handleMouseMove),window.addEventListener("touchmove",this._handleMouseMove),window.addEventListener("mouseup",this._handleMouseUp,!0),window.addEventListener("touchend",this._handleMouseUp,!0)),this._transforming=!0;const o=t.target.getAbsolutePosition(),a=t.target.getStage().getPointerPosition();this._anchorDragOffset={x:a.x-o.x,y:a.y-o.y},_++,this._fire("transformstart",{evt:t.evt,target:this.getNode()}),this._nodes.forEach((e=>{e._fire("transformstart",{evt:t.evt,target:e})}))}_handleMouseMove(t){let e,n,r;const i=this.findOne("."+this._movingAnchorName),o=i.getStage();o.setPointersPositions(t);const a=o.getPointerPosition();let s={x:a.x-this._anchorDragOffset.x,y:a.y-this._anchorDragOffset.y};const l=i.getAbsolutePosition();this.anchorDragBoundFunc()&&(s=this.anchorDragBoundFunc()(l,s,t)),i.setAbsolutePosition(s);const u=i.getAbsolutePosition();if(l.x===u.x&&l.y===u.y)return;if("rotater"===this._movingAnchorName){const r=this._getNodeRect();e=i.x()-r.width/2,n=-i.y()+r.height/2;let o=Math.atan2(-n,e)+Math.PI/2;r.height<0&&(o-=Math.PI);const a=c.Konva.getAngle(this.rotation())+o,s=c.Konva.getAngle(this.rotationSnapTolerance()),l=function(t,e,n){let r=e;for(let i=0;i<t.length;i++){const o=c.Konva.getAngle(t[i]),a=Math.abs(o-e)%(2*Math.PI);Math.min(a,2*Math.PI-a)<n&&(r=o)}return r}(this.rotationSnaps(),a,s),u=function(t,e){const n=function(t){return{x:t.x+t.width/2*Math.cos(t.rotation)+t.height/2*Math.sin(-t.rotation),y:t.y+t.height/2*Math.cos(t.rotation)+t.width/2*Math.sin(t.rotation)}}(t);return v(t,e,n)}(r,l-r.rotation);return void this._fitNodesInto(u,t)}const d=this.shiftBehavior();let h;h="inverted"===d?this.keepRatio()&&!t.shiftKey:"none"===d?this.keepRatio():this.keepRatio()||t.shiftKey;var f=this.centeredScaling()||t.altKey;if("top-left"===this._movingAnchorName){if(h){var p=f?{x:this.width()/2,y:this.height()/2}:{x:this.findOne(".bottom-right").x(),y:this.findOne(".bottom-right").y()};r=Math.sqrt(Math.pow(p.x-i.x(),2)+Math.pow(p.y-i.y(),2));var g=this.findOne(".top-left").x()>p.x?-1:1,m=this.findOne(".top-left").y()>p.y?-1:1;e=r*this.cos*g,n=r*this.sin*m,this.findOne(".top-left").x(p.x-e),this.findOne(".top-left").y(p.y-n)}}else if("top-center"===this._movingAnchorName)this.findOne(".top-left").y(i.y());else if("top-right"===this._movingAnchorName){h&&(p=f?{x:this.width()/2,y:this.height()/2}:{x:this.findOne(".bottom-left").x(),y:this.findOne(".bottom-left").y()},r=Math.sqrt(Math.pow(i.x()-p.x,2)+Math.pow(p.y-i.y(),2)),g=this.findOne(".top-right").x()<p.x?-1:1,m=this.findOne(".top-right").y()>p.y?-1:1,e=r*this.cos*g,n=r*this.sin*m,this.findOne(".top-right").x(p.x+e),this.findOne(".top-right").y(p.y-n));var y=i.position();this.findOne(".top-left").y(y.y),this.findOne(".bottom-right").x(y.x)}else"middle-left"===this._movingAnchorName?this.findOne(".top-left").x(i.x()):"middle-right"===this._movingAnchorName?this.findOne(".bottom-right").x(i.x()):"bottom-left"===this._movingAnchorName?(h&&(p=f?{x:this.width()/2,y:this.height()/2}:{x:this.findOne(".top-right").x(),y:this.findOne(".top-right").y()},r=Math.sqrt(Math.pow(p.x-i.x(),2)+Math.pow(i.y()-p.y,2)),g=p.x<i.x()?-1:1,m=i.y()<p.y?-1:1,e=r*this.cos*g,n=r*this.sin*m,i.x(p.x-e),i.y(p.y+n)),y=i.position(),this.findOne(".top-left").x(y.x),this.findOne(".bottom-right").y(y.y)):"bottom-center"===this._movingAnchorName?this.findOne(".bottom-right").y(i.y()):"bottom-right"===this._movingAnchorName?h&&(p=f?{x:this.width()/2,y:this.height()/2}:{x:this.findOne(".top-left").x(),y:this.findOne(".top-left").y()},r=Math.sqrt(Math.pow(i.x()-p.x,2)+Math.pow(i.y()-p.y,2)),g=this.findOne(".bottom-right").x()<p.x?-1:1,m=this.findOne(".bottom-right").y()<p.y?-1:1,e=r*this.cos*g,n=r*this.sin*m,this.findOne(".bottom-right").x(p.x+e),this.findOne(".bottom-right").y(p.y+n)):console.error(new Error("Wrong position argument of selection resizer: "+this._movingAnchorName));if(f=this.centeredScaling()||t.altKey){const t=this.findOne(".top-left"),e=this.findOne(".bottom-right"),n=t.x(),r=t.y(),i=this.getWidth()-e.x(),o=this.getHeight()-e.y();e.move({x:-n,y:-r}),t.move({x:i,y:o})}const b=this.findOne(".top-left").getAbsolutePosition();e=b.x,n=b.y;const _=this.findOne(".bottom-right").x()-this.findOne(".top-left").x(),w=this.findOne(".bottom-right").y()-this.findOne(".top-left").y();this._fitNodesInto({x:e,y:n,width:_,height:w,rotation:c.Konva.getAngle(this.rotation())},t)}_handleMouseUp(t){this._removeEvents(t)}getAbsoluteTransform(){return this.getTransform()}_removeEvents(t){var e;if(this._transforming){this._transforming=!1,"undefined"!=typeof window&&(window.removeEventListener("mousemove",this._handleMouseMove),window.removeEventListener("touchmove",this._handleMouseMove),window.removeEventListener("mouseup",this._handleMouseUp,!0),window.removeEventListener("touchend",this._handleMouseUp,!0));const n=this.getNode();_--,this._fire("transformend",{evt:t,target:n}),null===(e=this.getLayer())||void 0===e||e.batchDraw(),n&&this._nodes.forEach((e=>{var n;e._fire("transformend",{evt:t,target:e}),null===(n=e.getLayer())||void 0===n||n.batchDraw()})),this._movingAnchorName=null}}_fitNodesInto(t,e){const n=this._getNodeRect();if(r.Util._inRange(t.width,2*-this.padding()-1,1))return void this.update();if(r.Util._inRange(t.height,2*-this.padding()-1,1))return void this.update();const i=new r.Transform;if(i.rotate(c.Konva.getAngle(this.rotation())),this._movingAnchorName&&t.width<0&&this._movingAnchorName.indexOf("left")>=0){const e=i.point({x:2*-this.padding(),y:0});t.x+=e.x,t.y+=e.y,t.width+=2*this.padding(),this._movingAnchorName=this._movingAnchorName.replace("left","right"),this._anchorDragOffset.x-=e.x,this._anchorDragOffset.y-=e.y}else if(this._movingAnchorName&&t.width<0&&this._movingAnchorName.indexOf("right")>=0){const e=i.point({x:2*this.padding(),y:0});this._movingAnchorName=this._movingAnchorName.replace("right","left"),this._anchorDragOffset.x-=e.x,this._anchorDragOffset.y-=e.y,t.width+=2*this.padding()}if(this._movingAnchorName&&t.height<0&&this._movingAnchorName.indexOf("top")>=0){const e=i.point({x:0,y:2*-this.padding()});t.x+=e.x,t.y+=e.y,this._movingAnchorName=this._movingAnchorName.replace("top","bottom"),this._anchorDragOffset.x-=e.x,this._anchorDragOffset.y-=e.y,t.height+=2*this.padding()}else if(this._movingAnchorName&&t.height<0&&this._movingAnchorName.indexOf("bottom")>=0){const e=i.point({x:0,y:2*this.padding()});this._movingAnchorName=this._movingAnchorName.replace("bottom","top"),this._anchorDragOffset.x-=e.x,this._anchorDragOffset.y-=e.y,t.height+=2*this.padding()}if(this.boundBoxFunc()){const e=this.boundBoxFunc()(n,t);e?t=e:r.Util.warn("boundBoxFunc returned falsy. You should return new bound rect from it!")}const o=1e7,a=new r.Transform;a.translate(n.x,n.y),a.rotate(n.rotation),a.scale(n.width/o,n.height/o);const s=new r.Transform,l=t.width/o,u=t.height/o;!1===this.flipEnabled()?(s.translate(t.x,t.y),s.rotate(t.rotation),s.translate(t.width<0?t.width:0,t.height<0?t.height:0),s.scale(Math.abs(l),Math.abs(u))):(s.translate(t.x,t.y),s.rotate(t.rotation),s.scale(l,u));const d=s.multiply(a.invert());this._nodes.forEach((t=>{var e;const n=t.getParent().getAbsoluteTransform(),i=t.getTransform().copy();i.translate(t.offsetX(),t.offsetY());const o=new r.Transform;o.multiply(n.copy().invert()).multiply(d).multiply(n).multiply(i);const a=o.decompose();t.setAttrs(a),null===(e=t.getLayer())||void 0===e||e.batchDraw()})),this.rotation(r.Util._getRotation(t.rotation)),this._nodes.forEach((t=>{this._fire("transform",{evt:e,target:t}),t._fire("transform",{evt:e,target:t})})),this._resetTransformCache(),this.update(),this.getLayer().batchDraw()}forceUpdate(){this._resetTransformCache(),this.update()}_batchChangeChild(t,e){this.findOne(t).setAttrs(e)}update(){var t;const e=this._getNodeRect();this.rotation(r.Util._getRotation(e.rotation));const n=e.width,i=e.height,o=this.enabledAnchors(),a=this.resizeEnabled(),s=this.padding(),l=this.anchorSize(),c=this.find("._anchor");c.forEach((t=>{t.setAttrs({width:l,height:l,offsetX:l/2,offsetY:l/2,stroke:this.anchorStroke(),strokeWidth:this.anchorStrokeWidth(),fill:this.anchorFill(),cornerRadius:this.anchorCornerRadius()})})),this._batchChangeChild(".top-left",{x:0,y:0,offsetX:l/2+s,offsetY:l/2+s,visible:a&&o.indexOf("top-left")>=0}),this._batchChangeChild(".top-center",{x:n/2,y:0,offsetY:l/2+s,visible:a&&o.indexOf("top-center")>=0}),this._batchChangeChild(".top-right",{x:n,y:0,offsetX:l/2-s,offsetY:l/2+s,visible:a&&o.indexOf("top-right")>=0}),this._batchChangeChild(".middle-left",{x:0,y:i/2,offsetX:l/2+s,visible:a&&o.indexOf("middle-left")>=0}),this._batchChangeChild(".middle-right",{x:n,y:i/2,offsetX:l/2-s,visible:a&&o.indexOf("middle-right")>=0}),this._batchChangeChild(".bottom-left",{x:0,y:i,offsetX:l/2+s,offsetY:l/2-s,visible:a&&o.indexOf("bottom-left")>=0}),this._batchChangeChild(".bottom-center",{x:n/2,y:i,offsetY:l/2-s,visible:a&&o.indexOf("bottom-center")>=0}),this._batchChangeChild(".bottom-right",{x:n,y:i,offsetX:l/2-s,offsetY:l/2-s,visible:a&&o.indexOf("bottom-right")>=0}),this._batchChangeChild(".rotater",{x:n/2,y:-this.rotateAnchorOffset()*r.Util._sign(i)-s,visible:this.rotateEnabled()}),this._batchChangeChild(".back",{width:n,height:i,visible:this.borderEnabled(),stroke:this.borderStroke(),strokeWidth:this.borderStrokeWidth(),dash:this.borderDash(),x:0,y:0});const u=this.anchorStyleFunc();u&&c.forEach((t=>{u(t)})),null===(t=this.getLayer())||void 0===t||t.batchDraw()}isTransforming(){return this._transforming}stopTransform(){if(this._transforming){this._removeEvents();const t=this.findOne("."+this._movingAnchorName);t&&t.stopDrag()}}destroy(){return this.getStage()&&this._cursorChange&&this.getStage().content&&(this.getStage().content.style.cursor=""),l.Group.prototype.destroy.call(this),this.detach(),this._removeEvents(),this}toObject(){return o.Node.prototype.toObject.call(this)}clone(t){return o.Node.prototype.clone.call(this,t)}getClientRect(){return this.nodes().length>0?super.getClientRect():{x:0,y:0,width:0,height:0}}}e.Transformer=w,w.isTransforming=()=>_>0,w.prototype.className="Transformer",(0,d._registerNode)(w),i.Factory.addGetterSetter(w,"enabledAnchors",b,(function(t){return t instanceof Array||r.Util.warn("enabledAnchors value should be an array"),t instanceof Array&&t.forEach((function(t){-1===b.indexOf(t)&&r.Util.warn("Unknown anchor name: "+t+". Available names are: "+b.join(", "))})),t||[]})),i.Factory.addGetterSetter(w,"flipEnabled",!0,(0,u.getBooleanValidator)()),i.Factory.addGetterSetter(w,"resizeEnabled",!0),i.Factory.addGetterSetter(w,"anchorSize",10,(0,u.getNumberValidator)()),i.Factory.addGetterSetter(w,"rotateEnabled",!0),i.Factory.addGetterSetter(w,"rotateLineVisible",!0),i.Factory.addGetterSetter(w,"rotationSnaps",[]),i.Factory.addGetterSetter(w,"rotateAnchorOffset",50,(0,u.getNumberValidator)()),i.Factory.addGetterSetter(w,"rotateAnchorCursor","crosshair"),i.Factory.addGetterSetter(w,"rotationSnapTolerance",5,(0,u.getNumberValidator)()),i.Factory.addGetterSetter(w,"borderEnabled",!0),i.Factory.addGetterSetter(w,"anchorStroke","rgb(0, 161, 255)"),i.Factory.addGetterSetter(w,"anchorStrokeWidth",1,(0,u.getNumberValidator)()),i.Factory.addGetterSetter(w,"anchorFill","white"),i.Factory.addGetterSetter(w,"anchorCornerRadius",0,(0,u.getNumberValidator)()),i.Factory.addGetterSetter(w,"borderStroke","rgb(0, 161, 255)"),i.Factory.addGetterSetter(w,"borderStrokeWidth",1,(0,u.getNumberValidator)()),i.Factory.addGetterSetter(w,"borderDash"),i.Factory.addGetterSetter(w,"keepRatio",!0),i.Factory.addGetterSetter(w,"shiftBehavior","default"),i.Factory.addGetterSetter(w,"centeredScaling",!1),i.Factory.addGetterSetter(w,"ignoreStroke",!1),i.Factory.addGetterSetter(w,"padding",0,(0,u.getNumberValidator)()),i.Factory.addGetterSetter(w,"nodes"),i.Factory.addGetterSetter(w,"node"),i.Factory.addGetterSetter(w,"boundBoxFunc"),i.Factory.addGetterSetter(w,"anchorDragBoundFunc"),i.Factory.addGetterSetter(w,"anchorStyleFunc"),i.Factory.addGetterSetter(w,"shouldOverdrawWholeArea",!1),i.Factory.addGetterSetter(w,"useSingleNodeRotation",!0),i.Factory.backCompat(w,{lineEnabled:"borderEnabled",rotateHandlerOffset:"rotateAnchorOffset",enabledHandlers:"enabledAnchors"})},4617:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.TextPath=void 0;const r=n(9532),i=n(3100),o=n(3123),a=n(2878),s=n(5574),l=n(4715),c=n(951),u="normal";function d(t){t.fillText(this.partialText,0,0)}function h(t){t.strokeText(this.partialText,0,0)}class f extends o.Shape{constructor(t){super(t),this.dummyCanvas=r.Util.createCanvasElement(),this.dataArray=[],this._readDataAttribute(),this.on("dataChange.konva",(function(){this._readDataAttribute(),this._setTextData()})),this.on("textChange.konva alignChange.konva letterSpacingChange.konva kerningFuncChange.konva fontSizeChange.konva fontFamilyChange.konva",this._setTextData),this._setTextData()}_getTextPathLength(){return a.Path.getPathLength(this.dataArray)}_getPointAtLength(t){return this.attrs.data?t-1>this.pathLength?null:a.Path.getPointAtLengthOfDataArray(t,this.dataArray):null}_readDataAttribute(){this.dataArray=a.Path.parsePathData(this.attrs.data),this.pathLength=this._getTextPathLength()}_sceneFunc(t){t.setAttr("font",this._getContextFont()),t.setAttr("textBaseline",this.textBaseline()),t.setAttr("textAlign","left"),t.save();const e=this.textDecoration(),n=this.fill(),r=this.fontSize(),i=this.glyphInfo;"underline"===e&&t.beginPath();for(let n=0;n<i.length;n++){t.save();const o=i[n].p0;t.translate(o.x,o.y),t.rotate(i[n].rotation),this.partialText=i[n].text,t.fillStrokeShape(this),"underline"===e&&(0===n&&t.moveTo(0,r/2+1),t.lineTo(r,r/2+1)),t.restore()}"underline"===e&&(t.strokeStyle=n,t.lineWidth=r/20,t.stroke()),t.restore()}_hitFunc(t){t.beginPath();const e=this.glyphInfo;if(e.length>=1){const n=e[0].p0;t.moveTo(n.x,n.y)}for(let n=0;n<e.length;n++){const r=e[n].p1;t.lineTo(r.x,r.y)}t.setAttr("lineWidth",this.fontSize()),t.setAttr("strokeStyle",this.colorKey),t.stroke()}getTextWidth(){return this.textWidth}getTextHeight(){return r.Util.warn("text.getTextHeight() method is deprecated. Use text.height() - for full height and text.fontSize() - for one line height."),this.textHeight}setText(t){return s.Text.prototype.setText.call(this,t)}_getContextFont(){return s.Text.prototype._getContextFont.call(this)}_getTextSize(t){const e=this.dummyCanvas.getContext("2d");e.save(),e.font=this._getContextFont();const n=e.measureText(t);return e.restore(),{width:n.width,height:parseInt(`${this.fontSize()}`,10)}}_setTextData(){const{width:t,height:e}=this._getTextSize(this.attrs.text);if(this.textWidth=t,this.textHeight=e,this.glyphInfo=[],!this.attrs.data)return null;const n=this.letterSpacing(),r=this.align(),i=this.kerningFunc(),o=Math.max(this.textWidth+((this.attrs.text||"").length-1)*n,0);let l=0;"center"===r&&(l=Math.max(0,this.pathLength/2-o/2)),"right"===r&&(l=Math.max(0,this.pathLength-o));const c=(0,s.stringToArray)(this.text());let u=l;for(let t=0;t<c.length;t++){const e=this._getPointAtLength(u);if(!e)return;let s=this._getTextSize(c[t]).width+n;if(" "===c[t]&&"justify"===r){const t=this.text().split(" ").length-1;s+=(this.pathLength-o)/t}const l=this._getPointAtLength(u+s);if(!l)return;const d=a.Path.getLineLength(e.x,e.y,l.x,l.y);let h=0;if(i)try{h=i(c[t-1],c[t])*this.fontSize()}catch(t){h=0}e.x+=h,l.x+=h,this.textWidth+=h;const f=a.Path.getPointOnLine(h+d/2,e.x,e.y,l.x,l.y),p=Math.atan2(l.y-e.y,l.x-e.x);this.glyphInfo.push({transposeX:f.x,transposeY:f.y,text:c[t],rotation:p,p0:e,p1:l}),u+=s}}getSelfRect(){if(!this.glyphInfo.length)return{x:0,y:0,width:0,height:0};const t=[];this.glyphInfo.forEach((function(e){t.push(e.p0.x),t.push(e.p0.y),t.push(e.p1.x),t.push(e.p1.y)}));let e,n,r=t[0]||0,i=t[0]||0,o=t[1]||0,a=t[1]||0;for(let s=0;s<t.length/2;s++)e=t[2*s],n=t[2*s+1],r=Math.min(r,e),i=Math.max(i,e),o=Math.min(o,n),a=Math.max(a,n);const s=this.fontSize();return{x:r-s/2,y:o-s/2,width:i-r+s,height:a-o+s}}destroy(){return r.Util.releaseCanvas(this.dummyCanvas),super.destroy()}}e.TextPath=f,f.prototype._fillFunc=d,f.prototype._strokeFunc=h,f.prototype._fillFuncHit=d,f.prototype._strokeFuncHit=h,f.prototype.className="TextPath",f.prototype._attrsAffectingSize=["text","fontSize","data"],(0,c._registerNode)(f),i.Factory.addGetterSetter(f,"data"),i.Factory.addGetterSetter(f,"fontFamily","Arial"),i.Factory.addGetterSetter(f,"fontSize",12,(0,l.getNumberValidator)()),i.Factory.addGetterSetter(f,"fontStyle",u),i.Factory.addGetterSetter(f,"align","left"),i.Factory.addGetterSetter(f,"letterSpacing",0,(0,l.getNumberValidator)()),i.Factory.addGetterSetter(f,"textBaseline","middle"),i.Factory.addGetterSetter(f,"fontVariant",u),i.Factory.addGetterSetter(f,"text",""),i.Factory.addGetterSetter(f,"textDecoration",""),i.Factory.addGetterSetter(f,"kerningFunc",void 0)},4715:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.RGBComponent=function(t){return t>255?255:t<0?0:Math.round(t)},e.alphaComponent=function(t){return t>1?1:t<1e-4?1e-4:t},e.getNumberValidator=function(){if(r.Konva.isUnminified)return function(t,e){return i.Util._isNumber(t)||i.Util.warn(o(t)+' is a not valid value for "'+e+'" attribute. The value should be a number.'),t}},e.getNumberOrArrayOfNumbersValidator=function(t){if(r.Konva.isUnminified)return function(e,n){let r=i.Util._isNumber(e),a=i.Util._isArray(e)&&e.length==t;return r||a||i.Util.warn(o(e)+' is a not valid value for "'+n+'" attribute. The value should be a number or Array<number>('+t+")"),e}},e.getNumberOrAutoValidator=function(){if(r.Konva.isUnminified)return function(t,e){return i.Util._isNumber(t)||"auto"===t||i.Util.warn(o(t)+' is a not valid value for "'+e+'" attribute. The value should be a number or "auto".'),t}},e.getStringValidator=function(){if(r.Konva.isUnminified)return function(t,e){return i.Util._isString(t)||i.Util.warn(o(t)+' is a not valid value for "'+e+'" attribute. The value should be a string.'),t}},e.getStringOrGradientValidator=function(){if(r.Konva.isUnminified)return function(t,e){const n=i.Util._isString(t),r="[object CanvasGradient]"===Object.prototype.toString.call(t)||t&&t.addColorStop;return n||r||i.Util.warn(o(t)+' is a not valid value for "'+e+'" attribute. The value should be a string or a native gradient.'),t}},e.getFunctionValidator=function(){if(r.Konva.isUnminified)return function(t,e){return i.Util._isFunction(t)||i.Util.warn(o(t)+' is a not valid value for "'+e+'" attribute. The value should be a function.'),t}},e.getNumberArrayValidator=function(){if(r.Konva.isUnminified)return function(t,e){const n=Int8Array?Object.getPrototypeOf(Int8Array):null;return n&&t instanceof n||(i.Util._isArray(t)?t.forEach((function(t){i.Util._isNumber(t)||i.Util.warn('"'+e+'" attribute has non numeric element '+t+". Make sure that all elements are numbers.")})):i.Util.warn(o(t)+' is a not valid value for "'+e+'" attribute. The value should be a array of numbers.')),t}},e.getBooleanValidator=function(){if(r.Konva.isUnminified)return function(t,e){return!0===t||!1===t||i.Util.warn(o(t)+' is a not valid value for "'+e+'" attribute. The value should be a boolean.'),t}},e.getComponentValidator=function(t){if(r.Konva.isUnminified)return function(e,n){return null==e||i.Util.isObject(e)||i.Util.warn(o(e)+' is a not valid value for "'+n+'" attribute. The value should be an object with properties '+t),e}};const r=n(951),i=n(9532);function o(t){return i.Util._isString(t)?'"'+t+'"':"[object Number]"===Object.prototype.toString.call(t)||i.Util._isBoolean(t)?t:Object.prototype.toString.call(t)}},4781:t=>{t.exports=function(t){var e=typeof t;return null!=t&&("object"==e||"function"==e)}},4825:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Easings=e.Tween=void 0;const r=n(9532),i=n(8432),o=n(5304),a=n(951),s={node:1,duration:1,easing:1,onFinish:1,yoyo:1},l=["fill","stroke","shadowColor"];let c=0;class u{constructor(t,e,n,r,i,o,a){this.prop=t,this.propFunc=e,this.begin=r,this._pos=r,this.duration=o,this._change=0,this.prevPos=0,this.yoyo=a,this._time=0,this._position=0,this._startTime=0,this._finish=0,this.func=n,this._change=i-this.begin,this.pause()}fire(t){const e=this[t];e&&e()}setTime(t){t>this.duration?this.yoyo?(this._time=this.duration,this.reverse()):this.finish():t<0?this.yoyo?(this._time=0,this.play()):this.reset():(this._time=t,this.update())}getTime(){return this._time}setPosition(t){this.prevPos=this._pos,this.propFunc(t),this._pos=t}getPosition(t){return void 0===t&&(t=this._time),this.func(t,this.begin,this._change,this.duration)}play(){this.state=2,this._startTime=this.getTimer()-this._time,this.onEnterFrame(),this.fire("onPlay")}reverse(){this.state=3,this._time=this.duration-this._time,this._startTime=this.getTimer()-this._time,this.onEnterFrame(),this.fire("onReverse")}seek(t){this.pause(),this._time=t,this.update(),this.fire("onSeek")}reset(){this.pause(),this._time=0,this.update(),this.fire("onReset")}finish(){this.pause(),this._time=this.duration,this.update(),this.fire("onFinish")}update(){this.setPosition(this.getPosition(this._time)),this.fire("onUpdate")}onEnterFrame(){const t=this.getTimer()-this._startTime;2===this.state?this.setTime(t):3===this.state&&this.setTime(this.duration-t)}pause(){this.state=1,this.fire("onPause")}getTimer(){return(new Date).getTime()}}class d{constructor(t){const n=this,o=t.node,l=o._id,h=t.easing||e.Easings.Linear,f=!!t.yoyo;let p,g;p=void 0===t.duration?.3:0===t.duration?.001:t.duration,this.node=o,this._id=c++;const m=o.getLayer()||(o instanceof a.Konva.Stage?o.getLayers():null);for(g in m||r.Util.error("Tween constructor have `node` that is not in a layer. Please add node into layer first."),this.anim=new i.Animation((function(){n.tween.onEnterFrame()}),m),this.tween=new u(g,(function(t){n._tweenFunc(t)}),h,0,1,1e3*p,f),this._addListeners(),d.attrs[l]||(d.attrs[l]={}),d.attrs[l][this._id]||(d.attrs[l][this._id]={}),d.tweens[l]||(d.tweens[l]={}),t)void 0===s[g]&&this._addAttr(g,t[g]);this.reset(),this.onFinish=t.onFinish,this.onReset=t.onReset,this.onUpdate=t.onUpdate}_addAttr(t,e){const n=this.node,i=n._id;let o,a,s,c,u;const h=d.tweens[i][t];h&&delete d.attrs[i][h][t];let f=n.getAttr(t);if(r.Util._isArray(e))if(o=[],a=Math.max(e.length,f.length),"points"===t&&e.length!==f.length&&(e.length>f.length?(c=f,f=r.Util._prepareArrayForTween(f,e,n.closed())):(s=e,e=r.Util._prepareArrayForTween(e,f,n.closed()))),0===t.indexOf("fill"))for(let t=0;t<a;t++)if(t%2==0)o.push(e[t]-f[t]);else{const n=r.Util.colorToRGBA(f[t]);u=r.Util.colorToRGBA(e[t]),f[t]=n,o.push({r:u.r-n.r,g:u.g-n.g,b:u.b-n.b,a:u.a-n.a})}else for(let t=0;t<a;t++)o.push(e[t]-f[t]);else-1!==l.indexOf(t)?(f=r.Util.colorToRGBA(f),u=r.Util.colorToRGBA(e),o={r:u.r-f.r,g:u.g-f.g,b:u.b-f.b,a:u.a-f.a}):o=e-f;d.attrs[i][this._id][t]={start:f,diff:o,end:e,trueEnd:s,trueStart:c},d.tweens[i][t]=this._id}_tweenFunc(t){const e=this.node,n=d.attrs[e._id][this._id];let i,o,a,s,c,u,h,f;for(i in n){if(o=n[i],a=o.start,s=o.diff,f=o.end,r.Util._isArray(a))if(c=[],h=Math.max(a.length,f.length),0===i.indexOf("fill"))for(u=0;u<h;u++)u%2==0?c.push((a[u]||0)+s[u]*t):c.push("rgba("+Math.round(a[u].r+s[u].r*t)+","+Math.round(a[u].g+s[u].g*t)+","+Math.round(a[u].b+s[u].b*t)+","+(a[u].a+s[u].a*t)+")");else for(u=0;u<h;u++)c.push((a[u]||0)+s[u]*t);else c=-1!==l.indexOf(i)?"rgba("+Math.round(a.r+s.r*t)+","+Math.round(a.g+s.g*t)+","+Math.round(a.b+s.b*t)+","+(a.a+s.a*t)+")":a+s*t;e.setAttr(i,c)}}_addListeners(){this.tween.onPlay=()=>{this.anim.start()},this.tween.onReverse=()=>{this.anim.start()},this.tween.onPause=()=>{this.anim.stop()},this.tween.onFinish=()=>{const t=this.node,e=d.attrs[t._id][this._id];e.points&&e.points.trueEnd&&t.setAttr("points",e.points.trueEnd),this.onFinish&&this.onFinish.call(this)},this.tween.onReset=()=>{const t=this.node,e=d.attrs[t._id][this._id];e.points&&e.points.trueStart&&t.points(e.points.trueStart),this.onReset&&this.onReset()},this.tween.onUpdate=()=>{this.onUpdate&&this.onUpdate.call(this)}}play(){return this.tween.play(),this}reverse(){return this.tween.reverse(),this}reset(){return this.tween.reset(),this}seek(t){return this.tween.seek(1e3*t),this}pause(){return this.tween.pause(),this}finish(){return this.tween.finish(),this}destroy(){const t=this.node._id,e=this._id,n=d.tweens[t];this.pause();for(const e in n)delete d.tweens[t][e];delete d.attrs[t][e]}}e.Tween=d,d.attrs={},d.tweens={},o.Node.prototype.to=function(t){const e=t.onFinish;t.node=this,t.onFinish=function(){this.destroy(),e&&e()},new d(t).play()},e.Easings={BackEaseIn(t,e,n,r){const i=1.70158;return n*(t/=r)*t*((i+1)*t-i)+e},BackEaseOut(t,e,n,r){const i=1.70158;return n*((t=t/r-1)*t*((i+1)*t+i)+1)+e},BackEaseInOut(t,e,n,r){let i=1.70158;return(t/=r/2)<1?n/2*(t*t*((1+(i*=1.525))*t-i))+e:n/2*((t-=2)*t*((1+(i*=1.525))*t+i)+2)+e},ElasticEaseIn(t,e,n,r,i,o){let a=0;return 0===t?e:1==(t/=r)?e+n:(o||(o=.3*r),!i||i<Math.abs(n)?(i=n,a=o/4):a=o/(2*Math.PI)*Math.asin(n/i),-i*Math.pow(2,10*(t-=1))*Math.sin((t*r-a)*(2*Math.PI)/o)+e)},ElasticEaseOut(t,e,n,r,i,o){let a=0;return 0===t?e:1==(t/=r)?e+n:(o||(o=.3*r),!i||i<Math.abs(n)?(i=n,a=o/4):a=o/(2*Math.PI)*Math.asin(n/i),i*Math.pow(2,-10*t)*Math.sin((t*r-a)*(2*Math.PI)/o)+n+e)},ElasticEaseInOut(t,e,n,r,i,o){let a=0;return 0===t?e:2==(t/=r/2)?e+n:(o||(o=r*(.3*1.5)),!i||i<Math.abs(n)?(i=n,a=o/4):a=o/(2*Math.PI)*Math.asin(n/i),t<1?i*Math.pow(2,10*(t-=1))*Math.sin((t*r-a)*(2*Math.PI)/o)*-.5+e:i*Math.pow(2,-10*(t-=1))*Math.sin((t*r-a)*(2*Math.PI)/o)*.5+n+e)},BounceEaseOut:(t,e,n,r)=>(t/=r)<1/2.75?n*(7.5625*t*t)+e:t<2/2.75?n*(7.5625*(t-=1.5/2.75)*t+.75)+e:t<2.5/2.75?n*(7.5625*(t-=2.25/2.75)*t+.9375)+e:n*(7.5625*(t-=2.625/2.75)*t+.984375)+e,BounceEaseIn:(t,n,r,i)=>r-e.Easings.BounceEaseOut(i-t,0,r,i)+n,BounceEaseInOut:(t,n,r,i)=>t<i/2?.5*e.Easings.BounceEaseIn(2*t,0,r,i)+n:.5*e.Easings.BounceEaseOut(2*t-i,0,r,i)+.5*r+n,EaseIn:(t,e,n,r)=>n*(t/=r)*t+e,EaseOut:(t,e,n,r)=>-n*(t/=r)*(t-2)+e,EaseInOut:(t,e,n,r)=>(t/=r/2)<1?n/2*t*t+e:-n/2*(--t*(t-2)-1)+e,StrongEaseIn:(t,e,n,r)=>n*(t/=r)*t*t*t*t+e,StrongEaseOut:(t,e,n,r)=>n*((t=t/r-1)*t*t*t*t+1)+e,StrongEaseInOut:(t,e,n,r)=>(t/=r/2)<1?n/2*t*t*t*t*t+e:n/2*((t-=2)*t*t*t*t+2)+e,Linear:(t,e,n,r)=>n*t/r+e}},4907:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.HSV=void 0;const r=n(3100),i=n(5304),o=n(4715);e.HSV=function(t){const e=t.data,n=e.length,r=Math.pow(2,this.value()),i=Math.pow(2,this.saturation()),o=Math.abs(this.hue()+360)%360,a=r*i*Math.cos(o*Math.PI/180),s=r*i*Math.sin(o*Math.PI/180),l=.299*r+.701*a+.167*s,c=.587*r-.587*a+.33*s,u=.114*r-.114*a-.497*s,d=.299*r-.299*a-.328*s,h=.587*r+.413*a+.035*s,f=.114*r-.114*a+.293*s,p=.299*r-.3*a+1.25*s,g=.587*r-.586*a-1.05*s,m=.114*r+.886*a-.2*s;let y,b,v,_;for(let t=0;t<n;t+=4)y=e[t+0],b=e[t+1],v=e[t+2],_=e[t+3],e[t+0]=l*y+c*b+u*v,e[t+1]=d*y+h*b+f*v,e[t+2]=p*y+g*b+m*v,e[t+3]=_},r.Factory.addGetterSetter(i.Node,"hue",0,(0,o.getNumberValidator)(),r.Factory.afterSetFilter),r.Factory.addGetterSetter(i.Node,"saturation",0,(0,o.getNumberValidator)(),r.Factory.afterSetFilter),r.Factory.addGetterSetter(i.Node,"value",0,(0,o.getNumberValidator)(),r.Factory.afterSetFilter)},4941:(t,e,n)=>{var r=n(4781),i=n(1484),o=n(3326),a=Math.max,s=Math.min;t.exports=function(t,e,n){var l,c,u,d,h,f,p=0,g=!1,m=!1,y=!0;if("function"!=typeof t)throw new TypeError("Expected a function");function b(e){var n=l,r=c;return l=c=void 0,p=e,d=t.apply(r,n)}function v(t){var n=t-f;return void 0===f||n>=e||n<0||m&&t-p>=u}function _(){var t=i();if(v(t))return w(t);h=setTimeout(_,function(t){var n=e-(t-f);return m?s(n,u-(t-p)):n}(t))}function w(t){return h=void 0,y&&l?b(t):(l=c=void 0,d)}function x(){var t=i(),n=v(t);if(l=arguments,c=this,f=t,n){if(void 0===h)return function(t){return p=t,h=setTimeout(_,e),g?b(t):d}(f);if(m)return clearTimeout(h),h=setTimeout(_,e),b(f)}return void 0===h&&(h=setTimeout(_,e)),d}return e=o(e)||0,r(n)&&(g=!!n.leading,u=(m="maxWait"in n)?a(o(n.maxWait)||0,e):u,y="trailing"in n?!!n.trailing:y),x.cancel=function(){void 0!==h&&clearTimeout(h),p=0,l=f=c=h=void 0},x.flush=function(){return void 0===h?d:w(i())},x}},5115:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Posterize=void 0;const r=n(3100),i=n(5304),o=n(4715);e.Posterize=function(t){const e=Math.round(254*this.levels())+1,n=t.data,r=n.length,i=255/e;for(let t=0;t<r;t+=1)n[t]=Math.floor(n[t]/i)*i},r.Factory.addGetterSetter(i.Node,"levels",.5,(0,o.getNumberValidator)(),r.Factory.afterSetFilter)},5304:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Node=void 0;const r=n(9532),i=n(3100),o=n(9164),a=n(951),s=n(2916),l=n(4715),c="absoluteOpacity",u="allEventListeners",d="absoluteTransform",h="absoluteScale",f="canvas",p="listening",g="mouseenter",m="mouseleave",y="Shape",b=" ",v="stage",_="transform",w="visible",x=["xChange.konva","yChange.konva","scaleXChange.konva","scaleYChange.konva","skewXChange.konva","skewYChange.konva","rotationChange.konva","offsetXChange.konva","offsetYChange.konva","transformsEnabledChange.konva"].join(b);let S=1;class k{constructor(t){this._id=S++,this.eventListeners={},this.attrs={},this.index=0,this._allEventListeners=null,this.parent=null,this._cache=new Map,this._attachedDepsListeners=new Map,this._lastPos=null,this._batchingTransformChange=!1,this._needClearTransformCache=!1,this._filterUpToDate=!1,this._isUnderCache=!1,this._dragEventId=null,this._shouldFireChangeEvents=!1,this.setAttrs(t),this._shouldFireChangeEvents=!0}hasChildren(){return!1}_clearCache(t){t!==_&&t!==d||!this._cache.get(t)?t?this._cache.delete(t):this._cache.clear():this._cache.get(t).dirty=!0}_getCache(t,e){let n=this._cache.get(t);return(void 0===n||(t===_||t===d)&&!0===n.dirty)&&(n=e.call(this),this._cache.set(t,n)),n}_calculate(t,e,n){if(!this._attachedDepsListeners.get(t)){const n=e.map((t=>t+"Change.konva")).join(b);this.on(n,(()=>{this._clearCache(t)})),this._attachedDepsListeners.set(t,!0)}return this._getCache(t,n)}_getCanvasCache(){return this._cache.get(f)}_clearSelfAndDescendantCache(t){this._clearCache(t),t===d&&this.fire("absoluteTransformChange")}clearCache(){if(this._cache.has(f)){const{scene:t,filter:e,hit:n}=this._cache.get(f);r.Util.releaseCanvas(t,e,n),this._cache.delete(f)}return this._clearSelfAndDescendantCache(),this._requestDraw(),this}cache(t){const e=t||{};let n={};void 0!==e.x&&void 0!==e.y&&void 0!==e.width&&void 0!==e.height||(n=this.getClientRect({skipTransform:!0,relativeTo:this.getParent()||void 0}));let i=Math.ceil(e.width||n.width),a=Math.ceil(e.height||n.height),s=e.pixelRatio,l=void 0===e.x?Math.floor(n.x):e.x,u=void 0===e.y?Math.floor(n.y):e.y,d=e.offset||0,p=e.drawBorder||!1,g=e.hitCanvasPixelRatio||1;if(!i||!a)return void r.Util.error("Can not cache the node. Width or height of the node equals 0. Caching is skipped.");i+=2*d+(Math.abs(Math.round(n.x)-l)>.5?1:0),a+=2*d+(Math.abs(Math.round(n.y)-u)>.5?1:0),l-=d,u-=d;const m=new o.SceneCanvas({pixelRatio:s,width:i,height:a}),y=new o.SceneCanvas({pixelRatio:s,width:0,height:0,willReadFrequently:!0}),b=new o.HitCanvas({pixelRatio:g,width:i,height:a}),v=m.getContext(),_=b.getContext();return b.isCache=!0,m.isCache=!0,this._cache.delete(f),this._filterUpToDate=!1,!1===e.imageSmoothingEnabled&&(m.getContext()._context.imageSmoothingEnabled=!1,y.getContext()._context.imageSmoothingEnabled=!1),v.save(),_.save(),v.translate(-l,-u),_.translate(-l,-u),this._isUnderCache=!0,this._clearSelfAndDescendantCache(c),this._clearSelfAndDescendantCache(h),this.drawScene(m,this),this.drawHit(b,this),this._isUnderCache=!1,v.restore(),_.restore(),p&&(v.save(),v.beginPath(),v.rect(0,0,i,a),v.closePath(),v.setAttr("strokeStyle","red"),v.setAttr("lineWidth",5),v.stroke(),v.restore()),this._cache.set(f,{scene:m,filter:y,hit:b,x:l,y:u}),this._requestDraw(),this}isCached(){return this._cache.has(f)}getClientRect(t){throw new Error('abstract "getClientRect" method call')}_transformedRect(t,e){const n=[{x:t.x,y:t.y},{x:t.x+t.width,y:t.y},{x:t.x+t.width,y:t.y+t.height},{x:t.x,y:t.y+t.height}];let r=1/0,i=1/0,o=-1/0,a=-1/0;const s=this.getAbsoluteTransform(e);return n.forEach((function(t){const e=s.point(t);void 0===r&&(r=o=e.x,i=a=e.y),r=Math.min(r,e.x),i=Math.min(i,e.y),o=Math.max(o,e.x),a=Math.max(a,e.y)})),{x:r,y:i,width:o-r,height:a-i}}_drawCachedSceneCanvas(t){t.save(),t._applyOpacity(this),t._applyGlobalCompositeOperation(this);const e=this._getCanvasCache();t.translate(e.x,e.y);const n=this._getCachedSceneCanvas(),r=n.pixelRatio;t.drawImage(n._canvas,0,0,n.width/r,n.height/r),t.restore()}_drawCachedHitCanvas(t){const e=this._getCanvasCache(),n=e.hit;t.save(),t.translate(e.x,e.y),t.drawImage(n._canvas,0,0,n.width/n.pixelRatio,n.height/n.pixelRatio),t.restore()}_getCachedSceneCanvas(){let t,e,n,i,o=this.filters(),a=this._getCanvasCache(),s=a.scene,l=a.filter,c=l.getContext();if(o){if(!this._filterUpToDate){const a=s.pixelRatio;l.setSize(s.width/s.pixelRatio,s.height/s.pixelRatio);try{for(t=o.length,c.clear(),c.drawImage(s._canvas,0,0,s.getWidth()/a,s.getHeight()/a),e=c.getImageData(0,0,l.getWidth(),l.getHeight()),n=0;n<t;n++)i=o[n],"function"==typeof i?(i.call(this,e),c.putImageData(e,0,0)):r.Util.error("Filter should be type of function, but got "+typeof i+" instead. Please check correct filters")}catch(t){r.Util.error("Unable to apply filter. "+t.message+" This post my help you https://konvajs.org/docs/posts/Tainted_Canvas.html.")}this._filterUpToDate=!0}return l}return s}on(t,e){if(this._cache&&this._cache.delete(u),3===arguments.length)return this._delegate.apply(this,arguments);let n,r,i,o,a,s=t.split(b),l=s.length;for(n=0;n<l;n++)r=s[n],i=r.split("."),o=i[0],a=i[1]||"",this.eventListeners[o]||(this.eventListeners[o]=[]),this.eventListeners[o].push({name:a,handler:e});return this}off(t,e){let n,r,i,o,a,s,l=(t||"").split(b),c=l.length;if(this._cache&&this._cache.delete(u),!t)for(r in this.eventListeners)this._off(r);for(n=0;n<c;n++)if(i=l[n],o=i.split("."),a=o[0],s=o[1],a)this.eventListeners[a]&&this._off(a,s,e);else for(r in this.eventListeners)this._off(r,s,e);return this}dispatchEvent(t){const e={target:this,type:t.type,evt:t};return this.fire(t.type,e),this}addEventListener(t,e){return this.on(t,(function(t){e.call(this,t.evt)})),this}removeEventListener(t){return this.off(t),this}_delegate(t,e,n){const i=this;this.on(t,(function(t){const o=t.target.findAncestors(e,!0,i);for(let e=0;e<o.length;e++)(t=r.Util.cloneObject(t)).currentTarget=o[e],n.call(o[e],t)}))}remove(){return this.isDragging()&&this.stopDrag(),s.DD._dragElements.delete(this._id),this._remove(),this}_clearCaches(){this._clearSelfAndDescendantCache(d),this._clearSelfAndDescendantCache(c),this._clearSelfAndDescendantCache(h),this._clearSelfAndDescendantCache(v),this._clearSelfAndDescendantCache(w),this._clearSelfAndDescendantCache(p)}_remove(){this._clearCaches();const t=this.getParent();t&&t.children&&(t.children.splice(this.index,1),t._setChildrenIndices(),this.parent=null)}destroy(){return this.remove(),this.clearCache(),this}getAttr(t){const e="get"+r.Util._capitalize(t);return r.Util._isFunction(this[e])?this[e]():this.attrs[t]}getAncestors(){let t=this.getParent(),e=[];for(;t;)e.push(t),t=t.getParent();return e}getAttrs(){return this.attrs||{}}setAttrs(t){return this._batchTransformChanges((()=>{let e,n;if(!t)return this;for(e in t)"children"!==e&&(n="set"+r.Util._capitalize(e),r.Util._isFunction(this[n])?this[n](t[e]):this._setAttr(e,t[e]))})),this}isListening(){return this._getCache(p,this._isListening)}_isListening(t){if(!this.listening())return!1;const e=this.getParent();return!e||e===t||this===t||e._isListening(t)}isVisible(){return this._getCache(w,this._isVisible)}_isVisible(t){if(!this.visible())return!1;const e=this.getParent();return!e||e===t||this===t||e._isVisible(t)}shouldDrawHit(t,e=!1){if(t)return this._isVisible(t)&&this._isListening(t);const n=this.getLayer();let r=!1;s.DD._dragElements.forEach((t=>{"dragging"===t.dragStatus&&("Stage"===t.node.nodeType||t.node.getLayer()===n)&&(r=!0)}));const i=!e&&!a.Konva.hitOnDragEnabled&&(r||a.Konva.isTransforming());return this.isListening()&&this.isVisible()&&!i}show(){return this.visible(!0),this}hide(){return this.visible(!1),this}getZIndex(){return this.index||0}getAbsoluteZIndex(){let t,e,n,r,i=this.getDepth(),o=this,a=0;const s=this.getStage();return"Stage"!==o.nodeType&&s&&function s(l){for(t=[],e=l.length,n=0;n<e;n++)r=l[n],a++,r.nodeType!==y&&(t=t.concat(r.getChildren().slice())),r._id===o._id&&(n=e);t.length>0&&t[0].getDepth()<=i&&s(t)}(s.getChildren()),a}getDepth(){let t=0,e=this.parent;for(;e;)t++,e=e.parent;return t}_batchTransformChanges(t){this._batchingTransformChange=!0,t(),this._batchingTransformChange=!1,this._needClearTransformCache&&(this._clearCache(_),this._clearSelfAndDescendantCache(d)),this._needClearTransformCache=!1}setPosition(t){return this._batchTransformChanges((()=>{this.x(t.x),this.y(t.y)})),this}getPosition(){return{x:this.x(),y:this.y()}}getRelativePointerPosition(){const t=this.getStage();if(!t)return null;const e=t.getPointerPosition();if(!e)return null;const n=this.getAbsoluteTransform().copy();return n.invert(),n.point(e)}getAbsolutePosition(t){let e=!1,n=this.parent;for(;n;){if(n.isCached()){e=!0;break}n=n.parent}e&&!t&&(t=!0);const i=this.getAbsoluteTransform(t).getMatrix(),o=new r.Transform,a=this.offset();return o.m=i.slice(),o.translate(a.x,a.y),o.getTranslation()}setAbsolutePosition(t){const{x:e,y:n,...r}=this._clearTransform();this.attrs.x=e,this.attrs.y=n,this._clearCache(_);const i=this._getAbsoluteTransform().copy();return i.invert(),i.translate(t.x,t.y),t={x:this.attrs.x+i.getTranslation().x,y:this.attrs.y+i.getTranslation().y},this._setTransform(r),this.setPosition({x:t.x,y:t.y}),this._clearCache(_),this._clearSelfAndDescendantCache(d),this}_setTransform(t){let e;for(e in t)this.attrs[e]=t[e]}_clearTransform(){const t={x:this.x(),y:this.y(),rotation:this.rotation(),scaleX:this.scaleX(),scaleY:this.scaleY(),offsetX:this.offsetX(),offsetY:this.offsetY(),skewX:this.skewX(),skewY:this.skewY()};return this.attrs.x=0,this.attrs.y=0,this.attrs.rotation=0,this.attrs.scaleX=1,this.attrs.scaleY=1,this.attrs.offsetX=0,this.attrs.offsetY=0,this.attrs.skewX=0,this.attrs.skewY=0,t}move(t){let e=t.x,n=t.y,r=this.x(),i=this.y();return void 0!==e&&(r+=e),void 0!==n&&(i+=n),this.setPosition({x:r,y:i}),this}_eachAncestorReverse(t,e){let n,r,i=[],o=this.getParent();if(!e||e._id!==this._id){for(i.unshift(this);o&&(!e||o._id!==e._id);)i.unshift(o),o=o.parent;for(n=i.length,r=0;r<n;r++)t(i[r])}}rotate(t){return this.rotation(this.rotation()+t),this}moveToTop(){if(!this.parent)return r.Util.warn("Node has no parent. moveToTop function is ignored."),!1;const t=this.index;return t<this.parent.getChildren().length-1&&(this.parent.children.splice(t,1),this.parent.children.push(this),this.parent._setChildrenIndices(),!0)}moveUp(){if(!this.parent)return r.Util.warn("Node has no parent. moveUp function is ignored."),!1;const t=this.index;return t<this.parent.getChildren().length-1&&(this.parent.children.splice(t,1),this.parent.children.splice(t+1,0,this),this.parent._setChildrenIndices(),!0)}moveDown(){if(!this.parent)return r.Util.warn("Node has no parent. moveDown function is ignored."),!1;const t=this.index;return t>0&&(this.parent.children.splice(t,1),this.parent.children.splice(t-1,0,this),this.parent._setChildrenIndices(),!0)}moveToBottom(){if(!this.parent)return r.Util.warn("Node has no parent. moveToBottom function is ignored."),!1;const t=this.index;return t>0&&(this.parent.children.splice(t,1),this.parent.children.unshift(this),this.parent._setChildrenIndices(),!0)}setZIndex(t){if(!this.parent)return r.Util.warn("Node has no parent. zIndex parameter is ignored."),this;(t<0||t>=this.parent.children.length)&&r.Util.warn("Unexpected value "+t+" for zIndex property. zIndex is just index of a node in children of its parent. Expected value is from 0 to "+(this.parent.children.length-1)+".");const e=this.index;return this.parent.children.splice(e,1),this.parent.children.splice(t,0,this),this.parent._setChildrenIndices(),this}getAbsoluteOpacity(){return this._getCache(c,this._getAbsoluteOpacity)}_getAbsoluteOpacity(){let t=this.opacity();const e=this.getParent();return e&&!e._isUnderCache&&(t*=e.getAbsoluteOpacity()),t}moveTo(t){return this.getParent()!==t&&(this._remove(),t.add(this)),this}toObject(){let t,e,n,i,o,a=this.getAttrs();const s={attrs:{},className:this.getClassName()};for(t in a)e=a[t],o=r.Util.isObject(e)&&!r.Util._isPlainObject(e)&&!r.Util._isArray(e),o||(n="function"==typeof this[t]&&this[t],delete a[t],i=n?n.call(this):null,a[t]=e,i!==e&&(s.attrs[t]=e));return r.Util._prepareToStringify(s)}toJSON(){return JSON.stringify(this.toObject())}getParent(){return this.parent}findAncestors(t,e,n){const r=[];e&&this._isMatch(t)&&r.push(this);let i=this.parent;for(;i;){if(i===n)return r;i._isMatch(t)&&r.push(i),i=i.parent}return r}isAncestorOf(t){return!1}findAncestor(t,e,n){return this.findAncestors(t,e,n)[0]}_isMatch(t){if(!t)return!1;if("function"==typeof t)return t(this);let e,n,i=t.replace(/ /g,"").split(","),o=i.length;for(e=0;e<o;e++)if(n=i[e],r.Util.isValidSelector(n)||(r.Util.warn('Selector "'+n+'" is invalid. Allowed selectors examples are "#foo", ".bar" or "Group".'),r.Util.warn('If you have a custom shape with such className, please change it to start with upper letter like "Triangle".'),r.Util.warn("Konva is awesome, right?")),"#"===n.charAt(0)){if(this.id()===n.slice(1))return!0}else if("."===n.charAt(0)){if(this.hasName(n.slice(1)))return!0}else if(this.className===n||this.nodeType===n)return!0;return!1}getLayer(){const t=this.getParent();return t?t.getLayer():null}getStage(){return this._getCache(v,this._getStage)}_getStage(){const t=this.getParent();return t?t.getStage():null}fire(t,e={},n){return e.target=e.target||this,n?this._fireAndBubble(t,e):this._fire(t,e),this}getAbsoluteTransform(t){return t?this._getAbsoluteTransform(t):this._getCache(d,this._getAbsoluteTransform)}_getAbsoluteTransform(t){let e;if(t)return e=new r.Transform,this._eachAncestorReverse((function(t){const n=t.transformsEnabled();"all"===n?e.multiply(t.getTransform()):"position"===n&&e.translate(t.x()-t.offsetX(),t.y()-t.offsetY())}),t),e;{e=this._cache.get(d)||new r.Transform,this.parent?this.parent.getAbsoluteTransform().copyInto(e):e.reset();const t=this.transformsEnabled();if("all"===t)e.multiply(this.getTransform());else if("position"===t){const t=this.attrs.x||0,n=this.attrs.y||0,r=this.attrs.offsetX||0,i=this.attrs.offsetY||0;e.translate(t-r,n-i)}return e.dirty=!1,e}}getAbsoluteScale(t){let e=this;for(;e;)e._isUnderCache&&(t=e),e=e.getParent();const n=this.getAbsoluteTransform(t).decompose();return{x:n.scaleX,y:n.scaleY}}getAbsoluteRotation(){return this.getAbsoluteTransform().decompose().rotation}getTransform(){return this._getCache(_,this._getTransform)}_getTransform(){var t,e;const n=this._cache.get(_)||new r.Transform;n.reset();const i=this.x(),o=this.y(),s=a.Konva.getAngle(this.rotation()),l=null!==(t=this.attrs.scaleX)&&void 0!==t?t:1,c=null!==(e=this.attrs.scaleY)&&void 0!==e?e:1,u=this.attrs.skewX||0,d=this.attrs.skewY||0,h=this.attrs.offsetX||0,f=this.attrs.offsetY||0;return 0===i&&0===o||n.translate(i,o),0!==s&&n.rotate(s),0===u&&0===d||n.skew(u,d),1===l&&1===c||n.scale(l,c),0===h&&0===f||n.translate(-1*h,-1*f),n.dirty=!1,n}clone(t){let e,n,i,o,a,s=r.Util.cloneObject(this.attrs);for(e in t)s[e]=t[e];const l=new this.constructor(s);for(e in this.eventListeners)for(n=this.eventListeners[e],i=n.length,o=0;o<i;o++)a=n[o],a.name.indexOf("konva")<0&&(l.eventListeners[e]||(l.eventListeners[e]=[]),l.eventListeners[e].push(a));return l}_toKonvaCanvas(t){t=t||{};const e=this.getClientRect(),n=this.getStage(),r=void 0!==t.x?t.x:Math.floor(e.x),i=void 0!==t.y?t.y:Math.floor(e.y),a=t.pixelRatio||1,s=new o.SceneCanvas({width:t.width||Math.ceil(e.width)||(n?n.width():0),height:t.height||Math.ceil(e.height)||(n?n.height():0),pixelRatio:a}),l=s.getContext(),c=new o.SceneCanvas({width:s.width/s.pixelRatio+Math.abs(r),height:s.height/s.pixelRatio+Math.abs(i),pixelRatio:s.pixelRatio});return!1===t.imageSmoothingEnabled&&(l._context.imageSmoothingEnabled=!1),l.save(),(r||i)&&l.translate(-1*r,-1*i),this.drawScene(s,void 0,c),l.restore(),s}toCanvas(t){return this._toKonvaCanvas(t)._canvas}toDataURL(t){const e=(t=t||{}).mimeType||null,n=t.quality||null,r=this._toKonvaCanvas(t).toDataURL(e,n);return t.callback&&t.callback(r),r}toImage(t){return new Promise(((e,n)=>{try{const n=null==t?void 0:t.callback;n&&delete t.callback,r.Util._urlToImage(this.toDataURL(t),(function(t){e(t),null==n||n(t)}))}catch(t){n(t)}}))}toBlob(t){return new Promise(((e,n)=>{try{const n=null==t?void 0:t.callback;n&&delete t.callback,this.toCanvas(t).toBlob((t=>{e(t),null==n||n(t)}),null==t?void 0:t.mimeType,null==t?void 0:t.quality)}catch(t){n(t)}}))}setSize(t){return this.width(t.width),this.height(t.height),this}getSize(){return{width:this.width(),height:this.height()}}getClassName(){return this.className||this.nodeType}getType(){return this.nodeType}getDragDistance(){return void 0!==this.attrs.dragDistance?this.attrs.dragDistance:this.parent?this.parent.getDragDistance():a.Konva.dragDistance}_off(t,e,n){let r,i,o,a=this.eventListeners[t];for(r=0;r<a.length;r++)if(i=a[r].name,o=a[r].handler,!("konva"===i&&"konva"!==e||e&&i!==e||n&&n!==o)){if(a.splice(r,1),0===a.length){delete this.eventListeners[t];break}r--}}_fireChangeEvent(t,e,n){this._fire(t+"Change",{oldVal:e,newVal:n})}addName(t){if(!this.hasName(t)){const e=this.name(),n=e?e+" "+t:t;this.name(n)}return this}hasName(t){if(!t)return!1;const e=this.name();return!!e&&-1!==(e||"").split(/\s/g).indexOf(t)}removeName(t){const e=(this.name()||"").split(/\s/g),n=e.indexOf(t);return-1!==n&&(e.splice(n,1),this.name(e.join(" "))),this}setAttr(t,e){const n=this["set"+r.Util._capitalize(t)];return r.Util._isFunction(n)?n.call(this,e):this._setAttr(t,e),this}_requestDraw(){if(a.Konva.autoDrawEnabled){const t=this.getLayer()||this.getStage();null==t||t.batchDraw()}}_setAttr(t,e){const n=this.attrs[t];(n!==e||r.Util.isObject(e))&&(null==e?delete this.attrs[t]:this.attrs[t]=e,this._shouldFireChangeEvents&&this._fireChangeEvent(t,n,e),this._requestDraw())}_setComponentAttr(t,e,n){let r;void 0!==n&&(r=this.attrs[t],r||(this.attrs[t]=this.getAttr(t)),this.attrs[t][e]=n,this._fireChangeEvent(t,r,n))}_fireAndBubble(t,e,n){if(e&&this.nodeType===y&&(e.target=this),t!==g&&t!==m||!(n&&(this===n||this.isAncestorOf&&this.isAncestorOf(n))||"Stage"===this.nodeType&&!n)){this._fire(t,e);const r=(t===g||t===m)&&n&&n.isAncestorOf&&n.isAncestorOf(this)&&!n.isAncestorOf(this.parent);(e&&!e.cancelBubble||!e)&&this.parent&&this.parent.isListening()&&!r&&(n&&n.parent?this._fireAndBubble.call(this.parent,t,e,n):this._fireAndBubble.call(this.parent,t,e))}}_getProtoListeners(t){var e,n,r;const i=null!==(e=this._cache.get(u))&&void 0!==e?e:{};let o=null==i?void 0:i[t];if(void 0===o){o=[];let e=Object.getPrototypeOf(this);for(;e;){const i=null!==(r=null===(n=e.eventListeners)||void 0===n?void 0:n[t])&&void 0!==r?r:[];o.push(...i),e=Object.getPrototypeOf(e)}i[t]=o,this._cache.set(u,i)}return o}_fire(t,e){(e=e||{}).currentTarget=this,e.type=t;const n=this._getProtoListeners(t);if(n)for(var r=0;r<n.length;r++)n[r].handler.call(this,e);const i=this.eventListeners[t];if(i)for(r=0;r<i.length;r++)i[r].handler.call(this,e)}draw(){return this.drawScene(),this.drawHit(),this}_createDragElement(t){const e=t?t.pointerId:void 0,n=this.getStage(),r=this.getAbsolutePosition();if(!n)return;const i=n._getPointerById(e)||n._changedPointerPositions[0]||r;s.DD._dragElements.set(this._id,{node:this,startPointerPos:i,offset:{x:i.x-r.x,y:i.y-r.y},dragStatus:"ready",pointerId:e})}startDrag(t,e=!0){s.DD._dragElements.has(this._id)||this._createDragElement(t),s.DD._dragElements.get(this._id).dragStatus="dragging",this.fire("dragstart",{type:"dragstart",target:this,evt:t&&t.evt},e)}_setDragPosition(t,e){const n=this.getStage()._getPointerById(e.pointerId);if(!n)return;let i={x:n.x-e.offset.x,y:n.y-e.offset.y};const o=this.dragBoundFunc();if(void 0!==o){const e=o.call(this,i,t);e?i=e:r.Util.warn("dragBoundFunc did not return any value. That is unexpected behavior. You must return new absolute position from dragBoundFunc.")}this._lastPos&&this._lastPos.x===i.x&&this._lastPos.y===i.y||(this.setAbsolutePosition(i),this._requestDraw()),this._lastPos=i}stopDrag(t){const e=s.DD._dragElements.get(this._id);e&&(e.dragStatus="stopped"),s.DD._endDragBefore(t),s.DD._endDragAfter(t)}setDraggable(t){this._setAttr("draggable",t),this._dragChange()}isDragging(){const t=s.DD._dragElements.get(this._id);return!!t&&"dragging"===t.dragStatus}_listenDrag(){this._dragCleanup(),this.on("mousedown.konva touchstart.konva",(function(t){if(!(void 0===t.evt.button||a.Konva.dragButtons.indexOf(t.evt.button)>=0))return;if(this.isDragging())return;let e=!1;s.DD._dragElements.forEach((t=>{this.isAncestorOf(t.node)&&(e=!0)})),e||this._createDragElement(t)}))}_dragChange(){if(this.attrs.draggable)this._listenDrag();else{if(this._dragCleanup(),!this.getStage())return;const t=s.DD._dragElements.get(this._id),e=t&&"dragging"===t.dragStatus,n=t&&"ready"===t.dragStatus;e?this.stopDrag():n&&s.DD._dragElements.delete(this._id)}}_dragCleanup(){this.off("mousedown.konva"),this.off("touchstart.konva")}isClientRectOnScreen(t={x:0,y:0}){const e=this.getStage();if(!e)return!1;const n={x:-t.x,y:-t.y,width:e.width()+2*t.x,height:e.height()+2*t.y};return r.Util.haveIntersection(n,this.getClientRect())}static create(t,e){return r.Util._isString(t)&&(t=JSON.parse(t)),this._createNode(t,e)}static _createNode(t,e){let n,i,o,s=k.prototype.getClassName.call(t),l=t.children;if(e&&(t.attrs.container=e),a.Konva[s]||(r.Util.warn('Can not find a node with class name "'+s+'". Fallback to "Shape".'),s="Shape"),n=new(0,a.Konva[s])(t.attrs),l)for(i=l.length,o=0;o<i;o++)n.add(k._createNode(l[o]));return n}}e.Node=k,k.prototype.nodeType="Node",k.prototype._attrsAffectingSize=[],k.prototype.eventListeners={},k.prototype.on.call(k.prototype,x,(function(){this._batchingTransformChange?this._needClearTransformCache=!0:(this._clearCache(_),this._clearSelfAndDescendantCache(d))})),k.prototype.on.call(k.prototype,"visibleChange.konva",(function(){this._clearSelfAndDescendantCache(w)})),k.prototype.on.call(k.prototype,"listeningChange.konva",(function(){this._clearSelfAndDescendantCache(p)})),k.prototype.on.call(k.prototype,"opacityChange.konva",(function(){this._clearSelfAndDescendantCache(c)}));const C=i.Factory.addGetterSetter;C(k,"zIndex"),C(k,"absolutePosition"),C(k,"position"),C(k,"x",0,(0,l.getNumberValidator)()),C(k,"y",0,(0,l.getNumberValidator)()),C(k,"globalCompositeOperation","source-over",(0,l.getStringValidator)()),C(k,"opacity",1,(0,l.getNumberValidator)()),C(k,"name","",(0,l.getStringValidator)()),C(k,"id","",(0,l.getStringValidator)()),C(k,"rotation",0,(0,l.getNumberValidator)()),i.Factory.addComponentsGetterSetter(k,"scale",["x","y"]),C(k,"scaleX",1,(0,l.getNumberValidator)()),C(k,"scaleY",1,(0,l.getNumberValidator)()),i.Factory.addComponentsGetterSetter(k,"skew",["x","y"]),C(k,"skewX",0,(0,l.getNumberValidator)()),C(k,"skewY",0,(0,l.getNumberValidator)()),i.Factory.addComponentsGetterSetter(k,"offset",["x","y"]),C(k,"offsetX",0,(0,l.getNumberValidator)()),C(k,"offsetY",0,(0,l.getNumberValidator)()),C(k,"dragDistance",void 0,(0,l.getNumberValidator)()),C(k,"width",0,(0,l.getNumberValidator)()),C(k,"height",0,(0,l.getNumberValidator)()),C(k,"listening",!0,(0,l.getBooleanValidator)()),C(k,"preventDefault",!0,(0,l.getBooleanValidator)()),C(k,"filters",void 0,(function(t){return this._filterUpToDate=!1,t})),C(k,"visible",!0,(0,l.getBooleanValidator)()),C(k,"transformsEnabled","all",(0,l.getStringValidator)()),C(k,"size"),C(k,"dragBoundFunc"),C(k,"draggable",!1,(0,l.getBooleanValidator)()),i.Factory.backCompat(k,{rotateDeg:"rotate",setRotationDeg:"setRotation",getRotationDeg:"getRotation"})},5497:(t,e)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Grayscale=void 0,e.Grayscale=function(t){const e=t.data,n=e.length;for(let t=0;t<n;t+=4){const n=.34*e[t]+.5*e[t+1]+.16*e[t+2];e[t]=n,e[t+1]=n,e[t+2]=n}}},5574:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Text=void 0,e.stringToArray=c;const r=n(9532),i=n(3100),o=n(3123),a=n(951),s=n(4715),l=n(951);function c(t){return[...t].reduce(((t,e,n,r)=>{if(/\p{Emoji}/u.test(e)){const i=r[n+1];i&&/\p{Emoji_Modifier}|\u200D/u.test(i)?(t.push(e+i),r[n+1]=""):t.push(e)}else/\p{Regional_Indicator}{2}/u.test(e+(r[n+1]||""))?t.push(e+r[n+1]):n>0&&/\p{Mn}|\p{Me}|\p{Mc}/u.test(e)?t[t.length-1]+=e:e&&t.push(e);return t}),[])}const u="auto",d="inherit",h="justify",f="left",p="middle",g="normal",m=" ",y="none",b=["direction","fontFamily","fontSize","fontStyle","fontVariant","padding","align","verticalAlign","lineHeight","text","width","height","wrap","ellipsis","letterSpacing"],v=b.length;let _;function w(){return _||(_=r.Util.createCanvasElement().getContext("2d"),_)}class x extends o.Shape{constructor(t){super(function(t){return(t=t||{}).fillLinearGradientColorStops||t.fillRadialGradientColorStops||t.fillPatternImage||(t.fill=t.fill||"black"),t}(t)),this._partialTextX=0,this._partialTextY=0;for(let t=0;t<v;t++)this.on(b[t]+"Change.konva",this._setTextData);this._setTextData()}_sceneFunc(t){const e=this.textArr,n=e.length;if(!this.text())return;let r,i=this.padding(),o=this.fontSize(),s=this.lineHeight()*o,l=this.verticalAlign(),u=this.direction(),g=0,m=this.align(),y=this.getWidth(),b=this.letterSpacing(),v=this.fill(),_=this.textDecoration(),w=-1!==_.indexOf("underline"),x=-1!==_.indexOf("line-through");u=u===d?t.direction:u;let S=s/2,k=p;if(a.Konva._fixTextRendering){const t=this.measureSize("M");k="alphabetic",S=(t.fontBoundingBoxAscent-t.fontBoundingBoxDescent)/2+s/2}var C=0,T=0;for("rtl"===u&&t.setAttr("direction",u),t.setAttr("font",this._getContextFont()),t.setAttr("textBaseline",k),t.setAttr("textAlign",f),l===p?g=(this.getHeight()-n*s-2*i)/2:"bottom"===l&&(g=this.getHeight()-n*s-2*i),t.translate(i,g+i),r=0;r<n;r++){C=0,T=0;var E,P,I=e[r],A=I.text,M=I.width,D=I.lastInParagraph;if(t.save(),"right"===m?C+=y-M-2*i:"center"===m&&(C+=(y-M-2*i)/2),w){t.save(),t.beginPath();const e=C,n=S+T+(a.Konva._fixTextRendering?Math.round(o/4):Math.round(o/2));t.moveTo(e,n),E=A.split(" ").length-1,P=m!==h||D?M:y-2*i,t.lineTo(e+Math.round(P),n),t.lineWidth=o/15;const r=this._getLinearGradient();t.strokeStyle=r||v,t.stroke(),t.restore()}if(x){t.save(),t.beginPath();const e=a.Konva._fixTextRendering?-Math.round(o/4):0;t.moveTo(C,S+T+e),E=A.split(" ").length-1,P=m!==h||D?M:y-2*i,t.lineTo(C+Math.round(P),S+T+e),t.lineWidth=o/15;const n=this._getLinearGradient();t.strokeStyle=n||v,t.stroke(),t.restore()}if("rtl"===u||0===b&&m!==h)0!==b&&t.setAttr("letterSpacing",`${b}px`),this._partialTextX=C,this._partialTextY=S+T,this._partialText=A,t.fillStrokeShape(this);else{E=A.split(" ").length-1;const e=c(A);for(let n=0;n<e.length;n++){const r=e[n];" "!==r||D||m!==h||(C+=(y-2*i-M)/E),this._partialTextX=C,this._partialTextY=S+T,this._partialText=r,t.fillStrokeShape(this),C+=this.measureSize(r).width+b}}t.restore(),n>1&&(S+=s)}}_hitFunc(t){const e=this.getWidth(),n=this.getHeight();t.beginPath(),t.rect(0,0,e,n),t.closePath(),t.fillStrokeShape(this)}setText(t){const e=r.Util._isString(t)?t:null==t?"":t+"";return this._setAttr("text",e),this}getWidth(){return this.attrs.width===u||void 0===this.attrs.width?this.getTextWidth()+2*this.padding():this.attrs.width}getHeight(){return this.attrs.height===u||void 0===this.attrs.height?this.fontSize()*this.textArr.length*this.lineHeight()+2*this.padding():this.attrs.height}getTextWidth(){return this.textWidth}getTextHeight(){return r.Util.warn("text.getTextHeight() method is deprecated. Use text.height() - for full height and text.fontSize() - for one line height."),this.textHeight}measureSize(t){var e,n,r,i,o,a,s,l,c,u,d;let h,f=w(),p=this.fontSize();f.save(),f.font=this._getContextFont(),h=f.measureText(t),f.restore();const g=p/100;return{actualBoundingBoxAscent:null!==(e=h.actualBoundingBoxAscent)&&void 0!==e?e:71.58203125*g,actualBoundingBoxDescent:null!==(n=h.actualBoundingBoxDescent)&&void 0!==n?n:0,actualBoundingBoxLeft:null!==(r=h.actualBoundingBoxLeft)&&void 0!==r?r:-7.421875*g,actualBoundingBoxRight:null!==(i=h.actualBoundingBoxRight)&&void 0!==i?i:75.732421875*g,alphabeticBaseline:null!==(o=h.alphabeticBaseline)&&void 0!==o?o:0,emHeightAscent:null!==(a=h.emHeightAscent)&&void 0!==a?a:100*g,emHeightDescent:null!==(s=h.emHeightDescent)&&void 0!==s?s:-20*g,fontBoundingBoxAscent:null!==(l=h.fontBoundingBoxAscent)&&void 0!==l?l:91*g,fontBoundingBoxDescent:null!==(c=h.fontBoundingBoxDescent)&&void 0!==c?c:21*g,hangingBaseline:null!==(u=h.hangingBaseline)&&void 0!==u?u:72.80000305175781*g,ideographicBaseline:null!==(d=h.ideographicBaseline)&&void 0!==d?d:-21*g,width:h.width,height:p}}_getContextFont(){return this.fontStyle()+m+this.fontVariant()+m+(this.fontSize()+"px ")+this.fontFamily().split(",").map((t=>{const e=(t=t.trim()).indexOf(" ")>=0,n=t.indexOf('"')>=0||t.indexOf("'")>=0;return e&&!n&&(t=`"${t}"`),t})).join(", ")}_addTextLine(t){this.align()===h&&(t=t.trim());const e=this._getTextWidth(t);return this.textArr.push({text:t,width:e,lastInParagraph:!1})}_getTextWidth(t){const e=this.letterSpacing(),n=t.length;return w().measureText(t).width+e*n}_setTextData(){let t=this.text().split("\n"),e=+this.fontSize(),n=0,r=this.lineHeight()*e,i=this.attrs.width,o=this.attrs.height,a=i!==u&&void 0!==i,s=o!==u&&void 0!==o,l=this.padding(),d=i-2*l,h=o-2*l,f=0,p=this.wrap(),g="char"!==p&&p!==y,b=this.ellipsis();this.textArr=[],w().font=this._getContextFont();const v=b?this._getTextWidth("…"):0;for(let e=0,i=t.length;e<i;++e){let o=t[e],l=this._getTextWidth(o);if(a&&l>d)for(;o.length>0;){let t=0,e=c(o).length,i="",a=0;for(;t<e;){const n=t+e>>>1,l=c(o).slice(0,n+1).join(""),u=this._getTextWidth(l);(b&&s&&f+r>h?u+v:u)<=d?(t=n+1,i=l,a=u):e=n}if(!i)break;if(g){const e=c(o),n=c(i),r=e[n.length];let s;if((r===m||"-"===r)&&a<=d)s=n.length;else{const t=n.lastIndexOf(m),e=n.lastIndexOf("-");s=Math.max(t,e)+1}s>0&&(t=s,i=e.slice(0,t).join(""),a=this._getTextWidth(i))}if(i=i.trimRight(),this._addTextLine(i),n=Math.max(n,a),f+=r,this._shouldHandleEllipsis(f)){this._tryToAddEllipsisToLastLine();break}if(o=c(o).slice(t).join("").trimLeft(),o.length>0&&(l=this._getTextWidth(o),l<=d)){this._addTextLine(o),f+=r,n=Math.max(n,l);break}}else this._addTextLine(o),f+=r,n=Math.max(n,l),this._shouldHandleEllipsis(f)&&e<i-1&&this._tryToAddEllipsisToLastLine();if(this.textArr[this.textArr.length-1]&&(this.textArr[this.textArr.length-1].lastInParagraph=!0),s&&f+r>h)break}this.textHeight=e,this.textWidth=n}_shouldHandleEllipsis(t){const e=+this.fontSize(),n=this.lineHeight()*e,r=this.attrs.height,i=r!==u&&void 0!==r,o=r-2*this.padding();return!(this.wrap()!==y)||i&&t+n>o}_tryToAddEllipsisToLastLine(){const t=this.attrs.width,e=t!==u&&void 0!==t,n=t-2*this.padding(),r=this.ellipsis(),i=this.textArr[this.textArr.length-1];i&&r&&(e&&(this._getTextWidth(i.text+"…")<n||(i.text=i.text.slice(0,i.text.length-3))),this.textArr.splice(this.textArr.length-1,1),this._addTextLine(i.text+"…"))}getStrokeScaleEnabled(){return!0}_useBufferCanvas(){const t=-1!==this.textDecoration().indexOf("underline")||-1!==this.textDecoration().indexOf("line-through"),e=this.hasShadow();return!(!t||!e)||super._useBufferCanvas()}}e.Text=x,x.prototype._fillFunc=function(t){t.fillText(this._partialText,this._partialTextX,this._partialTextY)},x.prototype._strokeFunc=function(t){t.setAttr("miterLimit",2),t.strokeText(this._partialText,this._partialTextX,this._partialTextY)},x.prototype.className="Text",x.prototype._attrsAffectingSize=["text","fontSize","padding","wrap","lineHeight","letterSpacing"],(0,l._registerNode)(x),i.Factory.overWriteSetter(x,"width",(0,s.getNumberOrAutoValidator)()),i.Factory.overWriteSetter(x,"height",(0,s.getNumberOrAutoValidator)()),i.Factory.addGetterSetter(x,"direction",d),i.Factory.addGetterSetter(x,"fontFamily","Arial"),i.Factory.addGetterSetter(x,"fontSize",12,(0,s.getNumberValidator)()),i.Factory.addGetterSetter(x,"fontStyle",g),i.Factory.addGetterSetter(x,"fontVariant",g),i.Factory.addGetterSetter(x,"padding",0,(0,s.getNumberValidator)()),i.Factory.addGetterSetter(x,"align",f),i.Factory.addGetterSetter(x,"verticalAlign","top"),i.Factory.addGetterSetter(x,"lineHeight",1,(0,s.getNumberValidator)()),i.Factory.addGetterSetter(x,"wrap","word"),i.Factory.addGetterSetter(x,"ellipsis",!1,(0,s.getBooleanValidator)()),i.Factory.addGetterSetter(x,"letterSpacing",0,(0,s.getNumberValidator)()),i.Factory.addGetterSetter(x,"text","",(0,s.getStringValidator)()),i.Factory.addGetterSetter(x,"textDecoration","")},5987:(t,e,n)=>{var r=n(1681),i=Object.prototype,o=i.hasOwnProperty,a=i.toString,s=r?r.toStringTag:void 0;t.exports=function(t){var e=o.call(t,s),n=t[s];try{t[s]=void 0;var r=!0}catch(t){}var i=a.call(t);return r&&(e?t[s]=n:delete t[s]),i}},5995:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Ring=void 0;const r=n(3100),i=n(3123),o=n(4715),a=n(951),s=2*Math.PI;class l extends i.Shape{_sceneFunc(t){t.beginPath(),t.arc(0,0,this.innerRadius(),0,s,!1),t.moveTo(this.outerRadius(),0),t.arc(0,0,this.outerRadius(),s,0,!0),t.closePath(),t.fillStrokeShape(this)}getWidth(){return 2*this.outerRadius()}getHeight(){return 2*this.outerRadius()}setWidth(t){this.outerRadius(t/2)}setHeight(t){this.outerRadius(t/2)}}e.Ring=l,l.prototype.className="Ring",l.prototype._centroid=!0,l.prototype._attrsAffectingSize=["innerRadius","outerRadius"],(0,a._registerNode)(l),r.Factory.addGetterSetter(l,"innerRadius",0,(0,o.getNumberValidator)()),r.Factory.addGetterSetter(l,"outerRadius",0,(0,o.getNumberValidator)())},6064:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Mask=void 0;const r=n(3100),i=n(5304),o=n(4715);function a(t,e,n){let r=4*(n*t.width+e);const i=[];return i.push(t.data[r++],t.data[r++],t.data[r++],t.data[r++]),i}function s(t,e){return Math.sqrt(Math.pow(t[0]-e[0],2)+Math.pow(t[1]-e[1],2)+Math.pow(t[2]-e[2],2))}e.Mask=function(t){let e=function(t,e){const n=a(t,0,0),r=a(t,t.width-1,0),i=a(t,0,t.height-1),o=a(t,t.width-1,t.height-1),l=e||10;if(s(n,r)<l&&s(r,o)<l&&s(o,i)<l&&s(i,n)<l){const e=function(t){const e=[0,0,0];for(let n=0;n<t.length;n++)e[0]+=t[n][0],e[1]+=t[n][1],e[2]+=t[n][2];return e[0]/=t.length,e[1]/=t.length,e[2]/=t.length,e}([r,n,o,i]),a=[];for(let n=0;n<t.width*t.height;n++){const r=s(e,[t.data[4*n],t.data[4*n+1],t.data[4*n+2]]);a[n]=r<l?0:255}return a}}(t,this.threshold());return e&&(e=function(t,e,n){const r=[1,1,1,1,0,1,1,1,1],i=Math.round(Math.sqrt(r.length)),o=Math.floor(i/2),a=[];for(let s=0;s<n;s++)for(let l=0;l<e;l++){const c=s*e+l;let u=0;for(let a=0;a<i;a++)for(let c=0;c<i;c++){const d=s+a-o,h=l+c-o;if(d>=0&&d<n&&h>=0&&h<e){const n=r[a*i+c];u+=t[d*e+h]*n}}a[c]=2040===u?255:0}return a}(e,t.width,t.height),e=function(t,e,n){const r=[1,1,1,1,1,1,1,1,1],i=Math.round(Math.sqrt(r.length)),o=Math.floor(i/2),a=[];for(let s=0;s<n;s++)for(let l=0;l<e;l++){const c=s*e+l;let u=0;for(let a=0;a<i;a++)for(let c=0;c<i;c++){const d=s+a-o,h=l+c-o;if(d>=0&&d<n&&h>=0&&h<e){const n=r[a*i+c];u+=t[d*e+h]*n}}a[c]=u>=1020?255:0}return a}(e,t.width,t.height),e=function(t,e,n){const r=[1/9,1/9,1/9,1/9,1/9,1/9,1/9,1/9,1/9],i=Math.round(Math.sqrt(r.length)),o=Math.floor(i/2),a=[];for(let s=0;s<n;s++)for(let l=0;l<e;l++){const c=s*e+l;let u=0;for(let a=0;a<i;a++)for(let c=0;c<i;c++){const d=s+a-o,h=l+c-o;if(d>=0&&d<n&&h>=0&&h<e){const n=r[a*i+c];u+=t[d*e+h]*n}}a[c]=u}return a}(e,t.width,t.height),function(t,e){for(let n=0;n<t.width*t.height;n++)t.data[4*n+3]=e[n]}(t,e)),t},r.Factory.addGetterSetter(i.Node,"threshold",0,(0,o.getNumberValidator)(),r.Factory.afterSetFilter)},6308:(t,e)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Invert=void 0,e.Invert=function(t){const e=t.data,n=e.length;for(let t=0;t<n;t+=4)e[t]=255-e[t],e[t+1]=255-e[t+1],e[t+2]=255-e[t+2]}},6445:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Group=void 0;const r=n(9532),i=n(7081),o=n(951);class a extends i.Container{_validateAdd(t){const e=t.getType();"Group"!==e&&"Shape"!==e&&r.Util.throw("You may only add groups and shapes to groups.")}}e.Group=a,a.prototype.nodeType="Group",(0,o._registerNode)(a)},6488:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Konva=void 0;const r=n(951),i=n(9532),o=n(5304),a=n(7081),s=n(4396),l=n(1691),c=n(8833),u=n(6445),d=n(2916),h=n(3123),f=n(8432),p=n(4825),g=n(6605),m=n(9164);e.Konva=i.Util._assign(r.Konva,{Util:i.Util,Transform:i.Transform,Node:o.Node,Container:a.Container,Stage:s.Stage,stages:s.stages,Layer:l.Layer,FastLayer:c.FastLayer,Group:u.Group,DD:d.DD,Shape:h.Shape,shapes:h.shapes,Animation:f.Animation,Tween:p.Tween,Easings:p.Easings,Context:g.Context,Canvas:m.Canvas}),e.default=e.Konva},6605:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.HitContext=e.SceneContext=e.Context=void 0;const r=n(9532),i=n(951),o=["arc","arcTo","beginPath","bezierCurveTo","clearRect","clip","closePath","createLinearGradient","createPattern","createRadialGradient","drawImage","ellipse","fill","fillText","getImageData","createImageData","lineTo","moveTo","putImageData","quadraticCurveTo","rect","roundRect","restore","rotate","save","scale","setLineDash","setTransform","stroke","strokeText","transform","translate"];class a{constructor(t){this.canvas=t,i.Konva.enableTrace&&(this.traceArr=[],this._enableTrace())}fillShape(t){t.fillEnabled()&&this._fill(t)}_fill(t){}strokeShape(t){t.hasStroke()&&this._stroke(t)}_stroke(t){}fillStrokeShape(t){t.attrs.fillAfterStrokeEnabled?(this.strokeShape(t),this.fillShape(t)):(this.fillShape(t),this.strokeShape(t))}getTrace(t,e){let n,i,o,a,s=this.traceArr,l=s.length,c="";for(n=0;n<l;n++)i=s[n],o=i.method,o?(a=i.args,c+=o,t?c+="()":r.Util._isArray(a[0])?c+="(["+a.join(",")+"])":(e&&(a=a.map((t=>"number"==typeof t?Math.floor(t):t))),c+="("+a.join(",")+")")):(c+=i.property,t||(c+="="+i.val)),c+=";";return c}clearTrace(){this.traceArr=[]}_trace(t){let e,n=this.traceArr;n.push(t),e=n.length,e>=100&&n.shift()}reset(){const t=this.getCanvas().getPixelRatio();this.setTransform(1*t,0,0,1*t,0,0)}getCanvas(){return this.canvas}clear(t){const e=this.getCanvas();t?this.clearRect(t.x||0,t.y||0,t.width||0,t.height||0):this.clearRect(0,0,e.getWidth()/e.pixelRatio,e.getHeight()/e.pixelRatio)}_applyLineCap(t){const e=t.attrs.lineCap;e&&this.setAttr("lineCap",e)}_applyOpacity(t){const e=t.getAbsoluteOpacity();1!==e&&this.setAttr("globalAlpha",e)}_applyLineJoin(t){const e=t.attrs.lineJoin;e&&this.setAttr("lineJoin",e)}setAttr(t,e){this._context[t]=e}arc(t,e,n,r,i,o){this._context.arc(t,e,n,r,i,o)}arcTo(t,e,n,r,i){this._context.arcTo(t,e,n,r,i)}beginPath(){this._context.beginPath()}bezierCurveTo(t,e,n,r,i,o){this._context.bezierCurveTo(t,e,n,r,i,o)}clearRect(t,e,n,r){this._context.clearRect(t,e,n,r)}clip(...t){this._context.clip.apply(this._context,t)}closePath(){this._context.closePath()}createImageData(t,e){const n=arguments;return 2===n.length?this._context.createImageData(t,e):1===n.length?this._context.createImageData(t):void 0}createLinearGradient(t,e,n,r){return this._context.createLinearGradient(t,e,n,r)}createPattern(t,e){return this._context.createPattern(t,e)}createRadialGradient(t,e,n,r,i,o){return this._context.createRadialGradient(t,e,n,r,i,o)}drawImage(t,e,n,r,i,o,a,s,l){const c=arguments,u=this._context;3===c.length?u.drawImage(t,e,n):5===c.length?u.drawImage(t,e,n,r,i):9===c.length&&u.drawImage(t,e,n,r,i,o,a,s,l)}ellipse(t,e,n,r,i,o,a,s){this._context.ellipse(t,e,n,r,i,o,a,s)}isPointInPath(t,e,n,r){return n?this._context.isPointInPath(n,t,e,r):this._context.isPointInPath(t,e,r)}fill(...t){this._context.fill.apply(this._context,t)}fillRect(t,e,n,r){this._context.fillRect(t,e,n,r)}strokeRect(t,e,n,r){this._context.strokeRect(t,e,n,r)}fillText(t,e,n,r){r?this._context.fillText(t,e,n,r):this._context.fillText(t,e,n)}measureText(t){return this._context.measureText(t)}getImageData(t,e,n,r){return this._context.getImageData(t,e,n,r)}lineTo(t,e){this._context.lineTo(t,e)}moveTo(t,e){this._context.moveTo(t,e)}rect(t,e,n,r){this._context.rect(t,e,n,r)}roundRect(t,e,n,r,i){this._context.roundRect(t,e,n,r,i)}putImageData(t,e,n){this._context.putImageData(t,e,n)}quadraticCurveTo(t,e,n,r){this._context.quadraticCurveTo(t,e,n,r)}restore(){this._context.restore()}rotate(t){this._context.rotate(t)}save(){this._context.save()}scale(t,e){this._context.scale(t,e)}setLineDash(t){this._context.setLineDash?this._context.setLineDash(t):"mozDash"in this._context?this._context.mozDash=t:"webkitLineDash"in this._context&&(this._context.webkitLineDash=t)}getLineDash(){return this._context.getLineDash()}setTransform(t,e,n,r,i,o){this._context.setTransform(t,e,n,r,i,o)}stroke(t){t?this._context.stroke(t):this._context.stroke()}strokeText(t,e,n,r){this._context.strokeText(t,e,n,r)}transform(t,e,n,r,i,o){this._context.transform(t,e,n,r,i,o)}translate(t,e){this._context.translate(t,e)}_enableTrace(){let t,e,n=this,i=o.length,a=this.setAttr;const s=function(t){let i,o=n[t];n[t]=function(){return e=function(t){const e=[],n=t.length,i=r.Util;for(let r=0;r<n;r++){let n=t[r];i._isNumber(n)?n=Math.round(1e3*n)/1e3:i._isString(n)||(n+=""),e.push(n)}return e}(Array.prototype.slice.call(arguments,0)),i=o.apply(n,arguments),n._trace({method:t,args:e}),i}};for(t=0;t<i;t++)s(o[t]);n.setAttr=function(){a.apply(n,arguments);const t=arguments[0];let e=arguments[1];"shadowOffsetX"!==t&&"shadowOffsetY"!==t&&"shadowBlur"!==t||(e/=this.canvas.getPixelRatio()),n._trace({property:t,val:e})}}_applyGlobalCompositeOperation(t){const e=t.attrs.globalCompositeOperation;!e||"source-over"===e||this.setAttr("globalCompositeOperation",e)}}e.Context=a,["fillStyle","strokeStyle","shadowColor","shadowBlur","shadowOffsetX","shadowOffsetY","letterSpacing","lineCap","lineDashOffset","lineJoin","lineWidth","miterLimit","direction","font","textAlign","textBaseline","globalAlpha","globalCompositeOperation","imageSmoothingEnabled"].forEach((function(t){Object.defineProperty(a.prototype,t,{get(){return this._context[t]},set(e){this._context[t]=e}})})),e.SceneContext=class extends a{constructor(t,{willReadFrequently:e=!1}={}){super(t),this._context=t._canvas.getContext("2d",{willReadFrequently:e})}_fillColor(t){const e=t.fill();this.setAttr("fillStyle",e),t._fillFunc(this)}_fillPattern(t){this.setAttr("fillStyle",t._getFillPattern()),t._fillFunc(this)}_fillLinearGradient(t){const e=t._getLinearGradient();e&&(this.setAttr("fillStyle",e),t._fillFunc(this))}_fillRadialGradient(t){const e=t._getRadialGradient();e&&(this.setAttr("fillStyle",e),t._fillFunc(this))}_fill(t){const e=t.fill(),n=t.getFillPriority();if(e&&"color"===n)return void this._fillColor(t);const r=t.getFillPatternImage();if(r&&"pattern"===n)return void this._fillPattern(t);const i=t.getFillLinearGradientColorStops();if(i&&"linear-gradient"===n)return void this._fillLinearGradient(t);const o=t.getFillRadialGradientColorStops();o&&"radial-gradient"===n?this._fillRadialGradient(t):e?this._fillColor(t):r?this._fillPattern(t):i?this._fillLinearGradient(t):o&&this._fillRadialGradient(t)}_strokeLinearGradient(t){const e=t.getStrokeLinearGradientStartPoint(),n=t.getStrokeLinearGradientEndPoint(),r=t.getStrokeLinearGradientColorStops(),i=this.createLinearGradient(e.x,e.y,n.x,n.y);if(r){for(let t=0;t<r.length;t+=2)i.addColorStop(r[t],r[t+1]);this.setAttr("strokeStyle",i)}}_stroke(t){const e=t.dash(),n=t.getStrokeScaleEnabled();if(t.hasStroke()){if(!n){this.save();const t=this.getCanvas().getPixelRatio();this.setTransform(t,0,0,t,0,0)}this._applyLineCap(t),e&&t.dashEnabled()&&(this.setLineDash(e),this.setAttr("lineDashOffset",t.dashOffset())),this.setAttr("lineWidth",t.strokeWidth()),t.getShadowForStrokeEnabled()||this.setAttr("shadowColor","rgba(0,0,0,0)"),t.getStrokeLinearGradientColorStops()?this._strokeLinearGradient(t):this.setAttr("strokeStyle",t.stroke()),t._strokeFunc(this),n||this.restore()}}_applyShadow(t){var e,n,r;const i=null!==(e=t.getShadowRGBA())&&void 0!==e?e:"black",o=null!==(n=t.getShadowBlur())&&void 0!==n?n:5,a=null!==(r=t.getShadowOffset())&&void 0!==r?r:{x:0,y:0},s=t.getAbsoluteScale(),l=this.canvas.getPixelRatio(),c=s.x*l,u=s.y*l;this.setAttr("shadowColor",i),this.setAttr("shadowBlur",o*Math.min(Math.abs(c),Math.abs(u))),this.setAttr("shadowOffsetX",a.x*c),this.setAttr("shadowOffsetY",a.y*u)}},e.HitContext=class extends a{constructor(t){super(t),this._context=t._canvas.getContext("2d",{willReadFrequently:!0})}_fill(t){this.save(),this.setAttr("fillStyle",t.colorKey),t._fillFuncHit(this),this.restore()}strokeShape(t){t.hasHitStroke()&&this._stroke(t)}_stroke(t){if(t.hasHitStroke()){const e=t.getStrokeScaleEnabled();if(!e){this.save();const t=this.getCanvas().getPixelRatio();this.setTransform(t,0,0,t,0,0)}this._applyLineCap(t);const n=t.hitStrokeWidth(),r="auto"===n?t.strokeWidth():n;this.setAttr("lineWidth",r),this.setAttr("strokeStyle",t.colorKey),t._strokeFuncHit(this),e||this.restore()}}}},6618:(t,e,n)=>{"use strict";var r=n(9553);e.H=r.createRoot,r.hydrateRoot},6797:(t,e,n)=>{"use strict";t.exports=n(3527)},6940:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Sprite=void 0;const r=n(3100),i=n(3123),o=n(8432),a=n(4715),s=n(951);class l extends i.Shape{constructor(t){super(t),this._updated=!0,this.anim=new o.Animation((()=>{const t=this._updated;return this._updated=!1,t})),this.on("animationChange.konva",(function(){this.frameIndex(0)})),this.on("frameIndexChange.konva",(function(){this._updated=!0})),this.on("frameRateChange.konva",(function(){this.anim.isRunning()&&(clearInterval(this.interval),this._setInterval())}))}_sceneFunc(t){const e=this.animation(),n=this.frameIndex(),r=4*n,i=this.animations()[e],o=this.frameOffsets(),a=i[r+0],s=i[r+1],l=i[r+2],c=i[r+3],u=this.image();if((this.hasFill()||this.hasStroke())&&(t.beginPath(),t.rect(0,0,l,c),t.closePath(),t.fillStrokeShape(this)),u)if(o){const r=o[e],i=2*n;t.drawImage(u,a,s,l,c,r[i+0],r[i+1],l,c)}else t.drawImage(u,a,s,l,c,0,0,l,c)}_hitFunc(t){const e=this.animation(),n=this.frameIndex(),r=4*n,i=this.animations()[e],o=this.frameOffsets(),a=i[r+2],s=i[r+3];if(t.beginPath(),o){const r=o[e],i=2*n;t.rect(r[i+0],r[i+1],a,s)}else t.rect(0,0,a,s);t.closePath(),t.fillShape(this)}_useBufferCanvas(){return super._useBufferCanvas(!0)}_setInterval(){const t=this;this.interval=setInterval((function(){t._updateIndex()}),1e3/this.frameRate())}start(){if(this.isRunning())return;const t=this.getLayer();this.anim.setLayers(t),this._setInterval(),this.anim.start()}stop(){this.anim.stop(),clearInterval(this.interval)}isRunning(){return this.anim.isRunning()}_updateIndex(){const t=this.frameIndex(),e=this.animation();t<this.animations()[e].length/4-1?this.frameIndex(t+1):this.frameIndex(0)}}e.Sprite=l,l.prototype.className="Sprite",(0,s._registerNode)(l),r.Factory.addGetterSetter(l,"animation"),r.Factory.addGetterSetter(l,"animations"),r.Factory.addGetterSetter(l,"frameOffsets"),r.Factory.addGetterSetter(l,"image"),r.Factory.addGetterSetter(l,"frameIndex",0,(0,a.getNumberValidator)()),r.Factory.addGetterSetter(l,"frameRate",17,(0,a.getNumberValidator)()),r.Factory.backCompat(l,{index:"frameIndex",getIndex:"getFrameIndex",setIndex:"setFrameIndex"})},6995:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Line=void 0;const r=n(3100),i=n(951),o=n(3123),a=n(4715);function s(t,e,n,r,i,o,a){const s=Math.sqrt(Math.pow(n-t,2)+Math.pow(r-e,2)),l=Math.sqrt(Math.pow(i-n,2)+Math.pow(o-r,2)),c=a*s/(s+l),u=a*l/(s+l);return[n-c*(i-t),r-c*(o-e),n+u*(i-t),r+u*(o-e)]}function l(t,e){const n=t.length,r=[];for(let i=2;i<n-2;i+=2){const n=s(t[i-2],t[i-1],t[i],t[i+1],t[i+2],t[i+3],e);isNaN(n[0])||(r.push(n[0]),r.push(n[1]),r.push(t[i]),r.push(t[i+1]),r.push(n[2]),r.push(n[3]))}return r}class c extends o.Shape{constructor(t){super(t),this.on("pointsChange.konva tensionChange.konva closedChange.konva bezierChange.konva",(function(){this._clearCache("tensionPoints")}))}_sceneFunc(t){let e,n,r,i=this.points(),o=i.length,a=this.tension(),s=this.closed(),l=this.bezier();if(o){if(t.beginPath(),t.moveTo(i[0],i[1]),0!==a&&o>4){for(e=this.getTensionPoints(),n=e.length,r=s?0:4,s||t.quadraticCurveTo(e[0],e[1],e[2],e[3]);r<n-2;)t.bezierCurveTo(e[r++],e[r++],e[r++],e[r++],e[r++],e[r++]);s||t.quadraticCurveTo(e[n-2],e[n-1],i[o-2],i[o-1])}else if(l)for(r=2;r<o;)t.bezierCurveTo(i[r++],i[r++],i[r++],i[r++],i[r++],i[r++]);else for(r=2;r<o;r+=2)t.lineTo(i[r],i[r+1]);s?(t.closePath(),t.fillStrokeShape(this)):t.strokeShape(this)}}getTensionPoints(){return this._getCache("tensionPoints",this._getTensionPoints)}_getTensionPoints(){return this.closed()?this._getTensionPointsClosed():l(this.points(),this.tension())}_getTensionPointsClosed(){const t=this.points(),e=t.length,n=this.tension(),r=s(t[e-2],t[e-1],t[0],t[1],t[2],t[3],n),i=s(t[e-4],t[e-3],t[e-2],t[e-1],t[0],t[1],n),o=l(t,n);return[r[2],r[3]].concat(o).concat([i[0],i[1],t[e-2],t[e-1],i[2],i[3],r[0],r[1],t[0],t[1]])}getWidth(){return this.getSelfRect().width}getHeight(){return this.getSelfRect().height}getSelfRect(){let t=this.points();if(t.length<4)return{x:t[0]||0,y:t[1]||0,width:0,height:0};t=0!==this.tension()?[t[0],t[1],...this._getTensionPoints(),t[t.length-2],t[t.length-1]]:this.points();let e,n,r=t[0],i=t[0],o=t[1],a=t[1];for(let s=0;s<t.length/2;s++)e=t[2*s],n=t[2*s+1],r=Math.min(r,e),i=Math.max(i,e),o=Math.min(o,n),a=Math.max(a,n);return{x:r,y:o,width:i-r,height:a-o}}}e.Line=c,c.prototype.className="Line",c.prototype._attrsAffectingSize=["points","bezier","tension"],(0,i._registerNode)(c),r.Factory.addGetterSetter(c,"closed",!1),r.Factory.addGetterSetter(c,"bezier",!1),r.Factory.addGetterSetter(c,"tension",0,(0,a.getNumberValidator)()),r.Factory.addGetterSetter(c,"points",[],(0,a.getNumberArrayValidator)())},7070:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Konva=void 0;const r=n(6488),i=n(4197),o=n(2384),a=n(7969),s=n(4379),l=n(8696),c=n(8475),u=n(6995),d=n(2878),h=n(8803),f=n(7515),p=n(5995),g=n(6940),m=n(7281),y=n(5574),b=n(4617),v=n(4610),_=n(8241),w=n(1493),x=n(7187),S=n(3642),k=n(1175),C=n(664),T=n(5497),E=n(7189),P=n(4907),I=n(6308),A=n(2033),M=n(6064),D=n(9560),F=n(3468),R=n(5115),B=n(3945),L=n(1894),N=n(1952),O=n(21),z=n(501);e.Konva=r.Konva.Util._assign(r.Konva,{Arc:i.Arc,Arrow:o.Arrow,Circle:a.Circle,Ellipse:s.Ellipse,Image:l.Image,Label:c.Label,Tag:c.Tag,Line:u.Line,Path:d.Path,Rect:h.Rect,RegularPolygon:f.RegularPolygon,Ring:p.Ring,Sprite:g.Sprite,Star:m.Star,Text:y.Text,TextPath:b.TextPath,Transformer:v.Transformer,Wedge:_.Wedge,Filters:{Blur:w.Blur,Brighten:x.Brighten,Contrast:S.Contrast,Emboss:k.Emboss,Enhance:C.Enhance,Grayscale:T.Grayscale,HSL:E.HSL,HSV:P.HSV,Invert:I.Invert,Kaleidoscope:A.Kaleidoscope,Mask:M.Mask,Noise:D.Noise,Pixelate:F.Pixelate,Posterize:R.Posterize,RGB:B.RGB,RGBA:L.RGBA,Sepia:N.Sepia,Solarize:O.Solarize,Threshold:z.Threshold}})},7081:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Container=void 0;const r=n(3100),i=n(5304),o=n(4715);class a extends i.Node{constructor(){super(...arguments),this.children=[]}getChildren(t){if(!t)return this.children||[];const e=this.children||[],n=[];return e.forEach((function(e){t(e)&&n.push(e)})),n}hasChildren(){return this.getChildren().length>0}removeChildren(){return this.getChildren().forEach((t=>{t.parent=null,t.index=0,t.remove()})),this.children=[],this._requestDraw(),this}destroyChildren(){return this.getChildren().forEach((t=>{t.parent=null,t.index=0,t.destroy()})),this.children=[],this._requestDraw(),this}add(...t){if(0===t.length)return this;if(t.length>1){for(let e=0;e<t.length;e++)this.add(t[e]);return this}const e=t[0];return e.getParent()?(e.moveTo(this),this):(this._validateAdd(e),e.index=this.getChildren().length,e.parent=this,e._clearCaches(),this.getChildren().push(e),this._fire("add",{child:e}),this._requestDraw(),this)}destroy(){return this.hasChildren()&&this.destroyChildren(),super.destroy(),this}find(t){return this._generalFind(t,!1)}findOne(t){const e=this._generalFind(t,!0);return e.length>0?e[0]:void 0}_generalFind(t,e){const n=[];return this._descendants((r=>{const i=r._isMatch(t);return i&&n.push(r),!(!i||!e)})),n}_descendants(t){let e=!1;const n=this.getChildren();for(const r of n){if(e=t(r),e)return!0;if(r.hasChildren()&&(e=r._descendants(t),e))return!0}return!1}toObject(){const t=i.Node.prototype.toObject.call(this);return t.children=[],this.getChildren().forEach((e=>{t.children.push(e.toObject())})),t}isAncestorOf(t){let e=t.getParent();for(;e;){if(e._id===this._id)return!0;e=e.getParent()}return!1}clone(t){const e=i.Node.prototype.clone.call(this,t);return this.getChildren().forEach((function(t){e.add(t.clone())})),e}getAllIntersections(t){const e=[];return this.find("Shape").forEach((n=>{n.isVisible()&&n.intersects(t)&&e.push(n)})),e}_clearSelfAndDescendantCache(t){var e;super._clearSelfAndDescendantCache(t),this.isCached()||null===(e=this.children)||void 0===e||e.forEach((function(e){e._clearSelfAndDescendantCache(t)}))}_setChildrenIndices(){var t;null===(t=this.children)||void 0===t||t.forEach((function(t,e){t.index=e})),this._requestDraw()}drawScene(t,e,n){const r=this.getLayer(),i=t||r&&r.getCanvas(),o=i&&i.getContext(),a=this._getCanvasCache(),s=a&&a.scene,l=i&&i.isCache;if(!this.isVisible()&&!l)return this;if(s){o.save();const t=this.getAbsoluteTransform(e).getMatrix();o.transform(t[0],t[1],t[2],t[3],t[4],t[5]),this._drawCachedSceneCanvas(o),o.restore()}else this._drawChildren("drawScene",i,e,n);return this}drawHit(t,e){if(!this.shouldDrawHit(e))return this;const n=this.getLayer(),r=t||n&&n.hitCanvas,i=r&&r.getContext(),o=this._getCanvasCache();if(o&&o.hit){i.save();const t=this.getAbsoluteTransform(e).getMatrix();i.transform(t[0],t[1],t[2],t[3],t[4],t[5]),this._drawCachedHitCanvas(i),i.restore()}else this._drawChildren("drawHit",r,e);return this}_drawChildren(t,e,n,r){var i;const o=e&&e.getContext(),a=this.clipWidth(),s=this.clipHeight(),l=this.clipFunc(),c="number"==typeof a&&"number"==typeof s||l,u=n===this;if(c){o.save();const t=this.getAbsoluteTransform(n);let e,r=t.getMatrix();if(o.transform(r[0],r[1],r[2],r[3],r[4],r[5]),o.beginPath(),l)e=l.call(this,o,this);else{const t=this.clipX(),e=this.clipY();o.rect(t||0,e||0,a,s)}o.clip.apply(o,e),r=t.copy().invert().getMatrix(),o.transform(r[0],r[1],r[2],r[3],r[4],r[5])}const d=!u&&"source-over"!==this.globalCompositeOperation()&&"drawScene"===t;d&&(o.save(),o._applyGlobalCompositeOperation(this)),null===(i=this.children)||void 0===i||i.forEach((function(i){i[t](e,n,r)})),d&&o.restore(),c&&o.restore()}getClientRect(t={}){var e;const n=t.skipTransform,r=t.relativeTo;let i,o,a,s,l={x:1/0,y:1/0,width:0,height:0};const c=this;null===(e=this.children)||void 0===e||e.forEach((function(e){if(!e.visible())return;const n=e.getClientRect({relativeTo:c,skipShadow:t.skipShadow,skipStroke:t.skipStroke});0===n.width&&0===n.height||(void 0===i?(i=n.x,o=n.y,a=n.x+n.width,s=n.y+n.height):(i=Math.min(i,n.x),o=Math.min(o,n.y),a=Math.max(a,n.x+n.width),s=Math.max(s,n.y+n.height)))}));const u=this.find("Shape");let d=!1;for(let t=0;t<u.length;t++)if(u[t]._isVisible(this)){d=!0;break}return l=d&&void 0!==i?{x:i,y:o,width:a-i,height:s-o}:{x:0,y:0,width:0,height:0},n?l:this._transformedRect(l,r)}}e.Container=a,r.Factory.addComponentsGetterSetter(a,"clip",["x","y","width","height"]),r.Factory.addGetterSetter(a,"clipX",void 0,(0,o.getNumberValidator)()),r.Factory.addGetterSetter(a,"clipY",void 0,(0,o.getNumberValidator)()),r.Factory.addGetterSetter(a,"clipWidth",void 0,(0,o.getNumberValidator)()),r.Factory.addGetterSetter(a,"clipHeight",void 0,(0,o.getNumberValidator)()),r.Factory.addGetterSetter(a,"clipFunc")},7187:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Brighten=void 0;const r=n(3100),i=n(5304),o=n(4715);e.Brighten=function(t){const e=255*this.brightness(),n=t.data,r=n.length;for(let t=0;t<r;t+=4)n[t]+=e,n[t+1]+=e,n[t+2]+=e},r.Factory.addGetterSetter(i.Node,"brightness",0,(0,o.getNumberValidator)(),r.Factory.afterSetFilter)},7189:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.HSL=void 0;const r=n(3100),i=n(5304),o=n(4715);r.Factory.addGetterSetter(i.Node,"hue",0,(0,o.getNumberValidator)(),r.Factory.afterSetFilter),r.Factory.addGetterSetter(i.Node,"saturation",0,(0,o.getNumberValidator)(),r.Factory.afterSetFilter),r.Factory.addGetterSetter(i.Node,"luminance",0,(0,o.getNumberValidator)(),r.Factory.afterSetFilter),e.HSL=function(t){const e=t.data,n=e.length,r=Math.pow(2,this.saturation()),i=Math.abs(this.hue()+360)%360,o=127*this.luminance(),a=1*r*Math.cos(i*Math.PI/180),s=1*r*Math.sin(i*Math.PI/180),l=.299+.701*a+.167*s,c=.587-.587*a+.33*s,u=.114-.114*a-.497*s,d=.299-.299*a-.328*s,h=.587+.413*a+.035*s,f=.114-.114*a+.293*s,p=.299-.3*a+1.25*s,g=.587-.586*a-1.05*s,m=.114+.886*a-.2*s;let y,b,v,_;for(let t=0;t<n;t+=4)y=e[t+0],b=e[t+1],v=e[t+2],_=e[t+3],e[t+0]=l*y+c*b+u*v+o,e[t+1]=d*y+h*b+f*v+o,e[t+2]=p*y+g*b+m*v+o,e[t+3]=_}},7281:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Star=void 0;const r=n(3100),i=n(3123),o=n(4715),a=n(951);class s extends i.Shape{_sceneFunc(t){const e=this.innerRadius(),n=this.outerRadius(),r=this.numPoints();t.beginPath(),t.moveTo(0,0-n);for(let i=1;i<2*r;i++){const o=i%2==0?n:e,a=o*Math.sin(i*Math.PI/r),s=-1*o*Math.cos(i*Math.PI/r);t.lineTo(a,s)}t.closePath(),t.fillStrokeShape(this)}getWidth(){return 2*this.outerRadius()}getHeight(){return 2*this.outerRadius()}setWidth(t){this.outerRadius(t/2)}setHeight(t){this.outerRadius(t/2)}}e.Star=s,s.prototype.className="Star",s.prototype._centroid=!0,s.prototype._attrsAffectingSize=["innerRadius","outerRadius"],(0,a._registerNode)(s),r.Factory.addGetterSetter(s,"numPoints",5,(0,o.getNumberValidator)()),r.Factory.addGetterSetter(s,"innerRadius",0,(0,o.getNumberValidator)()),r.Factory.addGetterSetter(s,"outerRadius",0,(0,o.getNumberValidator)())},7515:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.RegularPolygon=void 0;const r=n(3100),i=n(3123),o=n(4715),a=n(951);class s extends i.Shape{_sceneFunc(t){const e=this._getPoints();t.beginPath(),t.moveTo(e[0].x,e[0].y);for(let n=1;n<e.length;n++)t.lineTo(e[n].x,e[n].y);t.closePath(),t.fillStrokeShape(this)}_getPoints(){const t=this.attrs.sides,e=this.attrs.radius||0,n=[];for(let r=0;r<t;r++)n.push({x:e*Math.sin(2*r*Math.PI/t),y:-1*e*Math.cos(2*r*Math.PI/t)});return n}getSelfRect(){const t=this._getPoints();let e=t[0].x,n=t[0].y,r=t[0].x,i=t[0].y;return t.forEach((t=>{e=Math.min(e,t.x),n=Math.max(n,t.x),r=Math.min(r,t.y),i=Math.max(i,t.y)})),{x:e,y:r,width:n-e,height:i-r}}getWidth(){return 2*this.radius()}getHeight(){return 2*this.radius()}setWidth(t){this.radius(t/2)}setHeight(t){this.radius(t/2)}}e.RegularPolygon=s,s.prototype.className="RegularPolygon",s.prototype._centroid=!0,s.prototype._attrsAffectingSize=["radius"],(0,a._registerNode)(s),r.Factory.addGetterSetter(s,"radius",0,(0,o.getNumberValidator)()),r.Factory.addGetterSetter(s,"sides",0,(0,o.getNumberValidator)())},7969:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Circle=void 0;const r=n(3100),i=n(3123),o=n(4715),a=n(951);class s extends i.Shape{_sceneFunc(t){t.beginPath(),t.arc(0,0,this.attrs.radius||0,0,2*Math.PI,!1),t.closePath(),t.fillStrokeShape(this)}getWidth(){return 2*this.radius()}getHeight(){return 2*this.radius()}setWidth(t){this.radius()!==t/2&&this.radius(t/2)}setHeight(t){this.radius()!==t/2&&this.radius(t/2)}}e.Circle=s,s.prototype._centroid=!0,s.prototype.className="Circle",s.prototype._attrsAffectingSize=["radius"],(0,a._registerNode)(s),r.Factory.addGetterSetter(s,"radius",0,(0,o.getNumberValidator)())},8241:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Wedge=void 0;const r=n(3100),i=n(3123),o=n(951),a=n(4715),s=n(951);class l extends i.Shape{_sceneFunc(t){t.beginPath(),t.arc(0,0,this.radius(),0,o.Konva.getAngle(this.angle()),this.clockwise()),t.lineTo(0,0),t.closePath(),t.fillStrokeShape(this)}getWidth(){return 2*this.radius()}getHeight(){return 2*this.radius()}setWidth(t){this.radius(t/2)}setHeight(t){this.radius(t/2)}}e.Wedge=l,l.prototype.className="Wedge",l.prototype._centroid=!0,l.prototype._attrsAffectingSize=["radius"],(0,s._registerNode)(l),r.Factory.addGetterSetter(l,"radius",0,(0,a.getNumberValidator)()),r.Factory.addGetterSetter(l,"angle",0,(0,a.getNumberValidator)()),r.Factory.addGetterSetter(l,"clockwise",!1),r.Factory.backCompat(l,{angleDeg:"angle",getAngleDeg:"getAngle",setAngleDeg:"setAngle"})},8274:(t,e)=>{"use strict";function n(t,e,n){const i=r(1,n,t),o=r(1,n,e),a=i*i+o*o;return Math.sqrt(a)}Object.defineProperty(e,"__esModule",{value:!0}),e.t2length=e.getQuadraticArcLength=e.getCubicArcLength=e.binomialCoefficients=e.cValues=e.tValues=void 0,e.tValues=[[],[],[-.5773502691896257,.5773502691896257],[0,-.7745966692414834,.7745966692414834],[-.33998104358485626,.33998104358485626,-.8611363115940526,.8611363115940526],[0,-.5384693101056831,.5384693101056831,-.906179845938664,.906179845938664],[.6612093864662645,-.6612093864662645,-.2386191860831969,.2386191860831969,-.932469514203152,.932469514203152],[0,.4058451513773972,-.4058451513773972,-.7415311855993945,.7415311855993945,-.9491079123427585,.9491079123427585],[-.1834346424956498,.1834346424956498,-.525532409916329,.525532409916329,-.7966664774136267,.7966664774136267,-.9602898564975363,.9602898564975363],[0,-.8360311073266358,.8360311073266358,-.9681602395076261,.9681602395076261,-.3242534234038089,.3242534234038089,-.6133714327005904,.6133714327005904],[-.14887433898163122,.14887433898163122,-.4333953941292472,.4333953941292472,-.6794095682990244,.6794095682990244,-.8650633666889845,.8650633666889845,-.9739065285171717,.9739065285171717],[0,-.26954315595234496,.26954315595234496,-.5190961292068118,.5190961292068118,-.7301520055740494,.7301520055740494,-.8870625997680953,.8870625997680953,-.978228658146057,.978228658146057],[-.1252334085114689,.1252334085114689,-.3678314989981802,.3678314989981802,-.5873179542866175,.5873179542866175,-.7699026741943047,.7699026741943047,-.9041172563704749,.9041172563704749,-.9815606342467192,.9815606342467192],[0,-.2304583159551348,.2304583159551348,-.44849275103644687,.44849275103644687,-.6423493394403402,.6423493394403402,-.8015780907333099,.8015780907333099,-.9175983992229779,.9175983992229779,-.9841830547185881,.9841830547185881],[-.10805494870734367,.10805494870734367,-.31911236892788974,.31911236892788974,-.5152486363581541,.5152486363581541,-.6872929048116855,.6872929048116855,-.827201315069765,.827201315069765,-.9284348836635735,.9284348836635735,-.9862838086968123,.9862838086968123],[0,-.20119409399743451,.20119409399743451,-.3941513470775634,.3941513470775634,-.5709721726085388,.5709721726085388,-.7244177313601701,.7244177313601701,-.8482065834104272,.8482065834104272,-.937273392400706,.937273392400706,-.9879925180204854,.9879925180204854],[-.09501250983763744,.09501250983763744,-.2816035507792589,.2816035507792589,-.45801677765722737,.45801677765722737,-.6178762444026438,.6178762444026438,-.755404408355003,.755404408355003,-.8656312023878318,.8656312023878318,-.9445750230732326,.9445750230732326,-.9894009349916499,.9894009349916499],[0,-.17848418149584785,.17848418149584785,-.3512317634538763,.3512317634538763,-.5126905370864769,.5126905370864769,-.6576711592166907,.6576711592166907,-.7815140038968014,.7815140038968014,-.8802391537269859,.8802391537269859,-.9506755217687678,.9506755217687678,-.9905754753144174,.9905754753144174],[-.0847750130417353,.0847750130417353,-.2518862256915055,.2518862256915055,-.41175116146284263,.41175116146284263,-.5597708310739475,.5597708310739475,-.6916870430603532,.6916870430603532,-.8037049589725231,.8037049589725231,-.8926024664975557,.8926024664975557,-.9558239495713977,.9558239495713977,-.9915651684209309,.9915651684209309],[0,-.16035864564022537,.16035864564022537,-.31656409996362983,.31656409996362983,-.46457074137596094,.46457074137596094,-.600545304661681,.600545304661681,-.7209661773352294,.7209661773352294,-.8227146565371428,.8227146565371428,-.9031559036148179,.9031559036148179,-.96020815213483,.96020815213483,-.9924068438435844,.9924068438435844],[-.07652652113349734,.07652652113349734,-.22778585114164507,.22778585114164507,-.37370608871541955,.37370608871541955,-.5108670019508271,.5108670019508271,-.636053680726515,.636053680726515,-.7463319064601508,.7463319064601508,-.8391169718222188,.8391169718222188,-.912234428251326,.912234428251326,-.9639719272779138,.9639719272779138,-.9931285991850949,.9931285991850949],[0,-.1455618541608951,.1455618541608951,-.2880213168024011,.2880213168024011,-.4243421202074388,.4243421202074388,-.5516188358872198,.5516188358872198,-.6671388041974123,.6671388041974123,-.7684399634756779,.7684399634756779,-.8533633645833173,.8533633645833173,-.9200993341504008,.9200993341504008,-.9672268385663063,.9672268385663063,-.9937521706203895,.9937521706203895],[-.06973927331972223,.06973927331972223,-.20786042668822127,.20786042668822127,-.34193582089208424,.34193582089208424,-.469355837986757,.469355837986757,-.5876404035069116,.5876404035069116,-.6944872631866827,.6944872631866827,-.7878168059792081,.7878168059792081,-.8658125777203002,.8658125777203002,-.926956772187174,.926956772187174,-.9700604978354287,.9700604978354287,-.9942945854823992,.9942945854823992],[0,-.1332568242984661,.1332568242984661,-.26413568097034495,.26413568097034495,-.3903010380302908,.3903010380302908,-.5095014778460075,.5095014778460075,-.6196098757636461,.6196098757636461,-.7186613631319502,.7186613631319502,-.8048884016188399,.8048884016188399,-.8767523582704416,.8767523582704416,-.9329710868260161,.9329710868260161,-.9725424712181152,.9725424712181152,-.9947693349975522,.9947693349975522],[-.06405689286260563,.06405689286260563,-.1911188674736163,.1911188674736163,-.3150426796961634,.3150426796961634,-.4337935076260451,.4337935076260451,-.5454214713888396,.5454214713888396,-.6480936519369755,.6480936519369755,-.7401241915785544,.7401241915785544,-.820001985973903,.820001985973903,-.8864155270044011,.8864155270044011,-.9382745520027328,.9382745520027328,-.9747285559713095,.9747285559713095,-.9951872199970213,.9951872199970213]],e.cValues=[[],[],[1,1],[.8888888888888888,.5555555555555556,.5555555555555556],[.6521451548625461,.6521451548625461,.34785484513745385,.34785484513745385],[.5688888888888889,.47862867049936647,.47862867049936647,.23692688505618908,.23692688505618908],[.3607615730481386,.3607615730481386,.46791393457269104,.46791393457269104,.17132449237917036,.17132449237917036],[.4179591836734694,.3818300505051189,.3818300505051189,.27970539148927664,.27970539148927664,.1294849661688697,.1294849661688697],[.362683783378362,.362683783378362,.31370664587788727,.31370664587788727,.22238103445337448,.22238103445337448,.10122853629037626,.10122853629037626],[.3302393550012598,.1806481606948574,.1806481606948574,.08127438836157441,.08127438836157441,.31234707704000286,.31234707704000286,.26061069640293544,.26061069640293544],[.29552422471475287,.29552422471475287,.26926671930999635,.26926671930999635,.21908636251598204,.21908636251598204,.1494513491505806,.1494513491505806,.06667134430868814,.06667134430868814],[.2729250867779006,.26280454451024665,.26280454451024665,.23319376459199048,.23319376459199048,.18629021092773426,.18629021092773426,.1255803694649046,.1255803694649046,.05566856711617366,.05566856711617366],[.24914704581340277,.24914704581340277,.2334925365383548,.2334925365383548,.20316742672306592,.20316742672306592,.16007832854334622,.16007832854334622,.10693932599531843,.10693932599531843,.04717533638651183,.04717533638651183],[.2325515532308739,.22628318026289723,.22628318026289723,.2078160475368885,.2078160475368885,.17814598076194574,.17814598076194574,.13887351021978725,.13887351021978725,.09212149983772845,.09212149983772845,.04048400476531588,.04048400476531588],[.2152638534631578,.2152638534631578,.2051984637212956,.2051984637212956,.18553839747793782,.18553839747793782,.15720316715819355,.15720316715819355,.12151857068790319,.12151857068790319,.08015808715976021,.08015808715976021,.03511946033175186,.03511946033175186],[.2025782419255613,.19843148532711158,.19843148532711158,.1861610000155622,.1861610000155622,.16626920581699392,.16626920581699392,.13957067792615432,.13957067792615432,.10715922046717194,.10715922046717194,.07036604748810812,.07036604748810812,.03075324199611727,.03075324199611727],[.1894506104550685,.1894506104550685,.18260341504492358,.18260341504492358,.16915651939500254,.16915651939500254,.14959598881657674,.14959598881657674,.12462897125553388,.12462897125553388,.09515851168249279,.09515851168249279,.062253523938647894,.062253523938647894,.027152459411754096,.027152459411754096],[.17944647035620653,.17656270536699264,.17656270536699264,.16800410215645004,.16800410215645004,.15404576107681028,.15404576107681028,.13513636846852548,.13513636846852548,.11188384719340397,.11188384719340397,.08503614831717918,.08503614831717918,.0554595293739872,.0554595293739872,.02414830286854793,.02414830286854793],[.1691423829631436,.1691423829631436,.16427648374583273,.16427648374583273,.15468467512626524,.15468467512626524,.14064291467065065,.14064291467065065,.12255520671147846,.12255520671147846,.10094204410628717,.10094204410628717,.07642573025488905,.07642573025488905,.0497145488949698,.0497145488949698,.02161601352648331,.02161601352648331],[.1610544498487837,.15896884339395434,.15896884339395434,.15276604206585967,.15276604206585967,.1426067021736066,.1426067021736066,.12875396253933621,.12875396253933621,.11156664554733399,.11156664554733399,.09149002162245,.09149002162245,.06904454273764123,.06904454273764123,.0448142267656996,.0448142267656996,.019461788229726478,.019461788229726478],[.15275338713072584,.15275338713072584,.14917298647260374,.14917298647260374,.14209610931838204,.14209610931838204,.13168863844917664,.13168863844917664,.11819453196151841,.11819453196151841,.10193011981724044,.10193011981724044,.08327674157670475,.08327674157670475,.06267204833410907,.06267204833410907,.04060142980038694,.04060142980038694,.017614007139152118,.017614007139152118],[.14608113364969041,.14452440398997005,.14452440398997005,.13988739479107315,.13988739479107315,.13226893863333747,.13226893863333747,.12183141605372853,.12183141605372853,.10879729916714838,.10879729916714838,.09344442345603386,.09344442345603386,.0761001136283793,.0761001136283793,.057134425426857205,.057134425426857205,.036953789770852494,.036953789770852494,.016017228257774335,.016017228257774335],[.13925187285563198,.13925187285563198,.13654149834601517,.13654149834601517,.13117350478706238,.13117350478706238,.12325237681051242,.12325237681051242,.11293229608053922,.11293229608053922,.10041414444288096,.10041414444288096,.08594160621706773,.08594160621706773,.06979646842452049,.06979646842452049,.052293335152683286,.052293335152683286,.03377490158481415,.03377490158481415,.0146279952982722,.0146279952982722],[.13365457218610619,.1324620394046966,.1324620394046966,.12890572218808216,.12890572218808216,.12304908430672953,.12304908430672953,.11499664022241136,.11499664022241136,.10489209146454141,.10489209146454141,.09291576606003515,.09291576606003515,.07928141177671895,.07928141177671895,.06423242140852585,.06423242140852585,.04803767173108467,.04803767173108467,.030988005856979445,.030988005856979445,.013411859487141771,.013411859487141771],[.12793819534675216,.12793819534675216,.1258374563468283,.1258374563468283,.12167047292780339,.12167047292780339,.1155056680537256,.1155056680537256,.10744427011596563,.10744427011596563,.09761865210411388,.09761865210411388,.08619016153195327,.08619016153195327,.0733464814110803,.0733464814110803,.05929858491543678,.05929858491543678,.04427743881741981,.04427743881741981,.028531388628933663,.028531388628933663,.0123412297999872,.0123412297999872]],e.binomialCoefficients=[[1],[1,1],[1,2,1],[1,3,3,1]],e.getCubicArcLength=(t,r,i)=>{let o,a;const s=i/2;o=0;for(let i=0;i<20;i++)a=s*e.tValues[20][i]+s,o+=e.cValues[20][i]*n(t,r,a);return s*o},e.getQuadraticArcLength=(t,e,n)=>{void 0===n&&(n=1);const r=t[0]-2*t[1]+t[2],i=e[0]-2*e[1]+e[2],o=2*t[1]-2*t[0],a=2*e[1]-2*e[0],s=4*(r*r+i*i),l=4*(r*o+i*a),c=o*o+a*a;if(0===s)return n*Math.sqrt(Math.pow(t[2]-t[0],2)+Math.pow(e[2]-e[0],2));const u=l/(2*s),d=n+u,h=c/s-u*u,f=d*d+h>0?Math.sqrt(d*d+h):0,p=u*u+h>0?Math.sqrt(u*u+h):0,g=u+Math.sqrt(u*u+h)!==0?h*Math.log(Math.abs((d+f)/(u+p))):0;return Math.sqrt(s)/2*(d*f-u*p+g)};const r=(t,n,i)=>{const o=i.length-1;let a,s;if(0===o)return 0;if(0===t){s=0;for(let t=0;t<=o;t++)s+=e.binomialCoefficients[o][t]*Math.pow(1-n,o-t)*Math.pow(n,t)*i[t];return s}a=new Array(o);for(let t=0;t<o;t++)a[t]=o*(i[t+1]-i[t]);return r(t-1,n,a)};e.t2length=(t,e,n)=>{let r=1,i=t/e,o=(t-n(i))/e,a=0;for(;r>.001;){const s=n(i+o),l=Math.abs(t-s)/e;if(l<r)r=l,i+=o;else{const a=n(i-o),s=Math.abs(t-a)/e;s<r?(r=s,i-=o):o/=2}if(a++,a>500)break}return i}},8394:t=>{t.exports=function(t){return null!=t&&"object"==typeof t}},8432:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Animation=void 0;const r=n(951),i=n(9532),o=r.glob.performance&&r.glob.performance.now?function(){return r.glob.performance.now()}:function(){return(new Date).getTime()};class a{constructor(t,e){this.id=a.animIdCounter++,this.frame={time:0,timeDiff:0,lastTime:o(),frameRate:0},this.func=t,this.setLayers(e)}setLayers(t){let e=[];return t&&(e=Array.isArray(t)?t:[t]),this.layers=e,this}getLayers(){return this.layers}addLayer(t){const e=this.layers,n=e.length;for(let r=0;r<n;r++)if(e[r]._id===t._id)return!1;return this.layers.push(t),!0}isRunning(){const t=a.animations,e=t.length;for(let n=0;n<e;n++)if(t[n].id===this.id)return!0;return!1}start(){return this.stop(),this.frame.timeDiff=0,this.frame.lastTime=o(),a._addAnimation(this),this}stop(){return a._removeAnimation(this),this}_updateFrameObject(t){this.frame.timeDiff=t-this.frame.lastTime,this.frame.lastTime=t,this.frame.time+=this.frame.timeDiff,this.frame.frameRate=1e3/this.frame.timeDiff}static _addAnimation(t){this.animations.push(t),this._handleAnimation()}static _removeAnimation(t){const e=t.id,n=this.animations,r=n.length;for(let t=0;t<r;t++)if(n[t].id===e){this.animations.splice(t,1);break}}static _runFrames(){const t={},e=this.animations;for(let n=0;n<e.length;n++){const r=e[n],i=r.layers,a=r.func;r._updateFrameObject(o());const s=i.length;let l;if(l=!a||!1!==a.call(r,r.frame),l)for(let e=0;e<s;e++){const n=i[e];void 0!==n._id&&(t[n._id]=n)}}for(const e in t)t.hasOwnProperty(e)&&t[e].batchDraw()}static _animationLoop(){const t=a;t.animations.length?(t._runFrames(),i.Util.requestAnimFrame(t._animationLoop)):t.animRunning=!1}static _handleAnimation(){this.animRunning||(this.animRunning=!0,i.Util.requestAnimFrame(this._animationLoop))}}e.Animation=a,a.animations=[],a.animIdCounter=0,a.animRunning=!1},8475:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Tag=e.Label=void 0;const r=n(3100),i=n(3123),o=n(6445),a=n(4715),s=n(951),l=["fontFamily","fontSize","fontStyle","padding","lineHeight","text","width","height","pointerDirection","pointerWidth","pointerHeight"],c="up",u="right",d="down",h="left",f=l.length;class p extends o.Group{constructor(t){super(t),this.on("add.konva",(function(t){this._addListeners(t.child),this._sync()}))}getText(){return this.find("Text")[0]}getTag(){return this.find("Tag")[0]}_addListeners(t){let e,n=this;const r=function(){n._sync()};for(e=0;e<f;e++)t.on(l[e]+"Change.konva",r)}getWidth(){return this.getText().width()}getHeight(){return this.getText().height()}_sync(){let t,e,n,r,i,o,a,s=this.getText(),l=this.getTag();if(s&&l){switch(t=s.width(),e=s.height(),n=l.pointerDirection(),r=l.pointerWidth(),a=l.pointerHeight(),i=0,o=0,n){case c:i=t/2,o=-1*a;break;case u:i=t+r,o=e/2;break;case d:i=t/2,o=e+a;break;case h:i=-1*r,o=e/2}l.setAttrs({x:-1*i,y:-1*o,width:t,height:e}),s.setAttrs({x:-1*i,y:-1*o})}}}e.Label=p,p.prototype.className="Label",(0,s._registerNode)(p);class g extends i.Shape{_sceneFunc(t){const e=this.width(),n=this.height(),r=this.pointerDirection(),i=this.pointerWidth(),o=this.pointerHeight(),a=this.cornerRadius();let s=0,l=0,f=0,p=0;"number"==typeof a?s=l=f=p=Math.min(a,e/2,n/2):(s=Math.min(a[0]||0,e/2,n/2),l=Math.min(a[1]||0,e/2,n/2),p=Math.min(a[2]||0,e/2,n/2),f=Math.min(a[3]||0,e/2,n/2)),t.beginPath(),t.moveTo(s,0),r===c&&(t.lineTo((e-i)/2,0),t.lineTo(e/2,-1*o),t.lineTo((e+i)/2,0)),t.lineTo(e-l,0),t.arc(e-l,l,l,3*Math.PI/2,0,!1),r===u&&(t.lineTo(e,(n-o)/2),t.lineTo(e+i,n/2),t.lineTo(e,(n+o)/2)),t.lineTo(e,n-p),t.arc(e-p,n-p,p,0,Math.PI/2,!1),r===d&&(t.lineTo((e+i)/2,n),t.lineTo(e/2,n+o),t.lineTo((e-i)/2,n)),t.lineTo(f,n),t.arc(f,n-f,f,Math.PI/2,Math.PI,!1),r===h&&(t.lineTo(0,(n+o)/2),t.lineTo(-1*i,n/2),t.lineTo(0,(n-o)/2)),t.lineTo(0,s),t.arc(s,s,s,Math.PI,3*Math.PI/2,!1),t.closePath(),t.fillStrokeShape(this)}getSelfRect(){let t=0,e=0,n=this.pointerWidth(),r=this.pointerHeight(),i=this.pointerDirection(),o=this.width(),a=this.height();return i===c?(e-=r,a+=r):i===d?a+=r:i===h?(t-=1.5*n,o+=n):i===u&&(o+=1.5*n),{x:t,y:e,width:o,height:a}}}e.Tag=g,g.prototype.className="Tag",(0,s._registerNode)(g),r.Factory.addGetterSetter(g,"pointerDirection","none"),r.Factory.addGetterSetter(g,"pointerWidth",0,(0,a.getNumberValidator)()),r.Factory.addGetterSetter(g,"pointerHeight",0,(0,a.getNumberValidator)()),r.Factory.addGetterSetter(g,"cornerRadius",0,(0,a.getNumberOrArrayOfNumbersValidator)(4))},8494:(t,e,n)=>{"use strict";t.exports=n(9447)},8608:(t,e,n)=>{var r=n(8664),i=/^\s+/;t.exports=function(t){return t?t.slice(0,r(t)+1).replace(i,""):t}},8664:t=>{var e=/\s/;t.exports=function(t){for(var n=t.length;n--&&e.test(t.charAt(n)););return n}},8696:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Image=void 0;const r=n(9532),i=n(3100),o=n(3123),a=n(951),s=n(4715);class l extends o.Shape{constructor(t){super(t),this._loadListener=()=>{this._requestDraw()},this.on("imageChange.konva",(t=>{this._removeImageLoad(t.oldVal),this._setImageLoad()})),this._setImageLoad()}_setImageLoad(){const t=this.image();t&&t.complete||t&&4===t.readyState||t&&t.addEventListener&&t.addEventListener("load",this._loadListener)}_removeImageLoad(t){t&&t.removeEventListener&&t.removeEventListener("load",this._loadListener)}destroy(){return this._removeImageLoad(this.image()),super.destroy(),this}_useBufferCanvas(){const t=!!this.cornerRadius(),e=this.hasShadow();return!(!t||!e)||super._useBufferCanvas(!0)}_sceneFunc(t){const e=this.getWidth(),n=this.getHeight(),i=this.cornerRadius(),o=this.attrs.image;let a;if(o){const t=this.attrs.cropWidth,r=this.attrs.cropHeight;a=t&&r?[o,this.cropX(),this.cropY(),t,r,0,0,e,n]:[o,0,0,e,n]}(this.hasFill()||this.hasStroke()||i)&&(t.beginPath(),i?r.Util.drawRoundedRectPath(t,e,n,i):t.rect(0,0,e,n),t.closePath(),t.fillStrokeShape(this)),o&&(i&&t.clip(),t.drawImage.apply(t,a))}_hitFunc(t){const e=this.width(),n=this.height(),i=this.cornerRadius();t.beginPath(),i?r.Util.drawRoundedRectPath(t,e,n,i):t.rect(0,0,e,n),t.closePath(),t.fillStrokeShape(this)}getWidth(){var t,e;return null!==(t=this.attrs.width)&&void 0!==t?t:null===(e=this.image())||void 0===e?void 0:e.width}getHeight(){var t,e;return null!==(t=this.attrs.height)&&void 0!==t?t:null===(e=this.image())||void 0===e?void 0:e.height}static fromURL(t,e,n=null){const i=r.Util.createImageElement();i.onload=function(){const t=new l({image:i});e(t)},i.onerror=n,i.crossOrigin="Anonymous",i.src=t}}e.Image=l,l.prototype.className="Image",(0,a._registerNode)(l),i.Factory.addGetterSetter(l,"cornerRadius",0,(0,s.getNumberOrArrayOfNumbersValidator)(4)),i.Factory.addGetterSetter(l,"image"),i.Factory.addComponentsGetterSetter(l,"crop",["x","y","width","height"]),i.Factory.addGetterSetter(l,"cropX",0,(0,s.getNumberValidator)()),i.Factory.addGetterSetter(l,"cropY",0,(0,s.getNumberValidator)()),i.Factory.addGetterSetter(l,"cropWidth",0,(0,s.getNumberValidator)()),i.Factory.addGetterSetter(l,"cropHeight",0,(0,s.getNumberValidator)())},8803:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Rect=void 0;const r=n(3100),i=n(3123),o=n(951),a=n(9532),s=n(4715);class l extends i.Shape{_sceneFunc(t){const e=this.cornerRadius(),n=this.width(),r=this.height();t.beginPath(),e?a.Util.drawRoundedRectPath(t,n,r,e):t.rect(0,0,n,r),t.closePath(),t.fillStrokeShape(this)}}e.Rect=l,l.prototype.className="Rect",(0,o._registerNode)(l),r.Factory.addGetterSetter(l,"cornerRadius",0,(0,s.getNumberOrArrayOfNumbersValidator)(4))},8833:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.FastLayer=void 0;const r=n(9532),i=n(1691),o=n(951);class a extends i.Layer{constructor(t){super(t),this.listening(!1),r.Util.warn('Konva.Fast layer is deprecated. Please use "new Konva.Layer({ listening: false })" instead.')}}e.FastLayer=a,a.prototype.nodeType="FastLayer",(0,o._registerNode)(a)},8858:(t,e,n)=>{var r=n(1672),i=n(8394);t.exports=function(t){return"symbol"==typeof t||i(t)&&"[object Symbol]"==r(t)}},9164:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.HitCanvas=e.SceneCanvas=e.Canvas=void 0;const r=n(9532),i=n(6605),o=n(951);let a;class s{constructor(t){this.pixelRatio=1,this.width=0,this.height=0,this.isCache=!1;const e=(t||{}).pixelRatio||o.Konva.pixelRatio||function(){if(a)return a;const t=r.Util.createCanvasElement(),e=t.getContext("2d");return a=(o.Konva._global.devicePixelRatio||1)/(e.webkitBackingStorePixelRatio||e.mozBackingStorePixelRatio||e.msBackingStorePixelRatio||e.oBackingStorePixelRatio||e.backingStorePixelRatio||1),r.Util.releaseCanvas(t),a}();this.pixelRatio=e,this._canvas=r.Util.createCanvasElement(),this._canvas.style.padding="0",this._canvas.style.margin="0",this._canvas.style.border="0",this._canvas.style.background="transparent",this._canvas.style.position="absolute",this._canvas.style.top="0",this._canvas.style.left="0"}getContext(){return this.context}getPixelRatio(){return this.pixelRatio}setPixelRatio(t){const e=this.pixelRatio;this.pixelRatio=t,this.setSize(this.getWidth()/e,this.getHeight()/e)}setWidth(t){this.width=this._canvas.width=t*this.pixelRatio,this._canvas.style.width=t+"px";const e=this.pixelRatio;this.getContext()._context.scale(e,e)}setHeight(t){this.height=this._canvas.height=t*this.pixelRatio,this._canvas.style.height=t+"px";const e=this.pixelRatio;this.getContext()._context.scale(e,e)}getWidth(){return this.width}getHeight(){return this.height}setSize(t,e){this.setWidth(t||0),this.setHeight(e||0)}toDataURL(t,e){try{return this._canvas.toDataURL(t,e)}catch(t){try{return this._canvas.toDataURL()}catch(t){return r.Util.error("Unable to get data URL. "+t.message+" For more info read https://konvajs.org/docs/posts/Tainted_Canvas.html."),""}}}}e.Canvas=s,e.SceneCanvas=class extends s{constructor(t={width:0,height:0,willReadFrequently:!1}){super(t),this.context=new i.SceneContext(this,{willReadFrequently:t.willReadFrequently}),this.setSize(t.width,t.height)}},e.HitCanvas=class extends s{constructor(t={width:0,height:0}){super(t),this.hitCanvas=!0,this.context=new i.HitContext(this),this.setSize(t.width,t.height)}}},9447:(t,e)=>{"use strict";function n(t,e){var n=t.length;t.push(e);t:for(;0<n;){var r=n-1>>>1,i=t[r];if(!(0<o(i,e)))break t;t[r]=e,t[n]=i,n=r}}function r(t){return 0===t.length?null:t[0]}function i(t){if(0===t.length)return null;var e=t[0],n=t.pop();if(n!==e){t[0]=n;t:for(var r=0,i=t.length,a=i>>>1;r<a;){var s=2*(r+1)-1,l=t[s],c=s+1,u=t[c];if(0>o(l,n))c<i&&0>o(u,l)?(t[r]=u,t[c]=n,r=c):(t[r]=l,t[s]=n,r=s);else{if(!(c<i&&0>o(u,n)))break t;t[r]=u,t[c]=n,r=c}}}return e}function o(t,e){var n=t.sortIndex-e.sortIndex;return 0!==n?n:t.id-e.id}if("object"==typeof performance&&"function"==typeof performance.now){var a=performance;e.unstable_now=function(){return a.now()}}else{var s=Date,l=s.now();e.unstable_now=function(){return s.now()-l}}var c=[],u=[],d=1,h=null,f=3,p=!1,g=!1,m=!1,y="function"==typeof setTimeout?setTimeout:null,b="function"==typeof clearTimeout?clearTimeout:null,v="undefined"!=typeof setImmediate?setImmediate:null;function _(t){for(var e=r(u);null!==e;){if(null===e.callback)i(u);else{if(!(e.startTime<=t))break;i(u),e.sortIndex=e.expirationTime,n(c,e)}e=r(u)}}function w(t){if(m=!1,_(t),!g)if(null!==r(c))g=!0,F(x);else{var e=r(u);null!==e&&R(w,e.startTime-t)}}function x(t,n){g=!1,m&&(m=!1,b(T),T=-1),p=!0;var o=f;try{for(_(n),h=r(c);null!==h&&(!(h.expirationTime>n)||t&&!I());){var a=h.callback;if("function"==typeof a){h.callback=null,f=h.priorityLevel;var s=a(h.expirationTime<=n);n=e.unstable_now(),"function"==typeof s?h.callback=s:h===r(c)&&i(c),_(n)}else i(c);h=r(c)}if(null!==h)var l=!0;else{var d=r(u);null!==d&&R(w,d.startTime-n),l=!1}return l}finally{h=null,f=o,p=!1}}"undefined"!=typeof navigator&&void 0!==navigator.scheduling&&void 0!==navigator.scheduling.isInputPending&&navigator.scheduling.isInputPending.bind(navigator.scheduling);var S,k=!1,C=null,T=-1,E=5,P=-1;function I(){return!(e.unstable_now()-P<E)}function A(){if(null!==C){var t=e.unstable_now();P=t;var n=!0;try{n=C(!0,t)}finally{n?S():(k=!1,C=null)}}else k=!1}if("function"==typeof v)S=function(){v(A)};else if("undefined"!=typeof MessageChannel){var M=new MessageChannel,D=M.port2;M.port1.onmessage=A,S=function(){D.postMessage(null)}}else S=function(){y(A,0)};function F(t){C=t,k||(k=!0,S())}function R(t,n){T=y((function(){t(e.unstable_now())}),n)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(t){t.callback=null},e.unstable_continueExecution=function(){g||p||(g=!0,F(x))},e.unstable_forceFrameRate=function(t){0>t||125<t?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):E=0<t?Math.floor(1e3/t):5},e.unstable_getCurrentPriorityLevel=function(){return f},e.unstable_getFirstCallbackNode=function(){return r(c)},e.unstable_next=function(t){switch(f){case 1:case 2:case 3:var e=3;break;default:e=f}var n=f;f=e;try{return t()}finally{f=n}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(t,e){switch(t){case 1:case 2:case 3:case 4:case 5:break;default:t=3}var n=f;f=t;try{return e()}finally{f=n}},e.unstable_scheduleCallback=function(t,i,o){var a=e.unstable_now();switch(o="object"==typeof o&&null!==o&&"number"==typeof(o=o.delay)&&0<o?a+o:a,t){case 1:var s=-1;break;case 2:s=250;break;case 5:s=1073741823;break;case 4:s=1e4;break;default:s=5e3}return t={id:d++,callback:i,priorityLevel:t,startTime:o,expirationTime:s=o+s,sortIndex:-1},o>a?(t.sortIndex=o,n(u,t),null===r(c)&&t===r(u)&&(m?(b(T),T=-1):m=!0,R(w,o-a))):(t.sortIndex=s,n(c,t),g||p||(g=!0,F(x))),t},e.unstable_shouldYield=I,e.unstable_wrapCallback=function(t){var e=f;return function(){var n=f;f=e;try{return t.apply(this,arguments)}finally{f=n}}}},9532:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Util=e.Transform=void 0;const r=n(951);class i{constructor(t=[1,0,0,1,0,0]){this.dirty=!1,this.m=t&&t.slice()||[1,0,0,1,0,0]}reset(){this.m[0]=1,this.m[1]=0,this.m[2]=0,this.m[3]=1,this.m[4]=0,this.m[5]=0}copy(){return new i(this.m)}copyInto(t){t.m[0]=this.m[0],t.m[1]=this.m[1],t.m[2]=this.m[2],t.m[3]=this.m[3],t.m[4]=this.m[4],t.m[5]=this.m[5]}point(t){const e=this.m;return{x:e[0]*t.x+e[2]*t.y+e[4],y:e[1]*t.x+e[3]*t.y+e[5]}}translate(t,e){return this.m[4]+=this.m[0]*t+this.m[2]*e,this.m[5]+=this.m[1]*t+this.m[3]*e,this}scale(t,e){return this.m[0]*=t,this.m[1]*=t,this.m[2]*=e,this.m[3]*=e,this}rotate(t){const e=Math.cos(t),n=Math.sin(t),r=this.m[0]*e+this.m[2]*n,i=this.m[1]*e+this.m[3]*n,o=this.m[0]*-n+this.m[2]*e,a=this.m[1]*-n+this.m[3]*e;return this.m[0]=r,this.m[1]=i,this.m[2]=o,this.m[3]=a,this}getTranslation(){return{x:this.m[4],y:this.m[5]}}skew(t,e){const n=this.m[0]+this.m[2]*e,r=this.m[1]+this.m[3]*e,i=this.m[2]+this.m[0]*t,o=this.m[3]+this.m[1]*t;return this.m[0]=n,this.m[1]=r,this.m[2]=i,this.m[3]=o,this}multiply(t){const e=this.m[0]*t.m[0]+this.m[2]*t.m[1],n=this.m[1]*t.m[0]+this.m[3]*t.m[1],r=this.m[0]*t.m[2]+this.m[2]*t.m[3],i=this.m[1]*t.m[2]+this.m[3]*t.m[3],o=this.m[0]*t.m[4]+this.m[2]*t.m[5]+this.m[4],a=this.m[1]*t.m[4]+this.m[3]*t.m[5]+this.m[5];return this.m[0]=e,this.m[1]=n,this.m[2]=r,this.m[3]=i,this.m[4]=o,this.m[5]=a,this}invert(){const t=1/(this.m[0]*this.m[3]-this.m[1]*this.m[2]),e=this.m[3]*t,n=-this.m[1]*t,r=-this.m[2]*t,i=this.m[0]*t,o=t*(this.m[2]*this.m[5]-this.m[3]*this.m[4]),a=t*(this.m[1]*this.m[4]-this.m[0]*this.m[5]);return this.m[0]=e,this.m[1]=n,this.m[2]=r,this.m[3]=i,this.m[4]=o,this.m[5]=a,this}getMatrix(){return this.m}decompose(){const t=this.m[0],n=this.m[1],r=this.m[2],i=this.m[3],o=t*i-n*r,a={x:this.m[4],y:this.m[5],rotation:0,scaleX:0,scaleY:0,skewX:0,skewY:0};if(0!=t||0!=n){const e=Math.sqrt(t*t+n*n);a.rotation=n>0?Math.acos(t/e):-Math.acos(t/e),a.scaleX=e,a.scaleY=o/e,a.skewX=(t*r+n*i)/o,a.skewY=0}else if(0!=r||0!=i){const e=Math.sqrt(r*r+i*i);a.rotation=Math.PI/2-(i>0?Math.acos(-r/e):-Math.acos(r/e)),a.scaleX=o/e,a.scaleY=e,a.skewX=0,a.skewY=(t*r+n*i)/o}return a.rotation=e.Util._getRotation(a.rotation),a}}e.Transform=i;const o=Math.PI/180,a=180/Math.PI,s="Konva error: ",l={aliceblue:[240,248,255],antiquewhite:[250,235,215],aqua:[0,255,255],aquamarine:[127,255,212],azure:[240,255,255],beige:[245,245,220],bisque:[255,228,196],black:[0,0,0],blanchedalmond:[255,235,205],blue:[0,0,255],blueviolet:[138,43,226],brown:[165,42,42],burlywood:[222,184,135],cadetblue:[95,158,160],chartreuse:[127,255,0],chocolate:[210,105,30],coral:[255,127,80],cornflowerblue:[100,149,237],cornsilk:[255,248,220],crimson:[220,20,60],cyan:[0,255,255],darkblue:[0,0,139],darkcyan:[0,139,139],darkgoldenrod:[184,132,11],darkgray:[169,169,169],darkgreen:[0,100,0],darkgrey:[169,169,169],darkkhaki:[189,183,107],darkmagenta:[139,0,139],darkolivegreen:[85,107,47],darkorange:[255,140,0],darkorchid:[153,50,204],darkred:[139,0,0],darksalmon:[233,150,122],darkseagreen:[143,188,143],darkslateblue:[72,61,139],darkslategray:[47,79,79],darkslategrey:[47,79,79],darkturquoise:[0,206,209],darkviolet:[148,0,211],deeppink:[255,20,147],deepskyblue:[0,191,255],dimgray:[105,105,105],dimgrey:[105,105,105],dodgerblue:[30,144,255],firebrick:[178,34,34],floralwhite:[255,255,240],forestgreen:[34,139,34],fuchsia:[255,0,255],gainsboro:[220,220,220],ghostwhite:[248,248,255],gold:[255,215,0],goldenrod:[218,165,32],gray:[128,128,128],green:[0,128,0],greenyellow:[173,255,47],grey:[128,128,128],honeydew:[240,255,240],hotpink:[255,105,180],indianred:[205,92,92],indigo:[75,0,130],ivory:[255,255,240],khaki:[240,230,140],lavender:[230,230,250],lavenderblush:[255,240,245],lawngreen:[124,252,0],lemonchiffon:[255,250,205],lightblue:[173,216,230],lightcoral:[240,128,128],lightcyan:[224,255,255],lightgoldenrodyellow:[250,250,210],lightgray:[211,211,211],lightgreen:[144,238,144],lightgrey:[211,211,211],lightpink:[255,182,193],lightsalmon:[255,160,122],lightseagreen:[32,178,170],lightskyblue:[135,206,250],lightslategray:[119,136,153],lightslategrey:[119,136,153],lightsteelblue:[176,196,222],lightyellow:[255,255,224],lime:[0,255,0],limegreen:[50,205,50],linen:[250,240,230],magenta:[255,0,255],maroon:[128,0,0],mediumaquamarine:[102,205,170],mediumblue:[0,0,205],mediumorchid:[186,85,211],mediumpurple:[147,112,219],mediumseagreen:[60,179,113],mediumslateblue:[123,104,238],mediumspringgreen:[0,250,154],mediumturquoise:[72,209,204],mediumvioletred:[199,21,133],midnightblue:[25,25,112],mintcream:[245,255,250],mistyrose:[255,228,225],moccasin:[255,228,181],navajowhite:[255,222,173],navy:[0,0,128],oldlace:[253,245,230],olive:[128,128,0],olivedrab:[107,142,35],orange:[255,165,0],orangered:[255,69,0],orchid:[218,112,214],palegoldenrod:[238,232,170],palegreen:[152,251,152],paleturquoise:[175,238,238],palevioletred:[219,112,147],papayawhip:[255,239,213],peachpuff:[255,218,185],peru:[205,133,63],pink:[255,192,203],plum:[221,160,203],powderblue:[176,224,230],purple:[128,0,128],rebeccapurple:[102,51,153],red:[255,0,0],rosybrown:[188,143,143],royalblue:[65,105,225],saddlebrown:[139,69,19],salmon:[250,128,114],sandybrown:[244,164,96],seagreen:[46,139,87],seashell:[255,245,238],sienna:[160,82,45],silver:[192,192,192],skyblue:[135,206,235],slateblue:[106,90,205],slategray:[119,128,144],slategrey:[119,128,144],snow:[255,255,250],springgreen:[0,255,127],steelblue:[70,130,180],tan:[210,180,140],teal:[0,128,128],thistle:[216,191,216],transparent:[255,255,255,0],tomato:[255,99,71],turquoise:[64,224,208],violet:[238,130,238],wheat:[245,222,179],white:[255,255,255],whitesmoke:[245,245,245],yellow:[255,255,0],yellowgreen:[154,205,5]},c=/rgb\((\d{1,3}),(\d{1,3}),(\d{1,3})\)/;let u=[];const d="undefined"!=typeof requestAnimationFrame&&requestAnimationFrame||function(t){setTimeout(t,60)};e.Util={_isElement:t=>!(!t||1!=t.nodeType),_isFunction:t=>!!(t&&t.constructor&&t.call&&t.apply),_isPlainObject:t=>!!t&&t.constructor===Object,_isArray:t=>"[object Array]"===Object.prototype.toString.call(t),_isNumber:t=>"[object Number]"===Object.prototype.toString.call(t)&&!isNaN(t)&&isFinite(t),_isString:t=>"[object String]"===Object.prototype.toString.call(t),_isBoolean:t=>"[object Boolean]"===Object.prototype.toString.call(t),isObject:t=>t instanceof Object,isValidSelector(t){if("string"!=typeof t)return!1;const e=t[0];return"#"===e||"."===e||e===e.toUpperCase()},_sign:t=>0===t||t>0?1:-1,requestAnimFrame(t){u.push(t),1===u.length&&d((function(){const t=u;u=[],t.forEach((function(t){t()}))}))},createCanvasElement(){const t=document.createElement("canvas");try{t.style=t.style||{}}catch(t){}return t},createImageElement:()=>document.createElement("img"),_isInDocument(t){for(;t=t.parentNode;)if(t==document)return!0;return!1},_urlToImage(t,n){const r=e.Util.createImageElement();r.onload=function(){n(r)},r.src=t},_rgbToHex:(t,e,n)=>((1<<24)+(t<<16)+(e<<8)+n).toString(16).slice(1),_hexToRgb(t){t=t.replace("#","");const e=parseInt(t,16);return{r:e>>16&255,g:e>>8&255,b:255&e}},getRandomColor(){let t=(16777215*Math.random()|0).toString(16);for(;t.length<6;)t="0"+t;return"#"+t},getRGB(t){let e;return t in l?(e=l[t],{r:e[0],g:e[1],b:e[2]}):"#"===t[0]?this._hexToRgb(t.substring(1)):"rgb("===t.substr(0,4)?(e=c.exec(t.replace(/ /g,"")),{r:parseInt(e[1],10),g:parseInt(e[2],10),b:parseInt(e[3],10)}):{r:0,g:0,b:0}},colorToRGBA:t=>(t=t||"black",e.Util._namedColorToRBA(t)||e.Util._hex3ColorToRGBA(t)||e.Util._hex4ColorToRGBA(t)||e.Util._hex6ColorToRGBA(t)||e.Util._hex8ColorToRGBA(t)||e.Util._rgbColorToRGBA(t)||e.Util._rgbaColorToRGBA(t)||e.Util._hslColorToRGBA(t)),_namedColorToRBA(t){const e=l[t.toLowerCase()];return e?{r:e[0],g:e[1],b:e[2],a:1}:null},_rgbColorToRGBA(t){if(0===t.indexOf("rgb(")){const e=(t=t.match(/rgb\(([^)]+)\)/)[1]).split(/ *, */).map(Number);return{r:e[0],g:e[1],b:e[2],a:1}}},_rgbaColorToRGBA(t){if(0===t.indexOf("rgba(")){const e=(t=t.match(/rgba\(([^)]+)\)/)[1]).split(/ *, */).map(((t,e)=>"%"===t.slice(-1)?3===e?parseInt(t)/100:parseInt(t)/100*255:Number(t)));return{r:e[0],g:e[1],b:e[2],a:e[3]}}},_hex8ColorToRGBA(t){if("#"===t[0]&&9===t.length)return{r:parseInt(t.slice(1,3),16),g:parseInt(t.slice(3,5),16),b:parseInt(t.slice(5,7),16),a:parseInt(t.slice(7,9),16)/255}},_hex6ColorToRGBA(t){if("#"===t[0]&&7===t.length)return{r:parseInt(t.slice(1,3),16),g:parseInt(t.slice(3,5),16),b:parseInt(t.slice(5,7),16),a:1}},_hex4ColorToRGBA(t){if("#"===t[0]&&5===t.length)return{r:parseInt(t[1]+t[1],16),g:parseInt(t[2]+t[2],16),b:parseInt(t[3]+t[3],16),a:parseInt(t[4]+t[4],16)/255}},_hex3ColorToRGBA(t){if("#"===t[0]&&4===t.length)return{r:parseInt(t[1]+t[1],16),g:parseInt(t[2]+t[2],16),b:parseInt(t[3]+t[3],16),a:1}},_hslColorToRGBA(t){if(/hsl\((\d+),\s*([\d.]+)%,\s*([\d.]+)%\)/g.test(t)){const[e,...n]=/hsl\((\d+),\s*([\d.]+)%,\s*([\d.]+)%\)/g.exec(t),r=Number(n[0])/360,i=Number(n[1])/100,o=Number(n[2])/100;let a,s,l;if(0===i)return l=255*o,{r:Math.round(l),g:Math.round(l),b:Math.round(l),a:1};a=o<.5?o*(1+i):o+i-o*i;const c=2*o-a,u=[0,0,0];for(let t=0;t<3;t++)s=r+1/3*-(t-1),s<0&&s++,s>1&&s--,l=6*s<1?c+6*(a-c)*s:2*s<1?a:3*s<2?c+(a-c)*(2/3-s)*6:c,u[t]=255*l;return{r:Math.round(u[0]),g:Math.round(u[1]),b:Math.round(u[2]),a:1}}},haveIntersection:(t,e)=>!(e.x>t.x+t.width||e.x+e.width<t.x||e.y>t.y+t.height||e.y+e.height<t.y),cloneObject(t){const e={};for(const n in t)this._isPlainObject(t[n])?e[n]=this.cloneObject(t[n]):this._isArray(t[n])?e[n]=this.cloneArray(t[n]):e[n]=t[n];return e},cloneArray:t=>t.slice(0),degToRad:t=>t*o,radToDeg:t=>t*a,_degToRad:t=>(e.Util.warn("Util._degToRad is removed. Please use public Util.degToRad instead."),e.Util.degToRad(t)),_radToDeg:t=>(e.Util.warn("Util._radToDeg is removed. Please use public Util.radToDeg instead."),e.Util.radToDeg(t)),_getRotation:t=>r.Konva.angleDeg?e.Util.radToDeg(t):t,_capitalize:t=>t.charAt(0).toUpperCase()+t.slice(1),throw(t){throw new Error(s+t)},error(t){console.error(s+t)},warn(t){r.Konva.showWarnings&&console.warn("Konva warning: "+t)},each(t,e){for(const n in t)e(n,t[n])},_inRange:(t,e,n)=>e<=t&&t<n,_getProjectionToSegment(t,e,n,r,i,o){let a,s,l;const c=(t-n)*(t-n)+(e-r)*(e-r);if(0==c)a=t,s=e,l=(i-n)*(i-n)+(o-r)*(o-r);else{const u=((i-t)*(n-t)+(o-e)*(r-e))/c;u<0?(a=t,s=e,l=(t-i)*(t-i)+(e-o)*(e-o)):u>1?(a=n,s=r,l=(n-i)*(n-i)+(r-o)*(r-o)):(a=t+u*(n-t),s=e+u*(r-e),l=(a-i)*(a-i)+(s-o)*(s-o))}return[a,s,l]},_getProjectionToLine(t,n,r){const i=e.Util.cloneObject(t);let o=Number.MAX_VALUE;return n.forEach((function(a,s){if(!r&&s===n.length-1)return;const l=n[(s+1)%n.length],c=e.Util._getProjectionToSegment(a.x,a.y,l.x,l.y,t.x,t.y),u=c[0],d=c[1],h=c[2];h<o&&(i.x=u,i.y=d,o=h)})),i},_prepareArrayForTween(t,n,r){const i=[],o=[];if(t.length>n.length){const e=n;n=t,t=e}for(let e=0;e<t.length;e+=2)i.push({x:t[e],y:t[e+1]});for(let t=0;t<n.length;t+=2)o.push({x:n[t],y:n[t+1]});const a=[];return o.forEach((function(t){const n=e.Util._getProjectionToLine(t,i,r);a.push(n.x),a.push(n.y)})),a},_prepareToStringify(t){let n;t.visitedByCircularReferenceRemoval=!0;for(const r in t)if(t.hasOwnProperty(r)&&t[r]&&"object"==typeof t[r])if(n=Object.getOwnPropertyDescriptor(t,r),t[r].visitedByCircularReferenceRemoval||e.Util._isElement(t[r])){if(!n.configurable)return null;delete t[r]}else if(null===e.Util._prepareToStringify(t[r])){if(!n.configurable)return null;delete t[r]}return delete t.visitedByCircularReferenceRemoval,t},_assign(t,e){for(const n in e)t[n]=e[n];return t},_getFirstPointerId:t=>t.touches?t.changedTouches[0].identifier:t.pointerId||999,releaseCanvas(...t){r.Konva.releaseCanvasOnDestroy&&t.forEach((t=>{t.width=0,t.height=0}))},drawRoundedRectPath(t,e,n,r){let i=0,o=0,a=0,s=0;"number"==typeof r?i=o=a=s=Math.min(r,e/2,n/2):(i=Math.min(r[0]||0,e/2,n/2),o=Math.min(r[1]||0,e/2,n/2),s=Math.min(r[2]||0,e/2,n/2),a=Math.min(r[3]||0,e/2,n/2)),t.moveTo(i,0),t.lineTo(e-o,0),t.arc(e-o,o,o,3*Math.PI/2,0,!1),t.lineTo(e,n-s),t.arc(e-s,n-s,s,0,Math.PI/2,!1),t.lineTo(a,n),t.arc(a,n-a,a,Math.PI/2,Math.PI,!1),t.lineTo(0,i),t.arc(i,i,i,Math.PI,3*Math.PI/2,!1)}}},9553:(t,e,n)=>{"use strict";!function t(){if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(t)}catch(t){console.error(t)}}(),t.exports=n(4311)},9560:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.Noise=void 0;const r=n(3100),i=n(5304),o=n(4715);e.Noise=function(t){const e=255*this.noise(),n=t.data,r=n.length,i=e/2;for(let t=0;t<r;t+=4)n[t+0]+=i-2*i*Math.random(),n[t+1]+=i-2*i*Math.random(),n[t+2]+=i-2*i*Math.random()},r.Factory.addGetterSetter(i.Node,"noise",.2,(0,o.getNumberValidator)(),r.Factory.afterSetFilter)},9842:(t,e,n)=>{"use strict";Object.defineProperty(e,"__esModule",{value:!0});const r=n(7070);t.exports=r.Konva}},r={};function i(t){var e=r[t];if(void 0!==e)return e.exports;var o=r[t]={id:t,loaded:!1,exports:{}};return n[t](o,o.exports,i),o.loaded=!0,o.exports}i.n=t=>{var e=t&&t.__esModule?()=>t.default:()=>t;return i.d(e,{a:e}),e},e=Object.getPrototypeOf?t=>Object.getPrototypeOf(t):t=>t.__proto__,i.t=function(n,r){if(1&r&&(n=this(n)),8&r)return n;if("object"==typeof n&&n){if(4&r&&n.__esModule)return n;if(16&r&&"function"==typeof n.then)return n}var o=Object.create(null);i.r(o);var a={};t=t||[null,e({}),e([]),e(e)];for(var s=2&r&&n;"object"==typeof s&&!~t.indexOf(s);s=e(s))Object.getOwnPropertyNames(s).forEach((t=>a[t]=()=>n[t]));return a.default=()=>n,i.d(o,a),o},i.d=(t,e)=>{for(var n in e)i.o(e,n)&&!i.o(t,n)&&Object.defineProperty(t,n,{enumerable:!0,get:e[n]})},i.g=function(){if("object"==typeof globalThis)return globalThis;try{return this||new Function("return this")()}catch(t){if("object"==typeof window)return window}}(),i.o=(t,e)=>Object.prototype.hasOwnProperty.call(t,e),i.r=t=>{"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(t,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(t,"__esModule",{value:!0})},i.nmd=t=>(t.paths=[],t.children||(t.children=[]),t),(()=>{"use strict";var t={};i.r(t),i.d(t,{appendChild:()=>Gk,appendChildToContainer:()=>Hk,appendInitialChild:()=>Ck,cancelTimeout:()=>zk,clearContainer:()=>iC,commitMount:()=>Zk,commitTextUpdate:()=>Qk,commitUpdate:()=>Jk,createInstance:()=>Tk,createTextInstance:()=>Ek,detachDeletedInstance:()=>oC,finalizeInitialChildren:()=>Pk,getChildHostContext:()=>Nk,getCurrentEventPriority:()=>aC,getPublicInstance:()=>Ik,getRootHostContext:()=>Lk,hideInstance:()=>tC,hideTextInstance:()=>eC,idlePriority:()=>xk.unstable_IdlePriority,insertBefore:()=>Yk,insertInContainerBefore:()=>qk,isPrimaryRenderer:()=>Vk,noTimeout:()=>Uk,now:()=>xk.unstable_now,prepareForCommit:()=>Ak,preparePortalMount:()=>Mk,prepareUpdate:()=>Dk,removeChild:()=>Kk,removeChildFromContainer:()=>Xk,resetAfterCommit:()=>Fk,resetTextContent:()=>Rk,run:()=>xk.unstable_runWithPriority,scheduleTimeout:()=>Ok,shouldDeprioritizeSubtree:()=>Bk,shouldSetTextContent:()=>jk,supportsMutation:()=>Wk,unhideInstance:()=>nC,unhideTextInstance:()=>rC,warnsIfNotActing:()=>$k});var e,n,r=i(3308),o=i.t(r,2),a=i(6618),s=i(2802),l=i.n(s);function c(t){if(null===t)return"null";if(void 0===t)return"undefined";switch(typeof t){case"number":case"bigint":return`${t}`;case"string":return`"${t}"`}return"function"==typeof t[Symbol.toPrimitive]?t[Symbol.toPrimitive]("string"):ArrayBuffer.isView(t)?t instanceof BigInt64Array||t instanceof BigUint64Array?`[${[...t].map((t=>c(t)))}]`:`[${t}]`:ArrayBuffer.isView(t)?`[${t}]`:JSON.stringify(t,((t,e)=>"bigint"==typeof e?`${e}`:e))}function u(t,e,n,r){return new(n||(n=Promise))((function(i,o){function a(t){try{l(r.next(t))}catch(t){o(t)}}function s(t){try{l(r.throw(t))}catch(t){o(t)}}function l(t){var e;t.done?i(t.value):(e=t.value,e instanceof n?e:new n((function(t){t(e)}))).then(a,s)}l((r=r.apply(t,e||[])).next())}))}function d(t){return this instanceof d?(this.v=t,this):new d(t)}function h(t,e,n){if(!Symbol.asyncIterator)throw new TypeError("Symbol.asyncIterator is not defined.");var r,i=n.apply(t,e||[]),o=[];return r=Object.create(("function"==typeof AsyncIterator?AsyncIterator:Object).prototype),a("next"),a("throw"),a("return",(function(t){return function(e){return Promise.resolve(e).then(t,c)}})),r[Symbol.asyncIterator]=function(){return this},r;function a(t,e){i[t]&&(r[t]=function(e){return new Promise((function(n,r){o.push([t,e,n,r])>1||s(t,e)}))},e&&(r[t]=e(r[t])))}function s(t,e){try{!function(t){t.value instanceof d?Promise.resolve(t.value.v).then(l,c):u(o[0][2],t)}(i[t](e))}catch(t){u(o[0][3],t)}}function l(t){s("next",t)}function c(t){s("throw",t)}function u(t,e){t(e),o.shift(),o.length&&s(o[0][0],o[0][1])}}function f(t){var e,n;return e={},r("next"),r("throw",(function(t){throw t})),r("return"),e[Symbol.iterator]=function(){return this},e;function r(r,i){e[r]=t[r]?function(e){return(n=!n)?{value:d(t[r](e)),done:!1}:i?i(e):e}:i}}function p(t){if(!Symbol.asyncIterator)throw new TypeError("Symbol.asyncIterator is not defined.");var e,n=t[Symbol.asyncIterator];return n?n.call(t):(t=function(t){var e="function"==typeof Symbol&&Symbol.iterator,n=e&&t[e],r=0;if(n)return n.call(t);if(t&&"number"==typeof t.length)return{next:function(){return t&&r>=t.length&&(t=void 0),{value:t&&t[r++],done:!t}}};throw new TypeError(e?"Object is not iterable.":"Symbol.iterator is not defined.")}(t),e={},r("next"),r("throw"),r("return"),e[Symbol.asyncIterator]=function(){return this},e);function r(n){e[n]=t[n]&&function(e){return new Promise((function(r,i){!function(t,e,n,r){Promise.resolve(r).then((function(e){t({value:e,done:n})}),e)}(r,i,(e=t[n](e)).done,e.value)}))}}}!function(t){t[t.NONE=0]="NONE",t[t.Null=1]="Null",t[t.Int=2]="Int",t[t.Float=3]="Float",t[t.Binary=4]="Binary",t[t.Utf8=5]="Utf8",t[t.Bool=6]="Bool",t[t.Decimal=7]="Decimal",t[t.Date=8]="Date",t[t.Time=9]="Time",t[t.Timestamp=10]="Timestamp",t[t.Interval=11]="Interval",t[t.List=12]="List",t[t.Struct=13]="Struct",t[t.Union=14]="Union",t[t.FixedSizeBinary=15]="FixedSizeBinary",t[t.FixedSizeList=16]="FixedSizeList",t[t.Map=17]="Map",t[t.Duration=18]="Duration",t[t.LargeBinary=19]="LargeBinary",t[t.LargeUtf8=20]="LargeUtf8",t[t.Dictionary=-1]="Dictionary",t[t.Int8=-2]="Int8",t[t.Int16=-3]="Int16",t[t.Int32=-4]="Int32",t[t.Int64=-5]="Int64",t[t.Uint8=-6]="Uint8",t[t.Uint16=-7]="Uint16",t[t.Uint32=-8]="Uint32",t[t.Uint64=-9]="Uint64",t[t.Float16=-10]="Float16",t[t.Float32=-11]="Float32",t[t.Float64=-12]="Float64",t[t.DateDay=-13]="DateDay",t[t.DateMillisecond=-14]="DateMillisecond",t[t.TimestampSecond=-15]="TimestampSecond",t[t.TimestampMillisecond=-16]="TimestampMillisecond",t[t.TimestampMicrosecond=-17]="TimestampMicrosecond",t[t.TimestampNanosecond=-18]="TimestampNanosecond",t[t.TimeSecond=-19]="TimeSecond",t[t.TimeMillisecond=-20]="TimeMillisecond",t[t.TimeMicrosecond=-21]="TimeMicrosecond",t[t.TimeNanosecond=-22]="TimeNanosecond",t[t.DenseUnion=-23]="DenseUnion",t[t.SparseUnion=-24]="SparseUnion",t[t.IntervalDayTime=-25]="IntervalDayTime",t[t.IntervalYearMonth=-26]="IntervalYearMonth",t[t.DurationSecond=-27]="DurationSecond",t[t.DurationMillisecond=-28]="DurationMillisecond",t[t.DurationMicrosecond=-29]="DurationMicrosecond",t[t.DurationNanosecond=-30]="DurationNanosecond"}(e||(e={})),function(t){t[t.OFFSET=0]="OFFSET",t[t.DATA=1]="DATA",t[t.VALIDITY=2]="VALIDITY",t[t.TYPE=3]="TYPE"}(n||(n={})),Object.create,Object.create,"function"==typeof SuppressedError&&SuppressedError;const g=new TextDecoder("utf-8"),m=t=>g.decode(t),y=new TextEncoder,b=t=>y.encode(t),v=t=>"boolean"==typeof t,_=t=>"function"==typeof t,w=t=>null!=t&&Object(t)===t,x=t=>w(t)&&_(t.then),S=t=>w(t)&&_(t[Symbol.iterator]),k=t=>w(t)&&_(t[Symbol.asyncIterator]),C=t=>w(t)&&w(t.schema),T=t=>w(t)&&"done"in t&&"value"in t,E=t=>w(t)&&_(t.stat)&&(t=>"number"==typeof t)(t.fd),P=t=>w(t)&&A(t.body),I=t=>"_getDOMStream"in t&&"_getNodeStream"in t,A=t=>w(t)&&_(t.cancel)&&_(t.getReader)&&!I(t),M=t=>w(t)&&_(t.read)&&_(t.pipe)&&v(t.readable)&&!I(t),D="undefined"!=typeof SharedArrayBuffer?SharedArrayBuffer:ArrayBuffer;function F(t,e,n=0,r=e.byteLength){const i=t.byteLength,o=new Uint8Array(t.buffer,t.byteOffset,i),a=new Uint8Array(e.buffer,e.byteOffset,Math.min(r,i));return o.set(a,n),t}function R(t,e){const n=function(t){const e=t[0]?[t[0]]:[];let n,r,i,o;for(let a,s,l=0,c=0,u=t.length;++l<u;)a=e[c],s=t[l],!a||!s||a.buffer!==s.buffer||s.byteOffset<a.byteOffset?s&&(e[++c]=s):(({byteOffset:n,byteLength:i}=a),({byteOffset:r,byteLength:o}=s),n+i<r||r+o<n?s&&(e[++c]=s):e[c]=new Uint8Array(a.buffer,n,r-n+o));return e}(t),r=n.reduce(((t,e)=>t+e.byteLength),0);let i,o,a,s=0,l=-1;const c=Math.min(e||Number.POSITIVE_INFINITY,r);for(const t=n.length;++l<t;){if(i=n[l],o=i.subarray(0,Math.min(i.length,c-s)),c<=s+o.length){o.length<i.length?n[l]=i.subarray(o.length):o.length===i.length&&l++,a?F(a,o,s):a=o;break}F(a||(a=new Uint8Array(c)),o,s),s+=o.length}return[a||new Uint8Array(0),n.slice(l),r-(a?a.byteLength:0)]}function B(t,e){let n=T(e)?e.value:e;return n instanceof t?t===Uint8Array?new t(n.buffer,n.byteOffset,n.byteLength):n:n?("string"==typeof n&&(n=b(n)),n instanceof ArrayBuffer||n instanceof D?new t(n):w(r=n)&&_(r.clear)&&_(r.bytes)&&_(r.position)&&_(r.setPosition)&&_(r.capacity)&&_(r.getBufferIdentifier)&&_(r.createLong)?B(t,n.bytes()):ArrayBuffer.isView(n)?n.byteLength<=0?new t(0):new t(n.buffer,n.byteOffset,n.byteLength/t.BYTES_PER_ELEMENT):t.from(n)):new t(0);var r}const L=t=>B(Int32Array,t),N=t=>B(BigInt64Array,t),O=t=>B(Uint8Array,t),z=t=>(t.next(),t);function U(t,e){return h(this,arguments,(function*(){if(x(e))return yield d(yield d(yield*f(p(U(t,yield d(e))))));const n=function(t){return h(this,arguments,(function*(){yield yield d(yield d(t))}))},r="string"==typeof e||ArrayBuffer.isView(e)||e instanceof ArrayBuffer||e instanceof D?n(e):S(e)?function(t){return h(this,arguments,(function*(){yield d(yield*f(p(z(function*(t){let e=null;do{e=t.next(yield null==e?void 0:e.value)}while(!e.done)}(t[Symbol.iterator]())))))}))}(e):k(e)?e:n(e);return yield d(yield*f(p(z(function(e){return h(this,arguments,(function*(){let n=null;do{n=yield d(e.next(yield yield d(B(t,n))))}while(!n.done)}))}(r[Symbol.asyncIterator]()))))),yield d(new t)}))}function j(t,e,n){if(0!==t)for(let r=-1,i=(n=n.slice(0,e)).length;++r<i;)n[r]+=t;return n.subarray(0,e)}function V(t){if("bigint"==typeof t&&(t<Number.MIN_SAFE_INTEGER||t>Number.MAX_SAFE_INTEGER))throw new TypeError(`${t} is not safe to convert to a number.`);return Number(t)}function $(t,e){return V(t/e)+V(t%e)/V(e)}const W=Symbol.for("isArrowBigNum");function G(t,...e){return 0===e.length?Object.setPrototypeOf(B(this.TypedArray,t),this.constructor.prototype):Object.setPrototypeOf(new this.TypedArray(t,...e),this.constructor.prototype)}function H(...t){return G.apply(this,t)}function Y(...t){return G.apply(this,t)}function q(...t){return G.apply(this,t)}G.prototype[W]=!0,G.prototype.toJSON=function(){return`"${Q(this)}"`},G.prototype.valueOf=function(t){return X(this,t)},G.prototype.toString=function(){return Q(this)},G.prototype[Symbol.toPrimitive]=function(t="default"){switch(t){case"number":return X(this);case"string":return Q(this);case"default":return 8===(e=this).byteLength?new e.BigIntArray(e.buffer,e.byteOffset,1)[0]:Q(e)}var e;return Q(this)},Object.setPrototypeOf(H.prototype,Object.create(Int32Array.prototype)),Object.setPrototypeOf(Y.prototype,Object.create(Uint32Array.prototype)),Object.setPrototypeOf(q.prototype,Object.create(Uint32Array.prototype)),Object.assign(H.prototype,G.prototype,{constructor:H,signed:!0,TypedArray:Int32Array,BigIntArray:BigInt64Array}),Object.assign(Y.prototype,G.prototype,{constructor:Y,signed:!1,TypedArray:Uint32Array,BigIntArray:BigUint64Array}),Object.assign(q.prototype,G.prototype,{constructor:q,signed:!0,TypedArray:Uint32Array,BigIntArray:BigUint64Array});const K=BigInt(4294967296)*BigInt(4294967296)-BigInt(1);function X(t,e){const{buffer:n,byteOffset:r,byteLength:i,signed:o}=t,a=new BigUint64Array(n,r,i/8),s=o&&a.at(-1)&BigInt(1)<<BigInt(63);let l=BigInt(0),c=0;if(s){for(const t of a)l|=(t^K)*(BigInt(1)<<BigInt(64*c++));l*=BigInt(-1),l-=BigInt(1)}else for(const t of a)l|=t*(BigInt(1)<<BigInt(64*c++));if("number"==typeof e){const t=BigInt(Math.pow(10,e)),n=l%t;return V(l/t)+V(n)/V(t)}return V(l)}function Q(t){if(8===t.byteLength)return`${new t.BigIntArray(t.buffer,t.byteOffset,1)[0]}`;if(!t.signed)return Z(t);let e=new Uint16Array(t.buffer,t.byteOffset,t.byteLength/2);if(new Int16Array([e.at(-1)])[0]>=0)return Z(t);e=e.slice();let n=1;for(let t=0;t<e.length;t++){const r=e[t],i=~r+n;e[t]=i,n&=0===r?1:0}return`-${Z(e)}`}function Z(t){let e="";const n=new Uint32Array(2);let r=new Uint16Array(t.buffer,t.byteOffset,t.byteLength/2);const i=new Uint32Array((r=new Uint16Array(r).reverse()).buffer);let o=-1;const a=r.length-1;do{for(n[0]=r[o=0];o<a;)r[o++]=n[1]=n[0]/10,n[0]=(n[0]-10*n[1]<<16)+r[o];r[o]=n[1]=n[0]/10,n[0]=n[0]-10*n[1],e=`${n[0]}${e}`}while(i[0]||i[1]||i[2]||i[3]);return null!=e?e:"0"}class J{static new(t,e){switch(e){case!0:return new H(t);case!1:return new Y(t)}switch(t.constructor){case Int8Array:case Int16Array:case Int32Array:case BigInt64Array:return new H(t)}return 16===t.byteLength?new q(t):new Y(t)}static signed(t){return new H(t)}static unsigned(t){return new Y(t)}static decimal(t){return new q(t)}constructor(t,e){return J.new(t,e)}}var tt,et,nt,rt,it,ot,at,st,lt,ct,ut,dt,ht,ft,pt,gt,mt,yt,bt,vt,_t,wt,xt,St,kt,Ct,Tt,Et;!function(t){t[t.HALF=0]="HALF",t[t.SINGLE=1]="SINGLE",t[t.DOUBLE=2]="DOUBLE"}(tt||(tt={})),function(t){t[t.SECOND=0]="SECOND",t[t.MILLISECOND=1]="MILLISECOND",t[t.MICROSECOND=2]="MICROSECOND",t[t.NANOSECOND=3]="NANOSECOND"}(et||(et={})),function(t){t[t.DAY=0]="DAY",t[t.MILLISECOND=1]="MILLISECOND"}(nt||(nt={})),function(t){t[t.YEAR_MONTH=0]="YEAR_MONTH",t[t.DAY_TIME=1]="DAY_TIME",t[t.MONTH_DAY_NANO=2]="MONTH_DAY_NANO"}(rt||(rt={})),function(t){t[t.Sparse=0]="Sparse",t[t.Dense=1]="Dense"}(it||(it={}));class Pt{static isNull(t){return(null==t?void 0:t.typeId)===e.Null}static isInt(t){return(null==t?void 0:t.typeId)===e.Int}static isFloat(t){return(null==t?void 0:t.typeId)===e.Float}static isBinary(t){return(null==t?void 0:t.typeId)===e.Binary}static isLargeBinary(t){return(null==t?void 0:t.typeId)===e.LargeBinary}static isUtf8(t){return(null==t?void 0:t.typeId)===e.Utf8}static isLargeUtf8(t){return(null==t?void 0:t.typeId)===e.LargeUtf8}static isBool(t){return(null==t?void 0:t.typeId)===e.Bool}static isDecimal(t){return(null==t?void 0:t.typeId)===e.Decimal}static isDate(t){return(null==t?void 0:t.typeId)===e.Date}static isTime(t){return(null==t?void 0:t.typeId)===e.Time}static isTimestamp(t){return(null==t?void 0:t.typeId)===e.Timestamp}static isInterval(t){return(null==t?void 0:t.typeId)===e.Interval}static isDuration(t){return(null==t?void 0:t.typeId)===e.Duration}static isList(t){return(null==t?void 0:t.typeId)===e.List}static isStruct(t){return(null==t?void 0:t.typeId)===e.Struct}static isUnion(t){return(null==t?void 0:t.typeId)===e.Union}static isFixedSizeBinary(t){return(null==t?void 0:t.typeId)===e.FixedSizeBinary}static isFixedSizeList(t){return(null==t?void 0:t.typeId)===e.FixedSizeList}static isMap(t){return(null==t?void 0:t.typeId)===e.Map}static isDictionary(t){return(null==t?void 0:t.typeId)===e.Dictionary}static isDenseUnion(t){return Pt.isUnion(t)&&t.mode===it.Dense}static isSparseUnion(t){return Pt.isUnion(t)&&t.mode===it.Sparse}constructor(t){this.typeId=t}}ot=Symbol.toStringTag,Pt[ot]=((Et=Pt.prototype).children=null,Et.ArrayType=Array,Et.OffsetArrayType=Int32Array,Et[Symbol.toStringTag]="DataType");class It extends Pt{constructor(){super(e.Null)}toString(){return"Null"}}at=Symbol.toStringTag,It[at]=(t=>t[Symbol.toStringTag]="Null")(It.prototype);class At extends Pt{constructor(t,n){super(e.Int),this.isSigned=t,this.bitWidth=n}get ArrayType(){switch(this.bitWidth){case 8:return this.isSigned?Int8Array:Uint8Array;case 16:return this.isSigned?Int16Array:Uint16Array;case 32:return this.isSigned?Int32Array:Uint32Array;case 64:return this.isSigned?BigInt64Array:BigUint64Array}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}toString(){return`${this.isSigned?"I":"Ui"}nt${this.bitWidth}`}}st=Symbol.toStringTag,At[st]=(t=>(t.isSigned=null,t.bitWidth=null,t[Symbol.toStringTag]="Int"))(At.prototype);class Mt extends At{constructor(){super(!0,32)}get ArrayType(){return Int32Array}}Object.defineProperty(class extends At{constructor(){super(!0,8)}get ArrayType(){return Int8Array}}.prototype,"ArrayType",{value:Int8Array}),Object.defineProperty(class extends At{constructor(){super(!0,16)}get ArrayType(){return Int16Array}}.prototype,"ArrayType",{value:Int16Array}),Object.defineProperty(Mt.prototype,"ArrayType",{value:Int32Array}),Object.defineProperty(class extends At{constructor(){super(!0,64)}get ArrayType(){return BigInt64Array}}.prototype,"ArrayType",{value:BigInt64Array}),Object.defineProperty(class extends At{constructor(){super(!1,8)}get ArrayType(){return Uint8Array}}.prototype,"ArrayType",{value:Uint8Array}),Object.defineProperty(class extends At{constructor(){super(!1,16)}get ArrayType(){return Uint16Array}}.prototype,"ArrayType",{value:Uint16Array}),Object.defineProperty(class extends At{constructor(){super(!1,32)}get ArrayType(){return Uint32Array}}.prototype,"ArrayType",{value:Uint32Array}),Object.defineProperty(class extends At{constructor(){super(!1,64)}get ArrayType(){return BigUint64Array}}.prototype,"ArrayType",{value:BigUint64Array});class Dt extends Pt{constructor(t){super(e.Float),this.precision=t}get ArrayType(){switch(this.precision){case tt.HALF:return Uint16Array;case tt.SINGLE:return Float32Array;case tt.DOUBLE:return Float64Array}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}toString(){return`Float${this.precision<<5||16}`}}lt=Symbol.toStringTag,Dt[lt]=(t=>(t.precision=null,t[Symbol.toStringTag]="Float"))(Dt.prototype),Object.defineProperty(class extends Dt{constructor(){super(tt.HALF)}}.prototype,"ArrayType",{value:Uint16Array}),Object.defineProperty(class extends Dt{constructor(){super(tt.SINGLE)}}.prototype,"ArrayType",{value:Float32Array}),Object.defineProperty(class extends Dt{constructor(){super(tt.DOUBLE)}}.prototype,"ArrayType",{value:Float64Array});class Ft extends Pt{constructor(){super(e.Binary)}toString(){return"Binary"}}ct=Symbol.toStringTag,Ft[ct]=(t=>(t.ArrayType=Uint8Array,t[Symbol.toStringTag]="Binary"))(Ft.prototype);class Rt extends Pt{constructor(){super(e.LargeBinary)}toString(){return"LargeBinary"}}ut=Symbol.toStringTag,Rt[ut]=(t=>(t.ArrayType=Uint8Array,t.OffsetArrayType=BigInt64Array,t[Symbol.toStringTag]="LargeBinary"))(Rt.prototype);class Bt extends Pt{constructor(){super(e.Utf8)}toString(){return"Utf8"}}dt=Symbol.toStringTag,Bt[dt]=(t=>(t.ArrayType=Uint8Array,t[Symbol.toStringTag]="Utf8"))(Bt.prototype);class Lt extends Pt{constructor(){super(e.LargeUtf8)}toString(){return"LargeUtf8"}}ht=Symbol.toStringTag,Lt[ht]=(t=>(t.ArrayType=Uint8Array,t.OffsetArrayType=BigInt64Array,t[Symbol.toStringTag]="LargeUtf8"))(Lt.prototype);class Nt extends Pt{constructor(){super(e.Bool)}toString(){return"Bool"}}ft=Symbol.toStringTag,Nt[ft]=(t=>(t.ArrayType=Uint8Array,t[Symbol.toStringTag]="Bool"))(Nt.prototype);class Ot extends Pt{constructor(t,n,r=128){super(e.Decimal),this.scale=t,this.precision=n,this.bitWidth=r}toString(){return`Decimal[${this.precision}e${this.scale>0?"+":""}${this.scale}]`}}pt=Symbol.toStringTag,Ot[pt]=(t=>(t.scale=null,t.precision=null,t.ArrayType=Uint32Array,t[Symbol.toStringTag]="Decimal"))(Ot.prototype);class zt extends Pt{constructor(t){super(e.Date),this.unit=t}toString(){return`Date${32*(this.unit+1)}<${nt[this.unit]}>`}get ArrayType(){return this.unit===nt.DAY?Int32Array:BigInt64Array}}gt=Symbol.toStringTag,zt[gt]=(t=>(t.unit=null,t[Symbol.toStringTag]="Date"))(zt.prototype);class Ut extends Pt{constructor(t,n){super(e.Time),this.unit=t,this.bitWidth=n}toString(){return`Time${this.bitWidth}<${et[this.unit]}>`}get ArrayType(){switch(this.bitWidth){case 32:return Int32Array;case 64:return BigInt64Array}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}}mt=Symbol.toStringTag,Ut[mt]=(t=>(t.unit=null,t.bitWidth=null,t[Symbol.toStringTag]="Time"))(Ut.prototype);class jt extends Pt{constructor(t,n){super(e.Timestamp),this.unit=t,this.timezone=n}toString(){return`Timestamp<${et[this.unit]}${this.timezone?`, ${this.timezone}`:""}>`}}yt=Symbol.toStringTag,jt[yt]=(t=>(t.unit=null,t.timezone=null,t.ArrayType=BigInt64Array,t[Symbol.toStringTag]="Timestamp"))(jt.prototype);class Vt extends Pt{constructor(t){super(e.Interval),this.unit=t}toString(){return`Interval<${rt[this.unit]}>`}}bt=Symbol.toStringTag,Vt[bt]=(t=>(t.unit=null,t.ArrayType=Int32Array,t[Symbol.toStringTag]="Interval"))(Vt.prototype);class $t extends Pt{constructor(t){super(e.Duration),this.unit=t}toString(){return`Duration<${et[this.unit]}>`}}vt=Symbol.toStringTag,$t[vt]=(t=>(t.unit=null,t.ArrayType=BigInt64Array,t[Symbol.toStringTag]="Duration"))($t.prototype);class Wt extends Pt{constructor(t){super(e.List),this.children=[t]}toString(){return`List<${this.valueType}>`}get valueType(){return this.children[0].type}get valueField(){return this.children[0]}get ArrayType(){return this.valueType.ArrayType}}_t=Symbol.toStringTag,Wt[_t]=(t=>(t.children=null,t[Symbol.toStringTag]="List"))(Wt.prototype);class Gt extends Pt{constructor(t){super(e.Struct),this.children=t}toString(){return`Struct<{${this.children.map((t=>`${t.name}:${t.type}`)).join(", ")}}>`}}wt=Symbol.toStringTag,Gt[wt]=(t=>(t.children=null,t[Symbol.toStringTag]="Struct"))(Gt.prototype);class Ht extends Pt{constructor(t,n,r){super(e.Union),this.mode=t,this.children=r,this.typeIds=n=Int32Array.from(n),this.typeIdToChildIndex=n.reduce(((t,e,n)=>(t[e]=n)&&t||t),Object.create(null))}toString(){return`${this[Symbol.toStringTag]}<${this.children.map((t=>`${t.type}`)).join(" | ")}>`}}xt=Symbol.toStringTag,Ht[xt]=(t=>(t.mode=null,t.typeIds=null,t.children=null,t.typeIdToChildIndex=null,t.ArrayType=Int8Array,t[Symbol.toStringTag]="Union"))(Ht.prototype);class Yt extends Pt{constructor(t){super(e.FixedSizeBinary),this.byteWidth=t}toString(){return`FixedSizeBinary[${this.byteWidth}]`}}St=Symbol.toStringTag,Yt[St]=(t=>(t.byteWidth=null,t.ArrayType=Uint8Array,t[Symbol.toStringTag]="FixedSizeBinary"))(Yt.prototype);class qt extends Pt{constructor(t,n){super(e.FixedSizeList),this.listSize=t,this.children=[n]}get valueType(){return this.children[0].type}get valueField(){return this.children[0]}get ArrayType(){return this.valueType.ArrayType}toString(){return`FixedSizeList[${this.listSize}]<${this.valueType}>`}}kt=Symbol.toStringTag,qt[kt]=(t=>(t.children=null,t.listSize=null,t[Symbol.toStringTag]="FixedSizeList"))(qt.prototype);class Kt extends Pt{constructor(t,n=!1){var r,i,o;if(super(e.Map),this.children=[t],this.keysSorted=n,t&&(t.name="entries",null===(r=null==t?void 0:t.type)||void 0===r?void 0:r.children)){const e=null===(i=null==t?void 0:t.type)||void 0===i?void 0:i.children[0];e&&(e.name="key");const n=null===(o=null==t?void 0:t.type)||void 0===o?void 0:o.children[1];n&&(n.name="value")}}get keyType(){return this.children[0].type.children[0].type}get valueType(){return this.children[0].type.children[1].type}get childType(){return this.children[0].type}toString(){return`Map<{${this.children[0].type.children.map((t=>`${t.name}:${t.type}`)).join(", ")}}>`}}Ct=Symbol.toStringTag,Kt[Ct]=(t=>(t.children=null,t.keysSorted=null,t[Symbol.toStringTag]="Map_"))(Kt.prototype);const Xt=(Qt=-1,()=>++Qt);var Qt;class Zt extends Pt{constructor(t,n,r,i){super(e.Dictionary),this.indices=n,this.dictionary=t,this.isOrdered=i||!1,this.id=null==r?Xt():V(r)}get children(){return this.dictionary.children}get valueType(){return this.dictionary}get ArrayType(){return this.dictionary.ArrayType}toString(){return`Dictionary<${this.indices}, ${this.dictionary}>`}}function Jt(t){const n=t;switch(t.typeId){case e.Decimal:return t.bitWidth/32;case e.Interval:return 1+n.unit;case e.FixedSizeList:return n.listSize;case e.FixedSizeBinary:return n.byteWidth;default:return 1}}Tt=Symbol.toStringTag,Zt[Tt]=(t=>(t.id=null,t.indices=null,t.isOrdered=null,t.dictionary=null,t[Symbol.toStringTag]="Dictionary"))(Zt.prototype);class te{visitMany(t,...e){return t.map(((t,n)=>this.visit(t,...e.map((t=>t[n])))))}visit(...t){return this.getVisitFn(t[0],!1).apply(this,t)}getVisitFn(t,n=!0){return function(t,n,r=!0){return"number"==typeof n?ee(t,n,r):"string"==typeof n&&n in e?ee(t,e[n],r):n&&n instanceof Pt?ee(t,ne(n),r):(null==n?void 0:n.type)&&n.type instanceof Pt?ee(t,ne(n.type),r):ee(t,e.NONE,r)}(this,t,n)}getVisitFnByTypeId(t,e=!0){return ee(this,t,e)}visitNull(t,...e){return null}visitBool(t,...e){return null}visitInt(t,...e){return null}visitFloat(t,...e){return null}visitUtf8(t,...e){return null}visitLargeUtf8(t,...e){return null}visitBinary(t,...e){return null}visitLargeBinary(t,...e){return null}visitFixedSizeBinary(t,...e){return null}visitDate(t,...e){return null}visitTimestamp(t,...e){return null}visitTime(t,...e){return null}visitDecimal(t,...e){return null}visitList(t,...e){return null}visitStruct(t,...e){return null}visitUnion(t,...e){return null}visitDictionary(t,...e){return null}visitInterval(t,...e){return null}visitDuration(t,...e){return null}visitFixedSizeList(t,...e){return null}visitMap(t,...e){return null}}function ee(t,n,r=!0){let i=null;switch(n){case e.Null:i=t.visitNull;break;case e.Bool:i=t.visitBool;break;case e.Int:i=t.visitInt;break;case e.Int8:i=t.visitInt8||t.visitInt;break;case e.Int16:i=t.visitInt16||t.visitInt;break;case e.Int32:i=t.visitInt32||t.visitInt;break;case e.Int64:i=t.visitInt64||t.visitInt;break;case e.Uint8:i=t.visitUint8||t.visitInt;break;case e.Uint16:i=t.visitUint16||t.visitInt;break;case e.Uint32:i=t.visitUint32||t.visitInt;break;case e.Uint64:i=t.visitUint64||t.visitInt;break;case e.Float:i=t.visitFloat;break;case e.Float16:i=t.visitFloat16||t.visitFloat;break;case e.Float32:i=t.visitFloat32||t.visitFloat;break;case e.Float64:i=t.visitFloat64||t.visitFloat;break;case e.Utf8:i=t.visitUtf8;break;case e.LargeUtf8:i=t.visitLargeUtf8;break;case e.Binary:i=t.visitBinary;break;case e.LargeBinary:i=t.visitLargeBinary;break;case e.FixedSizeBinary:i=t.visitFixedSizeBinary;break;case e.Date:i=t.visitDate;break;case e.DateDay:i=t.visitDateDay||t.visitDate;break;case e.DateMillisecond:i=t.visitDateMillisecond||t.visitDate;break;case e.Timestamp:i=t.visitTimestamp;break;case e.TimestampSecond:i=t.visitTimestampSecond||t.visitTimestamp;break;case e.TimestampMillisecond:i=t.visitTimestampMillisecond||t.visitTimestamp;break;case e.TimestampMicrosecond:i=t.visitTimestampMicrosecond||t.visitTimestamp;break;case e.TimestampNanosecond:i=t.visitTimestampNanosecond||t.visitTimestamp;break;case e.Time:i=t.visitTime;break;case e.TimeSecond:i=t.visitTimeSecond||t.visitTime;break;case e.TimeMillisecond:i=t.visitTimeMillisecond||t.visitTime;break;case e.TimeMicrosecond:i=t.visitTimeMicrosecond||t.visitTime;break;case e.TimeNanosecond:i=t.visitTimeNanosecond||t.visitTime;break;case e.Decimal:i=t.visitDecimal;break;case e.List:i=t.visitList;break;case e.Struct:i=t.visitStruct;break;case e.Union:i=t.visitUnion;break;case e.DenseUnion:i=t.visitDenseUnion||t.visitUnion;break;case e.SparseUnion:i=t.visitSparseUnion||t.visitUnion;break;case e.Dictionary:i=t.visitDictionary;break;case e.Interval:i=t.visitInterval;break;case e.IntervalDayTime:i=t.visitIntervalDayTime||t.visitInterval;break;case e.IntervalYearMonth:i=t.visitIntervalYearMonth||t.visitInterval;break;case e.Duration:i=t.visitDuration;break;case e.DurationSecond:i=t.visitDurationSecond||t.visitDuration;break;case e.DurationMillisecond:i=t.visitDurationMillisecond||t.visitDuration;break;case e.DurationMicrosecond:i=t.visitDurationMicrosecond||t.visitDuration;break;case e.DurationNanosecond:i=t.visitDurationNanosecond||t.visitDuration;break;case e.FixedSizeList:i=t.visitFixedSizeList;break;case e.Map:i=t.visitMap}if("function"==typeof i)return i;if(!r)return()=>null;throw new Error(`Unrecognized type '${e[n]}'`)}function ne(t){switch(t.typeId){case e.Null:return e.Null;case e.Int:{const{bitWidth:n,isSigned:r}=t;switch(n){case 8:return r?e.Int8:e.Uint8;case 16:return r?e.Int16:e.Uint16;case 32:return r?e.Int32:e.Uint32;case 64:return r?e.Int64:e.Uint64}return e.Int}case e.Float:switch(t.precision){case tt.HALF:return e.Float16;case tt.SINGLE:return e.Float32;case tt.DOUBLE:return e.Float64}return e.Float;case e.Binary:return e.Binary;case e.LargeBinary:return e.LargeBinary;case e.Utf8:return e.Utf8;case e.LargeUtf8:return e.LargeUtf8;case e.Bool:return e.Bool;case e.Decimal:return e.Decimal;case e.Time:switch(t.unit){case et.SECOND:return e.TimeSecond;case et.MILLISECOND:return e.TimeMillisecond;case et.MICROSECOND:return e.TimeMicrosecond;case et.NANOSECOND:return e.TimeNanosecond}return e.Time;case e.Timestamp:switch(t.unit){case et.SECOND:return e.TimestampSecond;case et.MILLISECOND:return e.TimestampMillisecond;case et.MICROSECOND:return e.TimestampMicrosecond;case et.NANOSECOND:return e.TimestampNanosecond}return e.Timestamp;case e.Date:switch(t.unit){case nt.DAY:return e.DateDay;case nt.MILLISECOND:return e.DateMillisecond}return e.Date;case e.Interval:switch(t.unit){case rt.DAY_TIME:return e.IntervalDayTime;case rt.YEAR_MONTH:return e.IntervalYearMonth}return e.Interval;case e.Duration:switch(t.unit){case et.SECOND:return e.DurationSecond;case et.MILLISECOND:return e.DurationMillisecond;case et.MICROSECOND:return e.DurationMicrosecond;case et.NANOSECOND:return e.DurationNanosecond}return e.Duration;case e.Map:return e.Map;case e.List:return e.List;case e.Struct:return e.Struct;case e.Union:switch(t.mode){case it.Dense:return e.DenseUnion;case it.Sparse:return e.SparseUnion}return e.Union;case e.FixedSizeBinary:return e.FixedSizeBinary;case e.FixedSizeList:return e.FixedSizeList;case e.Dictionary:return e.Dictionary}throw new Error(`Unrecognized type '${e[t.typeId]}'`)}te.prototype.visitInt8=null,te.prototype.visitInt16=null,te.prototype.visitInt32=null,te.prototype.visitInt64=null,te.prototype.visitUint8=null,te.prototype.visitUint16=null,te.prototype.visitUint32=null,te.prototype.visitUint64=null,te.prototype.visitFloat16=null,te.prototype.visitFloat32=null,te.prototype.visitFloat64=null,te.prototype.visitDateDay=null,te.prototype.visitDateMillisecond=null,te.prototype.visitTimestampSecond=null,te.prototype.visitTimestampMillisecond=null,te.prototype.visitTimestampMicrosecond=null,te.prototype.visitTimestampNanosecond=null,te.prototype.visitTimeSecond=null,te.prototype.visitTimeMillisecond=null,te.prototype.visitTimeMicrosecond=null,te.prototype.visitTimeNanosecond=null,te.prototype.visitDenseUnion=null,te.prototype.visitSparseUnion=null,te.prototype.visitIntervalDayTime=null,te.prototype.visitIntervalYearMonth=null,te.prototype.visitDuration=null,te.prototype.visitDurationSecond=null,te.prototype.visitDurationMillisecond=null,te.prototype.visitDurationMicrosecond=null,te.prototype.visitDurationNanosecond=null;const re=new Float64Array(1),ie=new Uint32Array(re.buffer);function oe(t){const e=(31744&t)>>10,n=(1023&t)/1024,r=Math.pow(-1,(32768&t)>>15);switch(e){case 31:return r*(n?Number.NaN:1/0);case 0:return r*(n?6103515625e-14*n:0)}return r*Math.pow(2,e-15)*(1+n)}class ae extends te{}function se(t){return(e,n,r)=>{if(e.setValid(n,null!=r))return t(e,n,r)}}const le=(t,e,n,r)=>{if(n+1<e.length){const i=V(e[n]),o=V(e[n+1]);t.set(r.subarray(0,o-i),i)}},ce=({values:t},e,n)=>{t[e]=n},ue=({values:t},e,n)=>{t[e]=n},de=({values:t},e,n)=>{t[e]=function(t){if(t!=t)return 32256;re[0]=t;const e=(2147483648&ie[1])>>16&65535;let n=2146435072&ie[1],r=0;return n>=1089470464?ie[0]>0?n=31744:(n=(2080374784&n)>>16,r=(1048575&ie[1])>>10):n<=1056964608?(r=1048576+(1048575&ie[1]),r=1048576+(r<<(n>>20)-998)>>21,n=0):(n=n-1056964608>>10,r=512+(1048575&ie[1])>>10),e|n|65535&r}(n)},he=({values:t},e,n)=>{((t,e,n)=>{t[e]=Math.floor(n/864e5)})(t,e,n.valueOf())},fe=({values:t},e,n)=>{t[e]=BigInt(n)},pe=({values:t,valueOffsets:e},n,r)=>le(t,e,n,r),ge=({values:t,valueOffsets:e},n,r)=>le(t,e,n,b(r)),me=({values:t},e,n)=>{t[e]=BigInt(n/1e3)},ye=({values:t},e,n)=>{t[e]=BigInt(n)},be=({values:t},e,n)=>{t[e]=BigInt(1e3*n)},ve=({values:t},e,n)=>{t[e]=BigInt(1e6*n)},_e=({values:t},e,n)=>{t[e]=n},we=({values:t},e,n)=>{t[e]=n},xe=({values:t},e,n)=>{t[e]=n},Se=({values:t},e,n)=>{t[e]=n},ke=(t,e,n)=>{const r=t.type.typeIdToChildIndex[t.typeIds[e]],i=t.children[r];De.visit(i,t.valueOffsets[e],n)},Ce=(t,e,n)=>{const r=t.type.typeIdToChildIndex[t.typeIds[e]],i=t.children[r];De.visit(i,e,n)},Te=({values:t},e,n)=>{t.set(n.subarray(0,2),2*e)},Ee=({values:t},e,n)=>{t[e]=12*n[0]+n[1]%12},Pe=({values:t},e,n)=>{t[e]=n},Ie=({values:t},e,n)=>{t[e]=n},Ae=({values:t},e,n)=>{t[e]=n},Me=({values:t},e,n)=>{t[e]=n};ae.prototype.visitBool=se((({offset:t,values:e},n,r)=>{const i=t+n;r?e[i>>3]|=1<<i%8:e[i>>3]&=~(1<<i%8)})),ae.prototype.visitInt=se(ce),ae.prototype.visitInt8=se(ce),ae.prototype.visitInt16=se(ce),ae.prototype.visitInt32=se(ce),ae.prototype.visitInt64=se(ce),ae.prototype.visitUint8=se(ce),ae.prototype.visitUint16=se(ce),ae.prototype.visitUint32=se(ce),ae.prototype.visitUint64=se(ce),ae.prototype.visitFloat=se(((t,e,n)=>{switch(t.type.precision){case tt.HALF:return de(t,e,n);case tt.SINGLE:case tt.DOUBLE:return ue(t,e,n)}})),ae.prototype.visitFloat16=se(de),ae.prototype.visitFloat32=se(ue),ae.prototype.visitFloat64=se(ue),ae.prototype.visitUtf8=se(ge),ae.prototype.visitLargeUtf8=se(ge),ae.prototype.visitBinary=se(pe),ae.prototype.visitLargeBinary=se(pe),ae.prototype.visitFixedSizeBinary=se((({stride:t,values:e},n,r)=>{e.set(r.subarray(0,t),t*n)})),ae.prototype.visitDate=se(((t,e,n)=>{t.type.unit===nt.DAY?he(t,e,n):fe(t,e,n)})),ae.prototype.visitDateDay=se(he),ae.prototype.visitDateMillisecond=se(fe),ae.prototype.visitTimestamp=se(((t,e,n)=>{switch(t.type.unit){case et.SECOND:return me(t,e,n);case et.MILLISECOND:return ye(t,e,n);case et.MICROSECOND:return be(t,e,n);case et.NANOSECOND:return ve(t,e,n)}})),ae.prototype.visitTimestampSecond=se(me),ae.prototype.visitTimestampMillisecond=se(ye),ae.prototype.visitTimestampMicrosecond=se(be),ae.prototype.visitTimestampNanosecond=se(ve),ae.prototype.visitTime=se(((t,e,n)=>{switch(t.type.unit){case et.SECOND:return _e(t,e,n);case et.MILLISECOND:return we(t,e,n);case et.MICROSECOND:return xe(t,e,n);case et.NANOSECOND:return Se(t,e,n)}})),ae.prototype.visitTimeSecond=se(_e),ae.prototype.visitTimeMillisecond=se(we),ae.prototype.visitTimeMicrosecond=se(xe),ae.prototype.visitTimeNanosecond=se(Se),ae.prototype.visitDecimal=se((({values:t,stride:e},n,r)=>{t.set(r.subarray(0,e),e*n)})),ae.prototype.visitList=se(((t,e,n)=>{const r=t.children[0],i=t.valueOffsets,o=De.getVisitFn(r);if(Array.isArray(n))for(let t=-1,a=i[e],s=i[e+1];a<s;)o(r,a++,n[++t]);else for(let t=-1,a=i[e],s=i[e+1];a<s;)o(r,a++,n.get(++t))})),ae.prototype.visitStruct=se(((t,e,n)=>{const r=t.type.children.map((t=>De.getVisitFn(t.type))),i=n instanceof Map?(o=e,a=n,(t,e,n,r)=>e&&t(e,o,a.get(n.name))):n instanceof Zn?((t,e)=>(n,r,i,o)=>r&&n(r,t,e.get(o)))(e,n):Array.isArray(n)?((t,e)=>(n,r,i,o)=>r&&n(r,t,e[o]))(e,n):((t,e)=>(n,r,i,o)=>r&&n(r,t,e[i.name]))(e,n);var o,a;t.type.children.forEach(((e,n)=>i(r[n],t.children[n],e,n)))})),ae.prototype.visitUnion=se(((t,e,n)=>{t.type.mode===it.Dense?ke(t,e,n):Ce(t,e,n)})),ae.prototype.visitDenseUnion=se(ke),ae.prototype.visitSparseUnion=se(Ce),ae.prototype.visitDictionary=se(((t,e,n)=>{var r;null===(r=t.dictionary)||void 0===r||r.set(t.values[e],n)})),ae.prototype.visitInterval=se(((t,e,n)=>{t.type.unit===rt.DAY_TIME?Te(t,e,n):Ee(t,e,n)})),ae.prototype.visitIntervalDayTime=se(Te),ae.prototype.visitIntervalYearMonth=se(Ee),ae.prototype.visitDuration=se(((t,e,n)=>{switch(t.type.unit){case et.SECOND:return Pe(t,e,n);case et.MILLISECOND:return Ie(t,e,n);case et.MICROSECOND:return Ae(t,e,n);case et.NANOSECOND:return Me(t,e,n)}})),ae.prototype.visitDurationSecond=se(Pe),ae.prototype.visitDurationMillisecond=se(Ie),ae.prototype.visitDurationMicrosecond=se(Ae),ae.prototype.visitDurationNanosecond=se(Me),ae.prototype.visitFixedSizeList=se(((t,e,n)=>{const{stride:r}=t,i=t.children[0],o=De.getVisitFn(i);if(Array.isArray(n))for(let t=-1,a=e*r;++t<r;)o(i,a+t,n[t]);else for(let t=-1,a=e*r;++t<r;)o(i,a+t,n.get(t))})),ae.prototype.visitMap=se(((t,e,n)=>{const r=t.children[0],{valueOffsets:i}=t,o=De.getVisitFn(r);let{[e]:a,[e+1]:s}=i;const l=n instanceof Map?n.entries():Object.entries(n);for(const t of l)if(o(r,a,t),++a>=s)break}));const De=new ae,Fe=Symbol.for("parent"),Re=Symbol.for("rowIndex");class Be{constructor(t,e){return this[Fe]=t,this[Re]=e,new Proxy(this,Ne)}toArray(){return Object.values(this.toJSON())}toJSON(){const t=this[Re],e=this[Fe],n=e.type.children,r={};for(let i=-1,o=n.length;++i<o;)r[n[i].name]=un.visit(e.children[i],t);return r}toString(){return`{${[...this].map((([t,e])=>`${c(t)}: ${c(e)}`)).join(", ")}}`}[Symbol.for("nodejs.util.inspect.custom")](){return this.toString()}[Symbol.iterator](){return new Le(this[Fe],this[Re])}}class Le{constructor(t,e){this.childIndex=0,this.children=t.children,this.rowIndex=e,this.childFields=t.type.children,this.numChildren=this.childFields.length}[Symbol.iterator](){return this}next(){const t=this.childIndex;return t<this.numChildren?(this.childIndex=t+1,{done:!1,value:[this.childFields[t].name,un.visit(this.children[t],this.rowIndex)]}):{done:!0,value:null}}}Object.defineProperties(Be.prototype,{[Symbol.toStringTag]:{enumerable:!1,configurable:!1,value:"Row"},[Fe]:{writable:!0,enumerable:!1,configurable:!1,value:null},[Re]:{writable:!0,enumerable:!1,configurable:!1,value:-1}});const Ne=new class{isExtensible(){return!1}deleteProperty(){return!1}preventExtensions(){return!0}ownKeys(t){return t[Fe].type.children.map((t=>t.name))}has(t,e){return t[Fe].type.children.some((t=>t.name===e))}getOwnPropertyDescriptor(t,e){if(t[Fe].type.children.some((t=>t.name===e)))return{writable:!0,enumerable:!0,configurable:!0}}get(t,e){if(Reflect.has(t,e))return t[e];const n=t[Fe].type.children.findIndex((t=>t.name===e));if(-1!==n){const r=un.visit(t[Fe].children[n],t[Re]);return Reflect.set(t,e,r),r}}set(t,e,n){const r=t[Fe].type.children.findIndex((t=>t.name===e));return-1!==r?(De.visit(t[Fe].children[r],t[Re],n),Reflect.set(t,e,n)):!(!Reflect.has(t,e)&&"symbol"!=typeof e)&&Reflect.set(t,e,n)}};class Oe extends te{}function ze(t){return(e,n)=>e.getValid(n)?t(e,n):null}const Ue=(t,e,n)=>{if(n+1>=e.length)return null;const r=V(e[n]),i=V(e[n+1]);return t.subarray(r,i)},je=({values:t},e)=>((t,e)=>864e5*t[e])(t,e),Ve=({values:t},e)=>V(t[e]),$e=({stride:t,values:e},n)=>e[t*n],We=({values:t},e)=>t[e],Ge=({values:t,valueOffsets:e},n)=>Ue(t,e,n),He=({values:t,valueOffsets:e},n)=>{const r=Ue(t,e,n);return null!==r?m(r):null},Ye=({values:t},e)=>1e3*V(t[e]),qe=({values:t},e)=>V(t[e]),Ke=({values:t},e)=>$(t[e],BigInt(1e3)),Xe=({values:t},e)=>$(t[e],BigInt(1e6)),Qe=({values:t},e)=>t[e],Ze=({values:t},e)=>t[e],Je=({values:t},e)=>t[e],tn=({values:t},e)=>t[e],en=(t,e)=>{const n=t.type.typeIdToChildIndex[t.typeIds[e]],r=t.children[n];return un.visit(r,t.valueOffsets[e])},nn=(t,e)=>{const n=t.type.typeIdToChildIndex[t.typeIds[e]],r=t.children[n];return un.visit(r,e)},rn=({values:t},e)=>t.subarray(2*e,2*(e+1)),on=({values:t},e)=>{const n=t[e],r=new Int32Array(2);return r[0]=Math.trunc(n/12),r[1]=Math.trunc(n%12),r},an=({values:t},e)=>t[e],sn=({values:t},e)=>t[e],ln=({values:t},e)=>t[e],cn=({values:t},e)=>t[e];Oe.prototype.visitNull=ze(((t,e)=>null)),Oe.prototype.visitBool=ze((({offset:t,values:e},n)=>{const r=t+n;return!!(e[r>>3]&1<<r%8)})),Oe.prototype.visitInt=ze((({values:t},e)=>t[e])),Oe.prototype.visitInt8=ze($e),Oe.prototype.visitInt16=ze($e),Oe.prototype.visitInt32=ze($e),Oe.prototype.visitInt64=ze(We),Oe.prototype.visitUint8=ze($e),Oe.prototype.visitUint16=ze($e),Oe.prototype.visitUint32=ze($e),Oe.prototype.visitUint64=ze(We),Oe.prototype.visitFloat=ze((({type:t,values:e},n)=>t.precision!==tt.HALF?e[n]:oe(e[n]))),Oe.prototype.visitFloat16=ze((({stride:t,values:e},n)=>oe(e[t*n]))),Oe.prototype.visitFloat32=ze($e),Oe.prototype.visitFloat64=ze($e),Oe.prototype.visitUtf8=ze(He),Oe.prototype.visitLargeUtf8=ze(He),Oe.prototype.visitBinary=ze(Ge),Oe.prototype.visitLargeBinary=ze(Ge),Oe.prototype.visitFixedSizeBinary=ze((({stride:t,values:e},n)=>e.subarray(t*n,t*(n+1)))),Oe.prototype.visitDate=ze(((t,e)=>t.type.unit===nt.DAY?je(t,e):Ve(t,e))),Oe.prototype.visitDateDay=ze(je),Oe.prototype.visitDateMillisecond=ze(Ve),Oe.prototype.visitTimestamp=ze(((t,e)=>{switch(t.type.unit){case et.SECOND:return Ye(t,e);case et.MILLISECOND:return qe(t,e);case et.MICROSECOND:return Ke(t,e);case et.NANOSECOND:return Xe(t,e)}})),Oe.prototype.visitTimestampSecond=ze(Ye),Oe.prototype.visitTimestampMillisecond=ze(qe),Oe.prototype.visitTimestampMicrosecond=ze(Ke),Oe.prototype.visitTimestampNanosecond=ze(Xe),Oe.prototype.visitTime=ze(((t,e)=>{switch(t.type.unit){case et.SECOND:return Qe(t,e);case et.MILLISECOND:return Ze(t,e);case et.MICROSECOND:return Je(t,e);case et.NANOSECOND:return tn(t,e)}})),Oe.prototype.visitTimeSecond=ze(Qe),Oe.prototype.visitTimeMillisecond=ze(Ze),Oe.prototype.visitTimeMicrosecond=ze(Je),Oe.prototype.visitTimeNanosecond=ze(tn),Oe.prototype.visitDecimal=ze((({values:t,stride:e},n)=>J.decimal(t.subarray(e*n,e*(n+1))))),Oe.prototype.visitList=ze(((t,e)=>{const{valueOffsets:n,stride:r,children:i}=t,{[e*r]:o,[e*r+1]:a}=n,s=i[0].slice(o,a-o);return new Zn([s])})),Oe.prototype.visitStruct=ze(((t,e)=>new Be(t,e))),Oe.prototype.visitUnion=ze(((t,e)=>t.type.mode===it.Dense?en(t,e):nn(t,e))),Oe.prototype.visitDenseUnion=ze(en),Oe.prototype.visitSparseUnion=ze(nn),Oe.prototype.visitDictionary=ze(((t,e)=>{var n;return null===(n=t.dictionary)||void 0===n?void 0:n.get(t.values[e])})),Oe.prototype.visitInterval=ze(((t,e)=>t.type.unit===rt.DAY_TIME?rn(t,e):on(t,e))),Oe.prototype.visitIntervalDayTime=ze(rn),Oe.prototype.visitIntervalYearMonth=ze(on),Oe.prototype.visitDuration=ze(((t,e)=>{switch(t.type.unit){case et.SECOND:return an(t,e);case et.MILLISECOND:return sn(t,e);case et.MICROSECOND:return ln(t,e);case et.NANOSECOND:return cn(t,e)}})),Oe.prototype.visitDurationSecond=ze(an),Oe.prototype.visitDurationMillisecond=ze(sn),Oe.prototype.visitDurationMicrosecond=ze(ln),Oe.prototype.visitDurationNanosecond=ze(cn),Oe.prototype.visitFixedSizeList=ze(((t,e)=>{const{stride:n,children:r}=t,i=r[0].slice(e*n,n);return new Zn([i])})),Oe.prototype.visitMap=ze(((t,e)=>{const{valueOffsets:n,children:r}=t,{[e]:i,[e+1]:o}=n,a=r[0];return new gn(a.slice(i,o-i))}));const un=new Oe,dn=Symbol.for("keys"),hn=Symbol.for("vals"),fn=Symbol.for("kKeysAsStrings"),pn=Symbol.for("_kKeysAsStrings");class gn{constructor(t){return this[dn]=new Zn([t.children[0]]).memoize(),this[hn]=t.children[1],new Proxy(this,new yn)}get[fn](){return this[pn]||(this[pn]=Array.from(this[dn].toArray(),String))}[Symbol.iterator](){return new mn(this[dn],this[hn])}get size(){return this[dn].length}toArray(){return Object.values(this.toJSON())}toJSON(){const t=this[dn],e=this[hn],n={};for(let r=-1,i=t.length;++r<i;)n[t.get(r)]=un.visit(e,r);return n}toString(){return`{${[...this].map((([t,e])=>`${c(t)}: ${c(e)}`)).join(", ")}}`}[Symbol.for("nodejs.util.inspect.custom")](){return this.toString()}}class mn{constructor(t,e){this.keys=t,this.vals=e,this.keyIndex=0,this.numKeys=t.length}[Symbol.iterator](){return this}next(){const t=this.keyIndex;return t===this.numKeys?{done:!0,value:null}:(this.keyIndex++,{done:!1,value:[this.keys.get(t),un.visit(this.vals,t)]})}}class yn{isExtensible(){return!1}deleteProperty(){return!1}preventExtensions(){return!0}ownKeys(t){return t[fn]}has(t,e){return t[fn].includes(e)}getOwnPropertyDescriptor(t,e){if(-1!==t[fn].indexOf(e))return{writable:!0,enumerable:!0,configurable:!0}}get(t,e){if(Reflect.has(t,e))return t[e];const n=t[fn].indexOf(e);if(-1!==n){const r=un.visit(Reflect.get(t,hn),n);return Reflect.set(t,e,r),r}}set(t,e,n){const r=t[fn].indexOf(e);return-1!==r?(De.visit(Reflect.get(t,hn),r,n),Reflect.set(t,e,n)):!!Reflect.has(t,e)&&Reflect.set(t,e,n)}}let bn;function vn(t,e,n,r){const{length:i=0}=t;let o="number"!=typeof e?0:e,a="number"!=typeof n?i:n;return o<0&&(o=(o%i+i)%i),a<0&&(a=(a%i+i)%i),a<o&&(bn=o,o=a,a=bn),a>i&&(a=i),r?r(t,o,a):[o,a]}Object.defineProperties(gn.prototype,{[Symbol.toStringTag]:{enumerable:!1,configurable:!1,value:"Row"},[dn]:{writable:!0,enumerable:!1,configurable:!1,value:null},[hn]:{writable:!0,enumerable:!1,configurable:!1,value:null},[pn]:{writable:!0,enumerable:!1,configurable:!1,value:null}});const _n=(t,e)=>t<0?e+t:t,wn=t=>t!=t;function xn(t){if("object"!=typeof t||null===t)return wn(t)?wn:e=>e===t;if(t instanceof Date){const e=t.valueOf();return t=>t instanceof Date&&t.valueOf()===e}return ArrayBuffer.isView(t)?e=>!!e&&function(t,e){let n=0;const r=t.length;if(r!==e.length)return!1;if(r>0)do{if(t[n]!==e[n])return!1}while(++n<r);return!0}(t,e):t instanceof Map?function(t){let e=-1;const n=[];for(const r of t.values())n[++e]=xn(r);return Sn(n)}(t):Array.isArray(t)?function(t){const e=[];for(let n=-1,r=t.length;++n<r;)e[n]=xn(t[n]);return Sn(e)}(t):t instanceof Zn?function(t){const e=[];for(let n=-1,r=t.length;++n<r;)e[n]=xn(t.get(n));return Sn(e)}(t):function(t,e=!1){const n=Object.keys(t);if(!e&&0===n.length)return()=>!1;const r=[];for(let e=-1,i=n.length;++e<i;)r[e]=xn(t[n[e]]);return Sn(r,n)}(t,!0)}function Sn(t,e){return n=>{if(!n||"object"!=typeof n)return!1;switch(n.constructor){case Array:return function(t,e){const n=t.length;if(e.length!==n)return!1;for(let r=-1;++r<n;)if(!t[r](e[r]))return!1;return!0}(t,n);case Map:return kn(t,n,n.keys());case gn:case Be:case Object:case void 0:return kn(t,n,e||Object.keys(n))}return n instanceof Zn&&function(t,e){const n=t.length;if(e.length!==n)return!1;for(let r=-1;++r<n;)if(!t[r](e.get(r)))return!1;return!0}(t,n)}}function kn(t,e,n){const r=n[Symbol.iterator](),i=e instanceof Map?e.keys():Object.keys(e)[Symbol.iterator](),o=e instanceof Map?e.values():Object.values(e)[Symbol.iterator]();let a=0;const s=t.length;let l=o.next(),c=r.next(),u=i.next();for(;a<s&&!c.done&&!u.done&&!l.done&&c.value===u.value&&t[a](l.value);++a,c=r.next(),u=i.next(),l=o.next());return!!(a===s&&c.done&&u.done&&l.done)||(r.return&&r.return(),i.return&&i.return(),o.return&&o.return(),!1)}class Cn{constructor(t=0,e){this.numChunks=t,this.getChunkIterator=e,this.chunkIndex=0,this.chunkIterator=this.getChunkIterator(0)}next(){for(;this.chunkIndex<this.numChunks;){const t=this.chunkIterator.next();if(!t.done)return t;++this.chunkIndex<this.numChunks&&(this.chunkIterator=this.getChunkIterator(this.chunkIndex))}return{done:!0,value:null}}[Symbol.iterator](){return this}}function Tn(t){return t.reduce(((t,e)=>t+e.nullCount),0)}function En(t){return t.reduce(((t,e,n)=>(t[n+1]=t[n]+e.length,t)),new Uint32Array(t.length+1))}function Pn(t,e,n,r){const i=[];for(let o=-1,a=t.length;++o<a;){const a=t[o],s=e[o],{length:l}=a;if(s>=r)break;if(n>=s+l)continue;if(s>=n&&s+l<=r){i.push(a);continue}const c=Math.max(0,n-s),u=Math.min(r-s,l);i.push(a.slice(c,u-c))}return 0===i.length&&i.push(t[0].slice(0,0)),i}function In(t,e,n,r){let i=0,o=0,a=e.length-1;do{if(i>=a-1)return n<e[a]?r(t,i,n-e[i]):null;o=i+Math.trunc(.5*(a-i)),n<e[o]?a=o:i=o}while(i<a)}function An(t,e){return t.getValid(e)}function Mn(t){function e(e,n,r){return t(e[n],r)}return function(t){return In(this.data,this._offsets,t,e)}}function Dn(t){let e;function n(n,r,i){return t(n[r],i,e)}return function(t,r){const i=this.data;e=r;const o=In(i,this._offsets,t,n);return e=void 0,o}}function Fn(t){let e;function n(n,r,i){let o=i,a=0,s=0;for(let i=r-1,l=n.length;++i<l;){const r=n[i];if(~(a=t(r,e,o)))return s+a;o=0,s+=r.length}return-1}return function(t,r){e=t;const i=this.data,o="number"!=typeof r?n(i,0,0):In(i,this._offsets,r,n);return e=void 0,o}}function Rn(t,e,n,r){return!!(n&1<<r)}function Bn(t,e,n,r){return(n&1<<r)>>r}function Ln(t,e,n){const r=n.byteLength+7&-8;if(t>0||n.byteLength<r){const i=new Uint8Array(r);return i.set(t%8==0?n.subarray(t>>3):Nn(new On(n,t,e,null,Rn)).subarray(0,r)),i}return n}function Nn(t){const e=[];let n=0,r=0,i=0;for(const o of t)o&&(i|=1<<r),8==++r&&(e[n++]=i,i=r=0);(0===n||r>0)&&(e[n++]=i);const o=new Uint8Array(e.length+7&-8);return o.set(e),o}class On{constructor(t,e,n,r,i){this.bytes=t,this.length=n,this.context=r,this.get=i,this.bit=e%8,this.byteIndex=e>>3,this.byte=t[this.byteIndex++],this.index=0}next(){return this.index<this.length?(8===this.bit&&(this.bit=0,this.byte=this.bytes[this.byteIndex++]),{value:this.get(this.context,this.index++,this.byte,this.bit++)}):{done:!0,value:null}}[Symbol.iterator](){return this}}function zn(t,e,n){if(n-e<=0)return 0;if(n-e<8){let r=0;for(const i of new On(t,e,n-e,t,Bn))r+=i;return r}const r=n>>3<<3,i=e+(e%8==0?0:8-e%8);return zn(t,e,i)+zn(t,r,n)+function(t,e,n){let r=0,i=Math.trunc(e);const o=new DataView(t.buffer,t.byteOffset,t.byteLength),a=void 0===n?t.byteLength:i+n;for(;a-i>=4;)r+=Un(o.getUint32(i)),i+=4;for(;a-i>=2;)r+=Un(o.getUint16(i)),i+=2;for(;a-i>=1;)r+=Un(o.getUint8(i)),i+=1;return r}(t,i>>3,r-i>>3)}function Un(t){let e=Math.trunc(t);return e-=e>>>1&1431655765,e=(858993459&e)+(e>>>2&858993459),16843009*(e+(e>>>4)&252645135)>>>24}class jn extends te{}function Vn(t,n,r){if(void 0===n)return-1;if(null===n)switch(t.typeId){case e.Union:case e.Dictionary:break;default:return function(t,e){const{nullBitmap:n}=t;if(!n||t.nullCount<=0)return-1;let r=0;for(const i of new On(n,t.offset+(e||0),t.length,n,Rn)){if(!i)return r;++r}return-1}(t,r)}const i=un.getVisitFn(t),o=xn(n);for(let e=(r||0)-1,n=t.length;++e<n;)if(o(i(t,e)))return e;return-1}function $n(t,e,n){const r=un.getVisitFn(t),i=xn(e);for(let e=(n||0)-1,o=t.length;++e<o;)if(i(r(t,e)))return e;return-1}jn.prototype.visitNull=function(t,e){return null===e&&t.length>0?0:-1},jn.prototype.visitBool=Vn,jn.prototype.visitInt=Vn,jn.prototype.visitInt8=Vn,jn.prototype.visitInt16=Vn,jn.prototype.visitInt32=Vn,jn.prototype.visitInt64=Vn,jn.prototype.visitUint8=Vn,jn.prototype.visitUint16=Vn,jn.prototype.visitUint32=Vn,jn.prototype.visitUint64=Vn,jn.prototype.visitFloat=Vn,jn.prototype.visitFloat16=Vn,jn.prototype.visitFloat32=Vn,jn.prototype.visitFloat64=Vn,jn.prototype.visitUtf8=Vn,jn.prototype.visitLargeUtf8=Vn,jn.prototype.visitBinary=Vn,jn.prototype.visitLargeBinary=Vn,jn.prototype.visitFixedSizeBinary=Vn,jn.prototype.visitDate=Vn,jn.prototype.visitDateDay=Vn,jn.prototype.visitDateMillisecond=Vn,jn.prototype.visitTimestamp=Vn,jn.prototype.visitTimestampSecond=Vn,jn.prototype.visitTimestampMillisecond=Vn,jn.prototype.visitTimestampMicrosecond=Vn,jn.prototype.visitTimestampNanosecond=Vn,jn.prototype.visitTime=Vn,jn.prototype.visitTimeSecond=Vn,jn.prototype.visitTimeMillisecond=Vn,jn.prototype.visitTimeMicrosecond=Vn,jn.prototype.visitTimeNanosecond=Vn,jn.prototype.visitDecimal=Vn,jn.prototype.visitList=Vn,jn.prototype.visitStruct=Vn,jn.prototype.visitUnion=Vn,jn.prototype.visitDenseUnion=$n,jn.prototype.visitSparseUnion=$n,jn.prototype.visitDictionary=Vn,jn.prototype.visitInterval=Vn,jn.prototype.visitIntervalDayTime=Vn,jn.prototype.visitIntervalYearMonth=Vn,jn.prototype.visitDuration=Vn,jn.prototype.visitDurationSecond=Vn,jn.prototype.visitDurationMillisecond=Vn,jn.prototype.visitDurationMicrosecond=Vn,jn.prototype.visitDurationNanosecond=Vn,jn.prototype.visitFixedSizeList=Vn,jn.prototype.visitMap=Vn;const Wn=new jn;class Gn extends te{}function Hn(t){const{type:e}=t;if(0===t.nullCount&&1===t.stride&&(Pt.isInt(e)&&64!==e.bitWidth||Pt.isTime(e)&&64!==e.bitWidth||Pt.isFloat(e)&&e.precision!==tt.HALF))return new Cn(t.data.length,(e=>{const n=t.data[e];return n.values.subarray(0,n.length)[Symbol.iterator]()}));let n=0;return new Cn(t.data.length,(e=>{const r=t.data[e].length,i=t.slice(n,n+r);return n+=r,new Yn(i)}))}class Yn{constructor(t){this.vector=t,this.index=0}next(){return this.index<this.vector.length?{value:this.vector.get(this.index++)}:{done:!0,value:null}}[Symbol.iterator](){return this}}Gn.prototype.visitNull=Hn,Gn.prototype.visitBool=Hn,Gn.prototype.visitInt=Hn,Gn.prototype.visitInt8=Hn,Gn.prototype.visitInt16=Hn,Gn.prototype.visitInt32=Hn,Gn.prototype.visitInt64=Hn,Gn.prototype.visitUint8=Hn,Gn.prototype.visitUint16=Hn,Gn.prototype.visitUint32=Hn,Gn.prototype.visitUint64=Hn,Gn.prototype.visitFloat=Hn,Gn.prototype.visitFloat16=Hn,Gn.prototype.visitFloat32=Hn,Gn.prototype.visitFloat64=Hn,Gn.prototype.visitUtf8=Hn,Gn.prototype.visitLargeUtf8=Hn,Gn.prototype.visitBinary=Hn,Gn.prototype.visitLargeBinary=Hn,Gn.prototype.visitFixedSizeBinary=Hn,Gn.prototype.visitDate=Hn,Gn.prototype.visitDateDay=Hn,Gn.prototype.visitDateMillisecond=Hn,Gn.prototype.visitTimestamp=Hn,Gn.prototype.visitTimestampSecond=Hn,Gn.prototype.visitTimestampMillisecond=Hn,Gn.prototype.visitTimestampMicrosecond=Hn,Gn.prototype.visitTimestampNanosecond=Hn,Gn.prototype.visitTime=Hn,Gn.prototype.visitTimeSecond=Hn,Gn.prototype.visitTimeMillisecond=Hn,Gn.prototype.visitTimeMicrosecond=Hn,Gn.prototype.visitTimeNanosecond=Hn,Gn.prototype.visitDecimal=Hn,Gn.prototype.visitList=Hn,Gn.prototype.visitStruct=Hn,Gn.prototype.visitUnion=Hn,Gn.prototype.visitDenseUnion=Hn,Gn.prototype.visitSparseUnion=Hn,Gn.prototype.visitDictionary=Hn,Gn.prototype.visitInterval=Hn,Gn.prototype.visitIntervalDayTime=Hn,Gn.prototype.visitIntervalYearMonth=Hn,Gn.prototype.visitDuration=Hn,Gn.prototype.visitDurationSecond=Hn,Gn.prototype.visitDurationMillisecond=Hn,Gn.prototype.visitDurationMicrosecond=Hn,Gn.prototype.visitDurationNanosecond=Hn,Gn.prototype.visitFixedSizeList=Hn,Gn.prototype.visitMap=Hn;const qn=new Gn;var Kn;const Xn={},Qn={};class Zn{constructor(t){var e,n,r;const i=t[0]instanceof Zn?t.flatMap((t=>t.data)):t;if(0===i.length||i.some((t=>!(t instanceof tr))))throw new TypeError("Vector constructor expects an Array of Data instances.");const o=null===(e=i[0])||void 0===e?void 0:e.type;switch(i.length){case 0:this._offsets=[0];break;case 1:{const{get:t,set:e,indexOf:n}=Xn[o.typeId],r=i[0];this.isValid=t=>An(r,t),this.get=e=>t(r,e),this.set=(t,n)=>e(r,t,n),this.indexOf=t=>n(r,t),this._offsets=[0,r.length];break}default:Object.setPrototypeOf(this,Qn[o.typeId]),this._offsets=En(i)}this.data=i,this.type=o,this.stride=Jt(o),this.numChildren=null!==(r=null===(n=o.children)||void 0===n?void 0:n.length)&&void 0!==r?r:0,this.length=this._offsets.at(-1)}get byteLength(){return this.data.reduce(((t,e)=>t+e.byteLength),0)}get nullable(){return this.data.some((t=>t.nullable))}get nullCount(){return Tn(this.data)}get ArrayType(){return this.type.ArrayType}get[Symbol.toStringTag](){return`${this.VectorName}<${this.type[Symbol.toStringTag]}>`}get VectorName(){return`${e[this.type.typeId]}Vector`}isValid(t){return!1}get(t){return null}at(t){return this.get(_n(t,this.length))}set(t,e){}indexOf(t,e){return-1}includes(t,e){return this.indexOf(t,e)>-1}[Symbol.iterator](){return qn.visit(this)}concat(...t){return new Zn(this.data.concat(t.flatMap((t=>t.data)).flat(Number.POSITIVE_INFINITY)))}slice(t,e){return new Zn(vn(this,t,e,(({data:t,_offsets:e},n,r)=>Pn(t,e,n,r))))}toJSON(){return[...this]}toArray(){const{type:t,data:n,length:r,stride:i,ArrayType:o}=this;switch(t.typeId){case e.Int:case e.Float:case e.Decimal:case e.Time:case e.Timestamp:switch(n.length){case 0:return new o;case 1:return n[0].values.subarray(0,r*i);default:return n.reduce(((t,{values:e,length:n})=>(t.array.set(e.subarray(0,n*i),t.offset),t.offset+=n*i,t)),{array:new o(r*i),offset:0}).array}}return[...this]}toString(){return`[${[...this].join(",")}]`}getChild(t){var e;return this.getChildAt(null===(e=this.type.children)||void 0===e?void 0:e.findIndex((e=>e.name===t)))}getChildAt(t){return t>-1&&t<this.numChildren?new Zn(this.data.map((({children:e})=>e[t]))):null}get isMemoized(){return!!Pt.isDictionary(this.type)&&this.data[0].dictionary.isMemoized}memoize(){if(Pt.isDictionary(this.type)){const t=new Jn(this.data[0].dictionary),e=this.data.map((e=>{const n=e.clone();return n.dictionary=t,n}));return new Zn(e)}return new Jn(this)}unmemoize(){if(Pt.isDictionary(this.type)&&this.isMemoized){const t=this.data[0].dictionary.unmemoize(),e=this.data.map((e=>{const n=e.clone();return n.dictionary=t,n}));return new Zn(e)}return this}}Kn=Symbol.toStringTag,Zn[Kn]=(t=>{t.type=Pt.prototype,t.data=[],t.length=0,t.stride=1,t.numChildren=0,t._offsets=new Uint32Array([0]),t[Symbol.isConcatSpreadable]=!0;const n=Object.keys(e).map((t=>e[t])).filter((t=>"number"==typeof t&&t!==e.NONE));for(const e of n){const n=un.getVisitFnByTypeId(e),r=De.getVisitFnByTypeId(e),i=Wn.getVisitFnByTypeId(e);Xn[e]={get:n,set:r,indexOf:i},Qn[e]=Object.create(t,{isValid:{value:Mn(An)},get:{value:Mn(un.getVisitFnByTypeId(e))},set:{value:Dn(De.getVisitFnByTypeId(e))},indexOf:{value:Fn(Wn.getVisitFnByTypeId(e))}})}return"Vector"})(Zn.prototype);class Jn extends Zn{constructor(t){super(t.data);const e=this.get,n=this.set,r=this.slice,i=new Array(this.length);Object.defineProperty(this,"get",{value(t){const n=i[t];if(void 0!==n)return n;const r=e.call(this,t);return i[t]=r,r}}),Object.defineProperty(this,"set",{value(t,e){n.call(this,t,e),i[t]=e}}),Object.defineProperty(this,"slice",{value:(t,e)=>new Jn(r.call(this,t,e))}),Object.defineProperty(this,"isMemoized",{value:!0}),Object.defineProperty(this,"unmemoize",{value:()=>new Zn(this.data)}),Object.defineProperty(this,"memoize",{value:()=>this})}}class tr{get typeId(){return this.type.typeId}get ArrayType(){return this.type.ArrayType}get buffers(){return[this.valueOffsets,this.values,this.nullBitmap,this.typeIds]}get nullable(){if(0!==this._nullCount){const{type:t}=this;return Pt.isSparseUnion(t)||Pt.isDenseUnion(t)?this.children.some((t=>t.nullable)):this.nullBitmap&&this.nullBitmap.byteLength>0}return!0}get byteLength(){let t=0;const{valueOffsets:e,values:n,nullBitmap:r,typeIds:i}=this;return e&&(t+=e.byteLength),n&&(t+=n.byteLength),r&&(t+=r.byteLength),i&&(t+=i.byteLength),this.children.reduce(((t,e)=>t+e.byteLength),t)}get nullCount(){if(Pt.isUnion(this.type))return this.children.reduce(((t,e)=>t+e.nullCount),0);let t,e=this._nullCount;return e<=-1&&(t=this.nullBitmap)&&(this._nullCount=e=0===t.length?0:this.length-zn(t,this.offset,this.offset+this.length)),e}constructor(t,e,n,r,i,o=[],a){let s;this.type=t,this.children=o,this.dictionary=a,this.offset=Math.floor(Math.max(e||0,0)),this.length=Math.floor(Math.max(n||0,0)),this._nullCount=Math.floor(Math.max(r||0,-1)),i instanceof tr?(this.stride=i.stride,this.values=i.values,this.typeIds=i.typeIds,this.nullBitmap=i.nullBitmap,this.valueOffsets=i.valueOffsets):(this.stride=Jt(t),i&&((s=i[0])&&(this.valueOffsets=s),(s=i[1])&&(this.values=s),(s=i[2])&&(this.nullBitmap=s),(s=i[3])&&(this.typeIds=s)))}getValid(t){const{type:e}=this;if(Pt.isUnion(e)){const n=e,r=this.children[n.typeIdToChildIndex[this.typeIds[t]]],i=n.mode===it.Dense?this.valueOffsets[t]:t;return r.getValid(i)}if(this.nullable&&this.nullCount>0){const e=this.offset+t;return!!(this.nullBitmap[e>>3]&1<<e%8)}return!0}setValid(t,e){let n;const{type:r}=this;if(Pt.isUnion(r)){const i=r,o=this.children[i.typeIdToChildIndex[this.typeIds[t]]],a=i.mode===it.Dense?this.valueOffsets[t]:t;n=o.getValid(a),o.setValid(a,e)}else{let{nullBitmap:r}=this;const{offset:i,length:o}=this,a=i+t,s=1<<a%8,l=a>>3;(!r||r.byteLength<=l)&&(r=new Uint8Array((i+o+63&-64)>>3).fill(255),this.nullCount>0?(r.set(Ln(i,o,this.nullBitmap),0),Object.assign(this,{nullBitmap:r})):Object.assign(this,{nullBitmap:r,_nullCount:0}));const c=r[l];n=!!(c&s),r[l]=e?c|s:c&~s}return n!==!!e&&(this._nullCount=this.nullCount+(e?-1:1)),e}clone(t=this.type,e=this.offset,n=this.length,r=this._nullCount,i=this,o=this.children){return new tr(t,e,n,r,i,o,this.dictionary)}slice(t,e){const{stride:n,typeId:r,children:i}=this,o=+(0===this._nullCount)-1,a=16===r?n:1,s=this._sliceBuffers(t,e,n,r);return this.clone(this.type,this.offset+t,e,o,s,0===i.length||this.valueOffsets?i:this._sliceChildren(i,a*t,a*e))}_changeLengthAndBackfillNullBitmap(t){if(this.typeId===e.Null)return this.clone(this.type,0,t,0);const{length:r,nullCount:i}=this,o=new Uint8Array((t+63&-64)>>3).fill(255,0,r>>3);o[r>>3]=(1<<r-(-8&r))-1,i>0&&o.set(Ln(this.offset,r,this.nullBitmap),0);const a=this.buffers;return a[n.VALIDITY]=o,this.clone(this.type,0,t,i+(t-r),a)}_sliceBuffers(t,e,r,i){let o;const{buffers:a}=this;return(o=a[n.TYPE])&&(a[n.TYPE]=o.subarray(t,t+e)),(o=a[n.OFFSET])&&(a[n.OFFSET]=o.subarray(t,t+e+1))||(o=a[n.DATA])&&(a[n.DATA]=6===i?o:o.subarray(r*t,r*(t+e))),a}_sliceChildren(t,e,n){return t.map((t=>t.slice(e,n)))}}tr.prototype.children=Object.freeze([]);class er extends te{visit(t){return this.getVisitFn(t.type).call(this,t)}visitNull(t){const{type:e,offset:n=0,length:r=0}=t;return new tr(e,n,r,r)}visitBool(t){const{type:e,offset:n=0}=t,r=O(t.nullBitmap),i=B(e.ArrayType,t.data),{length:o=i.length>>3,nullCount:a=(t.nullBitmap?-1:0)}=t;return new tr(e,n,o,a,[void 0,i,r])}visitInt(t){const{type:e,offset:n=0}=t,r=O(t.nullBitmap),i=B(e.ArrayType,t.data),{length:o=i.length,nullCount:a=(t.nullBitmap?-1:0)}=t;return new tr(e,n,o,a,[void 0,i,r])}visitFloat(t){const{type:e,offset:n=0}=t,r=O(t.nullBitmap),i=B(e.ArrayType,t.data),{length:o=i.length,nullCount:a=(t.nullBitmap?-1:0)}=t;return new tr(e,n,o,a,[void 0,i,r])}visitUtf8(t){const{type:e,offset:n=0}=t,r=O(t.data),i=O(t.nullBitmap),o=L(t.valueOffsets),{length:a=o.length-1,nullCount:s=(t.nullBitmap?-1:0)}=t;return new tr(e,n,a,s,[o,r,i])}visitLargeUtf8(t){const{type:e,offset:n=0}=t,r=O(t.data),i=O(t.nullBitmap),o=N(t.valueOffsets),{length:a=o.length-1,nullCount:s=(t.nullBitmap?-1:0)}=t;return new tr(e,n,a,s,[o,r,i])}visitBinary(t){const{type:e,offset:n=0}=t,r=O(t.data),i=O(t.nullBitmap),o=L(t.valueOffsets),{length:a=o.length-1,nullCount:s=(t.nullBitmap?-1:0)}=t;return new tr(e,n,a,s,[o,r,i])}visitLargeBinary(t){const{type:e,offset:n=0}=t,r=O(t.data),i=O(t.nullBitmap),o=N(t.valueOffsets),{length:a=o.length-1,nullCount:s=(t.nullBitmap?-1:0)}=t;return new tr(e,n,a,s,[o,r,i])}visitFixedSizeBinary(t){const{type:e,offset:n=0}=t,r=O(t.nullBitmap),i=B(e.ArrayType,t.data),{length:o=i.length/Jt(e),nullCount:a=(t.nullBitmap?-1:0)}=t;return new tr(e,n,o,a,[void 0,i,r])}visitDate(t){const{type:e,offset:n=0}=t,r=O(t.nullBitmap),i=B(e.ArrayType,t.data),{length:o=i.length/Jt(e),nullCount:a=(t.nullBitmap?-1:0)}=t;return new tr(e,n,o,a,[void 0,i,r])}visitTimestamp(t){const{type:e,offset:n=0}=t,r=O(t.nullBitmap),i=B(e.ArrayType,t.data),{length:o=i.length/Jt(e),nullCount:a=(t.nullBitmap?-1:0)}=t;return new tr(e,n,o,a,[void 0,i,r])}visitTime(t){const{type:e,offset:n=0}=t,r=O(t.nullBitmap),i=B(e.ArrayType,t.data),{length:o=i.length/Jt(e),nullCount:a=(t.nullBitmap?-1:0)}=t;return new tr(e,n,o,a,[void 0,i,r])}visitDecimal(t){const{type:e,offset:n=0}=t,r=O(t.nullBitmap),i=B(e.ArrayType,t.data),{length:o=i.length/Jt(e),nullCount:a=(t.nullBitmap?-1:0)}=t;return new tr(e,n,o,a,[void 0,i,r])}visitList(t){const{type:e,offset:n=0,child:r}=t,i=O(t.nullBitmap),o=L(t.valueOffsets),{length:a=o.length-1,nullCount:s=(t.nullBitmap?-1:0)}=t;return new tr(e,n,a,s,[o,void 0,i],[r])}visitStruct(t){const{type:e,offset:n=0,children:r=[]}=t,i=O(t.nullBitmap),{length:o=r.reduce(((t,{length:e})=>Math.max(t,e)),0),nullCount:a=(t.nullBitmap?-1:0)}=t;return new tr(e,n,o,a,[void 0,void 0,i],r)}visitUnion(t){const{type:e,offset:n=0,children:r=[]}=t,i=B(e.ArrayType,t.typeIds),{length:o=i.length,nullCount:a=-1}=t;if(Pt.isSparseUnion(e))return new tr(e,n,o,a,[void 0,void 0,void 0,i],r);const s=L(t.valueOffsets);return new tr(e,n,o,a,[s,void 0,void 0,i],r)}visitDictionary(t){const{type:e,offset:n=0}=t,r=O(t.nullBitmap),i=B(e.indices.ArrayType,t.data),{dictionary:o=new Zn([(new er).visit({type:e.dictionary})])}=t,{length:a=i.length,nullCount:s=(t.nullBitmap?-1:0)}=t;return new tr(e,n,a,s,[void 0,i,r],[],o)}visitInterval(t){const{type:e,offset:n=0}=t,r=O(t.nullBitmap),i=B(e.ArrayType,t.data),{length:o=i.length/Jt(e),nullCount:a=(t.nullBitmap?-1:0)}=t;return new tr(e,n,o,a,[void 0,i,r])}visitDuration(t){const{type:e,offset:n=0}=t,r=O(t.nullBitmap),i=B(e.ArrayType,t.data),{length:o=i.length,nullCount:a=(t.nullBitmap?-1:0)}=t;return new tr(e,n,o,a,[void 0,i,r])}visitFixedSizeList(t){const{type:e,offset:n=0,child:r=(new er).visit({type:e.valueType})}=t,i=O(t.nullBitmap),{length:o=r.length/Jt(e),nullCount:a=(t.nullBitmap?-1:0)}=t;return new tr(e,n,o,a,[void 0,void 0,i],[r])}visitMap(t){const{type:e,offset:n=0,child:r=(new er).visit({type:e.childType})}=t,i=O(t.nullBitmap),o=L(t.valueOffsets),{length:a=o.length-1,nullCount:s=(t.nullBitmap?-1:0)}=t;return new tr(e,n,a,s,[o,void 0,i],[r])}}const nr=new er;function rr(t){return nr.visit(t)}var ir;!function(t){t[t.V1=0]="V1",t[t.V2=1]="V2",t[t.V3=2]="V3",t[t.V4=3]="V4",t[t.V5=4]="V5"}(ir||(ir={}));class or{constructor(t=[],e,n,r=ir.V5){this.fields=t||[],this.metadata=e||new Map,n||(n=lr(this.fields)),this.dictionaries=n,this.metadataVersion=r}get[Symbol.toStringTag](){return"Schema"}get names(){return this.fields.map((t=>t.name))}toString(){return`Schema<{ ${this.fields.map(((t,e)=>`${e}: ${t}`)).join(", ")} }>`}select(t){const e=new Set(t),n=this.fields.filter((t=>e.has(t.name)));return new or(n,this.metadata)}selectAt(t){const e=t.map((t=>this.fields[t])).filter(Boolean);return new or(e,this.metadata)}assign(...t){const e=t[0]instanceof or?t[0]:Array.isArray(t[0])?new or(t[0]):new or(t),n=[...this.fields],r=sr(sr(new Map,this.metadata),e.metadata),i=e.fields.filter((t=>{const e=n.findIndex((e=>e.name===t.name));return!~e||(n[e]=t.clone({metadata:sr(sr(new Map,n[e].metadata),t.metadata)}))&&!1})),o=lr(i,new Map);return new or([...n,...i],r,new Map([...this.dictionaries,...o]))}}or.prototype.fields=null,or.prototype.metadata=null,or.prototype.dictionaries=null;class ar{static new(...t){let[e,n,r,i]=t;return t[0]&&"object"==typeof t[0]&&(({name:e}=t[0]),void 0===n&&(n=t[0].type),void 0===r&&(r=t[0].nullable),void 0===i&&(i=t[0].metadata)),new ar(`${e}`,n,r,i)}constructor(t,e,n=!1,r){this.name=t,this.type=e,this.nullable=n,this.metadata=r||new Map}get typeId(){return this.type.typeId}get[Symbol.toStringTag](){return"Field"}toString(){return`${this.name}: ${this.type}`}clone(...t){let[e,n,r,i]=t;return t[0]&&"object"==typeof t[0]?({name:e=this.name,type:n=this.type,nullable:r=this.nullable,metadata:i=this.metadata}=t[0]):[e=this.name,n=this.type,r=this.nullable,i=this.metadata]=t,ar.new(e,n,r,i)}}function sr(t,e){return new Map([...t||new Map,...e||new Map])}function lr(t,e=new Map){for(let n=-1,r=t.length;++n<r;){const r=t[n].type;if(Pt.isDictionary(r))if(e.has(r.id)){if(e.get(r.id)!==r.dictionary)throw new Error("Cannot create Schema containing two different dictionaries with the same Id")}else e.set(r.id,r.dictionary);r.children&&r.children.length>0&&lr(r.children,e)}return e}ar.prototype.type=null,ar.prototype.name=null,ar.prototype.nullable=null,ar.prototype.metadata=null;class cr extends te{compareSchemas(t,e){return t===e||e instanceof t.constructor&&this.compareManyFields(t.fields,e.fields)}compareManyFields(t,e){return t===e||Array.isArray(t)&&Array.isArray(e)&&t.length===e.length&&t.every(((t,n)=>this.compareFields(t,e[n])))}compareFields(t,e){return t===e||e instanceof t.constructor&&t.name===e.name&&t.nullable===e.nullable&&this.visit(t.type,e.type)}}function ur(t,e){return e instanceof t.constructor}function dr(t,e){return t===e||ur(t,e)}function hr(t,e){return t===e||ur(t,e)&&t.bitWidth===e.bitWidth&&t.isSigned===e.isSigned}function fr(t,e){return t===e||ur(t,e)&&t.precision===e.precision}function pr(t,e){return t===e||ur(t,e)&&t.unit===e.unit}function gr(t,e){return t===e||ur(t,e)&&t.unit===e.unit&&t.timezone===e.timezone}function mr(t,e){return t===e||ur(t,e)&&t.unit===e.unit&&t.bitWidth===e.bitWidth}function yr(t,e){return t===e||ur(t,e)&&t.mode===e.mode&&t.typeIds.every(((t,n)=>t===e.typeIds[n]))&&_r.compareManyFields(t.children,e.children)}function br(t,e){return t===e||ur(t,e)&&t.unit===e.unit}function vr(t,e){return t===e||ur(t,e)&&t.unit===e.unit}cr.prototype.visitNull=dr,cr.prototype.visitBool=dr,cr.prototype.visitInt=hr,cr.prototype.visitInt8=hr,cr.prototype.visitInt16=hr,cr.prototype.visitInt32=hr,cr.prototype.visitInt64=hr,cr.prototype.visitUint8=hr,cr.prototype.visitUint16=hr,cr.prototype.visitUint32=hr,cr.prototype.visitUint64=hr,cr.prototype.visitFloat=fr,cr.prototype.visitFloat16=fr,cr.prototype.visitFloat32=fr,cr.prototype.visitFloat64=fr,cr.prototype.visitUtf8=dr,cr.prototype.visitLargeUtf8=dr,cr.prototype.visitBinary=dr,cr.prototype.visitLargeBinary=dr,cr.prototype.visitFixedSizeBinary=function(t,e){return t===e||ur(t,e)&&t.byteWidth===e.byteWidth},cr.prototype.visitDate=pr,cr.prototype.visitDateDay=pr,cr.prototype.visitDateMillisecond=pr,cr.prototype.visitTimestamp=gr,cr.prototype.visitTimestampSecond=gr,cr.prototype.visitTimestampMillisecond=gr,cr.prototype.visitTimestampMicrosecond=gr,cr.prototype.visitTimestampNanosecond=gr,cr.prototype.visitTime=mr,cr.prototype.visitTimeSecond=mr,cr.prototype.visitTimeMillisecond=mr,cr.prototype.visitTimeMicrosecond=mr,cr.prototype.visitTimeNanosecond=mr,cr.prototype.visitDecimal=dr,cr.prototype.visitList=function(t,e){return t===e||ur(t,e)&&t.children.length===e.children.length&&_r.compareManyFields(t.children,e.children)},cr.prototype.visitStruct=function(t,e){return t===e||ur(t,e)&&t.children.length===e.children.length&&_r.compareManyFields(t.children,e.children)},cr.prototype.visitUnion=yr,cr.prototype.visitDenseUnion=yr,cr.prototype.visitSparseUnion=yr,cr.prototype.visitDictionary=function(t,e){return t===e||ur(t,e)&&t.id===e.id&&t.isOrdered===e.isOrdered&&_r.visit(t.indices,e.indices)&&_r.visit(t.dictionary,e.dictionary)},cr.prototype.visitInterval=br,cr.prototype.visitIntervalDayTime=br,cr.prototype.visitIntervalYearMonth=br,cr.prototype.visitDuration=vr,cr.prototype.visitDurationSecond=vr,cr.prototype.visitDurationMillisecond=vr,cr.prototype.visitDurationMicrosecond=vr,cr.prototype.visitDurationNanosecond=vr,cr.prototype.visitFixedSizeList=function(t,e){return t===e||ur(t,e)&&t.listSize===e.listSize&&t.children.length===e.children.length&&_r.compareManyFields(t.children,e.children)},cr.prototype.visitMap=function(t,e){return t===e||ur(t,e)&&t.keysSorted===e.keysSorted&&t.children.length===e.children.length&&_r.compareManyFields(t.children,e.children)};const _r=new cr;function wr(t,e){return _r.compareSchemas(t,e)}var xr,Sr,kr;class Cr{constructor(...t){switch(t.length){case 2:if([this.schema]=t,!(this.schema instanceof or))throw new TypeError("RecordBatch constructor expects a [Schema, Data] pair.");if([,this.data=rr({nullCount:0,type:new Gt(this.schema.fields),children:this.schema.fields.map((t=>rr({type:t.type,nullCount:0})))})]=t,!(this.data instanceof tr))throw new TypeError("RecordBatch constructor expects a [Schema, Data] pair.");[this.schema,this.data]=Tr(this.schema,this.data.children);break;case 1:{const[e]=t,{fields:n,children:r,length:i}=Object.keys(e).reduce(((t,n,r)=>(t.children[r]=e[n],t.length=Math.max(t.length,e[n].length),t.fields[r]=ar.new({name:n,type:e[n].type,nullable:!0}),t)),{length:0,fields:new Array,children:new Array}),o=new or(n),a=rr({type:new Gt(n),length:i,children:r,nullCount:0});[this.schema,this.data]=Tr(o,a.children,i);break}default:throw new TypeError("RecordBatch constructor expects an Object mapping names to child Data, or a [Schema, Data] pair.")}}get dictionaries(){return this._dictionaries||(this._dictionaries=Er(this.schema.fields,this.data.children))}get numCols(){return this.schema.fields.length}get numRows(){return this.data.length}get nullCount(){return this.data.nullCount}isValid(t){return this.data.getValid(t)}get(t){return un.visit(this.data,t)}at(t){return this.get(_n(t,this.numRows))}set(t,e){return De.visit(this.data,t,e)}indexOf(t,e){return Wn.visit(this.data,t,e)}[Symbol.iterator](){return qn.visit(new Zn([this.data]))}toArray(){return[...this]}concat(...t){return new Mr(this.schema,[this,...t])}slice(t,e){const[n]=new Zn([this.data]).slice(t,e).data;return new Cr(this.schema,n)}getChild(t){var e;return this.getChildAt(null===(e=this.schema.fields)||void 0===e?void 0:e.findIndex((e=>e.name===t)))}getChildAt(t){return t>-1&&t<this.schema.fields.length?new Zn([this.data.children[t]]):null}setChild(t,e){var n;return this.setChildAt(null===(n=this.schema.fields)||void 0===n?void 0:n.findIndex((e=>e.name===t)),e)}setChildAt(t,e){let n=this.schema,r=this.data;if(t>-1&&t<this.numCols){e||(e=new Zn([rr({type:new It,length:this.numRows})]));const i=n.fields.slice(),o=r.children.slice(),a=i[t].clone({type:e.type});[i[t],o[t]]=[a,e.data[0]],n=new or(i,new Map(this.schema.metadata)),r=rr({type:new Gt(i),children:o})}return new Cr(n,r)}select(t){const e=this.schema.select(t),n=new Gt(e.fields),r=[];for(const e of t){const t=this.schema.fields.findIndex((t=>t.name===e));~t&&(r[t]=this.data.children[t])}return new Cr(e,rr({type:n,length:this.numRows,children:r}))}selectAt(t){const e=this.schema.selectAt(t),n=t.map((t=>this.data.children[t])).filter(Boolean),r=rr({type:new Gt(e.fields),length:this.numRows,children:n});return new Cr(e,r)}}function Tr(t,e,n=e.reduce(((t,e)=>Math.max(t,e.length)),0)){var r;const i=[...t.fields],o=[...e],a=(n+63&-64)>>3;for(const[s,l]of t.fields.entries()){const t=e[s];t&&t.length===n||(i[s]=l.clone({nullable:!0}),o[s]=null!==(r=null==t?void 0:t._changeLengthAndBackfillNullBitmap(n))&&void 0!==r?r:rr({type:l.type,length:n,nullCount:n,nullBitmap:new Uint8Array(a)}))}return[t.assign(i),rr({type:new Gt(i),length:n,children:o})]}function Er(t,e,n=new Map){var r,i;if((null!==(r=null==t?void 0:t.length)&&void 0!==r?r:0)>0&&(null==t?void 0:t.length)===(null==e?void 0:e.length))for(let r=-1,o=t.length;++r<o;){const{type:o}=t[r],a=e[r];for(const t of[a,...(null===(i=null==a?void 0:a.dictionary)||void 0===i?void 0:i.data)||[]])Er(o.children,null==t?void 0:t.children,n);if(Pt.isDictionary(o)){const{id:t}=o;if(n.has(t)){if(n.get(t)!==a.dictionary)throw new Error("Cannot create Schema containing two different dictionaries with the same Id")}else(null==a?void 0:a.dictionary)&&n.set(t,a.dictionary)}}return n}xr=Symbol.toStringTag,Cr[xr]=(t=>(t._nullCount=-1,t[Symbol.isConcatSpreadable]=!0,"RecordBatch"))(Cr.prototype);class Pr extends Cr{constructor(t){const e=t.fields.map((t=>rr({type:t.type})));super(t,rr({type:new Gt(t.fields),nullCount:0,children:e}))}}function Ir(t,e){return function(t,e){const n=[...t.fields],r=[],i={numBatches:e.reduce(((t,e)=>Math.max(t,e.length)),0)};let o=0,a=0,s=-1;const l=e.length;let c,u=[];for(;i.numBatches-- >0;){for(a=Number.POSITIVE_INFINITY,s=-1;++s<l;)u[s]=c=e[s].shift(),a=Math.min(a,c?c.length:a);Number.isFinite(a)&&(u=Ar(n,a,u,e,i),a>0&&(r[o++]=rr({type:new Gt(n),length:a,nullCount:0,children:u.slice()})))}return[t=t.assign(n),r.map((e=>new Cr(t,e)))]}(t,e.map((t=>t.data.concat())))}function Ar(t,e,n,r,i){var o;const a=(e+63&-64)>>3;for(let s=-1,l=r.length;++s<l;){const l=n[s],c=null==l?void 0:l.length;if(c>=e)c===e?n[s]=l:(n[s]=l.slice(0,e),i.numBatches=Math.max(i.numBatches,r[s].unshift(l.slice(e,c-e))));else{const r=t[s];t[s]=r.clone({nullable:!0}),n[s]=null!==(o=null==l?void 0:l._changeLengthAndBackfillNullBitmap(e))&&void 0!==o?o:rr({type:r.type,length:e,nullCount:e,nullBitmap:new Uint8Array(a)})}}return n}class Mr{constructor(...t){var e,n;if(0===t.length)return this.batches=[],this.schema=new or([]),this._offsets=[0],this;let r,i;t[0]instanceof or&&(r=t.shift()),t.at(-1)instanceof Uint32Array&&(i=t.pop());const o=t=>{if(t){if(t instanceof Cr)return[t];if(t instanceof Mr)return t.batches;if(t instanceof tr){if(t.type instanceof Gt)return[new Cr(new or(t.type.children),t)]}else{if(Array.isArray(t))return t.flatMap((t=>o(t)));if("function"==typeof t[Symbol.iterator])return[...t].flatMap((t=>o(t)));if("object"==typeof t){const e=Object.keys(t),n=e.map((e=>new Zn([t[e]]))),i=null!=r?r:new or(e.map(((t,e)=>new ar(String(t),n[e].type,n[e].nullable)))),[,o]=Ir(i,n);return 0===o.length?[new Cr(t)]:o}}}return[]},a=t.flatMap((t=>o(t)));if(r=null!==(n=null!=r?r:null===(e=a[0])||void 0===e?void 0:e.schema)&&void 0!==n?n:new or([]),!(r instanceof or))throw new TypeError("Table constructor expects a [Schema, RecordBatch[]] pair.");for(const t of a){if(!(t instanceof Cr))throw new TypeError("Table constructor expects a [Schema, RecordBatch[]] pair.");if(!wr(r,t.schema))throw new TypeError("Table and inner RecordBatch schemas must be equivalent.")}this.schema=r,this.batches=a,this._offsets=null!=i?i:En(this.data)}get data(){return this.batches.map((({data:t})=>t))}get numCols(){return this.schema.fields.length}get numRows(){return this.data.reduce(((t,e)=>t+e.length),0)}get nullCount(){return-1===this._nullCount&&(this._nullCount=Tn(this.data)),this._nullCount}isValid(t){return!1}get(t){return null}at(t){return this.get(_n(t,this.numRows))}set(t,e){}indexOf(t,e){return-1}[Symbol.iterator](){return this.batches.length>0?qn.visit(new Zn(this.data)):new Array(0)[Symbol.iterator]()}toArray(){return[...this]}toString(){return`[\n  ${this.toArray().join(",\n  ")}\n]`}concat(...t){const e=this.schema,n=this.data.concat(t.flatMap((({data:t})=>t)));return new Mr(e,n.map((t=>new Cr(e,t))))}slice(t,e){const n=this.schema;[t,e]=vn({length:this.numRows},t,e);const r=Pn(this.data,this._offsets,t,e);return new Mr(n,r.map((t=>new Cr(n,t))))}getChild(t){return this.getChildAt(this.schema.fields.findIndex((e=>e.name===t)))}getChildAt(t){if(t>-1&&t<this.schema.fields.length){const e=this.data.map((e=>e.children[t]));if(0===e.length){const{type:n}=this.schema.fields[t],r=rr({type:n,length:0,nullCount:0});e.push(r._changeLengthAndBackfillNullBitmap(this.numRows))}return new Zn(e)}return null}setChild(t,e){var n;return this.setChildAt(null===(n=this.schema.fields)||void 0===n?void 0:n.findIndex((e=>e.name===t)),e)}setChildAt(t,e){let n=this.schema,r=[...this.batches];if(t>-1&&t<this.numCols){e||(e=new Zn([rr({type:new It,length:this.numRows})]));const i=n.fields.slice(),o=i[t].clone({type:e.type}),a=this.schema.fields.map(((t,e)=>this.getChildAt(e)));[i[t],a[t]]=[o,e],[n,r]=Ir(n,a)}return new Mr(n,r)}select(t){const e=this.schema.fields.reduce(((t,e,n)=>t.set(e.name,n)),new Map);return this.selectAt(t.map((t=>e.get(t))).filter((t=>t>-1)))}selectAt(t){const e=this.schema.selectAt(t),n=this.batches.map((e=>e.selectAt(t)));return new Mr(e,n)}assign(t){const e=this.schema.fields,[n,r]=t.schema.fields.reduce(((t,n,r)=>{const[i,o]=t,a=e.findIndex((t=>t.name===n.name));return~a?o[a]=r:i.push(r),t}),[[],[]]),i=this.schema.assign(t.schema),o=[...e.map(((t,e)=>[e,r[e]])).map((([e,n])=>void 0===n?this.getChildAt(e):t.getChildAt(n))),...n.map((e=>t.getChildAt(e)))].filter(Boolean);return new Mr(...Ir(i,o))}}Sr=Symbol.toStringTag,Mr[Sr]=(t=>(t.schema=null,t.batches=[],t._offsets=new Uint32Array([0]),t._nullCount=-1,t[Symbol.isConcatSpreadable]=!0,t.isValid=Mn(An),t.get=Mn(un.getVisitFn(e.Struct)),t.set=Dn(De.getVisitFn(e.Struct)),t.indexOf=Fn(Wn.getVisitFn(e.Struct)),"Table"))(Mr.prototype),function(t){t[t.NONE=0]="NONE",t[t.Schema=1]="Schema",t[t.DictionaryBatch=2]="DictionaryBatch",t[t.RecordBatch=3]="RecordBatch",t[t.Tensor=4]="Tensor",t[t.SparseTensor=5]="SparseTensor"}(kr||(kr={}));class Dr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}offset(){return this.bb.readInt64(this.bb_pos)}metaDataLength(){return this.bb.readInt32(this.bb_pos+8)}bodyLength(){return this.bb.readInt64(this.bb_pos+16)}static sizeOf(){return 24}static createBlock(t,e,n,r){return t.prep(8,24),t.writeInt64(BigInt(null!=r?r:0)),t.pad(4),t.writeInt32(n),t.writeInt64(BigInt(null!=e?e:0)),t.offset()}}const Fr=new Int32Array(2),Rr=new Float32Array(Fr.buffer),Br=new Float64Array(Fr.buffer),Lr=1===new Uint16Array(new Uint8Array([1,0]).buffer)[0];var Nr,Or,zr,Ur;!function(t){t[t.UTF8_BYTES=1]="UTF8_BYTES",t[t.UTF16_STRING=2]="UTF16_STRING"}(Nr||(Nr={}));class jr{constructor(t){this.bytes_=t,this.position_=0,this.text_decoder_=new TextDecoder}static allocate(t){return new jr(new Uint8Array(t))}clear(){this.position_=0}bytes(){return this.bytes_}position(){return this.position_}setPosition(t){this.position_=t}capacity(){return this.bytes_.length}readInt8(t){return this.readUint8(t)<<24>>24}readUint8(t){return this.bytes_[t]}readInt16(t){return this.readUint16(t)<<16>>16}readUint16(t){return this.bytes_[t]|this.bytes_[t+1]<<8}readInt32(t){return this.bytes_[t]|this.bytes_[t+1]<<8|this.bytes_[t+2]<<16|this.bytes_[t+3]<<24}readUint32(t){return this.readInt32(t)>>>0}readInt64(t){return BigInt.asIntN(64,BigInt(this.readUint32(t))+(BigInt(this.readUint32(t+4))<<BigInt(32)))}readUint64(t){return BigInt.asUintN(64,BigInt(this.readUint32(t))+(BigInt(this.readUint32(t+4))<<BigInt(32)))}readFloat32(t){return Fr[0]=this.readInt32(t),Rr[0]}readFloat64(t){return Fr[Lr?0:1]=this.readInt32(t),Fr[Lr?1:0]=this.readInt32(t+4),Br[0]}writeInt8(t,e){this.bytes_[t]=e}writeUint8(t,e){this.bytes_[t]=e}writeInt16(t,e){this.bytes_[t]=e,this.bytes_[t+1]=e>>8}writeUint16(t,e){this.bytes_[t]=e,this.bytes_[t+1]=e>>8}writeInt32(t,e){this.bytes_[t]=e,this.bytes_[t+1]=e>>8,this.bytes_[t+2]=e>>16,this.bytes_[t+3]=e>>24}writeUint32(t,e){this.bytes_[t]=e,this.bytes_[t+1]=e>>8,this.bytes_[t+2]=e>>16,this.bytes_[t+3]=e>>24}writeInt64(t,e){this.writeInt32(t,Number(BigInt.asIntN(32,e))),this.writeInt32(t+4,Number(BigInt.asIntN(32,e>>BigInt(32))))}writeUint64(t,e){this.writeUint32(t,Number(BigInt.asUintN(32,e))),this.writeUint32(t+4,Number(BigInt.asUintN(32,e>>BigInt(32))))}writeFloat32(t,e){Rr[0]=e,this.writeInt32(t,Fr[0])}writeFloat64(t,e){Br[0]=e,this.writeInt32(t,Fr[Lr?0:1]),this.writeInt32(t+4,Fr[Lr?1:0])}getBufferIdentifier(){if(this.bytes_.length<this.position_+4+4)throw new Error("FlatBuffers: ByteBuffer is too short to contain an identifier.");let t="";for(let e=0;e<4;e++)t+=String.fromCharCode(this.readInt8(this.position_+4+e));return t}__offset(t,e){const n=t-this.readInt32(t);return e<this.readInt16(n)?this.readInt16(n+e):0}__union(t,e){return t.bb_pos=e+this.readInt32(e),t.bb=this,t}__string(t,e){t+=this.readInt32(t);const n=this.readInt32(t);t+=4;const r=this.bytes_.subarray(t,t+n);return e===Nr.UTF8_BYTES?r:this.text_decoder_.decode(r)}__union_with_string(t,e){return"string"==typeof t?this.__string(e):this.__union(t,e)}__indirect(t){return t+this.readInt32(t)}__vector(t){return t+this.readInt32(t)+4}__vector_len(t){return this.readInt32(t+this.readInt32(t))}__has_identifier(t){if(4!=t.length)throw new Error("FlatBuffers: file identifier must be length 4");for(let e=0;e<4;e++)if(t.charCodeAt(e)!=this.readInt8(this.position()+4+e))return!1;return!0}createScalarList(t,e){const n=[];for(let r=0;r<e;++r){const e=t(r);null!==e&&n.push(e)}return n}createObjList(t,e){const n=[];for(let r=0;r<e;++r){const e=t(r);null!==e&&n.push(e.unpack())}return n}}class Vr{constructor(t){let e;this.minalign=1,this.vtable=null,this.vtable_in_use=0,this.isNested=!1,this.object_start=0,this.vtables=[],this.vector_num_elems=0,this.force_defaults=!1,this.string_maps=null,this.text_encoder=new TextEncoder,e=t||1024,this.bb=jr.allocate(e),this.space=e}clear(){this.bb.clear(),this.space=this.bb.capacity(),this.minalign=1,this.vtable=null,this.vtable_in_use=0,this.isNested=!1,this.object_start=0,this.vtables=[],this.vector_num_elems=0,this.force_defaults=!1,this.string_maps=null}forceDefaults(t){this.force_defaults=t}dataBuffer(){return this.bb}asUint8Array(){return this.bb.bytes().subarray(this.bb.position(),this.bb.position()+this.offset())}prep(t,e){t>this.minalign&&(this.minalign=t);const n=1+~(this.bb.capacity()-this.space+e)&t-1;for(;this.space<n+t+e;){const t=this.bb.capacity();this.bb=Vr.growByteBuffer(this.bb),this.space+=this.bb.capacity()-t}this.pad(n)}pad(t){for(let e=0;e<t;e++)this.bb.writeInt8(--this.space,0)}writeInt8(t){this.bb.writeInt8(this.space-=1,t)}writeInt16(t){this.bb.writeInt16(this.space-=2,t)}writeInt32(t){this.bb.writeInt32(this.space-=4,t)}writeInt64(t){this.bb.writeInt64(this.space-=8,t)}writeFloat32(t){this.bb.writeFloat32(this.space-=4,t)}writeFloat64(t){this.bb.writeFloat64(this.space-=8,t)}addInt8(t){this.prep(1,0),this.writeInt8(t)}addInt16(t){this.prep(2,0),this.writeInt16(t)}addInt32(t){this.prep(4,0),this.writeInt32(t)}addInt64(t){this.prep(8,0),this.writeInt64(t)}addFloat32(t){this.prep(4,0),this.writeFloat32(t)}addFloat64(t){this.prep(8,0),this.writeFloat64(t)}addFieldInt8(t,e,n){(this.force_defaults||e!=n)&&(this.addInt8(e),this.slot(t))}addFieldInt16(t,e,n){(this.force_defaults||e!=n)&&(this.addInt16(e),this.slot(t))}addFieldInt32(t,e,n){(this.force_defaults||e!=n)&&(this.addInt32(e),this.slot(t))}addFieldInt64(t,e,n){(this.force_defaults||e!==n)&&(this.addInt64(e),this.slot(t))}addFieldFloat32(t,e,n){(this.force_defaults||e!=n)&&(this.addFloat32(e),this.slot(t))}addFieldFloat64(t,e,n){(this.force_defaults||e!=n)&&(this.addFloat64(e),this.slot(t))}addFieldOffset(t,e,n){(this.force_defaults||e!=n)&&(this.addOffset(e),this.slot(t))}addFieldStruct(t,e,n){e!=n&&(this.nested(e),this.slot(t))}nested(t){if(t!=this.offset())throw new TypeError("FlatBuffers: struct must be serialized inline.")}notNested(){if(this.isNested)throw new TypeError("FlatBuffers: object serialization must not be nested.")}slot(t){null!==this.vtable&&(this.vtable[t]=this.offset())}offset(){return this.bb.capacity()-this.space}static growByteBuffer(t){const e=t.capacity();if(3221225472&e)throw new Error("FlatBuffers: cannot grow buffer beyond 2 gigabytes.");const n=e<<1,r=jr.allocate(n);return r.setPosition(n-e),r.bytes().set(t.bytes(),n-e),r}addOffset(t){this.prep(4,0),this.writeInt32(this.offset()-t+4)}startObject(t){this.notNested(),null==this.vtable&&(this.vtable=[]),this.vtable_in_use=t;for(let e=0;e<t;e++)this.vtable[e]=0;this.isNested=!0,this.object_start=this.offset()}endObject(){if(null==this.vtable||!this.isNested)throw new Error("FlatBuffers: endObject called without startObject");this.addInt32(0);const t=this.offset();let e=this.vtable_in_use-1;for(;e>=0&&0==this.vtable[e];e--);const n=e+1;for(;e>=0;e--)this.addInt16(0!=this.vtable[e]?t-this.vtable[e]:0);this.addInt16(t-this.object_start);const r=2*(n+2);this.addInt16(r);let i=0;const o=this.space;t:for(e=0;e<this.vtables.length;e++){const t=this.bb.capacity()-this.vtables[e];if(r==this.bb.readInt16(t)){for(let e=2;e<r;e+=2)if(this.bb.readInt16(o+e)!=this.bb.readInt16(t+e))continue t;i=this.vtables[e];break}}return i?(this.space=this.bb.capacity()-t,this.bb.writeInt32(this.space,i-t)):(this.vtables.push(this.offset()),this.bb.writeInt32(this.bb.capacity()-t,this.offset()-t)),this.isNested=!1,t}finish(t,e,n){const r=n?4:0;if(e){const t=e;if(this.prep(this.minalign,8+r),4!=t.length)throw new TypeError("FlatBuffers: file identifier must be length 4");for(let e=3;e>=0;e--)this.writeInt8(t.charCodeAt(e))}this.prep(this.minalign,4+r),this.addOffset(t),r&&this.addInt32(this.bb.capacity()-this.space),this.bb.setPosition(this.space)}finishSizePrefixed(t,e){this.finish(t,e,!0)}requiredField(t,e){const n=this.bb.capacity()-t,r=n-this.bb.readInt32(n);if(!(e<this.bb.readInt16(r)&&0!=this.bb.readInt16(r+e)))throw new TypeError("FlatBuffers: field "+e+" must be set")}startVector(t,e,n){this.notNested(),this.vector_num_elems=e,this.prep(4,t*e),this.prep(n,t*e)}endVector(){return this.writeInt32(this.vector_num_elems),this.offset()}createSharedString(t){if(!t)return 0;if(this.string_maps||(this.string_maps=new Map),this.string_maps.has(t))return this.string_maps.get(t);const e=this.createString(t);return this.string_maps.set(t,e),e}createString(t){if(null==t)return 0;let e;return e=t instanceof Uint8Array?t:this.text_encoder.encode(t),this.addInt8(0),this.startVector(1,e.length,1),this.bb.setPosition(this.space-=e.length),this.bb.bytes().set(e,this.space),this.endVector()}createByteVector(t){return null==t?0:(this.startVector(1,t.length,1),this.bb.setPosition(this.space-=t.length),this.bb.bytes().set(t,this.space),this.endVector())}createObjectOffset(t){return null===t?0:"string"==typeof t?this.createString(t):t.pack(this)}createObjectOffsetList(t){const e=[];for(let n=0;n<t.length;++n){const r=t[n];if(null===r)throw new TypeError("FlatBuffers: Argument for createObjectOffsetList cannot contain null.");e.push(this.createObjectOffset(r))}return e}createStructOffsetList(t,e){return e(this,t.length),this.createObjectOffsetList(t.slice().reverse()),this.endVector()}}class $r{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsKeyValue(t,e){return(e||new $r).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsKeyValue(t,e){return t.setPosition(t.position()+4),(e||new $r).__init(t.readInt32(t.position())+t.position(),t)}key(t){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.__string(this.bb_pos+e,t):null}value(t){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.__string(this.bb_pos+e,t):null}static startKeyValue(t){t.startObject(2)}static addKey(t,e){t.addFieldOffset(0,e,0)}static addValue(t,e){t.addFieldOffset(1,e,0)}static endKeyValue(t){return t.endObject()}static createKeyValue(t,e,n){return $r.startKeyValue(t),$r.addKey(t,e),$r.addValue(t,n),$r.endKeyValue(t)}}!function(t){t[t.Little=0]="Little",t[t.Big=1]="Big"}(Or||(Or={})),function(t){t[t.DenseArray=0]="DenseArray"}(zr||(zr={}));class Wr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsInt(t,e){return(e||new Wr).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsInt(t,e){return t.setPosition(t.position()+4),(e||new Wr).__init(t.readInt32(t.position())+t.position(),t)}bitWidth(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt32(this.bb_pos+t):0}isSigned(){const t=this.bb.__offset(this.bb_pos,6);return!!t&&!!this.bb.readInt8(this.bb_pos+t)}static startInt(t){t.startObject(2)}static addBitWidth(t,e){t.addFieldInt32(0,e,0)}static addIsSigned(t,e){t.addFieldInt8(1,+e,0)}static endInt(t){return t.endObject()}static createInt(t,e,n){return Wr.startInt(t),Wr.addBitWidth(t,e),Wr.addIsSigned(t,n),Wr.endInt(t)}}class Gr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsDictionaryEncoding(t,e){return(e||new Gr).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsDictionaryEncoding(t,e){return t.setPosition(t.position()+4),(e||new Gr).__init(t.readInt32(t.position())+t.position(),t)}id(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt64(this.bb_pos+t):BigInt("0")}indexType(t){const e=this.bb.__offset(this.bb_pos,6);return e?(t||new Wr).__init(this.bb.__indirect(this.bb_pos+e),this.bb):null}isOrdered(){const t=this.bb.__offset(this.bb_pos,8);return!!t&&!!this.bb.readInt8(this.bb_pos+t)}dictionaryKind(){const t=this.bb.__offset(this.bb_pos,10);return t?this.bb.readInt16(this.bb_pos+t):zr.DenseArray}static startDictionaryEncoding(t){t.startObject(4)}static addId(t,e){t.addFieldInt64(0,e,BigInt("0"))}static addIndexType(t,e){t.addFieldOffset(1,e,0)}static addIsOrdered(t,e){t.addFieldInt8(2,+e,0)}static addDictionaryKind(t,e){t.addFieldInt16(3,e,zr.DenseArray)}static endDictionaryEncoding(t){return t.endObject()}}!function(t){t[t.NONE=0]="NONE",t[t.Null=1]="Null",t[t.Int=2]="Int",t[t.FloatingPoint=3]="FloatingPoint",t[t.Binary=4]="Binary",t[t.Utf8=5]="Utf8",t[t.Bool=6]="Bool",t[t.Decimal=7]="Decimal",t[t.Date=8]="Date",t[t.Time=9]="Time",t[t.Timestamp=10]="Timestamp",t[t.Interval=11]="Interval",t[t.List=12]="List",t[t.Struct_=13]="Struct_",t[t.Union=14]="Union",t[t.FixedSizeBinary=15]="FixedSizeBinary",t[t.FixedSizeList=16]="FixedSizeList",t[t.Map=17]="Map",t[t.Duration=18]="Duration",t[t.LargeBinary=19]="LargeBinary",t[t.LargeUtf8=20]="LargeUtf8",t[t.LargeList=21]="LargeList",t[t.RunEndEncoded=22]="RunEndEncoded"}(Ur||(Ur={}));class Hr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsField(t,e){return(e||new Hr).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsField(t,e){return t.setPosition(t.position()+4),(e||new Hr).__init(t.readInt32(t.position())+t.position(),t)}name(t){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.__string(this.bb_pos+e,t):null}nullable(){const t=this.bb.__offset(this.bb_pos,6);return!!t&&!!this.bb.readInt8(this.bb_pos+t)}typeType(){const t=this.bb.__offset(this.bb_pos,8);return t?this.bb.readUint8(this.bb_pos+t):Ur.NONE}type(t){const e=this.bb.__offset(this.bb_pos,10);return e?this.bb.__union(t,this.bb_pos+e):null}dictionary(t){const e=this.bb.__offset(this.bb_pos,12);return e?(t||new Gr).__init(this.bb.__indirect(this.bb_pos+e),this.bb):null}children(t,e){const n=this.bb.__offset(this.bb_pos,14);return n?(e||new Hr).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*t),this.bb):null}childrenLength(){const t=this.bb.__offset(this.bb_pos,14);return t?this.bb.__vector_len(this.bb_pos+t):0}customMetadata(t,e){const n=this.bb.__offset(this.bb_pos,16);return n?(e||new $r).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*t),this.bb):null}customMetadataLength(){const t=this.bb.__offset(this.bb_pos,16);return t?this.bb.__vector_len(this.bb_pos+t):0}static startField(t){t.startObject(7)}static addName(t,e){t.addFieldOffset(0,e,0)}static addNullable(t,e){t.addFieldInt8(1,+e,0)}static addTypeType(t,e){t.addFieldInt8(2,e,Ur.NONE)}static addType(t,e){t.addFieldOffset(3,e,0)}static addDictionary(t,e){t.addFieldOffset(4,e,0)}static addChildren(t,e){t.addFieldOffset(5,e,0)}static createChildrenVector(t,e){t.startVector(4,e.length,4);for(let n=e.length-1;n>=0;n--)t.addOffset(e[n]);return t.endVector()}static startChildrenVector(t,e){t.startVector(4,e,4)}static addCustomMetadata(t,e){t.addFieldOffset(6,e,0)}static createCustomMetadataVector(t,e){t.startVector(4,e.length,4);for(let n=e.length-1;n>=0;n--)t.addOffset(e[n]);return t.endVector()}static startCustomMetadataVector(t,e){t.startVector(4,e,4)}static endField(t){return t.endObject()}}class Yr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsSchema(t,e){return(e||new Yr).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsSchema(t,e){return t.setPosition(t.position()+4),(e||new Yr).__init(t.readInt32(t.position())+t.position(),t)}endianness(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):Or.Little}fields(t,e){const n=this.bb.__offset(this.bb_pos,6);return n?(e||new Hr).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*t),this.bb):null}fieldsLength(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.__vector_len(this.bb_pos+t):0}customMetadata(t,e){const n=this.bb.__offset(this.bb_pos,8);return n?(e||new $r).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*t),this.bb):null}customMetadataLength(){const t=this.bb.__offset(this.bb_pos,8);return t?this.bb.__vector_len(this.bb_pos+t):0}features(t){const e=this.bb.__offset(this.bb_pos,10);return e?this.bb.readInt64(this.bb.__vector(this.bb_pos+e)+8*t):BigInt(0)}featuresLength(){const t=this.bb.__offset(this.bb_pos,10);return t?this.bb.__vector_len(this.bb_pos+t):0}static startSchema(t){t.startObject(4)}static addEndianness(t,e){t.addFieldInt16(0,e,Or.Little)}static addFields(t,e){t.addFieldOffset(1,e,0)}static createFieldsVector(t,e){t.startVector(4,e.length,4);for(let n=e.length-1;n>=0;n--)t.addOffset(e[n]);return t.endVector()}static startFieldsVector(t,e){t.startVector(4,e,4)}static addCustomMetadata(t,e){t.addFieldOffset(2,e,0)}static createCustomMetadataVector(t,e){t.startVector(4,e.length,4);for(let n=e.length-1;n>=0;n--)t.addOffset(e[n]);return t.endVector()}static startCustomMetadataVector(t,e){t.startVector(4,e,4)}static addFeatures(t,e){t.addFieldOffset(3,e,0)}static createFeaturesVector(t,e){t.startVector(8,e.length,8);for(let n=e.length-1;n>=0;n--)t.addInt64(e[n]);return t.endVector()}static startFeaturesVector(t,e){t.startVector(8,e,8)}static endSchema(t){return t.endObject()}static finishSchemaBuffer(t,e){t.finish(e)}static finishSizePrefixedSchemaBuffer(t,e){t.finish(e,void 0,!0)}static createSchema(t,e,n,r,i){return Yr.startSchema(t),Yr.addEndianness(t,e),Yr.addFields(t,n),Yr.addCustomMetadata(t,r),Yr.addFeatures(t,i),Yr.endSchema(t)}}class qr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsFooter(t,e){return(e||new qr).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsFooter(t,e){return t.setPosition(t.position()+4),(e||new qr).__init(t.readInt32(t.position())+t.position(),t)}version(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):ir.V1}schema(t){const e=this.bb.__offset(this.bb_pos,6);return e?(t||new Yr).__init(this.bb.__indirect(this.bb_pos+e),this.bb):null}dictionaries(t,e){const n=this.bb.__offset(this.bb_pos,8);return n?(e||new Dr).__init(this.bb.__vector(this.bb_pos+n)+24*t,this.bb):null}dictionariesLength(){const t=this.bb.__offset(this.bb_pos,8);return t?this.bb.__vector_len(this.bb_pos+t):0}recordBatches(t,e){const n=this.bb.__offset(this.bb_pos,10);return n?(e||new Dr).__init(this.bb.__vector(this.bb_pos+n)+24*t,this.bb):null}recordBatchesLength(){const t=this.bb.__offset(this.bb_pos,10);return t?this.bb.__vector_len(this.bb_pos+t):0}customMetadata(t,e){const n=this.bb.__offset(this.bb_pos,12);return n?(e||new $r).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*t),this.bb):null}customMetadataLength(){const t=this.bb.__offset(this.bb_pos,12);return t?this.bb.__vector_len(this.bb_pos+t):0}static startFooter(t){t.startObject(5)}static addVersion(t,e){t.addFieldInt16(0,e,ir.V1)}static addSchema(t,e){t.addFieldOffset(1,e,0)}static addDictionaries(t,e){t.addFieldOffset(2,e,0)}static startDictionariesVector(t,e){t.startVector(24,e,8)}static addRecordBatches(t,e){t.addFieldOffset(3,e,0)}static startRecordBatchesVector(t,e){t.startVector(24,e,8)}static addCustomMetadata(t,e){t.addFieldOffset(4,e,0)}static createCustomMetadataVector(t,e){t.startVector(4,e.length,4);for(let n=e.length-1;n>=0;n--)t.addOffset(e[n]);return t.endVector()}static startCustomMetadataVector(t,e){t.startVector(4,e,4)}static endFooter(t){return t.endObject()}static finishFooterBuffer(t,e){t.finish(e)}static finishSizePrefixedFooterBuffer(t,e){t.finish(e,void 0,!0)}}var Kr=Vr,Xr=jr;class Qr{static decode(t){t=new Xr(O(t));const e=qr.getRootAsFooter(t),n=or.decode(e.schema(),new Map,e.version());return new Zr(n,e)}static encode(t){const e=new Kr,n=or.encode(e,t.schema);qr.startRecordBatchesVector(e,t.numRecordBatches);for(const n of[...t.recordBatches()].slice().reverse())Jr.encode(e,n);const r=e.endVector();qr.startDictionariesVector(e,t.numDictionaries);for(const n of[...t.dictionaryBatches()].slice().reverse())Jr.encode(e,n);const i=e.endVector();return qr.startFooter(e),qr.addSchema(e,n),qr.addVersion(e,ir.V5),qr.addRecordBatches(e,r),qr.addDictionaries(e,i),qr.finishFooterBuffer(e,qr.endFooter(e)),e.asUint8Array()}get numRecordBatches(){return this._recordBatches.length}get numDictionaries(){return this._dictionaryBatches.length}constructor(t,e=ir.V5,n,r){this.schema=t,this.version=e,n&&(this._recordBatches=n),r&&(this._dictionaryBatches=r)}*recordBatches(){for(let t,e=-1,n=this.numRecordBatches;++e<n;)(t=this.getRecordBatch(e))&&(yield t)}*dictionaryBatches(){for(let t,e=-1,n=this.numDictionaries;++e<n;)(t=this.getDictionaryBatch(e))&&(yield t)}getRecordBatch(t){return t>=0&&t<this.numRecordBatches&&this._recordBatches[t]||null}getDictionaryBatch(t){return t>=0&&t<this.numDictionaries&&this._dictionaryBatches[t]||null}}class Zr extends Qr{get numRecordBatches(){return this._footer.recordBatchesLength()}get numDictionaries(){return this._footer.dictionariesLength()}constructor(t,e){super(t,e.version()),this._footer=e}getRecordBatch(t){if(t>=0&&t<this.numRecordBatches){const e=this._footer.recordBatches(t);if(e)return Jr.decode(e)}return null}getDictionaryBatch(t){if(t>=0&&t<this.numDictionaries){const e=this._footer.dictionaries(t);if(e)return Jr.decode(e)}return null}}class Jr{static decode(t){return new Jr(t.metaDataLength(),t.bodyLength(),t.offset())}static encode(t,e){const{metaDataLength:n}=e,r=BigInt(e.offset),i=BigInt(e.bodyLength);return Dr.createBlock(t,r,n,i)}constructor(t,e,n){this.metaDataLength=t,this.offset=V(n),this.bodyLength=V(e)}}const ti={fromIterable:t=>ei(function*(t){let e,n,r,i,o=!1,a=[],s=0;({cmd:r,size:i}=(yield null)||{cmd:"read",size:0});const l=(c=t,function*(t,e){const n=function*(t){yield t},r="string"==typeof e||ArrayBuffer.isView(e)||e instanceof ArrayBuffer||e instanceof D?n(e):S(e)?e:n(e);return yield*z(function*(e){let n=null;do{n=e.next(yield B(t,n))}while(!n.done)}(r[Symbol.iterator]())),new t}(Uint8Array,c))[Symbol.iterator]();var c;try{do{if(({done:e,value:n}=Number.isNaN(i-s)?l.next():l.next(i-s)),!e&&n.byteLength>0&&(a.push(n),s+=n.byteLength),e||i<=s)do{({cmd:r,size:i}=yield"peek"===r?R(a,i)[0]:([n,a,s]=R(a,i),n))}while(i<s)}while(!e)}catch(t){(o=!0)&&"function"==typeof l.throw&&l.throw(t)}finally{!1===o&&"function"==typeof l.return&&l.return(null)}return null}(t)),fromAsyncIterable:t=>ei(function(t){return h(this,arguments,(function*(){let e,n,r,i,o=!1,a=[],s=0;({cmd:r,size:i}=(yield yield d(null))||{cmd:"read",size:0});const l=(c=t,U(Uint8Array,c))[Symbol.asyncIterator]();var c;try{do{if(({done:e,value:n}=Number.isNaN(i-s)?yield d(l.next()):yield d(l.next(i-s))),!e&&n.byteLength>0&&(a.push(n),s+=n.byteLength),e||i<=s)do{({cmd:r,size:i}=yield yield d("peek"===r?R(a,i)[0]:([n,a,s]=R(a,i),n)))}while(i<s)}while(!e)}catch(t){(o=!0)&&"function"==typeof l.throw&&(yield d(l.throw(t)))}finally{!1===o&&"function"==typeof l.return&&(yield d(l.return(new Uint8Array(0))))}return yield d(null)}))}(t)),fromDOMStream:t=>ei(function(t){return h(this,arguments,(function*(){let e,n,r,i=!1,o=!1,a=[],s=0;({cmd:n,size:r}=(yield yield d(null))||{cmd:"read",size:0});const l=new ni(t);try{do{if(({done:i,value:e}=Number.isNaN(r-s)?yield d(l.read()):yield d(l.read(r-s))),!i&&e.byteLength>0&&(a.push(O(e)),s+=e.byteLength),i||r<=s)do{({cmd:n,size:r}=yield yield d("peek"===n?R(a,r)[0]:([e,a,s]=R(a,r),e)))}while(r<s)}while(!i)}catch(t){(o=!0)&&(yield d(l.cancel(t)))}finally{!1===o?yield d(l.cancel()):t.locked&&l.releaseLock()}return yield d(null)}))}(t)),fromNodeStream:t=>ei(function(t){return h(this,arguments,(function*(){const e=[];let n,r,i,o="error",a=!1,s=null,l=0,c=[];if(({cmd:n,size:r}=(yield yield d(null))||{cmd:"read",size:0}),t.isTTY)return yield yield d(new Uint8Array(0)),yield d(null);try{e[0]=ri(t,"end"),e[1]=ri(t,"error");do{if(e[2]=ri(t,"readable"),[o,s]=yield d(Promise.race(e.map((t=>t[2])))),"error"===o)break;if((a="end"===o)||(Number.isFinite(r-l)?(i=O(t.read(r-l)),i.byteLength<r-l&&(i=O(t.read()))):i=O(t.read()),i.byteLength>0&&(c.push(i),l+=i.byteLength)),a||r<=l)do{({cmd:n,size:r}=yield yield d("peek"===n?R(c,r)[0]:([i,c,l]=R(c,r),i)))}while(r<l)}while(!a)}finally{yield d(function(e,n){return i=c=null,new Promise(((r,i)=>{for(const[n,r]of e)t.off(n,r);try{const e=t.destroy;e&&e.call(t,n),n=void 0}catch(t){n=t||n}finally{null!=n?i(n):r()}}))}(e,"error"===o?s:null))}return yield d(null)}))}(t)),toDOMStream(t,e){throw new Error('"toDOMStream" not available in this environment')},toNodeStream(t,e){throw new Error('"toNodeStream" not available in this environment')}},ei=t=>(t.next(),t);class ni{constructor(t){this.source=t,this.reader=null,this.reader=this.source.getReader(),this.reader.closed.catch((()=>{}))}get closed(){return this.reader?this.reader.closed.catch((()=>{})):Promise.resolve()}releaseLock(){this.reader&&this.reader.releaseLock(),this.reader=null}cancel(t){return u(this,void 0,void 0,(function*(){const{reader:e,source:n}=this;e&&(yield e.cancel(t).catch((()=>{}))),n&&n.locked&&this.releaseLock()}))}read(t){return u(this,void 0,void 0,(function*(){if(0===t)return{done:null==this.reader,value:new Uint8Array(0)};const e=yield this.reader.read();return!e.done&&(e.value=O(e)),e}))}}const ri=(t,e)=>{const n=t=>r([e,t]);let r;return[e,n,new Promise((i=>(r=i)&&t.once(e,n)))]},ii=Object.freeze({done:!0,value:void 0});class oi{constructor(t){this._json=t}get schema(){return this._json.schema}get batches(){return this._json.batches||[]}get dictionaries(){return this._json.dictionaries||[]}}class ai{tee(){return this._getDOMStream().tee()}pipe(t,e){return this._getNodeStream().pipe(t,e)}pipeTo(t,e){return this._getDOMStream().pipeTo(t,e)}pipeThrough(t,e){return this._getDOMStream().pipeThrough(t,e)}_getDOMStream(){return this._DOMStream||(this._DOMStream=this.toDOMStream())}_getNodeStream(){return this._nodeStream||(this._nodeStream=this.toNodeStream())}}class si extends ai{constructor(){super(),this._values=[],this.resolvers=[],this._closedPromise=new Promise((t=>this._closedPromiseResolve=t))}get closed(){return this._closedPromise}cancel(t){return u(this,void 0,void 0,(function*(){yield this.return(t)}))}write(t){this._ensureOpen()&&(this.resolvers.length<=0?this._values.push(t):this.resolvers.shift().resolve({done:!1,value:t}))}abort(t){this._closedPromiseResolve&&(this.resolvers.length<=0?this._error={error:t}:this.resolvers.shift().reject({done:!0,value:t}))}close(){if(this._closedPromiseResolve){const{resolvers:t}=this;for(;t.length>0;)t.shift().resolve(ii);this._closedPromiseResolve(),this._closedPromiseResolve=void 0}}[Symbol.asyncIterator](){return this}toDOMStream(t){return ti.toDOMStream(this._closedPromiseResolve||this._error?this:this._values,t)}toNodeStream(t){return ti.toNodeStream(this._closedPromiseResolve||this._error?this:this._values,t)}throw(t){return u(this,void 0,void 0,(function*(){return yield this.abort(t),ii}))}return(t){return u(this,void 0,void 0,(function*(){return yield this.close(),ii}))}read(t){return u(this,void 0,void 0,(function*(){return(yield this.next(t,"read")).value}))}peek(t){return u(this,void 0,void 0,(function*(){return(yield this.next(t,"peek")).value}))}next(...t){return this._values.length>0?Promise.resolve({done:!1,value:this._values.shift()}):this._error?Promise.reject({done:!0,value:this._error.error}):this._closedPromiseResolve?new Promise(((t,e)=>{this.resolvers.push({resolve:t,reject:e})})):Promise.resolve(ii)}_ensureOpen(){if(this._closedPromiseResolve)return!0;throw new Error("AsyncQueue is closed")}}class li extends si{write(t){if((t=O(t)).byteLength>0)return super.write(t)}toString(t=!1){return t?m(this.toUint8Array(!0)):this.toUint8Array(!1).then(m)}toUint8Array(t=!1){return t?R(this._values)[0]:(()=>u(this,void 0,void 0,(function*(){var t,e,n,r;const i=[];let o=0;try{for(var a,s=!0,l=p(this);!(t=(a=yield l.next()).done);s=!0){r=a.value,s=!1;const t=r;i.push(t),o+=t.byteLength}}catch(t){e={error:t}}finally{try{s||t||!(n=l.return)||(yield n.call(l))}finally{if(e)throw e.error}}return R(i,o)[0]})))()}}class ci{constructor(t){t&&(this.source=new di(ti.fromIterable(t)))}[Symbol.iterator](){return this}next(t){return this.source.next(t)}throw(t){return this.source.throw(t)}return(t){return this.source.return(t)}peek(t){return this.source.peek(t)}read(t){return this.source.read(t)}}class ui{constructor(t){t instanceof ui?this.source=t.source:t instanceof li?this.source=new hi(ti.fromAsyncIterable(t)):M(t)?this.source=new hi(ti.fromNodeStream(t)):A(t)?this.source=new hi(ti.fromDOMStream(t)):P(t)?this.source=new hi(ti.fromDOMStream(t.body)):S(t)?this.source=new hi(ti.fromIterable(t)):(x(t)||k(t))&&(this.source=new hi(ti.fromAsyncIterable(t)))}[Symbol.asyncIterator](){return this}next(t){return this.source.next(t)}throw(t){return this.source.throw(t)}return(t){return this.source.return(t)}get closed(){return this.source.closed}cancel(t){return this.source.cancel(t)}peek(t){return this.source.peek(t)}read(t){return this.source.read(t)}}class di{constructor(t){this.source=t}cancel(t){this.return(t)}peek(t){return this.next(t,"peek").value}read(t){return this.next(t,"read").value}next(t,e="read"){return this.source.next({cmd:e,size:t})}throw(t){return Object.create(this.source.throw&&this.source.throw(t)||ii)}return(t){return Object.create(this.source.return&&this.source.return(t)||ii)}}class hi{constructor(t){this.source=t,this._closedPromise=new Promise((t=>this._closedPromiseResolve=t))}cancel(t){return u(this,void 0,void 0,(function*(){yield this.return(t)}))}get closed(){return this._closedPromise}read(t){return u(this,void 0,void 0,(function*(){return(yield this.next(t,"read")).value}))}peek(t){return u(this,void 0,void 0,(function*(){return(yield this.next(t,"peek")).value}))}next(t){return u(this,arguments,void 0,(function*(t,e="read"){return yield this.source.next({cmd:e,size:t})}))}throw(t){return u(this,void 0,void 0,(function*(){const e=this.source.throw&&(yield this.source.throw(t))||ii;return this._closedPromiseResolve&&this._closedPromiseResolve(),this._closedPromiseResolve=void 0,Object.create(e)}))}return(t){return u(this,void 0,void 0,(function*(){const e=this.source.return&&(yield this.source.return(t))||ii;return this._closedPromiseResolve&&this._closedPromiseResolve(),this._closedPromiseResolve=void 0,Object.create(e)}))}}class fi extends ci{constructor(t,e){super(),this.position=0,this.buffer=O(t),this.size=void 0===e?this.buffer.byteLength:e}readInt32(t){const{buffer:e,byteOffset:n}=this.readAt(t,4);return new DataView(e,n).getInt32(0,!0)}seek(t){return this.position=Math.min(t,this.size),t<this.size}read(t){const{buffer:e,size:n,position:r}=this;return e&&r<n?("number"!=typeof t&&(t=Number.POSITIVE_INFINITY),this.position=Math.min(n,r+Math.min(n-r,t)),e.subarray(r,this.position)):null}readAt(t,e){const n=this.buffer,r=Math.min(this.size,t+e);return n?n.subarray(t,r):new Uint8Array(e)}close(){this.buffer&&(this.buffer=null)}throw(t){return this.close(),{done:!0,value:t}}return(t){return this.close(),{done:!0,value:t}}}class pi extends ui{constructor(t,e){super(),this.position=0,this._handle=t,"number"==typeof e?this.size=e:this._pending=(()=>u(this,void 0,void 0,(function*(){this.size=(yield t.stat()).size,delete this._pending})))()}readInt32(t){return u(this,void 0,void 0,(function*(){const{buffer:e,byteOffset:n}=yield this.readAt(t,4);return new DataView(e,n).getInt32(0,!0)}))}seek(t){return u(this,void 0,void 0,(function*(){return this._pending&&(yield this._pending),this.position=Math.min(t,this.size),t<this.size}))}read(t){return u(this,void 0,void 0,(function*(){this._pending&&(yield this._pending);const{_handle:e,size:n,position:r}=this;if(e&&r<n){"number"!=typeof t&&(t=Number.POSITIVE_INFINITY);let i=r,o=0,a=0;const s=Math.min(n,i+Math.min(n-i,t)),l=new Uint8Array(Math.max(0,(this.position=s)-i));for(;(i+=a)<s&&(o+=a)<l.byteLength;)({bytesRead:a}=yield e.read(l,o,l.byteLength-o,i));return l}return null}))}readAt(t,e){return u(this,void 0,void 0,(function*(){this._pending&&(yield this._pending);const{_handle:n,size:r}=this;if(n&&t+e<r){const i=Math.min(r,t+e),o=new Uint8Array(i-t);return(yield n.read(o,0,e,t)).buffer}return new Uint8Array(e)}))}close(){return u(this,void 0,void 0,(function*(){const t=this._handle;this._handle=null,t&&(yield t.close())}))}throw(t){return u(this,void 0,void 0,(function*(){return yield this.close(),{done:!0,value:t}}))}return(t){return u(this,void 0,void 0,(function*(){return yield this.close(),{done:!0,value:t}}))}}function gi(t){return t<0&&(t=4294967295+t+1),`0x${t.toString(16)}`}const mi=[1,10,100,1e3,1e4,1e5,1e6,1e7,1e8];class yi{constructor(t){this.buffer=t}high(){return this.buffer[1]}low(){return this.buffer[0]}_times(t){const e=new Uint32Array([this.buffer[1]>>>16,65535&this.buffer[1],this.buffer[0]>>>16,65535&this.buffer[0]]),n=new Uint32Array([t.buffer[1]>>>16,65535&t.buffer[1],t.buffer[0]>>>16,65535&t.buffer[0]]);let r=e[3]*n[3];this.buffer[0]=65535&r;let i=r>>>16;return r=e[2]*n[3],i+=r,r=e[3]*n[2]>>>0,i+=r,this.buffer[0]+=i<<16,this.buffer[1]=i>>>0<r?65536:0,this.buffer[1]+=i>>>16,this.buffer[1]+=e[1]*n[3]+e[2]*n[2]+e[3]*n[1],this.buffer[1]+=e[0]*n[3]+e[1]*n[2]+e[2]*n[1]+e[3]*n[0]<<16,this}_plus(t){const e=this.buffer[0]+t.buffer[0]>>>0;this.buffer[1]+=t.buffer[1],e<this.buffer[0]>>>0&&++this.buffer[1],this.buffer[0]=e}lessThan(t){return this.buffer[1]<t.buffer[1]||this.buffer[1]===t.buffer[1]&&this.buffer[0]<t.buffer[0]}equals(t){return this.buffer[1]===t.buffer[1]&&this.buffer[0]==t.buffer[0]}greaterThan(t){return t.lessThan(this)}hex(){return`${gi(this.buffer[1])} ${gi(this.buffer[0])}`}}class bi extends yi{times(t){return this._times(t),this}plus(t){return this._plus(t),this}static from(t,e=new Uint32Array(2)){return bi.fromString("string"==typeof t?t:t.toString(),e)}static fromNumber(t,e=new Uint32Array(2)){return bi.fromString(t.toString(),e)}static fromString(t,e=new Uint32Array(2)){const n=t.length,r=new bi(e);for(let e=0;e<n;){const i=8<n-e?8:n-e,o=new bi(new Uint32Array([Number.parseInt(t.slice(e,e+i),10),0])),a=new bi(new Uint32Array([mi[i],0]));r.times(a),r.plus(o),e+=i}return r}static convertArray(t){const e=new Uint32Array(2*t.length);for(let n=-1,r=t.length;++n<r;)bi.from(t[n],new Uint32Array(e.buffer,e.byteOffset+2*n*4,2));return e}static multiply(t,e){return new bi(new Uint32Array(t.buffer)).times(e)}static add(t,e){return new bi(new Uint32Array(t.buffer)).plus(e)}}class vi extends yi{negate(){return this.buffer[0]=1+~this.buffer[0],this.buffer[1]=~this.buffer[1],0==this.buffer[0]&&++this.buffer[1],this}times(t){return this._times(t),this}plus(t){return this._plus(t),this}lessThan(t){const e=0|this.buffer[1],n=0|t.buffer[1];return e<n||e===n&&this.buffer[0]<t.buffer[0]}static from(t,e=new Uint32Array(2)){return vi.fromString("string"==typeof t?t:t.toString(),e)}static fromNumber(t,e=new Uint32Array(2)){return vi.fromString(t.toString(),e)}static fromString(t,e=new Uint32Array(2)){const n=t.startsWith("-"),r=t.length,i=new vi(e);for(let e=n?1:0;e<r;){const n=8<r-e?8:r-e,o=new vi(new Uint32Array([Number.parseInt(t.slice(e,e+n),10),0])),a=new vi(new Uint32Array([mi[n],0]));i.times(a),i.plus(o),e+=n}return n?i.negate():i}static convertArray(t){const e=new Uint32Array(2*t.length);for(let n=-1,r=t.length;++n<r;)vi.from(t[n],new Uint32Array(e.buffer,e.byteOffset+2*n*4,2));return e}static multiply(t,e){return new vi(new Uint32Array(t.buffer)).times(e)}static add(t,e){return new vi(new Uint32Array(t.buffer)).plus(e)}}class _i{constructor(t){this.buffer=t}high(){return new vi(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset+8,2))}low(){return new vi(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset,2))}negate(){return this.buffer[0]=1+~this.buffer[0],this.buffer[1]=~this.buffer[1],this.buffer[2]=~this.buffer[2],this.buffer[3]=~this.buffer[3],0==this.buffer[0]&&++this.buffer[1],0==this.buffer[1]&&++this.buffer[2],0==this.buffer[2]&&++this.buffer[3],this}times(t){const e=new bi(new Uint32Array([this.buffer[3],0])),n=new bi(new Uint32Array([this.buffer[2],0])),r=new bi(new Uint32Array([this.buffer[1],0])),i=new bi(new Uint32Array([this.buffer[0],0])),o=new bi(new Uint32Array([t.buffer[3],0])),a=new bi(new Uint32Array([t.buffer[2],0])),s=new bi(new Uint32Array([t.buffer[1],0])),l=new bi(new Uint32Array([t.buffer[0],0]));let c=bi.multiply(i,l);this.buffer[0]=c.low();const u=new bi(new Uint32Array([c.high(),0]));return c=bi.multiply(r,l),u.plus(c),c=bi.multiply(i,s),u.plus(c),this.buffer[1]=u.low(),this.buffer[3]=u.lessThan(c)?1:0,this.buffer[2]=u.high(),new bi(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset+8,2)).plus(bi.multiply(n,l)).plus(bi.multiply(r,s)).plus(bi.multiply(i,a)),this.buffer[3]+=bi.multiply(e,l).plus(bi.multiply(n,s)).plus(bi.multiply(r,a)).plus(bi.multiply(i,o)).low(),this}plus(t){const e=new Uint32Array(4);return e[3]=this.buffer[3]+t.buffer[3]>>>0,e[2]=this.buffer[2]+t.buffer[2]>>>0,e[1]=this.buffer[1]+t.buffer[1]>>>0,e[0]=this.buffer[0]+t.buffer[0]>>>0,e[0]<this.buffer[0]>>>0&&++e[1],e[1]<this.buffer[1]>>>0&&++e[2],e[2]<this.buffer[2]>>>0&&++e[3],this.buffer[3]=e[3],this.buffer[2]=e[2],this.buffer[1]=e[1],this.buffer[0]=e[0],this}hex(){return`${gi(this.buffer[3])} ${gi(this.buffer[2])} ${gi(this.buffer[1])} ${gi(this.buffer[0])}`}static multiply(t,e){return new _i(new Uint32Array(t.buffer)).times(e)}static add(t,e){return new _i(new Uint32Array(t.buffer)).plus(e)}static from(t,e=new Uint32Array(4)){return _i.fromString("string"==typeof t?t:t.toString(),e)}static fromNumber(t,e=new Uint32Array(4)){return _i.fromString(t.toString(),e)}static fromString(t,e=new Uint32Array(4)){const n=t.startsWith("-"),r=t.length,i=new _i(e);for(let e=n?1:0;e<r;){const n=8<r-e?8:r-e,o=new _i(new Uint32Array([Number.parseInt(t.slice(e,e+n),10),0,0,0])),a=new _i(new Uint32Array([mi[n],0,0,0]));i.times(a),i.plus(o),e+=n}return n?i.negate():i}static convertArray(t){const e=new Uint32Array(4*t.length);for(let n=-1,r=t.length;++n<r;)_i.from(t[n],new Uint32Array(e.buffer,e.byteOffset+16*n,4));return e}}class wi extends te{constructor(t,e,n,r,i=ir.V5){super(),this.nodesIndex=-1,this.buffersIndex=-1,this.bytes=t,this.nodes=e,this.buffers=n,this.dictionaries=r,this.metadataVersion=i}visit(t){return super.visit(t instanceof ar?t.type:t)}visitNull(t,{length:e}=this.nextFieldNode()){return rr({type:t,length:e})}visitBool(t,{length:e,nullCount:n}=this.nextFieldNode()){return rr({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),data:this.readData(t)})}visitInt(t,{length:e,nullCount:n}=this.nextFieldNode()){return rr({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),data:this.readData(t)})}visitFloat(t,{length:e,nullCount:n}=this.nextFieldNode()){return rr({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),data:this.readData(t)})}visitUtf8(t,{length:e,nullCount:n}=this.nextFieldNode()){return rr({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),valueOffsets:this.readOffsets(t),data:this.readData(t)})}visitLargeUtf8(t,{length:e,nullCount:n}=this.nextFieldNode()){return rr({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),valueOffsets:this.readOffsets(t),data:this.readData(t)})}visitBinary(t,{length:e,nullCount:n}=this.nextFieldNode()){return rr({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),valueOffsets:this.readOffsets(t),data:this.readData(t)})}visitLargeBinary(t,{length:e,nullCount:n}=this.nextFieldNode()){return rr({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),valueOffsets:this.readOffsets(t),data:this.readData(t)})}visitFixedSizeBinary(t,{length:e,nullCount:n}=this.nextFieldNode()){return rr({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),data:this.readData(t)})}visitDate(t,{length:e,nullCount:n}=this.nextFieldNode()){return rr({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),data:this.readData(t)})}visitTimestamp(t,{length:e,nullCount:n}=this.nextFieldNode()){return rr({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),data:this.readData(t)})}visitTime(t,{length:e,nullCount:n}=this.nextFieldNode()){return rr({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),data:this.readData(t)})}visitDecimal(t,{length:e,nullCount:n}=this.nextFieldNode()){return rr({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),data:this.readData(t)})}visitList(t,{length:e,nullCount:n}=this.nextFieldNode()){return rr({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),valueOffsets:this.readOffsets(t),child:this.visit(t.children[0])})}visitStruct(t,{length:e,nullCount:n}=this.nextFieldNode()){return rr({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),children:this.visitMany(t.children)})}visitUnion(t,{length:e,nullCount:n}=this.nextFieldNode()){return this.metadataVersion<ir.V5&&this.readNullBitmap(t,n),t.mode===it.Sparse?this.visitSparseUnion(t,{length:e,nullCount:n}):this.visitDenseUnion(t,{length:e,nullCount:n})}visitDenseUnion(t,{length:e,nullCount:n}=this.nextFieldNode()){return rr({type:t,length:e,nullCount:n,typeIds:this.readTypeIds(t),valueOffsets:this.readOffsets(t),children:this.visitMany(t.children)})}visitSparseUnion(t,{length:e,nullCount:n}=this.nextFieldNode()){return rr({type:t,length:e,nullCount:n,typeIds:this.readTypeIds(t),children:this.visitMany(t.children)})}visitDictionary(t,{length:e,nullCount:n}=this.nextFieldNode()){return rr({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),data:this.readData(t.indices),dictionary:this.readDictionary(t)})}visitInterval(t,{length:e,nullCount:n}=this.nextFieldNode()){return rr({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),data:this.readData(t)})}visitDuration(t,{length:e,nullCount:n}=this.nextFieldNode()){return rr({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),data:this.readData(t)})}visitFixedSizeList(t,{length:e,nullCount:n}=this.nextFieldNode()){return rr({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),child:this.visit(t.children[0])})}visitMap(t,{length:e,nullCount:n}=this.nextFieldNode()){return rr({type:t,length:e,nullCount:n,nullBitmap:this.readNullBitmap(t,n),valueOffsets:this.readOffsets(t),child:this.visit(t.children[0])})}nextFieldNode(){return this.nodes[++this.nodesIndex]}nextBufferRange(){return this.buffers[++this.buffersIndex]}readNullBitmap(t,e,n=this.nextBufferRange()){return e>0&&this.readData(t,n)||new Uint8Array(0)}readOffsets(t,e){return this.readData(t,e)}readTypeIds(t,e){return this.readData(t,e)}readData(t,{length:e,offset:n}=this.nextBufferRange()){return this.bytes.subarray(n,n+e)}readDictionary(t){return this.dictionaries.get(t.id)}}class xi extends wi{constructor(t,e,n,r,i){super(new Uint8Array(0),e,n,r,i),this.sources=t}readNullBitmap(t,e,{offset:n}=this.nextBufferRange()){return e<=0?new Uint8Array(0):Nn(this.sources[n])}readOffsets(t,{offset:e}=this.nextBufferRange()){return B(Uint8Array,B(t.OffsetArrayType,this.sources[e]))}readTypeIds(t,{offset:e}=this.nextBufferRange()){return B(Uint8Array,B(t.ArrayType,this.sources[e]))}readData(t,{offset:e}=this.nextBufferRange()){const{sources:n}=this;return Pt.isTimestamp(t)||(Pt.isInt(t)||Pt.isTime(t))&&64===t.bitWidth||Pt.isDuration(t)||Pt.isDate(t)&&t.unit===nt.MILLISECOND?B(Uint8Array,vi.convertArray(n[e])):Pt.isDecimal(t)?B(Uint8Array,_i.convertArray(n[e])):Pt.isBinary(t)||Pt.isLargeBinary(t)||Pt.isFixedSizeBinary(t)?function(t){const e=t.join(""),n=new Uint8Array(e.length/2);for(let t=0;t<e.length;t+=2)n[t>>1]=Number.parseInt(e.slice(t,t+2),16);return n}(n[e]):Pt.isBool(t)?Nn(n[e]):Pt.isUtf8(t)||Pt.isLargeUtf8(t)?b(n[e].join("")):B(Uint8Array,B(t.ArrayType,n[e].map((t=>+t))))}}var Si,ki;!function(t){t[t.BUFFER=0]="BUFFER"}(Si||(Si={})),function(t){t[t.LZ4_FRAME=0]="LZ4_FRAME",t[t.ZSTD=1]="ZSTD"}(ki||(ki={}));class Ci{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsBodyCompression(t,e){return(e||new Ci).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsBodyCompression(t,e){return t.setPosition(t.position()+4),(e||new Ci).__init(t.readInt32(t.position())+t.position(),t)}codec(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt8(this.bb_pos+t):ki.LZ4_FRAME}method(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.readInt8(this.bb_pos+t):Si.BUFFER}static startBodyCompression(t){t.startObject(2)}static addCodec(t,e){t.addFieldInt8(0,e,ki.LZ4_FRAME)}static addMethod(t,e){t.addFieldInt8(1,e,Si.BUFFER)}static endBodyCompression(t){return t.endObject()}static createBodyCompression(t,e,n){return Ci.startBodyCompression(t),Ci.addCodec(t,e),Ci.addMethod(t,n),Ci.endBodyCompression(t)}}class Ti{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}offset(){return this.bb.readInt64(this.bb_pos)}length(){return this.bb.readInt64(this.bb_pos+8)}static sizeOf(){return 16}static createBuffer(t,e,n){return t.prep(8,16),t.writeInt64(BigInt(null!=n?n:0)),t.writeInt64(BigInt(null!=e?e:0)),t.offset()}}class Ei{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}length(){return this.bb.readInt64(this.bb_pos)}nullCount(){return this.bb.readInt64(this.bb_pos+8)}static sizeOf(){return 16}static createFieldNode(t,e,n){return t.prep(8,16),t.writeInt64(BigInt(null!=n?n:0)),t.writeInt64(BigInt(null!=e?e:0)),t.offset()}}class Pi{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsRecordBatch(t,e){return(e||new Pi).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsRecordBatch(t,e){return t.setPosition(t.position()+4),(e||new Pi).__init(t.readInt32(t.position())+t.position(),t)}length(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt64(this.bb_pos+t):BigInt("0")}nodes(t,e){const n=this.bb.__offset(this.bb_pos,6);return n?(e||new Ei).__init(this.bb.__vector(this.bb_pos+n)+16*t,this.bb):null}nodesLength(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.__vector_len(this.bb_pos+t):0}buffers(t,e){const n=this.bb.__offset(this.bb_pos,8);return n?(e||new Ti).__init(this.bb.__vector(this.bb_pos+n)+16*t,this.bb):null}buffersLength(){const t=this.bb.__offset(this.bb_pos,8);return t?this.bb.__vector_len(this.bb_pos+t):0}compression(t){const e=this.bb.__offset(this.bb_pos,10);return e?(t||new Ci).__init(this.bb.__indirect(this.bb_pos+e),this.bb):null}static startRecordBatch(t){t.startObject(4)}static addLength(t,e){t.addFieldInt64(0,e,BigInt("0"))}static addNodes(t,e){t.addFieldOffset(1,e,0)}static startNodesVector(t,e){t.startVector(16,e,8)}static addBuffers(t,e){t.addFieldOffset(2,e,0)}static startBuffersVector(t,e){t.startVector(16,e,8)}static addCompression(t,e){t.addFieldOffset(3,e,0)}static endRecordBatch(t){return t.endObject()}}class Ii{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsDictionaryBatch(t,e){return(e||new Ii).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsDictionaryBatch(t,e){return t.setPosition(t.position()+4),(e||new Ii).__init(t.readInt32(t.position())+t.position(),t)}id(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt64(this.bb_pos+t):BigInt("0")}data(t){const e=this.bb.__offset(this.bb_pos,6);return e?(t||new Pi).__init(this.bb.__indirect(this.bb_pos+e),this.bb):null}isDelta(){const t=this.bb.__offset(this.bb_pos,8);return!!t&&!!this.bb.readInt8(this.bb_pos+t)}static startDictionaryBatch(t){t.startObject(3)}static addId(t,e){t.addFieldInt64(0,e,BigInt("0"))}static addData(t,e){t.addFieldOffset(1,e,0)}static addIsDelta(t,e){t.addFieldInt8(2,+e,0)}static endDictionaryBatch(t){return t.endObject()}}class Ai{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsFloatingPoint(t,e){return(e||new Ai).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsFloatingPoint(t,e){return t.setPosition(t.position()+4),(e||new Ai).__init(t.readInt32(t.position())+t.position(),t)}precision(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):tt.HALF}static startFloatingPoint(t){t.startObject(1)}static addPrecision(t,e){t.addFieldInt16(0,e,tt.HALF)}static endFloatingPoint(t){return t.endObject()}static createFloatingPoint(t,e){return Ai.startFloatingPoint(t),Ai.addPrecision(t,e),Ai.endFloatingPoint(t)}}class Mi{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsDecimal(t,e){return(e||new Mi).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsDecimal(t,e){return t.setPosition(t.position()+4),(e||new Mi).__init(t.readInt32(t.position())+t.position(),t)}precision(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt32(this.bb_pos+t):0}scale(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.readInt32(this.bb_pos+t):0}bitWidth(){const t=this.bb.__offset(this.bb_pos,8);return t?this.bb.readInt32(this.bb_pos+t):128}static startDecimal(t){t.startObject(3)}static addPrecision(t,e){t.addFieldInt32(0,e,0)}static addScale(t,e){t.addFieldInt32(1,e,0)}static addBitWidth(t,e){t.addFieldInt32(2,e,128)}static endDecimal(t){return t.endObject()}static createDecimal(t,e,n,r){return Mi.startDecimal(t),Mi.addPrecision(t,e),Mi.addScale(t,n),Mi.addBitWidth(t,r),Mi.endDecimal(t)}}class Di{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsDate(t,e){return(e||new Di).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsDate(t,e){return t.setPosition(t.position()+4),(e||new Di).__init(t.readInt32(t.position())+t.position(),t)}unit(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):nt.MILLISECOND}static startDate(t){t.startObject(1)}static addUnit(t,e){t.addFieldInt16(0,e,nt.MILLISECOND)}static endDate(t){return t.endObject()}static createDate(t,e){return Di.startDate(t),Di.addUnit(t,e),Di.endDate(t)}}class Fi{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsTime(t,e){return(e||new Fi).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsTime(t,e){return t.setPosition(t.position()+4),(e||new Fi).__init(t.readInt32(t.position())+t.position(),t)}unit(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):et.MILLISECOND}bitWidth(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.readInt32(this.bb_pos+t):32}static startTime(t){t.startObject(2)}static addUnit(t,e){t.addFieldInt16(0,e,et.MILLISECOND)}static addBitWidth(t,e){t.addFieldInt32(1,e,32)}static endTime(t){return t.endObject()}static createTime(t,e,n){return Fi.startTime(t),Fi.addUnit(t,e),Fi.addBitWidth(t,n),Fi.endTime(t)}}class Ri{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsTimestamp(t,e){return(e||new Ri).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsTimestamp(t,e){return t.setPosition(t.position()+4),(e||new Ri).__init(t.readInt32(t.position())+t.position(),t)}unit(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):et.SECOND}timezone(t){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.__string(this.bb_pos+e,t):null}static startTimestamp(t){t.startObject(2)}static addUnit(t,e){t.addFieldInt16(0,e,et.SECOND)}static addTimezone(t,e){t.addFieldOffset(1,e,0)}static endTimestamp(t){return t.endObject()}static createTimestamp(t,e,n){return Ri.startTimestamp(t),Ri.addUnit(t,e),Ri.addTimezone(t,n),Ri.endTimestamp(t)}}class Bi{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsInterval(t,e){return(e||new Bi).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsInterval(t,e){return t.setPosition(t.position()+4),(e||new Bi).__init(t.readInt32(t.position())+t.position(),t)}unit(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):rt.YEAR_MONTH}static startInterval(t){t.startObject(1)}static addUnit(t,e){t.addFieldInt16(0,e,rt.YEAR_MONTH)}static endInterval(t){return t.endObject()}static createInterval(t,e){return Bi.startInterval(t),Bi.addUnit(t,e),Bi.endInterval(t)}}class Li{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsDuration(t,e){return(e||new Li).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsDuration(t,e){return t.setPosition(t.position()+4),(e||new Li).__init(t.readInt32(t.position())+t.position(),t)}unit(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):et.MILLISECOND}static startDuration(t){t.startObject(1)}static addUnit(t,e){t.addFieldInt16(0,e,et.MILLISECOND)}static endDuration(t){return t.endObject()}static createDuration(t,e){return Li.startDuration(t),Li.addUnit(t,e),Li.endDuration(t)}}class Ni{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsUnion(t,e){return(e||new Ni).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsUnion(t,e){return t.setPosition(t.position()+4),(e||new Ni).__init(t.readInt32(t.position())+t.position(),t)}mode(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):it.Sparse}typeIds(t){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.readInt32(this.bb.__vector(this.bb_pos+e)+4*t):0}typeIdsLength(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.__vector_len(this.bb_pos+t):0}typeIdsArray(){const t=this.bb.__offset(this.bb_pos,6);return t?new Int32Array(this.bb.bytes().buffer,this.bb.bytes().byteOffset+this.bb.__vector(this.bb_pos+t),this.bb.__vector_len(this.bb_pos+t)):null}static startUnion(t){t.startObject(2)}static addMode(t,e){t.addFieldInt16(0,e,it.Sparse)}static addTypeIds(t,e){t.addFieldOffset(1,e,0)}static createTypeIdsVector(t,e){t.startVector(4,e.length,4);for(let n=e.length-1;n>=0;n--)t.addInt32(e[n]);return t.endVector()}static startTypeIdsVector(t,e){t.startVector(4,e,4)}static endUnion(t){return t.endObject()}static createUnion(t,e,n){return Ni.startUnion(t),Ni.addMode(t,e),Ni.addTypeIds(t,n),Ni.endUnion(t)}}class Oi{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsFixedSizeBinary(t,e){return(e||new Oi).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsFixedSizeBinary(t,e){return t.setPosition(t.position()+4),(e||new Oi).__init(t.readInt32(t.position())+t.position(),t)}byteWidth(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt32(this.bb_pos+t):0}static startFixedSizeBinary(t){t.startObject(1)}static addByteWidth(t,e){t.addFieldInt32(0,e,0)}static endFixedSizeBinary(t){return t.endObject()}static createFixedSizeBinary(t,e){return Oi.startFixedSizeBinary(t),Oi.addByteWidth(t,e),Oi.endFixedSizeBinary(t)}}class zi{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsFixedSizeList(t,e){return(e||new zi).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsFixedSizeList(t,e){return t.setPosition(t.position()+4),(e||new zi).__init(t.readInt32(t.position())+t.position(),t)}listSize(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt32(this.bb_pos+t):0}static startFixedSizeList(t){t.startObject(1)}static addListSize(t,e){t.addFieldInt32(0,e,0)}static endFixedSizeList(t){return t.endObject()}static createFixedSizeList(t,e){return zi.startFixedSizeList(t),zi.addListSize(t,e),zi.endFixedSizeList(t)}}class Ui{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsMap(t,e){return(e||new Ui).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsMap(t,e){return t.setPosition(t.position()+4),(e||new Ui).__init(t.readInt32(t.position())+t.position(),t)}keysSorted(){const t=this.bb.__offset(this.bb_pos,4);return!!t&&!!this.bb.readInt8(this.bb_pos+t)}static startMap(t){t.startObject(1)}static addKeysSorted(t,e){t.addFieldInt8(0,+e,0)}static endMap(t){return t.endObject()}static createMap(t,e){return Ui.startMap(t),Ui.addKeysSorted(t,e),Ui.endMap(t)}}class ji{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsMessage(t,e){return(e||new ji).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsMessage(t,e){return t.setPosition(t.position()+4),(e||new ji).__init(t.readInt32(t.position())+t.position(),t)}version(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):ir.V1}headerType(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.readUint8(this.bb_pos+t):kr.NONE}header(t){const e=this.bb.__offset(this.bb_pos,8);return e?this.bb.__union(t,this.bb_pos+e):null}bodyLength(){const t=this.bb.__offset(this.bb_pos,10);return t?this.bb.readInt64(this.bb_pos+t):BigInt("0")}customMetadata(t,e){const n=this.bb.__offset(this.bb_pos,12);return n?(e||new $r).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*t),this.bb):null}customMetadataLength(){const t=this.bb.__offset(this.bb_pos,12);return t?this.bb.__vector_len(this.bb_pos+t):0}static startMessage(t){t.startObject(5)}static addVersion(t,e){t.addFieldInt16(0,e,ir.V1)}static addHeaderType(t,e){t.addFieldInt8(1,e,kr.NONE)}static addHeader(t,e){t.addFieldOffset(2,e,0)}static addBodyLength(t,e){t.addFieldInt64(3,e,BigInt("0"))}static addCustomMetadata(t,e){t.addFieldOffset(4,e,0)}static createCustomMetadataVector(t,e){t.startVector(4,e.length,4);for(let n=e.length-1;n>=0;n--)t.addOffset(e[n]);return t.endVector()}static startCustomMetadataVector(t,e){t.startVector(4,e,4)}static endMessage(t){return t.endObject()}static finishMessageBuffer(t,e){t.finish(e)}static finishSizePrefixedMessageBuffer(t,e){t.finish(e,void 0,!0)}static createMessage(t,e,n,r,i,o){return ji.startMessage(t),ji.addVersion(t,e),ji.addHeaderType(t,n),ji.addHeader(t,r),ji.addBodyLength(t,i),ji.addCustomMetadata(t,o),ji.endMessage(t)}}class Vi{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsNull(t,e){return(e||new Vi).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsNull(t,e){return t.setPosition(t.position()+4),(e||new Vi).__init(t.readInt32(t.position())+t.position(),t)}static startNull(t){t.startObject(0)}static endNull(t){return t.endObject()}static createNull(t){return Vi.startNull(t),Vi.endNull(t)}}class $i{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsBinary(t,e){return(e||new $i).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsBinary(t,e){return t.setPosition(t.position()+4),(e||new $i).__init(t.readInt32(t.position())+t.position(),t)}static startBinary(t){t.startObject(0)}static endBinary(t){return t.endObject()}static createBinary(t){return $i.startBinary(t),$i.endBinary(t)}}class Wi{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsLargeBinary(t,e){return(e||new Wi).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsLargeBinary(t,e){return t.setPosition(t.position()+4),(e||new Wi).__init(t.readInt32(t.position())+t.position(),t)}static startLargeBinary(t){t.startObject(0)}static endLargeBinary(t){return t.endObject()}static createLargeBinary(t){return Wi.startLargeBinary(t),Wi.endLargeBinary(t)}}class Gi{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsBool(t,e){return(e||new Gi).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsBool(t,e){return t.setPosition(t.position()+4),(e||new Gi).__init(t.readInt32(t.position())+t.position(),t)}static startBool(t){t.startObject(0)}static endBool(t){return t.endObject()}static createBool(t){return Gi.startBool(t),Gi.endBool(t)}}class Hi{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsUtf8(t,e){return(e||new Hi).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsUtf8(t,e){return t.setPosition(t.position()+4),(e||new Hi).__init(t.readInt32(t.position())+t.position(),t)}static startUtf8(t){t.startObject(0)}static endUtf8(t){return t.endObject()}static createUtf8(t){return Hi.startUtf8(t),Hi.endUtf8(t)}}class Yi{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsLargeUtf8(t,e){return(e||new Yi).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsLargeUtf8(t,e){return t.setPosition(t.position()+4),(e||new Yi).__init(t.readInt32(t.position())+t.position(),t)}static startLargeUtf8(t){t.startObject(0)}static endLargeUtf8(t){return t.endObject()}static createLargeUtf8(t){return Yi.startLargeUtf8(t),Yi.endLargeUtf8(t)}}class qi{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsList(t,e){return(e||new qi).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsList(t,e){return t.setPosition(t.position()+4),(e||new qi).__init(t.readInt32(t.position())+t.position(),t)}static startList(t){t.startObject(0)}static endList(t){return t.endObject()}static createList(t){return qi.startList(t),qi.endList(t)}}class Ki{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsStruct_(t,e){return(e||new Ki).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsStruct_(t,e){return t.setPosition(t.position()+4),(e||new Ki).__init(t.readInt32(t.position())+t.position(),t)}static startStruct_(t){t.startObject(0)}static endStruct_(t){return t.endObject()}static createStruct_(t){return Ki.startStruct_(t),Ki.endStruct_(t)}}const Xi=new class extends te{visit(t,e){return null==t||null==e?void 0:super.visit(t,e)}visitNull(t,e){return Vi.startNull(e),Vi.endNull(e)}visitInt(t,e){return Wr.startInt(e),Wr.addBitWidth(e,t.bitWidth),Wr.addIsSigned(e,t.isSigned),Wr.endInt(e)}visitFloat(t,e){return Ai.startFloatingPoint(e),Ai.addPrecision(e,t.precision),Ai.endFloatingPoint(e)}visitBinary(t,e){return $i.startBinary(e),$i.endBinary(e)}visitLargeBinary(t,e){return Wi.startLargeBinary(e),Wi.endLargeBinary(e)}visitBool(t,e){return Gi.startBool(e),Gi.endBool(e)}visitUtf8(t,e){return Hi.startUtf8(e),Hi.endUtf8(e)}visitLargeUtf8(t,e){return Yi.startLargeUtf8(e),Yi.endLargeUtf8(e)}visitDecimal(t,e){return Mi.startDecimal(e),Mi.addScale(e,t.scale),Mi.addPrecision(e,t.precision),Mi.addBitWidth(e,t.bitWidth),Mi.endDecimal(e)}visitDate(t,e){return Di.startDate(e),Di.addUnit(e,t.unit),Di.endDate(e)}visitTime(t,e){return Fi.startTime(e),Fi.addUnit(e,t.unit),Fi.addBitWidth(e,t.bitWidth),Fi.endTime(e)}visitTimestamp(t,e){const n=t.timezone&&e.createString(t.timezone)||void 0;return Ri.startTimestamp(e),Ri.addUnit(e,t.unit),void 0!==n&&Ri.addTimezone(e,n),Ri.endTimestamp(e)}visitInterval(t,e){return Bi.startInterval(e),Bi.addUnit(e,t.unit),Bi.endInterval(e)}visitDuration(t,e){return Li.startDuration(e),Li.addUnit(e,t.unit),Li.endDuration(e)}visitList(t,e){return qi.startList(e),qi.endList(e)}visitStruct(t,e){return Ki.startStruct_(e),Ki.endStruct_(e)}visitUnion(t,e){Ni.startTypeIdsVector(e,t.typeIds.length);const n=Ni.createTypeIdsVector(e,t.typeIds);return Ni.startUnion(e),Ni.addMode(e,t.mode),Ni.addTypeIds(e,n),Ni.endUnion(e)}visitDictionary(t,e){const n=this.visit(t.indices,e);return Gr.startDictionaryEncoding(e),Gr.addId(e,BigInt(t.id)),Gr.addIsOrdered(e,t.isOrdered),void 0!==n&&Gr.addIndexType(e,n),Gr.endDictionaryEncoding(e)}visitFixedSizeBinary(t,e){return Oi.startFixedSizeBinary(e),Oi.addByteWidth(e,t.byteWidth),Oi.endFixedSizeBinary(e)}visitFixedSizeList(t,e){return zi.startFixedSizeList(e),zi.addListSize(e,t.listSize),zi.endFixedSizeList(e)}visitMap(t,e){return Ui.startMap(e),Ui.addKeysSorted(e,t.keysSorted),Ui.endMap(e)}};function Qi(t){return new so(t.count,Ji(t.columns),to(t.columns))}function Zi(t,e){return(t.children||[]).filter(Boolean).map((t=>ar.fromJSON(t,e)))}function Ji(t){return(t||[]).reduce(((t,e)=>{return[...t,new uo(e.count,(n=e.VALIDITY,(n||[]).reduce(((t,e)=>t+ +(0===e)),0))),...Ji(e.children)];var n}),[])}function to(t,e=[]){for(let n=-1,r=(t||[]).length;++n<r;){const r=t[n];r.VALIDITY&&e.push(new co(e.length,r.VALIDITY.length)),r.TYPE_ID&&e.push(new co(e.length,r.TYPE_ID.length)),r.OFFSET&&e.push(new co(e.length,r.OFFSET.length)),r.DATA&&e.push(new co(e.length,r.DATA.length)),e=to(r.children,e)}return e}function eo(t=[]){return new Map(t.map((({key:t,value:e})=>[t,e])))}function no(t){return new At(t.isSigned,t.bitWidth)}function ro(t,e){const n=t.type.name;switch(n){case"NONE":case"null":return new It;case"binary":return new Ft;case"largebinary":return new Rt;case"utf8":return new Bt;case"largeutf8":return new Lt;case"bool":return new Nt;case"list":return new Wt((e||[])[0]);case"struct":case"struct_":return new Gt(e||[])}switch(n){case"int":{const e=t.type;return new At(e.isSigned,e.bitWidth)}case"floatingpoint":{const e=t.type;return new Dt(tt[e.precision])}case"decimal":{const e=t.type;return new Ot(e.scale,e.precision,e.bitWidth)}case"date":{const e=t.type;return new zt(nt[e.unit])}case"time":{const e=t.type;return new Ut(et[e.unit],e.bitWidth)}case"timestamp":{const e=t.type;return new jt(et[e.unit],e.timezone)}case"interval":{const e=t.type;return new Vt(rt[e.unit])}case"duration":{const e=t.type;return new $t(et[e.unit])}case"union":{const n=t.type,[r,...i]=(n.mode+"").toLowerCase(),o=r.toUpperCase()+i.join("");return new Ht(it[o],n.typeIds||[],e||[])}case"fixedsizebinary":{const e=t.type;return new Yt(e.byteWidth)}case"fixedsizelist":{const n=t.type;return new qt(n.listSize,(e||[])[0])}case"map":{const n=t.type;return new Kt((e||[])[0],n.keysSorted)}}throw new Error(`Unrecognized type: "${n}"`)}var io=Vr,oo=jr;class ao{static fromJSON(t,e){const n=new ao(0,ir.V5,e);return n._createHeader=function(t,e){return()=>{switch(e){case kr.Schema:return or.fromJSON(t);case kr.RecordBatch:return so.fromJSON(t);case kr.DictionaryBatch:return lo.fromJSON(t)}throw new Error(`Unrecognized Message type: { name: ${kr[e]}, type: ${e} }`)}}(t,e),n}static decode(t){t=new oo(O(t));const e=ji.getRootAsMessage(t),n=e.bodyLength(),r=e.version(),i=e.headerType(),o=new ao(n,r,i);return o._createHeader=function(t,e){return()=>{switch(e){case kr.Schema:return or.decode(t.header(new Yr),new Map,t.version());case kr.RecordBatch:return so.decode(t.header(new Pi),t.version());case kr.DictionaryBatch:return lo.decode(t.header(new Ii),t.version())}throw new Error(`Unrecognized Message type: { name: ${kr[e]}, type: ${e} }`)}}(e,i),o}static encode(t){const e=new io;let n=-1;return t.isSchema()?n=or.encode(e,t.header()):t.isRecordBatch()?n=so.encode(e,t.header()):t.isDictionaryBatch()&&(n=lo.encode(e,t.header())),ji.startMessage(e),ji.addVersion(e,ir.V5),ji.addHeader(e,n),ji.addHeaderType(e,t.headerType),ji.addBodyLength(e,BigInt(t.bodyLength)),ji.finishMessageBuffer(e,ji.endMessage(e)),e.asUint8Array()}static from(t,e=0){if(t instanceof or)return new ao(0,ir.V5,kr.Schema,t);if(t instanceof so)return new ao(e,ir.V5,kr.RecordBatch,t);if(t instanceof lo)return new ao(e,ir.V5,kr.DictionaryBatch,t);throw new Error(`Unrecognized Message header: ${t}`)}get type(){return this.headerType}get version(){return this._version}get headerType(){return this._headerType}get bodyLength(){return this._bodyLength}header(){return this._createHeader()}isSchema(){return this.headerType===kr.Schema}isRecordBatch(){return this.headerType===kr.RecordBatch}isDictionaryBatch(){return this.headerType===kr.DictionaryBatch}constructor(t,e,n,r){this._version=e,this._headerType=n,this.body=new Uint8Array(0),r&&(this._createHeader=()=>r),this._bodyLength=V(t)}}class so{get nodes(){return this._nodes}get length(){return this._length}get buffers(){return this._buffers}constructor(t,e,n){this._nodes=e,this._buffers=n,this._length=V(t)}}class lo{get id(){return this._id}get data(){return this._data}get isDelta(){return this._isDelta}get length(){return this.data.length}get nodes(){return this.data.nodes}get buffers(){return this.data.buffers}constructor(t,e,n=!1){this._data=t,this._isDelta=n,this._id=V(e)}}class co{constructor(t,e){this.offset=V(t),this.length=V(e)}}class uo{constructor(t,e){this.length=V(t),this.nullCount=V(e)}}function ho(t,e){const n=[];for(let r,i=-1,o=-1,a=t.childrenLength();++i<a;)(r=t.children(i))&&(n[++o]=ar.decode(r,e));return n}function fo(t){const e=new Map;if(t)for(let n,r,i=-1,o=Math.trunc(t.customMetadataLength());++i<o;)(n=t.customMetadata(i))&&null!=(r=n.key())&&e.set(r,n.value());return e}function po(t){return new At(t.isSigned(),t.bitWidth())}function go(t,e){const n=t.typeType();switch(n){case Ur.NONE:case Ur.Null:return new It;case Ur.Binary:return new Ft;case Ur.LargeBinary:return new Rt;case Ur.Utf8:return new Bt;case Ur.LargeUtf8:return new Lt;case Ur.Bool:return new Nt;case Ur.List:return new Wt((e||[])[0]);case Ur.Struct_:return new Gt(e||[])}switch(n){case Ur.Int:{const e=t.type(new Wr);return new At(e.isSigned(),e.bitWidth())}case Ur.FloatingPoint:{const e=t.type(new Ai);return new Dt(e.precision())}case Ur.Decimal:{const e=t.type(new Mi);return new Ot(e.scale(),e.precision(),e.bitWidth())}case Ur.Date:{const e=t.type(new Di);return new zt(e.unit())}case Ur.Time:{const e=t.type(new Fi);return new Ut(e.unit(),e.bitWidth())}case Ur.Timestamp:{const e=t.type(new Ri);return new jt(e.unit(),e.timezone())}case Ur.Interval:{const e=t.type(new Bi);return new Vt(e.unit())}case Ur.Duration:{const e=t.type(new Li);return new $t(e.unit())}case Ur.Union:{const n=t.type(new Ni);return new Ht(n.mode(),n.typeIdsArray()||[],e||[])}case Ur.FixedSizeBinary:{const e=t.type(new Oi);return new Yt(e.byteWidth())}case Ur.FixedSizeList:{const n=t.type(new zi);return new qt(n.listSize(),(e||[])[0])}case Ur.Map:{const n=t.type(new Ui);return new Kt((e||[])[0],n.keysSorted())}}throw new Error(`Unrecognized type: "${Ur[n]}" (${n})`)}ar.encode=function(t,e){let n=-1,r=-1,i=-1;const o=e.type;let a=e.typeId;Pt.isDictionary(o)?(a=o.dictionary.typeId,i=Xi.visit(o,t),r=Xi.visit(o.dictionary,t)):r=Xi.visit(o,t);const s=(o.children||[]).map((e=>ar.encode(t,e))),l=Hr.createChildrenVector(t,s),c=e.metadata&&e.metadata.size>0?Hr.createCustomMetadataVector(t,[...e.metadata].map((([e,n])=>{const r=t.createString(`${e}`),i=t.createString(`${n}`);return $r.startKeyValue(t),$r.addKey(t,r),$r.addValue(t,i),$r.endKeyValue(t)}))):-1;return e.name&&(n=t.createString(e.name)),Hr.startField(t),Hr.addType(t,r),Hr.addTypeType(t,a),Hr.addChildren(t,l),Hr.addNullable(t,!!e.nullable),-1!==n&&Hr.addName(t,n),-1!==i&&Hr.addDictionary(t,i),-1!==c&&Hr.addCustomMetadata(t,c),Hr.endField(t)},ar.decode=function(t,e){let n,r,i,o,a,s;return e&&(s=t.dictionary())?e.has(n=V(s.id()))?(o=(o=s.indexType())?po(o):new Mt,a=new Zt(e.get(n),o,n,s.isOrdered()),r=new ar(t.name(),a,t.nullable(),fo(t))):(o=(o=s.indexType())?po(o):new Mt,e.set(n,i=go(t,ho(t,e))),a=new Zt(i,o,n,s.isOrdered()),r=new ar(t.name(),a,t.nullable(),fo(t))):(i=go(t,ho(t,e)),r=new ar(t.name(),i,t.nullable(),fo(t))),r||null},ar.fromJSON=function(t,e){let n,r,i,o,a,s;return e&&(o=t.dictionary)?e.has(n=o.id)?(r=(r=o.indexType)?no(r):new Mt,s=new Zt(e.get(n),r,n,o.isOrdered),i=new ar(t.name,s,t.nullable,eo(t.metadata))):(r=(r=o.indexType)?no(r):new Mt,e.set(n,a=ro(t,Zi(t,e))),s=new Zt(a,r,n,o.isOrdered),i=new ar(t.name,s,t.nullable,eo(t.metadata))):(a=ro(t,Zi(t,e)),i=new ar(t.name,a,t.nullable,eo(t.metadata))),i||null},or.encode=function(t,e){const n=e.fields.map((e=>ar.encode(t,e)));Yr.startFieldsVector(t,n.length);const r=Yr.createFieldsVector(t,n),i=e.metadata&&e.metadata.size>0?Yr.createCustomMetadataVector(t,[...e.metadata].map((([e,n])=>{const r=t.createString(`${e}`),i=t.createString(`${n}`);return $r.startKeyValue(t),$r.addKey(t,r),$r.addValue(t,i),$r.endKeyValue(t)}))):-1;return Yr.startSchema(t),Yr.addFields(t,r),Yr.addEndianness(t,mo?Or.Little:Or.Big),-1!==i&&Yr.addCustomMetadata(t,i),Yr.endSchema(t)},or.decode=function(t,e=new Map,n=ir.V5){const r=function(t,e){const n=[];for(let r,i=-1,o=-1,a=t.fieldsLength();++i<a;)(r=t.fields(i))&&(n[++o]=ar.decode(r,e));return n}(t,e);return new or(r,fo(t),e,n)},or.fromJSON=function(t,e=new Map){return new or(function(t,e){return(t.fields||[]).filter(Boolean).map((t=>ar.fromJSON(t,e)))}(t,e),eo(t.metadata),e)},so.encode=function(t,e){const n=e.nodes||[],r=e.buffers||[];Pi.startNodesVector(t,n.length);for(const e of n.slice().reverse())uo.encode(t,e);const i=t.endVector();Pi.startBuffersVector(t,r.length);for(const e of r.slice().reverse())co.encode(t,e);const o=t.endVector();return Pi.startRecordBatch(t),Pi.addLength(t,BigInt(e.length)),Pi.addNodes(t,i),Pi.addBuffers(t,o),Pi.endRecordBatch(t)},so.decode=function(t,e=ir.V5){if(null!==t.compression())throw new Error("Record batch compression not implemented");return new so(t.length(),function(t){const e=[];for(let n,r=-1,i=-1,o=t.nodesLength();++r<o;)(n=t.nodes(r))&&(e[++i]=uo.decode(n));return e}(t),function(t,e){const n=[];for(let r,i=-1,o=-1,a=t.buffersLength();++i<a;)(r=t.buffers(i))&&(e<ir.V4&&(r.bb_pos+=8*(i+1)),n[++o]=co.decode(r));return n}(t,e))},so.fromJSON=Qi,lo.encode=function(t,e){const n=so.encode(t,e.data);return Ii.startDictionaryBatch(t),Ii.addId(t,BigInt(e.id)),Ii.addIsDelta(t,e.isDelta),Ii.addData(t,n),Ii.endDictionaryBatch(t)},lo.decode=function(t,e=ir.V5){return new lo(so.decode(t.data(),e),t.id(),t.isDelta())},lo.fromJSON=function(t){return new lo(Qi(t.data),t.id,t.isDelta)},uo.encode=function(t,e){return Ei.createFieldNode(t,BigInt(e.length),BigInt(e.nullCount))},uo.decode=function(t){return new uo(t.length(),t.nullCount())},co.encode=function(t,e){return Ti.createBuffer(t,BigInt(e.offset),BigInt(e.length))},co.decode=function(t){return new co(t.offset(),t.length())};const mo=(()=>{const t=new ArrayBuffer(2);return new DataView(t).setInt16(0,256,!0),256===new Int16Array(t)[0]})(),yo=t=>`Expected ${kr[t]} Message in stream, but was null or length 0.`,bo=t=>`Header pointer of flatbuffer-encoded ${kr[t]} Message is null or length 0.`,vo=(t,e)=>`Expected to read ${t} metadata bytes, but only read ${e}.`,_o=(t,e)=>`Expected to read ${t} bytes for message body, but only read ${e}.`;class wo{constructor(t){this.source=t instanceof ci?t:new ci(t)}[Symbol.iterator](){return this}next(){let t;return(t=this.readMetadataLength()).done||-1===t.value&&(t=this.readMetadataLength()).done||(t=this.readMetadata(t.value)).done?ii:t}throw(t){return this.source.throw(t)}return(t){return this.source.return(t)}readMessage(t){let e;if((e=this.next()).done)return null;if(null!=t&&e.value.headerType!==t)throw new Error(yo(t));return e.value}readMessageBody(t){if(t<=0)return new Uint8Array(0);const e=O(this.source.read(t));if(e.byteLength<t)throw new Error(_o(t,e.byteLength));return e.byteOffset%8==0&&e.byteOffset+e.byteLength<=e.buffer.byteLength?e:e.slice()}readSchema(t=!1){const e=kr.Schema,n=this.readMessage(e),r=null==n?void 0:n.header();if(t&&!r)throw new Error(bo(e));return r}readMetadataLength(){const t=this.source.read(ko),e=t&&new jr(t),n=(null==e?void 0:e.readInt32(0))||0;return{done:0===n,value:n}}readMetadata(t){const e=this.source.read(t);if(!e)return ii;if(e.byteLength<t)throw new Error(vo(t,e.byteLength));return{done:!1,value:ao.decode(e)}}}class xo{constructor(t,e){this.source=t instanceof ui?t:E(t)?new pi(t,e):new ui(t)}[Symbol.asyncIterator](){return this}next(){return u(this,void 0,void 0,(function*(){let t;return(t=yield this.readMetadataLength()).done||-1===t.value&&(t=yield this.readMetadataLength()).done||(t=yield this.readMetadata(t.value)).done?ii:t}))}throw(t){return u(this,void 0,void 0,(function*(){return yield this.source.throw(t)}))}return(t){return u(this,void 0,void 0,(function*(){return yield this.source.return(t)}))}readMessage(t){return u(this,void 0,void 0,(function*(){let e;if((e=yield this.next()).done)return null;if(null!=t&&e.value.headerType!==t)throw new Error(yo(t));return e.value}))}readMessageBody(t){return u(this,void 0,void 0,(function*(){if(t<=0)return new Uint8Array(0);const e=O(yield this.source.read(t));if(e.byteLength<t)throw new Error(_o(t,e.byteLength));return e.byteOffset%8==0&&e.byteOffset+e.byteLength<=e.buffer.byteLength?e:e.slice()}))}readSchema(){return u(this,arguments,void 0,(function*(t=!1){const e=kr.Schema,n=yield this.readMessage(e),r=null==n?void 0:n.header();if(t&&!r)throw new Error(bo(e));return r}))}readMetadataLength(){return u(this,void 0,void 0,(function*(){const t=yield this.source.read(ko),e=t&&new jr(t),n=(null==e?void 0:e.readInt32(0))||0;return{done:0===n,value:n}}))}readMetadata(t){return u(this,void 0,void 0,(function*(){const e=yield this.source.read(t);if(!e)return ii;if(e.byteLength<t)throw new Error(vo(t,e.byteLength));return{done:!1,value:ao.decode(e)}}))}}class So extends wo{constructor(t){super(new Uint8Array(0)),this._schema=!1,this._body=[],this._batchIndex=0,this._dictionaryIndex=0,this._json=t instanceof oi?t:new oi(t)}next(){const{_json:t}=this;if(!this._schema)return this._schema=!0,{done:!1,value:ao.fromJSON(t.schema,kr.Schema)};if(this._dictionaryIndex<t.dictionaries.length){const e=t.dictionaries[this._dictionaryIndex++];return this._body=e.data.columns,{done:!1,value:ao.fromJSON(e,kr.DictionaryBatch)}}if(this._batchIndex<t.batches.length){const e=t.batches[this._batchIndex++];return this._body=e.columns,{done:!1,value:ao.fromJSON(e,kr.RecordBatch)}}return this._body=[],ii}readMessageBody(t){return function t(e){return(e||[]).reduce(((e,n)=>[...e,...n.VALIDITY&&[n.VALIDITY]||[],...n.TYPE_ID&&[n.TYPE_ID]||[],...n.OFFSET&&[n.OFFSET]||[],...n.DATA&&[n.DATA]||[],...t(n.children)]),[])}(this._body)}readMessage(t){let e;if((e=this.next()).done)return null;if(null!=t&&e.value.headerType!==t)throw new Error(yo(t));return e.value}readSchema(){const t=kr.Schema,e=this.readMessage(t),n=null==e?void 0:e.header();if(!e||!n)throw new Error(bo(t));return n}}const ko=4,Co=new Uint8Array(6);for(let t=0;t<6;t+=1)Co[t]="ARROW1".codePointAt(t);function To(t,e=0){for(let n=-1,r=Co.length;++n<r;)if(Co[n]!==t[e+n])return!1;return!0}const Eo=Co.length,Po=Eo+ko,Io=2*Eo+ko;class Ao extends ai{constructor(t){super(),this._impl=t}get closed(){return this._impl.closed}get schema(){return this._impl.schema}get autoDestroy(){return this._impl.autoDestroy}get dictionaries(){return this._impl.dictionaries}get numDictionaries(){return this._impl.numDictionaries}get numRecordBatches(){return this._impl.numRecordBatches}get footer(){return this._impl.isFile()?this._impl.footer:null}isSync(){return this._impl.isSync()}isAsync(){return this._impl.isAsync()}isFile(){return this._impl.isFile()}isStream(){return this._impl.isStream()}next(){return this._impl.next()}throw(t){return this._impl.throw(t)}return(t){return this._impl.return(t)}cancel(){return this._impl.cancel()}reset(t){return this._impl.reset(t),this._DOMStream=void 0,this._nodeStream=void 0,this}open(t){const e=this._impl.open(t);return x(e)?e.then((()=>this)):this}readRecordBatch(t){return this._impl.isFile()?this._impl.readRecordBatch(t):null}[Symbol.iterator](){return this._impl[Symbol.iterator]()}[Symbol.asyncIterator](){return this._impl[Symbol.asyncIterator]()}toDOMStream(){return ti.toDOMStream(this.isSync()?{[Symbol.iterator]:()=>this}:{[Symbol.asyncIterator]:()=>this})}toNodeStream(){return ti.toNodeStream(this.isSync()?{[Symbol.iterator]:()=>this}:{[Symbol.asyncIterator]:()=>this},{objectMode:!0})}static throughNode(t){throw new Error('"throughNode" not available in this environment')}static throughDOM(t,e){throw new Error('"throughDOM" not available in this environment')}static from(t){return t instanceof Ao?t:C(t)?function(t){return new Mo(new Uo(t))}(t):E(t)?function(t){return u(this,void 0,void 0,(function*(){const{size:e}=yield t.stat(),n=new pi(t,e);return e>=Io&&To(yield n.readAt(0,Eo+7&-8))?new Ro(new zo(n)):new Do(new No(n))}))}(t):x(t)?(()=>u(this,void 0,void 0,(function*(){return yield Ao.from(yield t)})))():P(t)||A(t)||M(t)||k(t)?function(t){return u(this,void 0,void 0,(function*(){const e=yield t.peek(Eo+7&-8);return e&&e.byteLength>=4?To(e)?new Fo(new Oo(yield t.read())):new Do(new No(t)):new Do(new No(function(){return h(this,arguments,(function*(){}))}()))}))}(new ui(t)):function(t){const e=t.peek(Eo+7&-8);return e&&e.byteLength>=4?To(e)?new Fo(new Oo(t.read())):new Mo(new Lo(t)):new Mo(new Lo(function*(){}()))}(new ci(t))}static readAll(t){return t instanceof Ao?t.isSync()?Vo(t):$o(t):C(t)||ArrayBuffer.isView(t)||S(t)||T(t)?Vo(t):$o(t)}}class Mo extends Ao{constructor(t){super(t),this._impl=t}readAll(){return[...this]}[Symbol.iterator](){return this._impl[Symbol.iterator]()}[Symbol.asyncIterator](){return h(this,arguments,(function*(){yield d(yield*f(p(this[Symbol.iterator]())))}))}}class Do extends Ao{constructor(t){super(t),this._impl=t}readAll(){return u(this,void 0,void 0,(function*(){var t,e,n,r;const i=new Array;try{for(var o,a=!0,s=p(this);!(t=(o=yield s.next()).done);a=!0){r=o.value,a=!1;const t=r;i.push(t)}}catch(t){e={error:t}}finally{try{a||t||!(n=s.return)||(yield n.call(s))}finally{if(e)throw e.error}}return i}))}[Symbol.iterator](){throw new Error("AsyncRecordBatchStreamReader is not Iterable")}[Symbol.asyncIterator](){return this._impl[Symbol.asyncIterator]()}}class Fo extends Mo{constructor(t){super(t),this._impl=t}}class Ro extends Do{constructor(t){super(t),this._impl=t}}class Bo{get numDictionaries(){return this._dictionaryIndex}get numRecordBatches(){return this._recordBatchIndex}constructor(t=new Map){this.closed=!1,this.autoDestroy=!0,this._dictionaryIndex=0,this._recordBatchIndex=0,this.dictionaries=t}isSync(){return!1}isAsync(){return!1}isFile(){return!1}isStream(){return!1}reset(t){return this._dictionaryIndex=0,this._recordBatchIndex=0,this.schema=t,this.dictionaries=new Map,this}_loadRecordBatch(t,e){const n=this._loadVectors(t,e,this.schema.fields),r=rr({type:new Gt(this.schema.fields),length:t.length,children:n});return new Cr(this.schema,r)}_loadDictionaryBatch(t,e){const{id:n,isDelta:r}=t,{dictionaries:i,schema:o}=this,a=i.get(n),s=o.dictionaries.get(n),l=this._loadVectors(t.data,e,[s]);return(a&&r?a.concat(new Zn(l)):new Zn(l)).memoize()}_loadVectors(t,e,n){return new wi(e,t.nodes,t.buffers,this.dictionaries,this.schema.metadataVersion).visitMany(n)}}class Lo extends Bo{constructor(t,e){super(e),this._reader=C(t)?new So(this._handle=t):new wo(this._handle=t)}isSync(){return!0}isStream(){return!0}[Symbol.iterator](){return this}cancel(){!this.closed&&(this.closed=!0)&&(this.reset()._reader.return(),this._reader=null,this.dictionaries=null)}open(t){return this.closed||(this.autoDestroy=jo(this,t),this.schema||(this.schema=this._reader.readSchema())||this.cancel()),this}throw(t){return!this.closed&&this.autoDestroy&&(this.closed=!0)?this.reset()._reader.throw(t):ii}return(t){return!this.closed&&this.autoDestroy&&(this.closed=!0)?this.reset()._reader.return(t):ii}next(){if(this.closed)return ii;let t;const{_reader:e}=this;for(;t=this._readNextMessageAndValidate();)if(t.isSchema())this.reset(t.header());else{if(t.isRecordBatch()){this._recordBatchIndex++;const n=t.header(),r=e.readMessageBody(t.bodyLength);return{done:!1,value:this._loadRecordBatch(n,r)}}if(t.isDictionaryBatch()){this._dictionaryIndex++;const n=t.header(),r=e.readMessageBody(t.bodyLength),i=this._loadDictionaryBatch(n,r);this.dictionaries.set(n.id,i)}}return this.schema&&0===this._recordBatchIndex?(this._recordBatchIndex++,{done:!1,value:new Pr(this.schema)}):this.return()}_readNextMessageAndValidate(t){return this._reader.readMessage(t)}}class No extends Bo{constructor(t,e){super(e),this._reader=new xo(this._handle=t)}isAsync(){return!0}isStream(){return!0}[Symbol.asyncIterator](){return this}cancel(){return u(this,void 0,void 0,(function*(){!this.closed&&(this.closed=!0)&&(yield this.reset()._reader.return(),this._reader=null,this.dictionaries=null)}))}open(t){return u(this,void 0,void 0,(function*(){return this.closed||(this.autoDestroy=jo(this,t),this.schema||(this.schema=yield this._reader.readSchema())||(yield this.cancel())),this}))}throw(t){return u(this,void 0,void 0,(function*(){return!this.closed&&this.autoDestroy&&(this.closed=!0)?yield this.reset()._reader.throw(t):ii}))}return(t){return u(this,void 0,void 0,(function*(){return!this.closed&&this.autoDestroy&&(this.closed=!0)?yield this.reset()._reader.return(t):ii}))}next(){return u(this,void 0,void 0,(function*(){if(this.closed)return ii;let t;const{_reader:e}=this;for(;t=yield this._readNextMessageAndValidate();)if(t.isSchema())yield this.reset(t.header());else{if(t.isRecordBatch()){this._recordBatchIndex++;const n=t.header(),r=yield e.readMessageBody(t.bodyLength);return{done:!1,value:this._loadRecordBatch(n,r)}}if(t.isDictionaryBatch()){this._dictionaryIndex++;const n=t.header(),r=yield e.readMessageBody(t.bodyLength),i=this._loadDictionaryBatch(n,r);this.dictionaries.set(n.id,i)}}return this.schema&&0===this._recordBatchIndex?(this._recordBatchIndex++,{done:!1,value:new Pr(this.schema)}):yield this.return()}))}_readNextMessageAndValidate(t){return u(this,void 0,void 0,(function*(){return yield this._reader.readMessage(t)}))}}class Oo extends Lo{get footer(){return this._footer}get numDictionaries(){return this._footer?this._footer.numDictionaries:0}get numRecordBatches(){return this._footer?this._footer.numRecordBatches:0}constructor(t,e){super(t instanceof fi?t:new fi(t),e)}isSync(){return!0}isFile(){return!0}open(t){if(!this.closed&&!this._footer){this.schema=(this._footer=this._readFooter()).schema;for(const t of this._footer.dictionaryBatches())t&&this._readDictionaryBatch(this._dictionaryIndex++)}return super.open(t)}readRecordBatch(t){var e;if(this.closed)return null;this._footer||this.open();const n=null===(e=this._footer)||void 0===e?void 0:e.getRecordBatch(t);if(n&&this._handle.seek(n.offset)){const t=this._reader.readMessage(kr.RecordBatch);if(null==t?void 0:t.isRecordBatch()){const e=t.header(),n=this._reader.readMessageBody(t.bodyLength);return this._loadRecordBatch(e,n)}}return null}_readDictionaryBatch(t){var e;const n=null===(e=this._footer)||void 0===e?void 0:e.getDictionaryBatch(t);if(n&&this._handle.seek(n.offset)){const t=this._reader.readMessage(kr.DictionaryBatch);if(null==t?void 0:t.isDictionaryBatch()){const e=t.header(),n=this._reader.readMessageBody(t.bodyLength),r=this._loadDictionaryBatch(e,n);this.dictionaries.set(e.id,r)}}}_readFooter(){const{_handle:t}=this,e=t.size-Po,n=t.readInt32(e),r=t.readAt(e-n,n);return Qr.decode(r)}_readNextMessageAndValidate(t){var e;if(this._footer||this.open(),this._footer&&this._recordBatchIndex<this.numRecordBatches){const n=null===(e=this._footer)||void 0===e?void 0:e.getRecordBatch(this._recordBatchIndex);if(n&&this._handle.seek(n.offset))return this._reader.readMessage(t)}return null}}class zo extends No{get footer(){return this._footer}get numDictionaries(){return this._footer?this._footer.numDictionaries:0}get numRecordBatches(){return this._footer?this._footer.numRecordBatches:0}constructor(t,...e){const n="number"!=typeof e[0]?e.shift():void 0,r=e[0]instanceof Map?e.shift():void 0;super(t instanceof pi?t:new pi(t,n),r)}isFile(){return!0}isAsync(){return!0}open(t){const e=Object.create(null,{open:{get:()=>super.open}});return u(this,void 0,void 0,(function*(){if(!this.closed&&!this._footer){this.schema=(this._footer=yield this._readFooter()).schema;for(const t of this._footer.dictionaryBatches())t&&(yield this._readDictionaryBatch(this._dictionaryIndex++))}return yield e.open.call(this,t)}))}readRecordBatch(t){return u(this,void 0,void 0,(function*(){var e;if(this.closed)return null;this._footer||(yield this.open());const n=null===(e=this._footer)||void 0===e?void 0:e.getRecordBatch(t);if(n&&(yield this._handle.seek(n.offset))){const t=yield this._reader.readMessage(kr.RecordBatch);if(null==t?void 0:t.isRecordBatch()){const e=t.header(),n=yield this._reader.readMessageBody(t.bodyLength);return this._loadRecordBatch(e,n)}}return null}))}_readDictionaryBatch(t){return u(this,void 0,void 0,(function*(){var e;const n=null===(e=this._footer)||void 0===e?void 0:e.getDictionaryBatch(t);if(n&&(yield this._handle.seek(n.offset))){const t=yield this._reader.readMessage(kr.DictionaryBatch);if(null==t?void 0:t.isDictionaryBatch()){const e=t.header(),n=yield this._reader.readMessageBody(t.bodyLength),r=this._loadDictionaryBatch(e,n);this.dictionaries.set(e.id,r)}}}))}_readFooter(){return u(this,void 0,void 0,(function*(){const{_handle:t}=this;t._pending&&(yield t._pending);const e=t.size-Po,n=yield t.readInt32(e),r=yield t.readAt(e-n,n);return Qr.decode(r)}))}_readNextMessageAndValidate(t){return u(this,void 0,void 0,(function*(){if(this._footer||(yield this.open()),this._footer&&this._recordBatchIndex<this.numRecordBatches){const e=this._footer.getRecordBatch(this._recordBatchIndex);if(e&&(yield this._handle.seek(e.offset)))return yield this._reader.readMessage(t)}return null}))}}class Uo extends Lo{constructor(t,e){super(t,e)}_loadVectors(t,e,n){return new xi(e,t.nodes,t.buffers,this.dictionaries,this.schema.metadataVersion).visitMany(n)}}function jo(t,e){return e&&"boolean"==typeof e.autoDestroy?e.autoDestroy:t.autoDestroy}function*Vo(t){const e=Ao.from(t);try{if(!e.open({autoDestroy:!1}).closed)do{yield e}while(!e.reset().open().closed)}finally{e.cancel()}}function $o(t){return h(this,arguments,(function*(){const e=yield d(Ao.from(t));try{if(!(yield d(e.open({autoDestroy:!1}))).closed)do{yield yield d(e)}while(!(yield d(e.reset().open())).closed)}finally{yield d(e.cancel())}}))}class Wo extends te{static assemble(...t){const e=t=>t.flatMap((t=>Array.isArray(t)?e(t):t instanceof Cr?t.data.children:t.data)),n=new Wo;return n.visitMany(e(t)),n}constructor(){super(),this._byteLength=0,this._nodes=[],this._buffers=[],this._bufferRegions=[]}visit(t){if(t instanceof Zn)return this.visitMany(t.data),this;const{type:e}=t;if(!Pt.isDictionary(e)){const{length:n}=t;if(n>2147483647)throw new RangeError("Cannot write arrays larger than 2^31 - 1 in length");if(Pt.isUnion(e))this.nodes.push(new uo(n,0));else{const{nullCount:r}=t;Pt.isNull(e)||Go.call(this,r<=0?new Uint8Array(0):Ln(t.offset,n,t.nullBitmap)),this.nodes.push(new uo(n,r))}}return super.visit(t)}visitNull(t){return this}visitDictionary(t){return this.visit(t.clone(t.type.indices))}get nodes(){return this._nodes}get buffers(){return this._buffers}get byteLength(){return this._byteLength}get bufferRegions(){return this._bufferRegions}}function Go(t){const e=t.byteLength+7&-8;return this.buffers.push(t),this.bufferRegions.push(new co(this._byteLength,e)),this._byteLength+=e,this}function Ho(t){return Go.call(this,t.values.subarray(0,t.length*t.stride))}function Yo(t){const{length:e,values:n,valueOffsets:r}=t,i=V(r[0]),o=V(r[e]),a=Math.min(o-i,n.byteLength-i);return Go.call(this,j(-i,e+1,r)),Go.call(this,n.subarray(i,i+a)),this}function qo(t){const{length:e,valueOffsets:n}=t;if(n){const{0:r,[e]:i}=n;return Go.call(this,j(-r,e+1,n)),this.visit(t.children[0].slice(r,i-r))}return this.visit(t.children[0])}function Ko(t){return this.visitMany(t.type.children.map(((e,n)=>t.children[n])).filter(Boolean))[0]}Wo.prototype.visitBool=function(t){let e;return t.nullCount>=t.length?Go.call(this,new Uint8Array(0)):(e=t.values)instanceof Uint8Array?Go.call(this,Ln(t.offset,t.length,e)):Go.call(this,Nn(t.values))},Wo.prototype.visitInt=Ho,Wo.prototype.visitFloat=Ho,Wo.prototype.visitUtf8=Yo,Wo.prototype.visitLargeUtf8=Yo,Wo.prototype.visitBinary=Yo,Wo.prototype.visitLargeBinary=Yo,Wo.prototype.visitFixedSizeBinary=Ho,Wo.prototype.visitDate=Ho,Wo.prototype.visitTimestamp=Ho,Wo.prototype.visitTime=Ho,Wo.prototype.visitDecimal=Ho,Wo.prototype.visitList=qo,Wo.prototype.visitStruct=Ko,Wo.prototype.visitUnion=function(t){var e;const{type:n,length:r,typeIds:i,valueOffsets:o}=t;if(Go.call(this,i),n.mode===it.Sparse)return Ko.call(this,t);if(n.mode===it.Dense){if(t.offset<=0)return Go.call(this,o),Ko.call(this,t);{const a=new Int32Array(r),s=Object.create(null),l=Object.create(null);for(let t,n,c=-1;++c<r;)void 0!==(t=i[c])&&(void 0===(n=s[t])&&(n=s[t]=o[c]),a[c]=o[c]-n,l[t]=(null!==(e=l[t])&&void 0!==e?e:0)+1);Go.call(this,a),this.visitMany(t.children.map(((t,e)=>{const i=n.typeIds[e],o=s[i],a=l[i];return t.slice(o,Math.min(r,a))})))}}return this},Wo.prototype.visitInterval=Ho,Wo.prototype.visitDuration=Ho,Wo.prototype.visitFixedSizeList=qo,Wo.prototype.visitMap=qo;class Xo extends ai{static throughNode(t){throw new Error('"throughNode" not available in this environment')}static throughDOM(t,e){throw new Error('"throughDOM" not available in this environment')}constructor(t){super(),this._position=0,this._started=!1,this._sink=new li,this._schema=null,this._dictionaryBlocks=[],this._recordBatchBlocks=[],this._seenDictionaries=new Map,this._dictionaryDeltaOffsets=new Map,w(t)||(t={autoDestroy:!0,writeLegacyIpcFormat:!1}),this._autoDestroy="boolean"!=typeof t.autoDestroy||t.autoDestroy,this._writeLegacyIpcFormat="boolean"==typeof t.writeLegacyIpcFormat&&t.writeLegacyIpcFormat}toString(t=!1){return this._sink.toString(t)}toUint8Array(t=!1){return this._sink.toUint8Array(t)}writeAll(t){return x(t)?t.then((t=>this.writeAll(t))):k(t)?ta(this,t):Jo(this,t)}get closed(){return this._sink.closed}[Symbol.asyncIterator](){return this._sink[Symbol.asyncIterator]()}toDOMStream(t){return this._sink.toDOMStream(t)}toNodeStream(t){return this._sink.toNodeStream(t)}close(){return this.reset()._sink.close()}abort(t){return this.reset()._sink.abort(t)}finish(){return this._autoDestroy?this.close():this.reset(this._sink,this._schema),this}reset(t=this._sink,e=null){var n;return t===this._sink||t instanceof li?this._sink=t:(this._sink=new li,t&&w(n=t)&&_(n.abort)&&_(n.getWriter)&&!I(n)?this.toDOMStream({type:"bytes"}).pipeTo(t):t&&(t=>w(t)&&_(t.end)&&_(t.write)&&v(t.writable)&&!I(t))(t)&&this.toNodeStream({objectMode:!1}).pipe(t)),this._started&&this._schema&&this._writeFooter(this._schema),this._started=!1,this._dictionaryBlocks=[],this._recordBatchBlocks=[],this._seenDictionaries=new Map,this._dictionaryDeltaOffsets=new Map,e&&wr(e,this._schema)||(null==e?(this._position=0,this._schema=null):(this._started=!0,this._schema=e,this._writeSchema(e))),this}write(t){let e=null;if(!this._sink)throw new Error("RecordBatchWriter is closed");if(null==t)return this.finish()&&void 0;if(t instanceof Mr&&!(e=t.schema))return this.finish()&&void 0;if(t instanceof Cr&&!(e=t.schema))return this.finish()&&void 0;if(e&&!wr(e,this._schema)){if(this._started&&this._autoDestroy)return this.close();this.reset(this._sink,e)}t instanceof Cr?t instanceof Pr||this._writeRecordBatch(t):t instanceof Mr?this.writeAll(t.batches):S(t)&&this.writeAll(t)}_writeMessage(t,e=8){const n=e-1,r=ao.encode(t),i=r.byteLength,o=this._writeLegacyIpcFormat?4:8,a=i+o+n&~n,s=a-i-o;return t.headerType===kr.RecordBatch?this._recordBatchBlocks.push(new Jr(a,t.bodyLength,this._position)):t.headerType===kr.DictionaryBatch&&this._dictionaryBlocks.push(new Jr(a,t.bodyLength,this._position)),this._writeLegacyIpcFormat||this._write(Int32Array.of(-1)),this._write(Int32Array.of(a-o)),i>0&&this._write(r),this._writePadding(s)}_write(t){if(this._started){const e=O(t);e&&e.byteLength>0&&(this._sink.write(e),this._position+=e.byteLength)}return this}_writeSchema(t){return this._writeMessage(ao.from(t))}_writeFooter(t){return this._writeLegacyIpcFormat?this._write(Int32Array.of(0)):this._write(Int32Array.of(-1,0))}_writeMagic(){return this._write(Co)}_writePadding(t){return t>0?this._write(new Uint8Array(t)):this}_writeRecordBatch(t){const{byteLength:e,nodes:n,bufferRegions:r,buffers:i}=Wo.assemble(t),o=new so(t.numRows,n,r),a=ao.from(o,e);return this._writeDictionaries(t)._writeMessage(a)._writeBodyBuffers(i)}_writeDictionaryBatch(t,e,n=!1){const{byteLength:r,nodes:i,bufferRegions:o,buffers:a}=Wo.assemble(new Zn([t])),s=new so(t.length,i,o),l=new lo(s,e,n),c=ao.from(l,r);return this._writeMessage(c)._writeBodyBuffers(a)}_writeBodyBuffers(t){let e,n,r;for(let i=-1,o=t.length;++i<o;)(e=t[i])&&(n=e.byteLength)>0&&(this._write(e),(r=(n+7&-8)-n)>0&&this._writePadding(r));return this}_writeDictionaries(t){var e,n;for(const[r,i]of t.dictionaries){const t=null!==(e=null==i?void 0:i.data)&&void 0!==e?e:[],o=this._seenDictionaries.get(r),a=null!==(n=this._dictionaryDeltaOffsets.get(r))&&void 0!==n?n:0;if(o&&o.data[0]===t[0]){if(a<t.length)for(const e of t.slice(a))this._writeDictionaryBatch(e,r,!0)}else for(const[e,n]of t.entries())this._writeDictionaryBatch(n,r,e>0);this._seenDictionaries.set(r,i),this._dictionaryDeltaOffsets.set(r,t.length)}return this}}class Qo extends Xo{static writeAll(t,e){const n=new Qo(e);return x(t)?t.then((t=>n.writeAll(t))):k(t)?ta(n,t):Jo(n,t)}}class Zo extends Xo{static writeAll(t){const e=new Zo;return x(t)?t.then((t=>e.writeAll(t))):k(t)?ta(e,t):Jo(e,t)}constructor(){super(),this._autoDestroy=!0}_writeSchema(t){return this._writeMagic()._writePadding(2)}_writeDictionaryBatch(t,e,n=!1){if(!n&&this._seenDictionaries.has(e))throw new Error("The Arrow File format does not support replacement dictionaries. ");return super._writeDictionaryBatch(t,e,n)}_writeFooter(t){const e=Qr.encode(new Qr(t,ir.V5,this._recordBatchBlocks,this._dictionaryBlocks));return super._writeFooter(t)._write(e)._write(Int32Array.of(e.byteLength))._writeMagic()}}function Jo(t,e){let n=e;e instanceof Mr&&(n=e.batches,t.reset(void 0,e.schema));for(const e of n)t.write(e);return t.finish()}function ta(t,e){return u(this,void 0,void 0,(function*(){var n,r,i,o,a,s,l;try{for(n=!0,r=p(e);!(o=(i=yield r.next()).done);n=!0){l=i.value,n=!1;const e=l;t.write(e)}}catch(t){a={error:t}}finally{try{n||o||!(s=r.return)||(yield s.call(r))}finally{if(a)throw a.error}}return t.finish()}))}function ea(t){const e=Ao.from(t);return x(e)?e.then((t=>ea(t))):e.isAsync()?e.readAll().then((t=>new Mr(t))):new Mr(e.readAll())}function na(t,e="stream"){return("stream"===e?Qo:Zo).writeAll(t).toUint8Array(!0)}var ra,ia=function(){function t(t,n,r,i){var o=this;this.getCell=function(t,e){var n=t<o.headerRows&&e<o.headerColumns,r=t>=o.headerRows&&e<o.headerColumns,i=t<o.headerRows&&e>=o.headerColumns;if(n){var a=["blank"];return e>0&&a.push("level"+t),{type:"blank",classNames:a.join(" "),content:""}}if(i)return{type:"columns",classNames:(a=["col_heading","level"+t,"col"+(l=e-o.headerColumns)]).join(" "),content:o.getContent(o.columnsTable,l,t)};if(r)return a=["row_heading","level"+e,"row"+(s=t-o.headerRows)],{type:"index",id:"T_".concat(o.uuid,"level").concat(e,"_row").concat(s),classNames:a.join(" "),content:o.getContent(o.indexTable,s,e)};a=["data","row"+(s=t-o.headerRows),"col"+(l=e-o.headerColumns)];var s,l,c=o.styler?o.getContent(o.styler.displayValuesTable,s,l):o.getContent(o.dataTable,s,l);return{type:"data",id:"T_".concat(o.uuid,"row").concat(s,"_col").concat(l),classNames:a.join(" "),content:c}},this.getContent=function(t,n,r){var i=t.getChildAt(r);return null===i?"":o.getColumnTypeId(t,r)===e.Timestamp?o.nanosToDate(i.get(n)):i.get(n)},this.dataTable=ea(t),this.indexTable=ea(n),this.columnsTable=ea(r),this.styler=i?{caption:i.caption,displayValuesTable:ea(i.displayValues),styles:i.styles,uuid:i.uuid}:void 0}return Object.defineProperty(t.prototype,"rows",{get:function(){return this.indexTable.numRows+this.columnsTable.numCols},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"columns",{get:function(){return this.indexTable.numCols+this.columnsTable.numRows},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"headerRows",{get:function(){return this.rows-this.dataRows},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"headerColumns",{get:function(){return this.columns-this.dataColumns},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"dataRows",{get:function(){return this.dataTable.numRows},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"dataColumns",{get:function(){return this.dataTable.numCols},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"uuid",{get:function(){return this.styler&&this.styler.uuid},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"caption",{get:function(){return this.styler&&this.styler.caption},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"styles",{get:function(){return this.styler&&this.styler.styles},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"table",{get:function(){return this.dataTable},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"index",{get:function(){return this.indexTable},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"columnTable",{get:function(){return this.columnsTable},enumerable:!1,configurable:!0}),t.prototype.serialize=function(){return{data:na(this.dataTable),index:na(this.indexTable),columns:na(this.columnsTable)}},t.prototype.getColumnTypeId=function(t,e){return t.schema.fields[e].type.typeId},t.prototype.nanosToDate=function(t){return new Date(t/1e6)},t}(),oa=function(){return oa=Object.assign||function(t){for(var e,n=1,r=arguments.length;n<r;n++)for(var i in e=arguments[n])Object.prototype.hasOwnProperty.call(e,i)&&(t[i]=e[i]);return t},oa.apply(this,arguments)};!function(t){t.COMPONENT_READY="streamlit:componentReady",t.SET_COMPONENT_VALUE="streamlit:setComponentValue",t.SET_FRAME_HEIGHT="streamlit:setFrameHeight"}(ra||(ra={}));var aa,sa=function(){function t(){}return t.API_VERSION=1,t.RENDER_EVENT="streamlit:render",t.events=new EventTarget,t.registeredMessageListener=!1,t.setComponentReady=function(){t.registeredMessageListener||(window.addEventListener("message",t.onMessageEvent),t.registeredMessageListener=!0),t.sendBackMsg(ra.COMPONENT_READY,{apiVersion:t.API_VERSION})},t.setFrameHeight=function(e){void 0===e&&(e=document.body.scrollHeight),e!==t.lastFrameHeight&&(t.lastFrameHeight=e,t.sendBackMsg(ra.SET_FRAME_HEIGHT,{height:e}))},t.setComponentValue=function(e){var n;e instanceof ia?(n="dataframe",e=e.serialize()):function(t){var e=!1;try{e=t instanceof BigInt64Array||t instanceof BigUint64Array}catch(t){}return t instanceof Int8Array||t instanceof Uint8Array||t instanceof Uint8ClampedArray||t instanceof Int16Array||t instanceof Uint16Array||t instanceof Int32Array||t instanceof Uint32Array||t instanceof Float32Array||t instanceof Float64Array||e}(e)?(n="bytes",e=new Uint8Array(e.buffer)):e instanceof ArrayBuffer?(n="bytes",e=new Uint8Array(e)):n="json",t.sendBackMsg(ra.SET_COMPONENT_VALUE,{value:e,dataType:n})},t.onMessageEvent=function(e){e.data.type===t.RENDER_EVENT&&t.onRenderMessage(e.data)},t.onRenderMessage=function(e){var n=e.args;null==n&&(console.error("Got null args in onRenderMessage. This should never happen"),n={});var r=e.dfs&&e.dfs.length>0?t.argsDataframeToObject(e.dfs):{};n=oa(oa({},n),r);var i=Boolean(e.disabled),o=e.theme;o&&la(o);var a={disabled:i,args:n,theme:o},s=new CustomEvent(t.RENDER_EVENT,{detail:a});t.events.dispatchEvent(s)},t.argsDataframeToObject=function(e){var n=e.map((function(e){var n=e.key,r=e.value;return[n,t.toArrowTable(r)]}));return Object.fromEntries(n)},t.toArrowTable=function(t){var e,n=(e=t.data).data,r=e.index,i=e.columns,o=e.styler;return new ia(n,r,i,o)},t.sendBackMsg=function(t,e){window.parent.postMessage(oa({isStreamlitMessage:!0,type:t},e),"*")},t}(),la=function(t){var e=document.createElement("style");document.head.appendChild(e),e.innerHTML="\n    :root {\n      --primary-color: ".concat(t.primaryColor,";\n      --background-color: ").concat(t.backgroundColor,";\n      --secondary-background-color: ").concat(t.secondaryBackgroundColor,";\n      --text-color: ").concat(t.textColor,";\n      --font: ").concat(t.font,";\n    }\n\n    body {\n      background-color: var(--background-color);\n      color: var(--text-color);\n    }\n  ")},ca=(aa=function(t,e){return aa=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(t,e){t.__proto__=e}||function(t,e){for(var n in e)Object.prototype.hasOwnProperty.call(e,n)&&(t[n]=e[n])},aa(t,e)},function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Class extends value "+String(e)+" is not a constructor or null");function n(){this.constructor=t}aa(t,e),t.prototype=null===e?Object.create(e):(n.prototype=e.prototype,new n)});function ua(t){var e=function(e){function n(t){var n=e.call(this,t)||this;return n.componentDidMount=function(){sa.events.addEventListener(sa.RENDER_EVENT,n.onRenderEvent),sa.setComponentReady()},n.componentDidUpdate=function(){null!=n.state.componentError&&sa.setFrameHeight()},n.componentWillUnmount=function(){sa.events.removeEventListener(sa.RENDER_EVENT,n.onRenderEvent)},n.onRenderEvent=function(t){n.setState({renderData:t.detail})},n.state={renderData:void 0,componentError:void 0},n}return ca(n,e),n.prototype.render=function(){return null!=this.state.componentError?r.createElement("div",null,r.createElement("h1",null,"Component Error"),r.createElement("span",null,this.state.componentError.message)):null==this.state.renderData?null:r.createElement(t,{width:window.innerWidth,disabled:this.state.renderData.disabled,args:this.state.renderData.args,theme:this.state.renderData.theme})},n.getDerivedStateFromError=function(t){return{componentError:t}},n}(r.PureComponent);return l()(e,t)}function da(t,e={}){let n=!1;function r(e){const n=`chakra-${(["container","root"].includes(e??"")?[t]:[t,e]).filter(Boolean).join("__")}`;return{className:n,selector:`.${n}`,toString:()=>e}}return{parts:function(...i){!function(){if(n)throw new Error("[anatomy] .part(...) should only be called once. Did you mean to use .extend(...) ?");n=!0}();for(const t of i)e[t]=r(t);return da(t,e)},toPart:r,extend:function(...n){for(const t of n)t in e||(e[t]=r(t));return da(t,e)},selectors:function(){return Object.fromEntries(Object.entries(e).map((([t,e])=>[t,e.selector])))},classnames:function(){return Object.fromEntries(Object.entries(e).map((([t,e])=>[t,e.className])))},get keys(){return Object.keys(e)},__type:{}}}!function(t){function e(){return null!==t&&t.apply(this,arguments)||this}ca(e,t),e.prototype.componentDidMount=function(){sa.setFrameHeight()},e.prototype.componentDidUpdate=function(){sa.setFrameHeight()}}(r.PureComponent);const ha=da("accordion").parts("root","container","button","panel","icon"),fa=da("alert").parts("title","description","container","icon","spinner"),pa=da("avatar").parts("label","badge","container","excessLabel","group"),ga=da("breadcrumb").parts("link","item","container","separator"),ma=(da("button").parts(),da("checkbox").parts("control","icon","container","label")),ya=(da("progress").parts("track","filledTrack","label"),da("drawer").parts("overlay","dialogContainer","dialog","header","closeButton","body","footer")),ba=da("editable").parts("preview","input","textarea"),va=da("form").parts("container","requiredIndicator","helperText"),_a=da("formError").parts("text","icon"),wa=da("input").parts("addon","field","element","group"),xa=da("list").parts("container","item","icon"),Sa=da("menu").parts("button","list","item","groupTitle","icon","command","divider"),ka=da("modal").parts("overlay","dialogContainer","dialog","header","closeButton","body","footer"),Ca=da("numberinput").parts("root","field","stepperGroup","stepper"),Ta=(da("pininput").parts("field"),da("popover").parts("content","header","body","footer","popper","arrow","closeButton")),Ea=da("progress").parts("label","filledTrack","track"),Pa=da("radio").parts("container","control","label"),Ia=da("select").parts("field","icon"),Aa=da("slider").parts("container","track","thumb","filledTrack","mark"),Ma=da("stat").parts("container","label","helpText","number","icon"),Da=da("switch").parts("container","track","thumb","label"),Fa=da("table").parts("table","thead","tbody","tr","th","td","tfoot","caption"),Ra=da("tabs").parts("root","tab","tablist","tabpanel","tabpanels","indicator"),Ba=da("tag").parts("container","label","closeButton"),La=da("card").parts("container","header","body","footer");function Na(t){return{definePartsStyle:t=>t,defineMultiStyleConfig:e=>({parts:t,...e})}}da("stepper").parts("stepper","step","title","description","indicator","separator","icon","number");const{definePartsStyle:Oa,defineMultiStyleConfig:za}=Na(ha.keys),Ua=za({baseStyle:Oa({container:{borderTopWidth:"1px",borderColor:"inherit",_last:{borderBottomWidth:"1px"}},button:{transitionProperty:"common",transitionDuration:"normal",fontSize:"md",_focusVisible:{boxShadow:"outline"},_hover:{bg:"blackAlpha.50"},_disabled:{opacity:.4,cursor:"not-allowed"},px:"4",py:"2"},panel:{pt:"2",px:"4",pb:"5"},icon:{fontSize:"1.25em"}})});function ja(t,e){return`var(${t}${e?`, ${e}`:""})`}function Va(t,e=""){return function(t){return function(t){return t.replace(/[!-,/:-@[-^`{-~]/g,"\\$&")}(function(t){return t.includes("\\.")||Number.isInteger(parseFloat(t.toString()))?t:t.replace(".","\\.")}(function(t,e="-"){return t.replace(/\s+/g,e)}(t.toString())))}(`--${function(t,e=""){return[e,t].filter(Boolean).join("-")}(t,e)}`)}function $a(t,e,n){const r=Va(t,n);return{variable:r,reference:ja(r,e)}}function Wa(t,e,n){return Math.min(Math.max(t,n),e)}class Ga extends Error{constructor(t){super(`Failed to parse color: "${t}"`)}}var Ha=Ga;function Ya(t){if("string"!=typeof t)throw new Ha(t);if("transparent"===t.trim().toLowerCase())return[0,0,0,0];let e=t.trim();e=es.test(t)?function(t){const e=t.toLowerCase().trim(),n=Ka[function(t){let e=5381,n=t.length;for(;n;)e=33*e^t.charCodeAt(--n);return(e>>>0)%2341}(e)];if(!n)throw new Ha(t);return`#${n}`}(t):t;const n=Qa.exec(e);if(n){const t=Array.from(n).slice(1);return[...t.slice(0,3).map((t=>parseInt(Xa(t,2),16))),parseInt(Xa(t[3]||"f",2),16)/255]}const r=Za.exec(e);if(r){const t=Array.from(r).slice(1);return[...t.slice(0,3).map((t=>parseInt(t,16))),parseInt(t[3]||"ff",16)/255]}const i=Ja.exec(e);if(i){const t=Array.from(i).slice(1);return[...t.slice(0,3).map((t=>parseInt(t,10))),parseFloat(t[3]||"1")]}const o=ts.exec(e);if(o){const[e,n,r,i]=Array.from(o).slice(1).map(parseFloat);if(Wa(0,100,n)!==n)throw new Ha(t);if(Wa(0,100,r)!==r)throw new Ha(t);return[...rs(e,n,r),Number.isNaN(i)?1:i]}throw new Ha(t)}const qa=t=>parseInt(t.replace(/_/g,""),36),Ka="1q29ehhb 1n09sgk7 1kl1ekf_ _yl4zsno 16z9eiv3 1p29lhp8 _bd9zg04 17u0____ _iw9zhe5 _to73___ _r45e31e _7l6g016 _jh8ouiv _zn3qba8 1jy4zshs 11u87k0u 1ro9yvyo 1aj3xael 1gz9zjz0 _3w8l4xo 1bf1ekf_ _ke3v___ _4rrkb__ 13j776yz _646mbhl _nrjr4__ _le6mbhl 1n37ehkb _m75f91n _qj3bzfz 1939yygw 11i5z6x8 _1k5f8xs 1509441m 15t5lwgf _ae2th1n _tg1ugcv 1lp1ugcv 16e14up_ _h55rw7n _ny9yavn _7a11xb_ 1ih442g9 _pv442g9 1mv16xof 14e6y7tu 1oo9zkds 17d1cisi _4v9y70f _y98m8kc 1019pq0v 12o9zda8 _348j4f4 1et50i2o _8epa8__ _ts6senj 1o350i2o 1mi9eiuo 1259yrp0 1ln80gnw _632xcoy 1cn9zldc _f29edu4 1n490c8q _9f9ziet 1b94vk74 _m49zkct 1kz6s73a 1eu9dtog _q58s1rz 1dy9sjiq __u89jo3 _aj5nkwg _ld89jo3 13h9z6wx _qa9z2ii _l119xgq _bs5arju 1hj4nwk9 1qt4nwk9 1ge6wau6 14j9zlcw 11p1edc_ _ms1zcxe _439shk6 _jt9y70f _754zsow 1la40eju _oq5p___ _x279qkz 1fa5r3rv _yd2d9ip _424tcku _8y1di2_ _zi2uabw _yy7rn9h 12yz980_ __39ljp6 1b59zg0x _n39zfzp 1fy9zest _b33k___ _hp9wq92 1il50hz4 _io472ub _lj9z3eo 19z9ykg0 _8t8iu3a 12b9bl4a 1ak5yw0o _896v4ku _tb8k8lv _s59zi6t _c09ze0p 1lg80oqn 1id9z8wb _238nba5 1kq6wgdi _154zssg _tn3zk49 _da9y6tc 1sg7cv4f _r12jvtt 1gq5fmkz 1cs9rvci _lp9jn1c _xw1tdnb 13f9zje6 16f6973h _vo7ir40 _bt5arjf _rc45e4t _hr4e100 10v4e100 _hc9zke2 _w91egv_ _sj2r1kk 13c87yx8 _vqpds__ _ni8ggk8 _tj9yqfb 1ia2j4r4 _7x9b10u 1fc9ld4j 1eq9zldr _5j9lhpx _ez9zl6o _md61fzm".split(" ").reduce(((t,e)=>{const n=qa(e.substring(0,3)),r=qa(e.substring(3)).toString(16);let i="";for(let t=0;t<6-r.length;t++)i+="0";return t[n]=`${i}${r}`,t}),{}),Xa=(t,e)=>Array.from(Array(e)).map((()=>t)).join(""),Qa=new RegExp(`^#${Xa("([a-f0-9])",3)}([a-f0-9])?$`,"i"),Za=new RegExp(`^#${Xa("([a-f0-9]{2})",3)}([a-f0-9]{2})?$`,"i"),Ja=new RegExp(`^rgba?\\(\\s*(\\d+)\\s*${Xa(",\\s*(\\d+)\\s*",2)}(?:,\\s*([\\d.]+))?\\s*\\)$`,"i"),ts=/^hsla?\(\s*([\d.]+)\s*,\s*([\d.]+)%\s*,\s*([\d.]+)%(?:\s*,\s*([\d.]+))?\s*\)$/i,es=/^[a-z]+$/i,ns=t=>Math.round(255*t),rs=(t,e,n)=>{let r=n/100;if(0===e)return[r,r,r].map(ns);const i=(t%360+360)%360/60,o=(1-Math.abs(2*r-1))*(e/100),a=o*(1-Math.abs(i%2-1));let s=0,l=0,c=0;i>=0&&i<1?(s=o,l=a):i>=1&&i<2?(s=a,l=o):i>=2&&i<3?(l=o,c=a):i>=3&&i<4?(l=a,c=o):i>=4&&i<5?(s=a,c=o):i>=5&&i<6&&(s=o,c=a);const u=r-o/2;return[s+u,l+u,c+u].map(ns)};function is(t,e){const[n,r,i,o]=Ya(t);return function(t,e,n,r){return`rgba(${Wa(0,255,t).toFixed()}, ${Wa(0,255,e).toFixed()}, ${Wa(0,255,n).toFixed()}, ${parseFloat(Wa(0,1,r).toFixed(3))})`}(n,r,i,o-e)}const os=(t,e,n)=>{const r=function(t,e,n,r,i){for(e=e.split?e.split("."):e,r=0;r<e.length;r++)t=t?t[e[r]]:i;return t===i?n:t}(t,`colors.${e}`,e);try{return function(t){const[e,n,r,i]=Ya(t);let o=t=>{const e=Wa(0,255,t).toString(16);return 1===e.length?`0${e}`:e};o(e),o(n),o(r),i<1&&o(Math.round(255*i))}(r),r}catch{return n??"#000000"}},as=(t,e)=>n=>is(os(n,t),1-e);function ss(t="1rem",e="rgba(255, 255, 255, 0.15)"){return{backgroundImage:`linear-gradient(\n    45deg,\n    ${e} 25%,\n    transparent 25%,\n    transparent 50%,\n    ${e} 50%,\n    ${e} 75%,\n    transparent 75%,\n    transparent\n  )`,backgroundSize:`${t} ${t}`}}const{definePartsStyle:ls,defineMultiStyleConfig:cs}=Na(fa.keys),us=$a("alert-fg"),ds=$a("alert-bg");function hs(t){const{theme:e,colorScheme:n}=t;return{light:`colors.${n}.100`,dark:as(`${n}.200`,.16)(e)}}const fs=cs({baseStyle:ls({container:{bg:ds.reference,px:"4",py:"3"},title:{fontWeight:"bold",lineHeight:"6",marginEnd:"2"},description:{lineHeight:"6"},icon:{color:us.reference,flexShrink:0,marginEnd:"3",w:"5",h:"6"},spinner:{color:us.reference,flexShrink:0,marginEnd:"3",w:"5",h:"5"}}),variants:{subtle:ls((t=>{const{colorScheme:e}=t,n=hs(t);return{container:{[us.variable]:`colors.${e}.600`,[ds.variable]:n.light,_dark:{[us.variable]:`colors.${e}.200`,[ds.variable]:n.dark}}}})),"left-accent":ls((t=>{const{colorScheme:e}=t,n=hs(t);return{container:{[us.variable]:`colors.${e}.600`,[ds.variable]:n.light,_dark:{[us.variable]:`colors.${e}.200`,[ds.variable]:n.dark},paddingStart:"3",borderStartWidth:"4px",borderStartColor:us.reference}}})),"top-accent":ls((t=>{const{colorScheme:e}=t,n=hs(t);return{container:{[us.variable]:`colors.${e}.600`,[ds.variable]:n.light,_dark:{[us.variable]:`colors.${e}.200`,[ds.variable]:n.dark},pt:"2",borderTopWidth:"4px",borderTopColor:us.reference}}})),solid:ls((t=>{const{colorScheme:e}=t;return{container:{[us.variable]:"colors.white",[ds.variable]:`colors.${e}.600`,_dark:{[us.variable]:"colors.gray.900",[ds.variable]:`colors.${e}.200`},color:us.reference}}}))},defaultProps:{variant:"subtle",colorScheme:"blue"}}),ps={px:"1px",.5:"0.125rem",1:"0.25rem",1.5:"0.375rem",2:"0.5rem",2.5:"0.625rem",3:"0.75rem",3.5:"0.875rem",4:"1rem",5:"1.25rem",6:"1.5rem",7:"1.75rem",8:"2rem",9:"2.25rem",10:"2.5rem",12:"3rem",14:"3.5rem",16:"4rem",20:"5rem",24:"6rem",28:"7rem",32:"8rem",36:"9rem",40:"10rem",44:"11rem",48:"12rem",52:"13rem",56:"14rem",60:"15rem",64:"16rem",72:"18rem",80:"20rem",96:"24rem"},gs={...ps,max:"max-content",min:"min-content",full:"100%","3xs":"14rem","2xs":"16rem",xs:"20rem",sm:"24rem",md:"28rem",lg:"32rem",xl:"36rem","2xl":"42rem","3xl":"48rem","4xl":"56rem","5xl":"64rem","6xl":"72rem","7xl":"80rem","8xl":"90rem",prose:"60ch",container:{sm:"640px",md:"768px",lg:"1024px",xl:"1280px"}};function ms(t,...e){return"function"==typeof t?t(...e):t}const{definePartsStyle:ys,defineMultiStyleConfig:bs}=Na(pa.keys),vs=$a("avatar-border-color"),_s=$a("avatar-bg"),ws=$a("avatar-font-size"),xs=$a("avatar-size"),Ss={borderRadius:"full",border:"0.2em solid",borderColor:vs.reference,[vs.variable]:"white",_dark:{[vs.variable]:"colors.gray.800"}},ks={bg:_s.reference,fontSize:ws.reference,width:xs.reference,height:xs.reference,lineHeight:"1",[_s.variable]:"colors.gray.200",_dark:{[_s.variable]:"colors.whiteAlpha.400"}},Cs=t=>{const{name:e,theme:n}=t,r=e?function(t){const e=`#${Math.floor(16777215*Math.random()).toString(16).padEnd(6,"0")}`;return t&&(n=t,0!==Object.keys(n).length)?t.string&&t.colors?function(t,e){let n=0;if(0===t.length)return e[0];for(let e=0;e<t.length;e+=1)n=t.charCodeAt(e)+((n<<5)-n),n|=0;return n=(n%e.length+e.length)%e.length,e[n]}(t.string,t.colors):t.string&&!t.colors?function(t){let e=0;if(0===t.length)return e.toString();for(let n=0;n<t.length;n+=1)e=t.charCodeAt(n)+((e<<5)-e),e|=0;let n="#";for(let t=0;t<3;t+=1)n+=`00${(e>>8*t&255).toString(16)}`.substr(-2);return n}(t.string):t.colors&&!t.string?function(t){return t[Math.floor(Math.random()*t.length)]}(t.colors):e:e;var n}({string:e}):"colors.gray.400",i=(t=>e=>"dark"===(t=>e=>{const n=(t=>{const[e,n,r]=Ya(t);return(299*e+587*n+114*r)/1e3})(os(e,t));return n<128?"dark":"light"})(t)(e))(r)(n);let o="white";return i||(o="gray.800"),{bg:_s.reference,fontSize:ws.reference,color:o,borderColor:vs.reference,verticalAlign:"top",width:xs.reference,height:xs.reference,"&:not([data-loaded])":{[_s.variable]:r},[vs.variable]:"colors.white",_dark:{[vs.variable]:"colors.gray.800"}}},Ts={fontSize:ws.reference,lineHeight:"1"};function Es(t){const e="100%"!==t?gs[t]:void 0;return ys({container:{[xs.variable]:e??t,[ws.variable]:`calc(${e??t} / 2.5)`},excessLabel:{[xs.variable]:e??t,[ws.variable]:`calc(${e??t} / 2.5)`}})}const Ps=bs({baseStyle:ys((t=>({badge:ms(Ss,t),excessLabel:ms(ks,t),container:ms(Cs,t),label:Ts}))),sizes:{"2xs":Es(4),xs:Es(6),sm:Es(8),md:Es(12),lg:Es(16),xl:Es(24),"2xl":Es(32),full:Es("100%")},defaultProps:{size:"md"}}),Is=function(t){const e={};for(const n of["bg","color","shadow"])if(Array.isArray(n)){const[r,i]=n;e[r]=$a(`${t}-${r}`,i)}else e[n]=$a(`${t}-${n}`);return e}("badge"),As={baseStyle:{px:1,textTransform:"uppercase",fontSize:"xs",borderRadius:"sm",fontWeight:"bold",bg:Is.bg.reference,color:Is.color.reference,boxShadow:Is.shadow.reference},variants:{solid:t=>{const{colorScheme:e,theme:n}=t,r=as(`${e}.500`,.6)(n);return{[Is.bg.variable]:`colors.${e}.500`,[Is.color.variable]:"colors.white",_dark:{[Is.bg.variable]:r,[Is.color.variable]:"colors.whiteAlpha.800"}}},subtle:t=>{const{colorScheme:e,theme:n}=t,r=as(`${e}.200`,.16)(n);return{[Is.bg.variable]:`colors.${e}.100`,[Is.color.variable]:`colors.${e}.800`,_dark:{[Is.bg.variable]:r,[Is.color.variable]:`colors.${e}.200`}}},outline:t=>{const{colorScheme:e,theme:n}=t,r=as(`${e}.200`,.8)(n);return{[Is.color.variable]:`colors.${e}.500`,_dark:{[Is.color.variable]:r},[Is.shadow.variable]:`inset 0 0 0px 1px ${Is.color.reference}`}}},defaultProps:{variant:"subtle",colorScheme:"gray"}},{defineMultiStyleConfig:Ms,definePartsStyle:Ds}=Na(ga.keys),Fs=$a("breadcrumb-link-decor"),Rs=Ms({baseStyle:Ds({link:{transitionProperty:"common",transitionDuration:"fast",transitionTimingFunction:"ease-out",outline:"none",color:"inherit",textDecoration:Fs.reference,[Fs.variable]:"none","&:not([aria-current=page])":{cursor:"pointer",_hover:{[Fs.variable]:"underline"},_focusVisible:{boxShadow:"outline"}}}})});function Bs(t,e){return n=>"dark"===n.colorMode?e:t}function Ls(t){const{orientation:e,vertical:n,horizontal:r}=t;return e?"vertical"===e?n:r:{}}const Ns=t=>{const{colorScheme:e,theme:n}=t;if("gray"===e)return{color:Bs("gray.800","whiteAlpha.900")(t),_hover:{bg:Bs("gray.100","whiteAlpha.200")(t)},_active:{bg:Bs("gray.200","whiteAlpha.300")(t)}};const r=as(`${e}.200`,.12)(n),i=as(`${e}.200`,.24)(n);return{color:Bs(`${e}.600`,`${e}.200`)(t),bg:"transparent",_hover:{bg:Bs(`${e}.50`,r)(t)},_active:{bg:Bs(`${e}.100`,i)(t)}}},Os={yellow:{bg:"yellow.400",color:"black",hoverBg:"yellow.500",activeBg:"yellow.600"},cyan:{bg:"cyan.400",color:"black",hoverBg:"cyan.500",activeBg:"cyan.600"}},zs={baseStyle:{lineHeight:"1.2",borderRadius:"md",fontWeight:"semibold",transitionProperty:"common",transitionDuration:"normal",_focusVisible:{boxShadow:"outline"},_disabled:{opacity:.4,cursor:"not-allowed",boxShadow:"none"},_hover:{_disabled:{bg:"initial"}}},variants:{ghost:Ns,outline:t=>{const{colorScheme:e}=t,n=Bs("gray.200","whiteAlpha.300")(t);return{border:"1px solid",borderColor:"gray"===e?n:"currentColor",".chakra-button__group[data-attached][data-orientation=horizontal] > &:not(:last-of-type)":{marginEnd:"-1px"},".chakra-button__group[data-attached][data-orientation=vertical] > &:not(:last-of-type)":{marginBottom:"-1px"},...ms(Ns,t)}},solid:t=>{const{colorScheme:e}=t;if("gray"===e){const e=Bs("gray.100","whiteAlpha.200")(t);return{bg:e,color:Bs("gray.800","whiteAlpha.900")(t),_hover:{bg:Bs("gray.200","whiteAlpha.300")(t),_disabled:{bg:e}},_active:{bg:Bs("gray.300","whiteAlpha.400")(t)}}}const{bg:n=`${e}.500`,color:r="white",hoverBg:i=`${e}.600`,activeBg:o=`${e}.700`}=Os[e]??{},a=Bs(n,`${e}.200`)(t);return{bg:a,color:Bs(r,"gray.800")(t),_hover:{bg:Bs(i,`${e}.300`)(t),_disabled:{bg:a}},_active:{bg:Bs(o,`${e}.400`)(t)}}},link:t=>{const{colorScheme:e}=t;return{padding:0,height:"auto",lineHeight:"normal",verticalAlign:"baseline",color:Bs(`${e}.500`,`${e}.200`)(t),_hover:{textDecoration:"underline",_disabled:{textDecoration:"none"}},_active:{color:Bs(`${e}.700`,`${e}.500`)(t)}}},unstyled:{bg:"none",color:"inherit",display:"inline",lineHeight:"inherit",m:"0",p:"0"}},sizes:{lg:{h:"12",minW:"12",fontSize:"lg",px:"6"},md:{h:"10",minW:"10",fontSize:"md",px:"4"},sm:{h:"8",minW:"8",fontSize:"sm",px:"3"},xs:{h:"6",minW:"6",fontSize:"xs",px:"2"}},defaultProps:{variant:"solid",size:"md",colorScheme:"gray"}},{definePartsStyle:Us,defineMultiStyleConfig:js}=Na(La.keys),Vs=$a("card-bg"),$s=$a("card-padding"),Ws=$a("card-shadow"),Gs=$a("card-radius"),Hs=$a("card-border-width","0"),Ys=$a("card-border-color"),qs=Us({container:{[Vs.variable]:"colors.chakra-body-bg",backgroundColor:Vs.reference,boxShadow:Ws.reference,borderRadius:Gs.reference,color:"chakra-body-text",borderWidth:Hs.reference,borderColor:Ys.reference},body:{padding:$s.reference,flex:"1 1 0%"},header:{padding:$s.reference},footer:{padding:$s.reference}}),Ks={sm:Us({container:{[Gs.variable]:"radii.base",[$s.variable]:"space.3"}}),md:Us({container:{[Gs.variable]:"radii.md",[$s.variable]:"space.5"}}),lg:Us({container:{[Gs.variable]:"radii.xl",[$s.variable]:"space.7"}})},Xs=js({baseStyle:qs,variants:{elevated:Us({container:{[Ws.variable]:"shadows.base",_dark:{[Vs.variable]:"colors.gray.700"}}}),outline:Us({container:{[Hs.variable]:"1px",[Ys.variable]:"colors.chakra-border-color"}}),filled:Us({container:{[Vs.variable]:"colors.chakra-subtle-bg"}}),unstyled:{body:{[$s.variable]:0},header:{[$s.variable]:0},footer:{[$s.variable]:0}}},sizes:Ks,defaultProps:{variant:"elevated",size:"md"}}),{definePartsStyle:Qs,defineMultiStyleConfig:Zs}=Na(ma.keys),Js=$a("checkbox-size"),tl=t=>{const{colorScheme:e}=t;return{w:Js.reference,h:Js.reference,transitionProperty:"box-shadow",transitionDuration:"normal",border:"2px solid",borderRadius:"sm",borderColor:"inherit",color:"white",_checked:{bg:Bs(`${e}.500`,`${e}.200`)(t),borderColor:Bs(`${e}.500`,`${e}.200`)(t),color:Bs("white","gray.900")(t),_hover:{bg:Bs(`${e}.600`,`${e}.300`)(t),borderColor:Bs(`${e}.600`,`${e}.300`)(t)},_disabled:{borderColor:Bs("gray.200","transparent")(t),bg:Bs("gray.200","whiteAlpha.300")(t),color:Bs("gray.500","whiteAlpha.500")(t)}},_indeterminate:{bg:Bs(`${e}.500`,`${e}.200`)(t),borderColor:Bs(`${e}.500`,`${e}.200`)(t),color:Bs("white","gray.900")(t)},_disabled:{bg:Bs("gray.100","whiteAlpha.100")(t),borderColor:Bs("gray.100","transparent")(t)},_focusVisible:{boxShadow:"outline"},_invalid:{borderColor:Bs("red.500","red.300")(t)}}},el={_disabled:{cursor:"not-allowed"}},nl={userSelect:"none",_disabled:{opacity:.4}},rl={transitionProperty:"transform",transitionDuration:"normal"},il=Zs({baseStyle:Qs((t=>({icon:rl,container:el,control:ms(tl,t),label:nl}))),sizes:{sm:Qs({control:{[Js.variable]:"sizes.3"},label:{fontSize:"sm"},icon:{fontSize:"3xs"}}),md:Qs({control:{[Js.variable]:"sizes.4"},label:{fontSize:"md"},icon:{fontSize:"2xs"}}),lg:Qs({control:{[Js.variable]:"sizes.5"},label:{fontSize:"lg"},icon:{fontSize:"2xs"}})},defaultProps:{size:"md",colorScheme:"blue"}});function ol(t){const e=function(t,e="-"){return t.replace(/\s+/g,e)}(t.toString());return e.includes("\\.")?t:function(t){return!Number.isInteger(parseFloat(t.toString()))}(t)?e.replace(".","\\."):t}function al(t,e){return`var(${ol(t)}${e?`, ${e}`:""})`}function sl(t,e){const n=function(t,e=""){return`--${function(t,e=""){return[e,ol(t)].filter(Boolean).join("-")}(t,e)}`}(t,e?.prefix);return{variable:n,reference:al(n,(r=e?.fallback,"string"==typeof r?r:r?.reference))};var r}const ll=sl("close-button-size"),cl=sl("close-button-bg"),ul={baseStyle:{w:[ll.reference],h:[ll.reference],borderRadius:"md",transitionProperty:"common",transitionDuration:"normal",_disabled:{opacity:.4,cursor:"not-allowed",boxShadow:"none"},_hover:{[cl.variable]:"colors.blackAlpha.100",_dark:{[cl.variable]:"colors.whiteAlpha.100"}},_active:{[cl.variable]:"colors.blackAlpha.200",_dark:{[cl.variable]:"colors.whiteAlpha.200"}},_focusVisible:{boxShadow:"outline"},bg:cl.reference},sizes:{lg:{[ll.variable]:"sizes.10",fontSize:"md"},md:{[ll.variable]:"sizes.8",fontSize:"xs"},sm:{[ll.variable]:"sizes.6",fontSize:"2xs"}},defaultProps:{size:"md"}},{variants:dl,defaultProps:hl}=As,fl={baseStyle:{fontFamily:"mono",fontSize:"sm",px:"0.2em",borderRadius:"sm",bg:Is.bg.reference,color:Is.color.reference,boxShadow:Is.shadow.reference},variants:dl,defaultProps:hl},{definePartsStyle:pl,defineMultiStyleConfig:gl}=Na(ya.keys),ml=$a("drawer-bg"),yl=$a("drawer-box-shadow");function bl(t){return pl("full"===t?{dialog:{maxW:"100vw",h:"100vh"}}:{dialog:{maxW:t}})}const vl={bg:"blackAlpha.600",zIndex:"modal"},_l={display:"flex",zIndex:"modal",justifyContent:"center"},wl=t=>{const{isFullHeight:e}=t;return{...e&&{height:"100vh"},zIndex:"modal",maxH:"100vh",color:"inherit",[ml.variable]:"colors.white",[yl.variable]:"shadows.lg",_dark:{[ml.variable]:"colors.gray.700",[yl.variable]:"shadows.dark-lg"},bg:ml.reference,boxShadow:yl.reference}},xl={px:"6",py:"4",fontSize:"xl",fontWeight:"semibold"},Sl={position:"absolute",top:"2",insetEnd:"3"},kl={px:"6",py:"2",flex:"1",overflow:"auto"},Cl={px:"6",py:"4"},Tl=gl({baseStyle:pl((t=>({overlay:vl,dialogContainer:_l,dialog:ms(wl,t),header:xl,closeButton:Sl,body:kl,footer:Cl}))),sizes:{xs:bl("xs"),sm:bl("md"),md:bl("lg"),lg:bl("2xl"),xl:bl("4xl"),full:bl("full")},defaultProps:{size:"xs"}}),{definePartsStyle:El,defineMultiStyleConfig:Pl}=Na(ba.keys),Il=Pl({baseStyle:El({preview:{borderRadius:"md",py:"1",transitionProperty:"common",transitionDuration:"normal"},input:{borderRadius:"md",py:"1",transitionProperty:"common",transitionDuration:"normal",width:"full",_focusVisible:{boxShadow:"outline"},_placeholder:{opacity:.6}},textarea:{borderRadius:"md",py:"1",transitionProperty:"common",transitionDuration:"normal",width:"full",_focusVisible:{boxShadow:"outline"},_placeholder:{opacity:.6}}})}),{definePartsStyle:Al,defineMultiStyleConfig:Ml}=Na(va.keys),Dl=$a("form-control-color"),Fl=Ml({baseStyle:Al({container:{width:"100%",position:"relative"},requiredIndicator:{marginStart:"1",[Dl.variable]:"colors.red.500",_dark:{[Dl.variable]:"colors.red.300"},color:Dl.reference},helperText:{mt:"2",[Dl.variable]:"colors.gray.600",_dark:{[Dl.variable]:"colors.whiteAlpha.600"},color:Dl.reference,lineHeight:"normal",fontSize:"sm"}})}),{definePartsStyle:Rl,defineMultiStyleConfig:Bl}=Na(_a.keys),Ll=$a("form-error-color"),Nl=Bl({baseStyle:Rl({text:{[Ll.variable]:"colors.red.500",_dark:{[Ll.variable]:"colors.red.300"},color:Ll.reference,mt:"2",fontSize:"sm",lineHeight:"normal"},icon:{marginEnd:"0.5em",[Ll.variable]:"colors.red.500",_dark:{[Ll.variable]:"colors.red.300"},color:Ll.reference}})}),{definePartsStyle:Ol,defineMultiStyleConfig:zl}=Na(wa.keys),Ul=$a("input-height"),jl=$a("input-font-size"),Vl=$a("input-padding"),$l=$a("input-border-radius"),Wl=Ol({addon:{height:Ul.reference,fontSize:jl.reference,px:Vl.reference,borderRadius:$l.reference},field:{width:"100%",height:Ul.reference,fontSize:jl.reference,px:Vl.reference,borderRadius:$l.reference,minWidth:0,outline:0,position:"relative",appearance:"none",transitionProperty:"common",transitionDuration:"normal",_disabled:{opacity:.4,cursor:"not-allowed"}}}),Gl={lg:{[jl.variable]:"fontSizes.lg",[Vl.variable]:"space.4",[$l.variable]:"radii.md",[Ul.variable]:"sizes.12"},md:{[jl.variable]:"fontSizes.md",[Vl.variable]:"space.4",[$l.variable]:"radii.md",[Ul.variable]:"sizes.10"},sm:{[jl.variable]:"fontSizes.sm",[Vl.variable]:"space.3",[$l.variable]:"radii.sm",[Ul.variable]:"sizes.8"},xs:{[jl.variable]:"fontSizes.xs",[Vl.variable]:"space.2",[$l.variable]:"radii.sm",[Ul.variable]:"sizes.6"}},Hl={lg:Ol({field:Gl.lg,group:Gl.lg}),md:Ol({field:Gl.md,group:Gl.md}),sm:Ol({field:Gl.sm,group:Gl.sm}),xs:Ol({field:Gl.xs,group:Gl.xs})};function Yl(t){const{focusBorderColor:e,errorBorderColor:n}=t;return{focusBorderColor:e||Bs("blue.500","blue.300")(t),errorBorderColor:n||Bs("red.500","red.300")(t)}}const ql=Ol((t=>{const{theme:e}=t,{focusBorderColor:n,errorBorderColor:r}=Yl(t);return{field:{border:"1px solid",borderColor:"inherit",bg:"inherit",_hover:{borderColor:Bs("gray.300","whiteAlpha.400")(t)},_readOnly:{boxShadow:"none !important",userSelect:"all"},_invalid:{borderColor:os(e,r),boxShadow:`0 0 0 1px ${os(e,r)}`},_focusVisible:{zIndex:1,borderColor:os(e,n),boxShadow:`0 0 0 1px ${os(e,n)}`}},addon:{border:"1px solid",borderColor:Bs("inherit","whiteAlpha.50")(t),bg:Bs("gray.100","whiteAlpha.300")(t)}}})),Kl=Ol((t=>{const{theme:e}=t,{focusBorderColor:n,errorBorderColor:r}=Yl(t);return{field:{border:"2px solid",borderColor:"transparent",bg:Bs("gray.100","whiteAlpha.50")(t),_hover:{bg:Bs("gray.200","whiteAlpha.100")(t)},_readOnly:{boxShadow:"none !important",userSelect:"all"},_invalid:{borderColor:os(e,r)},_focusVisible:{bg:"transparent",borderColor:os(e,n)}},addon:{border:"2px solid",borderColor:"transparent",bg:Bs("gray.100","whiteAlpha.50")(t)}}})),Xl=Ol((t=>{const{theme:e}=t,{focusBorderColor:n,errorBorderColor:r}=Yl(t);return{field:{borderBottom:"1px solid",borderColor:"inherit",borderRadius:"0",px:"0",bg:"transparent",_readOnly:{boxShadow:"none !important",userSelect:"all"},_invalid:{borderColor:os(e,r),boxShadow:`0px 1px 0px 0px ${os(e,r)}`},_focusVisible:{borderColor:os(e,n),boxShadow:`0px 1px 0px 0px ${os(e,n)}`}},addon:{borderBottom:"2px solid",borderColor:"inherit",borderRadius:"0",px:"0",bg:"transparent"}}})),Ql=zl({baseStyle:Wl,sizes:Hl,variants:{outline:ql,filled:Kl,flushed:Xl,unstyled:Ol({field:{bg:"transparent",px:"0",height:"auto"},addon:{bg:"transparent",px:"0",height:"auto"}})},defaultProps:{size:"md",variant:"outline"}}),Zl=$a("kbd-bg"),Jl={baseStyle:{[Zl.variable]:"colors.gray.100",_dark:{[Zl.variable]:"colors.whiteAlpha.100"},bg:Zl.reference,borderRadius:"md",borderWidth:"1px",borderBottomWidth:"3px",fontSize:"0.8em",fontWeight:"bold",lineHeight:"normal",px:"0.4em",whiteSpace:"nowrap"}},{defineMultiStyleConfig:tc,definePartsStyle:ec}=Na(xa.keys),nc=tc({baseStyle:ec({icon:{marginEnd:"2",display:"inline",verticalAlign:"text-bottom"}})}),{defineMultiStyleConfig:rc,definePartsStyle:ic}=Na(Sa.keys),oc=$a("menu-bg"),ac=$a("menu-shadow"),sc=rc({baseStyle:ic({button:{transitionProperty:"common",transitionDuration:"normal"},list:{[oc.variable]:"#fff",[ac.variable]:"shadows.sm",_dark:{[oc.variable]:"colors.gray.700",[ac.variable]:"shadows.dark-lg"},color:"inherit",minW:"3xs",py:"2",zIndex:"dropdown",borderRadius:"md",borderWidth:"1px",bg:oc.reference,boxShadow:ac.reference},item:{py:"1.5",px:"3",transitionProperty:"background",transitionDuration:"ultra-fast",transitionTimingFunction:"ease-in",_focus:{[oc.variable]:"colors.gray.100",_dark:{[oc.variable]:"colors.whiteAlpha.100"}},_active:{[oc.variable]:"colors.gray.200",_dark:{[oc.variable]:"colors.whiteAlpha.200"}},_expanded:{[oc.variable]:"colors.gray.100",_dark:{[oc.variable]:"colors.whiteAlpha.100"}},_disabled:{opacity:.4,cursor:"not-allowed"},bg:oc.reference},groupTitle:{mx:4,my:2,fontWeight:"semibold",fontSize:"sm"},icon:{display:"inline-flex",alignItems:"center",justifyContent:"center",flexShrink:0},command:{opacity:.6},divider:{border:0,borderBottom:"1px solid",borderColor:"inherit",my:"2",opacity:.6}})}),{defineMultiStyleConfig:lc,definePartsStyle:cc}=Na(ka.keys),uc=$a("modal-bg"),dc=$a("modal-shadow"),hc={bg:"blackAlpha.600",zIndex:"modal"},fc=t=>{const{isCentered:e,scrollBehavior:n}=t;return{display:"flex",zIndex:"modal",justifyContent:"center",alignItems:e?"center":"flex-start",overflow:"inside"===n?"hidden":"auto",overscrollBehaviorY:"none"}},pc=t=>{const{isCentered:e,scrollBehavior:n}=t;return{borderRadius:"md",color:"inherit",my:e?"auto":"16",mx:e?"auto":void 0,zIndex:"modal",maxH:"inside"===n?"calc(100% - 7.5rem)":void 0,[uc.variable]:"colors.white",[dc.variable]:"shadows.lg",_dark:{[uc.variable]:"colors.gray.700",[dc.variable]:"shadows.dark-lg"},bg:uc.reference,boxShadow:dc.reference}},gc={px:"6",py:"4",fontSize:"xl",fontWeight:"semibold"},mc={position:"absolute",top:"2",insetEnd:"3"},yc=t=>{const{scrollBehavior:e}=t;return{px:"6",py:"2",flex:"1",overflow:"inside"===e?"auto":void 0}},bc={px:"6",py:"4"};function vc(t){return cc("full"===t?{dialog:{maxW:"100vw",minH:"$100vh",my:"0",borderRadius:"0"}}:{dialog:{maxW:t}})}const _c=lc({baseStyle:cc((t=>({overlay:hc,dialogContainer:ms(fc,t),dialog:ms(pc,t),header:gc,closeButton:mc,body:ms(yc,t),footer:bc}))),sizes:{xs:vc("xs"),sm:vc("sm"),md:vc("md"),lg:vc("lg"),xl:vc("xl"),"2xl":vc("2xl"),"3xl":vc("3xl"),"4xl":vc("4xl"),"5xl":vc("5xl"),"6xl":vc("6xl"),full:vc("full")},defaultProps:{size:"md"}});function wc(t){return Array.isArray(t)}function xc(t){const e=typeof t;return null!=t&&("object"===e||"function"===e)&&!wc(t)}function Sc(t){return xc(t)&&t.reference?t.reference:String(t)}const kc=(t,...e)=>e.map(Sc).join(` ${t} `).replace(/calc/g,""),Cc=(...t)=>`calc(${kc("+",...t)})`,Tc=(...t)=>`calc(${kc("-",...t)})`,Ec=(...t)=>`calc(${kc("*",...t)})`,Pc=(...t)=>`calc(${kc("/",...t)})`,Ic=t=>{const e=Sc(t);return null==e||Number.isNaN(parseFloat(e))?Ec(e,-1):String(e).startsWith("-")?String(e).slice(1):`-${e}`},Ac=Object.assign((t=>({add:(...e)=>Ac(Cc(t,...e)),subtract:(...e)=>Ac(Tc(t,...e)),multiply:(...e)=>Ac(Ec(t,...e)),divide:(...e)=>Ac(Pc(t,...e)),negate:()=>Ac(Ic(t)),toString:()=>t.toString()})),{add:Cc,subtract:Tc,multiply:Ec,divide:Pc,negate:Ic}),Mc={letterSpacings:{tighter:"-0.05em",tight:"-0.025em",normal:"0",wide:"0.025em",wider:"0.05em",widest:"0.1em"},lineHeights:{normal:"normal",none:1,shorter:1.25,short:1.375,base:1.5,tall:1.625,taller:"2",3:".75rem",4:"1rem",5:"1.25rem",6:"1.5rem",7:"1.75rem",8:"2rem",9:"2.25rem",10:"2.5rem"},fontWeights:{hairline:100,thin:200,light:300,normal:400,medium:500,semibold:600,bold:700,extrabold:800,black:900},fonts:{heading:'-apple-system, BlinkMacSystemFont, "Segoe UI", Helvetica, Arial, sans-serif, "Apple Color Emoji", "Segoe UI Emoji", "Segoe UI Symbol"',body:'-apple-system, BlinkMacSystemFont, "Segoe UI", Helvetica, Arial, sans-serif, "Apple Color Emoji", "Segoe UI Emoji", "Segoe UI Symbol"',mono:'SFMono-Regular,Menlo,Monaco,Consolas,"Liberation Mono","Courier New",monospace'},fontSizes:{"3xs":"0.45rem","2xs":"0.625rem",xs:"0.75rem",sm:"0.875rem",md:"1rem",lg:"1.125rem",xl:"1.25rem","2xl":"1.5rem","3xl":"1.875rem","4xl":"2.25rem","5xl":"3rem","6xl":"3.75rem","7xl":"4.5rem","8xl":"6rem","9xl":"8rem"}},{defineMultiStyleConfig:Dc,definePartsStyle:Fc}=Na(Ca.keys),Rc=sl("number-input-stepper-width"),Bc=sl("number-input-input-padding"),Lc=Ac(Rc).add("0.5rem").toString(),Nc=sl("number-input-bg"),Oc=sl("number-input-color"),zc=sl("number-input-border-color"),Uc={[Rc.variable]:"sizes.6",[Bc.variable]:Lc},jc=t=>ms(Ql.baseStyle,t)?.field??{},Vc={width:Rc.reference},$c={borderStart:"1px solid",borderStartColor:zc.reference,color:Oc.reference,bg:Nc.reference,[Oc.variable]:"colors.chakra-body-text",[zc.variable]:"colors.chakra-border-color",_dark:{[Oc.variable]:"colors.whiteAlpha.800",[zc.variable]:"colors.whiteAlpha.300"},_active:{[Nc.variable]:"colors.gray.200",_dark:{[Nc.variable]:"colors.whiteAlpha.300"}},_disabled:{opacity:.4,cursor:"not-allowed"}};function Wc(t){const e=Ql.sizes?.[t],n={lg:"md",md:"md",sm:"sm",xs:"sm"},r=e.field?.fontSize??"md",i=Mc.fontSizes[r];return Fc({field:{...e.field,paddingInlineEnd:Bc.reference,verticalAlign:"top"},stepper:{fontSize:Ac(i).multiply(.75).toString(),_first:{borderTopEndRadius:n[t]},_last:{borderBottomEndRadius:n[t],mt:"-1px",borderTopWidth:1}}})}const Gc=Dc({baseStyle:Fc((t=>({root:Uc,field:ms(jc,t)??{},stepperGroup:Vc,stepper:$c}))),sizes:{xs:Wc("xs"),sm:Wc("sm"),md:Wc("md"),lg:Wc("lg")},variants:Ql.variants,defaultProps:Ql.defaultProps}),Hc={baseStyle:{...Ql.baseStyle?.field,textAlign:"center"},sizes:{lg:{fontSize:"lg",w:12,h:12,borderRadius:"md"},md:{fontSize:"md",w:10,h:10,borderRadius:"md"},sm:{fontSize:"sm",w:8,h:8,borderRadius:"sm"},xs:{fontSize:"xs",w:6,h:6,borderRadius:"sm"}},variants:{outline:t=>ms(Ql.variants?.outline,t)?.field??{},flushed:t=>ms(Ql.variants?.flushed,t)?.field??{},filled:t=>ms(Ql.variants?.filled,t)?.field??{},unstyled:Ql.variants?.unstyled.field??{}},defaultProps:Ql.defaultProps},{defineMultiStyleConfig:Yc,definePartsStyle:qc}=Na(Ta.keys),Kc=sl("popper-bg"),Xc=sl("popper-arrow-bg"),Qc=sl("popper-arrow-shadow-color"),Zc=Yc({baseStyle:qc({popper:{zIndex:"popover"},content:{[Kc.variable]:"colors.white",bg:Kc.reference,[Xc.variable]:Kc.reference,[Qc.variable]:"colors.gray.200",_dark:{[Kc.variable]:"colors.gray.700",[Qc.variable]:"colors.whiteAlpha.300"},width:"xs",border:"1px solid",borderColor:"inherit",borderRadius:"md",boxShadow:"sm",zIndex:"inherit",_focusVisible:{outline:0,boxShadow:"outline"}},header:{px:3,py:2,borderBottomWidth:"1px"},body:{px:3,py:2},footer:{px:3,py:2,borderTopWidth:"1px"},closeButton:{position:"absolute",borderRadius:"md",top:1,insetEnd:2,padding:2}})}),{defineMultiStyleConfig:Jc,definePartsStyle:tu}=Na(Ea.keys),eu=t=>{const{colorScheme:e,theme:n,isIndeterminate:r,hasStripe:i}=t,o=Bs(ss(),ss("1rem","rgba(0,0,0,0.1)"))(t),a=Bs(`${e}.500`,`${e}.200`)(t),s=`linear-gradient(\n    to right,\n    transparent 0%,\n    ${os(n,a)} 50%,\n    transparent 100%\n  )`;return{...!r&&i&&o,...r?{bgImage:s}:{bgColor:a}}},nu={lineHeight:"1",fontSize:"0.25em",fontWeight:"bold",color:"white"},ru=t=>({bg:Bs("gray.100","whiteAlpha.300")(t)}),iu=t=>({transitionProperty:"common",transitionDuration:"slow",...eu(t)}),ou=tu((t=>({label:nu,filledTrack:iu(t),track:ru(t)}))),au=Jc({sizes:{xs:tu({track:{h:"1"}}),sm:tu({track:{h:"2"}}),md:tu({track:{h:"3"}}),lg:tu({track:{h:"4"}})},baseStyle:ou,defaultProps:{size:"md",colorScheme:"blue"}}),{defineMultiStyleConfig:su,definePartsStyle:lu}=Na(Pa.keys),cu=t=>{const e=ms(il.baseStyle,t)?.control;return{...e,borderRadius:"full",_checked:{...e?._checked,_before:{content:'""',display:"inline-block",pos:"relative",w:"50%",h:"50%",borderRadius:"50%",bg:"currentColor"}}}},uu=su({baseStyle:lu((t=>({label:il.baseStyle?.(t).label,container:il.baseStyle?.(t).container,control:cu(t)}))),sizes:{md:lu({control:{w:"4",h:"4"},label:{fontSize:"md"}}),lg:lu({control:{w:"5",h:"5"},label:{fontSize:"lg"}}),sm:lu({control:{width:"3",height:"3"},label:{fontSize:"sm"}})},defaultProps:{size:"md",colorScheme:"blue"}}),{defineMultiStyleConfig:du,definePartsStyle:hu}=Na(Ia.keys),fu=$a("select-bg"),pu={paddingInlineEnd:"8"},gu=du({baseStyle:hu({field:{...Ql.baseStyle?.field,appearance:"none",paddingBottom:"1px",lineHeight:"normal",bg:fu.reference,[fu.variable]:"colors.white",_dark:{[fu.variable]:"colors.gray.700"},"> option, > optgroup":{bg:fu.reference}},icon:{width:"6",height:"100%",insetEnd:"2",position:"relative",color:"currentColor",fontSize:"xl",_disabled:{opacity:.5}}}),sizes:{lg:{...Ql.sizes?.lg,field:{...Ql.sizes?.lg.field,...pu}},md:{...Ql.sizes?.md,field:{...Ql.sizes?.md.field,...pu}},sm:{...Ql.sizes?.sm,field:{...Ql.sizes?.sm.field,...pu}},xs:{...Ql.sizes?.xs,field:{...Ql.sizes?.xs.field,...pu},icon:{insetEnd:"1"}}},variants:Ql.variants,defaultProps:Ql.defaultProps}),mu=$a("skeleton-start-color"),yu=$a("skeleton-end-color"),bu={baseStyle:{[mu.variable]:"colors.gray.100",[yu.variable]:"colors.gray.400",_dark:{[mu.variable]:"colors.gray.800",[yu.variable]:"colors.gray.600"},background:mu.reference,borderColor:yu.reference,opacity:.7,borderRadius:"sm"}},vu=$a("skip-link-bg"),_u={baseStyle:{borderRadius:"md",fontWeight:"semibold",_focusVisible:{boxShadow:"outline",padding:"4",position:"fixed",top:"6",insetStart:"6",[vu.variable]:"colors.white",_dark:{[vu.variable]:"colors.gray.700"},bg:vu.reference}}};function wu(t){return xc(t)&&t.reference?t.reference:String(t)}const xu=(t,...e)=>e.map(wu).join(` ${t} `).replace(/calc/g,""),Su=(...t)=>`calc(${xu("+",...t)})`,ku=(...t)=>`calc(${xu("-",...t)})`,Cu=(...t)=>`calc(${xu("*",...t)})`,Tu=(...t)=>`calc(${xu("/",...t)})`,Eu=t=>{const e=wu(t);return null==e||Number.isNaN(parseFloat(e))?Cu(e,-1):String(e).startsWith("-")?String(e).slice(1):`-${e}`},Pu=Object.assign((t=>({add:(...e)=>Pu(Su(t,...e)),subtract:(...e)=>Pu(ku(t,...e)),multiply:(...e)=>Pu(Cu(t,...e)),divide:(...e)=>Pu(Tu(t,...e)),negate:()=>Pu(Eu(t)),toString:()=>t.toString()})),{add:Su,subtract:ku,multiply:Cu,divide:Tu,negate:Eu}),{defineMultiStyleConfig:Iu,definePartsStyle:Au}=Na(Aa.keys),Mu=$a("slider-thumb-size"),Du=$a("slider-track-size"),Fu=$a("slider-bg"),Ru=t=>{const{orientation:e}=t;return{display:"inline-block",position:"relative",cursor:"pointer",_disabled:{opacity:.6,cursor:"default",pointerEvents:"none"},...Ls({orientation:e,vertical:{h:"100%",px:Pu(Mu.reference).divide(2).toString()},horizontal:{w:"100%",py:Pu(Mu.reference).divide(2).toString()}})}},Bu=t=>({...Ls({orientation:t.orientation,horizontal:{h:Du.reference},vertical:{w:Du.reference}}),overflow:"hidden",borderRadius:"sm",[Fu.variable]:"colors.gray.200",_dark:{[Fu.variable]:"colors.whiteAlpha.200"},_disabled:{[Fu.variable]:"colors.gray.300",_dark:{[Fu.variable]:"colors.whiteAlpha.300"}},bg:Fu.reference}),Lu=t=>{const{orientation:e}=t;return{...Ls({orientation:e,vertical:{left:"50%",transform:"translateX(-50%)",_active:{transform:"translateX(-50%) scale(1.15)"}},horizontal:{top:"50%",transform:"translateY(-50%)",_active:{transform:"translateY(-50%) scale(1.15)"}}}),w:Mu.reference,h:Mu.reference,display:"flex",alignItems:"center",justifyContent:"center",position:"absolute",outline:0,zIndex:1,borderRadius:"full",bg:"white",boxShadow:"base",border:"1px solid",borderColor:"transparent",transitionProperty:"transform",transitionDuration:"normal",_focusVisible:{boxShadow:"outline"},_disabled:{bg:"gray.300"}}},Nu=t=>{const{colorScheme:e}=t;return{width:"inherit",height:"inherit",[Fu.variable]:`colors.${e}.500`,_dark:{[Fu.variable]:`colors.${e}.200`},bg:Fu.reference}},Ou=Iu({baseStyle:Au((t=>({container:Ru(t),track:Bu(t),thumb:Lu(t),filledTrack:Nu(t)}))),sizes:{lg:Au({container:{[Mu.variable]:"sizes.4",[Du.variable]:"sizes.1"}}),md:Au({container:{[Mu.variable]:"sizes.3.5",[Du.variable]:"sizes.1"}}),sm:Au({container:{[Mu.variable]:"sizes.2.5",[Du.variable]:"sizes.0.5"}})},defaultProps:{size:"md",colorScheme:"blue"}}),zu=sl("spinner-size"),Uu={baseStyle:{width:[zu.reference],height:[zu.reference]},sizes:{xs:{[zu.variable]:"sizes.3"},sm:{[zu.variable]:"sizes.4"},md:{[zu.variable]:"sizes.6"},lg:{[zu.variable]:"sizes.8"},xl:{[zu.variable]:"sizes.12"}},defaultProps:{size:"md"}},{defineMultiStyleConfig:ju,definePartsStyle:Vu}=Na(Ma.keys),$u=ju({baseStyle:Vu({container:{},label:{fontWeight:"medium"},helpText:{opacity:.8,marginBottom:"2"},number:{verticalAlign:"baseline",fontWeight:"semibold"},icon:{marginEnd:1,w:"3.5",h:"3.5",verticalAlign:"middle"}}),sizes:{md:Vu({label:{fontSize:"sm"},helpText:{fontSize:"sm"},number:{fontSize:"2xl"}})},defaultProps:{size:"md"}}),{defineMultiStyleConfig:Wu,definePartsStyle:Gu}=Na(["stepper","step","title","description","indicator","separator","icon","number"]),Hu=$a("stepper-indicator-size"),Yu=$a("stepper-icon-size"),qu=$a("stepper-title-font-size"),Ku=$a("stepper-description-font-size"),Xu=$a("stepper-accent-color"),Qu=Wu({baseStyle:Gu((({colorScheme:t})=>({stepper:{display:"flex",justifyContent:"space-between",gap:"4","&[data-orientation=vertical]":{flexDirection:"column",alignItems:"flex-start"},"&[data-orientation=horizontal]":{flexDirection:"row",alignItems:"center"},[Xu.variable]:`colors.${t}.500`,_dark:{[Xu.variable]:`colors.${t}.200`}},title:{fontSize:qu.reference,fontWeight:"medium"},description:{fontSize:Ku.reference,color:"chakra-subtle-text"},number:{fontSize:qu.reference},step:{flexShrink:0,position:"relative",display:"flex",gap:"2","&[data-orientation=horizontal]":{alignItems:"center"},flex:"1","&:last-of-type:not([data-stretch])":{flex:"initial"}},icon:{flexShrink:0,width:Yu.reference,height:Yu.reference},indicator:{flexShrink:0,borderRadius:"full",width:Hu.reference,height:Hu.reference,display:"flex",justifyContent:"center",alignItems:"center","&[data-status=active]":{borderWidth:"2px",borderColor:Xu.reference},"&[data-status=complete]":{bg:Xu.reference,color:"chakra-inverse-text"},"&[data-status=incomplete]":{borderWidth:"2px"}},separator:{bg:"chakra-border-color",flex:"1","&[data-status=complete]":{bg:Xu.reference},"&[data-orientation=horizontal]":{width:"100%",height:"2px",marginStart:"2"},"&[data-orientation=vertical]":{width:"2px",position:"absolute",height:"100%",maxHeight:`calc(100% - ${Hu.reference} - 8px)`,top:`calc(${Hu.reference} + 4px)`,insetStart:`calc(${Hu.reference} / 2 - 1px)`}}}))),sizes:{xs:Gu({stepper:{[Hu.variable]:"sizes.4",[Yu.variable]:"sizes.3",[qu.variable]:"fontSizes.xs",[Ku.variable]:"fontSizes.xs"}}),sm:Gu({stepper:{[Hu.variable]:"sizes.6",[Yu.variable]:"sizes.4",[qu.variable]:"fontSizes.sm",[Ku.variable]:"fontSizes.xs"}}),md:Gu({stepper:{[Hu.variable]:"sizes.8",[Yu.variable]:"sizes.5",[qu.variable]:"fontSizes.md",[Ku.variable]:"fontSizes.sm"}}),lg:Gu({stepper:{[Hu.variable]:"sizes.10",[Yu.variable]:"sizes.6",[qu.variable]:"fontSizes.lg",[Ku.variable]:"fontSizes.md"}})},defaultProps:{size:"md",colorScheme:"blue"}}),{defineMultiStyleConfig:Zu,definePartsStyle:Ju}=Na(Da.keys),td=sl("switch-track-width"),ed=sl("switch-track-height"),nd=sl("switch-track-diff"),rd=Ac.subtract(td,ed),id=sl("switch-thumb-x"),od=sl("switch-bg"),ad=t=>{const{colorScheme:e}=t;return{borderRadius:"full",p:"0.5",width:[td.reference],height:[ed.reference],transitionProperty:"common",transitionDuration:"fast",[od.variable]:"colors.gray.300",_dark:{[od.variable]:"colors.whiteAlpha.400"},_focusVisible:{boxShadow:"outline"},_disabled:{opacity:.4,cursor:"not-allowed"},_checked:{[od.variable]:`colors.${e}.500`,_dark:{[od.variable]:`colors.${e}.200`}},bg:od.reference}},sd={bg:"white",transitionProperty:"transform",transitionDuration:"normal",borderRadius:"inherit",width:[ed.reference],height:[ed.reference],_checked:{transform:`translateX(${id.reference})`}},ld=Zu({baseStyle:Ju((t=>({container:{[nd.variable]:rd,[id.variable]:nd.reference,_rtl:{[id.variable]:Ac(nd).negate().toString()}},track:ad(t),thumb:sd}))),sizes:{sm:Ju({container:{[td.variable]:"1.375rem",[ed.variable]:"sizes.3"}}),md:Ju({container:{[td.variable]:"1.875rem",[ed.variable]:"sizes.4"}}),lg:Ju({container:{[td.variable]:"2.875rem",[ed.variable]:"sizes.6"}})},defaultProps:{size:"md",colorScheme:"blue"}}),{defineMultiStyleConfig:cd,definePartsStyle:ud}=Na(Fa.keys),dd=ud({table:{fontVariantNumeric:"lining-nums tabular-nums",borderCollapse:"collapse",width:"full"},th:{fontFamily:"heading",fontWeight:"bold",textTransform:"uppercase",letterSpacing:"wider",textAlign:"start"},td:{textAlign:"start"},caption:{mt:4,fontFamily:"heading",textAlign:"center",fontWeight:"medium"}}),hd={"&[data-is-numeric=true]":{textAlign:"end"}},fd=cd({baseStyle:dd,variants:{simple:ud((t=>{const{colorScheme:e}=t;return{th:{color:Bs("gray.600","gray.400")(t),borderBottom:"1px",borderColor:Bs(`${e}.100`,`${e}.700`)(t),...hd},td:{borderBottom:"1px",borderColor:Bs(`${e}.100`,`${e}.700`)(t),...hd},caption:{color:Bs("gray.600","gray.100")(t)},tfoot:{tr:{"&:last-of-type":{th:{borderBottomWidth:0}}}}}})),striped:ud((t=>{const{colorScheme:e}=t;return{th:{color:Bs("gray.600","gray.400")(t),borderBottom:"1px",borderColor:Bs(`${e}.100`,`${e}.700`)(t),...hd},td:{borderBottom:"1px",borderColor:Bs(`${e}.100`,`${e}.700`)(t),...hd},caption:{color:Bs("gray.600","gray.100")(t)},tbody:{tr:{"&:nth-of-type(odd)":{"th, td":{borderBottomWidth:"1px",borderColor:Bs(`${e}.100`,`${e}.700`)(t)},td:{background:Bs(`${e}.100`,`${e}.700`)(t)}}}},tfoot:{tr:{"&:last-of-type":{th:{borderBottomWidth:0}}}}}})),unstyled:{}},sizes:{sm:ud({th:{px:"4",py:"1",lineHeight:"4",fontSize:"xs"},td:{px:"4",py:"2",fontSize:"sm",lineHeight:"4"},caption:{px:"4",py:"2",fontSize:"xs"}}),md:ud({th:{px:"6",py:"3",lineHeight:"4",fontSize:"xs"},td:{px:"6",py:"4",lineHeight:"5"},caption:{px:"6",py:"2",fontSize:"sm"}}),lg:ud({th:{px:"8",py:"4",lineHeight:"5",fontSize:"sm"},td:{px:"8",py:"5",lineHeight:"6"},caption:{px:"6",py:"2",fontSize:"md"}})},defaultProps:{variant:"simple",size:"md",colorScheme:"gray"}}),pd=$a("tabs-color"),gd=$a("tabs-bg"),md=$a("tabs-border-color"),{defineMultiStyleConfig:yd,definePartsStyle:bd}=Na(Ra.keys),vd=t=>{const{orientation:e}=t;return{display:"vertical"===e?"flex":"block"}},_d=t=>{const{isFitted:e}=t;return{flex:e?1:void 0,transitionProperty:"common",transitionDuration:"normal",_focusVisible:{zIndex:1,boxShadow:"outline"},_disabled:{cursor:"not-allowed",opacity:.4}}},wd=t=>{const{align:e="start",orientation:n}=t;return{justifyContent:{end:"flex-end",center:"center",start:"flex-start"}[e],flexDirection:"vertical"===n?"column":"row"}},xd={p:4},Sd=bd((t=>({root:vd(t),tab:_d(t),tablist:wd(t),tabpanel:xd}))),kd={sm:bd({tab:{py:1,px:4,fontSize:"sm"}}),md:bd({tab:{fontSize:"md",py:2,px:4}}),lg:bd({tab:{fontSize:"lg",py:3,px:4}})},Cd=bd((t=>{const{colorScheme:e,orientation:n}=t,r="vertical"===n,i=r?"borderStart":"borderBottom",o=r?"marginStart":"marginBottom";return{tablist:{[i]:"2px solid",borderColor:"inherit"},tab:{[i]:"2px solid",borderColor:"transparent",[o]:"-2px",_selected:{[pd.variable]:`colors.${e}.600`,_dark:{[pd.variable]:`colors.${e}.300`},borderColor:"currentColor"},_active:{[gd.variable]:"colors.gray.200",_dark:{[gd.variable]:"colors.whiteAlpha.300"}},_disabled:{_active:{bg:"none"}},color:pd.reference,bg:gd.reference}}})),Td=bd((t=>{const{colorScheme:e}=t;return{tab:{borderTopRadius:"md",border:"1px solid",borderColor:"transparent",mb:"-1px",[md.variable]:"transparent",_selected:{[pd.variable]:`colors.${e}.600`,[md.variable]:"colors.white",_dark:{[pd.variable]:`colors.${e}.300`,[md.variable]:"colors.gray.800"},borderColor:"inherit",borderBottomColor:md.reference},color:pd.reference},tablist:{mb:"-1px",borderBottom:"1px solid",borderColor:"inherit"}}})),Ed=bd((t=>{const{colorScheme:e}=t;return{tab:{border:"1px solid",borderColor:"inherit",[gd.variable]:"colors.gray.50",_dark:{[gd.variable]:"colors.whiteAlpha.50"},mb:"-1px",_notLast:{marginEnd:"-1px"},_selected:{[gd.variable]:"colors.white",[pd.variable]:`colors.${e}.600`,_dark:{[gd.variable]:"colors.gray.800",[pd.variable]:`colors.${e}.300`},borderColor:"inherit",borderTopColor:"currentColor",borderBottomColor:"transparent"},color:pd.reference,bg:gd.reference},tablist:{mb:"-1px",borderBottom:"1px solid",borderColor:"inherit"}}})),Pd=bd((t=>{const{colorScheme:e,theme:n}=t;return{tab:{borderRadius:"full",fontWeight:"semibold",color:"gray.600",_selected:{color:os(n,`${e}.700`),bg:os(n,`${e}.100`)}}}})),Id=yd({baseStyle:Sd,sizes:kd,variants:{line:Cd,enclosed:Td,"enclosed-colored":Ed,"soft-rounded":Pd,"solid-rounded":bd((t=>{const{colorScheme:e}=t;return{tab:{borderRadius:"full",fontWeight:"semibold",[pd.variable]:"colors.gray.600",_dark:{[pd.variable]:"inherit"},_selected:{[pd.variable]:"colors.white",[gd.variable]:`colors.${e}.600`,_dark:{[pd.variable]:"colors.gray.800",[gd.variable]:`colors.${e}.300`}},color:pd.reference,bg:gd.reference}}})),unstyled:bd({})},defaultProps:{size:"md",variant:"line",colorScheme:"blue"}}),{defineMultiStyleConfig:Ad,definePartsStyle:Md}=Na(Ba.keys),Dd=$a("tag-bg"),Fd=$a("tag-color"),Rd=$a("tag-shadow"),Bd=$a("tag-min-height"),Ld=$a("tag-min-width"),Nd=$a("tag-font-size"),Od=$a("tag-padding-inline"),zd=Md({container:{fontWeight:"medium",lineHeight:1.2,outline:0,[Fd.variable]:Is.color.reference,[Dd.variable]:Is.bg.reference,[Rd.variable]:Is.shadow.reference,color:Fd.reference,bg:Dd.reference,boxShadow:Rd.reference,borderRadius:"md",minH:Bd.reference,minW:Ld.reference,fontSize:Nd.reference,px:Od.reference,_focusVisible:{[Rd.variable]:"shadows.outline"}},label:{lineHeight:1.2,overflow:"visible"},closeButton:{fontSize:"lg",w:"5",h:"5",transitionProperty:"common",transitionDuration:"normal",borderRadius:"full",marginStart:"1.5",marginEnd:"-1",opacity:.5,_disabled:{opacity:.4},_focusVisible:{boxShadow:"outline",bg:"rgba(0, 0, 0, 0.14)"},_hover:{opacity:.8},_active:{opacity:1}}}),Ud={sm:Md({container:{[Bd.variable]:"sizes.5",[Ld.variable]:"sizes.5",[Nd.variable]:"fontSizes.xs",[Od.variable]:"space.2"},closeButton:{marginEnd:"-2px",marginStart:"0.35rem"}}),md:Md({container:{[Bd.variable]:"sizes.6",[Ld.variable]:"sizes.6",[Nd.variable]:"fontSizes.sm",[Od.variable]:"space.2"}}),lg:Md({container:{[Bd.variable]:"sizes.8",[Ld.variable]:"sizes.8",[Nd.variable]:"fontSizes.md",[Od.variable]:"space.3"}})},jd=Ad({variants:{subtle:Md((t=>({container:As.variants?.subtle(t)}))),solid:Md((t=>({container:As.variants?.solid(t)}))),outline:Md((t=>({container:As.variants?.outline(t)})))},baseStyle:zd,sizes:Ud,defaultProps:{size:"md",variant:"subtle",colorScheme:"gray"}}),Vd={...Ql.baseStyle?.field,paddingY:"2",minHeight:"20",lineHeight:"short",verticalAlign:"top"},$d={outline:t=>Ql.variants?.outline(t).field??{},flushed:t=>Ql.variants?.flushed(t).field??{},filled:t=>Ql.variants?.filled(t).field??{},unstyled:Ql.variants?.unstyled.field??{}},Wd={baseStyle:Vd,sizes:{xs:Ql.sizes?.xs.field??{},sm:Ql.sizes?.sm.field??{},md:Ql.sizes?.md.field??{},lg:Ql.sizes?.lg.field??{}},variants:$d,defaultProps:{size:"md",variant:"outline"}},Gd=sl("tooltip-bg"),Hd=sl("tooltip-fg"),Yd=sl("popper-arrow-bg"),qd={bg:Gd.reference,color:Hd.reference,[Gd.variable]:"colors.gray.700",[Hd.variable]:"colors.whiteAlpha.900",_dark:{[Gd.variable]:"colors.gray.300",[Hd.variable]:"colors.gray.900"},[Yd.variable]:Gd.reference,px:"2",py:"0.5",borderRadius:"sm",fontWeight:"medium",fontSize:"sm",boxShadow:"md",maxW:"xs",zIndex:"tooltip"},Kd={Accordion:Ua,Alert:fs,Avatar:Ps,Badge:As,Breadcrumb:Rs,Button:zs,Checkbox:il,CloseButton:ul,Code:fl,Container:{baseStyle:{w:"100%",mx:"auto",maxW:"prose",px:"4"}},Divider:{baseStyle:{opacity:.6,borderColor:"inherit"},variants:{solid:{borderStyle:"solid"},dashed:{borderStyle:"dashed"}},defaultProps:{variant:"solid"}},Drawer:Tl,Editable:Il,Form:Fl,FormError:Nl,FormLabel:{baseStyle:{fontSize:"md",marginEnd:"3",mb:"2",fontWeight:"medium",transitionProperty:"common",transitionDuration:"normal",opacity:1,_disabled:{opacity:.4}}},Heading:{baseStyle:{fontFamily:"heading",fontWeight:"bold"},sizes:{"4xl":{fontSize:["6xl",null,"7xl"],lineHeight:1},"3xl":{fontSize:["5xl",null,"6xl"],lineHeight:1},"2xl":{fontSize:["4xl",null,"5xl"],lineHeight:[1.2,null,1]},xl:{fontSize:["3xl",null,"4xl"],lineHeight:[1.33,null,1.2]},lg:{fontSize:["2xl",null,"3xl"],lineHeight:[1.33,null,1.2]},md:{fontSize:"xl",lineHeight:1.2},sm:{fontSize:"md",lineHeight:1.2},xs:{fontSize:"sm",lineHeight:1.2}},defaultProps:{size:"xl"}},Input:Ql,Kbd:Jl,Link:{baseStyle:{transitionProperty:"common",transitionDuration:"fast",transitionTimingFunction:"ease-out",cursor:"pointer",textDecoration:"none",outline:"none",color:"inherit",_hover:{textDecoration:"underline"},_focusVisible:{boxShadow:"outline"}}},List:nc,Menu:sc,Modal:_c,NumberInput:Gc,PinInput:Hc,Popover:Zc,Progress:au,Radio:uu,Select:gu,Skeleton:bu,SkipLink:_u,Slider:Ou,Spinner:Uu,Stat:$u,Switch:ld,Table:fd,Tabs:Id,Tag:jd,Textarea:Wd,Tooltip:{baseStyle:qd},Card:Xs,Stepper:Qu},Xd={breakpoints:{base:"0em",sm:"30em",md:"48em",lg:"62em",xl:"80em","2xl":"96em"},zIndices:{hide:-1,auto:"auto",base:0,docked:10,dropdown:1e3,sticky:1100,banner:1200,overlay:1300,modal:1400,popover:1500,skipLink:1600,toast:1700,tooltip:1800},radii:{none:"0",sm:"0.125rem",base:"0.25rem",md:"0.375rem",lg:"0.5rem",xl:"0.75rem","2xl":"1rem","3xl":"1.5rem",full:"9999px"},blur:{none:0,sm:"4px",base:"8px",md:"12px",lg:"16px",xl:"24px","2xl":"40px","3xl":"64px"},colors:{transparent:"transparent",current:"currentColor",black:"#000000",white:"#FFFFFF",whiteAlpha:{50:"rgba(255, 255, 255, 0.04)",100:"rgba(255, 255, 255, 0.06)",200:"rgba(255, 255, 255, 0.08)",300:"rgba(255, 255, 255, 0.16)",400:"rgba(255, 255, 255, 0.24)",500:"rgba(255, 255, 255, 0.36)",600:"rgba(255, 255, 255, 0.48)",700:"rgba(255, 255, 255, 0.64)",800:"rgba(255, 255, 255, 0.80)",900:"rgba(255, 255, 255, 0.92)"},blackAlpha:{50:"rgba(0, 0, 0, 0.04)",100:"rgba(0, 0, 0, 0.06)",200:"rgba(0, 0, 0, 0.08)",300:"rgba(0, 0, 0, 0.16)",400:"rgba(0, 0, 0, 0.24)",500:"rgba(0, 0, 0, 0.36)",600:"rgba(0, 0, 0, 0.48)",700:"rgba(0, 0, 0, 0.64)",800:"rgba(0, 0, 0, 0.80)",900:"rgba(0, 0, 0, 0.92)"},gray:{50:"#F7FAFC",100:"#EDF2F7",200:"#E2E8F0",300:"#CBD5E0",400:"#A0AEC0",500:"#718096",600:"#4A5568",700:"#2D3748",800:"#1A202C",900:"#171923"},red:{50:"#FFF5F5",100:"#FED7D7",200:"#FEB2B2",300:"#FC8181",400:"#F56565",500:"#E53E3E",600:"#C53030",700:"#9B2C2C",800:"#822727",900:"#63171B"},orange:{50:"#FFFAF0",100:"#FEEBC8",200:"#FBD38D",300:"#F6AD55",400:"#ED8936",500:"#DD6B20",600:"#C05621",700:"#9C4221",800:"#7B341E",900:"#652B19"},yellow:{50:"#FFFFF0",100:"#FEFCBF",200:"#FAF089",300:"#F6E05E",400:"#ECC94B",500:"#D69E2E",600:"#B7791F",700:"#975A16",800:"#744210",900:"#5F370E"},green:{50:"#F0FFF4",100:"#C6F6D5",200:"#9AE6B4",300:"#68D391",400:"#48BB78",500:"#38A169",600:"#2F855A",700:"#276749",800:"#22543D",900:"#1C4532"},teal:{50:"#E6FFFA",100:"#B2F5EA",200:"#81E6D9",300:"#4FD1C5",400:"#38B2AC",500:"#319795",600:"#2C7A7B",700:"#285E61",800:"#234E52",900:"#1D4044"},blue:{50:"#ebf8ff",100:"#bee3f8",200:"#90cdf4",300:"#63b3ed",400:"#4299e1",500:"#3182ce",600:"#2b6cb0",700:"#2c5282",800:"#2a4365",900:"#1A365D"},cyan:{50:"#EDFDFD",100:"#C4F1F9",200:"#9DECF9",300:"#76E4F7",400:"#0BC5EA",500:"#00B5D8",600:"#00A3C4",700:"#0987A0",800:"#086F83",900:"#065666"},purple:{50:"#FAF5FF",100:"#E9D8FD",200:"#D6BCFA",300:"#B794F4",400:"#9F7AEA",500:"#805AD5",600:"#6B46C1",700:"#553C9A",800:"#44337A",900:"#322659"},pink:{50:"#FFF5F7",100:"#FED7E2",200:"#FBB6CE",300:"#F687B3",400:"#ED64A6",500:"#D53F8C",600:"#B83280",700:"#97266D",800:"#702459",900:"#521B41"}},...Mc,sizes:gs,shadows:{xs:"0 0 0 1px rgba(0, 0, 0, 0.05)",sm:"0 1px 2px 0 rgba(0, 0, 0, 0.05)",base:"0 1px 3px 0 rgba(0, 0, 0, 0.1), 0 1px 2px 0 rgba(0, 0, 0, 0.06)",md:"0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06)",lg:"0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -2px rgba(0, 0, 0, 0.05)",xl:"0 20px 25px -5px rgba(0, 0, 0, 0.1), 0 10px 10px -5px rgba(0, 0, 0, 0.04)","2xl":"0 25px 50px -12px rgba(0, 0, 0, 0.25)",outline:"0 0 0 3px rgba(66, 153, 225, 0.6)",inner:"inset 0 2px 4px 0 rgba(0,0,0,0.06)",none:"none","dark-lg":"rgba(0, 0, 0, 0.1) 0px 0px 0px 1px, rgba(0, 0, 0, 0.2) 0px 5px 10px, rgba(0, 0, 0, 0.4) 0px 15px 40px"},space:ps,borders:{none:0,"1px":"1px solid","2px":"2px solid","4px":"4px solid","8px":"8px solid"},transition:{property:{common:"background-color, border-color, color, fill, stroke, opacity, box-shadow, transform",colors:"background-color, border-color, color, fill, stroke",dimensions:"width, height",position:"left, right, top, bottom",background:"background-color, background-image, background-position"},easing:{"ease-in":"cubic-bezier(0.4, 0, 1, 1)","ease-out":"cubic-bezier(0, 0, 0.2, 1)","ease-in-out":"cubic-bezier(0.4, 0, 0.2, 1)"},duration:{"ultra-fast":"50ms",faster:"100ms",fast:"150ms",normal:"200ms",slow:"300ms",slower:"400ms","ultra-slow":"500ms"}}},Qd={colors:{"chakra-body-text":{_light:"gray.800",_dark:"whiteAlpha.900"},"chakra-body-bg":{_light:"white",_dark:"gray.800"},"chakra-border-color":{_light:"gray.200",_dark:"whiteAlpha.300"},"chakra-inverse-text":{_light:"white",_dark:"gray.800"},"chakra-subtle-bg":{_light:"gray.100",_dark:"gray.700"},"chakra-subtle-text":{_light:"gray.600",_dark:"gray.400"},"chakra-placeholder-color":{_light:"gray.500",_dark:"whiteAlpha.400"}}},Zd={global:{body:{fontFamily:"body",color:"chakra-body-text",bg:"chakra-body-bg",transitionProperty:"background-color",transitionDuration:"normal",lineHeight:"base"},"*::placeholder":{color:"chakra-placeholder-color"},"*, *::before, &::after":{borderColor:"chakra-border-color"}}},Jd={useSystemColorMode:!1,initialColorMode:"light",cssVarPrefix:"chakra"},th={semanticTokens:Qd,direction:"ltr",...Xd,components:Kd,styles:Zd,config:Jd},eh={semanticTokens:Qd,direction:"ltr",components:{},...Xd,styles:Zd,config:Jd};var nh=i(4384),rh=function(){function t(t){var e=this;this._insertTag=function(t){var n;n=0===e.tags.length?e.insertionPoint?e.insertionPoint.nextSibling:e.prepend?e.container.firstChild:e.before:e.tags[e.tags.length-1].nextSibling,e.container.insertBefore(t,n),e.tags.push(t)},this.isSpeedy=void 0===t.speedy||t.speedy,this.tags=[],this.ctr=0,this.nonce=t.nonce,this.key=t.key,this.container=t.container,this.prepend=t.prepend,this.insertionPoint=t.insertionPoint,this.before=null}var e=t.prototype;return e.hydrate=function(t){t.forEach(this._insertTag)},e.insert=function(t){this.ctr%(this.isSpeedy?65e3:1)==0&&this._insertTag(function(t){var e=document.createElement("style");return e.setAttribute("data-emotion",t.key),void 0!==t.nonce&&e.setAttribute("nonce",t.nonce),e.appendChild(document.createTextNode("")),e.setAttribute("data-s",""),e}(this));var e=this.tags[this.tags.length-1];if(this.isSpeedy){var n=function(t){if(t.sheet)return t.sheet;for(var e=0;e<document.styleSheets.length;e++)if(document.styleSheets[e].ownerNode===t)return document.styleSheets[e]}(e);try{n.insertRule(t,n.cssRules.length)}catch(t){}}else e.appendChild(document.createTextNode(t));this.ctr++},e.flush=function(){this.tags.forEach((function(t){var e;return null==(e=t.parentNode)?void 0:e.removeChild(t)})),this.tags=[],this.ctr=0},t}(),ih=Math.abs,oh=String.fromCharCode,ah=Object.assign;function sh(t){return t.trim()}function lh(t,e,n){return t.replace(e,n)}function ch(t,e){return t.indexOf(e)}function uh(t,e){return 0|t.charCodeAt(e)}function dh(t,e,n){return t.slice(e,n)}function hh(t){return t.length}function fh(t){return t.length}function ph(t,e){return e.push(t),t}var gh=1,mh=1,yh=0,bh=0,vh=0,_h="";function wh(t,e,n,r,i,o,a){return{value:t,root:e,parent:n,type:r,props:i,children:o,line:gh,column:mh,length:a,return:""}}function xh(t,e){return ah(wh("",null,null,"",null,null,0),t,{length:-t.length},e)}function Sh(){return vh=bh>0?uh(_h,--bh):0,mh--,10===vh&&(mh=1,gh--),vh}function kh(){return vh=bh<yh?uh(_h,bh++):0,mh++,10===vh&&(mh=1,gh++),vh}function Ch(){return uh(_h,bh)}function Th(){return bh}function Eh(t,e){return dh(_h,t,e)}function Ph(t){switch(t){case 0:case 9:case 10:case 13:case 32:return 5;case 33:case 43:case 44:case 47:case 62:case 64:case 126:case 59:case 123:case 125:return 4;case 58:return 3;case 34:case 39:case 40:case 91:return 2;case 41:case 93:return 1}return 0}function Ih(t){return gh=mh=1,yh=hh(_h=t),bh=0,[]}function Ah(t){return _h="",t}function Mh(t){return sh(Eh(bh-1,Rh(91===t?t+2:40===t?t+1:t)))}function Dh(t){for(;(vh=Ch())&&vh<33;)kh();return Ph(t)>2||Ph(vh)>3?"":" "}function Fh(t,e){for(;--e&&kh()&&!(vh<48||vh>102||vh>57&&vh<65||vh>70&&vh<97););return Eh(t,Th()+(e<6&&32==Ch()&&32==kh()))}function Rh(t){for(;kh();)switch(vh){case t:return bh;case 34:case 39:34!==t&&39!==t&&Rh(vh);break;case 40:41===t&&Rh(t);break;case 92:kh()}return bh}function Bh(t,e){for(;kh()&&t+vh!==57&&(t+vh!==84||47!==Ch()););return"/*"+Eh(e,bh-1)+"*"+oh(47===t?t:kh())}function Lh(t){for(;!Ph(Ch());)kh();return Eh(t,bh)}var Nh="-ms-",Oh="-moz-",zh="-webkit-",Uh="comm",jh="rule",Vh="decl",$h="@keyframes";function Wh(t,e){for(var n="",r=fh(t),i=0;i<r;i++)n+=e(t[i],i,t,e)||"";return n}function Gh(t,e,n,r){switch(t.type){case"@layer":if(t.children.length)break;case"@import":case Vh:return t.return=t.return||t.value;case Uh:return"";case $h:return t.return=t.value+"{"+Wh(t.children,r)+"}";case jh:t.value=t.props.join(",")}return hh(n=Wh(t.children,r))?t.return=t.value+"{"+n+"}":""}function Hh(t){return Ah(Yh("",null,null,null,[""],t=Ih(t),0,[0],t))}function Yh(t,e,n,r,i,o,a,s,l){for(var c=0,u=0,d=a,h=0,f=0,p=0,g=1,m=1,y=1,b=0,v="",_=i,w=o,x=r,S=v;m;)switch(p=b,b=kh()){case 40:if(108!=p&&58==uh(S,d-1)){-1!=ch(S+=lh(Mh(b),"&","&\f"),"&\f")&&(y=-1);break}case 34:case 39:case 91:S+=Mh(b);break;case 9:case 10:case 13:case 32:S+=Dh(p);break;case 92:S+=Fh(Th()-1,7);continue;case 47:switch(Ch()){case 42:case 47:ph(Kh(Bh(kh(),Th()),e,n),l);break;default:S+="/"}break;case 123*g:s[c++]=hh(S)*y;case 125*g:case 59:case 0:switch(b){case 0:case 125:m=0;case 59+u:-1==y&&(S=lh(S,/\f/g,"")),f>0&&hh(S)-d&&ph(f>32?Xh(S+";",r,n,d-1):Xh(lh(S," ","")+";",r,n,d-2),l);break;case 59:S+=";";default:if(ph(x=qh(S,e,n,c,u,i,s,v,_=[],w=[],d),o),123===b)if(0===u)Yh(S,e,x,x,_,o,d,s,w);else switch(99===h&&110===uh(S,3)?100:h){case 100:case 108:case 109:case 115:Yh(t,x,x,r&&ph(qh(t,x,x,0,0,i,s,v,i,_=[],d),w),i,w,d,s,r?_:w);break;default:Yh(S,x,x,x,[""],w,0,s,w)}}c=u=f=0,g=y=1,v=S="",d=a;break;case 58:d=1+hh(S),f=p;default:if(g<1)if(123==b)--g;else if(125==b&&0==g++&&125==Sh())continue;switch(S+=oh(b),b*g){case 38:y=u>0?1:(S+="\f",-1);break;case 44:s[c++]=(hh(S)-1)*y,y=1;break;case 64:45===Ch()&&(S+=Mh(kh())),h=Ch(),u=d=hh(v=S+=Lh(Th())),b++;break;case 45:45===p&&2==hh(S)&&(g=0)}}return o}function qh(t,e,n,r,i,o,a,s,l,c,u){for(var d=i-1,h=0===i?o:[""],f=fh(h),p=0,g=0,m=0;p<r;++p)for(var y=0,b=dh(t,d+1,d=ih(g=a[p])),v=t;y<f;++y)(v=sh(g>0?h[y]+" "+b:lh(b,/&\f/g,h[y])))&&(l[m++]=v);return wh(t,e,n,0===i?jh:s,l,c,u)}function Kh(t,e,n){return wh(t,e,n,Uh,oh(vh),dh(t,2,-2),0)}function Xh(t,e,n,r){return wh(t,e,n,Vh,dh(t,0,r),dh(t,r+1,-1),r)}var Qh=function(t,e,n){for(var r=0,i=0;r=i,i=Ch(),38===r&&12===i&&(e[n]=1),!Ph(i);)kh();return Eh(t,bh)},Zh=new WeakMap,Jh=function(t){if("rule"===t.type&&t.parent&&!(t.length<1)){for(var e=t.value,n=t.parent,r=t.column===n.column&&t.line===n.line;"rule"!==n.type;)if(!(n=n.parent))return;if((1!==t.props.length||58===e.charCodeAt(0)||Zh.get(n))&&!r){Zh.set(t,!0);for(var i=[],o=function(t,e){return Ah(function(t,e){var n=-1,r=44;do{switch(Ph(r)){case 0:38===r&&12===Ch()&&(e[n]=1),t[n]+=Qh(bh-1,e,n);break;case 2:t[n]+=Mh(r);break;case 4:if(44===r){t[++n]=58===Ch()?"&\f":"",e[n]=t[n].length;break}default:t[n]+=oh(r)}}while(r=kh());return t}(Ih(t),e))}(e,i),a=n.props,s=0,l=0;s<o.length;s++)for(var c=0;c<a.length;c++,l++)t.props[l]=i[s]?o[s].replace(/&\f/g,a[c]):a[c]+" "+o[s]}}},tf=function(t){if("decl"===t.type){var e=t.value;108===e.charCodeAt(0)&&98===e.charCodeAt(2)&&(t.return="",t.value="")}};function ef(t,e){switch(function(t,e){return 45^uh(t,0)?(((e<<2^uh(t,0))<<2^uh(t,1))<<2^uh(t,2))<<2^uh(t,3):0}(t,e)){case 5103:return zh+"print-"+t+t;case 5737:case 4201:case 3177:case 3433:case 1641:case 4457:case 2921:case 5572:case 6356:case 5844:case 3191:case 6645:case 3005:case 6391:case 5879:case 5623:case 6135:case 4599:case 4855:case 4215:case 6389:case 5109:case 5365:case 5621:case 3829:return zh+t+t;case 5349:case 4246:case 4810:case 6968:case 2756:return zh+t+Oh+t+Nh+t+t;case 6828:case 4268:return zh+t+Nh+t+t;case 6165:return zh+t+Nh+"flex-"+t+t;case 5187:return zh+t+lh(t,/(\w+).+(:[^]+)/,zh+"box-$1$2"+Nh+"flex-$1$2")+t;case 5443:return zh+t+Nh+"flex-item-"+lh(t,/flex-|-self/,"")+t;case 4675:return zh+t+Nh+"flex-line-pack"+lh(t,/align-content|flex-|-self/,"")+t;case 5548:return zh+t+Nh+lh(t,"shrink","negative")+t;case 5292:return zh+t+Nh+lh(t,"basis","preferred-size")+t;case 6060:return zh+"box-"+lh(t,"-grow","")+zh+t+Nh+lh(t,"grow","positive")+t;case 4554:return zh+lh(t,/([^-])(transform)/g,"$1"+zh+"$2")+t;case 6187:return lh(lh(lh(t,/(zoom-|grab)/,zh+"$1"),/(image-set)/,zh+"$1"),t,"")+t;case 5495:case 3959:return lh(t,/(image-set\([^]*)/,zh+"$1$`$1");case 4968:return lh(lh(t,/(.+:)(flex-)?(.*)/,zh+"box-pack:$3"+Nh+"flex-pack:$3"),/s.+-b[^;]+/,"justify")+zh+t+t;case 4095:case 3583:case 4068:case 2532:return lh(t,/(.+)-inline(.+)/,zh+"$1$2")+t;case 8116:case 7059:case 5753:case 5535:case 5445:case 5701:case 4933:case 4677:case 5533:case 5789:case 5021:case 4765:if(hh(t)-1-e>6)switch(uh(t,e+1)){case 109:if(45!==uh(t,e+4))break;case 102:return lh(t,/(.+:)(.+)-([^]+)/,"$1"+zh+"$2-$3$1"+Oh+(108==uh(t,e+3)?"$3":"$2-$3"))+t;case 115:return~ch(t,"stretch")?ef(lh(t,"stretch","fill-available"),e)+t:t}break;case 4949:if(115!==uh(t,e+1))break;case 6444:switch(uh(t,hh(t)-3-(~ch(t,"!important")&&10))){case 107:return lh(t,":",":"+zh)+t;case 101:return lh(t,/(.+:)([^;!]+)(;|!.+)?/,"$1"+zh+(45===uh(t,14)?"inline-":"")+"box$3$1"+zh+"$2$3$1"+Nh+"$2box$3")+t}break;case 5936:switch(uh(t,e+11)){case 114:return zh+t+Nh+lh(t,/[svh]\w+-[tblr]{2}/,"tb")+t;case 108:return zh+t+Nh+lh(t,/[svh]\w+-[tblr]{2}/,"tb-rl")+t;case 45:return zh+t+Nh+lh(t,/[svh]\w+-[tblr]{2}/,"lr")+t}return zh+t+Nh+t+t}return t}var nf=[function(t,e,n,r){if(t.length>-1&&!t.return)switch(t.type){case Vh:t.return=ef(t.value,t.length);break;case $h:return Wh([xh(t,{value:lh(t.value,"@","@"+zh)})],r);case jh:if(t.length)return function(t,e){return t.map(e).join("")}(t.props,(function(e){switch(function(t){return(t=/(::plac\w+|:read-\w+)/.exec(t))?t[0]:t}(e)){case":read-only":case":read-write":return Wh([xh(t,{props:[lh(e,/:(read-\w+)/,":-moz-$1")]})],r);case"::placeholder":return Wh([xh(t,{props:[lh(e,/:(plac\w+)/,":"+zh+"input-$1")]}),xh(t,{props:[lh(e,/:(plac\w+)/,":-moz-$1")]}),xh(t,{props:[lh(e,/:(plac\w+)/,Nh+"input-$1")]})],r)}return""}))}}],rf=function(t){var e=t.key;if("css"===e){var n=document.querySelectorAll("style[data-emotion]:not([data-s])");Array.prototype.forEach.call(n,(function(t){-1!==t.getAttribute("data-emotion").indexOf(" ")&&(document.head.appendChild(t),t.setAttribute("data-s",""))}))}var r,i,o=t.stylisPlugins||nf,a={},s=[];r=t.container||document.head,Array.prototype.forEach.call(document.querySelectorAll('style[data-emotion^="'+e+' "]'),(function(t){for(var e=t.getAttribute("data-emotion").split(" "),n=1;n<e.length;n++)a[e[n]]=!0;s.push(t)}));var l,c,u,d,h=[Gh,(d=function(t){l.insert(t)},function(t){t.root||(t=t.return)&&d(t)})],f=(c=[Jh,tf].concat(o,h),u=fh(c),function(t,e,n,r){for(var i="",o=0;o<u;o++)i+=c[o](t,e,n,r)||"";return i});i=function(t,e,n,r){l=n,function(t){Wh(Hh(t),f)}(t?t+"{"+e.styles+"}":e.styles),r&&(p.inserted[e.name]=!0)};var p={key:e,sheet:new rh({key:e,container:r,nonce:t.nonce,speedy:t.speedy,prepend:t.prepend,insertionPoint:t.insertionPoint}),nonce:t.nonce,inserted:a,registered:{},insert:i};return p.sheet.hydrate(s),p};function of(){return of=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var n=arguments[e];for(var r in n)({}).hasOwnProperty.call(n,r)&&(t[r]=n[r])}return t},of.apply(null,arguments)}var af=function(t){var e=new WeakMap;return function(n){if(e.has(n))return e.get(n);var r=t(n);return e.set(n,r),r}};function sf(t,e,n){var r="";return n.split(" ").forEach((function(n){void 0!==t[n]?e.push(t[n]+";"):n&&(r+=n+" ")})),r}var lf=function(t,e,n){var r=t.key+"-"+e.name;!1===n&&void 0===t.registered[r]&&(t.registered[r]=e.styles)},cf=function(t,e,n){lf(t,e,n);var r=t.key+"-"+e.name;if(void 0===t.inserted[e.name]){var i=e;do{t.insert(e===i?"."+r:"",i,t.sheet,!0),i=i.next}while(void 0!==i)}},uf={animationIterationCount:1,aspectRatio:1,borderImageOutset:1,borderImageSlice:1,borderImageWidth:1,boxFlex:1,boxFlexGroup:1,boxOrdinalGroup:1,columnCount:1,columns:1,flex:1,flexGrow:1,flexPositive:1,flexShrink:1,flexNegative:1,flexOrder:1,gridRow:1,gridRowEnd:1,gridRowSpan:1,gridRowStart:1,gridColumn:1,gridColumnEnd:1,gridColumnSpan:1,gridColumnStart:1,msGridRow:1,msGridRowSpan:1,msGridColumn:1,msGridColumnSpan:1,fontWeight:1,lineHeight:1,opacity:1,order:1,orphans:1,scale:1,tabSize:1,widows:1,zIndex:1,zoom:1,WebkitLineClamp:1,fillOpacity:1,floodOpacity:1,stopOpacity:1,strokeDasharray:1,strokeDashoffset:1,strokeMiterlimit:1,strokeOpacity:1,strokeWidth:1};function df(t){var e=Object.create(null);return function(n){return void 0===e[n]&&(e[n]=t(n)),e[n]}}var hf=/[A-Z]|^ms/g,ff=/_EMO_([^_]+?)_([^]*?)_EMO_/g,pf=function(t){return 45===t.charCodeAt(1)},gf=function(t){return null!=t&&"boolean"!=typeof t},mf=df((function(t){return pf(t)?t:t.replace(hf,"-$&").toLowerCase()})),yf=function(t,e){switch(t){case"animation":case"animationName":if("string"==typeof e)return e.replace(ff,(function(t,e,n){return vf={name:e,styles:n,next:vf},e}))}return 1===uf[t]||pf(t)||"number"!=typeof e||0===e?e:e+"px"};function bf(t,e,n){if(null==n)return"";var r=n;if(void 0!==r.__emotion_styles)return r;switch(typeof n){case"boolean":return"";case"object":var i=n;if(1===i.anim)return vf={name:i.name,styles:i.styles,next:vf},i.name;var o=n;if(void 0!==o.styles){var a=o.next;if(void 0!==a)for(;void 0!==a;)vf={name:a.name,styles:a.styles,next:vf},a=a.next;return o.styles+";"}return function(t,e,n){var r="";if(Array.isArray(n))for(var i=0;i<n.length;i++)r+=bf(t,e,n[i])+";";else for(var o in n){var a=n[o];if("object"!=typeof a){var s=a;null!=e&&void 0!==e[s]?r+=o+"{"+e[s]+"}":gf(s)&&(r+=mf(o)+":"+yf(o,s)+";")}else if(!Array.isArray(a)||"string"!=typeof a[0]||null!=e&&void 0!==e[a[0]]){var l=bf(t,e,a);switch(o){case"animation":case"animationName":r+=mf(o)+":"+l+";";break;default:r+=o+"{"+l+"}"}}else for(var c=0;c<a.length;c++)gf(a[c])&&(r+=mf(o)+":"+yf(o,a[c])+";")}return r}(t,e,n);case"function":if(void 0!==t){var s=vf,l=n(t);return vf=s,bf(t,e,l)}}var c=n;if(null==e)return c;var u=e[c];return void 0!==u?u:c}var vf,_f=/label:\s*([^\s;{]+)\s*(;|$)/g;function wf(t,e,n){if(1===t.length&&"object"==typeof t[0]&&null!==t[0]&&void 0!==t[0].styles)return t[0];var r=!0,i="";vf=void 0;var o=t[0];null==o||void 0===o.raw?(r=!1,i+=bf(n,e,o)):i+=o[0];for(var a=1;a<t.length;a++)i+=bf(n,e,t[a]),r&&(i+=o[a]);_f.lastIndex=0;for(var s,l="";null!==(s=_f.exec(i));)l+="-"+s[1];var c=function(t){for(var e,n=0,r=0,i=t.length;i>=4;++r,i-=4)e=1540483477*(65535&(e=255&t.charCodeAt(r)|(255&t.charCodeAt(++r))<<8|(255&t.charCodeAt(++r))<<16|(255&t.charCodeAt(++r))<<24))+(59797*(e>>>16)<<16),n=1540483477*(65535&(e^=e>>>24))+(59797*(e>>>16)<<16)^1540483477*(65535&n)+(59797*(n>>>16)<<16);switch(i){case 3:n^=(255&t.charCodeAt(r+2))<<16;case 2:n^=(255&t.charCodeAt(r+1))<<8;case 1:n=1540483477*(65535&(n^=255&t.charCodeAt(r)))+(59797*(n>>>16)<<16)}return(((n=1540483477*(65535&(n^=n>>>13))+(59797*(n>>>16)<<16))^n>>>15)>>>0).toString(36)}(i)+l;return{name:c,styles:i,next:vf}}var xf=!!o.useInsertionEffect&&o.useInsertionEffect,Sf=xf||function(t){return t()},kf=xf||r.useLayoutEffect,Cf=r.createContext("undefined"!=typeof HTMLElement?rf({key:"css"}):null),Tf=(Cf.Provider,function(t){return(0,r.forwardRef)((function(e,n){var i=(0,r.useContext)(Cf);return t(e,i,n)}))}),Ef=r.createContext({}),Pf=af((function(t){return af((function(e){return function(t,e){return"function"==typeof e?e(t):of({},t,e)}(t,e)}))})),If=function(t){var e=r.useContext(Ef);return t.theme!==e&&(e=Pf(e)(t.theme)),r.createElement(Ef.Provider,{value:e},t.children)},Af={}.hasOwnProperty,Mf="__EMOTION_TYPE_PLEASE_DO_NOT_USE__",Df=function(t){var e=t.cache,n=t.serialized,r=t.isStringTag;return lf(e,n,r),Sf((function(){return cf(e,n,r)})),null},Ff=Tf((function(t,e,n){var i=t.css;"string"==typeof i&&void 0!==e.registered[i]&&(i=e.registered[i]);var o=t[Mf],a=[i],s="";"string"==typeof t.className?s=sf(e.registered,a,t.className):null!=t.className&&(s=t.className+" ");var l=wf(a,void 0,r.useContext(Ef));s+=e.key+"-"+l.name;var c={};for(var u in t)Af.call(t,u)&&"css"!==u&&u!==Mf&&(c[u]=t[u]);return c.className=s,n&&(c.ref=n),r.createElement(r.Fragment,null,r.createElement(Df,{cache:e,serialized:l,isStringTag:"string"==typeof o}),r.createElement(o,c))}));const Rf=(0,r.createContext)({});function Bf(){const t=(0,r.useContext)(Rf);if(void 0===t)throw new Error("useColorMode must be used within a ColorModeProvider");return t}Rf.displayName="ColorModeContext";const Lf="chakra-ui-light",Nf="chakra-ui-dark",Of="chakra-ui-color-mode",zf=(Uf=Of,{ssr:!1,type:"localStorage",get(t){if(!globalThis?.document)return t;let e;try{e=localStorage.getItem(Uf)||t}catch(t){}return e||t},set(t){try{localStorage.setItem(Uf,t)}catch(t){}}});var Uf;const jf=()=>{},Vf=Boolean(globalThis?.document)?r.useLayoutEffect:r.useEffect;function $f(t,e){return"cookie"===t.type&&t.ssr?t.get(e):e}const Wf=function(t){const{value:e,children:n,options:{useSystemColorMode:i,initialColorMode:o,disableTransitionOnChange:a}={},colorModeManager:s=zf}=t,l=(0,r.useContext)(Cf),c="dark"===o?"dark":"light",[u,d]=(0,r.useState)((()=>$f(s,c))),[h,f]=(0,r.useState)((()=>$f(s))),{getSystemTheme:p,setClassName:g,setDataset:m,addListener:y}=(0,r.useMemo)((()=>function(t={}){const{preventTransition:e=!0,nonce:n}=t,r={setDataset:t=>{const n=e?r.preventTransition():void 0;document.documentElement.dataset.theme=t,document.documentElement.style.colorScheme=t,n?.()},setClassName(t){document.body.classList.add(t?Nf:Lf),document.body.classList.remove(t?Lf:Nf)},query:()=>window.matchMedia("(prefers-color-scheme: dark)"),getSystemTheme:t=>r.query().matches??"dark"===t?"dark":"light",addListener(t){const e=r.query(),n=e=>{t(e.matches?"dark":"light")};return"function"==typeof e.addListener?e.addListener(n):e.addEventListener("change",n),()=>{"function"==typeof e.removeListener?e.removeListener(n):e.removeEventListener("change",n)}},preventTransition(){const t=document.createElement("style");return t.appendChild(document.createTextNode("*{-webkit-transition:none!important;-moz-transition:none!important;-o-transition:none!important;-ms-transition:none!important;transition:none!important}")),void 0!==n&&(t.nonce=n),document.head.appendChild(t),()=>{window.getComputedStyle(document.body),requestAnimationFrame((()=>{requestAnimationFrame((()=>{document.head.removeChild(t)}))}))}}};return r}({preventTransition:a,nonce:l?.nonce})),[a,l?.nonce]),b="system"!==o||u?u:h,v=(0,r.useCallback)((t=>{const e="system"===t?p():t;d(e),g("dark"===e),m(e),s.set(e)}),[s,p,g,m]);Vf((()=>{"system"===o&&f(p())}),[]),(0,r.useEffect)((()=>{const t=s.get();v(t||("system"!==o?c:"system"))}),[s,c,o,v]);const _=(0,r.useCallback)((()=>{v("dark"===b?"light":"dark")}),[b,v]);(0,r.useEffect)((()=>{if(i)return y(v)}),[i,y,v]);const w=(0,r.useMemo)((()=>({colorMode:e??b,toggleColorMode:e?jf:_,setColorMode:e?jf:v,forced:void 0!==e})),[b,_,v,e]);return(0,nh.jsx)(Rf.Provider,{value:w,children:n})};Wf.displayName="ColorModeProvider";var Gf,Hf,Yf=function(t,e){var n=arguments;if(null==e||!Af.call(e,"css"))return r.createElement.apply(void 0,n);var i=n.length,o=new Array(i);o[0]=Ff,o[1]=function(t,e){var n={};for(var r in e)Af.call(e,r)&&(n[r]=e[r]);return n[Mf]=t,n}(t,e);for(var a=2;a<i;a++)o[a]=n[a];return r.createElement.apply(null,o)};Gf=Yf||(Yf={}),Hf||(Hf=Gf.JSX||(Gf.JSX={}));var qf=Tf((function(t,e){var n=wf([t.styles],void 0,r.useContext(Ef)),i=r.useRef();return kf((function(){var t=e.key+"-global",r=new e.sheet.constructor({key:t,nonce:e.sheet.nonce,container:e.sheet.container,speedy:e.sheet.isSpeedy}),o=!1,a=document.querySelector('style[data-emotion="'+t+" "+n.name+'"]');return e.sheet.tags.length&&(r.before=e.sheet.tags[0]),null!==a&&(o=!0,a.setAttribute("data-emotion",t),r.hydrate([a])),i.current=[r,o],function(){r.flush()}}),[e]),kf((function(){var t=i.current,r=t[0];if(t[1])t[1]=!1;else{if(void 0!==n.next&&cf(e,n.next,!0),r.tags.length){var o=r.tags[r.tags.length-1].nextElementSibling;r.before=o,r.flush()}e.insert("",n,r,!1)}}),[e,n.name]),null}));function Kf(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return wf(e)}const Xf=String.raw,Qf=Xf`
+  :root,
+  :host {
+    --chakra-vh: 100vh;
+  }
+
+  @supports (height: -webkit-fill-available) {
+    :root,
+    :host {
+      --chakra-vh: -webkit-fill-available;
+    }
+  }
+
+  @supports (height: -moz-fill-available) {
+    :root,
+    :host {
+      --chakra-vh: -moz-fill-available;
+    }
+  }
+
+  @supports (height: 100dvh) {
+    :root,
+    :host {
+      --chakra-vh: 100dvh;
+    }
+  }
+`,Zf=()=>(0,nh.jsx)(qf,{styles:Qf}),Jf=({scope:t=""})=>(0,nh.jsx)(qf,{styles:Xf`
+      html {
+        line-height: 1.5;
+        -webkit-text-size-adjust: 100%;
+        font-family: system-ui, sans-serif;
+        -webkit-font-smoothing: antialiased;
+        text-rendering: optimizeLegibility;
+        -moz-osx-font-smoothing: grayscale;
+        touch-action: manipulation;
+      }
+
+      body {
+        position: relative;
+        min-height: 100%;
+        margin: 0;
+        font-feature-settings: "kern";
+      }
+
+      ${t} :where(*, *::before, *::after) {
+        border-width: 0;
+        border-style: solid;
+        box-sizing: border-box;
+        word-wrap: break-word;
+      }
+
+      main {
+        display: block;
+      }
+
+      ${t} hr {
+        border-top-width: 1px;
+        box-sizing: content-box;
+        height: 0;
+        overflow: visible;
+      }
+
+      ${t} :where(pre, code, kbd,samp) {
+        font-family: SFMono-Regular, Menlo, Monaco, Consolas, monospace;
+        font-size: 1em;
+      }
+
+      ${t} a {
+        background-color: transparent;
+        color: inherit;
+        text-decoration: inherit;
+      }
+
+      ${t} abbr[title] {
+        border-bottom: none;
+        text-decoration: underline;
+        -webkit-text-decoration: underline dotted;
+        text-decoration: underline dotted;
+      }
+
+      ${t} :where(b, strong) {
+        font-weight: bold;
+      }
+
+      ${t} small {
+        font-size: 80%;
+      }
+
+      ${t} :where(sub,sup) {
+        font-size: 75%;
+        line-height: 0;
+        position: relative;
+        vertical-align: baseline;
+      }
+
+      ${t} sub {
+        bottom: -0.25em;
+      }
+
+      ${t} sup {
+        top: -0.5em;
+      }
+
+      ${t} img {
+        border-style: none;
+      }
+
+      ${t} :where(button, input, optgroup, select, textarea) {
+        font-family: inherit;
+        font-size: 100%;
+        line-height: 1.15;
+        margin: 0;
+      }
+
+      ${t} :where(button, input) {
+        overflow: visible;
+      }
+
+      ${t} :where(button, select) {
+        text-transform: none;
+      }
+
+      ${t} :where(
+          button::-moz-focus-inner,
+          [type="button"]::-moz-focus-inner,
+          [type="reset"]::-moz-focus-inner,
+          [type="submit"]::-moz-focus-inner
+        ) {
+        border-style: none;
+        padding: 0;
+      }
+
+      ${t} fieldset {
+        padding: 0.35em 0.75em 0.625em;
+      }
+
+      ${t} legend {
+        box-sizing: border-box;
+        color: inherit;
+        display: table;
+        max-width: 100%;
+        padding: 0;
+        white-space: normal;
+      }
+
+      ${t} progress {
+        vertical-align: baseline;
+      }
+
+      ${t} textarea {
+        overflow: auto;
+      }
+
+      ${t} :where([type="checkbox"], [type="radio"]) {
+        box-sizing: border-box;
+        padding: 0;
+      }
+
+      ${t} input[type="number"]::-webkit-inner-spin-button,
+      ${t} input[type="number"]::-webkit-outer-spin-button {
+        -webkit-appearance: none !important;
+      }
+
+      ${t} input[type="number"] {
+        -moz-appearance: textfield;
+      }
+
+      ${t} input[type="search"] {
+        -webkit-appearance: textfield;
+        outline-offset: -2px;
+      }
+
+      ${t} input[type="search"]::-webkit-search-decoration {
+        -webkit-appearance: none !important;
+      }
+
+      ${t} ::-webkit-file-upload-button {
+        -webkit-appearance: button;
+        font: inherit;
+      }
+
+      ${t} details {
+        display: block;
+      }
+
+      ${t} summary {
+        display: list-item;
+      }
+
+      template {
+        display: none;
+      }
+
+      [hidden] {
+        display: none !important;
+      }
+
+      ${t} :where(
+          blockquote,
+          dl,
+          dd,
+          h1,
+          h2,
+          h3,
+          h4,
+          h5,
+          h6,
+          hr,
+          figure,
+          p,
+          pre
+        ) {
+        margin: 0;
+      }
+
+      ${t} button {
+        background: transparent;
+        padding: 0;
+      }
+
+      ${t} fieldset {
+        margin: 0;
+        padding: 0;
+      }
+
+      ${t} :where(ol, ul) {
+        margin: 0;
+        padding: 0;
+      }
+
+      ${t} textarea {
+        resize: vertical;
+      }
+
+      ${t} :where(button, [role="button"]) {
+        cursor: pointer;
+      }
+
+      ${t} button::-moz-focus-inner {
+        border: 0 !important;
+      }
+
+      ${t} table {
+        border-collapse: collapse;
+      }
+
+      ${t} :where(h1, h2, h3, h4, h5, h6) {
+        font-size: inherit;
+        font-weight: inherit;
+      }
+
+      ${t} :where(button, input, optgroup, select, textarea) {
+        padding: 0;
+        line-height: inherit;
+        color: inherit;
+      }
+
+      ${t} :where(img, svg, video, canvas, audio, iframe, embed, object) {
+        display: block;
+      }
+
+      ${t} :where(img, video) {
+        max-width: 100%;
+        height: auto;
+      }
+
+      [data-js-focus-visible]
+        :focus:not([data-focus-visible-added]):not(
+          [data-focus-visible-disabled]
+        ) {
+        outline: none;
+        box-shadow: none;
+      }
+
+      ${t} select::-ms-expand {
+        display: none;
+      }
+
+      ${Qf}
+    `});function tp(t){const e=null==t?0:t.length;return e?t[e-1]:void 0}function ep(t){if(null==t)return t;const{unitless:e}=function(t){const e=parseFloat(t.toString()),n=t.toString().replace(String(e),"");return{unitless:!n,value:e,unit:n}}(t);return e||"number"==typeof t?`${t}px`:t}const np=(t,e)=>parseInt(t[1],10)>parseInt(e[1],10)?1:-1,rp=t=>Object.fromEntries(Object.entries(t).sort(np));function ip(t){const e=rp(t);return Object.assign(Object.values(e),e)}function op(t){return t?"number"==typeof(t=ep(t)??t)?`${t+-.02}`:t.replace(/(\d+\.?\d*)/u,(t=>`${parseFloat(t)+-.02}`)):t}function ap(t,e){const n=["@media screen"];return t&&n.push("and",`(min-width: ${ep(t)})`),e&&n.push("and",`(max-width: ${ep(e)})`),n.join(" ")}function sp(t){if(!t)return null;t.base=t.base??"0px";const e=ip(t),n=Object.entries(t).sort(np).map((([t,e],n,r)=>{let[,i]=r[n+1]??[];return i=parseFloat(i)>0?op(i):void 0,{_minW:op(e),breakpoint:t,minW:e,maxW:i,maxWQuery:ap(null,i),minWQuery:ap(e),minMaxQuery:ap(e,i)}})),r=function(t){const e=Object.keys(rp(t));return new Set(e)}(t),i=Array.from(r.values());return{keys:r,normalized:e,isResponsive(t){const e=Object.keys(t);return e.length>0&&e.every((t=>r.has(t)))},asObject:rp(t),asArray:ip(t),details:n,get:t=>n.find((e=>e.breakpoint===t)),media:[null,...e.map((t=>ap(t))).slice(1)],toArrayValue(t){if(!xc(t))throw new Error("toArrayValue: value must be an object");const e=i.map((e=>t[e]??null));for(;null===tp(e);)e.pop();return e},toObjectValue(t){if(!Array.isArray(t))throw new Error("toObjectValue: value must be an array");return t.reduce(((t,e,n)=>{const r=i[n];return null!=r&&null!=e&&(t[r]=e),t}),{})}}}var lp=i(602);function cp(t,e,n={}){const{stop:r,getKey:i}=n;return function t(n,o=[]){if(xc(n)||Array.isArray(n)){const a={};for(const[s,l]of Object.entries(n)){const c=i?.(s)??s,u=[...o,c];if(r?.(n,u))return e(n,o);a[c]=t(l,u)}return a}return e(n,o)}(t)}const up=(t,e)=>`${t}:hover ${e}, ${t}[data-hover] ${e}`,dp=(t,e)=>`${t}:focus ${e}, ${t}[data-focus] ${e}`,hp=(t,e)=>`${t}:focus-visible ${e}`,fp=(t,e)=>`${t}:focus-within ${e}`,pp=(t,e)=>`${t}:active ${e}, ${t}[data-active] ${e}`,gp=(t,e)=>`${t}:disabled ${e}, ${t}[data-disabled] ${e}`,mp=(t,e)=>`${t}:invalid ${e}, ${t}[data-invalid] ${e}`,yp=(t,e)=>`${t}:checked ${e}, ${t}[data-checked] ${e}`,bp=t=>_p((e=>t(e,"&")),"[role=group]","[data-group]",".group"),vp=t=>_p((e=>t(e,"~ &")),"[data-peer]",".peer"),_p=(t,...e)=>e.map(t).join(", "),wp={_hover:"&:hover, &[data-hover]",_active:"&:active, &[data-active]",_focus:"&:focus, &[data-focus]",_highlighted:"&[data-highlighted]",_focusWithin:"&:focus-within, &[data-focus-within]",_focusVisible:"&:focus-visible, &[data-focus-visible]",_disabled:"&:disabled, &[disabled], &[aria-disabled=true], &[data-disabled]",_readOnly:"&[aria-readonly=true], &[readonly], &[data-readonly]",_before:"&::before",_after:"&::after",_empty:"&:empty, &[data-empty]",_expanded:"&[aria-expanded=true], &[data-expanded], &[data-state=expanded]",_checked:"&[aria-checked=true], &[data-checked], &[data-state=checked]",_grabbed:"&[aria-grabbed=true], &[data-grabbed]",_pressed:"&[aria-pressed=true], &[data-pressed]",_invalid:"&[aria-invalid=true], &[data-invalid]",_valid:"&[data-valid], &[data-state=valid]",_loading:"&[data-loading], &[aria-busy=true]",_selected:"&[aria-selected=true], &[data-selected]",_hidden:"&[hidden], &[data-hidden]",_autofill:"&:-webkit-autofill",_even:"&:nth-of-type(even)",_odd:"&:nth-of-type(odd)",_first:"&:first-of-type",_firstLetter:"&::first-letter",_last:"&:last-of-type",_notFirst:"&:not(:first-of-type)",_notLast:"&:not(:last-of-type)",_visited:"&:visited",_activeLink:"&[aria-current=page]",_activeStep:"&[aria-current=step]",_indeterminate:"&:indeterminate, &[aria-checked=mixed], &[data-indeterminate], &[data-state=indeterminate]",_groupOpen:bp(((t,e)=>`${t}[data-open], ${t}[open], ${t}[data-state=open] ${e}`)),_groupClosed:bp(((t,e)=>`${t}[data-closed], ${t}[data-state=closed] ${e}`)),_groupHover:bp(up),_peerHover:vp(up),_groupFocus:bp(dp),_peerFocus:vp(dp),_groupFocusVisible:bp(hp),_peerFocusVisible:vp(hp),_groupActive:bp(pp),_peerActive:vp(pp),_groupDisabled:bp(gp),_peerDisabled:vp(gp),_groupInvalid:bp(mp),_peerInvalid:vp(mp),_groupChecked:bp(yp),_peerChecked:vp(yp),_groupFocusWithin:bp(fp),_peerFocusWithin:vp(fp),_peerPlaceholderShown:vp(((t,e)=>`${t}:placeholder-shown ${e}`)),_placeholder:"&::placeholder, &[data-placeholder]",_placeholderShown:"&:placeholder-shown, &[data-placeholder-shown]",_fullScreen:"&:fullscreen, &[data-fullscreen]",_selection:"&::selection",_rtl:"[dir=rtl] &, &[dir=rtl]",_ltr:"[dir=ltr] &, &[dir=ltr]",_mediaDark:"@media (prefers-color-scheme: dark)",_mediaReduceMotion:"@media (prefers-reduced-motion: reduce)",_dark:".chakra-ui-dark &:not([data-theme]),[data-theme=dark] &:not([data-theme]),&[data-theme=dark]",_light:".chakra-ui-light &:not([data-theme]),[data-theme=light] &:not([data-theme]),&[data-theme=light]",_horizontal:"&[data-orientation=horizontal]",_vertical:"&[data-orientation=vertical]",_open:"&[data-open], &[open], &[data-state=open]",_closed:"&[data-closed], &[data-state=closed]",_complete:"&[data-complete]",_incomplete:"&[data-incomplete]",_current:"&[data-current]"},xp=Object.keys(wp),Sp=["colors","borders","borderWidths","borderStyles","fonts","fontSizes","fontWeights","gradients","letterSpacings","lineHeights","radii","space","shadows","sizes","zIndices","transition","blur","breakpoints"];function kp(t){return function(t,e){const n={};for(const r of e)r in t&&(n[r]=t[r]);return n}(t,Sp)}function Cp(t,e){return $a(String(t).replace(/\./g,"-"),void 0,e)}function Tp(t,...e){return"function"==typeof t?t(...e):t}const Ep=t=>"string"==typeof t?t.replace(/!(important)?$/,"").trim():t;function Pp(t){const{scale:e,transform:n,compose:r}=t;return(t,i)=>{const o=((t,e)=>n=>{const r=String(e),i=(t=>/!(important)?$/.test(t))(r),o=Ep(r),a=t?`${t}.${o}`:o;let s=xc(n.__cssMap)&&a in n.__cssMap?n.__cssMap[a].varRef:e;return s=Ep(s),i?`${s} !important`:s})(e,t)(i);let a=n?.(o,i)??o;return r&&(a=r(a,i)),a}}const Ip=(...t)=>e=>t.reduce(((t,e)=>e(t)),e);function Ap(t,e){return n=>{const r={property:n,scale:t};return r.transform=Pp({scale:t,transform:e}),r}}const Mp=({rtl:t,ltr:e})=>n=>"rtl"===n.direction?t:e,Dp=["rotate(var(--chakra-rotate, 0))","scaleX(var(--chakra-scale-x, 1))","scaleY(var(--chakra-scale-y, 1))","skewX(var(--chakra-skew-x, 0))","skewY(var(--chakra-skew-y, 0))"],Fp={"--chakra-blur":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-brightness":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-contrast":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-grayscale":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-hue-rotate":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-invert":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-saturate":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-sepia":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-drop-shadow":"var(--chakra-empty,/*!*/ /*!*/)",filter:["var(--chakra-blur)","var(--chakra-brightness)","var(--chakra-contrast)","var(--chakra-grayscale)","var(--chakra-hue-rotate)","var(--chakra-invert)","var(--chakra-saturate)","var(--chakra-sepia)","var(--chakra-drop-shadow)"].join(" ")},Rp={backdropFilter:["var(--chakra-backdrop-blur)","var(--chakra-backdrop-brightness)","var(--chakra-backdrop-contrast)","var(--chakra-backdrop-grayscale)","var(--chakra-backdrop-hue-rotate)","var(--chakra-backdrop-invert)","var(--chakra-backdrop-opacity)","var(--chakra-backdrop-saturate)","var(--chakra-backdrop-sepia)"].join(" "),"--chakra-backdrop-blur":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-backdrop-brightness":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-backdrop-contrast":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-backdrop-grayscale":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-backdrop-hue-rotate":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-backdrop-invert":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-backdrop-opacity":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-backdrop-saturate":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-backdrop-sepia":"var(--chakra-empty,/*!*/ /*!*/)"},Bp={"row-reverse":{space:"--chakra-space-x-reverse",divide:"--chakra-divide-x-reverse"},"column-reverse":{space:"--chakra-space-y-reverse",divide:"--chakra-divide-y-reverse"}},Lp={"to-t":"to top","to-tr":"to top right","to-r":"to right","to-br":"to bottom right","to-b":"to bottom","to-bl":"to bottom left","to-l":"to left","to-tl":"to top left"},Np=new Set(Object.values(Lp)),Op=new Set(["none","-moz-initial","inherit","initial","revert","unset"]),zp=t=>t.trim(),Up=t=>"string"==typeof t&&t.includes("(")&&t.includes(")"),jp=t=>e=>`${t}(${e})`,Vp={filter:t=>"auto"!==t?t:Fp,backdropFilter:t=>"auto"!==t?t:Rp,ring:t=>function(t){return{"--chakra-ring-offset-shadow":"var(--chakra-ring-inset) 0 0 0 var(--chakra-ring-offset-width) var(--chakra-ring-offset-color)","--chakra-ring-shadow":"var(--chakra-ring-inset) 0 0 0 calc(var(--chakra-ring-width) + var(--chakra-ring-offset-width)) var(--chakra-ring-color)","--chakra-ring-width":t,boxShadow:["var(--chakra-ring-offset-shadow)","var(--chakra-ring-shadow)","var(--chakra-shadow, 0 0 #0000)"].join(", ")}}(Vp.px(t)),bgClip:t=>"text"===t?{color:"transparent",backgroundClip:"text"}:{backgroundClip:t},transform:t=>"auto"===t?["translateX(var(--chakra-translate-x, 0))","translateY(var(--chakra-translate-y, 0))",...Dp].join(" "):"auto-gpu"===t?["translate3d(var(--chakra-translate-x, 0), var(--chakra-translate-y, 0), 0)",...Dp].join(" "):t,vh:t=>"$100vh"===t?"var(--chakra-vh)":t,px(t){if(null==t)return t;const{unitless:e}=(t=>{const e=parseFloat(t.toString()),n=t.toString().replace(String(e),"");return{unitless:!n,value:e,unit:n}})(t);return e||"number"==typeof t?`${t}px`:t},fraction:t=>"number"!=typeof t||t>1?t:100*t+"%",float:(t,e)=>"rtl"===e.direction?{left:"right",right:"left"}[t]:t,degree(t){if(function(t){return/^var\(--.+\)$/.test(t)}(t)||null==t)return t;const e="string"==typeof t&&!t.endsWith("deg");return"number"==typeof t||e?`${t}deg`:t},gradient:(t,e)=>function(t,e){if(null==t||Op.has(t))return t;if(!Up(t)&&!Op.has(t))return`url('${t}')`;const n=/(^[a-z-A-Z]+)\((.*)\)/g.exec(t),r=n?.[1],i=n?.[2];if(!r||!i)return t;const o=r.includes("-gradient")?r:`${r}-gradient`,[a,...s]=i.split(",").map(zp).filter(Boolean);if(0===s?.length)return t;const l=a in Lp?Lp[a]:a;s.unshift(l);const c=s.map((t=>{if(Np.has(t))return t;const n=t.indexOf(" "),[r,i]=-1!==n?[t.substr(0,n),t.substr(n+1)]:[t],o=Up(i)?i:i&&i.split(" "),a=`colors.${r}`,s=a in e.__cssMap?e.__cssMap[a].varRef:r;return o?[s,...Array.isArray(o)?o:[o]].join(" "):s}));return`${o}(${c.join(", ")})`}(t,e??{}),blur:jp("blur"),opacity:jp("opacity"),brightness:jp("brightness"),contrast:jp("contrast"),dropShadow:jp("drop-shadow"),grayscale:jp("grayscale"),hueRotate:t=>jp("hue-rotate")(Vp.degree(t)),invert:jp("invert"),saturate:jp("saturate"),sepia:jp("sepia"),bgImage:t=>null==t||Up(t)||Op.has(t)?t:`url(${t})`,outline(t){const e="0"===String(t)||"none"===String(t);return null!==t&&e?{outline:"2px solid transparent",outlineOffset:"2px"}:{outline:t}},flexDirection(t){const{space:e,divide:n}=Bp[t]??{},r={flexDirection:t};return e&&(r[e]=1),n&&(r[n]=1),r}},$p={borderWidths:Ap("borderWidths"),borderStyles:Ap("borderStyles"),colors:Ap("colors"),borders:Ap("borders"),gradients:Ap("gradients",Vp.gradient),radii:Ap("radii",Vp.px),space:Ap("space",Ip(Vp.vh,Vp.px)),spaceT:Ap("space",Ip(Vp.vh,Vp.px)),degreeT:t=>({property:t,transform:Vp.degree}),prop:(t,e,n)=>({property:t,scale:e,...e&&{transform:Pp({scale:e,transform:n})}}),propT:(t,e)=>({property:t,transform:e}),sizes:Ap("sizes",Ip(Vp.vh,Vp.px)),sizesT:Ap("sizes",Ip(Vp.vh,Vp.fraction)),shadows:Ap("shadows"),logical:function(t){const{property:e,scale:n,transform:r}=t;return{scale:n,property:Mp(e),transform:n?Pp({scale:n,compose:r}):r}},blur:Ap("blur",Vp.blur)},Wp={background:$p.colors("background"),backgroundColor:$p.colors("backgroundColor"),backgroundImage:$p.gradients("backgroundImage"),backgroundSize:!0,backgroundPosition:!0,backgroundRepeat:!0,backgroundAttachment:!0,backgroundClip:{transform:Vp.bgClip},bgSize:$p.prop("backgroundSize"),bgPosition:$p.prop("backgroundPosition"),bg:$p.colors("background"),bgColor:$p.colors("backgroundColor"),bgPos:$p.prop("backgroundPosition"),bgRepeat:$p.prop("backgroundRepeat"),bgAttachment:$p.prop("backgroundAttachment"),bgGradient:$p.gradients("backgroundImage"),bgClip:{transform:Vp.bgClip}};Object.assign(Wp,{bgImage:Wp.backgroundImage,bgImg:Wp.backgroundImage});const Gp={border:$p.borders("border"),borderWidth:$p.borderWidths("borderWidth"),borderStyle:$p.borderStyles("borderStyle"),borderColor:$p.colors("borderColor"),borderRadius:$p.radii("borderRadius"),borderTop:$p.borders("borderTop"),borderBlockStart:$p.borders("borderBlockStart"),borderTopLeftRadius:$p.radii("borderTopLeftRadius"),borderStartStartRadius:$p.logical({scale:"radii",property:{ltr:"borderTopLeftRadius",rtl:"borderTopRightRadius"}}),borderEndStartRadius:$p.logical({scale:"radii",property:{ltr:"borderBottomLeftRadius",rtl:"borderBottomRightRadius"}}),borderTopRightRadius:$p.radii("borderTopRightRadius"),borderStartEndRadius:$p.logical({scale:"radii",property:{ltr:"borderTopRightRadius",rtl:"borderTopLeftRadius"}}),borderEndEndRadius:$p.logical({scale:"radii",property:{ltr:"borderBottomRightRadius",rtl:"borderBottomLeftRadius"}}),borderRight:$p.borders("borderRight"),borderInlineEnd:$p.borders("borderInlineEnd"),borderBottom:$p.borders("borderBottom"),borderBlockEnd:$p.borders("borderBlockEnd"),borderBottomLeftRadius:$p.radii("borderBottomLeftRadius"),borderBottomRightRadius:$p.radii("borderBottomRightRadius"),borderLeft:$p.borders("borderLeft"),borderInlineStart:{property:"borderInlineStart",scale:"borders"},borderInlineStartRadius:$p.logical({scale:"radii",property:{ltr:["borderTopLeftRadius","borderBottomLeftRadius"],rtl:["borderTopRightRadius","borderBottomRightRadius"]}}),borderInlineEndRadius:$p.logical({scale:"radii",property:{ltr:["borderTopRightRadius","borderBottomRightRadius"],rtl:["borderTopLeftRadius","borderBottomLeftRadius"]}}),borderX:$p.borders(["borderLeft","borderRight"]),borderInline:$p.borders("borderInline"),borderY:$p.borders(["borderTop","borderBottom"]),borderBlock:$p.borders("borderBlock"),borderTopWidth:$p.borderWidths("borderTopWidth"),borderBlockStartWidth:$p.borderWidths("borderBlockStartWidth"),borderTopColor:$p.colors("borderTopColor"),borderBlockStartColor:$p.colors("borderBlockStartColor"),borderTopStyle:$p.borderStyles("borderTopStyle"),borderBlockStartStyle:$p.borderStyles("borderBlockStartStyle"),borderBottomWidth:$p.borderWidths("borderBottomWidth"),borderBlockEndWidth:$p.borderWidths("borderBlockEndWidth"),borderBottomColor:$p.colors("borderBottomColor"),borderBlockEndColor:$p.colors("borderBlockEndColor"),borderBottomStyle:$p.borderStyles("borderBottomStyle"),borderBlockEndStyle:$p.borderStyles("borderBlockEndStyle"),borderLeftWidth:$p.borderWidths("borderLeftWidth"),borderInlineStartWidth:$p.borderWidths("borderInlineStartWidth"),borderLeftColor:$p.colors("borderLeftColor"),borderInlineStartColor:$p.colors("borderInlineStartColor"),borderLeftStyle:$p.borderStyles("borderLeftStyle"),borderInlineStartStyle:$p.borderStyles("borderInlineStartStyle"),borderRightWidth:$p.borderWidths("borderRightWidth"),borderInlineEndWidth:$p.borderWidths("borderInlineEndWidth"),borderRightColor:$p.colors("borderRightColor"),borderInlineEndColor:$p.colors("borderInlineEndColor"),borderRightStyle:$p.borderStyles("borderRightStyle"),borderInlineEndStyle:$p.borderStyles("borderInlineEndStyle"),borderTopRadius:$p.radii(["borderTopLeftRadius","borderTopRightRadius"]),borderBottomRadius:$p.radii(["borderBottomLeftRadius","borderBottomRightRadius"]),borderLeftRadius:$p.radii(["borderTopLeftRadius","borderBottomLeftRadius"]),borderRightRadius:$p.radii(["borderTopRightRadius","borderBottomRightRadius"])};Object.assign(Gp,{rounded:Gp.borderRadius,roundedTop:Gp.borderTopRadius,roundedTopLeft:Gp.borderTopLeftRadius,roundedTopRight:Gp.borderTopRightRadius,roundedTopStart:Gp.borderStartStartRadius,roundedTopEnd:Gp.borderStartEndRadius,roundedBottom:Gp.borderBottomRadius,roundedBottomLeft:Gp.borderBottomLeftRadius,roundedBottomRight:Gp.borderBottomRightRadius,roundedBottomStart:Gp.borderEndStartRadius,roundedBottomEnd:Gp.borderEndEndRadius,roundedLeft:Gp.borderLeftRadius,roundedRight:Gp.borderRightRadius,roundedStart:Gp.borderInlineStartRadius,roundedEnd:Gp.borderInlineEndRadius,borderStart:Gp.borderInlineStart,borderEnd:Gp.borderInlineEnd,borderTopStartRadius:Gp.borderStartStartRadius,borderTopEndRadius:Gp.borderStartEndRadius,borderBottomStartRadius:Gp.borderEndStartRadius,borderBottomEndRadius:Gp.borderEndEndRadius,borderStartRadius:Gp.borderInlineStartRadius,borderEndRadius:Gp.borderInlineEndRadius,borderStartWidth:Gp.borderInlineStartWidth,borderEndWidth:Gp.borderInlineEndWidth,borderStartColor:Gp.borderInlineStartColor,borderEndColor:Gp.borderInlineEndColor,borderStartStyle:Gp.borderInlineStartStyle,borderEndStyle:Gp.borderInlineEndStyle});const Hp={color:$p.colors("color"),textColor:$p.colors("color"),fill:$p.colors("fill"),stroke:$p.colors("stroke"),accentColor:$p.colors("accentColor"),textFillColor:$p.colors("textFillColor")},Yp={alignItems:!0,alignContent:!0,justifyItems:!0,justifyContent:!0,flexWrap:!0,flexDirection:{transform:Vp.flexDirection},flex:!0,flexFlow:!0,flexGrow:!0,flexShrink:!0,flexBasis:$p.sizes("flexBasis"),justifySelf:!0,alignSelf:!0,order:!0,placeItems:!0,placeContent:!0,placeSelf:!0,gap:$p.space("gap"),rowGap:$p.space("rowGap"),columnGap:$p.space("columnGap")};Object.assign(Yp,{flexDir:Yp.flexDirection});const qp={width:$p.sizesT("width"),inlineSize:$p.sizesT("inlineSize"),height:$p.sizes("height"),blockSize:$p.sizes("blockSize"),boxSize:$p.sizes(["width","height"]),minWidth:$p.sizes("minWidth"),minInlineSize:$p.sizes("minInlineSize"),minHeight:$p.sizes("minHeight"),minBlockSize:$p.sizes("minBlockSize"),maxWidth:$p.sizes("maxWidth"),maxInlineSize:$p.sizes("maxInlineSize"),maxHeight:$p.sizes("maxHeight"),maxBlockSize:$p.sizes("maxBlockSize"),overflow:!0,overflowX:!0,overflowY:!0,overscrollBehavior:!0,overscrollBehaviorX:!0,overscrollBehaviorY:!0,display:!0,aspectRatio:!0,hideFrom:{scale:"breakpoints",transform:(t,e)=>{const n=`@media screen and (min-width: ${e.__breakpoints?.get(t)?.minW??t})`;return{[n]:{display:"none"}}}},hideBelow:{scale:"breakpoints",transform:(t,e)=>{const n=`@media screen and (max-width: ${e.__breakpoints?.get(t)?._minW??t})`;return{[n]:{display:"none"}}}},verticalAlign:!0,boxSizing:!0,boxDecorationBreak:!0,float:$p.propT("float",Vp.float),objectFit:!0,objectPosition:!0,visibility:!0,isolation:!0};Object.assign(qp,{w:qp.width,h:qp.height,minW:qp.minWidth,maxW:qp.maxWidth,minH:qp.minHeight,maxH:qp.maxHeight,overscroll:qp.overscrollBehavior,overscrollX:qp.overscrollBehaviorX,overscrollY:qp.overscrollBehaviorY});const Kp={filter:{transform:Vp.filter},blur:$p.blur("--chakra-blur"),brightness:$p.propT("--chakra-brightness",Vp.brightness),contrast:$p.propT("--chakra-contrast",Vp.contrast),hueRotate:$p.propT("--chakra-hue-rotate",Vp.hueRotate),invert:$p.propT("--chakra-invert",Vp.invert),saturate:$p.propT("--chakra-saturate",Vp.saturate),dropShadow:$p.propT("--chakra-drop-shadow",Vp.dropShadow),backdropFilter:{transform:Vp.backdropFilter},backdropBlur:$p.blur("--chakra-backdrop-blur"),backdropBrightness:$p.propT("--chakra-backdrop-brightness",Vp.brightness),backdropContrast:$p.propT("--chakra-backdrop-contrast",Vp.contrast),backdropHueRotate:$p.propT("--chakra-backdrop-hue-rotate",Vp.hueRotate),backdropInvert:$p.propT("--chakra-backdrop-invert",Vp.invert),backdropSaturate:$p.propT("--chakra-backdrop-saturate",Vp.saturate)},Xp={ring:{transform:Vp.ring},ringColor:$p.colors("--chakra-ring-color"),ringOffset:$p.prop("--chakra-ring-offset-width"),ringOffsetColor:$p.colors("--chakra-ring-offset-color"),ringInset:$p.prop("--chakra-ring-inset")},Qp={appearance:!0,cursor:!0,resize:!0,userSelect:!0,pointerEvents:!0,outline:{transform:Vp.outline},outlineOffset:!0,outlineColor:$p.colors("outlineColor")},Zp={gridGap:$p.space("gridGap"),gridColumnGap:$p.space("gridColumnGap"),gridRowGap:$p.space("gridRowGap"),gridColumn:!0,gridRow:!0,gridAutoFlow:!0,gridAutoColumns:!0,gridColumnStart:!0,gridColumnEnd:!0,gridRowStart:!0,gridRowEnd:!0,gridAutoRows:!0,gridTemplate:!0,gridTemplateColumns:!0,gridTemplateRows:!0,gridTemplateAreas:!0,gridArea:!0},Jp=(t=>{const e=new WeakMap;return(n,r,i,o)=>{if(void 0===n)return t(n,r,i);e.has(n)||e.set(n,new Map);const a=e.get(n);if(a.has(r))return a.get(r);const s=t(n,r,i,o);return a.set(r,s),s}})((function(t,e,n,r){const i="string"==typeof e?e.split("."):[e];for(r=0;r<i.length&&t;r+=1)t=t[i[r]];return void 0===t?n:t})),tg={border:"0px",clip:"rect(0, 0, 0, 0)",width:"1px",height:"1px",margin:"-1px",padding:"0px",overflow:"hidden",whiteSpace:"nowrap",position:"absolute"},eg={position:"static",width:"auto",height:"auto",clip:"auto",padding:"0",margin:"0",overflow:"visible",whiteSpace:"normal"},ng=(t,e,n)=>{const r={},i=Jp(t,e,{});for(const t in i)t in n&&null!=n[t]||(r[t]=i[t]);return r},rg={srOnly:{transform:t=>!0===t?tg:"focusable"===t?eg:{}},layerStyle:{processResult:!0,transform:(t,e,n)=>ng(e,`layerStyles.${t}`,n)},textStyle:{processResult:!0,transform:(t,e,n)=>ng(e,`textStyles.${t}`,n)},apply:{processResult:!0,transform:(t,e,n)=>ng(e,t,n)}},ig={position:!0,pos:$p.prop("position"),zIndex:$p.prop("zIndex","zIndices"),inset:$p.spaceT("inset"),insetX:$p.spaceT(["left","right"]),insetInline:$p.spaceT("insetInline"),insetY:$p.spaceT(["top","bottom"]),insetBlock:$p.spaceT("insetBlock"),top:$p.spaceT("top"),insetBlockStart:$p.spaceT("insetBlockStart"),bottom:$p.spaceT("bottom"),insetBlockEnd:$p.spaceT("insetBlockEnd"),left:$p.spaceT("left"),insetInlineStart:$p.logical({scale:"space",property:{ltr:"left",rtl:"right"}}),right:$p.spaceT("right"),insetInlineEnd:$p.logical({scale:"space",property:{ltr:"right",rtl:"left"}})};Object.assign(ig,{insetStart:ig.insetInlineStart,insetEnd:ig.insetInlineEnd});const og={boxShadow:$p.shadows("boxShadow"),mixBlendMode:!0,blendMode:$p.prop("mixBlendMode"),backgroundBlendMode:!0,bgBlendMode:$p.prop("backgroundBlendMode"),opacity:!0};Object.assign(og,{shadow:og.boxShadow});const ag={margin:$p.spaceT("margin"),marginTop:$p.spaceT("marginTop"),marginBlockStart:$p.spaceT("marginBlockStart"),marginRight:$p.spaceT("marginRight"),marginInlineEnd:$p.spaceT("marginInlineEnd"),marginBottom:$p.spaceT("marginBottom"),marginBlockEnd:$p.spaceT("marginBlockEnd"),marginLeft:$p.spaceT("marginLeft"),marginInlineStart:$p.spaceT("marginInlineStart"),marginX:$p.spaceT(["marginInlineStart","marginInlineEnd"]),marginInline:$p.spaceT("marginInline"),marginY:$p.spaceT(["marginTop","marginBottom"]),marginBlock:$p.spaceT("marginBlock"),padding:$p.space("padding"),paddingTop:$p.space("paddingTop"),paddingBlockStart:$p.space("paddingBlockStart"),paddingRight:$p.space("paddingRight"),paddingBottom:$p.space("paddingBottom"),paddingBlockEnd:$p.space("paddingBlockEnd"),paddingLeft:$p.space("paddingLeft"),paddingInlineStart:$p.space("paddingInlineStart"),paddingInlineEnd:$p.space("paddingInlineEnd"),paddingX:$p.space(["paddingInlineStart","paddingInlineEnd"]),paddingInline:$p.space("paddingInline"),paddingY:$p.space(["paddingTop","paddingBottom"]),paddingBlock:$p.space("paddingBlock")};Object.assign(ag,{m:ag.margin,mt:ag.marginTop,mr:ag.marginRight,me:ag.marginInlineEnd,marginEnd:ag.marginInlineEnd,mb:ag.marginBottom,ml:ag.marginLeft,ms:ag.marginInlineStart,marginStart:ag.marginInlineStart,mx:ag.marginX,my:ag.marginY,p:ag.padding,pt:ag.paddingTop,py:ag.paddingY,px:ag.paddingX,pb:ag.paddingBottom,pl:ag.paddingLeft,ps:ag.paddingInlineStart,paddingStart:ag.paddingInlineStart,pr:ag.paddingRight,pe:ag.paddingInlineEnd,paddingEnd:ag.paddingInlineEnd});const sg={scrollBehavior:!0,scrollSnapAlign:!0,scrollSnapStop:!0,scrollSnapType:!0,scrollMargin:$p.spaceT("scrollMargin"),scrollMarginTop:$p.spaceT("scrollMarginTop"),scrollMarginBottom:$p.spaceT("scrollMarginBottom"),scrollMarginLeft:$p.spaceT("scrollMarginLeft"),scrollMarginRight:$p.spaceT("scrollMarginRight"),scrollMarginX:$p.spaceT(["scrollMarginLeft","scrollMarginRight"]),scrollMarginY:$p.spaceT(["scrollMarginTop","scrollMarginBottom"]),scrollPadding:$p.spaceT("scrollPadding"),scrollPaddingTop:$p.spaceT("scrollPaddingTop"),scrollPaddingBottom:$p.spaceT("scrollPaddingBottom"),scrollPaddingLeft:$p.spaceT("scrollPaddingLeft"),scrollPaddingRight:$p.spaceT("scrollPaddingRight"),scrollPaddingX:$p.spaceT(["scrollPaddingLeft","scrollPaddingRight"]),scrollPaddingY:$p.spaceT(["scrollPaddingTop","scrollPaddingBottom"])},lg={fontFamily:$p.prop("fontFamily","fonts"),fontSize:$p.prop("fontSize","fontSizes",Vp.px),fontWeight:$p.prop("fontWeight","fontWeights"),lineHeight:$p.prop("lineHeight","lineHeights"),letterSpacing:$p.prop("letterSpacing","letterSpacings"),textAlign:!0,fontStyle:!0,textIndent:!0,wordBreak:!0,overflowWrap:!0,textOverflow:!0,textTransform:!0,whiteSpace:!0,isTruncated:{transform(t){if(!0===t)return{overflow:"hidden",textOverflow:"ellipsis",whiteSpace:"nowrap"}}},noOfLines:{static:{overflow:"hidden",textOverflow:"ellipsis",display:"-webkit-box",WebkitBoxOrient:"vertical",WebkitLineClamp:"var(--chakra-line-clamp)"},property:"--chakra-line-clamp"}},cg={textDecorationColor:$p.colors("textDecorationColor"),textDecoration:!0,textDecor:{property:"textDecoration"},textDecorationLine:!0,textDecorationStyle:!0,textDecorationThickness:!0,textUnderlineOffset:!0,textShadow:$p.shadows("textShadow")},ug={clipPath:!0,transform:$p.propT("transform",Vp.transform),transformOrigin:!0,translateX:$p.spaceT("--chakra-translate-x"),translateY:$p.spaceT("--chakra-translate-y"),skewX:$p.degreeT("--chakra-skew-x"),skewY:$p.degreeT("--chakra-skew-y"),scaleX:$p.prop("--chakra-scale-x"),scaleY:$p.prop("--chakra-scale-y"),scale:$p.prop(["--chakra-scale-x","--chakra-scale-y"]),rotate:$p.degreeT("--chakra-rotate")},dg={listStyleType:!0,listStylePosition:!0,listStylePos:$p.prop("listStylePosition"),listStyleImage:!0,listStyleImg:$p.prop("listStyleImage")},hg={transition:!0,transitionDelay:!0,animation:!0,willChange:!0,transitionDuration:$p.prop("transitionDuration","transition.duration"),transitionProperty:$p.prop("transitionProperty","transition.property"),transitionTimingFunction:$p.prop("transitionTimingFunction","transition.easing")},fg=lp({},Wp,Gp,Hp,Yp,qp,Kp,Xp,Qp,Zp,rg,ig,og,ag,sg,lg,cg,ug,dg,hg),pg=Object.assign({},ag,qp,Yp,Zp,ig),gg=(Object.keys(pg),[...Object.keys(fg),...xp]),mg={...fg,...wp},yg=t=>t in mg,bg=(t,e)=>t.startsWith("--")&&"string"==typeof e&&!function(t){return/^var\(--.+\)$/.test(t)}(e),vg=(t,e)=>{if(null==e)return e;const n=e=>t.__cssMap?.[e]?.varRef,r=t=>n(t)??t,[i,o]=function(t){const e=[];let n="",r=!1;for(let i=0;i<t.length;i++){const o=t[i];"("===o?(r=!0,n+=o):")"===o?(r=!1,n+=o):","!==o||r?n+=o:(e.push(n),n="")}return n=n.trim(),n&&e.push(n),e}(e);return n(i)??r(o)??r(e)};const _g=t=>e=>function(t){const{configs:e={},pseudos:n={},theme:r}=t,i=(t,o=!1)=>{const a=Tp(t,r),s=(t=>e=>{if(!e.__breakpoints)return t;const{isResponsive:n,toArrayValue:r,media:i}=e.__breakpoints,o={};for(const a in t){let s=Tp(t[a],e);if(null==s)continue;if(s=xc(s)&&n(s)?r(s):s,!Array.isArray(s)){o[a]=s;continue}const l=s.slice(0,i.length).length;for(let t=0;t<l;t+=1){const e=i?.[t];e?(o[e]=o[e]||{},null!=s[t]&&(o[e][a]=s[t])):o[a]=s[t]}}return o})(a)(r);let l={};for(let t in s){let c=Tp(s[t],r);t in n&&(t=n[t]),bg(t,c)&&(c=vg(r,c));let u=e[t];if(!0===u&&(u={property:t}),xc(c)){l[t]=l[t]??{},l[t]=lp({},l[t],i(c,!0));continue}let d=u?.transform?.(c,r,a)??c;d=u?.processResult?i(d,!0):d;const h=Tp(u?.property,r);if(!o&&u?.static){const t=Tp(u.static,r);l=lp({},l,t)}if(h&&Array.isArray(h))for(const t of h)l[t]=d;else h?"&"===h&&xc(d)?l=lp({},l,d):l[h]=d:xc(d)?l=lp({},l,d):l[t]=d}return l};return i}({theme:e,pseudos:wp,configs:fg})(t);function wg(t={}){const{name:e,strict:n=!0,hookName:i="useContext",providerName:o="Provider",errorMessage:a,defaultValue:s}=t,l=(0,r.createContext)(s);return l.displayName=e,[l.Provider,function t(){const e=(0,r.useContext)(l);if(!e&&n){const e=new Error(a??`${i} returned \`undefined\`. Seems you forgot to wrap component within ${o}`);throw e.name="ContextError",Error.captureStackTrace?.(e,t),e}return e},l]}const xg=(t=>{const e=new WeakMap;return(n,r,i,o)=>{if(void 0===n)return t(n,r,i);e.has(n)||e.set(n,new Map);const a=e.get(n);if(a.has(r))return a.get(r);const s=t(n,r,i,o);return a.set(r,s),s}})((function(t,e,n,r){const i="string"==typeof e?e.split("."):[e];for(r=0;r<i.length&&t;r+=1)t=t[i[r]];return void 0===t?n:t}));function Sg(t){const{cssVarsRoot:e,theme:n,children:i}=t,o=(0,r.useMemo)((()=>function(t){const e=function(t){const{__cssMap:e,__cssVars:n,__breakpoints:r,...i}=t;return i}(t),{cssMap:n,cssVars:r}=function(t){const e=function(t){const e=kp(t),n=function(t){return t.semanticTokens}(t),r=t=>xp.includes(t)||"default"===t,i={};return cp(e,((t,e)=>{null!=t&&(i[e.join(".")]={isSemantic:!1,value:t})})),cp(n,((t,e)=>{null!=t&&(i[e.join(".")]={isSemantic:!0,value:t})}),{stop:t=>Object.keys(t).every(r)}),i}(t),n=t.config?.cssVarPrefix;let r={};const i={};function o(t,r){const i=[String(t).split(".")[0],r].join(".");if(!e[i])return r;const{reference:o}=Cp(i,n);return o}for(const[t,a]of Object.entries(e)){const{isSemantic:e,value:s}=a,{variable:l,reference:c}=Cp(t,n);if(!e){if(t.startsWith("space")){const e=t.split("."),[n,...r]=e,o=`${n}.-${r.join(".")}`,a=Pu.negate(s),u=Pu.negate(c);i[o]={value:a,var:l,varRef:u}}r[l]=s,i[t]={value:s,var:l,varRef:c};continue}const u=xc(s)?s:{default:s};r=lp(r,Object.entries(u).reduce(((e,[n,r])=>{if(!r)return e;const i=o(t,`${r}`);return"default"===n?(e[l]=i,e):(e[wp?.[n]??n]={[l]:i},e)}),{})),i[t]={value:c,var:l,varRef:c}}return{cssVars:r,cssMap:i}}(e);return Object.assign(e,{__cssVars:{"--chakra-ring-inset":"var(--chakra-empty,/*!*/ /*!*/)","--chakra-ring-offset-width":"0px","--chakra-ring-offset-color":"#fff","--chakra-ring-color":"rgba(66, 153, 225, 0.6)","--chakra-ring-offset-shadow":"0 0 #0000","--chakra-ring-shadow":"0 0 #0000","--chakra-space-x-reverse":"0","--chakra-space-y-reverse":"0",...r},__cssMap:n,__breakpoints:sp(e.breakpoints)}),e}(n)),[n]);return(0,nh.jsxs)(If,{theme:o,children:[(0,nh.jsx)(kg,{root:e}),i]})}function kg({root:t=":host, :root"}){const e=[t,"[data-theme]"].join(",");return(0,nh.jsx)(qf,{styles:t=>({[e]:t.__cssVars})})}const[Cg,Tg]=wg({name:"StylesContext",errorMessage:"useStyles: `styles` is undefined. Seems you forgot to wrap the components in `<StylesProvider />` "});function Eg(){const{colorMode:t}=Bf();return(0,nh.jsx)(qf,{styles:e=>{const n=Tp(xg(e,"styles.global"),{theme:e,colorMode:t});if(n)return _g(n)(e)}})}const[Pg,Ig]=wg({strict:!1,name:"PortalManagerContext"});function Ag(t){const{children:e,zIndex:n}=t;return(0,nh.jsx)(Pg,{value:{zIndex:n},children:e})}Ag.displayName="PortalManager";const Mg=(0,r.createContext)({getDocument:()=>document,getWindow:()=>window});function Dg(t){const{children:e,environment:n,disabled:i}=t,o=(0,r.useRef)(null),a=(0,r.useMemo)((()=>n||{getDocument:()=>o.current?.ownerDocument??document,getWindow:()=>o.current?.ownerDocument.defaultView??window}),[n]),s=!i||!n;return(0,nh.jsxs)(Mg.Provider,{value:a,children:[e,s&&(0,nh.jsx)("span",{id:"__chakra_env",hidden:!0,ref:o})]})}Mg.displayName="EnvironmentContext",Dg.displayName="EnvironmentProvider";const Fg=t=>{const{children:e,colorModeManager:n,portalZIndex:r,resetScope:i,resetCSS:o=!0,theme:a={},environment:s,cssVarsRoot:l,disableEnvironment:c,disableGlobalStyle:u}=t,d=(0,nh.jsx)(Dg,{environment:s,disabled:c,children:e});return(0,nh.jsx)(Sg,{theme:a,cssVarsRoot:l,children:(0,nh.jsxs)(Wf,{colorModeManager:n,options:a.config,children:[o?(0,nh.jsx)(Jf,{scope:i}):(0,nh.jsx)(Zf,{}),!u&&(0,nh.jsx)(Eg,{}),r?(0,nh.jsx)(Ag,{zIndex:r,children:d}):d]})})},Rg="undefined"!=typeof document,Bg=Rg?r.useLayoutEffect:r.useEffect;function Lg(){const t=(0,r.useRef)(!1);return Bg((()=>(t.current=!0,()=>{t.current=!1})),[]),t}const Ng=t=>t;class Og{constructor(){this.order=[],this.scheduled=new Set}add(t){if(!this.scheduled.has(t))return this.scheduled.add(t),this.order.push(t),!0}remove(t){const e=this.order.indexOf(t);-1!==e&&(this.order.splice(e,1),this.scheduled.delete(t))}clear(){this.order.length=0,this.scheduled.clear()}}const zg=["prepare","read","update","preRender","render","postRender"],{schedule:Ug,cancel:jg,state:Vg,steps:$g}=function(t){let e=!1,n=!0;const r={delta:0,timestamp:0,isProcessing:!1},i=zg.reduce(((t,n)=>(t[n]=function(t){let e=new Og,n=new Og,r=0,i=!1,o=!1;const a=new WeakSet,s={schedule:(t,o=!1,s=!1)=>{const l=s&&i,c=l?e:n;return o&&a.add(t),c.add(t)&&l&&i&&(r=e.order.length),t},cancel:t=>{n.remove(t),a.delete(t)},process:l=>{if(i)o=!0;else{if(i=!0,[e,n]=[n,e],n.clear(),r=e.order.length,r)for(let n=0;n<r;n++){const r=e.order[n];r(l),a.has(r)&&(s.schedule(r),t())}i=!1,o&&(o=!1,s.process(l))}}};return s}((()=>e=!0)),t)),{}),o=t=>i[t].process(r),a=()=>{const i=performance.now();e=!1,r.delta=n?1e3/60:Math.max(Math.min(i-r.timestamp,40),1),r.timestamp=i,r.isProcessing=!0,zg.forEach(o),r.isProcessing=!1,e&&(n=!1,t(a))},s=zg.reduce(((o,s)=>{const l=i[s];return o[s]=(i,o=!1,s=!1)=>(e||(e=!0,n=!0,r.isProcessing||t(a)),l.schedule(i,o,s)),o}),{});return{schedule:s,cancel:t=>zg.forEach((e=>i[e].cancel(t))),state:r,steps:i}}("undefined"!=typeof requestAnimationFrame?requestAnimationFrame:Ng),Wg=(0,r.createContext)(null);function Gg(t){const e=(0,r.useRef)(null);return null===e.current&&(e.current=t()),e.current}class Hg extends r.Component{getSnapshotBeforeUpdate(t){const e=this.props.childRef.current;if(e&&t.isPresent&&!this.props.isPresent){const t=this.props.sizeRef.current;t.height=e.offsetHeight||0,t.width=e.offsetWidth||0,t.top=e.offsetTop,t.left=e.offsetLeft}return null}componentDidUpdate(){}render(){return this.props.children}}function Yg({children:t,isPresent:e}){const n=(0,r.useId)(),i=(0,r.useRef)(null),o=(0,r.useRef)({width:0,height:0,top:0,left:0});return(0,r.useInsertionEffect)((()=>{const{width:t,height:r,top:a,left:s}=o.current;if(e||!i.current||!t||!r)return;i.current.dataset.motionPopId=n;const l=document.createElement("style");return document.head.appendChild(l),l.sheet&&l.sheet.insertRule(`\n          [data-motion-pop-id="${n}"] {\n            position: absolute !important;\n            width: ${t}px !important;\n            height: ${r}px !important;\n            top: ${a}px !important;\n            left: ${s}px !important;\n          }\n        `),()=>{document.head.removeChild(l)}}),[e]),r.createElement(Hg,{isPresent:e,childRef:i,sizeRef:o},r.cloneElement(t,{ref:i}))}const qg=({children:t,initial:e,isPresent:n,onExitComplete:i,custom:o,presenceAffectsLayout:a,mode:s})=>{const l=Gg(Kg),c=(0,r.useId)(),u=(0,r.useMemo)((()=>({id:c,initial:e,isPresent:n,custom:o,onExitComplete:t=>{l.set(t,!0);for(const t of l.values())if(!t)return;i&&i()},register:t=>(l.set(t,!1),()=>l.delete(t))})),a?void 0:[n]);return(0,r.useMemo)((()=>{l.forEach(((t,e)=>l.set(e,!1)))}),[n]),r.useEffect((()=>{!n&&!l.size&&i&&i()}),[n]),"popLayout"===s&&(t=r.createElement(Yg,{isPresent:n},t)),r.createElement(Wg.Provider,{value:u},t)};function Kg(){return new Map}const Xg=(0,r.createContext)({});let Qg=Ng,Zg=Ng;const Jg=t=>t.key||"",tm=({children:t,custom:e,initial:n=!0,onExitComplete:i,exitBeforeEnter:o,presenceAffectsLayout:a=!0,mode:s="sync"})=>{Zg(!o,"Replace exitBeforeEnter with mode='wait'");const l=(0,r.useContext)(Xg).forceRender||function(){const t=Lg(),[e,n]=(0,r.useState)(0),i=(0,r.useCallback)((()=>{t.current&&n(e+1)}),[e]);return[(0,r.useCallback)((()=>Ug.postRender(i)),[i]),e]}()[0],c=Lg(),u=function(t){const e=[];return r.Children.forEach(t,(t=>{(0,r.isValidElement)(t)&&e.push(t)})),e}(t);let d=u;const h=(0,r.useRef)(new Map).current,f=(0,r.useRef)(d),p=(0,r.useRef)(new Map).current,g=(0,r.useRef)(!0);var m;if(Bg((()=>{g.current=!1,function(t,e){t.forEach((t=>{const n=Jg(t);e.set(n,t)}))}(u,p),f.current=d})),m=()=>{g.current=!0,p.clear(),h.clear()},(0,r.useEffect)((()=>()=>m()),[]),g.current)return r.createElement(r.Fragment,null,d.map((t=>r.createElement(qg,{key:Jg(t),isPresent:!0,initial:!!n&&void 0,presenceAffectsLayout:a,mode:s},t))));d=[...d];const y=f.current.map(Jg),b=u.map(Jg),v=y.length;for(let t=0;t<v;t++){const e=y[t];-1!==b.indexOf(e)||h.has(e)||h.set(e,void 0)}return"wait"===s&&h.size&&(d=[]),h.forEach(((t,n)=>{if(-1!==b.indexOf(n))return;const o=p.get(n);if(!o)return;const g=y.indexOf(n);let m=t;if(!m){const t=()=>{h.delete(n);const t=Array.from(p.keys()).filter((t=>!b.includes(t)));if(t.forEach((t=>p.delete(t))),f.current=u.filter((e=>{const r=Jg(e);return r===n||t.includes(r)})),!h.size){if(!1===c.current)return;l(),i&&i()}};m=r.createElement(qg,{key:Jg(o),isPresent:!1,onExitComplete:t,custom:e,presenceAffectsLayout:a,mode:s},o),h.set(n,m)}d.splice(g,0,m)})),d=d.map((t=>{const e=t.key;return h.has(e)?t:r.createElement(qg,{key:Jg(t),isPresent:!0,presenceAffectsLayout:a,mode:s},t)})),r.createElement(r.Fragment,null,h.size?d:d.map((t=>(0,r.cloneElement)(t))))},em=(t,e)=>{const n=(0,r.useRef)(!1),i=(0,r.useRef)(!1);(0,r.useEffect)((()=>{if(n.current&&i.current)return t();i.current=!0}),e),(0,r.useEffect)((()=>(n.current=!0,()=>{n.current=!1})),[])};const nm=(0,r.createContext)({transformPagePoint:t=>t,isStatic:!1,reducedMotion:"never"}),rm=(0,r.createContext)({}),im=(0,r.createContext)({strict:!1}),om=t=>t.replace(/([a-z])([A-Z])/g,"$1-$2").toLowerCase(),am="data-"+om("framerAppearId");function sm(t){return t&&"object"==typeof t&&Object.prototype.hasOwnProperty.call(t,"current")}function lm(t){return"string"==typeof t||Array.isArray(t)}function cm(t){return null!==t&&"object"==typeof t&&"function"==typeof t.start}const um=["animate","whileInView","whileFocus","whileHover","whileTap","whileDrag","exit"],dm=["initial",...um];function hm(t){return cm(t.animate)||dm.some((e=>lm(t[e])))}function fm(t){return Boolean(hm(t)||t.variants)}function pm(t){return Array.isArray(t)?t.join(" "):t}const gm={animation:["animate","variants","whileHover","whileTap","exit","whileInView","whileFocus","whileDrag"],exit:["exit"],drag:["drag","dragControls"],focus:["whileFocus"],hover:["whileHover","onHoverStart","onHoverEnd"],tap:["whileTap","onTap","onTapStart","onTapCancel"],pan:["onPan","onPanStart","onPanSessionStart","onPanEnd"],inView:["whileInView","onViewportEnter","onViewportLeave"],layout:["layout","layoutId"]},mm={};for(const t in gm)mm[t]={isEnabled:e=>gm[t].some((t=>!!e[t]))};const ym=(0,r.createContext)({}),bm=Symbol.for("motionComponentSymbol");function vm({preloadedFeatures:t,createVisualElement:e,useRender:n,useVisualState:i,Component:o}){t&&function(t){for(const e in t)mm[e]={...mm[e],...t[e]}}(t);const a=(0,r.forwardRef)((function(a,s){let l;const c={...(0,r.useContext)(nm),...a,layoutId:_m(a)},{isStatic:u}=c,d=function(t){const{initial:e,animate:n}=function(t,e){if(hm(t)){const{initial:e,animate:n}=t;return{initial:!1===e||lm(e)?e:void 0,animate:lm(n)?n:void 0}}return!1!==t.inherit?e:{}}(t,(0,r.useContext)(rm));return(0,r.useMemo)((()=>({initial:e,animate:n})),[pm(e),pm(n)])}(a),h=i(a,u);if(!u&&Rg){d.visualElement=function(t,e,n,i){const{visualElement:o}=(0,r.useContext)(rm),a=(0,r.useContext)(im),s=(0,r.useContext)(Wg),l=(0,r.useContext)(nm).reducedMotion,c=(0,r.useRef)();i=i||a.renderer,!c.current&&i&&(c.current=i(t,{visualState:e,parent:o,props:n,presenceContext:s,blockInitialAnimation:!!s&&!1===s.initial,reducedMotionConfig:l}));const u=c.current;(0,r.useInsertionEffect)((()=>{u&&u.update(n,s)}));const d=(0,r.useRef)(Boolean(n[am]&&!window.HandoffComplete));return Bg((()=>{u&&(u.render(),d.current&&u.animationState&&u.animationState.animateChanges())})),(0,r.useEffect)((()=>{u&&(u.updateFeatures(),!d.current&&u.animationState&&u.animationState.animateChanges(),d.current&&(d.current=!1,window.HandoffComplete=!0))})),u}(o,h,c,e);const n=(0,r.useContext)(ym),i=(0,r.useContext)(im).strict;d.visualElement&&(l=d.visualElement.loadFeatures(c,i,t,n))}return r.createElement(rm.Provider,{value:d},l&&d.visualElement?r.createElement(l,{visualElement:d.visualElement,...c}):null,n(o,a,function(t,e,n){return(0,r.useCallback)((r=>{r&&t.mount&&t.mount(r),e&&(r?e.mount(r):e.unmount()),n&&("function"==typeof n?n(r):sm(n)&&(n.current=r))}),[e])}(h,d.visualElement,s),h,u,d.visualElement))}));return a[bm]=o,a}function _m({layoutId:t}){const e=(0,r.useContext)(Xg).id;return e&&void 0!==t?e+"-"+t:t}function wm(t){function e(e,n={}){return vm(t(e,n))}if("undefined"==typeof Proxy)return e;const n=new Map;return new Proxy(e,{get:(t,r)=>(n.has(r)||n.set(r,e(r)),n.get(r))})}const xm=["animate","circle","defs","desc","ellipse","g","image","line","filter","marker","mask","metadata","path","pattern","polygon","polyline","rect","stop","switch","symbol","svg","text","tspan","use","view"];function Sm(t){return"string"==typeof t&&!t.includes("-")&&!!(xm.indexOf(t)>-1||/[A-Z]/.test(t))}const km={},Cm=["transformPerspective","x","y","z","translateX","translateY","translateZ","scale","scaleX","scaleY","rotate","rotateX","rotateY","rotateZ","skew","skewX","skewY"],Tm=new Set(Cm);function Em(t,{layout:e,layoutId:n}){return Tm.has(t)||t.startsWith("origin")||(e||void 0!==n)&&(!!km[t]||"opacity"===t)}const Pm=t=>Boolean(t&&t.getVelocity),Im={x:"translateX",y:"translateY",z:"translateZ",transformPerspective:"perspective"},Am=Cm.length,Mm=t=>e=>"string"==typeof e&&e.startsWith(t),Dm=Mm("--"),Fm=Mm("var(--"),Rm=(t,e)=>e&&"number"==typeof t?e.transform(t):t,Bm=(t,e,n)=>Math.min(Math.max(n,t),e),Lm={test:t=>"number"==typeof t,parse:parseFloat,transform:t=>t},Nm={...Lm,transform:t=>Bm(0,1,t)},Om={...Lm,default:1},zm=t=>Math.round(1e5*t)/1e5,Um=/(-)?([\d]*\.?[\d])+/g,jm=/(#[0-9a-f]{3,8}|(rgb|hsl)a?\((-?[\d\.]+%?[,\s]+){2}(-?[\d\.]+%?)\s*[\,\/]?\s*[\d\.]*%?\))/gi,Vm=/^(#[0-9a-f]{3,8}|(rgb|hsl)a?\((-?[\d\.]+%?[,\s]+){2}(-?[\d\.]+%?)\s*[\,\/]?\s*[\d\.]*%?\))$/i;function $m(t){return"string"==typeof t}const Wm=t=>({test:e=>$m(e)&&e.endsWith(t)&&1===e.split(" ").length,parse:parseFloat,transform:e=>`${e}${t}`}),Gm=Wm("deg"),Hm=Wm("%"),Ym=Wm("px"),qm=Wm("vh"),Km=Wm("vw"),Xm={...Hm,parse:t=>Hm.parse(t)/100,transform:t=>Hm.transform(100*t)},Qm={...Lm,transform:Math.round},Zm={borderWidth:Ym,borderTopWidth:Ym,borderRightWidth:Ym,borderBottomWidth:Ym,borderLeftWidth:Ym,borderRadius:Ym,radius:Ym,borderTopLeftRadius:Ym,borderTopRightRadius:Ym,borderBottomRightRadius:Ym,borderBottomLeftRadius:Ym,width:Ym,maxWidth:Ym,height:Ym,maxHeight:Ym,size:Ym,top:Ym,right:Ym,bottom:Ym,left:Ym,padding:Ym,paddingTop:Ym,paddingRight:Ym,paddingBottom:Ym,paddingLeft:Ym,margin:Ym,marginTop:Ym,marginRight:Ym,marginBottom:Ym,marginLeft:Ym,rotate:Gm,rotateX:Gm,rotateY:Gm,rotateZ:Gm,scale:Om,scaleX:Om,scaleY:Om,scaleZ:Om,skew:Gm,skewX:Gm,skewY:Gm,distance:Ym,translateX:Ym,translateY:Ym,translateZ:Ym,x:Ym,y:Ym,z:Ym,perspective:Ym,transformPerspective:Ym,opacity:Nm,originX:Xm,originY:Xm,originZ:Ym,zIndex:Qm,fillOpacity:Nm,strokeOpacity:Nm,numOctaves:Qm};function Jm(t,e,n,r){const{style:i,vars:o,transform:a,transformOrigin:s}=t;let l=!1,c=!1,u=!0;for(const t in e){const n=e[t];if(Dm(t)){o[t]=n;continue}const r=Zm[t],d=Rm(n,r);if(Tm.has(t)){if(l=!0,a[t]=d,!u)continue;n!==(r.default||0)&&(u=!1)}else t.startsWith("origin")?(c=!0,s[t]=d):i[t]=d}if(e.transform||(l||r?i.transform=function(t,{enableHardwareAcceleration:e=!0,allowTransformNone:n=!0},r,i){let o="";for(let e=0;e<Am;e++){const n=Cm[e];void 0!==t[n]&&(o+=`${Im[n]||n}(${t[n]}) `)}return e&&!t.z&&(o+="translateZ(0)"),o=o.trim(),i?o=i(t,r?"":o):n&&r&&(o="none"),o}(t.transform,n,u,r):i.transform&&(i.transform="none")),c){const{originX:t="50%",originY:e="50%",originZ:n=0}=s;i.transformOrigin=`${t} ${e} ${n}`}}function ty(t,e,n){for(const r in e)Pm(e[r])||Em(r,n)||(t[r]=e[r])}function ey(t,e,n){const i={},o=function(t,e,n){const i={};return ty(i,t.style||{},t),Object.assign(i,function({transformTemplate:t},e,n){return(0,r.useMemo)((()=>{const r={style:{},transform:{},transformOrigin:{},vars:{}};return Jm(r,e,{enableHardwareAcceleration:!n},t),Object.assign({},r.vars,r.style)}),[e])}(t,e,n)),t.transformValues?t.transformValues(i):i}(t,e,n);return t.drag&&!1!==t.dragListener&&(i.draggable=!1,o.userSelect=o.WebkitUserSelect=o.WebkitTouchCallout="none",o.touchAction=!0===t.drag?"none":"pan-"+("x"===t.drag?"y":"x")),void 0===t.tabIndex&&(t.onTap||t.onTapStart||t.whileTap)&&(i.tabIndex=0),i.style=o,i}const ny=new Set(["animate","exit","variants","initial","style","values","variants","transition","transformTemplate","transformValues","custom","inherit","onBeforeLayoutMeasure","onAnimationStart","onAnimationComplete","onUpdate","onDragStart","onDrag","onDragEnd","onMeasureDragConstraints","onDirectionLock","onDragTransitionEnd","_dragX","_dragY","onHoverStart","onHoverEnd","onViewportEnter","onViewportLeave","globalTapTarget","ignoreStrict","viewport"]);function ry(t){return t.startsWith("while")||t.startsWith("drag")&&"draggable"!==t||t.startsWith("layout")||t.startsWith("onTap")||t.startsWith("onPan")||t.startsWith("onLayout")||ny.has(t)}let iy=t=>!ry(t);try{(oy=require("@emotion/is-prop-valid").default)&&(iy=t=>t.startsWith("on")?!ry(t):oy(t))}catch(ot){}var oy;function ay(t,e,n){return"string"==typeof t?t:Ym.transform(e+n*t)}const sy={offset:"stroke-dashoffset",array:"stroke-dasharray"},ly={offset:"strokeDashoffset",array:"strokeDasharray"};function cy(t,{attrX:e,attrY:n,attrScale:r,originX:i,originY:o,pathLength:a,pathSpacing:s=1,pathOffset:l=0,...c},u,d,h){if(Jm(t,c,u,h),d)return void(t.style.viewBox&&(t.attrs.viewBox=t.style.viewBox));t.attrs=t.style,t.style={};const{attrs:f,style:p,dimensions:g}=t;f.transform&&(g&&(p.transform=f.transform),delete f.transform),g&&(void 0!==i||void 0!==o||p.transform)&&(p.transformOrigin=function(t,e,n){return`${ay(e,t.x,t.width)} ${ay(n,t.y,t.height)}`}(g,void 0!==i?i:.5,void 0!==o?o:.5)),void 0!==e&&(f.x=e),void 0!==n&&(f.y=n),void 0!==r&&(f.scale=r),void 0!==a&&function(t,e,n=1,r=0,i=!0){t.pathLength=1;const o=i?sy:ly;t[o.offset]=Ym.transform(-r);const a=Ym.transform(e),s=Ym.transform(n);t[o.array]=`${a} ${s}`}(f,a,s,l,!1)}const uy=t=>"string"==typeof t&&"svg"===t.toLowerCase();function dy(t,e,n,i){const o=(0,r.useMemo)((()=>{const n={style:{},transform:{},transformOrigin:{},vars:{},attrs:{}};return cy(n,e,{enableHardwareAcceleration:!1},uy(i),t.transformTemplate),{...n.attrs,style:{...n.style}}}),[e]);if(t.style){const e={};ty(e,t.style,t),o.style={...e,...o.style}}return o}function hy(t=!1){return(e,n,i,{latestValues:o},a)=>{const s=(Sm(e)?dy:ey)(n,o,a,e),l=function(t,e,n){const r={};for(const i in t)"values"===i&&"object"==typeof t.values||(iy(i)||!0===n&&ry(i)||!e&&!ry(i)||t.draggable&&i.startsWith("onDrag"))&&(r[i]=t[i]);return r}(n,"string"==typeof e,t),c={...l,...s,ref:i},{children:u}=n,d=(0,r.useMemo)((()=>Pm(u)?u.get():u),[u]);return(0,r.createElement)(e,{...c,children:d})}}function fy(t,{style:e,vars:n},r,i){Object.assign(t.style,e,i&&i.getProjectionStyles(r));for(const e in n)t.style.setProperty(e,n[e])}const py=new Set(["baseFrequency","diffuseConstant","kernelMatrix","kernelUnitLength","keySplines","keyTimes","limitingConeAngle","markerHeight","markerWidth","numOctaves","targetX","targetY","surfaceScale","specularConstant","specularExponent","stdDeviation","tableValues","viewBox","gradientTransform","pathLength","startOffset","textLength","lengthAdjust"]);function gy(t,e,n,r){fy(t,e,void 0,r);for(const n in e.attrs)t.setAttribute(py.has(n)?n:om(n),e.attrs[n])}function my(t,e){const{style:n}=t,r={};for(const i in n)(Pm(n[i])||e.style&&Pm(e.style[i])||Em(i,t))&&(r[i]=n[i]);return r}function yy(t,e){const n=my(t,e);for(const r in t)(Pm(t[r])||Pm(e[r]))&&(n[-1!==Cm.indexOf(r)?"attr"+r.charAt(0).toUpperCase()+r.substring(1):r]=t[r]);return n}function by(t,e,n,r={},i={}){return"function"==typeof e&&(e=e(void 0!==n?n:t.custom,r,i)),"string"==typeof e&&(e=t.variants&&t.variants[e]),"function"==typeof e&&(e=e(void 0!==n?n:t.custom,r,i)),e}const vy=t=>Array.isArray(t);function _y(t){const e=Pm(t)?t.get():t;return n=e,Boolean(n&&"object"==typeof n&&n.mix&&n.toValue)?e.toValue():e;var n}const wy=t=>(e,n)=>{const i=(0,r.useContext)(rm),o=(0,r.useContext)(Wg),a=()=>function({scrapeMotionValuesFromProps:t,createRenderState:e,onMount:n},r,i,o){const a={latestValues:xy(r,i,o,t),renderState:e()};return n&&(a.mount=t=>n(r,t,a)),a}(t,e,i,o);return n?a():Gg(a)};function xy(t,e,n,r){const i={},o=r(t,{});for(const t in o)i[t]=_y(o[t]);let{initial:a,animate:s}=t;const l=hm(t),c=fm(t);e&&c&&!l&&!1!==t.inherit&&(void 0===a&&(a=e.initial),void 0===s&&(s=e.animate));let u=!!n&&!1===n.initial;u=u||!1===a;const d=u?s:a;return d&&"boolean"!=typeof d&&!cm(d)&&(Array.isArray(d)?d:[d]).forEach((e=>{const n=by(t,e);if(!n)return;const{transitionEnd:r,transition:o,...a}=n;for(const t in a){let e=a[t];Array.isArray(e)&&(e=e[u?e.length-1:0]),null!==e&&(i[t]=e)}for(const t in r)i[t]=r[t]})),i}const Sy={useVisualState:wy({scrapeMotionValuesFromProps:yy,createRenderState:()=>({style:{},transform:{},transformOrigin:{},vars:{},attrs:{}}),onMount:(t,e,{renderState:n,latestValues:r})=>{Ug.read((()=>{try{n.dimensions="function"==typeof e.getBBox?e.getBBox():e.getBoundingClientRect()}catch(t){n.dimensions={x:0,y:0,width:0,height:0}}})),Ug.render((()=>{cy(n,r,{enableHardwareAcceleration:!1},uy(e.tagName),t.transformTemplate),gy(e,n)}))}})},ky={useVisualState:wy({scrapeMotionValuesFromProps:my,createRenderState:()=>({style:{},transform:{},transformOrigin:{},vars:{}})})};function Cy(t,e,n,r={passive:!0}){return t.addEventListener(e,n,r),()=>t.removeEventListener(e,n)}const Ty=t=>"mouse"===t.pointerType?"number"!=typeof t.button||t.button<=0:!1!==t.isPrimary;function Ey(t,e="page"){return{point:{x:t[e+"X"],y:t[e+"Y"]}}}function Py(t,e,n,r){return Cy(t,e,(t=>e=>Ty(e)&&t(e,Ey(e)))(n),r)}const Iy=(t,e)=>n=>e(t(n)),Ay=(...t)=>t.reduce(Iy);function My(t){let e=null;return()=>null===e&&(e=t,()=>{e=null})}const Dy=My("dragHorizontal"),Fy=My("dragVertical");function Ry(t){let e=!1;if("y"===t)e=Fy();else if("x"===t)e=Dy();else{const t=Dy(),n=Fy();t&&n?e=()=>{t(),n()}:(t&&t(),n&&n())}return e}function By(){const t=Ry(!0);return!t||(t(),!1)}class Ly{constructor(t){this.isMounted=!1,this.node=t}update(){}}function Ny(t,e){const n="pointer"+(e?"enter":"leave"),r="onHover"+(e?"Start":"End");return Py(t.current,n,((n,i)=>{if("touch"===n.pointerType||By())return;const o=t.getProps();t.animationState&&o.whileHover&&t.animationState.setActive("whileHover",e),o[r]&&Ug.update((()=>o[r](n,i)))}),{passive:!t.getProps()[r]})}const Oy=(t,e)=>!!e&&(t===e||Oy(t,e.parentElement));function zy(t,e){if(!e)return;const n=new PointerEvent("pointer"+t);e(n,Ey(n))}const Uy=new WeakMap,jy=new WeakMap,Vy=t=>{const e=Uy.get(t.target);e&&e(t)},$y=t=>{t.forEach(Vy)};const Wy={some:0,all:1},Gy={inView:{Feature:class extends Ly{constructor(){super(...arguments),this.hasEnteredView=!1,this.isInView=!1}startObserver(){this.unmount();const{viewport:t={}}=this.node.getProps(),{root:e,margin:n,amount:r="some",once:i}=t,o={root:e?e.current:void 0,rootMargin:n,threshold:"number"==typeof r?r:Wy[r]};return function(t,e,n){const r=function({root:t,...e}){const n=t||document;jy.has(n)||jy.set(n,{});const r=jy.get(n),i=JSON.stringify(e);return r[i]||(r[i]=new IntersectionObserver($y,{root:t,...e})),r[i]}(e);return Uy.set(t,n),r.observe(t),()=>{Uy.delete(t),r.unobserve(t)}}(this.node.current,o,(t=>{const{isIntersecting:e}=t;if(this.isInView===e)return;if(this.isInView=e,i&&!e&&this.hasEnteredView)return;e&&(this.hasEnteredView=!0),this.node.animationState&&this.node.animationState.setActive("whileInView",e);const{onViewportEnter:n,onViewportLeave:r}=this.node.getProps(),o=e?n:r;o&&o(t)}))}mount(){this.startObserver()}update(){if("undefined"==typeof IntersectionObserver)return;const{props:t,prevProps:e}=this.node;["amount","margin","root"].some(function({viewport:t={}},{viewport:e={}}={}){return n=>t[n]!==e[n]}(t,e))&&this.startObserver()}unmount(){}}},tap:{Feature:class extends Ly{constructor(){super(...arguments),this.removeStartListeners=Ng,this.removeEndListeners=Ng,this.removeAccessibleListeners=Ng,this.startPointerPress=(t,e)=>{if(this.isPressing)return;this.removeEndListeners();const n=this.node.getProps(),r=Py(window,"pointerup",((t,e)=>{if(!this.checkPressEnd())return;const{onTap:n,onTapCancel:r,globalTapTarget:i}=this.node.getProps();Ug.update((()=>{i||Oy(this.node.current,t.target)?n&&n(t,e):r&&r(t,e)}))}),{passive:!(n.onTap||n.onPointerUp)}),i=Py(window,"pointercancel",((t,e)=>this.cancelPress(t,e)),{passive:!(n.onTapCancel||n.onPointerCancel)});this.removeEndListeners=Ay(r,i),this.startPress(t,e)},this.startAccessiblePress=()=>{const t=Cy(this.node.current,"keydown",(t=>{"Enter"!==t.key||this.isPressing||(this.removeEndListeners(),this.removeEndListeners=Cy(this.node.current,"keyup",(t=>{"Enter"===t.key&&this.checkPressEnd()&&zy("up",((t,e)=>{const{onTap:n}=this.node.getProps();n&&Ug.update((()=>n(t,e)))}))})),zy("down",((t,e)=>{this.startPress(t,e)})))})),e=Cy(this.node.current,"blur",(()=>{this.isPressing&&zy("cancel",((t,e)=>this.cancelPress(t,e)))}));this.removeAccessibleListeners=Ay(t,e)}}startPress(t,e){this.isPressing=!0;const{onTapStart:n,whileTap:r}=this.node.getProps();r&&this.node.animationState&&this.node.animationState.setActive("whileTap",!0),n&&Ug.update((()=>n(t,e)))}checkPressEnd(){return this.removeEndListeners(),this.isPressing=!1,this.node.getProps().whileTap&&this.node.animationState&&this.node.animationState.setActive("whileTap",!1),!By()}cancelPress(t,e){if(!this.checkPressEnd())return;const{onTapCancel:n}=this.node.getProps();n&&Ug.update((()=>n(t,e)))}mount(){const t=this.node.getProps(),e=Py(t.globalTapTarget?window:this.node.current,"pointerdown",this.startPointerPress,{passive:!(t.onTapStart||t.onPointerStart)}),n=Cy(this.node.current,"focus",this.startAccessiblePress);this.removeStartListeners=Ay(e,n)}unmount(){this.removeStartListeners(),this.removeEndListeners(),this.removeAccessibleListeners()}}},focus:{Feature:class extends Ly{constructor(){super(...arguments),this.isActive=!1}onFocus(){let t=!1;try{t=this.node.current.matches(":focus-visible")}catch(e){t=!0}t&&this.node.animationState&&(this.node.animationState.setActive("whileFocus",!0),this.isActive=!0)}onBlur(){this.isActive&&this.node.animationState&&(this.node.animationState.setActive("whileFocus",!1),this.isActive=!1)}mount(){this.unmount=Ay(Cy(this.node.current,"focus",(()=>this.onFocus())),Cy(this.node.current,"blur",(()=>this.onBlur())))}unmount(){}}},hover:{Feature:class extends Ly{mount(){this.unmount=Ay(Ny(this.node,!0),Ny(this.node,!1))}unmount(){}}}};function Hy(t,e){if(!Array.isArray(e))return!1;const n=e.length;if(n!==t.length)return!1;for(let r=0;r<n;r++)if(e[r]!==t[r])return!1;return!0}function Yy(t,e,n){const r=t.getProps();return by(r,e,void 0!==n?n:r.custom,function(t){const e={};return t.values.forEach(((t,n)=>e[n]=t.get())),e}(t),function(t){const e={};return t.values.forEach(((t,n)=>e[n]=t.getVelocity())),e}(t))}const qy=t=>1e3*t,Ky=t=>t/1e3,Xy=t=>Array.isArray(t)&&"number"==typeof t[0];function Qy(t){return Boolean(!t||"string"==typeof t&&Jy[t]||Xy(t)||Array.isArray(t)&&t.every(Qy))}const Zy=([t,e,n,r])=>`cubic-bezier(${t}, ${e}, ${n}, ${r})`,Jy={linear:"linear",ease:"ease",easeIn:"ease-in",easeOut:"ease-out",easeInOut:"ease-in-out",circIn:Zy([0,.65,.55,1]),circOut:Zy([.55,0,1,.45]),backIn:Zy([.31,.01,.66,-.59]),backOut:Zy([.33,1.53,.69,.99])};function tb(t){if(t)return Xy(t)?Zy(t):Array.isArray(t)?t.map(tb):Jy[t]}const eb=(t,e,n)=>(((1-3*n+3*e)*t+(3*n-6*e))*t+3*e)*t;function nb(t,e,n,r){if(t===e&&n===r)return Ng;return i=>0===i||1===i?i:eb(function(t,e,n,r,i){let o,a,s=0;do{a=e+(n-e)/2,o=eb(a,r,i)-t,o>0?n=a:e=a}while(Math.abs(o)>1e-7&&++s<12);return a}(i,0,1,t,n),e,r)}const rb=nb(.42,0,1,1),ib=nb(0,0,.58,1),ob=nb(.42,0,.58,1),ab=t=>e=>e<=.5?t(2*e)/2:(2-t(2*(1-e)))/2,sb=t=>e=>1-t(1-e),lb=t=>1-Math.sin(Math.acos(t)),cb=sb(lb),ub=ab(lb),db=nb(.33,1.53,.69,.99),hb=sb(db),fb=ab(hb),pb={linear:Ng,easeIn:rb,easeInOut:ob,easeOut:ib,circIn:lb,circInOut:ub,circOut:cb,backIn:hb,backInOut:fb,backOut:db,anticipate:t=>(t*=2)<1?.5*hb(t):.5*(2-Math.pow(2,-10*(t-1)))},gb=t=>{if(Array.isArray(t)){Zg(4===t.length,"Cubic bezier arrays must contain four numerical values.");const[e,n,r,i]=t;return nb(e,n,r,i)}return"string"==typeof t?(Zg(void 0!==pb[t],`Invalid easing type '${t}'`),pb[t]):t},mb=(t,e)=>n=>Boolean($m(n)&&Vm.test(n)&&n.startsWith(t)||e&&Object.prototype.hasOwnProperty.call(n,e)),yb=(t,e,n)=>r=>{if(!$m(r))return r;const[i,o,a,s]=r.match(Um);return{[t]:parseFloat(i),[e]:parseFloat(o),[n]:parseFloat(a),alpha:void 0!==s?parseFloat(s):1}},bb={...Lm,transform:t=>Math.round((t=>Bm(0,255,t))(t))},vb={test:mb("rgb","red"),parse:yb("red","green","blue"),transform:({red:t,green:e,blue:n,alpha:r=1})=>"rgba("+bb.transform(t)+", "+bb.transform(e)+", "+bb.transform(n)+", "+zm(Nm.transform(r))+")"},_b={test:mb("#"),parse:function(t){let e="",n="",r="",i="";return t.length>5?(e=t.substring(1,3),n=t.substring(3,5),r=t.substring(5,7),i=t.substring(7,9)):(e=t.substring(1,2),n=t.substring(2,3),r=t.substring(3,4),i=t.substring(4,5),e+=e,n+=n,r+=r,i+=i),{red:parseInt(e,16),green:parseInt(n,16),blue:parseInt(r,16),alpha:i?parseInt(i,16)/255:1}},transform:vb.transform},wb={test:mb("hsl","hue"),parse:yb("hue","saturation","lightness"),transform:({hue:t,saturation:e,lightness:n,alpha:r=1})=>"hsla("+Math.round(t)+", "+Hm.transform(zm(e))+", "+Hm.transform(zm(n))+", "+zm(Nm.transform(r))+")"},xb={test:t=>vb.test(t)||_b.test(t)||wb.test(t),parse:t=>vb.test(t)?vb.parse(t):wb.test(t)?wb.parse(t):_b.parse(t),transform:t=>$m(t)?t:t.hasOwnProperty("red")?vb.transform(t):wb.transform(t)},Sb=(t,e,n)=>-n*t+n*e+t;function kb(t,e,n){return n<0&&(n+=1),n>1&&(n-=1),n<1/6?t+6*(e-t)*n:n<.5?e:n<2/3?t+(e-t)*(2/3-n)*6:t}const Cb=(t,e,n)=>{const r=t*t;return Math.sqrt(Math.max(0,n*(e*e-r)+r))},Tb=[_b,vb,wb];function Eb(t){const e=(n=t,Tb.find((t=>t.test(n))));var n;Zg(Boolean(e),`'${t}' is not an animatable color. Use the equivalent color code instead.`);let r=e.parse(t);return e===wb&&(r=function({hue:t,saturation:e,lightness:n,alpha:r}){t/=360,n/=100;let i=0,o=0,a=0;if(e/=100){const r=n<.5?n*(1+e):n+e-n*e,s=2*n-r;i=kb(s,r,t+1/3),o=kb(s,r,t),a=kb(s,r,t-1/3)}else i=o=a=n;return{red:Math.round(255*i),green:Math.round(255*o),blue:Math.round(255*a),alpha:r}}(r)),r}const Pb=(t,e)=>{const n=Eb(t),r=Eb(e),i={...n};return t=>(i.red=Cb(n.red,r.red,t),i.green=Cb(n.green,r.green,t),i.blue=Cb(n.blue,r.blue,t),i.alpha=Sb(n.alpha,r.alpha,t),vb.transform(i))},Ib={regex:/var\s*\(\s*--[\w-]+(\s*,\s*(?:(?:[^)(]|\((?:[^)(]+|\([^)(]*\))*\))*)+)?\s*\)/g,countKey:"Vars",token:"${v}",parse:Ng},Ab={regex:jm,countKey:"Colors",token:"${c}",parse:xb.parse},Mb={regex:Um,countKey:"Numbers",token:"${n}",parse:Lm.parse};function Db(t,{regex:e,countKey:n,token:r,parse:i}){const o=t.tokenised.match(e);o&&(t["num"+n]=o.length,t.tokenised=t.tokenised.replace(e,r),t.values.push(...o.map(i)))}function Fb(t){const e=t.toString(),n={value:e,tokenised:e,values:[],numVars:0,numColors:0,numNumbers:0};return n.value.includes("var(--")&&Db(n,Ib),Db(n,Ab),Db(n,Mb),n}function Rb(t){return Fb(t).values}function Bb(t){const{values:e,numColors:n,numVars:r,tokenised:i}=Fb(t),o=e.length;return t=>{let e=i;for(let i=0;i<o;i++)e=i<r?e.replace(Ib.token,t[i]):i<r+n?e.replace(Ab.token,xb.transform(t[i])):e.replace(Mb.token,zm(t[i]));return e}}const Lb=t=>"number"==typeof t?0:t,Nb={test:function(t){var e,n;return isNaN(t)&&$m(t)&&((null===(e=t.match(Um))||void 0===e?void 0:e.length)||0)+((null===(n=t.match(jm))||void 0===n?void 0:n.length)||0)>0},parse:Rb,createTransformer:Bb,getAnimatableNone:function(t){const e=Rb(t);return Bb(t)(e.map(Lb))}},Ob=(t,e)=>n=>`${n>0?e:t}`;function zb(t,e){return"number"==typeof t?n=>Sb(t,e,n):xb.test(t)?Pb(t,e):t.startsWith("var(")?Ob(t,e):Vb(t,e)}const Ub=(t,e)=>{const n=[...t],r=n.length,i=t.map(((t,n)=>zb(t,e[n])));return t=>{for(let e=0;e<r;e++)n[e]=i[e](t);return n}},jb=(t,e)=>{const n={...t,...e},r={};for(const i in n)void 0!==t[i]&&void 0!==e[i]&&(r[i]=zb(t[i],e[i]));return t=>{for(const e in r)n[e]=r[e](t);return n}},Vb=(t,e)=>{const n=Nb.createTransformer(e),r=Fb(t),i=Fb(e);return r.numVars===i.numVars&&r.numColors===i.numColors&&r.numNumbers>=i.numNumbers?Ay(Ub(r.values,i.values),n):(Qg(!0,`Complex values '${t}' and '${e}' too different to mix. Ensure all colors are of the same type, and that each contains the same quantity of number and color values. Falling back to instant transition.`),Ob(t,e))},$b=(t,e,n)=>{const r=e-t;return 0===r?1:(n-t)/r},Wb=(t,e)=>n=>Sb(t,e,n);function Gb(t,e,{clamp:n=!0,ease:r,mixer:i}={}){const o=t.length;if(Zg(o===e.length,"Both input and output ranges must be the same length"),1===o)return()=>e[0];t[0]>t[o-1]&&(t=[...t].reverse(),e=[...e].reverse());const a=function(t,e,n){const r=[],i=n||("number"==typeof(o=t[0])?Wb:"string"==typeof o?xb.test(o)?Pb:Vb:Array.isArray(o)?Ub:"object"==typeof o?jb:Wb);var o;const a=t.length-1;for(let n=0;n<a;n++){let o=i(t[n],t[n+1]);if(e){const t=Array.isArray(e)?e[n]||Ng:e;o=Ay(t,o)}r.push(o)}return r}(e,r,i),s=a.length,l=e=>{let n=0;if(s>1)for(;n<t.length-2&&!(e<t[n+1]);n++);const r=$b(t[n],t[n+1],e);return a[n](r)};return n?e=>l(Bm(t[0],t[o-1],e)):l}function Hb({duration:t=300,keyframes:e,times:n,ease:r="easeInOut"}){const i=(t=>Array.isArray(t)&&"number"!=typeof t[0])(r)?r.map(gb):gb(r),o={done:!1,value:e[0]},a=function(t,e){return t.map((t=>t*e))}(n&&n.length===e.length?n:function(t){const e=[0];return function(t,e){const n=t[t.length-1];for(let r=1;r<=e;r++){const i=$b(0,e,r);t.push(Sb(n,1,i))}}(e,t.length-1),e}(e),t),s=Gb(a,e,{ease:Array.isArray(i)?i:(l=e,c=i,l.map((()=>c||ob)).splice(0,l.length-1))});var l,c;return{calculatedDuration:t,next:e=>(o.value=s(e),o.done=e>=t,o)}}function Yb(t,e){return e?t*(1e3/e):0}function qb(t,e,n){const r=Math.max(e-5,0);return Yb(n-t(r),e-r)}const Kb=12;function Xb(t,e){return t*Math.sqrt(1-e*e)}const Qb=["duration","bounce"],Zb=["stiffness","damping","mass"];function Jb(t,e){return e.some((e=>void 0!==t[e]))}function tv({keyframes:t,restDelta:e,restSpeed:n,...r}){const i=t[0],o=t[t.length-1],a={done:!1,value:i},{stiffness:s,damping:l,mass:c,duration:u,velocity:d,isResolvedFromDuration:h}=function(t){let e={velocity:0,stiffness:100,damping:10,mass:1,isResolvedFromDuration:!1,...t};if(!Jb(t,Zb)&&Jb(t,Qb)){const n=function({duration:t=800,bounce:e=.25,velocity:n=0,mass:r=1}){let i,o;Qg(t<=qy(10),"Spring duration must be 10 seconds or less");let a=1-e;a=Bm(.05,1,a),t=Bm(.01,10,Ky(t)),a<1?(i=e=>{const r=e*a,i=r*t;return.001-(r-n)/Xb(e,a)*Math.exp(-i)},o=e=>{const r=e*a*t,o=r*n+n,s=Math.pow(a,2)*Math.pow(e,2)*t,l=Math.exp(-r),c=Xb(Math.pow(e,2),a);return(.001-i(e)>0?-1:1)*((o-s)*l)/c}):(i=e=>Math.exp(-e*t)*((e-n)*t+1)-.001,o=e=>Math.exp(-e*t)*(t*t*(n-e)));const s=function(t,e,n){let r=n;for(let n=1;n<Kb;n++)r-=t(r)/e(r);return r}(i,o,5/t);if(t=qy(t),isNaN(s))return{stiffness:100,damping:10,duration:t};{const e=Math.pow(s,2)*r;return{stiffness:e,damping:2*a*Math.sqrt(r*e),duration:t}}}(t);e={...e,...n,mass:1},e.isResolvedFromDuration=!0}return e}({...r,velocity:-Ky(r.velocity||0)}),f=d||0,p=l/(2*Math.sqrt(s*c)),g=o-i,m=Ky(Math.sqrt(s/c)),y=Math.abs(g)<5;let b;if(n||(n=y?.01:2),e||(e=y?.005:.5),p<1){const t=Xb(m,p);b=e=>{const n=Math.exp(-p*m*e);return o-n*((f+p*m*g)/t*Math.sin(t*e)+g*Math.cos(t*e))}}else if(1===p)b=t=>o-Math.exp(-m*t)*(g+(f+m*g)*t);else{const t=m*Math.sqrt(p*p-1);b=e=>{const n=Math.exp(-p*m*e),r=Math.min(t*e,300);return o-n*((f+p*m*g)*Math.sinh(r)+t*g*Math.cosh(r))/t}}return{calculatedDuration:h&&u||null,next:t=>{const r=b(t);if(h)a.done=t>=u;else{let i=f;0!==t&&(i=p<1?qb(b,t,r):0);const s=Math.abs(i)<=n,l=Math.abs(o-r)<=e;a.done=s&&l}return a.value=a.done?o:r,a}}}function ev({keyframes:t,velocity:e=0,power:n=.8,timeConstant:r=325,bounceDamping:i=10,bounceStiffness:o=500,modifyTarget:a,min:s,max:l,restDelta:c=.5,restSpeed:u}){const d=t[0],h={done:!1,value:d},f=t=>void 0===s?l:void 0===l||Math.abs(s-t)<Math.abs(l-t)?s:l;let p=n*e;const g=d+p,m=void 0===a?g:a(g);m!==g&&(p=m-d);const y=t=>-p*Math.exp(-t/r),b=t=>m+y(t),v=t=>{const e=y(t),n=b(t);h.done=Math.abs(e)<=c,h.value=h.done?m:n};let _,w;const x=t=>{var e;e=h.value,(void 0!==s&&e<s||void 0!==l&&e>l)&&(_=t,w=tv({keyframes:[h.value,f(h.value)],velocity:qb(b,t,h.value),damping:i,stiffness:o,restDelta:c,restSpeed:u}))};return x(0),{calculatedDuration:null,next:t=>{let e=!1;return w||void 0!==_||(e=!0,v(t),x(t)),void 0!==_&&t>_?w.next(t-_):(!e&&v(t),h)}}}const nv=t=>{const e=({timestamp:e})=>t(e);return{start:()=>Ug.update(e,!0),stop:()=>jg(e),now:()=>Vg.isProcessing?Vg.timestamp:performance.now()}};function rv(t){let e=0,n=t.next(e);for(;!n.done&&e<2e4;)e+=50,n=t.next(e);return e>=2e4?1/0:e}const iv={decay:ev,inertia:ev,tween:Hb,keyframes:Hb,spring:tv};function ov({autoplay:t=!0,delay:e=0,driver:n=nv,keyframes:r,type:i="keyframes",repeat:o=0,repeatDelay:a=0,repeatType:s="loop",onPlay:l,onStop:c,onComplete:u,onUpdate:d,...h}){let f,p,g=1,m=!1;const y=()=>{p=new Promise((t=>{f=t}))};let b;y();const v=iv[i]||Hb;let _;v!==Hb&&"number"!=typeof r[0]&&(_=Gb([0,100],r,{clamp:!1}),r=[0,100]);const w=v({...h,keyframes:r});let x;"mirror"===s&&(x=v({...h,keyframes:[...r].reverse(),velocity:-(h.velocity||0)}));let S="idle",k=null,C=null,T=null;null===w.calculatedDuration&&o&&(w.calculatedDuration=rv(w));const{calculatedDuration:E}=w;let P=1/0,I=1/0;null!==E&&(P=E+a,I=P*(o+1)-a);let A=0;const M=t=>{if(null===C)return;g>0&&(C=Math.min(C,t)),g<0&&(C=Math.min(t-I/g,C)),A=null!==k?k:Math.round(t-C)*g;const n=A-e*(g>=0?1:-1),i=g>=0?n<0:n>I;A=Math.max(n,0),"finished"===S&&null===k&&(A=I);let l=A,c=w;if(o){const t=Math.min(A,I)/P;let e=Math.floor(t),n=t%1;!n&&t>=1&&(n=1),1===n&&e--,e=Math.min(e,o+1),Boolean(e%2)&&("reverse"===s?(n=1-n,a&&(n-=a/P)):"mirror"===s&&(c=x)),l=Bm(0,1,n)*P}const u=i?{done:!1,value:r[0]}:c.next(l);_&&(u.value=_(u.value));let{done:h}=u;i||null===E||(h=g>=0?A>=I:A<=0);const f=null===k&&("finished"===S||"running"===S&&h);return d&&d(u.value),f&&R(),u},D=()=>{b&&b.stop(),b=void 0},F=()=>{S="idle",D(),f(),y(),C=T=null},R=()=>{S="finished",u&&u(),D(),f()},B=()=>{if(m)return;b||(b=n(M));const t=b.now();l&&l(),null!==k?C=t-k:C&&"finished"!==S||(C=t),"finished"===S&&y(),T=C,k=null,S="running",b.start()};t&&B();const L={then:(t,e)=>p.then(t,e),get time(){return Ky(A)},set time(t){t=qy(t),A=t,null===k&&b&&0!==g?C=b.now()-t/g:k=t},get duration(){const t=null===w.calculatedDuration?rv(w):w.calculatedDuration;return Ky(t)},get speed(){return g},set speed(t){t!==g&&b&&(g=t,L.time=Ky(A))},get state(){return S},play:B,pause:()=>{S="paused",k=A},stop:()=>{m=!0,"idle"!==S&&(S="idle",c&&c(),F())},cancel:()=>{null!==T&&M(T),F()},complete:()=>{S="finished"},sample:t=>(C=0,M(t))};return L}const av=function(){let t;return()=>(void 0===t&&(t=Object.hasOwnProperty.call(Element.prototype,"animate")),t)}(),sv=new Set(["opacity","clipPath","filter","transform","backgroundColor"]);const lv={type:"spring",stiffness:500,damping:25,restSpeed:10},cv={type:"keyframes",duration:.8},uv={type:"keyframes",ease:[.25,.1,.35,1],duration:.3},dv=(t,{keyframes:e})=>e.length>2?cv:Tm.has(t)?t.startsWith("scale")?{type:"spring",stiffness:550,damping:0===e[1]?2*Math.sqrt(550):30,restSpeed:10}:lv:uv,hv=(t,e)=>!("zIndex"===t||"number"!=typeof e&&!Array.isArray(e)&&("string"!=typeof e||!Nb.test(e)&&"0"!==e||e.startsWith("url("))),fv=new Set(["brightness","contrast","saturate","opacity"]);function pv(t){const[e,n]=t.slice(0,-1).split("(");if("drop-shadow"===e)return t;const[r]=n.match(Um)||[];if(!r)return t;const i=n.replace(r,"");let o=fv.has(e)?1:0;return r!==n&&(o*=100),e+"("+o+i+")"}const gv=/([a-z-]*)\(.*?\)/g,mv={...Nb,getAnimatableNone:t=>{const e=t.match(gv);return e?e.map(pv).join(" "):t}},yv={...Zm,color:xb,backgroundColor:xb,outlineColor:xb,fill:xb,stroke:xb,borderColor:xb,borderTopColor:xb,borderRightColor:xb,borderBottomColor:xb,borderLeftColor:xb,filter:mv,WebkitFilter:mv},bv=t=>yv[t];function vv(t,e){let n=bv(t);return n!==mv&&(n=Nb),n.getAnimatableNone?n.getAnimatableNone(e):void 0}const _v=t=>/^0[^.\s]+$/.test(t);function wv(t){return"number"==typeof t?0===t:null!==t?"none"===t||"0"===t||_v(t):void 0}function xv(t,e){return t[e]||t.default||t}const Sv=(t,e,n,r={})=>i=>{const o=xv(r,t)||{},a=o.delay||r.delay||0;let{elapsed:s=0}=r;s-=qy(a);const l=function(t,e,n,r){const i=hv(e,n);let o;o=Array.isArray(n)?[...n]:[null,n];const a=void 0!==r.from?r.from:t.get();let s;const l=[];for(let t=0;t<o.length;t++)null===o[t]&&(o[t]=0===t?a:o[t-1]),wv(o[t])&&l.push(t),"string"==typeof o[t]&&"none"!==o[t]&&"0"!==o[t]&&(s=o[t]);if(i&&l.length&&s)for(let t=0;t<l.length;t++)o[l[t]]=vv(e,s);return o}(e,t,n,o),c=l[0],u=l[l.length-1],d=hv(t,c),h=hv(t,u);Qg(d===h,`You are trying to animate ${t} from "${c}" to "${u}". ${c} is not an animatable value - to enable this animation set ${c} to a value animatable to ${u} via the \`style\` property.`);let f={keyframes:l,velocity:e.getVelocity(),ease:"easeOut",...o,delay:-s,onUpdate:t=>{e.set(t),o.onUpdate&&o.onUpdate(t)},onComplete:()=>{i(),o.onComplete&&o.onComplete()}};if(function({when:t,delay:e,delayChildren:n,staggerChildren:r,staggerDirection:i,repeat:o,repeatType:a,repeatDelay:s,from:l,elapsed:c,...u}){return!!Object.keys(u).length}(o)||(f={...f,...dv(t,f)}),f.duration&&(f.duration=qy(f.duration)),f.repeatDelay&&(f.repeatDelay=qy(f.repeatDelay)),!d||!h||!1===o.type)return function({keyframes:t,delay:e,onUpdate:n,onComplete:r}){const i=()=>(n&&n(t[t.length-1]),r&&r(),{time:0,speed:1,duration:0,play:Ng,pause:Ng,stop:Ng,then:t=>(t(),Promise.resolve()),cancel:Ng,complete:Ng});return e?ov({keyframes:[0,1],duration:0,delay:e,onComplete:i}):i()}(f);if(!r.isHandoff&&e.owner&&e.owner.current instanceof HTMLElement&&!e.owner.getProps().onUpdate){const n=function(t,e,{onUpdate:n,onComplete:r,...i}){if(!av()||!sv.has(e)||i.repeatDelay||"mirror"===i.repeatType||0===i.damping||"inertia"===i.type)return!1;let o,a,s=!1,l=!1;const c=()=>{a=new Promise((t=>{o=t}))};c();let{keyframes:u,duration:d=300,ease:h,times:f}=i;if(((t,e)=>"spring"===e.type||"backgroundColor"===t||!Qy(e.ease))(e,i)){const t=ov({...i,repeat:0,delay:0});let e={done:!1,value:u[0]};const n=[];let r=0;for(;!e.done&&r<2e4;)e=t.sample(r),n.push(e.value),r+=10;f=void 0,u=n,d=r-10,h="linear"}const p=function(t,e,n,{delay:r=0,duration:i,repeat:o=0,repeatType:a="loop",ease:s,times:l}={}){const c={[e]:n};l&&(c.offset=l);const u=tb(s);return Array.isArray(u)&&(c.easing=u),t.animate(c,{delay:r,duration:i,easing:Array.isArray(u)?"linear":u,fill:"both",iterations:o+1,direction:"reverse"===a?"alternate":"normal"})}(t.owner.current,e,u,{...i,duration:d,ease:h,times:f}),g=()=>{l=!1,p.cancel()},m=()=>{l=!0,Ug.update(g),o(),c()};return p.onfinish=()=>{l||(t.set(function(t,{repeat:e,repeatType:n="loop"}){return t[e&&"loop"!==n&&e%2==1?0:t.length-1]}(u,i)),r&&r(),m())},{then:(t,e)=>a.then(t,e),attachTimeline:t=>(p.timeline=t,p.onfinish=null,Ng),get time(){return Ky(p.currentTime||0)},set time(t){p.currentTime=qy(t)},get speed(){return p.playbackRate},set speed(t){p.playbackRate=t},get duration(){return Ky(d)},play:()=>{s||(p.play(),jg(g))},pause:()=>p.pause(),stop:()=>{if(s=!0,"idle"===p.playState)return;const{currentTime:e}=p;if(e){const n=ov({...i,autoplay:!1});t.setWithVelocity(n.sample(e-10).value,n.sample(e).value,10)}m()},complete:()=>{l||p.finish()},cancel:m}}(e,t,f);if(n)return n}return ov(f)};function kv(t){return Boolean(Pm(t)&&t.add)}const Cv=t=>/^\-?\d*\.?\d+$/.test(t);function Tv(t,e){-1===t.indexOf(e)&&t.push(e)}function Ev(t,e){const n=t.indexOf(e);n>-1&&t.splice(n,1)}class Pv{constructor(){this.subscriptions=[]}add(t){return Tv(this.subscriptions,t),()=>Ev(this.subscriptions,t)}notify(t,e,n){const r=this.subscriptions.length;if(r)if(1===r)this.subscriptions[0](t,e,n);else for(let i=0;i<r;i++){const r=this.subscriptions[i];r&&r(t,e,n)}}getSize(){return this.subscriptions.length}clear(){this.subscriptions.length=0}}const Iv={current:void 0};class Av{constructor(t,e={}){var n;this.version="10.18.0",this.timeDelta=0,this.lastUpdated=0,this.canTrackVelocity=!1,this.events={},this.updateAndNotify=(t,e=!0)=>{this.prev=this.current,this.current=t;const{delta:n,timestamp:r}=Vg;this.lastUpdated!==r&&(this.timeDelta=n,this.lastUpdated=r,Ug.postRender(this.scheduleVelocityCheck)),this.prev!==this.current&&this.events.change&&this.events.change.notify(this.current),this.events.velocityChange&&this.events.velocityChange.notify(this.getVelocity()),e&&this.events.renderRequest&&this.events.renderRequest.notify(this.current)},this.scheduleVelocityCheck=()=>Ug.postRender(this.velocityCheck),this.velocityCheck=({timestamp:t})=>{t!==this.lastUpdated&&(this.prev=this.current,this.events.velocityChange&&this.events.velocityChange.notify(this.getVelocity()))},this.hasAnimated=!1,this.prev=this.current=t,this.canTrackVelocity=(n=this.current,!isNaN(parseFloat(n))),this.owner=e.owner}onChange(t){return this.on("change",t)}on(t,e){this.events[t]||(this.events[t]=new Pv);const n=this.events[t].add(e);return"change"===t?()=>{n(),Ug.read((()=>{this.events.change.getSize()||this.stop()}))}:n}clearListeners(){for(const t in this.events)this.events[t].clear()}attach(t,e){this.passiveEffect=t,this.stopPassiveEffect=e}set(t,e=!0){e&&this.passiveEffect?this.passiveEffect(t,this.updateAndNotify):this.updateAndNotify(t,e)}setWithVelocity(t,e,n){this.set(e),this.prev=t,this.timeDelta=n}jump(t){this.updateAndNotify(t),this.prev=t,this.stop(),this.stopPassiveEffect&&this.stopPassiveEffect()}get(){return Iv.current&&Iv.current.push(this),this.current}getPrevious(){return this.prev}getVelocity(){return this.canTrackVelocity?Yb(parseFloat(this.current)-parseFloat(this.prev),this.timeDelta):0}start(t){return this.stop(),new Promise((e=>{this.hasAnimated=!0,this.animation=t(e),this.events.animationStart&&this.events.animationStart.notify()})).then((()=>{this.events.animationComplete&&this.events.animationComplete.notify(),this.clearAnimation()}))}stop(){this.animation&&(this.animation.stop(),this.events.animationCancel&&this.events.animationCancel.notify()),this.clearAnimation()}isAnimating(){return!!this.animation}clearAnimation(){delete this.animation}destroy(){this.clearListeners(),this.stop(),this.stopPassiveEffect&&this.stopPassiveEffect()}}function Mv(t,e){return new Av(t,e)}const Dv=t=>e=>e.test(t),Fv=[Lm,Ym,Hm,Gm,Km,qm,{test:t=>"auto"===t,parse:t=>t}],Rv=t=>Fv.find(Dv(t)),Bv=[...Fv,xb,Nb];function Lv(t,e,n){t.hasValue(e)?t.getValue(e).set(n):t.addValue(e,Mv(n))}function Nv(t,e){if(e)return(e[t]||e.default||e).from}function Ov({protectedKeys:t,needsAnimating:e},n){const r=t.hasOwnProperty(n)&&!0!==e[n];return e[n]=!1,r}function zv(t,e){const n=t.get();if(!Array.isArray(e))return n!==e;for(let t=0;t<e.length;t++)if(e[t]!==n)return!0}function Uv(t,e,{delay:n=0,transitionOverride:r,type:i}={}){let{transition:o=t.getDefaultTransition(),transitionEnd:a,...s}=t.makeTargetAnimatable(e);const l=t.getValue("willChange");r&&(o=r);const c=[],u=i&&t.animationState&&t.animationState.getState()[i];for(const e in s){const r=t.getValue(e),i=s[e];if(!r||void 0===i||u&&Ov(u,e))continue;const a={delay:n,elapsed:0,...xv(o||{},e)};if(window.HandoffAppearAnimations){const n=t.getProps()[am];if(n){const t=window.HandoffAppearAnimations(n,e,r,Ug);null!==t&&(a.elapsed=t,a.isHandoff=!0)}}let d=!a.isHandoff&&!zv(r,i);if("spring"===a.type&&(r.getVelocity()||a.velocity)&&(d=!1),r.animation&&(d=!1),d)continue;r.start(Sv(e,r,i,t.shouldReduceMotion&&Tm.has(e)?{type:!1}:a));const h=r.animation;kv(l)&&(l.add(e),h.then((()=>l.remove(e)))),c.push(h)}return a&&Promise.all(c).then((()=>{a&&function(t,e){const n=Yy(t,e);let{transitionEnd:r={},transition:i={},...o}=n?t.makeTargetAnimatable(n,!1):{};o={...o,...r};for(const e in o)Lv(t,e,(a=o[e],vy(a)?a[a.length-1]||0:a));var a}(t,a)})),c}function jv(t,e,n={}){const r=Yy(t,e,n.custom);let{transition:i=t.getDefaultTransition()||{}}=r||{};n.transitionOverride&&(i=n.transitionOverride);const o=r?()=>Promise.all(Uv(t,r,n)):()=>Promise.resolve(),a=t.variantChildren&&t.variantChildren.size?(r=0)=>{const{delayChildren:o=0,staggerChildren:a,staggerDirection:s}=i;return function(t,e,n=0,r=0,i=1,o){const a=[],s=(t.variantChildren.size-1)*r,l=1===i?(t=0)=>t*r:(t=0)=>s-t*r;return Array.from(t.variantChildren).sort(Vv).forEach(((t,r)=>{t.notify("AnimationStart",e),a.push(jv(t,e,{...o,delay:n+l(r)}).then((()=>t.notify("AnimationComplete",e))))})),Promise.all(a)}(t,e,o+r,a,s,n)}:()=>Promise.resolve(),{when:s}=i;if(s){const[t,e]="beforeChildren"===s?[o,a]:[a,o];return t().then((()=>e()))}return Promise.all([o(),a(n.delay)])}function Vv(t,e){return t.sortNodePosition(e)}const $v=[...um].reverse(),Wv=um.length;function Gv(t){let e=function(t){return e=>Promise.all(e.map((({animation:e,options:n})=>function(t,e,n={}){let r;if(t.notify("AnimationStart",e),Array.isArray(e)){const i=e.map((e=>jv(t,e,n)));r=Promise.all(i)}else if("string"==typeof e)r=jv(t,e,n);else{const i="function"==typeof e?Yy(t,e,n.custom):e;r=Promise.all(Uv(t,i,n))}return r.then((()=>t.notify("AnimationComplete",e)))}(t,e,n))))}(t);const n={animate:Yv(!0),whileInView:Yv(),whileHover:Yv(),whileTap:Yv(),whileDrag:Yv(),whileFocus:Yv(),exit:Yv()};let r=!0;const i=(e,n)=>{const r=Yy(t,n);if(r){const{transition:t,transitionEnd:n,...i}=r;e={...e,...i,...n}}return e};function o(o,a){const s=t.getProps(),l=t.getVariantContext(!0)||{},c=[],u=new Set;let d={},h=1/0;for(let e=0;e<Wv;e++){const f=$v[e],p=n[f],g=void 0!==s[f]?s[f]:l[f],m=lm(g),y=f===a?p.isActive:null;!1===y&&(h=e);let b=g===l[f]&&g!==s[f]&&m;if(b&&r&&t.manuallyAnimateOnMount&&(b=!1),p.protectedKeys={...d},!p.isActive&&null===y||!g&&!p.prevProp||cm(g)||"boolean"==typeof g)continue;let v=Hv(p.prevProp,g)||f===a&&p.isActive&&!b&&m||e>h&&m,_=!1;const w=Array.isArray(g)?g:[g];let x=w.reduce(i,{});!1===y&&(x={});const{prevResolvedValues:S={}}=p,k={...S,...x},C=t=>{v=!0,u.has(t)&&(_=!0,u.delete(t)),p.needsAnimating[t]=!0};for(const t in k){const e=x[t],n=S[t];if(d.hasOwnProperty(t))continue;let r=!1;r=vy(e)&&vy(n)?!Hy(e,n):e!==n,r?void 0!==e?C(t):u.add(t):void 0!==e&&u.has(t)?C(t):p.protectedKeys[t]=!0}p.prevProp=g,p.prevResolvedValues=x,p.isActive&&(d={...d,...x}),r&&t.blockInitialAnimation&&(v=!1),!v||b&&!_||c.push(...w.map((t=>({animation:t,options:{type:f,...o}}))))}if(u.size){const e={};u.forEach((n=>{const r=t.getBaseTarget(n);void 0!==r&&(e[n]=r)})),c.push({animation:e})}let f=Boolean(c.length);return!r||!1!==s.initial&&s.initial!==s.animate||t.manuallyAnimateOnMount||(f=!1),r=!1,f?e(c):Promise.resolve()}return{animateChanges:o,setActive:function(e,r,i){var a;if(n[e].isActive===r)return Promise.resolve();null===(a=t.variantChildren)||void 0===a||a.forEach((t=>{var n;return null===(n=t.animationState)||void 0===n?void 0:n.setActive(e,r)})),n[e].isActive=r;const s=o(i,e);for(const t in n)n[t].protectedKeys={};return s},setAnimateFunction:function(n){e=n(t)},getState:()=>n}}function Hv(t,e){return"string"==typeof e?e!==t:!!Array.isArray(e)&&!Hy(e,t)}function Yv(t=!1){return{isActive:t,protectedKeys:{},needsAnimating:{},prevResolvedValues:{}}}let qv=0;const Kv={animation:{Feature:class extends Ly{constructor(t){super(t),t.animationState||(t.animationState=Gv(t))}updateAnimationControlsSubscription(){const{animate:t}=this.node.getProps();this.unmount(),cm(t)&&(this.unmount=t.subscribe(this.node))}mount(){this.updateAnimationControlsSubscription()}update(){const{animate:t}=this.node.getProps(),{animate:e}=this.node.prevProps||{};t!==e&&this.updateAnimationControlsSubscription()}unmount(){}}},exit:{Feature:class extends Ly{constructor(){super(...arguments),this.id=qv++}update(){if(!this.node.presenceContext)return;const{isPresent:t,onExitComplete:e,custom:n}=this.node.presenceContext,{isPresent:r}=this.node.prevPresenceContext||{};if(!this.node.animationState||t===r)return;const i=this.node.animationState.setActive("exit",!t,{custom:null!=n?n:this.node.getProps().custom});e&&!t&&i.then((()=>e(this.id)))}mount(){const{register:t}=this.node.presenceContext||{};t&&(this.unmount=t(this.id))}unmount(){}}}},Xv=(t,e)=>Math.abs(t-e);class Qv{constructor(t,e,{transformPagePoint:n,contextWindow:r,dragSnapToOrigin:i=!1}={}){if(this.startEvent=null,this.lastMoveEvent=null,this.lastMoveEventInfo=null,this.handlers={},this.contextWindow=window,this.updatePoint=()=>{if(!this.lastMoveEvent||!this.lastMoveEventInfo)return;const t=t_(this.lastMoveEventInfo,this.history),e=null!==this.startEvent,n=function(t,e){const n=Xv(t.x,e.x),r=Xv(t.y,e.y);return Math.sqrt(n**2+r**2)}(t.offset,{x:0,y:0})>=3;if(!e&&!n)return;const{point:r}=t,{timestamp:i}=Vg;this.history.push({...r,timestamp:i});const{onStart:o,onMove:a}=this.handlers;e||(o&&o(this.lastMoveEvent,t),this.startEvent=this.lastMoveEvent),a&&a(this.lastMoveEvent,t)},this.handlePointerMove=(t,e)=>{this.lastMoveEvent=t,this.lastMoveEventInfo=Zv(e,this.transformPagePoint),Ug.update(this.updatePoint,!0)},this.handlePointerUp=(t,e)=>{this.end();const{onEnd:n,onSessionEnd:r,resumeAnimation:i}=this.handlers;if(this.dragSnapToOrigin&&i&&i(),!this.lastMoveEvent||!this.lastMoveEventInfo)return;const o=t_("pointercancel"===t.type?this.lastMoveEventInfo:Zv(e,this.transformPagePoint),this.history);this.startEvent&&n&&n(t,o),r&&r(t,o)},!Ty(t))return;this.dragSnapToOrigin=i,this.handlers=e,this.transformPagePoint=n,this.contextWindow=r||window;const o=Zv(Ey(t),this.transformPagePoint),{point:a}=o,{timestamp:s}=Vg;this.history=[{...a,timestamp:s}];const{onSessionStart:l}=e;l&&l(t,t_(o,this.history)),this.removeListeners=Ay(Py(this.contextWindow,"pointermove",this.handlePointerMove),Py(this.contextWindow,"pointerup",this.handlePointerUp),Py(this.contextWindow,"pointercancel",this.handlePointerUp))}updateHandlers(t){this.handlers=t}end(){this.removeListeners&&this.removeListeners(),jg(this.updatePoint)}}function Zv(t,e){return e?{point:e(t.point)}:t}function Jv(t,e){return{x:t.x-e.x,y:t.y-e.y}}function t_({point:t},e){return{point:t,delta:Jv(t,n_(e)),offset:Jv(t,e_(e)),velocity:r_(e,.1)}}function e_(t){return t[0]}function n_(t){return t[t.length-1]}function r_(t,e){if(t.length<2)return{x:0,y:0};let n=t.length-1,r=null;const i=n_(t);for(;n>=0&&(r=t[n],!(i.timestamp-r.timestamp>qy(e)));)n--;if(!r)return{x:0,y:0};const o=Ky(i.timestamp-r.timestamp);if(0===o)return{x:0,y:0};const a={x:(i.x-r.x)/o,y:(i.y-r.y)/o};return a.x===1/0&&(a.x=0),a.y===1/0&&(a.y=0),a}function i_(t){return t.max-t.min}function o_(t,e=0,n=.01){return Math.abs(t-e)<=n}function a_(t,e,n,r=.5){t.origin=r,t.originPoint=Sb(e.min,e.max,t.origin),t.scale=i_(n)/i_(e),(o_(t.scale,1,1e-4)||isNaN(t.scale))&&(t.scale=1),t.translate=Sb(n.min,n.max,t.origin)-t.originPoint,(o_(t.translate)||isNaN(t.translate))&&(t.translate=0)}function s_(t,e,n,r){a_(t.x,e.x,n.x,r?r.originX:void 0),a_(t.y,e.y,n.y,r?r.originY:void 0)}function l_(t,e,n){t.min=n.min+e.min,t.max=t.min+i_(e)}function c_(t,e,n){t.min=e.min-n.min,t.max=t.min+i_(e)}function u_(t,e,n){c_(t.x,e.x,n.x),c_(t.y,e.y,n.y)}function d_(t,e,n){return{min:void 0!==e?t.min+e:void 0,max:void 0!==n?t.max+n-(t.max-t.min):void 0}}function h_(t,e){let n=e.min-t.min,r=e.max-t.max;return e.max-e.min<t.max-t.min&&([n,r]=[r,n]),{min:n,max:r}}const f_=.35;function p_(t,e,n){return{min:g_(t,e),max:g_(t,n)}}function g_(t,e){return"number"==typeof t?t:t[e]||0}function m_(t){return[t("x"),t("y")]}function y_({top:t,left:e,right:n,bottom:r}){return{x:{min:e,max:n},y:{min:t,max:r}}}function b_(t){return void 0===t||1===t}function v_({scale:t,scaleX:e,scaleY:n}){return!b_(t)||!b_(e)||!b_(n)}function __(t){return v_(t)||w_(t)||t.z||t.rotate||t.rotateX||t.rotateY}function w_(t){return x_(t.x)||x_(t.y)}function x_(t){return t&&"0%"!==t}function S_(t,e,n){return n+e*(t-n)}function k_(t,e,n,r,i){return void 0!==i&&(t=S_(t,i,r)),S_(t,n,r)+e}function C_(t,e=0,n=1,r,i){t.min=k_(t.min,e,n,r,i),t.max=k_(t.max,e,n,r,i)}function T_(t,{x:e,y:n}){C_(t.x,e.translate,e.scale,e.originPoint),C_(t.y,n.translate,n.scale,n.originPoint)}function E_(t){return Number.isInteger(t)||t>1.0000000000001||t<.999999999999?t:1}function P_(t,e){t.min=t.min+e,t.max=t.max+e}function I_(t,e,[n,r,i]){const o=void 0!==e[i]?e[i]:.5,a=Sb(t.min,t.max,o);C_(t,e[n],e[r],a,e.scale)}const A_=["x","scaleX","originX"],M_=["y","scaleY","originY"];function D_(t,e){I_(t.x,e,A_),I_(t.y,e,M_)}function F_(t,e){return y_(function(t,e){if(!e)return t;const n=e({x:t.left,y:t.top}),r=e({x:t.right,y:t.bottom});return{top:n.y,left:n.x,bottom:r.y,right:r.x}}(t.getBoundingClientRect(),e))}const R_=({current:t})=>t?t.ownerDocument.defaultView:null,B_=new WeakMap;class L_{constructor(t){this.openGlobalLock=null,this.isDragging=!1,this.currentDirection=null,this.originPoint={x:0,y:0},this.constraints=!1,this.hasMutatedConstraints=!1,this.elastic={x:{min:0,max:0},y:{min:0,max:0}},this.visualElement=t}start(t,{snapToCursor:e=!1}={}){const{presenceContext:n}=this.visualElement;if(n&&!1===n.isPresent)return;const{dragSnapToOrigin:r}=this.getProps();this.panSession=new Qv(t,{onSessionStart:t=>{const{dragSnapToOrigin:n}=this.getProps();n?this.pauseAnimation():this.stopAnimation(),e&&this.snapToCursor(Ey(t,"page").point)},onStart:(t,e)=>{const{drag:n,dragPropagation:r,onDragStart:i}=this.getProps();if(n&&!r&&(this.openGlobalLock&&this.openGlobalLock(),this.openGlobalLock=Ry(n),!this.openGlobalLock))return;this.isDragging=!0,this.currentDirection=null,this.resolveConstraints(),this.visualElement.projection&&(this.visualElement.projection.isAnimationBlocked=!0,this.visualElement.projection.target=void 0),m_((t=>{let e=this.getAxisMotionValue(t).get()||0;if(Hm.test(e)){const{projection:n}=this.visualElement;if(n&&n.layout){const r=n.layout.layoutBox[t];r&&(e=i_(r)*(parseFloat(e)/100))}}this.originPoint[t]=e})),i&&Ug.update((()=>i(t,e)),!1,!0);const{animationState:o}=this.visualElement;o&&o.setActive("whileDrag",!0)},onMove:(t,e)=>{const{dragPropagation:n,dragDirectionLock:r,onDirectionLock:i,onDrag:o}=this.getProps();if(!n&&!this.openGlobalLock)return;const{offset:a}=e;if(r&&null===this.currentDirection)return this.currentDirection=function(t,e=10){let n=null;return Math.abs(t.y)>e?n="y":Math.abs(t.x)>e&&(n="x"),n}(a),void(null!==this.currentDirection&&i&&i(this.currentDirection));this.updateAxis("x",e.point,a),this.updateAxis("y",e.point,a),this.visualElement.render(),o&&o(t,e)},onSessionEnd:(t,e)=>this.stop(t,e),resumeAnimation:()=>m_((t=>{var e;return"paused"===this.getAnimationState(t)&&(null===(e=this.getAxisMotionValue(t).animation)||void 0===e?void 0:e.play())}))},{transformPagePoint:this.visualElement.getTransformPagePoint(),dragSnapToOrigin:r,contextWindow:R_(this.visualElement)})}stop(t,e){const n=this.isDragging;if(this.cancel(),!n)return;const{velocity:r}=e;this.startAnimation(r);const{onDragEnd:i}=this.getProps();i&&Ug.update((()=>i(t,e)))}cancel(){this.isDragging=!1;const{projection:t,animationState:e}=this.visualElement;t&&(t.isAnimationBlocked=!1),this.panSession&&this.panSession.end(),this.panSession=void 0;const{dragPropagation:n}=this.getProps();!n&&this.openGlobalLock&&(this.openGlobalLock(),this.openGlobalLock=null),e&&e.setActive("whileDrag",!1)}updateAxis(t,e,n){const{drag:r}=this.getProps();if(!n||!N_(t,r,this.currentDirection))return;const i=this.getAxisMotionValue(t);let o=this.originPoint[t]+n[t];this.constraints&&this.constraints[t]&&(o=function(t,{min:e,max:n},r){return void 0!==e&&t<e?t=r?Sb(e,t,r.min):Math.max(t,e):void 0!==n&&t>n&&(t=r?Sb(n,t,r.max):Math.min(t,n)),t}(o,this.constraints[t],this.elastic[t])),i.set(o)}resolveConstraints(){var t;const{dragConstraints:e,dragElastic:n}=this.getProps(),r=this.visualElement.projection&&!this.visualElement.projection.layout?this.visualElement.projection.measure(!1):null===(t=this.visualElement.projection)||void 0===t?void 0:t.layout,i=this.constraints;e&&sm(e)?this.constraints||(this.constraints=this.resolveRefConstraints()):this.constraints=!(!e||!r)&&function(t,{top:e,left:n,bottom:r,right:i}){return{x:d_(t.x,n,i),y:d_(t.y,e,r)}}(r.layoutBox,e),this.elastic=function(t=f_){return!1===t?t=0:!0===t&&(t=f_),{x:p_(t,"left","right"),y:p_(t,"top","bottom")}}(n),i!==this.constraints&&r&&this.constraints&&!this.hasMutatedConstraints&&m_((t=>{this.getAxisMotionValue(t)&&(this.constraints[t]=function(t,e){const n={};return void 0!==e.min&&(n.min=e.min-t.min),void 0!==e.max&&(n.max=e.max-t.min),n}(r.layoutBox[t],this.constraints[t]))}))}resolveRefConstraints(){const{dragConstraints:t,onMeasureDragConstraints:e}=this.getProps();if(!t||!sm(t))return!1;const n=t.current;Zg(null!==n,"If `dragConstraints` is set as a React ref, that ref must be passed to another component's `ref` prop.");const{projection:r}=this.visualElement;if(!r||!r.layout)return!1;const i=function(t,e,n){const r=F_(t,n),{scroll:i}=e;return i&&(P_(r.x,i.offset.x),P_(r.y,i.offset.y)),r}(n,r.root,this.visualElement.getTransformPagePoint());let o=function(t,e){return{x:h_(t.x,e.x),y:h_(t.y,e.y)}}(r.layout.layoutBox,i);if(e){const t=e(function({x:t,y:e}){return{top:e.min,right:t.max,bottom:e.max,left:t.min}}(o));this.hasMutatedConstraints=!!t,t&&(o=y_(t))}return o}startAnimation(t){const{drag:e,dragMomentum:n,dragElastic:r,dragTransition:i,dragSnapToOrigin:o,onDragTransitionEnd:a}=this.getProps(),s=this.constraints||{},l=m_((a=>{if(!N_(a,e,this.currentDirection))return;let l=s&&s[a]||{};o&&(l={min:0,max:0});const c=r?200:1e6,u=r?40:1e7,d={type:"inertia",velocity:n?t[a]:0,bounceStiffness:c,bounceDamping:u,timeConstant:750,restDelta:1,restSpeed:10,...i,...l};return this.startAxisValueAnimation(a,d)}));return Promise.all(l).then(a)}startAxisValueAnimation(t,e){const n=this.getAxisMotionValue(t);return n.start(Sv(t,n,0,e))}stopAnimation(){m_((t=>this.getAxisMotionValue(t).stop()))}pauseAnimation(){m_((t=>{var e;return null===(e=this.getAxisMotionValue(t).animation)||void 0===e?void 0:e.pause()}))}getAnimationState(t){var e;return null===(e=this.getAxisMotionValue(t).animation)||void 0===e?void 0:e.state}getAxisMotionValue(t){const e="_drag"+t.toUpperCase(),n=this.visualElement.getProps();return n[e]||this.visualElement.getValue(t,(n.initial?n.initial[t]:void 0)||0)}snapToCursor(t){m_((e=>{const{drag:n}=this.getProps();if(!N_(e,n,this.currentDirection))return;const{projection:r}=this.visualElement,i=this.getAxisMotionValue(e);if(r&&r.layout){const{min:n,max:o}=r.layout.layoutBox[e];i.set(t[e]-Sb(n,o,.5))}}))}scalePositionWithinConstraints(){if(!this.visualElement.current)return;const{drag:t,dragConstraints:e}=this.getProps(),{projection:n}=this.visualElement;if(!sm(e)||!n||!this.constraints)return;this.stopAnimation();const r={x:0,y:0};m_((t=>{const e=this.getAxisMotionValue(t);if(e){const n=e.get();r[t]=function(t,e){let n=.5;const r=i_(t),i=i_(e);return i>r?n=$b(e.min,e.max-r,t.min):r>i&&(n=$b(t.min,t.max-i,e.min)),Bm(0,1,n)}({min:n,max:n},this.constraints[t])}}));const{transformTemplate:i}=this.visualElement.getProps();this.visualElement.current.style.transform=i?i({},""):"none",n.root&&n.root.updateScroll(),n.updateLayout(),this.resolveConstraints(),m_((e=>{if(!N_(e,t,null))return;const n=this.getAxisMotionValue(e),{min:i,max:o}=this.constraints[e];n.set(Sb(i,o,r[e]))}))}addListeners(){if(!this.visualElement.current)return;B_.set(this.visualElement,this);const t=Py(this.visualElement.current,"pointerdown",(t=>{const{drag:e,dragListener:n=!0}=this.getProps();e&&n&&this.start(t)})),e=()=>{const{dragConstraints:t}=this.getProps();sm(t)&&(this.constraints=this.resolveRefConstraints())},{projection:n}=this.visualElement,r=n.addEventListener("measure",e);n&&!n.layout&&(n.root&&n.root.updateScroll(),n.updateLayout()),e();const i=Cy(window,"resize",(()=>this.scalePositionWithinConstraints())),o=n.addEventListener("didUpdate",(({delta:t,hasLayoutChanged:e})=>{this.isDragging&&e&&(m_((e=>{const n=this.getAxisMotionValue(e);n&&(this.originPoint[e]+=t[e].translate,n.set(n.get()+t[e].translate))})),this.visualElement.render())}));return()=>{i(),t(),r(),o&&o()}}getProps(){const t=this.visualElement.getProps(),{drag:e=!1,dragDirectionLock:n=!1,dragPropagation:r=!1,dragConstraints:i=!1,dragElastic:o=f_,dragMomentum:a=!0}=t;return{...t,drag:e,dragDirectionLock:n,dragPropagation:r,dragConstraints:i,dragElastic:o,dragMomentum:a}}}function N_(t,e,n){return!(!0!==e&&e!==t||null!==n&&n!==t)}const O_=t=>(e,n)=>{t&&Ug.update((()=>t(e,n)))},z_={hasAnimatedSinceResize:!0,hasEverUpdated:!1};function U_(t,e){return e.max===e.min?0:t/(e.max-e.min)*100}const j_={correct:(t,e)=>{if(!e.target)return t;if("string"==typeof t){if(!Ym.test(t))return t;t=parseFloat(t)}return`${U_(t,e.target.x)}% ${U_(t,e.target.y)}%`}},V_={correct:(t,{treeScale:e,projectionDelta:n})=>{const r=t,i=Nb.parse(t);if(i.length>5)return r;const o=Nb.createTransformer(t),a="number"!=typeof i[0]?1:0,s=n.x.scale*e.x,l=n.y.scale*e.y;i[0+a]/=s,i[1+a]/=l;const c=Sb(s,l,.5);return"number"==typeof i[2+a]&&(i[2+a]/=c),"number"==typeof i[3+a]&&(i[3+a]/=c),o(i)}};class $_ extends r.Component{componentDidMount(){const{visualElement:t,layoutGroup:e,switchLayoutGroup:n,layoutId:r}=this.props,{projection:i}=t;var o;o=G_,Object.assign(km,o),i&&(e.group&&e.group.add(i),n&&n.register&&r&&n.register(i),i.root.didUpdate(),i.addEventListener("animationComplete",(()=>{this.safeToRemove()})),i.setOptions({...i.options,onExitComplete:()=>this.safeToRemove()})),z_.hasEverUpdated=!0}getSnapshotBeforeUpdate(t){const{layoutDependency:e,visualElement:n,drag:r,isPresent:i}=this.props,o=n.projection;return o?(o.isPresent=i,r||t.layoutDependency!==e||void 0===e?o.willUpdate():this.safeToRemove(),t.isPresent!==i&&(i?o.promote():o.relegate()||Ug.postRender((()=>{const t=o.getStack();t&&t.members.length||this.safeToRemove()}))),null):null}componentDidUpdate(){const{projection:t}=this.props.visualElement;t&&(t.root.didUpdate(),queueMicrotask((()=>{!t.currentAnimation&&t.isLead()&&this.safeToRemove()})))}componentWillUnmount(){const{visualElement:t,layoutGroup:e,switchLayoutGroup:n}=this.props,{projection:r}=t;r&&(r.scheduleCheckAfterUnmount(),e&&e.group&&e.group.remove(r),n&&n.deregister&&n.deregister(r))}safeToRemove(){const{safeToRemove:t}=this.props;t&&t()}render(){return null}}function W_(t){const[e,n]=function(){const t=(0,r.useContext)(Wg);if(null===t)return[!0,null];const{isPresent:e,onExitComplete:n,register:i}=t,o=(0,r.useId)();return(0,r.useEffect)((()=>i(o)),[]),!e&&n?[!1,()=>n&&n(o)]:[!0]}(),i=(0,r.useContext)(Xg);return r.createElement($_,{...t,layoutGroup:i,switchLayoutGroup:(0,r.useContext)(ym),isPresent:e,safeToRemove:n})}const G_={borderRadius:{...j_,applyTo:["borderTopLeftRadius","borderTopRightRadius","borderBottomLeftRadius","borderBottomRightRadius"]},borderTopLeftRadius:j_,borderTopRightRadius:j_,borderBottomLeftRadius:j_,borderBottomRightRadius:j_,boxShadow:V_},H_=["TopLeft","TopRight","BottomLeft","BottomRight"],Y_=H_.length,q_=t=>"string"==typeof t?parseFloat(t):t,K_=t=>"number"==typeof t||Ym.test(t);function X_(t,e){return void 0!==t[e]?t[e]:t.borderRadius}const Q_=J_(0,.5,cb),Z_=J_(.5,.95,Ng);function J_(t,e,n){return r=>r<t?0:r>e?1:n($b(t,e,r))}function tw(t,e){t.min=e.min,t.max=e.max}function ew(t,e){tw(t.x,e.x),tw(t.y,e.y)}function nw(t,e,n,r,i){return t=S_(t-=e,1/n,r),void 0!==i&&(t=S_(t,1/i,r)),t}function rw(t,e,[n,r,i],o,a){!function(t,e=0,n=1,r=.5,i,o=t,a=t){if(Hm.test(e)&&(e=parseFloat(e),e=Sb(a.min,a.max,e/100)-a.min),"number"!=typeof e)return;let s=Sb(o.min,o.max,r);t===o&&(s-=e),t.min=nw(t.min,e,n,s,i),t.max=nw(t.max,e,n,s,i)}(t,e[n],e[r],e[i],e.scale,o,a)}const iw=["x","scaleX","originX"],ow=["y","scaleY","originY"];function aw(t,e,n,r){rw(t.x,e,iw,n?n.x:void 0,r?r.x:void 0),rw(t.y,e,ow,n?n.y:void 0,r?r.y:void 0)}function sw(t){return 0===t.translate&&1===t.scale}function lw(t){return sw(t.x)&&sw(t.y)}function cw(t,e){return Math.round(t.x.min)===Math.round(e.x.min)&&Math.round(t.x.max)===Math.round(e.x.max)&&Math.round(t.y.min)===Math.round(e.y.min)&&Math.round(t.y.max)===Math.round(e.y.max)}function uw(t){return i_(t.x)/i_(t.y)}class dw{constructor(){this.members=[]}add(t){Tv(this.members,t),t.scheduleRender()}remove(t){if(Ev(this.members,t),t===this.prevLead&&(this.prevLead=void 0),t===this.lead){const t=this.members[this.members.length-1];t&&this.promote(t)}}relegate(t){const e=this.members.findIndex((e=>t===e));if(0===e)return!1;let n;for(let t=e;t>=0;t--){const e=this.members[t];if(!1!==e.isPresent){n=e;break}}return!!n&&(this.promote(n),!0)}promote(t,e){const n=this.lead;if(t!==n&&(this.prevLead=n,this.lead=t,t.show(),n)){n.instance&&n.scheduleRender(),t.scheduleRender(),t.resumeFrom=n,e&&(t.resumeFrom.preserveOpacity=!0),n.snapshot&&(t.snapshot=n.snapshot,t.snapshot.latestValues=n.animationValues||n.latestValues),t.root&&t.root.isUpdating&&(t.isLayoutDirty=!0);const{crossfade:r}=t.options;!1===r&&n.hide()}}exitAnimationComplete(){this.members.forEach((t=>{const{options:e,resumingFrom:n}=t;e.onExitComplete&&e.onExitComplete(),n&&n.options.onExitComplete&&n.options.onExitComplete()}))}scheduleRender(){this.members.forEach((t=>{t.instance&&t.scheduleRender(!1)}))}removeLeadSnapshot(){this.lead&&this.lead.snapshot&&(this.lead.snapshot=void 0)}}function hw(t,e,n){let r="";const i=t.x.translate/e.x,o=t.y.translate/e.y;if((i||o)&&(r=`translate3d(${i}px, ${o}px, 0) `),1===e.x&&1===e.y||(r+=`scale(${1/e.x}, ${1/e.y}) `),n){const{rotate:t,rotateX:e,rotateY:i}=n;t&&(r+=`rotate(${t}deg) `),e&&(r+=`rotateX(${e}deg) `),i&&(r+=`rotateY(${i}deg) `)}const a=t.x.scale*e.x,s=t.y.scale*e.y;return 1===a&&1===s||(r+=`scale(${a}, ${s})`),r||"none"}const fw=(t,e)=>t.depth-e.depth;class pw{constructor(){this.children=[],this.isDirty=!1}add(t){Tv(this.children,t),this.isDirty=!0}remove(t){Ev(this.children,t),this.isDirty=!0}forEach(t){this.isDirty&&this.children.sort(fw),this.isDirty=!1,this.children.forEach(t)}}const gw=["","X","Y","Z"],mw={visibility:"hidden"};let yw=0;const bw={type:"projectionFrame",totalNodes:0,resolvedTargetDeltas:0,recalculatedProjection:0};function vw({attachResizeListener:t,defaultParent:e,measureScroll:n,checkIsScrollRoot:r,resetTransform:i}){return class{constructor(t={},n=(null==e?void 0:e())){this.id=yw++,this.animationId=0,this.children=new Set,this.options={},this.isTreeAnimating=!1,this.isAnimationBlocked=!1,this.isLayoutDirty=!1,this.isProjectionDirty=!1,this.isSharedProjectionDirty=!1,this.isTransformDirty=!1,this.updateManuallyBlocked=!1,this.updateBlockedByResize=!1,this.isUpdating=!1,this.isSVG=!1,this.needsReset=!1,this.shouldResetTransform=!1,this.treeScale={x:1,y:1},this.eventHandlers=new Map,this.hasTreeAnimated=!1,this.updateScheduled=!1,this.projectionUpdateScheduled=!1,this.checkUpdateFailed=()=>{this.isUpdating&&(this.isUpdating=!1,this.clearAllSnapshots())},this.updateProjection=()=>{var t;this.projectionUpdateScheduled=!1,bw.totalNodes=bw.resolvedTargetDeltas=bw.recalculatedProjection=0,this.nodes.forEach(xw),this.nodes.forEach(Iw),this.nodes.forEach(Aw),this.nodes.forEach(Sw),t=bw,window.MotionDebug&&window.MotionDebug.record(t)},this.hasProjected=!1,this.isVisible=!0,this.animationProgress=0,this.sharedNodes=new Map,this.latestValues=t,this.root=n?n.root||n:this,this.path=n?[...n.path,n]:[],this.parent=n,this.depth=n?n.depth+1:0;for(let t=0;t<this.path.length;t++)this.path[t].shouldResetTransform=!0;this.root===this&&(this.nodes=new pw)}addEventListener(t,e){return this.eventHandlers.has(t)||this.eventHandlers.set(t,new Pv),this.eventHandlers.get(t).add(e)}notifyListeners(t,...e){const n=this.eventHandlers.get(t);n&&n.notify(...e)}hasListeners(t){return this.eventHandlers.has(t)}mount(e,n=this.root.hasTreeAnimated){if(this.instance)return;var r;this.isSVG=(r=e)instanceof SVGElement&&"svg"!==r.tagName,this.instance=e;const{layoutId:i,layout:o,visualElement:a}=this.options;if(a&&!a.current&&a.mount(e),this.root.nodes.add(this),this.parent&&this.parent.children.add(this),n&&(o||i)&&(this.isLayoutDirty=!0),t){let n;const r=()=>this.root.updateBlockedByResize=!1;t(e,(()=>{this.root.updateBlockedByResize=!0,n&&n(),n=function(t){const e=performance.now(),n=({timestamp:r})=>{const i=r-e;i>=250&&(jg(n),t(i-250))};return Ug.read(n,!0),()=>jg(n)}(r),z_.hasAnimatedSinceResize&&(z_.hasAnimatedSinceResize=!1,this.nodes.forEach(Pw))}))}i&&this.root.registerSharedNode(i,this),!1!==this.options.animate&&a&&(i||o)&&this.addEventListener("didUpdate",(({delta:t,hasLayoutChanged:e,hasRelativeTargetChanged:n,layout:r})=>{if(this.isTreeAnimationBlocked())return this.target=void 0,void(this.relativeTarget=void 0);const i=this.options.transition||a.getDefaultTransition()||Lw,{onLayoutAnimationStart:o,onLayoutAnimationComplete:s}=a.getProps(),l=!this.targetLayout||!cw(this.targetLayout,r)||n,c=!e&&n;if(this.options.layoutRoot||this.resumeFrom&&this.resumeFrom.instance||c||e&&(l||!this.currentAnimation)){this.resumeFrom&&(this.resumingFrom=this.resumeFrom,this.resumingFrom.resumingFrom=void 0),this.setAnimationOrigin(t,c);const e={...xv(i,"layout"),onPlay:o,onComplete:s};(a.shouldReduceMotion||this.options.layoutRoot)&&(e.delay=0,e.type=!1),this.startAnimation(e)}else e||Pw(this),this.isLead()&&this.options.onExitComplete&&this.options.onExitComplete();this.targetLayout=r}))}unmount(){this.options.layoutId&&this.willUpdate(),this.root.nodes.remove(this);const t=this.getStack();t&&t.remove(this),this.parent&&this.parent.children.delete(this),this.instance=void 0,jg(this.updateProjection)}blockUpdate(){this.updateManuallyBlocked=!0}unblockUpdate(){this.updateManuallyBlocked=!1}isUpdateBlocked(){return this.updateManuallyBlocked||this.updateBlockedByResize}isTreeAnimationBlocked(){return this.isAnimationBlocked||this.parent&&this.parent.isTreeAnimationBlocked()||!1}startUpdate(){this.isUpdateBlocked()||(this.isUpdating=!0,this.nodes&&this.nodes.forEach(Mw),this.animationId++)}getTransformTemplate(){const{visualElement:t}=this.options;return t&&t.getProps().transformTemplate}willUpdate(t=!0){if(this.root.hasTreeAnimated=!0,this.root.isUpdateBlocked())return void(this.options.onExitComplete&&this.options.onExitComplete());if(!this.root.isUpdating&&this.root.startUpdate(),this.isLayoutDirty)return;this.isLayoutDirty=!0;for(let t=0;t<this.path.length;t++){const e=this.path[t];e.shouldResetTransform=!0,e.updateScroll("snapshot"),e.options.layoutRoot&&e.willUpdate(!1)}const{layoutId:e,layout:n}=this.options;if(void 0===e&&!n)return;const r=this.getTransformTemplate();this.prevTransformTemplateValue=r?r(this.latestValues,""):void 0,this.updateSnapshot(),t&&this.notifyListeners("willUpdate")}update(){if(this.updateScheduled=!1,this.isUpdateBlocked())return this.unblockUpdate(),this.clearAllSnapshots(),void this.nodes.forEach(Cw);this.isUpdating||this.nodes.forEach(Tw),this.isUpdating=!1,this.nodes.forEach(Ew),this.nodes.forEach(_w),this.nodes.forEach(ww),this.clearAllSnapshots();const t=performance.now();Vg.delta=Bm(0,1e3/60,t-Vg.timestamp),Vg.timestamp=t,Vg.isProcessing=!0,$g.update.process(Vg),$g.preRender.process(Vg),$g.render.process(Vg),Vg.isProcessing=!1}didUpdate(){this.updateScheduled||(this.updateScheduled=!0,queueMicrotask((()=>this.update())))}clearAllSnapshots(){this.nodes.forEach(kw),this.sharedNodes.forEach(Dw)}scheduleUpdateProjection(){this.projectionUpdateScheduled||(this.projectionUpdateScheduled=!0,Ug.preRender(this.updateProjection,!1,!0))}scheduleCheckAfterUnmount(){Ug.postRender((()=>{this.isLayoutDirty?this.root.didUpdate():this.root.checkUpdateFailed()}))}updateSnapshot(){!this.snapshot&&this.instance&&(this.snapshot=this.measure())}updateLayout(){if(!this.instance)return;if(this.updateScroll(),!(this.options.alwaysMeasureLayout&&this.isLead()||this.isLayoutDirty))return;if(this.resumeFrom&&!this.resumeFrom.instance)for(let t=0;t<this.path.length;t++)this.path[t].updateScroll();const t=this.layout;this.layout=this.measure(!1),this.layoutCorrected={x:{min:0,max:0},y:{min:0,max:0}},this.isLayoutDirty=!1,this.projectionDelta=void 0,this.notifyListeners("measure",this.layout.layoutBox);const{visualElement:e}=this.options;e&&e.notify("LayoutMeasure",this.layout.layoutBox,t?t.layoutBox:void 0)}updateScroll(t="measure"){let e=Boolean(this.options.layoutScroll&&this.instance);this.scroll&&this.scroll.animationId===this.root.animationId&&this.scroll.phase===t&&(e=!1),e&&(this.scroll={animationId:this.root.animationId,phase:t,isRoot:r(this.instance),offset:n(this.instance)})}resetTransform(){if(!i)return;const t=this.isLayoutDirty||this.shouldResetTransform,e=this.projectionDelta&&!lw(this.projectionDelta),n=this.getTransformTemplate(),r=n?n(this.latestValues,""):void 0,o=r!==this.prevTransformTemplateValue;t&&(e||__(this.latestValues)||o)&&(i(this.instance,r),this.shouldResetTransform=!1,this.scheduleRender())}measure(t=!0){const e=this.measurePageBox();let n=this.removeElementScroll(e);var r;return t&&(n=this.removeTransform(n)),zw((r=n).x),zw(r.y),{animationId:this.root.animationId,measuredBox:e,layoutBox:n,latestValues:{},source:this.id}}measurePageBox(){const{visualElement:t}=this.options;if(!t)return{x:{min:0,max:0},y:{min:0,max:0}};const e=t.measureViewportBox(),{scroll:n}=this.root;return n&&(P_(e.x,n.offset.x),P_(e.y,n.offset.y)),e}removeElementScroll(t){const e={x:{min:0,max:0},y:{min:0,max:0}};ew(e,t);for(let n=0;n<this.path.length;n++){const r=this.path[n],{scroll:i,options:o}=r;if(r!==this.root&&i&&o.layoutScroll){if(i.isRoot){ew(e,t);const{scroll:n}=this.root;n&&(P_(e.x,-n.offset.x),P_(e.y,-n.offset.y))}P_(e.x,i.offset.x),P_(e.y,i.offset.y)}}return e}applyTransform(t,e=!1){const n={x:{min:0,max:0},y:{min:0,max:0}};ew(n,t);for(let t=0;t<this.path.length;t++){const r=this.path[t];!e&&r.options.layoutScroll&&r.scroll&&r!==r.root&&D_(n,{x:-r.scroll.offset.x,y:-r.scroll.offset.y}),__(r.latestValues)&&D_(n,r.latestValues)}return __(this.latestValues)&&D_(n,this.latestValues),n}removeTransform(t){const e={x:{min:0,max:0},y:{min:0,max:0}};ew(e,t);for(let t=0;t<this.path.length;t++){const n=this.path[t];if(!n.instance)continue;if(!__(n.latestValues))continue;v_(n.latestValues)&&n.updateSnapshot();const r={x:{min:0,max:0},y:{min:0,max:0}};ew(r,n.measurePageBox()),aw(e,n.latestValues,n.snapshot?n.snapshot.layoutBox:void 0,r)}return __(this.latestValues)&&aw(e,this.latestValues),e}setTargetDelta(t){this.targetDelta=t,this.root.scheduleUpdateProjection(),this.isProjectionDirty=!0}setOptions(t){this.options={...this.options,...t,crossfade:void 0===t.crossfade||t.crossfade}}clearMeasurements(){this.scroll=void 0,this.layout=void 0,this.snapshot=void 0,this.prevTransformTemplateValue=void 0,this.targetDelta=void 0,this.target=void 0,this.isLayoutDirty=!1}forceRelativeParentToResolveTarget(){this.relativeParent&&this.relativeParent.resolvedRelativeTargetAt!==Vg.timestamp&&this.relativeParent.resolveTargetDelta(!0)}resolveTargetDelta(t=!1){var e;const n=this.getLead();this.isProjectionDirty||(this.isProjectionDirty=n.isProjectionDirty),this.isTransformDirty||(this.isTransformDirty=n.isTransformDirty),this.isSharedProjectionDirty||(this.isSharedProjectionDirty=n.isSharedProjectionDirty);const r=Boolean(this.resumingFrom)||this!==n;if(!(t||r&&this.isSharedProjectionDirty||this.isProjectionDirty||(null===(e=this.parent)||void 0===e?void 0:e.isProjectionDirty)||this.attemptToResolveRelativeTarget))return;const{layout:i,layoutId:o}=this.options;if(this.layout&&(i||o)){if(this.resolvedRelativeTargetAt=Vg.timestamp,!this.targetDelta&&!this.relativeTarget){const t=this.getClosestProjectingParent();t&&t.layout&&1!==this.animationProgress?(this.relativeParent=t,this.forceRelativeParentToResolveTarget(),this.relativeTarget={x:{min:0,max:0},y:{min:0,max:0}},this.relativeTargetOrigin={x:{min:0,max:0},y:{min:0,max:0}},u_(this.relativeTargetOrigin,this.layout.layoutBox,t.layout.layoutBox),ew(this.relativeTarget,this.relativeTargetOrigin)):this.relativeParent=this.relativeTarget=void 0}if(this.relativeTarget||this.targetDelta){var a,s,l;if(this.target||(this.target={x:{min:0,max:0},y:{min:0,max:0}},this.targetWithTransforms={x:{min:0,max:0},y:{min:0,max:0}}),this.relativeTarget&&this.relativeTargetOrigin&&this.relativeParent&&this.relativeParent.target?(this.forceRelativeParentToResolveTarget(),a=this.target,s=this.relativeTarget,l=this.relativeParent.target,l_(a.x,s.x,l.x),l_(a.y,s.y,l.y)):this.targetDelta?(Boolean(this.resumingFrom)?this.target=this.applyTransform(this.layout.layoutBox):ew(this.target,this.layout.layoutBox),T_(this.target,this.targetDelta)):ew(this.target,this.layout.layoutBox),this.attemptToResolveRelativeTarget){this.attemptToResolveRelativeTarget=!1;const t=this.getClosestProjectingParent();t&&Boolean(t.resumingFrom)===Boolean(this.resumingFrom)&&!t.options.layoutScroll&&t.target&&1!==this.animationProgress?(this.relativeParent=t,this.forceRelativeParentToResolveTarget(),this.relativeTarget={x:{min:0,max:0},y:{min:0,max:0}},this.relativeTargetOrigin={x:{min:0,max:0},y:{min:0,max:0}},u_(this.relativeTargetOrigin,this.target,t.target),ew(this.relativeTarget,this.relativeTargetOrigin)):this.relativeParent=this.relativeTarget=void 0}bw.resolvedTargetDeltas++}}}getClosestProjectingParent(){if(this.parent&&!v_(this.parent.latestValues)&&!w_(this.parent.latestValues))return this.parent.isProjecting()?this.parent:this.parent.getClosestProjectingParent()}isProjecting(){return Boolean((this.relativeTarget||this.targetDelta||this.options.layoutRoot)&&this.layout)}calcProjection(){var t;const e=this.getLead(),n=Boolean(this.resumingFrom)||this!==e;let r=!0;if((this.isProjectionDirty||(null===(t=this.parent)||void 0===t?void 0:t.isProjectionDirty))&&(r=!1),n&&(this.isSharedProjectionDirty||this.isTransformDirty)&&(r=!1),this.resolvedRelativeTargetAt===Vg.timestamp&&(r=!1),r)return;const{layout:i,layoutId:o}=this.options;if(this.isTreeAnimating=Boolean(this.parent&&this.parent.isTreeAnimating||this.currentAnimation||this.pendingAnimation),this.isTreeAnimating||(this.targetDelta=this.relativeTarget=void 0),!this.layout||!i&&!o)return;ew(this.layoutCorrected,this.layout.layoutBox);const a=this.treeScale.x,s=this.treeScale.y;!function(t,e,n,r=!1){const i=n.length;if(!i)return;let o,a;e.x=e.y=1;for(let s=0;s<i;s++){o=n[s],a=o.projectionDelta;const i=o.instance;i&&i.style&&"contents"===i.style.display||(r&&o.options.layoutScroll&&o.scroll&&o!==o.root&&D_(t,{x:-o.scroll.offset.x,y:-o.scroll.offset.y}),a&&(e.x*=a.x.scale,e.y*=a.y.scale,T_(t,a)),r&&__(o.latestValues)&&D_(t,o.latestValues))}e.x=E_(e.x),e.y=E_(e.y)}(this.layoutCorrected,this.treeScale,this.path,n),!e.layout||e.target||1===this.treeScale.x&&1===this.treeScale.y||(e.target=e.layout.layoutBox);const{target:l}=e;if(!l)return void(this.projectionTransform&&(this.projectionDelta={x:{translate:0,scale:1,origin:0,originPoint:0},y:{translate:0,scale:1,origin:0,originPoint:0}},this.projectionTransform="none",this.scheduleRender()));this.projectionDelta||(this.projectionDelta={x:{translate:0,scale:1,origin:0,originPoint:0},y:{translate:0,scale:1,origin:0,originPoint:0}},this.projectionDeltaWithTransform={x:{translate:0,scale:1,origin:0,originPoint:0},y:{translate:0,scale:1,origin:0,originPoint:0}});const c=this.projectionTransform;s_(this.projectionDelta,this.layoutCorrected,l,this.latestValues),this.projectionTransform=hw(this.projectionDelta,this.treeScale),this.projectionTransform===c&&this.treeScale.x===a&&this.treeScale.y===s||(this.hasProjected=!0,this.scheduleRender(),this.notifyListeners("projectionUpdate",l)),bw.recalculatedProjection++}hide(){this.isVisible=!1}show(){this.isVisible=!0}scheduleRender(t=!0){if(this.options.scheduleRender&&this.options.scheduleRender(),t){const t=this.getStack();t&&t.scheduleRender()}this.resumingFrom&&!this.resumingFrom.instance&&(this.resumingFrom=void 0)}setAnimationOrigin(t,e=!1){const n=this.snapshot,r=n?n.latestValues:{},i={...this.latestValues},o={x:{translate:0,scale:1,origin:0,originPoint:0},y:{translate:0,scale:1,origin:0,originPoint:0}};this.relativeParent&&this.relativeParent.options.layoutRoot||(this.relativeTarget=this.relativeTargetOrigin=void 0),this.attemptToResolveRelativeTarget=!e;const a={x:{min:0,max:0},y:{min:0,max:0}},s=(n?n.source:void 0)!==(this.layout?this.layout.source:void 0),l=this.getStack(),c=!l||l.members.length<=1,u=Boolean(s&&!c&&!0===this.options.crossfade&&!this.path.some(Bw));let d;this.animationProgress=0,this.mixTargetDelta=e=>{const n=e/1e3;var l,h,f,p,g,m;Fw(o.x,t.x,n),Fw(o.y,t.y,n),this.setTargetDelta(o),this.relativeTarget&&this.relativeTargetOrigin&&this.layout&&this.relativeParent&&this.relativeParent.layout&&(u_(a,this.layout.layoutBox,this.relativeParent.layout.layoutBox),f=this.relativeTarget,p=this.relativeTargetOrigin,g=a,m=n,Rw(f.x,p.x,g.x,m),Rw(f.y,p.y,g.y,m),d&&(l=this.relativeTarget,h=d,l.x.min===h.x.min&&l.x.max===h.x.max&&l.y.min===h.y.min&&l.y.max===h.y.max)&&(this.isProjectionDirty=!1),d||(d={x:{min:0,max:0},y:{min:0,max:0}}),ew(d,this.relativeTarget)),s&&(this.animationValues=i,function(t,e,n,r,i,o){i?(t.opacity=Sb(0,void 0!==n.opacity?n.opacity:1,Q_(r)),t.opacityExit=Sb(void 0!==e.opacity?e.opacity:1,0,Z_(r))):o&&(t.opacity=Sb(void 0!==e.opacity?e.opacity:1,void 0!==n.opacity?n.opacity:1,r));for(let i=0;i<Y_;i++){const o=`border${H_[i]}Radius`;let a=X_(e,o),s=X_(n,o);void 0===a&&void 0===s||(a||(a=0),s||(s=0),0===a||0===s||K_(a)===K_(s)?(t[o]=Math.max(Sb(q_(a),q_(s),r),0),(Hm.test(s)||Hm.test(a))&&(t[o]+="%")):t[o]=s)}(e.rotate||n.rotate)&&(t.rotate=Sb(e.rotate||0,n.rotate||0,r))}(i,r,this.latestValues,n,u,c)),this.root.scheduleUpdateProjection(),this.scheduleRender(),this.animationProgress=n},this.mixTargetDelta(this.options.layoutRoot?1e3:0)}startAnimation(t){this.notifyListeners("animationStart"),this.currentAnimation&&this.currentAnimation.stop(),this.resumingFrom&&this.resumingFrom.currentAnimation&&this.resumingFrom.currentAnimation.stop(),this.pendingAnimation&&(jg(this.pendingAnimation),this.pendingAnimation=void 0),this.pendingAnimation=Ug.update((()=>{z_.hasAnimatedSinceResize=!0,this.currentAnimation=function(t,e,n){const r=Pm(0)?0:Mv(0);return r.start(Sv("",r,1e3,n)),r.animation}(0,0,{...t,onUpdate:e=>{this.mixTargetDelta(e),t.onUpdate&&t.onUpdate(e)},onComplete:()=>{t.onComplete&&t.onComplete(),this.completeAnimation()}}),this.resumingFrom&&(this.resumingFrom.currentAnimation=this.currentAnimation),this.pendingAnimation=void 0}))}completeAnimation(){this.resumingFrom&&(this.resumingFrom.currentAnimation=void 0,this.resumingFrom.preserveOpacity=void 0);const t=this.getStack();t&&t.exitAnimationComplete(),this.resumingFrom=this.currentAnimation=this.animationValues=void 0,this.notifyListeners("animationComplete")}finishAnimation(){this.currentAnimation&&(this.mixTargetDelta&&this.mixTargetDelta(1e3),this.currentAnimation.stop()),this.completeAnimation()}applyTransformsToTarget(){const t=this.getLead();let{targetWithTransforms:e,target:n,layout:r,latestValues:i}=t;if(e&&n&&r){if(this!==t&&this.layout&&r&&Uw(this.options.animationType,this.layout.layoutBox,r.layoutBox)){n=this.target||{x:{min:0,max:0},y:{min:0,max:0}};const e=i_(this.layout.layoutBox.x);n.x.min=t.target.x.min,n.x.max=n.x.min+e;const r=i_(this.layout.layoutBox.y);n.y.min=t.target.y.min,n.y.max=n.y.min+r}ew(e,n),D_(e,i),s_(this.projectionDeltaWithTransform,this.layoutCorrected,e,i)}}registerSharedNode(t,e){this.sharedNodes.has(t)||this.sharedNodes.set(t,new dw),this.sharedNodes.get(t).add(e);const n=e.options.initialPromotionConfig;e.promote({transition:n?n.transition:void 0,preserveFollowOpacity:n&&n.shouldPreserveFollowOpacity?n.shouldPreserveFollowOpacity(e):void 0})}isLead(){const t=this.getStack();return!t||t.lead===this}getLead(){var t;const{layoutId:e}=this.options;return e&&(null===(t=this.getStack())||void 0===t?void 0:t.lead)||this}getPrevLead(){var t;const{layoutId:e}=this.options;return e?null===(t=this.getStack())||void 0===t?void 0:t.prevLead:void 0}getStack(){const{layoutId:t}=this.options;if(t)return this.root.sharedNodes.get(t)}promote({needsReset:t,transition:e,preserveFollowOpacity:n}={}){const r=this.getStack();r&&r.promote(this,n),t&&(this.projectionDelta=void 0,this.needsReset=!0),e&&this.setOptions({transition:e})}relegate(){const t=this.getStack();return!!t&&t.relegate(this)}resetRotation(){const{visualElement:t}=this.options;if(!t)return;let e=!1;const{latestValues:n}=t;if((n.rotate||n.rotateX||n.rotateY||n.rotateZ)&&(e=!0),!e)return;const r={};for(let e=0;e<gw.length;e++){const i="rotate"+gw[e];n[i]&&(r[i]=n[i],t.setStaticValue(i,0))}t.render();for(const e in r)t.setStaticValue(e,r[e]);t.scheduleRender()}getProjectionStyles(t){var e,n;if(!this.instance||this.isSVG)return;if(!this.isVisible)return mw;const r={visibility:""},i=this.getTransformTemplate();if(this.needsReset)return this.needsReset=!1,r.opacity="",r.pointerEvents=_y(null==t?void 0:t.pointerEvents)||"",r.transform=i?i(this.latestValues,""):"none",r;const o=this.getLead();if(!this.projectionDelta||!this.layout||!o.target){const e={};return this.options.layoutId&&(e.opacity=void 0!==this.latestValues.opacity?this.latestValues.opacity:1,e.pointerEvents=_y(null==t?void 0:t.pointerEvents)||""),this.hasProjected&&!__(this.latestValues)&&(e.transform=i?i({},""):"none",this.hasProjected=!1),e}const a=o.animationValues||o.latestValues;this.applyTransformsToTarget(),r.transform=hw(this.projectionDeltaWithTransform,this.treeScale,a),i&&(r.transform=i(a,r.transform));const{x:s,y:l}=this.projectionDelta;r.transformOrigin=`${100*s.origin}% ${100*l.origin}% 0`,o.animationValues?r.opacity=o===this?null!==(n=null!==(e=a.opacity)&&void 0!==e?e:this.latestValues.opacity)&&void 0!==n?n:1:this.preserveOpacity?this.latestValues.opacity:a.opacityExit:r.opacity=o===this?void 0!==a.opacity?a.opacity:"":void 0!==a.opacityExit?a.opacityExit:0;for(const t in km){if(void 0===a[t])continue;const{correct:e,applyTo:n}=km[t],i="none"===r.transform?a[t]:e(a[t],o);if(n){const t=n.length;for(let e=0;e<t;e++)r[n[e]]=i}else r[t]=i}return this.options.layoutId&&(r.pointerEvents=o===this?_y(null==t?void 0:t.pointerEvents)||"":"none"),r}clearSnapshot(){this.resumeFrom=this.snapshot=void 0}resetTree(){this.root.nodes.forEach((t=>{var e;return null===(e=t.currentAnimation)||void 0===e?void 0:e.stop()})),this.root.nodes.forEach(Cw),this.root.sharedNodes.clear()}}}function _w(t){t.updateLayout()}function ww(t){var e;const n=(null===(e=t.resumeFrom)||void 0===e?void 0:e.snapshot)||t.snapshot;if(t.isLead()&&t.layout&&n&&t.hasListeners("didUpdate")){const{layoutBox:e,measuredBox:r}=t.layout,{animationType:i}=t.options,o=n.source!==t.layout.source;"size"===i?m_((t=>{const r=o?n.measuredBox[t]:n.layoutBox[t],i=i_(r);r.min=e[t].min,r.max=r.min+i})):Uw(i,n.layoutBox,e)&&m_((r=>{const i=o?n.measuredBox[r]:n.layoutBox[r],a=i_(e[r]);i.max=i.min+a,t.relativeTarget&&!t.currentAnimation&&(t.isProjectionDirty=!0,t.relativeTarget[r].max=t.relativeTarget[r].min+a)}));const a={x:{translate:0,scale:1,origin:0,originPoint:0},y:{translate:0,scale:1,origin:0,originPoint:0}};s_(a,e,n.layoutBox);const s={x:{translate:0,scale:1,origin:0,originPoint:0},y:{translate:0,scale:1,origin:0,originPoint:0}};o?s_(s,t.applyTransform(r,!0),n.measuredBox):s_(s,e,n.layoutBox);const l=!lw(a);let c=!1;if(!t.resumeFrom){const r=t.getClosestProjectingParent();if(r&&!r.resumeFrom){const{snapshot:i,layout:o}=r;if(i&&o){const a={x:{min:0,max:0},y:{min:0,max:0}};u_(a,n.layoutBox,i.layoutBox);const s={x:{min:0,max:0},y:{min:0,max:0}};u_(s,e,o.layoutBox),cw(a,s)||(c=!0),r.options.layoutRoot&&(t.relativeTarget=s,t.relativeTargetOrigin=a,t.relativeParent=r)}}}t.notifyListeners("didUpdate",{layout:e,snapshot:n,delta:s,layoutDelta:a,hasLayoutChanged:l,hasRelativeTargetChanged:c})}else if(t.isLead()){const{onExitComplete:e}=t.options;e&&e()}t.options.transition=void 0}function xw(t){bw.totalNodes++,t.parent&&(t.isProjecting()||(t.isProjectionDirty=t.parent.isProjectionDirty),t.isSharedProjectionDirty||(t.isSharedProjectionDirty=Boolean(t.isProjectionDirty||t.parent.isProjectionDirty||t.parent.isSharedProjectionDirty)),t.isTransformDirty||(t.isTransformDirty=t.parent.isTransformDirty))}function Sw(t){t.isProjectionDirty=t.isSharedProjectionDirty=t.isTransformDirty=!1}function kw(t){t.clearSnapshot()}function Cw(t){t.clearMeasurements()}function Tw(t){t.isLayoutDirty=!1}function Ew(t){const{visualElement:e}=t.options;e&&e.getProps().onBeforeLayoutMeasure&&e.notify("BeforeLayoutMeasure"),t.resetTransform()}function Pw(t){t.finishAnimation(),t.targetDelta=t.relativeTarget=t.target=void 0,t.isProjectionDirty=!0}function Iw(t){t.resolveTargetDelta()}function Aw(t){t.calcProjection()}function Mw(t){t.resetRotation()}function Dw(t){t.removeLeadSnapshot()}function Fw(t,e,n){t.translate=Sb(e.translate,0,n),t.scale=Sb(e.scale,1,n),t.origin=e.origin,t.originPoint=e.originPoint}function Rw(t,e,n,r){t.min=Sb(e.min,n.min,r),t.max=Sb(e.max,n.max,r)}function Bw(t){return t.animationValues&&void 0!==t.animationValues.opacityExit}const Lw={duration:.45,ease:[.4,0,.1,1]},Nw=t=>"undefined"!=typeof navigator&&navigator.userAgent.toLowerCase().includes(t),Ow=Nw("applewebkit/")&&!Nw("chrome/")?Math.round:Ng;function zw(t){t.min=Ow(t.min),t.max=Ow(t.max)}function Uw(t,e,n){return"position"===t||"preserve-aspect"===t&&!o_(uw(e),uw(n),.2)}const jw=vw({attachResizeListener:(t,e)=>Cy(t,"resize",e),measureScroll:()=>({x:document.documentElement.scrollLeft||document.body.scrollLeft,y:document.documentElement.scrollTop||document.body.scrollTop}),checkIsScrollRoot:()=>!0}),Vw={current:void 0},$w=vw({measureScroll:t=>({x:t.scrollLeft,y:t.scrollTop}),defaultParent:()=>{if(!Vw.current){const t=new jw({});t.mount(window),t.setOptions({layoutScroll:!0}),Vw.current=t}return Vw.current},resetTransform:(t,e)=>{t.style.transform=void 0!==e?e:"none"},checkIsScrollRoot:t=>Boolean("fixed"===window.getComputedStyle(t).position)}),Ww={pan:{Feature:class extends Ly{constructor(){super(...arguments),this.removePointerDownListener=Ng}onPointerDown(t){this.session=new Qv(t,this.createPanHandlers(),{transformPagePoint:this.node.getTransformPagePoint(),contextWindow:R_(this.node)})}createPanHandlers(){const{onPanSessionStart:t,onPanStart:e,onPan:n,onPanEnd:r}=this.node.getProps();return{onSessionStart:O_(t),onStart:O_(e),onMove:n,onEnd:(t,e)=>{delete this.session,r&&Ug.update((()=>r(t,e)))}}}mount(){this.removePointerDownListener=Py(this.node.current,"pointerdown",(t=>this.onPointerDown(t)))}update(){this.session&&this.session.updateHandlers(this.createPanHandlers())}unmount(){this.removePointerDownListener(),this.session&&this.session.end()}}},drag:{Feature:class extends Ly{constructor(t){super(t),this.removeGroupControls=Ng,this.removeListeners=Ng,this.controls=new L_(t)}mount(){const{dragControls:t}=this.node.getProps();t&&(this.removeGroupControls=t.subscribe(this.controls)),this.removeListeners=this.controls.addListeners()||Ng}unmount(){this.removeGroupControls(),this.removeListeners()}},ProjectionNode:$w,MeasureLayout:W_}},Gw=/var\((--[a-zA-Z0-9-_]+),? ?([a-zA-Z0-9 ()%#.,-]+)?\)/;function Hw(t,e,n=1){Zg(n<=4,`Max CSS variable fallback depth detected in property "${t}". This may indicate a circular fallback dependency.`);const[r,i]=function(t){const e=Gw.exec(t);if(!e)return[,];const[,n,r]=e;return[n,r]}(t);if(!r)return;const o=window.getComputedStyle(e).getPropertyValue(r);if(o){const t=o.trim();return Cv(t)?parseFloat(t):t}return Fm(i)?Hw(i,e,n+1):i}const Yw=new Set(["width","height","top","left","right","bottom","x","y","translateX","translateY"]),qw=t=>Yw.has(t),Kw=t=>t===Lm||t===Ym,Xw=(t,e)=>parseFloat(t.split(", ")[e]),Qw=(t,e)=>(n,{transform:r})=>{if("none"===r||!r)return 0;const i=r.match(/^matrix3d\((.+)\)$/);if(i)return Xw(i[1],e);{const e=r.match(/^matrix\((.+)\)$/);return e?Xw(e[1],t):0}},Zw=new Set(["x","y","z"]),Jw=Cm.filter((t=>!Zw.has(t))),tx={width:({x:t},{paddingLeft:e="0",paddingRight:n="0"})=>t.max-t.min-parseFloat(e)-parseFloat(n),height:({y:t},{paddingTop:e="0",paddingBottom:n="0"})=>t.max-t.min-parseFloat(e)-parseFloat(n),top:(t,{top:e})=>parseFloat(e),left:(t,{left:e})=>parseFloat(e),bottom:({y:t},{top:e})=>parseFloat(e)+(t.max-t.min),right:({x:t},{left:e})=>parseFloat(e)+(t.max-t.min),x:Qw(4,13),y:Qw(5,14)};tx.translateX=tx.x,tx.translateY=tx.y;function ex(t,e,n,r){return(t=>Object.keys(t).some(qw))(e)?((t,e,n={},r={})=>{e={...e},r={...r};const i=Object.keys(e).filter(qw);let o=[],a=!1;const s=[];if(i.forEach((i=>{const l=t.getValue(i);if(!t.hasValue(i))return;let c=n[i],u=Rv(c);const d=e[i];let h;if(vy(d)){const t=d.length,e=null===d[0]?1:0;c=d[e],u=Rv(c);for(let n=e;n<t&&null!==d[n];n++)h?Zg(Rv(d[n])===h,"All keyframes must be of the same type"):(h=Rv(d[n]),Zg(h===u||Kw(u)&&Kw(h),"Keyframes must be of the same dimension as the current value"))}else h=Rv(d);if(u!==h)if(Kw(u)&&Kw(h)){const t=l.get();"string"==typeof t&&l.set(parseFloat(t)),"string"==typeof d?e[i]=parseFloat(d):Array.isArray(d)&&h===Ym&&(e[i]=d.map(parseFloat))}else(null==u?void 0:u.transform)&&(null==h?void 0:h.transform)&&(0===c||0===d)?0===c?l.set(h.transform(c)):e[i]=u.transform(d):(a||(o=function(t){const e=[];return Jw.forEach((n=>{const r=t.getValue(n);void 0!==r&&(e.push([n,r.get()]),r.set(n.startsWith("scale")?1:0))})),e.length&&t.render(),e}(t),a=!0),s.push(i),r[i]=void 0!==r[i]?r[i]:e[i],l.jump(d))})),s.length){const n=s.indexOf("height")>=0?window.pageYOffset:null,i=((t,e,n)=>{const r=e.measureViewportBox(),i=e.current,o=getComputedStyle(i),{display:a}=o,s={};"none"===a&&e.setStaticValue("display",t.display||"block"),n.forEach((t=>{s[t]=tx[t](r,o)})),e.render();const l=e.measureViewportBox();return n.forEach((n=>{const r=e.getValue(n);r&&r.jump(s[n]),t[n]=tx[n](l,o)})),t})(e,t,s);return o.length&&o.forEach((([e,n])=>{t.getValue(e).set(n)})),t.render(),Rg&&null!==n&&window.scrollTo({top:n}),{target:i,transitionEnd:r}}return{target:e,transitionEnd:r}})(t,e,n,r):{target:e,transitionEnd:r}}const nx={current:null},rx={current:!1},ix=new WeakMap,ox=Object.keys(mm),ax=ox.length,sx=["AnimationStart","AnimationComplete","Update","BeforeLayoutMeasure","LayoutMeasure","LayoutAnimationStart","LayoutAnimationComplete"],lx=dm.length;class cx{constructor({parent:t,props:e,presenceContext:n,reducedMotionConfig:r,visualState:i},o={}){this.current=null,this.children=new Set,this.isVariantNode=!1,this.isControllingVariants=!1,this.shouldReduceMotion=null,this.values=new Map,this.features={},this.valueSubscriptions=new Map,this.prevMotionValues={},this.events={},this.propEventSubscriptions={},this.notifyUpdate=()=>this.notify("Update",this.latestValues),this.render=()=>{this.current&&(this.triggerBuild(),this.renderInstance(this.current,this.renderState,this.props.style,this.projection))},this.scheduleRender=()=>Ug.render(this.render,!1,!0);const{latestValues:a,renderState:s}=i;this.latestValues=a,this.baseTarget={...a},this.initialValues=e.initial?{...a}:{},this.renderState=s,this.parent=t,this.props=e,this.presenceContext=n,this.depth=t?t.depth+1:0,this.reducedMotionConfig=r,this.options=o,this.isControllingVariants=hm(e),this.isVariantNode=fm(e),this.isVariantNode&&(this.variantChildren=new Set),this.manuallyAnimateOnMount=Boolean(t&&t.current);const{willChange:l,...c}=this.scrapeMotionValuesFromProps(e,{});for(const t in c){const e=c[t];void 0!==a[t]&&Pm(e)&&(e.set(a[t],!1),kv(l)&&l.add(t))}}scrapeMotionValuesFromProps(t,e){return{}}mount(t){this.current=t,ix.set(t,this),this.projection&&!this.projection.instance&&this.projection.mount(t),this.parent&&this.isVariantNode&&!this.isControllingVariants&&(this.removeFromVariantTree=this.parent.addVariantChild(this)),this.values.forEach(((t,e)=>this.bindToMotionValue(e,t))),rx.current||function(){if(rx.current=!0,Rg)if(window.matchMedia){const t=window.matchMedia("(prefers-reduced-motion)"),e=()=>nx.current=t.matches;t.addListener(e),e()}else nx.current=!1}(),this.shouldReduceMotion="never"!==this.reducedMotionConfig&&("always"===this.reducedMotionConfig||nx.current),this.parent&&this.parent.children.add(this),this.update(this.props,this.presenceContext)}unmount(){ix.delete(this.current),this.projection&&this.projection.unmount(),jg(this.notifyUpdate),jg(this.render),this.valueSubscriptions.forEach((t=>t())),this.removeFromVariantTree&&this.removeFromVariantTree(),this.parent&&this.parent.children.delete(this);for(const t in this.events)this.events[t].clear();for(const t in this.features)this.features[t].unmount();this.current=null}bindToMotionValue(t,e){const n=Tm.has(t),r=e.on("change",(e=>{this.latestValues[t]=e,this.props.onUpdate&&Ug.update(this.notifyUpdate,!1,!0),n&&this.projection&&(this.projection.isTransformDirty=!0)})),i=e.on("renderRequest",this.scheduleRender);this.valueSubscriptions.set(t,(()=>{r(),i()}))}sortNodePosition(t){return this.current&&this.sortInstanceNodePosition&&this.type===t.type?this.sortInstanceNodePosition(this.current,t.current):0}loadFeatures({children:t,...e},n,r,i){let o,a;for(let t=0;t<ax;t++){const n=ox[t],{isEnabled:r,Feature:i,ProjectionNode:s,MeasureLayout:l}=mm[n];s&&(o=s),r(e)&&(!this.features[n]&&i&&(this.features[n]=new i(this)),l&&(a=l))}if(("html"===this.type||"svg"===this.type)&&!this.projection&&o){this.projection=new o(this.latestValues,this.parent&&this.parent.projection);const{layoutId:t,layout:n,drag:r,dragConstraints:a,layoutScroll:s,layoutRoot:l}=e;this.projection.setOptions({layoutId:t,layout:n,alwaysMeasureLayout:Boolean(r)||a&&sm(a),visualElement:this,scheduleRender:()=>this.scheduleRender(),animationType:"string"==typeof n?n:"both",initialPromotionConfig:i,layoutScroll:s,layoutRoot:l})}return a}updateFeatures(){for(const t in this.features){const e=this.features[t];e.isMounted?e.update():(e.mount(),e.isMounted=!0)}}triggerBuild(){this.build(this.renderState,this.latestValues,this.options,this.props)}measureViewportBox(){return this.current?this.measureInstanceViewportBox(this.current,this.props):{x:{min:0,max:0},y:{min:0,max:0}}}getStaticValue(t){return this.latestValues[t]}setStaticValue(t,e){this.latestValues[t]=e}makeTargetAnimatable(t,e=!0){return this.makeTargetAnimatableFromInstance(t,this.props,e)}update(t,e){(t.transformTemplate||this.props.transformTemplate)&&this.scheduleRender(),this.prevProps=this.props,this.props=t,this.prevPresenceContext=this.presenceContext,this.presenceContext=e;for(let e=0;e<sx.length;e++){const n=sx[e];this.propEventSubscriptions[n]&&(this.propEventSubscriptions[n](),delete this.propEventSubscriptions[n]);const r=t["on"+n];r&&(this.propEventSubscriptions[n]=this.on(n,r))}this.prevMotionValues=function(t,e,n){const{willChange:r}=e;for(const i in e){const o=e[i],a=n[i];if(Pm(o))t.addValue(i,o),kv(r)&&r.add(i);else if(Pm(a))t.addValue(i,Mv(o,{owner:t})),kv(r)&&r.remove(i);else if(a!==o)if(t.hasValue(i)){const e=t.getValue(i);!e.hasAnimated&&e.set(o)}else{const e=t.getStaticValue(i);t.addValue(i,Mv(void 0!==e?e:o,{owner:t}))}}for(const r in n)void 0===e[r]&&t.removeValue(r);return e}(this,this.scrapeMotionValuesFromProps(t,this.prevProps),this.prevMotionValues),this.handleChildMotionValue&&this.handleChildMotionValue()}getProps(){return this.props}getVariant(t){return this.props.variants?this.props.variants[t]:void 0}getDefaultTransition(){return this.props.transition}getTransformPagePoint(){return this.props.transformPagePoint}getClosestVariantNode(){return this.isVariantNode?this:this.parent?this.parent.getClosestVariantNode():void 0}getVariantContext(t=!1){if(t)return this.parent?this.parent.getVariantContext():void 0;if(!this.isControllingVariants){const t=this.parent&&this.parent.getVariantContext()||{};return void 0!==this.props.initial&&(t.initial=this.props.initial),t}const e={};for(let t=0;t<lx;t++){const n=dm[t],r=this.props[n];(lm(r)||!1===r)&&(e[n]=r)}return e}addVariantChild(t){const e=this.getClosestVariantNode();if(e)return e.variantChildren&&e.variantChildren.add(t),()=>e.variantChildren.delete(t)}addValue(t,e){e!==this.values.get(t)&&(this.removeValue(t),this.bindToMotionValue(t,e)),this.values.set(t,e),this.latestValues[t]=e.get()}removeValue(t){this.values.delete(t);const e=this.valueSubscriptions.get(t);e&&(e(),this.valueSubscriptions.delete(t)),delete this.latestValues[t],this.removeValueFromRenderState(t,this.renderState)}hasValue(t){return this.values.has(t)}getValue(t,e){if(this.props.values&&this.props.values[t])return this.props.values[t];let n=this.values.get(t);return void 0===n&&void 0!==e&&(n=Mv(e,{owner:this}),this.addValue(t,n)),n}readValue(t){var e;return void 0===this.latestValues[t]&&this.current?null!==(e=this.getBaseTargetFromProps(this.props,t))&&void 0!==e?e:this.readValueFromInstance(this.current,t,this.options):this.latestValues[t]}setBaseTarget(t,e){this.baseTarget[t]=e}getBaseTarget(t){var e;const{initial:n}=this.props,r="string"==typeof n||"object"==typeof n?null===(e=by(this.props,n))||void 0===e?void 0:e[t]:void 0;if(n&&void 0!==r)return r;const i=this.getBaseTargetFromProps(this.props,t);return void 0===i||Pm(i)?void 0!==this.initialValues[t]&&void 0===r?void 0:this.baseTarget[t]:i}on(t,e){return this.events[t]||(this.events[t]=new Pv),this.events[t].add(e)}notify(t,...e){this.events[t]&&this.events[t].notify(...e)}}class ux extends cx{sortInstanceNodePosition(t,e){return 2&t.compareDocumentPosition(e)?1:-1}getBaseTargetFromProps(t,e){return t.style?t.style[e]:void 0}removeValueFromRenderState(t,{vars:e,style:n}){delete e[t],delete n[t]}makeTargetAnimatableFromInstance({transition:t,transitionEnd:e,...n},{transformValues:r},i){let o=function(t,e,n){const r={};for(const i in t){const t=Nv(i,e);if(void 0!==t)r[i]=t;else{const t=n.getValue(i);t&&(r[i]=t.get())}}return r}(n,t||{},this);if(r&&(e&&(e=r(e)),n&&(n=r(n)),o&&(o=r(o))),i){!function(t,e,n){var r,i;const o=Object.keys(e).filter((e=>!t.hasValue(e))),a=o.length;var s;if(a)for(let l=0;l<a;l++){const a=o[l],c=e[a];let u=null;Array.isArray(c)&&(u=c[0]),null===u&&(u=null!==(i=null!==(r=n[a])&&void 0!==r?r:t.readValue(a))&&void 0!==i?i:e[a]),null!=u&&("string"==typeof u&&(Cv(u)||_v(u))?u=parseFloat(u):(s=u,!Bv.find(Dv(s))&&Nb.test(c)&&(u=vv(a,c))),t.addValue(a,Mv(u,{owner:t})),void 0===n[a]&&(n[a]=u),null!==u&&t.setBaseTarget(a,u))}}(this,n,o);const t=((t,e,n,r)=>{const i=function(t,{...e},n){const r=t.current;if(!(r instanceof Element))return{target:e,transitionEnd:n};n&&(n={...n}),t.values.forEach((t=>{const e=t.get();if(!Fm(e))return;const n=Hw(e,r);n&&t.set(n)}));for(const t in e){const i=e[t];if(!Fm(i))continue;const o=Hw(i,r);o&&(e[t]=o,n||(n={}),void 0===n[t]&&(n[t]=i))}return{target:e,transitionEnd:n}}(t,e,r);return ex(t,e=i.target,n,r=i.transitionEnd)})(this,n,o,e);e=t.transitionEnd,n=t.target}return{transition:t,transitionEnd:e,...n}}}class dx extends ux{constructor(){super(...arguments),this.type="html"}readValueFromInstance(t,e){if(Tm.has(e)){const t=bv(e);return t&&t.default||0}{const r=(n=t,window.getComputedStyle(n)),i=(Dm(e)?r.getPropertyValue(e):r[e])||0;return"string"==typeof i?i.trim():i}var n}measureInstanceViewportBox(t,{transformPagePoint:e}){return F_(t,e)}build(t,e,n,r){Jm(t,e,n,r.transformTemplate)}scrapeMotionValuesFromProps(t,e){return my(t,e)}handleChildMotionValue(){this.childSubscription&&(this.childSubscription(),delete this.childSubscription);const{children:t}=this.props;Pm(t)&&(this.childSubscription=t.on("change",(t=>{this.current&&(this.current.textContent=`${t}`)})))}renderInstance(t,e,n,r){fy(t,e,n,r)}}class hx extends ux{constructor(){super(...arguments),this.type="svg",this.isSVGTag=!1}getBaseTargetFromProps(t,e){return t[e]}readValueFromInstance(t,e){if(Tm.has(e)){const t=bv(e);return t&&t.default||0}return e=py.has(e)?e:om(e),t.getAttribute(e)}measureInstanceViewportBox(){return{x:{min:0,max:0},y:{min:0,max:0}}}scrapeMotionValuesFromProps(t,e){return yy(t,e)}build(t,e,n,r){cy(t,e,n,this.isSVGTag,r.transformTemplate)}renderInstance(t,e,n,r){gy(t,e,0,r)}mount(t){this.isSVGTag=uy(t.tagName),super.mount(t)}}const fx=(t,e)=>Sm(t)?new hx(e,{enableHardwareAcceleration:!1}):new dx(e,{enableHardwareAcceleration:!0}),px={...Kv,...Gy,...Ww,layout:{ProjectionNode:$w,MeasureLayout:W_}},gx=wm(((t,e)=>function(t,{forwardMotionProps:e=!1},n,r){return{...Sm(t)?Sy:ky,preloadedFeatures:n,useRender:hy(e),createVisualElement:r,Component:t}}(t,e,px,fx))),mx=(t,e)=>t.find((t=>t.id===e));function yx(t,e){const n=bx(t,e);return{position:n,index:n?t[n].findIndex((t=>t.id===e)):-1}}function bx(t,e){for(const[n,r]of Object.entries(t))if(mx(r,e))return n}function vx(t){return{position:"fixed",zIndex:"var(--toast-z-index, 5500)",pointerEvents:"none",display:"flex",flexDirection:"column",margin:"top"===t||"bottom"===t?"0 auto":void 0,top:t.includes("top")?"env(safe-area-inset-top, 0px)":void 0,bottom:t.includes("bottom")?"env(safe-area-inset-bottom, 0px)":void 0,right:t.includes("left")?void 0:"env(safe-area-inset-right, 0px)",left:t.includes("right")?void 0:"env(safe-area-inset-left, 0px)"}}function _x(t){const e=Object.assign({},t);for(let t in e)void 0===e[t]&&delete e[t];return e}var wx=/^((children|dangerouslySetInnerHTML|key|ref|autoFocus|defaultValue|defaultChecked|innerHTML|suppressContentEditableWarning|suppressHydrationWarning|valueLink|abbr|accept|acceptCharset|accessKey|action|allow|allowUserMedia|allowPaymentRequest|allowFullScreen|allowTransparency|alt|async|autoComplete|autoPlay|capture|cellPadding|cellSpacing|challenge|charSet|checked|cite|classID|className|cols|colSpan|content|contentEditable|contextMenu|controls|controlsList|coords|crossOrigin|data|dateTime|decoding|default|defer|dir|disabled|disablePictureInPicture|disableRemotePlayback|download|draggable|encType|enterKeyHint|fetchpriority|fetchPriority|form|formAction|formEncType|formMethod|formNoValidate|formTarget|frameBorder|headers|height|hidden|high|href|hrefLang|htmlFor|httpEquiv|id|inputMode|integrity|is|keyParams|keyType|kind|label|lang|list|loading|loop|low|marginHeight|marginWidth|max|maxLength|media|mediaGroup|method|min|minLength|multiple|muted|name|nonce|noValidate|open|optimum|pattern|placeholder|playsInline|poster|preload|profile|radioGroup|readOnly|referrerPolicy|rel|required|reversed|role|rows|rowSpan|sandbox|scope|scoped|scrolling|seamless|selected|shape|size|sizes|slot|span|spellCheck|src|srcDoc|srcLang|srcSet|start|step|style|summary|tabIndex|target|title|translate|type|useMap|value|width|wmode|wrap|about|datatype|inlist|prefix|property|resource|typeof|vocab|autoCapitalize|autoCorrect|autoSave|color|incremental|fallback|inert|itemProp|itemScope|itemType|itemID|itemRef|on|option|results|security|unselectable|accentHeight|accumulate|additive|alignmentBaseline|allowReorder|alphabetic|amplitude|arabicForm|ascent|attributeName|attributeType|autoReverse|azimuth|baseFrequency|baselineShift|baseProfile|bbox|begin|bias|by|calcMode|capHeight|clip|clipPathUnits|clipPath|clipRule|colorInterpolation|colorInterpolationFilters|colorProfile|colorRendering|contentScriptType|contentStyleType|cursor|cx|cy|d|decelerate|descent|diffuseConstant|direction|display|divisor|dominantBaseline|dur|dx|dy|edgeMode|elevation|enableBackground|end|exponent|externalResourcesRequired|fill|fillOpacity|fillRule|filter|filterRes|filterUnits|floodColor|floodOpacity|focusable|fontFamily|fontSize|fontSizeAdjust|fontStretch|fontStyle|fontVariant|fontWeight|format|from|fr|fx|fy|g1|g2|glyphName|glyphOrientationHorizontal|glyphOrientationVertical|glyphRef|gradientTransform|gradientUnits|hanging|horizAdvX|horizOriginX|ideographic|imageRendering|in|in2|intercept|k|k1|k2|k3|k4|kernelMatrix|kernelUnitLength|kerning|keyPoints|keySplines|keyTimes|lengthAdjust|letterSpacing|lightingColor|limitingConeAngle|local|markerEnd|markerMid|markerStart|markerHeight|markerUnits|markerWidth|mask|maskContentUnits|maskUnits|mathematical|mode|numOctaves|offset|opacity|operator|order|orient|orientation|origin|overflow|overlinePosition|overlineThickness|panose1|paintOrder|pathLength|patternContentUnits|patternTransform|patternUnits|pointerEvents|points|pointsAtX|pointsAtY|pointsAtZ|preserveAlpha|preserveAspectRatio|primitiveUnits|r|radius|refX|refY|renderingIntent|repeatCount|repeatDur|requiredExtensions|requiredFeatures|restart|result|rotate|rx|ry|scale|seed|shapeRendering|slope|spacing|specularConstant|specularExponent|speed|spreadMethod|startOffset|stdDeviation|stemh|stemv|stitchTiles|stopColor|stopOpacity|strikethroughPosition|strikethroughThickness|string|stroke|strokeDasharray|strokeDashoffset|strokeLinecap|strokeLinejoin|strokeMiterlimit|strokeOpacity|strokeWidth|surfaceScale|systemLanguage|tableValues|targetX|targetY|textAnchor|textDecoration|textRendering|textLength|to|transform|u1|u2|underlinePosition|underlineThickness|unicode|unicodeBidi|unicodeRange|unitsPerEm|vAlphabetic|vHanging|vIdeographic|vMathematical|values|vectorEffect|version|vertAdvY|vertOriginX|vertOriginY|viewBox|viewTarget|visibility|widths|wordSpacing|writingMode|x|xHeight|x1|x2|xChannelSelector|xlinkActuate|xlinkArcrole|xlinkHref|xlinkRole|xlinkShow|xlinkTitle|xlinkType|xmlBase|xmlns|xmlnsXlink|xmlLang|xmlSpace|y|y1|y2|yChannelSelector|z|zoomAndPan|for|class|autofocus)|(([Dd][Aa][Tt][Aa]|[Aa][Rr][Ii][Aa]|x)-.*))$/,xx=df((function(t){return wx.test(t)||111===t.charCodeAt(0)&&110===t.charCodeAt(1)&&t.charCodeAt(2)<91})),Sx=function(t){return"theme"!==t},kx=function(t){return"string"==typeof t&&t.charCodeAt(0)>96?xx:Sx},Cx=function(t,e,n){var r;if(e){var i=e.shouldForwardProp;r=t.__emotion_forwardProp&&i?function(e){return t.__emotion_forwardProp(e)&&i(e)}:i}return"function"!=typeof r&&n&&(r=t.__emotion_forwardProp),r},Tx=function(t){var e=t.cache,n=t.serialized,r=t.isStringTag;return lf(e,n,r),Sf((function(){return cf(e,n,r)})),null},Ex=function t(e,n){var i,o,a=e.__emotion_real===e,s=a&&e.__emotion_base||e;void 0!==n&&(i=n.label,o=n.target);var l=Cx(e,n,a),c=l||kx(s),u=!c("as");return function(){var d=arguments,h=a&&void 0!==e.__emotion_styles?e.__emotion_styles.slice(0):[];if(void 0!==i&&h.push("label:"+i+";"),null==d[0]||void 0===d[0].raw)h.push.apply(h,d);else{var f=d[0];h.push(f[0]);for(var p=d.length,g=1;g<p;g++)h.push(d[g],f[g])}var m=Tf((function(t,e,n){var i=u&&t.as||s,a="",d=[],f=t;if(null==t.theme){for(var p in f={},t)f[p]=t[p];f.theme=r.useContext(Ef)}"string"==typeof t.className?a=sf(e.registered,d,t.className):null!=t.className&&(a=t.className+" ");var g=wf(h.concat(d),e.registered,f);a+=e.key+"-"+g.name,void 0!==o&&(a+=" "+o);var m=u&&void 0===l?kx(i):c,y={};for(var b in t)u&&"as"===b||m(b)&&(y[b]=t[b]);return y.className=a,n&&(y.ref=n),r.createElement(r.Fragment,null,r.createElement(Tx,{cache:e,serialized:g,isStringTag:"string"==typeof i}),r.createElement(i,y))}));return m.displayName=void 0!==i?i:"Styled("+("string"==typeof s?s:s.displayName||s.name||"Component")+")",m.defaultProps=e.defaultProps,m.__emotion_real=m,m.__emotion_base=s,m.__emotion_styles=h,m.__emotion_forwardProp=l,Object.defineProperty(m,"toString",{value:function(){return"."+o}}),m.withComponent=function(e,r){return t(e,of({},n,r,{shouldForwardProp:Cx(m,r,!0)})).apply(void 0,h)},m}}.bind(null);["a","abbr","address","area","article","aside","audio","b","base","bdi","bdo","big","blockquote","body","br","button","canvas","caption","cite","code","col","colgroup","data","datalist","dd","del","details","dfn","dialog","div","dl","dt","em","embed","fieldset","figcaption","figure","footer","form","h1","h2","h3","h4","h5","h6","head","header","hgroup","hr","html","i","iframe","img","input","ins","kbd","keygen","label","legend","li","link","main","map","mark","marquee","menu","menuitem","meta","meter","nav","noscript","object","ol","optgroup","option","output","p","param","picture","pre","progress","q","rp","rt","ruby","s","samp","script","section","select","small","source","span","strong","style","sub","summary","sup","table","tbody","td","textarea","tfoot","th","thead","time","title","tr","track","u","ul","var","video","wbr","circle","clipPath","defs","ellipse","foreignObject","g","image","line","linearGradient","mask","path","pattern","polygon","polyline","radialGradient","rect","stop","svg","text","tspan"].forEach((function(t){Ex[t]=Ex(t)}));const Px=new Set([...gg,"textStyle","layerStyle","apply","noOfLines","focusBorderColor","errorBorderColor","as","__css","css","sx"]),Ix=new Set(["htmlWidth","htmlHeight","htmlSize","htmlTranslate"]);function Ax(t){return(Ix.has(t)||!Px.has(t))&&"_"!==t[0]}const Mx=(Dx=Ex).default||Dx;var Dx;function Fx(t,e){const{baseStyle:n,...i}=e??{};i.shouldForwardProp||(i.shouldForwardProp=Ax);const o=(({baseStyle:t})=>e=>{const{theme:n,css:r,__css:i,sx:o,...a}=e,[s]=function(t,...e){const n=Object.getOwnPropertyDescriptors(t),r=Object.keys(n),i=t=>{const e={};for(let r=0;r<t.length;r++){const i=t[r];n[i]&&(Object.defineProperty(e,i,n[i]),delete n[i])}return e};return e.map((t=>i(Array.isArray(t)?t:r.filter(t)))).concat(i(r))}(a,yg),l=function(t,...e){if(null==t)throw new TypeError("Cannot convert undefined or null to object");const n={...t};for(const t of e)if(null!=t)for(const e in t)Object.prototype.hasOwnProperty.call(t,e)&&(e in n&&delete n[e],n[e]=t[e]);return n}({},i,Tp(t,e),_x(s),o),c=_g(l)(e.theme);return r?[c,r]:c})({baseStyle:n}),a=Mx(t,i)(o);return(0,r.forwardRef)((function(t,e){const{children:n,...i}=t,{colorMode:o,forced:s}=Bf(),l=s?o:void 0;return(0,r.createElement)(a,{ref:e,"data-theme":l,...i},n)}))}const Rx=function(){const t=new Map;return new Proxy(Fx,{apply:(t,e,n)=>Fx(...n),get:(e,n)=>(t.has(n)||t.set(n,Fx(n)),t.get(n))})}(),Bx={initial:t=>{const{position:e}=t,n=["top","bottom"].includes(e)?"y":"x";let r=["top-right","bottom-right"].includes(e)?1:-1;return"bottom"===e&&(r=1),{opacity:0,[n]:24*r}},animate:{opacity:1,y:0,x:0,scale:1,transition:{duration:.4,ease:[.4,0,.2,1]}},exit:{opacity:0,scale:.85,transition:{duration:.2,ease:[.4,0,1,1]}}},Lx=(0,r.memo)((t=>{const{id:e,message:n,onCloseComplete:i,onRequestRemove:o,requestClose:a=!1,position:s="bottom",duration:l=5e3,containerStyle:c,motionVariants:u=Bx,toastSpacing:d="0.5rem"}=t,[h,f]=(0,r.useState)(l),p=null===(g=(0,r.useContext)(Wg))||g.isPresent;var g;em((()=>{p||i?.()}),[p]),em((()=>{f(l)}),[l]);const m=()=>{p&&o()};(0,r.useEffect)((()=>{p&&a&&o()}),[p,a,o]),function(t,e){const n=function(t,e=[]){const n=(0,r.useRef)(t);return(0,r.useEffect)((()=>{n.current=t})),(0,r.useCallback)(((...t)=>n.current?.(...t)),e)}(t);(0,r.useEffect)((()=>{if(null==e)return;let t=null;return t=window.setTimeout((()=>{n()}),e),()=>{t&&window.clearTimeout(t)}}),[e,n])}(m,h);const y=(0,r.useMemo)((()=>({pointerEvents:"auto",maxWidth:560,minWidth:300,margin:d,...c})),[c,d]),b=(0,r.useMemo)((()=>function(t){let e="center";return t.includes("right")&&(e="flex-end"),t.includes("left")&&(e="flex-start"),{display:"flex",flexDirection:"column",alignItems:e}}(s)),[s]);return(0,nh.jsx)(gx.div,{layout:!0,className:"chakra-toast",variants:u,initial:"initial",animate:"animate",exit:"exit",onHoverStart:()=>f(null),onHoverEnd:()=>f(l),custom:{position:s},style:b,children:(0,nh.jsx)(Rx.div,{role:"status","aria-atomic":"true",className:"chakra-toast__inner",__css:y,children:Tp(n,{id:e,onClose:m})})})}));function Nx(t,e=[]){const n=Object.assign({},t);for(const t of e)t in n&&delete n[t];return n}function Ox(t){return Nx(t,["styleConfig","size","variant","colorScheme"])}Lx.displayName="ToastComponent";const zx=(...t)=>t.filter(Boolean).join(" ");function Ux(t){return(0,r.forwardRef)(t)}function jx(t,e){for(let n=e+1;n<t.length;n++)if(null!=t[n])return n;return-1}var Vx=i(291);function $x(t,e={}){const{styleConfig:n,...i}=e,{theme:o,colorMode:a}={...Bf(),theme:function(){const t=(0,r.useContext)(Ef);if(!t)throw Error("useTheme: `theme` is undefined. Seems you forgot to wrap your app in `<ChakraProvider />` or `<ThemeProvider />`");return t}()},s=t?xg(o,`components.${t}`):void 0,l=n||s,c=lp({theme:o,colorMode:a},l?.defaultProps??{},_x(Nx(i,["children"])),((t,e)=>t?void 0:e)),u=(0,r.useRef)({});if(l){const t=function(t){return e=>{const{variant:n,size:r,theme:i}=e,o=function(t){const e=t.__breakpoints;return function(t,n,r,i){if(!e)return;const o={},a=function(t,e){return Array.isArray(t)?t:xc(t)?e(t):null!=t?[t]:void 0}(r,e.toArrayValue);if(!a)return o;const s=a.length,l=1===s,c=!!t.parts;for(let r=0;r<s;r++){const s=e.details[r],u=e.details[jx(a,r)],d=ap(s.minW,u?._minW),h=Tp(t[n]?.[a[r]],i);h&&(c?t.parts?.forEach((t=>{lp(o,{[t]:l?h[t]:{[d]:h[t]}})})):c?o[d]=h:l?lp(o,h):o[d]=h)}return o}}(i);return lp({},Tp(t.baseStyle??{},e),o(t,"sizes",r,e),o(t,"variants",n,e))}}(l),e=t(c);Vx(u.current,e)||(u.current=e)}return u.current}function Wx(t,e={}){return $x(t,e)}function Gx(t,e={}){return $x(t,e)}const Hx={path:(0,nh.jsxs)("g",{stroke:"currentColor",strokeWidth:"1.5",children:[(0,nh.jsx)("path",{strokeLinecap:"round",fill:"none",d:"M9,9a3,3,0,1,1,4,2.829,1.5,1.5,0,0,0-1,1.415V14.25"}),(0,nh.jsx)("path",{fill:"currentColor",strokeLinecap:"round",d:"M12,17.25a.375.375,0,1,0,.375.375A.375.375,0,0,0,12,17.25h0"}),(0,nh.jsx)("circle",{fill:"none",strokeMiterlimit:"10",cx:"12",cy:"12",r:"11.25"})]}),viewBox:"0 0 24 24"},Yx=Ux(((t,e)=>{const{as:n,viewBox:r,color:i="currentColor",focusable:o=!1,children:a,className:s,__css:l,...c}=t,u={ref:e,focusable:o,className:zx("chakra-icon",s),__css:{w:"1em",h:"1em",display:"inline-block",lineHeight:"1em",flexShrink:0,color:i,...l,...Wx("Icon",t)}},d=r??Hx.viewBox;if(n&&"string"!=typeof n)return(0,nh.jsx)(Rx.svg,{as:n,...u,...c});const h=a??Hx.path;return(0,nh.jsx)(Rx.svg,{verticalAlign:"middle",viewBox:d,...u,...c,children:h})}));function qx(t){return(0,nh.jsx)(Yx,{viewBox:"0 0 24 24",...t,children:(0,nh.jsx)("path",{fill:"currentColor",d:"M11.983,0a12.206,12.206,0,0,0-8.51,3.653A11.8,11.8,0,0,0,0,12.207,11.779,11.779,0,0,0,11.8,24h.214A12.111,12.111,0,0,0,24,11.791h0A11.766,11.766,0,0,0,11.983,0ZM10.5,16.542a1.476,1.476,0,0,1,1.449-1.53h.027a1.527,1.527,0,0,1,1.523,1.47,1.475,1.475,0,0,1-1.449,1.53h-.027A1.529,1.529,0,0,1,10.5,16.542ZM11,12.5v-6a1,1,0,0,1,2,0v6a1,1,0,1,1-2,0Z"})})}Yx.displayName="Icon";const Kx=function(){var t=Kf.apply(void 0,arguments),e="animation-"+t.name;return{name:e,styles:"@keyframes "+e+"{"+t.styles+"}",anim:1,toString:function(){return"_EMO_"+this.name+"_"+this.styles+"_EMO_"}}}({"0%":{transform:"rotate(0deg)"},"100%":{transform:"rotate(360deg)"}}),Xx=Ux(((t,e)=>{const n=Wx("Spinner",t),{label:r="Loading...",thickness:i="2px",speed:o="0.45s",emptyColor:a="transparent",className:s,...l}=Ox(t),c=zx("chakra-spinner",s),u={display:"inline-block",borderColor:"currentColor",borderStyle:"solid",borderRadius:"99999px",borderWidth:i,borderBottomColor:a,borderLeftColor:a,animation:`${Kx} ${o} linear infinite`,...n};return(0,nh.jsx)(Rx.div,{ref:e,__css:u,className:c,...l,children:r&&(0,nh.jsx)(Rx.span,{srOnly:!0,children:r})})}));Xx.displayName="Spinner";const[Qx,Zx]=wg({name:"AlertContext",hookName:"useAlertContext",providerName:"<Alert />"}),[Jx,tS]=wg({name:"AlertStylesContext",hookName:"useAlertStyles",providerName:"<Alert />"}),eS={info:{icon:function(t){return(0,nh.jsx)(Yx,{viewBox:"0 0 24 24",...t,children:(0,nh.jsx)("path",{fill:"currentColor",d:"M12,0A12,12,0,1,0,24,12,12.013,12.013,0,0,0,12,0Zm.25,5a1.5,1.5,0,1,1-1.5,1.5A1.5,1.5,0,0,1,12.25,5ZM14.5,18.5h-4a1,1,0,0,1,0-2h.75a.25.25,0,0,0,.25-.25v-4.5a.25.25,0,0,0-.25-.25H10.5a1,1,0,0,1,0-2h1a2,2,0,0,1,2,2v4.75a.25.25,0,0,0,.25.25h.75a1,1,0,1,1,0,2Z"})})},colorScheme:"blue"},warning:{icon:qx,colorScheme:"orange"},success:{icon:function(t){return(0,nh.jsx)(Yx,{viewBox:"0 0 24 24",...t,children:(0,nh.jsx)("path",{fill:"currentColor",d:"M12,0A12,12,0,1,0,24,12,12.014,12.014,0,0,0,12,0Zm6.927,8.2-6.845,9.289a1.011,1.011,0,0,1-1.43.188L5.764,13.769a1,1,0,1,1,1.25-1.562l4.076,3.261,6.227-8.451A1,1,0,1,1,18.927,8.2Z"})})},colorScheme:"green"},error:{icon:qx,colorScheme:"red"},loading:{icon:Xx,colorScheme:"blue"}},nS=Ux((function(t,e){const{status:n="info",addRole:r=!0,...i}=Ox(t),o=t.colorScheme??function(t){return eS[t].colorScheme}(n),a=Gx("Alert",{...t,colorScheme:o}),s={width:"100%",display:"flex",alignItems:"center",position:"relative",overflow:"hidden",...a.container};return(0,nh.jsx)(Qx,{value:{status:n},children:(0,nh.jsx)(Jx,{value:a,children:(0,nh.jsx)(Rx.div,{"data-status":n,role:r?"alert":void 0,ref:e,...i,className:zx("chakra-alert",t.className),__css:s})})})}));function rS(t){const{status:e}=Zx(),n=function(t){return eS[t].icon}(e),r=tS(),i="loading"===e?r.spinner:r.icon;return(0,nh.jsx)(Rx.span,{display:"inherit","data-status":e,...t,className:zx("chakra-alert__icon",t.className),__css:i,children:t.children||(0,nh.jsx)(n,{h:"100%",w:"100%"})})}nS.displayName="Alert",rS.displayName="AlertIcon";const iS=Ux((function(t,e){const n=tS(),{status:r}=Zx();return(0,nh.jsx)(Rx.div,{ref:e,"data-status":r,...t,className:zx("chakra-alert__title",t.className),__css:n.title})}));iS.displayName="AlertTitle";const oS=Ux((function(t,e){const{status:n}=Zx(),r={display:"inline",...tS().description};return(0,nh.jsx)(Rx.div,{ref:e,"data-status":n,...t,className:zx("chakra-alert__desc",t.className),__css:r})}));function aS(t){return(0,nh.jsx)(Yx,{focusable:"false","aria-hidden":!0,...t,children:(0,nh.jsx)("path",{fill:"currentColor",d:"M.439,21.44a1.5,1.5,0,0,0,2.122,2.121L11.823,14.3a.25.25,0,0,1,.354,0l9.262,9.263a1.5,1.5,0,1,0,2.122-2.121L14.3,12.177a.25.25,0,0,1,0-.354l9.263-9.262A1.5,1.5,0,0,0,21.439.44L12.177,9.7a.25.25,0,0,1-.354,0L2.561.44A1.5,1.5,0,0,0,.439,2.561L9.7,11.823a.25.25,0,0,1,0,.354Z"})})}oS.displayName="AlertDescription";const sS=Ux((function(t,e){const n=Wx("CloseButton",t),{children:r,isDisabled:i,__css:o,...a}=Ox(t);return(0,nh.jsx)(Rx.button,{type:"button","aria-label":"Close",ref:e,disabled:i,__css:{outline:0,display:"flex",alignItems:"center",justifyContent:"center",flexShrink:0,...n,...o},...a,children:r||(0,nh.jsx)(aS,{width:"1em",height:"1em"})})}));sS.displayName="CloseButton";const lS=t=>{const{status:e,variant:n="solid",id:r,title:i,isClosable:o,onClose:a,description:s,colorScheme:l,icon:c}=t,u=r?{root:`toast-${r}`,title:`toast-${r}-title`,description:`toast-${r}-description`}:void 0;return(0,nh.jsxs)(nS,{addRole:!1,status:e,variant:n,id:u?.root,alignItems:"start",borderRadius:"md",boxShadow:"lg",paddingEnd:8,textAlign:"start",width:"auto",colorScheme:l,children:[(0,nh.jsx)(rS,{children:c}),(0,nh.jsxs)(Rx.div,{flex:"1",maxWidth:"100%",children:[i&&(0,nh.jsx)(iS,{id:u?.title,children:i}),s&&(0,nh.jsx)(oS,{id:u?.description,display:"block",children:s})]}),o&&(0,nh.jsx)(sS,{size:"sm",onClick:a,position:"absolute",insetEnd:1,top:1})]})};function cS(t={}){const{render:e,toastComponent:n=lS}=t;return r=>"function"==typeof e?e({...r,...t}):(0,nh.jsx)(n,{...r,...t})}const uS=function(t){let e=t;const n=new Set,r=t=>{e=t(e),n.forEach((t=>t()))};return{getState:()=>e,subscribe:e=>(n.add(e),()=>{r((()=>t)),n.delete(e)}),removeToast:(t,e)=>{r((n=>({...n,[e]:n[e].filter((e=>e.id!=t))})))},notify:(t,e)=>{const n=function(t,e={}){dS+=1;const n=e.id??dS,r=e.position??"bottom";return{id:n,message:t,position:r,duration:e.duration,onCloseComplete:e.onCloseComplete,onRequestRemove:()=>uS.removeToast(String(n),r),status:e.status,requestClose:!1,containerStyle:e.containerStyle}}(t,e),{position:i,id:o}=n;return r((t=>{const e=i.includes("top")?[n,...t[i]??[]]:[...t[i]??[],n];return{...t,[i]:e}})),o},update:(t,e)=>{t&&r((n=>{const r={...n},{position:i,index:o}=yx(r,t);return i&&-1!==o&&(r[i][o]={...r[i][o],...e,message:cS(e)}),r}))},closeAll:({positions:t}={})=>{r((e=>(t??["bottom","bottom-right","bottom-left","top","top-left","top-right"]).reduce(((t,n)=>(t[n]=e[n].map((t=>({...t,requestClose:!0}))),t)),{...e})))},close:t=>{r((e=>{const n=bx(e,t);return n?{...e,[n]:e[n].map((e=>e.id==t?{...e,requestClose:!0}:e))}:e}))},isActive:t=>Boolean(yx(uS.getState(),t).position)}}({top:[],"top-left":[],"top-right":[],"bottom-left":[],bottom:[],"bottom-right":[]});let dS=0;const hS=Boolean(globalThis?.document)?r.useLayoutEffect:r.useEffect;var fS=i(9553);const[pS,gS]=wg({strict:!1,name:"PortalContext"}),mS="chakra-portal",yS=t=>(0,nh.jsx)("div",{className:"chakra-portal-zIndex",style:{position:"absolute",zIndex:t.zIndex,top:0,left:0,right:0},children:t.children}),bS=t=>{const{appendToParentPortal:e,children:n}=t,[i,o]=(0,r.useState)(null),a=(0,r.useRef)(null),[,s]=(0,r.useState)({});(0,r.useEffect)((()=>s({})),[]);const l=gS(),c=Ig();hS((()=>{if(!i)return;const t=i.ownerDocument,n=e?l??t.body:t.body;if(!n)return;a.current=t.createElement("div"),a.current.className=mS,n.appendChild(a.current),s({});const r=a.current;return()=>{n.contains(r)&&n.removeChild(r)}}),[i]);const u=c?.zIndex?(0,nh.jsx)(yS,{zIndex:c?.zIndex,children:n}):n;return a.current?(0,fS.createPortal)((0,nh.jsx)(pS,{value:a.current,children:u}),a.current):(0,nh.jsx)("span",{ref:t=>{t&&o(t)}})},vS=t=>{const{children:e,containerRef:n,appendToParentPortal:i}=t,o=n.current,a=o??("undefined"!=typeof window?document.body:void 0),s=(0,r.useMemo)((()=>{const t=o?.ownerDocument.createElement("div");return t&&(t.className=mS),t}),[o]),[,l]=(0,r.useState)({});return hS((()=>l({})),[]),hS((()=>{if(s&&a)return a.appendChild(s),()=>{a.removeChild(s)}}),[s,a]),a&&s?(0,fS.createPortal)((0,nh.jsx)(pS,{value:i?s:null,children:e}),s):null};function _S(t){const e={appendToParentPortal:!0,...t},{containerRef:n,...r}=e;return n?(0,nh.jsx)(vS,{containerRef:n,...r}):(0,nh.jsx)(bS,{...r})}_S.className=mS,_S.selector=".chakra-portal",_S.displayName="Portal";const[wS,xS]=wg({name:"ToastOptionsContext",strict:!1}),SS=t=>{const e=(0,r.useSyncExternalStore)(uS.subscribe,uS.getState,uS.getState),{motionVariants:n,component:i=Lx,portalProps:o,animatePresenceProps:a}=t,s=Object.keys(e).map((t=>{const r=e[t];return(0,nh.jsx)("div",{role:"region","aria-live":"polite","aria-label":`Notifications-${t}`,id:`chakra-toast-manager-${t}`,style:vx(t),children:(0,nh.jsx)(tm,{...a,initial:!1,children:r.map((t=>(0,nh.jsx)(i,{motionVariants:n,...t},t.id)))})},t)}));return(0,nh.jsx)(_S,{...o,children:s})},kS=(CS=th,function({children:t,theme:e=CS,toastOptions:n,...r}){return(0,nh.jsxs)(Fg,{theme:e,...r,children:[(0,nh.jsx)(wS,{value:n?.defaultOptions,children:t}),(0,nh.jsx)(SS,{...n})]})});var CS;const TS=t=>(0,nh.jsx)(Rx.div,{className:"chakra-stack__item",...t,__css:{display:"inline-block",flex:"0 0 auto",minWidth:0,...t.__css}});TS.displayName="StackItem",Object.freeze(["base","sm","md","lg","xl","2xl"]);const ES=Ux(((t,e)=>{const{isInline:n,direction:i,align:o,justify:a,spacing:s="0.5rem",wrap:l,children:c,divider:u,className:d,shouldWrapChildren:h,...f}=t,p=n?"row":i??"column",g=(0,r.useMemo)((()=>function(t){const{spacing:e,direction:n}=t,r={column:{my:e,mx:0,borderLeftWidth:0,borderBottomWidth:"1px"},"column-reverse":{my:e,mx:0,borderLeftWidth:0,borderBottomWidth:"1px"},row:{mx:e,my:0,borderLeftWidth:"1px",borderBottomWidth:0},"row-reverse":{mx:e,my:0,borderLeftWidth:"1px",borderBottomWidth:0}};return{"&":(i=n,o=t=>r[t],Array.isArray(i)?i.map((t=>null===t?null:o(t))):xc(i)?Object.keys(i).reduce(((t,e)=>(t[e]=o(i[e]),t)),{}):null!=i?o(i):null)};var i,o}({spacing:s,direction:p})),[s,p]),m=!!u,y=!h&&!m,b=(0,r.useMemo)((()=>{const t=function(t){return r.Children.toArray(t).filter((t=>(0,r.isValidElement)(t)))}(c);return y?t:t.map(((e,n)=>{const i=void 0!==e.key?e.key:n,o=n+1===t.length,a=h?(0,nh.jsx)(TS,{children:e},i):e;if(!m)return a;const s=(0,r.cloneElement)(u,{__css:g}),l=o?null:s;return(0,nh.jsxs)(r.Fragment,{children:[a,l]},i)}))}),[u,g,m,y,h,c]),v=zx("chakra-stack",d);return(0,nh.jsx)(Rx.div,{ref:e,display:"flex",alignItems:o,justifyContent:a,flexDirection:p,flexWrap:l,gap:m?void 0:s,className:v,...f,children:b})}));ES.displayName="Stack";const PS=Ux(((t,e)=>(0,nh.jsx)(ES,{align:"center",...t,direction:"column",ref:e})));PS.displayName="VStack";const IS=Rx("div");IS.displayName="Box";const AS=Ux((function(t,e){const n=Wx("Text",t),{className:r,align:i,decoration:o,casing:a,...s}=Ox(t),l=_x({textAlign:t.align,textDecoration:t.decoration,textTransform:t.casing});return(0,nh.jsx)(Rx.p,{ref:e,className:zx("chakra-text",t.className),...l,...s,__css:n})}));AS.displayName="Text";const MS=Ux((function(t,e){const{direction:n,align:r,justify:i,wrap:o,basis:a,grow:s,shrink:l,...c}=t,u={display:"flex",flexDirection:n,alignItems:r,justifyContent:i,flexWrap:o,flexBasis:a,flexGrow:s,flexShrink:l};return(0,nh.jsx)(Rx.div,{ref:e,__css:u,...c})}));MS.displayName="Flex";const DS=Ux(((t,e)=>(0,nh.jsx)(ES,{align:"center",...t,direction:"row",ref:e})));DS.displayName="HStack";const FS=t=>t?"":void 0,RS=t=>!!t||void 0;function BS(...t){return function(e){t.some((t=>(t?.(e),e?.defaultPrevented)))}}function LS(...t){return e=>{t.forEach((t=>{!function(t,e){if(null!=t)if("function"!=typeof t)try{t.current=e}catch(n){throw new Error(`Cannot assign value '${e}' to ref '${t}'`)}else t(e)}(t,e)}))}}function NS(...t){return(0,r.useMemo)((()=>LS(...t)),t)}const[OS,zS]=wg({name:"FormControlStylesContext",errorMessage:"useFormControlStyles returned is 'undefined'. Seems you forgot to wrap the components in \"<FormControl />\" "}),[US,jS]=wg({strict:!1,name:"FormControlContext"}),VS=Ux((function(t,e){const n=Gx("Form",t),i=Ox(t),{getRootProps:o,htmlProps:a,...s}=function(t){const{id:e,isRequired:n,isInvalid:i,isDisabled:o,isReadOnly:a,...s}=t,l=(0,r.useId)(),c=e||`field-${l}`,u=`${c}-label`,d=`${c}-feedback`,h=`${c}-helptext`,[f,p]=(0,r.useState)(!1),[g,m]=(0,r.useState)(!1),[y,b]=(0,r.useState)(!1),v=(0,r.useCallback)(((t={},e=null)=>({id:h,...t,ref:LS(e,(t=>{t&&m(!0)}))})),[h]),_=(0,r.useCallback)(((t={},e=null)=>({...t,ref:e,"data-focus":FS(y),"data-disabled":FS(o),"data-invalid":FS(i),"data-readonly":FS(a),id:void 0!==t.id?t.id:u,htmlFor:void 0!==t.htmlFor?t.htmlFor:c})),[c,o,y,i,a,u]),w=(0,r.useCallback)(((t={},e=null)=>({id:d,...t,ref:LS(e,(t=>{t&&p(!0)})),"aria-live":"polite"})),[d]),x=(0,r.useCallback)(((t={},e=null)=>({...t,...s,ref:e,role:"group","data-focus":FS(y),"data-disabled":FS(o),"data-invalid":FS(i),"data-readonly":FS(a)})),[s,o,y,i,a]),S=(0,r.useCallback)(((t={},e=null)=>({...t,ref:e,role:"presentation","aria-hidden":!0,children:t.children||"*"})),[]);return{isRequired:!!n,isInvalid:!!i,isReadOnly:!!a,isDisabled:!!o,isFocused:!!y,onFocus:()=>b(!0),onBlur:()=>b(!1),hasFeedbackText:f,setHasFeedbackText:p,hasHelpText:g,setHasHelpText:m,id:c,labelId:u,feedbackId:d,helpTextId:h,htmlProps:s,getHelpTextProps:v,getErrorMessageProps:w,getRootProps:x,getLabelProps:_,getRequiredIndicatorProps:S}}(i),l=zx("chakra-form-control",t.className);return(0,nh.jsx)(US,{value:s,children:(0,nh.jsx)(OS,{value:n,children:(0,nh.jsx)(Rx.div,{...o({},e),className:l,__css:n.container})})})}));VS.displayName="FormControl";const $S=Ux((function(t,e){const n=jS(),r=zS(),i=zx("chakra-form__helper-text",t.className);return(0,nh.jsx)(Rx.div,{...n?.getHelpTextProps(t,e),__css:r.helperText,className:i})}));$S.displayName="FormHelperText";const WS=Ux((function(t,e){const{htmlSize:n,...r}=t,i=Gx("Input",r),o=function(t){const{isDisabled:e,isInvalid:n,isReadOnly:r,isRequired:i,...o}=function(t){const e=jS(),{id:n,disabled:r,readOnly:i,required:o,isRequired:a,isInvalid:s,isReadOnly:l,isDisabled:c,onFocus:u,onBlur:d,...h}=t,f=t["aria-describedby"]?[t["aria-describedby"]]:[];return e?.hasFeedbackText&&e?.isInvalid&&f.push(e.feedbackId),e?.hasHelpText&&f.push(e.helpTextId),{...h,"aria-describedby":f.join(" ")||void 0,id:n??e?.id,isDisabled:r??c??e?.isDisabled,isReadOnly:i??l??e?.isReadOnly,isRequired:o??a??e?.isRequired,isInvalid:s??e?.isInvalid,onFocus:BS(e?.onFocus,u),onBlur:BS(e?.onBlur,d)}}(t);return{...o,disabled:e,readOnly:r,required:i,"aria-invalid":RS(n),"aria-required":RS(i),"aria-readonly":RS(r)}}(Ox(r)),a=zx("chakra-input",t.className);return(0,nh.jsx)(Rx.input,{size:n,...o,__css:i.field,ref:e,className:a})}));WS.displayName="Input",WS.id="Input";const[GS,HS]=wg({strict:!1,name:"ButtonGroupContext"});function YS(t){const{children:e,className:n,...i}=t,o=(0,r.isValidElement)(e)?(0,r.cloneElement)(e,{"aria-hidden":!0,focusable:!1}):e,a=zx("chakra-button__icon",n);return(0,nh.jsx)(Rx.span,{display:"inline-flex",alignSelf:"center",flexShrink:0,...i,className:a,children:o})}function qS(t){const{label:e,placement:n,spacing:i="0.5rem",children:o=(0,nh.jsx)(Xx,{color:"currentColor",width:"1em",height:"1em"}),className:a,__css:s,...l}=t,c=zx("chakra-button__spinner",a),u="start"===n?"marginEnd":"marginStart",d=(0,r.useMemo)((()=>({display:"flex",alignItems:"center",position:e?"relative":"absolute",[u]:e?i:0,fontSize:"1em",lineHeight:"normal",...s})),[s,e,u,i]);return(0,nh.jsx)(Rx.div,{className:c,...l,__css:d,children:o})}YS.displayName="ButtonIcon",qS.displayName="ButtonSpinner";const KS=Ux(((t,e)=>{const n=HS(),i=Wx("Button",{...n,...t}),{isDisabled:o=n?.isDisabled,isLoading:a,isActive:s,children:l,leftIcon:c,rightIcon:u,loadingText:d,iconSpacing:h="0.5rem",type:f,spinner:p,spinnerPlacement:g="start",className:m,as:y,shouldWrapChildren:b,...v}=Ox(t),_=(0,r.useMemo)((()=>{const t={...i?._focus,zIndex:1};return{display:"inline-flex",appearance:"none",alignItems:"center",justifyContent:"center",userSelect:"none",position:"relative",whiteSpace:"nowrap",verticalAlign:"middle",outline:"none",...i,...!!n&&{_focus:t}}}),[i,n]),{ref:w,type:x}=function(t){const[e,n]=(0,r.useState)(!t),i=(0,r.useCallback)((t=>{t&&n("BUTTON"===t.tagName)}),[]);return{ref:i,type:e?"button":void 0}}(y),S={rightIcon:u,leftIcon:c,iconSpacing:h,children:l,shouldWrapChildren:b};return(0,nh.jsxs)(Rx.button,{disabled:o||a,ref:NS(e,w),as:y,type:f??x,"data-active":FS(s),"data-loading":FS(a),__css:_,className:zx("chakra-button",m),...v,children:[a&&"start"===g&&(0,nh.jsx)(qS,{className:"chakra-button__spinner--start",label:d,placement:"start",spacing:h,children:p}),a?d||(0,nh.jsx)(Rx.span,{opacity:0,children:(0,nh.jsx)(XS,{...S})}):(0,nh.jsx)(XS,{...S}),a&&"end"===g&&(0,nh.jsx)(qS,{className:"chakra-button__spinner--end",label:d,placement:"end",spacing:h,children:p})]})}));function XS(t){const{leftIcon:e,rightIcon:n,children:r,iconSpacing:i,shouldWrapChildren:o}=t;return o?(0,nh.jsxs)("span",{style:{display:"contents"},children:[e&&(0,nh.jsx)(YS,{marginEnd:i,children:e}),r,n&&(0,nh.jsx)(YS,{marginStart:i,children:n})]}):(0,nh.jsxs)(nh.Fragment,{children:[e&&(0,nh.jsx)(YS,{marginEnd:i,children:e}),r,n&&(0,nh.jsx)(YS,{marginStart:i,children:n})]})}KS.displayName="Button";const QS=Rx("div",{baseStyle:{display:"flex",alignItems:"center",justifyContent:"center"}});QS.displayName="Center";const ZS={horizontal:{insetStart:"50%",transform:"translateX(-50%)"},vertical:{top:"50%",transform:"translateY(-50%)"},both:{insetStart:"50%",top:"50%",transform:"translate(-50%, -50%)"}},JS=(Ux((function(t,e){const{axis:n="both",...r}=t;return(0,nh.jsx)(Rx.div,{ref:e,__css:ZS[n],...r,position:"absolute"})})),["borders","breakpoints","colors","components","config","direction","fonts","fontSizes","fontWeights","letterSpacings","lineHeights","radii","shadows","sizes","space","styles","transition","zIndices"]);function tk(t){return"function"==typeof t}const ek=t=>function(...e){let n=[...e],r=e[e.length-1];var i;return xc(i=r)&&JS.every((t=>Object.prototype.hasOwnProperty.call(i,t)))&&n.length>1?n=n.slice(0,n.length-1):r=t,function(...t){return e=>t.reduce(((t,e)=>e(t)),e)}(...n.map((t=>e=>tk(t)?t(e):function(...t){return lp({},...t,rk)}(e,t))))(r)},nk=ek(th);function rk(t,e,n,r){return(tk(t)||tk(e))&&Object.prototype.hasOwnProperty.call(r,n)?(...n)=>{const r=tk(t)?t(...n):t,i=tk(e)?e(...n):e;return lp({},r,i,rk)}:xc(t)&&wc(e)||wc(t)&&xc(e)?e:void 0}ek(eh);var ik=i(760),ok=i.n(ik),ak=(i(9842),i(3895)),sk=i.n(ak),lk=i(6797),ck=i.n(lk),uk=i(4372),dk=i(951);const hk={children:!0,ref:!0,key:!0,style:!0,forwardedRef:!0,unstable_applyCache:!0,unstable_applyDrawHitFromCache:!0};let fk=!1,pk=!1;const gk=".react-konva-event";let mk=!1;const yk="ReactKonva: You have a Konva node with draggable = true and position defined but no onDragMove or onDragEnd events are handled.\nPosition of a node will be changed during drag&drop, so you should update state of the react app as well.\nConsider to add onDragMove or onDragEnd events.\nFor more info see: https://github.com/konvajs/react-konva/issues/256\n",bk='ReactKonva: You are using "zIndex" attribute for a Konva node.\nreact-konva may get confused with ordering. Just define correct order of elements in your render function of a component.\nFor more info see: https://github.com/konvajs/react-konva/issues/194\n',vk={};function _k(t,e,n=vk){if(!fk&&"zIndex"in e&&(console.warn(bk),fk=!0),!pk&&e.draggable){var r=void 0!==e.x||void 0!==e.y,i=e.onDragEnd||e.onDragMove;r&&!i&&(console.warn(yk),pk=!0)}for(var o in n)if(!hk[o]){var a="on"===o.slice(0,2),s=n[o]!==e[o];a&&s&&("content"===(f=o.substr(2).toLowerCase()).substr(0,7)&&(f="content"+f.substr(7,1).toUpperCase()+f.substr(8)),t.off(f,n[o])),!e.hasOwnProperty(o)&&t.setAttr(o,void 0)}var l=mk||e._useStrictMode,c={},u=!1;const d={};for(var o in e)if(!hk[o]){a="on"===o.slice(0,2);var h=n[o]!==e[o];a&&h&&("content"===(f=o.substr(2).toLowerCase()).substr(0,7)&&(f="content"+f.substr(7,1).toUpperCase()+f.substr(8)),e[o]&&(d[f]=e[o])),!a&&(e[o]!==n[o]||l&&e[o]!==t.getAttr(o))&&(u=!0,c[o]=e[o])}for(var f in u&&(t.setAttrs(c),wk(t)),d)t.on(f+gk,d[f])}function wk(t){if(!dk.Konva.autoDrawEnabled){var e=t.getLayer()||t.getStage();e&&e.batchDraw()}}var xk=i(8494);const Sk={},kk={};function Ck(t,e){"string"!=typeof e?(t.add(e),wk(t)):console.error(`Do not use plain text as child of Konva.Node. You are using text: ${e}`)}function Tk(t,e,n){let r=sk()[t];r||(console.error(`Konva has no node with the type ${t}. Group will be used instead. If you use minimal version of react-konva, just import required nodes into Konva: "import "konva/lib/shapes/${t}"  If you want to render DOM elements as part of canvas tree take a look into this demo: https://konvajs.github.io/docs/react/DOM_Portal.html`),r=sk().Group);const i={},o={};for(var a in e)"on"===a.slice(0,2)?o[a]=e[a]:i[a]=e[a];const s=new r(i);return _k(s,o),s}function Ek(t,e,n){console.error(`Text components are not supported for now in ReactKonva. Your text is: "${t}"`)}function Pk(t,e,n){return!1}function Ik(t){return t}function Ak(){return null}function Mk(){return null}function Dk(t,e,n,r){return kk}function Fk(){}function Rk(t){}function Bk(t,e){return!1}function Lk(){return Sk}function Nk(){return Sk}sk().Node.prototype._applyProps=_k;const Ok=setTimeout,zk=clearTimeout,Uk=-1;function jk(t,e){return!1}const Vk=!1,$k=!0,Wk=!0;function Gk(t,e){e.parent===t?e.moveToTop():t.add(e),wk(t)}function Hk(t,e){e.parent===t?e.moveToTop():t.add(e),wk(t)}function Yk(t,e,n){e._remove(),t.add(e),e.setZIndex(n.getZIndex()),wk(t)}function qk(t,e,n){Yk(t,e,n)}function Kk(t,e){e.destroy(),e.off(gk),wk(t)}function Xk(t,e){e.destroy(),e.off(gk),wk(t)}function Qk(t,e,n){console.error(`Text components are not yet supported in ReactKonva. You text is: "${n}"`)}function Zk(t,e,n){}function Jk(t,e,n,r,i){_k(t,i,r)}function tC(t){t.hide(),wk(t)}function eC(t){}function nC(t,e){(null==e.visible||e.visible)&&t.show()}function rC(t,e){}function iC(t){}function oC(){}const aC=()=>uk.DefaultEventPriority;var sC,lC,cC=Object.defineProperty,uC=Object.defineProperties,dC=Object.getOwnPropertyDescriptors,hC=Object.getOwnPropertySymbols,fC=Object.prototype.hasOwnProperty,pC=Object.prototype.propertyIsEnumerable,gC=(t,e,n)=>e in t?cC(t,e,{enumerable:!0,configurable:!0,writable:!0,value:n}):t[e]=n,mC=(t,e)=>{for(var n in e||(e={}))fC.call(e,n)&&gC(t,n,e[n]);if(hC)for(var n of hC(e))pC.call(e,n)&&gC(t,n,e[n]);return t};function yC(t,e,n){if(!t)return;if(!0===n(t))return t;let r=e?t.return:t.child;for(;r;){const t=yC(r,e,n);if(t)return t;r=e?null:r.sibling}}function bC(t){try{return Object.defineProperties(t,{_currentRenderer:{get:()=>null,set(){}},_currentRenderer2:{get:()=>null,set(){}}})}catch(e){return t}}"undefined"==typeof window||!(null==(sC=window.document)?void 0:sC.createElement)&&"ReactNative"!==(null==(lC=window.navigator)?void 0:lC.product)?r.useEffect:r.useLayoutEffect;const vC=console.error;console.error=function(){const t=[...arguments].join("");if(!(null==t?void 0:t.startsWith("Warning:"))||!t.includes("useContext"))return vC.apply(this,arguments);console.error=vC};const _C=bC(r.createContext(null));class wC extends r.Component{render(){return r.createElement(_C.Provider,{value:this._reactInternals},this.props.children)}}function xC(){const t=function(){const t=function(){const t=r.useContext(_C);if(null===t)throw new Error("its-fine: useFiber must be called within a <FiberProvider />!");const e=r.useId(),n=r.useMemo((()=>{for(const n of[t,null==t?void 0:t.alternate]){if(!n)continue;const t=yC(n,!1,(t=>{let n=t.memoizedState;for(;n;){if(n.memoizedState===e)return!0;n=n.next}}));if(t)return t}}),[t,e]);return n}(),[e]=r.useState((()=>new Map));e.clear();let n=t;for(;n;){if(n.type&&"object"==typeof n.type){const t=void 0===n.type._context&&n.type.Provider===n.type?n.type:n.type._context;t&&t!==_C&&!e.has(t)&&e.set(t,r.useContext(bC(t)))}n=n.return}return e}();return r.useMemo((()=>Array.from(t.keys()).reduce(((e,n)=>i=>{return r.createElement(e,null,r.createElement(n.Provider,(o=mC({},i),a={value:t.get(n)},uC(o,dC(a)))));var o,a}),(t=>r.createElement(wC,mC({},t))))),[t])}const SC=t=>{const e=r.useRef(),n=r.useRef(),i=r.useRef(),o=function(t){const e=r.useRef({});return r.useLayoutEffect((()=>{e.current=t})),r.useLayoutEffect((()=>()=>{e.current={}}),[]),e.current}(t),a=xC(),s=e=>{const{forwardedRef:n}=t;n&&("function"==typeof n?n(e):n.current=e)};return r.useLayoutEffect((()=>(n.current=new(sk().Stage)({width:t.width,height:t.height,container:e.current}),s(n.current),i.current=EC.createContainer(n.current,uk.LegacyRoot,!1,null),EC.updateContainer(r.createElement(a,{},t.children),i.current),()=>{sk().isBrowser&&(s(null),EC.updateContainer(null,i.current,null),n.current.destroy())})),[]),r.useLayoutEffect((()=>{s(n.current),_k(n.current,t,o),EC.updateContainer(r.createElement(a,{},t.children),i.current,null)})),r.createElement("div",{ref:e,id:t.id,accessKey:t.accessKey,className:t.className,role:t.role,style:t.style,tabIndex:t.tabIndex,title:t.title})},kC="Layer",CC="Rect",TC="Shape",EC=ck()(t);EC.injectIntoDevTools({findHostInstanceByFiber:()=>null,bundleType:0,version:r.version,rendererPackageName:"react-konva"});const PC=r.forwardRef(((t,e)=>r.createElement(wC,{},r.createElement(SC,{...t,forwardedRef:e}))));function IC(t){let e,n=t[0],r=1;for(;r<t.length;){const i=t[r],o=t[r+1];if(r+=2,("optionalAccess"===i||"optionalCall"===i)&&null==n)return;"access"===i||"optionalAccess"===i?(e=n,n=o(n)):"call"!==i&&"optionalCall"!==i||(n=o(((...t)=>n.call(e,...t))),e=void 0)}return n}const AC=({rectProps:t,onChange:e,isSelected:n,onClick:i,scale:o,strokeWidth:a,mode:s="Edit",shouldStartDrag:l})=>{const c=(0,r.useRef)(null),u=(0,r.useRef)(null);(0,r.useEffect)((()=>{n&&u.current&&c.current&&(u.current.nodes([c.current]),u.current.visible(!0),u.current.enabledAnchors(["top-left","top-center","top-right","middle-left","middle-right","bottom-left","bottom-center","bottom-right"]),u.current.keepRatio(!1),u.current.rotateEnabled(!1),u.current.padding(2),u.current.anchorSize(10),u.current.anchorStrokeWidth(2),u.current.anchorFill("#FFFFFF"),u.current.anchorStroke(t.stroke||"#0000FF"),u.current.anchorCornerRadius(4),IC([u,"access",t=>t.current,"access",t=>t.getLayer,"call",t=>t(),"optionalAccess",t=>t.batchDraw,"call",t=>t()]))}),[n,t.stroke]);const d="Edit"===s;return(0,r.useEffect)((()=>{d&&c.current&&IC([l,"optionalCall",t=>t()])&&c.current.startDrag()}),[]),r.createElement(r.Fragment,null,r.createElement(CC,{ref:c,x:t.x*o,y:t.y*o,width:t.width*o,height:t.height*o,stroke:t.stroke,strokeWidth:a,dash:[5,5],fill:n?t.stroke+"20":"transparent",draggable:d,onClick:i,onTap:i,onDragEnd:n=>{if(!c.current)return;const r=c.current;e({...t,x:r.x()/o,y:r.y()/o})},onTransformEnd:n=>{if(!c.current)return;const r=c.current,i=r.scaleX(),a=r.scaleY();r.scaleX(1),r.scaleY(1),e({...t,x:r.x()/o,y:r.y()/o,width:Math.max(5,r.width()*i)/o,height:Math.max(5,r.height()*a)/o})}}),n&&"Edit"===s&&r.createElement("Transformer",{ref:u,anchorStroke:t.stroke||"#0000FF",anchorFill:"#FFFFFF",anchorSize:10,anchorCornerRadius:4,borderStroke:t.stroke||"#0000FF",borderDash:[3,3],borderStrokeWidth:1,boundBoxFunc:(t,e)=>e.width<5||e.height<5?t:e}))};class MC{__init(){this.cells=new Map}constructor(t,e=128){MC.prototype.__init.call(this),this.items=t,this.cellSize=Math.max(e,1),t.forEach(((t,e)=>{const[n,r,i,o]=this.cellRange(t.x,t.y,t.width,t.height);for(let t=n;t<=i;t++)for(let n=r;n<=o;n++){const r=this.key(t,n),i=this.cells.get(r);i?i.push(e):this.cells.set(r,[e])}}))}key(t,e){return 65536*t+e}cellRange(t,e,n,r){const i=Math.min(t,t+n),o=Math.min(e,e+r),a=Math.max(t,t+n),s=Math.max(e,e+r);return[Math.floor(i/this.cellSize),Math.floor(o/this.cellSize),Math.floor(a/this.cellSize),Math.floor(s/this.cellSize)]}query(t,e,n,r){const[i,o,a,s]=this.cellRange(t,e,n,r),l=new Set;for(let c=i;c<=a;c++)for(let i=o;i<=s;i++){const o=this.cells.get(this.key(c,i));if(o)for(const i of o){const o=this.items[i];o.x<=t+n&&o.x+o.width>=t&&o.y<=e+r&&o.y+o.height>=e&&l.add(i)}}return Array.from(l).sort(((t,e)=>t-e)).map((t=>this.items[t]))}hitTest(t,e,n=0){const r=this.query(t-n,e-n,2*n,2*n);for(let i=r.length-1;i>=0;i--){const o=r[i];if(t>=o.x-n&&t<=o.x+o.width+n&&e>=o.y-n&&e<=o.y+o.height+n)return o}return null}}const DC=(t,e,n,r)=>{const i=t.signatures[`${e}/${n}_${r}`];return i?t.url_template.replace("{level}",String(e)).replace("{col}",String(n)).replace("{row}",String(r)).replace("{signature}",i):null},FC=new Map,RC=(t,e)=>{let n=FC.get(t);if(n)return FC.delete(t),FC.set(t,n),n;for(n=new window.Image,n.decoding="async",n.onload=e,n.src=t,FC.set(t,n);FC.size>512;)FC.delete(FC.keys().next().value);return n},BC=({tiles:t,scale:e,position:n,viewport:i})=>{const o=(0,r.useRef)(null),a=()=>function(t){let e,n=t[0],r=1;for(;r<t.length;){const i=t[r],o=t[r+1];if(r+=2,("optionalAccess"===i||"optionalCall"===i)&&null==n)return;"access"===i||"optionalAccess"===i?(e=n,n=o(n)):"call"!==i&&"optionalCall"!==i||(n=o(((...t)=>n.call(e,...t))),e=void 0)}return n}([o,"access",t=>t.current,"optionalAccess",t=>t.getLayer,"call",t=>t(),"optionalAccess",t=>t.batchDraw,"call",t=>t()]);return(0,r.useEffect)((()=>{a()}),[t,e,n.x,n.y,i[0],i[1]]),r.createElement(TC,{ref:o,listening:!1,perfectDrawEnabled:!1,sceneFunc:r=>{const o=r._context,s=((t,e)=>{let n=t.levels[0];for(const r of t.levels)r.factor>=e&&(n=r);return n})(t,e),l=t.tile_size,c=s.factor/e,u=-n.x*c,d=-n.y*c,h=u+i[0]*c,f=d+i[1]*c,p=Math.max(0,Math.floor(u/l)),g=Math.max(0,Math.floor(d/l)),m=Math.min(s.cols-1,Math.floor(h/l)),y=Math.min(s.rows-1,Math.floor(f/l)),b=e/s.factor;for(let e=p;e<=m;e++)for(let n=g;n<=y;n++){const r=DC(t,s.level,e,n);if(!r)continue;const i=RC(r,a);i.complete&&0!==i.naturalWidth&&o.drawImage(i,e*l*b,n*l*b,i.naturalWidth*b,i.naturalHeight*b)}}})};function LC(t){let e,n=t[0],r=1;for(;r<t.length;){const i=t[r],o=t[r+1];if(r+=2,("optionalAccess"===i||"optionalCall"===i)&&null==n)return;"access"===i||"optionalAccess"===i?(e=n,n=o(n)):"call"!==i&&"optionalCall"!==i||(n=o(((...t)=>n.call(e,...t))),e=void 0)}return n}let NC=0;const OC=t=>{const{rectangles:e,mode:n,selectedId:i,setSelectedId:o,setRectangles:a,setLabel:s,color_map:l,scale:c,label:u,image_size:d,image:h,strokeWidth:f,isLabelEditMode:p=!1,setIsLabelEditMode:g=()=>{},handleLabelInputChange:m=()=>{},showLabels:y=!1,suggestedLabels:b=[],showSuggestions:v=!1,setShowSuggestions:_=()=>{},handleSuggestionSelect:w=()=>{},isLoadingLabels:x=!1,tiles:S=null,viewport:k=null}=t,C=k?Math.min(d[0]*c,k[0]):d[0]*c,T=k?Math.min(d[1]*c,k[1]):d[1]*c,[E,P]=(0,r.useState)(null),[I,A]=(0,r.useState)({x:0,y:0}),[M,D]=(0,r.useState)(!1),[F,R]=(0,r.useState)(null),B=(0,r.useMemo)((()=>new MC(e,(t=>Math.max(64,Math.max(t[0],t[1])/32))(d))),[e,d[0],d[1]]),L=(0,r.useMemo)((()=>{const t=-I.x/c,e=-I.y/c;return B.query(t,e,C/c,T/c).filter((t=>t.id!==i))}),[B,I.x,I.y,c,i,C,T]),N=i?e.find((t=>t.id===i)):void 0,O=(0,r.useRef)(!1),z=(0,r.useRef)(null),[U,j]=(0,r.useState)({x:0,y:0}),V=r.useRef(null);(0,r.useEffect)((()=>{p&&V.current&&setTimeout((()=>{LC([V,"access",t=>t.current,"optionalAccess",t=>t.focus,"call",t=>t()]),_(!0)}),100)}),[p]),(0,r.useEffect)((()=>{if(i){const t=e.find((t=>t.id===i));t&&j({x:(t.x+t.width/2)*c+I.x,y:(t.y-30)*c+I.y})}}),[i,e,c,I]),(0,r.useEffect)((()=>{const t=t=>{"Delete"===t.key&&null!==i&&(a((t=>t.filter((t=>t.id!==i)))),o(null),g(!1))};return window.addEventListener("keydown",t),()=>window.removeEventListener("keydown",t)}),[i,a,o,g]),(0,r.useEffect)((()=>{console.log("BBoxCanvas: suggestedLabels 변경됨",b),console.log("showSuggestions:",v),console.log("suggestedLabels:",b),v&&b.length>0&&console.log("추천 UI 표시됨")}),[b,v]);const $=r.useRef(null);return r.createElement("div",{ref:$,style:{position:"relative",width:`${C}px`,height:`${T}px`,overflow:"hidden",border:"2px solid #3182CE",borderRadius:"4px",boxShadow:"0 0 10px rgba(0,0,0,0.1)",background:"repeating-conic-gradient(#f0f0f0 0% 25%, #e0e0e0 0% 50%) 50% / 20px 20px"}},r.createElement(PC,{width:C,height:T,onMouseDown:t=>{const e=t.target.getStage();if(!e)return;const r=e.getPointerPosition();if(!r)return;if(O.current=!0,t.target!==e)return;const a=B.hitTest((r.x-I.x)/c,(r.y-I.y)/c,4/c);if(a)return z.current="Edit"===n?a.id:null,o(a.id),void s(a.label);"Edit"===n?(D(!0),R({x:r.x,y:r.y})):"Draw"===n&&null===i?(P([(r.x-I.x)/c,(r.y-I.y)/c,(r.x-I.x)/c,(r.y-I.y)/c]),s("")):(o(null),g(!1))},onMouseMove:t=>{const e=t.target.getStage();if(!e)return;const r=e.getPointerPosition();r&&(null!==E&&"Draw"===n?P([E[0],E[1],(r.x-I.x)/c,(r.y-I.y)/c]):M&&"Edit"===n&&(A({x:I.x+(r.x-F.x),y:I.y+(r.y-F.y)}),R({x:r.x,y:r.y})))},onMouseUp:()=>{if(O.current=!1,z.current=null,null!==E&&"Draw"===n&&Math.abs(E[2]-E[0])>5&&Math.abs(E[3]-E[1])>5){const t=`bbox-${Date.now().toString(36)}-${(NC++).toString(36)}`;s(""),a((e=>[...e,{x:Math.min(E[0],E[2]),y:Math.min(E[1],E[3]),width:Math.abs(E[2]-E[0]),height:Math.abs(E[3]-E[1]),label:u,stroke:l[u]||"#39FF14",id:t}])),o(t),g(!0)}P(null),D(!1),R(null)}},r.createElement(kC,{x:I.x,y:I.y,listening:!1},r.createElement(CC,{x:0,y:0,width:d[0]*c,height:d[1]*c,fill:"#FFFFFF",stroke:"#DDDDDD",strokeWidth:1})),r.createElement(kC,{x:I.x,y:I.y,listening:!1},r.createElement("Image",{image:h||void 0,width:d[0]*c,height:d[1]*c}),S&&r.createElement(BC,{tiles:S,scale:c,position:I,viewport:[C,T]})),r.createElement(kC,{x:I.x,y:I.y,listening:!1},r.createElement(TC,{perfectDrawEnabled:!1,sceneFunc:t=>{const e=t._context,n=new Map;L.forEach((t=>{const e=n.get(t.stroke);e?e.push(t):n.set(t.stroke,[t])})),e.save(),e.lineWidth=f,e.setLineDash([5,5]),n.forEach(((t,n)=>{e.strokeStyle=n,e.beginPath(),t.forEach((t=>{e.rect(t.x*c,t.y*c,t.width*c,t.height*c)})),e.stroke()})),y&&(e.setLineDash([]),e.font="25px Arial",e.textBaseline="top",L.forEach((t=>{const n=t.label||"unlabeled",r=e.measureText(n).width,i=t.x*c,o=t.y*c-20-31;e.globalAlpha=.8,e.fillStyle="#2F4F4F",e.fillRect(i,o,r+6,31),e.fillStyle="white",e.fillText(n,i+3,o+3)}))),e.restore()}})),r.createElement(kC,{x:I.x,y:I.y},N&&r.createElement("Group",{key:N.id},r.createElement(AC,{rectProps:N,scale:c,strokeWidth:f,isSelected:!0,onClick:()=>{o(N.id),s(N.label)},mode:n,onChange:t=>{a((e=>e.map((e=>e.id===t.id?t:e))))},shouldStartDrag:()=>O.current&&z.current===N.id}),y&&r.createElement("Label",{x:N.x*c,y:N.y*c-20,opacity:.8,listening:!1},r.createElement("Tag",{fill:"#2F4F4F",cornerRadius:3,pointerDirection:"down",pointerWidth:10,pointerHeight:10,lineJoin:"round"}),r.createElement("Text",{text:N.label||"unlabeled",padding:3,fontFamily:"Arial",fontSize:25,fill:"white"}))),E&&r.createElement(CC,{fill:"#39FF144D",x:Math.min(E[0],E[2])*c,y:Math.min(E[1],E[3])*c,width:Math.abs(E[2]-E[0])*c,height:Math.abs(E[3]-E[1])*c,stroke:"#39FF14",strokeWidth:1}))),p&&i&&$.current&&r.createElement("div",{style:{position:"absolute",top:`${U.y}px`,left:`${U.x}px`,transform:"translate(-50%, -100%)",zIndex:1e3,background:"white",padding:"5px",borderRadius:"4px",boxShadow:"0 2px 5px rgba(0,0,0,0.2)"}},r.createElement(WS,{ref:V,size:"sm",value:u,placeholder:"라벨 입력",onChange:m,onBlur:()=>{setTimeout((()=>{LC([document,"access",t=>t.activeElement,"optionalAccess",t=>t.classList,"access",t=>t.contains,"call",t=>t("suggestion-item")])||(g(!1),_(!1))}),200)},onKeyDown:t=>{("Enter"===t.key||"Escape"===t.key)&&g(!1)},width:"200px"}),v&&r.createElement(IS,{mt:1,p:2,bg:"white",borderRadius:"md",boxShadow:"sm",border:"1px solid",borderColor:"gray.200",width:"200px"},x?r.createElement("div",{style:{padding:"10px",textAlign:"center",color:"gray"}},"텍스트 인식 중..."):b.length>0?r.createElement("div",{style:{display:"flex",flexDirection:"column",gap:"5px",maxHeight:"150px",overflowY:"auto"}},b.map(((t,e)=>r.createElement("div",{key:e,className:"suggestion-item",style:{padding:"5px 8px",borderRadius:"3px",cursor:"pointer",backgroundColor:t===u?"#e2f1ff":"transparent",fontWeight:t===u?"bold":"normal"},onMouseDown:e=>{e.preventDefault(),w(t)}},t)))):r.createElement("div",{style:{padding:"10px",textAlign:"center",color:"gray"}},"추천 텍스트가 없습니다"))))};var zC=i(4941),UC=i.n(zC);function jC(t,e){return null!=t?t:e()}function VC(t){let e,n=t[0],r=1;for(;r<t.length;){const i=t[r],o=t[r+1];if(r+=2,("optionalAccess"===i||"optionalCall"===i)&&null==n)return;"access"===i||"optionalAccess"===i?(e=n,n=o(n)):"call"!==i&&"optionalCall"!==i||(n=o(((...t)=>n.call(e,...t))),e=void 0)}return n}const $C=nk({config:{initialColorMode:"light",useSystemColorMode:!1}}),WC=(t,e)=>{const n=[],r=new Set;for(const i of e){r.add(i.id);const e=[i.x,i.y,i.width,i.height],o=t.get(i.id);o?(o.x===i.x&&o.y===i.y&&o.width===i.width&&o.height===i.height||n.push({op:"move",id:i.id,bbox:e}),(o.label||"")!==(i.label||"")&&n.push({op:"relabel",id:i.id,label:i.label||""})):n.push({op:"add",id:i.id,bbox:e,label:i.label||""})}return t.forEach(((t,e)=>{r.has(e)||n.push({op:"delete",id:e})})),n},GC=t=>new Map(t.map((t=>[t.id,t]))),HC=new Map;let YC=0;const qC=()=>`${Date.now()}-${YC++}`,KC=({args:t})=>{const{image_url:e,image_size:n,bbox_info:i,color_map:o,line_width:a,use_space:s,ocr_suggestions:l,idle_sync_ms:c=5e3,prefetch_urls:u=[],tiles:d=null,viewport_height:h=null}=t,f=d&&h?[.95*window.innerWidth,h]:null,p=n[0]>0?.8*window.innerWidth/n[0]:1,g=Math.min(.5,p),m=new URLSearchParams(window.location.search).get("streamlitUrl"),y=/^https?:\/\//.test(e),[b]=ok()(y?e:m+e);(0,r.useEffect)((()=>{b&&u.length>0&&(t=>{for(t.forEach((t=>{if(HC.has(t))return;const e=new window.Image;e.decoding="async",e.src=t,HC.set(t,e)}));HC.size>16;){const t=HC.keys().next().value;HC.delete(t)}})(u)}),[b,JSON.stringify(u)]);const[v,_]=(0,r.useState)(i.map(((t,e)=>({x:t.bbox[0],y:t.bbox[1],width:t.bbox[2],height:t.bbox[3],label:t.label,stroke:"#39FF14",id:jC(t.box_id,(()=>"bbox-"+e))})))),w=(0,r.useRef)(GC(v)),x=(0,r.useRef)(jC(t.version,(()=>0))),[S,k]=(0,r.useState)(null),[C,T]=(0,r.useState)(""),[E,P]=(0,r.useState)("Draw"),[I,A]=(0,r.useState)(!1),[M,D]=(0,r.useState)(1),[F,R]=(0,r.useState)(!1),[B,L]=(0,r.useState)(!1),N=(0,r.useRef)(null),{requestOcrForBox:O,handleOcrResponse:z,resetOcrState:U,suggestedLabels:j,showSuggestions:V,isLoading:$,setShowSuggestions:W}=(({sendOcrRequest:t})=>{const[e,n]=(0,r.useState)([]),[i,o]=(0,r.useState)(!1),[a,s]=(0,r.useState)(!1),l=(0,r.useRef)(!1),c=(0,r.useRef)(null),[u,d]=(0,r.useState)(null),h=()=>{l.current=!1,c.current=null,d(null)};return{requestOcrForBox:e=>{l.current||c.current===e||(l.current=!0,c.current=e,s(!0),t(e),d(e))},handleOcrResponse:t=>{t&&0!==t.length&&(n(t),o(!0),s(!1),h())},resetOcrState:h,suggestedLabels:e,showSuggestions:i,isLoading:a,setShowSuggestions:o}})({sendOcrRequest:t=>et({request_ocr:!0,selectedBoxId:t})});(0,r.useEffect)((()=>{if(S){const t=v.find((t=>t.id===S));t&&T(t.label)}}),[S,v]);const G=t=>{T(t.target.value)},H=()=>{null!==S&&_((t=>t.map((t=>t.id===S?{...t,label:C,stroke:"#39FF14"}:t))))},Y=(0,r.useRef)(null);console.log(t.request_ocr,t.ocr_suggestions,Y.current),(0,r.useEffect)((()=>{!0===t.request_ocr&&t.ocr_suggestions&&t.ocr_suggestions.length>0&&JSON.stringify(t.ocr_suggestions)!==JSON.stringify(Y.current)&&(Y.current=t.ocr_suggestions,z(t.ocr_suggestions),et({request_ocr:!1}),console.log("request_ocr 변했나??",t.request_ocr))}),[t.ocr_suggestions,t.ocr_suggestions]),(0,r.useEffect)((()=>{const t=t=>{if("streamlit:render"===t.data.type)try{const e=t.data.args;VC([e,"optionalAccess",t=>t.ocr_suggestions])&&Array.isArray(e.ocr_suggestions)&&z(e.ocr_suggestions)}catch(t){console.error("Error handling OCR suggestions from message:",t)}};return window.addEventListener("message",t),()=>window.removeEventListener("message",t)}),[]),(0,r.useEffect)((()=>{!1!==t.request_ocr&&void 0!==t.request_ocr||U()}),[t.request_ocr]);const q=UC()((()=>{if(n[1]>0){const t=n[1]*tt.current;sa.setFrameHeight((h?Math.min(t,h):t)+100)}}),100);(0,r.useEffect)((()=>((()=>{if(1===M&&n[0]>0){const t=.8*window.innerWidth/n[0];D(Math.min(t,1))}})(),q(),window.addEventListener("resize",q),()=>{window.removeEventListener("resize",q)})),[n,M]);const K=(0,r.useRef)(E),X=(0,r.useRef)(S),Q=(0,r.useRef)(s),Z=(0,r.useRef)(I),J=(0,r.useRef)(v),tt=(0,r.useRef)(M);(0,r.useEffect)((()=>{K.current=E}),[E]),(0,r.useEffect)((()=>{X.current=S}),[S]),(0,r.useEffect)((()=>{Q.current=s}),[s]),(0,r.useEffect)((()=>{Z.current=I}),[I]),(0,r.useEffect)((()=>{J.current=v}),[v]),(0,r.useEffect)((()=>{tt.current=M}),[M]);const et=(t={})=>{rt.current.cancel();const e=((t={})=>{const e=jC(t.mode,(()=>K.current)),n=jC(t.selectedBoxId,(()=>X.current)),r=J.current,i=tt.current,o=r.find((t=>t.id===n)),a={mode:e,ops:WC(w.current,r),base_version:x.current,event_id:qC(),scale:i,save_requested:jC(t.save_requested,(()=>!1)),request_ocr:jC(t.request_ocr,(()=>!1))};return o&&(a.selected_box_id=o.id,a.selected_box_coords=[o.x,o.y,o.width,o.height]),a})(t);e.ops.length>0&&(w.current=GC(J.current),x.current+=1),sa.setComponentValue(e)},nt=()=>{rt.current.cancel(),WC(w.current,J.current).length>0&&et()},rt=(0,r.useRef)(UC()((()=>nt()),Math.max(c,0))),it=(0,r.useRef)([]),ot=(0,r.useRef)(v),at=(0,r.useRef)(!1),st=(0,r.useRef)(0);(0,r.useEffect)((()=>{const t=ot.current;if(ot.current=v,t!==v){if(at.current)at.current=!1;else{const e=Date.now();e-st.current>300&&(it.current.push(t),it.current.length>100&&it.current.shift()),st.current=e}c>0&&rt.current()}}),[v]),(0,r.useEffect)((()=>{const t=()=>nt(),e=()=>{"hidden"===document.visibilityState&&nt()};return document.documentElement.addEventListener("mouseleave",t),window.addEventListener("blur",t),window.addEventListener("pagehide",t),document.addEventListener("visibilitychange",e),()=>{rt.current.cancel(),document.documentElement.removeEventListener("mouseleave",t),window.removeEventListener("blur",t),window.removeEventListener("pagehide",t),document.removeEventListener("visibilitychange",e)}}),[]),(0,r.useEffect)((()=>{if(!t.request_full_sync)return;const e=J.current;var n;sa.setComponentValue({mode:K.current,full_sync:!0,bboxes:(n=e,n.map((t=>({box_id:t.id,bbox:[t.x,t.y,t.width,t.height],label:t.label||""})))),base_version:x.current,event_id:qC(),scale:tt.current,save_requested:!1,request_ocr:!1}),w.current=GC(e),x.current+=1}),[t.request_full_sync]),(0,r.useEffect)((()=>{const t=t=>{K.current;const e=X.current,n=Q.current,r=Z.current,i=(J.current,"INPUT"===VC([t.target,"optionalAccess",t=>t.tagName]));n&&"Space"===t.code&&!i&&nt(),t.ctrlKey&&"KeyE"===t.code&&(t.preventDefault(),P("Edit")),t.ctrlKey&&"KeyD"===t.code&&(t.preventDefault(),P("Draw")),!t.ctrlKey&&!t.metaKey||"KeyZ"!==t.code||i||(t.preventDefault(),(()=>{const t=it.current.pop();t&&(at.current=!0,_(t),k(null),A(!1))})()),t.ctrlKey&&"KeyL"===t.code&&(t.preventDefault(),e&&(A(!0),W(!0))),t.ctrlKey&&"KeyM"===t.code&&(t.preventDefault(),e&&O(e)),t.ctrlKey&&"KeyR"===t.code&&(t.preventDefault(),L((t=>!t))),t.ctrlKey&&"KeyS"===t.code&&(t.preventDefault(),R(!0),setTimeout((()=>{R(!1)}),3e3),et({save_requested:!0})),"Delete"===t.code&&e&&(t.preventDefault(),_((t=>t.filter((t=>t.id!==e)))),k(null),A(!1)),"Escape"===t.code&&(t.preventDefault(),(r||e)&&(A(!1),k(null)))};return window.addEventListener("keydown",t),()=>{window.removeEventListener("keydown",t)}}),[]),(0,r.useEffect)((()=>{const t=UC()((t=>{D(t)}),50),e=e=>{if(e.ctrlKey&&VC([N,"access",t=>t.current,"optionalAccess",t=>t.contains,"call",t=>t(e.target)])){e.preventDefault();let n=d?tt.current*(e.deltaY<0?1.1:1/1.1):tt.current+(e.deltaY<0?.1:-.1);n=Math.min(Math.max(n,g),3),t(n)}};return window.addEventListener("wheel",e,{passive:!1}),()=>{window.removeEventListener("wheel",e)}}),[]);const lt=t=>{P(t)};return r.createElement(kS,{theme:$C},r.createElement(PS,{spacing:4,align:"stretch"},F&&r.createElement(IS,{p:3,bg:"green.100",color:"green.800",borderRadius:"md",position:"fixed",top:"20px",left:"50%",transform:"translateX(-50%)",zIndex:100,boxShadow:"md"},r.createElement(AS,{fontWeight:"bold"},"💾 어노테이션 저장 요청이 전송되었습니다!")),r.createElement(IS,{p:3,bg:"gray.200",borderRadius:"md",position:"sticky",top:0,zIndex:10,borderWidth:"1px",boxShadow:"sm"},r.createElement(MS,{justifyContent:"space-between",alignItems:"center"},r.createElement(DS,{spacing:4},r.createElement(IS,null,r.createElement(AS,{fontSize:"sm",mb:1,color:"black"},"Class"),r.createElement(WS,{value:C,onChange:G,onBlur:H,onKeyDown:t=>{"Enter"===t.key&&H()},placeholder:"Enter label",size:"sm",width:"200px",bg:"white",borderColor:"gray.200"}))),r.createElement(DS,null,r.createElement(AS,{fontSize:"sm",mr:2,color:"black"},"Zoom: ",(t=>`${Math.round(100*t)}%`)(M)),r.createElement(KS,{size:"sm",colorScheme:"teal",variant:B?"solid":"outline",onClick:()=>L((t=>!t))},B?"Hide Labels":"Show Labels"),r.createElement(KS,{size:"sm",colorScheme:"green",variant:"Draw"===E?"solid":"outline",onClick:()=>lt("Draw")},"Draw"),r.createElement(KS,{size:"sm",colorScheme:"blue",variant:"Edit"===E?"solid":"outline",onClick:()=>lt("Edit")},"Edit"),r.createElement(KS,{size:"sm",colorScheme:"purple",onClick:()=>{R(!0),setTimeout((()=>R(!1)),3e3),et({save_requested:!0})}},"Save"))),r.createElement(MS,{mt:2,justifyContent:"space-between",alignItems:"center"},r.createElement(AS,{fontSize:"xs",color:"black"},"Selected Items: ",v.length))),r.createElement(IS,{ref:N},r.createElement(QS,null,r.createElement(OC,{rectangles:v,mode:E,selectedId:S,scale:M,setSelectedId:k,setRectangles:_,setLabel:T,color_map:o,label:C,image:b,image_size:n,strokeWidth:a,isLabelEditMode:I,setIsLabelEditMode:A,handleLabelInputChange:G,showLabels:B,suggestedLabels:j,showSuggestions:V,setShowSuggestions:W,handleSuggestionSelect:t=>{T(t),null!==S&&_((e=>e.map((e=>e.id===S?{...e,label:t,stroke:"#39FF14"}:e)))),W(!1)},isLoadingLabels:$,tiles:d,viewport:f})))))},XC=(ua(KC),{assigned:{label:"할당",color:"green"},unassigned:{label:"미할당",color:"red"},review:{label:"검토",color:"orange"},confirmed:{label:"확정",color:"blue"}}),QC={queued:{label:"감지 대기",color:"gray"},done:{label:"자동 감지됨",color:"teal"},failed:{label:"감지 실패",color:"crimson"}},ZC=({args:t})=>{const{items:e,page_offset:n,page_size:i,total:o,selected_count:a,list_key:s,data_key:l,columns:c,height:u}=t,d=(0,r.useRef)(new Map),h=(0,r.useRef)(null),f=(0,r.useRef)(null),p=(0,r.useRef)(null),g=(0,r.useRef)(new Map),m=(0,r.useRef)(!1),y=(0,r.useRef)(null),b=(0,r.useRef)(new Map),v=(0,r.useRef)(null),[_,w]=(0,r.useState)(0),[x,S]=(0,r.useState)(0),[,k]=(0,r.useState)(0),C=()=>k((t=>t+1));h.current!==s&&(h.current=s,f.current=l,d.current=new Map,p.current=null,g.current=new Map,m.current=!1,y.current=null,b.current=new Map),f.current!==l&&(f.current=l,d.current=new Map,y.current=null,b.current=new Map,m.current||(p.current=null,g.current=new Map));for(let t=0;t<e.length;t+=i)d.current.set(n+t,e.slice(t,t+i));y.current===n&&(y.current=null),(0,r.useEffect)((()=>{sa.setFrameHeight(u)}),[u]),(0,r.useEffect)((()=>{if(!v.current)return;const t=v.current;S(t.clientWidth);const e=new ResizeObserver((()=>S(t.clientWidth)));return e.observe(t),()=>e.disconnect()}),[]);const T=t=>{m.current=!1,sa.setComponentValue({list_key:h.current,requested_offset:t,select_all:p.current,overrides:Object.fromEntries(g.current),version:Date.now()})},E=(0,r.useRef)(UC()((()=>T(null)),800)).current;(0,r.useEffect)((()=>()=>E.cancel()),[]);const P=t=>{const e=g.current.get(t.id);return void 0!==e?e:null!==p.current?p.current:t.selected},I=t=>{for(const e of Array.from(d.current.values())){const n=e.find((e=>e.id===t));if(n)return n}},A=t=>{g.current.set(t.id,!P(t)),m.current=!0,C(),E()},M=(()=>{if(!m.current)return a;const t=Array.from(g.current.entries());if(null!==p.current){const e=t.filter((([,t])=>t!==p.current)).length;return p.current?o-e:e}let e=a;for(const[n,r]of t){const t=I(n);t&&t.selected!==r&&(e+=r?1:-1)}return Math.min(Math.max(e,0),o)})(),D=o>0&&M===o,F=u-40,R=x>0?(x-12*(c-1))/c:200,B=3*R/4+130+12,L=Math.ceil(o/c),N=Math.max(Math.floor(_/B)-2,0),O=Math.min(Math.ceil((_+F)/B)+2,L),z=N*c,U=Math.min(O*c,o),j=t=>Math.floor(t/i)*i;(0,r.useEffect)((()=>{if(null!==y.current||0===o)return;const t=[];for(let e=j(z);e<U;e+=i)t.push(e);const e=j(Math.max(U-1,0))+i;for(let n=0;n<1;n++)t.push(e+n*i);t.push(j(z)-i);for(const e of t)if(e>=0&&e<o&&!d.current.has(e))return y.current=e,E.cancel(),void T(e)})),(0,r.useEffect)((()=>{const t=[];for(let e=j(z);e<U;e+=i){const n=d.current.get(e);n&&n.some((t=>!t.url))&&(b.current.get(e)||0)<5&&t.push(e)}if(0===t.length)return;const e=setTimeout((()=>{if(null!==y.current)return;const e=t[0];b.current.set(e,(b.current.get(e)||0)+1),y.current=e,E.cancel(),T(e)}),1500);return()=>clearTimeout(e)}));const V=[];for(let t=z;t<U;t++){const e={position:"absolute",top:Math.floor(t/c)*B+"px",left:t%c*(R+12)+"px",width:`${R}px`,height:B-12+"px",boxSizing:"border-box",overflow:"hidden"},n=d.current.get(j(t)),i=n?n[t-j(t)]:void 0;if(!i){V.push(r.createElement("div",{key:`placeholder-${t}`,style:{...e,padding:"6px"}},r.createElement("div",{style:{width:"100%",aspectRatio:"4 / 3",background:"#f0f0f0",borderRadius:"4px"}})));continue}const o=XC[i.status||""]||{label:"메타데이터 없음",color:"gray"},a=i.prelabel?QC[i.prelabel]:void 0,s=P(i);V.push(r.createElement("div",{key:i.id,onClick:()=>A(i),style:{...e,cursor:"pointer",padding:"6px",borderRadius:"6px",border:s?"2px solid #3182CE":"2px solid transparent",background:s?"#ebf4ff":"white"}},r.createElement("div",{style:{width:"100%",aspectRatio:"4 / 3",background:"#f0f0f0",borderRadius:"4px",overflow:"hidden"}},i.url&&r.createElement("img",{src:i.url,alt:i.filename,decoding:"async",style:{width:"100%",height:"100%",objectFit:"cover"}})),r.createElement("div",{style:{marginTop:"4px",whiteSpace:"nowrap",overflow:"hidden",textOverflow:"ellipsis"},title:i.filename},r.createElement("input",{type:"checkbox",checked:s,readOnly:!0})," ",i.filename),r.createElement("span",{style:{backgroundColor:o.color,padding:"2px 6px",borderRadius:"3px",color:"white"}},o.label),a&&r.createElement("span",{style:{backgroundColor:a.color,padding:"2px 6px",borderRadius:"3px",color:"white",marginLeft:"4px"}},a.label),i.assigned_by&&r.createElement("div",null,"할당된 사용자: ",i.assigned_by),i.created_by&&r.createElement("div",null,"업로드한 사용자: ",i.created_by),i.created_at&&r.createElement("div",null,"업로드 시간: ",i.created_at)))}return r.createElement("div",{style:{fontFamily:"sans-serif",fontSize:"13px"}},r.createElement("div",{style:{display:"flex",justifyContent:"space-between",alignItems:"center",marginBottom:"8px"}},r.createElement("label",{style:{cursor:"pointer"}},r.createElement("input",{type:"checkbox",checked:D,onChange:()=>{p.current=!D,g.current=new Map,m.current=!0,C(),E()}})," ","모두 선택"),r.createElement("span",null,"선택 ",M,"개 / 총 ",o,"개 이미지")),r.createElement("div",{ref:v,onScroll:t=>w(t.currentTarget.scrollTop),style:{height:`${F}px`,overflowY:"auto"}},r.createElement("div",{style:{position:"relative",height:L*B+"px"}},V)))},JC=ua((t=>"image_grid"===t.args.component?r.createElement(ZC,{...t}):r.createElement(KC,{...t}))),tT=document.getElementById("root");if(!tT)throw new Error("Failed to find the root element");(0,a.H)(tT).render(r.createElement(r.StrictMode,null,r.createElement(JC,null)))})()})();
+//# sourceMappingURL=main.c3715ea4.js.map
\ No newline at end of file
@@ -20,6 +20,8 @@ export interface BBoxProps {
   scale: number;
   strokeWidth: number;
   mode?: string;
+  // 마운트 직후 바로 드래그를 시작할지 (박스를 눌러 선택한 경우)
+  shouldStartDrag?: () => boolean;
 }
 
 const BBox: React.FC<BBoxProps> = ({
@@ -30,6 +32,7 @@ const BBox: React.FC<BBoxProps> = ({
   scale,
   strokeWidth,
   mode = "Edit",
+  shouldStartDrag,
 }) => {
   // Ref 타입을 Konva.Rect와 Konva.Transformer로 명확히 지정
   const shapeRef = useRef<Konva.Rect | null>(null);
@@ -80,6 +83,13 @@ const BBox: React.FC<BBoxProps> = ({
   // Edit 모드일 때만 드래그 가능하도록 설정
   const isDraggable = mode === "Edit";
 
+  // 선택과 동시에 누르고 있던 포인터로 드래그를 이어감
+  useEffect(() => {
+    if (isDraggable && shapeRef.current && shouldStartDrag?.()) {
+      shapeRef.current.startDrag();
+    }
+  }, []);
+
   return (
     <>
       <Rect
@@ -1,9 +1,20 @@
-import React, { useState, useEffect } from "react";
-import { Layer, Rect, Stage, Image, Group, Text, Label, Tag } from 'react-konva';
+import React, { useState, useEffect, useMemo, useRef } from "react";
+import { Layer, Rect, Stage, Image, Group, Text, Label, Tag, Shape } from 'react-konva';
 import Konva from 'konva';
 import BBox, { RectProps } from './BBox';
+import { GridIndex } from './spatialIndex';
+import TileLayer, { TilePyramid } from './TileLayer';
 import { Input, Box } from '@chakra-ui/react';
 
+// 히트 테스트 여유 (화면 픽셀)
+const HIT_TOLERANCE_PX = 4;
+// 공간 인덱스 셀 크기: 긴 변을 약 32칸으로 나누되 너무 작아지지 않게
+const indexCellSize = (image_size: number[]) => Math.max(64, Math.max(image_size[0], image_size[1]) / 32);
+
+// 새 박스 ID (Python 쪽 변경 연산이 ID로 박스를 찾으므로 재사용되면 안 됨)
+let boxIdCounter = 0;
+const createBoxId = () => `bbox-${Date.now().toString(36)}-${(boxIdCounter++).toString(36)}`;
+
 interface Rectangle extends RectProps {
   // RectProps already contains x, y, width, height, id, stroke, label
 }
@@ -31,6 +42,8 @@ interface BBoxCanvasLayerProps {
   setShowSuggestions?: React.Dispatch<React.SetStateAction<boolean>>;
   handleSuggestionSelect?: (label: string) => void;
   isLoadingLabels?: boolean; // 로딩 상태 추가
+  tiles?: TilePyramid | null; // 대형 스캔용 타일 피라미드 (좌표는 원본 픽셀)
+  viewport?: number[] | null; // 스테이지 최대 크기 (없으면 이미지 전체 크기)
 }
 
 const BBoxCanvas = (props: BBoxCanvasLayerProps) => {
@@ -56,13 +69,40 @@ const BBoxCanvas = (props: BBoxCanvasLayerProps) => {
     setShowSuggestions = () => {},
     handleSuggestionSelect = () => {},
     isLoadingLabels = false, // 로딩 상태 prop 추출
+    tiles = null,
+    viewport = null,
   } = props;
 
+  // 타일 모드에서는 이미지 전체 대신 뷰포트 크기의 스테이지만 만들고 이동/확대로 탐색
+  const stageWidth = viewport ? Math.min(image_size[0] * scale, viewport[0]) : image_size[0] * scale;
+  const stageHeight = viewport ? Math.min(image_size[1] * scale, viewport[1]) : image_size[1] * scale;
+
   const [adding, setAdding] = useState<number[] | null>(null);
   const [position, setPosition] = useState({ x: 0, y: 0 });
   const [isDragging, setIsDragging] = useState(false);
   const [dragStart, setDragStart] = useState<{ x: number, y: number } | null>(null);
   
+  // 선택되지 않은 박스는 React 노드 없이 한 Shape에서 그리고, 히트 테스트는 공간 인덱스로 처리
+  const spatialIndex = useMemo(
+    () => new GridIndex(rectangles, indexCellSize(image_size)),
+    [rectangles, image_size[0], image_size[1]]
+  );
+
+  // 현재 보이는 영역(이미지 좌표)에 걸친 박스만 그림 (선택 박스는 별도 레이어)
+  const visibleRectangles = useMemo(() => {
+    const viewX = -position.x / scale;
+    const viewY = -position.y / scale;
+    return spatialIndex
+      .query(viewX, viewY, stageWidth / scale, stageHeight / scale)
+      .filter((rect) => rect.id !== selectedId);
+  }, [spatialIndex, position.x, position.y, scale, selectedId, stageWidth, stageHeight]);
+
+  const selectedRect = selectedId ? rectangles.find((rect) => rect.id === selectedId) : undefined;
+
+  // 박스를 누른 채로 선택한 경우 선택 직후 바로 드래그를 이어가기 위한 상태
+  const pointerDownRef = useRef(false);
+  const dragOnSelectRef = useRef<string | null>(null);
+
   // 라벨 입력 위치 상태 추가
   const [labelPosition, setLabelPosition] = useState({ x: 0, y: 0 });
   // 라벨 입력 상자의 참조
@@ -93,9 +133,6 @@ const BBoxCanvas = (props: BBoxCanvasLayerProps) => {
   }, [selectedId, rectangles, scale, position]);
 
   const checkDeselect = (e: any) => {
-    // 먼저 대상이 Rect인지 확인
-    const isClickOnRect = e.target instanceof Konva.Rect;
-    
     // 커서 위치 가져오기
     const stage = e.target.getStage();
     if (!stage) return;
@@ -103,13 +140,31 @@ const BBoxCanvas = (props: BBoxCanvasLayerProps) => {
     const pointer = stage.getPointerPosition();
     if (!pointer) return;
 
+    pointerDownRef.current = true;
+
+    // 선택된 박스와 변형 핸들만 Konva 히트 대상 (나머지 레이어는 listening=false)
+    if (e.target !== stage) return;
+
+    // 그 외 박스는 공간 인덱스로 히트 테스트
+    const hit = spatialIndex.hitTest(
+      (pointer.x - position.x) / scale,
+      (pointer.y - position.y) / scale,
+      HIT_TOLERANCE_PX / scale
+    );
+    if (hit) {
+      dragOnSelectRef.current = mode === 'Edit' ? hit.id : null;
+      setSelectedId(hit.id);
+      setLabel(hit.label);
+      return;
+    }
+
     // Edit 모드에서 Rect가 선택되지 않았을 때 캔버스 드래깅 시작
-    if (mode === 'Edit' && !isClickOnRect) {
+    if (mode === 'Edit') {
       setIsDragging(true);
       setDragStart({ x: pointer.x, y: pointer.y });
     }
     // Draw 모드에서 바운딩 박스 그리기 시작
-    else if (mode === 'Draw' && !isClickOnRect) {
+    else if (mode === 'Draw') {
       if (selectedId === null) {
         setAdding([
           (pointer.x - position.x) / scale, 
@@ -125,7 +180,7 @@ const BBoxCanvas = (props: BBoxCanvasLayerProps) => {
       }
     }
     // Rect를 클릭하지 않았고 다른 모드일 경우 선택 해제
-    else if (!isClickOnRect) {
+    else {
       setSelectedId(null);
       setIsLabelEditMode(false);
     }
@@ -175,8 +230,8 @@ const BBoxCanvas = (props: BBoxCanvasLayerProps) => {
       ref={stageContainerRef} 
       style={{ 
         position: 'relative',
-        width: `${image_size[0] * scale}px`,
-        height: `${image_size[1] * scale}px`,
+        width: `${stageWidth}px`,
+        height: `${stageHeight}px`,
         overflow: 'hidden', // 중요: 영역을 넘어가는 부분은 숨김
         border: '2px solid #3182CE', // 파란색 테두리 추가
         borderRadius: '4px',         // 테두리 모서리 둥글게
@@ -185,8 +240,8 @@ const BBoxCanvas = (props: BBoxCanvasLayerProps) => {
       }}
     >
       <Stage
-        width={image_size[0] * scale}
-        height={image_size[1] * scale}
+        width={stageWidth}
+        height={stageHeight}
         // 마우스 클릭 시 이벤트
         onMouseDown={checkDeselect}
         // 마우스 이동 시 이벤트
@@ -218,11 +273,13 @@ const BBoxCanvas = (props: BBoxCanvasLayerProps) => {
         }}
         // 마우스 클릭 해제 시 이벤트
         onMouseUp={() => {
+          pointerDownRef.current = false;
+          dragOnSelectRef.current = null;
           // Draw 모드에서 바운딩 박스 그리기 완료
           if (adding !== null && mode === 'Draw') {
             // 최소 크기 이상인 경우에만 박스 생성 (작은 실수 클릭 방지)
             if (Math.abs(adding[2] - adding[0]) > 5 && Math.abs(adding[3] - adding[1]) > 5) {
-              const newId = `bbox-${rectangles.length}`; // 순차적 ID 생성
+              const newId = createBoxId(); // 삭제 후에도 겹치지 않는 고유 ID
               setLabel("");  // 라벨 상태 초기화
               setRectangles((prev) => [
                 ...prev,
@@ -249,7 +306,7 @@ const BBoxCanvas = (props: BBoxCanvasLayerProps) => {
         }}
       >
         {/* Layer 추가: 이미지 영역 표시를 위한 배경 레이어 */}
-        <Layer x={position.x} y={position.y}>
+        <Layer x={position.x} y={position.y} listening={false}>
           <Rect 
             x={0}
             y={0}
@@ -261,31 +318,85 @@ const BBoxCanvas = (props: BBoxCanvasLayerProps) => {
           />
         </Layer>
         {/* 기존 이미지 레이어 */}
-        <Layer x={position.x} y={position.y}>
-          <Image image={image || undefined} scaleX={scale} scaleY={scale} />
+        <Layer x={position.x} y={position.y} listening={false}>
+          <Image image={image || undefined} width={image_size[0] * scale} height={image_size[1] * scale} />
+          {tiles && (
+            <TileLayer tiles={tiles} scale={scale} position={position} viewport={[stageWidth, stageHeight]} />
+          )}
         </Layer>
+        {/* 선택되지 않은 박스: 보이는 것만 색상별로 묶어 한 번에 그림 */}
+        <Layer x={position.x} y={position.y} listening={false}>
+          <Shape
+            perfectDrawEnabled={false}
+            sceneFunc={(context) => {
+              const ctx = (context as any)._context as CanvasRenderingContext2D;
+              const byColor = new Map<string, Rectangle[]>();
+              visibleRectangles.forEach((rect) => {
+                const group = byColor.get(rect.stroke);
+                if (group) {
+                  group.push(rect);
+                } else {
+                  byColor.set(rect.stroke, [rect]);
+                }
+              });
+
+              ctx.save();
+              ctx.lineWidth = strokeWidth;
+              ctx.setLineDash([5, 5]);
+              byColor.forEach((group, color) => {
+                ctx.strokeStyle = color;
+                ctx.beginPath();
+                group.forEach((rect) => {
+                  ctx.rect(rect.x * scale, rect.y * scale, rect.width * scale, rect.height * scale);
+                });
+                ctx.stroke();
+              });
+
+              if (showLabels) {
+                ctx.setLineDash([]);
+                ctx.font = "25px Arial";
+                ctx.textBaseline = "top";
+                visibleRectangles.forEach((rect) => {
+                  const text = rect.label || "unlabeled";
+                  const textWidth = ctx.measureText(text).width;
+                  const x = rect.x * scale;
+                  const y = rect.y * scale - 20 - 31;
+                  ctx.globalAlpha = 0.8;
+                  ctx.fillStyle = "#2F4F4F";
+                  ctx.fillRect(x, y, textWidth + 6, 31);
+                  ctx.fillStyle = "white";
+                  ctx.fillText(text, x + 3, y + 3);
+                });
+              }
+              ctx.restore();
+            }}
+          />
+        </Layer>
+        {/* 선택된 박스만 Konva 노드로 그려 드래그/리사이즈 처리 */}
         <Layer x={position.x} y={position.y}>
-          {rectangles.map((rect) => (
-            <Group key={rect.id}>
+          {selectedRect && (
+            <Group key={selectedRect.id}>
               <BBox
-                rectProps={rect}
+                rectProps={selectedRect}
                 scale={scale}
                 strokeWidth={strokeWidth}
-                isSelected={rect.id === selectedId}
+                isSelected={true}
                 onClick={() => {
-                  setSelectedId(rect.id);
-                  setLabel(rect.label);
+                  setSelectedId(selectedRect.id);
+                  setLabel(selectedRect.label);
                 }}
                 mode={mode}
                 onChange={(newAttrs) => {
                   setRectangles((prev) => prev.map((r) => (r.id === newAttrs.id ? newAttrs : r)));
                 }}
+                shouldStartDrag={() => pointerDownRef.current && dragOnSelectRef.current === selectedRect.id}
               />
               {showLabels && (
                 <Label
-                  x={rect.x * scale}
-                  y={rect.y * scale - 20}
+                  x={selectedRect.x * scale}
+                  y={selectedRect.y * scale - 20}
                   opacity={0.8}
+                  listening={false}
                 >
                   <Tag
                     fill="#2F4F4F"
@@ -296,7 +407,7 @@ const BBoxCanvas = (props: BBoxCanvasLayerProps) => {
                     lineJoin="round"
                   />
                   <Text
-                    text={rect.label || "unlabeled"}
+                    text={selectedRect.label || "unlabeled"}
                     padding={3}
                     fontFamily="Arial"
                     fontSize={25}
@@ -305,7 +416,7 @@ const BBoxCanvas = (props: BBoxCanvasLayerProps) => {
                 </Label>
               )}
             </Group>
-          ))}
+          )}
           {adding && (
             <Rect
               fill="#39FF144D"
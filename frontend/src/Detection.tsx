@@ -8,6 +8,7 @@ import { ChakraProvider, Input, Box, HStack, VStack, Center, Button, Text, Flex
 import { extendTheme } from '@chakra-ui/react';
 import useImage from 'use-image';
 import BBoxCanvas from "./BBoxCanvas";
+import { TilePyramid } from "./TileLayer";
 import { useOcrManager } from "./useOcrManager"; // OCR 훅
 import debounce from 'lodash/debounce'; // 🔄 줌 최적화를 위한 debounce 추가
 
@@ -29,7 +30,13 @@ export interface PythonArgs {
   line_width: number,
   use_space: boolean,
   ocr_suggestions: string[],
-  request_ocr?: boolean
+  request_ocr?: boolean,
+  version: number,
+  request_full_sync?: number | boolean,   // 재동기화 요청 nonce (0/false면 요청 없음)
+  idle_sync_ms?: number,
+  prefetch_urls?: string[],
+  tiles?: TilePyramid | null,
+  viewport_height?: number | null
 }
 
 // BBox 타입 정의
@@ -51,6 +58,65 @@ const formatBBoxes = (rects: Rectangle[]) =>
     label: rect.label || "",
   }));
 
+// 변경 연산 (Python의 apply_annotation_ops가 적용)
+type BoxOp =
+  | { op: "add", id: string, bbox: number[], label: string }
+  | { op: "move", id: string, bbox: number[] }
+  | { op: "relabel", id: string, label: string }
+  | { op: "delete", id: string };
+
+// 마지막으로 보낸 스냅샷과 현재 박스를 비교해 변경 연산 목록 생성
+const diffBBoxes = (synced: Map<string, Rectangle>, current: Rectangle[]): BoxOp[] => {
+  const ops: BoxOp[] = [];
+  const seen = new Set<string>();
+  for (const rect of current) {
+    seen.add(rect.id);
+    const bbox = [rect.x, rect.y, rect.width, rect.height];
+    const prev = synced.get(rect.id);
+    if (!prev) {
+      ops.push({ op: "add", id: rect.id, bbox, label: rect.label || "" });
+      continue;
+    }
+    if (prev.x !== rect.x || prev.y !== rect.y || prev.width !== rect.width || prev.height !== rect.height) {
+      ops.push({ op: "move", id: rect.id, bbox });
+    }
+    if ((prev.label || "") !== (rect.label || "")) {
+      ops.push({ op: "relabel", id: rect.id, label: rect.label || "" });
+    }
+  }
+  synced.forEach((_, id) => {
+    if (!seen.has(id)) ops.push({ op: "delete", id });
+  });
+  return ops;
+};
+
+const snapshot = (rects: Rectangle[]) => new Map(rects.map((rect) => [rect.id, rect]));
+
+// 로컬 실행 취소 설정
+const UNDO_LIMIT = 100;
+const UNDO_COALESCE_MS = 300; // 드래그처럼 연속된 변경은 하나로 묶음
+
+// 미리 받은 이웃 이미지 (참조를 유지해야 요청이 취소되지 않음, URL 기준 중복 제거)
+const PREFETCH_KEEP = 16;
+const prefetchedImages = new Map<string, HTMLImageElement>();
+
+const prefetchImages = (urls: string[]) => {
+  urls.forEach((url) => {
+    if (prefetchedImages.has(url)) return;
+    const img = new window.Image();
+    img.decoding = "async";
+    img.src = url;
+    prefetchedImages.set(url, img);
+  });
+  while (prefetchedImages.size > PREFETCH_KEEP) {
+    const oldest = prefetchedImages.keys().next().value as string;
+    prefetchedImages.delete(oldest);
+  }
+};
+
+let eventCounter = 0;
+const nextEventId = () => `${Date.now()}-${eventCounter++}`;
+
 // 컴포넌트 본체
 const Detection = ({ args }: ComponentProps) => {
   const {
@@ -60,12 +126,30 @@ const Detection = ({ args }: ComponentProps) => {
     color_map,
     line_width,
     use_space,
-    ocr_suggestions
+    ocr_suggestions,
+    idle_sync_ms = 5000,
+    prefetch_urls = [],
+    tiles = null,
+    viewport_height = null
   }: PythonArgs = args
 
+  // 타일 모드: 고정 높이 뷰포트에서 원본 좌표로 확대/이동
+  const viewport = tiles && viewport_height ? [window.innerWidth * 0.95, viewport_height] : null;
+  const fitScale = image_size[0] > 0 ? window.innerWidth * 0.8 / image_size[0] : 1.0;
+  const minScale = Math.min(0.5, fitScale);
+
   const params = new URLSearchParams(window.location.search);
   const baseUrl = params.get('streamlitUrl');
-  const [image] = useImage(baseUrl + image_url);
+  // 절대 URL(MinIO presigned URL)은 그대로, 상대 경로는 Streamlit 미디어 파일로 처리
+  const isAbsoluteUrl = /^https?:\/\//.test(image_url);
+  const [image] = useImage(isAbsoluteUrl ? image_url : baseUrl + image_url);
+
+  // 현재 이미지가 로드된 뒤에 다음/이전 이미지를 미리 받아 이동 시 바로 그려지게 함
+  useEffect(() => {
+    if (image && prefetch_urls.length > 0) {
+      prefetchImages(prefetch_urls);
+    }
+  }, [image, JSON.stringify(prefetch_urls)]);
 
   const [rectangles, setRectangles] = useState<Rectangle[]>(
     bbox_info.map((bb, i) => ({
@@ -75,10 +159,14 @@ const Detection = ({ args }: ComponentProps) => {
       height: bb.bbox[3],
       label: bb.label,
       stroke: "#39FF14",
-      id: 'bbox-' + i
+      id: bb.box_id ?? 'bbox-' + i
     }))
   );
 
+  // Python과 마지막으로 동기화된 박스 상태와 그 버전
+  const syncedRef = useRef<Map<string, Rectangle>>(snapshot(rectangles));
+  const versionRef = useRef<number>(args.version ?? 0);
+
   const [selectedId, setSelectedId] = useState<string | null>(null);
   const [label, setLabel] = useState("");
   const [mode, setMode] = useState<string>('Draw');
@@ -97,7 +185,9 @@ const Detection = ({ args }: ComponentProps) => {
     showSuggestions,
     isLoading: isLoadingLabels,
     setShowSuggestions
-  } = useOcrManager({ rectangles, scale, mode });
+  } = useOcrManager({
+    sendOcrRequest: (boxId: string) => sendToStreamlit({ request_ocr: true, selectedBoxId: boxId })
+  });
 
   useEffect(() => {
     if (selectedId) {
@@ -166,7 +256,8 @@ const Detection = ({ args }: ComponentProps) => {
   // 🔄 줌 최적화를 위한 debounce 설정
   const debouncedUpdateFrameHeight = debounce(() => {
     if (image_size[1] > 0) {
-      Streamlit.setFrameHeight(image_size[1] * scaleRef.current + 100);
+      const canvasHeight = image_size[1] * scaleRef.current;
+      Streamlit.setFrameHeight((viewport_height ? Math.min(canvasHeight, viewport_height) : canvasHeight) + 100);
     }
   }, 100); // ← 100ms 안에 1번만 실행
   
@@ -213,9 +304,12 @@ const Detection = ({ args }: ComponentProps) => {
 
     const selectedBox = currentRectangles.find(box => box.id === selectedBoxId);
 
+    // 전체 목록 대신 마지막 동기화 이후의 변경분만 전송
     const payload: any = {
       mode: currentMode,
-      bboxes: formatBBoxes(currentRectangles),
+      ops: diffBBoxes(syncedRef.current, currentRectangles),
+      base_version: versionRef.current,
+      event_id: nextEventId(),
       scale: currentScale,
       save_requested: options.save_requested ?? false,
       request_ocr: options.request_ocr ?? false
@@ -235,10 +329,97 @@ const Detection = ({ args }: ComponentProps) => {
   };
 
   const sendToStreamlit = (options = {}) => {
+    idleSyncRef.current.cancel();
     const payload = buildPayload(options);
+    if (payload.ops.length > 0) {
+      // Python은 base_version이 일치할 때 적용하고 버전을 1 올림
+      syncedRef.current = snapshot(rectanglesRef.current);
+      versionRef.current += 1;
+    }
     Streamlit.setComponentValue(payload);
   };
 
+  // 변경분이 있을 때만 전송 (유휴 타이머, 이미지 이동 전 등)
+  const flushPendingEdits = () => {
+    idleSyncRef.current.cancel();
+    if (diffBBoxes(syncedRef.current, rectanglesRef.current).length > 0) {
+      sendToStreamlit();
+    }
+  };
+
+  const idleSyncRef = useRef(debounce(() => flushPendingEdits(), Math.max(idle_sync_ms, 0)));
+
+  // 로컬 실행 취소 스택 (Python 왕복 없이 처리)
+  const undoStackRef = useRef<Rectangle[][]>([]);
+  const prevRectanglesRef = useRef(rectangles);
+  const undoingRef = useRef(false);
+  const lastUndoPushRef = useRef(0);
+
+  useEffect(() => {
+    const prev = prevRectanglesRef.current;
+    prevRectanglesRef.current = rectangles;
+    if (prev === rectangles) return;
+
+    if (undoingRef.current) {
+      undoingRef.current = false;
+    } else {
+      const now = Date.now();
+      if (now - lastUndoPushRef.current > UNDO_COALESCE_MS) {
+        undoStackRef.current.push(prev);
+        if (undoStackRef.current.length > UNDO_LIMIT) undoStackRef.current.shift();
+      }
+      lastUndoPushRef.current = now;
+    }
+
+    if (idle_sync_ms > 0) {
+      idleSyncRef.current();
+    }
+  }, [rectangles]);
+
+  const undo = () => {
+    const previous = undoStackRef.current.pop();
+    if (!previous) return;
+    undoingRef.current = true;
+    setRectangles(previous);
+    setSelectedId(null);
+    setIsLabelEditMode(false);
+  };
+
+  // 캔버스 밖(이미지 이동 버튼 등)으로 나가거나 탭이 숨겨지기 전에 변경분 전송
+  useEffect(() => {
+    const onLeave = () => flushPendingEdits();
+    const onVisibility = () => { if (document.visibilityState === "hidden") flushPendingEdits(); };
+    document.documentElement.addEventListener("mouseleave", onLeave);
+    window.addEventListener("blur", onLeave);
+    window.addEventListener("pagehide", onLeave);
+    document.addEventListener("visibilitychange", onVisibility);
+    return () => {
+      idleSyncRef.current.cancel();
+      document.documentElement.removeEventListener("mouseleave", onLeave);
+      window.removeEventListener("blur", onLeave);
+      window.removeEventListener("pagehide", onLeave);
+      document.removeEventListener("visibilitychange", onVisibility);
+    };
+  }, []);
+
+  // Python이 버전 불일치로 재동기화를 요청하면 전체 목록을 한 번 전송 (요청마다 nonce가 바뀜)
+  useEffect(() => {
+    if (!args.request_full_sync) return;
+    const currentRectangles = rectanglesRef.current;
+    Streamlit.setComponentValue({
+      mode: modeRef.current,
+      full_sync: true,
+      bboxes: formatBBoxes(currentRectangles),
+      base_version: versionRef.current,
+      event_id: nextEventId(),
+      scale: scaleRef.current,
+      save_requested: false,
+      request_ocr: false
+    });
+    syncedRef.current = snapshot(currentRectangles);
+    versionRef.current += 1;
+  }, [args.request_full_sync]);
+
   useEffect(() => {
     const handleKeyPress = (event: KeyboardEvent) => {
       const mode = modeRef.current;
@@ -247,20 +428,27 @@ const Detection = ({ args }: ComponentProps) => {
       const isLabelEditMode = isLabelEditModeRef.current;
       const rectangles = rectanglesRef.current;
 
-      if (use_space && event.code === "Space") {
-        sendToStreamlit();
+      // 입력창에서는 브라우저 기본 동작(텍스트 실행 취소 등) 유지
+      const isTyping = (event.target as HTMLElement)?.tagName === "INPUT";
+
+      if (use_space && event.code === "Space" && !isTyping) {
+        flushPendingEdits();
       }
 
+      // 모드 전환은 캔버스 로컬 상태만 변경 (rerun 없음)
       if (event.ctrlKey && event.code === "KeyE") {
         event.preventDefault();
         setMode("Edit");
-        sendToStreamlit({ mode: "Edit" });
       }
 
       if (event.ctrlKey && event.code === "KeyD") {
         event.preventDefault();
         setMode("Draw");
-        sendToStreamlit({ mode: "Draw" });
+      }
+
+      if ((event.ctrlKey || event.metaKey) && event.code === "KeyZ" && !isTyping) {
+        event.preventDefault();
+        undo();
       }
 
       if (event.ctrlKey && event.code === "KeyL") {
@@ -323,8 +511,11 @@ const Detection = ({ args }: ComponentProps) => {
     const handleWheel = (event: WheelEvent) => {
       if (event.ctrlKey && canvasWrapperRef.current?.contains(event.target as Node)) {
         event.preventDefault();
-        let newScale = scaleRef.current + (event.deltaY < 0 ? 0.1 : -0.1);
-        newScale = Math.min(Math.max(newScale, 0.5), 3.0);
+        // 타일 모드는 배율 범위가 넓어 곱셈 단위로 확대/축소
+        let newScale = tiles
+          ? scaleRef.current * (event.deltaY < 0 ? 1.1 : 1 / 1.1)
+          : scaleRef.current + (event.deltaY < 0 ? 0.1 : -0.1);
+        newScale = Math.min(Math.max(newScale, minScale), 3.0);
         debouncedSetScale(newScale);
       }
     };
@@ -339,7 +530,6 @@ const Detection = ({ args }: ComponentProps) => {
 
   const handleModeChange = (newMode: string) => {
     setMode(newMode);
-    sendToStreamlit({ mode: newMode });
   };
 
   const handleSuggestionSelect = (suggestedLabel: string) => {
@@ -428,6 +618,8 @@ const Detection = ({ args }: ComponentProps) => {
               setShowSuggestions={setShowSuggestions}
               handleSuggestionSelect={handleSuggestionSelect}
               isLoadingLabels={isLoadingLabels}
+              tiles={tiles}
+              viewport={viewport}
             />
           </Center>
         </Box>
@@ -436,4 +628,5 @@ const Detection = ({ args }: ComponentProps) => {
   );
 };
 
+export { Detection };
 export default withStreamlitConnection(Detection);
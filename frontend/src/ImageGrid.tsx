@@ -0,0 +1,319 @@
+import { Streamlit, ComponentProps } from "streamlit-component-lib"
+import React, { useEffect, useRef, useState } from "react"
+import debounce from 'lodash/debounce';
+
+// Python에서 전달된 이미지 정보
+export interface GridItem {
+  id: string,
+  url: string | null,        // 썸네일 파생 이미지 URL (아직 생성 중이면 null)
+  filename: string,
+  status: string | null,
+  created_by: string | null,
+  assigned_by: string | null,
+  created_at: string | null,
+  prelabel: string | null,   // 일괄 자동 감지 상태 (queued, done, failed)
+  selected: boolean,         // Python 쪽 선택 상태
+}
+
+// Python에서 전달된 파라미터 정의
+export interface GridArgs {
+  items: GridItem[],
+  page_offset: number,
+  page_size: number,
+  total: number,
+  selected_count: number,
+  list_key: string,
+  data_key: string,
+  columns: number,
+  height: number,
+}
+
+const STATUS_BADGES: { [key: string]: { label: string, color: string } } = {
+  assigned: { label: "할당", color: "green" },
+  unassigned: { label: "미할당", color: "red" },
+  review: { label: "검토", color: "orange" },
+  confirmed: { label: "확정", color: "blue" },
+};
+
+const PRELABEL_BADGES: { [key: string]: { label: string, color: string } } = {
+  queued: { label: "감지 대기", color: "gray" },
+  done: { label: "자동 감지됨", color: "teal" },
+  failed: { label: "감지 실패", color: "crimson" },
+};
+
+const GAP = 12;               // 카드 간격 (px)
+const CARD_TEXT_HEIGHT = 130; // 썸네일 아래 파일명/배지/사용자 정보 영역 높이 (px)
+const OVERSCAN_ROWS = 2;      // 보이는 줄 위아래로 미리 그려둘 줄 수
+const THUMBNAIL_RETRY_MS = 1500;  // 썸네일이 생성 중인 페이지를 다시 요청하는 간격
+const THUMBNAIL_MAX_RETRIES = 5;
+const PREFETCH_AHEAD_PAGES = 1;   // 보이는 범위 다음 몇 페이지까지 미리 요청할지 (Python은 요청 페이지 뒤 페이지도 함께 보냄)
+
+const ImageGrid = ({ args }: ComponentProps) => {
+  const { items, page_offset, page_size, total, selected_count, list_key, data_key, columns, height }: GridArgs = args
+
+  // 받은 페이지 (page_offset → 이미지 목록), 누적 선택 변경 내역
+  const pagesRef = useRef<Map<number, GridItem[]>>(new Map());
+  const listKeyRef = useRef<string | null>(null);
+  const dataKeyRef = useRef<string | null>(null);
+  const selectAllRef = useRef<boolean | null>(null);
+  const overridesRef = useRef<Map<string, boolean>>(new Map());
+  const pendingRef = useRef(false);           // 아직 Python이 반영하지 않은 선택 변경이 있는지
+  const inflightRef = useRef<number | null>(null);
+  const retriesRef = useRef<Map<number, number>>(new Map());
+  const scrollRef = useRef<HTMLDivElement>(null);
+
+  const [scrollTop, setScrollTop] = useState(0);
+  const [width, setWidth] = useState(0);
+  const [, setRevision] = useState(0);
+  const redraw = () => setRevision((r) => r + 1);
+
+  // 프로젝트/필터가 바뀌면 이전 페이지와 선택 변경 내역을 모두 버리고 Python 상태를 기준으로 다시 시작
+  if (listKeyRef.current !== list_key) {
+    listKeyRef.current = list_key;
+    dataKeyRef.current = data_key;
+    pagesRef.current = new Map();
+    selectAllRef.current = null;
+    overridesRef.current = new Map();
+    pendingRef.current = false;
+    inflightRef.current = null;
+    retriesRef.current = new Map();
+  }
+  // 목록 내용이나 이미지 상태만 바뀌면 보관한 페이지만 버림
+  // 이미 보낸 선택 변경은 Python 선택 상태(item.selected)에 반영됐으므로, 보내지 않은 변경이 없을 때만 내역을 비움
+  if (dataKeyRef.current !== data_key) {
+    dataKeyRef.current = data_key;
+    pagesRef.current = new Map();
+    inflightRef.current = null;
+    retriesRef.current = new Map();
+    if (!pendingRef.current) {
+      selectAllRef.current = null;
+      overridesRef.current = new Map();
+    }
+  }
+  // 요청한 페이지와 함께 온 다음 페이지들도 페이지 단위로 보관
+  for (let start = 0; start < items.length; start += page_size) {
+    pagesRef.current.set(page_offset + start, items.slice(start, start + page_size));
+  }
+  if (inflightRef.current === page_offset) {
+    inflightRef.current = null;
+  }
+
+  useEffect(() => {
+    Streamlit.setFrameHeight(height);
+  }, [height]);
+
+  useEffect(() => {
+    if (!scrollRef.current) return;
+    const element = scrollRef.current;
+    setWidth(element.clientWidth);
+    const observer = new ResizeObserver(() => setWidth(element.clientWidth));
+    observer.observe(element);
+    return () => observer.disconnect();
+  }, []);
+
+  const sendToStreamlit = (requestedOffset: number | null) => {
+    pendingRef.current = false;
+    Streamlit.setComponentValue({
+      list_key: listKeyRef.current,
+      requested_offset: requestedOffset,
+      select_all: selectAllRef.current,
+      overrides: Object.fromEntries(overridesRef.current),
+      version: Date.now(),
+    });
+  };
+
+  // 선택 변경은 모아서 한 번만 전송
+  const debouncedSync = useRef(debounce(() => sendToStreamlit(null), 800)).current;
+  useEffect(() => () => debouncedSync.cancel(), []);
+
+  const isSelected = (item: GridItem) => {
+    const override = overridesRef.current.get(item.id);
+    if (override !== undefined) return override;
+    if (selectAllRef.current !== null) return selectAllRef.current;
+    return item.selected;
+  };
+
+  const findItem = (id: string) => {
+    for (const page of Array.from(pagesRef.current.values())) {
+      const found = page.find((item) => item.id === id);
+      if (found) return found;
+    }
+    return undefined;
+  };
+
+  // Python이 보낸 선택 수에 아직 반영되지 않은 변경만 더해 추정
+  const estimateSelectedCount = () => {
+    if (!pendingRef.current) return selected_count;
+    const overrides = Array.from(overridesRef.current.entries());
+    if (selectAllRef.current !== null) {
+      const flipped = overrides.filter(([, value]) => value !== selectAllRef.current).length;
+      return selectAllRef.current ? total - flipped : flipped;
+    }
+    let count = selected_count;
+    for (const [id, value] of overrides) {
+      const item = findItem(id);
+      if (item && item.selected !== value) count += value ? 1 : -1;
+    }
+    return Math.min(Math.max(count, 0), total);
+  };
+
+  const toggleSelect = (item: GridItem) => {
+    overridesRef.current.set(item.id, !isSelected(item));
+    pendingRef.current = true;
+    redraw();
+    debouncedSync();
+  };
+
+  const selectedCount = estimateSelectedCount();
+  const allSelected = total > 0 && selectedCount === total;
+
+  const toggleSelectAll = () => {
+    selectAllRef.current = !allSelected;
+    overridesRef.current = new Map();
+    pendingRef.current = true;
+    redraw();
+    debouncedSync();
+  };
+
+  // 보이는 줄 계산 (카드 높이는 열 너비로 고정)
+  const viewHeight = height - 40;
+  const cardWidth = width > 0 ? (width - GAP * (columns - 1)) / columns : 200;
+  const rowHeight = cardWidth * 3 / 4 + CARD_TEXT_HEIGHT + GAP;
+  const rowCount = Math.ceil(total / columns);
+  const firstRow = Math.max(Math.floor(scrollTop / rowHeight) - OVERSCAN_ROWS, 0);
+  const lastRow = Math.min(Math.ceil((scrollTop + viewHeight) / rowHeight) + OVERSCAN_ROWS, rowCount);
+  const firstIndex = firstRow * columns;
+  const lastIndex = Math.min(lastRow * columns, total);
+
+  const pageOf = (index: number) => Math.floor(index / page_size) * page_size;
+
+  // 아직 받지 않은 페이지를 하나 요청 (보이는 페이지 → 아래쪽 다음 페이지 → 위쪽 이전 페이지 순)
+  // 스크롤이 닿기 전에 다음 페이지를 요청하고, Python은 그 뒤 페이지까지 함께 보내므로 페이지마다 rerun하지 않음
+  useEffect(() => {
+    if (inflightRef.current !== null || total === 0) return;
+    const candidates: number[] = [];
+    for (let offset = pageOf(firstIndex); offset < lastIndex; offset += page_size) {
+      candidates.push(offset);
+    }
+    const nextOffset = pageOf(Math.max(lastIndex - 1, 0)) + page_size;
+    for (let i = 0; i < PREFETCH_AHEAD_PAGES; i++) {
+      candidates.push(nextOffset + i * page_size);
+    }
+    candidates.push(pageOf(firstIndex) - page_size);
+    for (const offset of candidates) {
+      if (offset >= 0 && offset < total && !pagesRef.current.has(offset)) {
+        inflightRef.current = offset;
+        debouncedSync.cancel();
+        sendToStreamlit(offset);
+        return;
+      }
+    }
+  });
+
+  // 썸네일이 아직 생성 중인 보이는 페이지는 잠시 뒤 다시 요청
+  useEffect(() => {
+    const waiting: number[] = [];
+    for (let offset = pageOf(firstIndex); offset < lastIndex; offset += page_size) {
+      const page = pagesRef.current.get(offset);
+      if (page && page.some((item) => !item.url) && (retriesRef.current.get(offset) || 0) < THUMBNAIL_MAX_RETRIES) {
+        waiting.push(offset);
+      }
+    }
+    if (waiting.length === 0) return;
+    const timer = setTimeout(() => {
+      if (inflightRef.current !== null) return;
+      const offset = waiting[0];
+      retriesRef.current.set(offset, (retriesRef.current.get(offset) || 0) + 1);
+      inflightRef.current = offset;
+      debouncedSync.cancel();
+      sendToStreamlit(offset);
+    }, THUMBNAIL_RETRY_MS);
+    return () => clearTimeout(timer);
+  });
+
+  const cards = [];
+  for (let index = firstIndex; index < lastIndex; index++) {
+    const row = Math.floor(index / columns);
+    const column = index % columns;
+    const position: React.CSSProperties = {
+      position: "absolute",
+      top: `${row * rowHeight}px`,
+      left: `${column * (cardWidth + GAP)}px`,
+      width: `${cardWidth}px`,
+      height: `${rowHeight - GAP}px`,
+      boxSizing: "border-box",
+      overflow: "hidden",
+    };
+    const page = pagesRef.current.get(pageOf(index));
+    const item = page ? page[index - pageOf(index)] : undefined;
+    if (!item) {
+      cards.push(
+        <div key={`placeholder-${index}`} style={{ ...position, padding: "6px" }}>
+          <div style={{ width: "100%", aspectRatio: "4 / 3", background: "#f0f0f0", borderRadius: "4px" }} />
+        </div>
+      );
+      continue;
+    }
+
+    const badge = STATUS_BADGES[item.status || ""] || { label: "메타데이터 없음", color: "gray" };
+    const prelabelBadge = item.prelabel ? PRELABEL_BADGES[item.prelabel] : undefined;
+    const selected = isSelected(item);
+    cards.push(
+      <div
+        key={item.id}
+        onClick={() => toggleSelect(item)}
+        style={{
+          ...position,
+          cursor: "pointer",
+          padding: "6px",
+          borderRadius: "6px",
+          border: selected ? "2px solid #3182CE" : "2px solid transparent",
+          background: selected ? "#ebf4ff" : "white",
+        }}
+      >
+        <div style={{ width: "100%", aspectRatio: "4 / 3", background: "#f0f0f0", borderRadius: "4px", overflow: "hidden" }}>
+          {item.url && (
+            <img src={item.url} alt={item.filename} decoding="async" style={{ width: "100%", height: "100%", objectFit: "cover" }} />
+          )}
+        </div>
+        <div style={{ marginTop: "4px", whiteSpace: "nowrap", overflow: "hidden", textOverflow: "ellipsis" }} title={item.filename}>
+          <input type="checkbox" checked={selected} readOnly /> {item.filename}
+        </div>
+        <span style={{ backgroundColor: badge.color, padding: "2px 6px", borderRadius: "3px", color: "white" }}>
+          {badge.label}
+        </span>
+        {prelabelBadge && (
+          <span style={{ backgroundColor: prelabelBadge.color, padding: "2px 6px", borderRadius: "3px", color: "white", marginLeft: "4px" }}>
+            {prelabelBadge.label}
+          </span>
+        )}
+        {item.assigned_by && <div>할당된 사용자: {item.assigned_by}</div>}
+        {item.created_by && <div>업로드한 사용자: {item.created_by}</div>}
+        {item.created_at && <div>업로드 시간: {item.created_at}</div>}
+      </div>
+    );
+  }
+
+  return (
+    <div style={{ fontFamily: "sans-serif", fontSize: "13px" }}>
+      <div style={{ display: "flex", justifyContent: "space-between", alignItems: "center", marginBottom: "8px" }}>
+        <label style={{ cursor: "pointer" }}>
+          <input type="checkbox" checked={allSelected} onChange={toggleSelectAll} />{" "}
+          모두 선택
+        </label>
+        <span>선택 {selectedCount}개 / 총 {total}개 이미지</span>
+      </div>
+      <div
+        ref={scrollRef}
+        onScroll={(event) => setScrollTop(event.currentTarget.scrollTop)}
+        style={{ height: `${viewHeight}px`, overflowY: "auto" }}
+      >
+        <div style={{ position: "relative", height: `${rowCount * rowHeight}px` }}>
+          {cards}
+        </div>
+      </div>
+    </div>
+  );
+};
+
+export default ImageGrid;
@@ -0,0 +1,127 @@
+import React, { useEffect, useRef } from "react";
+import { Shape } from "react-konva";
+import Konva from "konva";
+
+// Python get_tile_pyramid()가 전달하는 타일 피라미드 정보
+export interface TileLevel {
+  level: number;
+  factor: number;   // 원본 대비 배율 (level 0 = 1)
+  width: number;
+  height: number;
+  cols: number;
+  rows: number;
+}
+
+export interface TilePyramid {
+  width: number;
+  height: number;
+  tile_size: number;
+  url_template: string;   // {level}, {col}, {row}, {signature}를 채우면 presigned 타일 URL
+  signatures: { [key: string]: string };   // "level/col_row" → X-Amz-Signature
+  levels: TileLevel[];
+}
+
+const tileUrl = (tiles: TilePyramid, level: number, col: number, row: number) => {
+  const signature = tiles.signatures[`${level}/${col}_${row}`];
+  if (!signature) return null;
+  return tiles.url_template
+    .replace("{level}", String(level))
+    .replace("{col}", String(col))
+    .replace("{row}", String(row))
+    .replace("{signature}", signature);
+};
+
+interface TileLayerProps {
+  tiles: TilePyramid;
+  scale: number;                        // 원본 픽셀 → 화면 픽셀
+  position: { x: number, y: number };   // 레이어 이동량 (화면 픽셀)
+  viewport: number[];                   // 스테이지 크기 (화면 픽셀)
+}
+
+// 받은 타일 이미지 캐시 (URL 기준, 오래된 것부터 제거)
+const TILE_CACHE_LIMIT = 512;
+const tileCache = new Map<string, HTMLImageElement>();
+
+const loadTile = (url: string, onLoad: () => void) => {
+  let img = tileCache.get(url);
+  if (img) {
+    // 최근 사용으로 갱신
+    tileCache.delete(url);
+    tileCache.set(url, img);
+    return img;
+  }
+  img = new window.Image();
+  img.decoding = "async";
+  img.onload = onLoad;
+  img.src = url;
+  tileCache.set(url, img);
+  while (tileCache.size > TILE_CACHE_LIMIT) {
+    tileCache.delete(tileCache.keys().next().value as string);
+  }
+  return img;
+};
+
+// 화면 배율 이상의 해상도를 가진 가장 작은 레벨 선택
+const pickLevel = (tiles: TilePyramid, scale: number) => {
+  let chosen = tiles.levels[0];
+  for (const level of tiles.levels) {
+    if (level.factor >= scale) chosen = level;
+  }
+  return chosen;
+};
+
+// 현재 배율과 보이는 영역에 해당하는 타일만 그리는 레이어 내용
+const TileLayer = ({ tiles, scale, position, viewport }: TileLayerProps) => {
+  const shapeRef = useRef<Konva.Shape>(null);
+
+  const redraw = () => shapeRef.current?.getLayer()?.batchDraw();
+
+  useEffect(() => {
+    redraw();
+  }, [tiles, scale, position.x, position.y, viewport[0], viewport[1]]);
+
+  return (
+    <Shape
+      ref={shapeRef}
+      listening={false}
+      perfectDrawEnabled={false}
+      sceneFunc={(context) => {
+        const ctx = (context as any)._context as CanvasRenderingContext2D;
+        const level = pickLevel(tiles, scale);
+        const size = tiles.tile_size;
+
+        // 보이는 영역 (레벨 픽셀 좌표)
+        const toLevel = level.factor / scale;
+        const left = -position.x * toLevel;
+        const top = -position.y * toLevel;
+        const right = left + viewport[0] * toLevel;
+        const bottom = top + viewport[1] * toLevel;
+
+        const col0 = Math.max(0, Math.floor(left / size));
+        const row0 = Math.max(0, Math.floor(top / size));
+        const col1 = Math.min(level.cols - 1, Math.floor(right / size));
+        const row1 = Math.min(level.rows - 1, Math.floor(bottom / size));
+
+        // 레벨 픽셀 → 화면 픽셀
+        const toScreen = scale / level.factor;
+        for (let col = col0; col <= col1; col++) {
+          for (let row = row0; row <= row1; row++) {
+            const url = tileUrl(tiles, level.level, col, row);
+            if (!url) continue;
+            const img = loadTile(url, redraw);
+            if (!img.complete || img.naturalWidth === 0) continue;
+            ctx.drawImage(
+              img,
+              col * size * toScreen,
+              row * size * toScreen,
+              img.naturalWidth * toScreen,
+              img.naturalHeight * toScreen
+            );
+          }
+        }
+      }}
+    />
+  );
+};
+
+export default TileLayer;
@@ -1,6 +1,13 @@
 import React from "react"
 import { createRoot } from "react-dom/client"
-import Detection from "./Detection"
+import { withStreamlitConnection, ComponentProps } from "streamlit-component-lib"
+import { Detection } from "./Detection"
+import ImageGrid from "./ImageGrid"
+
+// 같은 컴포넌트 빌드에서 args.component 값으로 화면을 선택
+const Root = withStreamlitConnection((props: ComponentProps) =>
+  props.args.component === "image_grid" ? <ImageGrid {...props} /> : <Detection {...props} />
+)
 
 const rootElement = document.getElementById("root")
 if (!rootElement) throw new Error("Failed to find the root element")
@@ -8,6 +15,6 @@ if (!rootElement) throw new Error("Failed to find the root element")
 const root = createRoot(rootElement)
 root.render(
   <React.StrictMode>
-    <Detection />
+    <Root />
   </React.StrictMode>
 )
\ No newline at end of file
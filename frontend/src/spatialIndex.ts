@@ -0,0 +1,91 @@
+// 바운딩 박스용 균일 격자 공간 인덱스
+// 박스가 수천 개여도 화면 영역 조회(컬링)와 포인터 히트 테스트를 주변 셀만 확인해 처리합니다.
+// 좌표는 모두 이미지 좌표계(스케일 적용 전) 기준입니다.
+
+export interface IndexedBox {
+  id: string;
+  x: number;
+  y: number;
+  width: number;
+  height: number;
+}
+
+export class GridIndex<T extends IndexedBox> {
+  private cells = new Map<number, number[]>();
+  private readonly cellSize: number;
+  private readonly items: T[];
+
+  constructor(items: T[], cellSize = 128) {
+    this.items = items;
+    this.cellSize = Math.max(cellSize, 1);
+    items.forEach((item, i) => {
+      const [cx0, cy0, cx1, cy1] = this.cellRange(item.x, item.y, item.width, item.height);
+      for (let cx = cx0; cx <= cx1; cx++) {
+        for (let cy = cy0; cy <= cy1; cy++) {
+          const key = this.key(cx, cy);
+          const bucket = this.cells.get(key);
+          if (bucket) {
+            bucket.push(i);
+          } else {
+            this.cells.set(key, [i]);
+          }
+        }
+      }
+    });
+  }
+
+  // 셀 좌표를 하나의 숫자 키로 변환 (문자열 키보다 할당이 적음)
+  private key(cx: number, cy: number) {
+    return cx * 65536 + cy;
+  }
+
+  private cellRange(x: number, y: number, width: number, height: number) {
+    const left = Math.min(x, x + width);
+    const top = Math.min(y, y + height);
+    const right = Math.max(x, x + width);
+    const bottom = Math.max(y, y + height);
+    return [
+      Math.floor(left / this.cellSize),
+      Math.floor(top / this.cellSize),
+      Math.floor(right / this.cellSize),
+      Math.floor(bottom / this.cellSize),
+    ];
+  }
+
+  // 영역과 겹치는 박스를 원래 순서(그리기 순서)대로 반환
+  query(x: number, y: number, width: number, height: number): T[] {
+    const [cx0, cy0, cx1, cy1] = this.cellRange(x, y, width, height);
+    const found = new Set<number>();
+    for (let cx = cx0; cx <= cx1; cx++) {
+      for (let cy = cy0; cy <= cy1; cy++) {
+        const bucket = this.cells.get(this.key(cx, cy));
+        if (!bucket) continue;
+        for (const i of bucket) {
+          const item = this.items[i];
+          if (
+            item.x <= x + width && item.x + item.width >= x &&
+            item.y <= y + height && item.y + item.height >= y
+          ) {
+            found.add(i);
+          }
+        }
+      }
+    }
+    return Array.from(found).sort((a, b) => a - b).map((i) => this.items[i]);
+  }
+
+  // 점을 포함하는 박스 중 가장 위(나중에 그려진) 박스 반환
+  hitTest(x: number, y: number, tolerance = 0): T | null {
+    const candidates = this.query(x - tolerance, y - tolerance, tolerance * 2, tolerance * 2);
+    for (let i = candidates.length - 1; i >= 0; i--) {
+      const item = candidates[i];
+      if (
+        x >= item.x - tolerance && x <= item.x + item.width + tolerance &&
+        y >= item.y - tolerance && y <= item.y + item.height + tolerance
+      ) {
+        return item;
+      }
+    }
+    return null;
+  }
+}
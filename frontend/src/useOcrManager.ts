@@ -1,23 +1,11 @@
 import { useRef, useState, useEffect } from "react";
-import { Streamlit } from "streamlit-component-lib";
-
-interface Rectangle {
-  x: number;
-  y: number;
-  width: number;
-  height: number;
-  label: string;
-  stroke: string;
-  id: string;
-}
 
 interface UseOcrManagerProps {
-  rectangles: Rectangle[];
-  scale: number;
-  mode: string;
+  // 선택 박스의 OCR 요청을 Python으로 전송 (박스 변경분은 Detection의 변경 연산에 함께 실림)
+  sendOcrRequest: (boxId: string) => void;
 }
 
-export const useOcrManager = ({ rectangles, scale, mode }: UseOcrManagerProps) => {
+export const useOcrManager = ({ sendOcrRequest }: UseOcrManagerProps) => {
   const [suggestedLabels, setSuggestedLabels] = useState<string[]>([]);
   const [showSuggestions, setShowSuggestions] = useState(false);
   const [isLoading, setIsLoading] = useState(false);
@@ -26,32 +14,15 @@ export const useOcrManager = ({ rectangles, scale, mode }: UseOcrManagerProps) =
   const prevTriggerRef = useRef<string | null>(null);
   const [triggerId, setTriggerId] = useState<string | null>(null);
 
-  const formatBBoxes = (rects: Rectangle[]) =>
-    rects.map((rect) => ({
-      box_id: rect.id,
-      bbox: [rect.x, rect.y, rect.width, rect.height],
-      label: rect.label || "",
-    }));
-
   // OCR 요청 트리거
   const requestOcrForBox = (boxId: string) => {
     if (pendingRef.current || prevTriggerRef.current === boxId) return;
 
-    const box = rectangles.find((r) => r.id === boxId);
-    if (!box) return;
-
     pendingRef.current = true;
     prevTriggerRef.current = boxId;
     setIsLoading(true);
 
-    Streamlit.setComponentValue({
-      mode,
-      bboxes: formatBBoxes(rectangles),
-      scale,
-      request_ocr: true,
-      selected_box_id: boxId,
-      selected_box_coords: [box.x, box.y, box.width, box.height]
-    });
+    sendOcrRequest(boxId);
 
     setTriggerId(boxId); // 내부 상태 유지
   };
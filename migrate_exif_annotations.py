@@ -0,0 +1,106 @@
+import os
+import argparse
+
+from postgresql_utils import get_unoriented_images, save_oriented_annotations
+from minio_utils import MinIOManager, EXIF_TRANSPOSED_ORIENTATIONS
+
+# EXIF 방향 적용 전에 저장된 어노테이션 변환
+#   이전 버전의 캔버스는 EXIF 방향을 적용하지 않은 원본 픽셀 그대로 이미지를 보여줬으므로,
+#   그때 저장된 박스는 원본 픽셀 좌표입니다. 지금 캔버스/내보내기/메타데이터 크기는 방향을 적용한
+#   좌표를 쓰므로, Orientation이 1이 아닌 이미지의 박스를 같은 방향으로 변환합니다.
+#   변환한 이미지는 metadata.bbox_oriented를 켜서 다시 실행해도 두 번 변환하지 않습니다.
+
+
+def orient_point(x, y, orientation, width, height):
+    """원본 픽셀 좌표(크기 width x height)의 점을 EXIF 방향 적용 후 좌표로 옮깁니다 (ImageOps.exif_transpose와 같은 변환)."""
+    if orientation == 2:
+        return width - x, y
+    if orientation == 3:
+        return width - x, height - y
+    if orientation == 4:
+        return x, height - y
+    if orientation == 5:
+        return y, x
+    if orientation == 6:
+        return height - y, x
+    if orientation == 7:
+        return height - y, width - x
+    if orientation == 8:
+        return y, width - x
+    return x, y
+
+
+def orient_bbox(bbox, orientation, width, height):
+    """원본 픽셀 좌표의 {x, y, width, height} 박스를 EXIF 방향 적용 후 좌표로 변환합니다 (다른 키는 유지)."""
+    corners = [
+        orient_point(x, y, orientation, width, height)
+        for x in (bbox["x"], bbox["x"] + bbox["width"])
+        for y in (bbox["y"], bbox["y"] + bbox["height"])
+    ]
+    xs = [x for x, _ in corners]
+    ys = [y for _, y in corners]
+    return {**bbox, "x": min(xs), "y": min(ys), "width": max(xs) - min(xs), "height": max(ys) - min(ys)}
+
+
+def migrate_exif_annotations(minio_client, project_name=None, dry_run=False):
+    """
+    bbox_oriented가 꺼진 이미지의 EXIF 방향을 객체 헤더(범위 요청)로 확인해
+    어노테이션 좌표와 metadata의 width/height를 방향 적용 기준으로 바꿉니다.
+
+    Returns:
+        dict: images(확인한 이미지 수), converted(좌표를 바꾼 이미지 수), annotations(바꾼 박스 수), failed(실패한 storage_path 목록)
+    """
+    images = get_unoriented_images(project_name)
+    if images is None:
+        raise RuntimeError("방향 미적용 이미지를 조회할 수 없습니다.")
+
+    report = {"images": len(images), "converted": 0, "annotations": 0, "failed": []}
+    for image_id, storage_path, annotations in images:
+        bucket_name, object_name = storage_path.split("/", 1)
+        try:
+            width, height, orientation = minio_client.get_image_header(bucket_name, object_name)
+        except Exception as e:
+            print(f"DEBUG: 이미지 헤더 확인 실패 ({storage_path}) - {e}")
+            report["failed"].append(storage_path)
+            continue
+
+        # get_image_header는 방향 적용 후 크기를 반환하므로 원본 픽셀 크기로 되돌려 변환에 사용
+        raw_width, raw_height = (height, width) if orientation in EXIF_TRANSPOSED_ORIENTATIONS else (width, height)
+        if orientation not in (None, 1):
+            annotations = [
+                (annotation_id, orient_bbox(bbox, orientation, raw_width, raw_height))
+                for annotation_id, bbox in annotations
+            ]
+            report["converted"] += 1
+            report["annotations"] += len(annotations)
+            print(f"DEBUG: {storage_path} Orientation={orientation}, 박스 {len(annotations)}개 변환")
+        else:
+            annotations = []
+
+        if not dry_run and not save_oriented_annotations(image_id, width, height, annotations):
+            report["failed"].append(storage_path)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EXIF 방향 적용 전에 저장된 어노테이션 좌표를 방향 적용 기준으로 변환합니다.")
+    parser.add_argument("--project", default=None, help="변환할 프로젝트 이름 (생략하면 전체)")
+    parser.add_argument("--dry-run", action="store_true", help="변환 대상만 출력하고 DB는 바꾸지 않음")
+    parser.add_argument("--endpoint", default=os.environ.get("MINIO_ENDPOINT", "localhost:9000"))
+    parser.add_argument("--access-key", default=os.environ.get("MINIO_ACCESS_KEY"))
+    parser.add_argument("--secret-key", default=os.environ.get("MINIO_SECRET_KEY"))
+    parser.add_argument("--secure", action="store_true")
+    args = parser.parse_args()
+
+    minio_client = MinIOManager(args.access_key, args.secret_key, endpoint=args.endpoint, secure=args.secure)
+    report = migrate_exif_annotations(minio_client, args.project, dry_run=args.dry_run)
+    print(
+        f"확인 {report['images']}개, 좌표 변환 {report['converted']}개 이미지 / {report['annotations']}개 박스, "
+        f"실패 {len(report['failed'])}개"
+    )
+    if report["failed"]:
+        print(", ".join(report["failed"]))
+
+
+if __name__ == "__main__":
+    main()
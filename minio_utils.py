@@ -1,39 +1,144 @@
 import os
 import io
+import hashlib
+import socket
 import tempfile
+import certifi
+import urllib3
+from urllib3.connection import HTTPConnection
 from minio import Minio
+from minio.commonconfig import CopySource, ENABLED, Filter
+from minio.datatypes import PostPolicy
+from minio.deleteobjects import DeleteObject
+from minio.lifecycleconfig import LifecycleConfig, Rule, Expiration
 from minio.error import S3Error
 import streamlit as st
 import datetime
-import json
 from PIL import Image
 
-# @st.cache_resource
-# minioadmin
+# HTTP 커넥션 풀 설정
+HTTP_NUM_POOLS = 4           # 엔드포인트(host:port)별 풀 개수
+HTTP_POOL_MAXSIZE = 32       # 풀 하나당 유지할 keep-alive 커넥션 수
+HTTP_CONNECT_TIMEOUT = 5     # 초
+HTTP_READ_TIMEOUT = 60       # 초
+HTTP_RETRIES = 3
+
+
+# 멀티파트 업로드 파트 크기 (MinIO/S3 최소값은 5MiB)
+DEFAULT_PART_SIZE = 10 * 1024 * 1024
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+# EXIF Orientation 태그 번호
+EXIF_ORIENTATION_TAG = 0x0112
+# 90도 회전이 들어가 표시할 때 가로/세로가 바뀌는 Orientation 값
+EXIF_TRANSPOSED_ORIENTATIONS = (5, 6, 7, 8)
+# 원격 객체의 헤더만 읽을 때 처음 요청할 바이트 수
+IMAGE_HEADER_RANGE = 64 * 1024
+# 헤더가 잘렸을 때 범위를 늘려가며 재시도할 최대 바이트 수
+IMAGE_HEADER_MAX_RANGE = 1024 * 1024
+
+
+def read_image_header(file_obj):
+    """
+    이미지 전체를 디코딩하지 않고 헤더만 읽어 크기와 EXIF 방향 정보를 반환합니다.
+    PIL의 Image.open은 지연 로딩이므로 픽셀 데이터는 읽지 않습니다.
+    크기는 EXIF 방향을 적용해 화면에 보이는 기준이며 (Orientation 5~8이면 가로/세로를 바꿈),
+    읽은 후 파일 포인터는 처음 위치로 되돌립니다.
+
+    Args:
+        file_obj: 읽기 가능한 파일 객체 (Streamlit UploadedFile, BytesIO 등)
+
+    Returns:
+        tuple: (width, height, orientation)
+    """
+    file_obj.seek(0)
+    try:
+        with Image.open(file_obj) as img:
+            width, height = img.size
+            orientation = img.getexif().get(EXIF_ORIENTATION_TAG, 1)
+    finally:
+        file_obj.seek(0)
+    if orientation in EXIF_TRANSPOSED_ORIENTATIONS:
+        width, height = height, width
+    return width, height, orientation
 
 
 def get_image_dimensions(image_filename):
-    """이미지 파일의 크기를 반환합니다."""
+    """이미지 파일의 크기를 반환합니다. 객체 앞부분만 범위 요청으로 읽습니다."""
     try:
-        # 기존 코드 패턴에 맞춰 수정
-        temp_image_path = st.session_state.minio_client.load_image(
+        width, height, _ = st.session_state.minio_client.get_image_header(
             st.session_state.selected_bucket, 
             image_filename
         )
-        print(f"DEBUG: temp_image_path={temp_image_path}")
-        if not temp_image_path:
-            st.error(f"이미지를 로드할 수 없습니다: {image_filename}")
-        
-        img = Image.open(temp_image_path)
-        return img.width, img.height
+        return width, height
     except Exception as e:
         print(f"이미지 크기를 확인하는 중 오류 발생: {e}")
+        return None, None
+
+def compute_content_hash(file_obj, chunk_size=1024 * 1024):
+    """
+    파일 객체의 sha256 해시를 청크 단위로 계산합니다.
+    계산 후 파일 포인터는 처음 위치로 되돌립니다.
+
+    Args:
+        file_obj: 읽기 가능한 파일 객체 (Streamlit UploadedFile 등)
+        chunk_size (int): 한 번에 읽을 바이트 수
+
+    Returns:
+        str: sha256 hex digest
+    """
+    sha256 = hashlib.sha256()
+    file_obj.seek(0)
+    for chunk in iter(lambda: file_obj.read(chunk_size), b""):
+        sha256.update(chunk)
+    file_obj.seek(0)
+    return sha256.hexdigest()
+
+def create_http_client(secure=False, maxsize=HTTP_POOL_MAXSIZE):
+    """
+    MinIO 클라이언트가 사용할 urllib3 PoolManager를 생성합니다.
+    커넥션 풀 크기, 타임아웃, 재시도, TCP keep-alive를 명시적으로 설정합니다.
+
+    Args:
+        secure (bool): HTTPS 사용 여부
+        maxsize (int): 풀 하나당 유지할 커넥션 수
+
+    Returns:
+        urllib3.PoolManager: HTTP 커넥션 풀
+    """
+    socket_options = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    return urllib3.PoolManager(
+        num_pools=HTTP_NUM_POOLS,
+        maxsize=maxsize,
+        block=False,
+        timeout=urllib3.Timeout(connect=HTTP_CONNECT_TIMEOUT, read=HTTP_READ_TIMEOUT),
+        retries=urllib3.Retry(
+            total=HTTP_RETRIES,
+            backoff_factor=0.2,
+            status_forcelist=[500, 502, 503, 504]
+        ),
+        socket_options=socket_options,
+        cert_reqs="CERT_REQUIRED" if secure else "CERT_NONE",
+        ca_certs=certifi.where() if secure else None,
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_minio_manager(access_key, secret_key, endpoint="localhost:9000", secure=False):
+    """
+    자격 증명/엔드포인트별로 프로세스 전체에서 공유하는 MinIOManager를 반환합니다.
+    모든 세션과 rerun이 같은 커넥션 풀을 재사용하므로 keep-alive 커넥션이 유지됩니다.
+    """
+    return MinIOManager(access_key, secret_key, endpoint=endpoint, secure=secure)
+
 
 class MinIOManager:
     """
     MinIO 서버와의 상호작용을 관리하는 클래스
     """
-    def __init__(self, access_key, secret_key, endpoint="localhost:9000", secure=False):
+    def __init__(self, access_key, secret_key, endpoint="localhost:9000", secure=False, part_size=DEFAULT_PART_SIZE):
         """
         MinIO 클라이언트를 초기화합니다.
         
@@ -42,13 +147,45 @@ class MinIOManager:
             secret_key (str): MinIO 시크릿 키
             endpoint (str): MinIO 서버 엔드포인트
             secure (bool): HTTPS 사용 여부
+            part_size (int): 스트리밍 업로드 시 멀티파트 파트 크기 (최소 5MiB)
         """
+        self.endpoint = endpoint
+        self.secure = secure
+        self.part_size = max(part_size, MIN_PART_SIZE)
+        self.http_client = create_http_client(secure=secure)
         self.client = Minio(
             endpoint,
             access_key=access_key,
             secret_key=secret_key,
-            secure=secure
+            secure=secure,
+            http_client=self.http_client
         )
+
+    def get_pool_stats(self):
+        """
+        HTTP 커넥션 풀 상태를 반환합니다.
+
+        Returns:
+            list: 엔드포인트별 {host, port, maxsize, num_connections, num_requests, idle_connections}
+        """
+        stats = []
+        pools = self.http_client.pools
+        for pool_key in list(pools.keys()):
+            pool = pools.get(pool_key)
+            if pool is None:
+                continue
+            idle = 0
+            if pool.pool is not None:
+                idle = sum(1 for conn in list(pool.pool.queue) if conn is not None)
+            stats.append({
+                "host": pool.host,
+                "port": pool.port,
+                "maxsize": pool.pool.maxsize if pool.pool is not None else 0,
+                "num_connections": pool.num_connections,
+                "num_requests": pool.num_requests,
+                "idle_connections": idle,
+            })
+        return stats
     
     def check_connection(self):
         """
@@ -167,9 +304,8 @@ class MinIOManager:
             file_name = uploaded_file.name
             object_name = os.path.join(folder_path, file_name).replace("\\", "/")
             
-            # 파일 바이트 읽기
-            file_data = uploaded_file.getvalue()
-            file_size = len(file_data)
+            # 파일 크기 확인 (알 수 없으면 -1로 두고 스트리밍 업로드)
+            file_size = getattr(uploaded_file, "size", -1)
             
             if file_size == 0:
                 st.error(f"⚠️ {file_name}: 파일 크기가 0입니다. 업로드 생략됨.")
@@ -180,10 +316,10 @@ class MinIOManager:
             
             print(f"[DEBUG] 업로드 시도: {bucket_name}/{object_name}, size={file_size}, type={content_type}")
             
-            self.client.put_object(
+            self.upload_fileobj(
                 bucket_name,
                 object_name,
-                io.BytesIO(file_data),
+                uploaded_file,
                 length=file_size,
                 content_type=content_type
             )
@@ -193,6 +329,102 @@ class MinIOManager:
             st.error(f"MinIO 업로드 에러: {e}")
             return False
 
+    def upload_fileobj(self, bucket_name, object_name, file_obj, length=-1, content_type="application/octet-stream"):
+        """
+        파일 객체를 복사하지 않고 part_size 단위로 읽어 멀티파트로 스트리밍 업로드합니다.
+        업로드 한 건당 메모리 사용량은 파트 크기로 제한됩니다.
+
+        Args:
+            bucket_name (str): 업로드할 버킷 이름
+            object_name (str): 객체 이름(경로 포함)
+            file_obj: read()를 지원하는 파일 객체
+            length (int): 전체 크기, 알 수 없으면 -1
+            content_type (str): 객체의 Content-Type
+
+        Returns:
+            ObjectWriteResult: MinIO 업로드 결과
+        """
+        if hasattr(file_obj, "seek"):
+            file_obj.seek(0)
+        return self.client.put_object(
+            bucket_name,
+            object_name,
+            file_obj,
+            length=length,
+            content_type=content_type,
+            part_size=self.part_size
+        )
+
+
+    def get_image_header(self, bucket_name, object_name, length=IMAGE_HEADER_RANGE):
+        """
+        객체의 앞부분만 범위 요청(ranged GET)으로 받아 이미지 크기와 EXIF 방향을 반환합니다.
+        EXIF 블록이 커서 헤더가 잘린 경우 범위를 두 배씩 늘려 재시도하고,
+        그래도 실패하면 객체 전체를 받아 확인합니다.
+
+        Args:
+            bucket_name (str): 이미지가 있는 버킷 이름
+            object_name (str): 이미지 객체 이름
+            length (int): 처음 요청할 바이트 수
+
+        Returns:
+            tuple: (width, height, orientation)
+        """
+        while length <= IMAGE_HEADER_MAX_RANGE:
+            response = self.client.get_object(bucket_name, object_name, offset=0, length=length)
+            try:
+                data = response.read()
+            finally:
+                response.close()
+                response.release_conn()
+            try:
+                return read_image_header(io.BytesIO(data))
+            except Exception:
+                if len(data) < length:
+                    # 객체 전체를 이미 받았는데도 실패한 경우
+                    raise
+                length *= 2
+
+        response = self.client.get_object(bucket_name, object_name)
+        try:
+            data = response.read()
+        finally:
+            response.close()
+            response.release_conn()
+        return read_image_header(io.BytesIO(data))
+
+    def get_object_etag(self, bucket_name, object_name):
+        """객체의 ETag를 HEAD 요청으로 조회합니다. 본문은 받지 않습니다."""
+        return self.client.stat_object(bucket_name, object_name).etag
+
+    def stat_object_or_none(self, bucket_name, object_name):
+        """객체 정보를 HEAD 요청으로 조회하고, 객체가 없으면 None을 반환합니다."""
+        try:
+            return self.client.stat_object(bucket_name, object_name)
+        except S3Error as err:
+            if err.code in ("NoSuchKey", "NoSuchObject"):
+                return None
+            raise
+
+    def put_bytes(self, bucket_name, object_name, data, content_type, metadata=None):
+        """메모리의 바이트를 객체로 저장합니다. metadata에는 Cache-Control 등 헤더를 넣을 수 있습니다."""
+        return self.client.put_object(
+            bucket_name,
+            object_name,
+            io.BytesIO(data),
+            length=len(data),
+            content_type=content_type,
+            metadata=metadata
+        )
+
+    def get_object_bytes(self, bucket_name, object_name):
+        """객체 전체를 임시 파일 없이 메모리로 읽어 반환합니다."""
+        response = self.client.get_object(bucket_name, object_name)
+        try:
+            return response.read()
+        finally:
+            response.close()
+            response.release_conn()
 
     def load_image(self, bucket_name, object_name):
         """
@@ -237,7 +469,7 @@ class MinIOManager:
             return False
            
 
-    def get_presigned_url(self, bucket_name, object_name):
+    def get_presigned_url(self, bucket_name, object_name, expires=datetime.timedelta(hours=1)):
         """
         MinIO/S3 객체에 대한 presigned URL을 생성합니다.
         
@@ -254,9 +486,121 @@ class MinIOManager:
             url = self.client.presigned_get_object(
                 bucket_name,
                 object_name,
-                expires=datetime.timedelta(hours=1)
+                expires=expires
             )
             return url
         except Exception as e:
             print(f"Error generating presigned URL: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def get_presigned_post_policy(self, bucket_name, prefix, max_size=200 * 1024 * 1024, expires=datetime.timedelta(hours=1), metadata_fields=()):
+        """
+        브라우저가 MinIO로 직접 업로드할 수 있도록 POST policy 폼 데이터를 생성합니다.
+        prefix로 시작하는 키와 image/* Content-Type만 허용합니다.
+
+        Args:
+            bucket_name (str): 업로드할 버킷 이름
+            prefix (str): 허용할 객체 키 prefix
+            max_size (int): 파일 하나의 최대 바이트 수
+            expires (timedelta): policy 만료 시간
+            metadata_fields (tuple): 폼에 반드시 포함해야 하는 사용자 메타데이터 이름
+                (x-amz-meta-<이름> 필드로 전송되어 객체 메타데이터로 저장됨)
+
+        Returns:
+            tuple: (업로드 URL, 폼 필드 dict) 또는 실패 시 (None, None)
+        """
+        try:
+            policy = PostPolicy(bucket_name, datetime.datetime.utcnow() + expires)
+            policy.add_starts_with_condition("key", prefix)
+            policy.add_starts_with_condition("Content-Type", "image/")
+            policy.add_content_length_range_condition(1, max_size)
+            for name in metadata_fields:
+                policy.add_starts_with_condition(f"x-amz-meta-{name}", "")
+            form_data = self.client.presigned_post_policy(policy)
+            scheme = "https" if self.secure else "http"
+            return f"{scheme}://{self.endpoint}/{bucket_name}", form_data
+        except Exception as e:
+            print(f"Error generating presigned post policy: {e}")
+            return None, None
+
+    def move_object(self, bucket_name, source_object, target_object):
+        """
+        버킷 내에서 객체를 서버 측 복사 후 원본을 삭제하여 이동합니다.
+        데이터는 MinIO 내부에서만 복사되고 앱 서버를 거치지 않습니다.
+        """
+        self.client.copy_object(bucket_name, target_object, CopySource(bucket_name, source_object))
+        self.client.remove_object(bucket_name, source_object)
+
+    def delete_objects(self, bucket_name, object_names):
+        """
+        여러 객체를 한 번의 요청으로 삭제합니다.
+
+        Returns:
+            list: 삭제에 실패한 객체 이름 목록
+        """
+        errors = self.client.remove_objects(
+            bucket_name, [DeleteObject(name) for name in object_names]
+        )
+        return [error.name for error in errors]
+
+    def presign_get_objects(self, bucket_name, object_names, expires=datetime.timedelta(hours=1)):
+        """
+        여러 객체의 presigned GET URL을 같은 서명 시각으로 한 번에 만듭니다.
+        서명은 로컬 HMAC 계산이라 객체 수만큼 요청을 보내지 않습니다 (버킷 리전만 처음 한 번 조회).
+        서명 시각이 같으므로 URL끼리는 객체 경로와 X-Amz-Signature 값만 다릅니다.
+
+        Returns:
+            list: object_names와 같은 순서의 URL 목록
+        """
+        request_date = datetime.datetime.now(datetime.timezone.utc)
+        return [
+            self.client.presigned_get_object(bucket_name, object_name, expires=expires, request_date=request_date)
+            for object_name in object_names
+        ]
+
+    def get_object_metadata(self, bucket_name, object_name, name):
+        """객체의 사용자 메타데이터(x-amz-meta-<name>) 값을 HEAD 요청으로 조회합니다. 없으면 None."""
+        return self.client.stat_object(bucket_name, object_name).metadata.get(f"x-amz-meta-{name}")
+
+    def ensure_prefix_expiration(self, bucket_name, prefix, days, rule_id):
+        """
+        prefix 아래 객체가 days일 뒤 자동 삭제되도록 버킷 수명 주기 규칙을 추가합니다.
+        기존 규칙은 유지하고, 같은 rule_id가 이미 있으면 아무것도 하지 않습니다.
+
+        Returns:
+            bool: 규칙이 설정되어 있으면 True (권한 부족 등으로 실패하면 False)
+        """
+        try:
+            config = self.client.get_bucket_lifecycle(bucket_name)
+            rules = list(config.rules) if config else []
+            if any(rule.rule_id == rule_id for rule in rules):
+                return True
+            rules.append(Rule(
+                ENABLED,
+                rule_filter=Filter(prefix=prefix),
+                rule_id=rule_id,
+                expiration=Expiration(days=days),
+            ))
+            self.client.set_bucket_lifecycle(bucket_name, LifecycleConfig(rules))
+            return True
+        except Exception as e:
+            print(f"DEBUG: 수명 주기 규칙 설정 실패: {bucket_name}/{prefix}, {e}")
+            return False
+
+    def delete_objects_older_than(self, bucket_name, prefix, max_age):
+        """
+        prefix 아래에서 마지막 수정 후 max_age(timedelta)가 지난 객체를 삭제합니다.
+        수명 주기 규칙을 설정할 수 없을 때 대신 사용합니다.
+
+        Returns:
+            int: 삭제 요청한 객체 수
+        """
+        cutoff = datetime.datetime.now(datetime.timezone.utc) - max_age
+        expired = [
+            obj.object_name
+            for obj in self.client.list_objects(bucket_name, prefix=prefix, recursive=True)
+            if obj.last_modified is not None and obj.last_modified < cutoff
+        ]
+        if expired:
+            self.delete_objects(bucket_name, expired)
+        return len(expired)
@@ -0,0 +1,984 @@
+import os
+import json
+import time
+import hashlib
+import functools
+import queue
+import threading
+import multiprocessing
+import numpy as np
+import cv2
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, Future
+from concurrent.futures.process import BrokenProcessPool
+from paddleocr import PaddleOCR
+
+# OCR 모델 설정
+# 같은 설정의 모델은 프로세스당 한 번만 로드해서 모든 세션이 공유합니다.
+#   "backend": "paddle"(기본) 또는 "onnx"
+#     onnx는 det/rec_model_dir에 paddle2onnx로 변환한 .onnx 파일 경로를 지정하고,
+#     전처리/후처리는 PaddleOCR 것을 그대로 쓰며 추론만 ONNX Runtime 세션으로 실행합니다 (README 참고).
+#   "ort_intra_op_threads" / "ort_inter_op_threads": ONNX Runtime 스레드 수 (intra 미지정 시 cpu_threads 사용)
+#   "requires_gate": True면 quantize_models.py의 검사 보고서가 통과 상태이고 지금 모델 파일과 일치할 때만 로드 (INT8 모델)
+# DEFAULT_OCR_CONFIG(OCR_CONFIG 환경 변수)를 바꾸면 자동 감지/박스 추천/일괄 감지가 모두 해당 설정을 사용합니다.
+DEFAULT_OCR_CONFIG = os.environ.get("OCR_CONFIG", "default")
+# 모델 파일 루트 디렉터리 (OCR_MODEL_DIR 환경 변수로 바꿀 수 있음, 테스트/다른 서버용)
+OCR_MODEL_DIR = os.environ.get("OCR_MODEL_DIR", "/Users/nongshim/Desktop/Python/project/streamlit_image_annotation/Detection/inference")
+OCR_MODEL_CONFIGS = {
+    "default": {
+        "use_angle_cls": True,
+        "show_log": False,
+        "lang": "korean",
+        "det_model_dir": os.path.join(OCR_MODEL_DIR, "det_v6"),
+        "rec_model_dir": os.path.join(OCR_MODEL_DIR, "rec_v2_19_best"),
+    },
+    "onnx": {
+        "backend": "onnx",
+        "use_angle_cls": False,   # 방향 분류 모델은 변환하지 않음 (ocr()도 cls=False로 실행)
+        "show_log": False,
+        "lang": "korean",
+        "det_model_dir": os.path.join(OCR_MODEL_DIR, "onnx/det_v6.onnx"),
+        "rec_model_dir": os.path.join(OCR_MODEL_DIR, "onnx/rec_v2_19_best.onnx"),
+        "ort_inter_op_threads": 1,
+    },
+    # quantize_models.py가 정확도/속도 검사를 통과한 경우에만 만들어 두는 INT8 모델
+    "int8": {
+        "backend": "onnx",
+        "requires_gate": True,
+        "use_angle_cls": False,
+        "show_log": False,
+        "lang": "korean",
+        "det_model_dir": os.path.join(OCR_MODEL_DIR, "onnx/det_v6.int8.onnx"),
+        "rec_model_dir": os.path.join(OCR_MODEL_DIR, "onnx/rec_v2_19_best.int8.onnx"),
+        "ort_inter_op_threads": 1,
+    },
+}
+
+# PaddleOCR에 넘기지 않고 OCREngine이 직접 쓰는 설정 키
+ENGINE_CONFIG_KEYS = ("backend", "ort_intra_op_threads", "ort_inter_op_threads", "requires_gate")
+
+# 백엔드 일치 검사 기준 (check_backend_parity)
+PARITY_IOU_THRESHOLD = 0.9        # 같은 박스로 볼 최소 IoU
+PARITY_MIN_DET_RECALL = 0.98      # 기준 백엔드 박스 중 후보 백엔드가 찾아야 하는 비율
+PARITY_MIN_DET_PRECISION = 0.98   # 후보 백엔드 박스 중 기준 백엔드 박스와 짝지어져야 하는 비율
+PARITY_MIN_TEXT_AGREEMENT = 0.98  # 같은 박스에서 인식 결과가 일치해야 하는 비율
+
+# OCR 실행 위치
+#   "process": 별도 워커 프로세스 풀에서 실행 (Streamlit 스크립트 스레드와 GIL/CPU를 나눠 쓰지 않음)
+#   "thread": Streamlit 프로세스 안의 공유 엔진에서 직접 실행
+OCR_BACKEND = "process"
+OCR_WORKERS = 2                 # 워커 프로세스 수 (각자 모델을 하나씩 로드)
+OCR_TASK_TIMEOUT = 120          # 동기 호출 시 최대 대기 시간 (초)
+
+# 인식 요청 마이크로 배치
+#   여러 세션의 박스 인식 요청을 최대 REC_BATCH_MAX_WAIT_MS 동안 또는 REC_BATCH_MAX_SIZE장까지 모아 한 번에 추론
+REC_BATCH_MAX_SIZE = 32
+REC_BATCH_MAX_WAIT_MS = 5
+
+# OCR 작업 우선순위 (숫자가 작을수록 먼저 실행)
+PRIORITY_INTERACTIVE_BOX = 0     # 박스 단위 라벨 추천 (Ctrl+M)
+PRIORITY_INTERACTIVE_IMAGE = 1   # 이미지 전체 자동 감지 버튼
+PRIORITY_BATCH = 2               # 일괄 작업
+PRIORITY_NAMES = {
+    PRIORITY_INTERACTIVE_BOX: "interactive_box",
+    PRIORITY_INTERACTIVE_IMAGE: "interactive_image",
+    PRIORITY_BATCH: "batch",
+}
+
+# 스케줄러 설정
+#   OCR_MAX_CONCURRENCY: 백엔드에 동시에 보내는 일반 작업 수 (워커 수와 같게 두면 대기열은 스케줄러에만 쌓임)
+#   OCR_RESERVED_BOX_SLOTS: 그와 별도로 둔 박스 추천 전용 슬롯 수 (큰 이미지 작업이 몰려도 박스 추천 지연이 늘지 않게)
+#                           워커 프로세스 풀도 이만큼 더 띄워 전용 슬롯 작업이 워커를 기다리지 않음
+#   OCR_QUEUE_LIMITS: 우선순위별 최대 대기 작업 수, 넘으면 OCROverloadedError로 즉시 거절
+#                     타일 검출처럼 여러 호출로 나뉜 작업은 submit_many로 넣어 한 작업으로 셈
+OCR_MAX_CONCURRENCY = OCR_WORKERS
+OCR_RESERVED_BOX_SLOTS = 1
+OCR_QUEUE_LIMITS = {
+    PRIORITY_INTERACTIVE_BOX: 64,
+    PRIORITY_INTERACTIVE_IMAGE: 8,
+    PRIORITY_BATCH: 10000,
+}
+OCR_METRICS_WINDOW = 200  # 대기 시간 통계에 쓰는 최근 작업 수
+
+# 설정 이름 → OCREngine
+_engine_registry = {}
+_registry_lock = threading.Lock()
+
+# 설정 이름 → OCRWorkerPool
+_pool_registry = {}
+
+# 설정 이름 → RecognitionBatcher
+_batcher_registry = {}
+
+# 설정 이름 → OCRScheduler
+_scheduler_registry = {}
+
+# 워커 프로세스 안에서 사용할 설정 이름 (initializer에서 지정)
+_worker_config_name = DEFAULT_OCR_CONFIG
+
+
+class OCREngine:
+    """
+    PaddleOCR 인스턴스 하나를 여러 세션이 나눠 쓰기 위한 래퍼.
+    Paddle predictor는 스레드 안전하지 않으므로 검출/인식 모델마다 락을 두고 한 번에 하나씩 실행합니다.
+    (검출과 인식은 별도 predictor라 서로 동시에 실행될 수 있음)
+
+    text_detector / text_recognizer를 PaddleOCR과 같은 형태로 제공하므로
+    기존에 PaddleOCR 인스턴스를 받던 함수에 그대로 넘길 수 있습니다.
+    """
+
+    def __init__(self, name, config):
+        self.name = name
+        self.config = dict(config)
+        self.backend = self.config.get("backend", "paddle")
+
+        paddle_config = {key: value for key, value in self.config.items() if key not in ENGINE_CONFIG_KEYS}
+        if self.backend == "onnx":
+            paddle_config["use_onnx"] = True
+        self.paddle = PaddleOCR(**paddle_config)
+        if self.backend == "onnx":
+            self._tune_onnx_sessions()
+
+        self.det_lock = threading.Lock()
+        self.rec_lock = threading.Lock()
+
+    def _tune_onnx_sessions(self):
+        """
+        PaddleOCR이 기본 옵션으로 만든 ONNX Runtime 세션을 스레드 수를 지정한 세션으로 바꿉니다.
+        predictor/input_tensor만 교체하므로 이미지 전처리와 DB/CTC 후처리는 PaddleOCR 코드가 그대로 수행합니다.
+        """
+        intra_threads = self.config.get("ort_intra_op_threads") or self.config.get("cpu_threads") or 0
+        inter_threads = self.config.get("ort_inter_op_threads", 1)
+        for predictor, model_path in (
+            (self.paddle.text_detector, self.config["det_model_dir"]),
+            (self.paddle.text_recognizer, self.config["rec_model_dir"]),
+        ):
+            session = create_ort_session(model_path, intra_threads, inter_threads)
+            predictor.predictor = session
+            predictor.input_tensor = session.get_inputs()[0]
+            predictor.output_tensors = None
+
+    def text_detector(self, img_np):
+        """텍스트 영역 검출. PaddleOCR text_detector와 같은 (boxes, elapse)를 반환합니다."""
+        with self.det_lock:
+            return self.paddle.text_detector(img_np)
+
+    def text_recognizer(self, images):
+        """잘라낸 텍스트 이미지 목록 인식. PaddleOCR text_recognizer와 같은 (rec_res, elapse)를 반환합니다."""
+        with self.rec_lock:
+            return self.paddle.text_recognizer(images)
+
+    def ocr(self, img_np):
+        """검출+인식 전체 실행. [[box, (text, score)], ...]를 반환합니다."""
+        with self.det_lock, self.rec_lock:
+            result = self.paddle.ocr(img_np, cls=False)
+        return result[0] if result and result[0] else []
+
+    def det_decode_side(self):
+        """
+        검출 모델이 내부적으로 사용하는 최대 변 길이를 반환합니다.
+        det_limit_type이 'max'가 아니면 None을 반환합니다.
+        """
+        det_args = getattr(self.paddle.text_detector, "args", None)
+        if det_args is None or getattr(det_args, "det_limit_type", "max") != "max":
+            return None
+        return getattr(det_args, "det_limit_side_len", 960)
+
+
+def create_ort_session(model_path, intra_threads=0, inter_threads=1):
+    """
+    CPU용 ONNX Runtime 세션을 만듭니다.
+    intra_threads가 0이면 ONNX Runtime이 코어 수에 맞춰 정합니다.
+    워커 프로세스마다 코어 묶음이 고정되므로 inter-op 병렬은 끄고(1) 연산자 내부 병렬만 씁니다.
+    """
+    import onnxruntime as ort  # onnx 백엔드를 쓸 때만 필요
+
+    options = ort.SessionOptions()
+    options.intra_op_num_threads = intra_threads
+    options.inter_op_num_threads = inter_threads
+    options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    return ort.InferenceSession(model_path, sess_options=options, providers=["CPUExecutionProvider"])
+
+
+def _model_file_stats(model_dir):
+    """모델 디렉터리(또는 onnx 모델 파일 하나)의 (이름, 크기, 수정 시각) 목록을 반환합니다."""
+    files = []
+    if model_dir and os.path.isdir(model_dir):
+        for name in sorted(os.listdir(model_dir)):
+            stat = os.stat(os.path.join(model_dir, name))
+            files.append((name, stat.st_size, stat.st_mtime_ns))
+    elif model_dir and os.path.isfile(model_dir):
+        stat = os.stat(model_dir)
+        files.append((os.path.basename(model_dir), stat.st_size, stat.st_mtime_ns))
+    return tuple(files)
+
+
+def get_model_fingerprint(config_name=DEFAULT_OCR_CONFIG, stage="det"):
+    """
+    OCR 결과 캐시 키에 쓰는 모델 식별값.
+    해당 단계(det/rec)의 설정값과 모델 디렉터리 파일(이름, 크기, 수정 시각)이 바뀌면 값도 바뀝니다.
+    파일 정보는 매번 확인하므로 재시작 없이 모델 파일을 교체해도 바로 다른 값이 됩니다.
+    """
+    config = OCR_MODEL_CONFIGS[config_name]
+    return _model_fingerprint(config_name, stage, _model_file_stats(config.get(f"{stage}_model_dir")))
+
+
+@functools.lru_cache(maxsize=256)
+def _model_fingerprint(config_name, stage, files):
+    config = OCR_MODEL_CONFIGS[config_name]
+    params = {
+        key: value for key, value in sorted(config.items())
+        if key.startswith(stage) or key in ("lang", "backend")
+    }
+    payload = json.dumps([params, files], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def get_gate_report_path(config_name):
+    """quantize_models.py가 검사 보고서를 저장하는 경로 (검출 모델 파일 옆의 *.report.json)."""
+    return os.path.splitext(OCR_MODEL_CONFIGS[config_name]["det_model_dir"])[0] + ".report.json"
+
+
+def check_model_gate(config_name):
+    """
+    requires_gate 설정이면 검사 보고서가 통과 상태이고, 보고서에 기록된 모델 식별값이
+    지금 설치된 det/rec 모델과 같은지 확인합니다. 아니면 RuntimeError를 발생시킵니다.
+    (보고서 없이 모델 파일만 복사했거나, 검사 후 모델 파일을 바꾼 경우 로드하지 않음)
+    """
+    if not OCR_MODEL_CONFIGS[config_name].get("requires_gate"):
+        return
+    report_path = get_gate_report_path(config_name)
+    try:
+        with open(report_path, encoding="utf-8") as f:
+            report = json.load(f)
+    except (OSError, ValueError) as e:
+        raise RuntimeError(f"{config_name} 모델의 검사 보고서를 읽을 수 없습니다 ({report_path}): {e}")
+
+    if not report.get("passed"):
+        raise RuntimeError(f"{config_name} 모델이 검사를 통과하지 못했습니다: {report.get('reasons')}")
+    fingerprints = report.get("fingerprints") or {}
+    for stage in ("det", "rec"):
+        if fingerprints.get(stage) != get_model_fingerprint(config_name, stage):
+            raise RuntimeError(
+                f"{config_name} {stage} 모델이 검사한 모델과 다릅니다. quantize_models.py를 다시 실행하세요."
+            )
+
+
+def get_ocr_engine(config_name=DEFAULT_OCR_CONFIG):
+    """
+    설정 이름에 해당하는 공유 OCR 엔진을 반환합니다.
+    처음 호출될 때만 모델을 로드하며, 동시에 여러 세션이 요청해도 한 번만 로드합니다.
+
+    Args:
+        config_name (str): OCR_MODEL_CONFIGS의 키
+
+    Returns:
+        OCREngine: 공유 엔진
+    """
+    engine = _engine_registry.get(config_name)
+    if engine is not None:
+        return engine
+
+    with _registry_lock:
+        engine = _engine_registry.get(config_name)
+        if engine is None:
+            check_model_gate(config_name)
+            print(f"DEBUG: OCR 모델 로드 시작: {config_name}")
+            engine = OCREngine(config_name, OCR_MODEL_CONFIGS[config_name])
+            _engine_registry[config_name] = engine
+            print(f"DEBUG: OCR 모델 로드 완료: {config_name}")
+    return engine
+
+
+
+def _init_ocr_worker(config_name, cpu_groups, worker_counter):
+    """
+    워커 프로세스 초기화: 코어 묶음 하나에 고정하고 그 코어 수만큼만 스레드를 쓰도록 모델을 로드합니다.
+    """
+    global _worker_config_name
+    _worker_config_name = config_name
+
+    with worker_counter.get_lock():
+        index = worker_counter.value
+        worker_counter.value += 1
+    cpus = cpu_groups[index % len(cpu_groups)] if cpu_groups else None
+
+    config = OCR_MODEL_CONFIGS[config_name]
+    if cpus:
+        # sched_setaffinity는 Linux 전용 (macOS 등에서는 고정 없이 실행)
+        if hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, cpus)
+        config = {**config, "cpu_threads": len(cpus)}
+        OCR_MODEL_CONFIGS[config_name] = config
+
+    get_ocr_engine(config_name)
+    print(f"DEBUG: OCR 워커 {index} 준비 완료 (pid={os.getpid()}, cpus={cpus})")
+
+
+def _worker_detect(img_np):
+    return get_ocr_engine(_worker_config_name).text_detector(img_np)
+
+
+def _worker_recognize(images):
+    return get_ocr_engine(_worker_config_name).text_recognizer(images)
+
+
+def _worker_ocr(img_np):
+    return get_ocr_engine(_worker_config_name).ocr(img_np)
+
+
+def _worker_det_decode_side():
+    return get_ocr_engine(_worker_config_name).det_decode_side()
+
+
+def split_cpus(workers):
+    """사용 가능한 코어를 워커 수만큼 겹치지 않게 나눕니다."""
+    if hasattr(os, "sched_getaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+    else:
+        cpus = list(range(os.cpu_count() or 1))
+    per_worker = max(1, len(cpus) // workers)
+    return [cpus[i * per_worker:(i + 1) * per_worker] or cpus for i in range(workers)]
+
+
+class OCRWorkerPool:
+    """
+    OCR 전용 워커 프로세스 풀.
+    각 워커는 자기 모델을 가지고 코어 일부에 고정되며, 요청은 multiprocessing 큐로 전달됩니다.
+    submit_* 메서드는 concurrent.futures.Future를 반환하고,
+    text_detector / text_recognizer / ocr는 OCREngine과 같은 동기 인터페이스를 제공합니다.
+
+    워커 하나가 비정상 종료(메모리 부족 등)하면 ProcessPoolExecutor 전체가 깨져 이후 제출이 모두
+    BrokenProcessPool로 실패하므로, 제출할 때 이를 감지하면 풀을 새로 띄우고 다시 제출합니다.
+    (종료 시점에 실행 중이던 작업은 BrokenProcessPool로 실패하며 다시 실행하지 않음)
+    """
+
+    def __init__(self, config_name=DEFAULT_OCR_CONFIG, workers=OCR_WORKERS):
+        self.config_name = config_name
+        self.workers = workers
+        self._lock = threading.Lock()
+        self.executor = self._create_executor()
+        self._det_decode_side = None
+
+    def _create_executor(self):
+        # fork는 Paddle/Streamlit 스레드 상태를 복제하므로 spawn 사용
+        ctx = multiprocessing.get_context("spawn")
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=ctx,
+            initializer=_init_ocr_worker,
+            initargs=(self.config_name, split_cpus(self.workers), ctx.Value("i", 0)),
+        )
+
+    def _rebuild(self, broken):
+        """깨진 풀을 새 풀로 바꿉니다. 다른 스레드가 이미 바꿨으면 그대로 둡니다."""
+        with self._lock:
+            if self.executor is not broken:
+                return
+            print(f"DEBUG: OCR 워커 풀이 깨져 다시 시작합니다: {self.config_name}")
+            broken.shutdown(wait=False, cancel_futures=True)
+            self.executor = self._create_executor()
+
+    def _submit(self, fn, *args):
+        executor = self.executor
+        try:
+            return executor.submit(fn, *args)
+        except BrokenProcessPool:
+            self._rebuild(executor)
+            return self.executor.submit(fn, *args)
+
+    def submit_detect(self, img_np):
+        """텍스트 영역 검출 작업을 제출합니다. 결과: (boxes, elapse)"""
+        return self._submit(_worker_detect, img_np)
+
+    def submit_recognize(self, images):
+        """잘라낸 이미지 목록 인식 작업을 제출합니다. 결과: (rec_res, elapse)"""
+        return self._submit(_worker_recognize, images)
+
+    def submit_ocr(self, img_np):
+        """검출+인식 전체 작업을 제출합니다. 결과: [[box, (text, score)], ...]"""
+        return self._submit(_worker_ocr, img_np)
+
+    def text_detector(self, img_np):
+        return self.submit_detect(img_np).result(timeout=OCR_TASK_TIMEOUT)
+
+    def text_recognizer(self, images):
+        return self.submit_recognize(images).result(timeout=OCR_TASK_TIMEOUT)
+
+    def ocr(self, img_np):
+        return self.submit_ocr(img_np).result(timeout=OCR_TASK_TIMEOUT)
+
+    def det_decode_side(self):
+        if self._det_decode_side is None:
+            self._det_decode_side = self._submit(_worker_det_decode_side).result(timeout=OCR_TASK_TIMEOUT)
+        return self._det_decode_side
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def get_ocr_worker_pool(config_name=DEFAULT_OCR_CONFIG):
+    """설정 이름에 해당하는 프로세스 공유 OCR 워커 풀을 반환합니다 (처음 호출 시 생성)."""
+    pool = _pool_registry.get(config_name)
+    if pool is not None:
+        return pool
+
+    with _registry_lock:
+        pool = _pool_registry.get(config_name)
+        if pool is None:
+            # 워커 initializer에서 실패하면 풀 전체가 깨지므로 만들기 전에 확인
+            check_model_gate(config_name)
+            pool = OCRWorkerPool(config_name, workers=OCR_WORKERS + OCR_RESERVED_BOX_SLOTS)
+            _pool_registry[config_name] = pool
+    return pool
+
+
+def get_ocr_service(config_name=DEFAULT_OCR_CONFIG):
+    """
+    OCR_BACKEND 설정에 따라 워커 풀 또는 프로세스 내 공유 엔진을 반환합니다.
+    둘 다 text_detector / text_recognizer / ocr / det_decode_side를 제공합니다.
+    """
+    if OCR_BACKEND == "process":
+        return get_ocr_worker_pool(config_name)
+    return get_ocr_engine(config_name)
+
+
+def crop_boxes(img_np, boxes):
+    """검출 박스(4점 좌표)마다 외접 사각형 영역을 잘라 반환합니다."""
+    crops = []
+    for points in boxes:
+        points = np.asarray(points)
+        x_min, x_max = int(points[:, 0].min()), int(points[:, 0].max())
+        y_min, y_max = int(points[:, 1].min()), int(points[:, 1].max())
+        crops.append(img_np[max(y_min, 0):y_max, max(x_min, 0):x_max])
+    return crops
+
+
+def recognize_crops(crops, ocr, batch_size=32):
+    """
+    잘라낸 이미지들을 종횡비(w/h) 순으로 정렬해 배치로 인식하고 결과를 입력 순서대로 돌려줍니다.
+    비슷한 길이의 crop끼리 같은 배치에 들어가므로 배치 안에서 가장 긴 crop에 맞춘 패딩이 줄어듭니다.
+    크기 조정/패딩은 인식기(PaddleOCR TextRecognizer)가 배치마다 직접 하므로 원본 crop을 그대로 넘깁니다.
+    크기가 0인 이미지는 인식하지 않습니다.
+
+    Returns:
+        list: 입력과 같은 길이의 [(text, score) 또는 None, ...]
+    """
+    results = [None] * len(crops)
+    indices = [i for i, crop in enumerate(crops) if crop.shape[0] > 0 and crop.shape[1] > 0]
+    indices.sort(key=lambda i: crops[i].shape[1] / crops[i].shape[0])
+    for start in range(0, len(indices), batch_size):
+        batch_indices = indices[start:start + batch_size]
+        batch = [
+            cv2.cvtColor(crops[i], cv2.COLOR_GRAY2RGB) if crops[i].ndim == 2 else crops[i]
+            for i in batch_indices
+        ]
+        rec_results = ocr.text_recognizer(batch)
+        if rec_results is None or len(rec_results[0]) == 0:
+            continue
+        # 정렬된 배치 결과를 원래 입력 위치에 되돌려 넣음
+        for i, text_info in zip(batch_indices, rec_results[0]):
+            results[i] = text_info
+    return results
+
+
+class OCROverloadedError(Exception):
+    """OCR 대기열이 가득 차서 작업을 받지 않을 때 발생하는 예외"""
+    pass
+
+
+class _ScheduledJob:
+    """스케줄러 대기 중인 백엔드 호출 하나 (group: 같은 작업으로 함께 받아들인 호출 묶음)"""
+
+    def __init__(self, priority, user, method, args, group):
+        self.priority = priority
+        self.user = user
+        self.method = method
+        self.args = args
+        self.group = group
+        self.future = Future()
+        self.enqueued_at = time.monotonic()
+
+
+class _JobGroup:
+    """대기열 한도에서 작업 하나로 세는 호출 묶음 (아직 꺼내지 않은 호출 수)"""
+
+    def __init__(self, size):
+        self.pending = size
+
+
+class OCRScheduler:
+    """
+    OCR 작업 스케줄러 (우선순위 + 동시 실행 제한 + 대기열 제한 + 사용자별 공정성).
+
+    - 우선순위가 높은 클래스의 작업을 항상 먼저 꺼냄 (박스 추천 > 이미지 자동 감지 > 일괄 작업)
+    - 같은 클래스 안에서는 사용자별 대기열을 번갈아 꺼내 한 사용자의 큰 작업이 다른 사용자를 막지 않음
+    - 백엔드로 나가는 일반 작업은 max_concurrency개로 제한하고, 별도의 reserved_box_slots개는 박스 추천만 실행
+    - 클래스별 대기 작업 수가 한도를 넘으면 OCROverloadedError로 바로 거절 (부하 차단)
+      submit_many로 넣은 호출 묶음은 작업 하나로 세고, 전부 받거나 전부 거절함
+    """
+
+    def __init__(self, backend, max_concurrency=OCR_MAX_CONCURRENCY, queue_limits=None,
+                 reserved_box_slots=OCR_RESERVED_BOX_SLOTS):
+        self.backend = backend
+        self.queue_limits = dict(OCR_QUEUE_LIMITS if queue_limits is None else queue_limits)
+        # 우선순위 → (사용자 → 작업 deque), OrderedDict 순서가 라운드로빈 순서
+        self._queues = {priority: OrderedDict() for priority in PRIORITY_NAMES}
+        self._depth = {priority: 0 for priority in PRIORITY_NAMES}        # 대기 중인 작업(묶음) 수
+        self._task_depth = {priority: 0 for priority in PRIORITY_NAMES}   # 대기 중인 백엔드 호출 수
+        self._cond = threading.Condition()
+        self._metrics = {
+            priority: {
+                "running": 0,
+                "completed": 0,
+                "failed": 0,
+                "rejected": 0,
+                "wait_ms": deque(maxlen=OCR_METRICS_WINDOW),
+                "run_ms": deque(maxlen=OCR_METRICS_WINDOW),
+            }
+            for priority in PRIORITY_NAMES
+        }
+        self._threads = [
+            threading.Thread(
+                target=self._run,
+                args=(PRIORITY_INTERACTIVE_BOX if i < reserved_box_slots else max(PRIORITY_NAMES),),
+                name=f"ocr-scheduler-{i}",
+                daemon=True
+            )
+            for i in range(reserved_box_slots + max_concurrency)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, method, *args, priority=PRIORITY_BATCH, user=None):
+        """
+        백엔드 메서드(text_detector / text_recognizer / ocr) 호출을 대기열에 넣고 Future를 반환합니다.
+
+        Raises:
+            OCROverloadedError: 해당 우선순위 대기열이 가득 찬 경우
+        """
+        return self.submit_many(method, [args], priority=priority, user=user)[0]
+
+    def submit_many(self, method, args_list, priority=PRIORITY_BATCH, user=None):
+        """
+        같은 작업에 속한 여러 백엔드 호출(예: 한 이미지의 타일 검출)을 한꺼번에 대기열에 넣고 Future 목록을 반환합니다.
+        대기열 한도에는 작업 하나로 세며, 일부만 들어가는 일 없이 전부 받거나 전부 거절합니다.
+        호출들은 빈 슬롯에서 나눠 동시에 실행됩니다.
+
+        Raises:
+            OCROverloadedError: 해당 우선순위 대기열이 가득 찬 경우
+        """
+        group = _JobGroup(len(args_list))
+        jobs = [_ScheduledJob(priority, user, method, args, group) for args in args_list]
+        if not jobs:
+            return []
+        with self._cond:
+            if self._depth[priority] >= self.queue_limits.get(priority, 0):
+                self._metrics[priority]["rejected"] += 1
+                raise OCROverloadedError(
+                    f"OCR 대기열이 가득 찼습니다 ({PRIORITY_NAMES[priority]}: {self._depth[priority]}건 대기 중)"
+                )
+            self._queues[priority].setdefault(user, deque()).extend(jobs)
+            self._depth[priority] += 1
+            self._task_depth[priority] += len(jobs)
+            # 전용 슬롯 스레드가 받을 수 없는 작업일 수 있으므로 모두 깨움
+            self._cond.notify_all()
+        return [job.future for job in jobs]
+
+    def client(self, priority, user=None):
+        """지정한 우선순위/사용자로 작업을 넣는 OCR 백엔드 인터페이스를 반환합니다."""
+        return ScheduledOCRClient(self, priority, user)
+
+    def _next_job(self, lowest_priority):
+        """
+        lowest_priority 이내에서 가장 높은 우선순위 클래스의 다음 차례 사용자 작업을 꺼냅니다.
+        (락을 잡은 상태에서 호출)
+        """
+        for priority in sorted(self._queues):
+            if priority > lowest_priority:
+                break
+            users = self._queues[priority]
+            if not users:
+                continue
+            user, jobs = next(iter(users.items()))
+            job = jobs.popleft()
+            # 꺼낸 사용자는 순서 맨 뒤로 (남은 작업이 없으면 제거)
+            del users[user]
+            if jobs:
+                users[user] = jobs
+            self._task_depth[priority] -= 1
+            job.group.pending -= 1
+            if job.group.pending == 0:
+                self._depth[priority] -= 1
+            return job
+        return None
+
+    def _run(self, lowest_priority):
+        while True:
+            with self._cond:
+                job = self._next_job(lowest_priority)
+                while job is None:
+                    self._cond.wait()
+                    job = self._next_job(lowest_priority)
+                metrics = self._metrics[job.priority]
+                metrics["running"] += 1
+                metrics["wait_ms"].append((time.monotonic() - job.enqueued_at) * 1000)
+
+            if not job.future.set_running_or_notify_cancel():
+                with self._cond:
+                    metrics["running"] -= 1
+                continue
+
+            started = time.monotonic()
+            try:
+                result = getattr(self.backend, job.method)(*job.args)
+            except Exception as e:
+                job.future.set_exception(e)
+                failed = True
+            else:
+                job.future.set_result(result)
+                failed = False
+
+            with self._cond:
+                metrics["running"] -= 1
+                metrics["failed" if failed else "completed"] += 1
+                metrics["run_ms"].append((time.monotonic() - started) * 1000)
+
+    def get_metrics(self):
+        """우선순위 클래스별 대기/실행/거절 수와 최근 대기·실행 시간(p50/p95, ms)을 반환합니다."""
+        def percentile(values, q):
+            if not values:
+                return None
+            ordered = sorted(values)
+            return round(ordered[min(len(ordered) - 1, int(len(ordered) * q))], 1)
+
+        with self._cond:
+            return {
+                PRIORITY_NAMES[priority]: {
+                    "queued": self._depth[priority],
+                    "queued_tasks": self._task_depth[priority],
+                    "queued_users": len(self._queues[priority]),
+                    "running": metrics["running"],
+                    "completed": metrics["completed"],
+                    "failed": metrics["failed"],
+                    "rejected": metrics["rejected"],
+                    "wait_ms_p50": percentile(metrics["wait_ms"], 0.5),
+                    "wait_ms_p95": percentile(metrics["wait_ms"], 0.95),
+                    "run_ms_p50": percentile(metrics["run_ms"], 0.5),
+                    "run_ms_p95": percentile(metrics["run_ms"], 0.95),
+                }
+                for priority, metrics in self._metrics.items()
+            }
+
+
+class ScheduledOCRClient:
+    """
+    스케줄러를 거쳐 실행되는 OCR 백엔드 인터페이스.
+    OCREngine과 같은 text_detector / text_recognizer / ocr / det_decode_side와
+    비동기용 submit_detect / submit_recognize / submit_ocr를 제공합니다.
+    검출+인식 전체 실행(ocr)도 다른 호출과 같은 대기열/우선순위/동시 실행 제한을 거칩니다.
+
+    일괄 작업은 화면 작업에 밀려 오래 기다리는 것이 정상이므로 동기 호출에 시간 제한을 두지 않습니다 (timeout=None).
+    """
+
+    def __init__(self, scheduler, priority, user=None):
+        self.scheduler = scheduler
+        self.priority = priority
+        self.user = user
+        self.timeout = None if priority == PRIORITY_BATCH else OCR_TASK_TIMEOUT
+
+    def _submit(self, method, *args):
+        return self.scheduler.submit(method, *args, priority=self.priority, user=self.user)
+
+    def submit_detect(self, img_np):
+        return self._submit("text_detector", img_np)
+
+    def submit_detect_many(self, images):
+        """여러 이미지(타일)의 검출을 작업 하나로 넣고 Future 목록을 반환합니다."""
+        return self.scheduler.submit_many(
+            "text_detector", [(img_np,) for img_np in images], priority=self.priority, user=self.user
+        )
+
+    def submit_recognize(self, images):
+        return self._submit("text_recognizer", images)
+
+    def submit_ocr(self, img_np):
+        """검출+인식 전체 작업을 넣습니다. 결과: [[box, (text, score)], ...]"""
+        return self._submit("ocr", img_np)
+
+    def text_detector(self, img_np):
+        return self.submit_detect(img_np).result(timeout=self.timeout)
+
+    def text_recognizer(self, images):
+        return self.submit_recognize(images).result(timeout=self.timeout)
+
+    def ocr(self, img_np):
+        return self.submit_ocr(img_np).result(timeout=self.timeout)
+
+    def det_decode_side(self):
+        # 설정 조회는 추론이 아니므로 대기열을 거치지 않음
+        return self.scheduler.backend.det_decode_side()
+
+
+class _RecognitionRequest:
+    """배치 대기 중인 인식 요청 하나 (이미지 목록과 결과를 돌려줄 Future)"""
+
+    def __init__(self, images):
+        self.images = list(images)
+        self.future = Future()
+
+
+class RecognitionBatcher:
+    """
+    text_recognizer 앞에서 요청을 잠깐 모아 한 번의 배치 추론으로 처리하는 스케줄러.
+    첫 요청이 들어온 뒤 max_wait_ms 동안, 또는 모은 이미지가 max_batch_size에 도달할 때까지 기다렸다가
+    한 번에 추론하고 결과를 요청별로 나눠 돌려줍니다.
+
+    백엔드가 submit_recognize를 제공하면(워커 풀) 배치를 비동기로 제출해 여러 배치가 워커에서 동시에 실행됩니다.
+    """
+
+    def __init__(self, backend, max_batch_size=REC_BATCH_MAX_SIZE, max_wait_ms=REC_BATCH_MAX_WAIT_MS):
+        self.backend = backend
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue = queue.Queue()
+        self._carry = None  # 배치 크기를 넘어 다음 배치로 넘긴 요청
+        self._thread = threading.Thread(target=self._run, name="rec-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, images):
+        """잘라낸 이미지 목록을 인식 대기열에 넣고, [(text, score), ...]를 돌려줄 Future를 반환합니다."""
+        request = _RecognitionRequest(images)
+        if not request.images:
+            request.future.set_result([])
+        else:
+            self._queue.put(request)
+        return request.future
+
+    def text_recognizer(self, images):
+        """OCREngine과 같은 동기 인터페이스. (rec_res, elapse)를 반환합니다 (elapse는 None)."""
+        return self.submit(images).result(timeout=OCR_TASK_TIMEOUT), None
+
+    def _collect(self):
+        """다음 배치로 보낼 요청들을 모읍니다."""
+        first = self._carry if self._carry is not None else self._queue.get()
+        self._carry = None
+        batch = [first]
+        count = len(first.images)
+        deadline = time.monotonic() + self.max_wait
+
+        while count < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if count + len(request.images) > self.max_batch_size:
+                self._carry = request
+                break
+            batch.append(request)
+            count += len(request.images)
+        return batch
+
+    @staticmethod
+    def _fan_out(batch, rec_res):
+        """배치 추론 결과를 요청 순서대로 잘라 각 Future에 전달합니다."""
+        offset = 0
+        for request in batch:
+            n = len(request.images)
+            request.future.set_result(list(rec_res[offset:offset + n]))
+            offset += n
+
+    @staticmethod
+    def _fail(batch, error):
+        for request in batch:
+            if not request.future.done():
+                request.future.set_exception(error)
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            images = [image for request in batch for image in request.images]
+            try:
+                if hasattr(self.backend, "submit_recognize"):
+                    future = self.backend.submit_recognize(images)
+
+                    def done(f, batch=batch):
+                        try:
+                            self._fan_out(batch, f.result()[0])
+                        except Exception as e:
+                            self._fail(batch, e)
+
+                    future.add_done_callback(done)
+                else:
+                    rec_res, _ = self.backend.text_recognizer(images)
+                    self._fan_out(batch, rec_res)
+            except Exception as e:
+                self._fail(batch, e)
+
+
+def get_recognition_batcher(config_name=DEFAULT_OCR_CONFIG):
+    """OCR 서비스 앞에 붙는 프로세스 공유 인식 배치 스케줄러를 반환합니다 (처음 호출 시 생성)."""
+    batcher = _batcher_registry.get(config_name)
+    if batcher is not None:
+        return batcher
+
+    # 모은 배치는 박스 추천 우선순위로 스케줄러를 거쳐 실행
+    backend = get_ocr_scheduler(config_name).client(PRIORITY_INTERACTIVE_BOX, user="rec-batcher")
+    with _registry_lock:
+        batcher = _batcher_registry.get(config_name)
+        if batcher is None:
+            batcher = RecognitionBatcher(backend)
+            _batcher_registry[config_name] = batcher
+    return batcher
+
+
+def get_ocr_scheduler(config_name=DEFAULT_OCR_CONFIG):
+    """OCR 서비스 앞에 붙는 프로세스 공유 스케줄러를 반환합니다 (처음 호출 시 생성)."""
+    scheduler = _scheduler_registry.get(config_name)
+    if scheduler is not None:
+        return scheduler
+
+    backend = get_ocr_service(config_name)
+    with _registry_lock:
+        scheduler = _scheduler_registry.get(config_name)
+        if scheduler is None:
+            scheduler = OCRScheduler(backend)
+            _scheduler_registry[config_name] = scheduler
+    return scheduler
+
+
+def get_ocr_metrics(config_name=DEFAULT_OCR_CONFIG):
+    """스케줄러 대기열 통계를 반환합니다. 아직 OCR을 한 번도 쓰지 않았으면 None (워커를 띄우지 않음)."""
+    scheduler = _scheduler_registry.get(config_name)
+    return scheduler.get_metrics() if scheduler is not None else None
+
+
+def box_iou(a, b):
+    """두 박스(4점 좌표 또는 [x_min, y_min, x_max, y_max])의 외접 사각형 IoU를 계산합니다."""
+    a = np.asarray(a, dtype=np.float32).reshape(-1, 2)
+    b = np.asarray(b, dtype=np.float32).reshape(-1, 2)
+    ax0, ay0 = a.min(axis=0)
+    ax1, ay1 = a.max(axis=0)
+    bx0, by0 = b.min(axis=0)
+    bx1, by1 = b.max(axis=0)
+    inter = max(0.0, min(ax1, bx1) - max(ax0, bx0)) * max(0.0, min(ay1, by1) - max(ay0, by0))
+    union = (ax1 - ax0) * (ay1 - ay0) + (bx1 - bx0) * (by1 - by0) - inter
+    return float(inter / union) if union > 0 else 0.0
+
+
+def match_boxes(reference, candidate, iou_threshold=PARITY_IOU_THRESHOLD):
+    """
+    IoU가 높은 쌍부터 기준/후보 박스를 1:1로 짝지어 [(기준 index, 후보 index), ...]를 반환합니다.
+    """
+    pairs = []
+    for i, ref_box in enumerate(reference):
+        for j, cand_box in enumerate(candidate):
+            iou = box_iou(ref_box, cand_box)
+            if iou >= iou_threshold:
+                pairs.append((iou, i, j))
+
+    matched, used_ref, used_cand = [], set(), set()
+    for _, i, j in sorted(pairs, reverse=True):
+        if i not in used_ref and j not in used_cand:
+            matched.append((i, j))
+            used_ref.add(i)
+            used_cand.add(j)
+    return matched
+
+
+def check_backend_parity(image_dir="images", reference=DEFAULT_OCR_CONFIG, candidate="onnx", limit=None,
+                         iou_threshold=PARITY_IOU_THRESHOLD):
+    """
+    두 OCR 설정(예: paddle과 onnx)이 같은 이미지에서 같은 결과를 내는지 확인합니다.
+    검출은 박스 IoU로 짝을 지어 재현율/정밀도를, 인식은 기준 설정이 찾은 박스를 두 설정에 똑같이 넣어 텍스트 일치율을 봅니다.
+    모델 변환이나 백엔드 변경 후 저장소의 images/로 실행합니다 (python ocr_utils.py --candidate onnx).
+
+    Returns:
+        dict: 집계 결과와 기준 통과 여부(passed)
+    """
+    engines = {"reference": get_ocr_engine(reference), "candidate": get_ocr_engine(candidate)}
+    image_names = sorted(
+        name for name in os.listdir(image_dir)
+        if os.path.splitext(name)[1].lower() in (".jpg", ".jpeg", ".png")
+    )[:limit]
+
+    ref_count = cand_count = matched_count = text_total = text_equal = 0
+    det_time = {"reference": 0.0, "candidate": 0.0}
+    rec_time = {"reference": 0.0, "candidate": 0.0}
+    mismatched_images = []
+
+    for name in image_names:
+        img_np = cv2.imread(os.path.join(image_dir, name))
+        if img_np is None:
+            continue
+        img_np = cv2.cvtColor(img_np, cv2.COLOR_BGR2RGB)
+
+        boxes = {}
+        for key, engine in engines.items():
+            start = time.perf_counter()
+            result = engine.text_detector(img_np)
+            det_time[key] += time.perf_counter() - start
+            boxes[key] = list(result[0]) if result and result[0] is not None else []
+
+        matched = match_boxes(boxes["reference"], boxes["candidate"], iou_threshold)
+        ref_count += len(boxes["reference"])
+        cand_count += len(boxes["candidate"])
+        matched_count += len(matched)
+
+        crops = crop_boxes(img_np, boxes["reference"])
+        texts = {}
+        for key, engine in engines.items():
+            start = time.perf_counter()
+            texts[key] = recognize_crops(crops, engine)
+            rec_time[key] += time.perf_counter() - start
+        equal = sum(
+            1 for ref_text, cand_text in zip(texts["reference"], texts["candidate"])
+            if (ref_text[0] if ref_text else "") == (cand_text[0] if cand_text else "")
+        )
+        text_total += len(crops)
+        text_equal += equal
+
+        if len(matched) < max(len(boxes["reference"]), len(boxes["candidate"])) or equal < len(crops):
+            mismatched_images.append(name)
+
+    det_recall = matched_count / ref_count if ref_count else 1.0
+    det_precision = matched_count / cand_count if cand_count else 1.0
+    text_agreement = text_equal / text_total if text_total else 1.0
+    return {
+        "reference": reference,
+        "candidate": candidate,
+        "images": len(image_names),
+        "reference_boxes": ref_count,
+        "candidate_boxes": cand_count,
+        "det_recall": det_recall,
+        "det_precision": det_precision,
+        "text_agreement": text_agreement,
+        "det_time": det_time,
+        "rec_time": rec_time,
+        "mismatched_images": mismatched_images,
+        "passed": (
+            det_recall >= PARITY_MIN_DET_RECALL
+            and det_precision >= PARITY_MIN_DET_PRECISION
+            and text_agreement >= PARITY_MIN_TEXT_AGREEMENT
+        ),
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="두 OCR 설정(백엔드)의 검출/인식 결과가 일치하는지 확인합니다.")
+    parser.add_argument("--images", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "images"))
+    parser.add_argument("--reference", default=DEFAULT_OCR_CONFIG)
+    parser.add_argument("--candidate", default="onnx")
+    parser.add_argument("--limit", type=int, default=None, help="검사할 이미지 수 (기본: 전체)")
+    args = parser.parse_args()
+
+    report = check_backend_parity(args.images, args.reference, args.candidate, args.limit)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    sys.exit(0 if report["passed"] else 1)
@@ -25,6 +25,7 @@ from sklearn.metrics.pairwise import cosine_similarity
 from scipy.spatial.distance import cdist
 
 from paddleocr import PaddleOCR, draw_ocr
+from ocr_utils import crop_boxes, recognize_crops
 import paddle
 
 # from ultralytics import YOLO
@@ -631,7 +632,7 @@ def preprocess_roi(cropped, target_width=320, target_height=48):
     
     return processed
     
-def process_image_batch(image_path, ocr, batch_size=32, width=320, height=48):
+def process_image_batch(image_path, ocr, batch_size=32):
     # OpenCV로 이미지 로드 + RGB 변환 (빠른 처리)
     img_np = cv2.imread(image_path)
     if img_np is None:
@@ -645,45 +646,17 @@ def process_image_batch(image_path, ocr, batch_size=32, width=320, height=48):
     boxes_result = ocr.text_detector(img_np)
     boxes = boxes_result[0]
 
-    # ROI 추출 및 전처리
-    roi_images = []
-    valid_boxes = []
-
-    for points in boxes:
-        x_min = int(min(points[:, 0]))
-        x_max = int(max(points[:, 0]))
-        y_min = int(min(points[:, 1]))
-        y_max = int(max(points[:, 1]))
-        
-        # ROI 추출
-        cropped = img_np[y_min:y_max, x_min:x_max]
-        # processed = cv2.resize(cropped, (width, height))
-        processed = preprocess_roi(cropped, width, height)
-        
-        roi_images.append(processed)
-        valid_boxes.append(points)
+    # ROI 추출 후 배치 인식 (결과는 검출 순서)
+    results = recognize_crops(crop_boxes(img_np, boxes), ocr, batch_size=batch_size)
 
     paddle_boxes = []
     paddle_txts = []
     paddle_scores = []
-
-    # 배치 단위로 Recognition 수행
-    for i in range(0, len(roi_images), batch_size):
-        batch_images = roi_images[i:i+batch_size]
-        batch_boxes = valid_boxes[i:i+batch_size]
-        
-        rec_results = ocr.text_recognizer(batch_images)
-        
-        if rec_results is None or len(rec_results[0]) == 0:
-            continue
-            
-        texts = rec_results[0]
-        
-        for j, (text_info, box) in enumerate(zip(texts, batch_boxes)):
-            if text_info is not None:
-                text, conf = text_info
-                paddle_boxes.append(box.tolist())
-                paddle_txts.append(text)
-                paddle_scores.append(conf)
+    for points, text_info in zip(boxes, results):
+        if text_info is not None:
+            text, conf = text_info
+            paddle_boxes.append(points.tolist())
+            paddle_txts.append(text)
+            paddle_scores.append(conf)
 
     return paddle_boxes, paddle_txts, paddle_scores
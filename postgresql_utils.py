@@ -1,8 +1,11 @@
 import streamlit as st
 import os
 import json
+import time
 import datetime
 import psycopg2
+from psycopg2.extras import execute_values
+from collections import OrderedDict
 # from app_utils import *
 from minio_utils import *
 from style_utils import *
@@ -21,6 +24,11 @@ def get_current_page():
 def set_current_page(value):
     key = get_mode_key()
     st.session_state.page_by_mode[key] = value
+    reset_loaded_annotations()
+
+def reset_loaded_annotations():
+    """불러온 어노테이션을 무효화해 다음 렌더링에서 현재 이미지의 어노테이션을 DB에서 다시 읽게 합니다."""
+    st.session_state.annotations_image = None
 
 
 def connect_to_postgres():
@@ -120,8 +128,50 @@ def get_shared_projects(userid):
         return []
 
 
-def insert_metadata(project_name, image_path):
-    """이미지 메타데이터를 데이터베이스에 삽입합니다."""
+def get_existing_uploads(filenames, content_hashes=None):
+    """
+    업로드하려는 파일 중 이미 metadata 테이블에 존재하는 파일을 한 번의 쿼리로 조회합니다.
+    filename(UNIQUE 인덱스)과 content_hash(인덱스) 컬럼만 조회하므로
+    버킷 전체 객체 수와 무관하게 업로드 대상 수에 비례한 비용만 듭니다.
+
+    Args:
+        filenames (list): 업로드할 파일 이름 목록
+        content_hashes (list, optional): 업로드할 파일의 sha256 목록
+
+    Returns:
+        tuple: (이미 존재하는 파일 이름 set, 이미 존재하는 content_hash set) 또는 오류 시 None
+    """
+    try:
+        conn = connect_to_postgres()
+        cursor = conn.cursor()
+
+        query = """
+        SELECT filename, content_hash
+        FROM metadata
+        WHERE filename = ANY(%s)
+        OR content_hash = ANY(%s)
+        """
+        cursor.execute(query, (list(filenames), list(content_hashes or [])))
+        rows = cursor.fetchall()
+
+        cursor.close()
+        conn.close()
+
+        existing_filenames = {row[0] for row in rows}
+        existing_hashes = {row[1] for row in rows if row[1]}
+        return existing_filenames, existing_hashes
+
+    except Exception as e:
+        print(f"중복 파일 조회 오류: {e}")
+        # 오류 발생 시 중복 여부를 알 수 없으므로 호출 측에서 업로드를 중단하도록 None 반환
+        return None
+
+
+def insert_metadata(project_name, image_path, content_hash=None, width=None, height=None):
+    """
+    이미지 메타데이터를 데이터베이스에 삽입합니다.
+    width/height를 넘기지 않으면 MinIO 객체 헤더를 범위 요청으로 읽어 확인합니다.
+    """
     try:
         # PostgreSQL 연결
         conn = connect_to_postgres()
@@ -131,8 +181,11 @@ def insert_metadata(project_name, image_path):
         current_time = datetime.datetime.now().isoformat()
     
         # 이미지 크기 확인
-        print(f"이미지 크기 확인 전 확인: {image_path}")
-        img_width, img_height = get_image_dimensions(image_path.replace("easylabel/", ""))
+        if width is None or height is None:
+            print(f"이미지 크기 확인 전 확인: {image_path}")
+            img_width, img_height = get_image_dimensions(image_path.replace("easylabel/", ""))
+        else:
+            img_width, img_height = width, height
         print(f"DEBUG: img_width={img_width}, img_height={img_height}")
         info_data = {
             'filename': os.path.basename(image_path),
@@ -146,17 +199,17 @@ def insert_metadata(project_name, image_path):
             'assigned_by': None,    
             'last_modified_by': st.session_state.userid,
             'last_modified_at': current_time,
-            
+            'content_hash': content_hash,
         }
         insert_info_sql = """
-            INSERT INTO metadata (filename, project_name, storage_path, status, width, height, created_by, created_at, assigned_by, last_modified_by, last_modified_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) RETURNING id;
+            INSERT INTO metadata (filename, project_name, storage_path, status, width, height, created_by, created_at, assigned_by, last_modified_by, last_modified_at, content_hash)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) RETURNING id;
         """
         cursor.execute(insert_info_sql, (
             info_data['filename'], info_data['project_name'], info_data['storage_path'], info_data['status'],
             info_data['width'], info_data['height'], 
             info_data['created_by'], info_data['created_at'], info_data['assigned_by'],
-            info_data['last_modified_by'], info_data['last_modified_at']
+            info_data['last_modified_by'], info_data['last_modified_at'], info_data['content_hash']
         ))
         print("DEBUG: 메타데이터 삽입 완료")
         # 커밋 후 연결 종료
@@ -170,6 +223,49 @@ def insert_metadata(project_name, image_path):
         return False
 
 
+def insert_metadata_bulk(project_name, images):
+    """
+    여러 이미지의 메타데이터를 한 번의 쿼리로 삽입합니다.
+
+    Args:
+        project_name (str): 프로젝트 이름
+        images (list): {'storage_path', 'width', 'height', 'content_hash'(선택)} 형태의 dict 목록
+
+    Returns:
+        int: 삽입된 행 수 (오류 시 0)
+    """
+    if not images:
+        return 0
+    try:
+        conn = connect_to_postgres()
+        cursor = conn.cursor()
+
+        current_time = datetime.datetime.now().isoformat()
+        rows = [
+            (
+                os.path.basename(image['storage_path']), project_name, image['storage_path'], 'unassigned',
+                image['width'], image['height'],
+                st.session_state.userid, current_time, None,
+                st.session_state.userid, current_time, image.get('content_hash')
+            )
+            for image in images
+        ]
+        insert_info_sql = """
+            INSERT INTO metadata (filename, project_name, storage_path, status, width, height, created_by, created_at, assigned_by, last_modified_by, last_modified_at, content_hash)
+            VALUES %s;
+        """
+        execute_values(cursor, insert_info_sql, rows)
+        conn.commit()
+        cursor.close()
+        conn.close()
+
+        print(f"DEBUG: 메타데이터 {len(rows)}건 일괄 삽입 완료")
+        return len(rows)
+    except Exception as e:
+        print(f"데이터베이스 일괄 저장 오류: {e}")
+        return 0
+
+
 def delete_image_and_metadata(image_path):
     try:
         # PostgreSQL 연결
@@ -450,9 +546,10 @@ def load_annotations(image_path):
         
         # 결과 가져오기
         annotations = []
-        for row in cursor.fetchall():
+        for i, row in enumerate(cursor.fetchall()):
             label, bbox = row
             annotations.append({
+                'box_id': f"bbox-{i}",
                 'label': label,
                 'bbox': bbox
             })
@@ -461,8 +558,14 @@ def load_annotations(image_path):
         cursor.close()
         conn.close()
         
-        # session_state에 저장
+        # session_state에 저장 (어떤 이미지의 어노테이션인지 함께 기록)
         st.session_state.annotations = annotations
+        st.session_state.annotations_image = image_path
+        # 컴포넌트와 주고받는 변경 연산의 기준 버전 초기화
+        st.session_state.annotation_version = 0
+        st.session_state.annotation_event = None
+        st.session_state.annotation_resync = False
+        st.session_state.annotation_save_pending = False
         
         print(f"DEBUG: {len(annotations)}개의 어노테이션을 불러옴")
         return True
@@ -635,6 +738,47 @@ def get_filtered_images(status_filter, user_filter, sort_option):
         print(f"DEBUG: 이미지 필터링 중 오류 발생 - {e}")
         return []
 
+def get_image_manifest(image_paths):
+    """
+    여러 이미지의 그리드 표시용 메타데이터를 한 번의 쿼리로 조회합니다.
+
+    Args:
+        image_paths (list): storage_path 목록
+
+    Returns:
+        dict: storage_path → {status, created_by, created_at, assigned_by, prelabel_status}
+    """
+    if not image_paths:
+        return {}
+    try:
+        conn = connect_to_postgres()
+        cursor = conn.cursor()
+
+        query = """
+        SELECT storage_path, status, created_by, created_at, assigned_by, prelabel_status
+        FROM metadata
+        WHERE storage_path = ANY(%s)
+        """
+        cursor.execute(query, (list(image_paths),))
+        rows = cursor.fetchall()
+
+        cursor.close()
+        conn.close()
+
+        return {
+            row[0]: {
+                "status": row[1],
+                "created_by": row[2],
+                "created_at": row[3].strftime('%Y-%m-%d %H:%M:%S') if row[3] else None,
+                "assigned_by": row[4],
+                "prelabel_status": row[5],
+            }
+            for row in rows
+        }
+    except Exception as e:
+        print(f"DEBUG: 이미지 매니페스트 조회 중 오류 발생 - {e}")
+        return {}
+
 def check_own_uploaded_images():
     """
     선택된 이미지 중 사용자가 직접 업로드한 이미지 수를 확인합니다.
@@ -818,16 +962,21 @@ def toggle_select_all_images(images, page, items_per_page, select_all):
         st.session_state[f"select_{image_path}"] = select_all
 
 
-def display_image_grid(images, page=1, items_per_page=12):
+@st.fragment
+def display_image_grid(images, page=None, items_per_page=12):
     """
     이미지를 그리드 형태로 표시하고 각 이미지의 메타데이터를 데이터베이스에서 가져와 표시합니다.
     단순화된 페이지네이션 UI가 적용되었습니다.
+    fragment로 분리되어 체크박스/페이지 이동 시 그리드만 다시 실행됩니다.
     
     Args:
         images: 표시할 이미지 경로 목록
-        page: 현재 페이지 번호 (1부터 시작)
+        page: 현재 페이지 번호 (1부터 시작, None이면 st.session_state.page_num 사용)
         items_per_page: 페이지당 표시할 이미지 수
     """
+    if page is None:
+        page = st.session_state.page_num
+
     def apply_select_all_checkbox():
         # 모두 선택 체크박스
         select_all_key = f"select_all_page_{st.session_state.page_num}"
@@ -987,7 +1136,7 @@ def render_simplified_pagination(current_page, total_pages, total_items):
         if current_page > 1:
             if st.button("◀ 이전", key="prev_page", use_container_width=True):
                 st.session_state.page_num = current_page - 1
-                st.rerun()
+                st.rerun(scope="fragment")
         else:
             # 이전 버튼을 비활성화된 상태로 표시하기 위한 더미 버튼
             st.button("◀ 이전", key="prev_page_disabled", disabled=True, use_container_width=True)
@@ -998,7 +1147,341 @@ def render_simplified_pagination(current_page, total_pages, total_items):
         if current_page < total_pages:
             if st.button("다음 ▶", key="next_page", use_container_width=True):
                 st.session_state.page_num = current_page + 1
-                st.rerun()
+                st.rerun(scope="fragment")
         else:
             # 다음 버튼을 비활성화된 상태로 표시하기 위한 더미 버튼
-            st.button("다음 ▶", key="next_page_disabled", disabled=True, use_container_width=True)
\ No newline at end of file
+            st.button("다음 ▶", key="next_page_disabled", disabled=True, use_container_width=True)
+
+
+def get_content_hash(storage_path):
+    """metadata 테이블에 기록된 이미지의 sha256 해시를 반환합니다. 없거나 오류 시 None."""
+    try:
+        conn = connect_to_postgres()
+        cursor = conn.cursor()
+        cursor.execute("SELECT content_hash FROM metadata WHERE storage_path = %s", (storage_path,))
+        row = cursor.fetchone()
+        cursor.close()
+        conn.close()
+        return row[0] if row else None
+    except Exception as e:
+        print(f"DEBUG: content_hash 조회 중 오류 발생 - {e}")
+        return None
+
+
+# ocr_cache 보관 기간
+#   캐시 키에 모델 식별값이 들어가므로 모델을 바꾸면 이전 결과는 다시 읽히지 않고 남기만 합니다.
+#   저장 후 OCR_CACHE_TTL_DAYS가 지난 결과는 캐시 미스로 보고, put_ocr_cache가
+#   OCR_CACHE_PRUNE_INTERVAL초에 한 번씩 만료된 행을 지웁니다 (만료된 결과는 다시 계산해 저장).
+OCR_CACHE_TTL_DAYS = 30
+OCR_CACHE_PRUNE_INTERVAL = 3600
+_ocr_cache_last_prune = 0.0
+
+
+def get_ocr_cache(cache_key):
+    """ocr_cache 테이블에서 저장된 OCR 결과를 조회합니다. 없거나 만료됐거나 오류 시 None."""
+    try:
+        conn = connect_to_postgres()
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT result FROM ocr_cache WHERE cache_key = %s AND created_at >= %s",
+            (cache_key, datetime.datetime.now() - datetime.timedelta(days=OCR_CACHE_TTL_DAYS))
+        )
+        row = cursor.fetchone()
+        cursor.close()
+        conn.close()
+        return row[0] if row else None
+    except Exception as e:
+        print(f"DEBUG: OCR 캐시 조회 중 오류 발생 - {e}")
+        return None
+
+
+def put_ocr_cache(cache_key, kind, result):
+    """OCR 결과를 ocr_cache 테이블에 저장합니다 (같은 키가 있으면 덮어씀)."""
+    try:
+        conn = connect_to_postgres()
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            INSERT INTO ocr_cache (cache_key, kind, result, created_at)
+            VALUES (%s, %s, %s, %s)
+            ON CONFLICT (cache_key) DO UPDATE SET result = EXCLUDED.result, created_at = EXCLUDED.created_at;
+            """,
+            (cache_key, kind, json.dumps(result), datetime.datetime.now())
+        )
+        conn.commit()
+        cursor.close()
+        conn.close()
+        prune_ocr_cache()
+        return True
+    except Exception as e:
+        print(f"DEBUG: OCR 캐시 저장 중 오류 발생 - {e}")
+        return False
+
+
+def prune_ocr_cache(force=False):
+    """
+    OCR_CACHE_TTL_DAYS보다 오래된 ocr_cache 행을 삭제합니다.
+    force가 아니면 프로세스당 OCR_CACHE_PRUNE_INTERVAL초에 한 번만 실행합니다.
+
+    Returns:
+        int: 삭제한 행 수 (건너뛰었으면 0), 오류 시 None
+    """
+    global _ocr_cache_last_prune
+    now = time.time()
+    if not force and now - _ocr_cache_last_prune < OCR_CACHE_PRUNE_INTERVAL:
+        return 0
+    _ocr_cache_last_prune = now
+    try:
+        conn = connect_to_postgres()
+        cursor = conn.cursor()
+        cursor.execute(
+            "DELETE FROM ocr_cache WHERE created_at < %s",
+            (datetime.datetime.now() - datetime.timedelta(days=OCR_CACHE_TTL_DAYS),)
+        )
+        deleted = cursor.rowcount
+        conn.commit()
+        cursor.close()
+        conn.close()
+        if deleted:
+            print(f"DEBUG: 만료된 OCR 캐시 {deleted}개 삭제")
+        return deleted
+    except Exception as e:
+        print(f"DEBUG: OCR 캐시 정리 중 오류 발생 - {e}")
+        return None
+
+
+def get_project_image_paths(project_name):
+    """프로젝트에 속한 모든 이미지의 storage_path를 업로드 순서대로 반환합니다."""
+    try:
+        conn = connect_to_postgres()
+        cursor = conn.cursor()
+        cursor.execute("SELECT storage_path FROM metadata WHERE project_name = %s ORDER BY id", (project_name,))
+        paths = [row[0] for row in cursor.fetchall()]
+        cursor.close()
+        conn.close()
+        return paths
+    except Exception as e:
+        print(f"DEBUG: 프로젝트 이미지 조회 중 오류 발생 - {e}")
+        return []
+
+
+def get_prelabel_status(image_paths):
+    """
+    여러 이미지의 자동 감지(사전 레이블링) 상태를 한 번에 조회합니다.
+
+    Returns:
+        dict: storage_path → prelabel_status (None, 'queued', 'done', 'failed'), 오류 시 None
+    """
+    if not image_paths:
+        return {}
+    try:
+        conn = connect_to_postgres()
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT storage_path, prelabel_status FROM metadata WHERE storage_path = ANY(%s)",
+            (list(image_paths),)
+        )
+        status = dict(cursor.fetchall())
+        cursor.close()
+        conn.close()
+        return status
+    except Exception as e:
+        print(f"DEBUG: 자동 감지 상태 조회 중 오류 발생 - {e}")
+        return None
+
+
+def set_prelabel_status(image_paths, status):
+    """여러 이미지의 자동 감지 상태를 한 번의 쿼리로 변경합니다."""
+    if not image_paths:
+        return 0
+    try:
+        conn = connect_to_postgres()
+        cursor = conn.cursor()
+        cursor.execute(
+            "UPDATE metadata SET prelabel_status = %s WHERE storage_path = ANY(%s)",
+            (status, list(image_paths))
+        )
+        count = cursor.rowcount
+        conn.commit()
+        cursor.close()
+        conn.close()
+        return count
+    except Exception as e:
+        print(f"DEBUG: 자동 감지 상태 변경 중 오류 발생 - {e}")
+        return 0
+
+
+def get_labeled_image_paths(image_paths):
+    """
+    여러 이미지 중 확정됐거나 이미 어노테이션이 있는 이미지를 한 번의 쿼리로 찾습니다.
+    일괄 자동 감지는 이런 이미지에 사전 어노테이션을 넣지 않으므로 검출도 하지 않고 건너뜁니다.
+
+    Returns:
+        set: 해당하는 storage_path 집합 (오류 시 None)
+    """
+    if not image_paths:
+        return set()
+    try:
+        conn = connect_to_postgres()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT m.storage_path
+            FROM metadata m
+            WHERE m.storage_path = ANY(%s)
+              AND (m.status = 'confirmed' OR EXISTS (SELECT 1 FROM annotations a WHERE a.info_id = m.id))
+        """, (list(image_paths),))
+        paths = {row[0] for row in cursor.fetchall()}
+        cursor.close()
+        conn.close()
+        return paths
+    except Exception as e:
+        print(f"DEBUG: 어노테이션 보유 이미지 조회 중 오류 발생 - {e}")
+        return None
+
+
+def save_pre_annotations(results):
+    """
+    자동 감지 결과를 사전 어노테이션으로 일괄 저장하고 해당 이미지의 상태를 'done'으로 바꿉니다.
+    이미 어노테이션이 있는 이미지(사람이 작업했거나 이전 실행에서 저장됨)에는 추가하지 않습니다.
+    어노테이션 저장과 상태 변경은 한 트랜잭션이므로, 중간에 중단돼도 'done'이 아닌 이미지만 다시 처리하면 됩니다.
+
+    Args:
+        results (list): [(storage_path, [(label, {x, y, width, height}), ...]), ...]
+
+    Returns:
+        int: 저장한 어노테이션 수 (오류 시 None)
+    """
+    if not results:
+        return 0
+    try:
+        conn = connect_to_postgres()
+        cursor = conn.cursor()
+        conn.autocommit = False
+
+        paths = [path for path, _ in results]
+        cursor.execute("SELECT storage_path, id FROM metadata WHERE storage_path = ANY(%s)", (paths,))
+        image_ids = dict(cursor.fetchall())
+
+        cursor.execute(
+            "SELECT DISTINCT info_id FROM annotations WHERE info_id = ANY(%s)",
+            (list(image_ids.values()),)
+        )
+        annotated = {row[0] for row in cursor.fetchall()}
+
+        rows = [
+            (image_ids[path], label, json.dumps(bbox))
+            for path, annotations in results
+            if path in image_ids and image_ids[path] not in annotated
+            for label, bbox in annotations
+        ]
+        if rows:
+            execute_values(cursor, "INSERT INTO annotations (info_id, label, bbox) VALUES %s", rows)
+
+        cursor.execute("UPDATE metadata SET prelabel_status = 'done' WHERE storage_path = ANY(%s)", (paths,))
+        conn.commit()
+        cursor.close()
+        conn.close()
+        return len(rows)
+    except Exception as e:
+        print(f"DEBUG: 사전 어노테이션 저장 중 오류 발생 - {e}")
+        return None
+
+
+def get_confirmed_annotations(project_name, limit=None):
+    """
+    프로젝트에서 확정된 이미지와 어노테이션을 한 번의 쿼리로 가져옵니다 (모델 정확도 검사 기준 데이터).
+
+    Returns:
+        list: [(storage_path, [(label, {x, y, width, height}), ...]), ...] (오류 시 None)
+    """
+    try:
+        conn = connect_to_postgres()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT m.storage_path, a.label, a.bbox
+            FROM metadata m
+            JOIN annotations a ON a.info_id = m.id
+            WHERE m.project_name = %s AND m.status = 'confirmed'
+            ORDER BY m.id, a.id
+        """, (project_name,))
+        rows = cursor.fetchall()
+        cursor.close()
+        conn.close()
+
+        grouped = OrderedDict()
+        for storage_path, label, bbox in rows:
+            if storage_path not in grouped:
+                if limit is not None and len(grouped) >= limit:
+                    break
+                grouped[storage_path] = []
+            grouped[storage_path].append((label, bbox))
+        return list(grouped.items())
+    except Exception as e:
+        print(f"DEBUG: 확정 어노테이션 조회 중 오류 발생 - {e}")
+        return None
+
+
+def get_unoriented_images(project_name=None):
+    """
+    EXIF 방향 적용 전(원본 픽셀 좌표)으로 저장된 이미지와 그 어노테이션을 가져옵니다.
+    metadata.bbox_oriented가 FALSE인 이미지가 대상입니다 (migrate_exif_annotations.py 참고).
+
+    Returns:
+        list: [(id, storage_path, [(annotation_id, bbox), ...]), ...] (오류 시 None)
+    """
+    try:
+        conn = connect_to_postgres()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT m.id, m.storage_path, a.id, a.bbox
+            FROM metadata m
+            LEFT JOIN annotations a ON a.info_id = m.id
+            WHERE NOT m.bbox_oriented AND (%s::text IS NULL OR m.project_name = %s)
+            ORDER BY m.id, a.id
+        """, (project_name, project_name))
+        rows = cursor.fetchall()
+        cursor.close()
+        conn.close()
+
+        grouped = OrderedDict()
+        for image_id, storage_path, annotation_id, bbox in rows:
+            _, annotations = grouped.setdefault(image_id, (storage_path, []))
+            if annotation_id is not None:
+                annotations.append((annotation_id, bbox))
+        return [(image_id, path, annotations) for image_id, (path, annotations) in grouped.items()]
+    except Exception as e:
+        print(f"DEBUG: 방향 미적용 이미지 조회 중 오류 발생 - {e}")
+        return None
+
+
+def save_oriented_annotations(image_id, width, height, annotations):
+    """
+    EXIF 방향을 적용한 이미지 크기와 어노테이션 좌표를 한 트랜잭션으로 저장하고 bbox_oriented를 켭니다.
+
+    Args:
+        annotations (list): [(annotation_id, bbox), ...]
+
+    Returns:
+        bool: 성공 여부
+    """
+    try:
+        conn = connect_to_postgres()
+        cursor = conn.cursor()
+        conn.autocommit = False
+        if annotations:
+            execute_values(
+                cursor,
+                "UPDATE annotations AS a SET bbox = v.bbox::jsonb FROM (VALUES %s) AS v(id, bbox) WHERE a.id = v.id",
+                [(annotation_id, json.dumps(bbox)) for annotation_id, bbox in annotations]
+            )
+        cursor.execute(
+            "UPDATE metadata SET width = %s, height = %s, bbox_oriented = TRUE WHERE id = %s",
+            (width, height, image_id)
+        )
+        conn.commit()
+        cursor.close()
+        conn.close()
+        return True
+    except Exception as e:
+        print(f"DEBUG: 방향 적용 어노테이션 저장 중 오류 발생 - {e}")
+        return False
@@ -0,0 +1,325 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import subprocess
+
+import numpy as np
+import cv2
+
+from postgresql_utils import get_project_image_paths, get_confirmed_annotations
+from minio_utils import MinIOManager
+from ocr_utils import (
+    OCR_MODEL_CONFIGS, OCREngine, get_ocr_engine, get_gate_report_path, get_model_fingerprint,
+    crop_boxes, recognize_crops, match_boxes
+)
+from annotate_utils import split_first_dir
+
+# INT8 양자화 설정
+CALIBRATION_IMAGES = 50         # 검출 모델 보정에 쓰는 프로젝트 이미지 수
+EVAL_IMAGES = 100               # 정확도 검사에 쓰는 확정 이미지 수
+EVAL_IOU_THRESHOLD = 0.5        # 확정 박스와 검출 박스를 같은 박스로 볼 최소 IoU
+
+# 정확도 검사 기준: 원본(float) 모델 대비 허용하는 최대 하락폭
+MAX_DET_RECALL_DROP = 0.01
+MAX_REC_ACCURACY_DROP = 0.01
+# 속도 검사 기준: 원본 대비 최소 속도 향상 배수 (검출+인식 전체 시간 기준, 1.0 이하면 설치하지 않음)
+MIN_SPEEDUP = 1.1
+
+
+class _InputRecorder:
+    """ONNX Runtime 세션을 감싸 PaddleOCR 전처리를 거친 입력 텐서를 기록합니다 (보정 데이터 수집용)."""
+
+    def __init__(self, session):
+        self.session = session
+        self.inputs = []
+
+    def run(self, output_names, input_dict):
+        self.inputs.append({name: np.array(value, copy=True) for name, value in input_dict.items()})
+        return self.session.run(output_names, input_dict)
+
+    def get_inputs(self):
+        return self.session.get_inputs()
+
+
+def export_onnx(model_dir, save_file):
+    """Paddle 추론 모델 디렉터리를 paddle2onnx로 변환합니다 (README의 변환 명령과 같음)."""
+    os.makedirs(os.path.dirname(save_file), exist_ok=True)
+    subprocess.run([
+        "paddle2onnx",
+        "--model_dir", model_dir,
+        "--model_filename", "inference.pdmodel",
+        "--params_filename", "inference.pdiparams",
+        "--save_file", save_file,
+        "--opset_version", "11",
+        "--enable_onnx_checker", "True",
+    ], check=True)
+
+
+def load_project_images(minio_client, image_paths):
+    """MinIO에서 이미지를 받아 RGB 배열로 디코딩합니다. 읽지 못한 이미지는 건너뜁니다."""
+    images = []
+    for image_path in image_paths:
+        bucket_name, object_name = split_first_dir(image_path)
+        try:
+            data = np.frombuffer(minio_client.get_object_bytes(bucket_name, object_name), dtype=np.uint8)
+            img_np = cv2.imdecode(data, cv2.IMREAD_COLOR)
+            if img_np is not None:
+                images.append((image_path, cv2.cvtColor(img_np, cv2.COLOR_BGR2RGB)))
+        except Exception as e:
+            print(f"DEBUG: 이미지 로드 실패 ({image_path}) - {e}")
+    return images
+
+
+def collect_det_calibration_inputs(engine, images):
+    """float 검출 모델로 보정 이미지를 한 번씩 추론하면서 모델 입력 텐서를 모읍니다."""
+    detector = engine.paddle.text_detector
+    recorder = _InputRecorder(detector.predictor)
+    detector.predictor = recorder
+    try:
+        for _, img_np in images:
+            engine.text_detector(img_np)
+    finally:
+        detector.predictor = recorder.session
+    return recorder.inputs
+
+
+def quantize_det_model(model_path, output_path, calibration_inputs):
+    """
+    검출 모델(합성곱 위주)을 보정 데이터로 정적 INT8 양자화합니다 (QDQ, 채널별 가중치).
+    """
+    from onnxruntime.quantization import (
+        CalibrationDataReader, QuantFormat, QuantType, quantize_static
+    )
+    from onnxruntime.quantization.shape_inference import quant_pre_process
+
+    class RecordedDataReader(CalibrationDataReader):
+        def __init__(self, inputs):
+            self._inputs = iter(inputs)
+
+        def get_next(self):
+            return next(self._inputs, None)
+
+    prepared_path = output_path + ".prep.onnx"
+    quant_pre_process(model_path, prepared_path)
+    try:
+        quantize_static(
+            prepared_path,
+            output_path,
+            RecordedDataReader(calibration_inputs),
+            quant_format=QuantFormat.QDQ,
+            per_channel=True,
+            activation_type=QuantType.QUInt8,
+            weight_type=QuantType.QInt8,
+        )
+    finally:
+        if os.path.exists(prepared_path):
+            os.unlink(prepared_path)
+
+
+def quantize_rec_model(model_path, output_path):
+    """
+    인식 모델은 입력 너비가 배치마다 달라 활성값 범위를 고정하기 어려우므로 가중치만 INT8로 동적 양자화합니다.
+    """
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantize_dynamic(model_path, output_path, weight_type=QuantType.QInt8)
+
+
+def bbox_to_points(bbox):
+    """어노테이션 bbox(x, y, width, height)를 검출 결과와 같은 4점 좌표로 바꿉니다."""
+    x, y, w, h = bbox["x"], bbox["y"], bbox["width"], bbox["height"]
+    return [[x, y], [x + w, y], [x + w, y + h], [x, y + h]]
+
+
+def evaluate_ocr_engine(engine, samples, iou_threshold=EVAL_IOU_THRESHOLD):
+    """
+    확정 어노테이션을 정답으로 검출 재현율과 인식 정확도(라벨 완전 일치)를 계산합니다.
+    인식은 정답 박스를 잘라 넣으므로 검출 결과와 무관하게 인식 모델만 평가합니다.
+
+    Args:
+        samples (list): [(RGB 이미지, [(label, bbox dict), ...]), ...]
+    """
+    gt_count = matched_count = rec_total = rec_correct = 0
+    det_time = rec_time = 0.0
+    for img_np, annotations in samples:
+        gt_boxes = [bbox_to_points(bbox) for _, bbox in annotations]
+
+        start = time.perf_counter()
+        result = engine.text_detector(img_np)
+        det_time += time.perf_counter() - start
+        boxes = list(result[0]) if result and result[0] is not None else []
+        gt_count += len(gt_boxes)
+        matched_count += len(match_boxes(gt_boxes, boxes, iou_threshold))
+
+        labeled = [(label, points) for (label, _), points in zip(annotations, gt_boxes) if label]
+        start = time.perf_counter()
+        texts = recognize_crops(crop_boxes(img_np, [points for _, points in labeled]), engine)
+        rec_time += time.perf_counter() - start
+        rec_total += len(labeled)
+        rec_correct += sum(
+            1 for (label, _), text_info in zip(labeled, texts)
+            if text_info and text_info[0] == label
+        )
+
+    return {
+        "images": len(samples),
+        "det_recall": matched_count / gt_count if gt_count else 1.0,
+        "rec_accuracy": rec_correct / rec_total if rec_total else 1.0,
+        "det_time": det_time,
+        "rec_time": rec_time,
+    }
+
+
+def check_accuracy_gate(baseline, candidate,
+                        max_det_recall_drop=MAX_DET_RECALL_DROP, max_rec_accuracy_drop=MAX_REC_ACCURACY_DROP):
+    """양자화 모델이 원본 대비 허용 폭 이상 나빠졌으면 (False, 사유 목록)을 반환합니다."""
+    reasons = []
+    det_drop = baseline["det_recall"] - candidate["det_recall"]
+    rec_drop = baseline["rec_accuracy"] - candidate["rec_accuracy"]
+    if det_drop > max_det_recall_drop:
+        reasons.append(f"검출 재현율 {det_drop:.2%} 하락 (허용 {max_det_recall_drop:.2%})")
+    if rec_drop > max_rec_accuracy_drop:
+        reasons.append(f"인식 정확도 {rec_drop:.2%} 하락 (허용 {max_rec_accuracy_drop:.2%})")
+    return not reasons, reasons
+
+
+def check_speed_gate(baseline, candidate, min_speedup=MIN_SPEEDUP):
+    """
+    양자화 모델의 속도 향상 배수를 계산하고, 원본보다 min_speedup배 이상 빠르지 않으면 사유를 돌려줍니다.
+
+    Returns:
+        tuple: (speedup dict(det, rec, total), 사유 목록)
+    """
+    def ratio(base, cand):
+        return base / cand if cand else None
+
+    speedup = {
+        "det": ratio(baseline["det_time"], candidate["det_time"]),
+        "rec": ratio(baseline["rec_time"], candidate["rec_time"]),
+        "total": ratio(baseline["det_time"] + baseline["rec_time"], candidate["det_time"] + candidate["rec_time"]),
+    }
+    reasons = []
+    if speedup["total"] is None or speedup["total"] < min_speedup:
+        total = "측정 불가" if speedup["total"] is None else f"{speedup['total']:.2f}배"
+        reasons.append(f"속도 향상 {total} (최소 {min_speedup:.2f}배)")
+    return speedup, reasons
+
+
+def quantize_models(minio_client, project_name, source="onnx", target="int8",
+                    calibration_images=CALIBRATION_IMAGES, eval_images=EVAL_IMAGES, min_speedup=MIN_SPEEDUP, seed=0):
+    """
+    source 설정의 float ONNX 모델을 INT8로 양자화하고, 확정 어노테이션 기준 정확도 검사와
+    속도 검사를 모두 통과하면 target 설정의 모델 경로에 저장합니다. 통과하지 못하면 기존 target 모델은 그대로 둡니다.
+    설치할 때 저장하는 보고서에는 설치한 모델의 식별값이 들어가며, 런타임은 이 값이 맞을 때만 target 설정을 로드합니다.
+
+    Returns:
+        dict: 검사 결과 보고서 (passed, reasons, baseline, candidate)
+    """
+    source_config = OCR_MODEL_CONFIGS[source]
+    target_config = OCR_MODEL_CONFIGS[target]
+
+    # float ONNX 모델이 없으면 기본(Paddle) 설정의 추론 모델에서 변환
+    for stage in ("det", "rec"):
+        model_path = source_config[f"{stage}_model_dir"]
+        if not os.path.exists(model_path):
+            print(f"DEBUG: {stage} ONNX 모델이 없어 변환합니다: {model_path}")
+            export_onnx(OCR_MODEL_CONFIGS["default"][f"{stage}_model_dir"], model_path)
+
+    baseline_engine = get_ocr_engine(source)
+
+    # 1) 보정: 프로젝트 이미지 일부로 검출 모델 입력 분포 수집
+    image_paths = get_project_image_paths(project_name)
+    random.Random(seed).shuffle(image_paths)
+    calibration = load_project_images(minio_client, image_paths[:calibration_images])
+    if not calibration:
+        raise RuntimeError(f"보정에 쓸 이미지가 없습니다: {project_name}")
+    calibration_inputs = collect_det_calibration_inputs(baseline_engine, calibration)
+    print(f"DEBUG: 보정 입력 {len(calibration_inputs)}개 수집")
+
+    # 2) 양자화 (검사를 통과할 때까지는 임시 경로에 저장)
+    det_path = target_config["det_model_dir"]
+    rec_path = target_config["rec_model_dir"]
+    det_tmp = det_path + ".tmp"
+    rec_tmp = rec_path + ".tmp"
+    os.makedirs(os.path.dirname(det_path), exist_ok=True)
+    os.makedirs(os.path.dirname(rec_path), exist_ok=True)
+    quantize_det_model(source_config["det_model_dir"], det_tmp, calibration_inputs)
+    quantize_rec_model(source_config["rec_model_dir"], rec_tmp)
+
+    try:
+        # 3) 정확도 검사: 확정 어노테이션 기준으로 원본과 비교
+        confirmed = get_confirmed_annotations(project_name, limit=eval_images)
+        if not confirmed:
+            raise RuntimeError(f"정확도 검사에 쓸 확정 어노테이션이 없습니다: {project_name}")
+        images = dict(load_project_images(minio_client, [path for path, _ in confirmed]))
+        samples = [(images[path], annotations) for path, annotations in confirmed if path in images]
+
+        candidate_engine = OCREngine(target, {**target_config, "det_model_dir": det_tmp, "rec_model_dir": rec_tmp})
+        # 첫 추론의 세션 초기화 시간이 속도 비교에 들어가지 않도록 한 번 실행해 둠 (원본은 보정에서 이미 실행)
+        candidate_engine.text_detector(samples[0][0])
+        baseline = evaluate_ocr_engine(baseline_engine, samples)
+        candidate = evaluate_ocr_engine(candidate_engine, samples)
+        passed, reasons = check_accuracy_gate(baseline, candidate)
+        speedup, speed_reasons = check_speed_gate(baseline, candidate, min_speedup)
+        reasons += speed_reasons
+        passed = passed and not speed_reasons
+
+        report = {
+            "project": project_name,
+            "source": source,
+            "target": target,
+            "calibration_images": len(calibration),
+            "passed": passed,
+            "reasons": reasons,
+            "baseline": baseline,
+            "candidate": candidate,
+            "speedup": speedup,
+        }
+
+        # 4) 통과한 경우에만 target 경로에 설치 (런타임은 OCR_CONFIG=target으로 전환)
+        #    보고서의 모델 식별값은 설치한 파일 기준으로 계산 (이후 파일이 바뀌면 로드 거부)
+        if passed:
+            os.replace(det_tmp, det_path)
+            os.replace(rec_tmp, rec_path)
+            report["fingerprints"] = {stage: get_model_fingerprint(target, stage) for stage in ("det", "rec")}
+            with open(get_gate_report_path(target), "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+        return report
+    finally:
+        for path in (det_tmp, rec_tmp):
+            if os.path.exists(path):
+                os.unlink(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR 검출/인식 모델을 INT8로 양자화하고 확정 어노테이션으로 정확도를 검사합니다.")
+    parser.add_argument("--project", required=True, help="보정/검사에 쓸 프로젝트 이름")
+    parser.add_argument("--source", default="onnx", help="원본 float ONNX 모델 설정 이름")
+    parser.add_argument("--target", default="int8", help="양자화 모델을 저장할 설정 이름")
+    parser.add_argument("--calibration-images", type=int, default=CALIBRATION_IMAGES)
+    parser.add_argument("--eval-images", type=int, default=EVAL_IMAGES)
+    parser.add_argument("--min-speedup", type=float, default=MIN_SPEEDUP, help="설치에 필요한 최소 속도 향상 배수")
+    parser.add_argument("--endpoint", default=os.environ.get("MINIO_ENDPOINT", "localhost:9000"))
+    parser.add_argument("--access-key", default=os.environ.get("MINIO_ACCESS_KEY"))
+    parser.add_argument("--secret-key", default=os.environ.get("MINIO_SECRET_KEY"))
+    parser.add_argument("--secure", action="store_true")
+    args = parser.parse_args()
+
+    minio_client = MinIOManager(args.access_key, args.secret_key, endpoint=args.endpoint, secure=args.secure)
+    report = quantize_models(
+        minio_client, args.project, args.source, args.target,
+        calibration_images=args.calibration_images, eval_images=args.eval_images, min_speedup=args.min_speedup
+    )
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    speedup = report["speedup"]["total"]
+    print(f"속도 향상: {speedup:.2f}배" if speedup else "속도 향상: 측정 불가")
+    if not report["passed"]:
+        print("정확도/속도 검사를 통과하지 못해 양자화 모델을 설치하지 않았습니다.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,149 @@
 import os
 import time
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 from annotate_utils import *
 from minio_utils import MinIOManager
 from postgresql_utils import *
+from batch_detect import start_batch_detect, stop_batch_detect, get_batch_jobs
 from app_utils import *
 from style_utils import *
 
+# 가상 스크롤 그리드 컴포넌트 사용 여부 (False면 기존 Streamlit 그리드)
+USE_VIRTUAL_GRID = True
+# 그리드 컴포넌트의 페이지 크기 (브라우저가 페이지 단위로 보관/요청)
+GRID_WINDOW_SIZE = 60
+# 요청받은 페이지와 함께 미리 보내는 다음 페이지 수 (스크롤이 닿기 전에 받아 두어 페이지마다 rerun하지 않음)
+GRID_PREFETCH_PAGES = 2
+# 일괄 자동 감지 진행 상황 갱신 주기 (초)
+BATCH_PROGRESS_REFRESH = 2
+
+
+def apply_grid_selection(images, value):
+    """그리드 컴포넌트가 보낸 누적 선택 변경 내역을 기존 작업 버튼이 쓰는 select_{path} 키에 반영합니다."""
+    if value.get("select_all") is not None:
+        for image_path in images:
+            st.session_state[f"select_{image_path}"] = bool(value["select_all"])
+
+    image_set = set(images)
+    for image_path, is_selected in (value.get("overrides") or {}).items():
+        if image_path in image_set:
+            st.session_state[f"select_{image_path}"] = bool(is_selected)
+
+
+def invalidate_grid_pages():
+    """목록 이미지의 상태 등이 바뀌었을 때 브라우저가 보관한 그리드 페이지를 다시 받게 합니다 (선택은 유지)."""
+    st.session_state.grid_data_revision = st.session_state.get("grid_data_revision", 0) + 1
+
+
+@st.fragment
+def display_virtual_image_grid(images, list_filter, columns=5):
+    """
+    이미지 목록을 가상 스크롤 그리드 컴포넌트로 표시합니다.
+    컴포넌트가 요청한 페이지와 그 뒤 GRID_PREFETCH_PAGES개 페이지의 메타데이터를 한 번의 쿼리로 조회하고
+    썸네일 파생 이미지 URL과 함께 보냅니다.
+    컴포넌트에서 받은 선택 변경은 기존 작업 버튼이 쓰는 select_{path} 키로 반영합니다.
+
+    Args:
+        list_filter (tuple): 프로젝트와 필터/정렬 조건. 바뀔 때만 브라우저의 페이지와 선택 내역을 버림
+    """
+    if not images:
+        st.info("표시할 이미지가 없습니다.")
+        return
+
+    # 프로젝트/필터/정렬이 바뀌면 세대를 올려 브라우저의 페이지와 선택 변경 내역을 모두 버림
+    if st.session_state.get("grid_list_filter") != list_filter:
+        st.session_state.grid_list_filter = list_filter
+        st.session_state.grid_generation = st.session_state.get("grid_generation", 0) + 1
+        st.session_state.grid_page_offset = 0
+    list_key = str(st.session_state.get("grid_generation", 0))
+    # 목록 내용(삭제, 업로드)이나 이미지 상태가 바뀌면 보관한 페이지만 다시 받음 (선택은 유지)
+    data_key = f"{hash(tuple(images))}-{st.session_state.get('grid_data_revision', 0)}"
+
+    # 컴포넌트 값은 렌더링 전에 세션 상태로 들어와 있으므로, 요청한 페이지를 바로 이번 실행에서 보냄
+    # 이미 반영한 값이 rerun마다 다시 들어오므로 version으로 새 값만 처리
+    value = st.session_state.get("virtual_image_grid")
+    if (
+        value
+        and value.get("list_key") == list_key
+        and value.get("version", 0) > st.session_state.get("grid_selection_version", 0)
+    ):
+        st.session_state.grid_selection_version = value["version"]
+        apply_grid_selection(images, value)
+        if value.get("requested_offset") is not None:
+            st.session_state.grid_page_offset = int(value["requested_offset"])
+
+    page_offset = st.session_state.get("grid_page_offset", 0)
+    page_offset = min(max(page_offset, 0), (len(images) - 1) // GRID_WINDOW_SIZE * GRID_WINDOW_SIZE)
+    page = images[page_offset:page_offset + GRID_WINDOW_SIZE * (1 + GRID_PREFETCH_PAGES)]
+    manifest = get_image_manifest(page)
+    thumbnail_urls = get_thumbnail_urls(st.session_state.minio_client, st.session_state.selected_bucket, page)
+    iam = load_user_database()
+
+    def user_label(userid):
+        if not userid or userid == "NULL" or userid not in iam:
+            return None
+        return f"{iam[userid]['username']}({userid})"
+
+    items = []
+    for image_path in page:
+        info = manifest.get(image_path, {})
+        items.append({
+            "id": image_path,
+            "url": thumbnail_urls.get(image_path),
+            "filename": os.path.basename(image_path),
+            "status": info.get("status"),
+            "created_by": user_label(info.get("created_by")),
+            "assigned_by": user_label(info.get("assigned_by")),
+            "created_at": info.get("created_at"),
+            "prelabel": info.get("prelabel_status"),
+            "selected": bool(st.session_state.get(f"select_{image_path}")),
+        })
+
+    selected_count = sum(1 for image_path in images if st.session_state.get(f"select_{image_path}"))
+    image_grid(
+        items,
+        page_offset=page_offset,
+        page_size=GRID_WINDOW_SIZE,
+        total=len(images),
+        selected_count=selected_count,
+        list_key=list_key,
+        data_key=data_key,
+        columns=columns,
+        key="virtual_image_grid",
+    )
+
+
+@st.fragment(run_every=BATCH_PROGRESS_REFRESH)
+def display_batch_detect_progress():
+    """
+    현재 사용자의 일괄 자동 감지 작업 진행 상황을 주기적으로 갱신해 표시합니다.
+    작업이 끝나면 이미지 목록의 자동 감지 표시가 바뀌도록 전체 화면을 한 번 다시 그립니다.
+    """
+    jobs = get_batch_jobs(user=st.session_state.get("userid"))
+    active = [job for job in jobs if job["state"] in ("pending", "running")]
+    active_ids = {job["job_id"] for job in active}
+
+    previous_ids = st.session_state.get("batch_detect_active", set())
+    st.session_state.batch_detect_active = active_ids
+    if previous_ids - active_ids:
+        invalidate_grid_pages()
+        st.rerun()
+
+    for job in active:
+        col1, col2 = st.columns([5, 1])
+        with col1:
+            st.progress(
+                job["ratio"],
+                text=f"자동 감지 중: {job['processed']} / {job['total']} "
+                     f"(완료 {job['done']}, 건너뜀 {job['skipped']}, 실패 {job['failed']})"
+            )
+        with col2:
+            if st.button("중지", key=f"stop_batch_{job['job_id']}", use_container_width=True):
+                stop_batch_detect(job["job_id"])
+                st.toast("처리 중인 이미지까지 저장한 뒤 중지합니다. 다시 실행하면 남은 이미지부터 이어서 처리합니다.")
+
+
 def display_project_list(projects):
     """
     프로젝트 목록을 표시하는 함수
@@ -212,9 +349,9 @@ def render_image_list_screen():
                 st.write("")
                 action = st.selectbox(
                     "적용할 작업 선택",
-                    ["할당", "할당 해제", "검토로 변경", "확정으로 변경", "삭제"],
+                    ["할당", "할당 해제", "검토로 변경", "확정으로 변경", "삭제", "자동 감지", "자동 감지 + 인식"],
                 )
-                is_disabled = action in ["할당 해제", "확정으로 변경", "삭제"]  
+                is_disabled = action in ["할당 해제", "확정으로 변경", "삭제", "자동 감지", "자동 감지 + 인식"]  
 
             with col2:
                 st.write("")
@@ -250,6 +387,8 @@ def render_image_list_screen():
                     if not has_selected:
                         st.toast("작업할 이미지를 선택해주세요.")
                     else:
+                        # 상태/자동 감지 표시가 바뀌므로 그리드가 보관한 페이지를 다시 받게 함
+                        invalidate_grid_pages()
                         # 선택된 작업에 따라 다른 함수 실행
                         if action == "할당":
                             count =  change_status_selected_images("assigned", selected_user)
@@ -284,11 +423,37 @@ def render_image_list_screen():
                             else:
                                 # 삭제 확인 대화상자 표시
                                 confirm_delete()
+                        elif action in ["자동 감지", "자동 감지 + 인식"]:
+                            selected_paths = [
+                                key.replace("select_", "") for key, value in st.session_state.items()
+                                if key.startswith("select_") and value
+                            ]
+                            job = start_batch_detect(
+                                st.session_state.minio_client,
+                                selected_paths,
+                                user=st.session_state.get("userid"),
+                                recognize=action == "자동 감지 + 인식"
+                            )
+                            if job is None:
+                                st.toast("이미 실행 중인 자동 감지 작업이 있습니다. 작업이 끝나거나 중지한 뒤 다시 시도해주세요.")
+                            else:
+                                st.toast(f"{job.total}개 이미지의 자동 감지를 백그라운드에서 시작했습니다.")
             with col4:
                 # 업로드 대화상자 함수 정의
                 @st.dialog("이미지 업로드")
                 def upload_dialog():
                     st.write("업로드할 이미지 파일을 선택해주세요.\n동일한 파일명의 이미지가 서버에 존재할 경우 업로드가 불가능합니다")
+
+                    upload_method = st.radio(
+                        "업로드 방식",
+                        ["서버 경유", "MinIO 직접 업로드"],
+                        horizontal=True,
+                        help="대용량 업로드는 브라우저에서 MinIO로 직접 올리는 방식을 권장합니다"
+                    )
+                    if upload_method == "MinIO 직접 업로드":
+                        if direct_uploader():
+                            st.session_state.upload_success = True
+                        return
                     
                     # 파일 업로더
                     uploaded_files = st.file_uploader(
@@ -353,8 +518,16 @@ def render_image_list_screen():
 
 
             ##############################################################################################################################
+            # 일괄 자동 감지 진행 상황
+            display_batch_detect_progress()
+
             # 이미지 그리드 표시
-            display_image_grid(images, page=st.session_state.page_num, items_per_page=12)
+            if USE_VIRTUAL_GRID:
+                display_virtual_image_grid(
+                    images, (st.session_state.get("project_id"), status_filter, user_filter, sort_option)
+                )
+            else:
+                display_image_grid(images, items_per_page=12)
 
         else:
             st.warning("필터 조건에 맞는 이미지가 없습니다.")
@@ -362,6 +535,19 @@ def render_image_list_screen():
     else:
         st.info("왼쪽 사이드바에서 MinIO 버킷을 선택해주세요.")
 
+@st.fragment
+def render_labeling_workspace():
+    """
+    레이블링 캔버스 fragment.
+    박스 편집 등 캔버스 컴포넌트와의 상호작용은 이 함수만 다시 실행하며,
+    필요한 데이터(current_image, annotations, render_key)는 모두 session_state에서 읽습니다.
+    """
+    if not st.session_state.image_list or st.session_state.current_image is None:
+        return
+    bboxes, labels = prepare_annotation_data()
+    render_image_annotation(st.session_state.current_image, bboxes, labels)
+
+
 def render_image_annotation(image_path, bboxes, labels):
     container = st.container()
     with container:      
@@ -377,6 +563,19 @@ def render_image_annotation(image_path, bboxes, labels):
             key=f"{st.session_state.current_image}-{st.session_state.render_key}",
             width=None,
             height=None,
+            box_ids=[ann.get("box_id") or f"bbox-{i}" for i, ann in enumerate(st.session_state.annotations)],
+            version=st.session_state.get("annotation_version", 0),
+            # 요청마다 다른 값(nonce)을 보내야 컴포넌트가 같은 화면에서 두 번째 재동기화 요청도 알아챔
+            request_full_sync=(
+                st.session_state.get("annotation_resync_nonce", 0)
+                if st.session_state.get("annotation_resync") else 0
+            ),
+            ocr_suggestions=st.session_state.get("ocr_suggestions"),
+            prefetch_urls=get_prefetch_urls(
+                st.session_state.minio_client,
+                st.session_state.selected_bucket,
+                get_neighbor_images(st.session_state.image_list, st.session_state.current_image),
+            ),
         )
         
         if result is not None:
@@ -404,24 +603,122 @@ def prepare_annotation_data():
     return bboxes, labels
 
 
+def rerun_fragment():
+    """
+    프래그먼트 재실행 중이면 해당 프래그먼트만, 전체 앱 실행 중이면 앱 전체를 다시 실행합니다.
+    (전체 실행 중 st.rerun(scope="fragment")는 StreamlitAPIException을 발생시킴)
+    """
+    ctx = get_script_run_ctx()
+    if ctx is not None and ctx.fragment_ids_this_run:
+        st.rerun(scope="fragment")
+    st.rerun()
+
+
 def process_detection_result(result, image_path):
     """Detection 결과를 처리하는 함수"""
+    # 같은 컴포넌트 값이 rerun마다 다시 전달되므로 이미 처리한 이벤트는 건너뜀
+    event_id = result.get("event_id")
+    if event_id is not None and event_id == st.session_state.get("annotation_event"):
+        return
+    st.session_state.annotation_event = event_id
+
     # 모드 정보 업데이트
     if "mode" in result:
         st.session_state.current_mode = result["mode"]
     
-    # OCR 결과가 있으면 세션 상태에 저장
-    if "ocr_suggestions" in result:
-        st.session_state.ocr_suggestions = result["ocr_suggestions"]
-        print("DEBUG: process_detection_result에서 OCR 결과 저장:", result["ocr_suggestions"])
-    
     # 바운딩 박스 정보 업데이트
-    if "bboxes" in result:
+    if result.get("full_sync"):
         update_annotations_from_result(result["bboxes"])
-        
-        # Ctrl+S로 저장 요청이 있는 경우에만 어노테이션 저장
-        if result.get("save_requested", False):
-            insert_annotations(image_path)
+        base_version = result.get("base_version")
+        if base_version is None:  # 이전 번들은 버전을 보내지 않음
+            base_version = st.session_state.get("annotation_version", 0)
+        st.session_state.annotation_version = base_version + 1
+        st.session_state.annotation_resync = False
+    elif result.get("ops"):
+        apply_annotation_ops(result["ops"], result.get("base_version"))
+
+    save_requested = result.get("save_requested", False) or st.session_state.get("annotation_save_pending", False)
+
+    if st.session_state.get("annotation_resync"):
+        # 전체 목록을 받은 뒤에 저장하도록 미루고, 컴포넌트에 재동기화 요청
+        st.session_state.annotation_save_pending = save_requested
+        rerun_fragment()
+
+    # Ctrl+S로 저장 요청이 있는 경우에만 어노테이션 저장
+    if save_requested:
+        st.session_state.annotation_save_pending = False
+        insert_annotations(image_path)
+
+    # Ctrl+M 박스 OCR 요청: 추천 결과를 컴포넌트에 전달하도록 캔버스만 다시 실행
+    if result.get("request_ocr") and result.get("selected_box_coords"):
+        st.session_state.ocr_suggestions = suggest_labels_for_box(
+            st.session_state.minio_client,
+            st.session_state.selected_bucket,
+            image_path,
+            result["selected_box_coords"]
+        )
+        print("DEBUG: process_detection_result에서 OCR 결과 저장:", st.session_state.ocr_suggestions)
+        rerun_fragment()
+    elif st.session_state.get("ocr_suggestions"):
+        # 컴포넌트가 추천 결과를 받은 뒤 보낸 값이면 초기화
+        st.session_state.ocr_suggestions = None
+
+
+def apply_annotation_ops(ops, base_version):
+    """
+    컴포넌트가 보낸 변경 연산(add/move/relabel/delete)을 세션의 어노테이션에 적용하는 함수.
+    base_version이 현재 버전과 다르면 적용하지 않고 전체 재동기화를 요청합니다.
+    """
+    current_version = st.session_state.get("annotation_version", 0)
+    if base_version != current_version:
+        print(f"DEBUG: 어노테이션 버전 불일치 (base={base_version}, current={current_version}), 재동기화 요청")
+        if not st.session_state.get("annotation_resync"):
+            st.session_state.annotation_resync_nonce = st.session_state.get("annotation_resync_nonce", 0) + 1
+        st.session_state.annotation_resync = True
+        return False
+
+    annotations = st.session_state.annotations
+    index = {ann.get("box_id"): ann for ann in annotations}
+    next_id = max((ann.get("id", 0) for ann in annotations), default=0) + 1
+
+    for op in ops:
+        kind = op.get("op")
+        box_id = op.get("id")
+        ann = index.get(box_id)
+
+        if kind == "add" and ann is None:
+            ann = {
+                "id": next_id,
+                "box_id": box_id,
+                "label": op.get("label", ""),
+                "bbox": bbox_to_dict(op["bbox"]),
+            }
+            next_id += 1
+            annotations.append(ann)
+            index[box_id] = ann
+        elif kind == "move" and ann is not None:
+            ann["bbox"] = bbox_to_dict(op["bbox"])
+        elif kind == "relabel" and ann is not None:
+            ann["label"] = op.get("label", "")
+        elif kind == "delete" and ann is not None:
+            annotations.remove(ann)
+            del index[box_id]
+        else:
+            print(f"DEBUG: 적용할 수 없는 연산 무시 - {op}")
+
+    st.session_state.annotation_version = current_version + 1
+    return True
+
+
+def bbox_to_dict(bbox):
+    """[x, y, width, height] 리스트를 어노테이션 bbox 형식으로 변환하는 함수"""
+    return {
+        "x": bbox[0],
+        "y": bbox[1],
+        "width": bbox[2],
+        "height": bbox[3]
+    }
+
 
 def update_annotations_from_result(new_labels):
     """결과로부터 어노테이션 정보를 업데이트하는 함수"""
@@ -430,15 +727,11 @@ def update_annotations_from_result(new_labels):
     for i, item in enumerate(new_labels):
         annotation = {
             "id": i + 1,  
+            "box_id": item.get('box_id') or f"bbox-{i}",
             "label": item.get('label'),
-            "bbox": {
-                "x": item['bbox'][0],
-                "y": item['bbox'][1],
-                "width": item['bbox'][2],
-                "height": item['bbox'][3]
-            },
+            "bbox": bbox_to_dict(item['bbox']),
         }
         annotations.append(annotation)
     
     # 어노테이션 업데이트
-    st.session_state.annotations = annotations
\ No newline at end of file
+    st.session_state.annotations = annotations
@@ -0,0 +1,39 @@
+import os
+
+import pytest
+
+# 모델 런타임이 없는 환경(CI 등)에서는 건너뜀
+pytest.importorskip("onnxruntime")
+pytest.importorskip("paddleocr")
+pytest.importorskip("cv2")
+
+from ocr_utils import OCR_MODEL_CONFIGS, check_backend_parity
+
+# 기준은 OCR_CONFIG 환경 변수와 관계없이 Paddle 설정
+REFERENCE_CONFIG = "default"
+IMAGE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "images")
+# 전체 images/를 돌리면 오래 걸리므로 앞쪽 일부만 비교 (OCR_PARITY_LIMIT=0이면 전체)
+PARITY_LIMIT = int(os.environ.get("OCR_PARITY_LIMIT", "20")) or None
+
+
+def _models_available(config_name):
+    config = OCR_MODEL_CONFIGS[config_name]
+    return all(os.path.exists(config.get(key) or "") for key in ("det_model_dir", "rec_model_dir"))
+
+
+@pytest.mark.parametrize("candidate", ["onnx"])
+def test_onnx_matches_paddle(candidate):
+    if not _models_available(REFERENCE_CONFIG) or not _models_available(candidate):
+        pytest.skip("Paddle 또는 ONNX 모델 파일이 없습니다 (OCR_MODEL_DIR로 모델 디렉터리 지정).")
+    if not os.path.isdir(IMAGE_DIR):
+        pytest.skip("images/ 디렉터리가 없습니다.")
+
+    report = check_backend_parity(IMAGE_DIR, REFERENCE_CONFIG, candidate, limit=PARITY_LIMIT)
+
+    assert report["images"] > 0
+    assert report["reference_boxes"] > 0, "기준 백엔드가 박스를 하나도 찾지 못했습니다."
+    # 통과 기준은 check_backend_parity의 passed 하나만 사용 (재현율/정밀도/텍스트 일치율 임계값은 ocr_utils의 PARITY_MIN_*)
+    assert report["passed"], (
+        f"det_recall={report['det_recall']:.3f}, det_precision={report['det_precision']:.3f}, "
+        f"text_agreement={report['text_agreement']:.3f}, mismatched={report['mismatched_images']}"
+    )
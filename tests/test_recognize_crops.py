@@ -0,0 +1,46 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+pytest.importorskip("paddleocr")
+
+from ocr_utils import recognize_crops
+
+
+class _FakeOCR:
+    """crop 크기를 텍스트로 돌려주고, 받은 배치의 종횡비를 기록하는 가짜 엔진"""
+
+    def __init__(self):
+        self.batches = []
+
+    def text_recognizer(self, batch):
+        self.batches.append([crop.shape[1] / crop.shape[0] for crop in batch])
+        return [(f"{crop.shape[0]}x{crop.shape[1]}", 1.0) for crop in batch], 0.0
+
+
+def _crop(height, width):
+    return np.zeros((height, width, 3), dtype=np.uint8)
+
+
+def test_results_follow_input_order():
+    sizes = [(32, 400), (32, 40), (0, 10), (32, 200), (32, 32), (32, 800), (32, 100)]
+    crops = [_crop(h, w) for h, w in sizes]
+    ocr = _FakeOCR()
+
+    results = recognize_crops(crops, ocr, batch_size=2)
+
+    assert results[2] is None
+    for (h, w), result in zip(sizes, results):
+        if h > 0:
+            assert result == (f"{h}x{w}", 1.0)
+
+
+def test_batches_are_sorted_by_aspect_ratio():
+    widths = [400, 40, 200, 32, 800, 100]
+    ocr = _FakeOCR()
+
+    recognize_crops([_crop(32, w) for w in widths], ocr, batch_size=2)
+
+    ratios = [ratio for batch in ocr.batches for ratio in batch]
+    assert ratios == sorted(ratios)
+    assert len(ocr.batches) == 3